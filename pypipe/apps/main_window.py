@@ -9,8 +9,8 @@
 # System import
 import os
 import ast
+import pprint
 import logging
-from collections import OrderedDict
 
 # Define the logger
 logger = logging.getLogger(__name__)
@@ -19,23 +19,34 @@ logger = logging.getLogger(__name__)
 from pypipe.configure import info
 from pypipe.apps.utils.window import MyQUiLoader
 from pypipe.apps.utils.fill_treectrl import fill_treectrl
-from pypipe.gui.controls import QTCONTROLS
-from pypipe.gui.plotting import data_widget
+from pypipe.apps.utils.fill_treectrl import build_search_index
+from pypipe.apps.utils.fill_treectrl import filter_treectrl
 from pypipe.gui.scroll_widgets import ScrollWidget
 from pypipe.gui.function_widgets import FunctionDoc
 from pypipe.gui.function_widgets import DeleteObjects
 from pypipe.gui.function_widgets import FunctionParameters
+from pypipe.gui.workers import Worker
+from pypipe.gui.workers import MainThreadDispatcher
+from pypipe.gui.run_widgets import RunsWidget
+from pypipe.lib.base import ObjectStore
+from pypipe.lib.base import trace
+from pypipe.lib.base import is_tracing
+from pypipe.lib.base import observers_report
+from pypipe.lib.pipeline import Pipeline
+from pypipe.lib.instrumentation import RunLog
 from pypipe.lib.utils import load_func_from_module_path
 
 # Third party import import
 import numpy
 from PySide2 import QtCore, QtWidgets
+import shiboken2
 
 
 class PyPipeMainWindow(MyQUiLoader):
     """ PyPipe main window.
     """
-    def __init__(self, menu, ui_file):
+    def __init__(self, menu, ui_file, cache=None,
+                 memory_budget=2 * 1024 ** 3, isolated=False):
         """ Method to initialize the PyPipe main window class.
 
         Parameters
@@ -45,6 +56,13 @@ class PyPipeMainWindow(MyQUiLoader):
             the url to the documentation.
         ui_file: str (mandatory)
             a filename containing the user interface description
+        cache: ResultCache (optional, default None)
+            if set, use this cache to store/retrieve the function results.
+        memory_budget: int (optional, default 2GB)
+            the maximum size in bytes of the arrays kept in memory, larger
+            arrays are spilled to memory-mapped files.
+        isolated: bool (optional, default False)
+            if set, execute the functions in worker processes.
         default_study_config: ordered dict (madatory)
             some parameters for the study configuration
         """
@@ -53,17 +71,25 @@ class PyPipeMainWindow(MyQUiLoader):
 
         # Class parameters
         self.menu = menu
+        self.cache = cache
+        self.isolated = isolated
         self.functions = {}
         self._current_ui = None   
         self._current_del = None
         self._current_doc_html = None
-        self._objects = []
+        self._objects = ObjectStore(memory_budget=memory_budget)
+        self._objects.add_observer("change", self._on_objects_changed)
+        self._objects.add_observer("spill", self._on_objects_spilled)
+        self._pipelines = {}
+        self.runlog = RunLog()
+        self.runlog.enable_queue(dispatcher=MainThreadDispatcher())
 
         # Define dynamic controls
         self.controls = {
             QtWidgets.QAction: [
                 "actionHelp", "actionQuit", "actionBrowse",
-                "actionParameters", "actionDocumentation", "actionBoard"],
+                "actionParameters", "actionDocumentation", "actionBoard",
+                "actionRun"],
             QtWidgets.QTabWidget: [
                 "display"],
             QtWidgets.QDockWidget: [
@@ -83,11 +109,20 @@ class PyPipeMainWindow(MyQUiLoader):
         self.add_controls_to_ui()
         self.ui.display.setTabsClosable(True)
 
-        # Create the functions menu
+        # Create the documentation widget once: only its content is updated
+        doc_cachedir = None
+        if self.cache is not None:
+            doc_cachedir = os.path.join(self.cache.cachedir, "doc")
+        self._doc_widget = FunctionDoc(cachedir=doc_cachedir)
+        self.ui.dockWidgetDoc.setWidget(self._doc_widget)
+
+        # Create the functions menu and its search index
         fill_treectrl(self.ui.menu_treectrl, self.menu)
+        self._search_index = build_search_index(self.ui.menu_treectrl)
 
         # Signal for window interface
         self.ui.actionHelp.triggered.connect(self.onHelpClicked)
+        self.ui.actionRun.triggered.connect(self.onRunPipelineClicked)
 
         # Signal for tab widget
         self.ui.display.currentChanged.connect(self.onCurrentTabChanged)
@@ -112,7 +147,17 @@ class PyPipeMainWindow(MyQUiLoader):
             self.onTreeSelectionChanged)
 
         # Create objects managment widget
-        self._on_update_widgets(None)
+        self._param_widget = None
+        self._board = DeleteObjects(self._objects)
+        self._board.add_observer("update", self._on_update_widgets)
+        self.ui.dockWidgetBoard.setWidget(self._board)
+
+        # Create the function calls measures widget
+        self._runs_dock = QtWidgets.QDockWidget("Runs", self.ui)
+        self._runs_dock.setObjectName("dockWidgetRuns")
+        self._runs_widget = RunsWidget(self.runlog)
+        self._runs_dock.setWidget(self._runs_widget)
+        self.ui.addDockWidget(QtCore.Qt.BottomDockWidgetArea, self._runs_dock)
 
     def show(self):
         """ Shows the widget and its child widgets.
@@ -194,12 +239,9 @@ class PyPipeMainWindow(MyQUiLoader):
         """ Event to refresh the menu tree control that contains the pipeline
         modules.
         """
-        # Clear the current tree control
-        self.ui.menu_treectrl.clear()
-
-        # Build the new filtered tree control
-        fill_treectrl(self.ui.menu_treectrl, self.menu,
-                      self.ui.search.text().lower())
+        # Show/hide the existing tree items
+        filter_treectrl(self.ui.menu_treectrl, self._search_index,
+                        self.ui.search.text())
 
     def onTreeSelectionChanged(self):
         """ Event to refresh the pipeline load button status.
@@ -216,9 +258,8 @@ class PyPipeMainWindow(MyQUiLoader):
             param_widget = self.ui.dockWidgetParameters.widget()
             if param_widget is not None:
                 param_widget.close()
-            doc_widget = self.ui.dockWidgetDoc.widget()
-            if doc_widget is not None:
-                doc_widget.close()
+            self._param_widget = None
+            self._doc_widget.clear()
         else:
             # Create the function parameters widget
             function_input_params = [
@@ -237,29 +278,36 @@ class PyPipeMainWindow(MyQUiLoader):
                 output_arg_types=[param[0] for param in function_output_params],
                 input_meta=[param[1] for param in function_input_params],
                 output_meta=[param[1] for param in function_output_params])
+            if self.cache is not None:
+                function = self.cache.memoize(function)
             self.ui.status.clearMessage()
             param_widget = FunctionParameters(
                 function,
                 objects=self._objects,
-                status_widget=self.ui.status)
+                status_widget=self.ui.status,
+                isolated=self.isolated,
+                runlog=self.runlog)
             param_widget.setAttribute(QtCore.Qt.WA_DeleteOnClose, True)
-            param_widget.add_observer("update", self._on_update_widgets)
             scroll_param_widget = ScrollWidget(param_widget)
             scroll_param_widget.setAttribute(QtCore.Qt.WA_DeleteOnClose, True)
+            self._param_widget = param_widget
 
-            # Create the documentation widget
-            doc_widget = FunctionDoc(function)
-            doc_widget.setAttribute(QtCore.Qt.WA_DeleteOnClose, True)
+            # Update the documentation widget
+            self._doc_widget.set_function(function)
 
             # Add widgets to dock widgets
-            self.ui.dockWidgetDoc.setWidget(doc_widget)
             self.ui.dockWidgetParameters.setWidget(scroll_param_widget)
 
+        # Check that the closed widgets are not kept alive by observers
+        if is_tracing(logger):
+            logger.debug("Observers::\n{0}".format(
+                pprint.pformat(observers_report())))
+
     def onCloseTabClicked(self, index):
         """ Event to close a pipeline view.
         """
-        # Remove the table
-        self.ui.display.removeTab(index)
+        # Remove the table and release the displayed data
+        self._remove_tab(index)
         
 
     def onCurrentTabChanged(self, index):
@@ -270,6 +318,51 @@ class PyPipeMainWindow(MyQUiLoader):
         if index >= 0:
             pass
 
+    def onRunPipelineClicked(self):
+        """ Event to execute a pipeline described in a JSON file.
+
+        The pipeline is executed in a worker and its 'Objects' outputs are
+        appended to the objects list. A pipeline loaded again from an
+        unchanged file skips the nodes whose inputs are unchanged.
+        """
+        # Select the pipeline description
+        path = QtWidgets.QFileDialog.getOpenFileName(
+            self.ui, "Open pipeline", "", "Pipeline (*.json)")[0]
+        if not path:
+            return
+
+        # Load the pipeline
+        mtime = os.path.getmtime(path)
+        if path in self._pipelines and self._pipelines[path][0] == mtime:
+            pipeline = self._pipelines[path][1]
+        else:
+            try:
+                pipeline = Pipeline.from_json(self.menu, path)
+            except Exception as error:
+                QtWidgets.QMessageBox.critical(
+                    self.ui, "Error",
+                    "Impossible to load pipeline '{0}': {1}".format(
+                        path, error))
+                return
+            self._pipelines[path] = (mtime, pipeline)
+
+        # Execute it in a worker
+        name = os.path.basename(path)
+        self.ui.status.showMessage("Queued pipeline {0}".format(name))
+        self.ui.status.reformat()
+        self.ui.status.hideOrShow()
+        worker = Worker(pipeline.run, name, jobs=os.cpu_count() or 1,
+                        cache=self.cache, runlog=self.runlog)
+        worker.kwargs["progress"] = worker.report
+        worker.signals.progress.connect(self.ui.status.showMessage)
+        worker.signals.finished.connect(
+            lambda result, elapsed: self._on_pipeline_done(
+                name, pipeline, result[0], result[1], elapsed))
+        worker.signals.error.connect(
+            lambda trace, elapsed: self._on_pipeline_error(
+                name, trace, elapsed))
+        worker.start()
+
     def onHelpClicked(self):
         """ Event to display the package information.
         """
@@ -283,59 +376,141 @@ class PyPipeMainWindow(MyQUiLoader):
     ###########################################################################
 
     def _on_update_widgets(self, signal):
-        """ Update all the widgets.
+        """ Display an object when the board emits a 'show' signal.
+        """
+        trace(logger, "Update widgets::\nsignal: {0} - {1} - {2}",
+              signal.signal, signal.action, signal.position)
+        if signal.action == "show":
+            self._display_object(signal.position)
+        trace(logger, "Update widgets done.")
+
+    def _on_objects_changed(self, signal):
+        """ Update the widgets when the inner objects list is updated.
+
+        The 'removed' objects from the 'start' index have been replaced by
+        the new 'values': the displays of the removed objects are closed,
+        the new objects with an array data element or the array objects are
+        displayed, and only the object controls of the board and of the
+        function parameters are patched.
+        """
+        start, removed, count = signal.start, signal.removed, len(
+            signal.values)
+        trace(logger, "Objects changed::\nstart: {0} - removed: {1} - "
+              "count: {2}", start, removed, count)
+
+        # Close/add displays in tab widget: the tabs are named after the
+        # displayed object index
+        for position in range(start + count, start + removed):
+            idx = self._find_tab(position)
+            if idx >= 0:
+                self._remove_tab(idx)
+        if removed != count:
+            for idx in range(self.ui.display.count()):
+                position = int(self.ui.display.tabText(idx))
+                if position >= start + removed:
+                    self.ui.display.setTabText(
+                        idx, str(position + count - removed))
+        for position in range(start, start + count):
+            self._display_object(position)
+
+        # Patch the object controls
+        self._board.update_objects(start, removed, count)
+        if (self._param_widget is not None and
+                shiboken2.isValid(self._param_widget)):
+            self._param_widget.update_objects(start, removed, count)
+        trace(logger, "Objects changed done.")
+
+    def _on_objects_spilled(self, signal):
+        """ Rebuild the displays of the spilled objects from their
+        memory-mapped views so that the in-memory arrays are released.
+        """
+        trace(logger, "Objects spilled: {0}", signal.positions)
+        current_idx = self.ui.display.currentIndex()
+        for position in signal.positions:
+            if self._find_tab(position) >= 0:
+                self._display_object(position)
+        self.ui.display.setCurrentIndex(current_idx)
+
+    def _find_tab(self, position):
+        """ Get the index of the tab displaying an object.
+
+        Parameters
+        ----------
+        position: int
+            the object index.
+
+        Returns
+        -------
+        idx: int
+            the tab index, -1 if the object is not displayed.
+        """
+        for idx in range(self.ui.display.count()):
+            if self.ui.display.tabText(idx) == str(position):
+                return idx
+        return -1
 
-        This method is usefull for instance when the inner objects list
-        is updated.
+    def _remove_tab(self, idx):
+        """ Remove a tab and delete its widget: the removed widget would
+        otherwise keep the displayed data alive.
 
-        Depending on the emited signal, all the objects with an array data
-        element or the array objects will be displayed/removed.
+        Parameters
+        ----------
+        idx: int
+            the tab index.
         """
-        # Process emited signal
-        logger.debug("Update widgets::")
-        if signal is not None:
-            logger.debug("signal: {0} - {1} - {2}".format(
-                signal.signal, signal.action, signal.position))
-
-            # Close/add display in tab widget
-            if signal.action in ["show", "add"]:
-                new_object = self._objects[signal.position]
-                if (hasattr(new_object, "data") and
-                        isinstance(new_object.data, numpy.ndarray)):
-                    display_widget = data_widget(new_object.data)
-                elif isinstance(new_object, numpy.ndarray):
-                    display_widget = data_widget(new_object)
-                else:
-                    display_widget = QtWidgets.QLabel()
-                    display_widget.setText(repr(new_object))
-                self._insert_widget_in_tab(display_widget, signal.position)
-            elif signal.action == "del":
-                self.ui.display.removeTab(signal.position)
-                for idx in range(signal.position, self.ui.display.count()):
-                    self.ui.display.setTabText(idx, str(idx))
+        widget = self.ui.display.widget(idx)
+        self.ui.display.removeTab(idx)
+        if widget is not None:
+            widget.deleteLater()
+
+    def _display_object(self, position):
+        """ Display an object in the tab widget.
 
+        Parameters
+        ----------
+        position: int
+            the object index.
+        """
+        new_object = self._objects[position]
+        if (hasattr(new_object, "data") and
+                isinstance(new_object.data, numpy.ndarray)):
+            data = new_object.data
+        elif isinstance(new_object, numpy.ndarray):
+            data = new_object
+        else:
+            data = None
+        if data is not None:
+            # Import pyqtgraph only when an array is first displayed
+            from pypipe.gui.plotting import data_widget
+            display_widget = data_widget(data)
         else:
-            logger.debug("signal: None")
-        logger.debug("objects: {0}".format(self._objects))
-
-        # Close widgets in dock widgets
-        self.ui.dockWidgetBoard.widget().close()
-        scroll_param_widget = self.ui.dockWidgetParameters.widget()
-        if scroll_param_widget is not None:
-            scroll_param_widget.close()
-        doc_widget = self.ui.dockWidgetDoc.widget()
-        if doc_widget is not None:
-            doc_widget.close()       
-
-        # Create the object managment widget
-        del_widgets = DeleteObjects(self._objects)
-        del_widgets.setAttribute(QtCore.Qt.WA_DeleteOnClose, True)
-        del_widgets.add_observer("update", self._on_update_widgets)
-        self.ui.dockWidgetBoard.setWidget(del_widgets)
-
-        # Create the function parameters/documentation widgets
-        self.onTreeSelectionChanged()
-        logger.debug("Update widgets done.")
+            display_widget = QtWidgets.QLabel()
+            display_widget.setText(repr(new_object))
+        self._insert_widget_in_tab(display_widget, position)
+
+    def _on_pipeline_done(self, name, pipeline, outputs, skipped, elapsed):
+        """ Callback used when a pipeline execution is done: the 'Objects'
+        outputs of the executed nodes are appended to the objects list in a
+        single batch.
+        """
+        with self._objects.batch():
+            for node_name, node_outputs in outputs.items():
+                if node_name in skipped:
+                    continue
+                function = pipeline.nodes[node_name]["function"]
+                for output_name, output_type in zip(
+                        function._output_names, function._output_types):
+                    if output_type == "Objects":
+                        self._objects.append(node_outputs[output_name])
+        self.ui.status.showMessage("{0} done in {1:.2f}s ({2} skipped)".format(
+            name, elapsed, len(skipped)), 4000)
+
+    def _on_pipeline_error(self, name, trace, elapsed):
+        """ Callback used when a pipeline execution failed.
+        """
+        logger.error("Error during pipeline execution.\n{0}".format(trace))
+        self.ui.status.showMessage(
+            "{0} failed after {1:.2f}s".format(name, elapsed), 4000)
 
     def _insert_widget_in_tab(self, widget, index):
         """ Insert a new widget or replace an existing widget.
@@ -345,35 +520,19 @@ class PyPipeMainWindow(MyQUiLoader):
         widget: a widget (mandatory)
             the widget we want to draw.
         index: int
-            the tab index.
+            the displayed object index, used as tab name.
         """
         # Search if the tab corresponding to the widget has already been
         # created
-        already_created = False
-        idx = 0
-
-        # Go through all the tabs
-        for idx in range(self.ui.display.count()):
-
-            # Check if we have a match: the tab name is equal to the current
-            #pipeline name
-            if (self.ui.display.tabText(idx) == str(index)):
-                already_created = True
-                break
+        idx = self._find_tab(index)
 
         # If no match found, add a new tab with the widget
-        if not already_created:
+        if idx < 0:
             self.ui.display.addTab(widget, str(index))
             self.ui.display.setCurrentIndex(self.ui.display.count() - 1)
 
         # Otherwise, replace the widget from the match tab
         else:
-            # Delete the tab
-            self.ui.display.removeTab(index)
-
-            # Insert the new tab
-            self.ui.display.insertTab(index, widget, str(index))
-
-            # Set the corresponding index
-            self.ui.display.setCurrentIndex(index)
-
+            self._remove_tab(idx)
+            self.ui.display.insertTab(idx, widget, str(index))
+            self.ui.display.setCurrentIndex(idx)
@@ -15,6 +15,7 @@ import logging
 logger = logging.getLogger(__name__)
 
 # Package import
+from pypipe.lib.cache import ResultCache
 from pypipe.apps.utils.application import Application
 from pypipe.apps.main_window import PyPipeMainWindow
 import pypipe.apps.resources as resources
@@ -85,8 +86,18 @@ class PyPipeViewerApp(Application):
             else:
                 menu = {}
 
+        # Create the function results cache
+        cache = None
+        if getattr(self.options, "cachedir", None) is not None:
+            cache = ResultCache(self.options.cachedir)
+
         # Create and show the main window
-        self.window = PyPipeMainWindow(menu, ui_file)
+        kwargs = {}
+        if getattr(self.options, "memory_budget", None) is not None:
+            kwargs["memory_budget"] = self.options.memory_budget * 1024 ** 2
+        if getattr(self.options, "isolated", False):
+            kwargs["isolated"] = True
+        self.window = PyPipeMainWindow(menu, ui_file, cache=cache, **kwargs)
         self.window.show()
         self.window.ui.status.showMessage("Ready", 4000)
 
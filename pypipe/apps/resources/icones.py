@@ -1,14596 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# Resource object code
-#
-# Created: mer. juil. 24 10:23:25 2019
-#      by: The Resource Compiler for PySide2 (Qt v5.13.0)
-#
-# WARNING! All changes made in this file will be lost!
-
-from PySide2 import QtCore
-
-qt_resource_data = b"\
-\x00\x00\x14=\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\x00\x00\x5cr\xa8f\
-\x00\x00\x14\x04IDATx\x9c\xed\xdd\x7f\x88]e\
-~\xc7\xf1\xf7s\xeeD]\xd7I\x1c3&q\xbb\xfe\
-\x88\xcd6\x01'K\xd9\xd8U\x0c(\xeb\xdaVX\xe8\
-\x1f\xed\x1f\xd5\x06\x12\xe8\x82\xfe\xd1\xd5\x85\xfe!\x94\xa5\
-)XZAh\xff\xd8\xb2\x14\x85R\xb4\x0d\xea\xc2R\
-\xda\xfeQqAP\x08\xe86iY\x1d\x8bJ\xd8D\
-\xe3jL&\x99\xccL~\xcf\x9c\xf3\xed\x1f\xcf9\xf7\
-\x9e\xfbc\xee\xcc\xe4\xc7\xf3\xdc\xb9\xcf\xe7%\x93\xcc\xbd\
-sn<\xe7\xe4\xf9~\x9f\xef\xf3\x9c\xe7\x9c8d0\
-d\xf0\x9d}\x0f\xb0\xf1\xfeq\x9csKm\xbd\x06\xd8\
-\x09<\x04\xdc\x0bL\x00w\x02K~\xf0*1\xe0\x13\
-`\x128\x00\xbc\x05\xec\x07\xe6\x97\xfc`a\xbc\xb9k\
-?\xc7\xdf9\xe9\xff\x14\x89*T\x83\x91~\x5c+\xf8\
-q\xf4K\x00[\x80'\x80=\xc08\xdd\x7f\x7f!\x13\
-@\xe7\xeb)\xe0%\xe0E\xe0\xd0\xa2\x1f4\x03CI\
-`@(\x01\xc4\xb6\xbc\xe0\xbf\x0b\xd8\x0b\xec\xc2\xf7\xfe\
-\xb5O\x0f\x84z\x18\xcf\x03\xfb\x80g\x81#=7V\
-\x12\x18\x18\x8d\xd8;\x90\xb4\xa5\x83\xdf\x01?\x04~\x0a\
-\xdcG\xeb\xef\xcb18\xc1\x0f\xed\xfb\xd3\x00~\x1b\xf8\
-S|2x\xa7k\xe3\xf287\xff\xe1\x1d\x1c\x7fw\
-\x8a\xb3\x9f\x9d\x0f\xb4\x9b\xd2i\x90\x1aQZ\x1cL\xfc\
-p+\x13Oo],\xf8\xc7\xf0=\xe9\xa3\xed\x9fZ\
-\x15\xea}\xfa\xeb\xf8\xcae\xbak#3(\xe0\xd5o\
-\xfc\x07\x14\xc1\xf6Mj\xb2\xd8;\x90\xaa\x0d\xf7\xad\xef\
-\x17\xfc\x9b\xf0\x93jU\xf0\x0fZ\x8f\xbf\x94\xfa\xfe>\
-\x8a?\x96M]\x1b9\xe7'?\xff\xf5\x81\xd5ut\
-CD\x09 \x06\x07\xf7\xf4\x0f\xfe7\x81m\xad\xadW\
-\xadj\xdf\xb7\xe1\x8f\xa9+\x09\x00l\xbc\x7f\x9c\x0d\xf7\
-\xaf\x0f\xb6S\xd2\xa2\x04\x10\xc1\x86\xfb\xd7\xfbq\x7f\xb7\
-Q\xe0\x0d\x86#\xf8+\xf5$\xf0\x06\xfe\x18[?t\
-\xce'\xc4\xa7\xb6\x0e\xc7\xd1\xae2J\x00\xa1\xd5\x1a{\
-\x8f\xde\xff\x05\xfc5\xfdr\xcb\xa1Q\x1d\xcb\x04\xfe\x18\
-\xbb\xa8\x0a\x88C\x09 \xb0\x0d\xf7-\xda\xfb\xef\x01\x1e\
-+\xbf\x1f\xa6\xe0\xafT\xc7\xf4\x18\xfeX[?P\x15\
-\x10\x8d\x12@H\x0e6\xf4\xbe\xe47\x06<\xdf\xdaj\
-hU\xc7\xf6<\xfe\x98\xdbT\x97C%\x1c\xad\x03\x08\
-\xc9\xc1\xc3\xfbv\xf6J\x00\xcf\x02\xbf\xdb\xdaj\xe8}\
-\x15\xdf\xf6~^\xbd\xe1\x9c\x03\xf3\x97\x06O\xbc{2\
-\xde\x9e%F\x15@H\xe5\xc5\xb1\x1e\xbd\xff\x93\xb5-\
-\x86]u\x8cO\xd2Y\x05\xb8\xd6p@\xc2P\x02\x08\
-h\xc3}~\x92\xcb\xda\xff\xdbM\xc7\xccx\x22F\x0d\
-\xdb]?\x13\x00\xb7~[\x13\x81!)\x01\x04t\xeb\
-\xb7\xd77\x1bz\xc9\xe1W\xc9U\xdf\xa7\xa2:\xd6]\
-\xb5\xef1\xac\x99$%\x0c%\x80P\x16_\xf4\xb3#\
-\xc2\xde\x0c\x8a\x1d\xd4\x16\x075\xcfOJ\xa902%\
-\x80\xb8\x1ed\xf5-\xf3\xbdZ\xaa\xe3~0\xf6\x8e\xa4\
-l$\xf6\x0e$n\x07\xd09,H\xcd\x0e\xe0\xb5\xd8\
-;\x91*%\x80\x90\xac\xe3w\xd8\x96d\xdf_g\xcd\
-e\xcf\x12\x81\x86\x00\xa1\xb5\x82\xdf\xe1\x9f\xea\x93\xba\xf6\
-'\x1b%]\x0c\x85\xa7\x04\x10\xd7\xc6\xd8;0\x00t\
-\x0e\x22R\x02\x10I\x98\xe6\x00\x02\xaa&\xfb\xea\x93~\
-\xce\xd2\x9e\x04H|\x024:U\x00\x81\xa9\xc1\xf7\xa7\
-\xf3\x13\x96\x12\x80H\xc2\x94\x00D\x12\xa69\x80\xc8T\
-\xf2JL\xaa\x00D\x12\xa6\x04 \x920%\x00\x91\x84\
-)\x01\x88$L\x93\x80\x11\xd4\xa7\xfd\xd2^\x06\xa4\xa5\
-\xff\xb1)\x01\x04f\x80S\x0a\xa8\xb1>\xaf\xe4Z\xd3\
-\x10 85\xf1\xfet~BR\x02\x10I\x98\x86\x00\
-\x91\xa9\xbf\x93\x98\x94\x00\xa2S\x0a\x90x4\x04\x10I\
-\x98*\x80\x18t\x11\xa0E\x05PT\xaa\x00BS\x83\
-\xefO\xe7'(U\x00\x01u?\x14X\x05\x80\xe2=\
-.U\x00\x81\xa9\xc1\xf7\xa7\xf3\x13\x96*\x80\xa0z\xd4\
-\x00\x89?\x13P!\x1f\x97*\x80\xe0\xd4\xe0\xfb\xd3\xf9\
-\x09I\x15@dj\xee\x12\x93*\x00\x91\x84\xa9\x02\x88\
-N5\x80\xc4\xa3\x0a@$aJ\x00\x22\x09\xd3\x10 \
-\x02-\x04j\xd1\x00(.U\x00\x81\xa9\xc1\xf7\xa7\xf3\
-\x13\x96*\x80(T\x03\xb4(\xe4cR\x05\x10\x9c\x1a\
-|\x7f:?!\xa9\x02\x88L\xcd]bR\x05 \x92\
-0U\x00\xd1\xa9\x06\x90xT\x01\x88$L\x09@$\
-a\x1a\x02\x84\xa4G\x02u\xd3\x08(*%\x80\x80\xac\
-\xfc\xa5\xfe\x0c\x10\xc5\xffRo\xc8\xb5\xa4\x04\x10\x94\xe9\
-\xdf\x06\xec\xa2\x7f\x1b0&\xcd\x01\x04\xa7&\xde\x9f\xce\
-OH\xaa\x00bS{\x97\x88\x94\x00\x22S\xfcKL\
-J\x00\xd1)\x05H<\x9a\x03\x10I\x98\x12\x80H\xc2\
-\x94\x00D\x12\xa69\x80\x08\xb4\x0a\xa0E3 q\xa9\
-\x02\x08L\x0d\xbe?\x9d\x9f\xb0\x94\x00D\x12\xa6!@\
-\x14\x1a\x04\xb4\xa8\xcf\x8fI\x09 8\x7f7@\xfd\x95\
-\xd4\xe9\x8c\x84\xa4!\x80H\xc2\x94\x00D\x12\xa6!@\
-t*y%\x1eU\x00\x22\x09S\x05\x10\x90\x9e\x08\xd6\
-M\xf5O\x5cJ\x00\x81\x19\xe0\x94\x01Z\xac\xefK\xb9\
-\xc64\x04\x08M-\xbc?\x9d\x9f\xa0T\x01\x04\xa5A\
-@7E|LJ\x00\xc1i!P\x7f:#!)\
-\x01\xc4\xa6\xf6.\x11i\x0e@$a\xaa\x00\xa2S\x09\
- \xf1\xa8\x02\x10I\x98\x12\x80H\xc24\x04\x88@\x17\
-\x01[4\x00\x8aK\x15@`j\xf0\xfd\xe9\xfc\x84\xa5\
-\x0a \x0a\xd5\x00-\x0a\xf9\x98./\x01\xb8\x8e\xdfe\
-I\xae\xfa\xc5\xb5/\x04\x92\x0e\xcep\xcea\x99\x12\xc3\
-\xb2\xd9\x22\xdf/\xc3\xf2Zb\xb9\xd5\xf8}c\xac\xff\
-\x9d1\x9csl\xfd\xb3\xbbW\xf6\x7fJ]-i:\
-\xd7L\x07\x87\xc0m&\xdd\x8c``\x87\x81-\x94M\
-\xd7\xcc\xfcw\x8a\xff\x15\x99\xfa\xc5)N\xfe\xf7i\xcc\
-\x8c\x8f~\xf2\xabe\x9f\xc3\xfe\x0d\xcf\xf9\xafm?\xf8\
-M\x1f\xf0\x1d=\x7f\xd9\x90\xe5\xf2(\x01\xf4H\x00\xb2\
-rf\xb5SW~;\xf5\xee)>\xfa\xc9\xaf\x98z\
-w\xba\xef\x99]\xbc\xe19\xd8\xf6T-\xf0\x9d\x02\xfe\
-*+\x13\x00\x89'\x00\x94\x00\xae\xb2fB\xb0\xa5\x13\
-Aw\xc3s\xbe\xd4\xdf\xf9\xd2\xbd\x97\x13\xf8\xa96\xe4\
-\xcbQ%\x80\xbbH\xf7\xbc\x19p\x04%\x80\x95Z\xd6\
-\xb9\xeaL\x04\xfb\xf7\x1c\x84\xa2}\x1b\xd7\xf9j\xe7\xcb\
-;\x18\xbf\xef\x962\xf8\xfb\xb6K\xe7`\x13\xf0 \xb0\
-\x03\xd8\x06\x8c\x03\x1b\x97u\x08\xe2\x80\xaf\xe3'bS\
-N\x00\x0b\xc0g(\x01,\xd7\x97\xc0\x14\xf0!p\x10\
-x\xdb\xe0\x18\xfd\xce_\x95\x08\x0a\xd8\xbf\xfb\x00S\xbf\
-hU\x03\xad\x86\xe7\xe0\x81Z\xf0\xf7\xe9\xf5\xc7\x80\xdd\
-\xc0.\xe7\x03?\xd5\xc6{5\xa5z\x0e\x15\xf4W\xce\
-\xcc'\x82}\xc0\xcb\xc0\xf4\xe2\x1b\xfa\x09\xd6\xfd\xbb\x0f\
-p\xb2\x1c\x12\xf8\x86\xb7\xbc\xe0\x1f\x03\xfe\x02x\x12\x18\
--?V\xfbMD\x22\xa8O\x01\xce\x01/\x00\xcf\xb1\
-H\x22\xe8L\x02\xae+\xf8{}\xca\xb9=\xc0\xf3\xc0\
-\xad\xa0\xc0\x17\x19@\xf5Dp\x02x\x06\xb3\x97zn\
-X\xfe\xb2\x7f\xf7\x01\xdc\xd6\xa7\xeef\xeb\x0f\xee^\xac\
-\xe7\x1f\x05^\xc0\xb9\xc7j\xef)\xf0E\x06W+\x0f\
-\x98\xbd\x8a\xaf\xd8\xe7\xba6*+\x01\xf7\x07\x1f?\x02\
-\xf4\x0c\xfeM\xc0\x1b\xc0\x04\xad\x85+\x22\xb2:XY\
-\x13L\x02\xbf\x87\x9f(\xec\x929\xe7\x16\x0b\xfe7Q\
-\xf0\x8b\xacV\xae\x8c\xdd\x09|,o\xea\xb5Q\xaf{\
-\x01\xc6\xca\x0fl\x03\x07\xa6\xe0\x17Y\xa5\x9c\xbf\xf9\xc4\
-\xb6\xe1cz'\x1d\x93\x83\x9d\x09\xc0\xe1/'l\xf3\
-/M\xc1/\xb2\xba9\xfc\xbc\xc06|l\x7f\x8f\xda\
-<AV\xdd3P~\xfd9\xf0h\xed\x83\x22\xb2\xfa\
-U\xb1\xfc\xa8\xc1\xd3\xf5\x98\xaf?\x10\xe4.`o\xc7\
-\x07Dd8T1\xfd,>\xd6\x81\xf6\x04\xb0\x97r\
-\x81\x8f\x88\x0c\xadQZ\x1d}3\x01l\xc1/\xed\x05\
-\xf5\xfe\x22\xc3\xaa\xba\xde\xb7\x0b\x1f\xf3\x8c\x94\xf3\x01O\
-\x80[\xa3\x85\xd9\x22IX\x03\xf6\x04\xf0L\xe6_\xb0\
-\xa7\xfc\x81z\x7f\x91\xe1V\xc5\xf8\x1e`M\x86\xbf6\
-8\x1eo\x7fD$\x82q`\xe7\x08\xf0\x10\xcdG\x7f\
-\x88H\x02\xaaX\x7fh\x04\xb8\xd7\x7f\xaf\x19\x00\x91\xc4\
-\xdc\x9b\xe1\xd7\x0a\x8bHz&2\xe0\xce\xd8{!\x22\
-Q\xdc\x99\xf2\xf3\xe8DR\xe6@\xff6\xa0H\xd2\x94\
-\x00D\x126\xa2\xb9\x7f\x91t\xa9\x02\x10I\x98\x12\x80\
-H\xc2F\xb4\xfeG$]#Z\x01(\x92.\x0d\x01\
-D\x12\xa6\x04 \x920%\x00\x91\x84)\x01\x88$L\
-\x0b\x81D\x12\xa6\x0a@$aJ\x00\x22\x09S\x02\x10\
-I\x98\x16\x02\x89$L\x15\x80H\xc2\x94\x00D\x126\
-b\xe6\x87\x00\xce\xe9\xc9`\x22\xa9\xa8\xe2>#\x8f\xbc\
-'\x22\x12G^\xbb\x1dXS\x81\x22\x891\x18)+\
-\x01=\x1aX$!V\xfe\x92\xd9\xbc\xfa~\x91\x14\xd9\
-\xbc\x91\xd9E%\x00\x91\x14\xd9E#+.\xf8\x04P\
-\xcd\x0a\x8a\xc8p\xabb\xbd\xb8`\x8c\xd8y33\xc3\
-9\xe7P\x12\x10I\x82\x99\x99\x9d72\x0a>\xb13\
-\x86\x82_$\x11f\xd8\x19\x83\x82O2`\xb2\x98\xd3\
-0@$\x05\xcd\xf2\xdf\xc7\xfcdF\x83\x03v\xce(\
-4\x19(\x92\x84\xe2\xa2a\xe7\x0c\x1a\x1c\x18\xb1\x8c\xb7\
-\x5c\x8e\x15\xa7\x8c\xec6\xe7\xcc\x0c\xb4,Xd\xf8T\
-\xbd\xff)3\xc0h\xf0V\x86c\xbf\xc1Tq\xce\xc8\
-\xcfZ\xb9@@\xd5\x80\xc8P1\x1f\xdb\xf9Y\xa38\
-g\x18L\x91\xb1?\xc31O\xc6K\x00\xf9\x89\xc2,\
-\xb7\xe6*!\x11\x19\x02\xe6\xc3\xd9r#?Q\xf8\xc8\
-n\xf0\x929\xe6\xfd\xcd@\x8e\x17\x81yr\xc8\x8f[\
-\xf9\x01e\x00\x91a`e\x06\xc8\x8f\x1b\xe5\xcd\x7f\xf3\
-8^$\x87\x0c\x032\x0e\x01\xfb\x00\xec\x9cY~\xb2\
-\xf0\x1f\xd4P@dU\xabb8?Y`\xe7\x9a\x01\
-\xbd\x8f\x06\x87(`\x84\xb2\x22\xa0\xc1\xb3\xe4\xfc\x110\
-Z\xcc\x00\x144\xc63\xcc\xcc\xdf(\xa4yA\x91\xd5\
-\xc3Z\xa3\xf8|\xaa\xa0\x98\xf1\xf3~\xc0\x1c#\xfc\x15\
-9PT\x15\x80\xef\xf0\x8f\xe0\xd8[~\xda\x8a\x99\x82\
-\xfcx^N\x1e\x98\xe6\x05EV\x09\xab\x86\xf0f\xe4\
-\xc7s\x8a\x99\x82\xe6\xcc\xbe\x8f\xf1\xa3\x14\x94\x09\x00h\
-&\x81\x8c\x1f\x03\xafW\x7fN1g,\xfc:\xc7.\
-\xf9\xeca\xa6D 2\xa8\xcc\xaa\x92\xdf\xb0K>v\
-\xcb\x05?U\xd4\xbeN\x83\x1fS\xb4\xde\xc9\xda>\x5c\
-`\xe6\xd8\x05|\xd8|\xfb\x22,|V\x90O\x17e\
-\xf0W\x89@\x99@d\x10\xb4\xe2\xd1w\xd0\xf9t\xc1\
-\xc2g\x05v\xd1\xff\xb8\xdc\xecC\xcb\xd8e\x85\xdf\xb4\
-\x0a\xdf\xe63\x01q\xae\xdat\xda\x1c\x0fc\xbc\x09l\
-\x03\xcc\x19\xae8e\x1439\xd9\xcd\x8el\xad\xc3e\
-\xae=\x09h\xf1\x90H8\x1d\x1d\xb0\x15F1k\x14\
-\xa7\x9b3\xfd\xf5i\x80\x0f\xf11=\xddyq\xafq\
-\xcb\xf6\x9b\xb9a\xe3\xf5\x9d\x01|\x06\xf8\x19\xf0\xfb\xc0\
-\x86\xf2=\x87\x81\x9d\x87b\xc6\xb0\xf9r\x1f\x1a@\xa6\
-\xe0\xbf\x5c~\x825\xd1\xf3g\xba\xd8|%,7\x8a\
-sP\x9c6\xf2\xe3\x86\x9d\xa3\xbe~\xa7\xfan\x12\xc7\
-#\x18\xc7\xda?\x5cN\x09\x8c}s\x1d\xdf\xfa\x9b\x09\
-\xdf\x12\xbb\x1b\xe2(\xf0\x02\xf0X\xed\xbd\xee\xd6\xba\x06\
-\xdcu\x0e\x97\x01#\xe0p\xbaj\xb0\x0c\xee&\x87[\
-\x93\xee\x13\x99\xcd\xca\x8e\xe4\x8c\xd2\xc0\x92\xaa\x89\xbd\x05\
-\xb0\xdc?\xcd\x87\xf9\xc5\xb6lz\x15x\x12\x98k\xdb\
-\xa0\xbc\xb27\xfd\xde\x8c\x0f\xd3\xb1\xed\xeb\xf8\xd6\xdfN\
-`n\xd1\xc6\xb8\x07x\x1e\xb8\xb5\xf6^\x9a\xad\xf6*\
-j|-#\xfb\x8aK:\x01\x14\xe7\x8d\xfc\xf3\x22\xf6\
-\xae\x0c\x83z\xe0\x9f\x00\x9e\x01\xbf\xc2\xb7m\xa3\xb2\xe7\
-?\xfd\xde\x0c\xff\xf3\xa3I\x1a\x00\x17\x8e_\xe4\xf4\xe4\
-,\xb7}\xd7W\xfb=\x1a\xe4/\x81\x7f\xc2\x17\xfc\xdb\
-\x81\xebk?K\xb3\xf5^\x05\xd9\xa8\xc3\xadI7\x01\
-\x00\xd8\x02\xd8\x9c*\x80+P?ys\xc0?\xe0+\
-\xf6w\xba6,\x83\x7f\xfa\xbd\x19\xfe\xf7G\x93`>\
-\xa0\x01\x9f\x04\xa6kI\x00\xba\x12\xc1\x05\xe0\xe7\xf8!\
-\xc11`\x1c\xec\xb6\xabw\x1c\xa9q\xb5\x04\x90l\x12\
-\xb5V\x02P\x12\xb8L\x06\x1c\x04\xf7\x1c\xf0}\xe0?\
-\xf1\xb1\xda\xbeQ\x8f\xe0\x87\x1e\xbd\xf7\xcd\xdb\xd7\xb1\xf9\
-\xf1\xdb\x19\xfb\xe6:\xbf\xc1\xe2\xbd\x93\x03\xdb\x04<\x08\
-\xec\x00\xb6\x00\x9b\x80\x8dWt8\xe9p\x8d\xdfh|\
-=\xbb\xc1\x8d\xa4:cb`\xc5\x05[\xc8\x7f\x9d\x7f\
-\x862\xc0r}\x89\xef\x80\x0f\x01\x07\x81\xb7\xfdk\xd7\
-\xf3\xfc5\xaf\xd4\x19\x1c~\xe5(\x87_\xf9\xb4\xedL\
-\xf7nx\x0e\xeez\xecv\xee\xfe\x93;\x9a[\xf4N\
-\x04]\xff\xcf$\x1b\xf2\xb29\xe0zp\xd7;\xdc\x1a\
-\xe7\x1ak\xdd!\xe0.\x97\xe8\x18\xc0|\xeb<R\x9c\
-\xb1-\xc5\xbc\x99\xcd\x03\x17\xfcD\x97\xf4\xd5#\xd8\xdb\
-\x9bP=\xf0\xa7\xdf\x9f\xe1\xf0+G9\xfd\xfe\xcc\x12\
-\x9f\xea\xf1\xd3\xcd\x8f\xdf\xc1\xe6\xc7oo\xdb\xb2\xd5^\
-\x95\xb4W$\x03w\xa3+\x13\x00.\xbb\xd1\x1dr\xce\
-m&\xdd\xc4ifv\xd8\xce\xb3\xa5X0\xb3K\x86\
-]\xb4\x1e\x05\xac,\xcd7\xa1\x9e\x81?9\xb3h\xa8\
-.\xaf\xe1\x95\x15\xc1\xd8\xf6u\x8cm_\xd7\xf1i%\
-\x81e\x1b\x81lmFv\xbd\xc3\x8d8\xe7\xae\xe3\x10\
-\x89'\x00\xcc\x0e\xdb<[,\xf7\x15@q\xae\xd0e\
-\xc1\x15smax\xf8\x95\xa3L\xbf?\xd37\xf0k\
-\x9f\x5c\xd9\xff\xa7r\xd7c\xb7'\xbb~\xe5r\xdd\xf2\
-\xc0\xcd\xac\x7f\xf0f\x5c\xe6\xc0\xe1\x5c\xa6\x04\x80\xd9a\
-+\xd8R\xae0\xc7\xe6\x8dC\x7fwD\xfd\xca\x0a\x98\
-\xc1\xe9\xc9Y\x1f\xf0\xb0\xa2s7\xb2\xb2\xffS\xeb\xdb\
-#\xaf\x1c]\xd1G\x93\xe7\xa0qK\xc6\xf8w\xc7\x9a\
-o\x19\xe9F~\x9b\xf2\x8e\x14\x07\xb8\x86\xe3\xf0+G\
-\xab;T\xe5\x1a[Y\x02\x90+g\xe6+\x00\xf1:\
-.\x81X\xa1\xae?\xa4l\xe9MDdX\xa9\x02\x08\
-\xc8:~\x07\x0d\x01\xd4\xdf\xc7\xa5\x04\x10X\xf7\xb8_\
-!P\xa7\xb3\x11\x96\x86\x00\x22\x09S\x02\x10I\x98\x86\
-\x00\x91\xa9\xe4\x95\x98T\x01\x88$L\x09@$a\x1a\
-\x02\x04\xa5\x0b\x81\xdd4\x08\x8aI\x15@pj\xf0\xfd\
-\xe9\xfc\x84\xa4\x0a \xa4\xeaNM=M\xbdI\xff\xbc\
-D\x5c\xaa\x00\x02S\x83\xefO\xe7',U\x00\xd1\xa9\
-\xc5K<\xaa\x00D\x12\xa6\x0a 2\x95\xbc\x12\x93*\
-\x00\x91\x84)\x01\x88$LC\x80(\xb4\x10\xa8Ec\
-\xa0\x98T\x01\x04\xa7\x06\xdf\x9f\xceOH\xaa\x00\x02\xd2\
-B\xe0n\x0a\xf7\xb8T\x01\x04\xa6\x06\xdf\x9f\xceOX\
-\xaa\x00\xa2S\x93\x97xT\x01\x88$L\x15@d\xea\
-\xff%&U\x00\x22\x09S\x02\x10I\x98\x12\x80H\xc2\
-4\x07\x10\x94V\x02t\xd3,HLJ\x00\xc1\x19V\
-\x0bz\x85\xff\xd2\xef\xc8\xb5\xa3\x04\x10\x98\x01N\x05@\
-\x8b\xf5})\xd7\x98\xe6\x00D\x12\xa6\x0a \xb4\xae\x7f\
-\x1dT}^\x1b\x9d\x8e\xa0\x94\x00\x22S{\x97\x98\x94\
-\x00bS\x06\x90\x884\x07 \x920%\x00\x91\x84i\
-\x08\x10\x85\xae\x03\xb6h\x0c\x14\x93*\x80\xe0\xd4\xe0\xfb\
-\xd3\xf9\x09I\x15@@Z\x08\xdcM\xe1\x1e\x97*\x80\
-\xc0\xd4\xe0\xfb\xd3\xf9\x09K\x15@tj\xf2\x12\x8f*\
-\x00\x91\x84\xa9\x02\x88L\xfd\xbf\xc4\xa4\x0a@$aJ\
-\x00\x22\x09\xd3\x10 (]\x08\xec\xa6APLJ\x00\
-\xc1\xe9\x89@uz\x22P\x5c\x1a\x02\x04\xa6\xe6\xdd\x9f\
-\xceOXJ\x00\x22\x09\xd3\x10 \xa4\x9eS\x00\x89\xf7\
-y\x89\x1f~lJ\x00\xa1,\xd2\xd0\xd5\xfe%&\x0d\
-\x01BS\xc4/M\xe7(\x18%\x00\x91\x84i\x08\x10\
-\x9bz;\x89H\x15\x80H\xc2T\x01\x04\xd4\xba\x08\xd0\
-\xea\xf6]\xe2K\x81L%PT\xaa\x00\x02S\x83\xef\
-O\xe7',%\x00\x91\x84i\x08\x10\x83\xee\x05j\xe9\
-\xec\xf0U\x00\x04\xa5\x04\x10R\x8f\xc6\xad\x92WbR\
-\x02\x08\xcaZI \xf5\x9e\xbf\x93\x95\xc9P\xf90(\
-%\x80\x90\x8cVC\x07\x9c\x03e\x82Z\x15d`\x85\
-2@H\x9a\x04\x0c\xa9\x00\xb3V/g\x94\xaf\x13e\
-f\xad^\xbf\xfa\xca#\xefTb\x94\x00\x02\xb2\x02\xdf\
-\xc0\x0d(\xca\xaf\xd4U\xe7\xa1\xec\xfdm!\xdd\x84\x18\
-\x83\x12@H9X^\xf6|\x06,\xc4\xde\xa1\x01\xb0\
-\x00fer,\xc0tN\x82R\x02\x08\xa9\x00r+\
-\xab\x00\xc3\xe6c\xefP|6O\x99\x01\x0c\xcbQR\
-\x0cL\x09  _\xe2\xd2*{\xe7U\xee2o\xad\
-\xb1\x7f\x8e\x86\x00\x81)\x01\x84T\x00\x0b~\x9ck\x05\
-\xd8\xa5\xd8;\x14\x9f]\xf2\xe5\xbf\x15e\xf0\xab\x02\x08\
-J\x97\x01C2?\xc6u#@f\xd8\x05\x00\x87\x99\
-\x95\x97\x04\xd3Q]\xfc\xb0\x0b\x86\xbb\x09\xc8]s\x8e\
-D\xc2Q\x02\x08\xa9,u-\xc7\xd7^\x0b|i\xf3\
-\xb6\xd9\xadqI\xae\x7f\xb1y\x83\x05\xbe\xf4\xe7\xa4\xec\
-\xfdue$(\x0d\x01\x02k^\x0a\xcc1\x83);\
-kI.\x076\x0c\x7f\xec\x1c\xb3\x1cc\xa1u%@\
-\xc2Q\x02\x08\xad\xba\x14\x98\x03#|X\xcc\xf9\xb7S\
-Z\x10T\x1dk1\x07\x8cp\xa8\x9a\x00l\xae\x91\x90\
-`\x94\x00BkU\x00\x90q\x90y\xb0\xb3\x91\xf7)\
-\x02;\x0b\xcc\x03\x0d\x0eZ\xae\xde?\x16\xcd\x01\x84T\
-\xf5nU\x12(x\x1b0;m\xb8\xaf:gfC\
-\xff\x84\xa0j\xb8c\xa7\xcd\xca\x97o7\x13\xa2\x12@\
-p\xaa\x00\x022\xac\xb5\x06\xc0\x0f\x01\x8ea\x1c\xb4\x0b\
-`\xb3\xfez\xf80\x0f\x05\xaa\xfb l\xb6\xbc\x02b\
-\x1cd\x84c\xd59\xb1|x\x8f}P)\x01\x04t\
-\xf4\xb5/\xfc7\xe5\xdaw\x0a\x8c\x8c}\x00\xc5I\xac\
-\xb9\x0cv\x18\xe3\xa0\xba\xec\xb7\xe0\x8f\x15\x80\x06\xfb\xc8\
-\xb1z\xef\x7f\xf4\xb5\xcf\xe3\xec_\xa2\x94\x00\x2203\
-(\xcc/\x0bn\xf020G\x01v\xc2\xdan\x17\x1e\
-&\xd5]\x7fv\xc2\xaa`\x9f\xa3\xc1\xcb\x14\xe5\xb9(\
-o\x03\xae\xdf-)\xd7\x9e\x12@`3\x1f\xcc\xfao\
-\x9a\x93^6Mf/\x80a\xe7\xb1\xe2d-\x10\x18\
-\x8e\xaf\xe6\xac\xffI\x7f\x8c`\x94\xc7<\xddvW\xa4\
-\xc1\xec\xe4\x99+:\xbf\xb22J\x00!\x19\xcc\xbc?\
-W}\xeb\xef\x81\xc9\xc1\x1c\xcf\x19\x9c0\x0c\x9b5|\
-\x12\xb0\xea\x1e\x99\x01\x08\xe1\xcb\xfc*\xf7\x1f\xfc1\xd9\
-\xac_\xf3`p\xc22\x9ek.\x01nn\x073\x1f\
-\xcc]\xb5\xd3-KS\x02\x08\xec\xe8O\xbf\xa8E\x07\
-U\xb9;\x8d\xe3\x19\xfcK+f\x8cb\xcaj\x0f\xcc\
-X\x855q\xb9\xeff\xfeX\x8a\x99\xda\x03\xbf\xfc\xb1\
-Nw>\x13\xe1\xe8k\x9f\xab\xfc\x0f\xac\x11{\x07R\
-\xe4\x1c\xac\x9b\x18\xa5\xed\x06\x80\x8c_bl\x05&\x00\
-\xec\x22\x8e\x0b\xc0W\x5c3M\xbbUr\xc3@U\xf2\
-\xdb\x02\xd8\x97V\xads\xa8B\xfbUF\xd8\xdb\x9c\x08\
--\xb7w\xe6\x98\xdc\xfbQ\xf8\x9dM\x9c*\x80\x08>\
--{\xba\xe6%?\xc3\xf7\x84\x8e'\x81\xc9r3\xb3\
-\x0bP|\xe6Kg\xff\x86\x0d\xf4e\xc2\xfa\xfe\xd9\xac\
-\xf9}\xbf\xe0_\x96\x9bL\x92\xf1d3\xf8k\x87\xf2\
-\xa9z\xff(T\x01D\xb4n\xfb(\xd0\xd6\xb3_\xc2\
-\xf1o\xc0\xf7\x80q\x00\x0cg\xe7\x80\xb3@\xc3\xe1\xae\
-k\xff3bW\x05\x9d\x09\xc9\xce\x82\x1d7l\x8e*\
-\xa0\xab\x0d>\xc4\xf1\x08p\xaa\x1e\xe8\xd5\xac\xff\x07{\
-?\x0e\xb2\xbf\xd2N\x09 \x92\xd9\xff;\xc3\xda{F\
-\xb9a\xe3\xf5\x9dA|\x06\xf8\x19\xf5$\x00\x8e\xbc\x0c\
-\xae9|\xb5\xd0p\xb8\x01\xf9\xdb\xb3Ke\x8f\x7f\xa2\
-\xdc\xbf\xd6-\xbd\xf5\xe0\x7f\x18\xe3X\xdb\xe7\xca\xe0\x9f\
-\xfc\xcb\x8f\xb9x\x5c\x0fG\x88AK\x81c1\xbf0\
-h\xdd\xc4(\x86u&\x81c\xc0N`\x1f\xf0(\xad\
-@r,\x80M\x83M\x1b4\xc0\xdd\x00\xac\x01\xd7p\
-\xe1\x06t\xd5\xaa\xbdy|\x89\xdf}\x0f\x7f\xbd,x\
-\x1d\xd8\x851\xdd\xb6AY9\xcc\xbc?\xc7\xacf\xfe\
-\xa3Y\x1d\xb3JCl\xed\xc4(\x13\x7f\xfd[\xe0z\
-\x96\xf3\x0ex\x1ax\x16\x18\xedx\x7f\x10\xd5\x03\x7f\x0e\
-\xbf\xdf\x7f\xdf\xf1~[\xf0\x7f\xb0\xf7c\x8d\xfd#\x1a\
-\x90\x222]\x17\x8f_b\xe6\x833l\xf8\xcez\xa0\
-g\x12x\x17x\x15X\x07\xdcC\xfb\xdf\xd9\xa0$\x82\
-z\x08\xcf\x03\xff\x02<\x0e\xfcW\xd7\x86\x0a\xfe\x81\xa2\
-\x040\x00:\x93\x00t%\x82\xd3\xc0\xbf\xe3\x13\xc1E\
-\xe0\x1b\xc0\x8d=\xfe\xa8P\x09\xa13l\x0d\x98\x02\xfe\
-\x11\xf8>\xf0\xcf\xf8}n\xdfH\xc1?p\x06\xa5\x07\
-\x11`\xed\xf6Q\xee\xf8\xe3\xaf\xb1v\xe2\xa6\xa5f\xf7\
-\xd7\xe0\xe7\x08\x1e\x02\xee\xc5\xaf\x1d\xb8\x93\xb0\x09\xe0\x13\
-\xfc%\xcb\x03\xc0[\xc0~|\xef\xbf\xf8\x87\xcc8\xfa\
-\xea\x17Z\xf03@\xfe\x1f\xb2\x06\x01\x88VR\x88_\
-\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\xd81\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x01,\x00\x00\x01,\x08\x06\x00\x00\x00y}\x8eu\
-\x00\x00\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\
-\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\
-\x00\x9a\x9c\x18\x00\x00\x00\x07tIME\x07\xde\x02\x14\
-\x0f30\x98\xb5V\xf6\x00\x00 \x00IDATx\
-\xda\xec}w\x9c\x5ce\xbd\xfe\xf3\x9e:mgf\xfb\
-nz\xb2)$!4Q\x8a\x05H\x81\xe4\xaa\x09\x10\
-\xeb\x0f\x11\xaf\x82J'\x09\x09M\xd2\x10\x08\x89 \x8a\
-^\x15l\xf7*z\xaf\x14EAJ \xa1\x08\x02\x02\
-R\x04\x0c%\x10\x12\x08I\xb6f\xcb\xcc\x9c\xf2\xbe\xbf\
-?\xcey\xcf\xbe\xe7\xcc\x99\xc9l\xea&9\xef\x87\xc3\
-\xceNffwOy\xce\xf3}\xbe\xcf\xf7\xfb\x05\xa2\
-\x15\xadhE+Z\xd1\x8aV\xb4\xa2\x15\xadhE+\
-Z\xd1\x8aV\xb4\xa2\x15\xadhE+Z\xd1\x8aV\xb4\
-\xa2\x15\xadhE+Z\xd1\x8aV\xb4\xa2\x15\xadhE\
-+Z\xd1\x8aV\xb4\xa2\x15\xadhE+Z\xd1\x1aL\
-\x8bD\xbb\xe0\xe0^\x0b\x97\xaf\xc4\xaa\xc5\x8bB\xff\xed\
-\x9c\x85\xcb\xe4\x91M\xd5\xba\xa6*\x9a*\xcb\x0a!\x90\
-\x15Y\x96A )D\x92;{r\x8d\xba\xaa\xb4H\
-\x12I0\x006\xa5\x09\xc6X\xad\x22K\xa3\x00P\x00\
-\x00\x13N6B\x0c\x89\x90\xed6\xa5o\x00`\x0c`\
-\xba*\xb7\x01\xf87\x08\xc9\xd96\xb5\x19\xc0(\xa5\x16\
-!\x84R\x9b\x1a\x92DLU\x91\x0b\xe7}\xf3l\x1a\
-\xf6;\xfe\xf8\xd6\xdbp\xfe7\xcf\x89\x0ed\x04X\xd1\
-:\xd0\xd6\xa2\xe5\xab\xb0r\xf1\xc2\xa2\xe7\x95Cgj\
-K\xbe\xf6\x1fStU\x19\xae(\xd2\x10E\x92jd\
-I\xaa\x07A\x13cl(ch\x04P\x05 I\x08\
-R\xde\x89\xc3\x00EU \x11\xc9\xc5&\x06B\x084\
-U\xf5>\x9b1\xe6\xfbY\x8c1\x98\xa6\xd5\xff=\x18\
-L\xd3\x04c\x0c\xcc\xf9H\x06\xa0\x8b\x80\x14\xc0X+\
-!\xa4M\x92\xc8\xfb\x00\xd9jS\xda\xc6\x18\xdbB\x19\
-6+2\xf9\xf7\x85\xdf\xfe\xe6\x9b\xd1Q\x8d\x00+Z\
-\x07\x0a{Z\xb6\x0a\xab\x96\xf8\x01\xea\x8b\xe7_\xa1\x8e\
-l\xac\x99\x5c\x9bN\xceQd\xf9hM\x95\xa7\xa8\x8a\
-\xdc@\x00\x95\x81\x11\xf7\x9c \x00 \x11B\xf4X\x0c\
-\x89X\x0c\xba\xa6CUe\xc4c1\xc8\xb2\x84x\x22\
-\xc1\x18\xa5\x84\x10\x02\xe2\x02\x96\x835\x04\xa4\xccY\xc5\
-\x18sA\x8cx\x80\x05\x17\xd4z\xfbr\x00\x18z\xfb\
-r`\x8c!\x97\xcf\xc3(\x18\xc8\xe5\xf3\xc8\x17\x0a \
-\x84\xb8\x98\xe6\xb03\x100F\xb1\xcd\xb6\xedg$\x89\
-<.K\xd2=\xe7\x7f\xeb\x9cw\xc4\x9f\xf7\xa3\x9f\xdd\
-\x86\x0b\xbe\x151\xb0\x08\xb0\xa25\xa8\x99\xd3\xf9W|\
-\xb7zxC\xf5(MS\x9a\xc10\x85\x10\x9c(K\
-\xe4\x08Y\x96\x9bdB\xa0\xaa\x0adY\x86\xa6\xa8\x90\
-\x15\x19\xf1x\x0c\xba\xa6A\xd34\xe8\xba\x0e]S\xa1\
-i\xaa\xef\x14!\x02\x121\xe6\xb0)R\x06\x9d\x82\xaf\
-\x0f\x03\xaf\xa2\x7fc\x0c\x0e\xe21xO\xbb \x97+\
-\x14P(\x14P(\x98(\x18\x05\xf4\xe5\xf2\xcc0\x0d\
-b\x1a&,\xdb\x82iZ\xb0l\x0a\x06\xb6\x99\x80<\
-%Id-cx\x93Q\xf6\x81$K\xeb/\xfc\xf6\
-9}\xd1\xd9\x12\x01V\xb4\x06\x01{\xaa>\xe6T\xe5\
-\x9cO\x1f\x7f\x5c]\xb6\xea\xd4\x98\xa6LQ\x15\xb9\x85\
-QV\x0b E\x08\xe4D\x22\x8eT\x22\x89t*\x89\
-X,\x06E\x91!\xcb2TU\x85,\xcb\x00\x00I\
-\x92|@\xc3\xbf\xe7\xcf\x05\x01*\x0c\xac\xca\x01X\x10\
-\xec\x82\x80%~-\xf5\xd8\xf9JA\xa9\xf3\xd8\xa6\x14\
-\x96i\xc2\xb2mX\x96\xc5\x0c\xc3 =}9tw\
-\xf7\xa0\xbb\xa7\x07\x86i2\x02\xa9C\x92\xc86\x00[\
-lJ\x9f\x90$\xe9\xce\x8b\xce\xfd\xe6\x8b\xfc\xf7\xb9\xe5\
-'\xb7\xe2\xc2s\xbf\x19\x9dT\x11`EkO\xac/\
-\x9ew\xb9t\xe8\xe8!IE\x91k,\x9b~<\xae\
-)g\xc64\xf5\x18]S\xab%I\x02!\x80\xa2(\
-,SUE2\xe9*\xa4\xd3UP\x14\xc5\x07(\x84\
-\x10\x0f\x90\x9c\xf7\x90P`\x0a\xfb^dW\xe2\xf3\x95\
-\x02V9\x90\x0a\xfb^d`\x94R\xdf\xbf\x8b\xdfS\
-J}\xaf\xa7\x94\x22\x97\xcf\xa3\xa3\xb3\x0b\x9d]\xdb\xd1\
-\xdb\xdb\x07\x9b\xd9\xa0\x94\x81\xda\x14\x8c\xb1\xdf\x13B~\
-\xc9\x80\x17AH\xdf\xc5\xe7~\xd3c`?\xf8\xaf\x9f\
-\xe2\xe2\xf3\xbe\x1d\x9dl\x11`E\xabb\x16\xb5|\x15\
-V\x09\xa1\xde\xb9\x97_3zdS\xcdI\x09];\
-\x9e\x80\x1cK\x08Z\x14Y\x8e\xc5\xe31\xa4\x92\x09\xa4\
-\x92\x09\x16O\xc4I<\x16C\x5c\xd7\x1dEI\x00\x96\
- @\x89\xcf\x05\xc1\x891\x06I\x92 \xcb\xb2o\x93\
-$\xc9\xb7\xf1\xcf\x0b\xb2\xb3\x1d-\x0e4\xe2Wq\xb3\
-m\x1b\xb6m{\x8fM\xd3\x0c\xd5\xc2\x82\x9b\x08Z\x1e\
-\xa0\xb9\x82\xbem\xdb\xe8\xcb\xe5\x90\xcb\xe5\xd1\xd3\xdb\x8b\
-\xed\xdb\xbb\xd1\xdd\xdb\x0b\xc3\xb4\xa8$I\xff\x90\x08y\
-\x89\x82>F@\x1e\xba\xf8\xbco\xb7Fg`\x04X\
-\xd1\x1a\xe0:\xff\xcakk\xaa\xab\xe2sk\xab\x92_\
-K\xc4\xf4)\x84 \xc9\x18#\xc9d\x82\xd4\xd6T\xa3\
-&\x9b\xf1\xc2:\x0eDa_EV%\x02\x93\xc8\x8c\
-\x14E\x81\xae\xeb\xd04\x0d\xaa\xaa\xfa\xc0,\xb8$I\
-\x0a\xd5\xa5ve\x05C\xc5\xe02M\x13\xa6i\xba:\
-V\xa1\x08\xf4J\x81\x97\xf8\x95o\x8c1\x0e\x8a\xac\xb7\
-/G\xb6\xb5\xb6b[[\x07,j\xdb\x04\xb0\xc0\xf0\
-\x22!\xe4\xfa\x8b\xce\xfb\xd6=\x1e\xeb\xfa\xf1Oq\xf1\
-\xf9\x11\xeb\x8a\x00+bR\x1e\x93\x9a}\xf6\x02\xfd\xf0\
-\x96ac\x92q\xfd\x13\xaa,}^W\x95\x8f\xeb\x9a\
-\x9a\xd04\x15\xb1X\x0c\xd9t\x9a\xd5\xd4dIL\xd7\
-}l\xa9\x12\xb0\xe2\xdf\x8b\x8cIUUo\xe3\xe0\xc5\
-\x01\xa3\x1c[\xe2\xe0\xb2\xb7V\xf0w\x22\x84\xc0\xb2,\
-\x18\x86\x01\xcb\xb2`\x9a\xa6\xc7\xca,\xcb\xf2\x85\x86\xb6\
-m\xfb\x1e\x07\x01\xac\x1f\xe4(::\xb7\xa3\xbd\xbd\x13\
-]\xdd\xdd\xc8\xe5\xf30-\x0b\x00\xfb?B\xc8] \
-\xe4\xf9K\xce\xfb\xf6\xfa\xe8\x8c\x8d\x00\xeb\xe0\x04\xaae\
-+\xb1j\x89c\xda<\xe3\xa2\xab\xea\xc6\x0e\xad\xffr\
-M:9[\x95\xe5#\x09P\xad\xc74\xa9\xb6:\x8b\
-\xeal\x161]G,\xa6;\xe1\x17! BXV\
-\x09P\xe9\xba\xee\x8a\xed\x8a\xef}\x950\x9e\xc1\xba\x82\
-\xbf\x1f\x07&\xdb\xb6=\x16f\x18\x86/\x0c\x15\x01\x8a\
-\xbf\x9e?\x16\x99\x97i\x9a\xc8\x17\x0a\xac\xb7\xaf\x8f|\
-\xb8u\x1b:\xb7o\x07\x186\x83\x90\xb7$B~x\
-\xf1y\xdf\xbe\x93\x7f\xee\xcd?\xfe\x09.9\xff\xdc\xe8\
-\x84\x8e\x00\xeb\xc0]g\xcd[L\x9aj\xd2\xba\xae*\
-\x1f\xd1U\xf9\xecL2\xfe\xd9\x98\xae\xd6\x12\x22!\x91\
-\x88\xb1\xa6\x86\x06RS\x9d\xf5\xc0'\xb8\x89\xcf\x03\x80\
-,\xcb>\x16E\x08\x81\xa6i\x88\xc5b\xd0]6\xb6\
-3 \xb0/\x01hw,\xdb\xb6\x91\xcb\xe5\x90\xcf\xe7\
-==L\x0c\x19E\xb6\xc5\xffM|\xcc\xbf\x9a\xa6\x89\
-\x8d\xefoFk{;\x0c\xc3\xe4a\xe8\x0aF\xd8-\
-\x84\x91\xb6K.8\xb7\x00\x007\xff\xe8'\xb8\xe4\x82\
-\x08\xbc\x22\xc0:\x80\xd6\xb7/\xbbf\xdc\xc8\xc6\x9a\xd3\
-\xe21\xf5tU\x96\x8e\xd05M\xafJ%QS\x9d\
-e\xa9T\x92T\xa5R^\xb8\xb7#\xb0\x12\xb5(\xcd\
-\xf5Q)\x8a\xe21\xa9\x81\xeaL\xfb\x92QU\x0aX\
-;\xfb7Y\x96\xe5\x85\x8f\x86a\xc04M\x1f\xe3\x0a\
-\x0a\xff\xc1$\x00\x07\xae\xae\xae\xed\xac\xa3k;i\xef\
-\xe8@wo/$IZ#\x11\xe9O\x8c\xe1\xf6y\
-\x17\x9e\xdb\x1e\x9d\xe1\x11`\xed\xb7K4u^r\xf5\
-\xf5G\xd7eS\x17\xd7f\x92\xb3$I\xaa\x96\x89$\
-5\xd6\xd7\xa1\xa9\xb1\xde\x13\xce9S\xe2\x22:\xff>\
-\x8cUI\x92\x04EQ|,jGf\xcd\x1d\x81\xd3\
-\x9e\x00\x8c\xdd\x0d\x96\xa5~~\xa5\x7f\xaf\xa8g\xe5\xf3\
-y\xe4r9\x1fh\x89L\x8b\x03\x1a\xd7\xc5\x02\x99K\
-\xd6\xdb\x97#\x1b\xde\xdb\x88\xf6\xae\xedT\x22$O\x08\
-\xf9\x0d\x03[4\xef\x82\xf3\xb6Gg\x7f\x04X\xfb\x07\
-H-[\x85\x95\xae\xa9\xf3\x9b\x8b\x96\xd7\x0do\xa8>\
-QS\xe5\xaf\xa7\xe2\xfa\x891]\x8b\xc7c:j\xaa\
-\xabYc]-QU\x15\x10\x00\x8a\x83\x94\xc8\xa0\xc4\
-p\x8fg\xf38Pq\x7fU\xa9\x0b7\x08\x02\xc1\xef\
-\xcb\xb2\x1a\xcfu\x1e\xf2\xd9\x84\x00\xbb\x13\xb8\xf8\xcfq\
-\x7f\xe6\xae\x9e\x98a5\x8caN}\xfe\x98k^\x96\
-e\x15\xb1+\x11\xa8\xc2,\x17\x00\xd0\xd9\xd5\x85\x0f\xb7\
-nCGg\x17\x0a\x05\x03\x14\xec\xb7\x04\xf89!x\
-v\xde\x05\xe7\xe7\xa2\xab\x22\x02\xacA\xc8\xa6Vb\xa5\
-\xdb\xf9\xe0\xeb\xf3\x974\x0e\xad\xcf|\xad\xa1&\xfde\
-Y\x22\x87h\xaa\xaa\xd7\xd6T\xa3\xa9\xbe\x8e\xc5b1\
-\xc2m\x03b\xd6N\xcc\xe2\x05\xb5+\xc6\x98\xa7Iq\
-@\xdbY\x90\xf2\xbd\x8f\x9f\x04\x028\xb1 h\x05^\
-\x8f2\xff\xbeK`U\x0e\xb0D\x87}\xc8\xefKv\
-\x00N\xa5\xf6Q\x10\xb8(\xa50\x0c\xc3c]\xe5\xc2\
-D\xce\xba8\xc8\xd9\x96\x85\x5c>\x8f\xae\xee\x1elz\
-\xff\x03l\xef\xed\xb5%B^\x05\xf0\xd3\xf9\x17\x9e\xff\
-\x13\x00\xb8\xe9\x96\x1fc\xfe\x85\xe7G\x17K\x04X\xfb\
-~\x9d{\xf95R6\x95\xa8&\x84|\xbd\xbe:\xf5\
-\xad\xaa\x84\xdeB@PW[\xc3\x86\x0f\x1dJTU\
-\x06!\x92\xcf\x84\x19f\xc6\x14C@\xfeZ\x91M\x95\
-\x02'R\xbe\xea\xb8\x18\x90\xf8\x85\x1c\x02@$\x0cL\
-\xf6\x9d\xb8U\x0c\x98\xdc\xde\xb0\xa3\xd0\xd2\xfd\xbbK\x81\
-X\x18\x1b\xe3\xaf\xcb\xe7\xf3\x9eX_\x09pqK\x85\
-m\xdb`\x94\xa2\xbd\xa3\x13\xef\xbc\xb7\x91\xf5\xe5\xf2\x84\
-R\xda\xcd\xc0\xce$\x84<4\xff\xc2\x88qE\x80\xb5\
-\xaf\xc1\xea\xb2k\xc6\x0dk\xc8~!\x19\xd7\xcf\xd2U\
-e\x5c*\x19GC}=\xab\xce\xa4I\x22\x91(\xd2\
-\xa5J\x85~\xa2\x90\xceEt^\xeb\x17\xe6\x8f\xaa\x04\
-\xa4J\x02T\x10\x9c\x06\x0b@\x0d\x00\xc4XHH\xe9\
-\xdb'\x22[\x1b\x00x\x89\xac+L\xa4\xe7\xe1`\x98\
-;_\xdc(\xa5hkog[\xb6\xb5\x92\xd6\xb6\x0e\
-\xd8\xd4~\x85\x10\xf2kB\xc8\xcf\xe6_x~\xefM\
-?\xfc\x11\xe6_tAt\x01E\x80\xb5g\x17o|\
-7o\xf1\x8a\x1aM\x95\xbf1\xb4\xa1\xfa\x9c\x98\xaa\xb4\
-\x10B\xa4Q\xc3\x87\xa1\xb6\xa6\x9a\xa9\xaaJJ\xb1)\
-\x11\x9c\xc2\x80J\x14\xd1\xf9E$f\xfd\xc2B\x1a\xf1\
-bf\xa2&T\x0a\xa4\xc8\x01t\xf8\x05m\xaddx\
-,\x80\x17\x0f#\x83!a9\xe0\xa2\x94\x22\x9f\xcf\xf7\
-\xb3\xa8\x10\x0bD\x90mq\x06fY\x16r\xf9\x02{\
-w\xc3\x06\xd2\xda\xd1I\x19c\x1d`\xb8h\xc1\xc5\x17\
-\xfc\x0e\x00n\xfc\xe1\x8f\xb0 \x02\xae\x08\xb0v+H\
-\x09F\xcf\xf3\xaf\xbc\xb6\xae>\x9b\xfaL\x22\xa6\x9d\x97\
-M\xc6?\xaa\xeb\x1a\xeaj\xab\xd9\xd0\xe6f\xc2-\x05\
-\x1c\x88\xc4\xefE\x11=XN\xc3C?\x12`\x01\xa5\
-\xc0I\xd4nX\x10\x9c\x18\x1b\x5ca\xdd\xa0\xc04V\
-\xcc\xba\xf8\xfeuA\x9e\x94\xd0\x05\xc5}\xcf\xd9\x16g\
-Qa\xc0\x15\xb6q0\xeb\xec\xec\xc2\xc6\xf7?@G\
-g\x17,\xdb~\x8eHd\x01cx\xf2\xd2\x8b/\xb0\
-o\xfc\xc1\x8f\xb0\xe0\xe2\x08\xb8\x22\xc0\xdaeF\xe5\x94\
-\xcf|}\xc1R\xb56\x9d\xf8\xd2\x90\xba\xec\xd9\xba\xa6\
-\x1c\xad\xabj\xa2\xa9\xa9\x01\xf55\xd5,\x91H\x90`\
-\xe9K\x98\xa8\x1e\xd4\xaa\x14Eql\x0d\x5cH\x0fv\
->\x08\xc9\xd6\x85\xea/\x8c\xed\x7f\xa1\xdd>\xd6\xc4\xbc\
-\xfd\xc4\xc1\xaa\xc4\xbe\x16\x85{~C\xe1\xa5A\x22P\
-\xed(D\xe4\x9bi\x9a\xe8\xee\xee\xc1;\x1b\xde\xc3\xb6\
-\x8e\x0e\xaaH\xf2s\x84\x90\x05\x0b.\xbe\xe0o\xd1\x01\
-\x8a\x00k\xd75\xaa\xcb\xaf\x91\xd2\xc9\xd8\x91\x09]\xbb\
-\xb2\xa96\xfdiY\x96\xf5L\xba\x0acF\x8e\xf0t\
-\xa6\xb0\xce\x06A6\x15\xf4S\xa9\xee{I\xa9,]\
-%\x8c!Z\xbb\xef\x82\xd8\x01\xd0\x93\x90\xb0\xdb0\x0c\
-\x98\x86\x11\x9aU\x0c\xd3\xb4x\x88\xe80.\x8a\xad\xad\
-mX\xff\xeeF\x96\xcf\xe7\x09c\xec\x0f\x00\xce\x1e\x8e\
-\xe1\xdd_\xbc\xe4T\xac\xba\xf9\x87Xx\xc9E\xd1\x81\
-\x89\x00\xab2F\x05\x00\x17\x5cy\xed\xf8\xc6\x9a\xaa\xaf\
-\xa6\x93\xf1\xb3b\x9a2\xac:\x9b\xc1\x90\xa6\x06d3\
-Y_&/\x18\x0a\x963\x7fr/\x95/\x1c)\x03\
-@\x8c\xbf.\xa8CEk\xf7\x92\xaf\x00\xc3%B\x98\
-M\x02\xc7\x83\x087\x0d\x11\x88\xc2\x84y\x11\xac\xc4\x10\
-\xd1c\x5c\x96\x85\x0f\xb7le\x1b6n\x22\xf9|\xa1\
-\x0d\x04+@p\xf3\xc2\x8b/\xb2\xbew\xf3-\xb8\xf4\
-\x92\x0b\xa3\x83\x13\x9d\xf3\xe5\xb5\xaa\xf3\xaf\xbaVJh\
-\xea9C\xea\xb3\xe7$b\xda\x91\x8a,I\xe3\xc7\x8c\
-AUU\xca\xe7L\x0fcU\xa5\x80\x8awH\xe0\x17\
-D)\xe3\xa6'\x0a\x8b\xdaT\x05]\x14\xa2\xb5\xfbB\
-F\x0f\x94\x00H%<_A\xb6\xcb}\x5c\xa2\xe1T\
-\xd4\xb5x()\x82\x16\xdfl\xdbF\xc10\xd8\xfaw\
-\xdf#\x1fn\xddJ\x19c\x9b\x09#\xa7]:\xef\xc2\
-\x7fDL\xcbYrtv\xf6\xafE\xcbW\xe1\xc9\xb5\
-\xabq\xe8G?!\x9dt\xf2\x7f\x1cY\x97I\xdd2\
-\xb4>{~*\x11\x1bYWS\x8dI\x13\xc6\x93d\
-2\x01UU=\xdd\x89o\x9c1)\x8aR\xc4\xb6D\
-\x06&\x82\x95\xf8\xd5'\xa0\x87\x89\xe7!-\x8a\xa3\xb5\
-\xc7\xe2B\x9f0Ox\xfb\x19\xf4gWIH()\
-\xb2g~#\x0a\xeb\xa2\x11\xb6\x0979R[S\x8d\
-L\xba\x8a\xe4\xf3F\xba`\x14\xce\x99q\xca\xacfF\
-\xd8?W?\xf0@\xf7\xca\xef\xff\x00\xab\x1f| b\
-X\x11X9.\xf5\x8b\xbes]m\x22\xa6}cH\
-]\xf6<U\x96F\xd4\xd5V\x93\xa1\xcdM\xa8J\xa5\
-|\xc0\x13\xd6\x85\x93\x87x\xc1\x92\x1a\xf1\x84\x0ceR\
-\xa2_J\x08\xfb\x0e8\xeb\xc1\x01\xc0\xbcx\x17W/\
-l,\x93\x10\xe1\xe2z\xb0\xb8Z\x0c\x13E\xa6E)\
-\xf5\xb2\x8f\x5c\xd0\xef\xe8\xecb\xaf\xbf\xf1&1Ls\
-\x93$I\xcb\x17^r\xd1m\xabn\xfe!\xc0\x80\x85\
-\xf3.\x8a\x00\xeb`]'|\xe9\x5c\x1c;i\xcc\xb1\
-\xc9\x84\xbe\xa8\xa9&\xfdYY\x92\x94Q\xc3\x87\xb3\xfa\
-\xfaZ\x12dI\x95d\x01\xf9\x1d\x97\xff\x9b\xcf\xef\xc3\
-\xef\xda\xbc\x1e\x8f\x100J#\x80\xda\x0f\xc1\x0b\x92\xe4\
-\x81\x96/q\x22d\x139h\x95\xd2\xb6\x82\xfa\x96\xd8\
-U\x82\x7f}\xf5\xdf\xebXG\xd7v\xc2\x18\xbb\x97P\
-r\xfa\xc2\x05\x17\x99\x07\xe3n\x97\x0e\xf6\x10\x10\x00.\
-\xfa\xceuC?u\xf8\xf8K\x9b\xea2\xbfm\xaa\xc9\
-\x9cV[S\xadL>d\x02\x1a\x1b\xeb\x09\x0f\xf9\xb8\
-\xeb\x5c\x0c\x03\xc5P0\x0c\xc4\xbc\x894\xa2N\xe52\
-'ODg\x0c\xa0\xd4w\xd7\x8e\xd6\xfe\x116\x12B\
-@\xdc\x9e\xf1A\xb3\xae\x18\xf2\xf3\x96?\xe2\xb9\xc1\xcf\
-\x1b~n)\x8a\xe2\x9dc\xde\xa85w\x8b\xc5b8\
-b\xca\xa1d\xe2\xb8q,\x1e\x8b}\xc6\x06\xdd\xbc\xea\
-\xa6\x1f~\x8d\xff*7|\xff\xe6\x88a\x1d\xf0`\xe5\
-vTX\xb0\xf4\x86OVW%.\xac\xcf\xa6N%\
-\x84\xa8\x87\x8ckA:\x9d\x86\x1a\xd0\xa4\xc2t\xa90\
-_\x95\x17\x12\xcar\xe9\x9d\xcb\xef\xce\xd1:@\xb1\xac\
-\xb4g\xcev\xcd\xa3<<\x04\xd0_<\x1d\xc2\xb4x\
-X\xc9Y\x97a\x18l\xdd[\xeb\xc9\x96m\xdb,B\
-\xc8c\x8b\xe6]<=\x0a\x09\x0f\x02\xad\xea\xe2\xab\xaf\
-O&t\xf5\x8b5\xe9\xe4\xb9\xd5U\x89\xa3\xab\xaaR\
-l\xec\xe8QD\xd7u\xdf\x1d\xb0\x5c\x160\xd8\xfaE\
-\xecS\xc5D\xa7\xb9\xa0Wy\xe1Bt]\x1f\xb8\xd1\
-\xa2(\xd8#\x90Y$\xa4\xa8\xdf\x16\xd7\xbb\xca\xd9\x1f\
-\xc4\x10\xd1\xb6mlz\xff\x03\xb6\xfe\xbd\x8d\xc40\xcc\
-6\x02\xcc\xbcl\xc1%\xcf\xddp\xd3\xcd  X4\
-\xff\xe2\x08\xb0\x0e\x84\xc5\xbdU\x97\x5c\xbdbL:\xa9\
-\x9f\xd7X\x93\xfe\x9a\x22K\xb5c\xc7\x8cBmuu\
-Q\x88'\x02V\x18\xb3*5\x85F\xd4/\x82S`\
-\x06{\x9f\xf4h\xedF}\xcb\x05.\x22h\x95\xfc\x1c\
-\x00P\xb2\xdb\xa9\xd8\x93+\xa8k\x89\xc0\xd5\xd3\xd3\xcb\
-\xd6\xbd\xf56i\xef\xe8\xccI\x92\xf4\x83E\xf3/\xbe\
-\x22bX\x07P\xf8w\xe9\xd2\x95\x84\x10LM'c\
-\xf3\x1ak\xd2\xff\xa1k:\x990n4\x92\x89d\x11\
-P\x05\xc3\xbf \xb3\xe2\xec\x8a\x87\x00a\xcd\xe1\x82\xe5\
-\x1c\xd1:H\xc1\x8b3.W\x98\x17M\xa7\xc1\xb1d\
-b\x87S\x11\xb4D\xe0\xe2\x80\xc5'\x06\xad\x7fw\x03\
-{o\xd3\x07\x04\xc0\xcb\x8c\xb0O^>\x7f\xde\xf6\x1b\
-n\xbc\x19\x97-\xb8$\x02\xac\xfdu\xcd[\xbc\x22\xa1\
-*\xd2\x99M5\x99KR\x09\xfd\x90\x86\xfa:\x0c\x1f\
-\xd2\x0c]\xd7=q\x9c7\xd5\x0b\x02V)\x9d\x8a\x87\
-\x7fa\xa0$\x8e\x99\x8a\xc0*\x02-\xd1\x0eAJ\xdc\
-\xd4J5\x0c\x0c:\xe3\xc5\xec!oy\xb3\xad\xb5\x8d\
-\xad{\xebm\xd2\x97\xcb\xbd/\x11\xe9\xac\xcb\x16\x5c\xf2\
-\xc8\xca\xef\xdd\x8cE\x97\x1eX\xa0u@\x1bG\x17.\
-[\x85\xa7\x1e]\x8d\x85\xcbV6*\x8a\xf4\x9d\xd1M\
-\xf5\x0b\x131m\xf8\x98Q#0\xb4\xb9\x89i\x9aF\
-\xc4\xcc\x9f\x98\xb9\x11C\xc2r\xc3 \x82`\x15dU\
-\x11XE\x0b\x82T\xd0\xffTxG\x8e\xa0\xbcPn\
-\xf8\xadx\x0e\xc6t\x9d4\xd4\xd5\xb2|.\x97\xee\xe9\
-\xed;\xe3\xe4\x993{/\xbbt\xde\xdf\xaf\xff\xde\xf7\
-\xf1\xc8C\x0fF\x80\xb5?\xac\xa7\x1e]\x8dy\x8bW\
-\xb4\xa4\x12\xfa\xb5\xc3\x1bj\xce\x8c\xc7\xb4\xf4!\xe3Z\
-XmM\x0dQU\x95\x88)e\x0eT;\x12\xdaE\
-\xb0b\x5c\x97\x10\xfa\x9b\xfb\x9e\x1bL\x07\xda\xf5\x82\xf5\
-vw\x83\x10\x02U\xd3\x8azGEk\xcf\x03\x97\x8f\
-q\x09\xcf\x85\x01\x95\xa8\x89\x8a\xe0\x14\x06b\xdc%\xdf\
-\xd4X\x8f|\xa1@z{s\xa7L\x9dqJ\x15\x01\
-\xf9\xdb\xc3\x0f=`^\x7f\xe3\x81\x01\x5c\x07\xe4\xed\x7f\
-\xe1\xb2UX\xb5d!\xe6/Y\xf1\xd9\xc6\x9a\xf4\x82\
-t\x22v|u6\xad\xb6\x8c\x1a\xc9\x12\x89\x04\x09\xd3\
-\xabD\xdbBX\x08\xe8;\x81\x02'\x1d\x13m\x0a\x95\
-\x02\xd5^\x02\x0a\x02@UU\xdc\x7f\xe7\x9d\xb8\xef\xff\
-\xfe\x0f\x1f\xbc\xfb.b\x89\x04\x86\x8e\x1e\x8d\xd3\xce<\
-\x13\xc7M\x9b\x06\xd34#0\xd9g\x18\xd6_\xaf\xe8\
-1-\xe1\xe6\xb7\xa3\x101(\xc6\xf3^]\xadmm\
-x\xe9\xd5\x7f\x03\xc0\xd3 \xe4\x94+\x16\x5cr@L\
-\xf19\xa0\x00\x8b\x8f\xd4\xbat\xd9J\x02\xe0\xdc\xa6\x9a\
-\xf4Y\x99d\xfcc5\xd5Y6\xaee4\xe1:\x95\
-\x12\xe2\xb1\x0a\x96\xd6\x94\x02,\x9b\x1b\x05\x05\xad\x8aH\
-\x03\xf4\xdfr\x16F\xe9\x1ecb<\xdc(\xe4r\xf8\
-\xea\xf4\xe9x\xf9\x1f\xffp\xfe>\xae\xb9Q\x8a\x9ce\
-\xe1gw\xde\x89\x19\xa7\x9e\xea\x89\xbdQ\x08\xbb\x0f\xf4\
--!\x9bH9\x9b\x82\x93E$\x84\x84\x02\x16\xff\x1a\
-\x04-.\xc4\x9b\xa6\x89\xed\xdb\xbb\xf1\xf2k\xaf#\x97\
-/P0v\xc8\x15\x0b\xe7\xbf\x19\x01\xd6 [\xf3\x16\
-\xafH(\xb2\xf4\xad\xa1u\xd9sSq}\xdc\xf0a\
-C0\xa4\xb9\x09\xe5\xc0*,\x0b(\x8a\xea\x9c\x96\xdb\
-\xbc|\x86\x9fk(NY\xef\x10\xa48\xd8U\xf2\x9e\
-]\x04,0\x86\xd9G\x1e\x89\xb7\xd7\xadC\x22\x95\x82\
-\xa2i\xde\xdfe[\x16,\xd3DWw7n\xfc\xe5\
-/1\xf7?\xff\x13V\xc4\xb4\xf6\x1dh\xa1_\x94\xa7\
-\x94:7L\xf7\x1c\x0b\xcb$V\x22\xc6\x9b\xa6\x89\xbe\
-\xbe>\xf6\xea\xbf\xdf \xed\x1d\x9d9\x22I\x9f\xbf\xe2\
-\xd2y\xf7]\xb7\xea&\x5c\xb9p~\xa4a\xed\xbb\x10\
-p%\x9ezt5.[\xbe*-K\xd2\xe2\xd1\xcd\
-u\x97\xc4c\xea\xb0\x09\xe3[X}]\x1d\xe1e\x0f\
-\xa5:+\x84\x0d0\x15\xc1\xca\xa6\xd4\x01+B \x09\
-\xda\xd5`\x05+\x00\xd04\x0d\xd7\xcc\x9b\x87\xa7\xd7\xae\
-E\xba\xb6\x16\xa9l\x16\xa9\xeaj\xa4\xb2Y\xc4\xab\xaa\
-\xa0\xc7b\x90U\x15\xaa,c\xf5\x1f\xff\x88\x9a\xdaZ\
-L>\xea\xa8\x88e\xed#m\xcb\x13\xe1]\xe0\xb2m\
-\xdbik#I\x90B\x84\xf6\xa0\x9e\x15\xfc7\xe19\
-RWS\xcd\x0c\xc3T\xbb\xba{\xbe8\xe3\x94Y[\
-\xae\x5c8\xff\xf9\xebV\xdd\x88GV?\x141\xac}\
-\x15\x06.XrC\x83\xae\xa9K\x87\xd6g>\x97\xd0\
-\xf5\xfa\xf1\xe3\xc6\xb0tU\x15\x09\xab\xf9\x13\x81\x8a\x0f\
-&\x05\xe0\xf3Uq\xb7\xba\xed\xde\xcd\x88{B\xec4\
-\xab\x12\x07\x90\x06_\xb6\x07\x0e\xc4\xf6\xceN||\xf8\
-p\xd446\xa2\xaa\xa6\x06\xc9l\x16\xf1T\x0a\x8a\xaa\
-:\x05\xb9\x85\x02\xfa\xba\xbb\xd1\xdd\xd6\x86\x9e\xf6v\x18\
-\xb9\x1c\xee|\xfai\x8c\x1e?\x1e\xd4\xb6\xa3\xba\xc6}\
-\xcc\xb8@\x08,\xdb\xee\xaf\xa6\x10\x993P\xd4g+\
-\xd8\xc94\xa8i1\xc6\xf0\xf2\xab\xaf\xb3\x0f\xb7l%\
-\x8c\xb1\xf9\x00\xb9\xf9\xcaE\xf3\xf7\xbb\x8c\x8br \x80\
-\xd5\xfc%+&'\xe3\xda\xbc\xe6\x9a\xcc\x97R\xa9D\
-r\xdc\x98\xd1\xac\xaa*ED&%Z\x15J\xb9\xd6\
-\xc5\xbb\x14uY\x15\xa7\xe2\x92,\xef\x1aX\x95y\xbd\
-(\xba\xee\xae\x13~\xe3;\xef S[\x8blc#\
-\xb2\x0d\x0dHUWC\x8f\xc7!+\x0a\x18\x00\xcb0\
-\x10\xef\xe9\x81\xaa\xeb\x90d\x19\x1d[\xb6\xe0[\xb3g\
-\xe3\xaeg\x9fE\x22\x99\xdc+,0Z\xa5\x19\x17\x5c\
--\x8b\x0f\xae\xf0\xb2\xd4B\xd6P\xf4\xf9\xd9.\xb8\x95\
-\xd2^M\xd3\xc4\xa4\x09\xe3H&]\xc5\xd6\xbd\xf9\xf6\
-M\x00\x0e\x07\xf0\xb5kW\xde\x88\xab\x16-\x88B\xc2\
-\xbd\xb1\x8e;a\x06>~\xd2\x8c\xc3\x13\xbav\xf5\x88\
-\xc6\x9a\xaf$\x93\x09u\xca\xc4\x09$\x16\x8f\x11\xb1\xa3\
-\x82h]\x08\xfa\xab8\xab\x12;\x84\xda\xc2\x04\x140\
-\x06\xd9\x15\xe3\xc9@O:\xb7N\xach\xdc{\x00\xa4\
-v;\xc3\x22\x04]\x9d\x9dXs\xff\xfd\xa8\x1b6\x0c\
-\xd5\x8d\x8dHe\xb3\x88%\x93\xd0\xe2qh\xb1\x184\
-]\x87\xa2\xebP\xdc\x86\x82\x8c1t\xb6\xb7\xe3\xa5\xa7\
-\x9f\xc6\xa9_\xfd\xaaW\xe3V\x11\x1b\x88\xd6\x1e\xc2-\
-\xe2\xdd<\xf91\x92\x026\x08\xf1q\xb0i`\x98\x1d\
-\x22\x99H\x10]W\xd9\xd6m\xedGL?\xf9\x94\xa3\
-\xaeZ\xb4\xe0\x7f\x01\xe0\xba\x1b\xbe\x87G\x1e~(\x02\
-\xac=\xc5\xac\x9e\x5c\xbb\x1a\xc7\x9d8\xfd\xc8\xaaD\xec\
-\xaa\xe6\xda\xccg3\xe9\x942q\xc28\x22\xb6\xe8(\
-\xa7Y\x85MY\x06\xe0\x85\x80|Sd\xd9\x11?\x07\
-Z\xb0\x5c\xc2\x8f\xb5\xc7\xc1\xca\xfd]\xab\xd2i\xdc{\
-\xd7]\xa8\x192\xc4cW\x8a\xeb\xe4\x97$\x09\x92,\
-C\xe6}\xe5]\x8f\x16\xb5,\xbc\xf6\xc2\x0b\x90%\x09\
-\x1f\xf9\xf8\xc7K\xebYA\x90\x8a@k\x0fE\x86\x0e\
-@q\x81\xdd\x032\x97i\x95\x02.\xf1q\xd8\xf7U\
-\xc9$I\xa6\x92l[[\xfb!'M\x9b>a\xfa\
-\x8c\x93\xffx\xe5e\x97\xee\x17\x07q\xbf\xeb\x87\xb5\xb0\
-_\xb3\xfah*\xa6\xcfk\xacN\xcf\xa9\xa9\xce\xc4\xc6\
-\x8f\x1d\xc3t]/\xeaYU\xca\x08\x1a\x14(\x99\x0b\
-V\xb6m\x83\xba\x9a\x80\xea\x86\x8f\x9e\xc0>\xd0\xad\x84\
-V\xb5'\xc1\x8a\x9f\x9c\xa9T\x0a\x9f\x98>\x1d\xaa\xae\
-C\xd5\xb4~;\x83P2$+\x0a\xb4x\x1c\xa9l\
-\x16\x99\xfazd\xea\xebQ?l\x18~\x7f\xeb\xad\x9e\
-\xc1\xd4\x07J\xa2\x16'~\xbf3\xfb&\xdav\xb8q\
-\x96\xa4\xba\x0c\xdf\x97\x15t\x93@\x01\xe3\xa8O\xee\x10\
-\xdbx\x8b7qEU\xd1X_G\x8e>\xfcP&\
-\xcb\xf2\x97A\xc8Z\x00\xf8\xee\x0d7F\x0ckw3\
-\xabU\x8b\x17b\xc1\xd2\x1b\x8eN'cK\x86\xd4U\
-\x7f>\x9bM\xcb\x13\xc7\xb7@U5R\xaa\xc7z\x18\
-\xb3\xf2@K\x92<\xbd\xca\x1b\x86\x09@\x16\xc2\xc5]\
-\xbeS\x02E\x13\x87\x81=\x9b\xf1\xb0)\xc5\xe1G\x1f\
-\x8dW\xff\xf5/\x98\xb6]\xd2+\xc6\xd9\x96\xe4\xfe\xad\
-\xd4\xb2\xd0\xd3\xd5\x85\xe1\xa3F\xe1\x90\xc3\x0e\x03\xb3\xed\
-\xf0\x84A\x19`\x8e\xd6\xee\xbd\xf90\xc6 \xf3\xf3\xd4\
-eZ\xe24pI8\x06a%<\xc1r\x1e\xbeT\
-U%\xa9d\x82mkm\x1bu\xe2\xb4\x19\x1f!\x84\
-\xdc\xb9f\xf5C\xf4\xbb7|\x0fk\x06ix\xb8\xdf\
-\x00\x16\x9fds\xe9\xb2\x95S\xab\xab\x12\x97\xd7g\x93\
-'\xd7\xd7V\xcb\xe3ZF3U\x0d\xaf\x09,\xe7\xb3\
-\x0a\x86\x80<\xe3\xc2\x0f\xb07\x82kw\x9ct.P\
-1\xec\xbd\xb4,c\x0c\xb1X\x0c\x1f9\xfah\xfc\xfd\
-\xa9\xa7|'y\x98NB\x08\xf1\xc0\xdb2\x0c<\xb3\
-v-N\xfb\xcaW\xa0\xa8j\xd4\x0du\x90hY\x5c\
-\xcf\x12YrP\xb7\xdaQh\xc8\x9f\xe3+\x91\x88\x93\
-tU\x8am\xdd\xd6:\x81R\xfa\x895\x0f?\xf4\xdf\
-k\x06\xb1\x96\xb5\xdf\x00\x96[\xc4|DLU\xbe\xd5\
-T\x979\xbd\xae:\xab\x8ck\x19C\xc4\x02f\xb1\x15\
-mX\x8b\x18\xef\x8e$\xfa\xab\x5c\x06a\xd9\xb6w\xf7\
-Q\x14\xc5\xa9\xb3s\xcbpv\xc7F\xb0w=$\xfc\
-\xe4\xd6t\x1d\xc3\x87\x0f\xc7\x8b/\xbe\x18:\x04\x83k\
-\x22\xa2.b[\x16\xbaZ[a\x14\x0a8\xf6\x84\x13\
-@\x85)>\xd1\xb6\xef6)\xa4\x1b\x88\x08>\xb2+\
-_T\xc2\xb4\xf8WJ)4M%\x0d\xb5\xb5\xf8p\
-\xeb\xb6\xd1'N\x9b~\xf2\xb4\xe93~\xbd\xe6\xe1\xd5\
-\x83R\xd3\x1a\xf4\x1a\x16\xef\xbb\xbe`\xe9\x0d\x93\xe2\xba\
-\xbahXC\xf5\x195\xd9\x8c2~l\x8b\xcfc\x15\
-\xec\xb6\x10l\x0f#\xa6|)\xef7\xc4K\x1c\x5cg\
-1\xcf\xaaH\xbcT\x82\xb1\xdd\xb6a\x1fl\x04\x8e_\
-g\xc2\x84\x09\x18\xd2\xdc\xec\xa5\xc8\xc3\xfa0\x81\x10(\
-\x9a\x86x*\x85T6\x8b\xaa\x9a\x1a\xdc\xf1\xab_\xe1\
-\xc3\xf7\xdf\xf7\xea'I\xb4\xed\xd3\x8d\xdb\x1b\x82\x03.\
-<m\x8b\x9b\x9b\x03\xe7\xbb\x98\x19\x0f\xeaZ\xbco|\
-\xaa*\x85\xc3'Od\xb2D\x8eg\xc0\x8f\x00\xe0\x9a\
-\x15\xdf\x8b\x18\xd6@\xd7\x93kWc\xe1\xb2\x95CT\
-E\x9e?\xac\xbe\xfa\xcb\x99\xaa\x94\xee\x0a\xec$L\x5c\
-\xe7@%\x162\xfb\xc0J\xd0\xab8\xbd\x16\xef>J\
-\xb9^\xec\xfbc8\xe1\x86\xbdS\xa6L\xc1\xda\xb5k\
-}-\x9dKv\x07\xa0\x14\xa6a\xa0\xa7\xab\x0b\x8f\xfc\
-\xe9O\x98}\xc6\x19\xbb5D\x8e\xd6\xae\x85\x86\x92\x1b\
-\x1d\x84\xb67\xe2L\xabT\xd8\x1f`X\xa2\xae\xa5\xeb\
-*\xc9\xa43\xf8\xe0\xc3-\x1f\x9d:\xe3\x94\xba\xab/\
-\xbf\xf4\xfekV\xac\xc2\xda\x87WG\x80U\x89f\xf5\
-\xd4\xa3\xab\xb1`\xe9\x0d\x8d\xaa\xa2\xac\x18\xd1XsF\
-*\x19OL\x994\x11\x1c\xac\xc4\xbbE\xa9\x96\xc6\x22\
-hQJaQ\x0a\x16L\x13\x0b\x9e\x15\x8fV\x1f@\
-\x1bc\x0c\xaa\xaab\xd3\xc6\x8d\xd8\xd6\xda\xea\xfd\xbd\xc1\
-M\x9c\xecc[\x16,\xc3\xc0\x87\x9b6!\x1e\x8f\xe3\
-\xe8O~\xb2roV\xb4\xf6\xa48\xe9\xd5\x1b\x06\x8d\
-\xa3\xde\xb9\xec\x82VX\xaf\xad\xe0W\x7f+o@\xd3\
-TH\x12a\xed\x1d]\xc7L\x9d6\xbdp\xf5\x15\x8b\
-\xfev\xcd\x8a\x95\x83\x06\xb4\x06-`=\xf5\xe8j,\
-Z\xbe\xaaZ\x91\xc8e\xc3\x1b\xaa\xbf\x10\x8f\xeb\x99\xc9\
-\x87L(bV\xe5\x9a\xed\x89\xf4\xd8\xa6\x14T(g\
-\x08\x8b\xe9Uab\xef\x01s~\x0b'\xe8a\x87\x1f\
-\x8e\x97\xfe\xf9O\x14\x0c#\x94YqF\xc6A\xce\xb6\
-,\xd8\x86\x81G\xef\xbb\x0f\x9f\xfe\xfc\xe7\x91J\xa7#\
-\x96\xb5\xefi\x96O\x80'!\xcew\x84\xd4\x19\x86\x09\
-\xf0\xa5\x9aLf\xd2i\xa2*\x0a\xdb\xbce\xeb\xf4\x19\
-\xa7\xccl\xbf\xfa\xf2E\xcfF\x0c\xab,\xbbZ\x85O\
-L=Y\xa5\x94^>\xac\xa1\xfa\x0b1M\x1dz\xe8\
-\xa4CX2\x91 ASh\xb0\xdc\xa6\x14Xq\xe7\
-\xbaeY>'\xb0\x976\x96e_\x91\xe9\x81\x14\x12\
-R\xf7\xe4\x94$\x09\x87\x1fq\x04\x9ex\xe2\x89\xd2\x7f\
-\xa7\x90\x11\xe4Z\x9fm\x18\xb0-\x0b\xc7O\x9d\x1a\x01\
-\xc6 \xb9\x09IB\xf3\xc5\xe0\xb9\xec=v\xb5\xd9\xb0\
-\x1bS0,\x0c~F*\x99 \xf1x\x1c\xdbZ\xdb\
-fM\x9bq\xf2\xb3'N\x9b\xf1\xd6\xdaGVG\x80\
-U\x04V\xcbWBUd\xc9\xa6\xf4\xec\xe6\xda\xec\xff\
-K\xc5\xf5\x89-\xa3G\xa2\xa6:[\xd2g\x15f\x0a\
-\xe5\x86O\xcf[%t\x5c\x08\xa3\xc3\x92$\x81\x91\x03\
-3\xbbD\xc0\xcb\xd3\x18\x92\xa9$\x1a\x1b\x1a\xf0R\xb9\
-\xac\xa1kq\xe0'\xbde\x18x\xf9\xd9gq\xd6\x85\
-\x17D\xee\x86Ar\x13b\xf0\xd7\x10\x96\x04-\xc0\xf1\
-\xd9\x95\x00\xabR\x00\xc6\x18C2\x11G>\x9fg\x9d\
-\xdb\xb7\xcf\x91$\xe9\xae\xb5\x0f\xafn\x8b\x00+\xa0[\
-\xadZ\xb2\x08\x1f\xfd\xe4\xb4\xcf\xd5e\x92g\xa5\x13\xb1\
-\xe3F\x0e\x1f\xc6\x9a\x9b\x1aI\xd8\xc4\xe5r\xa1 )\
-\x01Va\x14X\xe1B4\xd8\x01\x99]\x12Ot\xcb\
-\xb6\xd1\xdc<\x04o\xbe\xf1\x06:\xbb\xba\xca\x0a\xbc\xbc\
-\x08\xd7\xb6,twu\xe1\xb5\xe7_\xc0\xac\xb9s\xc1\
-\x22-kP\x80\x96\xe8\xcb\x0a\xca\x1b\xc1\xd1rR\x19\
-M+x\xdc\xc5\xf7\xd6TgIOO\xaf\xde\xd7\x97\
-\xfb\xdc\xd4i\xd3\x7fr\xd2\xb4\x93\xcd}\xc9\xb4\x06\x8d\
-\xada\xd1\xf2UX\xb5d\x11\x16.[\xf9\x89L*\
-vV]:5\xb5\xa1\xbe\x8e\x0d\x1f6\x84\x94\xea\xb9\
-\xceC\xc1\xe0@S\x08e\x0c\x94R\xafMG)\xe3\
-d\xe048\xa07\x02\x02\xc30p\xc6W\xbe\x02\xa3\
-P\x08\x15\xdfy\x17UEU\x11K\xa5\x90\xccf\x91\
-\xad\xad\xc5?\x9f}\x16]\x1d\x9d\x88\x0c\x06\x83\xe7V\
-\xa4\x94\xa8\xc6\xf0\x92L\xee\xb80\xcb\xb2\xbc\xfeZ\xc1\
-r\x1e~}q\x1f\xa3\xe8kTU\x15\x87M\x9e\x08\
-E\x96\x9b)\xf0\xf0\xe2+\x17a\xd9\xf5+#\x86\xf5\
-\xe4\xda\xd5\xb8t\xd9\xca\xd1\x9a\x22\xcdo\xae\xc9\xcc\xce\
-\xa4\xd3\xf2\x84qc\x88\xb8#\xc3\x5c\xeca\x9aU\xd0\
-\xbaP\xea\x8e\xe2\xf9\xae$\xe9\xa0\xbbC\xa7\xaa\xaa`\
-\x14\x0a\xd8\xb0aC(\x98{wm\xf7\xb1i\x9a\xe8\
-\xdb\xbe\x1d\xc3\x86\x0f\xc7\x84)S\xa2\xe1\x15\x83A\xcb\
-r\x8f\x11\x0d9\x16\xc1IN\x9e8/\x08\xf1\xe5\x0c\
-\xa5\xc1\xd5P_\xcb6~\xb0y\xf8I\xd3f\xb4,\
-\xb9b\xd1\x1f\x97_\xb7\x12\xfb\x82i\x0d\x0aE\xc25\
-\x87\xa6\x08p\xd3\xc8\xa6\xea\xaf$\x12\xf1\xf8\x91S\x0e\
-\xf5\xa1\xbc\xa6i^\x9b\xe3r`e\x97\xd0\xacJ\x1d\
-pUQ\x0e\xda\x93\xbd\xa7\xa7\x077\x5c\x7f=\x88\xcb\
-N\xc3\x96m\xdb(\xf4\xf6\xa2s\xcb\x16l\xd9\xb0\x01\
-\x1a\x80{\x9f\x7f\x1e\x85B!B\x8cA\xb2,7\x9a\
-(u\x0c\xc5\x1b3!\x04\xaa\xaa:m\x99\xddML\
-H\x05{\xc3\x17\x0a\x05\x14\x0a\x05\xe4\xf3yttv\
-\xb2\xa7\x9e}\x9e(\x8a\xf2\x9f\x8b\xafX\xf4\xeb\x83\x96\
-a=\xb9v5\x8e=a\xfa\xf9\x0d\xd9\xd4i\xc9D\
-\xacy\xf2\x84\xf1\x88\xc5t\x84\x89\xec\x9c\xc2\x8aa`\
-\x91uA\x00\xabr6\x05.\xcc\x1f\x8ce\x1e \x04\
-\xb1X\x0c\xeb^\x7f\x1d\x1d\x9d\x9d^Z\x5c\xdc\x843\
-\x1e\xd4\xb6a\x1a\x066\xae_\x8f\xc3?\xf614\x0e\
-\x1d\xba[K\x97\xa2m\x17\x92*\x82\xc5\xa1Tx\x18\
-\xcc(r!^|.l\x82\xb9\xb84M#D\x22\
-\xac\xad\xbd\xe3\xd4\xa9\xd3g\xdc\xb5\xf6\x91\x87\xb7\x1eT\
-\x80\xc5\xcd\xa1\x8b\x96\xaf\xfaj6\xa9\x9fS\x93N\x1d\
-6i\xc28\x96NW\x11\x91]\x95*h.\x02+\
-\xdeqA\x10\x85\xcb\xddux\xc8s\xd0* \x8ca\
-\xf2\x94)x\xfc\xb1\xc7\xfa[\xe8\x84\x9f\xf1\xa0\x8c\xc1\
-6\x0cP\xcbBW[\x1b\xa6}\xe63\xfd=\xc8\xa3\
-m\x9f&Tv\xd4\xb1V\x0c\x09)\xa5^\x8f\xad\xb0\
-n$a\xb2\x89Xh\x9dN\xa5H[{\x07r\xf9\
-\xc2\xe7O\x9c6\xe3\xfb'N\x9fN\x1f}\xe4\xe1\x83\
-CtwE\xf6q`\xf6g\xab\xab\x12\x1fijj\
-`\xe9t\x15)\xd5\x1a&\xd8m\xc1\xd3\xac\xdc\x03a\
-\xdb6h\xc84\xdd\xb0\x03\x08\xc0\xab\x19<\x985\x90\
-T*\x85\xc3\x0f;\xac\xac\x8b\x9dH\x12T]\x87\x9e\
-J!\x91N\xe3\xd1\x07\x1e\xf0j\x15\xa3\xb5o\x17\xd7\
-\x18\xa52Cq\x83Z\x95\xe5\x86\x80\xa6e\xf9\xae%\
-1\x81\xc5#\x19\x914\xf0\xc7\x1f;\xea\x08\x16\xd3\xf5\
-z\x80\xdd\xbb\xf4\xca\xcb\x0f\x0e\x86\xb5h\xd9*|\xea\
-\xe4Y\xf5\x96i~wDc\xcd\x97\x1b\xeaj\xd9\xb8\
-\x96QDU5_\xc3\xb1\x1d\x89\xec\xd4\x8d\xc19\xbb\
-\x0a\x8a\x88%\x91:\x1a#\xef\x85\x12-c\xc7\xe2\x81\
-\xbf\xfe\xd5\x99\x06]\x0e\xe0(\x85U(\xa0\xbb\xb3\x13\
-\x8a,\xe3\x88c\x8e\x89\xc4\xf7Ar\x1c\x01\x94\x0d\x0b\
-\x837\xeb\xa0i:\xec\xba)s\xc3'\x99t\x8a\xbd\
-\xbfy\xcb\xd8\x93\xa6N7\x1e]\xf3\xf0\xdf\x0eh\xc0\
-Z\xb4l\x15V.Y\x88\x8f\x1e\x7f\xe2\x05\x99\x84\xb2\
- \x93N\x91\xc3&O\xf4\x9a\xf0\x05\xc1\xaaT\xe7\x05\
-qN[\x98\x81\xae\xc4\xde\xf6\xf4\xab\xa8\xcc\xc4\xb9C\
-\xa7R)\xe4z{\xb1i\xd3\xa6\x92\x8d\xfex\x08\xc9\
-\xcbu\xdex\xe5\x15\xcc\xfe\xd2\x97\x9c\xb4z\xb4\x1f\x07\
-\xc7\xcd'\xa4\xe5L\xd8\xebDM\x8bO-\x17\xc3\xc3\
-\xe05$f\x1b\xf9WUU\x89\xaa\xaa\xd8\xd6\xdaz\
-\xe2I\xd3f\xfc\xe1\xa4\xa9\xd3[\x1f]\xb3\xe7C\x95\
-\xf5\x9d\x97\x00\x00 \x00IDAT\xc3\xbd\x1e\x12.\
-Z\xee\x80\xd5\xa2e\xab\xa6k\xc4^4\xa4\xb1\x9eL\
-\x1c?\xceW#XN\xab\x12wx\xd0\xba \x0a\x8b\
-\xa5\x80J\x8c\xf9i\xb4\x81\x12\x82\x5c>\x8fO\x9cp\
-\x02l\xd7\xb3\x13\xb61\x00\x92\xaaBK$\x10\xaf\xaa\
-BgG\x07\x1e{\xe8!H\x8a\x12\xed\xc3A\xb2\x0d\
-\xc4\x9e\xe3\x0d\xb7p#\x14K\x98\xba#\xce\xe7\x0c\xfa\
-\xb4\xc4\xbes\xc3\x876#\x9b\xcd\xc8\x94\xb2\xff\xcb\xef\
-%ue\xaf\x03\xd6\xca\xc5\x0bq\xc5\xb57\xd5ut\
-\xb4\xdd2\xb4\xb1\xbe\xb6:\x9be\xd5\xd9\x0c\xa9\xa4\xd4\
-&\xe8b\xa7\xe2t\x9b2\x14\x96\x0b\xc7\xfe\xf9\x80p\
-\x9d\xed\xd1\x06\x02T\xd7T\xa3\xae\xb6\xd6\xd7\xc5\x22L\
-\xcbRt\x1d\xb1T\x0az2\x89\xef\xce\x9f\x0fMU\
-\xa3}8\x18\x8e!XERHP\x88\xb7\x05\xd0\x12\
-\xabA\x82\xb5\xb9\xc1\xbes\xba\xeed\xf1\x8f8t\x12\
-\x93d\xe90\x1d\xf81\x00,\xfd\xee\xf5\x07NH8\
-\xef\xeak\xf1\xf4\xe3kp\xf8\xd1\xc7\xdc:fX\xd3\
-\xd4\xda\x9a,;t\xe2\x84\xa2\x1a\xc1R,\x8b\xef\xc8\
-R\xfd\xac\xca\x85\x80\xfc\xb1\xe7\xf6=P\x0b\x07wb\
-#\xcc\xd9'\xb5uu\xf8\xc7\xb3\xcfz\xa3\xbfJ\x85\
-\x86\xb6e\xc14\x0c\xb4o\xdb\x86I\x87\x1d\x86!\xc3\
-GD\xfbs\x10\x1cC\x80U\xac)\x8a\xe1\x1e\x15B\
-=Y\xb0;\x94[BI\x10Q\x15\x99m\xd9\xd6\xfa\
-\xd1\x13\xa7N\xfb\xdd\xb2\xab\xafl? \x00k\xd1\xf2\
-U\xb8q\xd9\xe58\xf7\xd2\xef\x5c\x18\xd7\x94\xcb\x9a\xea\
-jp\xc8\xf8\xb1$\x11\x8f\xfb\x9c\xeca\xcd\xf8|\x22\
-\xbb\xeb\xb5\xb2\x85Pp\x87\xcc\x8a\x03W\xd0\xd9\x1b\xe5\
-\xc5\xbd\x8dR\x8a!C\x86`\xd3\xc6\x8d\xd8\xbam\xdb\
-\x0e\x0d\xb7\xb6a\xc06M\xe4\xba\xbbq\xd2\xacY`\
-\xee\x1d>\xda\x97\xd8\xa7\x1e\x87\x81&A\x82\x22<\xe0\
-\x9f\x80.jZ\xe2{D\xbbCU*Er\xb9\x1c\
-\xba{z\xbf|\xe2\xd4i?=q\xeat\xe3\xb15\
-\x8f\xec\xdf!\xe1\xca\xc5\x0b\xb1x\xd5\x8f\xd3\x96i\xac\
-\x1c;j\x18\x86\x0dmf\xd9L\x1aau\x82\xe2P\
-S\x91Yy\x19AWl'eR\xb9E-\x83\x83\
-\xd9\x8f(\xbbU\xc4\x9c\x0a\x85\x02\xa6\xcd\x98\x81|.\
-W6E\xaej\x1a\xf4T\x0a\xc9L\x06\xffr\xbb>\
-D\x09\x8c\xc1!\xbc\x97\xbd&\xca\xbcG\xf42\x9a\xa6\
-Ydw\x10\xa3\x1d\x91\x5c\xf0\xca\x93\x09c[\x18c\
-\xac\x0e K\x96}\xe7\x0a,\xbef\xcf\x84\x86{\x85\
-a\x9dy\xce\xf9\xf8\xc4\xf4YRG{\xebK\xa3\x87\
-\x0fi\xac\xc9fp\xc8\xf8\xb1>sh\xd0\xc9.\x82\
-\x16\xefcM]\xb0\x12\xcb\x10\x8a.\x14\x11\x9cB\x86\
-\x99\x12>\x5c\x22ri\xfb7w\x1f546\xe2\xe5\
-\x17_DOoohgR\xceZy\xdb\x99-\x9b\
-6\xe1\xe8\xe3\x8fGCs\xb3\xd3w+\xda\xf6y+\
-\xa1\x816\xa1\xf4\x8e\xad \xafH\x81\xe6\x7fAF\x16\
-\xfc\x9e\x10BR\xc9\x046o\xd9z\xfc\x89S\xa7\xdd\
-\xbd\xfc\xea+\xf7\x88\x0b~\x8f3\xac/\x9c\xf9u\xfc\
-\xe6\xb6\x1f\xa3g{\xe7\xfc\xb8\xae\x8d\xcfT%Y\xcb\
-\xe8\x91P\x02-\x8d\xcb5\xe1c\x8c9@%hV\
-\xa1w\x11\x0eP!\xac*\x8cQD[`#N'\
-\x87\x99\xb3f9\x19\xc32,K\xd64h\xc9$\x12\
-\x99\x0c~\xf9\xc3\x1fBr{\xe1G\xdb\xbe?\x86\x03\
-\x0d\x05\x83\x99C\xde\xe1\x84\x0a5\x88\xa5\x06Z\x88r\
-NcC=\xeakk\xc1\x18\xbb\x1d\x00\xae^~\xdd\
-n\xc7\x93=Z\xf9;k\xce\x5c\xfc\xe17\xbf\xc4\xdc\
-3\xce\x9a\xa8*\xea\xaa\xc9cG\xa3\xbe\xbe\x96d3\
-\x19(\x01\x81=\x08V\xbe\x8c\xa0P\xa0i\x0b\xe3\xb8\
-\x8a\x80\x8a\x10\x80;\xb6K\x8c\x88\x07\x00\x12\xf5s*\
-\xb9lJ1r\xd4(g_Q\xea1\xaf\xa0.\xa8\
-(\x0a\xb4X\x0c\xc9t\x1a/=\xff<\xb6\xb7\xb7#\
-\x91JE\xee\xf7}\x1f\x17Vt\x0c<[\x03\x8a\xbb\
-5X\xae\x03\xde\xb6mHn\xdd\xaex\xcd1\xc6\xa0\
-(\x8a\x97\xa5WU\xd5{<\xe9\x90qX\xfb\xf8\xb6\
-)W_s\xdd\x19\xd7\x5c}\xe5\xed\xfb\x15\xc3\xcad\
-k\x00\x00\xb1D\xea\x81aC\x1a\x99$+l\xe4\x88\
-\xe1\x15\x0d\x8c\x10\xd9\x95\xe8d\xf7\xf5\xae\x0e\xb3,\x94\
-\x18\xfa\xe9\xab\xb7\x8a\xc6\xa0\x97\xde\x00$\x93Id3\
-\x19X;\xb08\xa8\x9a\x06-\x91\x80\xa4(x\xe9\xb9\
-\xe7\xbcb\xf2h\xdb\xb7\xc7\x0f;(I\x13\xc3\xfbR\
-M\xfc8\x00Y\x82!\xbbT\x1f-Q\x87\xaeJ\xa5\
-p\xc8\xf8\x16\x80\xb1\xdf.^~\xed\x90\xab\x97]\xbb\
-\xff\x00\xd6\xff\xfe\xf7m8\xedKg\xde]\x9d\xcd\x8e\
-h\xae\xafC\xcb\x98\x11$\x1e\x8b\x85jUa`\xc5\
-\xef\xf8As\xa88\xdd\xa5H`/E\x81Q\xbe@\
-4Z~\x11v\xc6)\xa7\xa0\x90\xcb\xf9&\x0d\xfb6\
-\x00\xb2\xcb\xb2\xf4D\x02\x0f\xdes\xcf\x0eK{\xa2\xb5\
-\xf7\x12(%t\xa6\xd0\xac`\xf0\xb5b'S\x9e\xe4\
-\xf2\xb4\xad\x90\xf0P\x14\xdfeY\xc6\xa8\x11\xc3Y,\
-\xa6\x831v\xe35K\xae\xc2\xe2\xe5\xd7\x0en\xc0\x9a\
-5{.\x00\xe03\xa7\x7f\xe1\xf8tu\xedicF\
-\x0cc\xf1x\x8c\xd4\xd7\xd6\xfa4\xabr-\x8e\x01\x14\
-\xd5\x08\x16\xed\xe4\x1d0+\x16\x04+>\x22\x09\x91+\
-\xba\xec\xc6\x18>v\xcc1P\xdddG\xa9\x91`\x92\
-,;\x80\x95L\xe2\x89\x87\x1fF\xdb\xb6m\xd1\xbe\x1b\
-\x04\xc7\x0e\x81R\x1a\xfe\xb8\x12\xdf\xa2\x18\x1a\x8a}\xb2\
-J\xb9\xe0\xc5Mp\xc2\x93#\x0f\x9d\x0c\x00_Z\xbc\
-\xfc\xda\xa3\x97/\xbejpg\x09\xdfZ\xf7:\x00\xe0\
-\xd0#\x8f~f\xc4\xb0a\xa9\xdal\x9a\x1c2~,\
-\x92\xc9$Je\x06}\xa0\xe5f\xf0,\xd7oU\xd4\
-\xab'`\x06\x0d\xa3\xc0L\x08\x03}\xfa\xd5A\xdeR\
-\xa6\xb2\x09\xc3\x80\xa2(x\xeb\xcd7\xd1\xd1\xde\x0eH\
-RI]\x84R\x0a\xdb0\xd0\xdd\xd1\x81\xa1\xc3\x86a\
-\xdc\xc4I\x88\xecX\x83Ct\x17\xb3\xbcA\xad\xaaR\
-Q^\x94a\x82\xb3\x0e\x83\x04B\xbc\xa1)\x8a\x8c\xde\
-\xde>l\xef\xe99\xeeSS\xa7\xfd\xf4S'M\xc5\
-\xe3k\xd7\x0c>\xc0\x9a9\xe7t\xbc\xb5\xeeu\xcc\x9c\
-}\xfa/\x87\x0c\x1b\xf1\xc9I\xe3[H6S\x85Q\
-#\x86\x876\xe4+%\xb6\x87\xb58.)\xb4\x87\x00\
-\x15\x1fo\xe5\xa7\xc8\x04\x91\x99a\xc7\x1b\x01\x03e\x14\
-[>\xd8\x8c\xb7\xde~;\xb4\xb9\x1fs\xf7?c\x0c\
-\x96i\xc22\x0c\xd8\x86\x81\x93f\x9e\x12\xed\xc3}\xdf\
-\x9e\xb1h8\xc5@}r>'\xbc{\x0dr2Q\
-\xaa\xa56\xff\xb9\xfcg\xc7\xe3:6l\xdc\xd4H\x80\
-\x87\xbe\xbb\xe4;\x1b\x07%\xc3zk\xdd\xeb\x985g\
-\xee\x94\xaaL\xf5O&\x1e2\x9e\xe8\x8aB&O\x9c\
-\x00=P8\x19\x16\x12z\xa57\x81P\xb0(./\
-cY\x10\xc5\xf5\xe0\xd4\x18\x108%$\xd1}x\x87\
-\x1b?\x01\x9f|\xe2\x09\xa8\xba^\xb6\xf4\x89\xda6\xcc\
-B\x01\xaa$a\xd6i\xa79\x87'\xda\x87\xfb\xee\xd8\
-\x05@gW\xf4\xcc\xa0\x14#\x85tu(%\xea\xab\
-n&\xb1\xbd\xb3\xf3s'\x9c4\xed\xa6\x13\xa6N\xb3\
-w\x95e\xedV[\xc3\xac9\xa7\x83\x10If\x8c=\
-5b\xc4H9S\x95Dmu5\x92\x89\x84\xcf\xbe\
- \xc6\xbf$0\xa5\x96\xba\x9e+\xf1\x0e!\xc4\x1f\xe5\
-\xb3 \x81\xaf\xa4\x12E2Z\xe1'+\x03&N\x9a\
-\x04#\x9fw\xec\x0a\xa5\xa6\xb3\xc82\x14U\x85\x16\x8b\
-\xe1\xfdM\x9b`\xdbvh'\xcbh\xed\xddcGw\
-\xd3\xa9\xee\x15I\xbb\xd9B\xdb\xb6\xa1\xca2\xe0\x96\xc9\
-I\xc2WQ\x84\xe7\xbd\xe1G\x0e\x1f\xca\xd6ox/\
-\xc3\x18;\xfb\x9a\xc5W\xfd\xd7\xa0\x11\xddg\xcd\x99\x8b\
-\xfb\xef\xb9\x1b\xb6m_T\xdb\xd0\x98\x1a1\xac\x99)\
-\xb2\x8cC\xc6\xb5\xf8\x00J\x0c\x05\x83\x9d\x0e\xc3\xfa[\
-y\xa2:\xa5%-\x0b\xacDH\x18\x86U\x910[\
-y\xdb\x19=\x16\xc3\xb0a\xc3\x9c\x11Q\xc2\xb1\x117\
-\x00\x90\x14\x05\xaa\xae\xa3\xa7\xb7\x17\xef\xbd\xf3N\x94\xd8\
-\xd8\xc7\x1b\xdb\x8d\xf7e\x91E\xf1\xeb\xd2\x16B\xcd0\
-\xf1\x9d\x0f\x8bQU\x15\x89D\x82\x8c\x1d=\x8aQJ\
-W\x0c\xaa\x90\xd0\x0d\x053\x92,\xaf9\xfc\xf0#\x91\
-J\xc4Hs}=jk\xaa\x8bz\xb3\x87M\xbe\xf1\
-<Wb\xe7\xd0\x0aB@\x94\x10\xd7\xcb\xbd6\xda*\
-\xdb(\xa5\xb0-\x0b\xaf\xbd\xf6\x9a\xe3d/\xe3\xef\xb1\
-L\x13\xb9\x9e\x1e(\xb2\x8c\x8f~\xe2\x13`\x94F\xfb\
-\x10\xfb\xac\x06z\x8fX]|\x02|\x08\x8b\x16\x05~\
-\x91xT\xa5\x92d\xd3\xfb\x9b\xf5\x8f\x7f\xea\x84\x9a\xc7\
-\x1f]\xf3\xc0>\x07\xacYsN\xc7\xb8C&\x811\
-\xfa`c\xf3\x90QcG\x8f&\x04\x14\x87N\x9a\xe8\
-\xeb\x07\xcd\xc1*h\xf7\xe7\x86C\x9eF\xe5\x8d\xc5\x08\
-\x0f\xff\xcau\x0e\x080\xab\x0a8n\x143\x0c \x1c\
-\xa8\xaa\xaa\xc2\xe3\x8f>Z2\xcc\xf3\x9a)\xda6\xcc\
-|\x1e\xad\x9b7c\xf6\x17\xbe\x10\xed\xe7\x03\xf0\x5c\x10\
-\xc3?\x00^\xd608\xa8\x82o\xa2\x97\x8b\x00l\xcb\
-\xb6\xd6\xf1'L\x9d\xf6\xe3\xc7\x1f]c\xee\xd3\x90\xf0\
-\xfe{\xee\x06c\xec(I\x92?5y\xd2dF\x08\
-\xc5\xc8\xe1\xc3\xa0\xaa\xa5'\xdd\x04;\x88R\x01\xac\x08\
-\xd7\xae*M\xc1\x0e\xe4\xce\x12\xec\xe2\x10m%7F\
-)jjk\xa1\xaa\xaao\x12QQv\xc8\xf5d\xa9\
-\xba\x8e-\x9b7\xa3\xbb\xb33\xda\x7f\xfbz\xdb\x03,\
-\xab(\x13(\xfc[X\xcd\xa1Xo8t\xe8\x10\xa2\
-(J\x0dc\xec\x8b\x83B\xc3\x02\xf0\xe8\xf8\x09\x87\x90\
-d<F\xc0\x18\xeakk\x8a\xe2\xdb`_v\xaf\xfc\
-\x06\xfd\x8ev\xc6\xb5\xaa\x1d\x00\x14\x1b@\x18X\xa4u\
-E%\x1c\x15m\x04\x8e\x1f\xab\xa5\xa5\x05\x96a\x944\
-\x91\x02N\x03@Y\xd3\xc0\x00\xb4\xb5\xb6F\xfbo_\
-\x97\xe7\xec\xc1\xd0\x90g\xf1m\xdb\xf6\xba:\x045i\
-I\x92\x047\x80\x03Z\x13\xc7\xb7\x00\xc0/\xaeZz\
-\x8d\xbaO\x00\x8b;\xdag\xce>\xfd\x5c]\xd7\xabF\
-\x8d\x1c\xc5(5\xd1\xd8P\x8fD\x22Q\xb2]\x8c\xf8\
-\x87\xb1@as\xd9T\xac\x98B\xdd\x89\xa4\x1f\x81\xd3\
-F%\x12f+\x17\xdemJq\xe2I'\xc10\x8c\
-\x92e:b\xb6P\xd6u\xb4\xb7\xb6F=\xf3\xb1\xef\
-\x9c\xee{:\x18\x17k\x0d\xed@\xe3\xbf`\x9d\xa1,\
-\xf7\xd7\x1a6562\xd5\xe9f{\x1e\x00\x5c\xb5\xec\
-\xbb{\x17\xb0\xee\xff\xf3]\x00\x00\xcb\xb2\xae;\xe2\xf0\
-\xc3\x99\xa6\xcaD\x91%\x8c\x1c6\xcc\xc7\xae\xc2&\xde\
-\x884\x93\x0a\xa3\xb6K\xda\xe1\x18szX\xf1\xd2\x10\
-\x1e\xb6\x0cp\x8b\x84\xf7\x81\x0b\xb8\x13'O\x86\xec\xf6\
-\xc0*w\x12\xcb\x8a\x02E\xd3\xf0\xc6\xeb\xaf;7\xa7\
-h\xff\xed\x13\xa7;\xdb\x89\xebb\xa0\x1bgY\x96e\
-\xf9\xaee\x7fh\xe8w\x06\xc4b:\x19>l\x08\xa3\
-\x94^\xb6\xb3\x0e\xa3\x9d\x06\xacYs<v\xf5\xbd\xba\
-\xda\x9al}c\x13a\xccFu6\x0bMS\xcb\x1a\
-C\x8b\x8a\x9b\x03\x0d\xc4J\x5c\x11\x9e\x0f\x8b\x84d\x08\
-\x83\xf6\x86\xca\x03\xcah+\xb71\xc6\xa0\xe9:ZZ\
-Z\x9c\x06\x8a%\xa6\xea\x80\x10\x10I\x82\xac(\xf8\xd7\
-\x8b/BQU\xb0h\xffa_\xb8\xdc\xf7\x82\x02\xef\
-\x85\x86a\x13w\xc4\x08\xca\xc3\x01Y\x86,\xc98\xa4\
-e\x0c\xd1u\xbd\xf9\xaa\xa5\xdf\x9d\xfb\xdd%\xdf\x19\xf0\
-\x8f\xde\x05\xe3(\xc3\xac9s\x13\x96e}{\xdc\xb8\
-q\x8c\x00\xc4\xb6,\x0ckn.\x0a\x01\x83\xf1-G\
-d;0Z\x9e\xed(\x1c,S3\x18\x04\xafrx\
-E\xa2\xbe\x0d\x03Z\xa6i\xa0\xa9\xa9\x09\xeb\xdf}\x17\
-\x92\xa2\x94\x0c\xb7%Y\x86\xa2ix\xf1\xb9\xe7\xc0\x98\
-\x93<\x89\xd6>\xc8\xe8\xedV'V\x09\xf2\xe0^\x93\
-\xbc\xd9\x9f\x1c\x02V\xb2,\xc1\xb6%(\x8a\xdfP\xda\
-\xd8P\x87\x8d\x9b6\xaf\xb8j\xe95\x7fd\x00\xbdn\
-\xe9\xd5{\x9ea\xb9\x99\xc1\xe5\xf5u\xb5\xc9\xd1\xa3[\
-\x08a\x14\x99t\x1a\x99t\x95\x0fY\xcb\xb6\x8eq\x11\
-\x9a\x09\xdd\x18\xcan\x80\xff\xab\x1b\x1a\xb2\x01\x84\x87.\
-2F[\x85\x1ba\x04\xd4\xa6h\x1e:\xd4\x9b[X\
-\x8a\xb7J.\xc3\xea\xeb\xeb\xc3\xfauo8\x17M\xb4\
-\x0f\xf7\xe2\xe6\x1e\x0b\xba\xe7CB\xe6FF\x96e\xc1\
-\xb6,\xafwZ\x90\xa0\xc8\xb2\x04I\x96!+\x8a\xb3\
-\xc9\x0a\x86573\x9b\xd2\xd1\x00\xa9\x1b\xe88\xc3\x9d\
-bXn88\x941\xb6\xe0\xf8c?\xc6\xfa\xf2y\
-\x02fc\xd4\x88aNX\x10b\x0a-\xeaj\xe8\x86\
-\x17,0\xe0\xb4,\xaa\x97i\x81L+\x14\xe1\x99\x8b\
-W\xd1\x1a\xd0-\x1b-c\xc7\x22\x9f\xcbA\xd5uO\
-K\x0cjX\x90$\xcf\xde\xf0\xe2s\xcfa\xc8\xc8\x91\
-\xfbm)\x14\xf7\x00\xf2H\x81\xda6r\xb9\x1c\xa8m\
-\xa3\xaf\xb7\x17\xaa\xaa\xc20\x0c\xa8\xaa\x0a\x06 \x93\xcd\
-z\xf6\x0f\x1e.A(\x12\xdfk\xbf\xb5\xa0\xd3\xee)\
-?\x96WT\xed\xee#\xde\x82F\xd24\x9f\x00\xcfm\
-J\xb2\xac@\x96-\xc8\x92\xc3\xb4\xea\xebjI]M\
-V\xee\xe8\xdc~\xddu\xcb\xae>{\x8f\x02\xd6\xcc\xd9\
-\xa7\xe3\xfe{\xee\xc2)\x9f=}QmM\x16\xb1D\
-\x15\x0a\x86\x01EQP\x95J\xf9\x04\xf60\xd0\xf2\x8d\
-\x98w\xeb\x06\xb9\xd8\xbe\xe3X.\x00V\x02\xf3%\x03\
-\x88\xe2\xc9\x1ef\xcc\x07\xdc\x22\x04\xe3&L@!\x9f\
-G\x92\xd2\xd0q\xf6\x9e\x1fKQ\xa0'\x12X\xf7\xda\
-k\xf8\xf4\xdc\xb9\xfb\xdd\x9f*I\x124]\x87,\xcb\
-\xd8\xb2y3\x1e{\xe0\x01<t\xcf=\x00\x80m[\
-\xb6\xc06MtwwC\xd34\x98\x86\xe1\xccpd\
-\x0c\xc3\xc7\x8c\x01c\x0c\xa3ZZ0\xa2\xa5\x05\xb3N\
-?\x1d\x0d\xcd\xcd\x00\x00\xc30`\xbb=\xa5\xf6\xf4r\
-\xfaa\xedn5\xcb\xb9`\x9c\x9b\x94\xdb\xa5\x03\x0c\xee\
-\x7f\xb0-\x0bp[+\xab\xae\x1c\xe4\x80\x9a\x04B$\
-\xc8\x92\xe4\x81\x95,+0-\x13\xe3[F\xe3\xd9\x17\
-^\xfa\xc6UK\xaf\xb9\x9c\x01\xad\x95\x86\x85\x03\x06\xac\
-\x07\xfe|\xb7\xb3c\xa8}\xd1\xb1\x1f=\x1a\x96\xcd\x08\
-\xb3-446A\xd3\xb4\x22\xa1=8\xae\x0b\x00,\
-\x9e\x12\xb5\x5c\x1b\x03\xad\x08f\x1c\x1e\xe5\xf3\x9a0\x07\
-\xbb\xd8\xc0\x18\x16\x91\x10!\xd6N\xa4\xb2\x0f=\xf4P\
-l\xfc\xe0\x83P\xc0\xf2\xd8\xb3$A\xd14l\xdb\xb2\
-e\xc0\xd3[\xf6\x12Y\x0c\xed\xc8i[\x16\x0a\x85\x02\
->\xd8\xb8\x11\x7f\xfc\xedo\xf1\xbf?\xff9\xbas9\
-(.\x88\x117\xa9 2\x0b\xae\xe30\x00\xeb\xdf|\
-\x13\x0c\xc0Z\xd7\xa2\xb3\xf8\x92K0\xe5\xf0\xc3q\xcc\
-\xa7>\x85\x19s\xe6`\xf2\x91GB\x0d\x0c\xa8\xdd\x13\
-\xf7M\xd6\xdf\xadr7\x03!\x15~W\xe6\x81#\x7f\
-\x8e\xda\x14\x16l(\xb2\xe2^\xeb\x12\x08\xa1\x90$\x02\
-I\x22Pd\x09\x96,CQ$\xc8\x96\x84L:\x0d\
-UQ`\x98\xe6\xd9\xd7-[\x5cq\x9d\xe1\xce\x86\x84\
-?\xab\xa9\xceb\xe4\xc8\x91\xf8`K+\x08\x01F\x0d\
-\x1fVv\x90\x84\x08X\xd4\x1b/\xcf\xd9\xd2\x00O5\
-\xa152\x11B<R!\xec1F\x22\xe1}\xc0\xc2\
-\xbb\x89\x8f|\xeccx\xf7\xce;!kZ\xe8E\xcf\
-\xbb\x90*\xaa\x8a\xf6\xb6\xb6AS\x9e#\x02\x03O\xb1\
-\x03\xc0\xbbo\xbd\x85\x7f>\xfd4\xdeZ\xb7\x0e\xffz\
-\xe1\x05<\xf3\xc4\x13\xe8(\x14\x10\x03\xa0\xab*\x92\xb1\
-\x18$Yv\xea(%\xa9\x1f\xb0\xc4\x9b\xa6\xa0\xe90\
-\xc6\xc0x&\xd5\xb6\xf1\xda+\xaf\xe0\xe5\x97^\xc2\x7f\
-\xddr\x0b\x0e?\xf4P\x9c\xfa\xe5/\xe3\xb8\x13OD\
-mC\x03\x86\x8d\x1c\x89|>\xbf[\xf7\x11\xf3\x22\x11\
-\xb6[\x01\xd09\xb6\xf0\x18U\xff\xf1\xe6\x84\x8b\x80R\
-\x1b\x12\x01L\x97e9\x0aA\x7fHm\xcb2$\xd9\
-\xf5h\xb9F\xd2\xa1C\x9a\xd8\xdb\xefl8\x13\xc0\x8a\
-\xab\x96.\xc7\xb5K\x17W\x16\xaaW\x1c\x0e\xce\x99\x0b\
-\x02TQJ7\x9e2\xf5\xc4L<]\x0d\xdb6P\
-]U\x85)\x93'B\xd7u\xe8\xba\x0eM\xd3\xbc\x82\
-g\x9fqT\x92`\xba\x83\x1a\x9d\xb6\xab;\xc3t\xdc\
-\xd3Op\xc4\xb3\x9d8\xb4R\x84W\x03\x0e\x0b\xdf\x7f\
-\xff}\x5c}\xe5\x95N\xbb\x99\x12a\xa1\xe5v\x1f\xb5\
-\xfb\xfa\xf0\xbb\xbf\xfc\xa5\xa2\xb1\xe7{\x14\xa8\x5cf\xc4\
-\x9b\xcf\xbd\xf2\xc2\x0b\xf8\xdf_\xfc\x02k\xff\xfaW\xe4\
-s9\xe4r9\xc7\xb1\xed\x0a\xc3\x12\xaf\xccP\x14\xc8\
-\xaa\xea\x89\xc5>\xe0r\x99\xa4\xa7\xe9\xf0*\x0d\xb7C\
-\xaemY\xb0M\x13\xb6i\x82\xda\xb6#L\xbb\x8f\xe3\
-\x89\x04dY\xc6\xd0\x11#p\xc7c\x8fA\xd34\xaf\
-\x1b\x06\xd9e\xb0\x02l\xb6;\x1a\xcb0\x01G\xfd<\
-\x90\xb1\xb0X\xc6y\xbd\xa3U\xc9\xd05\xd5\xcb \xda\
-\xb6\x0d\xd3\xb2`\x9a&\x0a\x85\x02\x0a\xf9\x02\xf2\x85<\
-r}9\xe4\xf29<\xf2\xe8\xdf`3{\xecuK\
-\x17\xbf\xbd\xdb\x19\xd6\x03\xf7\xdc\x85\x99\xb3O?M\x92\
-\xa4\xcc\xd8\x96\x16l\xda\xda\x06jS4\xd6\xd7\x85\x96\
-\xe1\x04Y\x16s\xa9#\xa8{p\xe8\xceRW\xc6y\
-j\x91~U\xd1\xa1\xe21~4\xadx@\xb7\xdaL\
-:\xed\x5c\x88\x94\x96N/\xbb=\xbf\xbb{{a\x18\
-\x06b\xb1\xd8\x9e\xe7\xb2\xae~Fx\xf8&I\xb0L\
-\x13m[\xb7b\xf3\xa6Mx\xe7\xad\xb7p\xef\x1f\xfe\
-\x80\xb5\x0f?\x0c\x13\x80\xee2(\xc95\xbaj<\x83\
-\xa5(\xce\xf89Ms6\xfeXU\x8bXV\x91\x10\
-\xed\xb2*j\xdb\xb0-\x0bf\xa1\xe0ub\xb5\x0c\x03\
-f\xa1\x00\xdb\xbdQ\x1b\x86\x81u\xaf\xbe\x8a\x91\xd5\xd5\
-8\xff\xbc\xf3\xf0\x85\xff\xfcO\x8c\x1e7\xce\xd5\x86v\
-a7P\x06Fw\xdd\xb6\xc3\xb3\xf0\x82\xf0\xd2\xcf\xaa\
-\x8a \x92\xbf\x1e\xa0\xb0A\x00\xd8\xb6\x04UQ\xdc(\
-\xcau\x06\x10\x09\x12q\xb2\x86\xb2k(Ue\x15\x99\
-L\x15\xda;\xban\x06\xf0\xd9\xdd\x0eX3g\x9f.\
-\x03\xf8\xc5\xa7O\x9e\x86\xbci\x82H\x04\xaa*\xa3\xae\
-\xae\xd6\x07TA\x13\x19\xff\xde\xb2m\xd8\xb6\x05\x9b\xb9\
-\xd9A\xb2\x93{\xd3\x13\xdc\x8bKu\xd8\x80>\x83E\
-\xa05@\x96\xa5j\x9acC\x91\xa4\x92\x94\x9d\xc82\
-l\xc6\xf0\xec\x93O\xe2\x84\x193JZ!v\x15\xa4\
-8p(.\xa37\x0c\x03O?\xf6\x18\x1e\xfc\xd3\x9f\
-\xb0~\xdd:\xbc\xbfa\x03\xde{\xe7\x1dX\x00TB\
-\x10\xd7u\xa4\x5c\xb6\xa4\xf0\x16G\x020\xa9\x1c\xa8\xdc\
-\xcdcX\x1c\xac\xb8\x8e\x15\xa2a1\xa1\x16\x96\x83\x96\
-e\x18\x0eh\x15\x0a0\xf2y\x18\xf9<L\x01\xbc\x14\
-\xd3\xc4\xaf\xfe\xeb\xbfp\xf7\xef~\x87OM\x9f\x8eU\
-\xbf\xf8\x85/\x811\xa0C\xe3\xb1+6\xf0,\xb8{\
-=0q\x0a\x95'\xdc\x93~S\xb7(\xe63\xe1\x0b\
-#\x00qZC\x810X\xb6\x04IV\x00\xb8\x9e,\
-\xeab\x80\xec\x9f\xb6cH\x06\x8646\xb2\xb6\xf6\xce\
-\x13\xaf\x5c\xb2\xac\x8a1\xd2}\xfd\xf2\xc5\xbbU\xc3\xfa\
-\xaa\xaeiJ\xcb\xe8Q\xd8\xb4\xad\x13\xd42\xd1\x18\x00\
-\xab\xb02\x1cn\xdb\xb7l\xea\xb2,\x1b\x84H;\xaf\
-\x0b2\x16\xa0J\xfd\xd8W\x09!\xe6\x13t$I\x8a\
-@h\x00`\xa5\xc7b\x88\xc7b(X\x16$7m\
-\x1d\x14\xde)\xfa\xcbt^x\xf6Y\x9c4s\xe6.\
-\x01V)\xe1\x9e2\x06\xa3P@\xae\xaf\x0fO\xad]\
-\x8b\xdf\xfe\xecgx\xe6\x99g\xa0\x00P\xf89(\xcb\
-\xd0\x13\x09\xc49@\xb9a\x9e\xa2\xaa\x90C\x00J\x11\
-\xc3@\xf7\xfd\xbc\x0f\x98\x8fY\x05\x7f\x1f\xb1\xbd\x8a\x00\
-\x5c\xb6e9!!\x07\xadB\x01\xa6\x00Z\x86k\x13\
-1\x0a\x05<\xf0\xa7?\xa1m\xdb6\xfc\xe8\xf7\xbfG\
-<\x91\x18\xd0\xbd\x5c\xf4&\x92\x9dH\x112\xf4\xfb\x18\
-I\xa0E6c\xb4\xbf\xdd5\xf3#$\xf5\xd8\x1cu\
-<{ \xa0\x94y\xfeJE\x22\xae\x96%9`e\
-\xbb\x9e,\xd9\xf9^Q\x1546\xd4\x93\x97^}-\
-%IR\xcb\xf5\xcb\x17\xbf\xb8[\x18\xd6\xac\xd9\xa7\xe3\
-\xfe?\xdf\x0d\x9b\xd2o\x8c\x1d3\x9a\x81H\xc44M\
-0F1\xb4\xb9)\xb4\xbfU\xb0f\xd0\xa6\xcc\xa3\xcc\
-\xe2\x0e\xd9i\xd2\xeaY\x1cJ\xc7\xf3\x15\xd1\xde\x88a\
-U\xbc\xb8[9\xe7vn(\x05.<S\xf8\xfe\x86\
-\x0d\xbb\x1a\xe59&d\x97\x0d\xf5l\xdf\x8e\x97\x9f\x7f\
-\x1e\xaf\xbf\xf4\x12\xde^\xb7\x0eO?\xf6\x18\xfe\xf5\xd6\
-[P\x00\xc4\x08AJ\xd7\xfdZ\x94\xdb02\x8cE\
-\xc9\xaa\x0aU\xd3\xfa5*\xaeS\xb9^\xb2P6U\
-\x06\xcc\xbdW\xc82d\x17@\x14\xce\xb8(\x85m\x9a\
-\xd0M\x13\x96\xabm\x19\xf9<\x0a}}(\xf4\xf5!\
-\xdf\xdb\x8bB>\x8f\xa7\x9fx\x02\xb3\x8e:\x0a\xe7]\
-~9\xce8\xe7\x9c~\xcb\xc0\x0e\xef%\xee\x14g\xd6\
-\x1f\xbe\x0d\xf4\xa6\xe0\x03/\xe2>\xc7\xfc!\xa1?\xfc\
-\x0c\xfe\x1bo=\xc3@$\x0a\xcb4\xa1\xe8Z\x7f\xe7\
-\x0f\xb1\x93\x83@pb\xf1\x18\x9a\x1b\xeb\xb1e[\xdb\
-w\x00|n\xb7\x89\xee3\xe7\xccm\x04\xa3\x1f^\xf8\
-\xad\xb3\xd1\xda\xd5\x8b\xbe\xbe\x1c\x18\xb5p\xec\xd1G!\
-\x91\x88{b\xbb\xae\xeb\xbe\xae\xa2\xfc\x174\xdc\x83e\
-\xd9v\x7f6c\xd7\x03m\xdf_1\x10/\x16\x00\xc8\
-B\x1b\x95hU\xb6~\xf0\xbd\x1b\xf1\xcf\x97^B<\
-\x99\x0cg>\x94\xc2,\x14\xd0\xdd\xde\x0e\xd9\xb6q\xfb\
-_\xfe\x5c1\x93\xf5e\xf3\xdcF\x8f\xdb;;\xf1\x97\
-?\xfc\x01w\xfe\xfa\xbf\xf1\xc1\xa6M\xc8\xf5\xf6\x22\x97\
-\xcbyZ\x99\x07N\xa2\x0e\xc5\x01J\xd7}@\xe5\x13\
-\xd1\x05\x16U\x94\x01\x14\x80`\xd7\xa2\xd6@S;\xae\
-q\xb9!\xa3\x91\xcf\xc3\xe8\xebC\xae\xb7\x17\xf9\x9e\x1e\
-\xe4\xba\xbbQ\xe8\xeb\x03\xb5m\x1cu\xcc\xc7\xf0\xcd\xf9\
-\x0bp\xdcI'V\xa4\xcdZ\xc2\xc0\xd3\xcaBH\x81\
-Ey\xc1_\xf1sA\xb0pdc\xff\x95\xe6\xfb\xce\
-\x1d@\xc2\x13o2!\xa0\xccM\xb4\x99\x82\xf8^(\
- \xe7&=:::\xf0\xe4\xb3\xcf\x01\x00\xb9n\xd9\
-\xee\x0a\x09\x19\xbbm\xf8\xd0\xa1H%\x92\xd8\xdc\xda\x05\
-j[\xa8\xaf\xad\x86\xaa\xfa\x07K\x88a\xa0\x87\xfe6\
-\x85m\xd9\xa0\x94\x81Q\x16\xc8/\xec\x06\x96E\x05\x0c\
-\x1b\xc0'P\x02Hd/\xd4^\x1d0Q!AC\
-}=,\xd3,9~\x8d\x08!a\xdb\x96-\xc8\xf7\
-\xe5\x10O$K\xde.\xb9 K\x08\xd0\xbd};\xb6\
-n\xde\x8cm\x1fn\xc1\x13\x8f<\x8c\xbbo\xbf\x1d\xef\
-n\xdd\xea\x88\xe4n\xb9\x17\x0f\xf3$\x0ePn\x88'\
-\x8a\xe5*\x07,U\xf5@J\x92e\x1f\x8b\x22!\xd5\
-\x17Elc7Y\x0e\xbc\xa4\x93k\xfb\x90\x18\x83b\
-\xdbPT\x15\xaa\xaeC\x8d\xc5\xa0\xea\xba\xf7\xbb\xe6\xfb\
-\xfa\xf0\x8f\xa7\xfe\x8e\x7f<\xf59\xfca\xcd\x1aL>\
-\xe2\x08/2)u-P{`\xbf+e444\
-,\xf77\xf7\xdb%\xfd\xef\xa5\x81\xcb\x92\xc2\xe9\xe2 \
-\xb9L\x1b\x0c\xee1v\x06V:\x9a \xf1\xfc\x9a\xb1\
-X\xdc\xb1>\xd8\xf6\xe7/_\xbc\xec\x8e\x15\xcb\x97\xec\
-<`\xb9e8iJ\xe9\xf4#\x0e\x9d\xccL\xcb\x22\
-\x941\x18\xa6\x81\xa1\xcd\xcdE\x13p\x825\x83\x84\x10\
-\x98\xb6\x05\xca(l\xdb\xf2\x19\xd4\xd9.\x83\x16?#\
-\xfc\xe5\x08\xacr\xc8\xab\x8c\xf2G\xcb\xdbcu\x0d\x0d\
-\xb0L\xb3\xf4\xa8s8)\x7f\x1e\x92uww#\x96\
-Hx\xfb\x98g\xf2TW3\xda\xb0~=\x1e\xb9\xf7\
-^<\xb9v-\xb6n\xde\x8cw\xde|\x13\xad]]\
-P\x00h\x8a\x82\xbax\xdc\xd3\x92|\x1a\x94{\xb1\x07\
-\xb3z\x22\xd3\xe2\xef\x13\x01\x0a%f\xf4\xb1=\xe8\x19\
-\xf3}6!\x8e\xd5C\x92@\x5c\x10\xe5\x7f\x8f\x22\xe8\
-k\x8a\xaa\x22\xdf\xd7\x87\xb3>\xf3\x19\xcc_\xba\x14_\
-\xbf\xf0B\xf4\xf6\xf4\x14\x9d\xab\x04p\xb4\xe1\x0a\xbcW\
-\x9cA\xf1\xb0\xcf{\xces\xad\x17'\xc2\xf8`]\xe6\
-\xcc\xc8\x0b\xbd\xbaDf\xc5\x88\xdb\x1e\x99QX\xd4\x82\
-\xcdTG\x03#p|X\xb6\x0c[\xb2]v\xeb`\
-\x87\xaa)HWU\xa1\xbd\xa3c\xf6\x8a\xe5K\xee\xd8\
-%\x86u\xbfce8\xc1\xb6i|\xe2!\xe3\xd1\xd1\
-\xdd\x07J-$\xe21\xa4R\x09\x9f\x93=\xcc\xd5\x0e\
-8V\x06\x87Y\x91\xfe\xaf\xd8\x1dN_\xd7\x8bE\xc9\
-N1,\x80\x81I\xd8\xa7^\xa1\xfdm\x8d\x1e3\x06\
-\xa6a\xb8\x89\x13RR\xcb\xe2m\x93\xb7m\xd9\x82\x86\
-\xa6&\xaf\x1c\xcb4\x0c\xbc\xff\xde{\xf8\xc3\xaf\x7f\x8d\
-\xbb~\xf3\x1bt\xf7\xf4@\xe6\xe7\x8e\x0bt\x99d\xd2\
-\x03<\x0eR\xaa(\x94\xbb %\xf3\x0b]\x00'Y\
-\x08\xf1\xf8\xac\x00\x22\xfa\xf5\x18\xdb\xa3\xe04P\xe6%\
-\x89M-\x05\x00\xebs\xff\xbe|o/\x96\xcc\x9f\x0f\
-\xcb\xb2\xf0\x95o~3\x5cl\xa7l\x87\x05\xb2Nw\
-&\x9e\x92\x22!\xac*|\x84E\xbf\xf2\xe2\xf7_\x89\
-\x83\x8a=\x97\x91\x9b\xf2\x22\x84\xc02-\xc8D\x86%\
-YPU\x87Q\x11[\xb08p\x9d\xdb\x05\xad\xe6\xa6\
-\x06lkk;a\xb7\x88\xee\x8c\xb1\x9b?y\xfc\xc7\
-\x10\xd3utl\xda\x02\xcb4Q_[]4\xe6'\
-\xd8BF\x22\xc4)\xc3\xa1\xfd#\xe7A\xc4\x98y\x17\
-\xba\xf8\xf8\xac\x09\x188\xc3ro\x0b\x94\xb2\xa2\xb0 \
-Z\xa5\xd7\xc8\xd1\xa3a\x16\x0a\xfe\xee\x17a!\x90\xdb\
-\xb9a\xfd\x9bob\xf3\xc6\x8dX\xff\xe6\x9bx\xfe\xc9\
-'\xf1\xf4\xe3\x8f\xa3\xd30\x9c0OQ\x10\x8f\xc5\x9c\
-n\xa5\x8a\xe2}\x95\x05\xffS\xf0\xab\x18\xe2y\x1a\x14\
-\x07\xbb\xa0\x0b}/\xb0\xa7\xdd\xc1\xbc\x88$AVU\
-h<\xe5\xafiPt\x1d\xaa\xa6y@\xfc\xddE\x8b\
-\xd0\xd1\xd6\x86\xf3/\xbb\xcc?\x0b\xc1\xad\xc9-{\xe7\
-g\xbc\x01&\xff&xs\x11\xae\x1a!\xfc\xe9O\xc6\
-\x8b\x0d\x0a\x1c\x93(\x0d\x98\x1fE\xf1\x9d\xbf\xcf\xa66\
-L\xdb\x82\xaa* \xccoq\x92%\xc7\xf1.KN\
-\x9f\xaca\xcdM\xf8\xd7\xeb\xeb\x86_\xbexY\xf3\x8a\
-\xe5K6\xef\x14`\xcd\x9c}:\x08!\x87K\x924\
-\xe6\x88)\x87\xb2\xbe|\x81\xd8\x94\x82\xda\x14\x99tU\
-Q\xeb\x98\xa2^\xed\x84\xc0\xb6,\xb7l\xc1.\xce\x06\
-\xa3(S:\x90\xdb\x93P\x08\xed\xff<R\xe9\xfbi\
-\x7fFdW-\x0e\x07\x8b\x0a\x16\x8b\xc7\xfb\xa7\xa7\x94\
-\x09\x0b%I\x82\xa4(\xf8\xf1\xf7\xbe\x87\x8e-[\xd0\
-\xd3\xd5\xe5i[5\xc9d\xbf\x9b\x9c[\x09\xdcpH\
-\xcc\xe2\x89\x00\x15\x1a\xe2\x05L\x9c\xfbsx\xcf\xf7\x0d\
-qCE\xbe_\xf8\xdf\x0b\x00\xb7}\xff\xfbh\x1c2\
-\x04_8\xeb,\x0fM,\xdb*\xf3'\x0b\x05\xcb\xe2\
-\xf9I\xfa\x9f/z\xaf\xd7\xf0\x81\x80\x84\x84\x80\x5cs\
-'\xee\x03\xe6\xc91,\xf0\x02\x07\xb0$*\xc1\xa26\
-\x14B@9\xa3\xb4m\x8f\xfd\x8a\xe5:\xd5\x99\x0c:\
-\xba\xb6_\x01\xe0\xa2\x9d\x02\xac\x07\xfe|7f\xce>\
-\xfd\xccL\xba\x0a\xa9d\x92\xf4\xe6\x0bn\x18@Q\x9b\
-\xad.j:\x1f\x16\x0eZ\x96\x0d\xdbu\xe0\x86\x15\x1f\
-\x88\xac\x88\x0e\x14\x22xi\x0f\xf5\x7f\x16\x1d\x08\xc4P\
-\xc7k\xb2;\xc2Bz\x80\x83\x15!\x04\xf9B\x01\xe9\
-t\xba\xbfv\xae\x14{!\x04\xb2\xaa\xc2\xa2\x14DU\
-\x11\xaf\xaa\xf2X\x17\x0f\xe3\xc4,\x9e\xa8\xe3H\xbc\x9c\
-\xcb\x0d\x91\x88x~\x09V\x191\xcc\x0b>\xdeOw\
-\xb0\x03\x5c\xaa\xdao\xabp7n\x0f\xf8\xf1\xca\x95\x98\
-y\xea\xa9Hg\xb3\xb0,\xdbm\xc2[Z\x8c\xef\x0f\
-\xf7\xc4\xe7(\xcaM1d\x9epU|\x1bf\xbe\xff\
-\x89\xb9D\xb1\xce\x97y\xcc\xcc\xb6(,\xd3\x86\xa2\xa9\
-\xfd\xf8 I\x9e\xf8.\xcb\xfd\x7f_}]-::\
-\xbb\xbe\xb2S\x805s\xf6\x5c<\xf0\xe7\xbb`Y\xd6\
-\xec)\x93\x0ea\x9a\xaa\x92\xd6\xae\x1ePf#\x99\x88\
-#\x9e\x88\x17M\xc0\x11\xc1Jr\xeb\x06\x19\xa3\xa0\xd4\
-\xf6\xd3\xce\xe0\x0e\xd8yN\xed\xaf\x89\x1e\xe8\xe7\xb9\xec\
-\x8c2G\xb8\x94\xa5\x9d\x07-v\xe0\xa2\x943=G\
-\x18\x82\x0b\xee\xfb)\xb3_\x89\xeb\x9f\x8a%\x12\x9e\x89\
-R\x12K_\x82Y\xbc\x80\xcd@\x16.\xd40\xe6\xc4\
-\x0e\xc4n\xa6<Dt\xdb\xf4\xa8\xfc\x9a\xe2\x7f?!\
-\xd8\xde\xd6\x863\xff\xe3?\xb0\xfc\x07?\xc0\x94\xa3\x8f\
-\x06\xec\x12\xd7\x95\xcf\xf2\xc3\x84\x8f\xe7.\xfa`\xeaK\
-t\xb1\x87\xbcW|\x01\x09\xb1=\xf8\xa6\xc2\xf4\x1bY\
-)\xa3NX\xc8\x14O\xc1'\x84@\x96dH\xc4r\
-\xfb\xbe;F\xd2\xeal\x861F\x13W\x5c\xbd\xac\x09\
-\x04\x1f^\x1f\x92-TJ\xb3\xab\xbb0k\xce\xdc!\
-\x12\x91\xc6\x1d{\xf4G\xa0*\x0ary\x03\xa6a\xa0\
-yHS\xff\x8e-1\xba\x0b\x00,\xd3\x82m\xd3~\
->S\x02Q\xd8N\x85VL\x18Q\xbc\xb3\xa1\x19s\
-\x1d\xba\xf0\x1a\x8d\xed,\xb3\x22\x07\xdc\xb5\xe3\x86\x1c\x86\
-\x81|>\x8f\xc7W\xaf\xc6\x1d\xff\xfd\xdfxw\xc3\x06\
-\xd4\x0e\x1d\x8aTuuI\xd0\xe2\xe7\x81\xa2i\x88U\
-U9\xe3\xbf(u\x00\x8b\x83\x13/y\x11\xc3<\xf1\
-\xa6\xc7\xeb\xea\xf8\x14\x98\x83\xad\xdd\xb2\xc0\xb6\xf4d\xb2\
-\x1f\x00(\xc5\xa6\x8d\x1b\xf1\x85\xe9\xd3\xf1\xc0\xf3/\xa0\
-y\xd8\xb0\x10\x07:w\xa7\x871\xa3`Cq\x06\xe6\
-\x06t\xc4\xb9\x10\x04\xb5\xaa\xff\xf2\x22\x01q\xdd\xf7\xf9\
-,x=8\x895\xe2\xf6\xc8\x92$\x196eP\xb8\
-l\xe4Zb\x9c\x82\xf4\xfe\xda\xc2L:M\x18c\x1a\
-#\xacy\xc5\xf2\xa5\x1f\xee\x8c\xe8\xfe\xbd!\xcd\x8dP\
-T\x15\xa6MQ0L\xd7\x7fU\x1b\x9a\x15\x14\x19\x96\
-\xed\x8e\x9d\xf7\xc2\x06&\xec\xaf\x00\xaa\x04u\xac\xca\x87\
-I\x90\xd0\xf64\xac\xd2\xbb\x99P\x8f\xc8\x18`Y\x16\
-dE\xc1@~<\x0e\x00\xb0\x22\xc4\xf5\xc4(\x0a\xba\
-::\xf0\xef\x7f\xfd\x0b\xaf\xbf\xfc2\xd6\xbf\xf1\x06\x9e\
-X\xbd\x1a\xaf\xae_\x0f\x15@&\x91@\xb6\xb1\xb1\x22\
-\xb0\xe3\x17[,\x91\x80\x16\x8b\xf5OTq;w\x90\
-@\x8f\xa9\xe2\x8b\xeb o\xa7!dZ\x15M\x83\xce\
-\x01\x8b\x9bO)\xc5\x15\xdf\xfe\x16~u\xef\xbd\xfek\
-)\x90\xd8\x82\xa8\xb3\x93p\xaa \x167\xf7\xbf\x86\xf5\
-\xcb\x1cBt\xc8\xc4\xf7\xb0\xb0k\xb9\xf8\xdf)\xb5a\
-Z&TM\xeb\xcf\xda\x06B^\x89\xc8\xd04\x15\xf5\
-uu\xa4\xb5\xbd\xfdL\x00\xff\x1c`Hxz\x8c1\
-\xf6\xe9)\x93&\x02\x8c\xa1\xab\xb7\x0f`\x14\xb2${\
-\xe3\xe6\xc3&\xber\xd0\xb2\xa8\xed\x84\x82^\x9bX\x14\
-e!JiY\x95\x9d\xaaB\x9a\x82\x0d44#\xbe\
-#\xe9\xb5\xe6\xa0\x80\xe4\xd1aR\xd9\x8f\xdf\xcf\x00\x8b\
-\xb9w?\xb8 \xa5\xc82\xda[[\xf1\x97;\xee\xc0\
-\xdd\xb7\xff\x16[7oFOO\x0fz\xba\xbb= \
-\xab\x89\xc7!+\x0a\xf4x\x1c\x8a\xa6\x81\xb8c\xeb\xcb\
-\x966\xf1\xbb\xa9\xae\xfb\x80\x11\xbb\xd9M~P\x90-\
-\xd7\x80\xa9'\x12\x1e`QJ\xf1\xea+\xaf\xe0\xf2o\
-}\x1b7\xfc\xecg\xc2\xdc\x03\xbf\xaaT\x5c\xbd\xe6\x9c\
-\xb8$XT#\xc4|a\xce\xf5\x22S\xa9h-c\
-\xee\xbf\x07.D\x02\xc7\xe5\xee\x8c\x03\xb3a\xab\x10\xa2\
-0Np\x1c\x7f\x16\x91\x9cpi\xd8\x90&lkk\
-\xfb\x1c\x80\xf9\x03\x02,B\xc8\x08\xcb\xb2\x12\xc3\x866\
-C\x96ett\xf5\x802\x0aUQ|\xee\xf6P\xb1\
-\x9d\x10\xd8\x16\x05\xa5\x0c\x16\xe5\xc3Q\x05\xa4\x0a\x89\xa1\
-\x06n\x22eEo\x18\xd0{\xc3\xfcC`\xb0-\x1b\
-\x8a\xaa\xec8\xb4\x0c\xe8g\x83\xf4\x06-\x84\x17N]\
-\x5coO\x0f\xda\xb6nE\xeb\xd6\xadx\xe4\xfe\xfb\xf0\
-\xc7\xdb\x7f\x87\x0d\xad\xad\x9e\x9b\x5cv\x19P<\x99t\
-\xb2Vn\xe1\xb0\xa2(\xd0\xe2q\xe8\xee\x80\x5c\x08\xf3\
-\xefv\x14\xd6\x94\xd4W\x0eT-j\x0f-YU\x1d\
-\xd0\x12F\xe3\xady\xf0~\xbc\xf6\xf2K\x988\xe5\xb0\
-\x22]\x89\x86\xa6\xcd\xa9\x9f\x180\x14E)4pA\
-2Q\xcba\xc5\x11\x86\x0f\xac\x84\x9fI\xf9\xcf\xa2N\
-Y\x92E)T\x89\xf8\x82R\x89H\x90\xd0\x1f\xad\xd5\
-VW3I\x92\x86_v\xf5\xb2\xe4\x0d\xd7,\xe9\xad\
-\x18\xb0\x18c\xb3\xaa\xb3\x19\xa5\xbe\xae\xceeL\x14\xb6\
-e\xa2\xa66\x1b:\x09\x87/I\x92@\xc0\x07-\xda\
-n\xf58C\x91\xeb\xaa\x84\x96U9\x06\x90\x92\xc0S\
-9h\x15\xff\x1a\x16\xb3AlG\xf4-\x0f\x96l\x10\
-S+\x02Y\xee\xefM\xfe\xee\xdboc\xed\xfd\xf7\xe3\
-\x85g\x9e\xc1\xa6\x0d\x1b\xf0\xe6\xeb\xafc\x9b\xe0&\xaf\
-\x8d\xc5\xbc\x0c\x9e\xe4\xb2.\xd1j \xbb\xcd\x18y\x19\
-\x89\xa2\xeb\x9ei4bH{/l\xe7L+\x96L\
-:\xa0eY\xa0\x96\x85\x1b\x97.\xc5\xff\xdc{\x1f\xf2\
-\xb9\xbe\xa0~/\x5ck\xa2f\xc5\xaf3\xd2\x9f\xd5\x0b\
-^\x96\xac\xf8\x1a#\x81\xcfeLd\xed\xfc\xc9~6\
-\xc6u/\xcb\xb6@$\x02\xdb2\xbd\xa4\x0d!\x92\xcf\
-\xe0+I\x04\xb2#\x19\x10MQa\x18\xe64\x00\x7f\
-\x1e\x08`]\xf8\xb1\xa3\x8e\x12\x08$`Y&\xeak\
-\xebB\xcbo$\xa1\xdf\xb5a\xbb\xfa&\xc7-\xdf\x00\
-\x00 \x00IDAT\x15\xe5;GP\xc6\xcb(\xd4\
-!\x1a\xfa\x8eYR@K\xa2\x15\x01\x9d\xeb\xc8e\x8c\
-\x9b\xe4}\xcb\xb4,\xc8\x9aZ\xba\xf2}/\xce\xac\xdc\
-\x99e[&\xde}\xfbm\xfc\xdf\xaf~\x89;o\xbf\
-\x1d\x85\x5c\xce\xdfyS\x96\x91I$<_S\xb0\xf5\
-\x8ag1\x08t3\xf0\x04sUu2x\xee\x10\x91\
-h\xed=\xd0\x92d\x19\x8a\xae#\xe6f^-\xcb\xc2\
-\x8b\xcf=\x87\x97\x9e{\x0e\xe3&M\xea\xc7\x98\x12'\
--\xf1\xe9R4\xfc\xdaa\xc5WS0\xbc$ \x1e\
-\x83\xf2\xc0\xcb\xd5\x84\xbdR\x1f\xe1\x97\xb0(s\x1a\x1f\
-\xa8\xaa\x9b\xf0\xf4wp\x80\xeb~WeGr*\x18\
-\xc6\xa7*\x06\xacYs\xe6\xd6\x03h\x994q<\x93\
-\x08!N\xeb\x0a'C\x91\xcd\xa4C\x1b\xf4\x89\x1a\x85\
-m9\xadgx;U\x22z4Hi\x1dk\xc0\xe5\
-:\x8c\x15E\x87\xa4\x12\xa0s\x7f8\x03\x0bm\x7f\xcd\
-\xc0P0Lh\xde\xf4bR\x0c\x94\xfb\x82X0\xf8\
-\xc6(\xc9\xb2\x0cJ)\xde{\xe7\x1d\xfc\xfb\x95W\xf0\
-\xee\xfa\xf5x\xe6\x89'\xf0\xb7\x87\x1fF7\x80\x18\x80\
-\x98\xdb\xb5@,]\xe1V\x82\xa0\xab\x5c,\x85\x91]\
-\x0fT\xb0\xd4\xc5k\xb9\x02D]\xf1\xf7z\x98\xcf<\
-mP\xd5u\xc4R)\xd8\x86\x01\xb3\xa6\x06K\xe6]\
-\x82\xdb\xee\xba\x13\xa9\xaat\x89v\xcb\xcc\xcf\x17\xca]\
-;\xcc\x7fW\xf6\xebY\xfc%\xd4\xff3X\xa0Si\
- B\x04\xa3\xa0\x96\x0d\x16\x96\xa4#\xc4\xb3\xb1\x10\x89\
- \x93\xa9b\xdd=\xddS*\xd2\xb0f\xce\x9e\x0b\x00\
-s\x93\x89\x044\xf7\x04\xee\xdc\xde\x03\xdb2\x91\x88\xc5\
-\xbc\xfe\xeca\xa0%\xb6Af6s\xdb\xae\x07\x0bp\
-\xc8\x0e+\x9fY%\x80C\xbc\xb4\xc5.hX\xa5\x9b\
-\xc9R\xe6\x94\x14\xc9\x92\x1c\xe0\xc9{\xb7K\xa9\x18v\
-I\xee\x04]\x02\xe0\xb9\xbf\xff\x1dw\xfe\xcf\xff\xe0\xe9\
-'\x9e@__\x1f\xba::`\x98\xa6\xd7E\xb3\xd6\
-5\x5c*Bo(\xde\x02X\x16\x8d\x9aB\xb10\x11\
-\xcb]B:l\x86\x995\xa3\xb5\x8f\xd8\x16\xcf\x1e&\
-\x93\x88\x15\x0a\xd8\xf8\xde{X\xb6\xe0R\xac\xba\xf56\
-\xc1,\xea\x17\x9c\x18\x1f\xd1E\x03}\xda\xc3\x94v\xef\
-:\xeb\xef}U\xe4\xbe\x22\xfdr\x0f\xe3\xe3\xab\x18\x09\
-b\xa1\x03o\x94\xc2\xb4)\x0c\xcb\x82.;\xdd9$\
-.\xba\x13\xa1\xd1\x9f$\xa3\xbe\xb6\x96\xbc\xb7\xe9\xfd\xf1\
-\x15\x01\xd6\x03\x7f\xbe\x0b\xa7|\xf6\xb4YC\x9b\x1b\x99\
-\xa6\xaaDQ\x14l\xef\xe9\x83i\x9aH'\x93\x9eN\
-\x15\xd6\x02\x99\x9f\xc7\xb6m;\xed+\x88\x83\xc4\xfd\xc1\
-\x1eC\xc8_3@\xc0*'\x9a\x0f\x9c\xb2\x94{\x8f\
-aZ\xd05\xc9iA\xb3\x97\xbb){\xd9V\xcbB\
-g{;:\xda\xda\xb0\xee\xd5Wq\xc7o~\x83G\
-\x1f{\x0c\x00\xa0\x01P\xdd\xf0LR\x14$t\xbd\xb8\
-y\x9d\xd8\x0d\x80\x87x\x02\x83\x12K]|\x0c\x8a\xd7\
-\xe4E\x02\xf9\xa0\x5c\x92k\x1bQc1\xe8\x89\x04\x92\
-\xe94\x9e~\xec1\xbc\xbdn\x1dF\x8f\x1b/\x1c+\
-\xe6?\xd7)\x0d\xbfnh\xd8\x95\xc4\x8a.3\x7f&\
-\x90y\x00\xc7x2-\xcc\x88\xea\xfe\x1b\x93\x9c6S\
-\x90%\x81,\x10O\xd3\xe2\xb5\xa0\xb55Y0\xc6F\
-\xed\x10\xb0f\xcd\x99\x8b\xfb\xef\xb9\x0b\xb6mO\x19;\
-f\x0c\xe1\xc0\xd4\xd3\x97\x83i\x19H$j}\xe1_\
-\xd8Dg\x9b9\x19\x0c\x9b\xd2\x90p\x8a\xf8\xb5'\x84\
-\xc7p\x95\x15E\xb3\x9d|\x1f\x82\xaaZ\xd9e\x18\x06\
-tMs\xeb\xaa\x08\xf6X,H\x88#l\xab*r\
-}}\xf8\xc7\x93Ob\xed\x83\x0fb\xe3\xbb\xef\xe2\x8d\
-\xd7_\xc7\xfa\xb7\xdf\x86\x0d@\x05\x90t\xe7?\x12Y\
-v\x86T\x0afL\x11\x9c\xc4\x96\xbf\x92P0\xcc\xbb\
-\x22xmN\x02nr\x8fAE\x00\xb5[\x99\xb2\xe5\
-N\x8f\xd14\x0d\xf9|\xde\xeb\x07\x15l\x1aPa\x8c\
-\xe0y\xddx\xf6\xd6\xc8\xe7\xf1\xd3\x9bn\xc2\xcd\xbf\xfa\
-5r\xae\x00O\x04\x91=l^!\x0b\xa7X\xa1\xd7\
-R\x91m\x81\xf5\xb7\x93)\xbe\x06\xfd\xd7:\x03\x83\xc4\
-\x9c>YT\xd7\x8a\xc8N\x7fQ\xb4\x04]\x8fA\xd7\
-4\x5cv\xf5\xd2\x897\x5c\xb3\xf4\xf5\x92\x80u\xff=\
-wa\xe6\x9c\xb9(\xe4\x0b\xa3'M\x1c\x0fI\x92`\
-\x98\x967\x15$\x11\x8f\x954\x8c\xf2_\xd6\xb6\xe1\xa0\
-(C\xc0m\x1bR\xe6LP\xd6\xe2@\xca*\xde\xa4\
-\xe8c\xcb\xbf\xcf\x0b\xf6\x00J*\x9eeH\x19\x83a\
-\x98N\xc59\xd93\x170\xa5\x14}}}x\xe4\xbe\
-\xfbp\xfbm\xb7\xe1\x95\x17_\xf4\xee6<4\x8b\xbb\
-E\xc7\xa2P\xee\x95\xba\x88\x19=\xb1'\xb9\x1b\xbe\xf3\
-\x10\x8f3(~\x87\x16O\xfch\xedY\xb0RU\x15\
-\xa7\x9cr\x0af\xcc\x98\x01M\xd3\xd0\xd4\xd4\x84\x97_\
-~\x19\xcf=\xf7\x1c\xda\xdb\xdb\xf1\xce;\xef`\xeb\xd6\
-\xad\x03.\xc2\x97d\x19Z,\x86X2\x09\xb3P\xc0\
-\x9a\xbf\xde\x87w\xdf|\x0bMC\x87@\xcc\xdf\x11\xce\
-\xae\x02\xa3\xf1\x08\x0b\xbfz\x82\xff\xees\xb7sC(\
-\xa1 \x94\x800Rt9\x92\x80[\xd51\xbdr\xe3\
-k\xbf\xc6\xe6k\xa7\xce\xb1\x841\xa4\xabR\xe8\xe8\xdc\
->\x07\xc0\xebeCB\x02\x9c5tH\x13t\xd5\xb9\
-\x8b\x17L\xd3-]aH$\xe2%k\x07\xf9\xc5e\
-\xd9y\xd7\xc0FK0\x1d\xe6\xc3\x8eR\x88Q\x1e\x1a\
-\xc2-\x0d\x95O\xcc\xa1\x95\x17J\x138^2\xcb\x99\
-\x10\xb4SJ\xb9[\xa6 +\x0adIBWg'\
-\xdex\xfdu\xbc\xf3\xc6\x1bx\xed\x95W\xf0\xe8\x83\x0f\
-\xe2\x95w\xdfu\x06x\x02N[\x11\x1e\xa6\xb9\xe0\x13\
-\x9c\x93\xa7\x94\xebf\x10\xd6U3\xd0\x0e\x9aF\xa1\xde\
-\xde\x09\xdd$\x093f\xcc\xc0\x97\xbe\xf4%455\
-\xc1v\x87\x08SJq\xec\xb1\xc7\xe2\xb8\xe3\x8e\xf3^\
-{\xd3M7\xe1\xaf\xf7\xdd\x07M0\xdbV\x22\x1bx\
-,+\x99D\xa6\xae\x0e?\xbf\xe5\x07\xb8j\xc5\x0aW\
-\x1a\x17+B\xfcB\xba\x03<\xfe\xc6|\x1eC\x0a\x09\
-\x05y\xf6\xcf\x95\xaa\x5c\x12\x1e\xde\xb9\xb4(\x83F\x08\
-,\xdb\x84LePfC\x0e\xf1\xe8\x89\xa0U\x95J\
-\xa1\xa3s\xfbL\x00+\xca\x02\x16\x80\x0bF\x0e\x1f\xe6\
-\xb5\x08\xc9\x17\x9c\x948\xa3\x0c\xf1x\xbc\xa8w\x94\xaf\
-7\x0f\x1c\xfd\x8a\x85\xc4\xbe\xfe\x5c\x04+\x99)\xac\x1c\
-\x04\x8a\xb3\x1c\x95\x0b\xee\x03w&\x18\x96\x09\x06\x06U\
-\xa9\xbc\xde\x90\x10\x02Us\xbcP\xad[\xb7\xe0/w\
-\xdc\x81{\xef\xba\x0b\xad\x1f~\x88\xf6\xf6v\xf4tw\
-\x03\x00dEA\x83\xdb\x17J\xe2\x1d\x0dd\x19\x92 \
-\x94{\xc3\x14xx'\x82\x94\xa8?\x05\xb2/\x81[\
-}\x94\xd9\xdb\x8b\xac*\xa6\xeb\xf8\xe1-\xb7`\xf8\xf0\
-\xe1\xe8\xe9\xedCk[\xbb\xafg:\x81\xe3\xf8\x06\x9c\
-.\xa4\x17]t\x11&N\x9c\x88\x9bo\xbe\x19\xb2,\
-W\xf43\xf8\x85\xae\xe8:\xf4x\x1c\xb1D\x02\x8f\xad\
-~\x08\xd7\xder\x8bs~\x11\x9fj\x8e\xe2\xc8\x90\x16\
-q\x08\xffuU\x1c\xc2P\xf1CH\x89\xd73\xdf\xe5\
-\xe6}\xb2m\xdb0m\x0aE\x09\x8f\xd2d\x17\xb4\x92\
-\xc9$\x18cG\x95\xd5\xb0f\xce\x99\xab0\xc6\x0e\x1b\
->t\x08#\x00\x91%\x09\x05\xc3\xf2\xc6R\xc7t=\
-\xd40\xea\xd5\x0fR\x06Jm\xd7\xd2PJ\xa5f\xc5\
-\x82\xd3\x80Y\x96\xc7IQ\xa6\x06\xb3$X\xed\xacH\
-o\x9a\xa6gpCQ\xb9Q\xff\x8e/\xe4\xf3h\xdb\
-\xb6\x0d\xdb\xb6l\xc1\x83\x7f\xf9\x0b\xee\xfc\xcdo\xf0a\
-W\x174\x00\x1a\xaf\xa7#\x041\xd7\x0b%\x0eR\x08\
-\xb6\xcc\x15\xd9Sp\x021\xd7\xa0$\x91=\xb9\x99Z\
-\x16iP\xfb\x14\xac\x9a\x1a\x1b\xf1\xb3[o\x85$I\
-\xd8\xd6\xda\xda?\xda=\x10xq\x0d\xdcf@\xd7\xf6\
-\xed\x985k\x16z{{q\xdb\xad\xb7\x86\x8eR+\
-\x17\x1a\xaa\xb1\x18\xd4D\x02\xbd\xdd\xddX\xf8\xadob\
-\xd9\xcd?\x08\x9d\xba\xc3v\xa4\x0c{\x98C\x11\xd6l\
-\xaeT\xa7\x06\xe6\x8e\xfb*Vl\x5c\xc3*s\x1b\x0e\
-\xda6\xa0*\xbe\x1b\xbb\x14ha\x1d\x8b\xe9\x00\xa0-\
-\xbajir\xe5\xb5K{C\x01\x8b06\x942&\
-\xd5\xd4T\x13\xae}\x98\x96\x05\xdb2\x91IW\x15Q\
-\xd1 h95N\x0c\xb6;\x7f\xb0\xf8\x82a\x81\x90\
-\x0ee\xeb\x0a\x8bv\xae\x8f!\xb0\xa2B\xa9\x22\x0d+\
-\x0c0w*\x8c\xec\x7fU\xa1`8\xd3@d\xc9\xfb\
-7I\x96\xa1j\x1a\xfe\xf5\xcf\x7f\xe2\xf7\xbf\xfc%6\
-o\xda\x84\xe7\x9fy\x06\xad\xdd\xddP\x01h\xb2\x8c\x0c\
-\x07{WW\x12{\x8f\x875\xab\x0b\x0d\xf1\xc4b\xe1\
-\x10J\x1d\xd9\x0d\x06\xc7\xcaf\xb3\xf8\xd9\xad\xb7\xc2\xb2\
-m\xf4vw\xfbn$\xe5\xa4\x07\x9b\xdax\x7f\xf3\x87\
-8\xf5\xb4\xd3\xb0q\xe3F\xdcw\xdf}N\x19T\x85\
-l^V\x14h\xba\x8ex*\x85\xb5\x0f>\x88s?\
-\xf8\x00u\xf5\xf5eN\xe9\x10\xb1\x9c\x89.\xc5\xe2\x10\
-&\xf8>\x11\xe1\x98\x1f\xed\xfa\xdf/\xb0/\xca\x18L\
-\xcb\x02\x83\x1e\x1a\xder\xf0\x8a\xe91\x00L&@\x0d\
-\x80b\xc0\x9a5\xe7t\x00\xa4\x91Q*\xd7\xd7\xd4\xf4\
-\x8f\xfc\xb6),\xdbB\xa6*S\xa4\xea\x07A\x8b\xd7\
-7\xf5{\x87X\x09\xfd\xc9En\xb2\x83\xbaB\xe1\xed\
-\xaa\xaaBWU(.2K\xae\xf8\xefc@\x96S\
-lm\x9a&,JQp[\xf9\xfa\x80P`F\x95\
-\xb5\x85)\xee\x19\x94/\x14\x10\x8bink\x0c\x09\x1f\
-~\xf0\x01\x96]z)\xfe\xb6f\x8d7MF\x92$\
-d\xe3q\x9f\xb7\x89\xdb\x09\x82\x00\xa5\x88Y<\xb1\x9b\
-\x81\xd8\x97\xdc\xe1\xfe\xbe\x89\xc7\xd1\x1a|\xcb\xb2,\x9c\
-u\xd6Y\xc8\xbb\xa3\xac\xc469;:\xcb\x0a\x863\
-\x06o\xd3\x07\x9b1o\xde<\xac]\xb3\x06\x05\xc3\xa8\
-\xecx\xf3\x1eZ\xba\xee\xe8Y\xf18\xfe\xf1\xc4\x13\xf8\
-\xcc\xe7?\xe7N\xdc\x11\x93<\xfc^^lA\xe0\x99\
-?_\xbbM\x8f89\xfe\xf6\xe2\x10\xd11`\xfb\xa3\
-C\xb7d:X0\xedv\x9c` \xa1\xf2\x12O:\
-\xc4c:\x18c\x12\x91\x90\x01\xb0\xb1\x08\xb0\xee\xbf\xe7\
-n\x9c\xf2\xd9\xd3\x8eij\xa8'\x9a+\xfa\xca.\xc3\
-\xb2L\x0bU\xa9D\xa8v%\xee0\xdb\xb2\x1d\xd3(\
-+'\xe4\x86\xc4\x80\xd4\x7f\xe4T\xc5\xd1l\xe2\xba\x06\
-M\xd7\xa0)J\x7f\xd3\x8a2\xc7]\xd7\xe0\xfb\x1d\x01\
-\xc00M\x18\x86\x09\xc34\x91/\xe4a\x9a\xd6\x00\xc7\
-\x82\x15\xb38I\x92\x90\xcf\x9bx\xe7\xdf\xaf\xe1\xb7?\
-\xff9~\x7f\xc7\x1dH\x00\xd0t\xdd\x19\x96\x104k\
-\x8a\x82y`6\x9e\x97\xf9\xdb\x81\x06%zh\x22\x91\
-|\xf0\x86\x82#F\x8c\xc0\xc9\xa7\x9c\x82\xd6\xb6\xb6\x0a\
-o,\xce\xb1,\x18\x96s\xc3u?g\xcb\xb6V\xcc\
-\x9b7\x0f\xd7_\x7f=\xd8\x00nP\x1c\xb4\xd4X\x0c\
-\xf7\xdd}7N?\xe3\x0c\xf4\xf5\xf6\xf5S\x05\xe6\xd7\
-\xbf\x8a\xec\x0b,\xbc+\x03\x1fD\xc1\x8a.\x0dVD\
-.D\xcd*x\xaa\xf2\x08\xcc0-\xa8\x12\x8a:w\
-0\xe6NURU0B\x08e\xc8\x96\xd4\xb0\x18c\
-\xb3\xc6\x8f\x1b\xeb\x09y\x92$\xc1\xb2,X\x96\x81T\
-2U\x04X\x9e\xb2\xef\xfe\x966s\x0c\xa3\x84\xb0\x01\
-\x85Z\xfc\xb5U\xc9$\x92B'S\x84d\xb4v|\
-\xe8\xfd\x17\xb4\xe2\x02F\x02qP\x9a\x82iY\xe8\xee\
-\xe9AO_\x0e\x12vD\xb1\xc4\xec\x8a\xf3P\x92e\
-t\xb6\xb7\xe3\xfa\xcb/\xc73\x7f{\x02\xbd==\xa8\
-\x89\xc5\xbc\x01\x9e\xc1\x82a_\x0d\x9e04!\xd8\x97\
-\xfc@\xe9M~\x10\xa3\x15\xa8m\xe3\xeco|\x03]\
-]\xdb\xe1\xb8\xbf+ F \xc8\x9b\x86c\x05\x12\x0e\
-ywo/\x0e?\xf2(d2\x19tvvzv\
-\x94\x1d\xb1,Y`Y/\xbe\xf0\x9c\xdb\xb5U\x00\x95\
-\xb0~W\xde\xb7\x04\x8c\x84u\xc3\x0co\x5c\xe0\x00i\
-\xe0\x1a\x09\xb4}\x22\x9e\x96\xe5\xbc\xce\xb6-\xc8\x8a\xec\
-4F\x90\x15\x9f\xf6\xeb\xe0\x89\xf3\x99\xb2$!\xae\xc7\
-H\xbe\x90\x1f\x03\xe0o\xe1\x80\x05L\x1d7f\x94\x07\
-D\x96iyM\xf8\x1c\xf3d\xf1t\x191\xfcs|\
-\x16T\x18\xb8\xb8#hq\x0eXL\xd7P\x93\xcd8\
-\x83+\x18\x1fy\xbd\xfb;\xa4\x13\x00\xba\xaaB\xab\xae\
-F\xa6\xaa\x0a\xadm\x1dN<]\x8e\x0d\x0amk\x19\
-\x80\xbf?\xf6\x18\x16\x9es6\xf2\xf9<TMC,\
-\x95r\x86w\xea:\xb4X\xcc\xd7\xfeW\xd4\xa0HX\
-&O\x00&\xff\xb8\xf0H\x8b\xda\x1f\x97m\xdb\xa8k\
-h\x80i\x1a\x95\xf9\x8b\x19\x907LX6-\x12T\
-\x09\x08\xfa\xf2\x05\x8c\x1d;\x16\x7f\x7f\xfai\xa8^\x94\
-QAh\xe8v\xd6\xd0cq<\xff\xf7\xa71a\xf2\
-\xe4\xa2\x12\x9b\xa2G\x9ec=\xec2e\xa1\xd9B\x16\
-\xb0\x16\xf9*\x0f\x8b^\xce<\x0d\x9aQ\x87i1\x81\
-\xbd\x85\xd5$\xa7\x92\x09\xe4\xf2\xb9\xf1\xa1\x0ck\xd6\xec\
-\xb9\x09\x10\xe8\xd9L\x86\x11B\x08\x91$\xe4\x0d\x03\x8c\
-2W\xb3BY\xfd\x0a\xeeH\xea\x1dK\xd9\xfd\x17\xa8\
-\xaa\xaa\xc8\xa6\xd3\x88\xf1X\x0e;gb\x1c\x88E\x81\
-\x83\x81\xa2(hj\xacGOo\x1f\xda;:\xfd-\
-2|\xafw\xfe\xfe\xf6\xd66\xfc\xe4\xc6U\xb8\xebw\
-\xbf\x83\xae\xaa\x88'\x93\x1e\xf5\xd6b1'C\xe32\
-+9D(\x8fD\xf2\x03\x9c`Q\x8a\x98{\xb3\x0a\
-\xcc\xa8):\xa3\xf8@\xd3|\xc1\x84M\xed\x92\xaf4\
-\x0c\x03\xc7\x1dw<\x1e\x7f\xec1(\xb2\x5c\x11\xeb&\
-\x80'G\xc4\xab\xaa\xf0\xec\x93\x7f\xc3\x84\xc9\x93\xbca\
-\xa8\xa2\x06%4X\x10\x9a%\x17k\xea\xfe\xf61\xe2\
-\xfb\xfc\xc5\xd1\xa4Hd\x17?\xbf\x1f\xf2(\xb3aS\
-\xa7n\x83\x88Q\x1b\xfc\xf8\x92\x88\xc7\x01`L(`\
-1\xc2\x8eI\xc4\x9dpLvS\xe5\x8e\xa5\x81\xfa\xac\
-\x0caa!!\x04\x16\x9c\xa2g\xc7\xa3Q&#B\
-\x1c\x8d+\x11\x8b\xa1\xb6:[\x12\xa0v\xe62\xae\x18\
-\xea\x84\x9f\x99J&\x10\xd34\xbc\xbfekH\xe5\x82\
-\xc3i\xbb\xbb\xbb1\xf7\xc4O!\x97\xcb!\x91H@\
-\xd54hn\xeb_M\x183\xceC?~\x87\x90\xb8\
-\xe0\x1a\xc2\xa2\xa2u\xe0\xb1\xabD,\x06]\xd3\xdd>\
-S\xa5\xcfR\xc6\x18z\x0b\x057\x1e+}\xad00\
-\x8cji\xf1\x8c\xa6\xa4B\x17<\x07-=\x16\xc3\xcb\
-\xff|\x01\x0c\xc4\x11\xda\x05\xe8\x11\x7ff\xbf\xe4B\x02\
-\xb6\x86\xe2\xe7\xfdl\x89xa%\x81;\xf7P\xe8\xd7\
-D\x09@\xa8\xd3\xe1\x9d\xfb\xe4\x99;\x0b\x94\xcfz\xf0\
-]\xedD\xe8-\x0f \x91\x88\x03\x0c#\x8b\x00k\xe6\
-\x9c\xb9 \xc0\xd1\xf1X\x0c\xb2,\x13\xae\xad\xe4\x0by\
-\x07\xb0@\x8a4\xab\xa0Xf\xdbn;\x19\xc6|}\
-r\xc2\x90(\x95L\xa0&\x93)\xcb\x8c\x06\xda\xccs\
-g\x15\x1f\xc6\x18\x14UAsC\x1d\xb6\xb4\xb6\xc1\x16\
-2*zL\xc7\xdf\x1f}\x14g~\xf9\xcb\xa8\xd64\
-h\xf184\xb7\xd8\x94?\xf6&\x10\xbb\xf3\xe4HP\
-(\x8f\x80\xea\xa0X\x94R\xa4\x92I(\xaa\xe2\xb2\x87\
-p\xbd\xca\xb2m\xe4\x0d\xb32f\xcd\x082\xd9\x0c4\
-Uu\xe6@V\x18}\xf0\xa9;\x8a\xa6\xe1\xbdw\xdf\
-\x15&\xd9\xd0\xff\xcf\xde\x9b\xc7\xdbQ\x95Y\xc3k\xef\
-\x1a\xce|\xe7\x9by&\x81\x10\xc2(\xc1f\x92A\xa6\
-(\x86!\xda\x03\x9f\xfdk^\x1a\xf0\xd3\xafm\xc4V\
-i@\xd4~EA\x04! \xf6\xdb\xb6\xbe\x0e\xa8\x88\
-2\x08\x02\x89L\xda\x900C\x18BB\x92\x9b\xdc$\
-7w\x9e\xef\x99k\xd8\xfb\xfbc\xef\xaaSU\xa7\xce\
-\xbd7w\x0c\x98\xe2W\xe4\x9es\xea\x9cS\xa7\xaa\xf6\
-\xaa\xe7Y{=\xeb\x09\xc9\xf6\x88\xef\xf9\xd2\x0b\xe1\xcf\
-\xfb\xb3\x82\x80\xcd2\xe3\xbe8\x12\x8c\xfb\xdcH\xdd\x08\
-\x8b\x09\x8bg\xd1\xdc\x95\x94\xca\xd0\x1c\xfbn\xb9$\xe2\
-\xf1\xf0\x08k\xc3\xa3\x0fa\xf5Ek\x8f\xd1u]D\
-Wr5LK\x22;\x01\xa5J\xe8\x81q%\x0d\x96\
-\xd8\x09\x9b\xd9\xbe\x12\x90 8\xd4VU!\x95J\x8e\
-X\x123U\x94\xb3\xe0\xa6\xb8\xa8\xefjl@[g\
-\x17\x18\x13\xe9\xea\xcf\x7f\xf4#\xfcd\xdd:\xd4\xc9\x94\
-/\x22\x8bL#\xf184\xd9SO\xf1X\xb1\x1c\x02\
-\xa7\xbfV\xbe\x9d\xc32M\xcc\x981\x13\x9cqQ[\
-\x17\xb2\x14-\x13\xa6i\x8d\xda\xf9\x83s\x0eE\xd5D\
-\x0fH`\xd4\x11\x96\xe3IE\x14\x05\xb9|\x1e]\xed\
-\x1dh\x981#@E8\x7f\xb3\xd0\xb4fd\xb0*\
-\xd7H\xfa\x81\xb0\xbc4\x8f\xbb\xdd\xd6\x05N\x94d\x98\
-b\x82\x82K\x9b\x19\x22\xc9\xfc\xa8(Q\x9a\x15\x9a\x12\
-\xda\xb6=gVc\xa3\xe0\xaf\xe4\x1b\x0d\xcbru?\
-\x8ei|\x10\xa8Ja\xa5l\x99\xcdQ\xa1\xf4\x85#\
-\x16\x89\xa0*\x95\x04\x9b\x0e-\xd10\xe1\x9c\x03\xaf\x9a\
-\xaa\xa1\xa1\xb6\x16\x9d=\xbdx\xe0\xe7?\xc3m\xdf\xfe\
-6R\xf18\x22\x89\x04\x22\xf1\xb8\xe8\x00\x13\x8b\xb9)\
-\xa0\xe2ipyHY~(%T5\x15\x8c3_\
-y\x8ac%]0LX\x96\xed\xe1pG\xf7\xb9E\
-\xc3D<\x16C&\x9f?\xb0\x9b\xa14\xc5\x03!x\
-\xeb\xf5\xd7q\xee'?\x09\xdb\x0e\x82\x0a\xf7;\xaa\x94\
-\x91\xec\x04(K\x05\xc3\xa8\x9b\xa0\xc5r\xb8\xfd8\x9c\
-\x06\xae\x14R\xdbE<\xc6\xf3\x8er\xab\xc4\xdaD\x22\
-:\xe7\xf0\xa3?-\x85\xb4|fcc\x03q\xab\xa7\
-\x09\x85a\x98\xae\x102\x8c\x10\xf7>\xefkH@\xc4\
-4'\xf1\xac\x9a\xaabFc\x9d\xc8w\xc7\x03V\xe3\
-\xb0pw\xdda*\xac\x9csTW\xa5\xf0\xf0}\xbf\
-\xc4\xcd7}\x1dU\x12\xa8b\xc9$\xe2\xa9\x14\xa2\xc9\
-\xa4H\x03e\xd7\xa0\xd2\x9c\xed!\xa0\xfakO\x07\x09\
-\x80];w\xba\x03\xcf\xed\xcbg\xdb\xc8\x17\x8a\xb0,\
-[\xde\xdb\xf8\x01\xad\x8aB\xd1\xdf\xdf\xef\xa6P\xa3\xc6\
-+IQh\xba\x8e\xa7\x1f\xff\xa3tX\x91\xe3\x12\x5c\
-\x10\xe6D\x94\x0b9\x8f\x9d\xeft\x9f\x97\xdbz\xdf\xe3\
-\xdd\x86\x13\x87\x9d\xe2\xa51/Z\xa9\x97\x8d\x7f\x02i\
-\xc7L\x9c2\x1d&\x04\xa7\x01\xde\x8a\xb8\xf4\x13\x81\x98\
-\xfb\xa3\xf8\xca\x8d7E\xcaIw\xce\x1a\x1a\xeb\xeb<\
-\xed\xa4\xc5\xc1\x06\xe7>\xc2=\x0c\xb8\x18J\xd3\x94<\
-\xa4\xbd5c\x0c\xb3g\xd4\xc0u\x08\x1dOpE0\
-)\xde\xbcN\xdf\xbc?\xfc\xeew\xf8\xfe\x7f|\xcb\x05\
-\xabh2\x89h<\x0e-\x16\x13fy\x9e\xd9\x9aC\
-\xe9\xdf\xa1E\x04\x0e\x0c\x9c1\x0c\xf6\xf7\xc3\xb6\x99\xcb\
-\xf3\x16\xa5h\xb9D\x17\x1c\xf8\xc5\xbe}\xebV\xa4\x07\
-\x07Q\xdd\xd0p@\xd7\x1b\xf7t\xdfn\xd9\xb7W8\
-\x01\xfb\x0a\x92y\xb9\xe3\x13\x83\xd4a\x05#\xab`^\
-\x08\x7f\x93[\x94\x88w\x87\xca\x22\x95RE\xf9\xb7\xcd\
-\x18l\x9b\x83\xc2[\x96\x03?\x809\x99\x1c\xe3\xb5\x00\
-:\x00@]\xbdf-\xd6?\xf6\x10\x18\xe3\xf5\x0d\x0d\
-\xa5\x92\x1cx\x14\xb1\xaaZ\xc1\xbf\xdd\xf3/\x93\x84;\
-\x0f\xb1}\xa9\xadN\x09\xe5*g\x13\x13\x90\xf0\x89\x7f\
-\x9feZ\xf8\xcd\xcf\x7f\x86\xeb\xae\xb9\x06\xd1\x00X\xe9\
-\xb2/\x9fC\xaa\x8f\xd8\xde\xea\xd0\xf2W\xb38\xd7\x03\
-\xe3\x1c\xe9t\x06\xb9l\x06\xb1x\x12E\xd3p'p\
-\xc6z\xad(\x8a\x82\x87~\xfd+\x80R_\xd9\xdb\x81\
-\xec\x1b\x14\x05\xe0\x1c\xe9\xc1\x01D\xa2Q\x094\xc4\xf5\
-d\x0f\xdaa\xf1J]t\xcaj\x04\xcb\xc1\xc8\x11\x87\
-\x12oEJ\x88C\x88\x90u0\xd86\x83\xa6\x90\xb2\
-AJ<\x1e^\x84\x10pBR\x0e`\xd1\xf5\xa2%\
-}\x8c*T\xadJ\xa5\x02\xfc\x14\x01\xe3\x1c\xaa\xaa\x85\
-\xa6\x82\xbe\xfd\xe6N-\xa1\xd3eG\x84u\x9c\x03\xc9\
-DBF`\xa4\xb4b\x9c+\x9f\xb8U\xd34|\xfb\
-\x86\x1b\xf0\xb5\x7f\xfd\x22\xf4H\xa4\x04V\x89\x04\xf4X\
-LH\x15\x5c\x0b\xe8C@uh\xf1G2\xce5\x91\
-\xcf\xe7\xf0\xee\xdbo\xa3`\x18\x1e\xbej\xeck>\x97\
-\xc7K\x1b7\x8a\x9a\xd9\xb1\x5cw\xb2\xde6\x9f\xcf\xa3\
-\xbf\xaf_\x02\x0a\xf1\x80\x82\xc3\x85\x10\xf8,\x8b\xe5s\
-<\xe8\x16\xccK\xe3\xdaU\xc6{\x1fs\xaf\xda\x9dH\
-p\xf3\xff&\xceE6\xc6X\x89\xe3\x03w\x00\x8e \
-\x18\x8fQB\x00\x8ed0%\x5cQ\x95J\xba\xf9\xa3\
-W\x89\xcd\xc1C\xcd\xb6\x82'\x8d\xc9\xb6^\xe0\x22\xd7\
-\xe52L\xac\xa9J\x95{\xfb8/\x8e\x89\x84\xc2\x18\
-\x9c\x8a\xc3\x19wGa\xdb\xb4c\x07~\xb0\xee.\xd4\
-\xca\xc8\xca!\xd95\xa7\xdb\x8cc\xd92\x09\xea\xfbC\
-\xcb\x87\x00\xb4\x9cK\x9as\xfc\xe4\xde{q\xef/\xee\
-\x835l\x05\xc5\xe8\xa2\xa3\xa6\x1d\xdb\x91\xcf\xe5\x90\xa8\
-\xa9\x11\x9f?\x86\xeb\xcf\x11.\x0f\x0e\x0c`\xc6\xac\xd9\
-\xa5\x08\xca\x1b7\xf1p\xcb\x18\xee\xf5\xbcb\xfeT\xb0\
-,i\x09U\xbc\x87\x18\x01\xca\x097\xce\x19\x18\xb7\x81\
-J=\x98\xb8\xb7\xdd*bA\xd2}EU2Y\x16\
-=9Z\x0a\xa2\xd0\x8a\xd1\x95w:\x9f\xcbz\x22&\
-A\x9bP\x82\x9a\xea\xaa\xca\xd81\xea\x9b\x8d\x9c\x07&\
-^\xd7\xc4\x03]\xc3>X\xec\xf7y\xa7\x9c\x82\xbaD\
-\x02Q\x19YE\xe2qh\xd1\xa8\x1bY\x1dR\xa4O\
-\x0eQ\xfdaK\x0d\x15E\xc1[\xaf\xbf\x8eg\xd6?\
-)n\xd2\xe3\x08\xb0\x22\xd1\x08n\xb9\xf1\x06\xd7\x7f\x9f\
-\x8cm\xa7\x84\x80YQ\xd0\xba\x7f\x9f\x144s\x7f`\
-\x85\xb2!Q\xc2\x0b\xe2o\xcb\xc7\x89\x07\xc0J\x81Y\
-\xe8s\xee0\xf7|.\xf78\xa5p)o\xf0\xce\x11\
-:\xa6\x86r&@rX\x00\xe7<\xea\x07,\xce\x97\
-%\x13\x89\x12\x8e\xb8\xf2x\xf8z\xf7U\x8e\xb2dX\
-,\xd3Bp\x0e\xce8\xa2R\xf5\xcb9\x0f\x07\xaa\x03\
-f\xda\xc7\x03V\xe5H\xaf\xeb:NZ\xbe\x1c\xf9|\
-\x1e\xba\x07\xac\xf4hT\x5c$\x87\x0a\x90'<}\xb2\
-m\x1b\x86a`\xe6\xcc\x990MS\xf0\x87!&s\
-\x1f\xb4\xc5\xf1:\x8b\xa7R\xf8\xe6\x97\xaf\xc5\xe0\xc0@\
-)M:\xc0\x95s\x8e?>\xf8{\xec\xdf\xb7\xcf\x9d\
-\x91v\x1a\xd7\x1e\xe0\x01w\x0b\xec3\x83\xe9R$\xe4\
-\xa4\xb1N\x83\x08\xc9?\x83\x0d\xb7O\xf0\xbd\xee\x8e\xe9\
-\xb2\xe7\xb8\x9bi\xb9+\xe3\x9ePNrqL\xdaP\
-\x0d+7r\xff\xaf\xf8SBB\x96$\x12q\x97\xe4\
-\x22\x1e\xae\x86\x83\x8f\xca\xf9\xd0\x9b\xcb39[\x98J\
-\xc4=N\x8b\x13\xc1\xb4\x93\x09\x1b8\x8a\xa2\xe0\xf6\x9b\
-oFKK\x0b\x12\xd5\xd5\xaez\xddI\x03\x0f\x91\xeb\
-\x13\x03N\x94R\xa4R)466b\xe1\xc2\x858\
-\xfe\xf8\xe3\xb1j\xd5*,Y\x22\x04\xcc\xc5b\x11O\
-\xfd\xe9O\xf8\xed\x03\x0f`\xf7\xee\xdd\x1f\xdc\xdf+#\
-\x19E\xd3@5\x0d\x9f\xfb\xfb\xbf\xc5}\x8f?9&\
-\xe0+\xe6\xf3x\xe0\x17\xbf@4\x91\x00\xd5u13\
-\x8dR00\x86\x0fE__\xaf\xac\xf7\xf5\xa7\x82\x95\
-\x0a\x9e\x9dg\xbdu\x86\xe53~\x92\x02\x0a$N\x9c\
-\x87\xa4\x97\xde.\xd2D\xfc\x16\xc6\x03\x865\x81YL\
-\xee{\x87\x9f\xc3\x9a\x1f\x8f\x07\xfd\xae\xa8\x1b\x0a\x8d\x1c\
-\xbe\x13\xd7\xfc\xd3k\x8d\x9c\x8c\xc7\xc11\x11`\x05L\
-\xac\xf6]\x84\xefw\xdcr\x0bb\xc9\xa4\xab`\xd7\x22\
-\x91R-\xe0\xa1\xe5\x80\x17\xdb\xb6]\xeef\xd1\xa2E\
-X\xb5j\x15N8\xe1\x04,_\xbe\x1c\xf5uu\x88\
-K\xda!\x9b\xcb\xa3\xab\xa7W\xf0\xa3\x8a\x82\xf3W\x7f\
-\x02g\x9d}6.\xb9\xe4\x12d2\x99\x0ffJ\x08\
-\xe9E\xa5\xeb\xd0\xa3Q\xb4\xb7\xb6\xe2\xcf\x1b\xd6\xe3\xfc\
-\x8b.\x86Q,\x8e:\xad\xcc\xe5r\xb8\xf6\x8a\xcb\xd1\
-\xdc\xd4\x84dm-T\xd9wr\xcc\xb7k\xc9?\xef\
-m\xde\x0d\xaaP\xc0Bx\xbd\xa0O4Z\x02\x0e\xe6\
-}\x91\x94\xb2?/M\xc2\x027\xaa AV\xa6x\
-gLb\x1dG\xb0&\x86\xfbllxp\x8f\x1c\xc0\
-\xe2\xf3\xe3\xb1\x98K\x889\x9dX\xa5|+\xb43F\
-\x19{\x0d&j\x87\xe4] \x99\x88KK\x8b\xd18\
-8L}\xf8\xfe\x1f7\x5c\x0f\xd3\xb2\x10\xab\xaa\x82\x1e\
-\x8bA\xd5u\xd0\xf1\xde\xc9\xfe\x0a\x17*\xbbK\xab\xaa\
-\x8a\xe5\xcb\x97\xe3\xe4\x93O\xc6\xe9\xa7\x9f\x8e\xc5\x8b\x17\
-\xbb\x5cU\xbeP@.\x9f\xc7`G\x07,\xc6\xca\x06\
-^6\x9bE<\x1a\xc5\xad\xb7\xde\x8a\xab\xaf\xbez\xd4\
-\xb6\xc0\x07\x19\x89\xe5\xb6\x90\xd7\x0d\x03\x96a\xe0\x86/\
-]\x83\xbd\xbbv\xe1\xef\xff\xd7\x15\x88\x0a\xe7\x01\xff\x80\
-\xf6v1b\x0c\xdd\x1d\x1d\xb8\xf6\xca+\xd0\xd9\xde\x8e\
-h*\x05\xd5\x13\xed\x8f\x85\xf7\xf3\xd6\xffv\xb6w\x88\
-\xc9#\xc6d\x91rx\x83\x890\x10\x0bZ%W\x94\
-5\x84FV\xbc\x22\xe9\xce\x03\x80\xc4\xbd\x0ay\x9f\xde\
-\xa2\xd4\x8cL^\x19d\xb6\xb4r(\xed\x00!\x1e\x97\
-O\x1e\x9a\xfa\xf9\x81\x94\xf8\x08\xb4x,&\xa5\x0c\xa3\
-\xeb\x168\x85\xd7\x15\xda\xdb\xda\xf1\xa3\xbb\xd6!Q]\
-]*\xb5\xf1H\x17\x0e-\x95\xd3\xbcb\xb1\x08]\xd7\
-1\x7f\xfe|\x1c~\xf8\xe1X\xb1b\x05\x8e<\xf2H\
-,[\xb6\x0c55\xc2\x1c2\x97\xcf\xa3\xb7\xaf\x1f\x86\
-a\xc2\xb2L\xd8\x9ej\x09Z\xc1\xc4'\x97/\xe0\xe8\
-c\x8e\xc1\xb7\xbe\xf5-|\xe3\x1b\xdf\x80\xae\xeb\x1f<\
-\xcc\xa2Ttc\x8e\xc5\xa0\xdb6R\xb6\x8d\xff\xbc\xe7\
-n\xfc\xe5\xe9\xa7\xf0\xc9K?\x8dO\x5cz)\xea\x1b\
-\x1a\xc1\x98\x0dJ\x15\x98\xa6\x81\xccP\x1a\xef\xbe\xf5&\
-^\x7f\xf1E<\xf6\xfb\xdf!\x9f\xcb!&+*4\
-\xd9\xa9\xdb\xa1'\xc6r\xbe\x9ct\x95\x10\x22\xc6c\x05\
-c\xc1\x12dp\xd7m\xa2d-\xe3v\x9f\x08\x08F\
-I\xa9\x1e\x90s\xf0\xb2N\xa4^\xd3\x19\xee\x13\x95s\
-\x90\xf2(\x8a\x87\xc4Z\x9c\x83\x10f\xf8\x00\x8bs\xae\
-\xa9\xaa\x22{j\x12\x97\xcb\xa2\x92\xa9w\xac |\xfe\
-\xe8^\xb5\xb7, vv\x8a\x10@\xd7T\xb1[\x07\
-Qz%\x88\xf6\x08>u\xd6Y\xe2\xc2\x8aD\xdc4\
-\x10c\xbc(\xfeZ\x16\xc6\x18\x92\xc9$\xae\xbd\xf6Z\
-\x9cx\xe2\x89X\xb0`\x01Ti*W,\x16\x91\xcb\
-\xe7\xb1\xbf\xbd\xddw\xad\x10\xcf@\xc6\xb0q\xb6\xd0\xe2\
-\xb4ut\xe2\xfc\xf3/\xc0\x9dw\xde\x89t:\xfd\x81\
-L\xcd\xa9\xa2\xb8\x86\x8e\xb6i\x22\xc59\xf645\xe1\
-\x87\xdf\xbb\x05\xbf\xfe\xef\x1f\xe3\xa8\xe3\x8e\xc3\x82%K\
-\xd0\xd2\xbc\x1b\xdd]\xdd\xd8\xbbk\x17\x8a\x85<l\xc6\
-\xa0\xa8\xaa;\xe9\xe3^\x97\x18\x9fo\x9a\x93\xf1h\x11\
-]\x82\x0a/\x8f\xae\xbc\xd1\x10q\x82\x12\x0f\x8c\x11x\
-\xb4R\xe5\xa2R\xb7_!J3\x83<\xd8\xdd\x9d\x05\
-c5\x01\x87\xce\xd3\x9c\x05\xeb\x1c=\xd5\x01\x9c\x98.\
-`\xad\xbeh\xad\xac\x0aW\x89\xd7\x8cO\x14N\x8a;\
-\xa2\xe5\xb1\x5c\x09\x1b\xd4%\xcf\xa7\xd2a\x18M_\xb5\
-\xa9\x05+\xb1O\xdf\xb8\xee:\xb4\xec\xdf\x8fTM\x8d\
-[\xc4L\x0f\x89BG\xe4\xa6V_\xb0\x1a\xdf\xf9\xee\
-w\x00\x88&\x1c\xb9|\x1e\x85\xa2\x01\xc3\x0c\xd6\x9b\x06\
-i\xd2Q\xd2\x01\x92\x82\xe8\x1d\xe8\xc7\xa7.\xbc\x10\xf7\
-\xfd\xeaW\x07\xdd54\xea(KU\xa1G\xa3.\x1d\
-B\x09\x81i\x9a\xe8\xeb\xeb\xc5\x9f\x9f~\x0a6\xc4\xf4\
-\xbc\x02\xb8\x91\xbd\x16\x89@\xd3u\xe1\x0a\x22\xcd!\x95\
-\x89\xba\x91\x12\xc9CK\xc5|\x18\xb3\xe4+\xd8\x0er\
-W^\xf1\xfb0\x1a\xacR\xb4\x15\x18K\xcc\x9f\xf8\x11\
-\x109q\xe8\xef\xcf\x13\x04O^\x9ay\x1cr\x01\x8b\
-\x03\x1a \x1b\x18\x86$oD\xfa\xba\x07S\xc1\xca\xa9\
-\xa1\xd8\x01U\xa1\x07\x15oE\x88\xf0\xe1\xf9\xef{\xef\
-\x15n\xa1\xd2\xcb\xca\x89\xae\x0e-\xe1\x8beY\xb8\xf6\
-K_\xc2g\xff\xf1\x1f\xd1\xd1\xd9\x05\xd3\xb2\xfc\x85\xb8\
-\x04\x22\x12?\xf0\x8e\xb6\xa1\x8bi\x9aX~\xe4\x91`\
-\x96UV\xc3\xfa\x01\xc9\x9b\xdd\x1a>.\x1b\x0fSE\
-\x81b\x18\xb0L\x13\x9ae\xf9\x02\x0f\xaa( \xaa\x0a\
-\xcd\x89\xf8=\x86\x90d\x82~?\x01\xd0\xd0\xd0\x00\xcb\
-.1\xee\xae\x99\x9f\xdb\xdb+\x90\xf6\x059+\xaf\x92\
-\x9d\xf8\x81\xca{\xda]\xfe\x97\x90ay,\x90\xf0h\
-\xb0\xc4mq\x97\x98\xe7\x04\xeeL\x8cJ\x00\xcd\xe9\x04\
-\xe3\xedw\xe786\x10B\xc0,\xbb\x0c\xac\x82\x07\xc4\
-i\xa1\xe5\xf8\xbf\x1fl\xbc5\xa5\x04\xafl\xda\x84\x5c\
->\x8f\xbaT\xca\x05+R\x01|\x0f-b\x993g\
-\x0e\xfe\xe1\xb2\xcb\xb0\xbf\xbdC\x1a\xd3\x95\x87P\x13y\
-\xe4\xa8\xbcVm\xdb\x86\xc2\xd8\x01u\x8c9\xd8\x22-\
-U\xd3\x5c\xc025\x0d\xaai\xc2\xf6(\xe0\x1d\xa3=\
-EQ\xdc\xc6%N\xf3\xdc\x09\x93\xd5\xc8:\xc7\x85\x8b\
-\x17\xc36-\x19\xf5\xc9t\x8b0\x10\x06\xd7%\x18>\
-\xe9\x82\xa7\xab\x8eW\xf1\xce=\xde\xf0\x01\xc0\xf2\xcf\x10\
-\x86\xe3\x85\x80EYsH\xca(}\x0f\x93\xe6\x89\xd4\
-\xb8\x07\xb0\x86\xfb\xad\xba\xae\x81P\x22\xc3\xc8\xd2\xc1\xf3\
-\x1eH\x07-\x99\xe7\x0b\x22\x9a\x16\x92\x16L\xd3\x0dO\
-\x1e<\xc30\xf1\xc5\xcf}\x0e\xa9\x9a\x1a\xa8\x91\x88\x00\
-,\xcft\xf1T\x03\x96pi\xb5\xdd\x1b\xc5\xc1\x06\x98\
-\x84\x10\xe4\xf3y|\xe3\xa6\x9b\x5c'\xd6\xa9\x88v(\
-\xa5h\xd9\xdf\x22\x9a\xf2r.f\xb6>`7\x13\xb7\
-\xb4MQDY\x9b\x14\x95\xda\x96\xe5:;8\xa0F\
-d;=\xaa(n\xdb\xb7\x09\xab[u\xeb\xf48\xe2\
-\x89\xa4\xab,w\x19g\x9f\x9e\xdb\x0fV\x0e\x96\xb0\xb2\
-T\xcf\x13I\xc2?C\xe8\xed\x8bL<\xcfy\x81O\
-\x10\xe5N]\xb1\x04?\xee\xe7\xc2\x1c\x1c\xe1\x9cs\xc6\
-\x18\xb9\xe3\xd6\x9b{\xbc\x80E\xc5\xb1\xa3e\xc8\x1c\xd1\
-uP\xa2\x88\xf6\xd2\x8c\xfb\x0ebpz\x16\x9e\x90\xf0\
-`\x9a\xe1!\x008\xa5\xd8\xf2\xce;\xe8\xec\xe8@4\
-\x95\x82\xe6H\x18\xa6\xc1&\x86s\x0e\xcb\xb2`\x9a&\
-\x16/^\x8c\x81\x81\x01\x14\x0a\x85\x83.\xf5a\x8c\xc1\
-4\x0c,[\xbe\x1c\x83\xe9\xcc\x94\xed\x9f\xa6ix\xf2\
-\xd1G\xdd\x81\xfdA\x8c\xb0\xbc\x11\x14d\x7f\x04\x22\x9b\
-\xe4\xfa\xa4\x09\x8e\x84\xc8\xd3\xa4\xc4\x05\xab\x09JO\x1d\
-\xce\xaaa\xc6L\xe9\x1e\xe1\x10\xdd\xde\xc8\x86x\x1e\xfb\
-\x1dU\xb8d\xccK\x1c<q\xdd\x0eX\x80s\x22\x9e\
-\xcfc\xc1\x9aE\xee\x9d\x89\xa4 \x9ej\x17\xc6\xb9\x0b\
-\xe2\xcc\x93\x0e\xda\xcc\x22\xc1\xb1\xa9\x82s\xea\x10\x83\xc1\
-\xc8$\xa2\x8b<\xda\xf5_\x0e\xcc\x12\xfa\x1fS\xb7x\
-ZS\x15\xcf4\xe6\xf4/\xb1H\x0c7}\xedk\xa0\
-\x9aVJ\x05\xe5\xdd\x87M\xd2>\x12It:\x16#\
-3f\xcc\xc0\xbcy\xf3PSS\x83\x8b/\xbe\x18g\
-\x9f}6\x00\xe0\xf2\xcb/\xc7\xe6\xcd\x9b\x0f:\xc0\xe2\
-\x9c\xa3\xae\xb6V^\x9bl\xca\xd8\xc8tz\x08o\xbe\
-\xf6\x1a\xe255nQ\xfd\xc1\x00\xde\xb6mC\x97\xad\
-\xee,\xc9\xe3)\xa3,\xdfr\xda\xb9\x11\xd9\x93\xd2E\
-\x03O\xab\xb7\xb1j\xadF\xba\x06\xb9\x04\x03U\xd3\xbc\
-A\x94\x97\x92\x0aDW\xf0sWNsA\xc6+\xb8\
-\x8b\x22D@Z\xa1\x19\xab\x93\x10R\xf1\x1e\x0a\xea\xd1\
-bI_1OIO\xb1h\x82\x03E?`\x016\
-\x00n\x87\x1c\xa8h$\x02J\xa9\xb4\x83(\x81V\x19\
-x\xa1d\xb8\xc5\x19\x13\xc2?\x8e\x8a\xde\xd6S\x99\x0e\
-r\x00\x1b\x9f\x7f\x1e\xaf\xbe\xf2\x0aj\x1a\x1a\xdc\xae\xcc\
-\x13\xcd\xbdx\x07z.\x97\x83a\x18X\xb5j\x15>\
-\xfd\xe9Oc\xf1\xe2\xc5\x983g\x0e\xe6\xcf\x9f\x0f\x00\
-\x18Lg\xd0\xb4g\x1f8\xe78\xf5\xb4\xd3\xf0\xfa\xeb\
-\xaf\x1ftbI\xce\x18N8\xe1\x04\x0ce2n7\
-\xde0o\xa3\xd2\x05K\xc6v\x86<\x03\x9eR\x8a\x0d\
-\x7f\xfc\x83\xdbB\xca+\x8d\x98.\xd0.\x16\x8b8\xe5\
-\x94Sp\xf6\xd9gc\xce\x9c9\xa8\xab\xabCKK\
-\x0b:;;\xb1~\xfdzl\xdb\xb6M\x18;\x0e\xe7\
-f\xe2\x89\xa8*5\xc9\x9d\x8c\x9b\xbb3N\x19\xe7H\
-&S\xa56|e\x92'\xaf\xfd\x1e)?\xcfA\xf0\
-!\xbe>\x14n\x92\xe9\x8d\xa4\x88'\xde\xf2\x22\x05\x07\
-\x97U4p\x95\x05pg\x04=\xe3\x96\x00\xb9|\x0e\
-\xf0\xb4\xa9\x17\x80%\x12\xca\xd0\x1f\x1c\x8fE\xa0(\x0a\
-l\xc6\x5c\xe4\x0f\xa6\x84\x8e\xee\x8a\x12\xea\xea/\x14J\
-}\xdd2\xa6+\x15t\xec\x98\x1f\xf8\xf5\xaf\x10w\x88\
-v\xa7N0x\x22&h\xa9\xae\xaa\xc2\xcf\x7f\xfes\
-\x1c\x7f\xfc\xf1\xa5\x14\xd0\xb6\xd1\xd3\xd7\x8f7\xb7l\x85\
-eY\xbe\x8b{\xd5I'\x95\xee,\x07Y\x84\xd5\xdd\
-\xdd\x8d\x81t\x06\x96,RV\x15\x05\x94*P\x14!\
-{qd\x07\xe2\xdf1\xea\x84$W\x05\x00\x03\xfd\x03\
-\xf8\xf6\x8d7 ^U\xe5\x0a\x97\xa7\xf3\xb8TWW\
-\xe3\x1b\xdf\xf8\x06\xce9\xe7\x1c\x01^\x86\x09\xc6l\xac\
-\x5c\xb9\x12\x8a\xaa\xe2\xca+\xaf\xc4\xf6\xed\xdbq\xe5\x95\
-Wbhh\xe8\xa0\xe4\xd2\x9ch\xa5q\xd6LW\x87\
-U\x92-\xf8#,\xbf\xd7\xbb\xe7s\xb8\xaf\x12\x10`\
-\x1e\xd1CH\x89\x8f'\x89D\xf90\xe3`\x9c\x02\xb2\
-GDP\x02\xc19s\x0b\xa3\xf3\xf9<\x00\xec\x09\xa4\
-\x84\xb0+\x85\xa2\xf1X\x14\x94*\xfe\xb6<A\xc2]\
-\xfe oR*\x0e\xd4\xc4DX\xe3\xb5pWT\x15\
-\xef\xbd\xbbE49\x95\xa4\xe6d\x0e\x82H4\x8a\x85\
-\x8b\x17\xa3\xad\xb3\x0b\xf9Tw\xd8\x92\x00\x00 \x00I\
-DATB\x01\x03\x83i\x98\xa6):\x0f\xc9YW\
-\xefI\x8e\xc4\x13\x88\xc5b(\x1a\xc6A\x95\x16\xda\xb6\
-\x8d\xd6\xfd-\xe0\x9e\xae\xc4\xc2\x94\xce.\x9f\xd7\x09\x1c\
-N\xea\xb1#rHs_}\x9as\xad\x11\x22\xc4\xa7\
-\x9cc\xe3s\xcf\xe2\xd6\x9bnt\x1b\xd0z\x09\xe3\xa9\
-^,\xcb\xc2%\x97\x5c\x82\xeb\xff\xfd\xdfA\x14\x15;\
-w\xefA:\x9b\x85m\x8bn/\xaa\xa2BU\x15\xa4\
-\x92\x09\xcc\x98=\x1b\xbf\xf9\xcdop\xcf=\xf7\xe0\x91\
-G\x1eA\xccS1r0\xdctD\x87\x1a\x86\xea\xea\
-\x1aq\xe6x9\x80\x04\xcbm8\xfcL9\xf31\xe7\
-\xac\xac|&X\xca\x13\x0eV\x9em\x14\x80\x80BQ\
-H\xe9\xf3\x1cz\xa643\x88L6\x07\x00\xbe\x8ax\
-\x95\x83[\x95\x00+!\x1b\xab\x8a\xf6\xf3<\x14\xb0\xb8\
-\xb4D%\xce`\x94\x0a@G5;\x91\xe9\xddX\xde\
-\xa4\xaa\x0av77\x0b\x81\xa8\xaa\x02\xde\xe6\x11\x93\x90\
-F\xf5\xf7\xf7\xe3\xddm;\x10\x8dF\xdd\xa8\xd7\x97\x82\
-r\x7f\x1c8\x94\xc9\xa2\xae\xb6\x16m\xed\xednU\xfe\
-\xc1\x90\x0er\xc6\xb0\xb7y\x0f\xba\xbb:Q[\xdfP\
-\x89\x99)\xfbS\x5cK\xa5\x1f\x19\xc6~QI@[\
-\xa6\x89\x17\x9e{\x16\x8f\xdc\xffk\xbc\xbby3\x08\xa5\
-\x88\xc4\xe3%\x87\xd7i\x00p\xcb\xb2\xf0\xf1\x8f\x7f\x1c\
-\xdf\xf9\xcew\xb0}\xf7\x1e\x0c\xa53R\x18+~(\
-\xa5\x0a\x18g(\x1a\x0c\xc5\xbe\x01\xf4\xf6\x0fbfC\
-=n\xbb\xed6\x1cv\xd8aX\xb7n\xddA\x95\xde\
-3\xc60\x7f\xde<D\xa21drY_\xf1\x0c/\
-\xebn\x13\xb8\x15\xb1@\x8e\x14x\x5c\xb1}}%\xb0\
-\x92\xaf+\xf2\x9a\xa1\xd2=\xc2\xe1\xd9\xfc\x94\x13C6\
-\x97\x03\x08\x9a|\x80\xb5\xe1\xb1\x87\xed\x0b\xd6\x5c\x0a\xdb\
-\xb69\x97s\x8d\x0e QJ\xa1i\xa2\x9bq6\x9b\
-CU*\xe5Cn\xef\x8e)R(\xeaT\x14q6\
-\xcd`\x05\xb1O\xff\xb9\xeend\xd2i\xd444L\
-\x0a\xb1\x19\x1c\xe8\x99\xa1!\xe1\xeb\x1d\x8b\x96\x958\x84\
-\xa7\xae\x04\xf5\xf5\x0dhim=8t \x9e\xc8F\
-U\x14\xfc\xf2\xc7\xff\x85k\xae\xbfaL\x91\x0e\x91\x05\
-\xc1\x84R\x14r9\xf4\xf5\xf6\xa0\xaf\xa7\x07\xef\xbc\xf9\
-&\x9e\x7f\xe6i\xbc\xb3e\x0b\x00@\x07\xa0;Jo\
-G\xcc\x8b\xe9\xd1\xc7\xcd\x99=\x1b\xf7\xdcs\x0f\xde\xdc\
-\xb2U6\x90\xf0\x0e>\x1e\x1a\xc5\xb4wua`h\
-\x08\xff|\xe5\x95\xc8f2\xb8\xefW\xbf\x82)[\xe4\
-M;`\xd96\xaaR)\x98\xb6YF\x86\x87\x02V\
-\xa5h+\xe41\xe7\xe5ba\xees\x1a\xf5\x1b\xcf8\
-\xcf9\xd7\x05\xe5<\xf43\x1d\xae-\x93\xc9\x82pl\
-\x0b\x92\xee\xf2\xceb\x13\x1fY-/\x16]\xd3\x10\xd1\
-#\x18\x1cJc\xb6\x93\x07\x07\xf5X\x9c\x83*%\xe1\
-\xa9\xcdl(\x84N\x1bP\x95n\x08\x1c\xf7\xae[\x87\
-X\x22Q\xd6\x95y\x12\xe2o0\xc6`\x14\x8bx\xef\
-\x9d\xb7q\xc69\xe7\x82\xdb\xf6(~#GMm-\
-\x98e\x95\xfa\x1cNo\x1e\xe1\x0e4EU\xf1\x97g\
-\x9e\xc6\xd5\xd7|\x09\x91ht\xc4\xe3'\xc8y\x02U\
-\xd5\xa0G\x22\xe8\xef\xed\xc1\xab\x9b6\xe1\xd5M\x9b\xb0\
-\xafy7:\xdaZ\xd1\xd5\xd5\x05&/\xbc\x98\xd4\x1f\
-9\xed\xa8\xb4h\x14\x8a\xae\x8fz\xf6m\xa2\x97\xa1\xa1\
-!<\xf4\xd0C\xd8\xb2}\x07\x8c\x03H\xd1\x09!\xc8\
-\x17\x0axw\xdbv\x5c\xf3\xa5/\xc10M\xdcw\xdf\
-}\xd3\x9e\xe2s\xcea3\x86y\x0b\x16\x08\x93D\xa9\
-\x19u4X.\xcf\xeb\x5c\x89\xbc\x5cCEJ\x80\xe0\
-\xeb\x10\xe8\x03+^r#\xf5\x0b\xddYY\xb4\xe5\x1e\
-\x13N@\xa54\x823&;o\xd9\xb0e\xa4e\x98\
-\x16,\xcb\xe2\x94\xd2\xf6/_\x7f#~p\xcbwJ\
-\x80E\x08\xe9-\x1a\xc5\x19\xc1O/\x01\x96\x8et&\
-\xed\x8bN|\x9c\x168(U@\x89\x22\xea\x84l\x0e\
-\xaa\x8e\x8f0\x1d/X\x11B\xd0\xde\xda\x8at&\x03\
-U\xd7]O\xa1\xc9\xbak\x13\xe7\xc03\x867^~\
-\x05g\x9d{>,f\x8dj?\x8f\x5c\xb1\x02\xeb\xd7\
-?\xe9\x0a\x07\x0f\x06\x02\xde\xa9\x0f\xb5m\x1b\xb7\xfd\xc7\
-7\xf1\xad\xdb\xeep%\x1a\xce\xb5\xe1\x1d\x90\xb6-x\
-\xce\x81\xfe>\xfcy\xc3\x06<\xf5\xc7G\xb1k\xf7n\
-P\x08\xa1\x9f\x93\x16k\x8e\x83\xa6GP\xa9*\x0a\x14\
-)\xe6U5\x0dp\xce\xd5\x14K\x1a\xbeq\xd3M\xa8\
-k\x9c\x81\xa6\xe6\xbd\xfeA9\xca\xa5P4\xf0\xea\xdb\
-\xef\xe2\x13\x17^\x88\x9f\xfc\xe4'\x07\x85\x1e\xd1\xb6,\
-,^\xb2\x04\xb6]\xe2\x88\x84\xed\x93C\xa4{Z\xd2\
-s\xafG\xaf\x1f\xc0J\xef\x0d\x90\xee\x0e\xfe0\x1e\x08\
-\xd2=\xb3~\xdc\x9b\xf5p\xd9\x1c\x83\x96\x04\xa2pR\
-\xc2\xd2\xf6E\xe1!\xc6\x00\x9ev\xc0\xca\x1ba\xb5\xe5\
-\xf3\x85\x19\xf0 \xab3\xb0#\x11\x0d\x91H\x14C\xe9\
-\xc1\xd24)\x0b\xba7\x10\xa8\x0a\x91Q\x16D\x84\xc5\
-\xe9\xd8+\xcc'\xe8d\xed\xdb\xb3\x07\xb6mC\x93w\
-\xec\xc9T\x94{\xcd\x98_{i\x93(\x5c5F6\
-n\xe3\x9c\xe3\x84\x13O\x04\x1bgK\xa8\x89\xcf\x0cE\
-I\x09\xd54\xbc\xf0\xec\xb3\xf8\xc2?^\x86sV\x7f\
-\x12'\x9er\x0a\xe6\xcc\x9b\x8fX,\x86\xce\x8ev4\
-\xbd\xbf\x0d\xcdM\xbb\xb0}\xeb\x16\xbc\xfb\xc6\x1bh\xe9\
-\xe9\x81\x0aQ\xa0\xaa+\x8a[\x0f\xe7\x88'\x09\xa5\x22\
-\x1d\x90\xd1\x95#3QTU\xd4\xcfMSt\xa5\xa9\
-*\xce\xbb`5v\xec\xda\x0d:\x1e\x9b!\x0e\xc4\x93\
-UXy\xd4Q\xd8\xbec\xc7\xb4FYNM\xde\xea\
-\x0b?\x85\x8e\x9e~Oz\xcb\xcb\x5cC\x83L\x13\xe3\
-\xfeL\xc5\xbd-\xcbv7~\x09\x97\xbf\xc1!c\xc1\
-4\xd0;J\xc4\xb5@iIU\xe0\xee\xabk\x9f\xcc\
-P,\x16A\x08a\x00\x19\x0cK\x09\xf7d\xb2\xd9\xe3\
-H\xa0\x931\xe7\x1c\xd1\x88\x0e=\x1aA\xba#+\xda\
-q\xcbY\x9d`Z\xa8\x10\x0eB\x84z\xdc\xb6l`\
-\x0c\xc4\xe3D\x0e\xd5H$\x82\xfb\x7f\xf9Kw\xd6\xc9\
-\x01\xab\xc9\xbc\x80\x1c[\x9e\xde\xde^d3\x99Q_\
-\xf8\x0b\x17/qk1\x0f\x96Bl\x87gPU\x15\
-\xb1D\x02;\xdf\x7f\x1f\xdb\xdf{\x0f\xf1x\x1c\x89T\
-\x0a\xd1H\x14\x03\x83\x03(d\xb30\x0c\xc35\xb0K\
-IQ.\x91\xc7\xdd\xe1\xb0(\xa5 \xaa\x0a\xc5i\xaa\
-\xe0\x80\x96\xe71\x91\xaa\xf0\xe9\xe0y\x0e;\xe2\x08d\
-\x8b\x86\xc7iw\xec\xcb`:\x8d\xbf\xfb\xbb\xbf\xc37\
-\xbf\xf9M\x111N\xe3\xe4\xc9\x82\x05\x0b\x90\xce\x15\xfc\
-\xe3\x8b\x13O\xba\xc7=\xed\xbc\xb8GW\xe5\xd8#{\
-[\xd6{+\x0c\x11\xeau\xe7}\x8e1\x04\xec\xd1\x09\
-\x00\x0aB(\xa8B]\x90r|\xf38\x17\x19\x0a\xe3\
-\x1c\x85bQ6\x22\xe2}e\x80\xc5\xc1\xf7\xe6\xf2\xf9\
-\x12\xc2y\xbe8\x1e\x8d\xba3\x80\xf9|\x01\xba\xae\xcb\
-R\x1d\xbf6K\x01@\x15\xd1\xa2\xdb0-D\xa3\xfa\
-\xd8L\xc7&\xe8dQ\x85\xe2\x89\xc7\x1f\x87\x1a\x89\x88\
-\x99\xc1) q\xb9\x98\xa9\x80\xaa\xaa\xd8\xbfw/\xe6\
--\x5c8\xaa\xf7\xf5\x0f\x0ea\xe5\xca\x95\xd8\xb9k\x17\
-\x0e*\x0bA'\xf2\xd1u\xa8\x8c\xc12\x0c\xe4\xf2y\
-\xe4r9\xb7\xb30!\x04\x8aT\x80;\xe0\xe4\x80\x95\
-\x22A\xca\x05.\xd92\xcd\xf9\x17\x94\x96\xb5\x95\x9bj\
-\xb7WB\x08\x0c\xc3\xc0\xd9g\x9f\x8d\xc1\xa1\xf4\x84\x5c\
-#\xf9|\x01+\x8f=\xde7F\xa6\x85pg\x0c\x87\
-\x1f~\x04r\xf9\x82+\x15\xf0\xfe6VF\x903\x1f\
-\xe9\xee*)\xf9\xe8H\xf8\xb2\x0c\x81\x04\xadf\x08\xa8\
-\x22\xbak)\xb2\x13\x10\xf3\xf6\x82`\xa5Y\xc2|.\
-O8!\xfdw\xdez\xb3Y\x06X\x04dW&\x93\
-\x05()seH\xc4\x85\xae\x84\x12\x82L.\x8bT\
-*\xe9\x9b~,qY\x80\xa2\x88;\xa8a\x9a\xbe\x9c\
-\xf6@S\xaa\x89X\xda[\xdb\x90\xc9dP\x17\x8f\x8f\
-/\xc4?\xb0\xab\x1fDj\x8b\xf6\xedi\x1e5`\xa5\
-3\x19|\xec\xcc3\xb1\xa3\xa9\xe9`\x82+\x01F\xaa\
-\x0a-\x12\x11\x13+\x94\xc2\xb6m1\x99\xe0\xf8_y\
-S\xbcJQ\x93\x87\xb3\xf29\x828\x84\xc7$D\xd8\
-\x072\xa8M\xc3\xc0\x09\xabN\xf2qt\xe3\xbd\x0e\xfa\
-\x87\x86\x10\x8f\xc5`\x98\xe6\xb4E\xcd\x85B\x01\xab\xfe\
-\xe6d\xd8\x9e4\x8ex\xc0\xc8?C\xc8\xcaf\x0c9\
-\x1f\x06\x9c\x82\xb3{@Ye\x02g\xdcW8M\xa4\
-\x94\x81\x12\x05\x94\xd02\x1ca\x0e\xdd\xc4\x19\x862Y\
-\x80\xe3\xcf\xc1\xdf\xe4\xe4m\xdb\x862i\x11\x0a\x06\xb4\
-VI\xa79\x05\xa5\xc8d\xb2`\x8d\xac\x82\x17\x96\x9c\
-)T\x14\x18\xb6u@*e>\x09\x11V\x7f\x7f\xbf\
-\xcfOh*I\x5cEU\xb1o\xef^\x9c<\xcac\
-\xc0\x19\xc3\xdc\xf9\xf3\x85\xdeg\x8c\xcd2'\x8d\xffR\
-\x14(\x9c\x03\xd1\xa8(\xe0\xb5\xed\xd2qt\xa6\xa7\x1d\
-`\xf2\x88>\xbd\xae\x03\xeey\x90Q\x99\x8fG9\x08\
-8;\xaa(H\xa6\xaa0(\x84\x8a\x13\x04Z\x14\xf1\
-D\x1c\xf9\xde\xbeQu\x9d\x9a\xe8\x1b'\x18C\x22\x1e\
-\xc7E\x97\xae\xc5;\xefm\x13=CY\xa9l\x86\x8d\
- i \x1e\x1e\x8bxy\xac \xe9\x1e\x000i[\
-\xec\xe7\xb1\xe4\xff\x08\xa5\x00\xa5PT\x05\x8a\xa6\x82\xc9\
-I)\x17\xb0\x18\x13Jw\x10\xe18\x0b\xf6h(`\
-q\xe0\xdd\xa1\xa1\xac\xcb\x1fxAK\xd7UD#\x11\
-h\x9a\x8eL6W\x16Y1O\xc1\xa2\xa6\x0a\xc2\xd4\
-,\x1aS\xaa\xa1\x09\xfb\x96\xde\x9e\x9e\x92O\xfbTZ\
-\x94\xc8Hb\xf7\xce\x1d\x22\x22\x19e\xcf=E\x8b\xc8\
-n\x22\x95y,\xe7x[\x96\x05]\xd7Q__\x8f\
-e\xcb\x96\xe1\xe8\xa3\x8f\xc6\x03\x0f<\x80t:=i\
-\xe4\xbb\x03H\xcck\x8f\xe2q\x18 \x9e\xf4\xce\xa9\x99\
-+\xf3\xc8?\x08\xadb8c\x88E\xa3\x18\xca\xe4\xbc\
-\xe6O\xe3^TU\x85\xaa\xa8\xd3\xe3\xb5&\xbf\xf3\xeb\
-7\xdd\x84\xdd{\xf6\xba\xee\x0a\xce`a\x02\x81\xc2\xd3\
-9)\x9d\xf2\x02TX\x9a\xee\xdd\xd6g\xd2\xe7\xf2\xf2\
-\x9e\xef\xf4\x0a\xa68\x01!\x14\x0a\x05\xb8\xed\xc7\x0f\xaf\
-h4\x93\xcd\x80P\xf2t(`mx\xf4\xa1\xce\xb3\
-\xce\xbf\x10\x85b\x01\xd1H\xd4\x07Z\x8c1\xd4\xd5V\
-\xa3\xa7'\x81t:\xed\xf6\x9bs\xfeuHx\x00P\
-\xa9\xe8\x9eR,\x14&\xfd$\x8d\xf4\xe9\xbbv\xed\x82\
-&\xb9\x95\xa9\xbbN\xb8\x1bQ\xec\xda\xb1\x1d\xaa\xa2\x8e\
-\x0a\xb0\x08\x80\xda\xdaZqg\x92\x1ePa \x15\x8d\
-F\xb1d\xc9\x12\x9c{\xee\xb98\xe7\x9cs\xb0p\xe1\
-B$\x12q\xa8\x8a\x86\xd7_{\x0don\xde<\xe1\
-\xe9\xaf\x03H\x8cs(\x84\x80z\x06`\xc9\x16\x99\xf8\
-\x1c\x07\x80\x83\xa5\xe5\xc8\xc8\xe7K\x1c_\x1b\xb1X\x14\
-\xd9\x5cn\xc2\xae\x17\xdb\xb6\x91JU\xa1\xb5\xbd\xdd\x95\
-tL\xf5u\xd80s\x16\x06\x87\xd2\xa0\x94\xf8[\xcd\
-3\x16.\x00-\xe5v\xa5T.\x10\xf1\xfb\x1e3O\
-z\xe9\xbe\xeey\xc1\x8bS\x5cDv\x94\x00\xaa\xaaA\
-\xe3\x1c\x967\xba\x925\x84\x8c1\xa4\x872\xb0m\x96\
-\xbd\xfb\xb6\xef\xf5]{\xdd\x0d\xb8\xf3{\xdf-K\x09\
-A\x08\x06{z\xfb\xaa\xe7\xcd\x99\xe3\x93\xc93\xc6Q\
-_[\x83x\x22\x89\xd6\x96\xbdn\xde\x1f\xe6@J5\
-E\xb6\xe8&\x93j\xf86\x1a(\xdc\xd5\xd4\x04E6\
-I\x98\xaa\xbb\x9c[T\x0d\xa0\xbd\xbd\x0d\x16\xb3Gm\
-_S\xd7\xd8\x08EQ`J=\x93\xaa\xaaH&\x93\
-hll\xc4\x8a\x15+p\xca)\xa7\xe0\x8c3\xce\xc0\
-\x8c\x193$\xef\x95\xc5`:\x83}\x1d\x9d\x18Jg\
-q\xdc\x09'\xe0\xe5W^\x81.\xf9\xa6\xc9\xf8m\x8e\
-\x0a\x9e\x8c\x22%=X\xd2\xbd\xd1pX\xaa\xaa\xa2\xa7\
-\xb7\x17\xb1x|\xc2\xec\x86\x1c{!.k\xf9\xa6\x1a\
-\xc09c0\x19\x87F<\x1a\xaa\xc0y\x09m\xcf\xe5\
-\xe1\xa6x\x18W\x15\x00\xb7\x8a\xcd,\xfc\x01\x9f\x18\x1b\
-\x84\x80\xaab\x22\x07\x81R?\xd1 \xda\x06c\x1c=\
-\xbd\xbd\x9c\x10\xd2\x04\xc0\x07V>\xc0\xa2\x94vuv\
-uW\xcf\x995\xcb'Y`\x8c\xa1:\x95D4\x1a\
-C\xd10\x91\xcf\xe7\xa1\xaa\xaa+\x14\xb4m\x1b\x8a\xcc\
-\xd15\xc2\xa0(bZ\xdb\xb2\x99\xf4u\x9fx\xb0\x1a\
-\xcd\xc9\xdf\xd3\xdc\x0cu\x1a\xeeln*D(vn\
-\xdb\x86EK\x0e\x1b\x1d\x8fBU\xcchlD\x22\x95\
-\xc2i\xa7\x9f\x8eSO=\x15s\xe7\xce\xc5\x82\xf9\xf3\
-\x11\x8b\xc7\x91\xced\xd1\xd3\xd7\x8f\xb7\xdf{\x1f\xf9b\
-\x11\xc5\xa2\xe16\x7f \x84`\xd5\xaa\x8f\xe2\xeeu\xeb\
-\xa0k\xda\xa4\x90\xbc\xc3\x01\xfe\x07\xd9^\x9aK\xbeS\
-U\xd4\x03\x9e(\x1a\xe9x\xf5\xf7\xf7{G\xec\x94\xfd\
-&\xdb\xb2p\xec1\xc7\xa0\xa1q&\x06\x87\x86\x02u\
-~\xdc\x9558\xfd\x17\xdc\xf6\x5c!\xfa,\x0eR\xf1\
-\x06\xc4G|\x5c\x02EJ\xa4S(D\xb9\x1f\x93\x12\
-\x06\xc7\x99\x81\xd9\xb6kc\xd5\xd5\xd3\x0bJ\xe9\x8e\xd0\
-T\xbb\xc4\x11\xd2\x9e\xee\xde\xbe\xa5\x9cs\xc2\x02:+\
-U\x92\xa9\xb1X\x14\xed\x9d]H$\x12e\xdeX\x9c\
-s\xa8\x8cC\xd1\xb5\x12\xd7A'\xe7$\xb1\x11\x07?\
-E\x7f_\x9f\xb4m\x96*\xda)\xa1\xaf\x88{\x87V\
-5\x0do\xbd\xfe*\x16\x1dv\xd8\xa8\xa6\xb6\x87\xd2C\
-xb\xc3\x06TWW\x8bi\xddB\x01\xfd\x03C\xd8\
-\xb6{\x0f\x06\x87\xd2\x15sI\xc7(q\xfe\xa2\xc5\xb0\
-\x0c\x03,\x1e\x9f\x16\xcb\xe7\x0f,`1\x06\xdb\xb2\xb0\
-gw\x13\x96.?r\xc2d\x08\x96e!\x93\x1e\x02\
-\xb7mp\xa7\xf8}\x8a\xa2|\xc30\xf0\xf3_\xde\x87\
-W\xde~W\xd4\xe59\xda*i\xe0N\x02\xae\xa3 \
-\x92`w\x00\x8b\x10\x10Y.S2\xf0c\xc3K\x18\
-B\x1e\x13\x9fDB\x01\x14A\xb8kTh\xb4\x9c\xba\
-\xc1RJ(\x02\xa0B\xa1@@\xc8k_\xbe\xeeF\
-\xfc\xe0{\xdf\xf1\x8fm\x97\xf4\xa5\xb4\xa3\xbb\xbb\x87\xb8\
-b.\x0fh\x092\x1d\x88\xc5\xe2\xe8\xec\xec\x0e\xb0\xfa\
-\xdc\x0d\xad\x19\xe7\x88\xa8\x1a(\xe0\xb6\x06\x0b\x03\xb6\xf1\
-\xae\x18\xc5*\x95\xb2\x9e\x86\xb0S\x17a\x81\x10h\x9a\
-\x867_{\xd5s\xab\x19y\xed\x1d\x18\xc2\xb6\xa6]\
-xe\xf3\xdbx\xe9\xf5\xcd\xd8\xd6\xb4\x0b\x03\x03C\xa3\
-zo\xaeP\xc0\xfcy\xf3\x0eJo\xad\x83}\xd1t\
-\x1d?\xfd\xd1\xbd\x82o\x1c\xe5\xb9\x1av\x0508\xd0\
-\x8f\x01\xefMs\xaa&\xa0\x18\xc3\xa9\xa7\x9e\x8a\xb6\xae\
-\x1e!\xe0fN\xa4\xc4\xdc\xbf\x19\xe7\x803\xc1\x03Y\
-V\xe3u\xfbt<\xca\x9c}\x0e8\x81\xc2\xb14\x0e\
-{\xec\x10V\xac\x04\x82\x8e\xd12\x05\xa0\xa8\x0aTJ\
-\x9d\xdc\xd1M\x9b\x19\x13u\x8f\x96e\xf1\xa2i\x82\x00\
-\x7f\x0e\x82\x95\x0bX\x17\x5c\xb4\x16\x84\x90\xed\xe9L\xd6\
-W#\xe8\x80\x12!\x04U\xc9\x04\xa2\xd1(\xd2\xd9\x0c\
-L\xd3\xf2\x89G\xbd\xef\xd1TQ\xfcj\x98\xd6\xb4Q\
-\x18\x8cs\x0c\x0c\x0c\xb8\x9c\xcbT\xa7\x18\x8e\x9ed\xf7\
-\xae]\xa3\x9e%$\x84`\xcf\xfeV\xb4wt!\x97\
-\xcb\x97\x84\x97\xa3\x0cR3\xd9,\x96\xafXq\xa8\x03\
-\xd0\x18HwB)\x9av\xee@k\xcb\xbe\x09\xf9\x5c\
-]\xd3\xf0\x8b\x1f\xff\x17\xaci\x10\x8d\xe6\xf3y\x5c~\
-\xc5?cOK\x8b\xdf+\x81\xf1\xf2\x16^\x80\xdbV\
-\xcb\xef\xcf\xee\x1bL\x01\xbe:<\xf5\x0b\x12\xec\x8ei\
-\xb2\x93T\x12\x85\x82R\x05\xaa\xa2\x82P\x94\xa2*Y\
-\xa0\xed\x00\x97i\x18\xc4\xb4,\xfc\xe0{\xdfy\xbdb\
-J\xb8\xe1\xd1\x87\xb0\xfa\xa2K7\xe7\x0b\x05\x97\x9b\xf2\
-\xaa\xd8\x19c\x983\xa3\x11\xad\xed\x9d0L\x0b\x86Q\
-t\xedS\x82\xdbjT\xb4,*\xe4\xb3r\x8as\xea\
-\x07\x8f\xaa(\xc8\x17\x0a%m\xc8$\x0fb\xc6\x18(\
-\xa5\x88D\x22\xa8\xae\xae\xc6\xa2\x85\x0bq\xcc1\xc7\xe0\
-\xf4\xd3?\xe6\xce\x84L$g\x14\xba\xbdea\xc1\x82\
-\x05x\xf1\xc5\x17\xa7\xcd\xf8\xee\x83\xba\x10\x006cx\
-\xec\xa1\x07\xf1\xaf\xd7]\x0f\xa3X\x1c\x17\x08vvv\
-\xe2\xd9\x0dO\xa2\xaa\xb6\xceG.O\xc5\xb2\xfc\xc8#\
-\xf17\xa7\x9e\x8a\x97^{\xc3\xe3\x97\x1e\xf4a\x0f\x80\
-\x17\xf7P-<\xe8i5\xbc\xe7U%\x92\xddmG\
-\xe1L\xd6@8\xd3j\x9a\x0e\x85s\x98\x1e\xecp\xb8\
-+\xc69\xf6\xb7\xb7\x03\x1c/T\x1c\xdb\x9e\xd3\xf6Z\
-\xbeP\x80\xc5\x18\xb7m\x9b8\x84\xba-?\xa8\xb1\xa1\
-\x16\xd1hTj$rH%\x93.\xb89\xc0Ee\
-D\xa0j\x1a\xcc4\x9b\xb6>\xaaF\xb1\x88\xf4\xd0\x10\
-\x88\xc7WiBIM\xdb\x86i\x9a\xa0\x94b\xc6\x8c\
-\x198\xf1\xc4\x13q\xf2\xc9'c\xe5\xca\x95X\xb8p\
-!f\xcd\x9a\x05\x9b1tt\xf7\xe0\xfd\x9d\xbb\xa6&\
-\xaad\x0c\xb5\x0d\x8dBjB\xe9!\x14:0\xe2\x07\
-\x94R<\xf1\x87\x87\xf1\xf1\x0b>\x81\xa5G\x1c1\xa6\
-\x19na\x16\x10\xc1m\xdf\xba\x09\xd1h\xcc\xad-\x9d\
-J>\xee\x96\xef~\x17\xaf\xbc\xb1\xd9g%\x03&\xec\
-_\x84=\xb2$\xddI\x00\xb8\xdc\xa6\xa5\x92\x82\xe7\x81\
-\x86\xa7N7f\xf8_w\xb7\xf7D_\xa5\xfa\xc1\x92\
-\xdb,%B`\xacGJ\xa5}\xdcWC(:\xfa\
-ttv\x81\x10\xfcbD\xc0Z\xff\xe8C\xcd\xe7^\
-x1\x0a\xf9\x02\x89\xc7b\x22\xaft\xf8,\xdb\x06Q\
-U$\x131$\x93Uhko\xc7\xac\x993\xca\xd2\
-B\xc6\x184\xce\xa1G4PJP4\x8d\x11\x07\x8f\
-\xdf\xe2k\xe28\x89B\xb1\x88\xa8\xa2\x08N\x87\xd2q\
-\xa7\x86\xce\x85\xa7\xaa*\x96.]\x8a3\xcf<\x13\x17\
-^x!\x8e=\xf6X!\x965M\x0ces\xe8\xec\
-\xee\xc1\xf6\xe6WEI\xc6\x14/G\x1d}4\x8cb\
-q\xcau?\x1f\x5c\x9c\x22%\x92\x99RD\x22Q\xfc\
-\xfa\xa7\xff\x8do\xdev\xfb\x01\x91\xef\x8e\x84\x81R\x8a\
-?<\xf0[\xbc\xfd\xc6\x1bHTU\x09\x9b\x9c\x89j\
-\x88:2Zb\xf6\xec\xd9\x88U\xd7\xa2k\xa8\xd5\xb5\
-\xe2v\xa2+\x87\x00w\x1c\x1c\xb8\xd3\xcc\xd4I\x07I\
-\xc9\xae\xd8\xa1\xd7\x09\xe7\xbe\x99>o\xc4&\x1b\xe9x\
-\x22\xac\x12\xf8yk\x13\x9d\x9aAB\x09T]CD\
-!.\xcf\xea\x12\xee2\xca\xcad\xb2\xc8\xe6\xf2\x8cR\
-\xba\xe9\xda\xebn\xc4\x9d!\x1c\x96\x1a\x00\x8f\xb7\x9b\xf7\
-\xee=\xb6\xb6\xb6FDO\xb6\x0dK\xb6\x0c\xb7m\x1b\
-U\xc9\x04\xaakj\xd1\xd6\xbe\x1f\xc7y\xb8+_\x91\
-\xa7\xecg\xa8i:\x0aE\x13\x89htX8\x9a\xc8\
-\xd3\xe8\x1c\xa7L&\x0b\xcd\xa9\x92\x1f'\x8fE)\xc5\
-\xaaU\xabp\xec\xb1\xc7\xe2\xa8\xa3\x8e\xc2\xaaU\xab0\
-o\xde<\x00\xc0P&\x83]{\xf6aph\x08\x83\
-\xe9\x0c\x8a\xa6Y\xb2\xce\x98\x86\xa5q\xc6LX\xb2\xb3\
-0\xf9\x80vL\x9ej\x0e\x0b@\xa9\xacHU\xf1\xd6\
-\x1b\xafc\xfb\xd6\xf7\xb0\xe2\x98c\xdd\xe6\x1b\xa3\x89n\
-#\xd1(^x\xeeY\xfc\x9fuw\x22\x1a\x8f\xbbV\
-:\x93\x11\xe1\x87-\x8a\xaa\xe2\xf7\x0f>\x88\x1d{\xf6\
-{\xca\xd1\x82\xe9\x9e\xb7TF\x06#\xa5\x1f\xe1\x1f\x8f\
-\x9eR\x9b\xb0\xdf\xc0XY\x9e\x18\x18\xcb\xb2\x13\x0f\x07\
-\x08U\xa0P\x05\x9a\xaaCA\xa9\xe0\xd9M\x05\xe5:\
-\x94\xcepBH\x11\x9c\xb7\xdey\xdbwGJ\x09\x01\
-\x80<\xb5cW\xf3\xb1'\x1c{L\x89\x08\x93\x1fn\
-\xdb6j\xaaR\xd0u\x1d\xa6i\xa1\xbf\xbf\x1f\x8d\x8d\
-\x22\x05q\x94\xef\x8e\xe1}DU\xa1\xea:\x8c\x5c\x16\
-\x89\x18/ki=\xd9\xac7gv\x094\xc6\xa9\x81\
-!\x84\xe0\xfe\xfb\xef\x17\xa2N\xd3D.\x9fGGW\
-\x17\x18c\xc8\xe5\x0a\xd8\xb9\xa7E(\x89\x01(T)\
-'!\xa7p\xa1\xaa\x86\xda\xdaZ\x14M\xf3\x10`\x8d\
-\xe1\xc6\xe4\x80\xd67\xbf\xf2e|\xed[\xdf\xc6\x89'\
-\x9f\x22\xa7\xda-\x84\xa9\xff\x9c\x1b\x83\xaai\xf8\xcd\xff\
-\xfd)\xee\xff\xc5\xcf\xdc\xcfP<\x805\xd9\x8bmY\
-\xf8\xdc\xd5Wc S@6\x97\x97\x91c\xb8X\xd4\
-\x1f)\xf9Y\xf3r~\x0b!\xc2\xd1\xf2p#\xec\xb9\
-\xd2\xf1\x11\xa9\xa1\xa2j\xd0t\x0d\xe0\xcc\xc5\x16\xc6l\
-\x17?\x18c\xe8\xe9\xed% \xa4\xf9\xce\xef}'=\
-\x0a\x0e\x0bP\x14\xfa\xd4\xd6\xed;\xbe\xeaDU\x96m\
-C\xf3 `mu\x0a\x00\x81\xa6\xaa\xe8\xe9\x1b@}\
-}\xbd\x0f\xac\x9c(K\x91QV1\x9f\xf5\xa8l\xf9\
-D\xe3R\xc5%YU%\x04\xad\xb2\xa4d<\x08R\
-(\x14\xf0\xfc\xc6\x8d8\xfc\xf0\xc3\x85b\xd9\x03\x04\xd1\
-\x98\x0eE!\xe1\xdd\xb0\xa7a\xc9fs8\xeb\xac\xb3\
-\xf0\xc4\x93O\x82H\x95\xff\xa1e\x947&\x09X\x8a\
-\xa2\xc00\x0c\x5c\xf7\x95k1\xb3\xa6\x16\xff\xcf\x95W\
-\xe1\xd43\xceDR\xf63\xa0\xf2\x9a\xa2\x84\xc0(\x1a\
-h\xdd\xdf\x82\x9f\xfe\xe8^\xbc\xf6\xda\xab\x88\xe9\xbap\
-Tu\x1a\xa6z\x22\xb0\xc9\x8d\xacg\xe0\xcb_\xf9*\
-\xd6?\xf7?\xa2\xc5\x1e\xe7\x15\xab\x0e\xc2\x94\xee\xc1\x16\
-_\x95\xc1l$\xc0\x0a\xe8\xb0$o\xa5(\x14\xaaB\
-\xa1\xeb\xba\xd4EzdJL\x04C\xe0\x1c\xdd\xdd=\
-\x00c\xb7\x0e\xf7[]\xc0\xba\xe0\xa2\xb5\x00G\xb3\xaa\
-(vO_\xbf2\xb3\xb1\x01\xcc\xb6a[\x16ly\
-\x22\xa3\x91\x08\xaaRI\xc4\xe3\x09tvua\xd9a\
-\x8b]\xb5{\x90|\x8f\xea\x1a\x86\x08u\xf3\xe0\xc9\x04\
-\xa82\x90\xc9\xe5\x11\x8f\xc7Q\x18'\x8f\xe4hO\x9e\
-\xda\xb0\x01\xcb\x97/\x173\x9e^'F\x9b#\x16\x89\
- +\xfa\xa7\xf9\xb8\xae\xa9Ii\x9c\xe2d\x0aEQ\
-\xc1\xc1\xb1b\xe5J\xfc\xf1\xf1\xc7%az(\xca:\
-\xa0(\xcb\xd3N>\xc19\x06\x07\x07p\xd7\xed\xb7\xe1\
-\x8f\xbf\xff\x1d\x96\xaf<\x1a\xf3\x16,\x80\xa2\x8az\xd9\
-\xb6\x96\x16\xb4\xb6\xb4`\xfb\xd6-\x18J\xa7\x11\x97m\
-\xe4\x14\xf9\xafc\x9f3\xd971\xc6\x18\xee\xbd\xf7\x87\
-x\xf9\xcd\xb7d?\xd0\x92\x1e\xd0\xe1\x93\x88$\xcf\xb9\
-\xc7\x9b\xddiV[\xf2cG \x22\xf3o\xeb^o\
-\x01\xa0*]f~\xf0\x12vS\x82\xbbR\x14\x0aU\
-\x8f \xa2*`\x96\xe1K\x03m\xd9Bpp(\x8d\
-\x5c\xa1\xc0\xee\xbe\xfd\xd6\xfbF\x05XR\xda\xd0A@\
-\xac\xbe\xfe~\xda\xd0PO\x18\xe7\xb0\xa5\xd0\xccf\x0c\
-\xa6mc\xfe\x9c\x99\xe8\xed\xefCk\xcb^\x01h\x1e\
-\x19\x84W\x93\xa5\xe9\x11\xa8\xaa\x86\xbca\x22\xa2i\xf0\
-\xda\xddO\x06H\xf9\x90]\xa1H$\x93(\xf4\xf5\x8d\
-\x9d\xcf\x91g\x83\x00\xf8\x9f\xbf\xfc\x05\xd7|\xf9\xcb\x10\
-\xe5\x9a\xfe%\x1e\x8f\x22\x9d\xcd\xf9:\xf2\x90@!\xf0\
-d.\xb9l\x16\xfb\xf64\xe3\xb9?\xad\xc7\xab/m\
-\x12%Q\xba>\xa1\xdeb\x7f%\x0c\xbc\x00\x7fU\x15\
-v:\xf2\xe6Cm\x1b\xad-\xfb\xd0\xb2oo\xe8\xf1\
-$TD\x0e\xd4\x03V\x8e\xbb\xc5d\xdf08c\x98\
-;w.j\x1af\xe2\xfd]\xcd\xa2\xf5;\x11\xd7,\
-\x933\x83\x04\x0c\xdc)\xc5\x01\x93\xdd\xd9\x01\x90RT\
-\xc5<\x93\x81\x8c\xf1\x80%\x93|,\xddC\x19\x98;\
-K\xe8\x8cR\xc6K3\x85\xc2\xc2\x86{\xdc;\x14(\
-T\x83\x16\xd1\xa1\xc2\x86%\xcb\x81l[\x14\xf4;\x01\
-\xcf\xde\x96\xfd\x9c\x00\x9b\x00\xe0K_\xbd\x1ew}\xff\
-\x96\x91S\xc2\xf5\x8f>\x9c]}\xd1\xda\x96\xf6\x8e\xce\
-\xa5\xcb\x0e[\x02\xdb\xb2\xc0TU\xd4\xf9P\x0afY\
-\xa8\xadJ\x22\x11O\xc0\xb6\x19\xf6\xb5\xb6a\xc9\xa2\x85\
-\xbe<\xd4Y#\xba\x98\xe2\x1d\xe8\xef\x83V\xa58\xea\
-\xb5\xf0k%\x04\xa0\xc6s_R\x15\x15\x9a\xa6\x8d[\
-\x83\xe5L\xc9\xb6\xec\xdb\x07\xd34CC\xfb\xead\x12\
-m\x9d\xdd>\xa2\x9ds\xd1]\xd7\xb1Y\x193\xf0\xca\
-\x81\xe4xN\x99\xa6\x89\xce\xf6v4\xef\xda\x89\xfd{\
-\xf7b\xcb[o\xe1\xdd\xcdo\xa2\xc09T\x00\xd1h\
-\x14z$R\xe6ivh9\xb0\xd4Pq\xec\xbd\xa5\
-\xb5\x8em\xdb\xa0!\xa5)\xce\x04\x0b\x91Q\x97kg\
-4E\xa9`UU\x15\x9e|\xf2I\xbc\xfa\xce{\xa0\
-\x04\xb2\x0c\xc73\xb3\xe7\x99\xd5\x13\xd1\x11\xf7\xf9\x909\
-n:\x1c\xfeB\xe7\xb2\xee\xee\xccK\xac\x97\xbaG;\
-\xf3\x8d^\x82\x9fxIwBA(\xa0j*\xa2\x11\
-\x1dL\xda\xc9\x88\xbaAY\x8blY\xb0m\x1b\xdd=\
-\xdd\x84R\xfa\x1c\x80\x8a`\x15B\xba\x03\x00\xee\xdb\xdf\
-\xd6\xf6\x1f\x0e\xd1nK\x04\xa4\xb2e\xbd\xa2\xaa\xa0\x84\
-\xa0\xaa\xaa\x1a-\xadmX\xb4`\xbe\x0f\xb0\x9c\x81B\
-\x19C$\x16\x83\x92\x16\xaaw}\x18\x8f\xf7\x89>\xad\
-6\xb3QU%\xe4\x17\x18WC\x01Q\xb2P(\x14\
-\xd0\xdd\xd5\x85\xba\xfa\xfa\xb2M4ME<\x1aE\xa1\
-h\xf8B\x9a`\xa5\xfb\x81F\x5c\x8a\xac\xdf,\x14\x0a\
-x\xef\x9d\xb7\xb1\xf1\xd9g\xf0\xee\xe6\xcd\xc8\x17\xf2\xc8\
-\xa6\xd30l\x1b\x8a\x1c`1\x870\xf64\xda84\
-S8\xf6(\x8b(\x8a{l\x19c \xd2e\xd5G\
-^;\x11\x99\xa4K\x9c\xa6\x1an9\xd8$\xdf,r\
-\xd9,\x1e\xfc\xfd\xef\xb1\xa7\xad\x03\x85B\x11e\xb6\xec\
-N\xe9\x8bw\x9c\x05\x22\x02\x16\xb8\xd6\x87\xeb9\x18*\
-2Ey_B\xe73\x15\x10\x80Pa%\xa3i\x88\
-(\xa2\x83<\xe7<\x90\x122\x98\x86\xc1M\xcb&\x1c\
-xh\xb8\xe8\xaa\x12`\xdd\xdf\xde\xd9\xfd\x1f\xb6eA\
-!D \xa0\xaaB\x95_@\x19C}]\x0dz\xfb\
-\xfa\xd0\xd9\xd1\x86\x5c.\x0fM\xd3J; \xdd\x1b\x98\
-\xcd\x10\xd7\x15\xe8\x9a\x8aL.\x87\xda\xaa\xc4\x949~\
-r\x10\xcc_\xb0\x00\xefo\xdf>\xee\x0b\x87\x13\x02\xdb\
-4\xd1\xd5\xd9\x89\x9a\xda\xda\xd0\xd7\xebj\xab\xd1\xda\xde\
-9l(\xc5\x0f\x00\xb4L\xc3\xc0\xff<\xfd4\x9e\x7f\
-\xee\x19\xbc\xf9\xce\xdb\x02\x18\x01(\x1es<]UK\
-\x03\xcc3pH \xd2;\xb4\x1c8hQi\x85B\
-8\x07\x95\xd9\x05WU\xdf\xf5K\xa4'=u\x0c\x0e\
-\xa5\x96k*\x8e;c\x0c\xb7\xdf~;\x16\x1f~\x04\
-6\xbe\xfc*(Q\xc09\x0b\x05\xac\xca\xd60|\xe4\
-\x86\xa9A\xb0\x1a\x06\xc0\xbc\xb8\xa5(\x22\x1dV\x08\x85\
-B\x09\xf4\x88\x0e\x8d\x12\xd1j\xcc\x83\x13N\x90\xd3\xd5\
-\xd3G,\xcb\xce\xde}\xfb-\xef\x8e\xc83z\x1f\x5c\
-\xb0f-\xd6?\xfa\xd0\xcel.7\xb0g_\x0bL\
-\xdb\x86m3\xd8Vi\xfa\xd1\xb6\x19\x16\xce\x9e\x89h\
-4\x0ef\xdb\x18\x18\x1at_srRGf\xafQ\
-A\xb6\x99\xb6\x8d\xa2a\xc2K\xd9M\xee*\xd2Q6\
-\xceB`\xef;\x87\x86\x86B'\x0f\x18\xe3\x88\xcb\xb6\
-\xf4#\xed\x17c\xb2\xa8|\x84\xed\xf2\x85\x02\xee\xbd\xeb\
-\x0e\xbc\xfb\xce\xdb\x88R\x8a\x98\xa2\x08\xc7\x0cO;,\
-EU\xa1j\x9aXu\x1d\x8a\xa6\xf9Z\xbc\x1f\x02\xab\
-\x89\xc0.\x19m\xc9tO\xf5\x1cwEJ\x17\xbcQ\
-\xd5T,\x85B\x01_\xff\xfa\xd7q\xd1\xda\xb5x\xe9\
-\xb57@\x08\x05\x83\xe8\xe9\xc7\x85\x19\x83\x9c}\x93\x7f\
-\x03\xae\xe6\xc9\xa5HdOB\x87\x94\xf7\xfe\xed{L\
-J\xe3\xc9w\x1d{\xafW\xe2\xbfv]N\x8c\x88F\
-0\xaa\xa6#\x1a\x8d\x83H\xfbc\x1f\xdf-\x0d\x12\xb6\
-7\xed\x04!\xf8\xfa\xa8\xe8\x1e\xff\x19\x92\xd6(\x8a\xf2\
-\xe6\xce\xdd\xcdg-\x9c?\x9fX\x96\x05UUaY\
-6\x14E\xcc\xa0\xe8\xba\x8e\xda\x9a\x14\xfa\xaak\xd0\xb4\
-k\x0f\xe6\xce\x9e\xed\x937\xb8v3\xe0\x88\xc5\xe2\x88\
-\xe8\x11\xa43y\xd4V%&\xfc\xbcV\xa2\xf2\x17,\
-\x5c\xe8\x8a^\xc7\x9a\x16zg\xda^~\xf1E|\xf4\
-\xe4\x93E\x07\xdd\xb2\xf4\x8dBSU\x14\x8dQ\xe8\x9f\
-<\xc5\xa3\x95\xb6\x9d;g\x0e\x1a\x1b\x1b\xd1\xdf\xd7\xe7\
-z\xa4\xbb6\xc42U\xf1Z\x12S9;\xe4\xf5N\
-?\x04Z\x13\x07Z\xee\xcd\x8b\x10\xdf\xb5\xe6z\x9fM\
-\x91\xac\xc5\xb6m\xdcr\xcb-\xb8\xea\xaa\xab\xf0\xf83\
-\x7f\x86m1\xb7\xfc\x860Qn\xc39@\x18\x97\x0a\
-{\xa9V\x0f\xe4\x84\xcc\x19\xea\xc1:@\x060\xc2\xfc\
-\x04:\x09\xd6\x0dzo\xcd\xde\xed\xfc\xec+%\x14\xaa\
-\xa2B\xd7\xa3\x88\xebDFS\xdc\x17\xf8X\xb6\x8d\x9e\
-\xde^\x18\x86iPJ\x1f\x1c\xcd1\xf0\x8d\xe4\x0d\x8f\
->\xec\xf0'\xaf4\xefm!\xa6e\xc2f\xb6\x98z\
-\xe4\x0c\x96m\x81q\x06\xd36Q_[\x8d\x9a\xba\x06\
-ttu!\x9b\xcd\xba\x11V\x90\x80\x8f\xc7#\xd0\xa3\
-Q\x98nW\x0c\x19i\x8cs\xb5\xe5\xca+\xbc~\xc2\
-\x09\x1f\x11\xfd\xf20v\x8b\x1b\xf7\xa2$\x04\xcf>\xf3\
-\x0c4M\x0f\xfd.\xce8\x1a\x1b\xeaE\xf5\xb9d\x1e\
-\x85\x16\x87\x22\x9b\xc9`\xeb\x96w\xd0\xba\x7f\x1f8d\
-9\x82\xb3\xb2\xd2\xdfn\xa9\x02g(\x18\x06\x8e:\xfa\
-hA\x00\xcb\x08\xca\x1bM\xb9wx\x87\xe8ux\x14\
-gf\x8a\x90I\xb1\xf59\xd8V\xc6\x18\x0c\xc3@6\
-\x9b\x85\xae\xeb\x15}\xda\xc6\xbd\x02\xfevd\x1e\xef\xfa\
-`\xe3\xe1\xc9\x5c\xbft\xcd5\xb8\xfas\xff/\xfe\xf0\
-\xa7gP,\x1a\xee\xf5$\x22\xa6\x92\xa7\x14s\x9e\xf7\
-^kr\xb5+<\xcf\xe4gx\xafC\x1b\xb6\xe7\xfa\
-\x94\xe3\xd7}\x0f/\xfb>\xc6m\x808\xd1\x95\x22J\
-q\x22\x11PW\xd5n\xfb\xa2+\xce8zz\xfb@\
-\x08\xe9\xe0\x9c\xb7\x1dx\x84\x05`\xf5\x9a\xb5\x00\xc7\xef\
-\xf3\x85\xc2\xf5\x86ir]\xd7\xdd(\xcb)\xd1!\x84\
-\xa0\xbe\xa6\x0a \x04\xd1h\x14m\x1d\x9dH$\x12\xa1\
-\x12\x87(e\x88D\xa2PU\x15\xbd\x83Ch\xa8\xa9\
-\x9e\x92;\xff\xd2eKa\x18F\x99G\xfa\x98\xd2B\
-B\xb0\xab\xa9\x09\x9a\xa6\x86\xce\xf9q\x00U\xc98\xe2\
-\xb18\x8a\x86\x81\x9e\xae.\xbc\xf4\xfc_\xf0\xca\xa6M\
-\xe8\xed\xe9\xc2@_?>z\xda\xa9\xf8\xd2\xbf\x7f=\
- \xe8\xe3\xbe\x0ax\xe7n^\xc8\x17\xf0\xb9/|\x01\
-\x9b6m\x12\xdd\x90=\xdd\x7f\xbc\xe9\x87/B\xfb+\
-!\xd89\xe70M\x13\x85B\x01uuu\xf8\xecg\
-?\x8b\xcb.\xbb\x0c\x0d\x0d\x0d\xe8\xee\xee\xc6\xea\xd5\xab\
-\xdd\xb6b\x1f\x96\xa5P(\xe0\x9cs\xce\xc1W\xbe\xfa\
-5<\xfc\xc4\x06\xd8\x96=\xac\x9a}8A\xa8gc\
-\xf8\xf5\x9e\xc3\xf8\xbc\xbb\xc1Y\xb9W;\xf3P\xed\xe2\
-\x98\x8b\xe8J\xa1*4MG,\x1a\x91BQ&\xe8\
-%\xbbD/qp\xb4ut\x80\x10r\xfb]\xb7}\
-\x97\x8d\x09\xb0\xd6?\xf6\x10\x00l>\xef\xc2\x8b\xad\xb6\
-\xf6\x0e\xf5\xb0%\x8b\xdd\xe8Iq\xa6x)ED\xd7\
-QS\x95D\x7f\x22\x85={[p\xd8\xe2E\xbe\x9d\
-q\xc8w\xca\x18\xe2\xb1\x08\xd2\x91\x08\x06\x0by\x18\x86\
-!\xad\x8b\xf9\xa8\xf9\xa3\xb1,\xb1D\x02\xb3f\xcdB\
-^6\xc4\x18\x0bH\xba\xad\xedeq\xf3\xce\x1d;\xd0\
-\xd0\xd8\xe8\xbe\xc6\xe4\x0cb_o/\xda[[\xf1\xe8\
-\x1f\x1e\xc53\x7f\xda\x80\xfet\x1aD\x12\xe5\xceg\xec\
-\xd8\xb6\xcd\xbd#\x0e\xf7\xa3\x89\x0c\xe5\x97._\x01E\
-SK\x1c\x89gf*\xec\xa2\xfa\xb0\xa6\x7f\xce\xb9\x8b\
-\xc7\xe3\xa8\xaa\xaaBMM\x0d.\xbd\xf4R\x5c}\xf5\
-\xd5HI\xf5y\xbeP\xc0\xe0P\x1a\x0b\x16\xa7\xf0\xe2\
-\x8b/b\xcd\x9a5\xe8\xe9\xe9\xf9P\x80\x16!\x04\xff\
-\xf4O\xff\x84\xbb\xef\xbe\x1b\x0f<\xf6DIZ\x10h\
-\x936\xfc\xdfa\x00\xc5G(\xbf\xa9l\x19\x13\x86\x81\
-p&\x85(\x01U\x08\x14M\x81\xa6k\x88DTp\
-\xd3pKq\x9c\xb4\xd0b\x16\xba{zx&\x93%\
-?\xfc\xc1m\xf7\x8c\xf6x\xa8\xc3\x1c\xa8\xff|{\xcb\
-\xd6/z\x81\xc8\xe1\x84\x1cM\xd0\xe2\xf9s00\x94\
-\xc6\xee\xa6\x1d\x18\x1c\x1cD]]\x1d\x9ch\xcc\x1be\
-\xc5\xa2:\xa2\x91(\xf2\xba\x8et.\x8f\xdaTj\x0a\
-\xaa\xd7\x815k\xd6\xe0\xb7\x0f<0.\x1d\x96s\xc9\
-SJ\xf1\xee\xdb\xef\xe0\xe3\xe7\x9f\x8f=\xbbv\xe1\x95\
-\x97^\xc2\xdb\x9b7c\xdf\x9ef\xec\xd8\xb1\x03\x03\xd9\
-\xac\x0bR\x11\xcf\x8c\x91\xe3\x08\x90\xcbf\x91\xcf\xe7\xa1\
-\xeb\xfa\xf0\xdf)y\x86\x9e\xfe\x01\xd4\xd4\xd4 \x97/\
-\xf8\x9b\x8d~\xc8y)\xc6\x18\x8a\xc5\x22\x0a\x85\x02\x96\
-,Y\x82\xd5\xabW\xe3\x98c\x8e\xc1\xb2e\xcb\xf0\xd1\
-\x93NB$\x1aE\xbeP\xc4\xbe\xd66d\x9a\xf7b\
-p(\x8d\xfe\xc1!\xc1\x99\xaa\x0a\x8e]\xb1\x1c\x1b6\
-\xac\xc7UW]\x8dM\x9b6!\x91H|`\x81\xca\
-\xb6m|\xfb\xdb\xff\x1bW\xfc\xf3\x95x\xe6\xf9MB\
-b\x01R\xd1\xd3\x8a{\xba\x96\x0e\x0bN\xbe\x8e\xaa\xc1\
-m\x03\xc0\x14\xb4\x99q\x9f\x83OJA\xa8`\xdf)\
-\x00\xaa\xa8\xd0u\x1d\xf1D\x12\x9am\xc1d2\xba\xf2\
-\xcc\x0e\xda\x96\x8d\x9d\xbbvCQ\x94G\x00\xe0\x9a\xaf\
-^\x8fu\xc3\xc8\x19F\x03X\xff\xb7y\xef\xbe\x7f\x19\
-\x1c\x1a\x22\xd5\xd5\xd5P\x02\x11\x16\xa1\x14\xb1\x88\x08\xf9\
-\xe2\x89$\xb6\xeeh\xc2)'\x9d\xe8kN\xe1\x10\xf0\
-\x110\xc4\x13\x09d\xb3Y\x0c\x0e\x0c\x22\x19\xb3\xa0P\
-\x8a\xb1\xa8\xdfG\xbb\xe4r9\xac\xfd\xf4\xa7\xf1\xdb\xdf\
-\xfev\x5c\x05\xd0\xce\xa9\xd3u\x1d\xf7\xdcu'n\xf8\
-\xca\xbf\xa1P(\x88\xd9>\xc6\x5c\x226\x12\xec\xcb\xe7\
-\xf9\x1b\x9c\xc3\xb4,\x0c\xf5\x0f\xa0Av\xbd\x19i\x19\
-\x1aJcM\xb9\x1b\xa8\x00\x00 \x00IDAT\xee\
-\x9c\xb9\xd8\xd9\xd4\xf4\xa1O\xf7\xbc\x05\xf6\x8b\x17/\xc6\
-\x17\xbe\xf0\x05\x5cv\xd9e\x82\xff\x907\xc8\x8e\xaen\
-\xbc\xf2\xd6\xbb\xe8\xef\x1f(s\x10P\x5c9\x01\xf0\xd6\
-\x96m8b\xe9\x12<\xfd\xf4S\xf8\xfd\xef\x1f\xc4\x15\
-W\x5c\x81\xa8\x9c\xc5\xfd -\xe9t\x1a\x0f>\xf8 \
-\xce9\xe7\x5c<\xf9\xec_P(\x16\x87\x07+\x0f\x92\
-pF\xdca\xe5\x5c\xa3\xa1\xe0$\xdd\x1a\xc8\x88\xa4\xbb\
-\xa7~\xc7#4%\xbct\x1e(dtE\x15h\xaa\
-\x06]\xd3\x91\xd0\x14Y\xe8\xcc}\xc5\xce\x96e\xa1P\
-( \x9d\xc9\x12B\xc8\xaf\x00\x8c\x0a\xac*\x02\xd6\xea\
-\x8b\xd6\x02@3!\xa4\xd8\xde\xd1\x19I\xc4\xe3D\xa3\
-\x0al\xc5\x82ME\x9biJD\x97\xe7\xaaD\x02U\
-U\xd5\xe8\xechC6\x97\x83\xa2(n\x94\xe5\xd5d\
-%\xe3:\x06\x22:\xb4\xa8\x86\xde\xc1A4\xd4Tc\
-\xe2\x9d\xb0\xfc\x83\xa0\xba\xb6\x16\x8a\xdc\x8fq\xfbaQ\
-\x8a\xdd\xbbw\xfb<\xd3\x89gJ\x9bxg\xe9(\x15\
-\xb3\x19rV\xcf\x19\x8c\xd9\x5c\x06u\xbca\xd4\xdf9\
-w\xfe|l\xdf\xb1\xe3CUb\xc3\x18\x83)k<\
-\x17/^\x8c\xe5\xcb\x97c\xee\x9c9\xf8\xc4'?\x81\
-\xf3\xce;_\xa4x\xc5\x22\xfa\x07\x061\xd4\xd6\x81\x96\
-\xf6v\xf4\xf5\x0f\x8a\x9a\xb4\x0a\xdcT0\xea|\xf7\xfd\
-\xed\xc8d\xb3\xb8p\xcdE\xf8\xe5/\x7f\x81\x9bo\xfe\
-\x0ev\xee\xdc\xe9\x16\xdf\x1e\xccQU\xb1X\xc4\xd1G\
-\x1f\x8d;\xee\xb8\x03G\x1e\xb5\x12\x8f\xac\x7f\xca\xa5\x11\
-\xdc4\xb0\x22`\xc1\xed\x84\xe3\xed/\x08\xeeW\xaa\x07\
-\x8f\x1b\xf7\xbeV\xb6\x8d\x07\xcd|3\x85\xa5\xef\xa7\x84\
-\x82\x01\xd0(\x91d\xbb\x0a=\x16\x83\xaa\x100\x13%\
-W\x06\xcb\x86m\x0b\xfb\xa3\xee\x9e^\xd8\xb6m\xac\xfb\
-\xfe-\x0f\x1f\xc81\x0a\x05\xac\xf5\x8f>\x04\x00\x83\x17\
-\xac\xb9\xf4\xdd\xe6=\xfbV-Y\xb8\x00\xa6mA\xb1\
-\x15\xd8\xcc\x86b\x13\xd8T\x14\x9d,\x9a7\x0b\xed\xdd\
-=\xe0\x9c\xa3\xa3\xa3\x0b\x89x\xdc7[\xe8Dd\xba\
-\xa6 \x1e\x8b#\x9f\xcd\x22\x9d+\xc0\xb6l!0\x9b\
-\xac\x93\x0f\x82x<\x8eys\xe7\xa2y\xcf\x9e\xf1{\
-T\x11\x22\xc0WrR.@9\xc0T)\xba\x12\xa3\
-\x14\x841\xec\xd9\xb5\x1b\x0b\x17-\x19U\xc9\x06\xe7\x1c\
-55\xb5\xb0\x19\xfb\xc0;\x88Z\x96\x05\xc30`\x9a\
-&N=\xf5T\x5cq\xc5\x158\xf1\xc4\x13Q__\
-\x87Y\xb3f\x03\x00\xf6\xb7w\xe0\xf9\x97^C\xd1(\
-\xa2 \xdb\x989\x83X\xf3VI\x8c\x02o4E\xc5\
-\xbe\xd6v\xb4wv\xe1cg\x9e\x8d\xa7N\xff\x18\xee\
-\xbc\xeb.\xdcz\xeb\xad\xa8\xae\xae>h\x8f\xd3\xe0\xe0\
- ~\xf8\xc3\x1f\xe2\x1f\xfe\xe1\x1f\xd0;\x90\xc6\x9f\x9e\
-{\x1e\xcc\x0e\x12\xdd|\xe4\xbf+\x90\xec\xbe\x94\x0e\xe1\
-\x93?\xe5o\xe7\x15\xbe\xc2S\xf6\x03\xa1l'D\xb4\
-\xf0\xd2\xb5\x08\x92\xc9\x84\xe8\xbc\xc3\x84\x84\xc1\xf9\xd7\x96\
-e9;w\xed\x068\xff\xd7\x03=F\xea\x08\x88\x7f\
-CsK\xcb\xd3\xb2\x9b\x05LU\x05\xb5,7\x8a\x00\
-!\xd0\x14\x05\x0du\xb5H\x0f6\xe0\xfd\xa6]X\xbc\
-h\x01,\xcb*\xe3\xb2\x14\xdbF\x22\x99@:\x93\x86\
-V,\xa0\xa3\xaf\x0fs\x1a\x1aJ\x0a\xddIXTU\
-\xc7\xc5\x17_\x8c\xdbn\xbbM4\x18\x1d;\x1dVj\
-\xd9.9\xa9P\x80\xf2>/A\xce\x8d\xbe)\xc5\xd6\
-w\xdf\xc1\x99\xe7\x9d\x07f\x8f\xae1\xc5\xbc\x85\x0b`\
-\x99\xa6hN\xfb\x01K\xef\x14EAuu5\x22\x91\
-\x08\x8e?\xfex|\xfe\xf3\x9f\xc7\xe9\xa7\x9f.\x01\xcc\
-F\xa1XDK[\x1b^{\xe7Yds9P\xaa\
-\xb8\xbeb\xf2\x8eS\x1a\x10c\x8c\x8a\x0c\xd3\xc2\x9f\xfe\
-\xf2<\x8e:|\x19n\xbe\xf9f\xacY\xf3)\xac]\
-\xfbid2\x99\x83\x8a\x90\xa7\x94\xa2\xbe\xbe\x1e\x0f>\
-\xf8 \xce8\xf3L\xbc\xf4\xfaf45\xef\x81\xaa(\
-e3\xc9\x15g\x05\x87\xb3\x85\xf1\xf2X\xa1\x1e\xec\xc3\
-\x91\xe9\xc3{^Q\xa2\xc8bgQN\xa6\xa8\x1a\xa2\
-\xb1\x18\x92\x94\xc3\xb2JbQo\x00\xd3\xd2\xda\xc6\x8b\
-\xc5b\x9eR\xfa\xdbk\xbe\xf2\xefXw\xfb\xad\x07\x10\
-\x88TX.Xs)6<\xf60\xce\xf9\xc4\x9a\x9e\
-s\xcf\xfaX\xdd\x91\x87/#\xba\xae#\x12\x89@\x97\
-\xbe?\x9a\xa6AQ\x14dryl\xdd\xd9\x8c\xe6\xdd\
-M8\xe9\x84\xe3\xb0p\xc1|D\xa3QD\xa3QD\
-\x22\x11\xa8\xaa \xe1\xa0\xa9h\xeb\x19Bow7r\
-\x994R\xf1\xa8T\x89O^\x98\x1e\x8fEq\xf4\xca\
-\x95\x88\xc5b\xe3\x19\x85%\xce\xca9{\x01`\x22\x1e\
-\x80\xf2\xfe\xed\xa4A\xcc\xb2\x90H$\xf0\xdf\xbf\xf9\x1d\
-\xf2\xb9\xec\xa8\xbe\xb6&\x11\xc7\xa7V\x9f\x8fX<~\
-P\xcex9\x17\xba#3\x88D\x228\xed\xb4\xd3p\
-\xee\xb9\xe7b\xce\x9c98\xe9\xa4\x93\xb0t\xe9R\x00\
-@[g\x17\xba{z\x91\xce\x8a\x86\xb0\xf9|A\xf2\
-S\x13\xefl\xe1t\x12v>\xd6\xb6\x19\xaa\xabR8\
-~\xe5Q\xe8\xef\xed\xc6=\xf7\xdc\x83\xdf\xfe\xf6\xb7(\
-\x16\x8b\xc2\xbfj\x1a\x22X.[\xd1\x1dv\xd8a\xf8\
-\xfc\xe7?\x8f\xab\xae\xba\x0a=\xfd\x03\xd8\xf8\xf2k\xc8\
-\x17\x8a\xa0\x0a\xf5\x14\xd1\xfb\x7fS\xb9\x85\x8c,F\xf6\
-\xd8\xc6T\x06\xaeRT\xe4\xd7\x84\x06\xcbl\xc2\xb6\x09\
-\x09s\x89\x02U!\xd04\x1d\xd1h\x0c\xc9\xaa*4\
-64\xa0:\x22\xa8!\xd34a\x18&\x0c\xa3\x88b\
-\xb1\x08\xc30\xf0\xf2\xab\xafc`p\xf0\xa9\xbb\xbe\x7f\
-\xcb\xf9\x13\x16ay<\xcc\xd7o~g\xcbg\x97.\
-Y\xec\xf2S\x8eH\xd19\xd1U\xc9\x84(\x02N$\
-\xd1\xd4\xbc\x07s\xe7\xcc\xf6I!\xa8,\x22Um\x86\
-D<\x82L4\x82b1\x8f\x81t\x06\xf1XD\x1e\
-\xd3\x89'\xe09\xe7\x88D\xa38|\xd92\xec\xdb\xb7\
-o|\xce\xa3\x10u\x83\x08\x80QXY\x06\x0f\x09\xd7\
-9\x80\xce\xae.\xe4\xb2Y\x8fQ\xff\xf0K\xe3\xccY\
-H%\x930-k|E\xdc\x93\x14E9m\xde\xff\
-\xf6o\xff\x16\xd7^{-\x8e8\xe2\x08(\xd2\x9b\xab\
-P(`\xc7\xee=xt\xc3\xd3\xa2d\xcb+\xc6%\
-\x04\xaa\xaaT\xbc\xc3\x8f\x99\x1f\xe3\x1e\xc2\xd8s\x0a(\
-%\x18J\xa7\xf1?/\xbd\x8c\x95G\x1e\x81\x1f\xfe\xf0\
-\x87\xb8\xe9\xa6\x9bp\xc3\x0d7\xe0\x99g\x9e\x11\x9d\x9f\
-\xa5\x87\xd5T\x1c;\xc73\xee\x8b_\xfc\x22\xae\xbb\xee\
-:D\xa2Q<\xbb\xf1%\xf4\xf4\x0a;$J\x09\x18\
-\xb3]\x92\x9d{\x8c\xd5K\xbd\xfe\xfc\xb6\xc7,@\xa4\
-#4\xear\xd8(\x06\xc2K\xfd:\x83\x961<\xc4\
-\xf6\x98\x97E\x5c\x1c\x94* \xe0 D\x8cqU\xd3\
-\x10\x8dD\x11\x8b\xe9\xb0-\xd3u\x16\xb5\x99\x0dK\x96\
-\xf7\xa53i\xf4\xf6\xf5A\xa1\xf4\x9f\xc6\x945Uz\
-a\xbd\xf0\xc7\x02\xe7\xb8/\x93\xcd}\xb6\x90\xcfsE\
-Q\x88\x03Z\x0e`\x11B`Y\x16\x16\xcf\x9b\x83|\
-\xbe\x80\xfd-{1\x94N\x0b\xbb\x0dEq\xd3BK\
-\xa6\x92I=\x82\xa1h\x0c\xf9|\x01F\xd1@\xef\xc0\
-\x10j\xa4\x9ef2\x22\xad\x9e\xde>\x9c\xfd\xf1\x8f\xe3\
-'?\xfd\xa9;\x9b4\x1eR4,]\x1c\x0d\xa1O\
-\x08\x01\x05\xd0\xbao\x1ff\xcf\x9d'\xd3\xca \x22\xfa\
-\xdf\xb3\xaf\xb5\x0d\xc7\x1ew,^{\xfd\x8d\xe9\xf3]\
-\x96\x1c\x94i\x9a\xa8\xae\xae\xc6\x11G\x1c\x81\xf9\xf3\xe7\
-\xe3#\x1f\xf9\x08\xfe\xe1\xef\xff\x1es\xe6\xce\x15\xc7\xb9\
-\xaf\x1fm\x9d\xddh\xef\xec\xc4\xde\xfdm\xb0=7\xab\
-\x91H\xf2\xb1\xdfA\xca?\x8f\x0fw\x0d\x11\xe0\xed-\
-[\xb1o\x7f+\x8e:\xfcp\xfc\xecg?\x03\x00l\
-\xdc\xf8\x02~\xf3\x9b\xfb\xf1\xe6\x9bob\xc7\x8e\x1d0\
-\x0cC\x14\x92\x8f\x13\xc0\x1c`\xb7dt=\x7f\xfe|\
-\x1c~\xf8\xe1\xb8\xec\xb2\xcb\xb0f\xcd\x1a0\x0el\xd9\
-\xb6\x0d[\xb6\xed\x80%\xc5\xa0\x0e\xf0z\xad\x5c\xfc\xe0\
-QN\xb2\x97\xa5\x85^\xf7\xbe\x00`q\x04\xacc\xc0\
-+\x1f\xc3a\xa2+g_\x85H\x94B\xd3t\xe8\x91\
-\x08\x92\xc9$\x22\xcc\x16\x95-\x0ege\x0b\xb2\xdd4\
-Ml\xd9\xb6\x9d\x13J7\xdcu\xfb\xad\x1d\xd7|\xe5\
-z\xac\xbb\xfd\x96\x03>\xed#.\x17\xac\xb9\xb4\xef\xa3\
-'\x1cW{\xec\xd1GA\xd7u\xe8\x9a.*\xb05\
-\x0d\xaa\xaaBUTP\x85b\xcb\x8ef\xeco\xdd\x0f\
-p\x86s\xcf<\xddM\x0bu]\xa4\x91\xba\xaeAS\
-U\xf4\x1a\x0c\x9d\xed\x1d\x18\x1a\x1c@>\x97\xc3\xac\x86\
-:\x09&|R\xeeh\xf9l\x06g\x9dq\x86\xd0\xe4\
-LCj\xe5\xdcUM\xc3\xc0?^~\x05\xce\xbe\xe0\
-\x13\xa1\x87\xbfl\xd7\x08\xc1\xb67_\xc1\x9dw\xde5\
-m\x8d-TU\xc5e\x97]\x86\xb5k\xd7b\xc6\x8c\
-\x19X\xb0`>\x12\x89$\xb2\xf9<v\xecjFw\
-O/\x0c\xd3D._p\xab \xc4\xef\x98\xcc\xe3<\
->\x17['\xc2\x8d\xc7\xe2H\xc6\x13X8\x7f.\x0e\
-[4\x1fC\x83\x83\xd8\xbam\x1b\xd6\xad[\x87g\x9f\
-}\x16\x99L\x06\xa6i\x22\x16\x8b\xb9\xdc\xe4H\xb6=\
-NfaY\x16R\xa9\x14\x96-[\x86\xb5k\xd7\xe2\
-\xdcs\xcf\xc5\xc2\x05\x0bPW_\x8f\xfdm\x1dx\xbf\
-i7\x06\x87\x86\x90\xc9\xe7\xa4\x8f\x14)\x03\x8a2\xfe\
-*\x10\xf5`\x14\xa9\x1f\x86\x89\xb6\xca\xc0\xbd\xe2s!\
-\xdc\x15\x15$\xbbC\xf7\xc4\x13I\xd4\xd4\xd6bf}\
--\x14f\xc3\xb2L\x98\x96\x05\xd30\xc4$J\xa1\x88\
-L6\xc3\x9f\xdf\xf4\x12\xe1\x9c\x9f\xb3\xee\xfb\xb7<;\
-\xa1\x11V`\xf9\xca\xd6\xed;\x7fz\xd4\x8a#@,\
-\xe9\xd3l\xcbJu\xdb\xb93p\xcc\xa8\xaf\xc1`:\
-\x8d\x8e\xd6\x16\xf4\xf5\x0f`Fc\x03L\xd3\x92E\xd3\
-6l[\xbc\xb7JW0\x14\x8b\xa3\x90\xcf\xa1X(\
-\xa0\xb3\xbb\x17\xb3gL\x1e\x01\xbfx\xf1\x12\xdcp\xe3\
-\x8d\xb8\xf3\xce;\xa7/R\xe1\x1c\x0a\xa5\xd8\xb5\xab\x09\
-g\x95)\xef\xc3\x81\x8bq\x8eE\x87\x1d\x0e0\x066\
-\x0d\xbb\x5c(\x14\xf0\xe3\x1f\xff\x18\x97_~9\x8aE\
-\x03\xfd\x83Cx\xfd\x9d\xadhim\x03@@\xa9\xb4\
-b\x09\xe1\x8f&\xeb\xe63Ax\x07\x06 \x9d\xc9\x22\
-\x9d\xc9\xa0\xad\xb3\x03\x9b^{\x1dK\x16\xce\xc7\x8a#\
-\x96\xe3\xfe\xfb\xef\x07\x00l\xdd\xba\x15\xdb\xdf\x7f\x1fw\
-\xfc\xe0\x07\x18\x18\x18@6+:\xa3\xe7\xa5%\xb6\x93\
-\xda9\xfd\x08u]\xc7\xd2\xa5Kq\xdcq\xc7\xe1\xbc\
-\xf3\xce\xc3G?\xfaQ\xa4R)\xd8\x8c\xa1\xa7\xb7\x0f\
-;\xf6\xb4`\xcf\xf3/\x0a\x8e\x8a\xd2\x10@\xe2\x81\xc9\
-\xbdQ\x12\xeee\xaf\xf9^)\x07\xb70p\xaa\xd0$\
-5\xe4\x93d\x95\x07\x81\xa2\x0a\x81\xb4\xaa\xe9\xd0\xf5\x08\
-b\xb18T\xc2]\xed\x95m\xc9T\xd0\xb2\xc09\xc3\
-\xb6\xf7\xb7\x13\xc6\xd8\xce\xbbo\xbf\xf5\xd91\xdf@G\
-\xda@j\xb2\xfe0\x90N\xffh\xff\xfe6}\xc1\xbc\
-y\xc4\xa2\x14\x0aU\x5c\xdfj\xe7\x8e\xd3X[\x83\xf6\
-\xae>\xe8\x91(\xb67\xedBcc\x83o\xc6\x90R\
-!qP)E2\x99@.\x9bAA/\x22\x9f\xcb\
-`(\x93A2\x1e\x9f\x94\x0b\xbd\xa3\xab\x0b\x97\xff\xaf\
-\xcbq\xcf=\xf7\x08M\xd64\x80\x15\x97\x5cW_O\
-O\x88\xd7\xb7\x1f\xbc\xb8\xc7D\xdbf\xc2n\xf6@\xfc\
-\xb4&j\x999s&\xce_\xfd\x09\xac\x7f\xe6\xcf\xe8\
-\xed\x1f\x04\xe7b\x80*\x93\xec\xb959\x9f\x89\x0a\xc7\
-[\xdc.\x14B\xd0\xbcg\x1f\x9a\xf7\xec\xc3\x8c\xc6\x06\
-TW\xa5\xd0PW\x87\xd3>v\x06.\xb9\xf4R\x18\
-\x86\x01J\x09z{z\xb1k\xf7n\xd8\xb6\x8d|>\
-\x8fX,\x06\xc30p\xd8a\x87a\xd1\xa2E2\x85\
-f\xe8\xec\xeeF\xd3\x9e}\x18\x18\x1cBo\x7f?\x86\
-\xd2Y\xa1\x04\xa7D\xb6\x00d\xc1\x98\xd1\x17\xfe\xf0\x8a\
-\x91VH\xb4\x14\x8c8+\x99\xf1U\x02&\x8cTz\
-\x13<^\xa2a\xb2\x02\x0aU\x11\xed\xe7c\xb1\x18R\
-\x89(\xb8\xed\xd8\x1e[\xb0m\xcb\x1d\xff\x03\x83\x83\xbc\
-\xa3\xab\x9b\x13B.\x19W\xc4?\xd2\x06R\x93\xd5w\
-\xc1\x9aK\xb7\xed\xd8\xd5|\xdc\x9c\xd9\xb3@e\x94E\
-Bfxf7\xd6\xa2P\xc8c\xcf\xdefttv\
-b\xf6\xccYr\xa7M(\x0a\x85m3Pb\xa3:\
-\x11\xc1P,\x8e\x5c>\x0f\xd3P\xd1\x9fN#\x1e\x8f\
-MJ\x22a\xd96\x0a\x86\x85\xf3\xcf?\x1f\x8f>\xfa\
-(TU\x9d\x06\xcc\x12'\xbd\xab\xb3\xc3\xed\xc2[\xf1\
-\xf6\xef\x09\xb5\xa2\x89\x04\xa8\xe4\x0d\xa7z\x7f\xaf\xbe\xfa\
-*\xbc\xfc\xc6f\xe4\xf2yP\x85\x00PF\xe6\x89\x0e\
-\x12\x80\x1a\x0dP\x95-RV\xd1\xd9\xd3\x83\xce\xeen\
-\xec\xdc\xdd\xec\xda\xf7\xd4TU\x01\x94\xa0*\x99\xc4\xec\
-9sE=\xad\xa6\xa1h\x18P5\x15m\x1d]\xd8\
-\xbc\xed)\x98\x86\x89\xa2Qp\xbb \x0b\xb1'\xf1H\
-6\xca\xd3\xd9a#)\x87iw8q\xef\xdf\xa1\x91\
-\xd2pe9\x15\xce^\xd0F\xa6Rz\xe8\xd9_\xaa\
-\x10\x10E\xd8IGbQ\xc4\x921h\xdc\x86%\xdd\
-]J\x85\xce\x02\xb0v5\xef\x01!d/!\xe4\xfd\
-\xd1\x96\xe1\x8c'%\x04@\xbe\xd8\xd2\xd6\xfeB\xa1P\
-pO\xa2\x97xw\x80\xab*\x19\x87\xa2\xa9\x88\xc7\xe2\
-\xd8\xb5{/\x1a\xea\xeb\xa1(\x14\x96\xa5\xb8\xe6\xfc\x0a\
-\xa7\xd0\x98\x8d\xaa\xaa$\xf2\xf9\x1c\x0c\xa3\x00\xd3\xb4\xd0\
-\xd1\xd5\x83Y\x0d\xf5\x13> \x00 \x9d\xc9\xe0\xbb\xdf\
-\xfd.\x1e~\xf8\xe1i\xd55\xf5\xc8\x9e\x86A\xf1\xa8\
-s,\x19c\x18\xe8\xefCoO/\xba:\xda\xf1\xee\
-[\x9baK\xb0\x9aJ\x95\xb6i\x18X\xfb\x99\xbf\xc7\
-\xabo\xbd=\xaa\xe3U)\xfa\x9b\x0eey\xf9W\x8e\
-\xbc\x0fa\xae\x06\xce\xbe\xdb\xb6\x8d\xce\x9e\x1e\x11\xadw\
-t\xe1\xfd\x1dM\xee\xc0w\xf8mB\xa8kQ]\x0e\
-L>\xe7\xf32\xf9\x00*\xa6\x81\x9e\xff\x07\xbc\x8ey\
-\x05\x80\xe2!\x0a\xd0\x91RA^Nn\x85\x1c5\xd1\
-hB\x18D\x0a\xfd\x95\xa2\x08\xb2=\x16\x8b!\x19\x8d\
-\xc2\xb6-\x97h\xb7<\xd1U\xbeP@ww\x0f!\
-\x84\x5c\xb3\xee\xfb\xb7\x8c+\xc5\x19\x15`\xad^s)\
-\xd6?\xf6\xd0\xc6\xf3.\xbc\xf8\xbd\xb7\xde\xdb\xb6\xe2\xa4\
-\x13\x8e#\x96e\x09\x1fk\xdb.i\x92\x88(\x9f\x98\
-?k\x06\xf2\xf9<Z[\xf7\xa3\xbfo\x00\x8d\x8d\xf5\
-0\xe5\xf6\x0a\xa5\xb0%\xc8\xa5\xe2:\xd2\x898r\xb9\
-\x0c\x0c9\x15\x9e\xcef\x91J\xc4&\x9cj\xb2-\x0b\
-\xa0\x0a.\xb9\xe4\x12<\xf1\xc4\x13\xd3\x06X\x16ch\
-\xd9\xbb\x17\xb3\xe7\xcd\x85B\x157\xda\xdb\xf9\xfe6l\
-~\xed5\xecm\xde\x8d\xf6\xd6\xfd\x18\x1c\x18\x84a\x1a\
-B\xe9\xad\xeb~\xd7\x86I^\x18c\xf8\xe5}\xf7\xa1\
-\xbd\xbb\xc7\xe5h\xa63J\x9a\xd0(j\x18\x80\x1a\xf9\
-\xf3\x05Y\xefTh\x84\xbd\x95s\x16ZL\x1cF\xeb\
-\x0d73W\x89d\x0f\xf2V\xa3u`\xa8t\x8e\xca\
-\xd2\xbe\xb0\xe8\xcf\xb9)Q\xd9\xde\x9e\x92\x92\x9bh,\
-\x86D*\x05\x9d\x08\xfa\x821Q\x82\xc3<\xfex[\
-\xde\xdb\xc6-\xdb\xdex\xcf\x1d\xdf\xfb\xe3x\xcf\xf5\x01\
-\x8d\x80\xd5\x17\xad\xfd\x17UQ\xee\xb9h\xf5y<\x91\
-L\x90\x88\x14\x90\xea\xba\x0eEQ\x5c\x11\x1e\xa5\x14;\
-\xf6\xb6\xa2\xad\xb5\x15\xaaB\xf1\xf1\x8f\x9d\x0a=\x22D\
-\xa4\xd1h\xc4}\x8f\xa6\xa9\xe8)\xd8\xe8\xea\xe8\xc0@\
-\x7f?\xf2\xb9\x1c\xf2\xf9\x1c\xe6\xcd\x9c\xe1\xd3\xe9L\xe4\
-@T\xc0q\xc6\xc7>\x06m\x04\xd7\x84\xc9\x1aY\xc5\
-B\x01\x9f\xb9\xec\xb38\xe3\xe3\xe7b\xeb\x96w\xf0\xf2\
-\xc6\x17\xb0\xfd\xbd\xf70\x94\xcd\x88H\x0bp\xfd\xbb\x5c\
-u\xbdl2\xe1\x14RO\xf6r\xdcq\xc7\xe1\xc9\x0d\
-\x1b\xf0\xfbG\x1f\x9f\x96\xf4y\xb2\xa2\xa8\xb2\xad\xf8\xf0\
-\xef\x1d\x0e\x08\xc3O\x03\xaf`x\xc0\xc3\x9f\x1bf\x9b\
-\xd0\xd4p\x04\x17\x06\xffK<\xf4g\x8e\x96h/c\
-V\x89\xb8\x1e\x15\xd9\x91*\x12\x8d\x22\x91H\xa0\xb6\xbe\
-\x01\xb3\xebk@\x98\x0d\xcb\x14\x11\x95a\x1a(\x16\x84\
-P\xb4\xaf\xbf\x0f/\xbf\xf6\x06\x00\x9c\xc19\x9e\xbf\xfb\
-\xf6[\xc6u\xdeG\x8d\x0a\xab\xd7\xac\x05\x08\x7f\x8bq\
-~CU*Ek\xab\xabJ\xd6\xbd\x8e\x9d\x8ag\xa0\
-\xa9\xaa\x8aL\xc1@oo\x0f\x12\x89\x04\xaaR)\x99\
->\x96RI\x10\x8a\x88\xa6\xa2h\x0bK\x11\xa7\x95V\
-6\x9fGU21\xe1wmB\x08\x96.[\x8aL\
-&\x837\xdf|\xd3\x97\xceN\xfa\xea\xd2$\x04\xcd\xbb\
-w\xe1\x89?<\x8c\x177\xbe\x80\xb6\xd6V\x98\xa6\x01\
-J\x08\x14\xcfqtm\x90\x03i\xf7d\xaf\xb9\x5c\x0e\
-_\xfd\xda\xd7\xb0\xaf\xb3g\xda\xa2\xa6\xa0\xc7\xbd\xfb\x9c\
-\xd7\x0d\x968\x1e'\xa3+\xa0/\xb5\xb2B\xc9\xbc<\
-\xe4\xbd\xceK\x9c\x97\xefE\xe5\xee\xc7\x9e\x19>\xee\x07\
-\x02\xee\xeb\xa3U\xae\xad\xf2\x81SX\xcb-\x17i\x82\
-z+\xee\xff=\xc1\xdf\x88\x92Z\xdd\xfbB\x18\xce\x87\
-R0<\x08X%\x19\x83\xea\x02V\x125uu\x88\
-kDZ\x1e[\xb0-\x0b\x96i\xbac\xf9\xcd\xb7\xdf\
-A\xa1P|\xfa\xee\xdbo\xbd\xf9\x95\x177\x8e\xfb\xda\
-\x185`5m\xdf\x86\xa6\xed\xdb\xec\xa5G\x1c\xd9\xdf\
-\xd7?\xb0\xfa\x88\xa5K\xc0\x19\x0b\xe4\xed%.#\x16\
-\xd1Q0L\x14\x0a\x06\xba{z\xb0t\xc9b\x97\xab\
-!\x94\x88\xb0\x92P(\x84\x80\xab\x11\xe4\x0by\xd9\xa3\
-L\x14\xca\x16\x8b\x06\x12\xb1\x89\xb7\x05\xe9\xea\xe9\xc6g\
-\xd6\xae\xc5\xcf~\xf63\x14\x8b\xc5i\x19\x88\x86a\x80\
-\xd96\x88\x040\x1a\xa8K\xa4\x9e\x9b\x80\xd7\x0db*\
-\x96\xd3N=\x15\xdf\xf8\xd6\xff\xc6\xb6\x1d;\xa7\x1c\x98\
-\xca\xe0C\xa2\x07\xe7<\xa4\xb8w\xf4\x91X\x09H\xf8\
-\xb0\xd1\x14\xf7\x8f\xee\xd0\xaf\x0b\x82\x15\xf7cF9P\
-\xa1B\x14\xe5\x15\x86\x06g\x00C\xba\xd8\x84FN\xbc\
-rdW\x1e\xd5\x95sY\x95tW>\x85\xbbT\xde\
-\x13\x88\xe2\x7fUS\x11\x89D\x10K\xc4\x91JU\xa3\
-\xb1:\x01fYnSe\xc34a\xc9r\x9c\x96\xfd\
-\xfb\xf9\xde\x96\xfd&!\xe4\xa4W^\xdc8!\x83\xed\
-\x80\xf2\xae\x0b\xd6\xac\x05!dk\xb1X\xbc6\x1e\x8b\
-\xa9\xd5U)\xe28\x16PO\x93\x04\xe7\x87\xc6\x22:\
-r\x86\x85\x9e\x9e^0n\xa3\xbe\xae\x0e\x94\x8a\x1fN\
- -j(A4\xa2\xc2\xe0\x04\x85b\x11\x96%\x90\
-9_( \xa2\xebP\x15\xd5\xd5\xf6L\xc4J@D\
-\xa9\x0b\xb3\xb1\xe9\xc5\x17\xa7V\x90\xc9\xfd3\x80$\x00\
-P\xce1\xa4\xde\x08+P\xa78\x99\x8ba\x18\xf8\xc3\
-c\x8fa\xe3k\xaf\xc3\x92ME\xa6l\xf54/\x19\
-\xbf\xd7\xbb\xf71\x1b\xe5\xb6\xe1\xdb1w\xff\x82\xaf1\
-Y_Z\xfe\xbcc\xf1\xe2:\x83:\xfe\xe7a\xdb{\
-\x1e\xbb\xef\xf3\x5c\xb0\xfe\xe3\xc2\xdc\xd7\x99\xbb-+\xbd\
-7\xec\xb7\xc0\xb3\xafe\xbf-\xe47{\xbe_\xc8X\
-HiRH\x15\xb6\xc7\x91h\x04\xc9d\x15\xea\xebj\
-\x11!\x10\xc6|R\x09`\x9a\x16\x0c\xc3\x84e\x99x\
-k\xcb\x16b\xdb\xf6\xef\x08!\xbf\x99\x88\xe8\xea\x80\x01\
-KFY\xc6\xb2\xe5+V\xe5\x0a\x85\xe5\x87-Z\x00\
-\xce\x85<_D\x01\xa4D\x8b\x11\x02UQ\x90/\x1a\
-0-\x0b\xdd==X\xb6d\x91$\xefJ`\xe5\x94\
-\xac\xa8\x9a\x8e\xa2i\xa1X(H\xdf\x1c\x86\xa1t\x1a\
-\xf1X\xcc_\xc5?\x01K\xa1P\xc4\xc5\x17_\x84\xc7\
-\x1f\x7f\x1c\xfd\xfd\xfdS\x96\xfa\xb83J\xbe0\x9b\xf8\
-|\xb4\xc2\x8a\xaa\xf9\x14pW\x8c1\xdc}\xf7\xdd\x98\
-1g\x1e\xf6\xedo\x15\xfb8Qw\x89\xd1\xacc\xc4\
-\x7f\xff\xcaCS\xb9\xd0\xa8\x8eW\xe6\xc1\xca\x022>\
-L\xfa\xe7\x8f\xab\xca\xde\xe7\x8b\xa2\xca\x1c_x\xc5\xa8\
-\xacr\xf4\x85\xd0\x1e\x82\xc3\x09DC\xa3+\x0c\x1f]\
-q\xcfEK%w\xa5\xa8\x1a\x22\x11\x1d\xf1X\x025\
-\xb5\xf5\xa8KD\xc1\x99\x0d\xdb\xb4a\xda\x22\x0d4M\
-\x13\xb6m\xa1i\xf7n\xde\xd9\xd5\xcd\x08\xc1\xaau\xdf\
-\xbfu\xc2\xc4\x8fcb\xb6\x97-_\xf1p&\x9b\xbd\
-\xa9\xba*\xc5S\xc9\x04)\x09H\x11H\x0f\x81\xaaD\
-\x1c\xb9\xa2\x89\xc1\xc1\x01\xf4\x0d\x0c`\xee\x9c\xd9\x02\xad\
-\xe5@u\xf8,]U`\x11\x05\xc5b\x1e\x96i\xca\
-\x19\x06\x86\x5c>\x87T2\x0e>\xc6\xffX\x85\xe7\x8b\
-\xc5\x22N?\xe5T\xfc\xfa\xd7\xbf\x9e\xd2(+hC\
-C\xbd\xbc\x95\xc7Zy\xaaK\x88V\xae\x5c\x89u\xeb\
-\xee\xc6\xe3O=\xe3\xce\x0c\x1e\x9c\x9dr\xca#\x9aQ\
-\xbd\xafb\xa4\xe4\xff\x0cVq\x9b\xe1\xf7\x81\x0d\x1b=\
-\x0e\xff\x9d\xc1m\x98\x93Q\xb0\x11\x22P\x16\xf8\xde\x0a\
-\xd1\x1b\xabx<\xfc@\x1f\x5c\xa9\x940(T\x81\xa2\
-*b\xd2,\x1eC2U\x85\x86\x86\x1ah\x92\xb7\xb2\
-d\x9d\xa0e\x9a0-\x13C\x83C|\xf3\xdb[\x08\
-\xa1\xe4\xeau\xdf\xbf\xf5\xf5k\xbez=\xa6%\xc2\x92\
-3\x85X\xff\xe8C\xf6\xe1G\x1e\xd580\x94>i\
-\xfe\xdc\xd9\xbe\x1ey^\xce\x85K\x84f\x8c\xc1d@\
-Wg'f46 \x16\x89\x8aJoRr\xe9T\
-@\xa1Gu\x14L\x1b\xa6e\xba\x9a\x8eB\xb1\x00\xc3\
-\xb2\x90\x18\x8f=L\xc8\x92\xcb\xe7q\xf4\xd1G#\x1a\
-\xd1\xf1\xc2\x0b/\x8cz\xfa~\x22\x00\x8b\x84L\xd3:\
->[S]:D\x08A\xa1P\xc0\x9dw\xde\x85\xb7\
-\xde\xdf\x01\xc6\xa6\xa1\x12\xa0\xc2\xcc\x9b\x7f@\x059\xa6\
-a\xf8(\x1fQ\x0f\x94SS<H\xc5\x03\xc3R\x5c\
-\xdc\xd7L\xd4\xcf\x0b\x05\x88\xed@4\x16\xa6\xbb\xe2\x9e\
-H\x89\x87\xcd\x08\x86\x12\xe9\xc3\xf8]yh\x98\xca\x13\
-\x9f\x95f0C\x18v\x99\x05\x01\xa2\x9cLQTh\
-\xbaS\xdc\x9cBm}=j4U\x08D-Q7\
-h\xc9T\x903\x86-[\xb7\x91L6\xbb\x9bh\xb8\
-\xe2oN>\x9d\x8fU$:!\x80\xd5\xb4}\x1b.\
-\xb8\xe8R\x10B\xde0L\xf3+u\xb5\xd5<\x11\x8f\
-\x137z\xf06\x9e\x94K\x22\x1eE6o\xa0X,\
-\xa0\xb7\xb7\x0fK\x16-\xf0\x11\xf0\x94\x08\xd0\xd2\x08\x00\
-U\x87Q4a\x98\x06,\xcb\x04\xe7\x1c\x05\xe9\x9d\x14\
-\xd5\xf5\x11\xb9\xd6\xd1v\x87&\x84\xa0\xb7\xb7\x17\x7f\xf7\
-\x99\xcf\xe0\xb9\xe7\x9e\xc3\xfe\xfd\xfb?T\xad\xa1F\x0f\
-\x12\x1c7\xdex#V\x7f\xf2S\xd8\xb6c\xe7\xa4\xe2\
-\xe5h\xb2B\x7f_H^\x11\x5c\x86;\xef\xe0\x01\xf0\
-)K\xe9<C\x95WN\x0f\xf9\x88\x80TY\x19\xc1\
-\x03ic\xd8\xec\xa0\xf3{\xcb\x85\xa2\xc382T\x92\
-8\x84nSi\xb60\x14\xc6<7QQ\x88\xadP\
-\x0aB\x151+\xa8\xeb\x88\xc5\x13\xa8\xae\xadECM\
-\x0aT\x9a\xf2\x09'\x0f!e0M\x03{[Z\xb8\
-T\xb5\x1fs\xf7m\xb7\x0eMTd5\xae\x94Pr\
-Y\xd9\xa5G\x1cY\xdd\xdb7p\xf2\xa2ys%X\
-9\x11\x04\xf1\x936\x1c\x88\xea:L\x06\xf4\xf4t\xa3\
-P(bFcC\xf9\x8c\x18%\x88Dt\x18\x9c\xa3\
-X0\x5c\xe1\x19c\x0c\x03CiD\x22\x1atM\x1b\
->\xe4?\x90\xf4\x82st\xf5\xf4\xe2\x8b\xff\xf2\xff\xe1\
-\x91\x87\x1fF\x9f\xd3i\xf9\xafd\xb1,\x0b\xabV\xad\
-\xc2\xff\xf9\xaf\xff\xc2\xef\xfe\xf0\xc72\xc0\x98\xdcu\xfc\
-$;\x1b1\xed\x0a\xff.6\x8am+\x7f6\x1b1\
-\xcdt\x9a\x9b\x8eD\xb8\xb3\xb0\xcf\xaa\xf0[\xd8p\xa9\
-\xe00i(\x1b\xe68\x87\xbd\xe6\x00%\x85h(\xa1\
-j\xa2\xa1D$\x16C\xaa\xaa\x0a\xf5\xf5\xf5\x88\x11\xee\
-\xaa\xd9M)c\xb0L\x13\xc5b\x11o\xbd\xb3\x850\
-\xc6~s\xf7\x1d\xb7\xfe\xe2\x9a\x7f\xbb\x1e\xaf\xbc4\xb1\
-\x805.U !\xe4[\xd9\x5c\xee\xca}\xad\xad\xc9\
-\x85\xf3\xe7\x11H\x12\x9d\x03\xd0\x9c{\x8a\xc2\xa1@A\
-D\xa7H\xc4\xa3HU\xd7`\xdf\xfeV\x1c\xb1l)\
-\xa8BAMA\xc0SE\xf0Z*\x08\xea\xab\xaa\x91\
-\xcb\xe4`\x16\x8b0\x0d\x11nj\x8a\x8a\xb6\x8en\xcc\
-\x9b5\x13\xd1h\xe4@f\xb6\x87]\xf2\xf9\x02\xda;\
-\xbb\xf0\xc6\x1bo`\xd5\xaaUhjj\xfa\xab\x00-\
-\xc30\xf0\x99\xcf|\x06?\xff\xf9\xcf\xf1\xd0\x1f\xd7\xfb\
-\xbb\xab\x1c\xd4\x11\xe1h\xc4\x12\xa3P@T\x8a\x94B\
-\xdf\xc4\x11\xc2cW\x96,\x84%c\xbcBT3l\
-Qs\x98\x8c!<\xb2\x0b\xd7R\x1d\x80\xee\x0a\x8e\x9b\
-\xa9\x88\xaf\x08U@\x89\x02\x95*\xd0\xf5\x08\x12\xf1\x04\
-\xaa\xaakQ\xadQ\xa1b\xb7-19f\x8a\x19A\
-\xdbf\xd8\xb9k7\xcf\x17\x0a\x03*Q/\x07\x80u\
-w\xdc2\xe1\xe7\x7f\xdcW\xe8\xea\x8b\xd6\xfe4\xa2k\
-W\x9c}\xda\xc9\x1e\x05{\xc9>Y\xf1\xb4Q\xa7\x94\
-bo{/::\xda\x91\x88Gq\xd6\xc7N\x85\xae\
-\xe9\x88F\xa3\xd0t\xcd\xf5\xda\xd2T\x15\xddy\x0bm\
-\xad\xfb1\xd0?\x80L6\x8db\xbe\x00\xc34`\x9b\
-&\x16/\x98\x0fUS'\x8cs\xe2\x9cc\xde\x9c\xd9\
-\x98;k&\xe6\xcf\x9f\xef\x9a\x0d~\x98\xd3\xc0\x93N\
-:\x09\x1b7n\xc4\xef\x1ey\x0c\xad\xed\x1d\x07\xf5\xef\
-\x1d\x0bH\x8d\x0cT\xa3x_\x00\x99\x86\xe3\x87\xc2\x81\
-\x8c\x8f\x0a\xdcx\xf9\x83\x0aju^\xd9T\x8fc\xe4\
-\xd9\xc1\x11\x00\x8eR\x0a\x02\xa7\xecF\x8c\xe1h4\x8e\
-d*\x85\xda\xbaz\xcc\x9bU\x0f\x85sW\x18j\x98\
-\x06\x8c\xa2\x01\xc30\xd0\xdd\xd3\xcd_}c3!\x84\
-\x5cx\xf7\xed\xb7NZ\xed\xdb\xb8\xeb_\x9a\xb6o{\
-l\xc1\x92\xa5\xff\x02\x90X]m\x8d\x93\x17\xbak\xa9\
-\x97\x9a\xc8\x8b5EA\xd1f\xe8\xef\xeb\x03!\x04\x0d\
-\xf5u\x92\xe4#\xae\xd4\x01\x80\xd0f1\xc04\x8b\xb0\
-\x0cS\x88J\x19\x03g\x0c\xe9l\x06\xc9D\xbc\xcc\x8b\
-i<K\xdf\xc0 \x22\x91\x08V\x9d\xf8\x11<\xf1\xc4\
-\x13\xa3\xeal\xf3A\x5cL\xd3\xc4Yg\x9d\x85G\x1e\
-y\x04\x8fmx\x0a\xfb[\xdb\x5c?\xb3\x83a\x0dK\
-]\xc2\xb7e\xe1\xef\xf71O\xbcDh\xb9D\x15\xab\
-\xfc\xdd\x01\x0d\x94w[\xee\xfd\xac\xc0~\xf8\xde\xe7n\
-\xcfdd\x15\xdc7\xe6\xfb\x9c\xb2\xfdt\xe5\x0c!\xdf\
-\xed\x99\x19\xe0\x81\xdfV\xfe9\xcc\xff\x9c\xe75\x0e\xe6\
-\xe9p(\x9e\xa7\x9e:A\xc7)X\x8fD\x10\x8f\xc7\
-PUS\x8d\x86\x19\x8d\x88+D\xe8\xad\x1c\x93B\xd3\
-\x82i\x1a(\x16\x8bx\xed\xcd\xb7\x88eY\x8f\xdcs\
-\xc7\xf7n\xfe\xd7\x7f\xfb\xf7\x09O\x05'\x04\xb0V_\
-\xb4\x16M\xdb\xb7a\xd9\xf2\x15]\x83\xe9\xf4%\xb3\x1a\
-\x1b\xb9\xa2P\x97\x80\x17\xe9\xa1\x1fR4M\x01(\x81\
-\xcd\x81\x96\x96\x16\xcc\x9e9\x03\x11]/\xf9k\xc9U\
-\xa1\x04J<\x81\xa2!\xf5\x1d\xb6\x9090\xce`\x98\
-\x16\xd2\x99\x0cj\xab\xab&\x0c\xb0(!\x18\x18\x1c\xc4\
-\xc7\xcf:\x0b\x17\x5cp\x01~\xf2\x93\x9f|\xe8RC\
-\xce9N?\xfdt\xac_\xbf\x1eO>\xf3g\xec\xdb\
-\xdf\x06\x10R\x99\x00\x1f\xe3\xca\xc6#\xc9\x1a\x1e\xce\xc2\
-\xe0\xa8\xbc\x8c'\xf43\xcb\xdf\xc7\xe0\xd7d\x95\x7f?\
-/m\x17\xf2:\x03\xaf\xfc<*\x7f^\xd9\xf3\xce,\
-\xa8\xfb]<\x1c\x969/\xdfo\xcf\x08\xab\xf8\x5cp\
-\xc6\xd4;\x09 ;[p\x17\xacT\xa8\xaa&\x05\xa2\
-1$\xab\xabP[\xd7\x80\x86\x84\xee\x06\x0d\xa2\xfcF\
-DV\x86ib\xcb{[y\xdf\xc0`'%\xe4\xb4\
-W^\xdchO\x16X\x8d\x1b\xb0\x9a\xb6o\xc3\xea\x8b\
-\xd6b\xc3c\x0f\xbf}\xd8\xe1\xcb\xaf2\x0c\xa3j\xa6\
-$\xd3\xbdz\xa3\xe0\x12\xd5T\x14\x0c\x06\xd34\xd0\xd1\
-\xd9\x89\x05\xf3\xe6\xba\xa4;\x01q\x09\xfc\xb8B\xc0\xb5\
-\x08\xcc\xa2\x09\xcb4`\xd9\x16\x98\xcd\xc1l\x06\xd3\xb4\
-008\x88\xea\xaa\xa4\xcc\xbd'\xe6\xbf\xe6}\xfb\xb0\
-\xea\xc4\x8f\xe0\xa25\xff\x7f{o\x1a$\xd7u\x9d\x09\
-~\xe7\xbe=_n\xb5\xa2\x0a @\x8a$\xb8@\x9b\
-em\x96%\x87\xe8\x90l\x13\xdd#`\x02\x98%\xc2\
-3\x92\x1c\xddr\xdbc\xb7d{$[\xea\x9e\x98\xf9\
-\xe1\x09\xf7\x88\xb6\xd4R\x93=\xe3p[\xf6\xa8\xa5h\
-+4#@\x06\xa4\x1e\xc0\xa3n9\xc62%Q\xb2\
-eQ\x14\xc5\x1d\x0b\x81B\xed[\xeeo\xbbg~\xdc\
-\xfb^\xbe\xcc\xca*T\x81\x00Q \xf32\x8a\x85\xca\
-\xe5\xbd\x97\x99\xef\x9d<\xe7;\xdf\xf9\xbe#\xf8\xda\xd7\
-\xbe\xb6\xeb,\xa1\xaeuI)q\xf0\xe0A<\xf6\xd8\
-c\xf8\xfa\xff\xfb\x9f\xf1\xfc\x85\x0b\xd9\x17\xca\xc0\xff^\
-\x0a \xbe\xd3\xff\xae\x030/w\x02\xba_\x15\xa8\x97\
-W\x07\xd5\xfb\x98\xe1We\xb4o\xca\xb7\x1a\xf07\x06\
-\xf0\xa3\xe46\x9bK\xd8\x82_\xd5\xf3\x9e\xeb\xc7\xe8`\
-% `\x98\x86\x0aX\xb62\x93(\x16\x8b\xa8\x8e\x8c\
-br\xa4\x0c\xd2\x81*\x89UV\x15i\xae\xe4\xca\xca\
-\x0a\x9e~\xee\x05\x22\xa2\x0f>\xfc\xa9O\xfe\xf8F\x9f\
-\xc7\xd7\xa3$\x04\x00\xdc}\xef\xfd_\xaf7\x9a\xbfY\
-.\xfap\x1d\x87Rm\xef\xbc\x06v\xde5\xc5\xb5M\
-\x04\x09\xa3V[C\x12'\xd839\xae3\x1dE\xa2\
-L\x15\x0b<\xdbB\x08\x81H\x1bq\xca$\xd1^g\
-\xca\xfe\xbd\xdeh\xa2Z.\x83\xaf\xd3\xb4\x1d\x91\xc0\xa5\
-\x99\x19\xdc}\xf7\xdd\xf8\xe0\x07>\x80\xcf\x7f\xfe\xf3\xe8\
-t:/\x1bO\xeb\xba\x83\x94\xda$\xe4\x81\x07\x1e\xc0\
-\xa3\x7f\xfb(\xber\xfa?\xe2\x85s\x17\xd4\xfb|\xd3\
-*\xbf\x97\x96nmx\x98\xbc\xda\xb6\xbb\xe9\x0a_\xe5\
-\x98\xb2lG\x0e~\x0c\xf7m\x0f}\x81a\xf0\xf1\xea\
-\xfbd\x7f\xd5\xd6=>\xeeKQ3\xa9\xe9\x9e\x14o\
-\xf3\xe7\xf2\x804\x93\xb7\xac\xa49S\xbeM\x9b^i\
-v\xe58\x0e\x0a\x85\x02*\x95\x11LL\x8e\xc3\x13\xc8\
-\xe4b\xa2\xb8;+\xd8h4\xf8\xb1\xbf\xfb\x01%R\
-~\xfa\x91O?\xf4o^\x8e\xf3\xf9\xbai\xb8\x1c\xbc\
-\xef\xd02\x11\xbdc\xadV?\xb8ojR\x97\x15\xbd\
-&\xa3\x9c+\xc3S\xfc\x89\xd9\xc0\xec\xdc\x15\xf8Ee\
-\x08\xd0\xafL \x08(\xf8.\x82Xj&m\x88$\
-I\xc02\x01X\xd9\x9e\xd7\xeauT+\xe5\xeb\xdav\
-\x9f\x9b_\xc0\xd4\xd4\x1e\xfc\xca\xfb\xdf\x8f\xef>\xf6\x18\
-\x16\x16\x16n\xc9\x80\xc5\xcc\xf8\xc4'>\x81/|\xe1\
-\x0b8\xf1\xb5\xaf\xe1\xdc\x85\x0b\xfa\x8bDn\xf1\xf3R\
-\xe9\x0a\xf2\xbao_n\xc9\x1e\xdfz\xdbr\x93lh\
-\xcbL\x0e[dO\x03f\x00\x91\xdf\xce 6\xfe\x86\
-\xccJnr<\xb2o\x9b\xbd3\x83r\xc3\xf1\xc9\x5c\
-\xa0\x1d0\xd3\xb8\xd9\xac \xb4-\x1a)\xfa\x820\x94\
-k\xb3\xe3:\xf0\x0a\x05\x94\xcb\x15\x8cM\x8c\xa3\xeaX\
-zN0\xce\x02V\x14*\xca\xd1\x8f\x9fz\x9a\xea\x8d\
-F\x83\x88\xfe\xd1\xdb\xdf\xf1\xce\xf8\xb1\xef<z\xeb\x04\
-\xac\xe7\x9fy\x0a\x07\xef\xbd\xff\xabA\x18\xfe&3;\
-\xd5r9\xc7#\xcdO\xd0q\x96u\xb9\xb6\x890\x91\
-\x88\xe3\x0433Wp\xe0\xb6\xbdJ\xdd\x92\x90\x81\xef\
-B\x08X\x82 \x5c\x0fa\x10fii\x22\x93\xec\x83\
-\x0f\xc2\x10\x8dF\x03\xa5R\xe9\xba\x96o3W\xe6p\
-\xfb\xed\xb7\xe3\xe3\xbf\xfb\xbb\xd8\xb7w/\xbe\xf3\xdd\xef\
-\xa2^\xaf\xef\xfal\x8b\x88\x90$\x09l\xdb\xc6\x1f\xff\
-\xf1\x1f\xe3#\xbf\xf5\xdb8y\xeakx\xfa\xb9\xedR\
-6^J\xfat\x9d\x02-6\x92A\xb7\xb7\x1b\xde\xb0\
-\x8d\xad\x9f\xd7\xc7(\xdf\xf0d\x00\xfd\xa4\xcf\xad\xa8\x0b\
-\x83D\xfax\xb3&\xe5\xa0\x0e\xe4\xe6\xb7mFQ\xd8\
-\xaa\x13H\x83^W:\xf2\xab\x83U\xaaegiA\
-\xbeb\xa9\x8c\x91\xf1\x09LTJ@\x92\x82\xec\xda\x05\
-'\x0a\x11G\x11\x9e?w\x9e\xcf_\xb8\x18\x09\x12o\
-}\xf8\xd3\x9f\xbc\xf2r\x04\xab\xeb\x1a\xb0\x0e\x1f=\x8e\
-3\xa7OF\x07\xef;\xf4|\xbd\xde\xf8o\xc7\xc7\xaa\
-l\x1a\x06\xe59\x1e]O\xb3n+\xd6\xb1U70\
-\x08:\xb82\x97\xc3\xb3HI\xd0\xa43v\xbei \
-\xb6\x5c\x04AGE\xfbD\x0dHK)\xc1\x0c\x04Q\
-\x88\xb5\xf5\x1aR\x9d\xae\xebqM\x0a\x22\xcc/,\xe2\
-\x85\xf3\x17\xf1\x0b\xbf\xf0\x0b\xf8g\xbf\xfa\xabx\xfc\xf1\
-\xc73\xae\xd6\xcb\xa6\xa5\xb5\xc3\x9f$I\xf0\xb6\xb7\xbd\
-\x0d\x8f>\xfa(\xee:x\x0f\xfe\xdd\xbf\xff\x22\x16\x96\
-\x96\xb5S\x0bv\xed\x8f\xdcqu8hft;\xcf\
-\xed{\xfc@\xf0\x9d\xfb\xfbz\x9b\x80\xe8\xdc\x05\xdf\xb1\
-5\xf8\xde\xd3\xf7\xdb\x00\xacor\xdb&\xdb\xe6>>\
-\x15o\x00\xdd\xbb\x06\xab\xfd\xcfK#\x16\x91\xc8$c\
-\x94(\x9f\x07\xbf\xa8(\x0c{\xc6Fa\xb2\xca\xaa\xd2\
-\x0c+\xca\xcd\x0a>\xfe\xe3'I\x08\xf1[\x0f\x7f\xfa\
-\x93\xff\xf1\xc3\x1f\xfb8\xbe\xf7\xed[,`\xe5\x00\xf8\
-\xa7\xee\xba\xf7\xfe\xc3\xcb\xab\xeb\xb7MMN\x0c\x00\xde\
-\x09\xc8>\x04ES\xb3L\x03\xb1$\xd4\xd7k\x10\x06\
-a\xb4Z\xd5\xe5\xa0\xc8\x9eO\x00|\xc7F\xc4\xa4&\
-\xc2\xe3\x082V\x82\xf7,U\xfa\x1bG\x11\xd6\xd6\xd6\
-P,\x96`\x08q\xd5!\xd6\xed\xfe\xc4q\x8cs\x17\
-.bd\xa4\x8a\xdf\xfe\xad\x8f\xe0\x89'\x9e\xc0\xc5\x8b\
-\x173=\xad\xdd3\x18,\xe1y\x1e~\xef\xf7~\x0f\
-_\xfa\xd2\x9703;\x87/}\xe5\xa42\xb0\xd8\x86\
-\x89\x82\x9e\x00\x00 \x00IDAT\x8dC\xcc\xfd?\
-;.9\x070\xc4\xe5\xd5\x9f7\xb0\xbc\x94[\xb0\xc1\
-\xe5\xe6\x03\xccrSf\xba\xdc\x1c,\x97\x83\xd8\xf2r\
-SV\xfb\xe6\xe0\xbd\xdc\xc6\xa0u\xefc\x94\xc3\xb3r\
-b2\x84\x80i\x980M\x13\x8e\xeb\xa2\xe8\xfb\x18\x19\
-\x19\xc1\xe4\xc4$\x8a\x06#\xd4n\xcdJ6F\xfd\xb4\
-\x9a-\xfe\xf6\xf7\xbeOR\xca\xaf<\xf2\xe9\x87~\x17\
-\xc0\xcb\x16\xac\xaek\xc0\xca\x03\xf0\x07\xef;\xf4\x95(\
-\x8a~\x03\x0c\xbbT\xf4)\xcdr\xfb\xc1\xf7\x94\xb9k\
-j\xf9\xdf\x84\x093WfP,\xfa(\xfa~&z\
-\x9f\x1as\x9a\x82\xe0\x17<\x04\x09+\xa6\xadv\x95\x95\
-Rf'H\x14\xc7X\xaf\xd5P\xf0\x5c\xd8\xb6u\xdd\
-\xca\x14\x0207\xbf\x80\xd9\xf99\xfc\xde\xc7>\x8aw\
-\xbf\xfb\xdd\x98\x99\x99\xc1\x0b/\xbcp\xd33\xaa\xf4\xfd\
-|\xef{\xdf\x8b\xcf\x7f\xfe\xf3\xf8\xc7\xef{\x1f\xbe|\
-\xe2\x14\xfe\xe6\xdb\xdf\xe9y\xafw\x13\xc6~\xed)\xf0\
-\x80rok\x1e(\x062\xd5\xafR\xde\xf5\xcb\xbb\x0c\
-\xbao\xe3`s\x9f>\xe9\xc0!c\xde\xfcp\xaf\xc6\
-t\xef\xb9m\x13B+mN\x0eM\x13\x00!\x14\x91\
-\xdb0\x0cX\xb6\xca\xac\x0a\xbe\x8f\xea\xc8(F\xc7'\
-0\xe2\x9a\x88\xb4(_\x94\xe1V\x11$K\xfc\xe0\x87\
-?\xa2f\xb39KD\xef~\xfb\xcf\xbe+\xb9\xde\xb3\
-\x82\xdb\xb9\x0eo\xc8:|\xf4\xf8\xc7\x05\xd1'\xdf\xf4\
-\xfaC\x5c\xf0\x1c2t$O\x19\xf0B(\xb9\xd5\x8c\
-we\x18X\xaa\xb5P\xab\xd5\x91\xc4\x11\xde\xf3\xeew\
-\xa1T\xf4a\xd9\x0e\x1c\xc7\xc9\xd8\xf3\x96e\xa1\x99\x10\
-.\xcd\x5c\xc1\xca\xd2\x12\xd6\xd7W\xd0j\xb4\x10\x04\x01\
-\xc2(@\x1c'\x99\xfa\xe1kn\xdf\xaf\xdc\x9e\xaf\xf3\
-\xb2-\x1b?\xf3\xd67cj\xcf$\x9ex\xe2\x09<\
-\xf0\xc0\x03\xa8\xd7\xeb\x03\xddpn\xf87\x8ea\xe0\xbe\
-\xfb\xee\xc3\x9f\xff\xf9\x9f\xab\xd1\xa2\xf3\xe7\xf1\x17_>\
-\x818\xb9y\xaa\x0b\xd7\x8eZ]\xe3#vp\x07o\
-\xe39[1\xdaI\x97Y[\xed{P\xa0\xdb\xec\xf6\
-\xcd\xcc0\xf2L\xf7\x8d\xfb\xe4\xad_:o<\xd6\x14\
-\xbb\x14$ LE\x0c\xb5l\x1b\xae\xe3\xc1/\x16Q\
-\x19\x19\xc1\xc4\xe4\x1e\xec\x1b)e\xea\x0bi\xa0\xd2\x8c\
-v\xfe\xc9SO\xd3\xc5\xcb\x97\x13!h\xe4\xe1O=\
-T\xbf\x19g\xc9\x0d\xf1\xbbz\xf0\xc81\x9c=}\xf2\
-\xd1\xbb\xee\xb9\xef]+\xeb\xebw\x8dU+LB\xf4\
-\x14\x86\xfd_n\xcc\x0c\xd76\x11C \x08\x02\xcc\x5c\
-\x99\xc5\xde\xe9)\x95}\x81\x95n\x94~l\xc1\x12\x10\
-\xb6\xa3k\xeaD\xf3\xb3\x14\xb1\x94\xa5D\xa2{\xd2\xcb\
-\xabk\x10\x86\x80_\xb8\xbe.<I\x92\xe0\xfc\xc5\x8b\
-XYY\xc5\xfe\xfd\xfb\xf1/\xff\xe5\xbf\xc0/\xfd\xd2\
-/\xe1\x1d\xefx\x07l\xdb\xc6\xcc\xcc\x0c:\x9d\xce\x0d\
-\xfb\xd0\x5c\xd7\xc5\xdb\xdf\xfev\x1c=z\x14\xff\xea_\
-\xfd\x01\xfe\xf0\x0f\xff\x08\xf5f\x0b_?\xfb\x0d\x9c\xfd\
-\xc67\xbbf\x15\xb7\xd4\x0f6\xed\xee\xa1\xaf\x1b\x97\xfd\
-\xc8M8\x0e=\x14\x85>\xd6\xfc&@YO\x87N\
-nv\x7fJ\x15\xd8\xf8\x98\x9e\xee\x9c\xe4\x81\xc7\x90\xb1\
-\xd4\xfbo\x1bp\xcc\xf9m\xcb\xc1\xb2\x16\x83\xdf\x13\xee\
-\xaa=H\xee\xa50\xa4\x15\x8bi\x08\x98\xa6\x0d\xc7\xb2\
-\xe1\x15\x0a(\x95\x159tj\xac\x02$\xca\xad9N\
-R&{\x84$Npif\x86\x9e;w\x0eB\x88\
-_~\xf8S\x0f\xfd\xe0#\x1f\xfb\x04^\xee\xec\x0ax\
-\x89\xc3\xcf\xdb\xe8V\xfd\xf7\x9dN0\xf7\xe2\xcc,^\
-\xb3\x7f_O\xa02\xd2\x93R\xa7\xa6\x99ae\xc1B\
-\x1c\x97\xd0\xac\xaf\xe1;\xdf\xfb{\xbc\xfb]?\xd3U\
-\x81\xd0T\x08\x22\xa0\xe2Y\xe8L\xeeA\xa8AA\x99\
-H\xdd9\x94\x10\x9c\x06-`vv\x1e\xf5z\x13w\
-\xde~\x00\x92\xe5\xf5|m\xb827\x87\xd9\xf9y\xec\
-\x99\x9c\xc0m{\xf7\xe2u\xaf\x7f=>\xf8\xc1\x0fb\
-ff\x06\x0f=\xf4\x10\xbe\xf9\xcdo\xe2\x99g\x9e\xd9\
-\xf0\xbc<7\xedj\x94\x84|&u\xe8\xd0!|\xe8\
-C\x1f\xc2/\xfe\xe2/\xe2\xce;\xef\x84m\xdb\xf8\xc1\
-\x0f\x1f\xc7\x1f}\xf6\x11\xd4\x1a\x0d$I\x02\xcb2{\
-\xad\xa6nl\x22}]2\xa7\xab-\xc9\xd7\xbe\xcf\xed\
-dT\x9bu\xe0\x06?Zn\x9e=\x0dx\xde\x96\x19\
-\xd4\xa6\xa5\xe3\xc6\xfb6+\x1f\x07w\x1fs\xf4\xa1L\
-\x90\x80\xb22Ph}+\xb7P\x80_,\xa1:2\
-\x8a\xa9\x89\x11\x98\x9c J\x12\xcdd\xd7 {\x14b\
-qq\x89\x9f|\xeai\x02\xf0\xeb\x0f\x7f\xea\x93_\xfe\
-\xf0\xc7>\x81\x87?\xf5\xc9\x9b\xd3\x01\xbf\xd1;8|\
-\xf4\xf8{\xe28\xfeO\xf7\x1f\xbc\x8b\xab\x95\x12\xd9\x96\
-\x0d\xc34`\x9a\x96\x16\x07S\x86\x8c\xa9l\xb2\x10\x02\
-a\x9c`\xbd\x19\xa0^_\xc3\x81}\xfb\xf0\xa67\xbe\
-\x1e\x8ec\xeb\xc1j5\x5cm\x9a&\x0c\xcb\xc4\xccJ\
-\x03\xf3s\xb3XY^F\xa3\xb6\x8ev\xbb\x8d0\xd0\
-L\xdcD\xd5\xe1\x92\x19\xb6e\xe15\xb7\x1f\x80\xe3\xd8\
-\xd7\x97\x92@\x04\x96\x0ad\x95Rbtd\x04\xaf\xbd\
-\xef^\xdcy\xc7\xed\x00\x80g\x9f}\x16\xdf\xfa\xd6\xb7\
-\xf0\xa5/}\x09sssXYY\xc9\x18\xc2i\xb6\
-\xd6\x833\x08\x81\xd1\xd1Q\x94J%LMM\xe1-\
-oy\x0b\xde\xfb\xde\xf7\xe2\x1d\xefx\x07&&&\x10\
-\xc51.\xcf\xcc\xe0o\x1e\xfd\x0e~\xf2\xd4\xd3H$\
-\xc3\xb2v\xa7\x15\xd75\x878~\xe9\xc1\x91\xb7\x19/\
-\x19\xbc\xcd@\xb5\x95\x1a\xc3\xe6\x07\xce\xc0@y\x07\xde\
-v\xe0\xd9\x8c\xb6\xb0\x15\x16\xd6[\x06\x92 \x18\xc2\x84\
-i\x1a0L\x13\xae\xe7\xa2P(\xa2T\xae`dl\
-\x0cSS\x93(\x99B+\xfd*]\xf6(\x8a\x10\x86\
-!\x1a\xcd\x06?\xfa\xdd\xc7(I\xe4\xff\xf3\xf0\xa7>\
-\xf9\x8f?r\x13\x83\xd5\x0d\x0fX\xba4\xc4\xe1\xa3\xc7\
-?g\x1a\xc6?}\xed=w\xb1\xe3\xd8d\x98\x0a\xcf\
-2M\x13F\x0e\x00L\x07\xa0\x85\x10\x08\xa2\x04\xeb\xad\
-\x0e\x9a\xcd:\xee\xbd\xf3N\xbc\xf6\xfe{U\xc0\xb2m\
-\xd8\x96\x05S\x07-2L\x5cZZ\xc7\xfc\xec\x0c\xd6\
-VW\xd1h\xd4\xd0n\xb5\x10\x05!\xa2(\xee\x06-\
-)a\x98&\xf6NOatt\xe4\x86aMiJ\
-_)\x97\xe1\xfb\x05LONbrr\x12\xe3\xa3#\
-h6\x9bX[]E\xb3\xd9\xc4\x0b\xe7\xce!\x8ec\
-\xb4Z-\xd8\xb6\x8ds\xe7\xce\xe1\xae\xbb\xee\x82\xeb\xba\
-x\xcd\x1dw`jz\x1a\xc5b\x11 \xc2\xec\xfc<\
-\x16\x16\x16\xb1\xb4\xbc\x82z\xa3\x81v\xa7\x83\xe5\x95\x15\
-\xcc\xcc\x5c\x81\xb8\x05\xc7\x866\xc5]\xe8Z\x12\xb3m\
-\xf8\x84\xf3\xb6r\xaa-n\xe2\xabl\xebj\xd9\xd2\x0e\
-\xb9X[\x81\xf0\x832\xa9\x0dr\xa1\x04bt=\x13\
-\xf40\xb3e*\xd5P\xcf\xf3P*W0:1\x86\
-\xa9=S\xa88\xa6\x1a\xb9\xd1\xdd\xc0PO\x95\x84A\
-\xc8\x8f~\xf71j\xb6\xda\x7fK\x84\x9f{\xe4\xd3\x0f\
-\xdd\xf4s\xe7e;\xdb\x1f<r\xecE\xbf\xe0\xed\xbf\
-\xf7\xce\xdb\xd90M\xea\x07\xe0\xd3\xdfii(H\xa0\
-\x11Dhv\x02\x84\x9d6\xde\xf2\xa6\x9f\xc2m\xd3S\
-\xb0\x9d\xd4\x88\xd5\xd2C\x9a\x16X\x18\xb88\xbb\x80\x85\
-\xf9\x05\xac\xad\xad\xa0\xd9h\xa0\xd5j!\x0a\x03DQ\
-Z2*\x17\x98XJLN\x8cczz\xeae\xcc\
-\x18\x18\xae\xeb\xa2R*ad\xa4\x0a\xcfsq`\xef\
-^0\x08\x05\xcfE\x22%L\xc3@\x18EH\x92\x04\
-/^\x9e\xc1\xe2\xd2\x12\xd6j5\xd4\xeb\x83g\x19\x89\
-\x08\x8dF\x13\xe7\xce\x9f\xdf4c\xa4\x9bxR\xc9\x97\
-\xf4\x80\x9d=i{\x98\xfb\xc6\xe7\xf36\x8ee[\x99\
-U_P\xea\xdd\xe4&\x00<\x11\xd0\xf7\xa5\xb9\x19\xb8\
-\xbe\xe9!\xf2\xe0\xf0k\x08C}\xf6\x22\x15\xe13\xf5\
-5\xe3\xc0+\xf8(\x96\xca\x18\x1d\x1d\xc5\xe4\xd4\x14\xc6\
-\x0a\xb6\x0eV]?\xc10\x0c\x10E\x11\x7f\xf7\xfb\x7f\
-G\xeb\xeb\xf56\x80\x11\x12\x14\xdc\xcc\xcc\xeae\xc1\xb0\
-T\xa0:\x8e\xb3\xa7O\x80\x88~\xbe\xd9j?73\
-\xb7H\xb7MO\x22\xd6`\x964\xa5\xb2\xf2\x92\xac\xe7\
-\x99\x0c\xc5%\x11\x12\x05\xcb\x80d\x072N\xf0\xfd\xbf\
-\xff\x07\x887\xbf\x09\xfb\xf6N\xe7\x80X\xb5\x0f\xdb\x02\
-\xa6\xf6L\x22\xe6\xb44c$\x89D\xc2\x09\x04KH\
-I\x00+\xe11\x12\x84\xb9\xf9\x054\x9aM\xec\xdb;\
-\x0d\xdf\xf7\xd5\xfe\xc07\xf0\x02V\xba\xe9\xedv\x1b\xb3\
-s\xf3`\xb0z=$\xb2q\x09\xcf\xf5\xd0\xe9\xb4!\
-\x99a\x08#\x9b\xa7\xcc\xd3\x16\xfa\x83`\xd1/\xe0\xae\
-;\xef\xc4\x8b\x97/\xa3\xddno\xd0\x8b\xdf\x0d\x5c\xfc\
--5\xa9\xf8%me\x1bzW\x83w\xba\xbdr\x91\
-\xb7\x81k\x0d\xd6\xbb\xda*3\xdb@M\xe0\xad\xaa=\
-\xbe\xca\xee\x07dV\x04HH]\xa9\xa8\xee\xbb0\x0d\
-\xa5\xbe\xe0y(\x14\x8b\xa8\x8cT069\x811\xdf\
-F\x12\xf5\x06\xab(R\x0a\x0c\x8f\xff\xe8IZ[\xab\
-\xd5\x84\x10\xaf\x7f\xf8\xd3\x9f\x0c\xb0K\x96q\xa3w\xa0\
-4\xe0\x8f\xe3\xec\xa9\x13\xab\x07\xef;\xf4\xadF\xab\xf5\
-A!\x04\xbb\x8eM\x83\xc0\xe5\x8cT\xaao\xb3\x04\xc0\
-$\x90H\x89K\x97g01>\x0a\xc7q\xf4dA\
-wN\xd1\x12\x80\xe7\x97\x10%R\x09\xe3'18\x91\
-\xe0\xa4o>K*\xfeq\x18DXYY\x013\xa3\
-T,\xbe,Ww\xaaD\x91\x96\xbdY6)\x04\x92\
-$Qc\x129\x99\x9d\xed`=\x96ib\xa4RA\
-\x10t\xd0j\xb6z\xca\xd2\xad\xe7\xe7n\x84\xb7\xe0\x80\
-\xae\xdc5\xff\xc8m=\x8e\xb7\xec\x18\xf6n\x8f\xb7\xf1\
-x\xee\x7f\xdcU:\x8b\x9bu\x14\xbb\xf4\xf6\xcd\x9e'\
-7\x7f\x1e\xae\xf2Z\xb3\xfd\x22\xd7\x05\xd4\xa3lJ\x82\
-O\xd1\x86\x0cK\x19\x9f\xda.\xbct\xe4ft\x14\x13\
-{\xa6\xb1\xa7\xe4)\xcc*Iz\x83U\x18\xe1\xf1\x1f\
-\xfd\x98\xe7\x17\x16\xa5\x10\xe2u\x0f\x7f\xfa\x93\x17>\xf2\
-\xd1\x8f\xe3\xe5\x1a\xbd\xb9\xe9\x01+\x0dZ\xdam\xe7\xfc\
-\xc1\xfb\x0e\x8d\xd7\x9b\xad\xb7\x97\x8a\x1e\x0c\xd1\xd5\xcbb\
-0\xa0\xd5\x1d@\xc8:zJ\xf4\x8f\xc0d\x22\x91\x12\
-\xe7\xce\x9f\xc7\xc4\xf8\x18<\xcfC\xca5I]z\x5c\
-\x93`\xf9E5\xb2\x93\xe8yC\xa92.\xc9\x89\xba\
-\x06 {\x0c+k\xeb\xebh4\x9b(\x16}\x95\xdd\
-1\xe3f\xfc\x97\xbe\xd6k\xf9\x8f\x8806:\x0a\x10\
-\xa1\xd9l*\x12-^\xe6`\xc5/UNF\xde\x00\
--\xf7M4\xda\xb73\xdc|\x95\xedg\x8f\xdd`\x98\
-\xba\xf5k\x92\x03\xa5^6\x1fR\xbe\xda{\x0dJ\xaf\
-\x01mv\x0a\x02\x99]\xcc\xca\xf1<\x14\x0a>Je\
-5r3\xb9g\x0f&\xcb\x9e\x16\xe2\x8b3\xbeU\xa8\
-g\x04_8w\x1e\x17/]J\x08\xf4\xbeG\xfe\xf5\
-C\xdf\xff\xc8G?\x81\x87w\x01v\xf5\xb2\x06\xac,\
-\xd3R\xe5\xe1\x99\xbb\xef\xbd\xff-\xb5z\xf3\x9eR\xc1\
-cE\xcf\xca1\xe0S\x19\x0f\xe8ir\xa8\x92\xc8\x14\
-\x00\x0b\x15P.\xcf\x5c\xc1\xe8H\x15\xae\xe3nh\xdf\
-{\x86\x80\xed{\x88$\xb2\xd1\x1d\x05\xba\xab\x93\x0c\x12\
-\xd9\xd04X\x82Ah\xb7\xdbX^V\xdd\xbbr\xb9\
-\x8c[P\x94\x01RJ\x14\x8bE\x14|\x1f\xf5z\x1d\
-a\x18n\xcc\xb6^\xee\x9fm\x06\x93\x975Pm#\
-\x1b\xdc\xda\x0cb\x07\xe30[\x1e#\xae\xa2\x9b%\x07\
-\x1e_\xaf\x12k\x17\x88\xcb\xe4\x8dM\x13\x86i(\xda\
-\x82\xe7\xc2\xf3|\xc5\xb3\x1a\x1b\xc5\xe4\x9e)\x8c\x95<\
-p\xd4U\x0dM\xa5\x8e\xa5\x94x\xfa\xd9\xe7\xf8\xd9\xe7\
-_ \x02\x1d\xff\xb7\x9f\xfd\xc3\xaf\x7f\xf8\xa3\x1f\xc7#\
-\xbb(X\xdd\x14\x5c\xf6\xc1#\xc7@D\x15\x003\xc5\
-\x82\xeb\xef\x9f\x9e\xca$Y\xf3\xfa\xef\xfd \xbc\xee\xcf\
-\xa2\x151\xc2\xa0\x05\xd34\xf1\xf3?\xf7N\x14\x0a\x1e\
-l\xdb\x81e\x9a\x99\x0e\xb5i\x9a\xa8E\x8c\x99\xd9Y\
-\xac,.bue\x05\x8dF\x1d\x9dv'\x1b\x9e\x96\
-I\x0c)\xd5\x00uz\xc13\x03\x96e\xe1\x9e{\xee\
-\xd1c=\xb7\xdeJ\xc7\x98.^|1+yo\xbd\
-\xb5\x05\xd8\xcc\xdb9\xa9\x09\xb2\xff\x99\xdb\x00\xfa\x09\x04\
-Ir\xe0\xe3\xf2\x22\xd2=\x7f\x0d\x02\xda\xb7\x03\xa8o\
-\x06\xaa\xf7\xee\x08\x83\xe8\x0b\xd9X\x16H\xf1\xac\x04\x81\
-R\xd5\x05\xd3\x82\xed\xa8\xe9\x10\xafXD\xb9TBu\
-t\x1c\x13\x93S\x98\xf0M\xc4Q7\xb3\x8a\xe3\x18a\
-\x18 \x0c#\xfe\xc9\xd3\xcf\xe0\xe2\xa5K\x14\xc7\xf1G\
-\xff\xe4\x91\xcf\xfc\xeb\x8f|\xf4\xe3\xbb*\xb3z\xd93\
-\xac|\xa6\xf5\xfc3O\x05\x07\xef\xbb\xff\xab\x9d \xfa\
-'q\x12\x99\x9e\xeb\x80\xc1\x94w\xf4\xc8\xebysn\
-6\xde\x14\x80\x14\x16\xc2(\xc4\xe5\x99+\x18\x1bU\x98\
-\x16k\xa9\xd7\x14\xfb\xf1m\x13v\xa1\x888I e\
-\x92q\xa5\xb2oI(M(\xd2\xc1*=%\x92$\
-\xc6\xfc\xfc<\x98%\x5cWu$o\xbd\x8b\x9e12\
-R\x85\xeb:h\xb7\xdb\x08\x82p\x97\xa9\xa6^M\x08\
-yS\x87\xf8mm\x937\xe3c\xf1\xd6\x10\xfb\x86\xd1\
-\x99M\xa8\x08)\xac0\xe8~\x05\x9a\xcbM\x9f\xbf\xd5\
-L\xe1 \x13\x8b\x8d\x8c\x05\xca\xc0\xf5\xd45\xdc0\x14\
-^eY\x16l\xc7\x86\xeb\x15P,\x96P\xadT0\
-6>\x81\xbd\xd3S\xa8\xba\xa6\xc6\xac6\x96\x81\xe7\xce\
-_\xc0\x0b\x17.P\x1c\xc7\xff\xd3\x9f<\xf2\x99?\xfc\
-\xf5\x8f\xfc\x0e\xfe\xf7\xcf~jW\x9e\xd9\xc6\xcd\xd8\xa9\
-\xc2\xb3N.\xdds\xffk\xbf\xd3\x09\xc2\x0f&q\x02\
-\xbf\xe0\x12\xcb\x1eOH\x00i\x87\x8cz\xa6\x12Ty\
-h!\x8aB\xbcxi\x06\xa3#U\xd8\xb6\x9d}\xe8\
-\xa9\x92\xa2g\x0a8\xa5\x0a\xe2\xb44\x94\xa9\x1c\x8d\x84\
-L\xba\xaa\x01\x006`\x0f\xf5z\x03\xcb\xcb\xcb\x88\xe3\
-\x18\x95J\xf5\x96\x0bZ\xcc\x0c\xc7q122\x02\x80\
-\xb0\xb6\xb6\x96u\x1cw\xa3\xf7\xa0\xbc\xaa\xec\xef\xf6\xf7\
-!wX\x9an&\xcc\xb7\xa5z\xc35\xecSn\xf1\
-\x9a\xe46^Wv~\x93R\xc6%!\xb4\xf8\x9e\xa9\
-\x86\x98\x1d\x17\x85\x82\x8fBI\x05\xab\xd1\xf1ILM\
-M\xc17\x80DSf\x94A\xb12>M\xe2\x04O\
-=\xf3\x1c\xbfp\xe1\x02\xb5\xdb\xed\xdf\xf8\xdc\xff\xf1\xf0\
-g\xfe\xd9?\xffm\xfc\xc9#\x9f\xdd\xbd\x15\xc4\xcd>\
-\x80\xc3G\x8f\xbf_J\xfe\xc2\x9e\xb1*W\xcbE2\
-\x84\xa9\xb5\xa5\x8d.\x0b\xbe\xaf\xab\x96\x96\x87!\x04\xa2\
- \x04\x81\xf1\xc0\xcf\xfd,\xca\xe5rF*\xb5,\x1b\
-\xa6i\xc0\xb6,\xd4\x12\xc6\xcc\xcc<\x96\x16\xe6\xb1\xb6\
-\xbe\x8aF\xad\x86V\xab\x850\x082\x8d\x1f\xd6\x8e<\
-Rc\x07i\xd6\xa5.|\x07w\xbc\xe65\xf0\x0b\x05\
-%0\x08\xbe\xa5p.!\x04\x1a\x8d\x06.\x5c\xb8\x80\
-v\xbbs3\xc2\xe7\x0en\xddY\xf9\xb7%\x99`\x87\
-;\xb8\xda\xf3\xaeF\x22\xddP\xc0\xed\x80\xbb\xb5\xd5\xcb\
-\xa6\x5cf\xa58\x8aZ%\xd4T%\xa0e+\xab\xbc\
-T|\xaf\x5c\xa9\xaa`5^\x81\xcd2\x13\xe0K\x9d\
-n\xe2X\x91C\x9f}\xfey~\xee\xdc\x05j\xb7Z\
-_\xfd\xf7\x7f\xfa\xc7\xc7~\xf9W>\x84\xbf\xf8\xfc\xe7\
-v\xf5\xb9l\xdc\xcc\x9dk&\xfc\x8f\xee\xb9\xffP\xdc\
-\xea\x04\xef1M\x83M\xd3\xa0\xb4[\xc8\xfd\xddC\xe4\
-3q\x09\x01\x06\x0c\x13\x89Lp\xf9\xf2\x15\x8cT+\
-\xf0<O\xcf\xeau\xf7\xe3\x1a\x02~\xb1\x888\xc3\xaa\
-4\x80\x99\xfd\xbb[\x22fN\x22\xdc-N\xe28\xc6\
-\xe2\xd2\x22\xea\xf5\x1a\x00\x86\xef\x17o)c\x0af\x09\
-\xdb\xb61>>\x06\xdbv\xd0l6\x10EQNT\
-\xf1\xbaI\xf0a\xa7~7\xbc\x95`\xfb\x0e\xf7\xcb\x9b\
-mo\x0b\xa9\x9a^)\x99\xc1\x8f\xdf\xeev\xb9\xff=\
-\xd8\xf41[\x0b\xcc\xe7\xf7\x95\xb6\xa4Rwt\x911\
-\xd7\x0d]\x02\xba\xf0\x0a\x05\xf8~\x11\xe5J\x05\xa3c\
-c\x98\x9a\x9e\xc2\xe4H\x19\xa6\xd4C\xcc\x1a\x5c\x8fS\
-K\xf90\xc2\xd3\xcf>\xcb\x17/]\xa6\xf5\xf5\xf5\xaf\
-~\xf1\xcf\xfe\xe4\x18\x00<\xf1\xc3\x1f\xec\xfas\xf9\xa6\
-\x06\xac\x1c\xdd\xe1[\x07\xef;tw\xab\xddy\xa3\xeb\
-\xd8\x10\xa0\xee\x1c\xd5\x80A\xf5\x0csb\x86@\x02\x16\
-\x96VPx\x11\xbe_@\xc1\xf3z\x10L\x06`\x0b\
-\x81\xe2h\x05,\x81\x84\x13\xc8Dj4Bj\x9a\x8e\
-\xcc9\x96(\x15\xc9\xfc\x05\x0f(\xb7\xe4\xd5\xd55,\
-.\xce\xc3u=\xd8\xb6\xbd\xabD\xf1\xae\xd6\x91\x02\x80\
-B\xa1\x80={\xf6(JG\xad\xb6\xc32\x11\xd7l\
-3\xdf\xaf>\xb0\xf3\x8e\xe2f\xdb\xc5\xe0rKn}\
-,r\xdb\xf4\x85\x01\xef\x81\xdcj{\x8al\xb3\xa9\xf0\
-^v|\xe9\xdbA=<A\x99+\xff\x94~\x15\x03\
-\x22\xad0\x94\xb3\x8de\x9a\xb0l\x07\xae\xd6_/\x96\
-J(W*\x18\x9b\x98\xc0\xd4\xf4>L\xfa\x0e\x928\
-\xd2C\xcc\x89\x965\xee*\x86\xfe\xedw\x1e\xe3\xe5\x95\
-\x15\x9a\x9d\x9d=\xff\xe5/\xfe\x9f?\x9b\xda\xf5\xdd\x0a\
-\xcb\xb8\xd9\x07\xf0\xfc3O\xe1\xf0\x91\xe38s\xfa\xc4\
-W\xef\xba\xf7\xfew4\xdb\x9d\xbb\x1d\xdbPt\x874\
-\xcb\xe1. \xca=\x12\x1d\x00$\xc3@\x02\x18\x16@\
-\x84+WfQ\xf0<E\x06E\xd7\xb5\x87\x018\x00\
-\xfcb\x11$\xec\xccy\x87% e\x92Q)X\xf6\
-\xca\x88\xe4/\x8a\xf4\x8b/\x8ec,,,\xa0V\xaf\
-\xc30\x0cEd\xdd\x84\x91\xbe\x1b\xb1-fF\xb5Z\
-\xc5\xd8\xd8\x18\x92$A\x10\x04\x88\xa3H\xe1\x03/\xdd\
-<pk\x87\x9b\xeb\xa8\x08x5\xb7\x9a\xad\x8f\xa9\xef\
-\xb5`\xeb\xc7\xa3GVf\xf0k\xec\xde&\xaf\xbe\xad\
-\xec\x03\x91\x1b\xee\xa3\x1cZ\x93\x12\x8dI\xdbp\xd9\xa6\
-\x05S\x97\x80~\xa1\x08\xbfTFud\x0c\xe3\x13\x93\
-\xd8;1\x81\xb2#\xd4\x0cmf\x1a\xa1\xb0\xaa(\x8e\
-p\xe9\xf2\x0c\xfe\xe1\x87?\xc2\xda\xfa:-..>\
-~\xe2K_\xbc?\xbd\x06o\x95e\xec\x86\x83\xc8)\
-\x95\xfe\xdf\xcc\xfc\x8b\xadNp[\xc1q\x90/\x0d\xbb\
-\xf5~_\x171\xb5\x12\xe3\x04$L\x00\x02s\xf3\xf3\
-h\xb7;\x98\xda3\x99\x81\xeaizf\x12P.\xf9\
-\x90\x96\xad3)M$%\xe8\xc7rn\x9f\xb2k`\
-I\xc8\xeeK[\xd7\x9dN\x07+++X^Y\x06\
-\x11\xa9ae\xe0\x96\x08\x5cRJ\x18\x86\x81J\xa5\x82\
-\xb1\xb11X\xb6\x8d\xd5\xd5\xd5\xbekwg\xff\xc9k\
-\xf2\x1e\xdc.\xe9T\x0e \xdbn\xb1\xaf-\xb7$\xb7\
-\xfd\x1c9h\xff|\x95\xe3\xe4\x1d\xbc?}\x8f\x05\xa9\
-9C\x22%\x0d\x03!`\x08\x03\xa6\xa5\xf0*\xc7u\
-\xe1y\x05\x14\xfc\x22J\xd5\x0aF\xc7F19\xbd\x17\
-\xd3\x13#p4|\x11kRh\xea\x1d\x18\xc71\xfe\
-\xfe\x1f\x1e\xc7\xc5K\x97xii\x09\x0b\x0b\x0bO\xae\
-\xad\xad\xbd\xfd\xe2\xb9\xe7\xe3\xc3G\x8f\xddR\x01kW\
-\x021\x87\x8f\x1c\x7f\x8c\xc1o\x9b\x1a\xad\xb2m[$\
-\x0c\x03\xa6a\xe8\x16\xae\x91\x8d\xb3l4\x82\x00\xa4p\
-\xc0\x00\xa28\xc4\x1d\xb7\xdd\x867\xbc\xee\x10\x1c\xc7\x85\
-\xa5\x07@M\xd3\x82i\x1a\x10\xb6\x8d\xf9\xb5&\xe6\xe6\
-f\xb0\xbc\xb4\x84\xda\xda:Z\x8d\x06Z\xed\x96\x9aV\
-\x0f\xc3\x8c\xb3\xa2:CRS#\xb8\xdb\xb6\xee\xcb\x5c\
-L\xd3\xc4m\xb7\xed\xc7\xc8\xe8\x08,\xcb\xbae\xb2\xae\
-\x14\x98gf\x5c8\x7f\x1e\xab\xab\xab\x88\xa3\xe8%M\
-+\xdd\xf8\x97\xbdS\x80}0\x95a;\xcf\xe3m\xbe\
-\xb0\x81\xb4\x84m=\x96u&E`JA\xf5\x94\xb2\
-`\xc2\xb2L\x98\x96\x0d\xc7q\xe0z\x05\xf8~\x01\xa5\
-J\x15##c\x18\x9b\x18\xc7d\xa9\x00\x992\xd7\xe3\
-\x04\x89v\xb8\x89\xe3\x18\xab\xab\xebx\xe2\xc9\x1f\xa3V\
-o\xf0\xca\xca2\xad\xae\xae\xcd\x0a!\x0e1\xb0v\xf6\
-\xd4\x09\xdcjkW\x05\xac\xc3G\x8f\xeb\x93\x88J\x00\
-\x9f6\x0c\xf1\xc0h\xb9\xc8\xb6e\x91\x99\x92J\x07\x04\
-\xac|\xe0\x02\x002-H2!\x93\x18\xe3c#x\
-\xcb\x9b~\x0a\x05\xcfS\x01\xcb\xb2T'\xd14A\xc2\
-D-\x08q\xf9\xca\x1cV\x96\x16\xb0\xb6\xba\x86f\xbd\
-\x8eV\xa7\x85\xa0\xdd\xce\x84\xf7\xe3Xs\xb9Xj\xa2\
-i\x1f\xdb\xb8/s\xb1m\x07\x95J\x19ccc\x18\
-\x1b\x1b\xef\xc5\xddn\x81\xc0\x15\x04\x01\xea\xf5:\x16\x17\
-\x17\xb1\xb2\xb2\xac\x95*\xe9z\xc7\x9a\xeb\x13\xa8\xd2?\
-h\xfb\xdb\xe5\xad\xdb\x80[l\x96\xb1\xcd\xa7b\xd3\xa9\
-\xe8\xbe[\x15\xa8\xae\xf5@E\x0eX\x17\xe9x\x8d\x05\
-\xcb\xb1\xe1\xb8\x8a\xb2\xe0\xfbE\x94\xab#\x18\x1d\x1f\xc3\
-\x9e\x89I\xf8\x16\xd4\xecl\x1c\xe9\xdf\xb1\xeez3\x9e\
-{\xfey\x9c\xbb\xf8\x22\xda\xcd&\xcf-,P\xa7\xd3\
-y\x82\x88\xdes\xf6\xf4\xc9E\xdc\xa2\xcb\xd8M\x07\xf3\
-\xfc3O\xe1\xee\xfb\x0e\xe1\xec\xe9\x13\xe1\xc1\xfb\x0e}\
-YJ\xfe@'\x8c\xaa\x9ei\x82\x89\x07\x93J\x19}\
-\xb7\x01\x90\x12\xa4h\xebJ!av\x0eS{&a\
-hJD\xd7\xb1\x07\xf0,\x03\x85r\x05`\xcaY'\
-\xeaS\x95s\xa5\x07w\xfd\x14\x15\xce\x85\x81\x19\x14\x11\
-A\xca\x04\xadV\x0b\xcb\xcb\xcb\x98\x99\x99\x013P*\
-\x97o\x91\x8e\x22C\x18\x06<\xcf\xc3\xe8\xd8\x18\xa6\xa7\
-\xf7\x22\x8aB4\x9b\xcdk\xcf\x16e\x1fFtMA\
-\x8au\x93d\x8b\xbb\xb7\x11\xa8\x06\x06+\xb9\xf5^\x91\
-\xeb\x1cok\xd7<\xf8\x80z\x8d\x99\xb5\xea,q6\
-\x14\x0f\x12Z\xd4RU\x03\x96m\xc1\xf5<\x05\xac\x17\
-\x15\xb0>:>\x86=S\xd3\xd879\x0a\x9bdF\
-SH;\x80q\x14\xa3\xddn\xe3\xef~\xf0C\x5c\x9e\
-\x9dC\xb3V\xe3\xcb\xb3\xb3\x14\xc7\xf1\x0f\xfe\xeak_\
-}\xd3\xf3\xcf<\xd5z\xf0\xc8\xf1[\xaa\x0c\xdc\xf5%\
-a.\xe3r\x99\xf9\xaf\x05\xd1\xcfTJ\x1e\xbb\xb6M\
-iY\xa8\x84\xffT\x8bW\xc9\xb0\x88L\xb0,\x95Y\
-!\xc3\x02Y.\xc0\x12\x82\x08o\xfe\xa97`\xdf\xde\
-i\x08\xc3\x80\xadGyL\xd3\x82e\x1a\x08\xc8\xc0\xdc\
-\xf2\x1a\x16\xe6\xe6\xb0\xba\xb2\x84\xda\xfa:Z\xcd\xa6b\
-\x8aw\xdaYk8\x89c\x05\xd6\xb3\x9aO\xcc\x9a\x02\
-[\x08\xb1\xc9Dj%\xd1\x11\x8c\x8d\x8e\xc1/\x16Q\
-(\x14t\xc0\x93\xbb\x9b\xd3EJ_)\x0cC,,\
-.`]\xbf/\xadv'\x93\xdf\xbdz\x1a\xf1\xd2\xb2\
-*\xbe\xbal\xe8K\xdb\x16\xef \x9f\xe3\xed\x1c\xc6\xd6\
-*\xa6\x04\xed0,\x00\x01u\xde\x0aM\x025LS\
-\xc3\x17\xba\x04,\xf8(\xfa\x05\xad\x0e:\x81\xc9\x89q\
-TK\x1e(\xe5T%]\x80=\x89\x13,.-\xe1\
-\x87O\xfc\x18A\xa7\x8d\xda\xfa\x1a/\xaf\xac\x12H\x9c\
-a\xe6#\x04\xc4 \xc2\x99[\xb0\x14\xdc\xf5\x01KK\
-\xd2\xe0\xf0\xd1\xe3\x0e3\xff%\x11=X.8\xec\xd8\
-6\x19f\xb7,4\x0cCuQD:\x00\x8a\xcc\x88\
-\x15\xfa\xdf\x86]\xc80\x82\xfd\xb7\xed\xc5O\xbf\xe1\x0d\
-\x00Q\x86k\xa5\xce\xb7,\x0c,\xd6;\x98\x9b\x99\xc1\
-\xf2\xea\x12\xea\xeb\xebh\xd6\x1b\x9ad\xdaA\x10\x06\x88\
-\xa3D\xcf\x22\xaa2Q\x22\xe5s\x01\xd4\x03\xd8\x0f\xce\
-^\x00d\xee?\x13\x13\x13\x98\x9a\x9e\x86m[H\xa4\
-\xdc\x1d\x02V\xdb\xc8\xc0\xa2(B\xbb\xdd\xc6\xdc\xec,\
-\x96\x16\x97\xb2\xcc\xf2\xfap\xd3vH2\xbdVr\xe8\
-\xb6\x02\xd0\xf6\x83\xdb\xb6\x83U\xfa>i\xa3`\xa1\xa5\
-`\x8cthYs\xab\x5c\xc7E\xc1\xf7Q,\x16Q\
-\xaaV1:6\x81\xa9=c(\x08R\xc1)\x89\xb3\
-\xee_JY\xf8\xf1SOc~a\x01\x9dv\x13K\
-\x8b\x8bh\xb5\x030\xf09\x80~\xe3\xec\xe9\x13\x11^\
-\x01\xcb\xd8\xad\x07\x96\xa6\xacw\xdf{\x7fr\xf6\xf4\xc9\
-\xffp\xf0\xbeC?\x1fD\xc9\x1d\x06\x91*\xderT\
-\x83|[\x9bs\xee+i+Z\xc6!@\x06@\x06\
-VVW\xb1\xbc\xb2\x82\xd1\x91*\x0c\xc3\xec\xc9p\x04\
-\x18\x15\xd7\x86[\xa9v/>\xfde\x08\xd2e\x22%\
-9<\xa3\xb7g\x9d\xce(R\xa6\x061X\xcf(I\
-\x12Da\x88\xd5\xd5U\x5cz\xf1\x22\xd6\xd6\xd6`j\
-eH\x85#Q_\x90\xdbM?\x80a\x08\xb8\xae\x8b\
-\x89\x89\x09\xec?\xb0\x1f\xae\xeb\xa8\x99M\xad\x9f\xaf\xf0\
-\xbe\xeb;\xde\x83\xeb\xc2\xdb\x92WUc\x18\xac\xde \
-\xb7\xfd\xd8A.:\xe9\x17\x95\xb6\x05T\x8cuC\x07\
-+C\xc0\xb4L\xa5[\xe5\xd8p]\x0f~\xa1\x80b\
-\xb9\x88r\xb5\x82\xd1\xd11\xec\x99\x9e\xc2\xf4\x9e\x098\
-2\xd1\xd9T\x1a\xa4T\x09\xd8h6\xf1\xed\xef}\x0f\
-+++h\xd6\xd7\xb1\xbc\xb4\x84V\x10%D\xf4\xbf\
-\x9d=}\xf2w\xee\xbe\xef\x90\xbcUK\xc0[&`\
-\xf5\x07\xae\x83\xf7\x1d\xfa<3\xef\x0f\xe3\xe4\xa7\x99%\
-\x1b\x82\xa8K\xc9\x91\xdd\xdf\x19\xae\x95Z\x88\xab\xbfe\
-\x12\x82Y\xc2\xb0\x1c4[-\x5c\x99\x9dG\xa1\xe0\xa2\
-T,Br\x92\x9dd\x12\x8c\x82i\xa0T*B\xd8\
-n\xa6~  \xbaA\x0byS\xd8\xb4i\x98\xc3\xbd\
-z\xec\xce\xb7\x80X\xb4\x1bP\xa7\xd3\xc1\xfc\xc2<\x16\
-\xe6\xe7\xb1\xba\xba\x8az\xad\x8e0\x8ct`\xf0z\x5c\
-\xbbv\x13\xc1>\xbd\x10\x8b\xc5\x22\xf6LOabr\
-\x12\x95j\x05\xa5R\x11\xa6e\x22\x89\x15\xc7+\x9b.\
-\xb8&\xdcj3\x9ch\xe7\xdbbl\xbb\x897`\xbf\
-\xbc\xa3\xe7e'\x87\xce\xec\x91u\xb2\x95\x12\xa8HI\
-\xa0\x96\xf2)Pt\x05\x1f~\xb1\x88b\xb9\x82\xd1\xd1\
-qL\xec\x99\xc2\xbe\xdb\xf6b\xacX\x00\xe2(\xcb\xa6\
-\xe2\xcc$\x22\xc2\x0b\xe7\xcf\xe3\x89'\x7f\x82f\xa3\x81\
-\xfa\xfa\x0a\xaf\xac\xaeS\x10'\x92\x88\xfe\xc9\x99S'\
->sXW*\xaf\x94e\xdc\x0a\x07\x99\x96\x87\xcf?\
-\xf3\xd4\xe9\xbb\xef\xbd\xbf\x18'\xf2\x9d,%\x1b\x04\xe2\
-\x1c\x05\x9ee\xee$\xd7\xb7\xabAhUn\xc9$\x86\
-\x8cB\x90\xe5 \x91\x09\xae\xcc\xce\xa2\xdd\x090>:\
-\x925u\xd2o^\xcb\x10\x18+z0\xfdr\xd6b\
-\x86\xd6\x1cB:|\x0a\x82\x0e\x9b\x80f7\xf7\x5c\xcc\
-:\xbal\xa7C\xa8\xc0z\x89 \x08\xd0h4\xb0\xb2\
-\xb2\x8c\xd9+Wp\xf9\xd2%\x84A\xa8\xbf\x81\xdd]\
-\x89w\xa5\xeco!\x04\x1c\xc7E\xb1X\xc2\xc8\xe8(\
-\xa6\xf7\xee\xc5\xfe\x03\x07P\xadVa\xd96\x12)\x11\
-h\xbf\xc6\xc1]\xd6-\x14\x1b\xae\xb9\x1c\xe4\xcd\xb7#\
-\xb7\x8bG\xf1\x8e@z\xee\x13\x96\xcc\xe3\xabB\x88\xae\
-)\x84m\xab\xd1\x1a\xcf\x83\xe7+\xdd\xaaJ\xa5\x82\xf1\
-\x89IL\xee\x99\xc2\xde\xbd\x93\xf0\x00ES\x88\xa2\x9c\
-\xf5V\x84 \xe8\xe0\xdb\xdf\xfb\x1e\xe6\x17\x16\xd1\xa8\xad\
-\xa2\xb6\xb2\x8c\xf5F\x87\x12\xc9\x00\xe8\xcdD\xf8+\xad\
-\x8c\x82W\xd2\xba\xa5,WR}\xf8\xc3G\x8f\xff.\
-3\xff\x81e\x0a\xcb\xb3M6\x84A\xe9\x89 D\xd7\
-\xc4\x826\xf0\xb4\xba\xd9\x91\xe5)Wi\xb0\xc4hu\
-\x04oz\xc3kQ\xa9V!\x884\xae\x95\x82\xf2\x06\
-\x9a\xa1\xc4\xc2\xd22\x16\x16\xe6Q[S\x19P\xb3Q\
-G\xbb\xa3\xf4\xb5\x14gK\xc9\xcd*P^\x0fQ\xa7\
-\xf8\xd6\xa6\x17\xe86\x9blz{\xb6m\xa3T.\xa1\
-T*\xa1T*\xc3\xb6m\xd8\xb6\x03\xdb\xb1a\x98f\
-\x0f\xf8\xbf\x9b\xf8_\xe9\x05+tP\xae\xd5jh\xd4\
-\x14\xe7\xad\xd3j);\xf4(\xd26S\x0a\x1f\xcc\x9f\
-\x99\xe9\xa4\x82\x8e\x01\xdd\xd3\xf6Z\xb9W\xd7\x90\xa9\xed\
-\xe8y$@\x82Aj\xc8\x0cB\x18\xdaj\xcb\xd0\x16\
-w\x8aWe\xdb\x0e\x5c\xd7\x85W\xf0\xe0\xfb\xba\x0b8\
-:\x86\xf1\xc9qT}\x0f\x9c\xd2\x15\xb4\xd8^\x92\xc4\
-\xe8\x04\x01\x16\x16\x16\xf1\xe3\xa7\x9eF\xd0\xe9\xa0Y_\
-C\xb3\xd1\xe0v$\x89\x99\x7fDD\xff\xc5\x99S'\
-.\xe1\x15\xba\xe8V=\xf0\x07\x8f\x1e\x7f\x00\xcc\x7fm\
-\x08B\xc1\xd2\xfc,C\xb5\x85\x05\x09\x90\xa1}\x0e\xf5\
-\xd0h*\xc9\x01\xcai\xab\x9b\x16\x1c\xbf\x0c\x83\x14\x10\
-~\xf7\x9dw\xe0\x9e\xbb\xef\x82\x10\x06,\xcb\x84a\x9a\
-0\x0d\x85/\x80\x04\x96\x1a\x01\x16g\xaf`iy\x09\
-\xf5\xda:\x1a\xf5:Z\xad\x16\x82\x8e\xd2\x9cR){\
-\xa8\x0c0\xd2\xc0\x95\xc7O\x80,\x80\xbd\xd42La\
-I\xa9\xf0\xa1\x89B\xc1C\xb9RE\xb1TD\xa9T\
-\xce4\xc26(T\xee\xa6\x93\x8fTV\x9aH\x89$\
-\xc5\xc0tpn5\x9b*\x93\x08C\x04A'\x1b!\
-J\x92\x04aG\x95\x997\x82{\xb5#@\xbd\xff&\
-\xfd\x85\x98vO\x09\x042\x0cuN\x1a\x86>\x97,\
-8\xb6\x0dK\xdbm\xf9\xbe\x8fR\xa9\x82r\xb5\x8a\x91\
-\xf1\x09L\x8fWa\x00\x19\x114\x05\xd6e\x92`u\
-u\x0d?y\xf6Y\xd4ju\xd4\xd7W\xd1\xaa\xad\xa3\
-\x1dF\x1cI&f\xfc\x05\x81~\xf3\xcc\xe9\x13k\xa9\
-\xbd\xde0`\xed\xb2u\xf8\xe8\xf1if\xfc\x80\x88\xa7\
-\x5cK\x9d\x18FJ*\xcd\xb9I+\x10\xbbK0\xed\
-\x01\xb6I\xc0-Va[*C\x19\x1f\x1f\xc5[\xdf\
-\xf4&8\x8e\xa3\xc0P\xc3\xcc\xd4PM\xd3D-\x06\
-\x96\x96\x16\xb1\xb8\xb8\xa4\xb2\xad\xf5u4[-t\xda\
-Mt:\x1dD\xa1\x12\xf3\xcf\xbe\x15\xe3\xa4\xcb\x94G\
-N\xb6F\xa5N\xd7\xb51\x98\x0fN\xa6i\xc2/\x16\
-Q\xa9T\xe0\x17|\x14K%8\x8e\xad\x826\xb0a\
-J`\xa7\xc1r'A\xe9Z^C\xff\xeb\x09\xc3P\
-\xe14\xf5z\xe6\xef\xb8}2\xee\xce\xdc\x9dw\x12\xf0\
-R\xf3\x07\x12\x22+\x01\x85\xd0j\xa0\x9a~c\xa4\x14\
-\x1a\xcb\x84\xeb\xb8\xd9x\x8d_*\xa2R\xae\xa22:\
-\x8a\xf1\xf1q\x8c\x16=p\x14!I\xc1\xf5H\xf9\x12\
-\x04A\x88\x99+W\xf0\xe4S\xcf@\xca\x04\xeb+\x8b\
-h\xb7\xda\x1c%\x92b\x89\x90\x88\x7f\xff\xcc\xa9\x93\x7f\
-\xf0J\x0eT\xb7~\x86\xa5?\x9c\x07\x8f\x1c;\x00\xd0\
-\x9f\x11\xf1{M\x22\xb6\x0d\x22\xa1\xc7x\xba\xdaA\x22\
-c\x10\x93n'\xa7\x5c\x98\x14k0\x1d\x0f\x9e_\x84\
-\xd0^\x81\x07\xef\xbe\x13\xaf\xb9\xfd\x80\xd6\xe4RY\x96\
-!LX\x96\x81\x98\x0c\xd4\xda\x1d\xcc\xcd-buy\
-\x09\xeb\xb55\xe5\x85\xd8l\xeal+@\xa8\xcb\xc44\
-p\xc9Df\xdd3\x99M\xec\xcb\x0c\x03\xca\x8b\xef\xee\
-\xbc\xcc\xd9\xde\xc5\x9f\xf7\x82\xb4m;\x0b\xc4\x96e\xc3\
-q\x9d\x0cW!\x10\x1c\xc7\x01\x00\xd8\xb6\x9dQHT\
-\xd6\xb6\xf9\xc5L\xfd\xaf\x80\x80\xa0\xd3\xe9\xe5\xa81#\
-\x08\x02\x10\x80\x8e\xbe\xaf\xd3i#\xd6\xe5O\x14E\x90\
-\x92\x11E\xa9\x99g\x80 \x0c\xbb\x9d\xb64s\xd9V\
- \xcc\x89\xde]c\xc0\xe2\x9e\x0b%\x17\xf8R\xb3\xd2\
-<\xa0\xae\xcb^A:\xdb\xd7\xe7\x8di\xda\xca\xb9\xdc\
-Ux\x952\x85(\xa3R\x1d\xc5\xd8\xc4$\xc6+>\
-\x1cB\x96Q\xa5\xbc*f\xc6\xdc\xc2<\xce\x9d\xbf\x80\
-\xc5\xe5\x15\xb4\xeb54jk\x08\xa2\x98c\x061\xe3\
-<\x11\xfd\x0fgN\x9d\xf8\xab\x07\x8f\x1e\xc3\xd9S\xaf\
-\xec`u\xcbgX\xddL\xeb\x181\xe3\xdf\x80\xe8\xc3\
-\x06$\xdb\x86 \xca\x8d\xef\xa4Y\x96\xb2?\xd2%b\
-\xfa\xad\x88<\x87\x88P(\x8f\xc0\xb2m\x18\x82P)\
-\x17\xf1\xb67\xff4\x5c\xd7\x85eZY\x96e\x9a&\
-\x84a 0\x04\x16\x16\x97\xb1\xbc\xb8\x88\xf5\xb5\xb5\x1e\
-\xb2i\xa7\xd3F\x14\x84\xa9)\xa5v\xa0\xee\x96>\xa9\
-\xfe\x96*m\x08$%R\x85UI7\xf0\x83\xe9o\
-v\xe9\xff\xf5\x07\x80\x9ddF\xa5R\x19D@\xb3\xd9\
-D\x92$\xd7T\xde\xf6\xffM\xa4t\xd9)\x93\x1a\xba\
-\x1e/\x99{\x81s\xba\xb6\xed\xe4\xfd\x1fE\x9aY\xe5\
-\xb5\xaa\x0cC\xcd\xacZ\xea\x0b\xc0\xb1]x\x05\x17^\
-\xa1\x88B\xd1G\xb5:\x82J\xa5\x8a=\xd3\xd3(\x0a\
-@&J\x117\x89\x12DI\x94e\xe5O?\xf7\x1c\
-.^\xbc\x848\x8a\xb04;\x830\x0e\x11%\xcc\x09\
-\x04\x81\xf1\x97D\xf8\xaf\xce\x9c:\x91\xe0U\xb4\x8cW\
-\xc2\x8b8x\xdf!\x9c=}\xf2\xcc\xc1{\xef\x9f\x97\
-\x10\xefL\xa4\xf4\xc0\x09\x133\xf5pn\xd2y\xf9\x94\
-{\x95\xe2J\x19W\x86\x11\xb4\x9b\x90R\x82\x84\x890\
-\x8cq\xfe\xe2EX\x96\x85\x82\xebB\x08\x91I\xe4\x12\
-\x03\x16\x18\x95RQef\xb6\x0d\xd30!L\xb3\x1b\
-$\x89@F\xda!\xd2\xa5X_\x09\xa6\xfe\x9d\xd3\x1e\
- l\xe9\xb1w=\xad\xb8z\xa8\x03/a\x9b\xedv\
-\x1b\xedv;\xa3/\x5c\xeb\xcf\x86\xe0\x95vm\xafU\
-\x01b\x03G\x0a[\xda|m\xfd\xbe\xf5\x06+\x12\xa2\
-KQ\xd0\x04f5\xfb\xa7\xb4\xaal\xd7\xd1\xd9T\x11\
-\xc5RI3\xd5G1\xb1g\x0a\xd3SS\x98\x9a\x18\
-\x87\x83$\xb3\x88OGl\xa20\xc2\xf2\xca\x0a\xfe\xe1\
-\xf1\x1faf\xe6\x0a\x9a\xf5\x1a\x16\xe7.#L\x12\x8e\
-\x12\x22\x09\xb1B\xc4\xff\xf3\xd9\xd3'\x7f\xfb\xe0\xbd\xf7\
-\xf3+\xad\x0b\xf8\xaa\xc8\xb0z;\x88\xc7\x0e1\xe8?\
-\x11\xf3\xb4\x80\xa2>d%a\xcf\xc0\xb4\x1e\xe7\xe9\xeb\
-\x1e\xa6?B\x18p\xfc\x12<\xdf\x87A@\xb9X\xc4\
-\xbdw\xdf\x8d}{\xa7\x15{^\xcb\xd3fn\xd5$\
-\xb0\x1a\x84X\x9c_\xc0\xfa\xda\x0a\xd6\xd6\xd6\xd1n\xd4\
-5\xbe\xd5F\xd0\xe9 \xd4\xf8V\xacq\x8a$V \
-s\x92$\xbd\x82o\x99\xa3\xf0.\x00\xd0\xaf\xd7\xbc\x00\
-\x00\x17iIDAT\xcby\xf7\xec\xe8\xda\x95\x19\xae\
-\x9d\xed\x9e6k\x14U!_\xfau\xcf\xa9\xac\xf43\
-\x0cX\xb6\x0b\xdb\xb1\xe0x.<\xc7C\xa1X\x82_\
-,\xa2:2\x82\xea\xd88\xa6\xaae\x98\x00\x12\x9dq\
-\xa7\x80z\x22\x13\xac\xaf\xd7\xf0\xccs/`um\x0d\
-\xf5\xda\x1aV\x97\x97\x10\x05\x1d(\xffrA\x00\xfd\x0d\
-\x11\x7f\xe0\xcc\xa9\x93\x17\xf1*]\xf4J}a\x87\x8f\
-\x1c\xfb\x06\x13~\x9e\xa44\x0c\x92,H\x95\x89\x86N\
-\xe1\xb3\xe0\x95\x03LE_\x99\x08f\x98\x8e\x0b\xbf2\
-\x02\xc7T\xb6_{\xa7&\xf0\xbaC\x87\xe0y\xae\x02\
-SS@\xdeP'll\x18XXZ\xc3\xea\xca\x0a\
-V\xd7\xd7P_[C\xb3\xd9B\xbb\xddB\xd0n\xa1\
-\xa3\xf1\xad\x94\xa5\x9c\xc8\x182N\x10'\x12\x9cb\x5c\
-\xb9\xe0\x95e\x1b\xb4\x0b\x14\x1f\xf8\xe6\xec\x80\xaf\xe3\xb1\
-\xf0\xd56\xc0\xc85f\x846}\xa0l\xb4\x0by.\
-\x95at;\xc9\xb6\x0d[\x97\x7f\xae\xe7\xa9\xb1\x9aR\
-Iy\x02\x8e\x8c\xa0::\x8eQ\xcf\xe8J\x16%2\
-\xc3\xac\x820\xc0\x85\x17/\xe1\xdc\xb9\x0b\x88\xe2\x10\xab\
-K\x8b\xa8\xd7\xd6\x01\x00\x09\x0c@\x88\x80\x98\xff\xdd\x99\
-\xd3'?r\xf8\xe81\x9cy\x15`U\xaf\xe8\x92\xb0\
-/P\xa5Vb_<x\xef\xa1\xcb,\xc4{\x99\xc9\
-\x96R2\xcb\x84\xf2c\x1e\xb2\x8f#\xd5#\x8d\xab\xef\
-K\xe2\x08A\xab\x898N`X\x16\x9a\xad6f\xae\
-\x5cA\x18F\xf0\xbd\x02L\xd3\xd0\x80\xba\xfa\x11\xcc(\
-\x17=\x14\xcb%\xd8~Y\x075\x03\xa6e)\xef8\
-\xd3PC\xae\xe9\xd0v>\xe3K\xc1\x5c\xa2\xde\xaf\xf8\
-|\x8f*\xbdo\xc0\xcc\x22\xe1:(\xb7l\xf5C7\
-\x22\xa8m\xbe\x83\x81\xda\x0a\x83\x1e\xbaC\xd6\xfbv;\
-~\xa9\xa0\xbaA\xdd\x8c\xca4M\x18\x96\x05\xdb\xb4`\
-\xd9\xca\xff\xcf)\x14\xe0{\x9e\x9a\xfb\xab\x94Q\xa9\x8e\
-`ll\x1c\xe3\x93\x93\xd8\xb7o\x1f\xc6G*\xf0\x0c\
-\xce\x88\x9f\xa9\xc0\x9eL$._\x99\xc1\x8f\x9f|\x0a\
-W\xae\xccbmu\x11Ks\xb3h\xb5Z`2 \
-\xc9\x00\x848E\xcc\xbfr\xe6\xf4\xc9?\x03\x80W[\
-\x09\xf8\xaa\xc9\xb0r\x01\xccg\xa2o\x13\xf3\x1bX\xc6\
-L2!a\x08\x10i\x92i\xd6\xe1\x11}#\x14\xdd\
-\xc0!r\x83\xd4~y\x04\x85b\x09\x96\xa1\x02\xcd=\
-w\xdf\x85\x83w\xdf\xa98_\xa6\xa1f\x025(o\
-\x08\x81\xc000?\xbf\x82\xd5\xd5e\xd4\xd7\xd6Q\xaf\
-\xd7\xd1j5\xd1n)\x1aD\x18\x86\x88\x82\x10Q\x1c\
-f\xc4\xc9\x14\x98O\xa4\xcc\x82\xa1\x9aU\xd4\xba\xdfJ\
-5\xbcG\xe3\xfe\xa6\x98b\xf0\x8d\xdd\xe8\x8dr\xd5\xd9\
-P\xf31z\x9b/i&E]|Jq\xfc\x8cL\
-\xfa\xc5\xb4\x94N\x95\xebxp\x1c\x1b^\xa1\xa0\xf0\xaa\
-J\x19\xe5\xf2\x88R\x02-\x17\xc0R\xf9\x07\xe4\x83T\
-\x9c\xc4h6[x\xf2'?\xc1\xeaz\x0d\xadV\x03\
-s\x97_T\x9f;\x09&a\x11\x80\x88\x88\xfekf\
-\xfe\xfa\xd9\xd3'\x13\xed}\x80W\xfbzE\x07\xac\xfc\
-\x87\xfc\xe0\xd1\xe3\x9f\x22\xe0\x9f\xb3L\x1cN\x22&(\
-l\xab7\xcb\xd9\xa8\xf6 \xf2\x9dD}\xca[\xb6\x83\
-B\xb9\x0a\xdf\xf7\x01)Q\xa9\x94q\xe8\xde{2S\
-Wa\x08-\xc0\xa6ep,\x13\x8d\x90\xb1\xb6\xbe\x8e\
-\xd5\x95\x15\xd4\xd6\xd7\xd1h\xd4tG\xb1\x83N\xa7\x85\
-Pw\x14\xe3\x1c\xe3;I\x12\x85uH\x89$\x96\x83\
-m\xd2s\x1a\xf7Y\xf9x\x8d'\x02\xdf\xd4\xc0\xb5y\
-\xa0\xa2\x97\x5c\x1a\xf2\xc6 \x95~\xce\x8c\x0d_R\xd4\
-\x13\xa8\xd4\x17\x8fiZ\xaa\xfb\xe78]\xb7\x9a\xd4Z\
-\xcb/\xa3P,\xa0::\x8e\x91j\x19\xe5r\x11\x1e\
-\x18\x91.\xf9\xd2\xcf1I$V\xd6V\xf1\xe2\xa5\xcb\
-\x98\x9f_@\xab\xd5\xc2\xda\xca\x12\xd6VW \x0c\x83\
-\xc9\xb0\x88\x84\x11\x02\xf8*\x18\xff\xf4\xcc\xe9\x13\xcda\
-\xa0z\x95eX\xbd\xc0\xfc\xb1CD\xf4\x1f\x98\xf9\xa7\
-8\x89\xc0q\xa4ei\x8c\x1e|\xa2\x1f\xb3 \xdaX\
-\xae\x11\x11\x0c\xcbF\xa9:\x0a\xbf\xe0\xc3\xb2\x0c\x94\x8a\
-%\xdcq`\x1fn\xdf\x7f@=_sq\x943\xaf\
-\x09\x16\x06\xc2$\xc1j#\xc4\xca\xf2\x02j\xeb\xeb\xa8\
-\xd7\xd6\xd1i\xb7\xd1n\xb7\xd0n\xb5\x11\x85Af\xc5\
-\xa4\xc6}R%\xc9\x04R\xbb\xfd\xc8>\x0fE\xd5\x00\
-\x93:\xdb\xca\x19\xaa\xeby\xc6\x0d\x1d\xb8[\x15l\xbf\
-\xe6\xe3\xd2\xf3\x9f\xba\x18T\xcd\x96\xae.U\xfeK\xcb\
-\xd0\x1c>\xd3\x1002*\x8b\xf2\xfe\xb3L\x0b\xb6\xeb\
-\xc0u=\xa5\xaaP,\xa2T.\xc3/\x9512:\
-\x86\x89\xa2\x1e\x96\x97\xca\x0b0\x95\x80\x91,\xb1\xbe^\
-\xc3s/\x9c\xc3\xca\xea*\xda\xad\x16\x16\xe7g\xd1j\
-\xd4\x11'\x12\xc2\xb2A\xc2\x00\x11=\xc6\xcc\xbfv\xf6\
-\xf4\xc9\xc7\xfb\xbfp\x87\xebU\x16\xb0\x94\xfc2p\xf6\
-\xd4\x09<x\xe4\xd8\xef\x13\xd1GY\xcaB\x12\xb6\x19\
-:\xdb\xa2\xbe\x93w\xe3\x8fF:r\x81\x8b\x99\xe1\x14\
-|T\xaa\xe3p=E\xb6,\x17\x8bx\xdd\xfd\xf7\xa2\
-Z\xad\xc2\xb1\xed\xec[\xda0\xd2Y2\x03\x814Q\
-\xab\xd7\xb1\xba\xb2\x8a\xf5\xda:\x1a\xf5\x1a:\x9d6\x9a\
-\xcd&:\xed6\xc2N\x80 \x0a\x10\x851\xe28\xd4\
-\xac\xf9\x18Q\x14+\xa9f)\xb3Q\x16\x15\xbc\xb8\xc7\
-a\xa8\xdf-\x98\xa5\xe24IM\xe5\xa0]\x17\xb8\x06\
-\xa3M;\x8fy\x94y\xf9e8\x94\x06\xbd\x94\xb1C\
-\x9a1\xf7\xcak\xe7\xe5\xb7\xb3\xe9\x06\xcb\x84m\xab\x8c\
-\xca\xb1\x1d%S\xec\xfb\xf0\xbc\x822,\xadV\x95\xc3\
-r\xb5\x08\xa1K\xf8D\xeb\xaaK\xfd;\x8a#<\xfb\
-\xc29\xbc\xf8\xe2%H\x99`ui\x11K\x8b\xf3`\
-\x06\x1b\xa6MdZ\x92\x88\x16\x99\xf9\x7f<{\xfa\xe4\
-_\xe8/\xd6W<c}\x18\xb0vX&>x\xe4\
-\xd8[\x88\xe8\x7f\x01\xf3\xfb\x92(\x84L\x22\x108\xfd\
-\xa6\xeb\x1d]\x012.U\x0f\xe14W^\x08!\xe0\
-x>\xfcR\x19\x05\xdf\x87)\x04J\xa5\x22\x0e\xec\xbf\
-\x0d\xb7MO\xc3u\xdd\xec\xc2H1\x11\xd34\xd1\x89\
-\x19\x9d0\xc2\xca\xea:\xea\xeb\xeb\xa87\xeah5\x1b\
-h\xb5\x94\xd2i\xa7\xd3\xd16\x5c\x0a\xe3\x8at\xe0\x8a\
-\xe3(\x0bZI\x22\xb3 \xc6\x89\xd4\xfevj\x8eQ\
-\x05U\xa9\x95,r\x86\xb4\xa9mZ\xfe\x8a\xe7k<\
-knpI\xb8\xf5S(\xab\xf2\xba\x9f\x07e:f\
-)!8\xb3w\xa7\xeep|\xda\xedK\xb3*+\xed\
-\xfaZ\x16l\xdb\x86e\xd9p\x1d\x07\x8e\xeb\xc1-(\
-NUI\x0b\xea\x8d\x8dTQp\x1d\xd8\xc4\x88R\xcc\
-1\x89\xd5g\xc0\x8cz\xad\x8e\x8b\x97.a~a\x11\
-\xb5Z\x0d\xeb\xab+X[]F\x14ElX6\x09\
-\xd3\x02\x91x\x01\xc0#\x00\xfe\xec\xcc\xa9\x13\x8dW\x0b\
-[}\x18\xb0\xae\x1d\x90'\x10\xfd#f>\x0df\x11\
-\xc7\x01\x92(\xccN\xe8\xfe\x12q3\xe5\x87\xfe\xdf\xa6\
-m\xa3::\x09\xdf/\xc0\x14\x02\xae\xeb`\xff\xbe\xbd\
-\xb8\xfb\xce;\x91\xaa\xa5\xa6#?]\x99g\x81\x0e\x11\
-V\xd7\xeaX_[A\xa3\xd1Pj\xa7\xed\x16\x82v\
-Ge]Q\xa0\xd8\xf3zl%\x89\x95AF\x92S\
-\x89P\x9c.\x15\xb0\x12\x99\x00\x923\x0fF\xe5\xef\x91\
-\x1b\xc0\x1e\xa0\xee\xd0S>nvv\xc8\x1bp\xe6l\
-\x90\x98\xa6\xee\xce\xd2h$\xf30T\xee}O\x1dg\
-\xb2x\x95\xd9:dL\xf4,H\x19Buk\x8d.\
-F\xa5\x02\x95\x06\xd2-+S\xc0p\xdd\x02\xdc\x82\x1a\
-P.\x96J\xa8T\xaa(\x8fTQ5\x0c$\xac\xbe\
-,b\xcd\xa1K\x01\xf5(\x8a\xf0\xf4\xb3\xcfbfv\
-\x0eD\x84\xf9\xd9\x19,-\xceC\xc6\x09\x84\xed\xb0i\
-9:\xae\xd2\xc7\x98\xf9\xdf\x9e=}2P\xe7\xe2q\
-\x9c9=,\xff\x86\x01k+L\xab+\xc3\xec\x02\xf8\
-S\x00Ge\x12\x97\xa2\xa0\xc3,c\xea\xcd\xb4Dn\
-\x0e\xb1o\x86,w\x01\xa5\x17\x8bd\x86[(\xa2\x5c\
-\x19\x81\xef\xfb0t\xe0\xba\xfd\xc0~LMN\xa2R\
-.g\x14\x07\x91J\x8fhnO\x87\x04\x9a\xcd\x16\xd6\
-\x1bM\xa5\x0a\xd1h\xa0\xd3j\xa1\xd5\xd2\xe5\xa2\xb6!\
-\x0b\xc2\x10q\x18f\xf6Nq\xac\x94\x22d\x92\x92R\
-\xb5\xee<\xe7p\xaf\x8c\xf9/{\x87\x8c\xd3\x00\xd6\x17\
-\xc8\xfa\x83\x18\x0f\x080\xd7\x02\xf6o\x18\x05\x02\x81\x89\
-7\x9e\x9c\xb9.\x1e\xfa\xb0D\xca\x95\x80\x9c\xaap\xa4\
-\x81\x89\x00a\x18:\x98\xa9@%\x0c\xd5\xc5M\xb3[\
-\xc3\xb4T\xb0\xb2,X\x96\x0d\xdb\xb1\xe18\xae6~\
-\xf0Q\xf0\x0b(\x95\xcb(\x97\xcb\xf0=\x1f\x15\xc7\xec\
-v\xfbr\x1d\xdc \x0a\xd0\xa85q\xe9\xf2%\xbc8\
-s\x05Q\x18\xa2\xddnb\xf6\xf2\x8b\x88\x13\xc9\xa6e\
-\x93a9\x10B,0\xf3\x7f&\xa2_;s\xeaD\
-=%;\x0f\xd70`\xed\xa0D\xec\x12\xf1\x0e\x1f=\
-\xfez\x00\xbf\xcf\xcc\xff\xa5L\x12\x8e:M\xb0\x94\x94\
-\x1f\x9c\xde\xa8 \xd9\xcf\x94\xef^D)\xdeeZv\
-\xe6\xd0kY&l\xcbB\xa5\x5c\xc6\xde\xe9)\xdcq\
-\xe06\xa4\x16OB\x9bf\xa6\x98\x97\x14\x06\x12\x19c\
-\xbd\x13\xa3^\xaf\xa1\xb6\xbe\x8ef\xa3\x8e\xa0\x13\xa0\xdd\
-ji\xf6|\x880\xec(\x8eO\x18\xaa\xf2$\xd6]\
-\xc6\xacd\xec2\xea\xc1\xacn\x97\xbat\xec\x1b\xa7\x01\
-6\x8e\xcbP.>\xe5q\xb1\xcd\xd4\x047\x0d^\xb4\
-e\x04\xcb\xee\xceL\x1ar|\xab\xf4\xbdM\x05\x14\x91\
-\x95\xe7\x94e\xc3\x94\x05'\xad?E\x04a\x98]J\
-B\x8e\x13g\x1aj\xce\xcf\xb2,\xb8\xae\x07\xcb\xb6\xe1\
-\x15\xd4`\xb2W,\xa2X*c\xa4Z\x85o\x90\xfa\
-,\x92\x94n\xa22W\xd6\x98\xe1\xc5\x8b/\xe2\xd2\xcc\
-\x15\xb4;\x1d4\xeau,\xce\xcf\xa2^[G\x14\xc5\
-\xb0\x1c\x97M\xcb&\x12B\x02\xf883\x7f\xe5\xec\xe9\
-\x93\x17\x868\xd50`]\xef \xf6^\x80\xbe\x02\xa0\
-\x14\x05\x1d\x11vZLD\xd4\x83\x83\x0c\xca\xb0\xaeR\
-*\x02@\xb9:\x86\xca\xe8(\x5c\xc7\x01\x83\xe1\xb9.\
-\xee\xd8\x7f\x00\xb7\xef\xdf\x07\xc3\xb4`\xdbf\x0f\xbe\x22\
-R\xdcK\x08\xb4\x88P[\xab\xa1\xd9l\xa1\xd9P2\
-+\x9d\x8e*\x17\x83@\x05\xaf8\x0cU\x10\x8b\x22\xdd\
-R\xd7xW:x\xadG\x82\x98%\x12-{#\x93\
-\xae\xf6\xb8\x12g\xcdi\x98\xe7\xdc\x89\xf3\x19X\x1a\xb5\
-8\x0f\x90sn\x88\xfa\xaa\xe6\x0e\xb4!\x93\xea\xfd\x9d\
-\x0fT\xa9\xb2\x86&p\xea\x12\xb1G\x81\xc30!\xb4\
-\xc3\x8fa\x18 \xa3\xeb\x98l\x08\x0b\x86e\xc22\x0c\
-\xc5H\xb7l\xd8\x8e\x03\xdbq\xe0\xb9.\x1c\xd7C\xc1\
-/\xc2/\xfa(\x15\x8b(WKp\x12\x89X\xe6\x83\
-\xbdR\xdbHe_f\xe7\xe6\xf0\xec\xf3/ \x08C\
-\xc8$\xc6\xcc\xa5\x8bX[]\x01\x91`\xdb-\x90\xe5\
-\xb8\x0c\xa0\xcd\xcc\x0f\x9f=}\xf2_\xa8\x8c~\x88Q\
-\x0d\x03\xd6\x0d\x02\xe5\x0f\x1f9n2\xf8\xd7\x89\xe87\
-X\xca\xfb\xa3\xa0\x838\x0a!e\xd2\x9dCD\x9fC\
-O\x1a\xc8\x14\x0a\xdf{\x01\xa2;\xeeCB\xc0\xf5\xd5\
-\xb7x\xb1X\x86i\x9a\xb0-\x13\xa3#ULLL\
-`r|\x0c\x95J\x19@\xb7k\x99/\x1b\x13a \
-\x0cc\xb4\xa2\x10\xcdF'\x93\xb6i\xb7[\x08\x826\
-\x82\x8e\xa6F\x04\x81\x96lI-\xa1\x22\xc88VY\
-\x98\xd4`\xbdL2\x8eWf\x1e!\xb9\x9b\x81\xe52\
--\x99\x998h\x1a\x05S&?\xadl\xd6\x09\xfdf\
-\xa3\xdc\x7f\xa2\xa5\xefU\xee\x8e\xae\xec4u\xef\x07e\
-:f\x99\xf8b&\xdf\x22r4\x04\x85E\x11\x190\
-LU\x0e\x9a\xa6\xa5\xbb\xb1\x96\x1e\x9b\xc9cSi\xa0\
-*\xc0+\x14\xe0\x17K(\x16\x0b\xf0,\x13\x8ek\xc1\
-\xc8\xba}:P\xc9\x04` \x8ec,.-ai\
-y\x05\x0bKK\xa8\xd5\xeb\xa8\xaf\xadbue\x19\xb5\
-\xb5U\x18\x96\xc5\x96\xe3\x91iY \x12O2\xf3\xe7\
-\x88\xe8\xf3gN\x9dX\x1b\x06\xaba\xc0\xba\xb1\xd8V\
-.]\x7f\xf0\xc81\x8b\x88\xfe;f\xfeS\x00f\x1c\
-\x06\xe8\xb4\xea\x19^\xd2\xdfA\xec)\x15\xb3\xbf\xbb\xe5\
-a?~#\x84\x01\xd7\xf712:\x81\xa2\xef\xc34\
-U\x97\xb2Z\xad\xe2\x8e\x03\xb7azjJ?N\xf4\
-\x10\x1a\xbb\xec|\x01&\xa0\xc9\x84z\xbd\x81V\xa3\x81\
-\x8e\xe6t\x05A\x07A'@\x14\x87\x08\x82P\xb9\xad\
-\x84\xda\xcc \x8e u\x06\xa6\xca\x1c\xc5\x1db\x96=\
-\xca\x9fHX\xf1\xbfRV}\xce\x0dH\x95E\xf9\x0c\
-+GE\xe0\xad\xce6\x15\xd8HkJA\xbf\x87H\
-\xf9Q\x99v>\xc1H\xcb\xbf\xb4\xbc\x13\xe8v[\x85\
-\x91)z*\x9b,]\xf2\x996L\xdb\x84eX\xb0\
-\x1d5>\x93\xc9\x11\xfb\xbe\xf2\xfa+\x96\xe0\x9b\x80\xa9\
-\x8f\x9dSL\x8au\xe3B\x97\xcba\x18\xe2\x85s\x17\
-0;7\x87H{R\xce]\xb9\x8c\x85\xf9Y$q\
-\x04\xcb\xf1\xd8v\x0b\xa4?\xf3E\x00\x1f`\xe6o\x9e\
-=}2\x1c\x96~\xc3\x80u33.\x83\xc1\x7fD\
-D\xc7\xa5\xe4\x03q\xd8A\x14\xb4!\xa5\x92#\xca\xe3\
-(\x1bp\xad\x5c \x1bT&\xa6\x19\x8c\xedx(\x8f\
-\x8c\xa2T*\xc2q\x5c\x10\x00\xd7u1\xb5g\x02\xd3\
-SS\xf0\x0b\x05\x14\xfc\x02\x0c-mB\xb9!\xee\xb4\
-t\x8c\x85@\xc4\xa4$_:mt:\xa1\xf2U\xec\
-t\x10t:\x08\xa2\x00q\xa8\x1cW\x92D\xc9\x99\xa8\
-!\x5c\xfd\xa33/\x99\xa8r1\xe1\x042N\xbac\
-Ai\xd6%\x93\x9cd\x8b6\xf9\xe8\x09Z\xb4\xf9\x09\
-\xb7\x81n\xa0\x03zN\xb2%\x0d\xf0\xdd\x99K\xdd\x9c\
-H\xd9\xe7\xfa\xb7iX0,\x03\x96\x1e@\xee\x9a\x90\
-\xba*\x93*x\xf0\xbc\x02\x5c\xdb\x86\xeb\xb9\xb0m\x13\
-\xb6.\xef\xa4\xe6\xaf\xe5\x9b\x13q\x92\xa0\xd9hbm\
-\xbd\x86+ss\x98_XD\x1c\x87\x08\x83\x00+K\
-\x8bXYZ\x04\x09\x83m\xc7%\xdb+\x80\x88\x96\x01\
-<\x0e\xe03gN\x9d\xf8\xfa0\x9b\x1a\x06\xac]\xd0\
-M\xec\x9e\x80\x0f\x1e=v\x1b\x81\x1e\x00\xf0\x09f~\
-\xadLb\x04\x9d6\x07\xed\x96\x96\xb1\xd1\x8a\x98\xb9\x8b\
-\xae_\xbe\xa6\x07\xb7\xe9\xd1\xc6R1\xc00\x0cX\xb6\
-\x03\xdf/\xa222\x06\xaf\xe0\xc14\x0c\xe5[\xe7\xb8\
-\xd831\x8e\xa9=\x93\xaal\xcc\x8d\x96\xe4G\x8b\x0c\
-\xdd!\x93\x0cMq`4\xc2\x08a\x10\xa2\xd1h \
-\x0a\x02DQ\x8c@\x97\xbaa\xdam\xd4\xa3A,Y\
-\x052\xdd\xb6O\x81zN\xba\x8e\xd7\xaa\xeb\x88.\xce\
-%Yu\xfa\xfa\xdc\x8b\xba\xaf\x91\xba\x9a\xfa\xa2W\x1f\
-,\xcd\x14S\x11\xbc\x9e %L\x18\xa6b\x9e\x0b\x12\
-\x0a\x972\x0cX\x96\x92\xb1\xb6-\x07\x96\xa3\xb8S\xae\
-\xe7\xc3\xf5\x1c8\xb6\x03\xcf\x10\x99\xbe\xba\xd0\x5c\xb4D\
-\xcaL\xb2ZJ\x99\xa9\xbd\x86Q\x84K\x97f\xb0\xb0\
-\xb4\x84f\xab\x850\x0c\xb1\xbc\xb4\x80\x95\xe5%\xb4\x9b\
-Mt\x82\x00\xb6\xe3\xc2v<\x98\xa6\x09\x12b\x06\xc0\
-C\x00\xfe\xea\xcc\xa9\x13\xcf\xa6\xd9\x14\x80aF5\x0c\
-X\xbb6\xfbz\x0f3?BDwJ\x998\x9dV\
-\x13a\xa7\x9d\xd1\xaa\xbb =r\xc1+\xf7\xef\x5c\xca\
-\xb1Q\xd4/k\xb9\xc1r=T\xaa\xa3\xa8\x8e\x8c\xc2\
-ql\xc59b\x86\xeb:\x98\xda3\x89}\xd3\xd3(\
-\x15\x8b\x8a\xa5\xad\x05\x04\xd322_J\x0ahAA\
-\x22\xb4\x85@\xa7\x13i\x7f\xbb\x00a\x18!\xe8t\x90\
-\xc41\x828D\x12*\xecK\x95\x8c]E\xcc\x04:\
-h\xe5\x14*d\x9f\x96W\x8a\xda\xf5+\x88\xa6\xb7e\
-\x1d\xd7\x9c\xf31\x19JZ8\xb3m7\x05\x0c\xa1$\
-{H\x08X\x96\xadd\xaa\x0d\x0b\xb6\xad8S\x8e\xa3\
-d\x9dM\xdb\x86\xeb\xda\xf0\x0804\xfe&s\xe6\xa7\
-\xd9\xdf\x9a\xce\x91r\xd7\xa2$\xc6\xc2\xc2\x22\xe6\x17\x16\
-\xb1\xb8\xa4\x1c\xac\x93$\xc1\xfc\xec\x15,\xcc\xcdB\xca\
-\x04D\xc4\xb6[ \xc7\xf3`\x18f\x00\xe02\x80O\
-\x9c9u\xe2+\xf9\x0c|\xb8\x86\x01\xebV\xc2\xb9\xde\
-ED\xff\x0d\x88~Y\xc6\xf1X\x18\x06\x08;m\x8e\
-\xc2\xa0\x87\x12A)\x18\xbf!hQ\x8es\xa4@\xf9\
-\xd4\xd60\x05\xea\xd3\x8b\xdf\xf1\x0a\xf0\xfd\xa2R\x07\xf0\
-U\xe9(\x88\xe0:\x0e\xca\xe5\x22*\xe5\x0a\x8a\xc5\x02\
-J\xc5\x12JE\x1f\x96mo(CI\xf3\x94('\
-\x1d-\x05!aB\x1c\xc5\x00\xb4;\xb5L\x10\xc6\x89\
-.\x1f\x13-<(s$U\x95\x81A2\x12]b\
-\x81z\xfd\x19\xf3\x81W\x03Tj\xdf\xd4\xa5#\x18\xa6\
-&\xd0\x0a3\x1b]2\xf5\x1c\x9faX\xb0L\x82\xad\
-i\x09\xa9\x09\xa90\x08f\xce\x959\x91\x892\xccM\
-\x0d?zh\x18\x8cz\xbd\x81Z\xbd\x81z\xa3\x8ez\
-\xa3\x81z\xa3\x89f\xb3\x89 \x08\xd0n5\xd1j5\
-\xb1\xbe\xba\x8azm\x0d\xcc\x80\xed\xba\xec8\x1eY\xb6\
-\x0ba\x1as`>\xc9\xcc\xff\xd7\xd9\xd3'\xff\xbf\xe1\
-\xd9?\x0cX\xb7~\xb6u\xe481\xd8%\xa2\xf7\x03\
-\xf8,3{I\x1cq\xabQ\xa70hko>\x91\
-Q \xba\xadz\x0c\xfe\x9d\x03\xa8\x07I\xc7t]\x84\
-\x05\x0a\xc5\x22FF\xc7Q*W`\x9bF\x97\xe0J\
-\x02\xa5\xa2\x8f\xf1\xd11LN\x8e\xa3R.C\x80\x14\
-\xc9r@\xa9*z:\x9e\xa2K-\xe8\x8e\x0dg\xd9\
-SB\x8c\x04@\x0c@\x8245Be()SK\
-j}\xf7\xb4A\x90\xfe[\xd9\xb0\x11\x0cR\x86\xa3\x16\
-\x00\x01@d\xe6\xd9\x9cq\xbfR\xbaD\x1a|\xf2\xb2\
-\xc7Rw\x02R\xf9\x1d\xe6nV\x17E!\x16\x96\x96\
-\xb1\xb2\xbc\x82\xc5\x95eDQ\x9c=\xb6Qo`y\
-q\x1e\xab\xabKj\xee/7\x97\xe9\xf9E.\x14\xcb\
-y\x10\xfdw\x98\xf9/\x89\xa8u\xe6\xd4\x09\x1e\x9e\xe9\
-\xc3\x80\xf5\x0a*\x11\xbb$\xd4\x07\x8f\x1c\xfb\x15\x22\xfa\
--\x22\xba7\x89c\xaf\xddj \x0a\x02N\x92\x98\xf2\
-eQ\xc6)\xeas\xf1\xc9\x1b\x86nZ.\xa2;\xc4\
-\x9c^\xa8n\xa1\xa0\xd9\xf5E\xd8\x8e\x9a\x873\x0c\x03\
-\x00\xc1\xb4\x0c\x14\x0b>*\x952\x8a~\x01\xd5JE\
-\xeb\x90[\xb0l\x0b\x96\x06\xb27\xdb_\x1e\x8b\xca\x97\
-\xb4\x19\x99S/\x91{\x0e\xf7\xe9\x1aK\x9d\xf1d\xcd\
-D\xee\x9d\x22\x94r\xe3\x88P/\xa9U=)\x8ac\
-D\x89\x22\xcb\xc6q\x82v\xa7\x83f\xb3\x81\x95\xb5u\
-et\xdbn+\xecM;\xd0\xb4\x9a\x0d\xac\xae,c\
-}mEi\xf2\xe7^\x8b0\x0cv\x5c\x8f\x5c\xbf\x08\
-a\x18+,\xe5SD\xf4\xd0\x99S'\xbe6,\xfb\
-\x86\x01\xeb\x15\x0e\xd0\xabq\x1f\x1d\xb4\x04\x807\x11\xd1\
-a\x00\x1fb\xe6\xdb\x938F\xd0iq\xd8iS\x14\
-\x05\x99\x90`o\x96\x95\xe3%m\x11\xb0z\xfe\x9d+\
-)S7\x1c\xc344\xf6c\xa9\x91\x93\x82\x0f\xbfX\
-\x82\xeb\xbaj4EKF\xa7C\xbf\x96e*\x05M\
-\xc7\x81\xe7z\xf0}\x0f~\xa1\x00\xdbq\xe0\xdav&\
-\x17\xac\x82G^\xefa\xb0\xf6C\x9a\xf1t\x83o/\
-\xa6\x95\xcf\x88\x94\xbbs\x97\x12A\x044[j\x0c)\
-\x08\x02\xd4\x1b\x0dm\x9f\x16\xa1\xdd\xe9h\xbd0\x99\x91\
-b\xa38F\x18vP\xaf\xd5\x94\xf2E\xbb\x8d8\x89\
-\x11jB\xad\x0aR\xe91)<\xcb-\xf8\xecz>\
-\x99\x96\x0d!\xc4\x12\x80\xff\x95\x99\xbfq\xf6\xf4\xc9\xa7\
-r8\xe50X\x0d\x03\xd6\xab3\x80\x1d>z\xec\xad\
-\xcc\xf8\x03\x22\xfa9\x00V\x1cEF\xbb\xa5xSY\
-*2\x88\xbf\xd5\x8fs\xa1W)b\xe0\xdf\xb4\xf5\xc7\
-+\x0c\x03\xaeW@\xa5:\x8abQaa\x96\x1e\xcc\
-\xc6\x80\xf0\xc3\xcc(x\x1e\x0cC(\xdb3\xdb\x82\xef\
-\x15`\x98&\x1c\xcbR\xcc\xfd\xfc\xdc\x1f\x18\x8ec\xc3\
-q\x1c$I\x82f\xab\x9d\x0dM\x13\x80\xb5z\xad{\
-t\x0c\xac\xd7\xd7A t:\xca\x87\xb0\xd1l\xa17\
-\x99\xe4\xd4\xe4\x08\x00\x10\x86!\xda\xad&\xd6\xd6V\xd1\
-l\xd4\xd1h\xd4\xbbJ2\xc0\x86\xd9H\xe8XnY\
-6y\x05\x1fN\xa1\x00\x02E\x00\x16\x01|\xf8\xcc\xa9\
-\x13'\xfb\xb1\xc9\xe1\x1a\x06\xac\xe1R\xdf\xda\x93\xcc\xfc\
->\x22z7\x11\xbd\x93\x99\xef\x8c\xc2@\xc9\xc8\x84\x01\
-\x87a@\xbaC\xd5\x1d\xbcN\x83\x163\x90R&z\
-\x02\x18\x03$z?\xd4\xfe\x80\x96\xbb\x8ds\xd23\xba\
-\xa6\x84a)\xa1:\xdbv\xf4\x9c\x9d*'\x85 \xc5\
-\x1a\xd7\x03\xc3)QSd\xbc)\xd1\x9dQ\xe6.\xee\
-\xa5%\x134\x7f\x0b=\xd1$\x91];=\xce\x01\xf9\
-\xb1\x96\xceIMh\x13\x99 \x8eb\x04A;Se\
-\x8d\xc2pcpO\xcbO\x92`\xa9\xc0w\xd55\xb5\
-\x95\xed\x96\xe3\xc0\xb2\x1d\x18\x86\xd1b\xc6\xb7\x01\xfe>\
-3\xbeq\xf6\xf4\x89\xbf\xee/\xe7\x87k\x18\xb0\x86+\
-\xcd\xb8r\x13\xfa\x87\x8f\x1e\x17\xcc\xec\x13\xd1>\x00\xbf\
-\x0a\xe0\xd7\x98\xd9gf$q\xa4FmZ-\xc4I\
-\xd4\xc3\xac\xef\xb9X\xaf\xf2\xef\xde\x0fy\xa3C\xeb\xa0\
-\xe0\xd6\x8f!\xa5%\xdb\xc6F\x01\xe56I[\x9f]\
-i\xc0bd\x1e\x8c\xf9\xda\x91ew\xf0Z\xe6\x80\xf5\
-\xae\xcb\xb2L\xc3\xf2\x86\x99\xc6T\xa00\xc5\xb8\x1c\xb7\
-\x00\xcf\xf7\xd9q\x5c\xcayB~\x05\xc0\x9f2\xf3\xf7\
-\x09\xd4:s\xfaD0<\x1b\x87\x01k\xb8v\x9cm\
-\xf5~\xb3?x\xe4\xd8[\x01\xbc\x9f\x88\xde\x09\xa2=\
-\x04L\xc6ql\x05\xda&,Nbf))\xe5>\
-\x89\x9e \x92/!\xbb\x1fq\xff\xdf\x03\xfe\xdc\xf6\xa9\
-0\xc8\xeb\x82w\xa6\xb8\xb7\x89^ \xf7\x8e!\xe6U\
-!\xf2\xf7\xa5\xc1\x8c2\x17o6\x0d\x93lW\x91:\
-m\xc7\x01\x805f\x9e\x03\xf0C\x00_8s\xea\xc4\
-\x99A_\x18\xc35\x0cX\xc3u\x1d\xb1/b\x1c`\
-\xf0\x01\x22z3\x80\x07\x01\xfa\x05\x96\x89\x91\x9a\xb0\xc6\
-q\xc8Q\x10R\x14\x05\x08\x82\x0e\x04zeo\xbaI\
-\x15\xe5\x81.l\x1e\xab\xe8\xba\x9e\x18<\xe8\x96\x0d\xc1\
-j@\x10\xeb\xa31\x80\x95#\xb6iZ\x9am\xee\xb2\
-iZd\x98F:\xf8\xcc\x00\x7f\x0b\xc0\xdf\x02\xf8\x0e\
-\x80\x17\x01\xbcp\xe6\xd4\x89\xe6f_\x0c\xc35\x0cX\
-\xc3uc\xf0\xae\x9e.\xd5\xe1#\xc7\xdf\x08\xc2\xfb\x98\
-\xf9\x18\x11\xdd\x0f\xe5-)\x002\xa20P\xac\xf5@\
-\xc9*\xcb8\xe2\xb4n\xa3|0\xa0\x01E\xdc \xae\
-\xd7u\x0dV\xfdYS\xefm\xa4\x15CSYTS\
-\xe3i\x8e\xeb\xc10M\xb8\xae\x07f\x96\x00\x12\xbd\x89\
-\xc7\x01\xfc%\x80\xaf\x9d9u\xe2\x89\xe1\x992\x0cX\
-\xc3\xb5\xeb\xb3\xb0c&\x81^\xc7\xc0\xfd`~#\x11\
-\xed'\xa2\x03\x00\xf6\x01t;\xb3\x14q\x14).R\
-\x12\xab!\xdf8\xe1D&\x94\x1f\xfe\xe5$\x06\x03\x9a\
-\xe8\xd9\x07\xde\xd3\xd5N\x1b\xde\xbaD\xd4\xfc)!\xd4\
-lc^iBID\xa7.\xcaJ\xf9\xd30\xd5\xf8\
-\x0d\x11B\x00W\x18\xb8\x00\xe6Ef>OD\xe7\x18\
-\xfcC\x02}oH\xe2\x1c\x06\xac\xe1\xba\x95\x82\xd5\x80\
-\xf6\xfb\xe1#\xc7\x0d\x80m\x06l\x00\x0e\x11\xed\x01\xf0\
-s\x00\xde\x08\xe0\x10\x80{\x00L\xf6\x900\x91\x03\xd8\
-u\xfb?\x0a#%\xf0\xa7;w\xfdK\x89\x00\xc6\x10\
-\xa6\x09Cl4\x0fWJ\x0aJ\xb8\xc5\xb2l\x10Q\
-\xc6\xd4\xec\xa7j\xe8\xb1\xcb6\x80\x1f\x00x\x14\xc0\x13\
-\x00\xbe\xcb\xcc\xeb\x04D\x0ct\x00\xc4gO\x9f\x8c\xfb\
-\x82\xf5P\x11a\x18\xb0\x86\xeb\x95ZJ\xf6\xdd7\x0d\
-\xe0.\x00\x07\xc0\x98\x02\xe1u\x00\x1b\x00\xdd\xc7\xcc\x82\
-\x88<Uf\xc2\x05\x919\xe0\xa4\xb1\x008\x00\x02\x06\
-\xa2\x01)V\x08@s\x0f\xd0\xd6\xd1\xf1Y\x80b\x10\
-\x9e\x040\x0f\xe0\x0a\x80\xc7\xcf\x9c:1\xbf\xdd\x80<\
-\x5c\xc35\x0cX\xc3\xb51\xa0\x1d9n\x82`\x80Q\
-\x02\xc1\xde\xf8\x08v\xc1\xe4\x83\xb8\x09P\xa7\xe7\x1eU\
-\x22\xb6\x08\xd4\x06\x03\xdb\xa1\x0f\x0c\x1dc\x86k\xb8\x86\
-k\xb8\x86k\xb8\x86k\xb8\x86k\xb8\x86k\xb8\x86k\
-\xb8\x86k\xb8\x86k\xb8\x86k\xb8\x86k\xb8\x86k\xb8\
-\x86k\xb8\x86k\xb8\x86k\xb8\x86k\xb8\x86k\xb8\x86\
-k\xb8\x86k\xb8\x86k\xb8\x86k\xb8\x86k\xb8\x86k\
-\xb8\x86k\xb8\x86k\xb8\x86k\xb8\x86k\xb8\x86k\xb8\
-\x86k\xb8\x86k\xb8\x86\xeb\x96Z\xff?\x9e\x18\x15\x7f\
-\xd3\xc4\x9d\x1c\x00\x00\x00\x00IEND\xaeB`\x82\
-\
-\x00\x00\x19\xa5\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00r\x00\x00\x00r\x08\x06\x00\x00\x00\x8f\xdd\x85}\
-\x00\x00\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\
-\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\
-\x00\x9a\x9c\x18\x00\x00\x00\x07tIME\x07\xdd\x06\x03\
-\x08/\x07}\xea\x03i\x00\x00\x19%IDATx\
-\xda\xed\x9dyxT\xd5\xf9\xc7\xbf\xe7.\xb3O\x12\xb2\
-'$!$\x84-\x12\x09D\xd9\x04\x04\xad\x88\x22\xe0\
-B[[*\xda\x82Z\xebO\xadZkyZ\xd4Z\
-\x8bZ-\x95\xb6\xd2\xdaj+\xee\x14\x15\x17\x14\xad\x80\
-\x0a(\x91U\x08\x84\xb0d\xdf\x93\xc9L&\x93Y\xee\
-\xbd\xe7\x9c\xdf\x1f3\xd1\x90f\x1b\xc223\xe1}\x9e\
-\xf3\xcc\xbds\xefM\xce9\x9f\xf3\xbe\xe7=\xef9s\
-.\xe1\x9c\xe3\xbc\x84\xbf\x08\xe7\xab\xe0<\xc8\x90\x91%\
-\x1f7\xc6Y\x9f-]\x97\xf9\xef\x8a\xa7\x06+H\x12\
-\xee\xa6u\xd6\xfa\xeaE\x9f\x96\xb5\xaf\x83,\x00*\xc3\
-\xed\x05\xb1\xe9kf%T\x9f\xd7\xc80\x91\x8d\xe5n\
-\x92\xf3B\xd9\x9f>-o_7>3\x0a\x17\xa4\x98\
-\x01p\x145\xfb\xf2\x06\xa3FJ\xe1\x98\xe9\x7f\x1er\
-\x0a\x0fmk|\xa3\xb6\x9d\xde0yD\x0c$B`\
-w\xab\x80H\xd0\xea\xa3\xa9\xe7A\x86\x81\xfcq\xaf]\
-~d{\xe3\x1e\x97\xc6\xc7\xcd\xc8\x89\x85\xdd\xa3\xe2`\
-\xb5\x13z\xd9_\x14\xbd\x80\xa8\xf3 C\x5c\x96oo\
-2\xfd\xb1\xb0\xa9\x92Hb\xdc\xccQq\xa8uxQ\
-R\xd7\x06\x10\x02\x95R\x80q(\x1a\x13\xcf\x83\x0ca\
-\xb9\xff\xb3\x86\xd8?\x166\xd5\x99\x8d:\xdd\xa4\xac!\
-\xa8\xb0yp\xbc\xbe\x0d\x10\x08\x00\x0e\xc68@9\x08\
-\x06\xe7\xb88,@.\xfb\xa86\xfd\x9f\xbb\x9b+c\
-\x87\x181qx,\x8e\xd4:Q\xd5\xec\x02\x04\x01\x00\
-\x07X\xe0F\xc6\xfd\xe7\xe7A\x86\x9e\xfchc\xf5\x98\
-\x97\xf74\x1fNN\xb6`\x5cz\x0c\x8a\xaa\xec\xa8k\
-q\xff/D\x00\xe0,\x00\xf3<\xc8\x90\x92k\xd6\x97\
-\xcf~\xbf\xc8\xbe9#=\x1a\xa3R\xa2\xb0\xb7\xcc\x06\
-[\xab\x17\x10\x03\x10\xff\x87\xd9\xe0\x0d7\x86,\xc8\x19\
-/\x1f\xff\xe1\xb6c\xce\x97s\xb2b\x91\x1egF\xe1\
-\xb1&8\xdb}~\x88=\x0518\xef\xf9\xday\x90\
-g_\xf2\x9f/\xb9w\x7f\xa5\xeb\xe9\xdc\x91\x09H\x88\
-2`\xe7\xd1\x06\xb8=j\xef\x10\x03 u\x04\xbe\xc1\
-\x082\xa4Bto\x14;\xc8\xf2\xcd5\x7f.\xb5y\
-\x7f6~T\x12,\x06\x09\xbb\x8f6\xc2\xabh\x01\xef\
-\xb4\x0f\xe1@\x92E\xde\x90\x13\xab\xbf#\xc1$\xd1\xf4\
-(\xd9\xd7\xec\xa6J\xacQT\x09\x01]\xfd\x9d4~\
-\x1e\xe4\x19\x96W\x0f\xdb\x85\xfb>\xaaz\xa3\xde\xa9\xde\
-p\xd1\xd8d\x88\x02\xc1\xee\xa3\x8d\xd0(\x0d86\xfd\
-\x14\xca\x00\xca\xbf\xed2\x05\x00\x04\x80@4\x93,\xb4\
-\x9au\xe2;1\x06\xf1\xc0P\xab\xee\x8b\xf4(\xdd\x11\
-\xa3D\xda\xff~U\x06;\x0f\xf24\xc8\xdf\xf75K\
-\xbf\xd8T\xb9\xad\x9db\xf2\x94\xdcTx\x14\x15\xfb\x8f\
-5\x82q\xde?M\xfc\x06\x22GJ\x82\x15\xc3\x12\xac\
-`\x9c\x83q\x802\x0e\x8d2xU\x0dN\xb7\x0a\xa7\
-\xdb\x07\x8fW\x05T\xea\x07-\x09\x887K\x1f\x0d\x8d\
-\xd2?\x97\x13\xab\xdfqQ\xaa\xb9\xf1\x81)I\xfc<\
-\xc8 \xe5\x89/\xeb\x8d\xbf\xf9o\xd5\x11\x22\x89\x19S\
-r\x87\xa2\xa5\xcd\x8b\x83\xa5\x8d\xfe\x8b\x02\x09\xce\x11e\
-\x1c\xa9\x89V\xc4Y\x0dpyT0\xce!\x10\x02\x9d\
-,B/\x8b\xd0I\x22dI\x80$\x0aP5\x06G\
-\xbb\x0f\xf66/\x1a[\xdd\xe0^\xcd\xdf\xc7\x9a\xe4\x86\
-\x9cX\xc3\xd3#\x86\xe8\xd7^1\x22\xba\xf1\x8e\x89\x09\
-\xfc<\xc8>d\xf9\xd6\x9a\x98\x95[\xaa\xea\x8df\xbd\
-~\xca\x05i\xa8ir\xa2\xa4\xa298S\xda\x9d\xe7\
-\xda\xd3X\x92\x10\x10Q\x80\xd9 !\xca\xa4G\xb4E\
-\x8fX\xab\x11\x92$\xc0\xe5V\xd0\xe8p\xa3\xd6\xe6\x02\
-u\xab\x00\x00\xb3E>11\xc5\xbctJ\xbae\xdb\
-\xe3\x97\xa5\xd1\xf3 \xbb\x91;?\xacH\xfd\xeb\xb6\x9a\
-\x9a\xe8X3\x0a\xc6\xa4\xa2\xb4\xc6\x8e\xb2\xea\x16\xbfg\
-J\xce\xf0\x90\xb0c\x98\xc2\x01\x88\x02,F\x19\xf1\xd1\
-&$\xc4\x98`\xd4\xcbp\xba}\xa8ijCSK\
-\xbb\xdf\x04\xcb\xa22#3j\xc9\xd4\x0c\xeb\xfa\x95\x97\
-\xa5i\xe7A\x06d\xe9\xbbe#\x9f\xdfQS\x12\x9f\
-\x1c\x8d\xfcQ)8R\xde\x84\xaa:G`\xa0\x7f\x0e\
-\xa4C\x8b\x09`6\xe9\x91\x12oEJ\xbc\x05\x94r\
-T6\xb4\xa2\xba\xa1\x15\xf0Q@'\xe2\xd2\xe1QW\
-.\x1e\x9f\xf0\xf1O\xf2C\xcb\xe4\x9eu\x90W\xbd|\
-d\xda\x87\x07\x9b\xb6\xa7\xa6\xc7\x227+\x09\x07\x8f\xd7\
-\xa3\xbe\xb15\xa0\x89gZ\x15{\xad\x8ao\xb5\x941\
-\x08\x92\x88\xe48\x0b\xd2\x93b \xcb\x22*\xea\x1c\xa8\
-\xaaw\x00>\x0dV\xab\xfe\xc0\xa2qqW?\xbf \
-\xbbzP\x82\xbc\xf8o\x07\x16\xec*ul\xc8\xccJ\
-\xc4\x88\xf48\xec-\xaeA\x8b\xdd\x05H!8\xf3\xd4\
-IK\x13c\xad\xc8J\x8b\x03!\xc0\xd1\x8af\xd8\x9a\
-\x9d\x00\x07\xf2\xd2\xac\xf7\xdc95u\xf5\xb2\x09\x89|\
-\xd0\x80\xbc\xe4\xb9\x03\xb7\xef8j_3jL*\x86\
-&Ec\xd7\xc1J\xb4\xb5y\xfc\x10C\xd5/$'\
-\x03MO\x1e\x82\xec\x8cx\xd8\x1cn\x14\x97\xd6Ck\
-W`\xb6\xe8N\xdc195\xff\xc99\xc3\xda\x22\x1e\
-\xe4\xe4g\xf7\xdfQx\xc2\xf1\xd7\x0b\xf22\x10\x17c\
-\xc2\xae\x83\x15pw\xc4M\xc3I(\x83\xce #7\
-;\x05V\x8b\x1e\x87\x8e\xd5\xc3\xd6\xe4\x04\x04\x82\xc5\x05\
-\xc9\xa3_\xbaadI\xc4\x82\xbc\xfa\xc5\xa2E\x1f\xec\
-o\x5c\x97_\x90\x05\xb3A\x87\xc2\x03eP}Z\xf8\
-A\xeclr)Gj\xca\x10\x8c\x19\x91\x8c\xf2\x9a\x16\
-\x9c(m\x004\x869\xe3\x12\xae\xdct\xf3\x05\x1fE\
-\x1c\xc8G6W\xa4<\xfc\xfe\xf1\xda\x0b'd\xc1\xa0\
-\x13\xb1\xe7`\x054\x8d\x0el\x9c\x182\xdaIa\xb1\
-\x181>7\x03.\xb7\x82\x03\xc5\x95`\x1e\x0dSG\
-\xc6.\xd9q\xfb\xf8\xb5\x11\x05\xd2\xfa\xd0\xb6\x03\xb1\x89\
-\xb1\xe3\x86X\x8d8P\x5c\x05\xcey\xc03\x8d\x10a\
-\x0c\xa2(b|n\x06d\x9d\x84=\x07\xca\xa1:=\
-\xb8xd\xdc\xb2\xc2\x9fM\xf8gD\x80|lk\x85\
-\xfc\xeb\x0fN(\x96(#\x5c.\xef7\x91\x95\x88\x93\
-@pa\xec\xa84\xc4\xc5Z\xf0\xd5\xbeR\xf8\x1cn\
-\x5c\x9e\x97\xb4\xf8\xbfK/|\xe5le\xe3\x8c\xd98\
-\x83D88\x87\xcb\xe9\xe9&\xa2\x12A) \x87\x0f\
-W\xa2\xb1\xc9\x89I\xf9\xd90D\x1b\xf1\xc9\xfe\xfa\x97\
-\x97\xac+\x9e\x12\x11\xa65\xe5\xd1\xed\x9f\xd4\xdb\xbd\x97\
-A\x1a\x0c\xbf\x15\xe2\x80F\x9132\x0dI\x09\xd1(\
-\xdc}\x14j\x9b\x0f+\x16\x8c\x1a\xfa\xc8w\x86\xd7\x86\
-\xadF\x02\xc0\xbd3\xd2o\xf0O\x17\xb1\xc8\xd4\xc6\x93\
-\x12\x00Q\xc0\xb1\x92*4\xdb\xda\x90\x9f\x97\x05\xe8E\
-<\xf6\xe1\xf1\x92\x0d\x87\x9a\xa5\xb0\xd6H\x00\xb8\xf9\x8d\
-\xc3\x97\xbc\xb8\xadb\x1b\x0c\xd2 \xd0\xca@\x88\x912\
-\x8c\xcb\xcb\x02\x08pp\xf7q\xa4&\x987\xd6<4\
-c^\xd8j$\x00\xfc\xfb{c\xb7O\x1e\x19w5\
-\x02\xf3}\x91\x9d\x02\x96\x87\x00EEe0\xe8dd\
-\x8eLEmm\xeb\xd5\xd7\xbd\xf8\xf5\xbc\xb0\xd6\xc8\x0e\
-\xb9l\xcd\xee9[\x0e5n\x82,\xfa\x1bn\xa4\x0b\
-\xe3\xd0\xe9eL\x9c\x98\x83\xa2\xa2r\xb459\xf1\xfc\
--\xf9\x96\x1f_<\xb4=,5\xb2C6\xff\xb4\xe0\
-\xa3\xeb&\xa6\x14@\xd1\xfc\xb1\xcbH\xd7N\x02(n\
-/JJ\xaa0zT: \x12\xfc\xfa\xfd\x927\xc3\
-\xd6\xb4v\x967o\xc9\xdfs\xeb\xcca\xa3\xa0R\x80\
-\x0d\x02\x07H\x14\xd0\xd2`\x87\xdd\xde\x86a\xd9\xa9\xa8\
-\xabq\xce\xb9\xeb\xad\xe21amZ;\xcb\xcf7\x14\
-'\xfe\xe9\xa3\xe3\x0d\x90\x84\xe0\x16W\x85i\xc0@\x10\
-\x04\xe4\x8d\x1f\x81\xe2C\xe5\x80\xa2\xd4\x7f~\xdf%\xa9\
-\x17gD\xf3\xb0\xd5\xc8\x0eY\xb5pL\xe3#\x0bF\
-G\x09\x9c\xb7A\xa3\x91\xad\x95\x00\x98\xaa\xa2\xaa\xa2\x1e\
-\xc32\x93\xe1k\xf3%\xaf\xfe\xaclzX\x9b\xd6\xce\
-\xb2\xe2\xca\x9c\xb6\x95\xd7\x8eM4\xcab%\xd4\x08\xf7\
-h\x05\x01\xb6\x06;\x18c0\xc4Y\xf0\xfa\xce\xaa\x8d\
-;\xca\xec$\x22@\x02\xc0\x03\x97ey\x9f\xbcnl\
-vB\x94~;\x14\xed\x0c\x0d\x07\x98\xbf?f\x0c\xa0\
-\x14\xd0(\xa0j\x80\xa2\xf9?i\xa7s-p\xdd\xa7\
-\x06\xee\xa3\xfe\xeb4\xf0<\xef\x9c\x82\xd5L\x86\xc6z\
-\x1b\xe2\x13b@\xdd>\xcb\xaa-'f\x86}\x1f\xd9\
-U^\xd9]#<\xf8f\xd1[\xd5M\xed\x0b`8\
-\x0d+\x068\x02\x95\x1fX\xe0,\x09\xd0K\x82\xdb\xac\
-\x93\x9c&\x9d\xf8\x8aQ'\x96\x0d1\xc9\xd5\x00\xec\x0d\
-N\x9f'9\xda\xa0\xe8E\x81\xd9\xda\x15I\xa1\xcc0\
-<\xce\x14U\xda\xec\x8e\xe7\xe0\x19\xad\x1em\x84W\xa5\
-\x0b\x15\xcaL\x8a\xc6\x0c\xd0:\xc6\x8a$\xb0\x82]\x08\
-j85<;\x0d\x15\xa5\xb50J\xa4\xd2\xf5\xa7y\
-\xc3\x22\x0a$\x00\xac\xdbWKVl8\xbc\xaa\xa4\xca\
-q7\x0cr'\x22AFV\x18\x87,\x09\x95cS\
-\xac+\xd3b\x8c;\x12\xa3\xf5\xa5C\x8c:\x8f,\x09\
-\xfc\xf1\x05cN\xb9\xb0\xf7\xbdYD\xbc\x1a\x13\x18\xe3\
-\xfaj\xbb'\xb5\xda\xe1\xc9\xb6\xb7\xabW\xd5:\xbdw\
-\xa8^M\xea\xf0R!\x90\x1e\x16\x91\x11\x80R\xc4&\
-\xc5\x82R\x86\xd6\xeaf,\xbf~\x5c\xeac\xf3\xc7\xd4\
-E\x14\xc8\x0e\x99\xf0\xbb-?\xdfWj\xfb#\xf4\xa7\
-\x10\xd2\xd3\x18\xb2\x93\xad\xcf\xde:}\xf8\x9d\x0f\x5c\x91\
-sV\x0a\xf6\xfbMGI\xb3\xcbg.\xaaq\x8e;\
-T\xe7\x5cZ\xeb\xf0\xfe\x18*E\xb7\x1e9\xe70\x98\
-\x8c\x88K\x88A\xcd\xd1*d\xa7\x0fY{\xfc\xb7\xdf\
-Y\x12\x91 \x01\xe0\xe2\x95[\x7f\xb8\xebh\xd3\xcb\xd0\
-I\xc1E\x81T\x8a\x09\xd9q\xf7\xecY>\xfb\x99s\
-\x95\xf7\xe5\x1b\x0eI\xbb\xcb\xed\x13wW8\x9e\xb2;\
-\xdc\x97@\x12N^\xd6\xc29F\x8e\xcdB\xe9\xf1*\
-hn\x1f\xfev\xf3E\xf2m\xd33\x07\xbc\xe89$\
-\xe7\x97\xbe\xfa\xd5\xacW\xae\x18\x9fz\xc5\xa9D\x81(\
-e\xbas\x99\xf7\xdf/\xcc\xd5>\xbe\xe7\x92\xc2\x96U\
-\xf3\xa6\xdf4#+-5\xc6\xb8\x1e>\xd5\xef,\x05\
-\xa6\xba<n/\x12\x93c\x01\x8f\x82/K\x9b/\x0c\
-{\xaf\xb57\xf9\xe8\xeeK\xfe{\xdd\xc5\x19\x13\xa0\xa8\
-\xc1\xc1\x0c!y\xf1\x96\x82\x9a\x9a?\x5c\xbdhAA\
-z\x9e\x08p(\x14\x10\x08\xea\xab\x1b\x9024\x09\xc4\
-l\xc0\xa7\x87\x1b\xee\x8bh\x90\x00\xf0\xe6O'\xef\xbb\
-s\xce\xa8,(\xaa\xdf\x0b\x0dC\x98\x00\xb0\xe1gS\
-\x0f\xae\xbc!\xcf\x10o\xd5\xbd\x0f\x85Bu{ak\
-\xb4a\xc2%y\xa8h\xf1\xdc\xf8\xcc'\xc7\xa4\x88\x06\
-\x09\x00\x7f\xbe1\xbf\xec\xc1\x05\xb9\xf1\xd0(\xff6\x0a\
-\xc4zO!(\xbf\xb8b\xa4\xf2\xfcO&\xcd\x1f\x91\
-j}\x0d\x1aC\xf9\x91\x0a\x10p\xa4\x8d\x1c\x86\xfd\xe5\
-\xb6\xa1\x11\x0f\x12\x00V^\x97g{\xfc\xfb\xf9V\x9d\
-@\x1a\xbe\xf9\x81jo)De~^\x0a\xff\xcf\x1d\
-\xd3~h5\xeb\x8e\x80R\xec\xf9|\x1f\x9aJ\xab\xb0\
-\xb7\xca1oP\x80\x04\x80_\xce\x1d\xdd\xfe\x87\x1b'\
-dX\xf4\xe2\x91\xde\xa3@\xa1]\x8e\xf1\xe91\xfc\xfe\
-\xab\xc6\xcc\x82J\xc1\x19\x83\xcf\xedAY\x93\xeb\x9aA\
-\x03\x12\x00\xee\xba<GY\xb5x\xe2\x05\x891\x86\xed\
-\xf0\xa9\xdd\x98Y\x1e\xb2\xa6\xb5\xb3\xac\x98\x9f[?\x22\
-#f-T\x0d\x10\x04\xb4\xb5\xfb\x86\x0d*\x90\x00\xb0\
-tF6\xfd\xf3M\x17\xcd\x1c\x96`y\x0d\x1e\xe5d\
-md\x0c\x92@\xb4\xf0h\x94\xa3\xee\x86\xe2\x8f\xe5\xca\
-\x92\xd0:\xe8@\x02\xc0w/\xca`\xe5\x7f\xba\xf6\x07\
-c\x86\x0d\xf9-\xdc\xca\xb7\xc3\x13\x00>E\xb3\xf5\xf5\
-\xfc;\xc5\x97\xdf\xbev\xdf\xb0W\xb7\x94\xfex\xf8\xb9\
-*\xc3\xff]>\xd21\xe9\x82\xe4\xe5p\xf9p\xfb\xac\
-\x11\xb7\x9cs\x90\xbbj~'\x96\xda7\x9c\x93\xd9\xe1\
-\xc3O\xcc\x7fhNA\xc6\xd5\xf0\xaa\xfe\xd9\x0b\x9f\x8a\
-\x0b3b\x0e\xf4\xf6\xcc\xfe\xfaU\xd6j\xe7gk<\
-Z\xcb\x8dG\x9a^,]Wt\xd1c\xe7*\xff;\
-W\x5c\xb9\xf2\xd6\xabs\xe5\xd5\x8b/*\x1e\xe8\xdf\x1a\
-P\x88\xeeH\xd3Z\xcb'\xa5?i\x8b\xd2el\xbf\
-)\xff\xc4\xf4sf\xa6^\xfa*\xfa\xbd\xdd\x95\xbfe\
-\x1c\xd2\xda;\xa6\xdf9st\xcf\xdb\xabl,\xb9v\
-\x5cE\xeb\xc7\x07\xe2\xcc7\x812\x1b\xec\xeewa\xd6\
-%o\x9b\x94\xf6\xf0\xac1\x097S\x84\xa9\x0c\x08\xe4\
-\xeb\x07/~\xcc\xadJ\xcb\x15\xda\x8c\x91q\xb3.\x99\
-\x9d\xf5\xf7\x1d\xa1^\xe0\x8f\x8f/\x99t\xc2\xbeyg\
-\x8ca6d1\x0d\x94\xd9`k\x7f\x15:\xc9z\xa2\
- \xf5\x97\xe3\xc6\xa7\xdc\xed\x09G\x90\x032\xadn\xb5\
-9W'\xa5#\xd1\xb2\x04\xe5\x8e\x9d\xeb[<\x87B\
-~\x01\x0ee\xaa\xc09\xe0\xf4~\x82\xe6\xf6\xe7\x01H\
-\x88\xb7\xdc\x02\x1f\xf5d\x7fY\xf5H\xe3\xae\x9a'\xac\
-\x83\x0e\xa4Y\x97Q\xd8\xe2~\x1f\xad\x9e\x8d\x10\x85\x9c\
-\xe4\xc2\xea\xc7\xe7\x86C\x91)s\x07v\xc6\xd2`s\
-\xaf\x03e\xedH\xb4,\x05\x87\xc1\xf2e\xe5#\xce/\
-*\x1fJ\x1cT c\x0c9oq.\xa0]9\x0c\
-B(*[\x0fn<\xd2\xf4\xb29\x94\x0b\xcc \x80\
-q\x0a\xc698\x97\xc19`s\xbf\x03E\xabG\xa2\
-\xf5\x16\xc8b\x0a\xbe\xaa~\xa2ak\xd9}\xa3\x07\x0d\
-\xc88Sn\x05\x87\x04\x0e\x19n\xa5\x18f]\x1e\xb6\
-\x94=P|\xac\xe5m9\x84\xdd\x020\xf0N\x11=\
-\x09\x80\x88\x16\xf7F\xb8\x95\x12$Zo\x82A\xce\xc2\
-\x9e\xda\xd5\xc5\x9b\x8e-\x9d4(@\x16\xa4\xde\xe35\
-\xc9I{\x18\x08|Z\x13\x18w\xc3(OL\xff\xf0\
-\xe8\xad\x95\xdb\xcaW\xc4\x86b\x81\xfd\xb1\x03\x02\xce\x85\
-@\x22\xe0\x5c\x04\xa0\x83\xdd\xbd\x15N\xefWH\xb0|\
-\x1fV\xfd\x85(jxi\xe7{%\x8b\xe7D<H\
-\x00H\xb2LxB\xa3\x0a\x08\xd1\xa1\xd5\xbb\x0b\x16}\
-.\xcc\xba\xf1\xc9\x855O\xdb\xd6\x1fZp\xcd\xc1\x86\
-\x17C\xca\x01\xf2k\xa1\x00\xff\xfb\x08:'\x11\x84\xe8\
-\xd1\xea\xdd\x09\x87g\x1b\x12,\xd7#\xdaX\x80#M\
-\xeb7\xbdvp\xce\xd2\x88\x07\x99\x1e=\xe3c\x06\x7f\
-\x0b\xd7\xa8\x17\x8d\xae\xf7\x10c\x98\x86D\xcbB\x94\xdb\
-?\x7f\xf7\xd3\xf2\x15\xfb7\x1e\xbdu\xdc\x9e\xda5$\
-44\x92\xf42\x95I@`\x80\xd3\xbb\x0fM\xae\xf7\
-\x11k\x9a\x8bX\xd3\x0cT9\xb6\xfdc\xed\xfe\xe9\xbf\
-\x8a\xd8qd\x87\xfc\xa5pD\x85B\xdb3\x08\x11\xc1\
-\xb9\x0a\x9d\x18\x8f$\xeb\x02\x80s4\xb9?A\x9b\xef\
-\x08\x0cRL}\xa29oY\xb2%\x7f\xf3\xac\xe1\xbf\
-;gc\xb5\xf7J\x96M,n~s\xb7,\x98z\
-w\x8a\xb8\x0f&9\x13\x89\x96ypz\xf7\xa2\xd1\xb5\
-\x19q\xa6\xd1\xcfN\xcf\xfc\xf5\x9d\xa3\xe2\x16\xf2\x88\x04\
-\xf9^\xc9\xads\x0e5\xfeg\x93N\xb4\x04\xcc\x97\x06\
-\x81\xc8\x885\xcdD\xb4\xfeBx\xb4J\xd8\xdd\x85h\
-S\x8e\x83\x80\xc1 \xc5\xedI4\xe7>\x92h\x19\xb7\
-\x8d2\x9f\xf3;\xd9\x7f8kS\x16o\x14]\xf7\xfd\
-\x8a\xd6m\xafI\xc4\xd0\xb7\x87\xcb}\xd0K\xc9H\x8d\
-\xba\x1e.\xa5\x04u\xce\xf7\x11\xa5\xcf\xd88;\xebw\
-\xf3G\xc7/d\x11\x07\xb2\xb8\xf9m\xf9\xbd#\xb7+\
-\xa2\xa0\xc37\xcb\xde8\x03\x83\x0a\xa3\x94\x8e!\xa6\xc9\
-0\xc9\xc3\xa0\xd2f\xb4\xf9\x8e\xc0\xa5\x9c\x80Wk\x04\
-c>\xc8\xa2\x09V}\xeakF)~\xbd^\xb4\x96\
-X\xf5\xa9U\x069\xa6]\x16\x8cl\xfa\xb0_\x0d(\
-s[\xca~#x5\xa7\x8e15\xcd\xe69V\xe0\
-\xf0\x94\xdd\xad\xb0\xf6\xc9\x02\xd1\xa1\xbf\x13\x97\x8c\xab\xd0\
-\x891H\x89\xba\x16>\xb5\x1e5\xcew`\xd1%\x15\
-N\xcb\xb8\x7fz~\xca\x8f\xd5\x88\x02\x09\x00/\xec\x9d\
-\xf5\xb7\xc6\xf6\xc3\xb7I\x82\xa1K\x9f\xa4\x02\xe0\xd0K\
-\xc9\x886^\x08\x8b.\x1b\xa2`\x82\xa2\xd9\xe0VJ\
-\xe1\xd1\xea\xe1Qk\xa1\xd0\xd6\xc0\xbd\x04\x02\x91!\x09\
-zE\x10d\x8f,\x18?\xd6I\xd6\xc3\x84\x93\xf2h\
-Cz\xa3\xd3W\xd3J\x88\xe81\xc9q\x14\xe0hW\
-\x9a%I\xd4\x1b\x0dbt\x8c[mN\xd6\x98o\xb8\
-B]y*m\xbfT\xe3>\x0be>P\xaeA$\
-\x06\x98\xe4\xa1\xe0\xa0P4\x1b\x08\xe9\xbf{\xc0\xb9\x0a\
-Q0ah\xd4\xb5\xd0\xb8\x1bU\x8e\xff@\x16M\x0d\
-33\x97\x0f/H\xbd\xd5\x13Q \xbf\xacZ\x1d\xb3\
-\xa5\xecQ\xbbN4w\xeb+rN\xc1A!\x113\
-\x8cr\x1a\xcc\xfaL\x18\xa54\xc8\xa2?\x22\xa6R\x07\
-\x14j\x87J[\xe1\xa36\xa8\xb4\x15\x94{A\x99\x17\
-\x94\xf9\xc0AA\x99\x0f\x02\x11\xc0\xc1\xc1\x03\x13\xc8\x02\
-\x11\x03\xa3B@ 2\x04\x22C$z\x88\x82\x11\x92\
-`\x81^J\x80^\x8a\x83^L\x84^\x8aG\xbd\xeb\
-c8<_\xc3\xaf\x95\xc18I\x1a\x04\xa2Gj\xd4\
-<\x10BP\xe5x\x0b\x00uM\xcb\xb8/mZ\xc6\
-\xbd\xad\x11\x03\x12\x00\xfe\xb6k\xea\xdb-\x9e\xf2\x85\x92\
-\xa0\xef\xd1t\xf9!h\xfeA\x00\xd1A\x12\xac0\xca\
-\xc90\xca)\x90\xc5\x18\xe8\xc4\x18\x88\x82\x09\xe4\x9b\x95\
-\xc9\xfe\xfb)W\xc0\xb8\x0a\xce5ph\xdf\x80$D\
-\x00\x81\x04\x81H\x10\x88\x0e\x02\xd1\x81\x10\xe9\xa4~\xce\
-G\x1d\xf0iMp\xf9\xca\xe0\xd1jOq\x15\x01\x01\
-\x07\x05@\x90\x1a5\x17:1\x06\x95\xf6\xf5\xf0Q\x07\
-\xa6f\xdc=t\xf6\xf0\xdf\xd4F\x0c\xc8\xdd\xb5/\xc4\
-|p\xecA\xbb^4\xa3\xef%\xe2\x01=\xe2,P\
-A\xfew;\x08D\x86(\x18!\x12\x03D\xc1\x00I\
-0A\x12\xcc\x10\x05\x13D\xa2\x87@d\x10\x22\x81\x04\
-FN\x1c\x0c\x9ck`\x5c\x01e^h\xcc\x0d\x8d\xb9\
-\xa017(\xf3@\xe3nP\xe6\x85\xff%Z\x02\x04\
-\x22a \x9b\x18\xf0@~\x93-\x97\xc2b\xc8B\xa5\
-\xfdM\xb4)\xd5\x98\x9c\xf6\xd3\xb1W\x8eXY\x1c\x11\
- \x01\xe0\xd9]3^\xb5\xb9O\xdc(\x0b\xfaS\x1a\
-\xacw\x0c\xd9\xfd\xf9\xe2\x1d:\xdcI/\xc87G'\
-?\xd5\xf5\x1e\x7f\xf2\xf7\x85\xe4\xb4\xee?\xd1aU\x12\
--\xd3\x10c\x18\x83\xca\xd6\xf7\xe0\xf0\x1c\xc7\x84\xd4\xc5\
-\x93\x17\x8e\xfeKaD\x80<\xd0\xb0\xde\xf8v\xf1]\
-nY4 R\xb7\xef \x01\x98\x8c)\x887\x17 \
-\xd1|1*[?@\x8b\xe70F\xc5\xcd\xbd\xfe\x87\
-y\xaf\xbc\x15\xf6 \x01\xe0\xa5\xafo\xfc\xd9\xf1\x96O\
-\xff\xd2\xbd\xe3\x13I\xc2\xc1\xb8\x82!\xc6\x5c\xa4X\xa7\
-\xa3\xc6\xb9\x15M\xed\xfb\x90\x11=y\xd9\xb2\x89\x1b\xc3\
-\x7fw\xc8\xba\xb6\x83\xe4\x85\xfd\x8bj)\xf3%\x0b$\
-\xf2w\xbc\xa2\xcc\x87(C\x162\xa2/G\x83\xeb+\
-\xd4:\xbf@Zt\xc1#\xb7\x17lz8\xacA\x02\
-\xc0\x17U\xcf%}p\xec\xe1z} \xda\x13\xf10\
-\xb9\x02\x8b.\x15\x99C\xe6\xc2\xe6.B\xa5\xe3S\xc4\
-\x19\x87\xaf\xbew\xea\xce\xbb\xcf\xc6\xff\x17\x1f~\xf8\xcc\
-4\x9a\xf4\xe8\x89\xed\x95\xad{\x9b\x1a\xdb\x8f]-\x0a\
-z\x80\x7f\xeb\x80D\x5c\x22\x04\x84H\xf0j\xadh\xf3\
-Ubh\xd44\x18\xe4X\xd48wO*w\x14*\
-\x13R\xbe\xbb=l5\xb2C\x9e\xdc1\xe9\x13\xa7\xaf\
-\xf1\xb2\xde\xc6\x96\x91\xe4\x061\xaeB/Z\x91\x15;\
-\x17._\x0d\x8e\xb5|\x88)\xe9\xb7L\xbev\xf4\x93\
-\x85a\x0d\xb2\xa8\xe9C\xdd\x1b\x07\xeft\x12\x08zA\
-\x90\x22\xfe\x85\xab\x84\x00\x8ck\x90\x04\x032cf\xc3\
-\xe69\x0a\xbb\xe7\xb8\xf2\x83qk\x0c\xa3\xe3/?c\
-\xa5?\xe3+\xcd/H\x98\xab\xcc\xcdY\x91\xea\xd3|\
-\xd0(\x03\x0b\xbcF#R\x93\xffg\x9c\x12\x14\xcd\x87\
-\xe3\xb6\xff\xc2\xa3\xb4\xc2\xab\xfatG\x9a?\x1bz&\
-\xeb\xf9\xac\xb8\x94S\xd3\x97\xb48\xbcu9[J\x9f\
-=\xa6\x17M\x18\x1c\xdbC\x8a\xa0\x9c\xc1\xa5\xd8\xc08\
-\x81J\x151\xecA\x02\xc0U9\x0f\x1eo\xf36\x8f\
-\xdfY\xbdn\xbf^4\x83\x90\xc1\x00\x93\x80s\x06\x11\
-z\x8c\x88\x9dV\x1d\x11 \x01\xe0{\xe3\x9e\xfaZc\
-4oo\xcd\xbb\x07DA7\x08`\x12xT\x17\x0a\
-\xd2\xae\x9d\x9f\x9f2\xff\x8c\xfe\x1c\xe1\x9cl\xcf\xb2\xa1\
-\xf8\xf7\xc3\xb7\x9ex\xbeT\x12d\x08\x82\x18\xb1\x18}\
-\x9a\x1b\xa9Q\xa3\x9e{p\xc6\xa6\xdb\xce\xf4\xff:'\
-a\x97\x85c\x96\x97\x81\xf3\x98\xed\xe5\xaf\x97(\xaa'\
-I\x16\xf5\x11\xa7\x89>\xeaF\xacq\xe8\x86\x1f\x8d_\
-u{XGv\xfa#[K\xff%m+{\xe5/\
-\xf5\xae\xd2\xdb\xf4\xa21b^\xf0\xa2hn\xa4Xs\
-^X\x98\xfb\xcb\xa5\x17$\xcd\xe6\x11\x0f\xb2C\xd6\xec\
-\x5c6\xbb\xa8\xe1\xb3\xcd\x04\x04\xa2 \x879D\x0f\x92\
-\xadYO-\x9e\xb0\xf2\x81\xec\xd8\x82\xb3V\xb9!\xb3\
-\x85\xd9\x86\xc3O[\xbe\xaa|\xf7\x85fw\xf5\x22Y\
-0@ \xe1\xf7cj\x85z\x909d\xdc=\xbf\x9a\
-\xf5\xf6Y\xdfB-\xe4\xf6\xa2{~\xd7\xfd\xb9\x07\xea\
-\xb6|\xd0\xae\xb4f\xe8DC`\x8dN(\xf7\x86\x00\
-\xe7\x1c\x0a\xf5bt\xe2\x94\xeb\xef\x9b\xf1\xd2[\xe7$\
-\x1f\xa1\xb8\xa9\xe0\xa6\x92\xe7\xc8\x09\xdb\xfe\xa9\xc5\x0d_\
-\xae\xf5j\xedY\xa2 A \xe2i\x9e\xe7?=\xc2\
-\xc0\xa0Q\x05\xe3S/\x9by\xe7\xb45\x9f\x9f\xb3\x06\
-\xc5C8\xf8\xf9~\xf1\x1aRa?<\xb6\xd4\xf6\xf5\
-\xe3\x0eO\xe3<\x0e\x0eI\x90@\x88\x18\x12H\x19g\
-P\x99\x82\xa9\xc3\xe6\xe7-\x9b\xf4\xd4\xc1sj\x19x\
-\x98D\xb1_\xdd\xf7\x98\xe9\x84\xed\xebk\x1b\xdb*\x1f\
-hS\x1cy\xfe\xdd\xfb\xc5s\xa3\xa9\x04`\x8cBc\
-*\xe6\x8d\xbd5eQ\xde\xfd\xf5\xe7\xdc\xc4\xf30\x9c\
-\x8e\xf8\xc7\xce\xe5\xd1\x0dm\x15\x13m\xee\xba%m\xde\
-\x96\x1f\xa8L\x91(\xd3@\x88\x00\x81\x08  \x81\xa8\
-\x119#\xd1#\xca4\x00\xf0]\x93\xbb,\xe5\x86\xbc\
-\x9f\xdbC\xa2\xaf\xe6a>\xaf\xf4\xe6\xd7\xabI\xad\xb3\
-\xcc@\x99\x96\xd9\xdc^7\xcd\xe9m\xc9\xf7i\x9e\xeb\
-U\xaa\xc4hL\xd1SN\xfdK\x189 \x10\xff\xaa\
-:Q8\xc5}\xd3\x09\xa0Q\x15\x92\xa8\xabZ4\xfe\
-\xaeQ\xf3\xc6\xfe$d6\x8e\x08{\x90=\xc9\xeb{\
-W\x11\x8f\xda&\xf8\xa8G\x16\x89\xac\xe7\x9c\xcbu\xce\
-r\xd9\xe1i\xbe\xad\xdeY\xf9\x90x\x0a\xa1A\x85*\
-\xb0\xea\xa3\xf7,\x1a\xff\x7f\x93\xaf\x1c\xb38\xa4v\xd8\
-\x8aX\x90=\xc9\xaa\xad\xf7N\xf8\xfc\xc4{{\xf4\x92\
-\xb1\xff\x95D\x00\xaf\xeaA\xa25\xed\x9d\x1f\x14\xdcs\
-\xdd\xcc\xec\x05!\xb7\xe1\x9d\x84A&\x8a\xa6\xea)\x05\
-h\x10]\xa7Wm\xc7\xf0\xf81O\xdfXp\xd7/\
-\xa6d^\x11\x92-\x7f\xd0\x81\xa4\x81\xf7\xb8\xf4\x17\xa4\
-[uaT\xd2\x85+\x9e\xb9\xe1\xedGC\xb9\x5c\x83\
-\x0e$c\x01\x98\xfd0\x8e\xed>\x17&\x0d\xbf\xf4\xc6\
-\xc7\xe6\xbf\xf0z\xa8\x97\xeb\xa4\x80\xa6DHP\xe9\x8c\
-\xb72B\xc8\xe9N\x9a\xca\x88\x16x\x93ROI\xd3\
-8\xda<\xed\x98\x92y\xc5\x9c'\x16\xfc\xeb\x8d\xb3\xa2\
-Q\x03\xacw\xe9tVz\xff\x1c\xf8`\x9c\xfd\xd3z\
-\x1f\x00\xc0\xe7\xd5\x04\x8d\x02\x9a\xd0K\xb4\x86*\xb84\
-\xfb\x9a\x09\x8f.|\xe6\x00\x00!Py\xc1\xf4\x8d}\
-\xde\xab\x9df/3X\x90\x9d+\x8dti\x1d\xa4\x97\
-\x8a%\xfd8\xee\xcf\xb3]\xbf\xe3\xc1\x82t\xb5ze\
-J\x01*t?\xd0\xe7\xe0\xc8\xd7\xcd\x1e\xf1\xe8\xc2g\
-j\x01\xf4\xf4\x1bu\xde\xcb9\xef\x03(\x0f4\xfc\xfe\
-\xfe\x8d\x01\x83$\xbd|\x92n\xce\xbb;\xee\xed\xf9\x9e\
-\xa0\xf6\x17z\xd0\xda\x08\x00J\xab\xa6\xd3(?\x19d\
-`\xa0O\x88\x80\xe8C\x19#W\xbf\xf8\xf7V\x00\xa6\
->*\xb9\xa7\xefx\x0f\xf7\xf5tO\xd7\xe3\xbe\x9e\x0f\
-\x0adgXB \x91N\x9f]\x8f\xbb\xde\xdf\x1b\xf0\
-`\xa1\x07\x0b\xb1W\xb8u\x95\x8d2K\x22\xd0\xd8\xb7\
-7+\x9a\x0f\x06\xc9X\xd7\xfc\xba\xf7\x8a\x1d{?\xa2\
-\x00\xa2\xfa\x01\x03A\x00\xe9|\xce\xd0\xfd\xbb\x11X7\
-\xc7\xac\xd3q\xaf0\xa5^ \x8a=$\xa1K\xea\x0a\
-\x1c=\x80\x0e\x16f\x7f\xb44h\x90\xce\x0a7\xf7\xc5\
-R\xc8\x81\x9czT\x0f\xa2\xa5!\xc5\x07\x9e<v\xb3\
-\xc3\xe6\xd0\x01\x90\x83\xd0\xbe` \xb2.0\xbb\x82\xeb\
-\x9ch\x0f\xa9G\x98'Ev\x02}^\x07\x10)\x90\
-\xe4NI\x0c|'t\x81\xda\x97\xb6\xf6\x17\xe2@\xfb\
-\xd3>\xc5d1\x89\xd9\xf7\xa5m\x96\x04\x11>MA\
-2M}\xf5\xb3'\xbe\xf8\x07\xa5\xff3 \xe1A\x1c\
-\x07\x0b\xb3;\xad\xa3\x81O-p\xacvJZ 1\
-\x00L\xeb\xc6O\x92z\xe9\x17\x85N\xe0\xe4@\xc7/\
-\x07\xce\xc5~\xc0$\xa7hN\x07d:\xfb\xba\xeev\
-\xb9y\x5cM\xcaC\x8e\xe8\x96K\xc9~\xf2\xea\x96\xcd\
-\xdb*\x03e\xeb\xcb\xd1\xe8\xc99\xe9\xaf\x86\xf2~@\
-\xa4\x01`j\xa7\xe7;\xee\xe9\x5cO\xbc/\x8d\xecl\
-V;\xe0uN\x9dA\x8a\xdd\x98\xd8\xde@\x9e\xae~\
-p@ \xfb\xe1\x11\xf2 \xbf\xeb\x0bh\x7f@v6\
-\xa7\x1d \x95.I\x0d\x5c\xe7\xdd\x0d]\xa4n2G\
-:\xd9\xf1\x8e?,tj\x09\xb4\x1b\x8d$}\xc0D\
-\x1f@\x07jNO5:\x11\xac\xf6uw\xdc\x1b@\
-\xf4\x01\x91w\xa3\x91\xb4\x93)\xd5:]\xeb5\xcfR\
-\x0f\x85`]\xd4\x98\x05ZDo\x0e\x8f\xd0\x8d\xd7*\
-\xf4\x00\xf2T\xbdUr\x1a!\x06\xa3\x81\xfc\x14\xb5\x10\
-=8:=ieWGG\xebt\xcc\x82\xf5Z\xbb\
-v\xca\x9d\xb5\xb2/3\x1a\x8c6\x92\x01\x82\x1c\x08\xd4\
-\xbe\xe0\xf1\x01\x98\xd1`\xb4\xb2/s\xcb\xba\xf1p\x83\
-\x1aGvu\x93\xfb\x82\x13\x8c\xf9\xec\xcd[%}\x04\
-%\xcev\x1f\xc9{\x01\xdb_\xef5\x18\xb3\xdb\xd7w\
-\xa7\x14\xd9\xe1\xdd\xf4\x9b\xfd\xd1\x90S\x81q\xb6<W\
-~\x8a\x90\xfb\xd2\xd0`\x1bA0\x16\x80\xf4'd'\
-\xf5\xb3`=e\x8a\xf4\x12\xef<\xd5\xca>\xdd\xc1\xf7\
-\xd3\xe1\xfc\x9c\x0a\xec\xfe\x9a\xf3\xbe@\xf5+\xee\xfa\xff\
-\x13+u\xe3\xc3\xef\x05S\x00\x00\x00\x00IEND\
-\xaeB`\x82\
-\x00\x00@\x1f\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00d\x00\x00\x00d\x08\x06\x00\x00\x00p\xe2\x95T\
-\x00\x00\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x06bKGD\x00\x00\x00\x00\x00\x00\xf9C\xbb\x7f\x00\
-\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\
-\x00\x9a\x9c\x18\x00\x00\x00\x07tIME\x07\xdd\x05\x1c\
-\x07((\xdd\xfc\xd2\xd3\x00\x00\x00AtEXtC\
-omment\x00CREATOR: \
-gd-jpeg v1.0 (us\
-ing IJG JPEG v62\
-), quality = 90\x0a\
-\xb0EX\x93\x00\x00 \x00IDATx\xda\xd4\xbd\
-y\x98eWU\xfe\xffY{\xefs\xeePsu\xf5\
-<\xa6;\xe9t\xe6\x99!!DB\x18d\xf8\x09\x8a\
- \x11DAPD\xf1\xab\x06\x14d\x08D\x94\xd9\x88\
-\x8cA@A\x04\xc2\x8c\xc8\x1c !\x03\x99\xe7tw\
-\x92\x9e\xe7\x9a\xa7;\x9e\xb3\xf7\xfa\xfd\xb1\xcf\xad\xaa\x0e\
-\x1d\xe8F@\xad\xe7\xa9\xa7\xaa\xab\xaa\xef=g\xaf\xbd\
-\xd6z\xd7\xbb\xde\xb5\x0f\xfc\x92?T\xa1\xa5\x981\xb5\
-\x02\xb0\x7f\x99\xf2\xf1\x17(\xba|\x9f(\x0fI\xb7\x8e\
-J\xd2h\x9a\xbf~\xe9\xb0\x1c\xfa\xfb\x13\xed\xc4t_\
-\xf2\x19]\x92n\xd0U\xb6w\xea/\xed\xf9\xfb_f\
-{\xaf|\xbb\x98\xdf^a\x96>\x98\x19\xa6\xda\x0e\xd5\
-\xf89\xae\xf6\xd9\x9fPy\xe8\xab\xaf7\xff\xf2:\x15\
-T\x05U\x8bj\x826\xad}\xf0_\xcd\xf3\xbe\xb9Y\
-N\xfeh\xbf\xb9\xe0\x87\xa7\x9b\x0f\x1c(\xdb?\x9dr\
-\xf6\xdb\xbe\xe4F\xf7\x94\x93\xb1\x83\x03\xeec\xe1e\xe6\
-M\xafP\xc9\xba\x1a\x5c\xff\xac\xadr\xbc\xde\xce\x0f/\
-i2\xd9\xab\xe2EEQ\x86\xaf\xb9H~#\xf4\x19\
-~\x05\x1f\xc2\xaf\xc0\x22\x97p\x86\xd9\xc1\xdf\xb3M\x9f\
-\x09\xa2\x0a\x99~\x85\x924\xfe\xea\xf5\xf2\xe3?Z\xa3\
-\xd7l\x0cf\xf5\xc8*\xb9\xbe\xf9\xec0\xd3\x0f\xa5)\
-\xa4\xb9\x1a\x0f\xc0\xc6\xfb\xe5\xd4\xad\xab\xed\x16\xeae\xbf\
-e\xac\x8b\xbdSUJK\x1dA\xaa\x94]J\x9a\x18\
-c\x13\x13R\x11\xda^i\xb6<\x99o\x93\xb4k\xb6\
-\xbe3\xf7\x8b\x07\x1a\x95\x93\xd6\xd5V\x9b\xacy\xc3\x1f\
->\xe4\x87>v\x91\x0a\xa2|D\xe1e\x98\xc5{\x0f\
-\x99'\xfbO\xca;\xd7]\xe9\xe5\x0be>v\xc1i\
-\x5c\xbe\xf29@\x95\xc7\xdc\xb5C_v\xe7!^1\
-\xb0\x1d\x1a\x93\xc8\xa5\xd7\xea\xffy\x83\xb8\xa0\xe4l\xb7\
-\xc8z\x05\x02\xc06V\x0a\xecg\x03\xb98,\x13S\
-\x8e\xee\xf7y\xe1M\xd1\x08\x8bU\x8d\x87\xca\xcc\xfd\xdb\
-W\xe5\xad|\x0d\xa1\xba\x94\xdc\xf5B\xa5D\xcb\xf5P\
-\xf7\x15\x1a\xa1L#O\xc8\xb1(`\xc5`\x10\x8c\x06\
-\xca\xa6E\xc5\xb4\xa8\x9a&Nf\xa0\xd5 i\xcf \
-\xf5a[-\xef6'\xaf\xda-Po\xfd\xe1\x9b=\
-\x1f{\xab\xf0I,\xcfF\xcf\xef\xbf;\xdc\xc6\x12\xf3\
-V.\xd1\x9b\x98\x91:\x93\xdc\xcc\x89\xec\xbe\xfc\xb1\xa1\
-\xff-\xff\x8c \xff\xc7\x0d\x12\x02\x18\x03\xaa\xcc\x08t\
-}\xfa$\x91\xe1-\x0c\xeb\x12Y\xfa\x97\xc3\xe1u\xd7\
-\x5c.\xffp\xe9\x87x\xd3k\x9e\xc7G~\xeb]\xee\
-\xd0\xbaJ/\x07f\xd6\xb2w\xf4d&\x9bkq\xdd\
-\x15\xda\x95*#\xbe\x97\xd1\xe0\x18\xaf\xa5dA\x09\x08\
-\xde\x04<\x8a\x0f\xa0AH\x8cAE1\x22H0\xb8\
-`\xb1jp%\xa5\xbf\xdab\xb1\xcdX\xe2j\xa4\xcd\
-:\xf9T\x93\x9et;\xab\x07\xeee\xc5\xc0\xce\xbeV\
-s\xfa\x99w|\xc4\xdf\xd1\xf7a>0\xdd\x1b.~\
-\xfc\xdf\xc8\xfd\xaf\xb9\x82\xd2;\xef4\xfb\x14}\xad\xbe\
-!\xdc\xb3\xeb\x0am\xae\x97\xffC!K\x15D\x8el\
-\x0f\xc2\xdc[m\xe3\x83\xf2\x91W<W\xde\xf5\x91\xe5\
-\xdc\xf5\xc9\xdf\x93s\xcf\x7fWw\x9e\x96\xd62\x11N\
-\xe0`\xb6\x89\xa6,\xa1\x91\x96\x19\x0e\x09\xc3\xe3)\xd3\
-9d6\x03\x07b \x0bJ\xdc\xa9\x82\xe6\x82\xf1\x82\
-\x0b\x02\x08\xc1(>\x01L|?Q\xc1b\x01\xc1d\
-\x86\xc4;\xfa\x9ceQ\x7f\x8be6\xa3\xdch`\xcc\
-^V\xda\x07YVz(ax\xd7\xb7\xc7>6\xf1\
-\xee-\xff\xa0\xe7n\xfd(\xcf[\xf2z=\xed\xe5\xa3\
-\xe6\x133\x7f\x15^\xda\xf3n\x10\xd1#\xdc\xe6\xffb\
-\x0fQ\xe5\x95\xfc5\x1f\xe4\x9d\xe4@\x22\xf3?\x7f\xf6\
-\x8e[x\xe17\xb6\xcbe\xe7\xff\x0e\xfb\xcf\xc2q\xe7\
-\x9e.\xf2\xea)\xd4\xf4\x04\xeaz<\xe3~\x09\x87B\
-\xcaX\x06\xb5\xb6\xc1;\xc8\x83'\x98\x00\x80U\x8b\x14\
-Q\xc3;%\x88\x82\x1aL0X\x11T\xc1K \x18\
-\x85 \xd8 \x18\x0c*1P*@\x10\x12u\xb8\xe0\
-H\xd4Rr\x9e\xbe\xb4\xcdR\xf1\xacHG\xa8\xeaV\
-\x12\xd9\xca\x9a\xec~\x96\xad\x9cZ\xf2\xbd7\xb6\x0f\x9d\
-\xf7w\x1a\xbe\xf0r^w\xe0*}\xe7\x1b\xe3\x0dy\
-\x05\xa3\xf0m\xf9c\x9e\xce\x87\xe67\xe3/\xc0R\xee\
-\x17f\x8c\xa6\x02\x98\x0f\xb1D\xde\x00\xac\xf8\xa8\x15\x95\
-\xaf\xfb\x1f=\xf9\xe9\xfa5\xf7\x163u\xfd\x15\x5c\xf6\
-\xaa\xd7\x98\xfd\xfcN\x89\x1b\x0f\x9dA\xb3\xfb\xb14\xba\
-\x97\xb0{x1\xc3\xf52\xd3\xd6\xd3\xc0\xe35\x80\x80\
-f \x22X\x1b\x0dal\x5c\xd0\xd0\x04\xeb\x05c%\
-\xee'\x13\x17[\x0d\x181\xd19:\xab\xa3\x02\xa2\xa8\
-\x80\xfa\xb8\x013<M\xc9\xb0\xc6b1L4-\x87\
-\xa4\xcc\xf6z\x1fC\xd5\xe5\xac[\xb6\x89\xc6\xf8\x05\xec\
-\xd9w\xc3\xf0%W\xdc\xbe\x86\xae\xfa\xfb\xee\xf0\xfe\x1d\
-\x1f\xdcjF\xffL\xfd\xc7n\xfc\x8a0s\xa9\x99\xe9\
-i\xc8\xed\xdc\x18\x8a}\xad\xc8/&\xbf\xfc\xc2<\xe4\
-;\xf7\xbd\x84u\xffy\xb69\xe1u\xaf\xe6\xe2\xf7\x11\
-n8\x03Z\xdf}\x81\x5cr\xc5V\xdb\xfb\x81 _\
-~\xc6=\x86\xfa\xe4\x06\x0e\x8e<\x89f\xd7Zv\xd2\
-\xc5\xbe\x89~\xda&\xd0v9Y\x12P\x04\x9b\x1b\x10\
-Ac\xee!\xe4>.0\x12w\xbb+\xae[\xc0\x18\
-\x83*\xa0Bt$\x05\x15\x14\x13w\xab\x82\xf11d\
-\xa1`\x110\xf1\x9e\x83@\x86\x07\x04\xab\x86T\x13\xca\
-\xc1\xe1\xbceE\xef8\xeb\xcc4\xd5\xc6\xc3\xac]\xf1\
-m\xc9+\xdb.\xfb\xb7\x13\xf2\xd3\xdfvA\xfe\xb2\x89\
-\x97\xd1\x1e\xb80\xa8 \x80\xdc{\xcd\x1fh\xf7E\xdf\
-\xd0\xf5n\xf8\x17\x03\x82~Q\x06y\xca\xa9\xaf\x92\xd1\
-U\xdf\xe1\x05\x1f\xcb\xe5\xe2\xcf;98\x0b\xaf\xbf\xa2\
-W\xbe\xc7\x16\xe4\xd2\x03+\xb8\xef\xe0Y\x8cW\xcea\
-v\xc92v\x8d\xf52\x96\xe5\xd4\xcb\x0d\xb2\xb8\x86\x18\
-\x15\x12\x0c\xd6Z0\x8a\x17\x85\x1c\x9cXr\x14o\xe3\
-\xe5\xda\x92\x85\x1c$\x13L\x06dDo\xb0\xe0)\x96\
-I\x05\x11\xc1\x88\xe0\x13%\x14\xf9$(\x08\x8a\x18A\
-=\x18o\xf0\x16r\xa3\x04\xcd\xf1\xa2\x98$c[s\
-\x90\xa9t\x88U\x03CL5V\xe9\xa2\x89\x1f\xbf\xeb\
-5?\xbeu\x8cKv\x0e\x0dL\xc9\xe4\xb0\xf2\xa9\xa7\
-\xdd\xc9\x03\x7f\xff\x11\xfd\x87\x1b\xffU\xe8\x85NP\xfc\
-_\xe3!\xf7\x0d\xd5y\xdb\xdf\x7fM\xba\xfe\xe0_\xdd\
-\xe3\xec\xad<\xfeU\xa7\xf8S>xm\xca\xcdw\x9d\
-\x81\xac\xbe\x90\xed\xd9\x1av\xb7\x06\x19V\xa8\x996^\
-\x02VL\x0cC(F\xc1\xaaA\x10<J0\x1a\xf3\
-F0\xa8\x134\x8da\xa74k\xf0\xaax\x13P#\
-\xa8\x85 \x06\xc9\x15\x9f\xc5\xado\x130\xd6`\x9c\xc1\
-\xfb\x80\xaa\xa2\x1a\xbdD\x83 \xaaXq$\xe2\xf0\xd6\
-\xe3\xed\xbc\xd1$\x18\xd4*\xce[\xaa\xa1\xc2b\x1bX\
-]\x19amy\x1br\xe8\xbb<~\xe3m=\xfb\xfe\
-2\x7f\xc5\xca\x7f\xb2\xaf\xde\x91\x84?\xb6\xff\x1e\xbe\xb9\
-\xe6y\xe1\x7fU\xc8\x0a\x04\xccg\x84S\x96\xdd-\xf7\
--=\xd3\x1c0\xc8\x8aA\xadp\xff\xbe'\x91\x96.\
-\xe0\x01Y\xc2\xb6\xd1\x0aS\xb6\x8e X\x81V)P\
-\xb2\x09\x92\x0b\xaa\x01-B\x8e\x17\xf0\x1e\xf0\x82u\x16\
-\xac (\xde\x83\xd7@+S\xb2)hO+Y\xcd\
-c5`\xad\xc7\x1b\x08\x1a\xf0A\xc0\x18\xacVq%\
-C\xb5+!))\xb6\xa2Hj\xb1\xa9A\xac\xc5\xe5\
-\x06\x09\xa0F\xf1\x08\xc1\x064/\xee\xc8C\xc9'(\
-\x82&J\x97VX3TgS\xbe\x8bR\xebF\xce\
-[\xf2\xcd\x89\xab\x93\x19^\xe4\xf4\xd4\x1b\xb2\x90N\x10\
-v<[\xfe\x87B\x96\x06\xbe\xf6$\xe1\xd7\xff\xedE\
-\x5c\xb6\xe6\xd3\x5c)\x8a \x84s\x16\xf1\xc3\xe9\xb3D\
-\xd66\x85\x03\xf5\xa5\xdc\xbf\xe7IL\xf5\x9c\xcb\x8e\xda\
-2\xb65[\x84\x9e:\x1a\x0c>\xf3\xe0\x0d\xa5\xdc\x11\
-4\x10\x02H^\xdc\x8d\x18\xd4\x12k\x09#\x04\x0b>\
-\xcfi\x8eB{\xa2Ekv\x8aI?LV\xda\xb3\
-\xfcx\x99\xb9\xf0\xdc\x93\xdb\x1b\xd7W\xcd\x8a\xe5\xdd\xc6\
-\xa5\xa83\x1a$o\xc9\xc3\xbb'\xda\xf7\x1dhe;\
-v\xee\xe9\xbd\xe7\xee\xa9.\xea\xf5U\x94\xdd\x0a\xba\x16\
-\x0fP\x1d\xec\xa5\xd4g\xd1\xc4#!\xe6\x12\x10\xc8\xa2\
-\x07\x99`\xb0\xce\x92\x13\x8de\x12\xc3\xb4\xb6\xb8o\xd8\
-Q/\x9d\xcc\xc6\xae\x01n\xda\xdf;\xf0\xd8\x89\xaf\x93\
-\xf5\x0e\x9f7\xba3\xbc\xb0\xf9n\xfe\xa2\x13\xb1T\x8a\
-/\x8aAP\xb4\x88\xa3\xbf\x04\x83X\xcd\xf0\x88\xf5e\
-pW>\xa8\xff\xf4\xde\xdf\x97g\x9fO\x18\xbfq'\
-\xff4\xb0Nv\x9dp\x92\xe1\xc6\xd1\x0dx\x9e\xc9D\
-r\x12w\x8fW\x18\xb3m\x82UB\x88q^\x10\xd4\
-\x08^\xa3\x17\xa8(!Q4\x08Vb\xdd\xe0\xac%\
-\xd7\xc0\xcc~\xcf\xf4\xd8\x14\x8d\xe6\xfd\xec?\xf4\xc0\xfb\
-?\xf2\xecMg\xacN\xea\xc7\x0f\xf6\x9c\xdc\x97\xb8M\
-\xa95'\x8b\xc8zc]\xe5\xb0\x0b=u\xf1h;\
-\xf7\xdb\x83\x9e2=:1\xb9\xa5\xd4\xd3?\xfd_\xb7\
-\x1f\xb8\xe5M\x9f\xb9{f\xcf\xce\xedK\xe8q\xa7#\
-\xa5\xb5t\xad\xb2\x94\xfa\x0cb\x0c!\x17B\xf0\xa8\x0d\
-H\xe2\x08\xb6\xc85F\xd0\x96\xe23e\xa7\x0dL\x8e\
-/\xe3\xb4\x9e\xa7\xa3\xf9r\x0e\x8e}\xee\xc0o\xdc\xb3\
-5<\xfc\x11\x85\xf7\xcb\xfd\xeb\xa6\xf4TN\x94i\xb6\
-\xd2\x03E\x9c\x94_n\xc8Z\xaa\xbb\xcd\xd3>\xd7f\
-\xf5\xea\x9by\xdb\xf9\x9b8\xb8\xb2\xcd\xd2\xfd\xf7\x85.\
-\xddX\xaa_\xdf\xb3\x89\xda\xc0\x93\xd9gNb[\xab\
-\x9b)\xd7\x06\xabsu\x80\xfc\x84\xb7\x99X\xadX0\
--AZBH\xa1=\x03\x93\xbb[\xd8\xf4:\xee\x99\
-\xb9\xe1K\x9f<\xf7\xc4\x0bO\xe8\x7f\xde\xa2\xbe\x9e\xe7\
-\xa8\xaa\x18#\xbd\x8fv\xe9\xaa\xaa\x22\x8f,\x08\x94\x10\
-tbrjf\xf3\xceq\xff\x95s\x8e\xff\xe1\xa7x\
-\xe1\xd2\xb3\xa9\xef{\x06]K\xd7\xd0\xbbB0\xc6\x10\
-\x12%X\xc1\xe4B\xee\xe3\x16\xb7\xc6\xc5]\xef\x95\x12\
-%j\xbeM/\x09\xa7UZ\xac\xd5\xbb\xa8L]}\
-^\xcf\xe6\xbb\xabw-\xd7\xb7\xbdh5/\xda\xda\x94\
-37\xbe[\xbf\xbc\xe2\x95\xcao\xde\xa4\xf2\x81?\xfd\
-\xe5\x19$\xdc\x03\xe2pg\xad\x7f\x87\xbd+}\xad^\
-\xb3\xf8\x95\xed\xd2\xd8W\xcc\xf3\xae\xfc\xa4;\xf8\xeb\xa7\
-\x9f\xc2\xf6\xd639\xe87pOn\x98\xaa\xb6\xe9\x96\
-252\x92\x5c\x10\x0a\x88Z\xbc\xa7\xaa\xd2r\x81\xc4\
-[\xaa!EUh\xd4r\xa6\xc6\x9b2\xb5gG\xba\
-\xf6\xa4o}\xef\xb5\x9bN?{u\xfa\x82j\x9a<\
-\xf5\xd1\x17\xfbhk\xd6\xf9\xff\x9b\xe7y\xed\x81\x87\x0f\
-\xbe\xed\x1fn.\x7f\xeb\xb3\xdf\xbe\xf6q\x84\xe4IT\
-\xd7U(\x0f8\x8c\xb1d\xcd\x8cP\xd4-b\x0d.\
-q\x18g\xc8\xda\x9eTRZd\xf45\xca\x9c\x92\xb6\
-XV\xbe\x9b\xb5\xc9\x7f\xd8\x0d3\x0f\xbc\xeb\xbd\x1b\x9a\
-\xe7}\xf2N\x9d\x5c~\xa6\xee\xbcf\x8d\xfd#\xf6H\
-\x12$\x17\xab\xbf\x1c\x83\xa8\x82\x9f\xc5\xdds\xe3\xab\xf5\
-\xa2uW\xf2\x86\xc6j\x8e\x9fu\xf2[\xcd\xefm\xa2\
-i~\x93\xf1\x9e\xe3\xb9mFiV\x94\xb2\xb1x\xef\
-\xc9\xbcb\xad)\x82\xb5tv,\xaa\x90%J\xd2\xb2\
-\x94CB\xad\x1e\x18;8Nm\xe4\xc7\xdf|\xcfS\
-\x92KN\xea\x7f\xb53\xee\xf4\xff\xae!~\xfa\xfd\x84\
-\xd9\x1b\x0f\xcc\xbc\xf2\xe2+\xb6\x0c\xb7\xf7\x8c>\x95\xc1\
-E'\xd1\xb7\xd4\x81\xb5\x04\x22\x88\xf0\x99\xe2\x9c\xc5\xa5\
-\x96z\xabM\xc5\xa4$.\xa1\xe9=\xe5\xa6\xe1\x8c\xbe\
-\xc0\x9a\xc6}\x18\xf3\xe1\x0d\xbfv\xf1\x96\xc6\xe4\xb6\xb0\
-s \xe8'\xbf\xf1\xdb\xac{\xca\x17y\xb2\x93p,\
-\x00\xec\x98\x0d\xf2\xcd\xe7\xfd\xad<\xf1\x8bo\x92\xe3\xee\
-\xdf\xc2\xf1\x8b\xdegn\xfe\xf1\x0bN\x0c\xa5M\xcf`\
-O\xe9\x04\x1e\xacU\x99*\xb5(\xd9\x04\x97\x19\xb2<\
-`\xad!\x13-\x0a\xb8\x85\xfe&$MGV\x0d\xcc\
-4\x834\xb6\x8d\xea\xe4\xe4\xe7\x1e\xfe\xccs.8n\
-Q\xfa\x16cm\xf5\x97e\x88G\x1ay|\xba\xfe\xe9\
-'\xbd\xfd[\x1f\xbe\xe7\xa1\xe4B\xa8>\x91\xc5\xeb\x1c\
-IOB\x00Z\x8d\x0c\x13\xc0%\x0e\xcd!\xf7\x9e\xc4\
-%\xa85\xb45\xa7\xa7]\xe2\xf4\x9e:C\xed\xdb\xa8\
-\xef\xfa\x94y\xfe\xde\x87VmyF\xd8uR\x0f\xd7\
-\x0d\xdd\xe3/\x1a=\xe3\x98\xe0\xb0\xf9\xa9\xab\x0f\xfc\xfe\
-\xc7\xc3\xbc\xf5\x04v\x7f\xf1\x90.\xff\xea\xbd\x8c\xec]\
-\x9a\xdc\xb4\xf3M\xcbCz\xfc\x93\x99\xe9:\x91\x07j\
-U&L\x8b.)C&\xd4\xdaY\xac\xb8\xadE\x0b\
-FV\x95\xd8D\x0a\x06U\x83)C}<g|\xcb\
->\xbd;|\xf8\xe1O_r\xf1\x86%\x95w\xfd\xb2\
-\x8d\x11\xefe\xfe\xb5\xfb\xbb\xcb\x97\xde\xfa\x96g\xfdK\
-\xe5\xf8s\xbe\xc0l\xfdk\x8cni\xd3\x9c\x8c;H\
-\xc4\x10T\xf0*\xb4\x92@\xc9\x96\xc1\x1b\xda!\x83 \
-\xd4M\xe0\xbe\xe9\x01\x9a\xddgSZ\xf5\x9b\xe1\xbe\xa7\
-\xad\xd8\xbd\xda\xa7\xff\x5c\xf9ax\xe2\xe8&\xb2#\xd4\
-\x8b\x97\xeb\xcfc\x10@4\x97\x91\x97\xbc\x0aEQ\x82\
-\xe8\xc1\xb7r\xd3\xe7\xff\xc5m<\xeeRC{\xbc\xc2\
-\x9e\xfc\x89\xb4\xfaN\xe5\xfe\xf1Ar\xf5TmJ;\
-x\xb2\x100b\xf0\x06Z6\x8f\xa6t\x11B\x8a\x9a\
-HX8\xc3l\x02\xb5\xdd\xd3,\xab\x7fu\xf2\xde'\
-\xbfn\xc3\xb2\xc5\x7f\xa7Z$\x1a\x91_>\xd7]x\
-\x8a1\x864IO\x9c}\xdb\xd2\x07\xaf\xf9\xa7'4\
-\xc8\xda?`\xfa\xe0,\xed\xbab\xc4b\x9d\x8b\x14\x8b\
-\xb3\xb1\x884`\xbc#\x95\x84\xd48\xea\xb6\xcd\x03#\
-\xab\x90\xee'\xb2y\xfc\xa9|m8\xf9\xc7;\xfe\xd1\
-}\xee\xf2\x92M\x0a\xe8\xab\xe7^/\xb7\x8cw\xc9\x9f\
-(\xd2\xf3s\x19$\xc4*\xadg\xf3\xe3\x05\x90o\x9d\
-%\xf2\xd2\x97\xe4r\xd3o\xaf\xd1{wlu\xb8\xda\
-\xf9\xb8\xeayl\xce{\x99\xac6\xc9B,\xde4\x80\
-\x88\x01k#7\xd5\x16\xc4\x1b\x82\x18,\x09\xa2\x96<\
-(\xe4VjwOc\x17]=\xfaO\xcf{qO\
-\x9a\xfc\xde\xaf\xd2\x10\x8f\xf0\x14\x89\x86\xb1\xfa\xa4\x13\xfa\
-?\xf8\xa6\x97\x9c~'3S\xb7Q;\xa4$\x92\xe2\
-\x5c\x19\x1f\xc06\x5cD\x86\x05\xc5\x13\x0c\xe4&`\x10\
-\xc6\xcbu\xeek.\xa2\x94>\x83\xfe\xecI\xfb\xbf\xfb\
-U\xf3\xda\xcb\x09\xfc\xd9wi\x80\xb0\xf8A\xa6{j\
-\xe6a\x90\xb6>\xfa=\xfe\x84A./\x22\xd4\xc3\xe6\
-1\xdc\xb7,\x0d\xe7|\xec\xc5\x9ad\x98_\xbfc\xd8\
-\x9cy\xd5[\xeds\x9e\xf6\x04i\xe77\x9c\x86\x0e>\
-\x9e\xfd\xd9 \xa35\x08Ai%\x9e EH\xd2\xf9\
-<\xe1\xbdAU0\xc6\xe2sE\x8c\xc1\x99D\xc6\xb7\
-\xd5\xf5\xda\x89\xab&\xfe\xed\xfcW-\xeaq\x7fl\xac\
-\xa5\xe3\x1d\xff\x13\x1f\x1d\xc3\x00\xa5\xcb\x9e\xba\xf2/V\
-\x9ez\xf2\x17\xa9\x1d\xd8\xc1\xccX\xa0\xd5\xceH]\x09\
-\x11\x1bie\xb1\x80E\x82\x05\x0cy\x1a\xc8D\x18\xcb\
--\xdbu1\xae\xeb7['>|\xc6qCW\x99\
-\x9e\x9e\xcf\x98\xaa\xc7\x94\xbf\xf2\x12s\xdeSn\x0e\xff\
-\xb9\xe4\x90\xbe\xce<\xfa}\xfe\xa4A\x0c\xbc<\xc0u\
-\xdcjO\x19\xfag9\xe3\x0e$w\x98\xa5\xfb\xdf\xc8\
-\x8a\xbf\xc6~\xe0\xc5\x7f>D\xdas\x113CK\xd8\
-\x99\x97\xf1\x1a\x98\xd6&\x95\xb4\x12\xdb\xa8b\xb0b1\
-\x98\xd8Q2\x82\x11\x833\x16\x1f\x02h@g\xd0\xbd\
-S\xdf\x19}\xf0\xf9o\xe8/\xcb\xf3\x7f\xd5a\xeag\
-\xd9\xa6\xa7Z~\xe6\xf6\xb7\xae\xfa2'\x9c\xfda\xa6\
-\x0e\x8e\xa3\x99\xc5\x99X@Z\x13Y\x041\xf1\xfeD\
-\x0c%S\xa6M\x83\x96\xc9\xd9\xe9{\xa8\xf5\x9d\x80o\
-\xfe\xe6\x0dW=k\xe8\xff}\xfb\x1b\xf6\xa2{\x9f(\
-\xadD\xcc\xd4\xc3\x8f\x91td\xb1@\xed\xd8B\xd6\x9f\
-\x0b\xfc%\xc0\xaf\x07\xb6\xaf\x86\xe5\xbb~+|\xee\xf4\
-\xbb\xe5\xb5\xf6\xd6\xa4V)=\x16\xb3r9\xf7\x8c\x0f\
-1\xdd\xdd\xa2e<&X\xcaI\x82\x88A\xb0\x88\xb1\
-\x18cq\xc6\x92\x18\x1b+\xf4vt\xf5f]\xa9\xed\
-\xdf\xf7\xa6\xd7>\xa65\xd8\xe5~\xed\xbf[[\xfc2\
-<EU5MK\xc7\xef\xf9\x9b%\xcffJ>\x87\
-\xafy|;\x1a \x18\x03\xb6\xe8\xb7\x88!`\x91\xdc\
-Q\xca+\xb4BN\xb3\x9cs\xf7\xf8\x22\xcc\xd0I\xb9\
-\x1b\xbd\xf8\x8a\xdf\xff^\xf9\xaf^\xf5#\xfb\xa6\x03&\
-\x94\xbb&\xe1\xdc\xeb\x14\xfe0\xe1Q.\xfd\x88\x06\xf9\
-!\xf0T\x80\x9b\x96\xf3\xc6\xbf\xbb\x997\x7f\xe6\x07f\
-b\xec\xd5v\xc7\xef._Ce\xf0\x1c6\xcf.e\
-\xda\xe48ud\xa2tK\x99<\x8b\xfd\x0c\x15\x89\xa8\
-\xaa\xd3\xbf\x10\x01c\xd1\xb6b\x9c\xa16\x9e\x0f\x0e\xc8\
-m\xaf}\xe6\xaa\xe7\x03\xbd?\x8f1\x16zT\xd6n\
-12>zo\x80k\xf6\xec\xd9\xbdevf\xfa\xc0\
-/\xca(\xab\x06\xcbo\xfa\xc8\xdfn\xecg\xfa\xd0]\
-\xb4\x1b\xbe\xf0\x88\x18\xae\xb4\xf8^\xc4\xd0\xc2\x93H\x09\
-K\x82\x0b\x8eC\xa6\xce\xe6\xfaj\xca\x8b~\x8d\xc7/\
-\xd9x\xc3\xaew\xc9\xba[po{\xdb[\xe1\xfe\xd3\
-IP\xcf\xf01pY\x7f*0\xa9\x84\xd6\x0d\xcf\x97\
-\x91\xb5o\x96\x07wL\xb8\xab\xd7\x0d8\xc2\xc8\x994\
-\x96\xadd\xacQ!u\x81\xbc-\xa4&\x0a\x0dB\xdb\
-\xe3lR0\xa8\x05\xc9\xa6EWO\x80L\x90\x92!\
-\x84\xb1\xeb\xdf\xfe\xd4\xa1.\xc7o\xff\x9c]b\x15\x11\
-\x19\x1b\x1b\x9d\xdd75\xfb\x99\xcf\xde[\xbf\xf6\xb3\xd7\
-o\xcf\xda\xd6\x0c\xd2n$=\x95Rs\xc3\xba\x8dc\
-\xbf\xbe\xbe9\xf8\xe4\x93\x16\x9d\xbeq\xd9\xf2W\x1ac\
-\xdc\xb1zb\xf1\xb7\xfa\xbb\x8f_\xf6\x87o\xf8\xc4\x8f\
-?:\x92\xad8\x1d'\xdd\xf1\x9e4R\xf5j\xe2=\
-z\x1bh\xd86]Ti\x87\x80\xba&\x07|\x95\xd5\
-\xeetd\xecq\xef{\xee\xefn\xbbd\xf3k\xea\xd7\
-\xbd\xc0\xf0\x8f\x8d\x01\xf9\x83\xcf\xbe)\x5c\xf5B9\xa2\
-\x0e\xe1Q/P?d\xe5\xb2\xabo\xe5\x9f>qu\
-R~\xdc;\xcc\xec\xdb\xb6\xadgQ\xf8\x13\x1e\xee\x19\
-dW\xd3\xa2\xa2`d\xaeW\x1d\x10\x08Zt\xe4\x0a\
-\xcf3\x8a5\x96<\x0f\x18\x11\x9a\xc3\xb6\x1a\xa6\xae\xaa\
-}\xe2I_?\xd6\x05\x8a\x86\x88\xb5\xe5m\xb5\xec5\
-\xe7\xbd\xfe\xee\xcd\x8c\xd4\x9e\x86)\x9d@\xb9\xb7\x848\
-p\xdea04\xf3\x8c\xc6\xd4\x04\xa9\xfb\xd1\xab\x7fo\
-\xd3\xb6?\xdfX\x7f\xcb\xfa\xd5+N\x07l\xf1:r\
-\xb4\x9e(\x22\xb2e\x98+Nz\xc5\x7fnd\xf9y\
-\xc7Sj\xa5\xb4\xc5\x93HB\x8b\x8c\x14\x17\x09R\x15\
-\x8c)\xd6\xa1\xd0\x00\x1cW\xf6\xac\x9f\xdcN\xb7{\xe3\
-\xa2\x1f\xbc\xfc\xe1\xeb\x9f\xf5=\xbf\xe9ary\x91\xe6\
-\xa8*\xc6\x1c\x03\xec}e\xae\x1f=\xcd\x98\xfc\x1d\x9b\
-\x0d]7:\xec\xce\x8baI\x89\xe1F\x09\x110F\
-bCG\x0d\x18\x83\x88 6\xf6\xb3\x05\x05S\xc0_\
-\x1f\x7f\xaf8fk;\xbf\x7f\xc5\x85\xeb\x8e5\x81\xc7\
-\x85A<\xec\xfe\xfbo\x1ex\xe3y/\xb9}\x0d\x93\
-\x03\x7fE\xef\xc63\xe8[Y&\xa9\x08\xb6*\xd8n\
-p\xfdPY\x9a\xd0\xbbv\x10\xe3\x9e\xfb\xbe\x8f\xdc\xf1\
-\xd2\x0do\xd8\xfb\xfe[w\x1e\xba\xba(n\x8f\xd5K\
-X\xbf\x84\xf5}\xcb\x06n\xa35\x1eA\x8a\xb51\x8f\
-\x881\xa8\x11b\x92\x94\xd8\xe4*4bj\xe0P\xad\
-\x8a\x1f\x1c`f\xe4\xff\x9b\xe0O\xdc;?\x0e/(\
-\xbd]\xf9,`\x0c\xaf\xd2\x7f>\x0a\x83\x84\xab#\xab\
-;\x86\xf4\xf8\x17\x9a\xd5\x9f\x19\x91\xd9\xdf\x19\xdf\xc8q\
-\x1b\xd6\xb3\xa3\xd6G-\x89{\xcc\x13wC\x90\xe8\x09\
-q\xff\xc6\xd8\xaab0XD\xcd|c\xa0e\xb9w\
-\xe7\x0dg/\xb7\xaf=\x96ng'DM\xd5f\x7f\
-\xf8\xac\x0f?\xf8\xcf\x7f\xfb\xa9\x1d\xa70\xb8\xf4\x14z\
-\xfa\x0c\xa5\xcc\x92hJ\xa9\xa7\x84s\x0e\xb5\xe0\x8d\x82\
-\x15\xd2\xae2=\xebJ,=e\x09\xd5\xc1\x97=\xed\
-\x1fwN\x7f\xed\x8e\xddoVUU=\xb6vk\x0a\
-/8\xed\xe2\xc7\xfd\x88\xc6\xa1\x06*\x11\x9c\xa8\x11\xac\
-\xd8b\x19#\x924\x1as\x0aE\x8f\xa5n\x03\xfb\xf3\
-\x15\x0c\xac97,\xed=\xe1_\xbf\xf5;\x5c\xdd~\
-\xa9\xf9\xf6\x94E\x15> \x7fv\x14\x061\xcf\x07U\
-\x86oyK\xfa\xa7\x8b6\xdb\xec\x9c\x0d)g\xf6\x9e\
-E\xab\xbb\x9f}\xb5\x14g!\x98BG+\x82\x9aH\
--D\x91\x87\xa0A\x8a\x97\x95B[ \x08\x8e\xda\xec\
-\xccG>\xf0\xd4s\x9d\x91U\xaaG\xcf\xb6\x89\xa8\x00\
-{\x1f\xfb\x8e\x83\x1f\xfa\xd6MSOf\xc9\xf2\xd5t\
-K\x19\xd30d\xd6\xd3\x96\x1c\x1aJ\xa2\x09V\x134\
-\x17|#\xe0\x9b\x01\xf5\x02\xb9\xc3\x0e\xd8\x89\xfa\xd2\xd3\
-~\xe3\x8a\xbb\xect\xae7\x8a\xc4B\xf0\x18\x00\x84\xfb\
-\xd2\xb3y1\xb5\xd6\xdd\xe4\xb9\x80\xday\x91E!\x9c\
-\x10#\x85\x18\xc3\x12BQ\xafXeo\xbbD\xa3w\
-\x88\x15\xd5'\xe8\x99\x97\xa6'_v\xae\xddpfH\
-\xee>\xa6J\xfd\xf9'\x08\xb5=L\xdd\x9a\xbaCO\
-<o\x05\x8bV\x1d\xc7\x83\xad>ji\x1b\x93[,\
-\x16k\x1dV\xa2:\xd0\x88\x8b\xde\xa1Q\x9e#\xc1\x11\
-D\x08\xa6@%\x1e\xea\xf5\xe1\x0b7v\x9fB'\xa8\
-\x1d\x9d\x7f\x00\x12\xbe\xb3e\xea?\x1fzp\xdf\x0b\xe8\
-9\xae\x8fv\x97\x87\xc4\x90\xb8\x12\xa6\xec\xc8\xaa0k\
-2\xf0 6\x22:\xf1\x06\x9a\x10Z\x01\xeb\x0c\xad\xd9\
-\x1cI\x8d,=\xee\xb9\xfd/\xf9\xd1\xa7\xc7k\xb5\xef\
-u\x90\xd4Qs^\xb3S\x17\xd0n\xfd\x90v#\xb6\
-\x11\x140\xe2b\x03K\x05\x0d\x96\xa0\x16T\xb0\xc6\x16\
-\x08\xcc1#-\x1e\x1c_J\xff\xea\xd3\xf8\xb5\xf2\xea\
-K{G\xed\x07\x7f\xd4\xc3y}\xc7b\x90\x1f>,\
-\xbc\xab\xce\xe7\xae;\xcf\xea\xeaM+\x99\xad.\xe2\x80\
-\xa4\x18g\xc9}\xe1\xf0\x1aw\x7f \xc2\x5c4.\xb5\
-\x06\x13ed\x08&\x9892\xb1V\xdf\xbf\xa4\xbf\xb4\
-L\x8e\xa9\x85&\xcc\xb4\xfd\x03\xcf}\xf7\xbdSap\
-\xc3\x22\x92&\xb8\xdc\x92W#3\xa0\x0d\xa5\x5cK\xe8\
-1U|\x88\xca\x14S\xb6$\xa5\x94$M1\xa5\x04\
-\xef\x0c\x15[\xa6\x9c\xa5\x9a.\x0b$\xfd\x97\xfe\xfeg\
-\xf7\xfe;\x9a\x1fu\x1eSU]\xbcx\xd1\x99ox\
-\xd5EKi\xb4\x1b\x04\x0f\xbe\xc8\x9f1D\x99\x02P\
-J$#\x8b\xe8\x10\xc9Ia\xb8U\xa5\xd5\xb5\x8e\xd5\
-\xfd\xc7_\x87s\xef\xfd\xd1\xfb$\x0b\xc7\x1b9j\x83\
-\x8c`\x16\xdd\xbc\xc5\xec\xbc\xfc\x89}tu\x9d\xc0\xb8\
-\xe9\xa5\xd1R\xacw\xe4%\x8d\xbb\xbf\x90\xffG\x9d\x88\
-A\x88U\xba1\x12\x0bC\x1b\xc5\x06\xc6:Hd\xe8\
-\xb8\xa4\xd2U\xb2\xc91A\x5c\xc8\xbf\xbd\xb9\xf6\xfdz\
-\xb3{\x03i%\xa5\xad\x1e\x05B\x16P\xaf\xb1\xf8\xb4\
-\x0e\x83\x85\xc4`\xbcE\xda\x86\xa0\x06Mb\xf1\xa63\
-\x81\xb6\x89^E\xa6\x94{\xca\xd7\xff\xf8\xe0Euq\
-\xdf8\xb6\xe4\xae<\xf3\xec\xd2:Z3\xa3\xb8R\x12\
-%F\x1a0\xd6bl\x14N\xe0b\xd2\x8f,L\x0c\
-e\xea\xa1nZL\xfaU$\xbd'\x7f\xef\xe2?\xe8\
-\xa2rUBz\xe8\x88q\xfbH\x06\x912\x98~\x06\
-\x9d\x96O\xef\xc5\x0d.a\x22\xef%O<\xdeD.\
-J\xb5\xb8Y\x04\x0a\xe9N\x04\xe5Q\x81\x0e\xd1\x85E\
-\x1d*\x96\x90\xc9\x05'\x0f\x0e\x96\x9d\xf4\x1fmB\x8f\
-\xc9W\xf3\xdf~\xe9\xf7\xbfKW\xba\x02\x11\x87ZA\
-\x9c\xc3\xe00!\x8a}s\x94v\x1e\x80$\x06C1\
-\x91UN\x0c\xc6Z\x92r\x09\xd7]\xc2U\xca\xb8R\
-\x99\xae\xbe\xeaD\xb3g\xc9\xf5[G\xa7\x8f\xb5\x06*\
-9ibu\x02\xd4\x22y\xa7\xad`\x0a\xc2Q\xe6\xea\
-\xae\xcefU\xa2\x1c)s\xc2D\xbb\x1f-\x1f\x17\x96\
-=\xb5\x87\x1bw\x08\xe33\xe6He\xc7\x91\x0aCq\
-`\x84iKkp\x09\xed\xd2Z\x1a\xa9\xa3\x15r4\
-\x0f\xa4>!\x18\x9d\xd3\xd9B\x01\x7f\xa5#\xe9\x14\x08\
-\x06#\x96\x0e\xab\x99\xfb,q\xe9L\x11\xd7\x8ezW\
-\xce\xd4\xea\x0d\x96\xa5\xa7\x92t%\xa8\x0b\x18\x8d\xf9K\
-)\x8a2\x11\xb0!&Sg\xd0\xbc\x82\xe2@-!\
-KQ\x9f`\xa4\x846\x85,O\xf1\x0a\x16KZ\x19\
-\xbc\xea;\x0f}\xed\x92\x8d\x03\xa3F\xec\xd0\xd1\x86O\
-\xd3\x9e]\x82\xcdf \x07\xb5\x9d\xfe\x8eF}Y\xf1\
-GZ\x18\xa5\xa3\x03s%G\xa6\x81\xc9\x00K\xdb\xa7\
-\xb2t\xf1\xdat\xac~\xb0\x0d6\xea\x8d\x0e\xdf\xa1\xee\
-\x08\x1dDS\x03\xb3k\x03)\xe5\xf2\x1a\xd2\xfe.j\
-\xadh#\x13\xa2Dg\x0e=\x15\xd5\xb8t.\xc8\xc4\
-]\xa2bc\x1dR\xd0'>\x0fiZm\x1e\xeb\x8e\
-\xdc9:\xf6-\xaa\xfd\xeb1V\xc8s\x05\xb5Q\xa3\
-\x9b\x80K\x0d\x1a*\x04_\xc5\xb7\xaa\xd0.\xa3XT\
--\xa8+PO!\xb6\x0e!\x0a\xaf\x9d\x07,Iu\
- \x17\x96\x8b\xd8c\xa2mV\xf6\x96\x9f\x85\x0f\x9f\x8d\
-!\xd9E\x81_\xd4|\xcf\xaf\x85\x16z\xe2x\xe3D\
-O\xb2\xca\xb4\x17L\xf7\x10\xbdc\xa7\x9a\x8d\xcb\xee\xe2\
-\xae\xe9v\x11\xa1\x0ek\xa5\xba#\xc0\x1a\xa3`\xb3K\
-\x8e\xef\xa2bN\xa0\x9e\x94h\xcc\xe48k\xe6`\x9e\
-\x0as=rKQ\xad\x1bA\xad\x80\xb7\xf3B$c\
-0\x85\x12\xc6\xe8B\xe4tT\x0bP]\xbcb\x1fn\
-l\x15b\xa3\x9a0\xad:\x82XB\xbb\x9blb\x10\
-\xa1\x0bI\x5c\xccW\x9d\xd7\x959mT\xf4Z\x05\x97\
-\xc5\xb9\x08\x8c\x22^\xc1\x9a\xe0\x93JP\x8e\xda$\xaa\
-\xaa\xd5J\xa5\x8b<\xaf\x80\xa9`\xabM$\x03\x0dJ\
-d\x10\xa4@\xfa2\x7f!\xc4<c\x83\xa1\xed\x95Z\
-\xb5B\xc5\x9c\xd1<\xe3\xe2\xcfs\xd7\x83\xb5\xc2 \xf9\
-O\xf3\x10[\xfc\x91c\xc9\xc9=\xf4\x0f\x0d\xb1'\x8b\
-]\xc0\xd4%\x84T\xc8\x83G0\xd8B\xe8\x1ce\xc7\
-1\x9f\x88/\xda\xb3\x22X\x13\x0b\xa4\x00\x88q\x9ag\
-iP\xefL\xa7\x96:\x8a\x8fv.\x09\xb6\xd2\x8dI\
-\x1cb\xaaHk\x88<\xeb!\x84\x04\x9b2\x07\x1c@\
-\x91\x8eB-.MQ\xe5F5\x85\xc1\x10\xd9rA\
-\xda\x8ax\xbd{\xeb\x81C\xedl]\xab\x92\xba\xa3\x0e\
-\xa1\xdf\xfc\xc1u?\xa2\x92\xf4\x935\x870&\xc3\xb8\
-\x1a\xc6\xb4\xd0\x90A\x91Gt\x81\xcc\xd7\xe1hK\x8e\
-UKn\x94\xb1\xe08\xa1{-K\xce\xed\x05f\x0a\
-ctBW\x87l\x0a\xa0\xca\xd5\xbbV\xf1\x18V\xc8\
-\x22\xba\x0c\xe9\x90A\xfb\x97\xd13\x940\xd1\xb6\x18g\
-\xc8\x9dF4A\x14)wT\xe7BQ\x1cE\xd2 \
-\xde\xb4\xedpp\xb1X\xb2.94z\xb0\x12T\xfd\
-Q\xa2+\x05e\xcf\xa4\x99@t\x15y\xb6\x9a\xf6\xcc\
-\x1a\xf2|1\xb6T&\xad\x1aLb\x99\x93\xb8/t\
-\xf0\x05\x9f\xaa\x1a=\xd4ApE\xde3Bh\xf9\xe3\
-Ww\x97Rg\x8fI(X\xed\xeb\x9d\xa2b\xcaP\
-\x01\x11Gh\xf7\x13\xdaC\x84|\x001el\x12\x11\
-\x17\x98xU\xb6\xa8\xe0\x83\xc1b\x98\xcc\x1c\xe5\xde*\
-\xfd\x95U,ZlW.\xc5^t.\xc2\xc1OF\
-J\x02\x9dGY\x87\xb66\xccJz\x8d#u\xac\xd8\
-\x98@y)\xa4\x96f\xe6p.\xa1mB\x8c\xdf\x1a\
-\xe5\xfdZ\xb4ec\x95J\x1c\x01\xe84m0\x11u\
-\x15:[W\xa9|\xff\x81\xd6\xc8\xee\xe1\x89\x1dGU\
-\x8c\xc58|\xe09W\xde6KIN\x01\x19\xc0\x96\
-\x12L2\xdf\x89\x94N\x89\xa9\xf1SEQ\xa3E\xf3\
-h\xbe\x89\xe4]\xa7%\xad\x98L\xc1\x09\xedVm\xc5\
-\xe2\xca\x885\xc7\xc6\xfc/^\xbbq'b\xfb\xe3\xa6\
-\x0e`\x12\x81\xc4a\xe8B\xb3\x01|\xbb\x07\x91$\x0a\
-\xbd\x8d!\x18\x89\xb0X\x0dXC#/A9\xc1\xc8\
-ql\xd8\x98\x0e-\xb3\xc9\x9aA,;Ge\x01\xec\
-\x8d\xdf\xdfwKC\xea\xb4\x99\xb5\xb9!\x95\x84J\x7f\
-7\xb3\xbeL\xc0\x12D\xe3\x8bj\x14)D\x7f4q\
-!\xb4\x00f\x12\xabs5\xa0\xc5\x18\x99:\xb0\x18\xd2\
-\x8a\xc3w\x9du\xed\xb0\xfc0\xa8f\x8f\xd6\x5c\x9a\xfb\
-\x99\x08\xef\xd8\xdb\xfe\xfd\xe6d\xeb\x95t\x0f$1\x88\
-\xfad\xae\xd8:\xcc\x1b\xe6\xac\x18\x0ds\x98\x97\x00>\
-\xf1\x10\x88\xf1>\x8b\xdd\xd7\xfa\xec\xf0SO_4\x09\
-T\x8e\xc5 Y\x08\x09\xad\xc1\xdeB{\x5cHwC\
-\xe4\xce0\x82\x86\x0ay\xa3\x17\x0d\x15\x8cs\xa8\x8d*\
-~uB0\x01o,u[\xa648@\xd7\xa0\xdb\
-9Y\xa6=\x83p\xd1\xfb\xa3\x11z\xa60\xed\x14`\
-\x96\xe1\x09gr\x9a6X\x0c\xcb\xba\x12\xba\xbb\x87\x98\
-%\xc5'\xf1\xcd\xac\xba\x224\x19\xd4\x141\xc9\xc4\x82\
-H\xd5F\xa6\x17A4\x86-\xc4`\xd4\xa1\xde M\
-K\xef\xb2\xb5/}\xcf^\xf7\x9cw~\xf2e\xc0d\
-\xa7JV\x8d%G'N{\x9fOn\x99\xe5\xed\x7f\
-{\xc5\x9d/\xa2\xbcd=j5\x1a\xd6\x09!\x14\xb3\
-\x85E\xe2\xfeY\x9f\x08\x98v\x1ce@\x80.h\xb7\
-\xc2@eb\xd7\xef>f\xf1\xc5\xa8v\x1f\x8bA\x86\
-gsG\xe6\x96a\x04\xc4*\x84(\xfdW\x89\xf0@\
-\x9c`\x9c#\xf8.B\xd6\x83t\xde\xd8F\x12VE\
-\x99mvQ\xae.\xa5RJ\x9a$v\xba\x81\xa1R\
-\x15\xae\x07v\xad\x11Sj\x01\xd4$\x1dk1@n\
-BWb\xe9IS\x96-\xab\xd0 A\x93\x18\xda\x8c\
-\xd8\xb9y\x0c1\x912\x10+s}s\x88\xbc\x95\x11\
-\x8b\xa8\xc5hG\x10 \xe4\x06\xca\xa9\xa5\xda\xfb\xe4\xaf\
-\xdf\x7f\xfa\xd9o\xbe\xe6\xe0\xebv\xcd\xcc\xbcY\xd1\x07\
-D\x10\x11\x11\xdf\xaeom\xc0\x95o\xb9}\xfcu\xa7\
-\xfe\xc5Mk\xbd\x0e=\x17\xdb\x0fY;'8EM\
-\x9c!<Zct\x90V\xd26P\x8a\xeb\xd2ng\
-\x1c\xb8\x7f\xf8\xabo|B\xaf\x81\xb3\x8ev&\xb0\xb3\
-a\xfe\xf2\xeb\xc3\xf7\x92&C Q\x03,\x1d(7\
-\x07\xaa\xa2\xb7H\x22`R|\xbb\x1b\xcd\xca\x18\xdc\x9c\
-\x5c\xb3\xe1S\x06\x16\xf5P-%\xa1\x94\xdaf\x1bC\
-\xbd\x01\x06\x9a\x03\xcd\x02e5\xef\xc1\xe5\xc8(\xa0\x89\
-\x08\x16G\xa5\xd4\xcd\x01\x9f\x12\x5c\x1c\x941\x125I\
-\x9d\xdc\xa0\xc6\xcc\xa1+\xc4\x22a~T\xcc(sm\
-\xa0\xceW\xef\x84\xa4/\xa1\xbbr\xfe[?\xb5w\xd3\
-\x15\x9fjmY\xbe\xd1\xfd\xe3\xd2\xe5k\xa6t\xc6\xd8\
-C\x07\xf6\x0c\x8d\x8e\xcbyY\xdb\xbe\x91\xca\xaa\xc5\x98\
-n\x17\xf1\x87\x8f@\x82,BkY\x10\xb1\x16VO\
-\xf3\x94\xba<\xa2\xac\x12|PB\x16\x98\xd8\x9c?\xe3\
-\xfc\xc5\xdf\xb8pC\xef\xd3#\xab~\xf4\xd4\xc9\xd4\xe4\
-xc\xfb\xe6\xe1eT\xd6&\xa8\x06\x82\x03\xdb\x968\
-f\x1c:\xd7$\xc5\xdbF/6\xd6\xe2\xa9F\xe5\xbf\
-\xc9\xc1A+/\xd1_\xe9%M\x12_NM\xde\x82\
-\x95a\xb9\xec\xbb\x1b1\xe7\x07q\xe7r\x87\xdcv\xef\
-8\x13w,\xa3i\xa6\x0d\xdeX\xd4$\xa4\x89\xc5{\
-\x07.B\xb9N\xd5\xdd\x19'\xe8\xd0\xed\x12\xdc\x1c\xd5\
-\x1eT0\xa1\xa8\xa2\x0b\x08h\x82`\xbc\xa5\xd9\x9d!\
-\x0aUW\xa6\xeb\xa4U\xdaj.\xdf\xbf{\xec9\xfb\
-\xb7\x1dZ\x81\xad$H\x8f`\xd3\x9cj\xf7\x9c\x99Q\
-\x11\x92\xb4@tA1)\xa8\x0fG.\xa3;TA\
-a\x18-\xc0\x1ae\xc17rj\x87Z\x97\x9c\xd7\xbf\
-\xf5\xbf.;\xfd\xf74V\xf3G\xd5\xb1\xect\x18\xeb\
-\xa9\xfb8\xf5\xee\xa7R-\xda\xd3b\x8a&\x9c\x89h\
-\x8e\x85p\xbbX'1`\x9cA=\xf8\xbcL0\x86\
-6J\x9a\xa6\xe4\xe2\xd2\xb1\xba\x19\xe9\xc6H>+\x1c\
-\x02\x0d\x0ew\x13\x8f%\xf9f\xa6\xe3\x0f|\x093\xf0\
-5\xa3\xa1\xdb0k\x04\x9fzl\x9e\xc6\xe6\x93J1\
-\xd0\x1a\x1bN\xda\x19r\x09EC\xa63TY\x18)\
-\x18\x0a\xd21~/\x89\xe0\x9a\x0e\x0dJ\xe6\x026u\
-\xe0\x86H\x17-\xa5<\xb4\x90OKb}\xa7\xa0^\
-Q\x09q\xbaV%\xce\xa9g\xb1\x96\xd0\x9f\xdc\xc2\x14\
-\x01=\xf6\x04m,\x80\x82\xf7dM\xc7\xd4\xce\xdao\
-\x9c\xe5\xb6}\xe6\xcf\xcf99\x02\x90\xa3o\x1f\x17\xfe\
-\x9d\x7f\xec\x81\xd6\x9d\x94+/\xc5\x97b]a\xb3\xe2\
-\x9a\xbc>*zW\xe2x\xb6'`LB\xc0\xe1U\
-I%q\xed`\xd6\xee\xab\xcb\x8e'\xa4\x86\xfd\xd3<\
-\xb9\x06#/\xbc6\xb8\x16\x09\xec\x0d\xd2dJ\xcaZ\
-\x8c\x00\x85\x22\xf6\xab\xb5\x88\xf3tz\x93\x9d\xc6\xd2\x1c\
-\xed\x5c\xcc$\xab-\xc6\xa84^\x86)\x90X0\x11\
-ey\x1f\x8a\xd1f\x8b)\x1b\xf2\xda\x10!\x1b\xc4\xa5\
-r\xd8\xe5w\xea\xdc\xe0\x22%a\xdb\xb1\xd2\xf5V\xb1\
-j\xb0\xde\x14\x7f\xa5?y\xf3\xaeHY(\xc1CV\
-\x13f\xc7\x85\xe1\x837\xbf\xfdU\x9bj\x7f\xfa\xd4\x95\
-\x1b+\xa9\xab\x1c\xb3\xec(\x0a\x11n\xba\xf2S\xdb\xcf\
-\xa7\xb4,\xc5\xda\x02\xe6w\xce/\xd0\xce\x18\xf6\xa3U\
-T\xb1\x16\xa2\xa0\x97|\xb0\x88\x15|0`D\x01\x9b\
-\x1a\x09uH\x7f\xf8\x18\xdc,),\xbbVZ\xb4\xc4\
-\x05\x155j\xe2\x9c\x9e:L\x12\x13x\xac\xde#\xf8\
-\x16\x8d9\x83\x10\x11U\xf4\x86y75\x8f>\x83?\
-\x00\x00\x1fFIDAT*E\x9fYq\x1a\x09F\
-\xd1\x00b\xb1e\x87o\x0e\x12\xda\x8bI\xca\x05+\xdc\
-Q^,\xa8\xb4}\xf0\x18#\xd8\x92\xc56-\xd9\xa4\
-\xa7Q\xcb\x08\xde\x13\xf8\xc9\x06\xac\x00\xd6X4S\xf1\
--Ok\xa6\xa5\xcd\xc6\x8e\x97<\xfd\xb4C\xff\xef\xc2\
-\xf5\xe7\x9fy\xea\xba\xfe\x05\xa2\x85c\xd5\x04\xf1\xad\x07\
-\xf6o\x1b\x9b4\x17\xd3_-<\xb4c\x80p8\xec\
-~\xe4E\x1dv\xa5V0\x1a\x97.\xf7)>7\x81\
-`\xc8\xa3@d\xe4P.\xc3]n\x9e:1\x18r\
-\xa5\xa0\xd6\xbd\x90\xb5\x05-\x03&\xf2\xab\xc6\x18|\xb1\
-\xf3\x0d&\x16\x95V1\xb2\x802\xa0\x83\xcf#\xdb\x19\
-\x0a\x8f\xc3\xba\xd8\xdc\xca\xfb\xf1\xd9\x10\xb6R\x08\xcd\x82\
-\xf2\xc8\x15\x12\x11\xd2`\xc9\x9b01S\x1fH\xa6G\
-\xceZ\xe5\xc7V-\xaa\xecu\xe2Z\xea\x8e\x10\xb2P\
-\xc8\xdbz|_s\xfd\xf9\xa7\xad[\xbeh\xb0\xff\xe0\
-i\xab{V\x03\xe7\x00c\xaaZ0\xf3r\x8c\xe3\x17\
-\xcaT\xa3v\xfb3\xdf\xbfc/\xe5\xd5\x83\x88\xb3\x05\
-\xc3>\x0f\xbf\x8fj\xaa\xc3t\xc4\xd2`\x8c\xc7\xb7\x02\
-\xa8\x04\xc4h\xaeFQ\xcazP\x97\xb7W\xa9[H\
-:\x14+*\x84 h\x13l_\x86\xe4\x15\xc4\x9a\xa2\
-\x09U\xd0\xe7R\x18\xa43\x0dU\x90\x8d\x063\xc7m\
-u\x08\xb7H\xa5\x08\xaa]\xe4\xed!L\xc9\x14\xc6\xe0\
-\xb0\x01\x9e\xc3V\x22\x17\x86w\x8e\xfc\xfe\xe3\xd3m\x97\
-\xff\xee\xa9K\xd7..\x9f\x08\x9c}\x0ck\xb9b>\
-\xda\xb0\xe8\x98\x18\xcd\x85\xc9\x1c\xe4\xe6=\x8d\xfbC\xa3\
-\xff\x12\xba*\xdd\x0b^E\xe6\x98\xa7\xb9\xbe\xc3\xa3(\
-\xd61 ~\xfe\xdf\xd6\xb6\xf1\x99\xce)\x17\x8b^\x96\
-J\x09\x0d\x88Ii\x0bii\xee\xf0\x03\xaf\x1e\xd4\x0b\
-y+\x90\x98V\xd1\xef\x88*\x12\x83\x89\x85\x1f\xb1\xce\
-0E\xea\xee(\xc2\xe7Sy'\x1d\x16\x8d+S\x22\
-k,B\xac\x89Gd\x98\x228i\xbc\xb0\xd8\xef\xd2\
-\xe2\xde\x94\xe1\xdd\xe3\xff\xef9\xcbo\xfb\x97?;\xeb\
-\x9c\xb5\x8b\xcb\xc7\x81v\xfd<\xb2Q\x91\x9f\x9c\x059\
-zc\xa8d\x22w=\xfd-[\xb7S\xed97\xd2\
-\xfd(^\x95P|\xc6\x0aq>\xd7<\xf2S\x8a\xbd\
-G\x91\xdbT!\x91\x06\x1a\xda\x9a{\x02\xb9\xfa\x86\xd5\
-0;E\xde\xbc\x9b'\x8c\xa1np\xa4\x1e\xfe\xe4\x8d\
-\xeb\xcd\x03\xe4r\xdf\xb4\xd50\x90\xc3\xec\xb6\x9cC;\
-\xda\xf4o\x00k-\xb9(m\x9fc\x8c\x8d2\xfc\x02\
-\xdfk\x889C\x0a\x98k\xad%x\x08y\x88\xe7\x7f\
-X\x83M\x0c\xb0\x14k\xab\xf1\xda}\xec\x17tH\xc8\
-\xe0Cq\xac\x92\x85\xa0\xf8\x96?\xa1\xbf~\xf7\xdf=\
-g\xe5\x05&\x8a':~\xfb+\x9b\x17\x11\x11Q\xe4\
-\xae\xf4O7\xff\x0d\xe9\x8a\xcfS\xe9v4\xb3\x0c\xe7\
-\xdc\xe1!\xb6`\x0e\x90#9`\xe7\x98\x8f\x08\x1bM\
-\x81\xfc\xaa6ct\xef\xb4?\xb07\xdfQ\x1a\x90\x81\
-\xfb*\xfa\xd8JC\xfe\xea7\x9f&\xfb\xbf\x1e\xc4\xe0\
-F\xf1T\x11,5\xda\xd1\x0b\xdb\x9921;\xcd\xa2\
-\xb2\xa2yq\xbc\x91\xb11q\x16,\xae\x86\x82v7\
-\x14m\x5c\x03\xc1\xc4]\x8f \xc6a\x13K\xde\xea%\
-ov\xcd\x1f\x08S\x5chDa1\xb8\x9b\xbcsH\
-L \x9b\x9dz\xdeY~\xa9\xa5\xdd\xfb?\xa1\x86\x8f\
-\xef\x19F\xdf~\xcb\xc8\x7f0\xdb\xfcgz\xba\xaad\
-\x04\x924\x1a\xe30O}4t5\xd7=,\xea\x93\
-\x02\xe4\x88\x87\x01\x17\x98i\x8e\xd2j\x06\x92\x14OJ\
-\xbbQ\x22\xb9y\x93\x8cG_2\xf2y\xee\xd7&\xb9\
-6\xc8\x15A\x99\x98\xf5\xec=0AO\x10R\x13s\
-\x86\xb5\x0e1\xf1\xdc\x11\xe9\xf8b\xc7\x1fM,\xe5B\
-\x88\xf3\xe6\xe2\x0c&5 \x15|k\xb0h\xf83'\
- \xeb\x90\xe6*E\xb6\xf5\x91\xeb\xc9E\xc9&F\x9f\
-\xfd\x94sw\x94+]\xbf\xf29\x84B@\x97]y\
-\xfb\xcc\xe5\xaf\xff\xd0\xdeg\xd0\xb5\xfc8\x12g \x95\
-X\x90\xce%\x11}\x04\xcd\x7fx\xe7`\xee\xe7Er\
-1Eh.\xa9\xd2\xd5\x16\x0e\x1e:DmJ\x11\xd5\
-i\xda\xda\x22\xe3\x1d\xd7n\x09_\xe0*u\x9cq\xa6\
-\x8e\x83\xdc\xc4\xde\xf8\x82\xd3M\x8fky\xf6\xef\x1e#\
-\x9f\xc9\xe8.)\xcd`0\xd6\x14'\xf4D\xa1\x98\xa8\
-\x89\xf3\xe5Eo];m\x16c\x22\x08\xb0\x16\xdf\xee\
-\xc1\x96\x22\x1f&\x0a\x12\x8a3G\x98\x87\xb8\xc6\x14\x15\
-\xbfxD\x0c>\x9f\x5c\xbc\xa8w\xef\xff\x841DT\
-\xde\xb3\xbd\xf5\xc2\xcb>\xba\xe3\xc5$+\x1eK\xe2,\
-\x9a\x08F\x8aC\xb2Ll\x84u\xc2\x10\x9d\xaf\x9d\xd6\
--2W\x9c\x88\x08\xf2\x08X\xdcm<\xd4\x9a\x1c\xd8\
-\xb1\x9f\x83\xe3\x19!\xf1\xb0Oo\x00e+\xb0\xf2-\
-\xea\xd8\xb3\xa7\x03s\xa2\xb8\xaa\x1d\x946\x9e\xb1\x87\xc7\
-9\xb0\xafI\xdf\xf19c\xed46vT\xe3\x09m\
-E)b\xe8\xb0\x98\xf2\x08\xca@\x80\x14\xf5U\x8c\x93\
-\xf98[\xb4Z%\x14&\xf1`\xd28\x81\x85Bj\
-\x05W\xd2\xc4\xd1\xfc\x15\x9a\x02\x10\x0d\xeaG\xdf\xbeu\
-\xf6\xb27\x5c\xb9\xefR\xdc\xe0o\xa0\xd5\x166\x80:\
-\xc5\xb7C<#e\xbeY\xbb i\xc8#_l\x1e\
-\x8b\xcd\xf5i\x04\xc9\xa0\xbf\xdcb\xec\xc0$\x07\xb7\x8c\
-\x12\xa6\xc2Ot\xd4\xf6\xef;\xac\x85[\x1c\x03&\x9a\
-\xa0\xda\x9a\xdd\xd5blr\x9c\xbet%4J\xc5\xa8\
-\x9ab\xb4\xe0\xae\xd4\xc4\xe4^\xc0\x5c\xa4\x10\xcaI,\
-&\xf3V\x054\x8a#Tt\xbeW\xd1!\x15\x04L\
-\x1b(\x83&\x8a\x09`EHK\xe5\xd9z\xd6C%\
-\xf9\x95$o\x10<\xfc\xe0\xb1\xef\xbb\xf5\xd3\xb7\xdf[\
-})\xa5%\x17\xe2\xba=bR\xd4(\xb4\x05I#\
-\x81\xa5G\xa8\x9bx\xb4i\x02\x9d\xaf\x1dU\x15\x8b\xd0\
-W\xf2L\xd5\x0e0\xb9\xa3Y\x02\xcd\x10\x0d\xa8BU\
-\xe1\x1b\xc0\xaf\x1d\xa6\xcbR\xe2\xbcY\xc8 \xa4[j\
-u\xf6\xec\x1af\xb0\x15\xc0z|Y\xa3\xc6J4J\
-`l\xa12\x91\xd8C\xd7\x0e\x9fe,\xd6\xa6\xa8\xef\
-\x01[\x94P>\x16\x81\xaa!\x82\xe3\x8250%\x83\
-f\xd1\x18N\x0c\xa6\x150\xbe\xff\x0b\xb7\xed4!\xf8\
-\xd6\xb1\x8a\xa2\x8f\xc5\x1e\x22\x22\xedv\xbeo\x0a>\xba\
-\xe85\xf7\x7f\xed\xf6\xfb\x06\xfe\x9a\x9e\xb5\x17\xd2\xd5S\
-\xc0|_\x8cr\x9b\x0e\xbe\x0b\x1c\x9b\xea2\xd29\x82\
-`=$\xb9\xd2\x9d\xd5\xd9\xb7w'c;\x9bm\x08\
-aN\xf2\xd9Rx\xf9\x11\x85r\xf1\xfc\x02\xf0&\x1b\
-\xcb\x998p\x90|\xa2M\xbfq\xa8\x8f\x12\x9cN\xac\
-T5H(4R\xc5\xbf\xd1\xe2 \x97V\x15\xd1$\
-\xe6\xfd\x0e(\x9f\xe3tB\x81\x07$\xf2B>\x92\x87\
-\xd6\x0a\x92\x18\x5c\xdf\xd0\xe5\x9f\xda\x7fp\x7f\xcb\xff;\
-\xfc\xe2G\xd6\x14\xbc\x0fa\xb6\xde\xcew\xfc\xcem\xe1\
-e\xfd\x7fv_\xdfT\xb3\xf4Nz\x96\xad\x83\xe0\xc9\
-\x9b\x1e\xab\x9dHV\xf0V\x9eH\xa1\x1f\xa1o\xffh\
-\x9f\xaaq\x13\x06\x09(\x81^\x93\xe3'\xa7\x19?\xb4\
-\xdb\xd5\xa7s\x11|\x91uC\xfc\xf2\xd0O\xa8N\xe6\
-t:b\x08]\x03-i>\xfc\xc0\x08\xb3S\x07Y\
-\xd6\xb3\x8cI\x0f\xbes\xb6`\x01s}!{1b\
-\x16\x90\x83\x16\x9fu\xcd\x17E\xc5\xd1\xad\xda\x19\xcb\xeb\
-\x94\x8e\xc5kY)\x8cd\x04S\x86\xd2@\x17K\xf3\
-KW\xbfg\xcfKg.[\x9av\x97\xbb_\xfc\xf3\
-\x85\xa2\xc33v\x96ec8\xb3ko\xe6\xae]\x7f\
-\xf9\xcd\xdfg\xa4\xf7tL\xe3*\xfa\xd6\xad\xc1\xf5A\
-h(\xde\x06\xa8\x18\xc8\xe7d\x0a\x84\x0e\xb5_\x8c\xeb\
-\x1f\xd3G\x0e\xea\x02\xde\x09\x03\x99\xa7=\xb2\x8b-w\
-\x1c\xb4\xa1\x9d\xeb\x82\xa39\x7f\x9a.+\x14\x95\x9b7\
-)9\x9b\xb7L\xb2g\xf7\x01NX}\x12\xe5\xbc\x97\
-Z\xb5\x09>\xf6\xd5U\x0biM'\x89I\xd1#\xd1\
-\x041\x969V^\x0b\xe1\xf5\xdc_\x16H\xa4\x98s\
-\x89\x87\x97\x05$W0\x864\x11\xa4o5\x07\x0f\xbd\
-\xf7q\xef\xd9\xf9/\xdf\xfb\xf35\xf4;\xf3\xc4r\xb9\
-\xba\xf6g\x9cs\xd0\x01723=\xa9\xb6\xab\xe7\xb3\
-\xdb\xf7\xee\x1f9e\xed\xea\x95\xfb}x\xf0\xed\xb7\xec\
-\xdb\xf9\xad\x1bf\x8f{x[\xba\x8et\xd5{\x19\xa8\
-\x1c\x87\xabXr\x93\x13B,`E\x0d\x99\xcf\xb1\xe2\
-\xe6\x14\x88\xb2\xa0#vLeQ\xf1\xf7\xc6\x1a\x12\x15\
-\x86l\x83}\xdbw\xb3\xf9\xf6\x89\x96\xef\xc9139\
-\xbe\xe3!G\xd6eu\x80k\xf0\x81|\xfa\x10M\xba\
-\x0e\xb5\xd8|\xcf\x1eN\x7f\xec~\xba\xc3b\x1a\x95,\
-\x16\x82\xc1D$\x15\x9b\x15s\xf9#\x9eeX\x8e\xd4\
-\x8a\x8dI\x90B\x0adX\x80\xe1e\x9e\x0d\x15\x13\xe9\
-z\xc9\xe7\xc1X\xa9G\xb0}\xa7\xde?>r\xf9\xaa\
-\xb7\xee\xb8\xbdk\xc5\xb2w-=\xb1\xfbn\xdd\xfd\xed\
-\xfc\xb7\x8es\xcb\xceX\xb6l]\x9eg\xf4\xf4\x0f\xb6\
-T\x15\x83\xb8\xd76\xab\xdf\xeai\x0e\x95\xb2\x09\x92\xc9\
-\x91\xfe\x9e\xb1\x03{\xfa\x9b\x07\x1f\x5ci\xf3\xc9r\xde\
-\xd0'\x85R\xcfj\xcaK\x06XjK\x883\xe0\x04\
-/\x8a\xd5b'\x17\xf9\xd5v\xa4L\x12\x0f\x1e\x16\xa3\
-\x0b\xf0\xd31\xd0\xf6E\x89f\x15z[P\xcd\x0f\xb0\
-\xed\x81\x1d\xcc\xecj\x10\x06r|\xdd\x83\x0f\x8f\x94\x93\
-\xca#\x10\x82\x03\xca\x16\xdb5\xc0\xe2\xbe\xd1u\xf5\xe5\
-\xf4\x9c\xbd\x9a7\xbe\xeb\x99\xd4\xd6\x9f\xcb}\xe2\x08%\
-\x1fk\x105s\x9dA\xabQ\x9b%V\x08Y?B\
-\x05\x93\x14M\xa6\x10\x8ay\x89\xf9!G3\xc7\xffx\
-\x0cq\xf6\x9b\xce\xb5\xd9\x22\xf9\xab\xc1%B^\x87\xac\
-\xa1\xe4\xed\x16A\x15\xf5\x19J(\x16l\xdee\x92\xcc\
-\xc6[\xb3\x1aY\x02gq\xce\x91\x94\x04\xd7\x05\x9a\x80\
-\xcfc\xafD\xed\x5c7\x01\xc9\x85\x5c<\xc1\x06\x8cq\
-\xb1\xaf\xe3;\xf5Rd\x13\xe6\x98\x05\x9d?6N\x1e\
-\xe1\x0a\xf3!{\xbec#\x02\xdaV62\xcb\xe2\xdd\
-\xb7\xc8\xbb/\xfb\x0f\xb7\xf3\xbb\x0f\xbb\x03\x83\x87\x1a\x8c\
-O\x11\x07\xd6\x9b\x85`N\x8f\xe4!\x01\xf0AB>\
->\xa8\xbeRs\xad\xc6\xccC\xe3l\xbei\x84\xf3O\
-\x19fG\xed8f\xb5\x15\x8f\xc6\xd3X\xc1\x1bk\x0a\
-\xafS\x04\x17\xc5\xa5.\x026C\xd1{7E\x94\xea\
-\x18C;b\x0c\x83\x04\x85\x5c#\xe7\x95\xc6\xfe\xb4z\
-\xa2\xc2\x10\xb0i\x94\xef\xa8O\xa3\x82E+\xa8\x03\x97\
-@\xb9\x0cIY\xd1\x84\xf9\x82-\x89\x0b\xe8[\x01\xdb\
-\xe1\xcaT\xa0\x15e\xafb\x15ob\xe5l\x8a\xb0\xe4\
-\x9cE]T\xb3\x93u\x04\xe4E\xc3K\xe7e\xaa\xb2\
-\x10\x8f\xca<\xf3@\xd0\x82F\xd2\x02q\xc6k\x0f*\
-T\x82\xb0\xa64\xc2=w\xec\x91=;F\x16O\x0f\
-f\xe3\xa5VnZ\xe2\x0b\xa1[\xf8i9$\xca\x14\
-\x9c\xfa\xde\xa5\xc3\xde=\xb0\xb4\xde(\xcd\x94\xb9\xf9\xba\
-m\x9c\xf9\x8c\xb5\xac]\xbe\x9a\x07\xb3\x04\xef2Tu\
-N\xac\xd6\xe1\xfb\x9189\x84\xd1\xb9\xd0h\xadtN\
-\x06\x9f\xab`\xd1\xa2\x0eqBh\x07L(\xf6\x94\x0a\
-\xf8@\x08\x81\xa4b\xd1&\xd4\x0e*\x93\x07w\xe2\xdc\
-\x8f(\xf5\xee\xa4\x19\xa6\x11W\xa2=\xbc\x9eR\xf6\x04\
-\xca\x03\xc7\xd3\xb7N0\x89\x81\x10b73tvs\
-\x1c\xd0T:tw\xd1\x89,\x1ac\x9dIbQ\xa0\
-\x93gE:\xf3Fh\x87?d\xc1\xb5\x17\xfb\xdf\xcb\
-|y\xa8\xc5\x09eqf$\x22+\xab\x06\x93\xc1\xda\
-r\x83\xf6\xf0A\xee\xb9aK\x98\x98\xaa\xb9ZW\xa3\
-\xbaz<\xcf\x0f\xe0CN\xf8Y\xf3!\x1e\x08\x92\x93\
-\x9f\xdb\xa3:\xe6\xa6\xda\x8b<9[n\xd9\xcb\x8d\xdf\
-\x1da]r\x88\xaePB\x8dCm\xac?\xf0\xf1h\
-U1\xf30\xd8v.\xb6\xe3\x11\xb1\x17\x13\x8f\xa5P\
--\x94C\x0a^q\x89\xc5$\x86\x90\x05h\xe7\x88*\
-Ib\xc8k\x81\x91\x07FL{\xf6\xca\xc1\xd5'\xbe\
-\xf8\xe4\x99\x07\xde}\xe59\x87\xae\xf9\xfe\xef\xda\x91/\
-=wz\xeb7_>t\x03\xd9\xc0\x8b\xa4={\x05\
-{o\xd8N{\xaa]\x0c\x97z|\x96\x91\x96-\xd6\
-\x15BW\x05c\x02\xc6(\xb6\xd8\xf5q\x90\xd6 &\
-\x02w#\xf1w\x88b\x8c\x16_\xe7\xc3k\xdcx\x05\
-\x8b-\x12\xff_\xf1o:g5\x87\xe2\xb5B\xec\x81\
-\xf4\xb4a\x8d\x1b\xe5\x8ekwq\xe7u\xdb\x177g\
-\xb3\xfd=\x87\xda\xa7\xacG\xf2\x9c\x8c\xf98\xfdS\xc7\
-\x11\x82\xb5\xf81hI\xcf\x90\xeb\x9a\xf6\xad\xf1\xc9\xdd\
-5\xbd\xf3G\x9b9\xe7\xa25\xac\x5c\xbb\x94\x86/\x11\
-lVxF\xf4\x10c\x0d\x9a\x9b8\x91\xd0\xa1P\xe6\
-\x88\x84\xa2\xb9\xa5:\x7f\x83\x08!\xf7\x98\x8a\x8b\x8d\x98\
-\x5c1\xce\x22FiN\xe4\x8c?\xbc\xf5\xf8\xd5=W\
-\xfe\xc3c\xa7w^rF\xfa\xb7\xfd\x83\x7f\xf8\x8c\xc3\
-T\x84\xed\xe6\xae\xe9\xb77o\xbfvO\xf2\xa9g\x7f\
-\xec\xeeW3\xfe\xe0\x9b\x19X\x7f.]C\x06\x9f\x85\
-Bd\xdd9\x1e\xd4\x1cF\x85\xdb\x02P\x06\x89\x15\xb4\
-\x9a8g>7Q\xa127(`\x160$fA\
-7\xdfJ\xa4\x92\xf4\x11UC$2\x04\xdb\x10V\x96\
-\x9b\xccl\x1f\xe6\xe6k\xeft\xbb\x1e\x9c)\x87\x81\xa6\
-_^\xcdG{\xf7eN\xc4\xe7\xaaaN\xc4\xb4@\
-\xed\xfe\x93\x00\xc1!\x07N?)I7\xab\xa9\xe4\x92\
-L/\xf6e\x0e\x8d\x07\x96l\xe8f\xc3\xf1\x83L7\
-\x07\xc8]\xac\xd6M0\x18c\x11'D!m\x8a\x95\
-\x18\x06L\xe1\xc6f\x01\xc3c\x8a\x1b3DU\x88s\
-66\xde\x82\xc1\x95\x85\xd0\x0cL\xed\xdeJc\xf0\xaf\
-\xb7\xbeq\xcd3O[\xdesN\xb5w\xf0\xb7\x16\x96\
-\x16\xaa\xaa\xd6%\xfd\xa5J\xf9\xa4\x0d\x8b\xdd\x13^~\
-\xe1\x12\xfd\xc7\x0f\xef\xfe\x07Yb\xce\xa3\xd4\xbd\x02\x97\
-\x98\xa2\xbe\x8d\xc4\xa0\x11\x99k\x80\x999\x9a\xe7\xb0\x8e\
-]1\x8a:\xffC!\xce\xe2\xb3 UtF\xbc\x99\
-\xe3\xb4\xcc\xdc\xff1\x1d!H\x0aF\x0d\xdd-\xcf\xba\
-p\x80\xfb\xae\xbb\x99/\x7f\xe2v5\xb5\x99v\xb3{\
-&\xb3\xd5\xfa\xa8M\xeaa\xb4\xd6*`\xaf\xfe\xac\x91\
-6\x0d\xed>e\xc7\xe3\xdbK\xfb\xb6g\xb6\xfb`\xd3\
-\xd4l\xc3M\xee\x9e\xe2\xfao>Dm\xfb^\x96\xe8\
-,\xa5V\x82`c[,H\x14=\xcc\x1d\x86?\x7f\
-\x83RP\xc1\x9d\xf3\x1dD%\xb2\xa6\x22$\xd6\xc6\x1d\
-\x98+F\xe3\xce\xad\x0dO0\xdd\xfc\xd8'_\xd4^\
-6\xd4S}I\xa9g\xf1\x0b\xe3\x11\xef\xf3U\xfb\xbc\
-\x0cU\xd5\x1a\xb3jUO\xf9U\xc3_x\xfce:\
-<\xfbnf\x0e\xec\xc5\xa0$V\xa2\x16\xa08\xc8 \
-B\xef\xe2l\xde\x85\xe1\xb4\xa3\xdd\x17\xe6\x0c&\x0b\x1a\
-N\xd2\xe1\xdd\xe6\xc0H,hua=%\xcc\xe7\xc9\
- \xa4uX\x96\xcd\xd2\xd8\xb1\x93\x1b\xfe\xeb\xfe\xca\xc4\
-\xceY\xd5\xdeFce\xab\xbdRw\xb6\x1es\xfbS\
-2\xd3\xeeS\x8e\xd0\xfb5G\xaeh\x5cX\x7f\xffT\
-{\xd3\x19hui\xcb\xdb\xb1\xfalE|\x9b\xcd?\
-:\xc0\xe6[\x0f\xb1\xaa\xbc\x87\x9e\x00\x89\xda\xa2\x0e)\
-\x18\xd0\x8e\xdb/h7\xcf\xa3\xabx\xf4\x84\xe9\x8c\xc3\
-\xa1q\x08H4\x8a\xe04\x10Z\x9e\xd6\xe4\xc3\x7f\xf2\
-\xd4\xd2\xdeK/8\xe1\xbd\x1a\xd5\x09\xe6\xd1\xda\xb0\x0b\
-\x0d3\xd4\x95>\xf7\x9a7\x9f9D}\xf4\x1e4\xf3\
-\x18\x07\xd6\xc4&\xb3-z\x12\xc6\x04\xac\x89\xf9\x222\
-\x0cE\x1e\x01\x0c!J7Ld\x0fLQ\x14\x9a\x05\
-\xad\x1f#\xf3\x1aU;'\xeb(lg\xe3\xf2\xda\x0c\
-z\x1b\xca\x1a\xb7\x8b\x87~\xbc\x8b\xfb\xae\xdb\xd7\x97j\
-\xbb2C\xb3\xb4\xb4\x91\xad]\xeb\xc3_\xe8\xd9!\x90\
-\x86#\x19\xe4\x08!\xcb\x22\xd4\x98`\x8b\xec\xdc\x8d\x8e\
-\x8c\xa1\x81\xe0\xdam\x1c\x8dYa|\xa2\xc5\xba\x15C\
-l:\xb5\xcaDc1-\x93G^Jl\xa1\xefM\
-\xa2\x84\xa7\xb3\x13\x8bdn\xa4c$)4+\xf1a\
-,\x92\x80\x0d\xf1l\x90\xac\xd5\xae$\xf5\x1f|\xefO\
-N>\xb7d\xddYG/f\x8b[zY5\xc8g\
-\xf6\xb4\xf6L6\xcd\xa9\x98\xd4,\x18\xe6g\x8e%\xe8\
-@\xdd\xce\xf7\xf1\x18\x10\x99\xa7t\xe6\xd8\x84\x8e\xa4\xe9\
-p\x88\x1b\xcf\x87\x97\xf9\xca]\x22\xdf%\x80\x0f\x81j\
-K8\xaf\xeb \xbb\xaf\xdd\xc6\xc7?\xfc}v\xde\x7f\
-\xa8\xe6\x99\xce\xb41\xed\x0f\xf9\x99\xe1\x11\x1a\x9f\xf3?\
-n\xc1\x84\xb7$\xaa\x8f\x00ZG\xf0\x10O\xc4\x7f\xea\
-\xbd'/\x8a\x96&P\x07\x9a\xc9\x96\x9b\x0e\xf1\xc5\xcf\
-\xdeC}\xfb0\xeb\xba\xc6\xe8\x0a\xddT\xa5\x82\xe6E\
-\x98\xb2\xd1\x8d\x8b\xf1\xed\xb9\xe1\xd0\xa8X\xd1\xc2k\x22\
-JQ\x1b\xb0\xa1\x08\x11i\x806+\x87\xfcnm\xb6\
-\xd6\xfe\x1c\xadW\x93hx\xdcY\x8b\x9b\xa3\xe0}\xec\
-\xd7t\xda\xddR\x80\x89\x0e\xb7\xb6 /\x80`T\x1f\
-\x91c4rY\x12\x1f\x12`\x8a\x98+\x05P\x90B\
-\xed\xde\x91\x92\xe2\x95\x80R\x0a\x96\x93\xbbk\xcc\xee\xde\
-\xc7\x97\xbft3{\xef\x18%>Y\xa5\x0e\xb4\x08\xe4\
-\xad69LGF$\xd6<G1\xa7~8\x95\xd2\
-\x02\xda\x85QfKUm\x9a\x837\xed\xe7\xbb_|\
-\x80\xee\xd1}\xac '\x88\x92\x97\xf2bV\x9d\xb9\x18\
-\x5c(\x86\xe6\xf7\x9dt`o\x11\xdb-\xc5 i\x84\
-\x8e&p\xfe\x09\x95zW\xb5\xeb\x9ccU\x99\xa8\xaa\
-&\xa5\xf2\xe0\x05k\xbaf (\xd6\xd9\x18\xae\x0ar\
-\xb3\x03$\x0e\x0bA\xa60\x16\xf3\x86\xa3\xa3\x9dY\x90\
-H\x8cD\xcdr\xacE\xa2`!n\xbc\xf9\xc6[\xa2\
-\x86\xd5\x9a\xb1h\xfc\x10\xdf\xf9\xea\x1d\xe9\xf7\xbf\xf8P\
-\x1f\xf5\xb9\x8d\x5c|\xb6\x8f4y{,\x06\xe9xH\
-\xab\xf3\xa2\xb3R\xaei\xad1+_\xfc\xd4]\xfc\xf8\
-+\x9bY\xd9\xd8\xc3@3\xc1\x86\x14W\x88\xad;I\
-\xb2\x93\xe9\xa2\x01:\xa8k\xbe\xedk\xc2\x82{\x8a\x07\
-\xecl\x1f\x9b\x09>o\xef>V\x81\x83\xc4S$t\
-\xa4\xd1LH\x5c\x0c7\x06E\x8a\xc9\xe1\xf9\xf7\x95\x22\
-\xaf\xcc\xffN:\xe1\x94\xc3\x94=s\xd7\x8b\x16=\x1c\
-\x95\xc3\xf8,\xdb\xc9\x95\x0a\x03\xcd\xc0\xba\xc6An\xf8\
-\xcf\xdb\xf9\xfa\xa7\xee\xcc{M+\xcc\xd8i\xa0Q|\
-\xb6\x0b\x1a \x7f$\xa1\xf8\xb3\xe6\xd4\x1f9\xb0\xe7\x8b\
-\x17j\x00\xaeT\xab\x94\x93\x99\xd6d\x83\x87\x95\xcf\x7f\
-\xe2\x1e\xbfj\xc9\x10'<\xdd\x90\xd76PKC1\
-\xe4Y\xf0D\xc5\x88\xb0\x14a\xa1\xd3U\x8c\x0bQ\x80\
-\x16[ //\xf8\xb2\x1ch\xf5\xaf\xb4.\xdd\x87\xea\
-\x9ac}\xa6S\x1e\xfc\x83\xd7\x8d%=\xa4I\x82-\
-<,Nt\xe9\x5c\xde\x08st\x94,P\xf2\xc8\x5c\
-xRb}\xd2iO/\x14e\x98\xb9\xd9\x13\x8d\x1e\
-\xa3\xe0s\xe8i\x0b\x1b\x93=l\xbb\xe6~\xfe\xe3C\
-7\xe3\x0e\xd4d4\xcc\xb4\xe8\xa9\xc1d\x87\xaf\xca~\
-\x96w\xfc,\x0faA%\xd9\xf1\x92VW\x98\xaa5\
-\x97T\x9a~\xb0\xb7\xe5w\xdd;\xc2\xd5W\xdf\xce\xfe\
-{\xf7qR\xefnJ\x14\xfcP\x881\xd8\x14\xfd\x0e\
-)\xde\xca\x98y\xf4\x85\x80\x0b\xf30\xd2*\x98\x92\x1c\
-\x1a\x09\x9b\x9a0q\xec\x0f\xd8R\xb0\xc9\xfe\xad#\xe9\
-z\x92R2\x97\x17l'\x97\x88\x22\x12\x0a\x0f(\x10\
-R\xa7s9\xd74\x8b\xbf\x9b\xf3`\x89\xc2\x86\x08H\
-t\xae\x9e1s\x11])\xabrV\xdf!F\xef\xdf\
-\xc3\x17\xae\xbe\xcd\xed\xbck\x84\xac5\xed\x16\xd9\xe6q\
-\xcc6$n\xe4V\xb1\x86?\xd3 G;\xa3<\xb7\
-:\x8dE\xd6\x86Y+\xe9\x8c\x13\xe7k&\xd9\xb5\xaf\
-\x9e\xfb\x96\xb0\xa2\xc7\xb0fu7\xd3\xed.B\xc5\x80\
-\x8d\x9d2S4x\xe2<h\x81\xf9\xb58\xb6&\x89\
-\x903\x0e\xbe\x08\xc1\x84v{F\xdf\xf6\xc3o\x7f\xe0\
-/\xceYwr9M\x87~\x96Z}\x81\xb0\xad\xf6\
-\xc5\xdd\xb3_\xff\xe4]\xf5\xd3\xa9,]\x157F\xd1\
-\x120\xc5\xeaw\x1aMsCO\x9d\xa3\xfa\xe6\x92\xbf\
-\xcc\xedC\xb5\x1a\x1f\xf2b\x98{|\x92\x164\x0c.\
-\xea\x04\x92Y\xcf)f\x9c\x89\x9b\xb6\xf2\xf5O\xdf^\
-\xfd\xf6\x97\x1f\x10m\xce\xe4\xb5\xeaT\xcfl}\xd2\x97\
-\xf3\xd9\xd9\x9cz\x11\xae~a\x069\x8c\xa2\xb7\xed\xc0\
-`\xd6/\x0d\x93\x18\xbf\xa4\x9d:\x99\xb5\xf9\xccl\x83\
-\xbcmX\xb7\xc2\xb1le\x85z\xe8\x22\xf7\x06\x17\x8a\
-\xa1\x95P\x9c\x02\xa1\xf1 \x01k\xe2\xe3!\xac\x97h\
-4\x01k\x04\xe7\x0ch\xd7\xcaEK\xca\xa5t\xe4\x13\
-\x8f]\xbe\xf8d#\xb2\xe8\xd1\x8c\xd2\xf9y\xd6n\xfb\
-{\xc4\xbe\xee)\x1f\xdf]\xa2:\xf8\x1c\xd2\x92[@\
-b\xca\xdc3\x0dU\xf4'&\xact\xa1!:\x83\xff\
-\xb6\x03@L\xcc\x89Q\xa9@\xaey|j\x82\x17\xba\
-=lJ'im~\x88/\xfd\xfb\xedr\xf3w\xb6\
-Xwp\xb6\xdd\xe3fK\x8d\xfe\xa9Z\x7f\x98\x99]\
-\xdf\xd3`\xb8\xde8\xdapu,\x1e2g\x98\xa1!\
-L\x7f\xb3OZ$\xd2Z\x94\xd9\xa4\xdcJ\xfaF\xc6\
-\xbc}p\xc7L{r\xb8\xce\xba\x95\x09\x1bVUi\
-\xb4\xbbhX\x8d\x04_Q \x9aP\xd0&\x05R1\
-y\xcc\x8ab\xc1\xaa\xe0DH\xcan\xa6\x11V~\xe7\
-`\xb6\xbf\xef\xdc\xea{\x1eO\xf2\x02\x11I\x8ed\x14\
-\x11\x91Zmv\xea\xc6\xc4\xfc\xde\x05\x1f\xdc\xbc\x88\xae\
-%\x97Q\x1e\xec\xc2\x14\x83=\xf34Q\xe7\xb8\x8b\x05\
-\xdd\xa3\x85\xa4!z\xd8\x8c\x87\x16$\xa8)\xd8\xdf@\
-\x1c\xb9\xb6\xc6\x122\x18\xc8\xe0\xb4\xf2\x18\x07n\xdbl\
-\xfe\xe5\xbd\xd7\xf7}\xffk\x0f\x99p`\xba\xb9\xca6\
-4s\x93gM/\x9b9\xc1\xe7\xb5F:\xd1\xacM\
-\x85Va\x8c_\xb8AH\x1c\xac8\x13[\xb33,\
-\x1d\xef\xd6\xc6L\xa6u\x9b\x925!\xcdrZ\xcd]\
-\x19\xbb\xb6\xcf\xb2\xbc\xa7\xc4\xc9\x9b\x1c\x0d\xe9\xa6U\xec\
-\xb8\x98$\x0aXiLD9\x85\xa2C\x0c\x18\x0f\xa6\
-\x15\x0f!KJ\x8e\xa6\x9e\xf2\x9d\xeb\xa7\x06\xfe3m\
-\xfe\xcd\xf3\xfb\xe4\x94J\x9a.\x7f\xa4N\x7f\xba\xed?\
-\xfb{S\xe5\xbf~\xfd\xbf>\xf0\x1c\xec\xe2\x97\xd3\xb3\
-\xa8\x8f !\x9e(Q\x18Z\xc4\x14\xa1\xa9s\x9e\xd5\
-\x02\x15\xa8\xc8<\x11*\x0bF\x81B\xf1\xbbB\xc2\xa4\
-\xc5Ci\xac7\x0ch\xce\xc9\xc9>\xb6}{\x07\x9f\
-{\xff\x8f\xcd\x8f\xbf\xb5=\xcbk\xd3\xadry\x96\xd9\
-d\xa2{\x22\x99\x82\xd9\x99\xe5\xc7\x8d7O\xeb\x0e\xad\
-\xcd\xe3\xb4C\x98o@\x1dK8\xfa\x99\x1fN0g\
-\x9d\x99&;\x8f\x0b\xe5\xd2\xad>]\xb3gM\xf7\xed\
-\xfd\xa5\xbeV\xbf\x19t\xbb\x0eT\xbb\xdcT\xdft\xb7\
-\xe9\xd6\xe3/Z\xc3\xf3_\xf1\x18\xce}\xda\x89\xec7\
-K\x18/\xa5\xe4\x22\xa8\x8bF\xb1^\xb0\xc5\x09\x0b\xc6\
-w\xd4\x7f\x01\xdb\x8a=\x12\xe3bXk\xb4rZ{\
-\xb7\x91&\xff\xc6\xf0\x9e;O\x5c\xd5\xea\xfd\xbb_?\
-\xff\x82\x0c\x97^\xfa\x9e\xaf~\x9dM\x17n\xa2\xd9x\
-\x11]\x8bN\xa2\xd2S\x22\xcf=A\xe2\x11RA\xb5\
-\xa8< \x14\x02\xef \xf3\xfd\x8dP\x08\x18(N\x14\
-\x8dO\x04UB(\x9e\x1b\xe2\xe2Q\x86xA2\xc1\
-\xe5\xcaPh\xb1\x22?\xc0\xed\xdf}\x98/\x7f\xfcV\
-\xf6\xdd\xb4\xaf<1;\x1dj\xe5\xc9\x5c\xba&7j\
-\xd7L7\xb3\xd3\xb7\xbdhQ\x8b\xc7I\xe3\xec\x1fm\
-\xado\xfd\x12Y-{t\x98\xfb\xdf\xf2\x90\xa5l\xd2\
-k\x0e~E>yf\xc6\xf0\x13F\xdd\xf1[\x0f\xe8\
-\xd4L;\xd4\xaa\xb9\x0e\xb4\xa7L\xd5\x89\x9d\xb1K-\
-\x93{[\xa5\x87n\x1b\xf3!o\xb1q\xad\xa5\x7f\xd0\
-\xe0\x9be\x02&.vQ b\x14\x9b\xc7p%I\
-T<\xba\x02\x00\x90+N\x94J\xff\x10&y2]\
-C\xcf\x1e\xd3e\x8f\xfb\xfcC3\xab\xbf\xb85\x1c\xc7\
-\xd0\x86\x17\x93\xb8g\xd1\xdd\xbf\x82\xb4\xe2 \x04<\x81\
-\xc4\xbaH\x7f\x13%F\x1dv`n>A\x0e\x1f\xcc\
-\xd4\x0e\xe16\xaf\xbb\x8c\xdeac\xde\xb0-C_\xdb\
-\xb3\xba<F\xe9\xc0n~\xf0\xef\xf7&W_y\x9b\
-\xdb\xf2\xe0\x013Y\x9a\xaa\xd8\xc6l\xaf\xf5\xd33}\
-\xe9\x8c\xebk\xd5\xce\xaeL5\xa7\x1eWoV\x9a\xbf\
-\x96\xfd\xd9U\x7f\x91}\xcf\xdf\xeb3&\x8f~\xd3\x1f\
-\x8bA\x0e\xb0\x85\x9b\xe8\x0a\xad;\xf7d\x8c\xd4\xea\x0f\
-\x91\xe73~:\xb0\x7fJg\x1dZ/\x09\xa69\xe9\
-\xa5\xd5\xca\xc2\xccd\xc6\xe7>\xdc`\xeb\x1d\xc3\xfc\xc6\
-\xab\x1e\xc7\xfa\xb3f\x98\x94U\x8c\xb4R2\x13\x90\xa0\
-\xb8\xe2<\xc9`c\x87\xcd2/\xb71nn\x0e\x81\
-\xb4[)\x85^Tzp\xdd&*\x0a\x17\x80\xf6\xce\
-sI\x12q\xc5h\x99\xce\xa3z] R\xe8\x1c\xd7\
-%\x11d(\xf1\xb9\xb9\xc1\x15\xedW\x0dx\xef\x09\xb9\
-\x90\x87@\xc5\xa7\xac49\xfdf/\x0f\xddt\x88\xaf\
-\xbf\xff6\xee\xbbeo8\xb0g,m\xbb\xd9\x9c\xd2\
-\xcc\x8c2\xdd\x0aa\x9a\xfa\xcc\xf4h\xc9\xd4o7\xbe\
-Q\xfd~\xbd\x9d=pk6\x14\xfe\xd6\xd7\xd9ql\
-\x14\xd0\xb1\xfc\xf1+\xf8\x08W\xf1Gs\x03\xe0@B\
-\x9c\xca/a\xe8.u\xd3'3\xb6[\x95\xde\x96\xd3\
-.\xba\xaa}\xb8R\x8f\xac:u\xb1>\xfd\xb9\xa7\xf0\
-\xe4\xe7\xac\xc7._\xc1\xbe\xd0K\xbbl\xe3s\x03M\
-T|\x98\x10yMI\x98C6f\x01\x93Z\xc8\xb7\
-\x90\xd0\x99O{d\xc5T\x88\x0dT\x8b\x87S\x86\xd8\
-\xdf.\xf2D\x98k\xe3\xca\xdc\xf0VP\xc82_\x14\
-\x1c\xc5\xb1\x85\x01\xac\x05\xd7\xf2\xacq\x13\xc8\xfeC|\
-\xff\xab\xdb\xe4\x1b_\xb8O\x0f\xdc=F\x96\xcf0\xd3\
-\x9cJ=5`\xaa\x9d\xca\x0cy\x98&h\xadS\xab\
-\x15\xa8*\x00\xfar>\xccG\xf9\xe3_\x8eA\x8e4\
-jYxYI\x1ceJ\xd2U\xae\xd9.\x85\xde\x9c\
-\xd0\x9d;z1\xa6{\x85\xcb{\x0et-\xab\xe8c\
-\x9e\xb1\x9eK\x9ey\x1c'=n\x1d:\xb4\x98\xc9\xa4\
-J\xcdG\x0d\xad\xd1\x10\xbb\xa1\xc6\xcc\xd1\x11\x1d9\xce\
-\xfc\xf9:?\xed\x19\xf3:\x07\xa0\xb4\x98q\xecH\xdb\
-\xb4H\xd6\xdaQ\x8e\xa8\x10$>\xde5\x0f>\x9eT\
-a,\xe2\xa1,m\xfa|\x8d\xf2\xf8\x18\x9bo\xd9\xc9\
-7\xbf\xf20\xb7|}\xc7\x90\x8e6G\x1bf\x06/\
-\xb3.\xd7i\x87\x99\x15\x98nTt\x96v\xa8\xe3\xb5\
-y,\x05\xe0/$\x87\xfc\x14zE\xb1&\x90&\x1a\
-Zy(\xe1\xa2.#\xa8:/\xc1\xfa~\xad\xdbv\
-\xf8\xff\xdb;\x9f\x1f7\x92*\x8e\x7f^Uuu\xb7\
-=\x1e\xcfL\x12%a\x13)\x08r\x88@b\xb5 \
-\x10\x08q\xe2\xdf\xe4\xcc\x99\x0b\x07N\x80\x96\xe5\xc7!\
-\x87E\xb0KD\x96e\x13\xc8$\x93\x99\x1d\x8f\xedn\
-w\xfd\xe4\xd0v\xd2\xb1\x12\x16)!3+mIO\
-.\xcb\x17w}\xfb\xd5\xfb\xfd\x1eG\x7f\x9f\xcb\x9f~\
-\x7f\xc8\xe1\x83\x13\xf6B\xe4\x9d]\xc5\xfe\x8eC+K\
-\xa2\xe8\x9d\x93\x9b\x97d\xd3\x8f@\xd6\xc6\xe4\xc6\x1e\x18\
-\x04Z\x9eY\xd7\xcf,qy\xde\x83m\xe3N\x8f\x83\
-l\x11\xe9\x87E>\x8bD\xe4\xbee\x88E1\x15\xc7\
-\xb5|L\xfd\xf8)\xf7\x7f}\x8f_\xfe\xfcC~\xf1\
-\xb3\xbf\xf0\xf1\x07\xffb\xb5\x9a\xaf\x5c5\x17\x17\xceL\
-\xcag\x06ufP\xf3\x15a\x9e\xc7ECH-)\
-\xbb!g\xbc\xce[\xfe\xdaEG\xfd\xbdS\x150-\
-\xe0\xb1\x05F\x13\xec8\x92&N\xc7I\x8eW\xea,\
-\xdd\x8e\x1a\xcdw(R\x1d\xd8\xab\xd9\xbf=\xe1\xfb\xef\
-\xde\xe2\x87?\xb9\xc5w~\xfc\x0e\xd5\x8d]N\xa99\
-\x0b\x15Qzi\x22E_5\xb9\xa9-\xd1}\xb6\xc2\
-Z\x0e\xe4\xadj\xa5\xb5U\xcd\xa0\x09\xa5@&=\xeb\
-\xc2\x8d\xac\xc1\xc8}y@\x11\x13\xbb\xc6q \x0b\xda\
-\x07'|\xf8\xbbG\xfc\xe1\xb7\x0f\xf8\xe0\xee'\xf8\xcf\
-Z\x89\xc7\xcb\xb2IK\xbf,\x17\xd1\xee4\xb8\x93\xe5\
-\x08\xbd\xd0\xa8\xf9\x1c\xb7\x5c{r7@\xbc6\x18o\
-\x0a\x905\xab]\xd2\x05?5+~e0\xb3\x8a\x9c\
-\xca\xaab,0Q\x9a\xf1jY\x8d\x0eb5^\xaa\
-\xc5\xa8\xadse\x1b\xca\xa0\x94\x8d\x97nN\xf8\xf6{\
-\xd7\xf9\xde\x0fn\xf0\xde\x8f.s\xed\x9bW\x90\xfa\x80\
-\x15%]\xb6D\xbb\x1eN,/\xc6\xb7ek\xba\xc0\
-\xa0\xa1\xc6Z\xd0\xaf\xa7\x88n\xb2*sFb\xc2\xc4\
-\x8cM\x8e*\xb7\xa8\xf9\x8c\x93O\x8f\xf8\xe3\xfbO\xf8\
-\xcd\xfb\x9f\xf2\xd7\xbb\x8f\xa4y\xd2\xea\x1c\xbc\xd2t\xd3\
-h\xba&\xa9\xe5r\x1c\x9a\xebEh\x8f\xe62\x0b9\
-/\x10iP\xd2\xe1\xd3\xaaB\x07O\x0a\x91\xff\xad9\
-\xdb[\x03\xe4\x16\xdf\x92\x9a;\xfa#\xee)\xae\x7fR\
-\xa8\xceY\x9d\x5c\x99\x03#3f$\x8f\xeb:Q\x8e\
-=]mU;\x8e\x15#\x1ae\xbd\xd1%;\xa6B\
-\xd5\x96k\xb7\xf7\xb9\xf3\xee\x15\xee|\xf7\x80\x1b\xdf8\
-\xe0\xca\xd5=&\x97\x0e\xb0\xd3\x8a\x5ci\x02\x059\x1b\
-\xb2(\xa2\xe8\xbe\x89\xf3F\xcbb\xd8\xe1<\xa3SD\
-rB\x111\xc9#\xce\x13f-\xb3\xa3\xcf9z\xfc\
-9\x0f\xee\x9f\xf0\xb7\xbb\xa7\xdc\xff\xf31\x0f\xee\x1ds\
-6k\x95\xc7\x19\x8cK;\xceM\x97\xbams\xb5l\
-D/\x0b\xb3l\xa7\xd3\xb8:\x9e\xabE.L\x83Q\
-\x1d\x95q\x1c.\xfcm\x0e\x92#\xc6\x7f2\xbbX\xe3\
-\xbb\xb7<\xc8\x9b\x5c\xcd^\x0b\x13j2U_\x9d\xc3\
-hC\x05j\xe4I%\x22\x16k*\xb4.0\xda\xb2\
-\xb7_s\xf9k;L\xaf\xd6\x5c\xfe\xfa\x98\xab7/\
-q\xf3\xc6.W\xafV\xd4{{T#\xc3\xceTS\
-\x96\x05\x85\xd2h\xd5_S)\xf7B\xbas\x9e\xc5i\
-`\xd5D\x9a\xd3\x13\x8e\x9et\xfc\xfba\xc3\xd3\x87'\
-<\xfa\xc7\x19\x87\x9f\x9dqr\xd8\xb2\x9c\xad\xf0\xd1\x13\
-|GH]\x91\x95\x17d\xe5\x88\xcd\xfa:j\xd7\xe9\
-\x9e\x1b\x8fm;\xd0\xa2\x06\xe5\x04o\xb0\xe8\xf4\xffU\
-\xcc:\x00\xc5\xac\x81\xb1k@\xea5\xbd\xb8\xd7\xaaD\
-\xb0\x88X1\xc9\xa2U\x91\xa3V\x04\x0dvl9\x98\
-\xd6\xecM*<\x99\xd1\xaeew2fTWX\xad\
-\xd1k\x1d,\xe5\x84O\x91e\xd3r\xb6hh\xe6\x8e\
-\x1d\xa38\x9eu\xea\xe1\xd3\x85\xf1K\xef\x8a\x98\x18\xa3\
-H\xe2X%G\xca\x1d\x22\x8e\x98:R^\x0d\x02J\
-\xdb\xfba\x80)\xbe\x8e&u\x1e\x80\xbc\x8a[\x9e\xdb\
--\xcf\xa9\x06j\xe9\xf7\x95FlMY&\x8c\xeeh\
-\x8d!\x1bC6\x9d\xca\xe2\x0b4\xb9\x94>\xbc\xa8\x04\
-\x97\xb3\x22\xa0\xf0k\x0fT!\x09-\x14z\xdd=!\
-D\x95\x1c:\xe1\xb5\x90\x03*\xc6\xa8\xc2\x1eu\xf48\
-\xbf\xa0\xeb\xc3\xd3B\x87\xd5\x0e%-HK\xebW\x03\
-\x9b\xa2\x1b\x08\xed\xf8\xb2l\xc3/\x13 CnQ\x03\
-`\xec\xc6~\xd9\x90BJ\x8b.!\x97F\xa7\xd2Y\
-l\x1cU\xa5J\xa9P\xcbN\x12\xa2\x93\xa0uRJ\
-4*g\x91\xacz\xef\x9f\xa8>\x917\xa7u\xdeZ\
-\x92$\x92s\x0e):\x93s\x91\x88E\x22DM\xf4\
-E\x11\x94\x22\xe4.t\xb1\xcb\x9b\xd0j\x87\x12\x87\xa2\
-C\xe8\xf0ycO\xb8- \xd2\x9b\xbe\xa2\xce\x03\x90\
-!\xb7l\xc8\x0c\xc8\x0e@*\x00\xab(\xacHU \
-\xc9N\xb3\xb5{\xb9.\xcfp\xea\x14\xafb\x7f\xd6:\
-\xd1a\xd1j\x13\xa3\x1d\x04@\x93#&\xc1\x92\xc5\xa4\
-\xcb\xd92\xc6$G\xf2G\xaaY\x85\x82`|\xf6E\
-\x8a\xae\xa5\x1d\x1e\xbc;\xa0\x0e\x1a\xe5\x8eX\xfaA>\
-\xc1[\x01\xe2<\x00\xd96F\x872F3-\x0b\xb4\
-*\x08I\xef/\xb2-\x92.f\xa65\x1a1\xe4l\
-\x9a\x12MY\xdaz\xd6\x89Bt\x14T\xb6Yy\xa4\
-\x1f\x04\x07\xe8\x9c\xd0\x99\xac\xbc\xf4\xf3\xe1R\x8e\xcdD\
-E\xdd\xa4\xb0\x9f$9\xc9~\xa5\x08\xd1+/Z\x87\
-\x90\xbc#\x13\x00\x7f@\x1d'\x94\xb1D\x85{\x9c\x84\
-\xc1\xb5\x14\xdf\xe6\xe1\x9c\xe7 G5\xb8\xce^P\x02\
-\xd6\x9d\x98u\xde\x80\xb5!\x11\xdd\x17\x97>\xe34\xf9\
-\x82\x14\xa6>\x8e\x9es\x14$\xe6\xdeV\x88[\x829\
-liLim\xe1\xa4\xf38\x94\x0b1Ys\xe0\xac\
-\x1c\xd2P\xee\x0c\xe5\x90l}\xbe*9#m\xed\x87\
-\xc51\xf1%raX\xc8\x7f\xae\x87q\xd1\x96\xde\xca\
-\x88\xd1[\xa0\xc9\x16\xfdw\x1f\xdb\xb0K\xc5\xf3\xfd\xd0\
-\xc5\x11/\xd2\xc3_D@\xb69g\xfb\xbb\xbc\xe27\
-\xb6\xde\xee\x97\x15\x90o\xffv!\x1f\xfa\xcb\xba\xbe\xe8\
-\xbfg\xbeZ_\xad\xd7]\xff\x012\xe3\x87zd@\
-\xd4\xf5\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x01\x05\xb5\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\xbe\x00\x00\x00\xef\x08\x06\x00\x00\x00L\xa6n\xcf\
-\x00\x00\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\
-\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\
-\x00\x9a\x9c\x18\x00\x00\x00\x07tIME\x07\xde\x02\x1b\
-\x0d\x10\x17\xd8\xf1P\xc4\x00\x00\x00AtEXtC\
-omment\x00CREATOR: \
-gd-jpeg v1.0 (us\
-ing IJG JPEG v62\
-), quality = 90\x0a\
-\xb0EX\x93\x00\x00 \x00IDATx\xda\x9c\xbd\
-w\xb8dU\x95\xfe\xffYk\xefs\xaan\xecp\xbb\
-\x9b\xee\x06\x9a\x9c\x9a\x9c\x150\x81`\xc0\x84\x11\xc11\
-+\x98\x03fF\xc50?\xc3\xe8\xe88\x8ec\x1c\x15\
-\xe3\xe0\x8c\x0a\xea\x98\x15G\x10Q\x92HP\xb0\x81\xc6\
-\x06:\xd3}cU\x9d\xb3\xf7\xfa\xfdqN\xd5\xad{\
-\xa9\xc4\xf7>O=U\xb7\xc2\x89k\xaf\xbd\xd6\xbb\xde\
-\xf5n\x01\x12\x8a?c\xe1\x9f\xb4\xbd/m\xcf\xdd\xbe\
-\xbb\xf8=\x03\xb4\xedu\xf3\xf7\x02\xc4\xf2\xb3\xc5\xbf\xe9\
-\xb6\xdf\xc5\xfbh?\x96^\xc7 8\x18z\xe7\x87\x9d\
-\x1eu8\xa3\xdf\x7f{\xb8`\xfa6\xd9\xf9\x80\xb7\xff\
-8\xf6&\x99\xa8\x8f\xca\xa3\xbe\xfa\xe9\xb8\xebU\x1f\xd3\
-c^5\xe6/\xff\xd9\xda\xecs\xffv\x197\xedu\
-\xad\xfb\xe9y\x1b\xf4\x8d+/\xab\x1c\x90\xee\x1e\x19\x1b\
-\xd9=\x9c/\x0b\x95$#\x1d\xdf\xcex\x0cH0\xa2\
-\x8e35)\xcc\xe5\x8d\xa5Y\xb6\xbd:=\xb7)\xd6\
-\x7f\xb6I\xe7>=\xbe-\xdf\xf3WO\xe2\xe9\xb7\xbe\
-^\x7f\xf2\xf6'\xb2\xf1\xfbo\x8b\xaf>\xea2\xa9\xfa\
-\xed|\xec\xf0\xbde\xe3\xaf\xcf1\xf9\xf1\xb7c\xa8\xff\
-\xad\xd3yt\xba\xde\xed\xe7\xd7\xe97t\xb8.\xdd\xb6\
-M\x87\xfb(\x03\xec\x9f>\xef\xf5\xda\x1f\x1d\xeee\xb7\
-\xe3\xb2\x87y|\xd6\xe1\xf3n\xf6\xb0\xe0`\x92\x016\
-\xd8\xeb`\xac\xc3Nz\xee\xb4\xcb\xc9\xf4z_\xfal\
-+\xb6\x0d\xaa\x05\xfbP\x84'\x1d`Llx\xa2\x1d\
-\xca\xf9|\xfb#\xaf\x93\xec\xb1\xbb\xbc}\xf4Y\xe1u\
-\xff\xf3\x8f\xb6\xf9Ug\xb9\xaf\x8ed\xf9\xbd\x1f{0\
-\xdc\xf9\xbd#\x96\xd4\xd2[\x0f[\xd5`\xff$\xe3\x80\
-<\xb2.5\xf6\xd1\xc8\xea\x903.\xe0\xa3\xc7\x09\xa8\
-\x19\x84@\x0c\x91<\xf1L\xcd$\xdc\xeb\x03\x9b\x87g\
-\xd8\xf4\xc0\x94l\x9c\x9e\xd6['\xf7\x0b7\x9f\xf1\x9e\
-\xd7\xce\x1cs\xe1\xef*7\x8d~-\x9e\xfe\xde\xfb\xe3\
-\xf7v|Q>x\xc1e\xf2\xad\xab,l\xba\xb5\xaf\
-qu\xbb.\xdd>\xebv\x0f{9\xaaA\x8d\xbe\xd3\
-~\xb5\xbc\xf6\xf40\x5c\x19\xc0\xb8e\xc0\x01\xd7\xee<\
-C\xf9\xacm\xf7\x7f\xf1v\xdb\xbfo\x8b/\x80\xef\xe0\
-}c\x9b\xb7\xa6\x8f!\xb6{\x22\x16m\xcb\xba|O\
-\x07\xb8\x89\xdd>\xef\xe7\xf1\xdb\x8fQR\xa7\xbc\xe1\xe4\
-(\xd7\xbe~\x85\xfca\xe8\xe5\xf2\xe4\xf7\x5c`\xef\xdf\
-.\xf2\x8e\xfb\xde\x9fO\xd4\xbe\x93\xbc\xaf2%\xf12\
-\x0e\x1b\x82gU\x02\xc7i\x85%\xc1\xb1<\x81!\x17\
-\x09j\xc4hHTD@$\x80\x80\x0a(\x06\x16\x09\
-\x11$\x828P\x1f\xd1<\xa3\x9e\xd5\xd9\xb6k\x92m\
-\xf5\x1a\xffq\xf0\xc5C?\x1d\xfe\x8f\xb7\xc8\xdc5'\
-\xc8\xab\x1e\xf1ty\xc4/N\xb7\xcb\xbe\xb71\xfc\x88\
-\x0d\x83x\xc7^\xceb\x10\xe7\xd3\xcf\x88\xda\xbf\xb3x\
-&~\xb8\x1e\xbf\x9ba\xb7\x1bg\xaf\xbf^\xdb\xea\x14\
-A\xf4\x1bH\xdd\xae]\xcb\xf0\xdb\x7f(}6\xbcx\
-\xa3\xed\xdf[l\xf4\xd6\xc1\x13[\x17c\xa6\xcf\xc5\xee\
-\xe5\xc5\xb4\xc3\xb6\x05\x10\xc1\xf3<y\x9f<v\xf4j\
-\xfew\xc9\xb5\x5cq\xe2\xd3\xf8\xf2\xd3\xfe\xab\xfa\xfc\xc7\
-\xcc\xae\x9a\xbd\x9dGL\xcdrn5\xe5\x881\xa1&\
-\x11\x04\x9c\xd4\xa9\xe7F \xa1bJ\xc5\x14\x89\x81\x8c\
-\x9c \x11\xa7\x82C\x101\xa4<K1\x8fHF\xc0\
-0\x14\x17\x15\xa2\x10j\xbb\x99\x99\xad\xf3\xc3\xe1\xc3F\
->\xf9\x98k\xce\x9a\x5c\xf2\xb1\xb7\x86\xe4\xe4\xaf\xcaU\
-s?\x8f\xfc\xdf]6\x801\xb3\xe8z\xea\x00\xb3d\
-\xbf\x1b\xbf\xf8;\xbd\xbc&]\xc2\xa3N\x83t\xf1v\
-:\x85\xbd\xb4\xcd\x12\xdd\x9c\xd7 \xe1\xaetp\xd2\xd6\
-a\x16j\x7f\xbfe\x93M\xc3\xa7Ol\xc8\x80\x9f-\
->\xf1\xc5S\x8dt\x08O\xe8q\x81\xe8\x11\xd7\x0e\x18\
-\x17\x8e\x09\xeb~\x07\x07\xdfo7}\xf9Y\xc3\xcb\xef\
-\x98>|h\x8a\xc7h\x83\xb3*\xca\xba\x8a\xa3\x96)\
-\x96;R\x09\x04\xc0LH\x15\x1c\x81\xa0\x81\xa0\x11\x11\
-\xc5\x03.3r+\xbd=\x82j,\xce$\x89\x90\x0b\
-1\xf38\x94\xc4\x1b\xf8\x9c\x18\x95\xb4\x11\xc8k\xc6\xb5\
-\xb5T>\xb5\xf3\xb4}\xae\xfe\xe5\x9a\x0f\xcb/xc\
-\xfc\x09\x9b\xbbyu\xe9`@\xd2\xc7S\x0e\x12\xca0\
-\xc0\x00\xe9\xf7\xfb^\xd1@\xaf\x01\x17\x179O\xfa\x84\
-$\xfd\xec\xd1\x06\x1c(\x1d\xcf\xbd\x19\xe3[\x9f\xf8\xba\
-\x9b\xc7\xef\xe49\xda\xdf\x8b=\xa6\xddA=~\xc7\xef\
-\xaf\xd9\x0b\x99\xdc\x0e35l\x9f\xbd\x90\xfb\xef\x07\xd9\
-\xc7\xb3\xe7\x5c\xce\xdd\x9bG\x0c\x9c\xac@\xe5\x00&\xe3\
-\xef\xe7\xf6\xd3\xbb\x7f{\xd7\x09#5;o\x18\x8e\xf7\
-\xc6\x12<\x12\x01\x8d\xa0\x8e\xc4\x22\xd1\x02\xd1\x0c-\xcd\
-N\x001\xc3\xb48r\xc1p\x16Q\x033+s\x88\
-\xe2\x0c%\x17\x9c\x16\xbf\x12@-\x12\xc8ixO\x12\
-\x04\x89E\x08\xb4\xbdf\xfc\xd7]g<\xfas\xa7\x9d\
-\xf7\xf6\xe9\x89\xbf\x9em\xf9\x0e\xb5\xdd\xf9\x04T\x12\xc6\
-\xd9a\x8dz]j\x0b\x0d\x7f\x90|i\xb1W\xeb\x17\
-\xa2\xd8\xffcn\xd0m`\xf4\xf3\xf8\xfd\xf2:\xfa\xe4\
-\x02\xbd\xf2\x19:\x84C\xd6g@\x8a+\xbf(\x1dv\
-\xac\x8bB\x89N\xb1|\xfb\xc1\xb5O%\x8bG\xb0.\
-\xf2f\xed\xaf\xa5m[\xdd.\xd4\x82\xef\xbd\x90\x0bx\
-\xde[\xafO\xc7\xd6\x8fp\xcf\x9fW\xf0\xac\xd7L'\
-U\xb7/w=yOw\xf6\xd3\xb6\xca\x9f\x7f\xf8\x22\
-K\xf82\x0f\xbc\xf7\x9bC\xff\xf0\xe1\xc9\xfdw\xdf\xf2\
-\xe0\xdb\x5c\x9dW.\xad\xb2\xaf\x83\x11\xd1\xb6P\xc8\x90\
-\x081F$\x94{h\x1a\xbb\x1a\xe6\x8c`9\x229\
-\x90!I \xb8\x889Z\x03\x02\x04$\x22&(\xe0\
-D1\x81( \xc1\xe3pT|\xa0\xe1S&b\x85\
-c\x86o\xd9\xe8\x9e\xe9\xe2u\xc7\xbc\xee\x16\x1eX\x7f\
-\xb0\x1b\xbe\xea\x9b\x1c0\xf1QY\xf1\xb4\xef\xb9\xe5\xa7\
-n\xd1\xcd\x7flyU\xe9\x11..v&:\xa0#\
-\x91\x01\xf2\x80\xc5\xf7u\xf1\xf6\xa5\xcb,e\x1d\xde\x93\
-\x1e\x03\xd8\x007\x00\x92E\x8fmH\x8f\xdcH\xba\xd8\
-\x9d5C\x1d\x19\x102\xb4>#\xb7[b\xdb+\xd6\
-\xef5e/\xde\x9e8AFO\xc6v\xff\xfe\xdb<\
-\x93\xe7\xc9#V_\xadw%?\xb30\xf2S~\xb3\
-\xe3M\xf1\xd4\x95k\xfdc^\xf5\xfep\xdc\xf1W\xed\
-\xbd\xacQ{je\x9as\xc6\x8c\x09\xef\x09\x99\xe1\xca\
-3l\xd9,\x11\xc4\x90$\x90[\x03o9.\xd6\xd1\
-\xd8 \xc9\x02I\xc8q\x0e\x02\x11\xa1Hr\xa3\x09\x82\
-\x22\xea\x88\xea\x88\xce\x11}B4\x87D\x87DA\xac\
-\x18T\x91\x8c\x06\x0e/\x19u\xaf\xf8\xfa\x10K\xa62\
-Bp\xfc\xc7l\xd5\x7f\xea\xd0M\xff8\xf5\xdek\xfe\
-\xc9]\xf2\xbf\x22O~\xf5\xf3\xe3\x8f\xff\xb2\x05\xbe\xf3\
-\x93\xd8\x07Nf\x00h\x93\x01\xbcu'\xcfj]\x10\
-\xb2AQ;\xe9q\x7f{%\xae\xfd\xf2\x14\xe9\x91;\
-\xf6K\xc6\x1f\xb2\x9f\xc5\x86?H<\xdf+!\xebg\
-\xc8\x83\xdc\x88\xc5\x9f-0\x82\xb1*z\xd17p\xb3\
-w\x1f\xa8\xd9o\x0f\xc9\xb7\xfe\xee\x1a\xab\x9f\xb2S\xff\
-\xe7\xdeW\xc5}n<\xc6\xfeg\xee\x82d\xf5\xd5\x9c\
-=^\xe7\xb9I\xe4\x80\x98\xe0\x14D\x22\x9a;$\x82\
-\x11\xc0\x1b\xe2!\xc4\x0ci\xcc0\x14\xe7Hh\xe0\x5c\
-\x86X@\x10\x02\x06&D\xb1\xe2\xf8\xc40ms\x12\
-QQ@M :D<\xa6UbR!\xcf\x05\x17\
-\x15\xf5\x86D\x873A\xb4N\xcd\x05\xea\xa1\xcaX\xad\
-A^\x87o\xff\xea\xfc\xc7\x5cr\xc9S^\x9bW_\
-\xf0Y\xf7\xfeo]\x1b?\xf9\xa3\x95\xf17\xe1\xeeN\
-1u7\x14F\xfa\xc0\x93\x83\xa0Aqq\xf2\xf70\
-B\x0f\xfa\xcc \x0f\xc7(\x07\x09\xa7\x06Eq\xe8r\
-.\x02\x98+\xa7\x1a\xe9\x03\x13v\x9aRze\xfd\xda\
-g\x1a\xa4GRg\xbd\xc2\x9ee\x13\xf0\xd2U\xb8;\
-~\xfa\x980\xf6\xe2+\xfdQ\xef\xdb\x95|\xfe]\x17\
-\xe6\xef\xdbs\x05_\xba\xeam\xeb\xd2\xabx\xdbR\xe3\
-<*LD\x07\x95@0A\x1a\x1e\x89Ft\x91\x98\
-Fb\x9a\x11\xe7v0^\xdb\xc98\xb3x\xcdP\xcd\
-A\x8d(\x82\x89\x80ik\xb2\x97\xa8`el(E\
-\xc4\xaf\x22X160\x17\x89bH\xccqYF\xe2\
-\x13\xa2\x0aF$\x8f\x81Z\xac0d\x09U\xc9i`\
-\xa0\x0e\xaf\x9e#\xd6\x5c\xb9q\x89\xae\xa9^s\xfcA\
-\xdf\xe7\x1dK^c\x7f\xbb\xfd91<xy?'\
-#}0\x7f\xebr\xbfb\x97\xdfJ\x8f\xfcJ\xfa\x84\
-\xa9\x83\x18j/{\xe9\x94Cj\x0f\x14Q\x1eF\xad\
-H\xbb\x9d\x8fk\x8b\xb1\xfa\xc5T\xd6'\xbe\xa3O\xa6\
-.]\x1e\x83N\x97\x02\xc8\xb0\xa5\xf2\xe2\xdb\x8e\xb7\xef\
-M~M\xae=|;k>qf\xf6\xb3\x93\xef\x1d\
-:\xf8\x1d\x9f{|\xbe\x99\x0f\x8c\xa6\x1cVIH\xc4\
-S\xcd\x8a\xad\x88\x15\x09\xa7\xa5\x81\xa0s\xb8\xda\x83\x8c\
-\xcelg\xc2\xcd\xa1INH\x8ch\x11\x11\x88\x06&\
-\x82\xa8\xe0\x9c\x15\xd8\xbc\x03u\xb1xm\x0aQ\x0b\x0f\
-n\x82\x16A\x0f\xa2\x86a\x98F\x0c\x83\xac\x8eO\x8c\
- ).\x06\xeafDW\x9c\x8d\x99\xc3\xd5\x1dy\x0a\
-Z\x89\x9cp\xc0\xd4\xcd+\x1f\xb1\x8c?\xfe|\xe4\x90\
-\xc6\x8e\xf1\xb5R\xff\xdd\x0f\xbb! \xda\x07t\x90.\
-\xc6\xda\xe9\x9e\xea\x00\xd7\xbf[\x5c\xde)\x8e\xb7.\x03\
-\xc3\xba\xdc\xffAjB\xd6\xe3\xbcl\x91\xa3\x95~\xc6\
-\xde\xfe;\x01\xd2>\xd8\xba\xf4\x98\xd2\xfa\xe1\xd0\x0c\xb8\
-\xdd\xce\xb1\x9e,\xb1\xca\x8a\x19\xa9o\xcbm\x15N&\
-\xc7\x02\x95\x99\xfdyQ\xfc\x0d\xdf\xfe\xc1\xde~\xeb\xc8\
-\x1b\xf3]C\xdf[\xb3k\xf7\xc6\xf3\x97:\xceN\x1c\
-cb\x04\x0f\x04\xc3\xc8\x11\x1c\xe2!\xcf\xa6\x19\xcav\
-1\xc2\x0cU\x9f\x11\x05\x82\x15\xc6\x1a\x11\xd4h\x9ap\
-\x81\xf1\x9a\x80\x94\xee\x5cJc\xb6y(\xcc\xca\x83\x9e\
-\x0fA\x14\xd1@\x94X\xcc0\xa6h\xeep2F\x9a\
-V\x98\x89\xe5\x0d1\x88\xc1\xe3=\x90\x07\xf2\xc4\xe1\x1a\
-[I7\xde\xc6\x8f\x96\x1c\xc2?\xee\xb3c\xcf\xad{\
-~\xee>\xb9o\xcb\x1e\xe6*\xdbe\xe9X\x90\xa1\x07\
-\x97\xda\xa6%\x11vNv\xf3\xe0\xd6cV\xeeW\x95\
-\xed\x05?\xea\xff#\xf4\xd9/\x1c\xb6.hT\xb7\xa2\
-\x95\x0d@\x9d\x91\x1e\xb9\xc8C>s]F\xa9\xf4H\
-F;\xc5\x87\xfd.z?O\xaf\x0f\x85C\xf7\xb1\xd3\
-\xd8\xacw\xdf\xfe\x03\xbfv\xfc~y\xefo>\xc3A\
-o\xfc\x91{\xdf\xfe3z\xed\x9f6q\xfdK\x9e#\
-[\x96~\xf4\xa8\xfa\xee]\x97,\xadpj\xc5S\xd1\
-\xa2\x9c\xa4\x11\x22\x86y\x08IN\x9c\xbb\x9f\xe5\xf9v\
-\xc6\xb4\x81\xf3\x81\xd02\x5cADP\x93\xc2\xe0\xad,\
-l\x101\x17\x08\xa28s\xb8(\xad\xa9\xd1\x9b\xc7E\
-\x0a\xe4'Xi\xe4E\x22\x1b\x80(%\xcc\x89\x14\x1b\
-\x93:\xd1\xe7\xf80\x8e\x13C$\xd0\x10A4\x16\xe7\
-j\xa0\x95Q\xea\xa33\xec7u\x0fG\xbc\xe3\xd0\xda\
-\xef\x0f\x9d\x8a\x8d\xfd\xee\x98\xe6\xaa\xff\xad\xb9\xcf\x0c]\
-\xa5g\x8c\x9f/\xdf\xff\xda\x13<_\xfd}$\x0f\xf4\
-@Pz9\x1f\x1d N\x1e\x04\xed\xe9\xf6\xbd^\xb0\
-\xf7 \xc9\xf0\xa0\xe1\xb4t\x99\x09\xfa%\xfa\x0b\xce\xb5\
-=\xc6\x1f\xe4\xc7t\x98R:\xc1\x91\xd2'\x14\xeaW\
-\xb2f\xfc\xf0\x9a\xa4\x7f|O\xf2\x87W9\xbb\xe7\xb2\
-\x17\xdb\x87\xdep\xb0\xac\xf9\xe7\xef\xd8\xdb\xce\xdfl\x17\
-~\xe1\xcb#\xdf\x98\xbe\xf2Qa\xc6\xde3\x92\xb2J\
-\x04\x93\x8c\xdc\x05b\x14\xc4\x1c\xa6F\x90)\xaaS\x9b\
-X+\xb3$\x89\x110D\x8a\x02\x95\x94F_x\xf8\
-\xe2\x08\x8bg\x03S$OP\x0c\xb3@f\x81<B\
-\x88\x10b $\xe0EpjDU\xd2!\xa5b\x1e\
-\x8f\xc3\xa3xS\xd4\x14\x8bRL\x0f\xf5\x1a\x0d\xafX\
-\x18!\x95\x00\x89\xe0\x0db\x043\xc5\xe5B:4\xce\
-l\xb6\x8d\x83\xe2}q\xbf\xe4\x89\xcb\xae\xfa\xf2\x0f\xfe\
-4\xbd{\xe9.w\xd3\x8d\x17\x84wn\xbbIn\xdf\
-\xf1\x85x\xefu\xc1b\xec\x8b\x91K\x07\x18Zz\xc4\
-\xeb\xddB#\xed\x12\xa7\x0f\x02\x89\x0e\xb2\x9fA\x0ap\
-2\x00\x1c;H^\xf2\x90ch'\xa9I\x0f>\xc5\
- \xc5\x86~\x95\xb5A\xe0\xafVb\xbct\xb5p\xcc\
-\xf7\xf7qo:\xe7\x09\xe6O\xd9\xc8\xd9\xa7~\x97\xd5\
-G~\x5co\x5c\xf1\xc1Q\xbf\xbb~n5p\xeeP\
-BZW\xcc\x83\xd7\x1a\xf5\xba\xa2\x89\x12e\x86\xa4\xb6\
-\x95%\xf9nF*\x81L\x0aP\xbdu\x8c\x22\xf3\xc7\
-b\x86\x94I\xaa\xb4M\xbcb\x80\x0b\x04\x1f!:4\
-\xf7\xb8\xa8\x88\xd6i\x00\xe6\x04U\xf0\x01b\x80\x0c\x03\
-U\x1c\x8a\x13\xc3\xa9a\x12\x89y\x95\x0a\xb3L\xba\x88\
-\xd6\xd7 V\xc54\xe2\xa48\xdb`\x82\xe2H\xeaJ\
-\xbe\xf4.\xdc\xf4F\xfc\xa4\xe3J[\xaf\xef\xd8\xf7\x82\
-\xb0\xf1\x19\x8f{\x86?\xf9\xe8_\xe9\xcc'?\x12\xfe\
-\x897D#\xd3\x01\xd0\x12:\xd0\x1b\xe4a\xde\xaf~\
-a\xea\xe2\xa2\x15\x03\x84C\x9d\xe0\xd8^\x89\xae\x0d\x00\
-\x8f\xf6\xab\xfev\x84\xe5\x9b\x86\xffp\xaa\x83\x83\xa04\
-\xdd\xe2\xb1~Y}\xeb\xf3!\x9e\xcfE|]\x7fv\
-\xf9^\xba\x22\xdb\xca\xed\xdf92\xfe\xea\xbd\xb7\xaf\x18\
-\xfb{\xfd\xc2\xa5\xca\xa9\xf9\x10C\x8d\x94jZcV\
-\x03\x8a\xe2\x05\xb2\xc6vFk[XY\xad\x13\xb4 \
-\x90\xc5\xa88\xa14p\x9b\x7fn\x0e\x02\xa3\xe4\xdc\x14\
-G`ZTd-\x87\x1cp\xce\xe1\x0c,\x8f\x90:\
-\x92\xd9\xc8\x5c\x06\xa1\xeaH\x14\xac\x91Sw\x19uQ\
-\x1c\x8e\xc4\x8a\xf0\x09\x8b\xd8P\x8e\xa7JU\x0cj\x8e\
-`+i\x0c\xe5\xb8<\xc1\xf9\x1c\xcb\x8aAD]\x90\
-\xca41\xde\x81w\x82\xdf<\xc5\xff\x8dM$\xaf}\
-\x5c\xc8\xa6\xff|\xdc\x95\x81\x1f&\xc6WN\x8fP\x1f\
-\xf4^\xf5\x0a\x89b\x8fJ\xe8\xc3qTt\xa9\xdc\xf7\
-\xa3?\x0f\xc2#Z\x0c\xd7\xd2#t\xea\xc7p}\x88\
--\xf6\xc2\xf1\x19 Y\xe8\x87\xfb\xc7\x01\x92\x9c\x8e\xff\
-W\xd6\xc0\xde\xaf:\xc2=\xe9\xce;\xe2\x1f\x8e\xdeS\
-\x7fr\xd6={\xb0\xd5.\xaa\xa4\x9c\xe4#\xb5z\x95\
-\xb4\xd2\xc0|\x06\x99\x92\xab1\x94\xdf\xc3\xb2\xe9I\xc6\
-SW@\x86.\x10]\x84\xa8%\xb2c-\x8f\xdf\xca\
-N\x0d\xa4\xa4\x1a`\xf3\x9fk\x10,\x17\x82BR\x89\
-hh0W\x0fLOU4\xdd\xa9C\xf5?\xceT\
-\xb6]\xba}\xe2\x81\xab\xab\xa7E\x96\x1e\xb5\x9c\x89\xd5\
-kI\xc6G\xd0\x14f\xb6le\xcb\xaf6\x1d6\xf9\
-\xfb\xecm\xcb\xef_s\xc4\xb2\xda\xba}\xb2\x9a_1\
-K\x9a\xad\xa6\x9a\x8fP\x8f\x86T\x02\x04%Z\x8ei\
-$o8\xe0n\x86\xf2\xed\xe4N\xa9\xecn\xf0\xbd\xf1\
-\xa7q\xc9\xc1\xfe\xec\xc9\xe1\x8b~\x9c\xdfsc\x8c=\
-\x8c\xab\x1f\xac\x17\xfb\xd4N\x06\xa5\x0b[\x87\xea\xbet\
-pl\x0cPW\x88\x1d\xaa\xc4\xddh.\xdd\x92\xedA\
-k\x00\x0b\xde\xeb\xc6\xd5\xb1\x01\xbcG\xbf\x1c\x00z\xd3\
-\x89\xe7/V\x15\xa1\xe6\x80 0j>\x99\xc6V\x8e\
-\xb1\xfe\xcd\xe6\xff\xe1\xc0\x13y\xc9\xf8\xaf\x0f\x92\x8c\xb7\
-\x8c\x0fs\xacy\xa63\x87&u\x1ab(\x0ea\x17\
-i\xed>&d\x8e\x8a\x1a\xb9\x19*`\xa2\x85\xb1[\
-a\xd3be\x11J\xe6\xff\x17\x11\x10\x0a(\x12)\xb8\
-9\xa2\xa8\x14\x04\xb4X\x0b\xccn\xa8\xb1\xed\xca\xe4\xa0\
-p\xed\xf0\xc9\xd5\xcb8q\x9a\x89G\x1e\xc0\xf8^+\
-\x90z\x8a\x04\xc1\x8fz$+H\x0c\xcd-Y\x06X\
-\xa0n\xb3Ln\xd8t\xf0\xd6\x1f\xdf\xf7\x8a\xb9\x1f\xe9\
-Y\xfe\xaf\xc3\x07\xec\xc3\xda\xb2\x0a\x8c\x17\x5c\x10\xa2\xcb\
-1Q,\xdbB\xd4\xbf3lJ^\xab34\x99\xf1\
-\xf9}^\xc2?\xfb\x17\x9f=\xb9\xf2\xae_\xb0-\xcb\
-a\xf8\x00\xc6\xea\x1b\x09Rg\xb66\x0eL\xf6\xaa\xc8\
-\xf6+,uJN\xadO!\x91\x1e\x046\xe93\x9b\
-X\x9f\xbc\xcf\x16\xedS\x07\xa8\x1c\xf7jX\xea\xd8\xf0\
-\xd4n\xf8\xf20\xbcH\xbf\x0b*\x03\x18~\xf1w\xe4\
-\x0a\xfc\x9b\xbe\xe4N})\xe17|\x84}\xf8\x01\xcb\
-\xdex\xa6\xdb\xe3\xc7\xb7\xc4\x1b_s\xb1\xdcz\xe0\x07\
-\x8eI\xd2\xfc\xe2$eo\x81\xe9\xc4\x93\x060\x0d\xe4\
-\xea\xb0\xd9\xed,\xa9\xdd\xcb\xb2\xb1\x1a\x12\x1dfB\xc1\
-G(\x8f.\x02\xce\x91jF\x9e%h\x10\xa2\x9fc\
-\xaeb\xf8\xd9*\xde\x19\xe2\x85\xc42\xe6L\xf0(\x16\
-\x8d\x90\x09\xb5+6\xf3\x97\x8f-{Ir\xcf\xaa'\
-\xed79\xbe\xcf2F\xd7\xad\xa0\x88\xe3\x8b!\xa3%\
-t\xa3e\x0ei\x80\xc5\x88YIW6!:\xa3>\
-\xd3\xc0i\xc2\xd4}\xdb\xf6\xd8\xfe\x87\x8d\x1f\xca/\x99\
-z\xe6\xf2\x9d{\xa7\x9e\x8aET\x15\x0dF\x96\x08\xbe\
-\xa6\xa8\xff=N\x03\xf5P\xc1\x85:\xe9\xb69\xfe\xf3\
-\x1b\x8f|\xcb%\xe7^\xfdU\xf9V\xad\xca%g\xdf\
-\xcb\x15\xefyjH^\xffC\xf7\xa4\x1bn\x08\xfc\xe7\
-i\x11f\xfb9\xaaN\x94\xe6~\x9dN\xbd\x9c\x9e.\
-B\xf6\xfa5\xb7\xd0\x81\x0bf=r\x90A\x1bW\x06\
-I\x90\xfb\x1a\xfe\xa0\x09k\xc7\xa6\x8f\xb6QO\x87X\
-\xb2\xeb\xb4\xb7\xfe\xa9g\xb0\xcf\x13\xef\xd1\x03\xde\xf4G\
-\xdbv\xd1:\xf9\xe2\xcd\xd3z\xda+.\xb4?\xae\xfb\
-\xec\xb1;\x1e\xe0\xe2q\xcfxUH\x1a\x15\x22F\xe6\
-<*\x01\xadoa\xe9\xec\x16V\x0cG\xea\x120\x13\
-\x5c\x13\xb5i\xdfG\xdd\xc8$\x90%\x86\xb3\x11\xc6+\
-5\xb2\xd9\xc8l\xe2\xa8\x9a\x11\x13C2\x8f\x9a\x11f\
-\x8d\xc6\xaf'\xd3\xbf\xbd\xcc^V\x9b=\xe2M\xa7\x91\
-\xa6K\x18\x8a\x8a\x1f\xf3$9\x84\xa4`\xe2kI^\
-\x10-2\x04\xb3\xe2F\x1a\x82H$F\xc1(\x0c?\
-\x9f\xce@R\xf2\x98\x13r\xe1\x8eK\x7f\xf6\xf7\x95\xef\
-\xddg\xa9\xc6\x11+\xea\x06VB\x0d\xceyBv\x03\
-\xd1\xef\x86\x90\xe2\x92\x84\xea\x8e\x1a\xbb\xb6\xc1Gv$\
-\xfc\xf7\x19\x8do\xd4\xfe\xf1\xaa\xcf\xf1\xc8;'\xec\xb9\
-O_\xce\xcc\xd7\xaf4\x166\xb4\xd0\xc7yuj\xfb\
-\xb4\x01I`\x8b\xe3\xee8\x00\x81\xac\x9f\xa7\xeeV\xbc\
-\x92\x0e\xfb\x92\x0e3\x01}j\x0d\x1d\xe3\x7fGw\xe6\
-\xe4 \xec\xb7^\xddVt\xa8\xd8uH\xb4\xf6\xe5\xe9\
-\xb5W\xc8\xe9O\xfc\xba\xdfs\xcdGX6\xd5\xd0\xbb\
-\xdf\x0c\x1f\xce\xaf{dc+\xef\x1bN\x18\x1dJ\x18\
-6\xc8\xb5A\x16RR\x17a\xf6\x01\x96\x86\xcd\xac\x18\
-\xcb\x08Dhx\x90\xa2\x82Z\xa2\xe8\xf3\xc4\xc9!H\
-\xc4 :\x5c\x1a\xd1\x5c\x08\x89\x90F\x85\xd4\xd0\x86\x90\
-m\x86]\xbf\x8d\xab\xa7\x9fY\xfb\x87\x8d_9\xec\xf3\
-\xc7e\x07\x9cu\x02#\xa3\xa3\x0cW\x1c~\xd8\xe1\x04\
-\x22u\x92\x8a\xc39pNp\x1e\xd4I\xf90\xa4\xf9\
-\xacZ\x0c\x08'h,f\x07\x19\x12\x08Bj\x0e\x7f\
-\xe0\xd23k\x97\xde\xbbgR_\x9a*>3\x1aN\
-\xf1Q\xb0$\xa2\x08!\xdfM\xc5\x05\x1a1\x90U\x13\
-F\xd2\x8c\x93tI\xfa\xc7_\x8e\x1ex\xcf\xbbj?\
-\xf2\x07\x9f~\x93\x97\xff\x5cmW]\xf2J\xe5w?\
-5B\x18\x142\x16\x06cWv\x9b!zA\x9b\xd6\
-!\xee\xefV\xcf\x19$\x22\xe8\xc6\xf0\xedW\x00\x95\x1e\
-$8\xa1\x8d\x8d\xd2+~\xb7.(\x00=\xb8\x18\xd6\
-\x03O]tb\xca\xcfk\xc3\xfc\xed\x17O\x8d\xb7\x7f\
-\xe9\x11\xf1\x07\x17\xc0\x99\x0fr\x8a\xec\xe6\xcd\x95a\x96\
-U#d\x91\xac\xe1\xd0|\x88\xd1J\x8e\x9f\xdb\xc0\x9a\
-|++\xd2H\xb0\x221\xb5\xa4(\x22am\xdbo\
-\xc6\xf5y$\x8f)\x15KHB$K\xea\x84\x1c\x82\
-\x13\x12<\xfcr\x92;\x9fco\x98|\xde\xba\xef\xef\
-q\xff\x09\xef~2\xcb\xd7\xac\xa12,$D\xbc\x87\
-D \xf104^%I\xc0\xa7\x90T\xc0\xa5\x82O\
-\xc0%\xe5\xeb\xb4\xf8\xcc%\x90\xa4R\xfc\xd6\xc0\x8f\x08\
-\xceA5Q$F\x86\xd2\xd1\x8b\xb6\x1c}wU\xc8\
-|\xb1\x07\xafE2n\x8d\x84$Y\x8az\xc1YJ\
-E\x03!\xce15\x912>\xb1\xab\xf1\xd9\xaf\xc7O\
-\xed\xff\xf2\xe3>\x97\xdd9\x0c\xdb\x0f\x7f\x0dk\xeb\xbf\
-\x10\xc9\xe2\xa0\x84\xc0N8\x7f\xbf\x84\xb8_5^\x1e\
-\x86\xf1Z\x8fA4H\xb8-=l\x90\x1e\xc7\xf6\x10\
-\xa7\xbb\x18\xc7\xef\xd6\xac;h\x13\xf2\xc3M\x9e\xe4\xe8\
-#\xb1\xd7\xbf\xf4\x0c\xbf\xecM\x1f\xb6\xef\xdcsr\xf2\
-\xf9\xdb\xe2>\x8dI>12\xc6\x1es\x8e\xb9\xb4\xc0\
-\xda\x1bT\x19\xa9\xe4\xd4\xa77\xb0\xbc2\xcb\xb0\x08\xe4\
-\xda\xac7\x81\x0b\x05V_R\x0d\xda\xc3\x1d\x82CS\
-H,\xa7\xde0\xb2\xaaP\x89\x0e\xdd\xd2`\xeb+\xa6\
-\xd6\xdf\xf1\xcb\xc3\xbet\x8a\x8d\xef3A\xb5Z!\x09\
-\x82Y@\x83\xe1\xab\x8a\x8e(\xe49\x81\x8ct\xa8\x8a\
-+\x0b\xbf\xa6\xcdK8\x7fA\xcdJ@\xb4\xed\x7f1\
-\xc8$\x12\xe6\x0c\xcd\x94\xac\x22\xe4u\xb8\xef\x9a\x9b\xb7\
-\xd8\xd9\x8de\x09{\xe5F#\x01\xcd \xcczl\xc9\
-\x0c\xf5\xc6\xadT\xcdQ\xf19a\xae\xc1\x5cRa$\
-\x85d\xeb\x14\xb7fgL\x9c\xb3\xdf\xaf_73:\
-\xfcT\xb9s\xed\xf1n\xfd\x07\xc9\x1e\xdc\xd93n\x1f\
-4\x04\xe9\x15g\xc7\x1ed\xc2~\x0a\x1d\xfd\xe2\xf8N\
-=\xba\xd6\xa3:l=\xc1\x92\xde\xb3\x02Mv\xa6\xf6\
-\xe0Eh\x97*`?\x82Y'\xaf\x22\xce\xfb\xa2^\
-\xc9\x908\x0d\x88\x09\xbbd\xc4~{\xdf\xfe\xf2\x8e/\
-|\xd1\x9f{\xdf\xf6\x83\xa6w\xf1\xe1\xf1aVG!\
-K\x221s\xb8T\xd0\xb4Fc\xee^V3CU\
-\x8b\x0e\xfb\xe6\xd0-\xe8\x06\x8a+\x0bR%\xd9\xa6\xac\
-\xc4\x02\xb9\x12\x5c\x9d\xba\x08\x82\xa72\x1b\x98\xbe|\xf7\
-\xb2;\x9e\xb1\xe4\xdd\xe1\xb6\xf5\x1fz\x1cK\xd7,'\
-A\xf1\x11\x5c\x15\x9c\x1a~\x89\xc3W\x04g\x86\xa6\x8e\
-j\x92 \x99!Z\xb4\x9a\x8bZ\xf1hr\x13\xa49\
-\x08\x8a\xa1\xa7\xe5e0\x07\xd2(\xfa\xd3C\x88\x90\x16\
-`)\x89;\xfb\xc1\x7f\xbfmU\x95\x95\x06\xa1\xaa\x0c\
-7\xa0.\x86\xa4\xe0\xe6\x1a\xa8La\x02\xae\x024\x94\
-\xcc\x02VI\x98\x98\xbdknt\xf5\xea=~w\xf0\
-\x1e\x1f\xb5\xfa\xb7\xa7\xe2\xf7\xef\xac\xc6\x0co\xe2\xabZ\
-\xf5\x0d\xf2\xd0\x119\x91\x1e\xdc\x1a\xe93\x93/n\x1a\
-\xa2\x07u@\xfa\xe4\x18\xd2!\xbc\xeedW\xd2c6\
-Y\xfc{\xedQ\xad\xed48\xa4\x1f\x09\xa9\x13\x0d\xd6\
-\xba\xc0R\xdd\xa64\x00\xd23\xc68\xeb]\xafv_\
-\xe4#\xc2\x1bn\xd0\x93\x0e<I>\xcdz\xf9\xea\xdb\
-f\x92\xe5g\xddn5\xdbpH\x98\xe2\xfd\xcb\xaa\xec\
-\x15#\x0d\xa9\x93\xb9\x80\xf8H\xb0\x88\x9b\xf9;k\xdd\
-n|\xe2\xd1\x92?S\x98Zl\xe1\xf11\x18\x99\x96\
-x\xbd\x08xGU\xc0|\x8d\x86\x13\x5c\xe2\x19\xfa{\
-\x9dM/\x9e}\xfa\x86\x17\x1d\xf0\xddu\xbb\x0e~\xe1\
-\xa3\xa8\x8eU\x88\xd4\xf0\x0e\x92\x11\xc5\xfb\x88OA\x89\
-H\x0c\x80\x15\xf1\xbd@\xee \x8a\x10\xa2\x10\xeaB\xac\
-\x17\x5cMk\xd6\x80m\xbe\xcd\xc5#\x98\xe5`9*\
-\xe0\x9d\xa0\xde\xd0\xbaA\x80\xb4R\xf9\xee.\xb7[\x04\
-K\xa12U\xc02\xce\x83k$T\xfd8B \x10\
-iX\xc1\xed\x91\xe6\xdeG\x22\xcf:\x7f\xf2\xb2S\xb2\
-G\xee\xaf?\xbd{Ix}\xb5&\xfc\xc3\x0d\xce\x7f\
-\xe2\x87\xee\xdbO@\x97\x8f\xac\x97\xaa\xbe\xc5\xba0f\
-\xfb\xb5\xe5\xf5\xc3\xe5\xadC4`]\xec\xc3\xe8\xddL\
-\xd2\xef\xfb\xd0\x9d\xde\x1c\xbb<\xdb\xa2\xff;\xe2\xfe\xed\
-\x5c\x9dA\x0bU\xbd8\x15]\xe32\xb7m\x981\xce\
-\xe0\xd4\xbb\xde%\xafz\xdd\xba\xe4\xde\xf1\x10\x8f\xbf\xe6\
-\xe7<\xef5K\xf4\x9a\x03._;\xb2\xc5.^\x9e\
-r`\x03\x1a1\xa7\xe6+\x8c\xe6BLst\xe6\x01\
-\xd6\xf8\x1a\xea \x84B\xe6\x03)\xc2\x1a+\xfd+R\
-\x9a\xdd\xb00\x14\x05\xe6\x94<\xe6\xd4\x14\x1c\x15\x86\x1a\
-\x9e\xe4\xf7\xb3\xdc~\xba\xffh\xe3\xd6\xc3\xde\xf8(&\
-\xf6XM\x12!qPq\x8e!U\x5c\x12\x89.P\
-\x11O\x1a\x14\x15\x08\xc1\x98}\xb0NV\xfb+i\xed\
-jf\xb7\x5c\xc9\xcc\xce+\xc9v\xfe\x01\xc9\xfe\x84\xd8\
-\x03\xcc\xccT\xa9k\x85j\xf4\xa4\x0d-\xf8\xa0J\xd9\
-\xef%\x85\x7f)\xa9p\x05\xfe)\x18n\xf7\x83\x1b\xee\
-|\xed\xe8\xed{\x9a!\x99\x10S\x0a\x02\x5cT\xcc\xd5\
-\x88qg1\xe4\xa2C\x5c\xc02\x87\xa6\x86\xa8\xc3\xef\
-\x9a\xe2\xc4\xe7\xa6\x1b/\x8b\xcbj\xd9/\x1bo\x92\xea\
-\xb5_\xe5\x19\xcb.\xe7\xb7a\x89}\x22\xbd]\xbf\xf4\
-\x8c\xab\x94\xeb>\x15\xb1\x1a=@\x0b\xed\x83\x82tR\
-F\x18$\xe9\xecF\x11\xee\x96@\xcb\x803P\xb7\xf8\
-\x9d.v\xd85)\xf6=\xe2\xbc\x87\x83\x12\xf4\xea\x95\
-4\xc0\xce\x9c\xdeG\x8f\xder\xbe\xfc\xee\xabk\xf5_\
-mN\x7f\xfe\x9bW\xf0\x8d\x0f=\xd5\xdfr\xe0\xce\xa1\
-\xca5\xbc~\xb9\xb2>\xcbh\xd8\x18C\x16\xf1\x16\x98\
-K3\xf2\xfa\x0e\xd6\x8e4\x10\x22d\xae0v\xb1\xf9\
-\x93h\x16\x5cE\xa0j$\xbb\x95\x19\xef\x18J\xeb\xe0\
-\x0c\x9f$T's\xa6\xbe6\xb5\xf2\x8e7\xae\xfc\xf7\
-\xe5\xac;\xf6h\xaa\xd5\x04?,xo$R\xd0\xd3\
-\xb2j\x1d\xdfHI\xeaJ\xe673U\xbf\x0f?\xfd\
-k\x99\xdc\xf2\x1b9\xeb\xf8\xdf\x8d\xc0d\x0a\x5c\xc8\x8a\
-\xf8T\xe0\xe4\x9fc\xfc\x00=\xe2\x9fa\x84\xed\xee\xba\
-\xcds\x07\xc7\xbb\xa6^L>q\x1a\xd5p\x10U\x99\
-\xc0\x88hI\x81\x8b\xae4\xb3\xbc\x98\x9b\x5c\xea\xa7W\
-\x9dsT\x9e\x7fw.3\xfcP\xca\xd2\x10h\xb4\xd8\
-\xcfJDQ\xb3\xe2\xc6\x89\xa0\xb1Q4\xb4xp\xab\
-GXw\xcfu|\xe8\xf8\x97\x1c\xfc\xeas\xb7\x7fP\
-/\x19\xdd\x9f7\xad\xdd\xe2N\xbc\xee9\xd9\x1b\xa7\x1f\
-\xc3\x91\xbf\xba\x94?\x13\xa4\x87\xd7\xedT9\xb5\x1e\xf7\
-P\x06(ZI\x8f\x19\xa5\x9f!w\x9aUz\x85,\
-\xbd\xa0\xd8N\xb5\x82\x05\xdfoOn\xfb\xf1l\xe4a\
-$K\x0fAx\x8ez\x04z\xd2q\xc7\xe9\x17\xb3\xfd\
-\xe3\xe3\x97\x1f\xa6\x7f\xfe\xf9k\xe3\x8f\xae8*\xdd\xe3\
-g[\xde3\x9apN\xda`[c\x9c\xe1\xa1\x88F\
-O\x9e\xcc1;\xf9W\xf6\x22\xa5:4FV`\xe2\
-\x04sm\xf4\xe1\xf9\x90\xbe\xe0\xdb\xe4d\x92\x90f\x0e\
-\xa9d\x844G7F\x1exSx\xc2\xd6\xcb\xf7\xff\
-\xc0Q\xec\xb1\xff\xde\x90G\xac\x12HRH\x9c\xe2\xb4\
-`\xe1\xcf\xd6\xa7\xf1\xf1jt\xf6Jg\xb3\xbf\x1d{\
-\xc4\xe8M\xbbd\x8f\x99\xf6\x13\xda\x0e\x1cz\xff\x1a\xff\
-\x88\xdb\xcf\xb4\x0f\x9fqi8\x9c;\x80\x7f\x94\xb7\xbc\
-\xf3\xad\xeec\xff\xdf\x89A\x04s\xbb\x1fX\x1eo\xa9\
-\x9ecU\xdeL:\xb2\x9e\xe8c\xc9\x91\x10b\x14B\
-\x06yf\xe4\x81\x15;\xfep\xef\xcd\x93gm\x1d\xf7\
-\xac\xaaxFk9SEo\x17i\xba\x9b\xb9\xfa\x9d\
-$\x1a\x0b\x0at\x1a \x13b\x10\xcc;\xaa\x1e\x98\x9a\
-\xa5\xb6\x0d\xb9\xe8Q#\xe7_\xbe}\xf9\xc7\xd3+n\
-<\xd9l\x9f\xe5\xf2\xf4u\xd73y\x8f\xe8\xbe\x9f\xd7\
-l\xe7d\x1c\x84+?\x08u\xb8S5\xb4WR\xda\
-/q\xa6\xcf1\x0c:Xz\xf5\xeav}\xed\x19\x5c\
-\x7fe\x10\xc8\xac\xebLq\xcf}\xdeV\x7f\xf56\xf7\
-\xf4O\x9c\xcb\xaaO\xbf\xd5\x9et\xf7\x09~\xec\x07[\
-^\xb34p\x86\xa64\xb2\x0aC>\xe0\xc8\x98v5\
-\xf2\xe9\x0d\x1c8\xbc\x19\xb2=\xc8\xeaK\xb1\xc4\xd0$\
-\x22\xa1\x87x\x86\x82\x93@T\x10\xe7\x19\xde\x9c\xb1\xe9\
-\x91s/\xbdw\xcb\xe1\xaf{4K\x96-!\x09\xa0\
-\x1e4-ZA\xa4\x06\xf5i\xb0\xec[L\xac\xfa4\
-\xab\x93{\xdd\xf2\xf1m\x1b\xed4{\x11\x9f\xd7_\xde\
-\x9b\x1d\xc8\xd4\xce}\x99\xde\xbaT\x96\xaf\xbco\xc5\x81\
-{lX\x0f\x0f\xae_\x83=\xd7N\xd0c6\x1d\xec\
-\x9e{;\xf2\xab\xe1\x9f\xdb\xd7\xae\x7f\xa6L\xf2%\x99\
-\xa8\xfeqj\xe8\xa4\x7f\xfd\xe6\xdc\xc6/_\x1b\xee\xdb\
-\xf69\xc6\xf78\x16\xa1R\x14\xbc\x9a\x8f\xa2\xe2P\x0b\
-\xb1\xb1\xa9\xce\xe41\x09{\x86H=\x1a\xb1\xa40\x14\
-\x22'\xae\xc8\x1c\x00Q\xc1\x9c#\x099\xb5`4\x12\
-\x87\x17\xa5\xbe\x04\xbb\xe07\x95\xaf\xdfp\xf8\x93\xbe\xb6\
-\xf9\x8b\xdf\xab\xc7\xbf\xdd{,\xe7\xae;\x82\xdb\x8fD\
-\x82\xc4A\xf9W\x0c@N\xeb\x17ww\xa3&\xf4\xab\
-\x05\xc9\x00h\xcf \xba\xa1\xf4\xa1/\xf7$\xa9Y\x07\
-\x16_\xa7x)v-^H\xc1o\xac`\xe4j\x05\
-?>8\xa3\xe2\x85g\x9e\xab\xeb\x96\xff\x81\x8d\xf7\x1d\
-+\x7f{\xf6\xb7\x9f0\x9a\xc5K\x96\xd6\x09Y\x0a\xa4\
-$.\xa3\xee=R\xbb\x87q61\x92fda\x02\
-\xe7\xd6`\xd1\xe1\x08D5b\xd4\xa2yD\xda]~\
-\xc1\x8c\xc9\xc4\x91\x1adw7\xd8~T\xf5C\x93\x1c\
-t\xfe\xe9T\xd2\x22m4\xdf \xadx\x92(4j\
-\xbb\xc8\xb7\xff\x8e\xfdV|\x80\x91\x91\x0d4\xb2\xa5l\
-\x98;\x1ci<\x09]\xfa\x18$\x1cH\x8a\xe0L\xc1\
-\x19\xb9\x1aA#\x96O\xc2\xccoY6~\xa9T\xea\
-\x7f\xb0u\xa3;L|\xc6\xa5\x22;\xbe\xf6m&v\
-\xac\x8a7|\xed\xf1\xd5\xfc\x9d_i\x9c\xfc\xe13\x8f\
-\xe2\xc1\xea\xcf\x19\x1d\x1bG\xd4a\x08!B\xde\x80h\
-\xe2\xb7\xdet\xd7w6\x9dz\xdbY\xcb8\x02%\xb1\
-H\x8e!1\xc5'\x93\xd4\x1b\x1b\xf0\x92\xe1$\x16\xbd\
-\xc2V\xd6\x83\x13\xd0F Z\x85J\xacc\xb5a>\
-\xf8\xd9\xfc\xacK\xaf\xbe|${\xf4#\xbf/_<\
-\xe4\x1db\xbf\xffR\xfc\xfb\x0f\xb6\xf6\x22\x96\xf5\xd3+\
-\xa5\x8f\xe7\xed&\x0f\xf9p\x84\xc9\xa4G\xa5vPx\
-\xb6\xd7\x8c\xd2M\x12\xd1\x94\xc1\x1a\xcd\xdb\x0f,\xf6H\
->\x8c\x17=[\x1e\xf5\xd8+\xf4\x17<W\xde\xfc\x0d\
-\x1c\xef?U5\xfd\x9e\xf0\xb4C\xe5\xa5\xbf\xbe\xc5\x1e\
-\xf7\xef\xbf\xcd\xb7\xbd\xf2\x9b\x07W\xa7\xe2E\xa3\x19\xda\
-P\xc4E\xc8\x0dS\x8f\xe6\xf73\xa6\x9bX\xa2\x19\xf5\
-\x86\x02\x01m6\x98\xe0\xd02\xb9\x95\xe8qR\xb4\x0c\
-\x12\x14u\x11\xf0\xa4\x89\xa2\xbf\x9e\x19\xbe\xe7\x84\xe1\xcf\
-\xd49\xf8y\x8ff8\x15R\x03W5|%Av\
-\xe7dS?!\x9f{\x09\x87\x1f\xfcN\xb6\xe9q\xfc\
-u\xd7\xe7y \xbf\x86\xd1\xe1\xcbY\xb2\xfaB\x96\x0f\
-\x1d\xc6\xd2\xf1\x84\xa1q%]\x02\x95\x11e\xb4\xeaY\
-\x92\xa6,\x1fZ\xc1\xb2\x15\xe70e\x97\xd9\xb6\xf8K\
-n\xda\xf1\xb6%7\xe7\xab8\x13&\xf6\xbe\x82O\x7f\
-\xe5t\xff\x92\x97\xbd\xb6q\xf2\xe5W\xe9\x05\x87=\xe5\
-&*\xfc\x1a\xea\x8ehV\xf4\x85\x15\x0aV\x88\x12+\
-K*\x93\xea,\xc8|\xa1H\x14\x93\x82(g8\xa4\
-Tr\xb3\x00\x16}\xd1\xc5\x05H\xe2\xf1.\xd0H\x12\
-\xb0)^v\xd1\xf1W\x8d\xee\xba\xf8\xf5\xee\xdc5\xc3\
-\xee\xdeg\xff\x7f~,\x8ci\x9f\x8a\xa9\xf4Ap:\
-\xe9+\xf5\xab\xf8\x0e\xdat\x22=j<\xfd\x06\xca \
-\x14\xf8~\xb4\x8d\x96\xb7\xef%\xe4\xda\xaf[~\xe1\x05\
-\x18\xda*\xa7\x8cl\xd2\xd3\xb8\xc4^t\xf2\x9d\xd8\xc8\
-j>\xdb\xb8\x8c\x1f\xcd\xde)_\x7f\xd4^q\xeeu\
-+\x97\xdc\xf1{.Y3\xca2\x89D\xf1\xf8\xa0\x90\
-F\x1a\xd9\x0e\x86\x1a\x9b\x98\x18\x0d\xd4\x83\xe0\x5cD,\
-\x22uA\xa3\xa0i 4\x0c\x82\x91YNh4\xa8\
-\x87a\x86\xaa\x86\xcb\x95\x98D\xb2_Mr\xd73\xd6\
-}}e\x5c\xfb\x88\xf5$\x22h\xb5h\x17\x11'\xcc\
-Nod4{\x0b\xd5\xc6\xdf\xd9>\xfaB\xfe\xfa\xe0\
-cI\xd2\xbdX2\xbc\x04\x9fP\xea$\x94\x08Ll\
-6\x106O\xb1l\x1d\xc1\xf0\xe6\xa8\x0eE\xdc\xd0\xa1\
-\xb8\xd9\xf7N\xee\xfe\xfb\xd9\x12\x1ex\xad\xfd\xe7\xea\x1b\
-\x1a\xcb\xdec7\xff\xe2\xbf\xfc\xfbG\x9f\x16fo;\
-F\x98\xdet\x17+\x96)\xb9\x84\xb2\xeb6\x12U!\
-\x12\x15\xadS\x09\xaa\xb3\x15\xb3\x82\x1c\xe7\x8aF\x16k\
-J\x01\xb8P\xf4\x04\xe0p\x16\x88\xa2\x94\xe2m\x98\x16\
-R\x86\xf9\xb0c\xef{\xae\x9e=\xff\xba\x7f{\xec'\
-\x7f\xf3\xe2U\x95=?\xf9\xb1\xec\xee\xdb\xa7\xba\x95\xeb\
-\xe9\x93,\xf6j\xed\xeb\xe4\xf5\x95\xeem\xa9\x830D\
-\xbb5\x90\x0f\xda\x03\xd0\x8bk\xd4\xf5\xbc\x17\xc3U\xa1\
-\xcd\xabw\xc2|{\xd1\x1a\x02`\xe7n\xff?;\xb3\
-ra|\x8as\xe1\xae\x1b\xae\x95\xe7\xdf\xa2<\xea\xe9\
-_wy\x5c\xc2g\xbe\xf2\x80\xbf\xe3j{\xe7\xda*\
-\xfb'\x10\x0a\xb1aD\x22\x96\xee\xc0\xcf\xde\xc3\xca\xa1\
-:sV\x18@\xd1$RJ\x11\x9b\x11\xadTMH\
-\x1c\x15\x8b\xd8\xa8QM\x22\x89DD\x1c\xfe\xb2\xad\xdc\
-\xf8\xa45?]\x1e\xf7?\xf9(\x86\xcdC5\xe0\x87\
-\x8c\xcc\xcd\xb0\xf3\x9e\xefp\xca\x8agRKOd\xe7\
-\xd2\x1f\xb0d\xfc\x15,\x1d;\x84\xf1\xea(I+\xda\
-+\xda\xca\xe7\x0bRey\xac)\x0c\x88\xe2\xa5\xc0Z\
-*T\x88\x12\x88UX\xbe\xd7Il\x91o\xc9_\xef\
-?z\xf2\x09OHw\xde\xf2y{\xf7\xcc1|m\
-\xdd\xef\x97\x22\x95\xc7CZ\x10\xd9|\x14$6\xfb\x02\
-\xac\x93?\xb2\xa2'Q\xdbA\xbe&\xd7nl\xebp\
-\x00\x00 \x00IDATS:`\xe9\x06\xe2\x1ds\
-+r^\x93}-YsgL\xe3=\xa3ous\
-\xdbN\xb3.S\x7f'\x0dS\xe8,\x14\x1c\x17QV\
-\xe2\xa2\x99\x7f1\x9de1\xa6\x1f{T_Y\x94$\
-\xc7.\xf6\x15\x1f\x06\x9d9t\xa8%u\xa2J\x98.\
-\xda\xa1\xd0[.\xa4o\x91\xe2\xe6\x9b\xab\xf6\xa9}\xc7\
-\xec\xa7\xa7\xbd\xc3^\xf0\xfe\xaf\xe6\x13\x9f\xfe\xdf\xb8\xbe\
-\xf2\xfc`/}\xb5>\xfe\xcbS\xcf^\x99r\xbay\
-*1\xa2j\xb8\x98\x93\xfb9\xe2\xec}L,\x9b\xa6\
-\xa6u\xb2(X\x14\x92\x08H@4/X\xeeV^\
-\xaa\xcc\xa3\xceS\x99\xab\xe0\x5cN#mP\xfb\xf6\x96\
-\xf1?\xbe\xf0\xe8\x9f\x1c\xc5\xfe\x87\x1e[\x08\xfa\x8dD\
-\xaa\x920\xf5\xc0\x8d\xb8\xd9K\xd8s\xaf\xff\xe3\xfa\x1d\
-_gx\xc9\xdbY\xba|\x15\xae\x92\xa0\xcea\xea\x0a\
-\xb1\xc0\xd2\x10]i\xe4b\xf3H\xb7\x96\xd9\x0bR\x84\
-+\x99\x04\xb0Hj\x8a9\xa3\x91D\x86W\xec\xc7\xdc\
-\xe8\xe7\xdf\xb7\xf7\x8dgN\xe4?Y/\xb7l?\xe9\
-\xbe\x1b\x0e\xfaW\xc6\xc7\x8e(\xd2rS$6)\xcc\
-\xb1\xad\xd2\xdb\xba\xdaMf]\xd9\x156o\xed%}\
-S\xda\xaes\xb3\x9f\xa0$H\xc8\xb2a\xc66]\x17\
-_\xbe\xf2\xd23\xc2+\xc33\xc3\xea\xfawE\xe6'\
-\xf1n\x9c\x9bn,G\xebP\xa9g\x11>\xaf\xf4\xd7\
-\xe3\xe9\xc4\xe1\xeaE\x8f\x96.\x9c!\xe9\x11\x92-\xae\
-*\xc7A\x00\x98^:\xf5\x0cP\xcd{HV\x7f\xdb\
-\xce}\xed\x8a\xc9_s\xe6\x96;\xe5\xf3\x8f|\xb9\xbf\
-f\xeep\xde\xfe\xe8\x9b\xdd7\x87\xde{\xa0\xdb\xcd\xcb\
-\x12\xcf\x88\x05\xf2\x1c\x8c\x06\xf9HNV\xbb\x9fq\x99\
-&\xd1@D\xcb \x83R\xc62\x14\xb2\x1df\xc4X\
-\x1e\xb0\xafS\x8f\x91\x10\x04\x0b)\xfe\x9b\xdb\xddu\xaf\
-:\xe8\xd2\x03\x998p\x1f\x92aC\x86\x8d\x86)\x8d\
-\xd9o\xb2\x82\xcf\xe0\x87\xce&\x8b\x1fet\xf4\x10\xa2\
-\xabA\x08\x05\xbe.\x14\xf5Q+\xe6\x14m*\xe5\x08\
-\xa8\xd8\xa2[_ -^\x94D\x1d\xd1\x22DH\x83\
-\xc7\x05\xc1\x89R\x19:\x96\xd9\xa1O\xdb\xf0\xbao\x92\
-\x8f~\x8bd\xfc\x5c\x86\xaai\x89\xc8\x172U\xe2K\
-F\x915}xK\xae\xa44ci=\xb73\x80\xa4\
-\xc5\x04j\x9f\x1d\xa4\x90\xf8\xc4\x04\x1a#\xc43\xd7\xff\
-\xd37W\x7f\xf9\xf0/\xcaY+E\x963L\x97*\
-\xabt\xa9\xc4Z\x8f\x99\xde\xfaTs{9\xc8^\xca\
-\x1dFw\xa1\xd9APD\xeb\xf3~\xa7\xc1k\xbe\xcf\
-T\xd4\x0dZ\xea\xb6q;n\xf5_$\xf9\xf9\x0d\xec\
-\xdc\xf85\xbe\xf0\xc6S\xf4\xfa]\xff\x12\xae{\xe1\xe9\
-c\x7f\xfd\x97x\xf1\xdaQV\xd5\x8dl, \xd3\x0e\
-\xf3\x09\xc4\xcd,e;\xc3)4\xb2\x04\x8d\x8aj\xd1\
-L\x122+\x98\xef\x12@!\x9a\xa0\x18\xce\xe7\xc4X\
-!\xd5\x8c\xb9\x9f\xec\xe6\xb6\x17\x1e\xf1?\x87\xb0\xf6\xa4\
-\xf58\x17p.\x10g\x1bT\xb3\x8f\xe1E\x98\x1d\xfb\
-\x04\xa3c\xc3xU\x9cA\x94\x0a*\x82\xaf\x1b\x91\x88\
-$E:\xa9\xa6\x85\x84\xacP\x96\xc8\xe6\xcd\xb0\x0c\xb1\
-\x88\x16\x091\xa0\xce\x15\xb0\xa4Y\xc1e0!\x11!\
-zei\xb2'\x99\x8bE\xd6\x11\x85\x10K\x15}\x85\
-\x9c2\x88\x89R\xf2H\xadk\xa9{>\x1c**\x18\
-\x82k6\xc97\xfb\x85\xb5\x18J\x9aG,\x82\xab\x0a\
-\xab\x0f\xdd\xbd\xeb\xc4\xf1;/\xfe\xf1\xfe\xcb\xbd\xf9\xfb\
-\xfd\xa0\x95\xf8^\xed\x85\xfc?\x143\xfb\xd5\x05\x06!\
-\xb4\xd1\x01Y\xec$K\xd3\xaf\xb9\xbd\xe3yk\x17^\
-\x03\x03\xf0,:y|9e\x05\xf2\x8657q\xdf\
-Q;\xb8h\xe4\x82\xf8\xdc/\xff\xd6\xdd\xf9\xf1\xc6?\
-\xacJ9\xd1\x8c\xbcj$s\x91\xbc\x1a L1T\
-\xdf\xc1\xf2\x91\x9cF\x88PvH)\x11\x09\x85&\xbd\
-\xf8H\x96ghb\xa8Ers\xe8\xe40j\x19\x8d\
-+w%w\x9d\xb3\xc7W\x96\xb2\xf6\xd8#\x904 \
-\xea\xa8\xdb}8\xfe\x1d_9\x960\xf1v\xc6\x96\x0e\
-\x91 e\xd7TA\x0a\xf0\x0d\x88)\xc4\xb4\xd08v\
-\xb1\x1cRQ\xda|i1\x03\xc8<\xd5\x12EIb\
-R\xb6\xaa+\xa2\x0a\xde\xd0\x04\x1a\x1ap\x181\x17\x9c\
-\x17BU\x88\x952g(\x83\x96H,\x1bU\x8a\xd8\
-I\x9c\xa4\x92K\xa0\x90NPpe\xe8b\xd6\xa4Y\
-\x97\xfd\xc2\xd2\x9c\xc2\x05\x13%\x8a\x16\xaaofD)\
-\xe4Nr3\xaai\x9d\xd3\xbex\xf4\x15\x95-w<\
-VtamrP\x09\xf8^\xf0f?\xa9\x18\xeb\xf1\
-\xbak\xbc\xdd%~\xef\xa5\xa5o}\xf8C\xf4\xe3)\
-\xf9>\x84\xfd~\x17\xed!'}\xdd\x1f\xb1??}\
-\xa3\xdb\xf1\xdc\xef\xf2\x9c\xff\x0e\xe1\x03\xf7\xbf\xf3\xd1\xce\
-\xf3\x9c!!k\x80\x10\xc9E\xf1\xd2 \xd6\x1f`x\
-x\x96Z\xe6P\x15L\x8aX>\x08X\x14$z<\
-\xb34B\x9d8\x22T\xe7\x84\xcc\x8a\xdf\xdb\x06\xa7\xbb\
-\x9f\xbb\xea\xe3C\xecw\xc6\xf1\xa4\x12\xc9\x83C\xf2\xdf\
-2\x96^O\xe6\xce\xa2\xb2\xe4H\x5cE \x8f\x85p\
-w32.xe`\x86\xc3\x17\xf1}\xa9\x99\xd6\xa4\
-\xb5k\xdb\xccW$\xb8\xcdT\xb4hT\xf4h+\x14\
-\xb1\x92\x88\xec\xa4\x90b4g\xc4\xb2\x1bK\xac\xf0\xd3\
-\xb1\xbc\xb4\x1e\x8fYAc\x10p\xb1\x9e/\xd1\x86\x8b\
-\x81\xacd\xf6h\x1e\x081!M\x8cLs\x08\x09\x89\
-\x18Q2B\xb9\x1cQ\xb1\xe5b\xe8\x99\x05b\x02\xbe\
-f\x04\xaf\x88d\x9c~\xf4Q\xf7\xfd\xeb\xad\x8d\x9f\xcf\
-\xe5\x9c\xf1p<t?\xb5\xb3AC\x11\x19 <\xb6\
-\x01\xeck\x10\xbe\xbf\x0d\xd0\x03\xd0\x11\xaa\xd7\x01\xabt\
-\xdd\x88K\x0f\x89\xe7\x8e\x99>Nl\xfd\xc56w\xc7\
-z\xfd\xe7c?\xbb2\x9d\xe2\x15K\x95\xf1Y%\x04\
-\xd0\x1c\xb4\x92\x13\xc3NF\xa5\x86\x0bBh%wm\
-\x91\xad\x02i\x849%\xe4\x0d\xc8 \xab\x04\x9c7d\
-n\x9a\xad\xa7\xedz\xf5\xc6\xa9\x03\x9e|\x22\xa9\x87\xb9\
-\xa1\x0c\xb5_\xa1swP\xf7\xe7S]\xb5\x1e\xb5\x88\
-\xabC\xe2\x1cV\xaeX\xd5\x8c\xd5\xc1Z\xfd\xb2\x94\xb1\
-{\xd3\xb3\xab\x18\xa2\xd2BuZg\xd9\xfc\xbf\x15\x06\
-\xd1\xa4\x09\x95\xc1Pl\x0d\x05\x91\xb6\x9b-\xd6\xd2o\
-\x906\x9fbfI\xb6\xab\xbe\xd2\x91\x0e+C\xb1\xd0\
-\xe7\x09V\xe2\xf8\xa5\xc7o\xea\xec7\xf3\xdby8D\
-\xcb\xd9C\x11<N=\x899H\x1d\xfb\x8d\xdc\xcc\xfa\
-\xc0\xd7\xe36\xe6\xfay\xc5n\xc4\xaeN\x94\xe1~\x89\
-\xe5 :\xa9]\xf5\xea;\x90\xe7\xa4\x8f\x97\xef5\xd8\
-\xfa\x0eJ\xed\x92A\xd3\xa1p\xd5\x89\xd3\xbdX\xe1V\
-?\xbb\xd7\x9b\xd9s\xea\xa3\xf2\xfc\xd5\xffA\xdc\xc1S\
-F\x94\x13}a\xd0\xbe\x14W\x0d2\x8d\x8f;\x19\xae\
-\xe6\xe4\xb9[\xa0E)\xe5MW\x8cH\x9dFZe\
-D\xebE\xb6^\x87|K\xc6\x96c\xe7\x9e\xf5\xb7\xa9\
-\xe3\xdez&C#\x9e(\x86\x0f\xb71\x147\xe1W\
-\x9c\xc7\xd2%+\xa9\x06EcAg\xcb\xc81\xc9\x0b\
-\x0e\x8cZS\xfd\xb8\xe5\xc9\x9d\xcc\xeb\xaa9)%f\
-\xa3\x95\x03\xa5xh\x19\xfa\xcc\xdbMAUn69\
-\x0a\xa0E\xf3mk\xb0H\xdb5*\xf6U\x9c\x99Y\
-\x91\xa6\xaaj5\xd1d\xcf\x94\xb1\x86\x90k\xd1OP\
-4\x91Y!R\xae\x01\xd3X\x96\xbe\xcaAU2\xfe\
-\xcd\x0a\x01\xab\xa8\x02y\xa0\xe1\xca\x85,\xc6\x12\x1a\xd3\
-\x9b9\xe7\x83\xf6O\x11F\xe1\xa1\x8aw\xda!\xb4\x88\
-=l`\x10\xae\xbct\xe0\xda[\x87\xe6\x15z\x0c\x9c\
-^\xdc\xfdv\x14I\x19\xacI\xbe\x93\xfa\xb2-Fu\
-:\xf1\xe8\xbb\xc5c\x9d8\x19\xad\xc7\xda\xcae\xf2\xdd\
-\xa3N\x08\x1f\xdeq\xcb\xb1\xa1\xce\x85x\xe6\x1a\x81,\
-\x11\xd4\x05\xcc\xcf\xc1\xd4\x0e\x96T#\x8d60\xaf\xe9\
-S\xe7a6A\xa3B\x1e\xa8\xbb9\x9cW*\xb3\x8e\
-\xc6\xeb\xa7O\xdd\xb4\xf5\xe4w?\x8d\x91J\x85F\x92\
-\x93\xc4\xdf\x90\xda\x0e\xe2\xf8yT\xc6*H^`\x86\
-\xf9\xb0!\xde\xa8d\x8e\x04_x\xf2r\xcd\x92\xf9\xd7\
-\xf3\x8a\x99\xda\x06aJ\xe9`\xd5\xe6\x955\x8b\xd7\xf3\
-\xabI\xccG\xe1\x0b\x0f]\xda\xf1\xf9fG\x965\x9b\
-\xd0m\x1e\xc2t\xa4\xa1!\x13)\xc3s\x91Z\x22$\
-*\xad\x16v+\xe5\x0b\x11kf\xc2X\xa4\xd5\xe6b\
-\xe5\x1eE\x04\x0d\x81:FT\x83\x9039^\xe7I\
-[\xf8\x98ksz\xddZ\xfc\x8c\xee+\xd2X\x9f\xf8\
-\xdd\xfap\xf3{-b!=\xb6\xd9\x0f\x87\xef\xa5\xa5\
-\xd9/\xa96:\xf06\xbaq\xa2\xa5Ov\xbf\xe0\xbd\
-\xa7\x9fq\x85\xd6\xf6~\xf7\xd8\xec\xdfx\xeb\xb2\xa5\x8c\
-\x87\x88\xa9\xe1h\x90\xa7\x19ym;\xe3C\x19y4\
-bP\xd4+\xbei*6\x0f\x1c\x8a\xc5R&D\xd1\
-\x5c\xc8\xc3\x0cs_\x98;\xe0\xee+\x8e\xfa\xf8\xc9T\
-\x96\xa6\x88\x0b\x8c\xc8\xb5\xc4\xca\xfe\x0c\xadx\x1c\xd5D\
-\xf0\x80\xd7\xa2\xf8\xe3L\x0a!\x10oE\xbd\xb5\x94\x94\
-\x92R\xd4\xa0u\xabE\x0a\x8f\xde\xbc\x22\xe5b\x9e\xd2\
-\xd1\xc9Y\xf9[)\x8d\xbeH\x8a\x9b\x8a=\xd2f\xf6\
-\xadP\xc9dA)\xaa\x15\xeaD*\x93\xd7oN\x1c\
-\xc3N\xf0y\xa1\xcd\xd9Do\x22\x01\xd5\xc2\xc3\x17\xd2\
-\xfc\xe5!YQ\xe3h\xce\x8c\x05(\xeap%_)\
-\x96\xa0\xe9\xe8\xecEo=\x1a\xee\x8b\x1d\x0aJ\xbd\x1a\
-\x87d\x00\xb8P\xba\x84G\x834\xb9\x0cB2\x1bT\
-,\xcb\xba8\xed\x81t`\x07\xc5\xf1;\x8c\xe6\x838\
-\xec\x10\xaf\x1c\xfct^p\xe6\xdez\xc6c\x0f\x91!\
-^o\xe9S\x8f\xb5[\xfe\xdb\x9e\xbbd\x88u\xa6\xf8\
-\x0a\xa4\x08j\x19y6E\xc5\xd5P\xc9 \x145L\
-\x08\x0b\xaa2\xc1\xca\xe4V\xc0r\x8fKrt\xdc1\
-t\xd5\xaed\xe3\xc5k\xbf\xb8\x9a\xa5\xfb\xac\xc6\x8d&\
-h\xba\x15\xcfZF\x86\xf6\xc3eZ&\x8c\x869\xd0\
-\x5cH\x82+\x96w@p\xa1\x0c$J\xc9\xa8f\x18\
-\xa3\xc4\xd2\xe8\xcb\xf7\xa5\x0d!_\x84\xe1\xcbb\x09\xf3\
-\xd8\x8e\xbb7g\x89E\x05\xd6\xf9\x8a\xd4C\xaefh\
-\xc4\xa5S?\xbd\x0d\xf0\x95\xc2\xf0\xb3&\xd2/\x86\xc5\
-\xd0\x22\x8ek[\x0b\x8b5\x1f%\x1b5\x9a`\xea\xf1\
-%];\xaa\xc3\x8bc\xd7\x5c\xc6)\xbc\xfa\xbf\xcbK\
-;f^\x87\x00\xa7,\xa9\xf4\xc3\xeb#\xfd\x17\xa0\x88\
-]\x90=\xa1\xbb\xa4w\xa7\x8a\xf0 B\xc3\x9d\x06N\
-\xfb\x00\x0e\x8b\xf6\x1f\x07)bi\x87\x8a\x5c\xec\x9f\xfd\
-+\xba\xe2er\xfe\xfe\x07\x08/z\xad\x1e\xf9\xe4=\
-\xfc>'\xee\xe9\x97<\xe3\x95\xee\xb57\xde\xb6o\x0a\
-O\x1f\x1df\xc2\xd5h\x90QW+\x16Y\x90]T\
-\x9c\x11)Qp\xcd\x0b\x8f\x86\xa2\xea\x0a\x16\xa2%T\
-\xa4\x98\xe6\xa3\x1a\xb8H~}\x83{\x1f\xbf\xec\x03\x19\
-k\xd6\x1f\x89jD5g(\x19\xc3*\xfb\xe2\x1d8\
-/h\x22\xa8\x14r\xaf\xe6\x8a\x9eXg\xf3\xa5\xb0\x12\
-7o\xb6k\xd1\x5c\xccDb\x9b\xc1\x16A\xf8|\xe5\
-\xb6\xfd\x815\x17\xccj\xc5\xf9\xad{\x18\xad\xf5\xbe\xb6\
-)\xe9/\xf4K\xf3C\x041b\xadq\xd4\xcc5u\
-\x89\x84\x1c\xb2\x5c\x89\x0e\x9c8Dr\xb2P'\xcf}\
-\xf1?\x8aD\x876U\xe0h\x1b\x00Rj\xb7Y$\
-\x8b\x82X$\x8c\x1aa\x5c\xe44\xfe\xfdY$`\xca\
-\x0bd|\xf48\x81\xbd\xe1\xbc#{\xadpB\x8f\x9a\
-M\xaf\xc4\xb2\x9f\x0c\xbc\xf4\x81\x19{%\xc9\xbd*\xc8\
-\xbd\xf6\xd7-\x5cgq\x8c?(\x05\x15\x92H|\xf4\
-\x9d\x9c~S*\xcb\xbe\xf6\x0e{\xb7]\x1c\xff\xfb\xfa\
-\x95\xe1\xa2\xef\xbc\xd7\xa5\x93\xf5\xf3\xc6\x878T\x22\xa6\
-s\xd4\x83\x15~7\xce0*\x01\x95X\xae\x11[\xda\
-c,\xfaI\x0d+\xd6\x8c2\x87ZB\xe2G\x18#\
-\xa5\xb2m\x8e]\xaf\xde\xf3\xc2\xba\x1d\xf3\xbc\xc7\x90\x04\
-\xa8$J\xea\x15\xb3a\x92\x84b\x85\xab\xa6AC\xab\
-?KJD\xa5\x19\x97\xab\xb0\xf0}\x91\x05\xe9\xd2\x82\
-\xcfi\xd7N\xa6\x05\xaa,\x88\xd1[-\xedm(O\
-3\xad\x95N\x13u\xdb\x7f\x22D\xea\xe7\x0c\xcdL\xa8\
-RI\x84\xc4\x83\x06\xc8\xf3\x22\xb4\x89!\xc3\xa9\x10\xcd\
-\xdax9m\xe5\x9a\xd8,o5g\xa3\x82|\xe0\xd4\
-\xe1DI\x1a\x99M\xfc\x95!\x9fT\xd1\xc8e\x96M\
-z*k\x1e\x84\xb9\xac\x9f\xc6\xbd\xd0}\x85\xcbnh\
-\xcf\xa0\x15\x5c\xeb\x82\xdc\x0cBL\xeb\xb5JJ\xaf\xe6\
-y\xe9\x17\xeaH\x9f\xf8i\xfeu\x96\xc2_\x1fk\xd7\
-\xbd|\x93~\xea\xefk\xe5\x80\xcd\xcf`\xfaMg\xc8\
-\x1b\xbe\xf4?\x87\x86\x06\xe7\x8fz|='\x0b\x0ax\
-\x12k\xe0e\xb2\xd0\x8ei\x13\xe3 /\x8a31D\
-\xf2\x1cbn\x84Z\x9d\x19\x89X\xad\xc1Lh0\xfb\
-o\xb5\xe3\xb6]w\xc8\x1b\xf7\xc5\x0f9\xfc\x90A\x12\
-I\x12%\xf5B\xa2Ex\xa2jE\xc2Z\x16\xa8\x9a\
-$3\x8d2\xaf\x8aP\x16\xf8E\xc0\x99\xb6\xd8\x97\xda\
-\xae\x94@\x91^6\x1f\x05S\xceZ\x15\xdd&\xbf\xa6\
-\xa5\xe0#\xd2\xa5\xce\xd3>\x0c\xac\xa3\xa3\xcb\xa6\xa7\x1e\
-1\xc6\xde\xa1X\x5c\x0e\x17\x8b)$\x0a\x99\xe6Dr\
-\x9cB\x88\xae@r\xb49%\xe9\xbc\xfeg\xd0\x16F\
-d\xa2D\xe7\x8a\xd0\xc8;\x5c\xd53\x9c\xbc\xbf\xb1z\
-vT\xe3\xd1\x1c&\xa7\xad\xd8\x97\xc3\xe4L\xf8\xca\x9f\
-\x02\x0fm\xce^\xbc.q?5=\xfa\x10\x18\x07\xd1\
-\xad\xef&\x13\xd2\x0d\xf7\xa7\x0b\xc1.\x0e\x80\xf1\xb3\x88\
-\x7fd\xda\x87\x83\xd3\x91\xfa)4\xe4Y\xc9?\xe8?\
-\xe9;b\xad^\x97w\xfd\xf0u\x84\xa7\xbcC7\xfc\
-\x99\x8bG=R\xaf1]\xcf\xa9\x87\x84\xc4C\x92\xef\
-\x22M3\xb2\x16\x1e-\x0b\xa0\x10I<\xa9*\x9a*\
-\xe92\xa5*ufS\x83\xab\xeeK\xff\xfa\x91\x03>\
-\xb8\x8a\xd5\x13{S\x11\x877C\xa4\x81S\xc3i\x11\
-\xda\xa84C\x9c\x12u\xd16\x9e\x8d\xd2\xaa\xbe*\x14\
-\xbf)\x93\x5cm}O\xe6\x01\xb3\xe6\xe2?6O\x13\
-[\xe0\x97\xac\x5c\x12\xae\xac\xa5\xce\xf36\xed\xa1\xb4\xa7\
-\x1e\x10@\x0c\xb0\xfb\xa6\xbf\x8c\xa6\x8c\xd5!\x04!\xaa\
-a~~\xd8\xe5\x96\xa1\x12\xcb\xca\xec\xfc\xca\x8bE\x0e\
-[\x1eSYz3-t\x84ZG\x87`\xdeS\xd9\
-\x96\xb9=\x8e<~X\xd7\x0dy\xd6\x1f;\xaa\x07\xac\
-\x11\x81\x03zQ\x94\x95\xeeJdq\x80\x8ah7\xed\
-\x9bn3B\xaf\x81\xd0\x89\xb1)=8@\x83\x84a\
-\xad\xed\xe9\x00\xd9\xf5C\xc2\x9f4\xc1N?\x11\xf1\xd9\
-\x0b\xf9\xd0\xa9\x07r\xd27?\xad7\xbeq\xe73'\
-*\x9c\xa8\x90\xc5@L\x0a1T/\x93H:K\x96\
-\xfbb\xe1\xb4\xf6*\x8c+\xd7\xa0\xca\xf2V\x93u\xac\
-e\xcczGuW\x8d\x07\x9f9\xf1v\xe5\xd0\xa3\x8f\
-B\xb2:\xae\x02\xae\xaaT\xcb6\xbe\xe6=*\x96h\
-n#\x94\xd9<\x9b\xb2\x85\xc37\xdd\xb55\xcfX\xba\
-D\xa6\xb2\x005nR\xc4\xe6\xd9\x9a6\x9f\xacZ;\
-z\xd3^\xb8Z|\x15\x17\x8aL!B\x0ca\xbf\x07\
-\xfe\xfd\x1e\xa4`\x10\xd1Dt\xca\xdd\xe6\x19\x89\xb3\x22\
-\xcc)\xb3\xb8X\xa6*\xb6 \x85n{\x94e\xb2`\
-\x10\xf32\xc9\xf5\xe6&\xeac\xab8ql\x83\xc8\xd8\
-\x0a\xf4\xa0#\x80\xa5\xfdP\x12\xeb\xe3e{\xe9_\x0e\
-Jc\xa7\x0fT)\xf4\x96\xab\x19\xa4\x89\xa6\x1b\xe4\xda\
-\xb5r\xdb\xaf\x8bE\xea\x19\xfc\xdb\x17\x0e\x89\x17\xeeX\
-\xc3]/\xfe\x84L\xde\xbcr|4\xf0\xbc\xa4\x5c\xcc\
-8\xf5\x0cU\x8d\xd4\xd5\x886I\xf091\xaf\x92X\
-\x1b\xe0\xddl\x10WA\x9cA4b\xa2\xa4\xb9\xa2\xd1\
-\x11\xcf\xde\xf5\xec\xbb\xe7Nz\xdd\xe3q>R\xa98\
-\xd2\xd4\xc8\x93:R)*\xab*\xb1\x85\xb4\xb4hd\
-\xad\xf8^Z\xe8\xa8\x88\xb4B\x14-\x87\x976\xbf'\
-\x0f%\xb5.|\xb4\x89F\xa9=\xa4\xac\xd2Dae\
-Q\x94\xbf\xf0>\xd8B&\xb1A\x0c\xb5\x0bFoY\
-\x82\xe2R!\xd5\x22%\x0f&\x04\x11\xac\xd1 \xd1\x9c\
-R\xd3\xa7H\x9d[I--T\xc7Z\xd4\x85\xa2i\
-\xc5\x10,\x16\x92]Q\x0c\x1do\x84\xf1$\xad\xd9]\
-\xfb\x8d\xe1\x13\x93t\xfb\xb5\x22\xdc\xdf\x8d\x97\xd3o\xed\
-\x03\xe5\xe1u:\xf5J:\xa5\x07\xa6\xdf\x8d\x02\xad]\
-\xb8\xfa\xdd\xe8\x0b\xbd\x18\x06\x0b\x1a\x01\x06\x11\xf0l\xbd\
-^w\xfa_y\xde_\xd0\xe3\xff\xf2'Fn\xdc\xfe\
-\xb8e\x09\x87\xe3\xc1\xe6h\xc4@\x8cJ\x8cs\xa8\x0a\
-\x15*$i\x8d\x06\xd6\x12\xd5k.\x98f\xd1 W\
-\x5c\x9a\xc3\x5c\x83\x19/\xe8\xb7\xb6\x0e\xfd\xe5O\xc7^\
-|\x22^\x95!\x15*U\x8f\x01\x95\x98\xe0(\xd4\xcd\
-Z\xcb=\x94\x08KAs\x9f\x0fe\x84\xf9x\x9fH\
-\x09\x9e\xda<u\xa1\xec\xb6\x9a\x9f!\x16\xc2\x97\xcdF\
-\xc0V\xfao\x82\xd3y\x83o\xae\x22QL\xc8\x113\
-\x9d\x97\x10,g\x83\x96*\x7f\xd9r\x13\x11b\x0es\
-;v\x9c:<\xb7v\xc8H-0'\xf9\xfc\xfc\xe1\
- \xc6:\xea\x8c\x06\x8a\x98/\xa5\xcb\x8b&\x19J!\
--+\x94y\x88\xa2\xe5\x9e\x9bhE\x91/X\xa2\xb8\
-\xb1\x98\x0f\x9f\xb0\xcf\xfd\xf2\x95\x1do\xb5\x0fO\xbd<\
-\xba\x13n\xe7}\xa7n\x96>\xf1\xb3\xf5)b\x09\x83\
-)\xa6Y\x97\xd9\xc3\xe8.U\xa9\xf4\xd6\xea\xb4.y\
-'\xf4\xd6\xd9y\xc8\xa0\xd5\x1eYt\xd7\x13\x12\xc1\xd2\
-i8x\xee\xe2\xfc'\x87\x9d4\x9c\xd6\xec\xf9\xb10\
-b\x9f\xf8\x82\x12(\x01\xb5\x8c\xa4\x5c\xe3R\xe2\xbc\x7f\
-mo\xb6\x10\x8a5e\xf1\x11\xc2\x08C[fe\xd7\
-\x9b\xf7\xbcd<\xacZ\xbb\x1a\x95\x88\xd7\x88w\xb1\x95\
-l6\x97Wv\xad\xa4\xd3\xda82e!\xa9\xb5\xd0\
-O\x93\x081_\x94j%\xa8\xcd8\xbd=^(\x93\
-X\x9a\xa4\xe4\x16\xc6?\x7f\xe1[\x88\xcdB\x90\xa6k\
-\x99D\xca\x8cF\x0cb,Hl\x93WoX)S\
->\xce\xd7t[\xf4g\x1f\x08\x8d:\xbe<\xe4\xa8M\
-\xbaB{\x1a\xbd\xf0v[;\x8d\xb99\x1bDH6\
-\xcc$K\x97\x9cp\x84\xbb\xf0\xa0\xf7\xbb\xd3\xf5\x07r\
-\xe2\x92\xbb\xe53\xb7\xbe\xd4\xda\x14e\xacO\x98\xd3-\
-\xb4\xe8T\xf4\xec'A\xd8\xa3&\xd4W\xf4\x95\x1e\x85\
-\xa9^\xe1PW\x9e\xcf\xc3iDi\xeb\x7f\xc0~8\
-\xf1A\xe3\xdb\x1f\xb4\xb0\x81'\x0e\x0b'j\x91We\
-H\x91\x22\xc6\x06i\x12\xcbf\x12\x99W\x8bo&d\
-\xcd\xb5\xa8\xc4\xb0,\x92\xcf\x1a\xb5\xaa\x90\xbeg\xeba\
-w\xed8\xf8\xbc\xa3\xa9\x98#U%M\x0a\xa5aW\
-\x1a\xa6k\xc5\xd4\xd2\x82 \x8bjkY\xc4j\x0e\xa7\
-&\x07\xa7\x94\xf4k2\x81\xa4\x9c\x19Z\xa1\x8e\xccs\
-rZe\xaar\x06q\xadU\xb3\x0a\x03\x8e\xd6\x19\xc5\
-1[x#\xe6\x07d1\x08\x83d\xa0\x14\x0a\xfc\x84\
-'\xca\xefX)a\x18\xa3a\x82E??\x04\xb3\xd9\
-\x82\x8a]\xa25\x05\xe7^1u\x98jI_\x90\xd6\
-R\xa5\x86\x14\x1e\xbf\x89\xeb7\x9bV\x9cb?\xfc\xfb\
-\xe8\xa3?\xf5\xbd\xa3\x96\x9fq\xc4\xbd\xf6\x9c\xe3n\xd5\
-\xb5\x8al>\xe2\x93\xc0r:\x84\x13\xdd\xa0\xcd^\x1e\
-\x9c.\x94\xf6\x1e\xea\xd8]1\xf6A\xc8ht\x99A\
-\x94\xde\x1d_\x0f\xd9\xae\xd2\x7f\x19\x98\x87\xf2#\x0c\xb8\
-s3\x97\xef\xf7\xactv;o\xa9\xa6\xcc\x96\xeb\xbc\
-j\xa3h\xccS\xcdQ-!\xba&\x02\x8e\x15\x00c\
-\xeb\xa6\x15\xceX\x9c'qUF\x7f\xf1wn\xfa\xc6\
-Q\x9f=\x90td\x18s\x01\xa5\xe8\xaau4\x8d_\
-\xda\xaa\xac\xf3\xdc\x9b&\xa2\xa3e\xf5UK\x1a\x82\x0a\
-\xadu\xc7\x9d\x1a\xce\xb4\xad\xc3\xaa\x0c\xb8\xe2\xfcCc\
-\x91(\xcf\x87\x8eeb\x5c\x1a\xb6k\x1euG\x02\xeb\
-\xfc\x0c\xd4\x02\x19\xcbn\xd9\x18\xadPjT!\x9b\x9a\
->%\xbb\xd1U\x85J\xb9#\x13 \x16u\xe6h\xb3\
-\xe0s\xf2\xa0\xc5\x19\xc5\xbc\x18zy\x81\xf37=\xbc\
-!Dk\xc7OK4\xa7Y\xd5\x15G~O}\xfc\
-X\xee\x93\xb3\x9f\xf3\xd1\xddq\xa62'S\x8dUF\
-\x0d\x81z/\xda\xb1t\xa07\xc4>\x95\xd4N\x8d!\
-\xbd\xd0\x1e\x19\xa0(\xd5\x89\xb7\x13;T\x96;\x0dD\
-\xa1{\xfbd\x8b\x8f\xdfG\x15\xad\xf5o;\xe3In\
-\xf8\xbfOG\xffF\x9e[MX!B\xddE4B\
-\xee\x04\x95\x80O\x0a\xb3l\xf2JPC\xa4\xa0\xd2.\
-\x9c\xb6\x81\x8a\xe0\xb7\xec\xe6\xef/\x9c\xf8@\xca\xbeG\
-\x1c\x89\x8b\x11?\xa6\xf8\xac\xd0\xb6,`\xc8\xf9D\xb5\
-\x18>\xb4\x8aGB\xdb\xb2\xcam\x94\x03m\xa3\x1d/\
-P\xce\x97b\xf0\xcc\x17\xa2\x16\x9dn\xc9\xc4\xb4\x05\xd7\
-]0\xed\xa1\x08\xd6\x84@\x17\x19\x87A\xb9\x06\xa2\x10\
-\x04\xdf\xd8\xb0\xfd\xd8\xec\xeai\xaa\x05T\xb3\xa0\xdb\xca\
- \xceB\x12h\xe4\x05\xd3\xa8`\xf77\x9bg\xe3\xfc\
-\xb96\xcbf\xd6\xd6\x17\xd0\xbe\xa6WnXH\xfd4\
-\xbb\xe2%|\xfbO?\xfb\xcd\xb0{`\xea\x9eQ{\
-\xe5u\x9f\xb4/1\xd3\x94\x9b~8<\x1a\xa3\xbfJ\
-Z/\xbd{\x1e\x06=\xa6\x17\x97\x9f.d\xb5\xc5l\
-\xe2^\xc2\xb7\xbd\xa5!\x92\x04=d\xad)O\xfc\x98\
->\xd1#G\xac\x1a\x11\xbf~\xa9\x0c/\xdd\xdb\x96_\
-\xe6\x96\xea\x1c\xcfO<\xb3\x89\xa3bE{\x9c&J\
-EK\x86\xbd\xb5Q\xb4\x9c5\x15\x0c\xe6/R\xa9e\
-\x1f\xb3\x06s\x1f\xdeu\xe4\xfd\x0f\x1e\xf4\xe4\xf5TD\
-IQ$\x14\x86\x9b\xca|qj\x81\x7fhGl\x9a\
-\xcb3\xb7\xb0\xbdy|]\x9by\x85Y+\x9eo\xf2\
-sT\xda\x0bT\xf3#\xa3IYnB\xd7\xd2F\xca\
-\x17\x16~\xb7\xdb\xcdk&\xbaQ\xc0iB\x88\x91h\
-\xd9\x9e\xd9_j\xc7\xa4\x8c\x15*)-\x01\x5cS\x88\
-1\x032\x22\xb1\xe8=.\xddM\xa4\x94\x1b\xd16C\
-W\x9d\xef\xc8*\x97(mr\xf7\x0dCr#\xd6\x02\
-\x81\xf1\x95c\xfc\xdb\xbf\xbe\xff\x07o\xfab\xe3\xca\x15\
-\x1f\x91w\x1fz\x89\xae\xa8:\xe9CE\x87\xde\x0b6\
-\xf7\xaa\xde\xd2'G\x94\x01\xf8\xfa\xb1C\xd5X\xba\x14\
-\xa3\x06\x957\x97^\xfc\xfb\x05\x09\xcb\xca%\xf0\xd9\x8b\
-p\xfc\xc7\x1b*?\xce\xcfu\xbf9b\xc6\x8f\xff\xf3\
-\xb3\x93\x91\x0b\xbe\xeb\xe3\x96\xf0\x84\x89*k\x93\x0c\x9f\
-G\xf2,!EQ\x99#h\x8eY$H,\xf86\
-\x80\xe4\x8ae\x828Ef#\xa1R\x92\x06\x02\xc8\x9d\
-\x99\xee\xbe\xf4\xc0\x8b\xf6bl\xd52\xb4b\xc8\x12\xc1\
-\xc7\x08\x09\x8c\xe0\x0b\xfc\xdd\x8aeu\x0a\xf1\x8d2\x8c\
-)Q\x93\x22((<}\x81\xe4\x94\x81U(\xb9\xf5\
-V\x8661\x16z\xf7H\x19\xd2\x94\x8a=\xb1Y\xe4\
-\x8a\xf3\x86]b\xfaM\x10_\xb4d\xd4\xd9|\xd6\xd2\
-\x82(]\xdbD\xbbh\xe1\x0d\x89\xa5\xf0\x85\x05\xc2\x5c\
-\xbe\xdf\xce\xcbn_\xa1,uR\xac~^nDk\
-\x8a\xe8\x1c\xb9\xe4h)\x90\x95+D+2\x97\x82\x10\
-\xa4E\x85\xb6\x5c\xe5E\xdb\x08k\x16\x8ag\xd7D\xae\
-f\x03\xf9\xd6Ls\xf20\xcb\x92\x15g\xf2\x82\xd7>\
-\x8e\xf0\xec\xf0\x9dG\x07\x96\x9fg\xc2i/S\xd6\xff\
-\x8bp\xc0\xbb\xed\xe0\x83\xb17\x9fS\xfe\xb6{\xf5\xb3\
-\x97\xdc\x8c.\xaa\xa4\xc6\x1e\xc5\xd0n\xa8\x8eu\xe1\xcf\
-\xc7.\x05\xaf\xd8\xa7H\xd5S3T{\x8d\x8c\xfb\xb7\
-\x8b\xbd\xf2\xcb\x87\x85\xcf\xbc\xedQ\xd9){\x9e\x17\x7f\
-\xb2ayl|\xf5Y\xe1\xed\x07\xfd\xcbH\x98\xe1\xd1\
-bTE\x8b\xa5\xe9\xc50\x97c\x96\xcf\xeb\x17\xb4\xb1\
-[\x0cA+\x9eJ\xde \xd7\x06\xf5Z\x8as\xa0\x09\
-\xe8?\xcf<j\xf3\xd4~O>\x0cM\x8c|\xba\x8e\
-D\xc3\x0d\xf9\xa2\x0dKc\xabh\xd4\xe4\xd9\xb4\xc1\xf4\
--\xd4\x86fH\xd1\x86\xd1\x17qwYYm\x0b\x95\
-\x9a\xc2\x83\xda\xc6F\x9b\xc7\x9b\xda\x15od\xc1\xd2\xcf\
-\x0b\xe86\x8b\x12\xdbh\x8b\xc2\xc3\xb2\xd6j\xa1\xa0E\
-;\x9f\x90M\xd5.\xcc\xafh\x04Y\x84N(\xd1E\
-r\xc9\x8a_8!\x22\x0f\xe9Qhn\xb1U\xfd\xce\
-\x9b\xa5\xbby\x94,4\xeb\x18\xc1\x08\xbb\xb3D\xa9\x98\
-'\x19Qj\xee\xd5\xec\xff\x8b\xb1\xf7\xff\xef\xc1v*\
-u9\xeb\xceK\xed\x84\xdb~jl\x98\xb4;\xeex\
-\x0e\xdf\xbd\xb1c\xe9\xbf\x97:B'c\xeb\x86\xd0\xc4\
->\xb3\x84\x0cH\x82\xeb\x16\x0a\x0d\xa2\xc3\xbf`\xff\xda\
-\xa3\xfc\x0c(/\xbf\xe5\x22\xb6\xed\xb8\xdb\x0e\xfa\xf0?\
-\xba\xf3\x9fp\xab|\xea\xb2\x07\xe2\x0bv\xfd\xd7\x1e>\
-pzE\xb1Pj\xba\xbb@\x90\x1a\xe2\xf3\xc2\x04\x9a\
-8G\x0bO\x11\xb0\x8cL=IZa\xc4rB\x06\
-\xe1\xfa\xfb\xb8\xf5\x1b\x07~`_*n\x08\x9fz*\
-\xa3)\xa2\x05\xdf\xd0\x198\x8b\xf3\xc3\xb3\x99\xac\xca|\
-\x15\xb5\x99\xa4\xea<\xa1b\xfe=i\xd2\x90\xdb\xc2\x22\
-\xa3%\x1f\x22,\x1a$\xb60\x94\x9a\x8fq\x9a}O\
-\xdd\xc2\xd4\xb6\xfai\x8b\xfe)\xf3\x82\xd4\xe6\x889L\
-\xdep\xebY\xe3\xec\xef\x85JY\x1a\xb3Xl\xd5\x92\
-\x9c\xd8\x98\xc3\x89\x15\xdc\x1d(t\xf2\xdb\x0e\xa7}8\
-Z\x13\xcb\x97BN\x5c\xca!\xde\xfc\x8efF\xd8\x99\
-\xa7\x05\x8fi\xd8\xa7H\xe5\xb1\x5c\x7f\xdb\xc9\xaf8t\
-Z\xcfZ\x01\xa7<2p\x92{\x80\xc7\xb1\x8f\xc0a\
-vO\xf2\x9e~U\xd5N\xa8\x8f\x0d\xc0\xe4\xb4>\x95\
-Z\xe9\x13\xffwC\x7f\xa4_\x1c\xdf\x8b,\xd7\xab\xf3\
-\xc6R\x84\x03\xf8\x86|d\xeb\xf1\xb6eb+\xec|\
-\x95\xc9g\xb62\xf9@|\xc1\xa8gTA)Z\x07\
-\xa3\x8b\x88\x86\xa2!\xaf\xa4\x8c\xc4\xa6g\x92\x82=\x18\
-,\xa3\x11\x12\xbc\xa4T\x92@\xb4@\xf6\xcc\xb9sv\
-\xb2\xd7\x01\x07\xe3\xbc\xe1\xbc\xe0\x13A\xf2\x88wB\xc5\
-\x175I\xac\xecMj\x12\xc9\xca6T\xb1\x85\xfd\xac\
-\xcddW\xad\x1d\xea\x94\x92\x89Y\xaa&\xb4&\xd3R\
-\x1dM\xacT\xa1\x97VQK\xcd\x1eB(n\xc7\xf0\
-;^\xdc\xa6\xf0\x9fP\x84Ae^\x12\xcb\xfe\xdd\xbc\
-Q;}\xf3\xebnu\xc2\x88\x96Z8Z\x10\xcd0\
- \xc9\x086[\x80\x9f\xf9<Jk\xc1\x95\x9e\xb8\xec\
-!\x10-I\x14\xf3=\x02\xcd\x15\x87b3\xaf\x8a\x0e\
-\xa9G\xc2\xce,\x85$I\x881\xc39\xd8\xbc\xed]\
-w\xbd\xf6\x0d\xfe\xdf\xfe\x82\xdc\x9cF\xd9\x92\xce\xe8~\
-\xc9g\xe5H\xae\xd2bq\xed\x85u\xe9\x1e\x9c\x9e\xc5\
-m\x85\xf4\xc0\xe5;-\xd5\xd3i?\xda\xa5\x8a\xbc\xb8\
-\xf5P\xba|\xbeX\xd2P:\xe4\x08,\xa6%w\x9c\
-v\x1aD\xfb\xf9\xea\xeb\xed\xbd\xd5\xff\x95\xab\xb7\xff\x99\
-\xbb\xd6}_\xcf^w\xf1\xcat\x8e\xe79\xa5\xd6\x5c\
-v@\x03F\x8e\xd3\xd2\xa0l>\xb2n\xaf\xd2\x12\x0b\
-0Q\x1a5\xa6\xa2\xc0\x0f\xff\xce\xed[\x9e\xf0\x81'\
-R\xf1\x0e\xc9\x0d\x97\x16\xb0\xa2wE[\x85/\x0dR\
-\xdb\xd63\x9c\xf7\xea\xf3\xf4\x04)\x17/o\x12\xceh\
-\x838\x9b\xd1\x0c&\xad\x81\xb0\xa0\xe0\x85\xb4\xe9-K\
-G\x07$\xed7\xc3\xe4!%\xa4\xc2\x077{jm\
->\xcc)?\x8e\x08\xbb7\xdc\xfd\x89Uw\x1f\xea\x0d\
-\x97AM\xa5\xd4z(\x03\xa58K\xa2\x0dr)Z\
-\x08\xad)4\xa8\xa5\xe77\x0a\xd3,\xa5\xcfZ\x95\x03\
-\x99WX\x9b_!F\x90i\x122[>J\xe2\x95\
-\x9a4H\x5c\x03\xaf'\xfd\xcfw\xb3\xe7\xfd\xf6r\xab\
-}w\xd9KE\x9f\xb0A\xd6=e\x03ck\xae\x14\
-\xd6m\x1d\x14}\xe9\xc7\xbb\xef\x15\xa2H\x1f\xcf=\xc8\
-\xdf\xa0+\xf5\xf4\xe4\x11i/X(M\xa3L\xbcb\
-R\xfes\xfb\xb7\xec\xc0w\xb9\xf8\xee\x8f?%\xdb|\
-Mx\xaej\xd1\x0c\x1e\xa4P\xf1\xd5XTjqh\
-p\x85\xe8i3Zn>\xa2\x80x\xbc\xabQ\xab8\
-*\xbbgy\xf0C\xfb\xbew\x15#\x13\xe3\xc5\x22k\
-U!\xe6y\xa1\x8e\x90\x08\x04\xc3[(\x89c\xf3\x84\
-\xb0vD\xb1\x19\xf2\xb4\xe4\xf8\x9a\xe1\x8b\xb4\x85/\xed\
-|{\x99\xaf\xbe\xb6\x0a\x5cFgl\xbe\xa3cog\
-\xe9K\xc7\xf5\xb2\x9b\xa6\xd7\xf2\xc7\x22\xe4\xb50\xba\xeb\
-\xbb\xb7,\xd3XI\x8dD\x9b]0E\x17\x989%\
-\xcff\xa8\xb8H.\xc5:W4\x1bL\x9a\x14\xe4\x16\
-\x8c\xd1\xa4!\xcf\xbf\x96\xb6\x5c\xc0\x9a\x95\xf0\xe9\x90\xc2\
-\xf0\xea\xe5d\xa1NR\xf5H\xeaHu'\x99\xbc\x9b\
-7\xbd{\x1d\xcfz\x09\xdb\xd6x\xdb{E\x90\xc7\x9e\
-\x1eu\xff\xfd\xbe\xda+\x867\xbak\xd6\xf7#\xaf\x19\
-\xfd\x17]\xeeV\x15\x96~\x84\xc9\x0e\xdb\x88]f\x86\
-\x05\xb3\x91\xf6h \x88\xe2@\xef\xc7\xddu\xfe\x13y\
-\xc6\xa6\xef\xd9\xa5\xf7_\x93\x8eNr^%!+3\
-\xc4\xc2\xc9\x1b.\x09H\x09X6Y\x86\xb1\xd4&h\
-\xb2\xe0\x8b\x95\xa0R\x92\xb9H\xf8U\xdcc\xea\xe6}\
-\x9e\xba\x16\xf5\xc5\x10q(\x89\xf3\xa8\x16\xcb!\xa8*\
-\xd5hd\xaeh\xc2+H\xba%\xad-6\x91\x99\xd2\
-\x8b\x9b\xccS\x0bL\xca\xbdZ\xeb\xf5\xbc\xd8^)\x1e\
-e2\xdf\x9de\xe0\xa2\xb6\xc5\xe6\xa5Q\x07Yp9\
-\xacTXk\x0e\xa6\xe8\xda\x8c\xdd\x8a\x12\x924\x07F\
-\x890Y4,\x8fd\xd3\xbb/\xaa\xfetxB\x98\
-h$X\xa0X\xd3\xaa\xa1$\x08\x89\x9b$\x84i\x1a\
-\xe6\xc0\x8a6B\x15\x8f3\x8fk\xca\xa1KA\xde+\
-JsE\xc3\x8eH\xf9\xac\x91 \x06\xe2\x8bf\x1e\x97\
-1\xfd\xbb\xad\x1a\xa9zE\x1d\xa4&\xe0@\xaa\xcaH\
-%eG\xf2\x16\x1ey\x9a\xfd\xed\x94\xc3\xe4\xbc/<\
-\x83\xd3v\xef\x85{r\xc3\xad:\xb5+\xfe.\x1d\x88\
-b\xed\xfa\x9b\x9d\xbcl\xe8\x12\x0e\xc9\x00\xac\xd0n\xbd\
-\xc0\x9d\x94\xda\xe2\xa2\xe2\x96\xf4a\x87v\xd4\xce\x5c\x88\
-\x94\x97\xb1\xe39\xffz\x00\x81g\x85\xeb?\xb1\xeb\xd1\
-\xa90\xacE\xd4\xec\xb4\xe8p\x95X\xa4\x9f\xd6\x9e\x1b\
-FC\xb5@'\xca\x9a\x10\x16\x22y\x88\xe4fd\x1f\
-\xb3\xa7\xce1\xbe\xefj\x5c\x88-\x8eL\xd9I\xd1\xfa\
-sM\x1eK\xd3\xa0\xcb\x04T\xa5m\x06\x906\x92Z\
-\x19\x16\xb5\xc5\xbe\xf3\x88\x906\x13\xe2\x87\xd6\x04\xac\x03\
-\x9d\xb8)%X\x04\x1d6\xdf\x9d\xd8\x04\x85\x16\xb11\
-\xe7Y\x0b\x0b{\xb7Ldx\xea\xcf\x1bO\x9f\xbb&\
-'P'\x92\xb9\x22\x13\x89V,\xf8\xd6\xc8f\xa8z\
-+\x98\x99-\xefm%\x07\xbfp\xf5\xadF\x00\xa4E\
-[0\xa3\xe0\xe2\xe3\x8b\x8e\x04\x09\x84\x10\xa9[\x02W\
-\xdc]\x9d!M\x9b\xb9\x8f\x169\x92o&\xf6\x8f\x93\
-\xf7|\xf6\xc8\x83^y\x14\x8f\xb9`7/{\xc9\x85\
-v\xc8\xc7\x1f\x9b\xcd\x5c\xed\xa1\xbb\xbe&]`\xc2n\
-^yq\xec\xcd\x00\xf5\x82\xd8\xa3If\xd0\xe3\xe8&\
-G\xfe\x90P\xa7+\x99\xa86\x0b\x1b\xef \xdev\xd8\
-\xb1$\xef{{e\xef<\x9c\xee\x04\xdf^2\xd2\x08\
-\x16\xcb5f\xdb]\xa6,X\x9f\xcaT\xca\xa5,\x03\
-\x8d\xeb\xb7\xb1\xe9\x86\x83^\x7f >\xf5\xa4\x15\x8f\xfa\
-r\xdd\xd8\x12\xb1i2\x80[\x0d\xe2\xcc\xb7\x5c/8\
-\xd2f\x0c\xdf$\x9d\xb5\x81\x90\xd2B\x7f\xda\xe2|\xe6\
-\xbb\xb1h%\xc6\x9dQ\x85\x05\x01FK@\xaa\x0c4\
-\xb4\x8d\x81\x09-\xa5\xb4\xf9V\xde2xR!\xd4\xb3\
-\xa3\xa7\xaf\xb8\xff\x98\x84e\xd5\x88&\x85Pa\xa8\x17\
-B\x839ub6\x87s\x05V\xaf\xdaN;(\xd1\
-\x1b+\xc2\xbd\x82\x8bS&\xe5b\x88)V\xae\x10#\
-Z\x0c\x02$bZ!^?}\xf0\x04i*\xa83\
-\xd4\x15\x18\x92\x0a\x883\xd2%klj\xea\xa5g\xac\
-\x5c/\x7fx\xc2Y\xf2\xc0\x9e\x8f\xd0\xf7\xfd\xe1I\xba\
-\x82\xb1n\x8b\xa8\xc9\x80\x8d&\xdd\xd0\x9b~j\x0c\xd6\
-'\x87\xe87x\xbaU\x92\xbb\xfei\x97\x1f\x01X\x82\
-\xb3\xea\x95\xff?c\xe7\x1dg\xd7U\xdd\xfb\xef\xda{\
-\x9fs\xcb4I3*\xb6$\xcb\xc6\xb8\xe1n\xb0M\
-\xb1\x8d\x09\xcd$\x06\x92\xe7\x00\xa6w\x03I\xc8#<\
-\x8a\xe1\xc5\xc1\x81\xd0\xf2\x021%\xc4\x04\x1c\x08<\x08\
-\xa4\xbc\x00\x06\x82!\x14\xe3\x98\xe2\x86m\x5c\xb1\x5c\xe5\
-\xa2.M\xbf\xf7\x9e\xb3\xf7z\x7f\xec}\xce=3\x96\
-d\xf4\xf9\xdc\xcf\x8c\xae43\xf7\xdc\xd9g\xef\xb5~\
-\xebW\xd0[>\xf8/\xd9i\xe3\xdf]\x17\x02'%\
-v:\x03(EQ)qf\xc8u\x5c\xd2\x1dV\xa5\
-N#U\xd7\x8e\x08\xee\xbc\xf2\xf5\xbb\x98Z\xbf\x11\x9b\
-TpMK\x0f\xd3xo\xad\x8d\x9e\xf4\x06\x1aX\xfb\
-\x10z\xac\x1b\xd9T\xaa\x98Zc\x9b`\xccjp\x95\
-\x1a\xe0\xe6\xa2\xaf=\xef\xeb\x9c\x05i\xd8\x7f$NN\
-\xb5\x88+n\xf1\xb2M$\xa4e\x89ht\xb2\x5c\xb2\
-\x14\x94\x002\xd89\xff\xca\xf9On\xb3\x8eV\x00\xb5\
-\x06\x17L\xb2\xeb-\x09\xcc\xe1]IY\xbd\x80\xd08\
-K\x12\x1a\xaa\xb2\xcc\xbcG\x1bo\xb4\xc6@\xd2\xb2T\
-\x825\x98\x96%\xdb\xdec\x8e\xd1\x0d\xeb\xb1.\xa4\x05\
-\xaf\xb5\xb6\x0b#\xb8\xac\x8f_|\xd9\x9f\xbfx\xf4\xc8\
-\xe7|\xf3=e\xfe\xfc+\xcb\x07_\xf8!s\xf0\xd1\
-{\xf4\x00l\xcc\xe5\x0b\xd3\xf0h\x03)\xc3\xfe\xb5\xbb\
-\xba\x8f\xaf[\xfe\x7f\xed\x01n0s\x00v\xa6\xe1\xb1\
-\xbd7\x97\xa0<\xe6\x00\xdd\xaf\x8e\x90\xc9\x04+\x0d\x87\
-\xac\xd0\xe3\x17\xb7\x1cB\xc9a\xa913\x95\xb1\xbax\
-\x8c\x1d\xd2\xb2*\x8a\xd6\x92\x7f\x1cx\x09\x00\x00 \x00\
-IDAT\xef\xa9\x1a\x97\xe6@)~\xf20w\xcc\
-=\xe5-g\xd1\xca\x5c*c<\xd6\x0a\xc6\xc8\xa3\xa8\
-\x09Nd\x09_>.\xd8Duk4\xaf\x92\xc6e\
-\x91\xad^\x99FI}\x12\x98\xe6N\x8f\xd4\xa5\xd2\xa3\
-\x99\x95\x0cY3\xc9\xaa\x84\x86gT\xd0$\xf4K<\
-S\xaa63z\x14\x0e\x81\xa1\x04\xe4\x86\x92\xce\xaeo\
-]\xfb\xda)\x8e\xb1B{\xda0_\x08\xa53X\x0c\
-\xc6\x05\xca0\x8fH\x19y\x9f!B\x96\xa1\x8cTW\
-\x95\xe1Y\x13y<i\x18(2\x9c\xe0\xfaH\xc1S\
-\xa0\xc4 Y\x86~\xf9\x16f\x19\x1f\xcb\x11\x13S\x08\
-L\xb5\xdb'\xc9&^\xe9\x8c\x0dxd\xe7\xc76\x7f\
-Q\xf9\xd6\xc6\x9f\xcb/\x8f\x9a\x96\xcd;\x1fS\xf7\xba\
-\xaf\x00\xe5\xfd\x89\xbfu?Mr`\xdfF\xc5\xfb\xd3\
-\xfc\xee\xeb\x04ZN\xa0\xf3\x8f\xa1\x05X\xfe\xf3\x97\xdc\
-\xad\x8f:\x1aJ,\xcf\xc5\xeb\x85\xffrr\xd8\xbe\x8b\
-\xa7e\x96ne:\x9cI\x1c-\x99\x86S\xa4\x0e}\
-\xddE\x87HI%\x15Q\xc0\xbfw\xc5\xbb[\x8cM\
-\xad\xc0\xf6\x142\x8d\x88\x83TJ'\xa1A}\xaf\xeb\
-\xf6\xaaa4\xcbz YV\xf2\x98t\x12\xd4\xfb\x80\
-\xc8\x12\xbf\xcc\xfa\xadL\xe6\xc3\x9a\x00@i\xb0)\xab\
-\x0dv\xa9d0\x05G\xc8\x10\xd3\xafv\xfaj\xe7G\
-\x13\x9cY\x91\xdc\x10\xfa\x0bs\x17\xcf\xbf\xfdA\xa0\x9b\
-\x1b\xf2\x11C\xb7\xaf\xf4\xacO\xb7\x8fG\xca\x05\xac\xf5\
-\xf8 \xa8\x0e\xa3\xb6\xa5\xc1\xbb\x97\xe6\xd0\xaa\xf1\xdb\x8a\
-7\xb4C\xb24\xd9\x18\x18B0,\xfc\xe3]S\x8e\
-\x91V\xe2*U\x0a2\xab\xc9\xda\x1c2\xb5hg@\
-k\xec\x94{^\xfb\xb7o<\xe7\x86\xff\x1a\xfc\xd7O\
-6\x96;vf!\x07&\x19\x95\xac\x0bc\x93\xa8\xb5\
-\xfb\xdde\x0f\xe4\xb4\xb0?\xc3)\xd8\xbfW\xe7\xfe\xd4\
-\x7f\xca\x81]\x95\x0d\x8f6F\xdb\x9f\x1f\xd0\xa3&\xb7\
-\xcb\x05x\x002\xc7<\xcfa\x82\xbf\xbc\xe8N7\xbe\
-\xc8\x0bD\x99\x13K\xee\x05\xb5\x05\xa5z\xa4LH\x8e\
-\x091v^@q\xd8r@\xcf\x00\xb9#\x0f\x11\xef\
-\xf1W\xee\xe0\x9e[\xd6\x9d\xb1\x96\xeex\x0b\xd3R\x9c\
-\x11\xca\xb2\xacQ\x16\xd5\xa5\xe0\x8aM\xaf\xaf\x9a\xb6\xc2\
-R\xdb\xbf\xfa\xd2k\x92\x99,\xc1\xfa\x1b\xec\x81\xc8\xc9\
-\xd1!\xce\x1fA\xd8H\x9c\x0e\x8d\x89kh:y\xa6\
-\x89T\xa8i\x09\xd4~eB\xfcX\xb7\xeeiL'\
-\x02e\xaf$xe\xc7W~\xfc\xaa\x89\xe2p\x05\xed\
-+}Q4S\xb22\x1d@:\x0fY\x9fB\x05B\
-NV\xf9_Z!\xd4\x83\xbf\xf4jB\xa5\x07\x96\xa1\
-g\xbe\x80:O(-\xc6f\xe4\x1a(\xe6\x07\xcc=\
-4\xfa\xd4\xa3\xb0.D<\xc8\x82\xb5\xa9\xdc\xb1 \x19\
-\x90\x81\x94\xc2\xc8\x8a\x82\xc1\xc2+\xed\xab\xdf\xbf\xfe\xba\
-\xbf\x9f\xcf\xda\x9f\x19q\x9f\xe4\x8dr\x0b\xe7\x9a5\x97\
-`g\xefxF\xfe\xc7\xa7^,O`j9o\xff\
-@\x14\x019\x00\x97g_h\x90\xfe\x16\x92\xc5f)\
-\xc5\x01\xd8\xa0<\x86\xc2K\x97\xe3\xf8\xcbs\x8e\xd27\
-_\x09<\xe0\xf7\xfcm\xff\x04\xa3lpq@d\x0d\
-\xa9\xff\xf4\x18\x1bu\xa2u-\xea\x05l\x89\xba6#\
-ZR,\x04\x16G!/\x02\xfa\x9d\xb1g\xb7\x07k\
-\x8f?8\x8a2\x82\x22&\x90w]=\xe2\x97\x98\xbc\
-V/Z\x9b\xd0\x9a\xa1]\xb7\x0cq\xfaGeH5\
-v\xf5\x0a\xafo\x08\xc4\xd1\x8a\x9b3,\x99\xb5\x1a<\
--y\xdf\xb5\xa6&\x84ZB\x98\xa44\xba\x8fC7\
-}\xafPz\x9a\xf2\xac\xc1\xfc\xdc\xc5\xe6s\xe5\xb8\xb2\
-R\xe3<X}\xe5\x94&h\x16\xe8\xcfO\xd3\xb6\x9e\
-BR~X\xcd\xc3\x19\x02E*\xa9\xa95\xb2\xd4q\
-@\x86\xbc|\xf1!\xca\x14\xb3\x0c\xf7_w3\xe8w\
-G\x1d\x92+\xc6\xa53\xd9$\x188\xee\x00\x94\xb6\xc4\
-\x96\x82\x16\x9e\xee\xc8&\xef\xf4\xc5/\xfb\xc5&]g\
-\x83\xbc\xf7)\xf3\x1cs\xe8I\xfa\xd0-\xaf6\xf9\x85\
-\x93\xfe\xc8\x9b3t)\xe7f_5x\xd8G\x99#\
-\x07\x98\xf2\xeeK\x04c\x1e\xa3\x5c1\xbfEs\xfc\xdb\
-\x0c\xb6j\xca\xc2\x01db\x06\x94\xb0\xf5~\xce\x1b\xcf\
-(MD\xc1\xd5F\x17_kB\x92p\xa7\xb9\xaa\x1f\
-\x8e\x83\x82Xjl\xac(X\x9cU3\xf8B\xeb\x0f\
-<#+'\xc8\x5c\xfc\xd1\xceF\xe7\xb6\xe1pI\x96\
-\x04B\xf90\x5c\xe8C\xd0H\x96\xc0\x95\xa6\x1a\x1fW\
-'\xc1\xd2y\xea\x92\xcd!\xc1\xebC\xa2o\x05YV\
-;:\x15\xd0\xd3\xd8o\x9b\x96\xdff\xa8M\xd0FM\
-\xa6\x02b\x0c\xa1\xf0\x94\xa5GZnj\xf6Gw\xbe\
-\xd2\xfdj\xcaF\xb2EH\xd0\xb0\x94\x91y\x11\xc2^\
-\xc4\x0d(\x86>\xb5\xc9x\xcbDQI5\x1b\x0e\xb5\
-\x0c2\xee\xfa:\xd4\x04\xd7\xb4\x85\x10\x8b-C\xa0\xf7\
-\xad\xe9\xf5#\x85\xedj\xd4\xbdX0V\xa3V\xd8&\
-H7\x0d\xedB\x16\xd0Biw\x1d\x92_\xf0o\x0b\
-\x1f[y\xca\xbd3z\xd8\xd3\x7fn\xf7\xbe\xfd\xe0l\
-\xc5\x03\xef\x0c\xff\xef\xb2\xf3\xb8|\xc5\x7fq{g\x9a\
-\x03\x94.\xfbj<e?\xa5\x07\x07@\x8b\x94\xc7\x16\
-\xad\xef\xcf\xb7\xd3<\xc6p\xedQ\xdf\xcf\x1c@\x14\xa0\
-\xb0G\x94\xc3l\xb7\xe4\x0ck(U\x09\xa5\x12\xca\x92\
-\x02\x0fn8\x9c\xafL\xdc\x15EC\xc0\x87\xe8\x10\xe0\
-Z\x86V\x01z\xd5\xf4\xc4\xc3\x8b\x87\xfc\xce\xd1\x98B\
-\x09\xc1\x93\xb5\x93A\xf8\xc07\x1d)k#\xd7\x08\x84\
-\x0ew\xe3\x0a;\xaf\xdag\xb3,\xa4mH\x87kn\
-\x162\xb4\xfb3!\x85\xeaP/he\xa8\x0f\x0b\x0d\
-f\x9a.\xf5\xb1_b\x89\xa9\xa9\xeeZ\x92\xccV\xc1\
-\x9f\xc9\xec\xb8\x9c\x9d\xfb\xdd\xf9\xcf\xdcw\xb0e\xc4\x0b\
-!A\x94\xe2\xe3 \xca\xdb\x92\xa2\xb7\x87\xccz\x0aM\
-\xe9\x8eV\x09\xde\xd6\x91\x141\xe76}\xde\x08\x1eU\
-\xad\xb4\xca\x8d\xdfbn\xc8\x15t\xf7\x02\xbd\x1b9z\
-\x8a\xf6\xa8\x83\xe0\xc9rI\xf6\x8a\xf1\x06 \xc90\xf3\
-\xe0\xf0\x1d\xc5\xb4\x05_\x0e\x90\xd6\xea\xde\xcd?\x7f\xe7\
-'>\xac\xfd\xf7\xfd\xf0^\xceY\xfc3\x1d\xb9\xff\xbd\
-\xe1Y\xd9\xafy\xe8/\xafq\x93\xa7\x95\xfb\xda\xc9\xcd\
-oA\x06;\x90\xe1\xb0\xf2\xdb9t\x87\x03\x94U\x07\
-\x22\xb5\x1d\x90\xc9i\x0eXWe!\xdc\xfcg\xf7\x9d\
-\x94\xc3T\x19\x99\x98$T'h\xc0J\xa8\x1904\
-\x1aA)=%\x16\xe3|$\xa7\x19\x83{\xeb\xecs\
-\x1ear\xf5Z\x5cf\xa0\x08\xc9\xdeO\xb1\xc6\x0cm\
-W%4\xfcp\xa8\xf5\xaeIy1\xdc_L\xd3\x8b\
-\x92%(\xcd\xf2\xf7@T\xeb\xe5\xb2d\x01\x07\xa9\xa9\
-\xc4\xbe\x8eW\x8b9\xb6\xf1\x0a\xabk25\xfd \x10\
-\x92@Pk\xcb\xd6\x90\x9a\xe2\xe0C\x0c'\xb5\xb63\
-}\xf3#\x17\xca\x0fB\xa2\xc5\xf94>3\x06\x82\xf1\
-x?\x07\xaeG!\x10B\x8e\x09)\x0f^\x87\xea\xaa\
-x\xa6\x0c\x07WA\x93V \xcd\xdbC\xb0\xf1\x15\x06\
-\x83d1 {\xee\xb6E\xebo\xda\xb3\xb2\xa4\xeb2\
-h\xc5\x9a\xde$\x9b*$*\xd9\xac\x89\x0c\xff\xcc\x1a\
-\xc8\xc0{\x8fd\xb3\x10\xfex\xe3\xa5\xffq\xfc\xf3\xaf\
-\xbd\xb0|\xc3`/;\xdfw\x93}\xa0\xf8\xa9\xb6:\
-\xdad\xd7\xcb~&\xb6\xbf\x8d\xab\xf6\xfe\x06W\xfb\xab\
-\xcd\xf7\xc7\xb4\x0c\x07\xa8\xdde?S\xe0GA\x9c5\
-#\xae\x9be\x0aV\xad\xed\xea\xc48\x22\x0e8\x8f\x10\
-\x169}<\xc3{\x89\xf3\xbf<.\xd5,E\xd7T\
-\xb5\xa8\x98\x88\xcb\x90\x09F3\x5c\xe8\xb3\x18\xc5\xa4\x84\
-;\xa6\xb9w\xd7\xa9\x7f\xfa\x14\x9c\x0a\xf8@\xd6\xce\xea\
-F\xd0\xb4\xed>\xaeU\x96\x5cO\x8d\xf6,\xe7\xcd$\
-*\x02\xa1\x81}4nlihgU\xa9CC\x83\
-\x0ey4a\xb9\xcaT\x86s\xad\xd0\xe0\x08UEV\
-\x85\xf8\xe8r\xfe}\x02\xca\xfb\xb3\xfd\xe7\xef\xfd\x93+\
-\x8f\x19\xe1\xc8\x00\xa5&\xd5TR\xa0\x05J\xbc\x9f\xc5\
-:\x1f\xe1G\xef\xb0\xc9\x160\xa4\x10!\xad$\x89f\
-\x18\xfeV\xf9\xdeU]\x09)\x1fK\xd3)<P\x90\
-\x1f\xecXU\xd2\x9e\x9a\xc2fJg\xc4\xc6\xa6\xd6F\
-D\xc7\xd8h\xa7\xa8\xd6S\xe4\x05n>FEwG\
-Z\x18\x1cc\x93\xbb\xb9\xea\xea\x8f\x9d9\xfd\xe1\xec\xdf\
-\x1f\xf1\xda?\xe3\x02w\x15\xdf\xd7g\xbc\xf7\xcd\xe5\xae\
-\xeb\xec\x81\x10\x9b\xfd\x95/\x8f\xb5\xe8\x7f\x9b\xa8\xd0\x03\
-\xc5\xd0\x1e(n\xf4@\x9e\xb0C\x1b\xe1U\xab\xd0\xcb\
-O+,/\xbc\xd1\x1c\xf1\xda\xffc\xbft&\xf6\xa2\
-\x97b\xf5M\xe4\xa3\x96c\x00\x97\xa5 2\x22\x05\xd9\
-5\x1a\x9e&A\x8a@<\xb63pE\x94\xc7\x85\xbf\
-zh\xed}\xac\xde\xb4!\xf9\x5c\x828\xc5\x91\xb8\x9a\
-\xber5h\xc8\x04\xd3b\x1b\x08deBK\xb4R\
-K-\xa5\x22\xd4\xa9\x0e5\x8bK\xeb!Xx\x94\xb7\
-p\xd22\x89&g\x9a\x8a\x95\x94\x5ck\x92\xaeU\x13\
-+>0|TS\xd9\xe0}-NQi\x1c\xc4\x22\
-\x84Rx\xe8\x9b\xdf\xff\xbb\x89\x9b\x8e(|\x1ciY\
-\x1fi\xc2\x03\x87\xb8@p\x8bQP\xae\xd5\xb5\x86\xb4\
-\x83%\xb1\xb9H\x0cv\x1b\xd25\x86\xdb@}\xe9\xc3\
-\xee\x04\x85`32\x03\xc5\xa5wo\xc8Y\xb1\xc2\xe1\
-&\xd2}\x98\x09\xc6i\xe4C%\xaa\xaaJ\x14\xcd\xe3\
-4i\x81\x15g\x0dA=cS\xc7^\xfd\xf6O\x9e\
-w\xe9w\x8d\x7f\xc3\xbf\x7f\xde_\xfc\xb9gH{\xeb\
-\xe9\xb2z\xf1\xc9\xfb\xe3\xbf\xcb\x01T[f?\x04\xb4\
-\x03\xc5\x10\xedo\x06\xc0\x01\x9a\xda\x03Mk\xf7\x1bH\
-a\x00FZ\xb0w\x17\xcaq\xc7\xc9\x8e\xfb\x0e\xd1N\
-p|q\xf3\x0a\xbd\xf6?\xed\xaa\xe0\xd9\xd8\x18\x15\xa1\
-\xe0\x09\x18]vIM\x04\xde\x1a\x9c58\x0d\x84\x99\
-\x1e{\xae:\xfe\x1d\xc7\xe0L\x0cZ3\x96\x06\x9d\x98\
-\xa5\x99\xc5\xcbRE\x0a3\xa4\x16\x1b\xa5\xf1SY\x0a\
-\xe2W\xdfmI\x83<\xf4q\xa8\xfc\x07BMG\x88\
-\xfbph8!$^M\xcd\xbb\x09T\x18}#\xcc\
-!\xed\xec\xd5\xf7\xd2\x10\x053!\x04B\xe9\xe9/\xcc\
-~\xa4s\xd1\x9en _\x14\x8a\xda%-~\x05.\
-\xe0\x07sd\xce\xd7\x93\xdad\x94\x86\x06\x8dC\xc1\x1a\
-w\x1a\xf2vh\xf0<\x9bNj\xb5\xf0A\x03\xe55\
-\xbb\xd8\xb9'?\xe2plVb\xcb\x12\x9b\x17X\x13\
-\xe2\xf4[\xb4\xe1&\x97\xd8\xae)\xf7\xcf\xfb\x10\xbd\xec\
-Dp]\xa7\xc5\xe2\x8b\x9e\xf4\xaaO\xadZy\xc5\xbd\
-\xbae\xe5\x05r\xff\xc9\x0f\xe8Z\xeex,\xf7\x8d\xfd\
-\x09T~\xdb\xdc\xe4}\xb9\xa0\x99\x03\xf4\x0b\xbaL\xfd\
-\xb5\xaf\x93\xe4@b\x95X\xea\xec\xd8\x05\xff:\x87\xba\
-\x15=\xce\xba\xff]\xfa\xc9\xdfd\xe1\x81w^o\x16\
-\xed\xf8\x86\x91\x9c\xb5\x8d6\x8f*J\xc1\x80.\xbf\x84\
-T\xf9\x8a8\xf2E(:\x8a\xbbj7\x8f\xec9\xec\
-\xac\xc3\xc8\xda6qE*\x1b)\xad?\xee\xeb\xb8\x92\
-\x04\x15j30H\x96\xfb\x17\xec\xfb\xcd\x0cUC+\
-R\xbbRV\xf3\xcf\x90XD\x95664\x1b\xd8\x84\
-\xe9k\x1d\xcf\x19w\xc4\x04\xb2\xd6\xa4_\x0di\xd1G\
-\xa2R|\x08\xab\xf7|\xedg\xe7\xe7\xf7\x1f\x22 \xb9\
-!\x13E}\xc2\xa0\x5c\x897}\xfc`\x9e<\x15Q\
-5\x99\xae\xe2\xe74~CZqq\xb4\xa1\xab\xad\x16\
-:\x06\x0d)\xbcQ\x05\xcdr\x16\xder\xfd\xfa.k\
-6\xb5p\xa2\xa8\xf7d\x99\xc1f\x11{3&\xee\xf2\
-\x86*\xd4\xba\x12\xf0\x87z>\xa26 \xb9\xc7fg\
-\xdd5\x18y\xee\xbb\xcf\xc2\x8f^t\x14\xe3G\xfe_\
-y\x80\x19}\x8ca\x92r`\xbf}\x0e0(\xd5\x03\
-\xec\xf8<\x06u\x82\xfdLv\xf7\xb7F\x96\x98\xc6j\
-o\x00W\xf4\x8e\xd5\xc9\xc5E\xfe\xec\x84\xcc|\xb78\
-5p\xf75\xf2x;\xbd\xba%\xac\xab\x99\xb7\xd5\x9e\
-\xe7\x1b\xe5sE\xfa\x95!\x9eR\xc6%\xe1}\xa0\xfc\
-\xe1\xaag\x8f\x97\x9d\xb1\xd1\xb8\xd3W\x0a*\x1b\xe9X\
-\xd5/\xa1I\xa54\x95\xd0[` 6b\xfb\xcda\
-\x94<F%)C|\xbd\xe9gO\xbdx+\xa6\xbb\
-\xd4\xfcG\xadJ\x9c\xba\x17H\x97j\xb4\xae\xf7+\xf2\
-Y\xa8\x1c\xd1\x92:V\xacA\x9ca\xfe\xa1\xed\xef\x09\
-\x7f\xb5gC\xd0\xb1\xe0py\xc0-\xc2 \xc4\x14\xc3\
-\x90\x95\xf4gw\xd1\xcd\x03\x83\xda}\xd04X\xfd\x8d\
-a\x956\xc2\x85*c\xc2f\x88P\x054\x1b\xd0\xdc\
-`o\xd8\xce\xf4\x9d\x13\xbf\xf3\x04\x8c\xf4i\xb5\x84l\
-T\xc8\xac\x0cC3l\x94 R\xd18\xd2LD\x0d\
-u0\x9dh\xc4\x96F\xb3\x1e[\x1f\xf9\xcb\xc3_\xaa\
-#\xdf\xbb\xfd\x0c\xf5+o232\xd8\xdfd\xf6@\
-\x18\xba>\x06\xbf\x9f\x03\xdc,\xfb\x8b\x15\xe21\x06d\
-r\x00\xe1\x8a,\xe7\xe3+\xa0{\x8e?\x92\xd6\x9e_\
-\xeb\x0ay\x88\x90\xfd\x81\x5c\x9f\xbdZm\x11\x8eB\xc8\
-h\xb8zi\x11\x17\x89\xd9\x87mtBxT\x03e\
-K\xc8\xee[`\xfbU\x9d\xd3\x1d\xed\x15\x1d|\xbf\x88\
-|\x1c\xd3X\xbc&\x1e\xdc\x15\xb5`8\x9d\x8d\xbbs\
-\x99\xea\xe8fk\xab&,)\x8b\x9a\x17\x18\xb41M\
-\x05\xca0\xcc\x0d\x09\x89R\x10\xc2\x90\xfdR?gh\
-\xc8>R]\x9f\x18\x98j\x9a\xbe72\xfc\xba\xa4\x02\
-\x0b@\x7fa\xf1\xb0\x9d\x97]\xff\xa6\xd1\x87\xd7\x16B\
-\x91\xc5\xa2\xac \xe2?b\xc1\x0f\xe6\xb1\xb6\x87\xb7J\
-Q\x8f\xce\x12\x98Zy\xdeW\x0b\xdb\x08\x81a#+\
-Z\xd9\x09\xa6\x89n\xa3\xecA\x0c\xfd\x0f\xde\xb6Zh\
-\x8dY\xf2\x0cl[iY\x8bm+&'\x19qi\
-b\xf5\xa7\x1e+\xdd6\xb6\xa2k\xbb\xd8\x00[\x04U\
-O\xab56\xfd\xae\x0f^|\x06\x0c\xee\xdb5\x15\x1e\
-5*\xdc\xf7\x9f\xc0\xbe\xe3\x84\x96\x1bA\xe9\x01z\x83\
-\xc72\xa3\xda\x1f_\xff@\x8b}\x9f\xda\xdd\xa1\x9eq\
-\xcb\x89\x9c\xf0\xb5\xb7\xe8\xfa\x99\x05\xe5\xee3u\xf5\xc8\
-\xa0\xbbm\x9e#E\x18\xd4\x9a\xe9d\x07ecq`\
-j\x1b\xc0e\xd8\xb2\x0d(\x9e\xb0\xb5\xd5\xb1\xb7\x8c>\
-%\xc3\x8c\x09\xe2R\x08\x83\x19j\x86\xa0I=\x90%\
-\xbb\xbf\x88P\x86Tw\xb3\xcc\x9fR\xf6}\xa1R\xcb\
-\xff\xa8\xbd0\x83\x0ew\xf1\xd0\x18d\x85\xf4\x9f\x82\x0c\
-\xa1\xcd\xe8^bj\xfa1\xaa\xf5\xee\xdf$\x10hZ\
-8\xa5\x0ae\xbf\xc7\x9e[\xef\xfd\xfb\xfc\x03\x0f:\xcf\
-\x981XJ\xfc\xa2\xa1\xdf\x82\x96\x15\x02\x05a0K\
-\xeeJ\xbc\x09\xe0-\xe2M\x02jR\x02Jh\xe4\x5c\
-U\xf3c\x86j+M$\xb6Hd\xb3\x04\x1f\xff\x1e\
-\xee\x9af\xcf\xcfx\xd2\xa1\xb4\xc6<\xf9\x98\xc5\xb8@\
-\xf0\xbd\xb8\xe0M\xa2{;\x10\x1b\x10\x89\xeet\x95M\
-\xa26\xbcG+\xbd\x82\xc9\x84<\xefQ\xeay\xfc\xd5\
-\x97O\xbd\xe5\x90\x0f\x14\xe0\x22g\x10\x81\xac%\x19V\
-\xed\x81\x8d\xc8\xcc>\x1a]\x93f\x9a\x91\xe9\x85\x1b\xa6\
-\x1b\xd3Q\xc8\xb0]\x03\xb6\x05\x8c\x03\xa3\xcbN\x94\x1c\
-h\x0fa\x1bkp\x06C\x1b\xb1\x1d\xe8\xb4\xf7y\xf3\
-\xecw8V\xef\xf8\xcf\x5c\xf5I\xb3fa\x9e\xaf\xde\
-&p\xe26\xe6\xd6\xad3+\x95\xa3$1Y\xfcp\
-\x0cT\xe5\xfd-]\xf0i\x98\xa5\x82\x04\x83\x1d\x18\xfc\
-\x9d\xac-\x99<\xee\x10|_i\xb5m\xc3\xf2\xa3A\
-.S\xdd\xaf\x15\xa3\x06\xa5\xd0\xa8\xce\x0a!\xd4\x86\xb1\
-\xf2(xV\x96\xc6\x227\xf7\x1e\x95a\x19\xd3\x14U\
-5!\xd2\xd4\x0f\xd4\xfc\xd2Z\x0aR\xd1\x8f\x13\xb2\xa3\
-\x8a\xaf\x5c\xff\x82\x10\x82\xb28S<_\xff\xe2\x9a\xb3\
-G8\xce\xc5\xd0\xb6B\x1dj\x85\x1c!\xd8\x92R\x17\
-A{\xa8\x80\xf7QE%&-\xea\x8a\x1a\x94\x06V\
-ZMgk\x8b\xc5\xe1\x15\x8aO\xe7\x8cO\xb7l\x00\
-\xfd\xde\x8eq\xd9j\x0f\x1a\xa15jqY \xb7`\
-G\xc0\xdaP/\xfe\xeat\x8e\xd3[\xa9m\x16+\x81\
-\x8a1${E\x83q\xc2@<c\x13\xc2\x03w\xbf\
-m\xdd\xcca]>w\x89\xfdw^e\xdet\xda\xe9\
-\x86\x9b^\x9a\xfd1\xe3r\xfe\xca\xf3\x84\x95\x93\xf2\x18\
-eN\xa3\xb40\xfa\xba\x15j\x9e\x9f=E\x0ev_\
-\x87\xe7^.\x98\xf3\xf9\x1d> '\xf3\x1d\xd3>\xf8\
-|\xec%\x93\x863>k\x1d\xd3\xc2\x07\xbf&\xff\xa1\
-\xd8\xa7jK_\xbf`\xf4%\x9f\xb8@\xe1\x8a\x00O\
-b\x8c\x15z\xfa\xd3\x9eb\xdfv\x19\xc2\xef\xfd\x85L\
-}r\x9d{\xdd\xbf\xd2\xdax\xf0\xeb\x0d\x1cv \x97\
-\x87\xfaOm!x\xcc\xd4n\xfe\xf9\x9aB\xb7\x8cu\
-a\xe4F\x99l\xed\x90\xbeg\xbdKR\xb9\x9a)\x18\
-\x86\xd9\x80\xcdC\xa5\xa65\x06\x82\x11L/\x83\xbf\xdb\
-\xb1\xe9!N\x1f9\x15\xe7\x865\xb34w\xe8\x84\xa4\
-HE\x897\x82\x09C\x06\x9aJ`\x10\xa0U\xdbr\
-/\x9d\xf16\xd7\x7f\xa8\xdc=j\xf6\xe4\xb2\x9a\xbf\xfa\
-\x9e\x89P\xf6\xa8v\xab)&\xa9\x86q\x22\x8f\xe6\xd9\
-'\xd7\x84\xe0\xc1\x87\x92\x99\xef\xfc\xe8\x92\xd1+\xd6\x8a\
-\xd2\xf2P\xd8H\xff2\xc9\x1d:\xe4\x9ebn\x0f\xdd\
-\xbcd@3\xf6Y\xeb\xc1\xaf\x12Rg\x13\xbf{\x08\
-\xc9!\xa8\x82QS9$\x01B;`\x8dG\x83`\
-\xf6\xc0\xae\xcf\xdc\xbb\xae\xcb\xe4\x9a\x16\x22!n\xa4\x19\
-\xb8\xb6Mt\xe4\xa1H\xc7kr^3R\xeb\x11\x22\
-\xe1\xce\xd4\xe1\xaa%\x1e\xf1\x0e\xb5\xd0j\x19\x06{\xcf\
-\xbc\xae{\xe3I\x13\x97\x8f_\xbby\xedw\xbc\xf5\xbb\
-,\xb7\x9c\xa2\xaf\xe1}\xfa\xa9\xb3nr\x84\xb5\x9e\xcb\
-w\xed\x8f\xa0\xb6d\x90\x14\x08\xfc|\xfa\x14N\xd6\xf7\
-`e\x05Y\xebR=\xef]\xffb7\x7f\xeb\x9b\xfe\
-\x05\xcf\xee\xd8\xb5g\xe6\xee\xa1\xebF\x07_\xf9\x9d7\
-\xb4\x8e\xfd\xc0\x07\xcd\xee\xed\x9bO\xdd\xfd\xaf<\xe9\x1b\
-\xa6\x7f\x88\xb6\xd1\xde\x13?\xfd\xf0'\xaf\xfd\xf4\x0d\x93\
-\xeb[7}\xfa\xf6g\xcf\xbf\xed\xf2\x0b\xc2\x0b\xbf}\
-\xbe\xb9\xf3\xf2\xb7\xf3\x9d\xef\xff~\xf8\xdfOi\xfb\xc5\
-\xa3\xac\xf0\xf0\xb5\xbf\xcd,A]\xf5\x9fn\xfa\xee\xc1\
-a\xd7i\x1f\x97\xed\xb3\x1f\x10\xb2\x0f\x85\xd1\xfb\xfd\xba\
-\xf9\xc0h\x10\x16k\xbfxm\x04\xb6V\x0a\xab\xa1d\
-#j\xa0\x02\xbe%\xe8\x8e\x05fo\xda\xf4\xba)\xda\
-!\xc7:(\xa5\xc0\x19\x97\x9aMS\xd7\xcc\xc3-\xed\
-\xd1M\x92\x18C\x0feT\xaa\xa5\xd00~j\xb2\xe7\
-\x93\x0dmcz\xdc\xe0\xdbW\xbb\xf9\xd0\x90{\xf8\xb9\
-\xd6\xa7\x82\xd60f#\x82!T\xe2\xbe\x0aa\x8a\x93\
-N\x00\xb5\x96\x85\x07\x1e\xb9\xd4~\xa4w\xa8\xea\x86\x01\
-\x14N\xd0`0\x1a'\xb1\x18\xf0\x83\xbdXz\xa8\x0d\
-\xf8**\x9a\x86\x9f\x83Fzqt\x5c\x88\x5cQ\xa9\
-\x16\x7f\x93MD\x80\x9cx\x92f\x96,\x04\x06\xdf\xbb\
-\xd7\xee\xde\xec\x9ev,\xed\xb6\x92e\x01\x9b).\x03\
-\x9b8\xf8.\xedQA4-x\xc1\x07\xad\x7fr\xe5\
-\xfe\x1f\x82!\x10(LIG\x1cmu\xa8X\xf2\x15\
-mv\xcf\xbc\xed\xa4g\xfe\xce\xab.<\xfb\x229}\
-\x0b\xfa\xde\x17\xaf.\xae\xe4x\xf3\x9f\xab.\x0fl\x9e\
-\x96}\x10\xd4d\xdf\xfa\x8e\x8c-\xf9+t\xbb_\xc7\
-!'\x9c&\x7ft*n\x9b\xc2C\x7f\xda\x95\xbf\xec\
-\x1c\xcb\xbb?\xf8W\xfe\xb3\xb7\xdd\xe5\xe4\x8b\xaf_\xb7\
-\xe5\xee\xbb\xfe\xd7\x98\xe1I\xeb\x1de{\x94\x96(\xde\
-\xf7h\xf7,o\xde\xfd`\x7f\xdb\xab\xd7}\xfb\xaa7\
-\xbe\xe3\xbb\xdf\xb0_8\xf9\xb6\xedG\xae\xf0\xbb\xff\xf9\
-\x8f\x8b'\x9a+y\xdc\xaa[\xf8R\x86\xa1xlQ\
-z=\xfd\xbaj\xf2a8\xf9web\xf4\x08\x8e\xff\
-\xb3Q\xbd\xf3vN\xee\xe6q\x96\xa9\x8d\x5c\x904o\
-]jV*C\xcbo,\xb6\xb4\xb0y\x1b[8\xe4\
-\x8c\xe3\xe2Q\xdb\x0b\xd8\xc4\xec\x96\xda\xc0Uj$c\
-\xbfCj#,zEM\x88\xc5\x01\xcb9\xef\xcd\x89\
-\xacV1\x8aK\x1e\x11s\xd7Z\xc5Z9x6\xcb\
-\x9e\x9a\xbb\xd3\x18H\x0d%\x84CuUE\x9b\x0e\x08\
-\xbeW\x1c7\xfb\xa9k_\xd2\xfe\xcdh_\x22\xfd\xa0\
-\xac3{\xc0)\xa5.\xa2\xe5\x1e\x5c\xcb\xd3\x13\xad\xe7\
-\xc0\xc1\xa4,\xdf\x0a\xabWE\xfc\xd0d\xb7z^\x89\
-\xa1\x0f\xa2\x828\x8f\xb7\x81\xd0\x13\xca\xc5\x0cZ-z\
-o\xfb\xf5)\x1bY\xf9\xb8\x9c\xac\x0d6W\xf2\x1c\xac\
-S\x9cS\xac\x8bM+V06\x22;\x98\xf8|\xed\
-QdB\x8aO\x8d\x86\x8eV\x05\x87\xc1\x05!\x94\x05\
-t\x16\x09\xd9\xb3\xae\xbc\xe7\xdf\x7f7\xbc}Woq\
-\xe5\xd3\xa5\x98:\xc4\xdc3\xb5\x81LWp\xdc/\xe6\
-\x94\xfd'\xa6/+y\x94\xe9\xa3\x90\xed\xcf\xbbD\xce\
-=\x0f[\xde\xb4R\x7f\xf6\x91\x0f\x97W\xff\xdb\xb7\x03\
-W|(|\xf4\xc7\xff8\x18\xfb\xbb\xd7\x1f\x99o\xe3\
-\x83S\xcaSFs\xa4c\xd1A+\xdaS\xaaGF\
-\x02\xf3+\xbaL\xe4\x19/\x09\xf3\xe1s\xb3\xaf\xbc\xfe\
-}\xe1m\x1c\xb7\xe1\x92\xbf\xe3\xe1\xbbw\xe9w\xf2\xd7\
-k\xbb\xb5q\x7f\xc8\xd2\xbeQ\x9dg\xec\x9a\x82\xebD\
-O\xe7z\xaex\xe1ZU\xe1\xd0\xcc\xd5\xbf\xef\xda\xbc\
-\xa3\xd2\x17V\xbc\xc9\xaa\xaa\xd6\xa1\x1d\x9e\x14\x02\x9f{\
-x\xec\x11:ccq\x01\x16\x9e\xcc\x9a\x86\xb9\xab.\
-ip\xf7{ %Gk\xdf\xbc\x08]\xa6o\xadd\
-\xd7\x15~_\xdf\x19\xd4I$JC&H\x821\xb5\
-B\x81R+\x99n\x90\xd8\xfc\x86\xc4\xcb\x19\xd2\x1b\xaa\
-\xd1\x91\xb8\xd8\xab<\xf2\xedk\xbe>\xfa\xb7\xc5\x98e\
-u\x08\x04\x0d\xc9\xee;\xcd\x9f\x5cA\xd1\xdfEf\x02\
-\xdeD\xde\x8dx\x17Gp\xb6\xba%\x13\xc3\xb2\xea6\
-*\xdc6D\xbc\xbe>{T\xd0\x9eE\xbd\xc3\xda\x80\
-\xe6\x9e\x85O]\xcb\xf4\xec\xfa3\x8f\xa2-\x81\xac\xa5\
-\xb4\xda\x82\xcb\x15\xe7\xa2u\xaf3\x15\x9a\x93\x10\x1d\x12\
-W\xa7\xaa\xeb\xedp\xef3&28[\x11\xb7\x88/\
-\xa5,)\xcb\xc0\xc8\xc4\x02;v\x7fh\xe26\xed\xde\
-;6)\x7f\xf3\xac\xcb\xe4\xde\xddFO\xf8\xc5fZ\
-^\x0f\xe4f\xb0l\xd7/\x0d7\x7fB\x7f\x7f\xcd\xff\
-\x93\xbbW\xc2W\xfe\xfb\xd9\xfe\xc8\x85\x0b\xcd_\xfc\xd7\
-\xa1\xe1\x0bG\x9d\xcfo.\xfd\xd2S\xcam|t\xd2\
-\xb1\xcex\xe6\xcc\x80\xc5\x12\xda\xfeV\xd6\x14\xb72U\
-\xdc\xc6\x8a\xf9\xeb\xe8.\xfe\x82,\xbf\x8f\x85Q\x03+\
-\x02\xe7\xac\xea\xf3\xf1\x17\x9e\xc4\x9f\x5c\xf1\xf7+3\x7f\
-\xd4\xe5&\xdf\xf4\xd0r\x88\xd4\xec\x0f\xce\x14@\x9e}\
-\xda\x1e3u\xfd\x9f\xe9\xc8\xe3<\x07Q2\xd2\xe7`\
-c\x96r\xc45\xd4-\xa9\xa1Y\xf2T\x96N\x82\xe0\
-\x09\xc6S|\xf7\xf0\xd7\x8c\xd3\x1a\xb4\x22\xdd\xa0\x13w\
-\xeb\xaa\x925\xf2\xdb\xc0c\xf1\x95\x0d\x88\xd1h\xc6\xc8\
-\xb2\x12fi=Y\x07\xdcWeK\x03\xddQ\x05\x0d\
-f\xe8]P\xc1\x9e\xa9\xf4\x89\xfa\xa7\xeay\xad\xa5\xde\
-!,U<\x85\x10\xd0\x00\xbb~\xf3\xc0_\x17/\xb9\
-\xeeHx<\x01\x93\x84#\xa1\xe2\xcf;\xa5(g\xb1\
-n\x1eo\xc0\x07\x03>z\x0e\x19i\xc4u\x1a\x13\x99\
-\x9bH\xfa\xdc$\xb8R\x97\xb0/\xe3\x8da#\x99-\
-\xb7d;\xe7\xd9\xf5\xc1\x9dO;\x98V\xbb\xa4\xd5\x11\
-2\x17p.\x9a\xb3;\x17p\x12\xcd\xb9L\x22\xa6\x89\
-\xc4\x85]\xa3<\x89\xee\xe1\xb2*\xb11>\xac\xb5\x94\
-\xb6D3\xc1\xd9,\x8a\xfd\x8d2q\xf8\xe8\xf4\x87\xde\
-\xf3\xe7k\xde\xf6\xc6\xb0v\xd35\xfc\xcf\xf0\x88Y?\
-9)\xd7\x1f/\xcb\x17W,ZM:\x9fm\x96\xda\
-\xc8\xf8.\x9e\xc4\x1f\xb0\xeb\x9a5zw1\xa2w<\
-\xf5\xf9\x92\xf3M}\xdfg\x0f\x1a\xfd\xdd\xc7?x\x86\
-\x0c\xc2\xdf\xac\x5c\xc1J\xcd\xe9h\xa0,Jd\xee.\
-V\x85\x22\xce\xca\x8d#\xd8\x8cv\x06c\x83-\xac\x98\
-\xb9\x8e\x95\xe5<\xed\xaec\xdd\x1a\xc3;\xd7\xac\xbb\xed\
-\x83W\xbf\xd4\xaf=f\xfd\xaa%K\xc8\x1a\x82\xb8\xda\
-\xfa:4\xa5\x87\x0a\xc8o\xba\x9e\xb2s\x13\xdb\xef\x98\
-\xe1\xf5\xfc\xa3f\x9eM\x1a\x8f\xe4\x06I>!\xefZ\
-\xf3DD\x9b:\xd0\xd8\x8ej\xd1c\xb6x\xfc\xd3\x8f\
-\xc7\xd9\x88\xd1\xbb<M\xe6M\x83\x04\xa6\xcdft?\
-\xb6+\x0a}c(\xf0u\x0d^\x975K\xacA\x86\
-@`\x131\xf6Q\x94Z\xab\xb3\x83\x0e\x9b\xe4\xfa\x14\
-\x80\xa5\x9c\x9b\xba\x08S\xbc\xf8(!\xd1H\xb6V`\
-~f\xe6\x99\xb3\x1f\xfe\xf9\x9bG\xc3IeI\xe1\x03\
-\xa1\x0c\xf4\x05T]\xb4P4=|\xb9\x17\xebJ\x22\
-\xfd>\xf1OM\x88\x13\x02o\xa2\x06\xb9\xa2\x1b\x9b\x86\
-I\xa1iLt\xbd\xa9\xadEh%\xa74Q\xfc\x17\
-\x1f\x1a\xcb\xb7M\x9c\xbc\x9a\xd6\x84\xc1\xda\x82,\xd7\xb4\
-\xdbkML\xab2~1\x1ai\x0bf\xa8\xb95\x12\
-5\xce\xa2\x89\xab\x9f0~1!y5\x80\xcb\x05k\
-c\xa1e3hO\xbc\xe0\x81\xb7\xddz\xc4\xd4\xaa\xa7\
-\xe9\x13\xe5\xef\xc5\x9f\xba7f\x0d/\xdb\xed\xc5\xc0\x1b\
-\xfe\x10s\xe6\x8b1\xbc\xe1\x8b\x86\xd3?&p\x820\
-y\x0a{\xd7\xcd\xc99O\xe8\xd3\xf9\xb1Qfw\xc9\
-+\xf5\xa2\xb0\xad\xc3\x13\x8b;\xb8\xf8 \xc7\xea\xe0\x90\
-\xc2`\xf26\x1d\xd9\xcb\xaaN\x97\xac\xdd\xc1\x01}\x11\
-J\x9bc\x11\xfa*\xccZ%,\xdeN\xab\x7f\x17&\
-\x0c\x98\xd3q^\xba\xbe\xb7\xebo\x7f\xf0\xf1\x9d'\xf3\
-\xdd'\x84\x15\xe7X9Q\xde.o}/n\xd3k\
-6\x196M,\x81\x01\x1d \xce!\xdb;0w\x8c\
-\xf0\xdf7\x9c\x18F\xe8\xa1\xb0Z\xc0[\x85\x82\xa5j\
-X\xb3\xd4Bu\xc9\xee\x84An\xde\xc1\xd6\xe2\x88\xf5\
-\xc7#\xadHI0\x95\xb1S\x1d\xad#\xb5c\xf1r\
-\x88h\x18\x9f\x19o\x8c\xc2\x06\xe6\x820f\x1a\xbc\x85\
-e\x93\xbc C\xc6zmh\xd2\xec \xebF6!\
-2Us[C+\xc3+R\x81\x10\x02e\xf0\x88\xb5\
-i\x88\x15\xf0\xa5A-+\xf7^q\xcb\xc7\xf3/\x8d\
-\x8ezF\xa6\x85\xb9\xdc\xe3Z\x961U\x06D\xe6\xbb\
-/\xf6\x90\xc9\x22A\xcdp\xc2-\x1a\xb9:\xb1/\x1e\
-\xde\x5c\x8d\x09\xb8\xda\xc4\xbd7\x82VI\x87\x09\x09\xd0\
-BP\x06\xf4\xb7+\x0b\x1f\xbf\xeb\xa8\x8cCV\xe7\xe4\
-V\xc93\xc1e\x81,#\xe6\xa3\xbbX\xbaH2u\
-\xa9\xfa\x93\xc8w\x8as\x0d\x1b\xd2&`\x93(\xa5F\
-\xec\x02Y\x1a\xbb\xf9\x04\xe7\xaa\x02\x05\x98\xf6d\x7f~\
-\xf6\x15r\xff+?p\xf3\xc8\xbb\x07\x92\x1fj\xd9\xb0\
-\x0e\xae\xdd\xb5\xa4\xce\xb7\x0a\xc5&\xd8\xb1wDq\x93\
-rt\xe7\x1b\xfa\xf2gm6\xd3k\x0d\x0f\xae\xb9\xc1\
-\xcc\xfd\xe6m\xe5\x13\xbes\xbf\xfc\xe4\xf6\xaf\x96\x07_\
-\xf2\xeb\xe7,\xec\xe2\xafV\x1aV\xa2\xec\x0a%=\x17\
-p\x85C?\xfck~y\x9fYeW\x86Y\x7f\xee\
-\xe3\x8b\xd5\xa7M\xb1\xbe#\x04F\x980\x8a\xf3B\xaf\
-\xabx\xdd\x06\xa52\xd5\x9eb/9\xa7\xed\x9d\xe1\x03\
-\x0f\xaf\xba\xed\xa2\xc3\xfes\xea\xe6\x17\xc9\xc7\xc2s\x7f\
-4\x08\xffw\xc3\xa7aZ\x1em!\xb8f\x0da\xa4\
-\x0dA\x8f\x22g\x07?\xe3\xb9RzF\xaa\xe3 \xc9\
-\xde\xaa\xdd\x9d\x86\x18\xb0v\xf1M\xf2:#\xc0\x95\xe5\
-\xe8\x5c\xd1\x9a\xe8`\xb2\x88\xc5\xa3\xc3\xc1\x95\xc8\xd2\x85\
-\xab\xfb%>\xc5-O\x04f\x0a\x83\x9aA\xfd5A\
-\xcd\xd2F\xb7\xc9\x12\x0f\xa9d\xa9->\xe2/;\x84\
-\xea\xdf+\xa7\x1f\xea\xbc\xf0HC\xa0Fo\xa2\x9b\x82\
-`\x07\x82\xb7q\x110(\xcc\xccm[><}\xfe\
-\xaf\x0f\x11&\x820\x92\x95\x18!\xda\xab\x04\x8b\xcd<\
-e\x98&\x14\xd38\x0be\x88?\xa2\x0ep\x08\xd4f\
-\xe5Z\x8bJL\x0dYR\x0e]:\xa3\x13r\xf5u\
-\xb1g\xf7\xb9C?}\xff\x8a]\xbbV\x9f}\x02\xad\
-\x16d\xae$o\x05\xf2\x5cqY@\xdc\x10\xc2\xa4.\
-_b\x0cRd\xadJt\xae\x90a\xc05&\xd4\xd6\
-.\xa4\x94x1\x01+Q\xab+F\xf1\x99\x92\xdb\x12\
-i\xbd\xe1\xd7G\x1f\xb1\xf1\xa695\x0fL\xbdQ\x98\
-X\xfb\xa8\xdf[\x99\xb5\xf8b\xf8\x0fn\x0b\x9f\x95\xb3\
-\xbe\xf4<\xbd\xec\xae\x7f7\xaf\x9f\xe9s\xce\x96\x1e\xee\
-\xf2\xb1\xf2\xab\xb7_\xc2\xd5O~\x09w\xfd\xe8\x9a3\
-Gf\xf8\xe8\xc6\x9c\xb5\x99\xc5\x99\x0e\xa3>'/\x1c\
-fz\x86m\x9f\x98\xba\xfc\x94/\x9f\xf8\x9b\xf3>y\
-\xea#/{N\xfb\xc13V\xec\xf8Q\xf6\xd4[\xcf\
-\xba\xea\xe6\xbd\xf9\xad\xf3\x19\x8by\x8b\xae\xcd\xc8Z9\
-\xae\x1c0\x17\x1e!\xb8\x01\xba\xaa\xcd\xf1\xed\x92\x0f\xfc\
-\xfa\x97\x0b\x9b>\xff\xbc\xcb\xe9\xb9#\xed\xff\x0c\x17\x88\
-\xd9\xfbLy\x14;\xb3_ \xab\x800\xfd\x1a\x029\
-\xec\x1c\xb4\x0d\xb4\x95\x18\x9f\xc0P\x18\xa8UC[)\
-\x81\xaar'\x19\x7f\xa0`~\xb3\xea\xc9\xe3\xe4\xadV\
-\xcd^\xc4\x82\xd8\xc76\x06]\xc2\xa9g\xe8~<\x8f\
-\xa5\xa7e\xbd\x8dK\xb5`\x8d\x0e\xcb\x98jJ[\xeb\
-h\x1bhLU\xcehEKH\xa2\x93\xbaI\x96\xc6\
-\x90*Nz\x0c\x8e \x82\xc7C\x10z\xf3\xf3\x7f\xb0\
-\xe5\x95\xdf\xbf`\x9cS%\x80\xf7\xcc\xb6\x0d#\xd6\xa3\
-\xfdHC\xc0,R\xf6\xb6\xd2\xca\x0b\xfa\x12\xeaQ\x9b\
-h#7W\x0d\x9a\xa6\xb6\xd8*\x91\xdc\xa4\x02\xa3\x9a\
-\x11\x0f\xfd\x1c\xaa\xf7[;\x90oQf>\xba\xf99\
-\xc7\xb0z\x9d\xd0n\x07lV\xd2\xee\x1a\xf2\x96\x92e\
-\x90[pNSc\xdbL|\x89\xea\x89jq\x8bk\
-\xe8\x9a\xadI\xde;\x01\x97\xe4\x89\xd6\x98\x88\xf8H\x12\
-\xae\x04\x8f\xc9\x0c\xf9\x98\xe1\xc6\x9f~\xf4\x16\xddU\xf0\
-\x8d\xf7\xfb\xc3\xbfx\xd3\xa3\x85\x1e\x03\x11\x1e\x99\xd4\xf5\
-\xbf\xfc\x9a~d\x04\xae\xdb\xf9\x9cpV\xf7V}n\
-\xff2\xfd\xe6\xe6c9\xf6\xad\xff\x16\xbe\xf9\xaa\xf3\x9f\
-\xd6\xde\xcaGWZV\x17\x16m\x19\x8c))\xed \
-\x8e\x07\xc7\xba\xb4\xdc\xaa\xa9\x95\x8cN\x8e\xd0\x99\xcc\x99\
-\x5c?\xca\xa1O=\xe6\xfaS~\xf8\x9a'/\x5c\xbf\
-\xf6\xdcG\xdet\xe7\x8f\x07\xed\xdf\x0cF\xa17B\xd6\
-\xca\xc9\xadE\xcb9\xbc,\xb2\xb7\x95q\xf2\xe4\xde\x85\
-\x8b\xae\xff\xec\x0b\xd6\xbe\xf8\xb5\x7f\xa6W\xdd\x7f\x8e\x06\
-\x16t\xb9\xf4P|\x01\x9du\x08\x93\x9bdc+c\
-\xd7\x97u\xa2\xe5pi\x98_\xb5\x89\xb2\x04E\x97\xe1\
-\xee_\xf1KT\x91\x10\x18\xec^y\xf4\x14\x92\xe8<\
-b\x0d\xc6.\xf1\x99\xda\xbf&R\x96Nq%\x8dn\
-\xb4\xa5l+[\x18\xca\x86\xb1^CN\x95&\x025\
-\x97\xbe\x01\xee\x04\x1dV\xcd\x95\xf40\xa0I<>\xe4\
-\xdd,\x9d\xf6\x82\x16\xca\xc0E\x9e\xca`\xae8\xe5\xa1\
-\x8b\x7f\xf8w\xa37\x1e\xd2/\x09m\xa5\xed\xa1\xe8{\
-\xe6\x01\x8b\xa7\xb4=\xfc`'Y\xb6\x18\x8d\xb6T\x10\
-\xf1\xc9-!\xcd\x17*\x95\xa4I&\xba\x95cgb\
-]\x0e{'\x19\x8a(C\xda\x9e\xa4\xc5\xf4\xab\x7f\xb4\
-\xc6q\xf8\x89\x1b\xd0\xb2G\xe6<#]K\x96\x07\xf2\
-,\xa5C\xe6\xd5\xa46\x95\x98\xa6\x11yd*\xadB\
-\x22\xa9%q\x8a\x91\xc8&2.\xce\x93\xadH\x9a\xe6\
-\x9aT\xff+\xd6\xc7\xe8\x0a\x0ds\xa8{\xcag/\xfc\
-\xebW\xfc\xe7k\xdeR\x8cG\x0a\xc12\xa0\xa2\xa7|\
-\xf5\xbd\xe1\xadk\xbem\x0e[1\xce\x87\x7f\xefb\xbb\
-\xf9\x8dG\xb9\xc9\x83o53\xb7\xdd\xa1\x9f\xf4\x7f\xf8\
-\xfbf\x1b\x97\xachs\x88\x04\x16\xcb@9\xd7%\x0c\
-:\xe4-K\xde\x02\x9b\x19\xda\xd9\xfcmw\x91i`\
-$(#\x0b\xc2x\xb0\xac0\xc2aG\x1f\xf5\xcb\xa9\
-K~\xe7\xdc\xd9oM\xbe\x7f\xf3\x11\xbf\xec\x0b{J\
-G\xe1r:\xc1\x11\x16\xdb\xe4\xb9\xb0\xd0\xcdy\xe6\xcc\
-\xf5\x5c\xf4\xd5\xd7X\xb3k\xc3@\x9e\xc0\xb1\x8fvY\
-\xe8+\x9cl\x10V\x1c.\xe3\xedg\xf1\xe0V\xda\xae\
-\xb2]\xd2\xa1\xa6\xc9\x0c\xfd\x0a\x1e\x1ds\x96\xca\x9e\x85\
-\x82\xf9\xad\xf9&\xc1\xe6Y\xdc=\xf2\xc8\xf2\xd2A`\
-\xdf\x0e\xb6\x07\xb0\xa7\xd6\x18\x16\x14\x8cg&\xd8HZ\
-3\x95\xab$\xb5\xf5G|h]\xc7k\xf2\xba\x09U\
-\x0e\x95\xc6\x85^\x81Q\x1a\xe2~[\x9d\xf1\xa1Y6\
-%\xa8\x13\x0b\x1a\x02Eo\xd0\xdd\xf1\xcd\xab\xbeZ\xfc\
-\xfd\xe8\x84\xb0f\xe0\xe9K@\xc5c\x0c\xe4ZR8\
-\xc52\x8b\x16{\xc9\x5c\xf4\xc8\xb1\xdeD\x9b\xdb\x10O\
-M\x13\x86\xe6\xe4\x84D\xeb\xae\xac\x01\xab\x97\xeb-\xea\
-m\xcd\x04\x0a\xa9g\x0aj\x08\x97\xde\xc9\xae\xab\xc7^\
-t\x18-\x19\xd0\xea(\xed\x8e\xa1;\xe6\xb0\x94\xd8,\
-\x96..I\xdb]\x16\x86N\xd15)0\xba\x99\x8a\
-id\xfe\x9a\x06\xcaV\xc1\xcc\x96\x1a\xb8\x16#q.\
-\xd0\x8d\xd4\x1c\x8b\xa1\xb3r\xc0\xd6\xc5\xb7uW\x9d\xba\
-z\xd7\xe1\x0f\xef\x9b<\xb5z\x5cf\xee\xe9\xea\x1dS\
-A\xb6\xce\xde\xa1\xe3_z\x99n\xfb\xd3\xbfn\xdfs\
-\xc5\xde\x17d;\xb9p\xaa\xcdZ\x8dL'C\x07g\
-,%\x0eK\x9f>%\x03,\xdd'\x0c>v\x0b\xd9\
-\x5cI[\x0d\xa3mK\xdeQ\x8c)\xc9\x9dg\xd2v\
-\xcau\xcf:\xe6\xa3\x93W\x9e\xfb\x82[O\xff\xf9\x22\
-<\xbc\x901\x90<&h\xd2E\x82cqM\x9b\xb3\
-\x1e\xf7/\x83\x0b\xde\xff\xae\xf3y\xf8\xd8\xcf5\xa3\xf6\
-\xa2\x90\xb57\xef\xb8b\xcb\xd3\x03\xad\xaf\xcbA\xebn\
-\x14\xd3\xaa\xfd\xd5\x02\xfda\x00\x00 \x00IDAT\
-\xb6$)\x85*~\xce\x90\xd92\xc4V$4Z\xd7\
-\xed}\xfa\x0f\xb22`\x5c\xf5\xe6U\xfbVXv\x9b\
-\xd4\xb6\xd6\xfb\x81\x7f\xa5&Pi\x00\xef\x02\xbb\x06\xd5\
-sI\xdbEh\xa8\xcd+\x0f\x9c\xa5A%M\xf1^\
-\x08\xa9\xfcI l\x08\x8a\xd70\xf4.\xa8\x0c;*\
-L\xdf:\xa6o\xbd\xf7c\xbb\xfed\xe7\xa1\x86I\x1f\
-(\xf3\x80u\xd1\xea\xdb$\xec^\xdc\x00\xb3\xb8\x83N\
-\xe6)u\xe8\x09Q[\xd1\x8a\xd4\xfekU\xfd\x1e\xea\
-\xe7*>>\x0d\x1eh*\x85\xc4\x919\xf0\xbbK\xe6\
-?\xb3\xf3\xecM~\xd5\xd4(f\x22\xd0\xee\x0a\xedQ\
-\xc5u=\xce(\xceB\x96\xa5\xda=\xf1q2\x13\x05\
-\xe6&\xed\xf2\xd64>\x97\xc8\xcc\xb4\xc4f8\xda\x95\
-\x87\xfa&\x89\x10h\xa8u\xcd\xc6\x05r\x03\xaem\xc8\
-\x9dE&&\x16\xbfw\xed\x8b\x8e=\xf7|\xf3|\x9e\
-\xc9\xfac\xce\x81W\xbeT.z\x1d\x86M\x7f G\
-o\xd8\xcb'\xcf>H\xfee\xf02y\xc65;\xf5\
-\x9f\x9f\xf4u\xbf\xe7\x06\xcejm\xe3]+FX3\
-(\x98vq\xd1\x1b\x9b\x13F:\xb4:m\xf2\x9e\x8b\
-I\xc0\x22d\xef:\xfc\xb6q\xfa\xdb\xb6\x92\xd9@\x86\
-'WO7\x08+\x16#\xa89\x1a\x0c\xab\xa7F\xae\
-:\xe8\x1b/9\xe3\xee?|`\xc6\xb13\x03\x97\x07\
-\x06>\xc3\xb3\x1a#\x19+Vz^t\xca.{\xc2\
-\xdes\xde/\xaf\xe7Sv\x95=\x9a7\xbe\x22\x196\
-i\xb9J\xbfz\xc27\xe5\xb0o\x7f,\xac\xf9\xfd\x1f\
-H\x96lD\xca\x18^P]~\x95D^s\xfb\x8c\
-\xa6t\xbed\xaf\x84\x22{T\xfa;u4\xd6\xd3&\
-U\xfej\x14\x97\xdb\x06S\xa5\xb1\xd77b;\xa99\
-9C\x1b\x10\x8c\x90\xa9\xa1\xb4\xcaN\x81A\xc3=N\
-5\xd4\x10e5\xa8RiP\x13\x1a)%C-\x93\
-\xd4\xbc\xfa\x8a1\x14D\xf1\xfdAl!\xcb2\x9e\x16\
-\xc6\xb0\xf7\xfe\x07\xdeu\xff\x0b\xafye6{Hi\
-\xb0\xa1d \x0a\xfd@Y$\xf0\xcf\x0d(g\xb7\xd3\
-\xcaz\x11\xb1\x09\x0e\xa3\x01\x5c@U\x12\x05\xb1q\xc5\
-\xde\xd4\xcc\xcc\x1a\xa3O[\xbc\xa4m>8\x83\xebI\
-\xa4/\x97\x16\xber\x7fg\xcf\xaf9~\x0d\xedq\xa5\
-m\x03\xadv s\x01\x1bJZ]\x83\xb3\xd5\xc2\x1d\
-\xc6\x9c\xda,6\xb2\xceH\x83\xb7\x13wwK\x9c\xd2\
-\x9a\xe4\x22\xd7\xb4\x19\x8cn\xd3!\x9e\x0e\x12\x22\x07h\
-\x90:\x12\xeb1\x18F\xe8\xd2\xd7W\xfc\xf8\xf8\x97O\
-\xbd\x8e\x17\x99\xf0{\xe7\xca\xe4\xdauf\xc3\x89\xd8\x15\
-/\x153\xb9g\x82N\xb62\xdc\xe1.\xd47N\xfb\
-p\xd2\xe1\xbaqz\x1b\xefY\xd5e\xbdS\x82\xb1\xb4\
-\xbc\xc3K+\x12.\xcb\x16Eh\xa1\x8b\x93\x8c;!\
-\x0f}\x06O\x1d\xe7\xb0l\xf1+?\xa5[\x1aFD\
-\x18\xc72\x22B\xcb\x95\x8c\xa8\xd26\x90;X\xbdf\
-\xe2\xf6\xf1O=\xf7Uw\xbf\xec\xe1\x85\x0e\xb3\xda\x22\
-sBpc\x0cd\x15\x03:\x1c\xc6\x9c\x7f\xdd\x0f_\
-py\xbe\xfa\xe8\xff\x16\xe3\xcf\x97W=\xd3T\xf2\xfb\
-\xdd\xc2W.\xd37M\xde)\x0b\xe5\x90\xf1b\xaa\x00\
-\x9a!+xI\x85\x13\x1aN6\x95\xe3M_\xf2P\
-\xba\x0906\xeem\xb2$md\x1f\x1c\x0ai\x0e\xa3\
-d\x99\xfc \xddf&v\xb3\x031\xec\x0d1\x10S\
-B\x0a\xbd\xa9\xa6\xaa\x86Z95,Y\x9a\xc3\xac\xd4\
-\xcc\xa6\xe7#\xe7>\x0e\xaf\xca\xb2D:\x19\x05%\xa5\
-\x96\x84\x81\xb20\xbb\xf7Uw\xbd\xe0G\x17\x8e=|\
-\x5cG\x18_\x0c\x14Y\x89\x0d\x9a\x1c\xf6\xc1PB\x7f\
-7y>G\x91\xf0\xa3\x9a\x8cQO\xb2C5\xa6\xad\
-\xd3w\x15\x86\x96!\xcd\xee&\x1a[\xa0}\xa1,\x04\
-_\xf4\x99\xd9\x9d1{\xe1\xe6\xe7\x1e\xc1\xe4\xfa\x9c,\
-\xf3dyI\x9e\x07\x5c\x9e\xa6\xb2\xa6\x19W\xaa\xc9\xcf\
-nh\x8cK\xc5\xc4\xaccJ\xc3\xd0\xa9BbS[\
-\x99\xf5\x9az\x92+\xf1\xf9$T\xc1\xa5B7\x04\x9c\
-@\xb7k\xe8\xb4\x8f\xea\xfd\xfa\xbe\xd7\xfc>\xdf(\xa7\
-w\xbcC\x7f\xfc\xd5\x87\xe5\xcd\xbfz\x9e\xff\x1fO\xfd\
-\x99\xbb\xfa\xe8\xaf\x99\xaf]&\xf2\xd6\x0dg\x9b\x97\xe9\
-\xcb\xc3\xdc]\xfa\xf6\x95\xe3\x1c\xa4\x16\xc1a\xc4\x81\xb4\
-\xd3p\xa2\x05e\x07\x8a\x11D\xc6\xb1\xfd\x1c\xeb\x0a\x8a\
-\xd1>|~\xea3\x13\xe8\xd6\xed\xb4\x82\xd0F\xe8x\
-heJ.\xd0B\x18\xe9CK\x84\x91\xd5\xed\x1f\x9a\
-\xbf}\xc6\x9f?|\xdc\xf5&\x03\x93\x93\x99\x92\x81;\
-\x84\xbe\xe6\x146\xf0\xc2\xb3\xcakO\xfd\xc8_<(\
-\xab\xce\xb9\xc5\xdc\xf0\xa7\x17\xf9\x84X\x96\xca\xbd\x97\x84\
-\x13\x9e2#7\xdc\x88j\x89O\xc7x\x9d\xbc\xb1L\
-\xeb\xd5\xdcG\xab\xa5d\x8dE\xe6\xa4c\xc8'20\
-\xa6\x11\xa0\x16\x90\x03H\x06\xb5\xd1\xf4\xd6\xd3\xd3\x8aG\
-\x9f\xee\x1b+\x82w\xca6\x9fQh\x99\xf0\x0e\x19.\
-bI\xcc\xf6D\xca\x0a\x81\xfay5\xf1\x00\x8d\x96 \
-I^(\x80O(O\x16-X\xad8\x5c\xdef~\
-f\xe6\xa9\xb7\xbe\xe9\xfb\x7f\xd3\xbd\xf9h\x06\x98^\xa0\
-\x18\x87vV\xc5\x1bi\x0cv`\x11S\xceb\xdcB\
-<\x09\x18\x968\x1aB]0\x89\xf5\xc3[\xde\xf8\xb8\
-4+o\x08e\x897\xa6\x88\xc5\xba\x82\xb2mi\xe7\
-m\x8a\xb3\xaf82\xf0\xf8\xa7\x1eNk\x14Z\x9d@\
-\xab\x0dY\x0e\x99M\x8b\xdf*\xd6\xc5F\xd5\x99\xe1.\
-oM\x8c\xda\x8aN\xc9\xb1\xbe\xb7\xa2\x11|u\xf1a\
-\x12\xee/V\xd0\xd4\xe8:\x01k\x05k\xaa\xd3\x22N\
-_m\xca\x07V\x1d\xa0N\x19\x99,\xd8\xb1\xfd\xed\xf2\
-\xfd\x0f\x1f\xf2\xd7\xad\x9e\xdea\xd7\xeb\xcb\xef\xbd\x81\xde\
-\xce\xa9\xc0\xaa\xadt\xbb{\xf4\x01\x9d\x0b[n\xd8\xb0\
-j\xd2\xf2\xf4<\xb6\xcd\x88E\xa4\x83\x84\x16h\x9b\x10\
-:\x88u\x84\x96!\x8ce8\xbb\x92v\xd1\xa6[t\
-\x18\xfb]\xdd>q\xc8\xee\xcf]\x85-{\xe4Z2\
-\x1a$\x9e\x00}\xa5\x8b\xd2\xca\x89e\x90\x81U+'\
->\xf9\xc0\x17N\xbf\xbc0?\xd3.\x19\x1d\xc6\x8ay\
-\xa4\xb3\x8aA\xd7\xa2\xdb\xee\xe1\x8f\xcf<\xfb\xbd\xe5!\
-'\xfe\x94U\x83\xf3\x86\xa3\xe6\x91U[dg\xdf\xe9\
-7~\xf1:=\xe6(;[\x96\xc3t\x13\x19\xca\xb6\
-\xb5\xf1\x8b\x92\x8aGR\x8d:P\xcc|>\x96\xd3\x19\
-\x1b\x8f\xe8B\x15\xb3\x93\x90\x93\xe5\x8dk5!\xad\x0f\
-\x85\xc6\xb0\xbe\xaa\x90\xb5\x19r#\xd0w\x86G\x06\x16\
-o\xfbu\xac\xb1\x0e\xfd\x8dk^~H\xb7[\xed}\
-S\xbd\xca&\x82\x93\x9a:[\xc6\x9e\xa1,Kz\xfd\
-b\xf5}\x97]y\xa9\xff\xdahG\x19\xc9\x04S\x16\
-,zOYFj0\xae\xa4t\x8b\x14\xbd\xddd\xb6\
-\x88\xb3a\x13P\xe3\xebGp\x01/e}\x95T{\
-m\x95\xd7\xd2\x8c\xba\x96\xe1U\x84\x12\x82:\xb2\xae\x12\
->r\xdfD\xb1y\xe2\x0fN\xa6\xddY\xa0\xed\x02\xed\
-.\xe4-\xc8\xdb\x81,\x8f\xd2Bc\xa9\xebw[\x13\
-\xce\xd2\xdf\x91F\x89S\xc9\x0cM\xfcw\x86\xc1\xd9U\
-\x99c\x13\xb2#\xa2\xc9\xc1:.xgRZ\x8d\x15\
-\x0a\xf5\x0c\x18PJ\xc1\xd8\x9a\x1e\xff\xfc\x8dO\xed\xf9\
-\xac\xfa\x17\xbf\xf3 \x9eu\xfa6\xb9\xf6\x0b/\xf2\xcf\
-?\xe2\x04y\xcf\x19w\xcb\xdb\xbe\xf3\xe2r\xeb5n\
-Sni\xfb\x92E\xe3\x80.\xaamT;\xa0m\x8c\
-\xc9Q\xe9 ~\x1cG\x0b\xe3\xd6\x90\x85\x8c`\x07\xf8\
-\xae%\xff\x1b\xf9$\xb6\xdc\xfc\x10\x1dc\xe8\xe4B\xc7\
-DyO\xabP\x82\xf18\xaft$\xc3\xd8\xc0\x9a\x93\
-\x1e\xff\x8a\xab?u\xf0\xce\x8c\xdbM\x8f\xe0KF\x0b\
-\x0b6#\xb42N\xfb\xcc\xf7\xcf=m\xd3G\xb7\x15\
-\xc7~\xe9Iy\xadU\x9c\xdf\x8d\xfe{\xd9\x12^\xf2\
-i\xc3\xab\x8f\x9a\x0dJ\xa9!\xcd\xf4\xf4Q\xcc\xf5H\
-\xaa2\xc9\xcf|\xa8$4e\xd6ut\xf2N\xbd7\
-\xee\x1b\xb4Y\xe6z\xa9\x0d\xaeb\xbd\xf3\x0f;\x07_\
-\xbb G\x18n7\x86\x9d\xa5%\x18_\xa394\xf8\
-9\xb1Pk<OS7\xdb\x10\xa8\xf8\x18\xd73\x90\
-\x12_\x04Ba\xb9\xf3K\xdf\xfd\xf9\xcc{F\x0f\xcf\
-\xd9\xd0\xee\x11\x8cGqt\xe7\x0d\xc1\x14Q\x94\x93\x0d\
-({\xdbi\xe5\x8b\x91\x00[8\x5c\xd5eW\x06[\
-\xd5G\x13\x96\x10\xfd\xa4\xe9\xda\x5c\xdd\x82!\xe6\xd5V\
-\xd9\xec\xbe\x10\xfc\xcd\xb3\xec\xfc\x9b]\xe7ndr\x8a\
-\x84\xd7C+\x0fip%\x91\x93\xe3\x14g\x97\x08\xd7\
-\xd3hQ\xd3\xe2\x0d\xa9\x84\x91z8\x85T\x18\xff0\
-<\xc3T\x8b\xdf\x08R\x8bW\x92\xdf\xa6\x05\xa3\x1e#\
-\x90e6R\x19\x8cbC\xa0\x95)\x9dU'^\xf4\
-\x9a\x0f\xbc\xe0I/\xff\xb8\xfe\xc9\xe8_\xe8\xb3\x1f\xde\
-\xa0\xbd\xa3\xc7\xf4X\x943\x17V\x99\xf9\x193Rf\
-\xa8\xb6\xc9B\x9bR[\x88\xe6\x08m\xd4\xb4P\xc9b\
-\xc9\xe3[\x84\xa2\x8b\x09+\xe8\xc8Z2\x01\x15C\xeb\
-\x9c\xd6\xde\xf5O\xdf\xf3\xee_ ;\xe6\xc9\x822j\
-,-\x17\xb0\xae\xa0\x83\xa3\xe5-\xb6H>\xabN\xe7\
-W\xfc\x8f\x93>|\xf5\x13\xf7\x14\x03$\xece\x869\
-\xbc*\x83\x8e\x85\x11\x1f\xde\xf8\xaew\xdc'\x9b\xb7h\
-\xa8\xd9\x99O\x7f\x1er\xcf\x95\x17\x04\xba\x1d\x99\xe1\x8c\
-\xd2\x0b=#C\xfaW#D8B)C\x84\xa7\xb6\
-zDQ/\x99\xc4\x1c\xab21{*\x99\xfa~B\
-b\xa5\x11\xa5\xa9\xa1\xf2\x1a\xd0\x06\x1931)\x03\xd1\
-\xcbM\x85\x90+;\x0b\xc7\x82*A\x02\xc1'qy\
-c\x17\x0f\xe9e\xd5__\xd1\x97\xab\xc9D\xca\x17\xf4\
-\xa2`\x1c\xa1\x84-?\xf8\xefk\xa7/p\x1b\x0c\xeb\
-\xf0\xe8\x9caP\x04\xb4\xed1\x9d@6p8[\xe2\
-\x17\xf7\xd2\xcaz\x94Y\x817\x8a\x94\x16[\x89\xee\x93\
-\xdf\xa5Y\x82\xf4\x86:\x01\x92\xcaQ\xda\xc4m\xc4\xea\
-0\xe5E\xd3\x0db\x8d\xd2\xbfx\xcb\xe1n:;z\
-\x0d\xdd\xae\xd0\x1d1\xb8\xbc o\x85HD\xcbB\xe4\
-\xe4\x18\xc5\x98\x805\xc4\x06\xd7\x0c99\x95\xda\xcd$\
-\x0bv\x93~\xb25\xa9v\xaf&\xbb\xd2\x08\xe6H\x7f\
-G\xc0\xd8tzX%$\xc3.g\x85\xccZ2\xb1\
-\xb4pd\x18\x5c\xc7P\xc8\xf9\xeb\xbfq\xf6\xc8\xe0\xd5\
-\xcf\xcd\xa6\xef\xfe\x99\xdc\xf3\xe0?\x9a\xb7~\xff\xc9\xbc\
-\xef\x99\xbf0\xe3\x1d?\x1dr\xb0\xe3\xb4\xcb6jr\
-\x82\xb4\xf16#HN\xb09\xc1e\x84\x96\xb2 m\
-\x8cvh\xe7\x873\xb20\xc5\x8a\xf6\x80\xa2\xa3\xe4_\
-\xe1;\xeb\xc6v\xfd\xc3\x0f\xc9\xca\x1e\xad2\xd0*-\
-mZ8\xc0\xbb\x02+\x82\xc5\xe2\xd4\xe0Vv\xffc\
-\xdb[\x0fyd\x17\x0f\xb6\x16\xe9\xe6\xd3P\x18ZV\
-)F\xe0\x84\xb1\xa7\x1c\xbb\xe93\x17-\x16\x06\x90\xa9\
-\x098\xf6\x5c\xecY\xe1\xe3z\xe6\xa7\xdf\x1e^\xc4g\
-\x0b\x9f\xb1=\x83\xdc\x0f\xcd\xb1QA\x8a\x86b\xb6\x1a\
-\x8c\xab\xa6\xe4Y%\x10$&\xd8\xfa\xa0\xa8\x13\xb4\x0c\
-`\x0d\xeaCc\xf4E\xc3\xe4\xb2\x9a\x0c\xe8\x12\xd9`\
-\xfcnI{T\x85\xde$\xd7\x03#\x86A\x0e[\xfa\
-\x86>ednV6\x22\xc9\x0cJ\xa51\xa5\xf5\x15\
-i-\x12\x03\xea\xf3+DjB\xb1X\xb6\x1e\xba\xea\
-\xba\xef\xdds\xfe\xf4\xd1\x96\x8d\xf3&bGy\xc0e\
-\x1e|\xa0\xc0\x13$\xe0e7*\x0b\xb1\x95U\xc0z\
-B\xbb\x8f\xaf\xf6\x5c\x09\xf5\xc1\xb3$\xea\xd4\x86\x04\x06\
-\xa4T\x8d\x84cU0p\xe4Az\xe8d\x98K\xef\
-1\x0f\xfc\xc7\xecs\x8f`b4\xd0\x994\xb4rO\
-;\x0b\xb4ZB\x95\x9b\x18\x0d\xa3\x22\xff0\xd6\xeaR\
-g\xf5\xd6\xed\xb2U\xd4\xea\xd0I\xcd\xc6\xf9Du\x13\
-\xb8\x86\x0cqHT\x8b5\xbfa\xf8o6\x03q\x01\
-U\x9f\xe8'\x10\x5c,\xeeL\x01\x9d\xb1\xb3\xbey\xe3\
-S\xcf~\xf3\xee\xa7\x85\x89\xb37\xcbk\xdf\xf9\xa0\xbf\
-$\xbc$\x5cq\xfa\x0fMgt\xf2>U\x16m\x8e\
-J\x1b\xd16\x22-b\xb3\xda\xc6\xf8.\xc6w0a\
-\x94\x9c\x8c2\xb4\x180\x86\xebld0\xdb\xa6\xd3\x17\
-\xc2:\xcf\xba\xab\xf7\xfcy\xbez\xef\xbf^O\xd0\x10\
-7\xbb\x04\xcb9\x9b\xe1\x9dR\xfa\xe88\xad\xb9\xbb\x9f\
-\xa7\xad\xbdu\xdb&\xaf3\xf4\x17\x03\x99\x9b\xa10\x80\
-\xf3\xb4\xe7\xf6\x94\xc7\xfc\xe4\x9c\xb43\xf5\x17\xe0\xba-\
-\xe8C\x5c\xc6\x13\xd8\xcc\x15\xf1\xd2\x1fT!\x13i8\
-bI\x8d\x80/\xf9\xc5\xearY\xaf\xcd-&K\x94\
-\xc7\x0a\x0b\xb6\x86\xe5D\xcc:\x17\xb6\xca\x99\xd2!\xe6\
-.\x8d@\x86j\xd7\xae\xc4'>(^\x02\x8b\x16\x1e\
-\xec\xe7\x94R\xa2\x16\xbc$r\x95\x0e9\xf8A\x18:\
-\xce\xe3\x09F)\x08x\xef\x09\xce\x12\x82\xf0\xc8\x8f\xae\
-\xb9\xe2\xf6\xe7\xed<;\xef\x1d&\x8e\xbc\xdb\x8f\xb7\xb0\
-7P:\xac\x07\xe3<\x05\xb3P\xce\xe3L\x19}\x19\
-T\x22U\xd8\xa7h\xb5j\xd6\x9cb\xa2\xeb\xf7F\x93\
-\x8e\xd6\x86\xba\xe6\x97B\x08:`\xa01\x19E}\x82\
-3\x7f3\xcb\x03\xef\xd8\xfd\xca\xd3\xd8\xf8\x84Ut\xdb\
-\x8a\xee\x99fd\xd4\xd2\x1e1\xb8\xdc\xc7\xf2\xa5r@\
-\x96\x90\xea\xf9j\x10\x1f\x86\x18\xbda\x09ea\xc9\xc7\
-\x14\x18A\xcd\xd9\x095w\xa7\xc2\xfc++\x92\xba\x0f\
-@\x11c\xea(\x10c\xc0\xb4\xe2M1\xd6\xb6\xcc\xcf\
-_\xbcp\x92\x16\xd3\xa7\xdc)\x1fy\xedM\x5c\xfaO\
-?\xb0\x87~\xe8\xf3\xfe\x8f_\xbbm\xcev\xb8\x09\x8b\
-w9H\x8b`\xd2n_?Z(9\xe2Z\x04\x9b\
-\x11\xca@\xd7N\xd0\xed\xae%\xcb\x07\xd8\xd2\xe1\x1f\x9f\
-\xb1\xf1\xeb[_\xbb\xd0\xddr\xe5u\xf4\xc5\xd0wJ\
-\xbf,\xf1>\xd2p#\xa7\x0a<\x1e\xd9\xb8\xfa\xeb\x0f\
-\x1e1S\xceSf\xb3\xb8r\x0e\xf5\x1e\x8c\xd0\xb1\xe5\
-\xe0\xe0\x7f0\x07\xc7\x01\xd6\xac\xcb\xb8\xe6\xe6S\xc2\xcc\
-!\x17\x98\x1dG\xfe\xc0\x08\xe8\xb4\xe1N\x1f\x12\x83{\
-\xe8d^\xeb\x90\xea\xd4r\x86B\x0a\x051Z&\xfc\
-\xdd\x99\xb8\xbb\xa6\xcaU\xccp\x87\x0f\x8dVV\x1b\x94\
-\xee\xa1\x1di4\xd3\xc0$\xba\x96\x19\x9e\xc7j\x86\xb9\
-\xde>\x13\x162\xe1\xde^\xc6\x22\x83X\x81\x07\x93\xa0\
-\xce\xe8]\xe0\x93\xa8\xa4(\x07\x80%\x98\xf8\x0b\xa4g\
-(\x17\x07\xdc\xfd\xcd\x9f\x5c}\xdd\xf3\xb7\x9e\xd6\xd2C\
-\xe6 \x98\x02-=\x85\xfa\x14W\x1a\xf7\xce\xc0,\x12\
-\xf6 \xb6\xa0\x14OH\xceg&\xa4\x110%\xc1\x94\
-\x04\xf5h\x08\x04)\x93\x94\xc5\x13\xf0Q\xa8\xa2\x01\xb5\
-\x1e\xaf\x81\xd0\xf5d\x85\x03\x19Pxp\xe2)v+\
-;_\xf5\xab\xc3'\xfd\xd41\xab\xe8\xb4\x0bF\xc6\x85\
-\x91\x09\x8b\x95\x01y[\xc9\x1c8G\xac\xefm\xec\x0a\
-\xaa\xd2\xc6\x98(8\x89\xcf\x0d\xeb\xfcX\xbf\x87\xfas\
-+&e$R\xa7\xa5\x98\x04\x5cW\xee\x16\x00\xce\x0c\
-\xed\xdb+K\x12+\x8a\xb1\x86\x8a\x81\xe2\xd4\xe2\xb3\x82\
-\xcc\x04FW\x1c\xf6\xf9\x0b\xfe\xcf\xdb\xfe\xef\xc7\xb6\xf6\
-\x8e\xda\xb6Y8\xef\xf9\xee\x8fx\x12?z\xf7\xbb7\
-\xbc\xfa\xc7\xb9\xb5-\xe6\xb4\x8d\xd0B\xb4\x03i\xf7G\
-:@\x07C\x17\xb1-$x4xBY\xd2\xb2\xe3\
-d~\x05\xf4AJ(\x9fZ\x14\x93\xdf\xdb\xf9\xec\xfb\
-\xdb\x8f|\xefz\x8a\x81\xe23\x877B\x11\x02\xa6o\
-\xf1\x09\xd4\xb06\xff\xf2\xc3\xcf\xe8\x97{\x99\xf3\xf3\xa8\
-N\xa3\x94x\xebh\xe7\x96\xb5o\xd4\xc5dA\x9c\xaf\
-\x10n\xbf\x90\x93_\x12\xcc\xe6-Y\xe0\x8cKL\xd6\
-\xe7\xd7}Mi\x86iw\xf7\x899\xd3\xc46\x97k\
-\xbbZ\xe5\x82\xa7\xbf\xb8\x88\x11E}Zd\xb5\xf7\xbc\
-\xd4'@3RG\xab\x06\xd54\xf0\x19\x1d\xca\x0b\x87\
-\xa9TC\xb2\x83M\x9bla\x02sN\xb9o\x90\xb1\
-\x18\x00\xf1I\x0b\x95\xdc\xfa}\xa0$ \xceAP\xca\
-\xa0h\x01\xa5\xd3\xfc\x9e+~\xf1\x9d\xdb^<s\xe2\
-\x08\x87.\x98\x94\xa0\x95^\xb5\x84\x98\xd8n\x0b\xbc,\
-B1\x87u\x03\x0a\xf15NU\xdd\x14\xd80|O\
-\x92\xbfetJH\xbcLUDCM\xe63\xa6\xa2\
-0\x941s\xc0E\xb3\x8d\xce\xa5\xf7\xae\xd2_\xaex\
-\xf9\x91\xb8V\x81h\x9f,\xf3\xb4\xc6\x0c\xae\x1d\x12\xdf\
-\x1e\x9cK\xc41$\x8aKR\xf3jLc\x87F\xd2\
-\xce/\xc3\xd3\xa0\x0e\xc1\x8e\xb5{E\x8d6)\x82)\
-\xaa\xb3\x127\xa72\x9a\xaa\xb8\xfa6\xfe\xdc\xd8\x03\xa4\
-\xc5o\xc0\xf4<Y+\xa3\xe7{\xb4\xb3y\xd0\xff\xd5\
-y\xdfg\x8f\xbc\xee\x89?\x0coz\xc9\xfd\x83\xf5\xff\
-4X\xc9\xee\xa9O\x5c\xbex\xce\xe9\x0b\x1d\x16\xb4\x8d\
-J\x07hc\xd2M`B,y09\xf8\x80\xd5\x92\
-\xa0\x03\xfa\xbe\xa0_\x04l6\xceXK\x08\xed\x12\x93\
-YF\x9f<\xceiWd\xbf\xb7e\xed\xce\x7f\xf8)\
-3\xd3\xd3\xf4\x81`->\x17\x06e\x89\x146\x22t\
-\xa7\xac\x5c\x9c\xa7\xf4\x03\x8c\xceG\x17\x0b\x13w\xe3\x91\
-\xb9\xf2\xf4\xe4\x8f_\xb6ap\x12G\x9e\x82y\xe0\x94\
-Yx\xdc\xf1\xe6\xd8\x0d\x9d\x1b\x16\x1b\x90f\x95\xfb!\
-1\x1b\xe4\xd1^m\xe9\xe6\xe8\x94\xb3\x9e\xc5=3\xf8\
-\x22\x8eS\xc5\x98!\xd5\xb7\x81\xe24\xca\xa7d\xff\x91\
-\x0a\x1b\xd3,o\x96\xaa\xa9\xaaG\x99\x96\x9fI@a\
-i\x95^&\xdc\xdf\xb3l\xf7Ji\xa2uSu\x1e\
-y<f\x10\xed\x04\xc5Y\x06&p\xfb7~\xf4\x83\
-;\xff\xb0\x7f\xf6hy\xa4\x17\xf2\xd1\x02\xdb\x19\xa0F\
-\xc8\x83\xc3\x89`\xb3\x822_\xc0\xeb4\xc6\x0c\xf0\xa9\
-2\x96:PH#\x11M\xcbd\xc2_\x05\x96&\xb6\
-j\xa8\x80\x00\xea\xe1\x15\x15\xe3uP\xd0k+-\xab\
-H\xbf\xa4\xb8\xbb\xe0\xe1\xf7o\x7f\xc1\xe3\x18_\xd3\xa2\
-;\x0e\xad\x0e\xe4\xceG\xec\xbe\x15\x95UY\x1e5\xb2\
-\xcej\xa2\x84h\xdd\xa8VD\xf1\xca\xb4\x8b\xf4o&\
-\xdd\x00\xb69\xbde\x08a\x1adi\xf9R\x956\xd5\
-\x14\xb7\x9e\x06GY\xa3\xa4\x13\xc4\xb88nkaq\
-mC\xf0\xca\xf8\xa4\xf6\xb6l}g\xf7\xfd\x9a_\xfa\
-\xed\x0f\x17\x0f\xdf\xf1\xab\x0f1u\xd8\x99\x1c\xfc\xe4\xce\
-_\xfe\x9c\xdd\xedQz\xb4\x80\x16J\x0b\x956*m\
-\x82d\x94\xde\x13\xb4\xc0\xda\x02\x91\x01\xaae\xec(\xfa\
-\x96V\xd1at\xe00\x83\xc0\xbc\x94\x0c\x9e\x18\xd8t\
-\xed\xe4[;/(^\xf2_\xecxp;\xb3Z0\
-o\x0aL\x96Q:\xa5,J\xec\xda\x95f\x1a\xca2\
-\xb2\x8c\xc5a\xb5\xc4S\xd0\xfbv\xf6\xab\x84\xeah\xa9\
-\xd8q\xa1\x87\x99\xca\xc4\xf0\xe4\x0dn{w\xf5\x5c+\
-c{\xa8\x19&\xe9\xf2m\xcdt_\x8aO&\xa4\xbc\
-\x13\xfa%\xfd\x99E\x82\x97\xda\x81X\xfd0\x94\xad9\
-\xfc\xad L\xa9\xa6\xb7\xd5\x5cl\xe8\xcb=4\xe1\xa8\
-M\x9ebLf\x19\x22\xea]\x91\xf6\x83@\xbf\xeby\
-\xa8\xb0<\xd0\xcb\xe9Q\xc4dBc\x22Z\x9c\xdc\xd2\
-\xe6f\xa6\xdd\xaf>\xf6\xad\x9b6\xbfTN\xc9\xc3\x86\
-y\xcf\xc0\x06BQ\xd2\xf3\x8a\xf6<\x8b\xae*\x0c\xfa\
-\xc8`\x1a+}\xbc\xf5h)\x98\xca\x09\xa1\xbe\xd9\xd3\
-\xe9P-\xfc\xa0\x8d\xa6\x1f\x8c\x94\xf8$p/%\x22\
-\x05\xc1\x07\x825\xb84>3\x8b\x81\x1d'\xfc\xf8i\
-N\xa7\x0e_K\xde\xf6ho\x81\xf6\xa8%\xebX:\
-c\x19\xcez,>\xf2\xe9\xad\xd4\x9e\xa3qG\x1fJ\
-\x09\xab\xf2&.N\xa9\x17\xff\x90\xe2M\x8d\xdaHs\
-\xca[\x87\xef-}T\x15\xa6\xb5C\x9b\xab\xca\xf3\xd4\
-\x8ab:\x06\xdf\x1f0\xd2i\x13\x5c\x09\x04\xb2\xee\xd3\
-\x16?\xf4\x0f\xa7\xc8{\xbe\xf0\xd7d+\xce%+w\
-31\xb5\xe7Kw\x9e:\xb1G\xd9c#\x92\xe3\xa5\
-\x05\xb6\x85:\x8b/\x03\xa2Eb^y\xac\x94X<\
-\x19\x05j\xe6\x99-\x0c\xad\x91\x92\xb5\x1a\xe8X\x8ff\
-\xd0\x9d\x82\x15\xffr\xc4\x15\xc7}\xe6\xd8C\xbe\xc7\xde\
-\xcf\xfc\x94\xe9\xfb\x17\x99+\x0b\x16\x05\x0a+\x84\xdd\xbd\
-A\x0f\xcb\x0e\xe6:k1\xbeE\x07O_\x90\xdd\x9f\
-{\xe6t\xca\xc0\xea\x97\xf0\xe4\xcdz\xcc\xdd\x94o\xf6\
-#\xda\xea\xed\x95[Vm\xf03\xc2\x8d)\xf0^E\
-\x08N\x91\x90a\xbd\xc5K\x88\x9cG\x1fO\x00\x934\
-\x1e\xe5\x88\x9f\xc7\x15\xdb\x0c\xa6\x15\xd7\xa4\xf6\xaa\x08\xc3\
-\xa1\x11\x94T\xe41\x9b\x88\xea\xcb\x92\x1f%\xe2nK\
-\xd3\xc4k3:\xc1i\x06\x18|\x0a\xb2\x95\xca\xdb\xc0\
-\x1bp\xca^\x03\x9b\x83c{\xe1\xe9y\x8f\x96\x81\xd2\
-\xc2\xec\xc2\xdec\xae\xf9\xdf?\xba\xee\x81w\xaf8\xa6\
-\xcd\xe1\xde\xe3\xf3\x101x\xa2\x05St\xed7X\xbb\
-\xc8\xa0?\x871\x05\xa5\x89\x98\x8d\x91\x84\xc2\xd8\x01A\
-|\xac\xdf5\xc4\xc8\xcdP\x0e\xed\xc4\xfd\xb0k1\xa5\
-A\x9c\xe04FJD\x81~\xc0\x17\x1e\x8f\xc1\x0c\x84\
-\x85\x17]\x7fHQ\xae}\xea\x93\xe8\x8ezZ9t\
-\xa7ZHVb;\x9e\xe0\xcbH:\xcb,.\x89J\
-\x8c\x8d\x91\xda\xf1!\x8d:\xbe\x16U\xa2\xea1>f\
-\x8dY\xc0\x06\x8b\xd5\xc8\xd1\x91\x94\xedk%\xd1\x97\xd3\
-\x0c-\xde0&R!\x1c\x18gpY\xb3\xc9\x1d\xd2\
-\x1e\xe2\x80\xb1\x84\x1c|\xbf$\xd3(To\x8fM\xb2\
-\xd8\xfe\x10f\xfc\xa5t\xa7\xf6\xd0\x91i\xf2\xf6\xccN\
-w\xd2\xfc\xe7\xae\xcf{\xbe\xcd@[P\x8ebic\
-M\x8f\x9ex\xac\x96\x98P\x12|\x81\x97\x82`\x06x\
--\x11\x94N\xbeH\xb1X0W\xcc\xd3\xe9/b\xb3\
-@\xe9,9}\xe4\xcd]\xce\xdc\xfd\xac?\xed~\xe0\
-\xe0\x93\xbe{Z\xf9\xb1\x9b;\xd3\x97\xdf\xc2\xde\xff\xbe\
-\xe3\xa0G>\x7f\xb7\xcf\x90\xd6zr;\xc9\xa0\x8c\x80\
-\xf8|o\xaf\xbd\xe7grn\x94\x1e\xe2w\xf2\x81\xef\
-?\x8f\x1b\xb25\xe1\x1d\x7fx\x9d\xf9\xc9\xed\xa7\xc9\x17\
-n:\xb2\x7f\xf1A\x5c]\xccs\x961\x14!\xd5\xd9\
-^\x90V\x22\xc3\x1aM\xe8\xb9\xd6\xa4V]\x93\xd3\xdd\
- {\xcd}\xa1\xafq\x8e\x999\x8c1\x91D\xb6<\
-I\x5c\x87\x13\x00\xa93\xbc\x19Fk\x8a\xees\xe6\xb5\
-\x5c\x1b[\xe7X\x15\x8ai\xa58\x1eU\x1eZ\x8c\x90\
-]\xd7Y\xf2\xdd\x8f\xfc\xfe\x8d\xaf\xf8\xe5'\xfa?x\
-\xdc\xd8\x08\x9d\x85\x01\xb3\xc6a\xd1\xa1\x17\x8e@\xb0\x9e\
- \x03B\x7f\x1ek\x02^}\xa4\x95&G\x9c\xa1\x8a\
-\xc7#\xc1\xd6\xb0\xae.\x09\xdb\xaa\xcd\x1b\xa2\xdd\x8a\x09\
-\xa85\xe4^\x90\x8eb\xc4\xd0.\x0d%\x82|\xf6\xde\
-\xce\xae\x1fw_\xf6d&\xd6\x86h5\xeb\x94<\x8f\
-\xc2\x92*\xbb\xca\x98\xa1\x8d\xa2H\xa8\x9d\x1f\xaa\x19\xba\
-\xa9\x1c\x9e%\x12ML\x90F>\xe2\x90.b$*\
-\xcd*\xd7\x9f\x10\x86'\x855\xe0\x93\xd9C\xe5\x96d\
-\xa8\xa4\xd2qZS\xa5O\xaa\x89\xf3\x10\x12\x87*\x98\
-\x00\x99\xe0\xd4\x92\xdb\x92l\xedzF\xb3i\x98\x9ee\
-\xc04\x9dBY\xf38\xfd\xcc/O\x0c/{\xd6\xb5\
-;\x0e\xceX\x9b\x0bE\x18\xa0j\x99\x08%\x85\x94\x18\
-\xf5\xa8\x96\xb1\x93\xa5D\x88\x9f\x0b\x05*E\xcc\x1a\x18\
-,\xd2\xf6\xf3dmK\xdf\xae@\xbdbF\x07\x1c\xfa\
-\xde\xc7\xed]\xf3\x8e\x83\xde3\xfd\xab]\xec\xec\xef\xb1\
-\xfd\x83\x8f\xf2\x87\xae2\x8c\xb4[\xb8\xf9>\xedv\x0f\
-\xbbc\x81\x07f\x8f,\xaf=\xee\xd2m\xde\x002\xc6\
-\x08\xcf1m>\xba\xf7\x89J\xb1\x91\x8d\x07\xb5\xe5'\
-\xd3\xe7\xe9\xac\xed\xde\x06\xec\xcd#Q5\xf3\x91\xea\x12\
-\xd4\xa2\xc1\xa5\x96)4h\xca \xab;\x8c\x1d*{\
-\xb2\xb8\x17\x9a\xa1#B\xf0\x8f6\x08m:\x13WR\
-\x97z\xaa\xaaZ'\x0d\x86 4=\xce\xeaX\x9e\x0a\
-MO\x81f\xd22\x14\x12\x18\x04\x0f%\xe8\x88e\xd1\
-\x96\xdcz\xf3-o\xf9\xfa\xb1W^\xb6\xf0\x83\xc7\xaf\
-\x0c\xe4v\x81\xbe\x08N}\xcd\xc47\xb5\x97e\x8f2\
-\xcc \xaeO\x99v\xf6f\xc8\x8a\x10\xcb\x19\x03\xa8\xf1\
-u\xcdnj\x92uY\xa95csk\x16X,\x14\
-\xed\x17\xf42\x8f\xf6-v7\xcc\x97\x01{\xe3\x9c\xdc\
-\xff?\x1f<g\x8d\x8eLZF'[t& w\
-J\x96\x072'5m\xa0B[\xea\xe8l\x89\xe1\xaa\
-T%\x09\xb19\xad\xd8\x99Um\x1f\x1bU3\x9c\xe6\
-2\xac\xf9A\x96\xb09c\x093Dy\xac\xa1\x81\x0a\
-\xa5f9\x09\xd5+\x81\xbaM\xa7\x83\xd8\xe8\xb1\x9fe\
-\xca\xf8x\x9f1\xb3\x88\x9b\x9bG:\xd3\xe8\xa69\xda\
-+\xf7052\xb3\xc5?\xa3\xfc?W\x8d\xed\xb6\xe3\
-\x04)\xc9L\x81-\xa0t\x03\x1c%h\x11\x179%\
-\xa4\x8f\xaa%\xa8\xc7h\x01v@i{\x14a7\xec\
-\xf9\x15y\xef\x01\xac\x81\x9e7\x0czJ\x0b\xcb\xea\xd3\
-\x1d\x07\x9d\xb5\xc2?a\xe3j6i\x87\xac\xf4x\x09\
-\x94[\xf7\xb0\xd3N\xf0\xb1\x8bO\x99\x9a\x1d\xb9\xf1\x1f\
-\xe3\x9b2\xcb\x1c\xcf[x\x03\xc7o\xb9\x89\xb7t\xde\
-\xc2\xe1;\x7fZ<\xf9\xfb\x9f\x0f\xd3\x9d\xc1\xfds\x81\
-\x072!k9Z\xc6\xc5\xdd+D\x0f\xc82\xdd\xf3\
-\xbe\xca\x1dT\x81\xdc\x92\xad\xdby\xd3N\x0a_\x22Y\
-\x1e\x17\x8c\x07_\xf8\x86CB\xc3\xa7\xb2\xcaP1\x82\
-O\x14A1\x9a\x821\x87f\xb0A\xa3$C\x13\xae\
-\xa4u\xfeT\x22\x9e\x01\xbe\x08\x94eQ\xbb\xca\xf7\xe6\
-\x17:w_~\xf3\xa5\xf7=\xf3\xbe\x0f\xac\xdcy\xa8\
-\x07k2:j\xc9\x07\x16\xc8h\x07\x8f\x10PS\x10\
-L\x8fP\xcc\xe1\xec\x80\x82\x82\x94\x875\xcc\xc1\x92@\
-P\x1f\xc7c!\xfa\x19c\xfdPa\x95\xd0\x1eC\x99\
-\xd4h\x8aq9m\x9b\xd3\xc1\xe2\xd4\xa3\x83Ef\xbb\
-\x01\xb7u\xc0\x96s\xaf9\xa5\xebW\x9f|\x18\xadN\
-@\xfcBl\x5c\xdb\x12i\x01.\xc6u\xc6\x9d\xdaD\
-\xa8N\x93\x03\xb4Fj\xb13\xf1\x164\x1a\xcfb\x13\
-l\xe4\x8d\x86\xea\x15'c*cR\xf3\x1a\xb0\xd6\xa7\
-\xe1\x95\xd6b\x14Sa\xff6.\xf0\xcaJ\xdc\x9aa\
-\x86\xb0\x91\xb8583l\x88\xadV\x19[\x11\xe2\xcc\
-;sd\xf9\x1c\x1a\xf6R\xcaNd0\xc7\xd8B\x9f\
-\xcc\xcc\xa3c\xbbY\xb7z\xf7\xa7\xbf~\xb6\xff\xe1f\
-\xee\xb7P\x96\xe0\xecb\x84\x22\xa4@MI\x90\x02a\
-\x00\x0cP-P\x1f\xe1e\x0d\x81\xd8\xd2\x15\x04-\x08\
-\x16\xcc\xe0\x06\xda\xf3\xdf#\xe3n\x16e\x91~\xd6g\
-P\x8c\xd0\xedw\xd0V \xb4\xa1o\xe6\x98a7{\
-;k\xf8\xe0\x85\xaf\xdb\xf8\xd3\x97~{\xc2n\xd89\
-\x91j|{$\xbb_\xfe!\xb9\xecw\x1fv'n\
-\xff9\x1c\xb1\x91\xdd+\xfbr\xc63\xca\x1d=\xb8u\
-q\xc0l\xba\x0fM\xeec~\xa0Z|i\xd1\xb22\
-\xf7k\x18\xd1\x9e\xfc\xf0\xb7v\xc8\xfc\xde\xf9\xd8\xf2\x06\
-\x08e\x845\x87r\xc0J\xae1\xcc\x91m&sj\
-\x22\xf6\x86\xe4a\x1fd\xc8\xad_\xfe\x08\xf5GA\x9c\
-\xc1\x969\xe5 \xb0kz\xeb\xd3o\xbc\xf0\x17\xbf\xd8\
-\xf9\xa2\xc5\x97O\xcc\x1c\xde\xb2\x8c\x8fy\xac/\x18\xb0\
-\xc8\x82\x89\xc7i\x194\x226\xd9<\x03\x9dE\xb3\x01\
-\x85)\x13\x87:FBg\x12\xd1\x1b\x952\xdd\xe0\x09\
-\xaeIRK\x91\xc4\xbe\x14\x9f\x98\xbd\x8a\xe0Q\x09\x84\
-0\xa0\x94\x05z\x99!_\x10\xc2\xa8\xa1[\xe6,\xbc\
-\xf2\x17k\xdc\xb6U\xcf>\x85\xeeHA\xbb+\xd1\x02\
-\xd0\x95\x11\xba\xcc*%T\xf4\x1b\x0d\x95\xd8\x80!\x13\
-\xa8\xde\xfd+,^\x86\xc8\x8c\xd4\x03\xad4\xac\x92P\
-{\x19\xa9Jc(%\xc9\x10E\xeb\x92I*\x88\xb4\
-\xa2+\x1b\x93\xe4\x88\x15\xcc\x99J0\xa3\x04\x1b\xad\xbe\
-2#t:=Z\xf9\x1cb\xa6\xb1:K\x08{Q\
-\x9d!\xd7\x05l6G\xa75\xc3hk\x0fG\x9d\xb8\
-\xfb\x0f?t\xfa\x9e\xdb\xb6q\xb7WJ\xb7H\xf0\x9e\
-@\x11-\xe8\xb5L;\xbd\x8f\xe6\x0e\xc4\xdf\x93\x06\x9f\
-J!\x0ff@\xe8\xce0\xc8\x84B\xf7b\x16~F\
-\xa7\xff}\xcc\xc2/q\xbd\x9b\xd0\xf27\xf8\x85{\x18\
-\xf4\xb6\xd0\xdd}\x0f#[\xb7\xf1\xf1/o|\xf67\
-\xfe\xe9\x9a\x0b\xdd\xe4?\x9cZn<\xe5E\x95\x85`\
-\x07\xd6 \x1b,\xf2\xe6;\x1f\x17.\xfe\x5cK~p\
-\xe6\xaf\xf5\x85\xef\xec\x14\xa3\x87\xc8\x95[\xe7\x99\xef\x97\
-\xf44D\x08\xc5\x80h$\x06\x96e\xac|\xebDX\
-Ux\xd6\x84\x9f\xcc\x16\xb6\xcdD\xe2\x97O\x8b\xd4\x99\
-a\xe0\x02i\xa7\xd7\xa5\xcc\x85fzb\xc5\xd9\xa9<\
-\x1c\x9a\x81k\x95@|(\xb7\x8a\x03\xab^\xf0x\x07\
-\xf7\x5c{\xcb{\xae<\xf5\xa7_\xeb\xfe\xddA\x1b\xc7\
-8\x98\x80\x1dth\xcf\x1a4\x94\x04\xe90\x91yL\
-\xd08\xef5}4\xcc#\xae\x877\x9e\x10b\xf6\xa2\
-\xabZAM3M\x13\xea\xecP\xd1\xb0$\x87}\xc8\
-\xb6l<o\x22\xae/\x0b.:\xd8\xe8\x80\x81q\xc8\
-\x9f\x5c{\xd0\xc2\x7fO\xbc\xec\x04&7Y\xba+\x1d\
-Y[\xc9\xda\x90w\xe2$\x94\x86KBm\xf1Q\xcf\
-6\x1a\xda\x85\xd4\x13\x99fY\xd2\x14\x95'J\xf2\xb0\
-)\xadn\x14i\xec\xe4\xa9P\x93\x88\xf0\xd8\x0a\x09J\
-\x0b\xbfB}L\xed\xc0\x90\xc4\xeb\x22\xa8\x04\x0c\x90\xe7\
-\x03:\x9dy\x5c6\x03:C\xd6Y\xa4\xe5\x06\x10\xe6\
-P;\x8fe\x91\xd1n\xc9\x8aM}V\xaf\x9c\x99^\
-{f\xef\x1d\x97M\xcd\x153\xcc\xf6\x0c\x99\x8fe\xa7\
-P`\xb4\x8c\x16\xb6\x94\x18-\xc1\x94`\x0a\x84\x12\x83\
-\xc7\x88\xc7\xe0\x91\x9e\x22\x83X\x0aiV\x12\xec\x0c\xa1\
-x\x80\xc2\xddB1\xb8\x81Ro\xc6\xcf\xdf\x84\xdd\xb1\
-\xc3\xfc\xed\xab\xee\xd3\xaf\x9d\xf8\xf9\xab\x94\x7f\xfa\xa3\x01\
-\x1b\xef\xd5\xab\x9f3oR\x0c\x13\xc0\xb1f\xc3\xc1\xb7\
-\xf2\xe06\xf4\xf0\xae\xe3\xee\xfeq0\xb8QU\x09w\
-\x5c\xc0\xbf\xad\xe9r\x92\xcbp\xa5g\x80\xd6\xbc\xbe\xc0\
-\x80V^\x0e}\x90%\xa0\xd2gv]q\xf1\x96\xbd\
-O{\xdd\xb3\xc9[\x86l%\xe8\xa0 k\xb9\x883\
-k\xa4\xd2j\x83\x98\xdb\xe8tk?\x1c\x93\xc8d\xde\
-\xfbd8+\x94!\xa0Aq\xc6\x10\x06\xb1m\x0cV\
-\xf0e`n\xeb\xaeC\xef\xfd\xce]\x9f\xb8\xeb\x8f\x1e\
-y\xe6\xe1\x9c\xdc\xcb\x10U\x06NQ\xb5\xc9\xcf\xc6!\
-6\xf6i\xdez\x0a\x19 e<\xc5\xbcDKUM\
-\xdb\x81\xd4\xe2\x1b[\x17\x1c\xcd\xf8g\x12\xf5\xad\xf6\x1c\
-\x8a\xba\x8dH\xd71\x8d\x14\xa7`\x08\x03A' \xff\
-\xf2C\xd9\xfd\xaf\xde\xf6\xd2#\xd9x\xfc\xc1\xe4\xa3}\
-\xba#\x9e\xce\x88\xd2n)Ye\x15\x92\x82\x99k\xb7\
-\x043\xf4\xba\xa8\x12b\xacT\x22\x13j\x87\xba\xff\xcf\
-\xd9w\xc7\xebUUi?k\xed}\xcey\xcb-i\
-$\xa4\x90\x10\x02\x84\x8eh\x14i6\x8aH\x11\xacX\
-FgdD\xf9t\x10\xd4\xb1\xeb\x8ce\xc6\xb1\xcd(\
-\xb6q,\x80eP\x14l\x80\xd2\xa4)\x08H\x91\x16\
-\x02$!\x85\xf4v\xeb[\xce\xd9{\xaf\xef\x8f\xbdO\
-\xb9\x97[\xe2\xe4\xf7\xbb\xe4rK\xee}\xdfw\x97\xb5\
-\x9e\xf5\x94\x9c~\x8d\x90\xc4n\x1d*\xacU.\xcf\x09\
-\xe6b\x98h]\x10\xe6\x08`\x5c\xf9\x1a\xd8\xd0_\xd9\
-\x10\xeej\xad/-\xe1\x00c\x05\xd61\x1c9H\xca\
-\xa85vCx\x00\x8e\x87\x10\xdb\x0e\x98\xdb jA\
-\xd9.\x04\x1d\x10\xbaPd!\xa4\xb0}\xa3\xc3\xc0\x86\
-&\xd6?\xbd\xe0}\x87^\x17\xff\xfb\xb9\x83\x87\xc4\x0e\
-s\xa4\x0b\xc3\x19\xa4\x9b\xa1\xeb\x08I\xd4\x05\xf1(\xba\
-\xd6sC\x81\x0c\x0e\xe1F\x10\x03E\xa1\xe1u\x02E\
-)\x1c9DY\x0bmg l\x11\x0d\xb4a\x06\x81\
-+w|\xe7\xec/\x9c\xfa\xaa\xb3h\xd9\xa3\x17\xca\x9a\
-M\xc7`\xdf\xd9k\xdd\xd6\xf6p\x01\x8a\x01\xd8\x81\xa1\
-\xe1\x10\xeb\x9c:\x81\xdd\x0a\x1d\x81_\xa0\xa0j\x0a\xeb\
-\x936\xceK|ic\xad\xc0j\xf2\xdep\x8a`\x9d\
-\x07\xd7r\xe2\x15\x5c\x8c\xda\xd0\xda\xbbW\xde\xbd\xe4\xa2\
-\x03\xa0\x22\xe5\x87\xfbB\x80\x0e\x89\xae\x5c:\xc0\xbb\xa0\
-\xa1-,\xc3i\x5c(\x8c\x03\x88\x95\x7f\x91\xba6\x88\
-R\xfcb\x17\xcdH\xbb\x06\xa6\xd5MV\xdd\xf2\xe0\xc7\
-V\xbd\xeb\x99\xef\xba\xcbf.\x9b\x83\xc5\x91\x80\xb3\x0e\
-F\x14\xc0*B\xe4\x02*\xc3\xde\xc4\xc9\xb1\x81u)\
-HR\x80\x5c\xa1'(\xa2\xa5\x0bm}\xd9i\x14\xf4\
-\xba1vyT`\xf8e\xa8\x1d*n\x14\x0a*\x06\
-\xe2\x84an\x1f\xc0\x86\xb7l<c\xb9Yp\xdcB\
-$u\x8b$6H\x12 i\x00q\x10\x97(\xe5S\
-LP9\xbdi\x9c\xf1i\xa1j\xa9j#hl\xfe\
-$\xd1X\x14\xad\xe0\xea\xe4\x11@\xa8pj\xa5\xa4\x1d\
-J\xf8\x04\xd187\xebB*J\xe5\xe0\xd1\x11\xb4j\
-#\x8ev\x024\x0c\xe6Qh\xb4\xa1\xd0\x06s\x07\xcc\
-]?\x0dA\x06\x22\x0b\xcb)\xa2\xc8\xc1t\x1cl\x83\
-\xee}bv\xef\x96\xed\x1bF\xcf:\xac\x0bcP\xef\
-\x08D\xb5a\xe26\xc4X8g\x83\x83\xb4\x059\x03\
-\xa2\x0c\x90,\x90t38\xb1P\xa6\x83\xd4\x10\x94\xeb\
-\xc2D\xe2\x15\xba#]\xb8N\x82o}\xe4\xbd\x1f\xbf\
-\xf4\xfb\x87\xff\x15\xa7\xcf\xfa.\xfd\xf1Q8`\x0bF\
-\xda\x1dB&\xa4\xa6\x88K\x17\xe7 \xdbw\x82\x0f\xfe\
-\xe7\x13\xb7\xd6\x1f\xde\xb0\x7f\x9f\xc6\x11\x04o\x8b7\xce\
-\x96\xd3:\xaf\x03\xf2e\xa1FtH\xc3\xd6/\x1d=\
-k\x13f\xcd\x9e\x0fM\x0a:\x0a\xf9\xdea\x8c>&\
-\xf7*'\xe7J\xf5\xc5%\x88\xf5\x93_\x10A\xb2\x90\
-\xaaa}\x96\x00\x00 \x00IDAT\x1b\x12)\xa4\
-i\x06\x82B\xd6M\xb1i\xfd\xeac\x7f\xf7\xa6\x1b~\
-\xd3\xf3\xd5\xf9g\xf4lY\xd4\xd1\x10\xa7\xa0R\x82\x8b\
-#4\x9c\x82@#B>\xb04\xb0\xca\xc0:O\x00\
-q\x14\xb0wv\x15\x05 {\x98\x93*\x81\xf1$c\
-\x02\x88r\xbb\x10)D\xe5\x5cLs\x11\xda@\x08\x80\
-L`\x12\x05~z76\xbe\xfc\xe93\x0eo\xcd?\
-n\x01\xea\xb5\x0cI\xcd\xa2^s\x88\x1b@\x1c\x13\xe2\
-\xc8\xc7r\xea\xc0\xa6\xf4\xd4\xe0|\x08U\xb9\x02\xf3)\
-T\xa8\x1a\x89\xca.KP1\xe4\x05\x15N\x9d\xe5\x96\
-\xa5\xe7&qV\xb7U\xbe1\xc2\xe2/\x82\xe1D\xbc\
-]L\x85\xa4\xce\xc1P&\xd2\xbb\xa1\xb0\x1b\xe2\x86\xa1\
-\xb8\x0d\x96\x16\x18\x1d\xb0t\x01\xd7\x05\xbb\x0c\xec,\x14\
-9(8p\xa2\x91.Rp[\x05}\xb5\xfa_W\
-6k\xabW=cN?\xd2f\x110+\xee\x80\x0d\
-\x10\x09\xa0\xb3\x0e\xdal\x11\x89\x05\x91\x81x\x1fU\x80\
-\xfc6R\xdd\x14\xdd\xc4 R@b:H\x1b\x84\xc6\
-\xce!\xb8,\xc1\x97>\xf4\xae\xeb~|\xe7\xe7w\xd8\
-\x0bkW\xf2\xaf_{\x99\x1e\x1el\x0a6>Z\xe8\
-=T\xd5\xd5s|\x92E\xa4@\xe7\xaf\x00}\xee\xd9\
-\x98\xce\x9f7\xb8\x01CrZS\xa1N~\x82\x99Q\
->:\xf2\x5c\x13\xe7\x1c\x94X\xb8\xd8\x00q\x84\xe8\x81\
-\xf5k\x9e^s\xd0\x1b\x0eA\x94(8+!\xf10\
-\xe0\xf5\x5c\xd6\xabT\xa1&\x14A\x9d\xc1\x05\xc2d\x81\
-\x12\x16y\xdf\x1cK@&F\x0d>\xb3u\xe9\x9f\xff\
-\xe5\x8f\xbf\xd8\xfe\x8f\xad\x8f\xed\xb7\xf1\xc8\xfe\xc8\xf5u\
-\x01\x9b\x08\xb8)H\x10!\x1a\x01\xba\xb1g\x929\x12\
-8e`9\x83\xb840z<}\x0d\xb9h>\xc8\
-W\xaa\xc4^\xf2\x099\x81\x01S\x06\x8c\xe6J\xe2b\
-\xee\x09\xaex=\xb8b\xa9\x896p;\x1c\xda/\x7f\
-\xfc\xe5sv\xee\xf3\xd2\x85P\x8d.bX4\x9a\x8c\
-\xa4!\x85\x19\x94\x8a\xe0\x0d\x9dB*$sU\x05A\
-\xc5\xd0\xaf:\xcd\xae\x9a\xe7\xe6N\xd0\x8c\xb1\xf4d\x02\
-C\xa9\xca\x94\xa1\xe2\xd1\xe8\x15Y\x01\xfb\xcf=\x9d\x8b\
-$y)\xb0\x7f\x9f\xd7R>j\xc9\xd5s\x16\x88\xf5\
-\x0e\x00\xbb\x00\x19\x81F\xdb\x0b2\x91\x82%\xf5\xf8\x96\
-\xb3 m\x83\x0eX\x836i\xd4\xeb10\xaf\x86n\
-\xea\x107\xe3\xc7v\xec;s\xf33\x1b\x86_\xb6\xa8\
-\xeb\x12\x87\x18\x1dt\xd8A(\xf5\xe1Ed\x00\xa4\x1e\
-0@\x06r\xfe\xd4\x978\x03\x13\x10\xa6\xf4P[\x07\
-0\xa24\xfec\xffo\xc8\xf7W\xbd`\x0d^\xb6\xf6\
-\x1ey\xd3\x11\x0f\xf2=C\xdb\xec\xce\xfbn\x137l\
-\x8af2/u&\x0a\xd9ER\x03\xce\x5c\x0c\xbej\
-\xff\x1f\xca\x99\x8b\x7f;\x14mI\xfb#\x87\xc34\x17\
-z(.\xe9\x97\x00i\x18K\xa0\xae\x85\xa93\x1a\x87\
-5w\xc7\xdf\xcf\x8e\xdf\x8d\xbe\xb9\xfb\x8c\x1d;\xe5\xe3\
-\xd8\x8a?[5+%\xaf9\xd1\x15 Q\xc8\xac\x85\
-\xb1\x8cv:\x845\x7fz\xe4\xb4]W\xec\xf8\xfcC\
-oz\xfa\xcbs\x1e<pN\x13\xfdH\xd0t]\xb4\
-\x89|\xbc\xbd\xa4\xe8\x1a\x8b,bh\xe5\xe0\x5c\x86\x0e\
-\x0b\x84\xba\xb0H\x0b\xc6d5\x8e\x82P\xc6%\x94q\
-[T \xe0\x12\xda\x0e\xaa~\xba(\x05\xa8b\x9eB\
-%9C\x11x\xd0b\xe0\xecG\x8eR\xab\xfaO:\
-\x00\xfd\xf3\x22$5\x8bf/\xa3\xd6\x00t\xe2\x82\xe1\
-+\xf9Ii\xc0\xcc\x89\xc6\x9e\xc2c\xdf\xa7\xa2\x94\xc9\
-\xb7Wn\x8fB\x18\xfb\xf9\xb1e\x92\xc7\xdes7\xce\
-j\xe9R\x0c\x0f\xa9\xfc\xff\x22S\xac\x08\xce\x0eC3\
-)\x15\x19\x22\x84(\xda\x0e\xa2\xed\x80\xed R)\xa0\
-\xba 1\xd0d\x001P\xda\x86\x90<\x0dk\x15l\
-O\x84hw\x82\xa8\xb7\x81\xb8\xde\x04:\x0a\xd2\xcb\x8f\
-\xec\x5c\xb0\xe0\xe6\xd5h/\xef\xdb:p\xc0,\xf4\xd8\
-\x164\x03\xb1dpb\x00g@\x9c\x85S\xdf\x81\xb4\
-\x836\x1d\xa4\xad.:\x9cA\x0f\xa4\x18L\x15}\xe4\
-\xc0o\xcb\xaf\x0ek\x9e\xad#\xd5\xa2\xbb^\xf2\x0d\xf5\
-@\x1a\xc9\xc8\xdc~\xda\xbc\xaa)#\x83\xbb1~\xe1\
-\xcb\x04\xd9\xa1\xb0\xb6I\xbf?\xf9Z\xfcd\xf7\xeb\xe9\
-G\x8f\x8cfo;\x05\xab\xb7?\x83\x97\xf6\xc6\x98\x1d\
-\x96o^9\xfa\xf8\x0f\x80\x5c\x02\xe6\x1a\x22J\x91\xf5\
-\xbaLm\xdc\xb1\xf5\xd9\xc7\xe6\x9f;\x1fZ\xc5\xc5\x82\
-'WqSp\xc1\x01-7/\xcd\x8d[\xc5'\x85\
-\x1bg0\xda\x1e\xc6#\xd7\xdc\xfe\x9e5\xefZ\xff\xc5\
-\xf4\x9b\xfa\xdd\xf6\xb6\xbe\x03gc\xa1\xf3\xcb\x85\x94\x03\
-\x10!6\x04g5\x94\xd3\xd0\xccPp\x10\xab|\x8e\
-\xbak\xc3\xc1@\xd8\xf8\xb9\x03\xca\xc2\xab\xe0\xd9\xa0\xd4\
-\x8a\xe5XU\x11c\x91\x87\x90\xa2\xea\x1eM\x95\x0dS\
-*\xa9r+&6\x0e\xbbN\xbco\x11=\xd2\x7f\xce\
-\xa1\x98\xb5 FoC#\xeaf\x88z\x05q\xe2B\
-\x88\x03\xa0\xb4o\xf6\x11\x02\x1a\xcaXS\x8f\xc1\x8fE\
-q\xa8Xt\x5c\x04mTK\x99\xf2\xfd\x9cs_:\
-\x5c\xa0\x9c\x88\xe7tq*\xed\xdb\x8bv\x9ch\xacH\
-\xb2*\xa6\x94\xb1NxY\xdaB\xa3g\x1d(\xcb\x90\
-$\xfelf\x18hv!G7d8J\x0c\x8a\x12\
-\x98(\xc2HSC\xa55\x88Q\xa0Z\x8c\xa4\xbf\x81\
-Z\xbf\xda\x96\xce\x9d\xf3\xab\x07\x1a\xb5\xce\xe0\xda\xed\xc7\
-/\x05T\x1bJ\x0c\xb4X0\xdbb\x98\x051\xa0,\
-E\xaa\x1c\xe2\xa6E\xb2~\x14;M?\x7f`\xa0\xdd\
-\xbc\xeb\xc6\xff]\xa9\xae\x7f\xf15\xfa\xf9=\x8f\xd0\xc9\
-\xaf\xddH\xbf\x9e\xf5VzQ\xe7z<\xbbr\x93\xec\
-\x1a\xe8\x8c\xa9\xef\xf4\xa4\x96~\x1a\x84W\xbf\x94\xf4\xf3\
-\x0e\xa3\xa7\xf5\x7f\xf3\xd2\x93\xee2kV\xbd\xe4\xc8\xee\
-}\xf6\xf2\x05}\xe85\x0e\x96\x1dl\xc4H\x98A\xdd\
-\xdc\xaa\xd5\xc1F\x04\x9dua\xf6\xec\xc2\xae\x17\xce\xfd\
-I\xcf\xee\xc5+\x16#\xe9k\x14\xd7y.La-\
- E\xa0\xae7v\x12-\xe8\xb4[<\xbcgO\xd4\
-}ft\xf1\x9f\xfe\xf3\xcf\xff\x96\xdc\xdcs\xec2\x1c\
-\xd2H\xd0\xcfmt\xc9\x93r}\xc8\xb4\xf3/\x97\x0b\
-\x93n\x8f\xb4A\xb1\x85\xe3\x14\x99\xb4\x91\x86\xc4\x05\xc9\
-\x87\xa0\xce'\xb7\xf8{;\xe4\xb40\x854\xa8@]\
-\x80\xc0\x05\x8b\xce\xa2\xc8`\x06D\x81\xc5\xc7\xfa@\x94\
-W\x00\x84\x9a^ pVy& \x0c\x06O\xbc{\
-\xff\xf6#\x8b\xdf\xf8\x22\xf4\xcdq\xa87\x80z\x8d\x91\
-\xd4\x0dt\xcd7\xb5Q$P\xdaAi/\x1d,\xad\
-@\x5c\xa1~\x02\xfc\xf4\xb5\x88\x99\xe6\xb0%\xc9?\xf2\
-\x5cXR\xf0\xeb\xf3I,B\xedO\xe5\x9d\x95\x97E\
-YP\xc3\xf9\xf8\xb9rzn\x19\x05M\xdc\x84\x90;\
-\x1b\x06\x14\xceQ\xf0\x1a%X\xe3S\xe1)\xd2\x18\xd8\
->\x80\x05\xfb^\x0bt\x81\xe1h\x04u+\x90\xcc\xfa\
-A\x19+\x081\x0c4\x8chH\xee\xad\x80\x04\x82:\
-\xac\xab\xc3\x98&\xda\xed&\xbaY\x0fFZ\xfd\x18\xde\
-\xd6\x83\xcd\xeb\xe2%#\xbf}\xe6{g\xech??\
-v3b\x8b\x9aX\x90Ka\xc5\x819\x03e\x1d\xa4\
-\xb1\xa0g\xeb 6\xd4\x8fP\xffo\xf1\xfdf\xe5\xbd\
-\x7fxet\xc9\xc0\x1d.^\xd0E\xab\x0d\xfce\xfe\
-\x85\x82g\xee\xc5\x01\xf3Vc\xed\x93\xc3c\xd2\x19i\
-\x5c\x8d?v\x14\xa55p\xca\x97\xf0\xd4A\x1f\x88\x0f\
-\xfe\xebS\xd9\xf2}\xff@\xb7\xbd\xf9C\xdc\xba\x7f\xe4\
-ej\x0f\xfecf\x0d}\xd6W\xe3\xc6y\x83\x0a\xad\
-\x006\x0e\x96\x09\x0c/@\xec\xde\xb9\x09k\x7f\xa5\x8e\
-q\x9b\xf6?\xf7\xe0\x0d2;\xdd\xcc\xf3\xa4\xad\xfa\x98\
- \xa2]\xea\x883\xccA\x87\x16\xd2H4\xa7\xb5\xba\
-\xb5t\xebo\x9f=.{\x92_>\x1b\xf3\xfbz0\
-\x87\x19\x89I\xd1u\x02\xab4b\xeb`r\x92\xb3T\
-\x00Q\xafJ\x0c\xd5\xa8\x81\xb3]\x00\x99\xd7\xe6\x14\x15\
-\x83\x0a\xc6\xac\xe1}\xca\x9d\xcb\x02DY\xb0,\x104\
-[~\x93\x15\x1ekEJ\x09\x87\xb3\x93\xc3\xf7+(\
-r0Z #\x82\x917\xae^\x92\xde\xa2_}8\
-f/\xf4\xe5M\xad.\xa8\xd7\x81\xa4\xe1\xbc\xadwL\
-\xd0a:\xeb\xad<\xa4@[(\xb8\x9a\x85\x0c\x99\xca\
-\xbd\x1a\xdc\xe9\xa8dH1\x17n\xcc\xa5Sr \xa0\
-q\xeeuG\x18\xb3\xf8\x9d8XW\xf6\x06\xc5$<\
-\x8f4\x0d\xee\xd1.\xffx\xe0m8\xf10\xa7w\xa4\
-#\x80\x15ZC\x1d\xf46\xff\x0c\xe1U\x88\x0d\x90:\
-\x8b8\xb2\x80e\x88h8R0\x88\x91q\x04\xd8\x04\
-\xb058\xaeA\xa8\x01\xa1&\x9c\xab#3\x0d\x18\xdb\
-\x8fn\xab\x17\xed\xe1\x18#\xa3\x8c\xed{\x08\x9bW\xc9\
-\x89\xf5[n\xfa\xe6\x09{\xb6.\xd2rD\x9a\xa2)\
-\x99\x7f\x94\xb6\x85\x1d\x03\x19\xdd\xbd\xdf+z\x7f\xdc\xff\
-\x9d\xb3v\x9cz\xd2r}\x8a{\x06\xdf\xbc\xfc\xcal\
-\xe3\xe6T&\x08\x83\x1eG&.O\xfc\xe7\xfe\xd1\xbd\
-\xc0I\xdb\xa8-M\xbez\xf4\xb5x\xc7\xe9\x97\xb3y\
-\xf2\x19\xbb\xf9\xc8\xa3#;\x803\xda\xc3\xf8\xc4\xbc&\
-\xea]\xf6\xaaL\xeb\xa3\x14D\x08\xe8\x08\xb2\xde\x08=\
-\xc6\xa0\x1b\x13\x22fP7Ck\xb0\x8b\xd1\x9d\x06\xe9\
-\xb0U\xc68I\xadsN)\xf0\xbe\x8cd\xaeBC\
-kh$\x88(B\xbdf\xa1\xda5(#0Q\xcb\
-'\x0afu$:E\x17\x021\xde\x89X\x22\x01\xd8\
-\xc2)\x03g-\x90u@\xf0c\xed\x1c uT\x0a\
-\x1b)X\xe6\xe5\xb9\x86\x10U@\x98\xbe\xdd\xaf\xdaR\
-qi\xe9\x17\xf6\x99\x05\x85s7l \x17Fs\x11\
-@C\x84\x9dg=6'\xbag\xf6\xdb\x0eAc\x9e\
-B\xa3\x0e\xc4\xb1E\xadF\xa8\xd5\x05Q\xcdz\x13\xc2\
-\x98\xa0t\x90\x0e2\x81\xf3\x13\xbf\x92\xc8\xcea\x9a\x90\
-\x17\x86E\xc3\xc9\xcf\xad\xfd\xfd\x06\xa0J\xea\x8c\x80\x83\
-C\x7f\xbey8,~[I\x8f\xf1\x1eF>}\xcb\
-\xa9\xb1\x892~\xf1\x07\xcdr\xbe\xf0m8\xf9\xc5\xd3\
-\xfb\x8c%\x08\xd6!\xe9\xbd\x01\xbc\xc5\xc15\xbb\xe0(\
-\x82\xcb\x14`#\x08G0\x9c\xc0J\x0c\x91\x04\xce\xd5\
-!\xd2\x00\xe9\x06\x84{\xe0\xd0\x04\x99\x1e\xb8\xb4\x17)\
-\x08#\xc6\x82\xba\x09F7\xf5a\xd3\xb37\xc0\xa4\x17\
-\xdf\xfe\x8dk\xb6\xc5\x97\xed\xda\x17I_\x7f<\xc2\xf1\
-`\x8d:vg\xb2\xe7+\xcb_\xbb\xfd\xa6\x1do\xe2\
-7\xdf\x7f\xa2;w\x19\xf4\xea\x05/\xa6\xaf~\xf1\x09\
-\xbbs\xe7\xa0\x9b\xc0\x9f\x95\xc6\x85L!\x9a q\xba\
-,}\xe6^B\xf5\xb3\xdfL\xady\xc7Fg\x1d\xf4\
-;\xb9\xde\xec\xeb~\xb7\xe7U\xfc\xc5\x0f\xfd\xd6~\xfb\
-\x92cO\x89\xba\xf8\xda\x82\x1e\xd4:\x82,q\xb0\x02\
-D]\x87nLHR\x82Q\xda;\xb7\x0f\x8eb\x97\
-\x8eQ\x8b\x18\x11\x13T(\xe9\x9d\x08$\xd2\x88aa\
-]\x86\xd4\x02\x0e\x1a\x91\x8a\x90P\x17]\xebK\x13\xa7\
-\x9c_p\xc2P\xc4\x1e\x9et\xb9\xc3\xa5\x81\xd1\x0e\xe4\
-F\xa1L\x17\xa2\x0c\xba\xe2\xe0\x88AJC\xe5\x86V\
-T\xcd\x91\xe5289HeHTHw\xe1@\xb5\
-\x0e\x16T\xa8\x94@\xe2`XA\x81\x0b1\xa5s\x0a\
-\x92EHd\x18\x9b\x8f\xfb\xcb\xc1xr\xf1i\x87c\
-\xd6\x9c\x08\xf5^\xa0\xd6\xf4\x83\xa9Z\x22H\x12\x02\xc7\
-\xfe\xc4\xd7Z\x0a\xd5\x94\x0a\xf6\xdc\xfe\xa4\x96\xa2\xf6\x06\
-r9a\xc5\x22\xb4 \xa9U\x5cM\xf3\x85\xcd\xae\xa4\
-\x17\x93W\xdfs\x18\x80I\xf8\xb7\xf3\xae\xc6\x93\x009\
-x\x88\x86\xc0k\x1d6@\x85\x18\xe8\xdd-h\xec@\
-\xcb\x050\xc22D\x03\x83C\x06\x0b\xe7\xdd\x88\xe1\x81\
-\xa7\x10S\x04G\x11\xacc\x88\xcb%'\x092\x8e\x01\
-\xa9\xc3\xb9\x06D\xeap\xba\x07@\x13Nz\xd0\xb5\x11\
-\xc0\x11X\x128c\xd0\x1dn`d\xe4\xaa\xda\x7f\xbd\
-\xf3\xe2\xee\xa7\x9ePO\xae=\x86n\xd3d\xdf\xfd\xf2\
-\xb6Bv\x9b\xfct\xf8d\xfa\xcaC}\xf6_\x0f\x1d\
-\xd4_\xbdw?s\xdb)\xab\x14F\x1a\x0e\xdb2\xc2\
-\xb7\x8e60O\xecU\xca\x94\x1e\x17\xd3X\x5c\x0b\xcd\
-&\xe8\xa2\x7f\x00}\xe9\xa5\x8f\xf0\xcb\xd6]!\xd7m\
-\xfc/\xbe\xa0u\xaa\xfd\xdf\xa3\xdf\xc9\xa7\xddw\x91\xbb\
-\xe9\xc7\x0ffO~f\xd1\x0b\xa3m\xf8,\x0b\x16%\
-1\xf4\x8c\x18=\xa3\x06#\x11!\xb6\xfe\xc4dq^\
-\x1e\xae|\xd5\xc9T\xfa,\x109\x88\x18dFCS\
-\x8c\x98\x00B\x8aL\x0c\xd2T\x01\x89w\x81\x8c\xac\x86\
-2\x82\x0c)\xba\xe4\xa3\xcd\x1c\x1b8t!6\x85J\
-3h\x95\xc2E\x82TlQ\xa6\x10\xe90\xff-K\
-\x14\x0e\xc6\x88\x05\xd7\xa18\xf1\xcb9valE\x9e\
-nP\xdc\x06\x22\xb0A\xf8\xc7\xc4\x9e\x94A\x0c\xbb\xa5\
-\x83\x91\xb7\xaf;\xbcv\xdf\xccs\x97\xa3\x1egh4\
-\x09\xf5\x99@\x1c\x09\x92H\xbc\xfd_\xe4\x03\xdaX[\
-h\xf2Y\xb4PR\x90\xbe$\x17~P\x99>\x9ec\
-O\x9c\x1b\x13V&\xb5\xf9\x22f\x96|\x800\xa6\xe6\
-'W\x0e\xae\xb82?a\xe5*'~\x09\x85Z\xf2\
-C\xa9\x10\x8a\x10\xd8\xb1\x04gP\xe4\x869\x11\xd8\xdc\
-{#X0f\x1d\x0b;\x9ab\xe1\x11W\xa1\xb5\xc5\
-\xa0\x9b1,\xc5p6\x01\xa1\x0e\xab\x128\xaa\xc3I\
-\x0dpMX\xa9\xc1\xa1\x07\x82&\x9cm\x02J\xf9T\
-L\xc7\x18\xd99\x8c\xba\x5c\x86\x0f\xbf\xe5\xab\xb2\xb8\x81\
-\xfb\x8e\xdaO^9p\xa9KzS\xf9\xf9\xe09\x5c\
-W\x90w=z\x8a\x1b\xbe0\xe1\xd6\x8a\x0f\xd2Go\
-|\xbd\x9c\xfb\xe8n^\xb9i\x89\xeb?z_z\xe7\
-\x93+\xed\xca\xd5\xc32I\xf0tq\xe2\xabJx\xd7\
-s6Ef!\x07\xcdd\xbc\xf6O\xd7\xc9e/\xfc\
-==\xb2\xf9`\x5c\xde\xf92~\xb2\xf18<\xb4\xe8\
-\x02:\xe7[\xa7\xaaG\xffr\xe4\xa6C\x0f\xd9q\xab\
-\x22\x0b\xd7\xc11:Fb\xfd\xe9\xcf\x99Cj\x19\xd0\
-\x11j\x95\xdc,\xe7\xe0\xad\x9c\xc2\x82\x12\xa7\x109\xc0\
-\xc2\xf3\xb2\xad\x04\xff\xf8X!v\x0e.u\xc8\x9c\x17\
-\x18\x92\x06\x98,\xba\xae\x05%\x83\x880\x00\x96\x11\xb8\
-\xa8\x8d\x0e[X\xb6\x01\xefP\xd0\x08i\xe0\x9c\xfb6\
-\xc8\xd8\xb4m`,\xde\x11Z\xc5\xdc@\x9d\x8b\xac\xf4\
-\xd0&J\xa9\x02PD '\x10f\xa4\x1b\x060\xf4\
-\xaa'_\xd8\xbbr\xe1i\x87\xa2\x97\x05\xf1\x0c \xee\
-\x17\xc4V\x10\xd5\x04*\xf2\xc2\x0e\x15\x85\xb4A\x15\x82\
-\x1aTN\xcf\xe0\xe2H\xe7<\xbd\x9dh\x5c\x5cF\xe9\
-fD\xe3\xec\xd6\xb9\x12iRFxP\x01:\x17\x8f\
-\xae@|\xb8\xe2\xb8P\x997W\x02\x02\xf3\xcd\x90'\
-\x18\x17O\x98\x93bJl\x95\x03[A$\x1a\xa2\x15\
-\x86\xb7/E\xd2|\x06\x9d.\xe0\xa8\x0e\xd8\xa0\xb2\xe5\
-:,\xeaph\xfa7i\xc2\xda\x06\x9c4\xc0\xa4\xc1\
-\xd6wK\xc3\xeda\xd4v\x7f\xf4\xca\x8d\xfd\x97?~\
-\xf1\x5c{\xe5W\x1f\x8c6\x1e~\x0c=\xd3X\x87\xad\
-\xb3~'\xa3}k\xf0\xc7\xe1\x05\xd8Bo\x90\x0f\xdd\
-q<^w\xe7e\xb8\xe8\x91\xa3\xdc-\xe7\xbc\x87\x9f\
-z\xeb\x12\xfe\xd3\x91\x11\xd6\xdc\xb4\xd1\x8d\x0c\x8e`\x82\
-\xec\xdd1\x95\xccD\xa5\xceX\xffz\x82,C\x93\xd6\
-\xcc}>\xe0jx\xf3\xb2[q\xc7\xbd\x0bd\xf3I\
-W\xd1\xd2\xb5\xdf\xc5\x7f\x9d\xf0#z\xcd\xb3\xafv\xbb\
-?pcM\xadn\x1f\xf1\xe8\xa3\xb8d\xd9L\xac\xa8\
-\x132\xc5\xa8;\x0d2\xdei'\x0dV\xa4 \x0d6\
-\x1a\x8a-,w\x90r\x8c\xc8x\xe0\xcdJn(\xc8\
-\x80\xa9\xa1\xe6\x0c\x9c\xca\x90%\x19\xba:\x85\xed\xb4\x90\
-dC\x88\xd8AT\xa0\xaeq\x8ex\xa8R\xc6.\xec\
-\x89t\x85=\x1f\x87\xdb'\xe4\x1f\xb2\x0a\x22\x0d_\xe2\
-Hq\xe2sa\xdb\xcd\xc6!\xb3\x02\x93$\xa8\xb1\x02\
-\xb7\x0d\xdaJ\x00]CL\x0a\xb1%\x8c\xfcl=6\
-\x5c\xbc\xe3\xa4\xc3\xdbKO\x98\x83ZC\x10\xc7\x16Q\
-\x03Hz\x04\x89r\x88\xea\xde\xbcZqH\x1dW\x1e\
-\x86d]5}\xa2\xb2l\x09\x0c\xcb\xaa+\x1aS\xc5\
-\xd0\x85\xcbc*\xd7\xc6\x02\x15\xb9anGN\xaeL\
-1\x0f}\x04U3\x0a\xa9\xe4\xe8;\xc7E\xc4\x92g\
- Q\xc1\xe1AH\x9d,\xe8\xdf\xa1\xeew\x00\x9cu\
-\x10(\x88%\x18q\xc8R\x07';0{\xe1\x03\x18\
-\xda\xc1\x80\x8daM\x1d\xa2\x1a0\x5c\x83\xe3\x06\x9ck\
-B\x9b\x19\x10\xaa\xa3\xc3\x19\x22I\x10K\x0dC[7\
-\xe0\xa8\x15o\xff\xfa\xb9\x07=\xf6S<J\xbb\xbe|\
-\x16\x1f\xfd\xe2\x9d\xea\x9a\x0b_m\xdc\xf6\xed\x82\x9dw\
-\xc9l\x15\xc1\x18\x87!\x9c.+\xf0\x10?\x05\x8dA\
-l\x16,;\x97\xb1\xa4)G\x0d\xff\x94\x1e\xf9K\xea\
-&\xa8j\xa4\x22\xf5\xa3\x89\x16>O\x90ZB\x13\xa6\
-\x98\xf4\x9c\x8f7\x1ex\x0b\xbf\xeb\x15\xcf\xf2Y\xeak\
-\xe8t\x0f\x93\x8d\x0b_\xaf\xf7\x8d\x07z\xee\xba\x11o\
-\xdd\x7f.\xde\xd8\xdb\x8by\xa2a\xc9\xcb\x0b\x94\xf6>\
-4J,\x8c\xf8\x91\x14!B$\xca_\xee\xc1\x80\xd6\
-\xe6n\x04\xb5ad\x91\x83\xc9:P\xdd\x16\xe2n\x1b\
-Z[\x98\xc8\xa34EsJ\x1cr\x959\x0f7\x02\
-\x5c@\x5c$O\x15\xcc\xedQBS*\x5cD\x87{\
-C\x04\xae4\xb3\xfe\x9c\xb3\x19`\xeb\x11j\x8aA\xce\
-Owa\x01K\x06Y&H\xbf\xbb\xadw\xe4\xa3\xa3\
-\xaf\xdc\x1f\x0b\x97\xcf\xf2\xd6\xdd\xb1E\x5cs\xa8\xd5\x09\
-Q\x22\x88k\x0e:\x22(\xe5\x17\xbe\xd2\xa5\x88\x83T\
-I%F\xe1q)\x05O\x86\xd8\x95\x19\x01$ap\
-T\x226c\xf97U\xdf\x9c\xd2\x19\xb9\xd4\xdbV\xcb\
-#\x81\x0e\x81C\x1e\x14v\xc54]\x0a}\x83G~\
-\x8aR'\xa7\x93;\x14\xf7\xb1Gx\x82c\x86S\xb0\
-\x22\xc82\x8bN\x87 n;f\xccY\x83N'B\
-\x96Ep\xd2\x84\xa3\x06\x1c\xd7\x01\xd7\x0f\xb8\x06l\x98\
-\xa8\xb8\x8e\x81\x19}\xaa\xb1\xff\xa2K\xfe\xf7\xdf\xde\xb9\
-\xf6\x07\xadcq\xeb\x81,\x9f[\xf0#\xfe`\xff\x05\
-\x82\xab.w\x182\x93d\xe7>gq\xa3\xb2\xc0'\
-\xfa\xfa\xe2\xeb\xf4\xc4I$\xd3\xfe?aq\x9d\xa2\x1d\
-\x0b\xd0\xc6\x06\xe8\xbe\xb6\xe0\xd4\x93\xf5~\xd7?`^\
-\xf9_\xb7\xec\xbeq\xf4\xdd\xffu\xf3k\xf5\x1ds\x9e\
-5\xaf\x9f\xe1p\xd6\x8c\x99\xe8S3!\x16\xe8f\x0d\
-8R@\x22\xa0\x9aW\xc3Z\xa4\xe8\xc0\x0f&\xd8\x06\
-\xfa\xa93\x80\x19\x81\xeeX\xd4`\x01\xb60=\x06m\
-\x12H\x16{\xbc\x22\xa0+\xc1q\xcd\x9f\xdf\xce\xe5.\
-z\xc50>Oa\x95\x10u\x00\xf1>\xc2\x92g.\
-\x06\x14\x91\x84@.4\xc5\xc2^\x0ab\x0d\xacq0\
-`@+\xe8$\x02\xd6\x0ca\xe7?m?\xac\xe7\xd6\
-\xfa\xb1\x87b\xfe\xbc\x1a\xa4\xd6E\x94hD5x\x98\
-2\x11\xe8$8\x92\x05$\x06L\xa5\x1e\x81\x1cT\xe1\
-,\x81\x2285\x97\xfby\xca5\x17D\xb1\x92E\x14\
-\x1aS\x0a\x14\x8b\xdc\xe3?\xcf\xa9A\xc1^C\x91}\
-\x1an\x04+\xdei!O\x91\xc9}IYh\xcc\x0c\
-\x1b\xa17\xc8\xfb\x01\xe7\xfc\x06\xa9\xaaF\x1dW\x88K\
-\x12\x84C\x22P\xa4PO\x1c\xb2\xee\x5c\x0c\xed\xea\x83\
-n\xec\x00j)\x9ci\x00\xd2\x0brM\x18\x89`)\
-E-J\xd0g\x13\xac\xdd\xb1\x1b\x07\x1e\xff\x99\xd1\xe6\
-\xe1kw\xfd#\xa2\xd7,{\xb3\xed?aP\xedy\
-o3\xfb\xce\xcf\xbfM\xff\x84\xab\xc9`\xcf\x14\xa99\
-\xe32\xb8*\x0fz\x92\xe4\x1d\xaaNn\xc7\xc7\x9e?\
-\xa7\x16\x1e\xf35\x94\x00g\x7f\x96\x1f\x95\x03dA\xeb\
-Z\x1ce\xef\xe0-O>)CO\xcfw;\xb3/\
-J\xcf\xdb\xce\x8f.\xf8\xd5\xed[\xe7\xedz\xeaO\x83\
-\xcb\x1e\xbbs\xcfV\x1c\x1ao\xc1|J\x01\xbb\x09&\
-\xdd\x09eF\xd1\xe3v!\x92\xcd0\xe9\x1e\xc4v\x0f\
-\x18\xbb\x01\x1a\x00\xd4\x00D\x0f\xc1\x06\xd5\xbdS\xb6\xcc\
-\x95\xca\x99>\xe4J \xa4\xc8\x1aAiZ\x99\x07R\
-3\xca6QJ\x7f\x08\xcasz\x0b\xe9{y^\x22\
-7\xd0S)\xb2\x9a\x07>%e\xa8(\x01\xffn+\
-\xb6\xbdn\xcb\xcb\x17>>\xfb\xf8E~(\x15\x033\
-\xfbj\x88\xea\x1e\xbd\x89j\x02\x1d\x11t\xe4'\xb2\xa0\
-R3\xab(\xc4\x90P\xe9\x13G\x15:@\xfeX\xb4\
-*98\x05Q,\xe7\xd8s\xc9\xa4$VE\xae<\
-*N\x0b\xbe\xf4\xe1\xc2\xe3nL\xbf ^\x0bA\x84\
-\xe7\xf6\x11T:W#\xcf\xce\x02\x17\x1bj\xccr\x12\
-?\x9f\xf6Y\xeea\xa3\x06e\xb2\x8e\x14\x94\x8a\x90\x9a\
-&2\xd3\x80\xa0\x06q=`\xd7\xf4\xb9\x09ba\x9d\
-\xc3\xd0H\x0a\xd7v\xd8\xfd\xd8\x8c/_r\xd3\x8dO\
-\xfd\xf7\x97\xec\x8e;\xff\x01\x07\x1ep\x0f7w>\x82\
-\xfb\xef\xfb\x84<\x89\xcf\x03\xde\x01p\x22v\xc1Dk\
-\x94\xa68\xedQ-u&\xc2\xf1ej$\x88\xa5\xb1\
-\xe2\x22\xca\x92\xc31o\xcb%x\xef\x99muXC\
-\xa8\xfd\x04\xe4\x87\xeb\xcfs\xaf\x198\x07\xe7\xf7~\x88\
-?\xfe\xa9M\xb8o\xf6\x01\xb8\xed\xe4\xfe\xee\xe3\xaf\x7f\
-\xe4\xdcd\x93\xfdP\x9fCo\x83\x918\x9f\xfe\xe7\x9f\
-N\x0d%\xae0\x12\x97\xf0\xd2\x89S\x81\xb7Y\x12n\
-\xfd\xb9n\x91\xbbx\x90R\x80\xcd\xfd\xd6\x0a\x93\xdf\xa2\
-\xb4\xc9\xa9\xfd\xae\xb8\x04\xb9\x98Y\x828p\x0e\xb9h\
-\xe7\x04~\xb9X\x06(\xd1\xd0m\x82Q\x09\xf4\xa6\x0e\
-v\x7fuu\xff\x9e\xff\x91S\x96\xe3\x80\x03f\xa2\xd1\
-\x13\xc1J\x0b\x91v\x981\xbb\x0e\xd1\x19Td\x83\x83\
-1\xa0\x12OC\xc8C\x95\x09\x1e\xc1\xd1\x9c\x97/\x5c\
-\x0c\x9f\x80P\xe7\xe7\xf5<\xf2\xac\xda0\x99e\xa9`\
-\xf6R\x9c\xc6\x140z\xae\x90G\xc6\x94=\x5c\x96G\
-\xe5\xa6\xf0^\x86\xa0RQ\x95_)\x0a\xa5\x03\x83\x08\
-\x15C.\xeb\xa4({\x04\x81\x8b\x1f\x82\xbb`\xfd\x80\
-\xcb\x19\x1f\x8d\xea\x82$\xce\x06\xf3\xae\xcc\x06H\xd4)\
-0G\xc8\x9cA\x969\x900\xda\x99\x81\xb44d`\
-\x08m}\xfe\xba\xcb\xce|\xf0\xaa\xc1\x1f\xeb\x0b\x96\xde\
-\x8d\xb5'\xdf\x88\x15o\xbf\x85q\xdak2t\x86'\
-/\xb9\xc7.rW\xa1\xe0\xc8\x047\x00U\xd9\x99j\
-\xdc\x17a\x0a(\x88\x00@+\x91\xff\xe8\xbbO\x9d\xb2\
-\xf5Z\x5c}\xfa\xff\xe0>\xb5\x14\x03\x8f\xaf\xc6\xc3O\
-\x1c.j\xcf)\x90\xe8f\xdc|\xc9\x02\xbe~\xe3\x99\
-\x18X\x7f:\xbeqMK\xff\xdb\x15\x8f\xac:^\xff\
-\xf2\x97\xfdkv\xec\xb1\xc0\xcc\xae\xc1\x22\xc5\xd0Q\x04\
-\x09\xe6\x7f\x02\x8f\x22\xb30\xc8\xa9\xc2\xcfWr3\x8b\
-\xc2l\xd5\x05\xeb)*\x00;\x04MQ\xfe\x88\xb9\x8a\
-\x85\x144.)iX\x156\x0c\x11\x8d;=\xc2\x86\
-#\x02u\x0c\x06~\xbcQ\x0f^\xbc\xed\x98\x9e\x9bg\
-\x9dv8\x16,n\x82#\x03\x9d\x18\xd4\x1b\x84z\x9f\
-\x82\x8b\xbb\x88\x94\xb7\xe5V:\xa8\x95T)\x12g\x90\
-\x87-s\xa2\x17\xf1X\x00!O (P#*\xd4\
-\x0d\xcc\xbe\xf9,N\xe3\x80\xfap!f\xa3\x8a\xf8\x93\
-\x0ajq\xd5\x9c\x97\xc6\xa5\x1a\x90P\xe5\xee\xe3\xca3\
-U\xfc\x801\xfc}\x8c\x1b\x96\x95\xc3\xb5\x92\xa1'y\
-\x94\xaa\x12Xg\xbd\xdc\x14\x04%\x9e\xd2\xe8\xf3\xc6\x0c\
-\xe0\x1c8\xf5\xb8\x1eC\x03\xda\xa1-5(\x13]\xf1\
-\xad\xfa\x1d\xaf\xba\xf7\x1d\xb8\xa6\xb7\xc7\xad]\xdfu\x0b\
-\x1f;ZV\xae\xfa\x15Df\xd1\x0c\xf4\xa0C-\xa0\
-'FO\xaa)\xf5,\xc3\xf1\x10<Mr\xc2?\xe7\
-\xfd\xf18\xbeL\xb1\xe0\xc7\xec\xb23\x0f\x05\xf5l\xed\
-\x91\xab\x96.!\xcc\xec\x03\x1ez\x5c0\xdaD\xa3\xd9\
-O\xf5\xfa*\xd9\xb5\xe0#\xa4\xb6e\xb2b\xc3.\x9a\
-\x85\x16\xa8q\x1b~7w\x87\xe0J\xc8\xaf/[2\
-\xfb\x90\x8d\x1b\x8e\xc8F\xf0O=\x84\x13f;\x8cd\
-~\x06\xe8\xfbQ\x01E\x00G\x16\xe2\x04.#\xb8\xcc\
-S\x048bh\x17tC\xceS\x058\xd0\x07\x88\xbd\
-m\xb7\x13\xe5\xe33\x85\x8a\x86\xd9\x9b\xbcF\xd0\xa4<\
-\xda\x13\xf2\xbd\x9cf\xdf\xea\xc1\xc2\x88\x86R\x0a*\x22\
-\x804:7?\x8b\x0d\x17o?h\xce\xba\xfdNX\
-\xecj=\x11\xfa\xfa\xbd\x94E\xd5\x8co^c\x1f\x82\
-\xacc\x8b8\xe1B5\xc5\x85\x17\x8dGo\xf2\x92\x85\
-B\xea\x08\xa8\xf4\xa0\x7f\x8e!T\x0e\x98rI\x8eV\
-\xc4c0\xfdbS\xd0\xd8\x9b\xc0/H.E\xe6@\
-\x81\xe6\xc8\x18\x9c?\xa0I\x90\x8a\x8a\xab\xca=\x95\xc2\
-73oz\xad\xa3JRMU\xe8\xefOwk\xf3\
-\xec`\x82\x15\x81\xcb\xfco`\xad\xcfi\xb7\x160\xe1\
-X\xb2\x86\x03\xe3\xd6\xdf\xb1&s\x18\x19J\xb0\xfc\xe8\
-7|\xc7\x9dx\xff\x96\xcd/\xa1\xef\xfe\xfb\x7f\x9b\xa3\
-y\x09\xad8\xa9\x87\x87\xee\xb8D\x96\xe1\xe3r\xf1\x1b\
-_B\xe8\xe9\xe0\x8e\xdf\xec'o\xd8u\xaflG:\
-]\xbd?i\xba&\x8d\xa3%\xcb\x14\x0b^&\xb82\
-\xc6#A2\xc1\x0e$\x00\xf2\x82\x93b~\xef\x85J\
-\xcd\xee\xb6\xe9\x9cm7\x9a\x19\xb5\x93h\xcf\x09\xcf\xa3\
-u\xdf~\xea\xf9{6\xe3\x833\x06p\xe8L\x02K\
-\x82\x98\x18\x94\x02\xa6\xddD\x5c\xef\xc0\xc4]X\xa7\xc0\
-\x99\x02TE<\x92\x87~\xe6C}Q^z\x91\xf3\
-k\x0awg\x0d\xb6\xbe\x09\xb6\xda\xc1%\xf07\x0a\x12\
-D\xc6\xa0\xeb,:\x5cG\xddXd\xa3\x19F6\x0a\
-\x99\x8f\xac\x9da\xefZt\xee\x91h\xd6\x04`\x83\x9e\
-\x85\x09\x8c\xed\xa0\xa9\x19Z\x03Q\xc8\xa1\x8ab_\xcb\
-\xe7\x0e\xc6\x8a\x00\x8aJW\x02V.pj\xc2\xb3\xad\
-KO\x06\xef\x8a\x861\x0b\x9f+:/\xce\xe1\xceP\
-\xf6\x00\x15\xa8\xb3\xf8Z)\x88h\xd5\xef\xcf}\xdc\xf3\
-\xb2*\x17\x86V\x85\xe8%\xc7\xc7\xbfnJJ\x14\x09\
-@\xb1\xf9r\x9a\x83\xb3A5WA{\xf2\x81\x97\xdf\
-\x00\xae\xb0\x83\xb1\x81\xe6`\xc2\xd4\xc6Y\xe5\xa7\xc5\x81\
-\xd9\xe5\x8c\xdf,\xd6\x09\x5c\xca\x10D\xd8\xb2\xe71|\
-\xf7\xe2\xd3\xf6\xfd\xd8\xe7\xe2O\x1f\xf6\x19=x\x7f\xcd\
-\xcd\xf9\xfd\xd1n\xf4\x03w\xe9\xf7\xbd\xf0\xc3r\xdaO\
-X\xae\xbe\xfe{x\xff\xd3\xcf\xcaUr\x9e\x1b\xc1o\
-e\x8aC[\xc2\xdav\xe3\x1a_TK\x1d\x8c[\xc4\
-\x13-\xfa\x89\x1a\x87\x89\x1a\x89\x09\xa7e[\x8e{?\
-]w\xdae\xeayO\xff\xda.\xff\xe5\xf7p\xe7_\
-\x8e\xa1\xef|\xe3}\xf2\xd2{O\xdbp\xe2\x9a\x9f^\
-\xf5\xea\xe3q\x9b1\xe8\x80\x10\xa5\x06=:E\xb3\x9e\
-\xc1D\x02\xc7>y\x85\xd9x.\x10\xca\xfa\x9c\x99s\
-T\xb2\x88\x82\x1bS\xe9\x869-b\x03\x89\x0d`\x15\
-\xa8\xadB0W\x86\x8c\x09\x12GP[\xda\x18\xbdq\
-\xb4\x9e~v\xf72\xfc\xcb\x9e\xa3gm\x5c\xf6\x8a\x83\
-P\xefs\xd0u\x83z\x93\x11CP\x83WL\xa9H\
-\xa0\x82x\xc4\x13\xa3\x03\x5cX\x08\xba+\x0b:\xc4\x8b\
-\xa2\xf0\xfa,\x07T%RRr\xe9\x8b\x911Ui\
-\xc1R|\x1f\xaaq\x1aa,H\x98\x88\xbfOc\xa3\
-`0>|\xef9?\xc8w\xff\xd5\x01Ze\xb4C\
-\xf9\x10\x01\xe5\x0dUt\xd4\xc5XH\x0a\x06S^\x5c\
-\x96\xbfG\x99\xa6\xc6TFD\x11y\x96\x93\xd5\x19X\
-\x16\xf1I\xc7\x0f\x0d}\xe1\xe3\xf7\xbd\xf0\xa8\x03\xe8\xbe\
-9\xaf\xc5/6\xfd\xa7\xb49\xe5\xab\xfe\xdf&\xab\xd7\
-\xbeB\xde\xf1\xfc\xddr\xe1\xa7.\x8e\x1e\xbc\x7f\x95\xdd\
-9h\xabr2\x9e\xa0\xe1\x1d\xa3F\xa8~\xbe\xca\xce\
-\x94\x92\x8f=-l\x84\x09j*\x99\xe2\xe6\xc0Y\xf3\
-\x16\xd3\x15\xf3\xf6Q\x7f]\xf2\x00\xfe\xf5U\x07\xcb]\
-\x87\xbf\x8dg\xec\xbc\x01\x9f\x1b\xb9\x8bvn[\xe8Z\
-_\xb8\xcf|y\xf1\x02\xf7\xcb\x17/\x9a\xbd\xdf\x86m\
-K\xfa;\xe6\xe8\x8e\xc1\x99\xb5\x0e\x8ej0\xeaq\x84\
-\x0c\x1a\x99\x16\xb0\x18\x980{Ty\xb2\xad\xcb%\x84\
-\x9e\xaa\xcc\xcas\x08\xc5\xf9f\xd5i\xcf\x0a\xd76\x01\
-\x89\x0e\xae\xf9\x06\xc3w\xeeF\xf7\x8a\xc1\x1e<0\xe3\
-\x98}7\xf4-l\xa21\xa3\x06]\x13\xd4\x13\x86(\
-\xe3\x9d\x0fX\xe0(C\xad\xd7g\x9f\xb0\xf2\xe1iZ\
-{/\x1a\xd6\x02\x150#\x0aQ\x9b\xa5\xfdv\xa5\xa4\
-\xd1aQ1\xc6\x90\xc9(\x942\x1c,\xfdr\xcdW\
-\xb9\x08\xa5\x98\xe8\x16\xc3*\xa2Bx^\xf5\xc6\xf4\xe6\
-P\x95\xa67\xcfTG\xd5g\xb3\x8a\xf5\x97r\x1b\xb6\
-(\x22\x83\x98\xca>\xc3\xd3\xa1=\x0f\xc8Z\xff\xbbZ\
-\x07X\xcb\x85\xc8\xdd\xba\x90*\x19\xf2\x83\x9d)\xe9\xcd\
-\xe2\xe0\xcb\x9a\xca\x0da\xac7\xca\xb1\x22 \x1ba\xa8\
-\xd3\x86\xb6\xba\x96\xae\x1e\xbc\xfd\xc8\xcf\xdfxD?\xd5\
-\x07\x94\xdcS?\xb2\xf7\x96\xbf.\xba~\xe8\x93\xcbg\
-\xb9\xe5\x17\x1d\xa1\x9e\xb9}\x81\x1b:\xff\x9d\xd1\x93\x17\
-\xfc0mmZ?\xd9\xbci\xb2\x12]&bg\x8e\
-\xfff7\x0d\xdf\x01\x934\x15\x13n\x8e\xf9'6y\
-\xd6?\xcc\xe3\xf5\xbf|\xb7]\xf1\x87\x0f\xf3\x91\x00\x1e\
-n\xbc\xc3u\x8f\xff9\xad\xbe\xb1)\x9f\x99\xf52\xcc\
-\xde\xfd#\xfe\xc0\xfc'\xe4\x0d\x9f}\x91>c\xb7\xa1\
-\xbbO\xf8{~\xcf\xcf~\xadW\xde3x|\x038\
-m\xb6\xc1\xf1\x8a\xd1\xa7\x13p]y\xc1{0mu\
-\xce\xc1*\x85\x88\xbc\x07\xa6u\xc1\x96\xc5\x11\x8c\xeb\xc2\
-\xd8\x18\x90&\xa2N\x86\xce\x83[h\xd7\xffl\xe6\xd1\
-\xbb\xe6-\xdf\xaf\xbd\xcfAs\x10\xcf\x05\x92z\x04\xb1\
-)\x1a\x89F\xb3\xa7\x06\x93\xb6\xa1b@\xcd\x00\xc4\x19\
-\xd4\x9dB\xa3/\x82A\xe6\xebn\x1d\xb6\xb9\xf2Ai\
-\x04W,^\x1d\x95V\x11\x5c\x99\x9a\x02T\x94:\xb9\
-m\x1f\x15\xecJ\xf6f\xe2Ag\x9b{\xd7W'\xb4\
-\x8c\xc2z\xc2\x0f\xa2\xc2l\xa0\xa0\x1d\xa3\xea\xba\x90\x9f\
-\xa8\x08=\x82/C\x98\xcb 8\xbf\xf1\x5c\x91v\xa0\
-\xac\x8cils75O\xe5s\xc5=\xea\x1c\x03\x8e\
-}-\xef\xcaZ\xdf\xb8`o\xe8\xbc%\x818\xf6\x9b\
-\xc0\x09\xace\x0fJ8\x86\x0d\xa5\x90\xe7\xfc\x08\xd8h\
-\x8cf)@\x1aY\xc7|r\x9f/l\xfc\xd4QO\
--h\x11L6\x8a\xfb$\xa6\x7f\xfd\xac\x91\x1d\xd7\x7f\
-\xef\xd5\x0e\xbf\xfc\x8d\xfb 6\xd1?\xe3@\xdbEg\
-<\xa23~\xad\xf2\x04kU&[\xf8\x98\xa0V\x97\
-\x09\xf8<\x82\xe9\xff\x14\xb7\x80B\x9f\x9c\xda\xfbs:\
-\xe8\xb0\x88_+\x1bx\xa6\xba^\xbe\xbfr\xa5\xfb\xe6\
-\xbb>\x8a\xb7\xb7?O\x0f%/\xc6\xf6\xf3\x86\xd4\xb6\
-'v\xbb\xda\xc5o7K\x97]\xcbC\xe7\xbd\x82>\
-\xfd\xe1\x87\xdc\xf2\xf95w\xe1\xe6o\xb9\x8fa\x05\x1f\
-\xf5\xd6\x07\xf7\xdd\xb4\x8e\x8f\x89\xac[\xb8\xc0\xc9\xc2\xba\
-\xc6l\x0d\xf4\x92C\xbd\x1b\xfbsW\x04\xc6\x08\x0c\x08\
-\x1dDh\xa9\x98\xf6\xac\xb1x\xfa\xfd\x0fE\xcb\x9f\xec\
-;\xea\xf9Xp\xc0\x0a\xcc\x9c\xd1\x83$\xe9\x02\x01\x82\
-T`\x88\xb6@l\xa1\x94\xc0\xc1 R\x84\x1a\x14\xe2\
-\x84\x81\xc8\xc19\x83\xa8\x16\xc6]\xca\xf3\xe8\x85\xf3:\
-\xb9\xe2B\xa6Q\xb0*\xd9\x85\x89\x19\xe78~uA\
-Ka\xe9G\xc1XW\xa9R<\x92{\x96 ,X\
-\xaa|O\xd1\xa0R\xd5e\xa1lJK\xef\x87\xe0\x8d\
-I4\x06\xb6,\x10\xa7\x10OG\x0c\xb0-\xa7\xbd\xcc\
-R\x09\x87\x93\xa2\x94\xc9{\x0f\xa9X\x98\xb8\xe0\xacj\
-\xf3\xfa\xdeyg7\x13\xe4t&\xc3\x18\xf7;\xeb\x04\
-\xc6\x12l \xbfY\x0b\xa4\x91\xa0\xd3\xce\x90p\xb3>\
-x\xc7\xfa?\xbd\xf2\xdb|x]\x16\x12Cm[\x8d\
-\xc7\x87\x9e\x88?v\xc4\xeb\xbb\x0f\xcd\xbe\xe1\xdb\xf17\
-\x1e\xba\x04\xef\xba\xc9\xda\x91aq\xf3\x12\xa1m\xdd\x04\
-\x0a1,Z\x94\x1b\x80N\x80\xf1\xcbD'>\xa6\x80\
-\x83\xc6\x9f\xec2\x09\x01h<\xbc4\xb6\xfca\x88:\
-\x14dO\x98E\x07\xf6\xef\xa6\xa3w\x02\x8f_\xbb\xc2\
-\xad\xd9y\x1e\x22l\xc0\xf9\xf8#\x1c6\xe1\xdbg\xcf\
-\x02RK\x17\xdc8Gv\x9ew\x0f\xdd\xfd(c\xcf\
-\xca\xf3\xe4\x04\xd4\xa1\xf1W\xb9\x19+\x05g\xb6\x05\x9f\
-\x80\xe08\x7f\x85\xff\xe3\x0dP\xf3\x1e\x8a\xe8\x9d;\x8d\
-v\xabE\xd5c\x98\xac\x05\xf7\xe37\xc1~\xeam/\
-\xb1\xc0\x1d\x94\xdbQ\xf19\xef9Pf4\x9f\x87\xad\
-;\xcf\x84\x89OFo\xef\x1c$\xd10\x88\xbd8\x84\
-\x01P,\x88\x1b\x0a\x1c\xee\xe9\xa8\xe6\xe3\x1b\xc49 \
-v\x05\xbfF1\xfb\x8f\xc1\x82\xb5\x0a,K\x94\xf2t\
-\xed\xd5K>W*\xb7\xe8\xf6YT\x05h\x13\xd2\x06\
-\xf3@\x07\xaa~\x7fn\xd6\x83\x12\x91AE\x99Ul\
-\x02)\x17\x7fUJX6\xb12F\x83[\x86E\x94\
-\xa2t\xe6 \xc0\xcc\xe7\x0c\x05\x01N\x0a*\x05\x17M\
-5\x02D\x19bUs*\x83\x10\x8c\x95B\xd9\xe5\x02\
-\xe59gs:\xe7\xfd}\x8c\xf3\xa5\x92X\x7f\xf2\xfb\
-9\x00c\xc4\xb6QC\x03\xbb\xb3\xf4\x15\xb3\xff\xfd\xe1\
-[\x8e\x7f\xeaH\xab\x11\x8bCw\xfd\xf5p\xad\x1d\xc9\
-\x85G\x7f\xbf\xf3\xe7?^@\xd1\xd9\x97\xbf\xbf\xfb\xfe\
-\xf9\x97\xf2\xb9G;>\x1a7\xdaF\xeff\xfc\xfb\xdd\
-\xef\xa0\x8fo\xa8\xbb6\xda\x98\xe60\xa7\xf1p&\xa6\
-@j\xa6\xaa\xeb1\xa9|q\xfc\x06\xa22\x09]J\
-3\xa9b&.\xd5\x8e\x8b\x0aJp\x00\xa3\xa5\x9cL\
-\x95vk\xc5\xc6,\x0a\x0a\xa9\xa4\x87\x03\x8f\x98\x9c\xe8\
-\x00\x00 \x00IDAT\xc0\xfe?$\xec\xfa\xa3\xfc\
-f\xdf+\xd4\xae#\x0c.x\xc3\xad\xb0\x87\x1c\xd1\xc0\
-S\xb7E\xf8\xdf\x1b\xcf\x01\xf5^\x8c\xa4o\x11\xa2\xb8\
-\x85D\x0b\x22\xad!\xc8\x10\xd7\x22@9\xa4\xd6K\xd4\
-#\xed\x93\xfe\x5c\xc8{\x88\xb4\xf2%\x0aJ\x9e;\xb8\
-\xe4\xc0\x14a\x0d\x14\xc2\xd7\xc2\xb9\xa0\x94o8U^\
-C\xe7\x11\x9ba\x0a\xab\xb9\xec\x1b9x\xe1\xe7\xf2\xb0\
-r\xb1s(?r\x9fL\xffo\x96\xa4\xef\x92\x8c\x86\
-19X\x02\x16U\xd8\x90\x14\x94\x0a\x84\x92-4\xe3\
-\xa5\xedx\x85\xea\x9c\x93\xcaC\xb2|\xee,\xea\xeb\xf6\
-``\x05\x04\xf3\xa9\xfc\xe3\xae,o\x02\xdeo\x82\x82\
-\xcb\xd9 ct^\x85\x91v2P_\x8cl\xc8b\
-\xdd\x9fw\xac\xf9\xfb\xaf\x0f,d,U5\xc8\xf0\xa3\
-\x88\xdb\x0f`T\xcf\xc7\x87\xaf\xfc\xee\xa7o\xfedm\
-\x09\x8d\xbe\xfaT\xe1\xd1\x9d\xea\x93\x7f}\x95k\xcd=\
-\x93\xe2\xce\xdd\xf2\xa3\x07V\xbagwM\x8aN\x16k\
-TU\xba\xdd\xc9P\x19\x9a\xe2\xf3\xd3\xa194\x05\xe1\
-\x0d\x93\xf8\xf9`\x8a\x8dF\x15\x01\xcd\x04\xde\x83\xc8]\
-\x0c\xf3\x91\x0d\x01 \xdd\xac\xc3i\xcd;\x07v\xc9|\
-\xdb\xa53\x9f\xfa\x01\x9fr\xed\x97\xb3\xe7]\x7fM\xe7\
-\xae??t\x1f\x9e\xbc\xf7\xdbx\xe5\xab\xef\xc7H\xab\
-\x01\x935\xbc9m\x5c\x0b\x1e^\x0e*R\x88\x93\x18\
-1E\x10+\xd0\xa2\x10AC\x04H\xc5\x22c\xeb\xd9\
-C\xe2aC'\x18\x1b\x02O\xd5\x80\xeb\xe0S\x138\
-39F\xe3*\x03,W\xc1n\xcaT\xdc\xd2Z$\
-8\xe0\x97^D\x92\xf3v\xf2\x94\xb2\x0a\xef\xa6j\xaf\
-\x9e\xbb1\x8c\xb7_\xa8\xfa\xeep~*1\xc6\xe2J\
-\xf9\x00\x9c\xc6\xbc\x1c\xf9\xf8/\xbf5J\xc1\xba\x94(\
-\x95T\xce(\x9f5\x10\x92\x92KJ6G\x1al\x01\
-\x89\x18\x18\x15\xe8E\xf5=\x03\xbfY\xfb\xda\x03d\xa1\
-X$\xb5:\xba\xf4\x0c\xe6\xb4\x06p\xf2\xd1/\xbd}\
-\xdd\xcc\xb7t\xd7\xbdw\xf7g\xe8\xa7\x87~\x82\x9f\xba\
-\xf56\xb3\xcc]\x83\xef-\xfe\x1a\xed|\xe8a\x81\xdd\
-C\x93P\x1a\xa8\x0ag\xd24\x88\xcdd\x02\x96*\xdd\
-s\xb2\x85<)Ih/n\x09\x9ad\x101\xd5\xf7\
-=\xa7,\xd3\x1a\xf8\xc2\x8a\xc7xq\xf2\x10\xae\xdeu\
-\xb6\xdc\xbc\xf0\x93\xb0\xd9F\xbc\xc6m\x94\xd1\xd1\xd7\xd0\
-M'\xfc\x5c\x9d\xf0\x8f\x12\x7f\xe3\x95\x9f_\xfb\xb3\x0f\
-\xdc\xf9+\xbc\xee\xcd\xb7\xc2b\x15T\xbb\x0dc\xf6\x07\
-\xd4\x5c\xb0JA]\x07g\x04\xdd8\x83b\x0d\xc5\xca\
-\x07u2#b\x1d\x88@\xb9\x12\xb8\xf0\xc9/~\x1d\
-\x92r\x11\x13\x85Z\xb4:A\xad<gU\xab\x15\xca\
-\xfd\x14\xbd\x0c\xd8\xd7\xed\xc1\x9b]\xdc\xd8\xa7a,'\
-\x07c%5\x95R\xa8\xdc\x1cT]\x91\x95g\xb8r\
-\x83\xe5\x9b\xa0r\xac\x94\x97u\xd5\xe1a\xfc\xa3\xa8~\
-\x7f\xe5b\xcf\xcb\xafB\xe1 Eo*\x00\xd0\x05L\
-l\xd1\xe3\x1a;\xb7\xa3\xf5\xcf\x87\xad\xac;\x81\xb6=\
-\xe8v\x9fD\xadO\xc1\xc8 N?`\xf3j\xf4\xbf\
-u\xf4/\xbf\xbf\xf4\x97\xd9\xc6\xc3?G\x1f\x9f\xf7\xbf\
-\xf8\xf1;~\xa1q\xd3]\x0e\x83+e\x5cs\xfb\x9c\
-\x1b@\x8d\xc3A'[\xf0\x13\xe1\xf8\xb2\x17x?\xa6\
- \x11M\xb5\xa9&\xeb)&\xdaP4\xc5\xcdD\x11\
-1\x9d\xd9\x0fE5\xd0\x9dYKp\xde9\xbcv\xd9\
-+\xe9'\xf1\xdb\xb0\xef\x86\xcb\xe5\x82\x13\xbf\xacVm\
-\xbc\xdf]z\xcd\xe1\xf4\xde\xf5\x87\xab\x9f\xac\xb9jx\
-E\xfc\xec\xaa\xfb\x9a\xef\xbb\xa5w\xe9\xc6\x1f\x0f\x0f\xb8\
-\x8700\xb8?2\xb3\x04I\x94\x22Q\x09\x08\x8c6\
-:\x18q\x1d\x9fx'1L\xc8I\xf4'\xb1*\xad\
-\xf9\x0a\x05o\xa0{I~\xa2S\x99yZ\x8d\xcf\x96\
-\x22)/\xd8\xb1p%\x1c;\xa7k\x94'\x7f5$\
-[\x02\xf7\xb4$\xbd\x95\x1b`\xec\xdc\x00\x05\xfd\x01\xd5\
-\xd4\xe2q\xafoNi\xc8c&\xc4U\xec\x11\xa5\x5c\
-\xc8\xf9c\xe4j\xa5Z\x8d2\xa6\xca\xa6\xa0\x8a[v\
-\xb0\x99ax\xd7<\x97:\x9f\x8dl\x1d4X\x9b\xa4\
-q\xd1\xd2[w\x83QS\x04m\xd7\xc1\xd4\x0d\x12f\
-dZ\xf0\xe2\xf6\x03\x88\x17\xbe\xe7%\xf7|u\xcd\xa7\
-\xd5\xc7\x9e\x9e\xeb\xbe\x22_\xa3\xc7\x9f|\xc4\xee\xd8i\
-h:6g\xd5Pjo\xfe\xd0$\x5chL\x82\xe3\
-\xd3\xb8\x8fO\xb6\x981\x0dCt*b\xd2d\x1b\xc0\
-;\xf3\x8b\xe0\x9e\xce\xdb\xdc\x8dO\xcdr\xa7\xbe\xf8A\
-}\xd4\x8c_\xd0\xd2\x8d\x97\xcb\xfc\xb5wcVw;\
-mn+\xb9n\xfe)t\xe63O\xe3=\x83\xeb\xe9\
-\xc3C\xc7\xbao\xbd\xe0\x9dX\xb1\xe3l\xf7\xf0\xee\xf5\
-\x9d\xbb\x9e\xf9\xd9c\x97\xfd\xfe\xf6+p\xce\xf97b\
-\xebP\x0fZ\x1bgA\x13\x03\xd4\x80(\xef\x14\xe6m\
-\xd0Qx\x97\xbb1\xa9\xede9\x22y\xf1\xedh\x8c\
-\xeb\xb1_\xf4R,N\xa9d\x81\x15\x1f\x07\x15\xc3\xaa\
-\x9c,F\x95\x12\xc6U\x9e[\x17,\xffd\x8c\xe3Z\
-H:\x11\xae\xa4NbL\xbeXn\x8b[x\x08\xe5\
-\xa2\xf2\xf1\x0c^A\x91_V\xe8\xe8H\x8a\x80\xedr\
-\x81\x97g\x7f5\xdd\xa60\xb6\xca\xb9\x03\xd6[\x06\xa4\
-\x91E,\x1a\x8a\x19i\xe2\x94\xda\x83\xd7\xcd\xbde\xf7\
-\xcc&\xe6\xc7\xa3\x18\xc96Cw\xdbH)F\xa2\x18\
-H\x0cN\x5c\xf6\xc4\xaa>\xec'\xf7\xc9\xac\xa5\xdd{\
-6u\xe8\xc1{vK+\x9dv\x0d\x8f9\xf1\xc7/\
-:\x99dQ\xca\x14\xf5\x93Lsr\xef\xcd\xe9?Y\
-_\xc0\x13,\xec\xa96D^\xb3R{\xe9\xa9\x84x\
-_\xe6\xc1?\xcb\x09\x0b-\x1dV\x13\x9a\xcf\xbb\xf1\xa7\
-M\x91\xdcp\xff\x0bDf-\xc2\xaa\xb5\xb3\xe5\xfb\xad\
-\xe7\xb9\xd5\xfb\xfd\x81d\xeb\xcf\xb0e\xa5\xc3\x12\xdaE\
-_\x99q\x1c\xe3\xc8wG\x87\x9cs\xc5\x96\x9d\x1f\xfd\
-\xe1\xb5x\xcb\xa5\xd7\xd0\xfa\xc7\xd6\x22\xe2Apg_\
-\x90\xd9\x0fq\xc2>!\xd7\xc7\xa7\xfb_I\xfbd\xf7\
-`\xd9\x16\xc8a\x81\xba\xab\xf2\x83\x91\xe1\x9c\x85h\x82\
-\xa6\x904\x963IYC\xb1\x06+\xc0\xc2yt\xc8\
-1D\xe5\xaae\xf6\xde\x9a\xe1ya\x0b\x18\xf6\xfcz\
-\xc9E\x93\x11\x83\x9d\xdf<\x0e\x0e\x11E\xe1V\xc0\xd8\
-\x13YP\x08]\xa8b\x0a[\xd0\xf9\xc2\xf7\xb8*\xd5\
-\x8fJsZ\x1aC\x81\x0b\x13\x5c\xc1\x98\xa0n\x8c\x99\
-L\xd3\xd8;[\x18\x96\x1c\xb4\xd2>r\x83\x14$\x11\
-\xdd\xde\xd2}\xcd\xdc?\x0c.\xac\xa3G\x01\xca\xecB\
-\x83Fa\x95Ej\x1d\x5c\xbd\x06\x90\xc5\x8bh'\x0e\
-\x90\x9e\xc6\x03\xdfy\xfdY#[\x17\xb6\xf0\x81]\xa3\
-\xfc\xd7\xad'\xe3\xcc\xe3VS\xbd\x0f|\xd0\xd0K\xf0\
-\xac}\x96\xaa\xee\xb84\x89\x18\x05\x13pr\xf6v\x98\
-\xc5\x93|\xfdTD\xb8\xa9\xd8u\x13)kx\x92\x81\
-\xc5$?C\x15\x01sJ\x97\x97\xba\xb1c\xda\xb7\x89\
-U;L\x04\xd1\x80d8\xe3\x08\xd0\xdb\x8f\xa8\xa9w\
-\xfe\xf0\xa52r\xd3\xbb\x13\xdc\xdf\xe9\xc3\xd0\x8e\x15\xd8\
-\xb5\xe7|H\xedT4\xeb\xc3\xa8%\x06L\x0a\xd69\
-d\xdd\x0ch\x08j\x14\x81\x99\x90\xaa\x0c\xe2\x1c\xe2T\
-\xc1F\x16\xf5f\x0c\xd3\xc9\xc0NPk&\xc8\xd2\x0c\
-,\xde\xfa\x5c\x94C\xd6mch\xdb\x00vo\xdd\x81\
-\x81\xdd#PD\x983\xa7\x0f\xfb\x1c0\x073\xe6\xcf\
-\x80F\x02\xc5@\x12io\x98\x0d\x01\x1a\x0a\x91%t\
-\xa8\x03\x18AB\x11T\xc40H\xa1\xa1=%\x99\xcb\
-\xd7\x94+\x1e\xf8\xaa\xb4q\x18\xa3\xd8Be*\x9c?\
-{*\xa7a\x84|\xc7\xdco\x8e\x8a\x04\x9b\xdc\xae<\
-\xf7\xe7\xf1\xbc\x1d\x81\x1ffy\xb2Z\xf8\x98c\xa4\xd6\
- F\x0d-\xeaB\x8d(\x98\x1e\xae\x0f\xac\x1c\xfd\xc3\
-\x0b\xfey\xdb\x8b\xfa\xb1\xc0i\xb8\xf4^\xf4\xd3V\x0c\
-+F$\x04\xd5\xb5\xc8bB\xd4\xce \xbb\xba\xb8\xad\
-~\x18>\xbe_\xf3=\x03\xa7\x7f\xed*{\xc3\xc3o\
-\xc3{\xfb\xef\xc2\xd5\xf6/\xe8\x1dy\x05V\xe3\x8e`\
-\x1111;\x93*\x8b`\xba\xc6t:E\xccd8\
-?&\x18*LE\x95\xe0)n\x12LPfa\x9a\
-\xdfy\xd21\xf6\x14D<\xef\xb4\xb2(\xe1\x15\xef\xe8\
-\xe3\x85<\xc4'n\xef\xd2\x19\xeb\x1av\xd7\xba\x19f\
-\xf9\xcaM\x96\xae\xbeu\x7f\x5c\xfb\xc7\x8b\xc0\x8d3\xd1\
-\xe8\xed\x81\xca\x18d\x04)\xa5\xe0\x06\x83\x15\x83\xb30\
-\x19M\x80\x84#\x18k\x10\xd5\x09\xd4\x16tffH\
-\xb7\xa7M\xb5\x09=\xab\xff\xfc\xe4?<{s\xebm\
-\xf3\xb0ln\x1d3\x8cC\x8a\x0c\x16\x0ce\x13\xc4\xec\
-@[\x06\xb1\xe5\x07\xdb\xb0\xf6\xfa\xa5g\xf6\xee8\xfa\
-\x9c\x83\xda\xb3\xe6\xf4\x02M\x86\x12\x00VP\x1baP\
-\x83\xe1\x12\x9f\xed\xc8\xf0\x93Y\x93\x1a\xc4q4\x86\xe0\
-\xc6\xe30~\xa0:/@A\x8d\xa0\xcaF\x91\xc2\xfa\
-$\xd4\xef\xae\xca0\xcd\x01(WD\xe7yN?{\
-+\xb0\x80\xe9[\x93\xcb\x18=\xfe\x0ff\xa4\xa9\xf1~\
-\x9aZ\xf7\xa6\xeb\xed\xe3\xcf\xbbd\xdb\xbc\x1a\xe6P\x0c\
-\xca\xfe\x00\xc5{\xd0\xb2u4H@\xae\x8d\x16\x13\x22\
-\xd1\xd0Y\x86\xe6\x1e\xe0\xf3[_|\xccw\x8e\x97\xdb\
-\x05\x97\xbd\xdc\xeds\xd3\x97\xf1B\xf7\x1b\x0c\xbe\xef\xeb\
-\xbc\xe1\xb7\x90\x8d\xeb&\xd6\xdcNEN\xfb[\x9bR\
-L\xc3\x93\x96i\x167\xa6)\x810\xc1\xbfA{=\
-K\x98\xb8_\xa1\x09\xe4kc\x16\x7f}\xd6\xdf\xd1\xf1\
-\xfb_\xae>\xf8\xe0N\xb9y\xf97\xf1\xd5KW\xb1\
-Z\xbd\x03\x9f\xfeo\xed\xee\x8do\xb5\xd7=\x04s\xd8\
-/\x9e\xe8Yu\xf5\xcfNqQ\xed\x95\x88\xeb\xc7@\
-\xf3\xa1P\x94\x82\xa8\x03(\x82\xd6>\xae\xd4f)\xd0\
-\x00\x94\x01v\xec\xd8q\xd0\xd0\xca\x91W\xef\xbc}\xf4\
-|~\xb6\x7fQ\x1d}\xda\xa7\x9f\xb3\xd3\xde\xa5\xcd3\
-\x90\xc0\xc2`\xe7\x90\x89\x81c\x02\xb3\x02?\x9db\xd7\
-\x0f\xe3\xfd\x87~\xdf\xf7\xdax\xf5\x01+fcN\xef\
-l\x8cF-0\x11\xeaQ\x0c%\x0c\x9b\x19\xd4\xa2\x04\
--\x8c\x22\xb2j\x0c\xa7\xa7\xc0\xfd\x8b\x85,%\x17\x08\
-\xe3\x86]T\x9e\xfc\x05\xc6_D^\xa3\x18\xc4\xa1\x92\
-\xc1\xe5\x9bv\x9f\xe3e\x9dghZ\x81O[pa\
-\xf1;\x1f\x9c\xe7l\xf8\x98R\xb3\xda\x0f\xb6\xb7\x1e\xf7\
-\x89\x8e#\xccP\x11\x5c\xebzP\xa3\x83V\xab\x07\xcd\
-\xc8\xfb\xe3\x8b\xf2\xcc\xa8\xb8\x95bx\xa4\x8bz\xed(\
->m\xe6!\x8f\xad[\xf0\xa7\x17b\xe7-[\xf1\xba\
-[\xff\xc9\xed\xfe\xf7_\xa9\xad\xd7\x0c\xc9\xc3\x0f\x96\xb7\
-\xfaT\xa5\x0eM\xb3\x18e\x1a\xe4F\xa6\x90\x7fMU\
-\x9e\xc84\xb7\x85L#-\x9b\xd6Se\x82E=U\
-?Rl\xccSg.\xc2\x07\xf69\x80\xcf\xfd\xf0\x0a\
-\xeav\xb7\xe1\xfdW\xdd\xe5\x1a)\xe8?O&\xea\x9b\
-;\x1f\xff\xf9\xd8\xdd\xd4x\x00\xeeu\xef\x93\x0c\x8b\xd6\
-\xd6\xfb\xae\xbfz\xeep7Z.\xdd\xc1\xbf\x87\xaa\x9d\
-\x05n\xa6\x80j!R\x0cC\x16\x09\xc5\xd1\xca\xbbW\
-}y\xe4W\xd9\xe93\x06\x17.\xaec\xa6\xe9\xa0\x05\
-O\x9b\xe6\xcc\xdf\xc5Ne0\x88\x10)\x06\xc7\xa9\xbf\
-\xafM@\xbd\xe1\xe0\x8c\x85\x8b2d\x9b-Z\xd7t\
-\xe6n\xf9\xd4\x11\x1f\xec\xc5\x11/:\x1c\xc6eh\xb9\
-\x16\xea6\x06u\x05QM\xa3\x1be\x88\xd2\x10\x91Q\
-9\xb5\x0b\xf5\x17\xb9\x80\xcdS\xa1\xf0*\xdd\x1c0f\
-\xd2\x9b\x0f\xc6*\x95S\xc9?\xaa\xb8D\xe4@~\x9e\
-p\xef\xc2\xfb\xd6\x84\xb2\xc7\xfaV\xc8Z@\x94B\xa6\
-,2\xa7\x16\xed\xba\xf4\xb1\x0d\xa7_wpW\x90$\
-)\xba\x83\x7f\x00\xf5X\xa4\x9d&jI\x0a\xea2 \
-\x0e\xae\x96\x81S\x83\xae\x8b0cK\x1b\xdf{\xf8\xd2\
-y\x9f\xfb\xdeq1\xdf\xf2\x8e\xfb\xf8\xda\xbb\xf7\xc3G\
-\x9fx\x81]\xfb\xc4\xbdh\x0d\xe396\xe1\xff\x17\xfc\
-~\xaa!\xd7\xdf\x02e\xee\x0d\xca\xb37\x93a\xda\x8b\
-\xf2K\xfe\x86\xd9\xc1s~\xbf}^8D\xd9\xfb7\
-\xa8\xd7=\xf2g\x1c\xf3\xbd\xcd2{\xe5\x81\xe8?\xec\
-\x09:7\xdbM\xbf\x1b\xed\xb8_\x0d\xef/\xbag\x94\
-\xce\x7f\xfa\x93I|\xcf\x0d\xe6\x91\xa3\xfea4z\xd3\
-w6\xfe\xfa\x9do\xfb\xf9o\xd6>\xef\x07\xd9\xc6G\
-\xba\xe8\x8c\x1e\x06\xd3\x05L\xdb-\xbf\xef\xa7\x0f\xdd-\
-\xd7\xf7=\xbf\xd9\xddwn\x82\xdah\x8a\xb6\xa5\xc2\x01\
-D\xb4+&Fb\xbc\xf5\xb9\xb1\x1aZ4t.\xb0\
-q\x0e\xb6\x91\xc2\x9a\x08\xba\xb7\x173\x8eOF\xe7\xbe\
-e\xfd-\x83W\xaf{\xea\xb1\xd6~K\xe7!\xaeE\
-\xd8ECH(\x82u\x16V,\xb8\xa2\xba\x93b\xba\
-D\xa8\xb4\xb2\x95\xff\x96'8(\xb7 \xcf\xd3+\x83\
-5\x97\x94\x0d\xae\x0b\x10\xadTh+\xde|\xcaUt\
-\xbeT|>\x9f\x05H$\xa0\x8c@\x8a}\x08\x88\xcd\
-^%\x9f[s\xce\xfen\x89\x22\xb0\xdd\x02k\xf7@\
-\x94*\xf0Qa\x7fg\xb9L\x90\xc6\x11jB\xc8F\
-2,9\xe9\xb8\xd6Ov_\xb4\xc2\xde\xf4\xf5#\xf4\
-E\x0b.\xd3\xc9\xb7\xef\xb4\x03\xc3\x1bi3V\x15\xeb\
-L\xef\x85\xab\xc2t\x14e\x99\xa2\x01\x96)8\x13\x93\
-\xfd<7\xc1L\x81\xf6\xa2\xec\x9a\x8cZA\x93\x94E\
-2\x01\x8a\x85\xa9\x10\xa3{\xff\xa8\xe5\xde\xc7O4\xe7\
-\xee^\x81g\xb0\x9c6\xcc\xd9O\xf6\x1c\xb1\x8a\x80;\
-\xe5\x88\xaf\xccr\x06/\xa4\x1f\xf5\xcd\xc1\x8fF\x1fL\
-\xe7\xdb\x8d\xf8\xdc\xaf\xbf\xe6\x96\xe2.\xfd\x96E_Q\
-?<\xe3C\xbb^\xffM|\x9ez\xe4K\x07\xfc\xdd\
-\xbb\xce9\xf9OW\xbd\xe1\xb3\xcb\x87\x0eI\x9a\x98\x83\
-6F\xb262\x15\x83\xb3\x08\xb1\x8bAR\x83C\x1d\
-Du\x10G@C\xa3a\x14\x90:X\xb4\xe0\xa4\x05\
-\xe9dP\xd2A\x0c\x82K,\xb2\x11Aj\x007\xbf\
-\x17\xf3\x1en\xff\xb9\xf7\x1d\xd7\x0d?x\xe3k>p\
-,\xeaK\x9a\x80\x8d\x10u\xbd\x83\xa9\x04\x83\x16\x0e\x93\
-`\xcb\x15\xeeP\x1eb\x17&\xceL\xb9\x9c'\x90\xe5\
-\xc8\xfbJ\xe7\xc8\x0d\x07t'O\x03\xf3\xf0|\x18\xb2\
-Q\x05:\xb2\x0c\xcd\x15\xcd\x02\xcaR\x89\x99\x80\x98\xe0\
-R\xc0\x1a\x0b\x06`\x06\xe8\xfc\x83M\x9f\xb1\xe0\x88`\
-\xd2\x01\xa8H!u\x00K\x86\xcc0\xa8\xee\x10\x09\xc0\
-F\x81C(\x88\x9a\xd3D\xcf\x83\xff*\xcb\xdb\x8b\xdf\
-\xf1\xb0~*rC\x0e\x5c\xdf\xff\x8f\xd4zt\xf3\x98\
-50\x11IM\xf6\xa2<\xa0\x09\xb8:2\xc5\xe0j\
-\xba\x85?\xa5\x22~\x22v\xdd\x14\xa5\xd3\xdf\xfag\xba\
-fy\x92\x83 \xf1{4\xce\xfc\xb5\xdfq\xde{\x12\
-\x0c/\x13\xc8\x10\xc51\xd2\xaf_\x1a\x9d\xf8\xb5-\xf6\
-\xef7=\xe3~\xf0\xbeG\xd4\xd7g<\x95\xf4\xfev\
-\xf8#\xb3\x9bxC\xa2\xa0l\x0aC\x04\xd7i\xa0\x97\
-f\xc15\xe6`T\xcfD*\xfd\x88x&\x14\xea`\
-\x8a\x00\x89\xbc\xd0\x86\x18\xcc\x19,\x8f\xc2\x98A\x08\xba\
-@\xba\x1d\x91y\x0a\xca\xee\x81F\x0c\x1beHu\x17\
-\xd8n1\xf4\x89\xf6\xe2\xf5W\x9d\xf1\xa5\xa3\xd1;s\
-\x06:v\x14.\xb3\x88X\x15eI\xe9\xa6\xe05\x06\
-\x04\x8c\x15\xbc\x17d9*j\xf8bP\xe5\xcaH\x8d\
-\x12\x1dBa\x9c2^QVL\xbe|\x96+\xc4\x06\
-\x8a3\xb1\xe7\xec\x80\x91v\x0c\xa4\xae\xb0\xf9\xd7+G\
-N\xb8t\x11)\xccJ\x08\xa3#\xf7\xa3Yoa$\
-\xd5\xd0\xba\x8d\x8e(D\x10\xb0\x84\xe0\xa4\xc0\x80\xe0\xb6\
-C{\xab\xe0s\x87\xe1\x9d\xbf>\xe9K\xe7\xe0\x84\x0b\
-\xceV\xb7?\xb4\x8f<t\xff.t+\x5c\x92\x89p\
-\xfc\xc9\xca\x97\x89\xbe\xae*\x9a\xe6)\x06]\x93!)\
-\xb2\x17\xbd\xc4D\x0b\x1f\x93\xdc2\x93i\x09\xa6\xbb\x95\
-d/o\x92\xca\xd7YOM\xb4\x00L>\x8cr\x81\
-\x8a`\x008\x9937\xa3o\xae\xb8\x8en\xe8\xa9\xe3\
-G\x07i\xbc\xfd\xbc\xf5\xea\x05?\xdf|\xe1\xcc\x0c\x17\
-\xc4:\x08eb\xc42\x13\xf1\x8cC0\x18\x1d\x824\
-]\x04m\xe7@\xd9~D\xa6\x86\x08>'\xd2\xe5q\
-E\xa2\xa1$\x82\xb65h\xdd\x0bA?4\x16\x22j\
-\x1c\x84\xd1\xfa\x0c\xb4\xd2!4\xd0\x01\x81\xe1\xea\x8c\xfa\
-\xd9\x8d\xc1y\xf7?q\xff\xc3\xcf,}\xc5\x5c0\x14\
-8Q\x10#E\x1a\x22s\xce\x1d\xf26\xe5\xa5pK\
-\x8a\xc12!\xf7\x04*\xa7N\xee9\x81\x149\xad0\
-X\x98\x08\x8dS\x91\xe5\xd9f\x5c\xa1e{;\x12\x11\
-\xc0u3o7\xd6\x17\xa13\xe0\xde\xd7\xfb\xc5\xf5\xa7\
-\xcd\x1cY\xc6\x0cd\x83`\xda\x85LeHE\x15\xa3\
-B.\xfcP\xcb\x02\x8a\x88 m\x87\x87\xbf\xb1\xfe\x81\
-\x87\xdev\xc0\xd1\x0a\x1bN\xa4\x07F\x8e\xc2\xae]\x8f\
-:\x91\xf2\xf5\xe3i\xf0\xf4\xc9\xf0\xfc\x89\x86Y\x7f\xcb\
-\x09<~\xca\xcaS\xf4\x122ns\xd1\x04on\x82\
-\xcd4~\x13\xf38^\x11\x8d\xfb\xdcD_O\x93L\
-\x92e\x02\xad2\x8d\x93\xb8\xb1\xaa\x03\xf3\x1e\x03\xf7\xdd\
-\xdc+\xee\xa3Wf\xe7}\xec\xc9\x97\xf6\xec\xc6\x87\xa3\
-&\x9c\xcb \xa6\x07\xac\x0e\x87i\x1e\x87n\xb6\x045\
-\x1b#j\x00\xaa\x0e\xc45\x02\xd54DGp\x88@\
-\x92\x808\x82%\xedCu(\x06L\x8c\xc8) r\
-\xe8\xb8\x18\xb5\xee\xa1\xe8\xef=\x07\xa3\xfc\x02\x88\xe9G\
-\x8c\x08\x0c\x0b\xf7\xc3h\xdd\x81\x0bo\xbf\xfcA\x8c\x8c\
-\xb4\x80\x11.\xac\xbe\x9d\x03\x8c\xf1\xb2\x1d+\x80\xcd|\
-\xb9\xe12\xfff3\x0f9Z+AX\xe2)\xc4\xd6\
-\xf8\xd0n\x91`\x1d\x12\xb4\xb4\xe2\xbc\xd0\xdc\xe6>\xfc\
-.\x17\xaa{\x7f\xbc*\x85#\xb7\x03\xf0\xf5\x92\x81\x8e\
-\x15t\xa4\x00\x05tVn|\xc7\xbe\xbb\x16\xc5\x0e5\
-vpv7@\x0e\xa9cX\x16XQ\xbe\xe0r\xa5\
-\x8d\x8c\xcb\x7f\x22\x11\xa0\x13Dx\x1c8\xf0\x8cN$\
-\xad\xd9\xe8w3\xf2\x1e\xa4\xe0\xee\xf04C+\x99\xe6\
-t\x9d\x92\xfa9\x05\x02$\xe3\x16-\xf6\xe2\x06\x90I\
-`\xd6\xc9\x1a\xd3\xa9n\x08L\xf0\xd8&{\xc3\x14\x5c\
-\xa4\xa9n\x10\x99\xd1\x07\xba\xe2-\xc4\x0f\x9c\xf73z\
-\xf4\xfd\xd1\xc1q\x0d_\xe8a\xecA\x076Z\x8c\xa8\
-\xff \xb4\xd5>\xc8Z\x1a*cO}s\xde\xa2<\
-\x03\xc1\x12\xc1;\xae\xd5\xc0R\x83\xb2\x09\x22x\x89\xaf\
-hB\xa6\x09\xa9\xd2p\xae\x06\x8d\x08P\x16\x993P\
-=\x07\xa3\xd3|\x09\x8c,\x02u\x18h\xc4h~u\
-\xf0\x86^\xbdg\xcb0\xda\xc8\x82+\x82\xf7\xaa\xf0B\
-\x12\x815\x9eBlD`\x83\xa8\xc4\xfbgJPQ\
-y\xd4\xc5s\xe9K\x1a\xb2\xf7\xcf\x09\xdc\xfc\xf0u\x85\
-\x18=\x17\xa9\xb8\x9c\x9f\x0f\x18\x11\xff3\x02\x8d\x83@\
-P\xb1\xf6\xba[Xd\x83\xa3\xe7\xc6\xb7\xb4\x97r:\
-\xd3Z\xb4\xd1\x82S\xc3H\x15\xc1\xd8\x08:\x7fN\x02\
-\x01D|\x92\xa2\xf7C\x0dA\xf7b\x19\x06o\x19\xe6\
-\xf5ka7\xf6\x8f\xa0!\x06\xfd\x12\x8fY\x83<\xc1\
-B\x97i\x9a\xdc\xc9\xbef:\xa4do\xc4\xe94\xc5\
-0\xe9oAr\xa6C\x95d\x02\x9d\xf0T\xe4<\x99\
-\xe2c2\xd9\xef:\xbc>\x92\x1f|ayv\xee\xb9\
-/\xd6\x92\x9a\xf7\xcd\x8d1\xa7\xabak\x0bax\x7f\
-\xb8\xee\x0c\xd4\x04P5\x83,10V\x83\xd2\x1a8\
-M\xa0l\x0cH\x0c\x11\x9dC< \x89@\x88 \x14\
-C\x90\x00\x92@I\x0d\x11bh\x02\x1c\x22(\xd3@\
--%\xc4\x1c!\xad\xbf\x08\xdd\xe4`\xd4\x89\xa0O\x9d\
-\x99-:\xf6\xafWn\x80M]\xb18mX\x90\xb9\
-u\x88\x0d\x91?\x85\xb2*wI\xc8\xbd\xf1mX\xc0\
-N`\x9d\x83\xb1R\xe4\x97\x85\xca/\xbc\x1fR\xd8A\
-\xc5Y\x9c7\xc0.\xdc\x1a\xceI\xf8\xdb\x01\x86@F\
-@\x94\xd6:\x8f\x8e\xbc\xb7\xe7\x16\xdd\x00\x9a)\xc1\x9a\
-Q\x98\xb8\x8d\xb6ch\xc4!=\x80\xe0D\xc1\x11\xc3\
-\xe549\x0e\x9b\xc0\x02]\x03\x1a\xc0\xcbo\xe4/}\
-\xefu\xc6,\xff#\xd2\xd1\x07\xb0\xd8\xcd\xa2\xf1\x9a\xc4\
-\xbd9\xc5&\xfb\xc3\x13\x9c\xa4\xe37\x88\x9b\x02\x22\x94\
-)6\x18M\x81\xc0Lv\x8ac\xdc\xf0i\xaa\xdf\x9b\
-1\xb1}\x0aU\x1e\x17OP\xceLD\xca\x9b\xa8,\
-\xc3\xc6=\x99|\xe2\xd6W\xe0\xb3\xff\xf6\xc0Q\xbd\x8c\
-\xe3\x9a\xa3\x18\xa5}\xc1\xdd\xa5\xd0V\xf9\xe5\xc414\
-b$\xa4\xc1\xe4\x90\xc5\x02\xaa\x13T\x92\x0b\x19\x15\x1c\
-4\x1ciX\xa5\xe18\x01Q\x02r\x09\x94\xabA\x89\
-\xf6!\xdb\x94@\x91\x0a\x8e\xd35P\xda\x8b\xa6%$\
-\xf5\xe7a\x88\x0eEb\x18\xb5\xaf\xe1\x819\xd8\xb9f\
-\x0fH)_\xea\x98\xc0\xdb\xb0\x1e\xa9\xc9\x15S&\xe8\
-e\xa5\xb0\x11\xa1\x10\x14QJ\x0e\xc5\xf9\xe7\xc6\xd8R\
-dn]\x08\x85\x12\x82\xb1(\xbe\xdf\x0a\x95\xff\x9e\x22\
-\xd8\xd0\x07\x09\x03`\x05\xd7\xb2\x90\x0e\xc0qr\xac\xfd\
-\xc5\x86\x93fb\x89\x15\x18\x12Df\x04 \x07\xab\xd8\
-{\xae\x92\x82\x08CH\x15\x9d\x87%\x82(\xf6\xbd\x90\
-\x03\xb8\x0d\xda\x06\xb9\x07\xf2\xc6\xab\xd5>sZ\xf2\xfc\
-\xd3\x9f\xa4\xdd=\x03\x13.\xdc\xa9\x16\xd7\xde4{S\
-\xc1\xa1<IY\x81IJ)\x99b\xf1OUJ\xc9\
-\x14\xfd\xc8\xdep\xf8'B\x96\xdc8\xfa\xc6d%\xe0\
-\xc4\xffno\x8d\x96\xbe\xe5&\xa2\xb6yi\x02\xcc\x1d\
-\xdd\x07\xaew\x1e\x84=o\x8d\x95?\x16\xac\x05\xac\xf1\
-\xa1(Qpv6.$\xb1\x907\xcd\x22\xd6`\x8a\
-A\xa4\x01\xc4\x00+\x88bX&X\xa7\x00\xeb\xe9o\
-N\x03FY8\xe5\xe0\x94 \xeb0\xfak\xcb\xd0\xa2\
-yh\x1f4\x03\xfb\x1d{\xc77\x1f\x873\x5c\xe4\xbc\
-\xa4\xc6BR\x86\xa1\xf2\xb4\x87\xa3\x90\x84\xa2 \x96\xfd\
-\x82\xae\x94(\xc5 \xca\xf9C\xc2Y\x0e\x8b\x9f\x0b1\
-]\xbe\x11\xfc-\xe2o\x15\x9b\x09\x00\x0d!\x82\xed\x0a\
-L&\xe8Z\xebM\x7f\xfb\xeaX\xf7\x93\x87\xbf3\xfb\
-\xde9d\x91$\x02\xb2\xc3h\xebatL\x0dJ\x08\
-V\x19\xa4!\xd1\xc1\xe6\xaf\x96\x052\xd2\xc1\xc5\xc8y\
-uo}\x1f\xb7\xf2\xfc\xe3\xff\xd3\xb6_\x92\xb1zv\
-\x11==\xf4\x12i,\xed<gQ\xfe_\x1aS\x99\
-\xe4\xd4\xa3)D$\xd3\xd5\xe54\x0d1n2.>\
-\xed\x85\x8ako\xe6\x13SM\xa4'b\xa5N\xd7\xfc\
-\x02\x228\xe8M\xc3\xf5\xa4\x8bs\xb8\x89Q^\x86\x86\
-\xb2\x1e\x92\xa4\xcaw\x06\xbcDBNW\xe1\xed\x0f\x7f\
-\xb2y\xf2\x99\xf6o\x14C8\x02(\x0a\xb1\x1e\xda\xe7\
-\x80\x857\x0a\x16a\x04\x02:\x1a\x92\x01]\xc3\xa0\xfa\
-!PR\x03\xbe\x5c\xdb6\x1f[\xd6n\xf5)e\x0d\
-\x86\x12\x0dk\x1dFM'\xd4\xfb\x1cN\x7f_\xeb\xbb\
-\xe0\x9b\xe9B\xf7a]\xde\x18\x07\x0as\xb8\xd0%\xd4\
-\xf3\xd6R\x11#T\xd8\x8e\x87R\xcat\x1cF\xb7\x8f\
-B\xf7\xd4\xa1\xea1\xa0\x08\xd9p\x0a\xc7\x84MO\xaf\
-\xbbu\xe1e3\x17\xd4\xb0X\x0985\xc8h+\x86\
-\x14\xc1\x10{\xbe)\x08\x22\xca[\xc3\xb0\x0b\x0b>A\
-\x8c\x18\xaa%\x18e@F\x0c\xd6,z/\xf6\xf4\x9f\
-\x05\xd5\xf3\xdb\xb7\xd8\x93\xbaM~p\xc6<<\xb5\xba\
-\xa8\x06d*\xf1\xc9t\x8b\x88\xa6hte\x92[\x84\
-\xf6\xa2\x0e\xa7I0\xf4\xc9NV\xd9\xcb\x81\x1b\xc6!\
-72\x8d\xce@&Aw\xc6\x97T\x13\xddT\x05\x11\
-*\xaaw\xe5\xb8\xdfo=\xa8AX\x96\xcc\x80\xe9\xd6\
-Ps\x0aL\x0e\x8e\xa5\xd4\x0c\x16B@\xbf\xe4\xd8\x85\
-8S\xe1`\xd8\xcd \x17\xfe_\x14H\x22\x00\xda\xfb\
-\xf5\x0bW\xcco\xa9t\xde\x04y\xb2s\xbfET\x1b\
-E\x87\xea`{\x08\xf4\xe2YX\x98<v\xef\x1ad\
-\xc2hwS\x00\x11\x98c$\xb6\x16D\xe3\xaeX\xec\
-\xd6\xfa\x93\xdaX\x81X\xaf\x91\x95\xfc\xfdJ\xc3kC\
-Y\xe3\xac@B\x9f\x90Y\xf2\xda\xda\xdc~\xc4\x09H\
-+ adm\xeb\x99\x99\x99C\xdc\xd7@\xb7m>\
-\x1a}f\xf4\xc5\xaa\xbb8\xe9\x06\xb4f\x10\x1d\xcdP\
-V\x85\xed\xa3B|\x93W\x148\xa7A\x0ap\xca!\
-c\x81!\xff\xbc\xf4\xb4\x13\xdc\xd2\xb3\xe9*W_\x12\
-\xd1G\x9bW\xf3\xe1\x8f\xcd\x97\xee\x9e\x18\xce\xd2\x985\
-\xc0\x93\x88=\xa6\xc2\xbd\xc7\xc3\x87S\xa1&\xb4\x17\x0d\
-2M\xf1y\xda\xcb\x1bho7\x01&in1\x85\
-&A\xf6\x82\xb4G\x13\xe8\x06p\xedv\x98\x87\xd7\xe2\
-\xf4\xde\x06F\xa9\x0e\xad[\x18\xe9&>\x16\x94\x9cG\
-\xc2\xc7\xfdVDe\x8bX\xcaD*?\x97\x18.w\
-\xd3A\xa9\xca}\xee\x86\xf5\xee\xd1\xac\x0c\x5c'\x81\xce\
-\xbaHk\xb3\x91\xa9\xd9\xd0\xe7\xd03\xfd\x1e\x8b\xdf\x0d\
-t\xc5\xa0\x85\x0c.%\x0fs\x1a\xc0\x18\x04\x97c\x09\
-Q\x9f\x01\xa6t\x0e&4\xb2\xbe\x9e/)\xc79\x8c\
-\xe9='J\xf8\xd2\xc1\xc1\x8a\x8f\x05\xa4Z\x84(N\
-\xd0\x1el\xc1\x18O6\x18\x191\xc7\xed\xf9\xef\xb5\xef\
-\xe9{f\xb6\x10\x1cb\xf4t;\x18q\x19\xda\x89\xdf\
-\xd0\xe2|\xa0\x87\x93\x9c \xa1\x01\xeb3\x12\x1c\x19\xa4\
-0H\x1b\x1a\xf5a\x07\xb7\xe8\x18\xba\x13g\xceP\xe6\
-\xa0\x1a\x1d\xb1\x80\x90=\xf6\x8f2\x8b\xb6\xa3\xa7.c\
-\x0eW\xde\xcb\x85\xfa\xb7.\xa6\xe9\xa0D\x9a\xe4\x94\x9d\
-N\xd9ES\x0c\xc3&\x83di\x9a\xdeao\x1f\x8b\
-L\xb1i&\xa49\x9fN\xc0\x82\x0c\xc7\xd9\xb9\xc8\x88\
-\xc1\xba\x85\x0e\xa48\xbd\x91G\xd0IE\xfe\x11\x94\xf2\
-\x8er)\xa1\xf3\x81\x17\xc1,P`@\x92y\x9f\x03\
-\x96\x90\xef\xe6\xdf\x84\x1c\x1c\xfc\xdf\x22\x02\xb6\x0e\xc68\
-\xa4\xdd\x06j\x96\xc1z\x04\xd9\xec\x85\xc8^T\xdb\xb1\
-\x0f\xb6n\x1aA\xecjHS\x8b\x96\xc9`\xac\x0d\xa4\
-1\x7f\x82\xc3VM\x9fJk\x10_\xf3K\x19\x09\x14\
-\x90\x9f\x22\x15\xb1b)\xee!\xd1\xd04\x0b!k[\
-\xb4:)\x00\x05\x15G\xe8B/z\xe6\xb3\xf7\xfdr\
-\xd6\xf5\x0b\x162\xe6\x19 J-\x86\xa3\x11\xb4\xc4\xc1\
-ZB\x1aB\xfcr\x9bw\xe7\x18\x12xL\x96\x15H\
-\x12D]\x05K\x02\x1e\x02n\xf9\xcb\x82\xde\x0d\x98\xb3\
-\x83\xfe\xdcu\xf4\xab>\xb8\xdd\xcd\xbf\xc3\xd1\x0b\x87\xe9\
-\xc0\xa5c_\x1b\x9eb\xb1Mw\x82\xd2$C \xda\
-\x8b\x93yo\x09p2\x85\xd8\x84\xf6\x92\x81I\x93\x0c\
-\xb6\xa6s\x7f\x9bh\xe05i\xff\xa2\x10\x03\x14\x03\x9a\
-\x09\x9a\x04h\xe6\xa3\xf1%2\x13\xca\xf3\xb4\xa0\xb5O\
-\x8dR\x0e\xb9\xd3\x00\x88\xaa\x841\xeb\x17\xba\xb8\x9c\x11\
-\xe0\xff\x16\x07\xc0\x80\x9c\x01\xbb\x14,\x19\xc8Y@\xac\
-\x8fq\x16\xe7]q\xc2\xe8^\xf2s\x96\x09\xaa\xde\x81\
-eFl\x04b\xfb\x11\x9f\x90l\xdf\x80\xa1\xf6\x15h\
-\xa7mt\x07\x81\xc8*h\xae\x87s5,R\x83\x12\
-\xd6\x0c~\xd5.\xf3\x88\x8c3\x04g\x180\x1e\x19r\
-&|.\xf3\xef\x8b\x00b=\xd9\x0c\xa0\x02\xc2\xb4\x16\
-\x88U\x02(\x85\xd6`:k\xdd\xd7\xef\xb9\xe7\xa0{\
-\x967\x15f\xb4\x18R\x03X\xef\xc4\xf6\xa8\x85QX\
-\xd84A\x04\x1f\xe9$\x1cn:\x0a\x80\xaa2H\x89\
-ATC\xd2\x8d -\x83lN/\xae\xfc\xbb\x97~\
-<{^\xfdc\xe8\x1e\xd12\xbf\xb9u\x16\xdd\xd4\x0f\
-\xcc^J\xa4x\xec\xeb\xad1\xb9#\xf2t\x0cG`\
-b?\xfd\xc9`\xc8\xbd\xb1 \x1f\xffo\xd34\xc8\x11\
-\xed\x05\xaa$\x13\xd5\xdf\x93<\xa6\xa9\xb8\xfe2\x15\x12\
-t&\xfe\x85~\xbbh\x13\xe1E\xf7\xa2>\xb4\x9b>\
-\xf5\xd7M\xf4\xb1\x97%\xb5\xa7\xba\xdd8\xee\xc2v\x13\
-\xc4`X\xce`\xa1\xc1!b\xd4\x1fd\xc1.\xa4H\
-\x5c\xf4\xb6\x88\x02\x07\x12\x0b\x82\x82\x90\x09\x96\xae.\xdc\
-\x13.`\x1b~S\xb0Tbp]\xf0I\xd3\x02\xdd\
-e\x90X8\x0e\x86\xb9\xc8@\xfb\xce5\x89<\xfa\xd9\
-\xff\x99}\xb5|c\xcf\xdb?\xf92!s\x0e\xba\xf5\
-\xc3\xc0\xfa hbDq\x17\xc2^K\xccD0\xca\
-\xa1\x96i8r@\xc2\xb0\xd6 b\x05c\x1d4\x08\
-\xac\xfco+BP\x0aPZ\xc3\xb42\xb0\x038b\
-Xc\xbd\x9f\x10\x01\x8a\x14\xdaC\xdd\x97o\xbdt\xd5\
-\xff\xecw\xd7\xd2\xd9\x8c\xf9\xa9\xc1\xa8r\x10\xd7E[\
-1T\xe6\xbd\xb7\x1c\x0c\xba\xaa\xa4\xb3\xe5\x04\x0b@\x01\
-\xc6\xdb\xbb\xdb8\xf5\x99\xc4{jx\xa8=\xb2`\xcd\
-\xf6\xb6\x95\xed\xd7m\x94\xda\xfd\xa0\xce\xd6]\xf2y\x9e\
-+\xbd\x9f\xdcI\xc3\x83c_o\x9e\x82e){Q\
-\xfb\xee\xcd\xc2\x9b\xacq\x9d\xae\xc9\xe5\xbd\xa4\x0dc\x12\
-T\xe7o!\xa9\xd1\xdf\xd0pOXre\x18\x04\xe6\
-\xfc\x1a\xa0\x16\xdc=;\xe4\x89\x1dG\x09FX\xeb\xba\
-\x0f\xc7!\x0b![\xe9\x8d\x04$\x0e\x22\x0e>8\xdc\
-\x81\xc4/b\x0a'v\xfe7`@b\xfc)\x9f\x97\
-:\x92\x81\xc4@`\xfc\xf7{\xceP\xf8;\x84\x14\xc2\
-\x96t\xb1\xb0\xb1\x08\x02\xe8~\xe8;\x96`\xd6]\xd7\
-\x10\xdcoFn\x5ct\xc6\x85\x97D\xc3\xc3o\xa5\x9e\
-\xf6\x05H\x07~\x8b\xa1!\x8d\xd4\xf5C\x88\xfd\x09\xdf\
-\x01F\x1b\x06m\xed\x80\x0e\xc1t\x1d\xd0E\x01\x8b:\
-\xcb0\xd6\x07\xc09\x0bd\xbb2Oi\xa8+t\xba\
-\x19`\x18\xce\x082\x03l\x5c\xb7\xe5\xe2\x9d\x9fx\xfa\
-\xca\x85w\x1d\xb0_\x0d\x0b\xc9 U\x19\x1cw\xd1\xe5\
-\x0c\xc6\xbab\x9e\xab\xe1\xc0.'7p\x91 \xef<\
-\x16\x0cq\x06\xedn\x0dl\x80\x0c)]\xf7\xcf\x07%\
-\x833\x9f\xf7\x09\x02 \x9d\xad9%z\x07\x86\x07E\
-&\x1a\xe4\xb8IJ\x0d\x9a\x04o\x9f\x8e\x1f?]\xed\
-=\xd9\xc6\x91I\xeas\x9e\xa4f\x9f\xaa&\x9f\x0c\x9d\
-\xc2^P4\xe4o\x9cR\x87\xab\xf37\x82\x87\xb68\
-\x18\x11\x19n\xf1\x00\x00\xcc\xd0\x82\x1aD\x08\x9a\x1d\x9c\
-\x18\xaf\x1a*\xe2\xa5mQ\x96\xa0X\xf4e\xdd\xee`\
-\x00\xc9\xbcP\x8928J\xe1\x5c\x0a\x91\xd4\xff?R\
-\x10\x0c\x84L\xdeP\xc2\x89\xf1~\x0a\xb0\x9e1O~\
-\xab9*\x5c\xcf@\x99E\xbakHu\xde\xfeTl\
-\x8frO\xd2\xbe\xf7\x1eo\xa2e_\xdc\xf2\xaf\x9f;\
-\xfe\x867m9\xfa=\xd1%\xef;\x04{6}\x1a\
-\xdb\xb7oG\xa7\x13!\xedZ\xa8A\x85\xa8\x15a4\
-M\xbd\xf7tM\x83t \x0c\x84\xe0gg\x05\xce\x08\
-\xd2H\xa0{k\xd0&\x862\x11\x10ih\x9b\xd0\xb6\
-?m\xf8qv\xd1\xa6\x8f\xcc{\xfa\x80\xa6F\x8fX\
-\x90u\x01\x9fO\xd1q)\x0c\x1b\xd8\x22\xff d\xbd\
-8\x0a\xa9\x94\x0a\xcei\x88\xd5p\x10X\x8e\xa0\xe5\xff\
-s\xf6\xdea\x92\x5c\xd5\xdd\xff\xe7\xdc[\xd5ar\xd8\
-\xa4\xcd+\xad\x12\x92\x10\x08\x09!\xc9\x22[2&\x8b\
-\x8c\x01\xdb\xbc\xbcD\xbf\xc66\xbc\xd8`\xc0\x09\xdb\x98\
-\x1f\xc9\xbc\x04\x9bdl\xc06\x19\x09\x933BBH\
-(\xaf\x22\xd2j\xb5\xd2\xe6\xc93\x9d\xaa\xea\xde\xf3\xfb\
-\xa3\xaa\xc3\xccvW\xf7\xb2\xcf\xd3\xcf\xcc\xceLWW\
-8\xf7\xdc\xef\xf9\x9e\xef9\x07\xdc\x8a\xf2@ie\xfa\
-\xdbWn\xf9\x88\x99\xd7m\xe40\x8a\xab\x22\xdc\xb0\x8f\
-\xe1\x91S\xa1\xd4\xaf\xa3\xb2\xe9\x03Y\xba\xe9\xec}\x97\
-\xf7\x0d\xe2\xc5\x07\xed\xe2\xa0}T\xa4\x83\xee`\xab>\
-g\xea$\x98;\xd4\x09\x8b\xc6U\xf5\x9d\xfe\xd7\xaf|\
-\xd3\x9e\x8dC\x94\xbdK\xbbFJ\x01\xa4\x84\xa5\x88\xd8\
-\x10\x9fI\x0fD\x8a\x08a\x1a&H\x01\x95\x10( \
-\x04 )\x87\xdf\xd4\xd26'\x16\xa6p\xc8\xa1.\xc1\
-\x90\x80D(\x11\xda\x5c,4@#\xf0u\xa0\x8e\x92\
-\xed\x14\x95%\xf6\x14\xef\xdb\xfe\xca\x8b\x16*\xcb2u\
-\x1d\x17\x1cx\xaf|~\xd3^\xff\xc9\xd2\x7f\x07?\xf3\
-\xdfp;N\xfa\x03\xfe\xf6c\xc4e4\x8c\xde\xf2\xa1\
-'\xfbe}\x1e\xc3\xf6\x91x\x9d\xc0\x97\x0c\xeb\xa6\xc6\
-\x88k\x11\xaa\x09\xd6\xa6\xdd\x1e|\xd6\xdd*\x08\xd2.\
-\x12\x22J\x12'\x144`ef\xfe\x89G\xbex\xe4\
-\x9f'~\x1al\xdf\xc0v1X\x1b`<4\x12G\
-\xa5\x04\x1eG\xdc\x1a\xe1\x1a \xc6`\xb0\x88\x97\xaci\
-I\xbb\xe5\xadzA\xc4\xe1\x8d!\xac\xd4\xd1\xf9\x82\xbc\
-\xe9\xe4\xfb>\xf3\xcb\xd3\xae\xff\xb5\x1c\xd8\xf3>\xa9,\
-\xd5\xba=\xe3U\xe5\xa4\xc1\x80^\xba[Qx\xaf\xc0\
-\xd3\x0c\xa0\xf7Ykt&'\xf8\xec\xb5\xf8z\x05\xb3\
-\xbf\x89\x06\xdf\xf4\x88+\xfa\x1d\xb3u\x0f\x1e{.\xe6\
-\xc6\x04\x7f\xecX\xf3}E\x11\xfe\xcc\xdd\xabo\x9a\xa9\
-\xc7l\x0a-\xa1ZB\x15\x9cu)V\xf7\xbe\x95\x1b\
-\x16\x1cJ\x90\xc2\x1d\xe3ZZ\xc2v;\x8cf\xe0\x9b\
-\x19\xbe\xfaV ,\xb8\xd4\xebk\x92\xfe\xdf\xa7\xbf\x13\
-\x5c\xab\xd9\x9a6\xdb\x0ez\x0f\x95!\xaa\xee\xffV\xeb\
-\x8b\x813\x93\xfe\xf3\xe6\xe2\xbf\xf9\xa4\xbb\xed\x82\x92\xf9\
-\xdcs\x9fn\x1e,\xdc*\xd1\xadE\xff\xee\xf3\x1b\xc5\
-\x8f\x1e\xb9\xd0\xfd\xd1\xe3\xdf\xfc\xfd\xca\xe7_\xf5\x13\xf9\
-\xfb\xcfl\xbf\xe2\xce\x8f<3L\x16/\xfb\xc2\xcc\xe3\
-B\xd6\x9f\xb5\x93R)\x80\xd6\x0e&i]\x93\xb5\xd0\
-H\xd5\x9a\xf5\xa3\x95\xb3\xf7}\xf3\xee?/\xfe$x\
-\xd6\xc6xCi\x8cMuh\x18G\x5cVL\xc3\x11\
-Y\x9fV\xdeZI\x9b\x8ah\xb6\xa8\xb3^\x10*\xb6\
-c\xd0i\xca\x15\xa5\xf3\xe0-\xe1B\x85\xc8\x0d\xf3\x9f\
-E?}\xa3\x95\xaf\x07\xef\xba\xf3\x1a\xff\xf6\xa5Q\xee\
-]\xdd4\xb6\xab\xad\x06=2\xa1\xdd\x1a\xc7\x0e\xc2\xd4\
-H\x8e\x06\xbf\xd7\xc9\x98\x1c(\xd9#\x7f\x00\x00 \x00\
-IDAT\x01X\xbf\x06VyE+B\xff\xba\xdc\
-A\xd4\xa6y\x94o\xcb)\x88 \x17\x5c\x80\xf9\xe9O\
-\xd1J\xa5\xe8\x91\xd7\xc83\xf9\xbai\x94\xb9\xdbEl\
-(X\xf0\xa4\x83\xac\xc9\xb0\xbd\xf8Vp\xda\x1cj\x97\
-\xfe\xdfe\x05~I\xd6\x8d3n\x8d\xb0j.\x08\xc9\
-\xbaz\xa6\x0bF\xdbq\x82$\xa8\xa4\x0cdZ\xed\x9a\
-\x19~\xab\xed\xab'\xb15\x0e\xdf\xf3\xe05q\xfc\xc5\
-\x8fjp\x19\x1c\x8c.\x95\xdb\xcfx\x19?\xba\xe8\xed\
-\xc9\x17\x0b\xef\xe4\x1b\xf6\x0a\x8e,W\xf4\xd1\xc3\x9f6\
-o\x1fy\xa1\xbd\xbax5O=\xe5\xb7\x1e\xf8\xdb\xff\
-\xf5\xc2\x9f\xca\x9e\xe4\xa5\x7f\x1f\xde\xc8\xd7\xef\xb67\xbe\
-e\xe8\x85C~\xd3#Nal}\x11;d\xa0\xae\
-Tg\xeb\xc4Qc\xeb\xbd\xffz\xf3\x17v\xde\xb3c\
-\xd7z\xbf\xbdT\xa0\xa8eJ\x15G\xad`\x90 \x81\
-J\xc4|\x00\xde\x184\x0c\x08b\x9b\xea@\xc5`\xd4\
-\xa7\xadfi\xb5\xf2G\x5c\xdaq]\xb3\x99\x8a\xc6\x1a\
-B\x1f\xf0K7\xcaW~g_\xc2s?\xf0X\xff\
-\xd5K\x7faf\xf7\x1c\xf6\xcc\xe7\xb6\x9f\xa4\x93\xd5\xe9\
-\x06\x0d|N\xe07\x08|\xf19A\xe2@L\xc9\x00\
-\xd4\xa6t\xd9m|\x1f%%=Dm\xbd\xce\xd1\xf7\
-\xd9\x15\x05\x90o\x7f\x9bv\x97\x1e\x1a\xa0\x7f\xa7\xa7>\
-\x15\x89O\xe5\xfbNy\x9a\x15\xbc&\xc4x\x90 \xf5\
-\xe5\xaa8I\x10\x93\xb6\xed\xc9Z\x97e\xed\xccSU\
-LZ\xffd\xb3@7U 6\x9buk\x16\xc0*\
-qF\x85&\xd9\x22I\x03]C\x8c\xb3\x0e[\x8bi\
-\x94\x84a\x14\x17\xd5\x89\x0f6\xb8\xbe\xb1\xf9\xf52\x7f\
-\xe0q2w\xef_\xcb\xcb\xa6^\xec\xed\x97\x9c^^\
-?\xccx\xfdC~\x86\x7f\xe6\x00\x01?\xae\x1c\x94\x9d\
-\xdf\x13\xb1\xffp\xa9}\xf6?\xfd\xb5\x987\xc57-\
-\xbcR~q\x16\xfa\xccWoOF_e\xff3\xfe\
-\xd1!\xee\xff\xe0\xfd\xa7$\xb3Sg\x8fM/\xde>\
-\xf7\xbbf\xaf\x5c\xb1\x95\x0d'\x9d\xc5\xf9\x122\xec-\
-\xde\xa5\x89&\x17z\x12\x1cI\xe2Ilk\x985\xe2\
-\x15\x8cC\xc5\xa6\xd7c\x0cx\x8b\xb1\x9a\xc64\xbe\x94\
-\xb6C\xf21\x91\x15T\x8a\x94\xe6#\x1e\xae\x16\xf9\xd4\
-\xae\x91/V~\xe7\xac\x17\xca;8K^\xfd\xd6\xa2\
-q\x7f%\x8e\x1b\xb4/\x85\x1e\x9c@b\xca\xe40!\
-y\xe3B\xa5\x0f\x86\x96\x010x?\x18\x96\xe7\x91\x07\
-euz\xc552@,\xd1\x95iz\xff\x0f\x8b\xfa\
-\xbe\xe74\xae\xdd{\x135\x07!\x1e'\x82M\x22\x12\
-c\xb39)\x92B\x14\xb5\x18u)K\x03\xad>\xc2\
-\xed<\x82\xcf\xf0}\xc7\xf2\xd2\xe6.\xe1Z\xc6\xae\xea\
-\xd2E\xe4\x1c\xce8\xc4:$\xf0\x14\x92\x04\xe7\x13\xa2\
-zL\xb0~\x1b\xd7\xbc\xe8\xc1\x0f\xc3I7\xf0\xf2\xeb\
-\xa6\xfc\x97\x93\x11\xfd\xfc\xd6\xd7\xf0'\xd3\xe8\xe1\xd9C\
-\xedkI\xd0\x87\x17\x0a\xbcM\xffC/xUl~\
-\xef\xb5a8v\xba\xfc\xe3\xc1\xbb\xf5\xb4\xcd\x05\xceN\
-\x94\xea\x137r\xc6e\xee\xfe\x86\xb3\xf7\x1b\xbf\x91\x9d\
->\xa1a\x03\xac\x17\x02\xf5D\xaax#8\xd2\x9a\x16\
-5i\xc6\xba9q^\xb0\xa8\xda\xacII\xd6\xf80\
-\x9beF\x92N\x1c\xf0\xb6F\xa2\x82\x97\x90bCH\
-\x1a\x0d\x9c\x1b\xe1\x13w\x1d>\xff\xd7\x9c\xf9Y\x09\x0f\
-\x8c\x98#\x9c\xef\x92\x17_\xe2\x16V\x1e2\xeda^\
-\xbd\x9f\x8f\xc9\xa11\xa5\x0f\xcc\xd1.\x1c\xb9\xe1\xc4\x8a\
-\xc2%\xe7\xb3\x07-0\xef\x06c4\x07\xa6\xad\x8d\xf4\
-}\x1f\x05g\xbf\xb6\xe99\xf9\x83\x88;\x8fR\xa9\x1a\
-\xbe\xef\x13\xac1\x94$N\x8d3ccT\x1c\xaa\x09\
-H\x92\xd1\x91)\x83\x93\xbe\x22\xd2yF\x11J\x9c\x06\
-\xaa\x19\x93\x83\xc4@\x8c\x12\xe3}\x82\x12\xb7=\xbe\xc4\
-m\xb6\xc7\xc7\xa88\xc4'$&\xa1T\x17~y\xc6\
-\xdb\xf4\xa1\x83\x9f\xf9\x02g\xed}\xbd\xff\xdc\xa9\xff\xa6\
-\x8d3_\xc8HQ\xcc\xa9'\x1d\xcfh%\x0bS\xea\
-~\xf0\x04\xbd\xfb\x22\x85{\x123\xf7y=\xbar\xb2\
-\xbc\xf1P\x95\xdb\x02\x87\x15\xc55J\x0c'%F\x93\
-:Q\xe8P\xe3\x11\xdf \xb6\x11\x91\xd4\x88\xdd\x22\xea\
-\xe6I\xa8\x10S\xc7\x9b:\x9e6%+Y0.\x92\
-\xc1\xb5f|B\x8c\xcf(Y1\x86\xa2\xf5\xd8Z\x05\
-\x1b\x9d\xc4{>8w\xd9\x0f\xff\xcf\xdbop\xdb\xdf\
-\xb2\xd1\x9dQ\xac\xf2B&y\xc1\x9f\xfe4\xd8\xb9\xcd\
-\xfb>\xb6\xa4\x9d<~/ir\xa7\x12\xd1w\x810\
-k\xbd\xab\xeb\xc1swk\xef\xa19\x09\xaeN\x1d\xbf\
-\x1f\x80\xae49\x89\xa8\xb5\x0f\xd3\xf5\xd1\x0au\x13\xa3\
-\xe5\xd5\x09\xf4\xa4>\x9f\xbf^\x99\xac\xe2\xbc\xb5\xffS\
-\x13\x92r: \xc7\x15\x95\x00\x87h\x1a\x90\x8a&\xa9\
-\x11\xabK\x17\x80$\x19|\x89\xf1\xc4xm\xa0\xda@\
-5\xc2kJg\xaaO\x17\x82j\x03L\xba0$c\
-u\xd0\x04\x95\x18\x83C\x5cD\xec\x1a\xc44\xf0\xd5:\
-\xb6\xbc\x8eO\xf0|\xcc\xbeG\xfdup\xe5\xa5+\x01\
-\x13\xa7A8\xc2\x8b\xf7\xbd\x5c\xaf\xdec\xd6>\x0b\x13\
-0\xcb\x0dw?\x9e\xff\xba\xfd\xff\xda\xa9'\xaa\xbf>\
-x\xa4\xb9\xf6\x89\xa3\xfbN\xbd\xa4\xf8\x07G\x8e\xf1\x8d\
-\x99\x84z\xc3\x83]b\xa9X\xc7\x03\xa1\xa9\xe3\x82\x15\
-\x5c<\x8bu\xb3X\xbb\x8c\x0f*xS\xc1K\x0d\xaf\
-\x11F\x924\x86\x918\x8dKH+\x1a\xd3\xda\xb3\xf4\
-~\x888\x0c\x1e\xeb\xd2k\xb1\x8b\x1eW\x1d\xe3\x03\x1f\
-\xff\xc7\x17\x7f\xfb=\x07^\xef\xdf\x19~Bo\xd9\xf8\
-IY~\xbe\x8bO\xff\x87\x17\xc8\x86W\x1d\x08\xa66\
-\x1f'\xbc\xd4n\xd0\xdc\x9c`\x1a_\xc8/-4}\
-\xa8\xd1~^[\xbb\xc8~\xcd\x80\x09\xaa~\xccN\xb7\
-E2\x08\x0c2}\x92q=\x17\xcfO\x96\x90{\xef\
-\xd8\x15\xcf\x8c\x14nj8\xf6T 2\x9a2\x16Y\
-\xb2I5\x0bF3\xe3\xc7gI*\x92\xd4\x88i\xb4\
-\xbc\xbf'j\x1b\xb74P\xa2,\x00\x8e3l\x9fR\
-\x99\x9a\x19N\x0a}\xb2\x9d%\x8e\x08W<\xdf\xfb\xf6\
-k_\xf7\xabK\x97\xfe,\xdc<\x02\xef+\xfe\x9e\xdb\
-\xb9\xff\xdf\xf9\xf2\xb1\x8b\xc5=\xeb\xad\x86\x91\xf3\x8e\x8b\
-\xab\xb6L#\x8b\x8f\xf9\xb5\xfc\xf0\x87OO\xfe\xe5\xae\
-\xa7\xca\xc7\x9e\xab\xfe\x8d\xf7\xfe\x5c\xecw\xeas\xa7\x7f\
-\x9d?>t\x07oY\xd8\xc3\x0d\xd5\x07\x19\xe2\x10&\
-\xde\x87\xab\x1f\xc64\xe60v\x19_\xa8\xe2\xa4\x91\xee\
-X\x92`p\x18q\x18\x12,\x0e\xa3\x09F#\x8cF\
-\x88\xc4\x19\xec\x8b\xdb\xbb\x9fo\x10'\x8a\x1e\xadP\x9d\
-w\xbc\xff\xad<\xef\xeb\xb7\xdc\xf2Q\xbe{\xc3\xcb\x09\
-^\xf3j\xfb\xf1\xeb\xff\xc2O\xef\xfcC3v\xd5\x1c\
-?~\x00O\xd2u\xc76\xe4\x14\x89\xf4J\x12\xf5\x9a\
-$\xd7\xabdPrd\xbe\xe4\xe8\xef\x07)\xfd\xcb\x93\
-'\xf7\x83f\xfd\xe2\x83\x13I\xc4\xf5S\x85*\xc0L\
-\xb4C\x9f\xb8}\x8f\xbf*\x1c^\x88\xc6\xf8\xafJ\x8c\
-1\x01&\xf6$\xeaPu\x19;\x93\xa4[\xbcO2\
-\xa3\x8f\xb3Lm\x96\x95\xd5\x184\xc6h\x94A\x82\x0c\
-\x1a\x10\xa1.J\xdf\xe7\x13pM\x0a3\xcb\xea\xba\x04\
-\x8c\xc7\x04J\x01\x88\xe2u\xe1'\xdf\xf0\xc7\x97\xea\x1d\
-\x17>\xd1_\xfc\xfdK\xe2\x8f=\xffs\xc1\xf9\x8f\xc1\
-<\xef\x02\xc2\xf5\xb5C\xcd\xe1\xd1\xab\x9e\xab1\xb14\
-\xceB\xde\xfb\xe8O\x99o>\xf6\x09\xf2\xef\x8f\xda3\
-t\xcd\x0f^\xe7_t\xc7\xd3t\xe7\x85\xe7\x96\x9e\xf8\
-\xd3=?\xde{\xfe\xae\xd7\xaf\xd4y\xdf\xc3\x8b\x94$\
-\xa2\xa0\x0d\xbc\xd4pZG]\x82\xa8\xc3\xc6B!\x81\
-\xc0;\xac\xf7\x04\x9a\xbe\xac\x8f\xb3\xac\xb5C\xbc\xc3x\
-\x87Q\x8f\xf8\xf4\xff\x16Gy\xa9\xcaRy\x13o\xfb\
-\xd7\xf9\xdf\xfa\xfa\x7f\xbf\xeb\xf1z\xee\x9bN\xb2;o\
-\xfcs^\x7f\xe9\xbb\xcc_|\xad\x10\xec+~C\xff\
-|\xe6:\xf9\xf9\x1b~\x1a\xdd|\xc3i\xdd\xe0\xb8_\
-\x9b\xd0\x92.z\x9d^S\xcb\xd7\xb2'kq\xfd\xa0\
-\xdd\x92\xc91\xdaA\xbe\xf6{_7\xca4\xaf\xbc2\
-\xaf\x97g\xde\xfb\xd7f\xbd\xbb\xc06\xf1/\xff]\x09\
-6\xefx\x0e\xff\xf4\xd1\xaf4\xae\x7f\xb9|\xfc\x8c\x11\
-.\xd3\xb4\x5c\xdbIH\xe0\x0c\xb15\x10\x14\xb0\xae\x80\
-\xd1\x00\x8fMS\xf2Y\x01\x8a\xc9\xfa\x95A:c\xb1\
-9\x1b\xac\xd5\xd5&\x9b\x84e#G\xe4#\x5c\xe8\x08\
-\xd4\xa1\x1a\xe1JJy\xa5Fc!\xe1K?x\xce\
-\xb3\xde\xfd\xb6\xbf*G\x8bw~WuA\x95G=\
-\x85\xa9{\x7fh.\xdc\xb9\xc8\x0f\x1e\xd8\xe4\xe3\xda\xe1\
-\xae\xfd\x84\x1ey\x1ar\xdb\xd17i8\xf4Cy\xda\
-\xa9\xb7\xc8\xbd\xbf6T\xab%\x1d\xfd\x87\xba\xb9\xfc[\
-\x9e\x8f\x98\xef\xf9\xf3\xdfv\x0b_\xfe\xb7\xb7<\xe2\xc0\
-m\xbcgK\x81S\x0aE0\x05\xbc\x18\xc4\x1841\
-$>\xc4\x9b\x00\x09\x0c\x18\x9b&\xe6|\x80`p6\
-\xab\xa3\x8d\x02\xbc3P\x08\xd3b\x85\x19\xc3]\xc3\x17\
-\xf1\xaeM;\x8f\x1c\xd84\x7f\x83\xbe\xe0\xc3\xcfH\xfe\
-\xe7\x8b\xdf\xd1\x1ao\xd3\xc3\x93\x87`\xbc\xaa\xe1\xdeE\
-\xd96<\xc4\x03\x95M\xaa\xec\x1d\x84\xd4\xd0\xbc\xa6\xb1\
-y\xf2\x84\xb5}\xeb\xfb5\x8b\x1d4\xeb\xaa}\xa8\xcf\
-^\xf8Z\xfa\x18z\xbfL\xefo\xba\xe8\xf2\xbf\xb7[\
-\x85W\xbdK\xfe{\xc3\xfb\xf9\x87\x8f\xdd6\xa1\x9e?\
-\xfc\xec\xef\xf0\xcc\x1d\xa3l\xf0\x92\x8dRK\xb3\x94\xce\
-\x86\x98$\xc0\x13\x82XLf\xf8\xa8\xc5\x88\x81\x96\xf1\
-g\x0f\xad\xa5Is\xa8\x07c=&\xf4\xd8$\x15{\
-E\xa1R\xd4\x18W\xadS\x5c\xa8\xf3\xf3\xc5\xf3\xa7^\
-\xfb\xe9\x1f\x8f/\xffo\xfb\x80\xf9\xddo\xe1\x0e\xcd\xf4\
-\xdc\x85}\x0e\xb5\xdd\xf1o\x84\xe0\xb2\xef\xd9o\xfe\xe0\
-cz\xba\x8e\xcb\xceW\xbc\x9fK\x87\xbe\xeb?\xb4\xe1\
-\xd5\xe3#\xdf9\xf4\xfbNy\xcex\x89-#!Q\
-d\x88%DL\x01k\xd2\x0a*\x8f\xc5k\x08.\x04\
-\x13\x82\xcbT?\xc5\x80\xb2*,\xc5\xec\x89\xc4|\xeb\
-\xe0\xe6K\xbe\xfa\xe1\xbf{z\xb5\xb4c\xd8|j\xdf\
-W\xcd\xbd\x97\xcf\xf2\xa4\xf3\x95\x83\x1f\xbc\xcb\xb1\x98\x0c\
-\xd2\xf7\xb4\xeb\xef\xbbMD\xc9\x1b\x0e1h\x97\x04\xc8\
-\x1f0A\x8f\xech\xb7RD\xd3\xe5\x18\xa6\x87W\x1f\
-D\xe20\x88ng\x90\x9cC\x9e\x22\x15\x80S6-\
-\xc9\xfbN\xfa\xb1y\xf9\xe1\x97\x94\xe7o\xfd\xc5\xe3\x8f\
-\xd5T\xee[\xb2G\x1f\xb5N\xd7\xad/1\xea\x05\xca\
-\x96r \x04\xcb\x11\xcb\x92\x8er\x08U\xb3\xe4TS\
-\xd3\xd3*\xeeh\xc9\x14\xc0e\x81\xb1\x03\x1b\xa1\xa2\x98\
-FL$u\x12\xf5\x98Z\x95eM\x18Y\x88\xb8u\
-\xe1\x9c\x89\xd7\xbe\xf0\xbb\xa7\xcf\xbd\xaa\xb8\xc7\xbe\xf9\xf0\
-\x1f\xe8\xfdw\x1dQtE\xc8\x9fS\xa0\xf9\x22\xc0M\
-\xf8\xf3\xdfk>\xf7\xec\x09\xf6\xbf\xe3\x8f\xec\xa3\xc7?\
-\xcd\xfe\xff|\x8c\x0e\x7f\xe5E\x8d\xf5\xff\xfe\xe5\x1b\xe3\
-\xfb\xfc\x0dn\x86uj9',\x13Z\xc1H\x9at\
-\xf3\xde I\x80\xf1\x16\xdb\x1c&j\x15\xeb\x1cS\xd5\
-\x88\x07+!\x1f\xd9;5\xf5\x89s_z\xe5u\x9f\
-\x7f\xe8\x19\xc9\xbb^\xf2\xba\xc2\xb6\xcd_7\x7f\xb7r\
-\x8f{\xeb\xe9o \x0a\xbeM\xf1Ww\xfbF\xa3\xef\
-3\xed\x16cf2\xf2\xfc1\x9f\xddxnr\xbc{\
-\xbf><\xbd\x8e{\x22=y\xba\xe9\xed\xf3`\x8f\xe9\
-\x01kL\x1fU\xe8 \xc7\xcb\x9b\x0e\xc3\xfc\x0a\xf2\xeb\
-x\xab\x96\xee\xfa\xe1#\xe7\xab\x0c\xf9\xd2xr\xff\xbc\
-\x1f=ZsSO\xd8B!\xb4\xa9F\xbe\x11Q\xb5\
-Bq\xc4\x12zE\x8c'\x96fA\x8a\xcb\xbc{S\
-\x9a\xe02\xd5e\xf6}\x90I\x93\xab5*A\x8c\x88\
-\x10j\x95X=\xc5\x03+\xdc4\xfd(\xde|\xe4\xa6\
-\xe4\xc8\xc6\xdb'd\xaf\xdd\xcdW\x1e\xfdq\xb8\xee\xd3\
-\x1e\xbfH\x97z\x8a\xbc\x8a\xb45\xcf-a\xe9\x8e\x92\
-\xbd\xa0\xf1:\xf9\xf0\x13\x0b2C\x22/\x99\xfd\x8a\xec\
->\xff\xbf\xed\xb5\x1fz\x85{\xa1\x1c\x9c\xd5WV\xae\
->x#wW\xe6\xd9-1C&\xa6\xee=I\xe4\
-\xb3\xe4\x9d\xc3\xf9\x84\xa0\xd6 9R\xe3\xe6\xb8\xc4?\
-l\xfa\xcb\xf0=\x1fa\xf4\xf6_^\xbbP\xd9\xfa\x99\
-+\xf5\x7fo\xf8\xa8\xec\xba\xb6\xc6\xab\xcdY\xfe\x17\xff\
-\xaf\x1c\xee\xd8\xfe*\xf9\xb7\xe8g\xf6G?\xc5\xcf\xd7\
-\x8e{\x0ey\xd2\x97U\xdfw\x9bs\xdb\xcb\xab\xf9\x01\
-\xbdx/\x83\xf1=N\xc2\xe7\xdct%\x7f\x18\xdc \
-\x19_\xe9\x03k~\xd3@\xd7\xf4\x10\xd8\xb5\x8e=6\
-\x86\x9b@v,\xc9\xe8\xaezu9\x1e\x09u\xc7\x8c\
-\x99<\x8d\xfa\xca\xaes&\xdd\xa9\x7fu\x91/=q\
-\x0b\x81\xf7\xd8\xa2\x12\xb8\x14\xefz\x93\xf6\xc8L\x85i\
-&\x1b \x94.7\xc9\x9a\xf7I\x96\xe1Mg\x8c'\
-$\xea!0\x94l\x8c\xae\xd4Y:\x5c\xe3\xae\x89\xb3\
-\xf9\x1b7\xcb\xfe\x1f\xd6\x9e\xe2_\xf5\xe5\x93\xdc\x0bw\
-\x7fK\xbe:\xf5,\x97\x5c\xf9\x19\xc9\xd8\x0f\xf9\x0d\xef\
-\xb3\x9ai\x91g~-,>pt\xda\x1d\xfc\xeb\x8f\
-'3\xf7?\x03v\xd7\x84\xc7\xcc\xcbo\x1f\xdbl\xbe\
-/\xf7\xe9_^|\xaa\x14\xde\xfa\xd4\xe8\xaf\xe4\x07\xee\
-\xeagr\xee\xd20\x17\xec\xa8\xb0y\xacN\xe2*4\
-\x1e\x10\x0e\x1f\x9e\xe6\xc0K^\xcf\xddzya\xce\xec\
-\xbd\xd6\xf1\xdf\x0b\xc1K\xbf\xf6'\xd4&\xffP\xefz\
-\xe5\x9f\x85w\xfb\xef\xf8\xf5\x7fyV\xf2\x92\x87\x9eg\
-\xce{\xd6\x0d\xc2\xd5/\xd5G\xce\xfc\x07\x97\xb2\xdbW\
-\xd87H\x85\x9dv\xd3\x91e\xb2\xfe\xe3\x94\x94\xdd\xc4\
-c\xbe\x8f>\xbf\xd7\x96\xd9+\x19fz\xe0G\xe9#\
-\x0f\xf8M\x0c\xbf\x1fScr\x92ay\xdd\x94\xf3\x9a\
-\xe7:c\xd80\x19\xca\xfa\xd9M\x97$\xd3\xf37l\
-\xf6\xaeqz5\x91S\x1a\x1an\x0b4\xde9]\x96\
-\x8d/=\xdd\xc7\xaf;\x13\xb7\xb1\xcc\x90\x87\xba7`\
-\xd3\xe2j\xa1\xb9\x00\xb2\x22\xf3LY\xdf\xean\x99e\
-n\x11\x0f\xd6\x10\x1a\x8f\xdb\xbf\xc0\xb1O\xdd\xce\xdc\xb7\
-\x1e,~\xf7\xce#\x8d\x0f>\xe9\xfd_\x1a\xba\xfas\
-\xd7:{\xd69\xc8e\xbb\xccG\xeez\x92\xbe\xe3\xc3\
-$\x07\x97r\x07y\xf4\xff\xff:\xe0o\x9e\x1b\xfc\xfd\
-w\x9f\xa1\xaf\xbc*\xe0\x1d\xff\xf7\xc3<\xf0\xf49\xf9\
-?\x7f\xbd\x1e.\xd8i\x82\xbd?\xf0_\xba+\xd1\x7f\
-\x7f\xd9\x9f\x09R\xe3\x1b\x9f\xfe\xc7\xe4\x19+\xdf\xd7\xdd\
-/}\xaa\xde\x7f\xc5\x1e8\xf3\x05\x86\xa3O\xd2g\xbc\
-\xf6\xad\xf2\x84\xfd\xfb\xcd\xcf\xf6\x1e\x94_\xf2S\x7f\xee\
-\x93\xbf)\x97\xed\x1e\x97\x03\xcb;Y9\xfc\x06\xdd\xf1\
-\xf0\x0f\xe4\xdd\xcf\xb8\x89\x0d[o\xe7\xe5\x9f\x9f\xd5\xc9\
-\xb3/\x92\x1f=\xb9 W\xbf\xf9WnafQ\x07\
-\xd0\x8cu\xb5\x9f<V\x87\x01\xbch/\xef\xed{\xe4\
-\x06\xfa\x9dP^\xe6\xf47\x09\x80O\x94\xba\xec\x95\xcd\
-\xed\x15\xdc\xe7\x19G\x19\x98\x04\x1a\xd8pR|r\xa6\
-\x11\xdd\xadp\xb2zv\x0e\x15\xd9T\x89max\xa8\
-\xfc\xde\x95\xf7\xae\x5c{\xeb\xf5\xbc~\x02\x9e\xb3\xbe\x88\
-:%q\xe0\x9cA\x8d%0\x01\x81\x114Q\x12\x15\
-b\xe7\xc0\x08&L\x05]\x81\xf5$\xf5\x84\xa5\x1f<\
-\xc8\xcc\x87n\xe2\xa1\xeb\x8f\x8e.8\x8d#\x0ac\xef\
-f\xf3\x0b\xaa\xf2\xc0G\xd0m\x93\xc2\xd0n..\xdc\
- \xd7\xde\xd6\x97\xb1\x1a\x84E\x03A\x9f\xac\x17\xcb.\
-\x0ep\xfd\x05\x87\x98\xdf\x11\xf1\x88=\xc8E\xc0-e\
-\xb8\xf2V\xe39k\x830Z\xe0\x91\xd7\xce\xa9)L\
-\xca-\xd1\x0e\xd8\xbdG\x8b\x9b0\x8d\xfd\x09\xec?O\
--\x82RT\xcf\xbd\x0c\x0f\xed\x93sNC\x0e\xd9\xb2\
-\x1e\xb0\x9bx\xcc\xf55n\xda\xb8B|\xea\x04\xfc\xfc\
-av\xef\x82\x953\x90\xc3\xdf\xee9\x03m\x90g.\
-\x9d\x1e\xbfW:~P\x1e[\xd6\xd0|r\x02^8\
-\xcf\x98\x07\xa1C\x19\xf0\xbce@\x18s\x22\x8cT\xb7\
-\xf3\xb3\x99O\x5c\x01\x86\x80\xd3\x81\xdd\xc0\xc9\xd9ks\
-\x182\x91$\xc1\xbf\xa9&\xef\xe7\xad\x1a\xea\xdb\xd7\xdb\
-k\xdf2\x7f\xfa}\xfb\xf4\xefN\x1e\xf7\xeb7\x96(\
-\x8e\x85\x0c\x15\x0c\xc6B\x82\x80X\xc2\xd83b\xd3\x86\
-\x1f\xcb3\x15\x92\x99\x06\x5cs\x80\x95\x8f\xde\xc6\xe1}\
-\x95\xd1\x83c,\x1f+\x0b\xba\xe8\xc2\xb8\xee\xe2\x1f\x02\
-7\xf6\xc8\xd7\xd0G\xa1*\x03\xde\x93\x13qh2\x00\
-$!'\xbf\xd3m\x10\xe0 \xd2\x98\xe3\x9eo\xc0\xe0\
-E\x1e\xfd\x84g\x9ac\xc4\x0c\xc8\x920\x80\x9a\xb2\x1f\
-o\x7f\x22\xb4)\x03,j9\x81\x85\xd2\xec\xa2<\x01\
-,fT\xf1\x16`\x13\xb0!{M\x01Cq0\xfa\
-\xcf\xc4\xcb\x9f|\xf3\xe9\x9b\x8b\x9bf\xce\xb1O\x7f\xc3\
-\x90\xff\xde\x7f\xae\x1cMb\xee\x9e\x0e\xeb\xf7\xfe\xd6\x8e\
-p\xe8\x11\xebtr4H\xc6\xc50\xee\x1d\xa3\x9b\x8b\
-\xec\xbb\xe2\x0c\xbe\xb7\xe8L\xd5\x8a<\xf4'?p\x8f\
-\xbbaF\xfep61G4q\x8b\x98\xcaR%,\
-\xcf/\xb9\xa0\x8e\x91\x10\x17o\xc8\x9eq\xd2%\xdf\x22\
-=\x88\x88A\x16\xc5 3\x0e\xf2\xa0k\xbf\x8a\xba~\
-\xf9\x1a\x1d\x10f\xf7|~A\x0eO?\xe8E\xf9\x1c\
-\xbdM/\xb8q\xa2\xde\xa1\x1f\xdf>\xa8\x97\x1e4\xbf\
-\x90\x97'\xc8\xfb,\x93\x19}%\xd3\x04\xed\x00N\x02\
-6f\xc6\xbf\x91t\xa2\xc4\xc7\xcf\x7f\xee\xba\xff8\xe9\
-\xea\xa0\x10\xdd\xb3\x8d\xf7?\xf3)~a\xd7\x13$\xf9\
-\xd6\x1f\x0d\x8fW\xef\xab\xc5\x86\xfa\x95\xfb\xe5\xe0U\x0f\
-\x8f\x98\xa0^\x9b,\x8b\xdb\xae\xe2\xceLB\xfb\xad\xab\
-~\x10}\xec\xaa\x7fm\x14\xdd\x0d?\xf7\x8f\xa8\xfc\xee\
-5\x0bQ\xfc<\xf5\xbe6\x12\xa2\xd6x\x1a\xaeV\xf5\
-I8+\xd6[\x0fc\x19\xe4Z\xe9\x11\xc7q\x02T\
-5'\x00\x87\xe5\x04\xee\xab\xe6Hf\xfa\xb5\xa7\xd7|\
-\x91`\xef\x89\x97\xc1\x9aU\xdf-c\xd9\xaf\xf7\x8c9\
-\x81\x0f\xceS^\xfa\x13\xb8\x11\xfdhO\xfah\x8f\xfa\
-q\xfd\xbd\xbcJ\xaf*\xb4\xe6\xf9\x0c\x035 \x02\xb6\
-e\xde~k\xf6\xda\x02\x94\x80\x9f\x00\xff\xfa\x97\xa5\x07\
-\xca\xd5\xa9\xa2\xfeU\xfd\xb9:\xf7\xd8\x170\xbct\xaf\
-\x14\xaa\x87\x0a+5\xb3\xe8\x83\xc2\xa2\xa5\x98x\x17K\
-\xacj\x1d,\x07\xe2\x19/\xf8[\x9e\xf72\xb1\xd1M\
-D\x0b\x1b\x87\xed\xfa\xa7\xec\x88\xee\xber\xdf\x95\xe0\x1f\
-W\xf7z4\xa1T\xa74\xe6\xd6\xbb\xa3K'O\xf8\
-\xc2\x0d\x87\xa9ze\x1b\xb0'{\xd6\xbe\xcf\xce\x97\x97\
-\x88\xece\xe0\xbeK2s\x10\x88$}\xa4)\xdd\x1c\
-i\xde\xa4\x9a\xce\xb2U\xc8\x1f\xff\xd4s\x1a\xca\xa0[\
-\xdb\x89\xeacN\x84u\xe9\x07\x85\xa4\xc7\xcd\xea\x15\x7f\
-\xf4\xfa\x8c^\x8d\xa3\xfa\xf5\xe9\xef<\xae\xcb\x8c^3\
-\xc3\xdf\x04l\xef0\xf8\xcd\x19\xcc\xf9\x16\xf0N\x0a\x04\
-Wlx\x8b\xfb\xc8m\x8fw\x7f\x1e\xff\xb3\xbf\xe2\xff\
-;E\xdf\xb8\xfc\xf4d2\xa8\x07\xa3AP\x1dW\x99\
-\x1d\x8eWfJIe\xd6H\xbc\xe2\xad\xa9'Rp\
-\xa5\xe9\xcd\xfb\xaeq\x8f2f\x1b\xe6\xc8\xa3^\xe1\x7f\
-1\xfe\x07\x1a\x0e\x15\xbe\x19\x08\x913\x05@)\xd6\x0e\
-\xbb\xaa\xa3\xf6\xab\xe5\xf5\x07\xbd\xcaQ`}\x06\xbf\x06\
-\x9d\x16\xd9/\xfb\xae}\x92x\xddl$\xcf\x8bk\xce\
-\xae\xd3\x0b\x12\xf5\x8b;\xbb\xd9\xd1\xaa\x1cS\xb7\x19X\
-p\xe2\x01\x08=<b?<}\x22\x98\xdf\x0c\x88\xd3\
-e@\x8f>h\x83+\xdfG\xbb\xe33\xa3\x0f3\x5c\
-\xbf\xb1#\x88\xdd\x05\xec\xcc^_\x04>\xd9\xf2\x90\x97\
->Z\x82\xab\xef\xd3\xad6\x92J\xa9\xa1\xc7\xb6N\xc3\
-=K\xa7c\xe5l\xb0\x07\xf0q\x8c&!p\x0a\x98\
-S\x11s2CS\x7fL\xb8n\xb1\xb8r'\xd6\xa4\
-\xf5\xb5\xc5\x12\x85\xa5\x0a\x1fp\xa9\xa0a?\xf0\x00p\
-?\xc5\xa9\x834\xe6\x0a\xc0(0\x07\xec\xcb\xce\xd1\x0f\
-H\xf1\xf6\xdbm\x07);\xed\x07m\xb4OL\xd5\x8f\
-Z\xce\x8b\xc9r\x17G/\xc9\xc2\x89\x18\xce\xa0\xd2\x00\
-\xe9\xb3\xb2\xa5\x87t\x22/\x80\xcd\xcb\xd2\xf5\xc3\x9f\xdd\
-\xb6\xf2^\xa3\x89\xf2\xae\xb9\x94\xe1\xe8\xc5\x8c\xbe\xdc\x95\
-a\xfb\x1d\xd9\xf7\x9b\x80\x1b\x80\x0f\xae2\xba\xfd\x87\xd5\
-\x13\xb1\xa0N\xab1\xc2l\x0d\xf0[\xd2\x0ed\xc9Q\
-\xf0\xcd8a\x1ct=\xf8e\xe2\xcaO\xa9\x1f\x8b\x9c\
-\x87\xd8A\xec\xa1\x1eQ\xd7\x949:\x1bX\x00\x96\x81\
-E\x5cm\x06\xa8f\xe7=\x06\xcc\x90\xafs\xca\x8b\xa5\
-\xa4\x0fa\xd1\xe9\x9cz\xed\x16y,M\x1ei2\x88\
-\x1cem\xa9h\x9e\x0cF\xe9\xe2\xc9\xf2:\x1c\xf4\xf2\
-\x88\xd2' \x1a\xa4/\xbd\xf6\xe1\xc7\xbb]\x00\x03p\
-\xf5\x83VSiN\xa0\x94\xb7\xc0\x83\x0e\xa3\x1f\xc9\x8c\
-}[\xf6\xda\x9e}\xdd\x03\xfc\x0d\xa9B\x9e\x1e\x8b\xad\
-\xf9,J\xd9\xb1V\xb2\x00\xb9\x91\xbd\xcf\x03\xc7\xb2\xd8\
-am!\x8f\x05\xae\xca\x82\xe6r\xf6\xb5\xf9}-{\
-U\x80\xe9.\xf9\x95^\xc3:\xba9\x98~=\x86N\
-d\x18\xf7\x89t\xb9&\x07\xd2\xd2\x07\xe6vc\x83V\
-eO\xf3\x1a*\xe5Qw\xddp\xb1\xefA\x93\x0d\x02\
-K\x06i\xf6\xdak\x15\xeb\x00\x01\xf4o\xb2\xbb\xe4=\
-\xd8\xd1\xcc\xc3\x96\xba\x18\xfd.\xe0z\xe0\xaf:\xe8\xc4\
-~\x0bI\x80\xa5\xccS7\x0d\xbfi\xac\x873\xc3\xef\
-\xd6\xa7\xbf\x06\x5c\x99\xc5\x11\xe5\xec5\x94\x1d\xb3\x06\xd4\
-\xb3\x9f\xd9\x1e\x0c\x9b\xf6\xc9\xe5\x0c\xf2O\x18X\xe7\xd3\
-\xd5i\xf6\x0b\x8a\xa5\x8f\x0dt{\x96\xda\xeb\xf3M\x1f\
-\x9aI\xfbx\xd9n\xc6mz\xacF\xdf'X\xf6\xf4\
-\xef\xeb\xa3\x1d\xc1$\x1c\xdf\xa3~\xed\xb1\xba-l\xdf\
-\xf1Z\xfb\x1e\xd7\xc3+v\xbb\xe6&mi3C\xdf\
-\xdea\xf8\x9b\x81{\x80\x7f\xca<v\xbfX\xa6y\xcc\
-03\xfaz\x87\xd17\x7f\xbf\x92c\xb4!\xf0\x9fY\
-\xac1\x92\xbd\x863\xcf\xdfd\x99\xd2\x16U\xdd\xbbP\
-\xf42`\x19\x80\x0e^\xeb|<\xbd\xa7\xd8t\xde\xff\
-^\x83\xc2{-\x86\xce\xe3\xf8>\xce9\xef\xfb\xe3\xa0\
-N\xb7m\x22\x0f\x0a\xe8\x00I'\xa1\xf7\xf4\x12z|\
-V\xaf\x1b\xddm\x1aI\xaf\xf2\xc4^\xe3;;_\xdd\
-*\xcb\xcc\x80\xf4\xe8hf\x9c\xbe\xc3\xd8\x9b\x9e\xfe\xe4\
-,\x98\xfc\xc7laH\xc7\xa5e\xe3\xbeM/\xda\xd4\
-dF\xda,\x1el\x9e\xa7\xcb0z^\x1c\xa3\xc07\
-2\xaf?\x9a\xbd\xc6\xb3s\xacg\xc7\x1ci\xfe\xad\xc9\
-\x9f\x14\xa9=\x8c\xdb\xf4\xc9\xd2\xf6\xab\x7f\x86\xee]\xa8\
-\xb5\xc7{\xe9\xc3\x0c1\x00\x13\xa9\xbd0j\xbf\xc1\x0a\
-:\xc0\xaa\x1f\x04g\xe7m=:`\xb2\xecD\x07\xc5\
-\xf5\xeb\xa3\x7f\x22\x89/\xb5\x18\x19\xa58\xbc0\xe1\x1c\
-\xcf~|\xcc\x97n\xd9Fui\xbbA\xb7{\x89\xb7\
-#\xb2\x1b\x98e\xbc\xf4\xe7\xcc\xdd3\xc3\xe5\x17\x87\xdc\
-\xf7\x1cle\x93AD5Y\xcf\xd0\xcc\x0c\xc2:]\
-\xe6\x8d\x5c\xfa\xe4\x9a\x89c\xb8\xe9\x064\x9a\x1a\x0f8\
-VU\x12\x89\xd8Tp\x5ct6\xc1\xd7\xaf\xb7\xe2\x09\
-\xbd\xf5\x1a\x96\x98{\xd2\xe31\xb5T\x8akj5\xa4\
-TB\x8f\x1d\x838\x86\x0d\x1b\x08n\xbe\x85kku\
-.Rd\x1c\x98\xc0\xe9X\xe6\xf5\xeb\x99\xe7\x9f\x14\xcc\
-\xccKx\x979\x1d+?\xe3\xe3jA\xeea\x86\x07\
-YT\xce|\xbbP}\xd8\x10\x8e\xc3}\xff\xac}\x9e\
-w\xbfa\x19\x83\xe6T\xfa\x91\x08\x83\xe4p\xf2\x02\xe8\
-\xaet\xab\xacau\x06\x19\xd9\xd9\xabx\xbc\x9f\x88+\
-/\x9a\x1fD\x92\xdc\xad\xd4\x8f\x13\xe4\x9e\xf3\xb2\xc2y\
-\x89\x93&TK\x03\xc7\xcbw\xafp\xddC[\xa9%\
-;l\xe4O\x16\xe4\xe4\x04\x7fr\xf6\xb7o\x04\xe6\x9b\
-\xbb\xe9\x05l\x93Q\xb6S\xa2\xa0S\x84R#\x22\x22\
-\x11\xcb,\x05 \xc4P\xc3\xe9W\xb9{\x12\xeci\xd3\
-\x8c\xdf1{ay\x99\x97]aJ\x7f\xfa\xaf\xbb\x5c\
-\xe2\x1e\x9d\x88;\xc3\x8c\xf2/ni\xdd,XMU\
-\xc9\x81*\xce@C\xd3\x0d\x06y,[\xc2\x1b9\xf8\
-F\x8f\x8e*\xfc:\xa30\x7f\x0d\x1c\xcc\x98\x9di`\
-e\x0a=V\xe6\xcd\xf6\x10\x1f\xf6\x9eF\xba\xeb?\xf7\
-\x0c\xe1kw7\x0b\xbb4\xab\xd5\xd0>\xd9\xf3A9\
-{\x06X<\xfd\xe40\xfdj\xb3\x07\xa1_[\xb6\x1b\
-\xe4d^\x07U4\x0e\xeaM\x07\x113u\xdb\xda\xba\
-\xe1\xbaA\xa4\xcb\x83\xce\xd2\xed\xa6\xb1\xeff\xfcM\xa6\
-d\x89\xef\xde\xb7\x1e\xd8b\x0d\xdbm\xc0\x0e\xf1z2\
-B0>\xcc\xdb\xbf\xf46\xe6\xbf\xf6c\x02\x17\x82\x09\
-\xe0\x09\xbf|X\x8f\x99\xc3\xb2mL\xfdW\xcf\x0bY\
-\x1c/q\xc7P\x09\xf9\xfa\x9fx\xbf2-\x8dx\xaf\
-l\x0f~[KG\x9e\xb5\xceP\xadn@\xfd\xec\xc3\
-K\xca\x8d\xb7\x1aU-\x80/\xa9\x98\xc0\xbd\xf7gs\
-\xfc\xf75!\x8d\x9a\xd1\xf2X\xa6\xcf,B\xc1(\x12\
-y\xa2\xd0\xdf\xfa\xd9\xd7\xd4\xd80|\xa3%~\x96\xe0\
-&b|\x13\xee\xcce1C\x0d\x98\x98\xfb\xd3\xf3g\
-\x98[\x10V.\xb1,.\xca#\x1b\xfb\xf4\xb4\xda\xdd\
-r\xce\x0b\xd0bA\xb9\xf2\x06\xf4\x17\xf7\x1eW\x82\xe8\
-\xfb\xb0{\xfd\xd83\xfd\x0d<\xb5\xf6\x08h\xfb\x95\x1c\
-\xf6ZL\xads\x0dr\xa8D\x1d\x00\xde(\xfd\x87\xb7\
-\xf5SX\xea\x80Y\xe3^#7\xf3(\xc8~\x92\x8b\
-n}B\xbb}\xa6\xed\xa0\x1a'\x81\xed\x16\xb3U\xd4\
-oM<\xbb\x04F\xad\xe1Og\x97\xb8\xefM{\xce\
-\x0a\xcd\xee\xb2\x8f.\xda\xe0\xe5\xbc\x9d|\xfc\x9f\xce\xb0\
-\xee\xd8C\x81k\xccXf\xa3\x22\xb3\x8d\x10\x13\x07\x9c\
-|\x83\x10;C\xac\xe6`\xfd6O\xb5\xb8\xde\xf8\xfa\
-Qm\x8c;\x0e\xec\xf3\xa5;\xee\x03\x5c1\xc1\x04\x94\
-\x86#\xbe\xffo\x1bq\xb3\xc3X\x15bQ\xc4\xa4)\
-\xab8Q\xacWlQ\x1b\xaf\xf8\xa9\xe3\xa2g\xdc\xc1\
-\xf5W\xbd\x14\xaf\xe3\xa8\x1f\xcf\x0c\x7f\x14\x98\xcd\xe2\x87\
-x\xdd\xa7n\x9c\x8a\x9e\xf3\x9f\xb3K7K\xc0\xf2\x11\
-o\x8e}I\xcf\xdcp\x9fy\xe0\x94#2\xb7\x8c\xfa\
-d\xd5\xb3\xf49\x98\x1czW\xeau\xd3\x05\xf5\xe3\xe2\
-a\xb0\xb9\x0b\xfd\xbax\xe7\xc5\x9bJG\xb7\xe4~\x89\
-\xa0\xb5F\x91W\xb8\xc1\x09r\xac\x9a\xc3'\xcb\x00\xc7\
-\xa4K\xd2\xa23X\xf2}`\xd0\xda\x85n\xba\xec\x00\
-C\x19m9\x02l\x0f0\xdb\x12\xfcv\x08NFd\
-\x9a\x0d\xdb_\xeb\x0e\xdew\x88\x7f\xb9~\xe8\xe6\xeb\xbf\
-R\xe4\x9e\xbb\x87\xd8S/S\xbd\xb5\x84\x1c\xb2\x04%\
-\xa5\x18\x80)\x19(@`\x0c6RF\x87\xd2\xa6\xaf\
-q\xd2\xe0\xe8\xc8\xb0DQ\x5c4\xeb=\x95}:\xa5\
-\x07\x83y\x95\xa2b\x8b\x94\x87g\x09\xc7\x86\xd9X*\
-\xa75X\xda\x9a\x1eDRW\x88\xa10&4P\xc6\
-m\x8d\xbd\xd3\xd7\xb10{.\x8dd&\x838M\xb5\
-h\x03h\xac,\xd9\xf1\xfa\x97\xdf\x19\xf1\x9c\x7fk\xf0\
-\xc7/v\xb7}y'w\x7f\xfaV\xefw\x19\x92\x9f\
-\xa9\xf8\x11+\xf0~\x07\xb3\xc2`\xa20\xedc/y\
-^\xdeu\xa1z\xb5O\x5c\xb0\x966\xcf\xeb\x9e\xdd\xf5\
-<\x825F\xe9sNb\xad1t3\x1c\xd3\x83\xad\
-8\x115\xa5\xe7\xf8r\xc5~\x9e{\x90\x8e\xcby\x10\
-\xadu\xcd&\xed\xb2\xdd\xa9\xc1\x19\xcb B\x09\xd8Y\
-\x0cd\xbbKt\x1b\x04\xdb\x91`\x1d\x1b6\xbf\x87\x0b\
-\x9f\x18\xf0\xf8\xdf?\x9b\xa4a)\x17ax\x93g\xdc\
-\x0aa\x00\xf5Dq\xd90+U\xd0@Q\xe3\x18\x1a\
-6`\xc0\x17\x0dT\x84*AP\xad6\xc6\xec\x90\x02\
-R\x9c%$\xd0\x02\xce\x0cQ\x1a\xdeK\xe2\x020\xe9\
-\xe4p\x00k\xb3\x91\x9c\x06\xa2PaH0\x81ay\
-\xae\xc4\xe3~\xfb;|\xef\x0bO\xed0\xfa\xb1l\xf1\
-V\x80\xb8>24\xc4\xe6\xf1\x1d\xec{o\x81\xb7\xfe\
-\x8b\xf7#\xa6Z\x7fr\xb4\x02g\xae\xf0\xb4\xf51e\
-\xef)\xbc\x09n{\x9b\xff\x8b\xe7\x22\xef\xfe\x1a`\xf1\
-\xd9\x18\xb6f\xeb\x14\xed\x92\x0f\xea\xe6]\xf3\xb4:\x9d\
-\xf5 :\xa0C\x83\xde\x8d~{\xd9\xe8q\x8b.\x18\
- \x9a\xeeu1: \xc5\x94\x97'\xc8\x0b.\x19\x00\
-\x02\xf5Z4\xab\x16\xe1\xd9L0\xc6\x88\x5c[:\x00\
-\x17\x9e*\xac\xd4u\xcb\x86\xfd\xa6x/\xba\xf7\xfe\xf4\
-\x86?\x96-L\x13\xeb$V\x5cp\xaa\xdc8\xf6s\
-\x7f\xdf\x9c\x1fEN\x8a\x18\x191T\x0fn3\xae\xb6\
-\xd5:\xbf=\xc6\xec\xa0\x10\x9e\xc1\xbam\x1f\xe3\xbc'\
-\x1f#\xd61&\xca\x82\x18\x87\xb5B \x825`D\
-\x90\x95\xec\x81\x0a\x88\xa4c3\xf1P]V\x82\xf1\xb4\
-\x1fr}F\x88+\x89\xaf'\xc9\xc3\xa3\xd3N<\xb8\
-\xb90\xf0..\x22f\x94\xc9\x93\x8eRs\x16\x97\xa4\
-\xc7R\xcdj\x884\xed\x9a\xe6\x02%\xa8y\xd4\xa6E\
-\xe9\xb1-3<\xf1\x1di\xd4\xceS\xcf\xd1\x0e\xe3_\
-\x06\x1a\xc5\xb2$\x8d@<\xd3\x93\x09\x13\x93\x16_\x1b\
-f1\x1af\xfe\xfe\x8d\xb8{c\xd0\x06\xeb\xc2\x06\x97\
-\xbd\xba\xfe\xc1\xe9\x0du\xf6\xff\xdd\x0a\xdc,\xbc\xef\x83\
-\xf0\xaf\x9f\x95\xcbv\xaals*?/\xc0\xf2.4\
-\xb9\x1f\x8e\xde\x85\xc2Er\x1a\xeb\xf507\xb0\xc4!\
-\x06\xc0\xecyX|\x10\xf2\xa3\x9fC\xeb\xb9\x13\x05\xe4\
-7_:\xd1Q\x9a\xfd\x02\xd9\xdfD\x8f\x9dGm\xf6\
-\xe2\x9bW\xbdg\x8a1\xd9\xc9\x84\x5c[>\xa2\xec\x1e\
-\x81\xf2$s\x9f\xdb\xef\xcf\xab\x9e${9\xc4\x15\x9c\
-A@C\x968\x8f\x1b\x98 L\xbc\xde?\xefK@\
-\x82\xce\xc6,\x1f\xd9\x09\xba]a[\x02\xdb|\x10\x9e\
-\xc3\xceS\xff\x8e3/\x98Al\x01UE\x13m\xed\
-\x11nM\x82I\xa4}]\xa1\x11|,HE\x09F\
-\x850\x11\x0e\x1f*\xa0\xf58\xf6$\x0f\xac/\xaa,\
-BT5\x05\x07\x01A0\xc1\xee\xc7=Lcq\x82\
-p\xd5f\x9cZ\xbf\xcdJH%J5\x87F\xc1\x96\
-\x0a\xec:\xe7v\x9d?|>\xe8T\x86\xef'\x81\x19\
-\xd9=\xd9\x9886_?2?[ba\xde\x10\x0c\
-\xc3p\xd1`&\x95\xcd%\xa1\x1e\x07\xd4\x13\x0b:D\
-]\x5c}\xdfA\xe1\xc5\xbf\x9309\xbe\xc2\x13\xaf\x98\
-\xe1\x7f\x9e\xd7\xb8\xe9\x1f?\x09\xb7\xdf\xc5\xab\xcf>\xc0\
-R\xb1\xc6\x7f\xdd\xb3\x91\x19\x8e\xe0\x9fYg_rT\
-\x92\x9f,+\xb5\xdc\x82$r8\xfa^\xf6\x94\xd7\xbe\
-\xdd\xd0\xbf\xd0\xe98V\xa7\xd7I\xf8\x1c\xdd\x0c]\xb6\
-\x16\xfa\xd0V\x83\x04\xbb2\xe0\x8a\xf6}\xd2\xeb\xabn\
-z\x8c\xe7\xb3\xdc\xa6\xcc\xa3|\xea&5\x14\xe5\x05\x5c\
-h\x1a4x9S\xf2Y\xf6z\xb6\x7f\x00\xb6\x1f\x15\
-\x0a\xb1\xe1\xee\x9f[\x0ebB\x82\xca\x88eg\x14\xfa\
-\x9d\xb1c{\x94\xc8\xf6(\x0cOf\xc3\xa6\x8fr\xfa\
-\xb93\xf8B\x808M;\xc5d\xa7a\xcc\xea\x07\xa8\
-\xda\xdev5\xeb\x05\x95v\xbd\xcf\xfe\xd6xj\xb52\
-\x89\xab\x02\x8e\x91\xa2\x02D\xaa\x05\x85\x22FV(\x05\
-\x02\x81v\x8c}n\xd3\x8e\xa2\xd2\xfa\xb9\x006P\xa2\
-\x86ez}\x9d\xd2\xe8^\x1a\xd5I\x92\xa4\xe9\xf1\xc7\
-\xf8\xdd\xd3\x8f\xfa\x0f\xdd\xda\xa0\xe4c\xaa\xf3\x01\xf5Q\
-%\x19\xf1\x18\x84\xc5\xc8\xa3N\xd2\xf3\x0b \x8c,.\
-t\x8c\xed\x08\xa9\xafL\xf0\xc5\xffX\xc7\x17\xa8\xcdl\
-\xdar\xec{\xbf\xff\xe2\x95\xc7}j\x9f\x1b\x9d\xfb\x09\
-\xcf\xa6\xa6\x9f\xa5\xca\xe1\xa1:\xe3\x17?`\x1aG*\
-~\xe9\xa6\xdcg\xdc\xcd\x93\x9b\x01\xecePx\xdb\xcd\
-\x9e\xfcZ\x8c\x9f\xc7\xc1J\x8f4y\x9e\xb4aP\x99\
-\xaa\x0c\x90\xb0\xe8\xc7\xd3\xf7\x1a\xd7\xb9j!\xfe\x82\x87\
-\x15R+\xda\xcd6vr\x85\xdc\xc6\xb2\x16\xb1T\x87\
-\x8f\xc0+\xf6(\xfb\xdeUf\xe1\xc61\x0e<\x5cf\
-]\xb8\xcc\xa1\xc7\xce\x8d\x857mm\x98hG\xec\xd8\
-\x96x\xb6J`\xce\xd0\x0d\x9b\xbe\xcb\x85\x8f\xbf\x83(\
-(1\x12\xc2JC\xb0\x81\xe2\x9b\x06#\x8as\xa6e\
-\xe8\xe9\x5c\x92\xeck\x13\x1e\x9bL \xe1\xd3\xea\xd9\x85\
-\xa5\x12\xb1_\x00\x1c\x0b\x93\xaa N\xb5\x00\x94\x09\x82\
-c\xd8(\xc4 \xc4\xd9\xb3\x13\xe9\x88\x19TZ\x8b-\
-\xfdl!(\xa6\x0d\xbc'\xd6\xdd\xc7\xec\xe1\xa7\x90$\
-c\x05+\x13\x91\xd3I\xbdz\xdf\xc2\x18A\xfdX\xa3\
-Vgf\xb1Di\xd13\x1e\x1a\x86'\x0d++\xd9\
-bT\xc1\xc7\x10\x86\x9e 1\x84\x93\x16?\xaa\x8c\xac\
-\xf7DI\xc8\xf2\xe26\xae\xbd*\xf9\xdb\xd3\xfc\x22\xc3\
-S\xcb\xb2\xeeiU=\xd8\x887\x7f\xe15\xbc\xe6\x9e\
-i\xbdq\xdf\x18W\xb1\xa8\x03\xc0\xd4A\x9e\xfb\xa0\xd3\
-v\x06\xa1\xc8[\xb6fY]l>H\xc6\xb6\x1fM\
-H\x1f1X?O\xbf\xb65\xb9\xc9\x91=\xf4c\x8c\
-\xd6\x5c\xc0\x90x\xf3\x02\xee\x1f\x8b\xd9\xff\xc8\x97\xc9\x81\
-\x0f\xbdA\x8f\x8e\xec+s\xe3\x07\xb6\xb2\xb0w\x9ad\
-\xa5\xcc\x88\xcc\xf2\x88\x9d\x0b\xdc\xfe\x8bu&\xa8\xedJ\
-<;\x13d\xbb\x97\xd2\xf9Lm\xb8\x92'\xfc\xee5\
-D\xa6\x08c\x827\x8a\x8f\x05\xad\x09\x12\xae\xbe\xc9\xa9\
-\xd1gX\x9c\xf6\xf7J:\xc7\xcf\xd5\x15\x19\x16\x12\x9b\
-\xf0\xc0\xed\x13,/\xce\x83_`\xe1\xdc\x18n\x94\xd0\
-\x98\x93b\xfc.\x1d\x9e\x98\xe7\xe4\xdd\xb3\x88M'\x85\
-\xa3\x92\xed\x22\xedkVm\x7f\x9ef\x8c\x8f\x22\xec<\
-\xeb\x00\xf7\xdfz)>\x8e\x03\xa35\x1f\x9a*\xf5\xa4\
-\x92T++\x0b\xf6\xa0\x9f\x00\x00 \x00IDAT\
-\x91\xab[\x22BJ\xa5\x02\xa3S\x10\x8cZ\xa2Z\x1a\
-\xbav6\x8fU\x85\xc2\x88\xc1\x06BP\x10\x0aE\xc1\
-\x16=%+\xac\x1b\x1e!\xb0\xe3,\xdf2\x01s:\
-\xf2\x94\x9bVN\xfd\xf6\x98\xd1z\xa4\xb7ro?\xe1\
-\x9a\xe4H\x13\xf2\xf2/k\x93\x99\xac\x91\xac\xf4\xcb\x07\
-\xb4Dj\xfd\xe6\xcev\xfbj\x18\xbcH\xddwag\
-\x0c\xf9\x9a\xedA\xe6\xe8\xea\x00\x99@\x03\x98\xf3\xcf\xc7\
-\x14\x8b\xe9\xc8\xa9\x99\xb1\x22+\xaf\xf8C\xc3+\xe6\x02\
->\xf5\xb2m\xdc\xfe\x8bS\x19\x9f\x1efb*`j\
-\xeb\xc2\xfa'\xedX8\xf9'_\x18C+\xdb\x1b\x99\
-\xa7\xf7\x84\xa7\xb3~\xcbU<\xed5?\xa7\x22E\xfc\
-\x88\x80\x05oS\xedW\x9b\xe0\x10\xbcO\xaf\xc1\x18\x7f\
-\xdc\xdaS\x95lh\x0f\x14\x83lJ\xb8(qb@\
-#\xa6\x0a\xca\xe3/\x01\xb0\xaaZD\x18cr\xe2 \
-.\x0a\x111\xe0S\xefn\xcc\xea\x1eG\x22\xed\xeb\x16\
-Q\xc4\x80\x09\x85p<`x\xf4\x97\x88\xdd\x802&\
-^\xc7\x91\xe2\xe42\x04\xeb\xe2B\xc4\xca\xd1:\x0b\x8b\
-\x9e$\x12\x8c\xa4,Q#\x01\xe7\xd2\xa1\xcda \x8c\
-\x97\x0d\xf5Y\xd7\xf1\xf2P\x85\x92\x11\x821\x18\x1d\x87\
-\xf2\xa6\x00\xb7\xbc\xf5\xd0\x9e\xe7\x9e\xfd\xfe\x97\x1e\x19\xff\
-\xf7\xdf;\xcfb\x03\xc0\xf8\x9c\x1c\xd1Z\x07\xe5\xe9^\
-^\xd8k\xf8w?\x86/\x8f\x9c\xf1\x96\xfer\xd9^\
-\x12\xd2Au.k\x0b;\x06\xed\xbf9H\xc0\xbb\xea\
-s\xb6q\x96\x9c\xc4n\xa9\x0c?,\xbbv\xc2\xdc\x5c\
-z\xa1\xa7o\xc5\x8c\x17\xe1\xd0\xf8vx\xc6\x13B\x0e\
-|s\x92[\xae\xdb\x8e-\x0d31\xed\xa9\xad\x18J\
-\xe1B\xe9\xc2\xc7\x1f\x1b\xfd\xf4\xbb\x87VV\xfc\xeez\
-C\xb7\xab\xcavo\xc3\xd3\x19\x9d\xba\x8d\x8b\x9f\xff#\
-\xea\xf1P6\x97PP\x97\x19|\x22\x94\x8d\x90\x88\xb6\
-\xef\x90\xa4\x1e\x18Ii\xc7\x14\xdb\xa7pGU\x10\xa3\
-x\x93j\xe9}U9p\xdfDX[9\xe2\x03\xad\
-\xf0\xf4O\xc6\x93\xb7\xbc\xa7(\xea\xb75Lx*\xa7\
-\x9ds3\xc3\x13\x16k!V\x8e\xdbI\x9a\xd0\xa7u\
-_\xb2\xcf\x0a\xad\x10\xb9\x80\xad\xbb\xee\xe4\xbe\xdb\x9e\xa6\
-\xde-[K\x0d\xe7j6\x0e\x97\x87\xa7|\xc3\xf9$\
-\xf0\x81)\xe8\xe8\xa4e|2]\x88b 0\xa4\xbb\
-\x8a\x82WC\x5c\x05\x17\x0b\xe2\x05q .\x85h\xb1\
-BMA\x02ad\x08\xc6G,\xd1\xe2\x14+\x07K\
-<\xe6\xa2\x983\x7f;)\xdfy;\xbb'\x13\xf3\xe8\
-G\xab\x09&ai\x0e\xfc\xe4%By\x8b\xb0)\xe0\
-I\x17/\x18\x05Y\x9c\xeb\xba\x13\x0c2\xd4\x9b>\xe2\
-\xbd\xae\xce\xdc\x0c@\x15v\xabI\x95\x13\xcc\xbaAw\
-\x9d\xfe B\xb8A\x12X\x02p\x11/`\x09\xc3\xf8\
-8\x9cq\x16r\xc9%\xe9/\xefy\xb0\xe0\x1bg_\
-\xe2y\xcc\x05#\xdc\xff\xa3\x1d\xd4+\x9b\x18;\xc90\
-<\xed\x88\x13!\xa9-\x16\x8f\xee?\xb2\xf1]o\x08\
-\x96\xe7\xfd\x8e\x95e\xd9b`\x9bZ\xfbH\x86'\xef\
-\xe0\xb1\xcf\xf8\x16\x09!\xea=\x9a\x084\x14i(\xbe\
-*h,\xd4P\xc4K\x0br\xa4\x9e\x97\x8e\x80\xb6\xd3\
-;\xa7\xa3\xfc\x1ac`\x9c\xe2\x8f\x86\x04.\x8e\xadK\
-v-\x97\x1d\xe7O2V\xb4\x850\xa4\xa4&l0\
-\xb2\xc1\x93XO\xad\xd6\x1c\xda\xd9\x81\xf3\xa5\x1dL\x0b\
-\xe9\x04X\xcd\xe0\x09\xa2X\x0b5\xca\x8c\xad\xfb\xb6'\
-\xdc\xe6\x1d\xe3a\x12\x8f\x87\x94\xc7\xf5\xd1\x91\xae\xdfH\
-\x5cj\xcc6\x989\xe4\xa8\xcf\xa6\xa3D\x0bF0&\
-=\xaeS%\xf2\x0e;\xa2\x04\xc3 %E\x0b\x82\x96\
-\x14)\x828\xc5\xc6\xe9\xbd\x88c\x88\x9c\xc7\xdb\x98\xd1\
-\xc9Q*\xd5\x1d\x1c\xbcmk\xfc\xfc?\x93`\xd3\xa4\
-\x8e\x8c\xc0\x05\xbb\x91r\x08\xc4\x8b\x10]\x02KC\xac\
-\x9fD.}J\xfeh\xce\x1e\xb66H\xd2\xab\xa7T\
-\xc5\x0c\xb0:\xb4\x8f\x10hP\x95c^\xa5~\xaf\xe1\
-\x13\x83\xd4\xe3\xb6~\xffE\xfe\x9ac\xc15<\xe5|\
-\xcci\x11\x94\xcb\x18\xd8\xc8\xc1\xff\xf3m\xd93\xbf}\
-\x1d\xfb\x8e\xee\xc0\x8e\x84\x14\xcb)+\x92$B\x03\xd0\
-M.Z\xd8\x18>h\xc6v,\xc5C\x9b#\xc2m\
-.(\x9c\xc9\xd0\xf8]\x5c\xfe\xec\xafb|\x01\x96M\
-\xa7\xd9e\x9e\x1b\xc4d\x1c\xbd\xf5i\xb3\xee\x96\x87\xef\
-\xb1\x19g^\xdb9\x83\xe0Y\xae\x068\x8d\x86\x5c\xe0\
-\xd63\xac\xfc\x1e:\x17'\xc5\x86\xa7\x80\x0d+4\x02\
-\x8bO\x0c\xde\xaf\xe1(<\xad\xc5\xd5\xbc\x0db\xb4\xb5\
-\x18\x9c*>\x01M\x0a\x9cr\xd6\xad\x04\xa1uNF\
-\x15F=\xc9\xd8\xf2\x01\xc2\xf1\x09\xa2\xea\xb2\xd4\xa9\xd5\
-\x95\xc5\x85\x0e\x81Zk\xc1f8\xdfK;w\x90\x05\
-\xd6&\xbb\xee\xe6\x8c[cR\xdaV\xbd\xd0\xc0a\x86\
-\x85\x91\xe1\xf1d\xe6\xbaS\xf7\xfc\xce\xdbK_3\xaf\
-\xf5\xfb\xef\x1e\xf2\xaf|*\xe6\xf9K\x01\x17\xadL\xc3\
-\xec\xb2~\xf1\xf3\xb8\xcf\xdd\xb9C\xbb$\xa8\xb4\x0f\x04\
-\xf6}\x90\x87\xe4\xd8\xb1\xb1'(\xea\x1aD\x8a<\xc8\
-D\xc0~z\x8b\xbc\xa0\xb7W\xb9\x22O}*\xe6\xcc\
-\xd31gX\xf4\xc1\x0ar\xd55g*\x17\xbdUx\
-\xe0;\x9bq\xc9F\xd6o\xf3\x94G,\x84\x82\xf3\x8a\
-\xb1\xc2\xd0\xa8\xd0X(\xe3V&\x98\x5cg\x18\x0aC\
-\x8cl\xa0X\x5c\xe6\xa2']IT\x19ah\xdc0\
-:\x04\xde\x08>\xd6\x16\xa4hz\xdd\x94\x9e4\x1dt\
-\xa3\xac\xf2\xca\xcd\x9f\x19\xd3\x0cD\xa1X\x06_\x15\x16\
-\x8e\x968z,\x9e\x8e\xe29\x19\x1b\xad\xcd\xbc\xf5\xcf\
-|\xf2\xce\xbf\x99R\x91\x1d\xae0\xaal9\xf3\x18\xe5\
-@@\x15\xb5k\x8e\xabiLa\xcc\x9a\xcf\xcav\x9e\
-\x82f#\x87\x12\xc3\xfc\x91\x12\xae~\x92\xa8_\x11O\
-\xadQ\xb3\xd5\xe1'\x94\x96\xe56c\xeb\x14B\x8a\x04\
-L\xad\x17\xd4\xc8\x1a6J:\xa8Yi\xc5\x13\xed\xdd\
-\xad\xd3\x19(\x82\xd0(\x80\x84\xc2\xc4\x98\xa1X\x0ax\
-\xf0\xce)J\xdb\xea\xba\xe1\xb2\x86\xb9\xf2!?J,\
-;X\xc6\xf3L9\xc4\xc5Bx&\xcc]\xdb\xcf6\
-\x06\x15\xb7\x0d$\xb4\x0c\xfa\xc8r\xf3Tu'\x92I\
-c\x00\x09p\xbf\xceZ\xfdFq\xcam\xb7\xa1\x17_\
-\x8c\xdc2\x0b\xdf\xbb\xffq\xcaG?\x0f\x1f\x7f\xd3v\
-\x0ac#LmU,\x96b\x1d*^\xa9ye\xac\
-a\x18*\x19\xc2-\xca\xe4\xb4@\xa4\x14\xce\x98\x85\xe4\
-\x87,{\xc57J\x8c\x8d(*B5V\xe2Z\x8a\
-\x81\x9bP\xa2\x85\xdb=h\x13\xbf\xcbj\xae\xbdi,\
-\xaa\xed\xef\x9b\xec\x8e1\x9ejCh\xb8d+\xa1;\
-V\xb4>s\xe6\x85XL\x89\xf2\xc4\x0aa\xd90\x84\
-\xb2\x1cw\x81y\x92\xf6KN\xb1x\xfb\xb3\xc5\x80w\
-J\xb5\x01#\xc3\x06Y\xe7\x98\xdex?\xb5\xa5S\x5c\
-\x94\x8cB2\x86\x93\xf1\x07\xee>i\xf6<j\xf5\xda\
-\xd2\xa1z}!.\xe1\xce\xb1\x98\xec\xda\xda,Q\x13\
-Z\xb5\xf3\x05\xea\xa5M\xa9v\xecd\x92^\x18FI\
-w>g(\x94\x94\xf2:e\xfe\xc1\xad\x0f\x95\x86\x8f\
->\xf4\xe6\xf7\xccl\xfa\xd2\x95\xf2\xa4\x07\x7f\xa4\x17Q\
-\xe6&n\x01s\x05\x03\xd0\xe1\xdd2\xf4yj\xde\xdc\
-D\xaa\xf9\x0d\x8dY\x07\xc8\xea\x9e\xe8\xa2\xe8\xb6B\xbb\
-MZ\xec\x15\x13\xe8\xd1\xa3\xf0\xcdo\xe2\xbe}\xf5)\
->\xbe\xf0\x1d\x9e\x8f\xbf\xe9\x14\xb6n\x1ecz\xdc\x90\
-,)\xc5Fz\xc9\xc6\xa4\x86\x18U=\xcb\xcb\x8e\xc6\
-\x82b\x0b\x10\x8cB`B\x5c\x5c\x84\xe1\x22\xa5\x11\x9f\
-\x0d\x9a\x87\x95X\xa9\xf9\xd5\x9e>5\xe6\xce\xb3I\x8f\
-km\xb6\xed;\xe9`\x5c\xe8\xc0\xfd\xcd\xee.J\x14\
-\x1b\xe3%\x19\xc28\x1d-\xc0{\x9em\x81PMP\
-\xa04Rgd\xcc\xa3\x91 J\xcf\xdc\x85\xd7\xe6\xf9\
-\xe8\x9a[\xa2\x04\xa2\x8cL\x18\xcex\xf4\x83\xd80Q\
-eL\xd0q\x1c\x13<tl\xfcr\xb6\xc5\xeb0Q\
-aq6\x22J\x0c\x98\x0eID\x07c\xd42z\x15\
-l\x90\xcdb7\x8a\xb5\x1ek}\xfb\xefP\xcaN0\
-5X\xaa9\xe6\x1b\xa9\x94b\xf3:\xc1\xd6O\xe2\xa1\
-\xeb&\x0f\xbf\xe89\x5cKBp\xf1w\x04\xf6*\xf7\
-~\x80\x9c\x04W\xde\xb4K!\xbf\xe1@\xcf~J\x96\
-\xee\xad4\xe8\xc1\x9f\xf7\x83)\x83dS\xfbq\xb40\
-\xc0\xd0\x85n\xc7\xda0\x86,\xeb\xff\x12}\xd5[\x85\
-\x07>\xb2\x85\xd1\xf1\x11&\xa6\xd3\xf1\xc1q\xac\xd8\xcc\
-k\xa5\xbd9$3~%\x0e \x12\x8fO\x94\xb8\xe1\
-\x89\x12\xc1\x86\x02\xd9\xd0\xf9Z=\xe5\xb7\xd5\x835M\
-H#-6\xc5\x98\xf6y\x8a\xa4t\xa0d\x98\x9b\x0e\
-~=5\xcc\xb4\x8e\xa4\x18\x1a\x92\x8ar\xe8\x81\x92]\
-Y\xacl\xf3\xe1\xfc\xd0\xca\x96\xe8\xc8\xec\x03\x81?\xb8\
-\xb0\x09S8\x89\xf5\xdb\xe7Y\xbf\xa5\x06\x15\xc1\x1b\x8f\
-\x84\xdaZ\xb4\xad\xa4\x18\xd9\x90{\xd3L\x90I\x9bH\
-V!,\x1b\x0a\x81\xa1`\x12\x0e\xecs\xd4\xaagX\
-\xd5%\x15\xad\x11k\xad\xe1\x92\xc5u#59L\x14\
-\xba\xf2\xa6\x12\xe5\xa22<dI \x95\xa5yA\xac\
-f\x18\xbe\x1d\xdf4\x17\x81\xf7M\x0aWZ\x8f\xa2\x90\
-\x18\xbcQj\x89\x12%J\x18(C6\xa4<\x02G\
-\x1f\x1c'Z\xaeN\x9f\x19G\x13\xc7\xe6\xb8\xf8\xac\xaa\
-\xf1S*\x87\x0f\xf6.\x0c\xa7\xff\xdcc\xed\x93?:\
-na\xd9\x1e\x9c\xbc\xf41\xea^ig\xe9\xb3*{\
-QV\xfd\xa6\x222\x00\x96\xe39\x17\x10\xdc~\xfa\xb4\
-\x12\xccL\x90\xc4\x1b)\x8f+Q\x1d\x1aQj\x0f\x8d\
-\x18\x92\xccu\x15,\xd8P0\xc5TT\x16$)U\
-\xa7\xde`C\x858el4\xf1\x18\x81@\x84\x82\xa5\
-\xa5\xbd\x915\x97\xdb4B\xd55W+d\x86\xd1\x5c\
-$\xe9\x02\x1c\x0e\x0c\xf5Yxxoi\xc8\xcd-\x13\
-\x0d-\xdd\xe6\x9f\x14\xad\x8b\xae.T\xaan3\xa6\xb8\
-\x8e\xf5\x1bg\xd88\x94\xd0\x88S\xaf\x89\x91U\xc9*\
-:0\xb6v\xc4\x10d\xb9I?\x02e/h\x0cq\
-dYw\xca>\x1e\xbe\xffI\xf8Z\x0dO\x15\xe7+\
-\x07\xa9T\xf6G\xbe\x9eD\x04c\x87\x0f\xd9\xc6\xba\xa9\
-\x80\xf5\x1b\x02\xe2\x92\xd2@\x19\x8d\x0c\xb1\xb4'o\xa1\
-\xa92\xb3y\xfd\x9d\xd4jsq\xc4\x99\xf7\x0f\x8dP\
-\x0c\x05\x83\x90x\x9f\xde\xe7\x12\x1c\xda?<\xbf\xfd\x82\
-\xe5=\xd7\x9f\xedn\xdcs-\x1dF\x0f\xf9\xed\xd7\xfb\
-\xd5l\xf7c\x1ae-\xab\x93Gi\xea\x09@\x96\xbc\
-\xa2t\x1d@\xec\x96Gw\xf6\x1bG*W]O\xc2\
-\x05\x7f \xfc\xfa\x9e\x0d\x98\xe14!C\xf60R\xb6\
-#\xe3\xde;\x82\xb4\xe3b\xfe\xccp\xc4\xfa\x16E\xd8\
-\x825\xd9\x1b\xd2\x04R\x9aHj\xca\x14:iL\x13\
-\xb4\x7f&\xa2mo\xdc\x09\xe04]\x90\xb1#\x0c\x88\
-G\x08=|\x5c\xeb\x91/\x00\x01a`)\x95\x22L\
-\x19\xfc\x10$FVe\x80\x9b\x18\xbf\xf3\x997?K\
-$U\x80j\xa5\xa9e\x93t\xe1h\xc0\xf8\xd4\xf7\xbd\
-\x98\xad*\x8c\x91\x16\xa9\x8c\xa5[\x19Qd|\x83\x95\
-\x05\xa8V<>s\x10Z\x94\xd6mo\xedb\xcd\xcf\
-n\x05\xb5\xed \x1fR\xba\xb6u/}\xc6byp\
-\x0e\xc4x\x86\x02\xcb\x1d\xb7l\xe0\x85/\xa2\x0b\xac\xcd\
-\x83\xddk_~@[\x5c;\xf0\xa4\xaf\xb8\xac\x97\x01\
-k\xce\xcf\xa4G\xb6\xce0X;o\x19 Z\xf7\xdd\
-Lv\xf9\xe5\x9fS~\xf1\xa5I\x02)P\x08\x95\xd1\
-\xa2i\x19l\xd3\xeb*\x82\xb5\xa9\x9eF\xd7\x9c\x86\x88\
-b\xd2\x00\x13\xf5\xedF\x04\xcd\xf76\x8d\xd9\xfb\xd4\x18\
-\x9c3\xad\xad\xbe\x19\xb4fz\x81U\x7f\xaf\xaa\x18\xab\
-\x1d\xef\x07\xafJ=\xf6$N\x024\x1e\xa3\xe4\x00\xe2\
-\x18\x0b\x94\x11\x0b\xd3\x935J%\xa1\x1cJ\x9a\x05U\
-me\x86;\xefe'\xd3\xd2\x02\xaa\x22\x14:\x02m\
-k\x15/%\xce\xfa\xed\x9b\x09J\x01Aa\x0a\x183\
-\xc2\x84A\x8a\x10Dxm0\xb7\x183w4\x81%\
-(\xc5\x86\xaa:0\xcd\x9d+e\x88D\xda\x14gs\
-\xb1\x8bI\xc5z\xad\xdd\xcd\xb7)\xcfv@\x9f9\x83\
-ap~\x98\xc6\x95e~\xfb\x12\x19\xb1\xb9\xcd\xab\xf2\
-\xd0\x86\x19P\xdcx\x1c\x1djzp\xea\xd2\x07vt\
-\xdbf\x84\xfc\x02t\xfap\xf8\xfd\xa6-\xe63Ke\
-\xe0\xa3\xbfg\x98]\xd8\xc0\xc8\x84R\x0cRl\xefT\
-I43\x8e\xcc;\xb7\x0d5\xf3P\xc6g\x89\xa0L\
-\xe7\xa2\xb4J\xfbVy\xd1\xcc\xe36\x1f(B\xd7D\
-\x95\xf7\xdd\xa8>Y\x15$\xd6\x13\xc5\xab\x12%\x12\x88\
-&C\x84\xca\x15\xef\x95\xa4a\x0b\x10\x06X\xabL\xac\
-w\xa8\x93V6\xb6\x19\x98\x8b\xac\xa6/\x9b;Ks\
-\x11\xb6\xe2\x89\x18\x12\xefI\xd4SO\x14+PLJ\
-\x8cN^\x87\x096\x00\x13\xc3E&K\x96QxY\
-\xe4\x82F\xc4\x91cu\x0e\x1f\xf6\xb8*\x14\x8b\x86F\
-\xa9\xf33\xd2\xc1\xa2\xdeK3E\xdd:\x07\xef\xa4\x15\
-\x5ck\xf3V\xfa\xd5\xef\xad;%q\xca\xe8\x8402\
-\x16pp\xdf8\xcf~\xa6^tQ\xee\xe4\xcd~\x08\
-D\xfaH\x9de\x10\xa8s\x22\x8cK?\x83\xcck\x1d\
-\x92\xb7\x8d\x0d\xd2n\xee\xf8\xf8#B\xf9\xdf\xaf\x1ee\
-\xa8d\x18\x1a\x03k;\xc4[\xcd\xbf\xd3\xeeUe\x9d\
-AZs\x9a\xacw\x92\x96\xf8u$\x9dV\x196\x92\
-\x0d\xe3\xecq\xb7Z\xde~5\xb42&\xf5\xbe+\xb1\
-\xd2\x88@\xf1A \xc98Ee\xa5A\x09[@l\
-\x01\x09\xab\x14\x87\x85\xe2\x88\xd0(*\xdev\xb0H\xca\
-*#\xef\x5c\x94-X\x87P\xf0Bc\x19\xeaq\x9a\
-\xd9\x1d\x1a\x13\x8a\xa3\x96u[\x1e \xb0F\x84q\xa7\
-\x8c9\xd1I\xf8\xa5\x19\xddU\x8c\x86\x92F\xc4\xcc\xbc\
-B\xec\x09\xc3t\xda\xb9\xb6\x9c\xc0\xea\xe7f\x8c\xe2}\
-\xfbz\x9b\xbf\x97\x8e\xc7\xdf\xb98]&_\x0a\xca\x86\
-\xf1Iai~\x9c\xc9!\x09\x5c\xdf!#\x0c\xa8\xd8\
-\xec\x87\xf3\xb5\x1bs\x93\x17!\xaf58\xd3Gs\xd3\
-M,\x96\x87\xc5\x06\x19\x0a!9\x17\xe7Y7\x04\x07\
-W\x86\x19\x19\x17\x14\x83\xe9\xe0\x9d[\xda\xf5\x961v\
-\x06\x89\xedL\xab1i\x1e\xb2\x85\xf3\xa5\x8da\xd1N\
-\xc3\xcbp\x7f\x8b\xbfnS\x99M\x86\xa5}l\xd3Z\
-<\xde\x9b\xd6\xb1\xac@\xa3\x11\xa0\x89/\xab\xba%\x02\
-\xe5\xc6\xeb\x04\xef\x0a\x08E\xcaCK\xc4\x0dK\xdc\xd0\
-\xf4n\x0b\xc7\x9dw7\xe7\xd1\x09\xdf\x9a\xbc\xba\x02V\
--\xa2\x06,l?c\x06\x13\xcccd\xc2{\xc6\x03\
-5\x13\xc2Cc\x9b\xcf\x9fjLAd\xab\xb5\x98\xc6\
-\x8a!\x89@4u\x00\xe9\xf9\x1f\xef,\xd4\x9b\x96T\
-\xa2\x09{\xda\xf7\xab\x09\x03\x9b7@\xb2\xe9^J\xb9\
-,\x14m\x89\xa5\x8d\xb2w\xb9g\x13*\xd3C\xaa \
-9\xf9&3\x00b\x10\x9b\x93\x1d\xed\xa5\x8d\xe96B\
-\xb1_Vv\x90i\xe4\xf4\xd0\xee\xf7\xeb\x83\x99\xe2\xfd\
-J\xec9\xf3\xe9\x1b)\xac/\xa0(\xf59\x88\x04l\
-H\xaa\x14\xf4m\xed\xfaZ\xa8\xb0\x9a\x9eI\x8331\
-\xa9\xa16\x7f(-\xcd;-\xf6D\xcc\x1a^\xbf\x19\
-G\x88\xb4\xa0S\x9b\x06l\x7f\xbeWa\xd8\xc0\xb1{\
-Ka\xe5P<[(\xcc\xdc\xbb\xfb\xaa\xc6\xc9G?\
-aJzd\xc3\xa2\x09w\xb2\xeb\xac#\x0c\x8fF\xac\
-\x1cv\x04\xa4\xec\x88\xd7\xd5\x9e\xbd3!\xb6\xfag\xe9\
-}u\xa1B\x98\xcePw(I\xa4\xf8\x08\xa6\xc6\xe0\
-\xd8a\xcf\xf2\xcai>q\xcb\xa2\xa6\x96\xd0\xa8.\xdd\
-^_,S\x90E;oi\x84EJ%ez\xc2\
-\x127V?[\xe9\xc0\xed\xa9d\xa39\x80tm\xf0\
-\x9d\xed\x8aY\xb6\xcb\xc6\x82\x17AJ\x8ax\x8bT\x85\
-\xa5\xb9\x95\xd9\xab\xaf\xaf\x11\x0f,__\xeb\xe1}\x1f\
-f\xb0k\xach\x18\xac\xa5\xdf \x9a\xeaA\xba\xa81\
-`\xd2\xab_\xa1\xc9\xf1\x8b\xcc\x02\xf5c\x06I<\x1a\
-\x0b\xa6\x94\x19\x9c#-\xf5\xebH\x1e5\xf5\xeam\xca\
-Q[\x1f\xd3\x09k$K\xd2t.\x96\xa6\x17\xb3\xd6\
-\xaf\x825\xcee\xef1\x9dG^\xfd\x99\x9dg\x1cy\
-\xa8\xd7\x0b\x22\xda\x08V\x1a\x8e-%\x92h\xaf\xa9\x09\
-!\xaa\xc3l\xd92\x9f\xa6Y\x0a\xa9\xb7u\xaa\x1d\xa2\
-4]\x95\x5cj\xc2\x9ef\xec\xd2\xc4\xd8\xd2q\xebD\
-\xa4\xf5r\x8d\x80G^x\x1bAP\xf4b\xc7\x1d~\
-\xacD0\x11\xe1\x86\x1f\xcb\xd6\x86\x8d}D\xa3\x12\xd3\
-\xa8\x0aI\xb5\x1d\x0f\xadMfuD0\xab\x9ey\xf7\
-\xdd(e\x82\x02!\x8d[P\xbc\xf7\x1c]\xb0\xad\xc6\
-\x86\xbd\x8d>\xaf\x22\xab_,\xd0\x95\x0a5}\x0c\xd1\
-\x9f\x00\xce\xea,\x1a\xd1\x9cU'}\x02\x92\x13\xfd\x97\
-\xbew\x08!I\x12*\xb3\x82& a\x93v\x5c\x0b\
-\x0b\x04\xe7M\x0b\xd28M\xb7j4\xf5\xf2\x22\xa9w\
-o\xc1\x89\xd6\x96N\xa6\x8bI\x17B\xb3\xca\xaa3\xb8\
-\xc4\xb4\xcb\x0b;\x7f\xa7\x1d\xb1C{\xb1xj\x8d\x82\
-\xf1\xda0\x0d\x1ccc\xba\x12O\xdb\xc8Q\x22\x08\x1c\
-\xe1\xe6\x04)\xb5\x1fQ\x13n\xa4L\x92Y\x9d4\xca\
-\xa4b\x9d\xbbJ;\xd1u\xfc?\x87\xa0a\xc8\xc4\xf4\
-\x0f(\x04\xdb\x12\xd1QE\xc7=:\xfekf\xd5:\
-\x8dpRgy^Y\x99MZ\xb1\x84\xf7\xa6\xe5\x04\
-\x9a\xde=\xdd\x15\xa5\x03\xeeu\x04\xf6\xcd\x84\x9a\xa6/\
-1\xe9\x22\xa9{%\xf1\x9e86\x0c\x0f\xc7\x8f<r\
-B\xb3\x18\x06i2\x96\x17/\xb4X\x1dY\xb3mh\
-\x0f\xaf\xde\xcb{\x0f\xd2\x11!\x0f\xfa\xfc&ed\xc7\
-+E\x97\x87 \xa9\xd4\xa9\xd6<q\xa2\x94\xad\xc9\x1e\
-\x96\x92$\x9d\x01\xa6f\xdeZ[\x06#F3:.\
-e&\xbc\x97\x0e\xcf\xaf-\xf8\xd2\xf4\xa6\xcd\x05\x80\xd2\
-:\x96\xaci\xcd\xd8N\xf1\xb7\xa9Lc|\x8b\xee\xab\
-\xa9\xa3\x1e\x15\x8ah\xa3`\xf0D\xfb\xc5\x11\x05\x15(\
-P*G\x8c\x94\x95P2\xeap(m\x81\x94\x1a\xb5\
-o\xed6\xaa\xcd\x05\xda\xc9\x22iG6\xb5\x9b\x19)\
-\x0d\x1c\x1a\x17\xb9\xf0\x89\xb7\x12\x16-\xd8\x09Sp\xe3\
-\xc0\xd8\x01\x96\x0b\xa7\xb2.\xa2VkPk8\xe6\x97\
-=\x9e\xf6\xf971|\xf3^4s\x1a-\xad\x8eh\
-\x0b\xf2\xb5vP4\xd3\xff\xa4\x0bAEq\x0e\xea\xce\
-s$l<\x82\xadRJ\x07\xf3\xe45\x0b\xeb\xf6\xfc\
-\x0d\x83\x8f\x0b\xd2n\xb2d%\xbf\xd8\xa4\x9f\xee\xa6\xdf\
-\x09\xe7\xb5\x1c\xcf\xd3a\xf7\xa31W/\xa0u\x13+\
-\xb8\x19\x83u>-\x99\xb3\x86$\x01\x93\xac)\xd6\xe8\
-LT\x09k0\xffj\xaa\xb3C\x9c\xd8\xa6\xf4V\x05\
-\xafkJ\xa6\x8d\xae\x81\x06\x1d\xf2\xde\x0ef\xc8\x99\x04\
-\xe7\x83@\x88C\x83\xb2y\x8b&\xf8@\x85aJ\xc5\
-9\xa2\x95\x90\xa0(\xd8!i\xd7\x96w\x04\x95m-\
-r\x93\xaa\xa5%\x0d\xeeTO\xb6\xa0\x0f\xba\xea\xee\xdb\
-\xb2b\x832\xa3\x13?\xc6\x98-8\xc602\x1e\x85\
-\xf5\xd1K\x1f[K\x8a\xd5\xb9\x88\xa5\xe5\x06\x95%h\
-\xeeW\xb2F\xb6\xdc\xbc\x0f\xab\xbd\xbc\xb4\xcf%\xdby\
-\x9aG\x08\xadd\xc9\xad\xf4o\x83b\xc2\xa3^\x1e\x9d\
-O \x05B\xc8oh6\x90\xea2\xc7)K7\xdd\
-\xfb Ma{m!\xd0{2]\x9e\xa0\xad[_\
-\xfdn\xfd\xd5e\x80\x1b\xa0\x8cV\x85\xcf|r\x05\x17\
-\xa5j\x18W\x86\x82\x15\x12\xd5,q\xd2\x96\x1b4=\
-V\x9b\xaa\xa4\xc5\xe7\xb7\x0d>\xf5p\xeaS\xaf\xde,\
-\xf9k\xc2\x8dv\xb1\x89\xb4:\x1d\x18\xd3\xdc\xddWc\
-\xe2Ur\x05\x93\xee\x00\xf5\xd9\x02Bl\x0d\xce\x04x\
-\xf6\xdd\xa5\xf54\x1a\x1d\xa2\x5c\x9eG\x9cE\x0a\xe9m\
-\x89\xd5cX}n\xads\x12Vu_\xe8\xbc\x86\xe3\
-\x0d\xb4}6%k\xf0A\xc0\x86\x9d\x0f`L\xe2U\
-\xc6\x81q\x87N\x1c\x19\xaa\xc8\xb0/4HL\x84\x8b\
-5e\x09\xa4\xc9\xd5\xaf\xa6u\xe9\xb8\xde\xb6\x22\xb5\xbd\
-\xc8\xb5\xa3@\xdegt\xa6\xc6\x8aO\x84\xf5\x9b\x16\x18\
-?\x8dy\xaa\x12\xe3\xd6\xb6\x19\x1fd\xe4\xeaZ\x87\xb9\
-v\xea\xe1\xdaRE\xdf\xa9\xce\xec4\xb6\xb5\x9d\x89\xbb\
-\xb5\xd5\xf3\x03h\xec\xd7\x1eK\xfadx\xe9\xf2\xf7\x83\
-\xee )\xb3\xb4\x0cL\xfe\xbdR\xdax\x98F\xcdP\
-h\xa4\x22\xb3b(P\xea\xd4\xd2h\x0b\xafv\xb2<\
-\xcd\xe2\x90f\x01\x86\xfa\xf4\xd5\xcc\xdc6\xdf#\x02\xd6\
-\xbaT\x15\x99am1\x9aQ\x9biL\x90\x1e\xc7t\
-\xb4\x1d\xc9\xa8\xd4\xe6]M\xa0\xf6`\x11\xd1\xc6\xca\xdc\
-D\xf4\xb4\xe5G\xc9\x0d\xbb_#C\xd3KE\x17\x86\
-eF'\xe7q5!\xaax\xaa\xd6Sj\x18\xc2\xba\
-\xc9r\x00>\x13\xc2\x99V\x10\x0b\xa9\x0c\xb8\x15\x8ft\
-\xe0\xfcN\xe9D\xb3\xd3\x83\x96\xc0\x8d\x82\x1d\xb7\xac\xdf\
-\xd1`x\xf4\xe1\x86\xd8i\xb40\xe95\x98\xbc\xf3f\
-F\xb6<\xae\x14\xb1sw\xc2\xba-\xa0\xc5\xd4\x80\xc5\
-j\x97\x22z]\xb5\x0b6\x83\xddf\x0c\xd2\xb9\x00b\
-\xaf\xc4UehI\x88\x8f:\xb6m]\xe4_\xde\xc1\
-~\x9eD\x8dH\xbb\xd8\xa2tao\xc8I`\xe5\xd5\
-r\xaf\x82\xed\x83T`\xd1G\xa0\xd6\xaf\xa1l/\xb5\
-\x9d\xf6\xc8\xfc\xf6\x1bL\xd6-\xa7\xa0\x00\xdb\xf9\xaa\xe1\
-\xe2\xc7\xccQ_n\x10\xd7 .B8\x94b\xe0v\
-\xaa\x9f\xae\xc9+]\xc5Q\xd3\x1a\xe0\xa0k\x92^m\
-\xeez\xf5\xb6\xdf.>\xd1U\x95Q\xa9\x11d^0\
-[L\xc6*\xd5J\x09\x8dk\xf5\x91\x8a\xb7x\xff\xf0\
-\x07\xae\x90z\x8d\x2260LNF-&J\x92\xb4\
-\xb0\x1d\xb3Z\xfb\xbe*p\xce^^\xd70I\x1cO\
-C*B\x5c\x03\xdb\x800\x81\xf1Q\xd8v\xda\x8d\xac\
-\xdf~=\xeb7\xcdE\xd3\x1b\x8b\xf7\x94\xb7M\xdd\xfe\
-O?U\xb6\xee2\xe8\xa4\xc56\xe9]\xb7\x96\xe1\xc9\
-\x9cH\x07\xd4\x91\x8e\x00\xb7\x09\xc1\x9a\x0b%\x1c6\x0c\
-M\x19\x96*\x9e\xe5\xea2\x87fk\x1c\xfa\xbeyp\
-\xdb\xd7}\x8eH\xb1\xdf\xd4\xc5\xbc@\xb8\xa7M\x07\x03\
-\xe2&\xe8_\x8c\xd2\xab\xc2\xfdD&\x9dw\x83W\x9e\
-\xd5\x9d\x19z\x9e\xe7\xe5\xbbn\xb2\x87k\x87\x93oL\
-<\xee(\xf33[)Y\xa14\x95\xe9j\x92\x8cW\
-^\x03A\xd2T\x7f\x06]:\xc6\xc16\x8d\xaa\xa53\
-Y#\xc4jM#\xea\x80O\xed\x82\x10]E\xf45\
-9~\x13\xa4E+\xb6\xe0\x98\x9f)!~\xd6\x07\xb8\
-q\xca\xbc\x90\xff\xa7qC\x0a\x0c\x97\xeb\x04\x05\x9b\x16\
-t\x18\xc0+jd5\x1d\xbaF+\xdf\xaaF\xc9\xee\
-_\xca:\xa5\x9a\xa4\xd6\xe2\xeb\x8ci\x96\xb2\xba\x84@\
-\x09\x099\xf5Q+l\xadU\x90XI*\xd0\xa8\x96\
-x\xc7\x9f\x9fF0n\x18Y\x0742Ivv\xfe\
-\xc7-\xae>\xf6\xd6\xbcw\xc5P\xf0\x89gq\x8e\xa1\
-\x95G\x1c\xba\xfc\x9a_\xf9\xa3\xbfu\xb7\xb9\xef$\x94\
-\x87\x8e\xeb\x90\xd6\xcd\xcb\x0f2N\x94\x01(\xcf\xae\xbd\
-3\xd7\x8eo\x1c\xa4\x10\xa4\x1b\xc62\xf4\x9fn1\xa8\
-\xb6\xba\x1buu\xdc]\xdf9\x8d?v\xc7A\xcb\xef\
-\x9c\xb7\xc0w\x7f9F}v\x1c3\xec1\xdaL@\
-\xc9*\xac\xbb\xca\xe8\xb3\xec\xa2j\xe6\xcd\x9b5\xa4\x1d\
-\x05\xe4\xab\x0c\xcftV$\xa5O\xb6S\xc6\xd0\xe6\xd4\
-e\xd5%63\xbe\xb5Z@\xadR\xa7\xe1\xdd\x07\xf9\
-\xa5\x07,\x8e2\x85\xb1:\xc5\x89\x90\xc2\x88!\xae\xa4\
-1E\x10d\x90+6\xed\xab\xefx<M\xf3n}\
-\xb6k\x0b\xf1\xda\xf2\x02\xdf:\x97d\x14*\xce3l\
-,\xc6x\x0a%Kq\x02\x82\xaa\xa1>\xe4Ib%\
-)X\xd4\x92\xd5\x1adP\xce5\xad\x22KZu\x88\
-\xe0:\xb3\xe0\xd2\x91\x01o\x0b\xd8\x04\x8d<\xf3G\x85\
-\xe9-\x07\xde}\xf3\xd1\xc6\xd6so\xb7\x1f)\xa1\x89\
-\xd8\xa6#\xe96>\xb4\x1bz\xc8\x9bh\xd8/\x9f\x04\
-Y!J^\xe6V\xfbH\x12\xfaA\x92~\xdbS^\
-\x92A\xba\x18{n\xc3\xa0\xc5\x12\xcc5\xd0#{\x8e\
-\xc0\xb3^V\xe1\xfe\xbb\xcaDq\x89BI\xd7(X\
-\x8fgtZ\x18U\xdbB\xfa\xd5\x22\xb5NOK\x87\
-\xe4xM\xc64s\xf1F\xb4kVX=\x14\x0a\x89\
-\xbd\xeb\xfa\xf5\x81\x8b\x0e{\xcf2H\x0c\x84Hq;\
-\x93[`\xf3\xee*CV\xa89%\xf10\x14\xa6x\
-\xdekVj(\x1drg\xe9\xd4\xfaw\xaeL9.\
-C\x9d\x06\xdfBTN\x0d-\x8a\x95\xc0\x83\xb3\x10!\
-\x109\xd4\x08a\x09\x12\xaf\x14$\xe5\xde\xd5\xb5\xef\xb9\
-\xcd\x12t\x9d\x19\xe2\xe3\x99\xb2f\xad\xae\xb6\x1e\x8f\x11\
-av\x06F\xc6\x0e\x95_t\xd2\xbc?\xfc\xc9`\xe1\
-\xb4\xaa|\xe1*|\xa5q\x892\xb7\xbf\xdf\x5c\xdd<\
-\xa9L\x1e\x14\xee\xfaw\x86\xfc2\xae\xbcA\xc7\xfd*\
-]\xe8\x91\xb8\x92.\xba\x8b<\xb6hm\x03\xaa\x9e\xec\
-\xd0\x8d\xf1\xcb\xe4\xd6;\x80;\xef0\xdc\xffmx\xd5\
-k\x1f\xa6\x94,\x13-\x9aU\x0f\xa6)\x14k\x15s\
-\xac\x0al\xd7\xde\xc6\xf69\xaf\xfa\xbd\xac\x89\x0f\xa4\x9d\
-JJ\xf7\xf6\xd4\x157;/\xd8\xcc\x0b\x8a@T\x0f\
-\xc4\xab\x9f\x18\xc6m\x5c\xd7$\xbbw[TJ\x94\xc7\
-\xabH\xc1\xa4\x0b\xaa\xd5\xc5A[mDZ\x05~-\
-\x91Z{\xe16Y\x16#~u\x9f\xcdl[P\x0f\
-\xa6\xa4\x98\x82\xe0\xcaJ\x0c\xac,{\xaaU\xc5'\xca\
-|]Y\xa8{*\x0d\xc5;C\xec!YhK1\
-:\xe9\xdbf\x82L\xb3\x98\xa7S\xba\xe1\xb3\xcf\xb2\x92\
-2^X%Z1Lm?Lr\xf9\xdc\xe8\xcf?\
-a\xe5\xb9\x9e\x87\x86Qx\x14\xa5\xfb\xce\x90\x1c\xbb\x1a\
-4\xcf3H\x5c\xda\xe1\x99\xd21\x90yia\xed\x83\
-\xeb\xbbM\xb5\xcbk!\xde\xab\xe1g?\xd8C\x8e\x0a\
-\xf4x(VB(o\x16N\xb9\xccS<\xb2\x9d\xb1\
-\xb1qJ\xeb\x15;b\x89\x13Ou\xdeS\x8c\x85\xb8\
-\x08\x8d\xc4\xe3\x8cP\x1a\x11\x86\x0b\x82QC\xbc\xec\x8e\
-S#6!\x91w\xd2\xd2\x997\x8d]h\xf3\xfe\xce\
-\x99\x96\xdca\xa4nY$\xc1\x87\xc2T9m\xf5}\
-\xf0!\xec\xcf\xbf7\x15\xe0\xeel<\xeb\xb49^7\
-\x5c\xdfz\xf9\x9d\xd3\x87J+\x8fqg=a\x81\xcd\
-\xa7\xc7)S\x94\x05\xc2\x1d4\xfc*9\xc5Z\x91\xdd\
-\xda\xdf7\x17\x83t\x08\xf5T\xb3v\x87Igv5\
-+\x5c\x11Y\x15\xc74\xe5\xc7\xe9B\x92\xd5}:\x81\
-j!\xad\x1b&\x06\x89\xb2\xcc\xf2\x8a')\x0b\xa3\x13\
-0Q\x0ep\x158\xb8\xcf\x11s\x10{\xce\x0c?\x7f\
-\x97\x01\x18-\xc1r\xbd\xa7C\xcd\xeb\x97\xa9k\x9e\xbb\
-a\xf0\xf6\xf4\xad\x1b\x11\xf4abN4\x81E\x9f4\
-2\xf4\xee\x98\xd0\xeb\xb3LN \xd3\xbb\x9fg\x1d\xa8\
-\x1f\xf4\xfc\xea3\xf0O\xdfz\x98k>\x1f\xb1tp\
-\x1a3\xe1)\x8d\xc2P($\x05a\xb8\x08R5\x18\
-\xab\x18\x05\x1f{\x8aVZs\xc8W%\xb1\x9a-4\
-\xac\x82\xcb\x0c\x85\xb6'\xef\x0c\x98[\x81\xa7%\xed>\
-\xd6,\x06\x17\xcf\xdcb\x11$\x02\xef\xb0\x89\xe7\xf2\xeb\
-\xa9R\x0e\x9d\x04\x10\x86\xb4\xb5\xee\xb6\xd3pW\xebs\
-\xdaPc5\xd6\xee\x0c\xdc;\xe3\x8c,\xccN\x8f\x15\
-\xcb\x1a\xd5j\xd6b\xdc\xe8\xaa\x04YK\xcd\x8ai\x1d\
-\xbb3#\x5ct\xe9vc\xac`\xb2y\xd2n\xc8\xe2\
-\xea\x8a\x9bW\x8e\x1c\xf1`jl:\xf3\x08\x97\x9d\xbb\
-\xc4_\xbe\xb6\xe5\xf02\xa3\xef\xd7\x18X\x07\x81-\xf4\
-o({\x5c0\x1c\xd0\xbfG\xe5\x89N\x99\xeb\xa5\xda\
-\xecWc\xab}Di\x83JO\x8f?\xdf\x0f\xbc\xd2\
-\xf3\xd4\xf7\x1da\xe2\xcee\xf6\xffz3Z-34\
-\xa9\x0c\x97\x04W\x12\xc6b\xa8F\x1e\xf1 \x91\x12[\
-\x0fA\x1bF\xb43\x9f\xed\xecd3\xdeM\xf5=\x1d\
-\x81d\xebg\xe9;\xaa\x91'.\x81\xcd\x10M\x94\x08\
-\xd5\x95@\xa0\xd1\x10\x9f0QV\x80\xf9\xa0Q\xa48\
-!\x14J\xed\x92G\xa4\xad\x0a\xd55\xbbL/\xcar\
-\xb5\x1e\xa8)+\xd0\xb6<\xf8\xb8\x80\xb4#\xd9\xd4I\
-\xd3H\x87\x9a\xd4\xaf\x9e\x07\xde\xbc\x1fe5m\xdf[\
-\x16\xd4@\x88\xe2\x17`\xf6\xb0\xb0T86\xe1w\xcf\
-\x8c\xdet\xa7[\xf8\xc5'lx\xce2sGV\xa9\
-)\xb5\x87\xfc8o\x86r^s\xe0^\xd2\x98\xe3\x16\
-G\xb7\xa1g\xbe\xe3d\xf2:0\xf4\xe3\xfd}\x0f\x91\
-\xdb\xda\xcf\xf29'\xbb6\xeb\xd6-\xb3\xe7s\xc4H\
-\x00\x5c\xb1\xeb\xb0y\xd1W\xfe\x02\xae\xbb\xbe\xc2\x1f\xbd\
-y/\x81\x9f\xa5zD\xa8\xccz\x1a\xb3\x8e\xbasm\
-c-\x09Q\xc3\xb4\xbb\x85q\xbc*\xb1Y\xb1\xd5\xc6\
-\xf9\xa6\x85\xb3\xa5#i\xa4\x1e\xdcP\x1a\xa0\x1a\x93\x06\
-|q%fy1\xc4\x17\x22D\xdd\xb9cG\xd0S\
-\xffH\x94\x89\x12\xc1\x88\xa10\xe4Z]\xd1\xac\xf5\xab\
-\xb8\xff\xce\x98\xa4\x99\xa0j&\xa9Z}\xf93\xfdL\
-g\x8c\x92v];\xbe\xf8\xa6y\xfcfuZ'=\
-\xdblP\xdb\xd4\xe0(\xd2\xcar7uJ\xc6\x90N\
-~1J\xb4\xe4Y9\xe2Y9\xec\xa9Tb.~\
-\xc4\x03\x9b\x8e\x0d\x1d|\xdd\xcd?r\xff\xb1\xfeG\xf2\
-\xd2\xdf\x9a%\xa8\xfb^p\xc4\x93_\x9b-]\xec\xb3\
-[\x0cI\x0f\x9b:n\x92\xba\xa5wCW9A\xef\
-\xdf\x0d\xe3\x1b\xf2;/\xf4\xeb\xd6\xa0t\xef\x91hz\
-H\xab\xbb\xbdL\xc9\xc0\xd0)K\xe6\x92\x0d{\xcd\xf2\
-U\x9f\xf4\xd1{>\xbb\x14\x1d^X\xe1\xc0\x83\x96F\
-\xd5\xe2+\x86b\xa1};\xa4\x04\xa2\xcdll\xc7\xb6\
-\x9fu-[\x9d\xf5\x95Ul\xcf\xea\xafY\xd5\x91\x85\
-\xc2\xa8P\xf4\x86\xeaJ\x22\xfb\xf6\x0ei\xa3\xbe\x22\xa3\
-\xd1\xc2\x13^\xb2\x1c\xff\xf0\x86\x03\xe6W\xb3\xd1F\xa6\
-&'\xd8r\xfa\xe2*\xd1\xd9\xda\x0eiH\xbb\xa9U\
-;q\x96\xe1o\xdb\xd6\xeb\x1f\x0f\x85\x8e\x7fv\xd2b\
-\x88\xbam\xc0\xb2\xaa\x82j-K\xa4\xd2\x94\x84\xc0\xfc\
-1\xa8\xcc)\x8dj\x0dc\xe6\xe5\xa5\x1f~X\xf6T\
-\xa3\xf1\xbb\xdeeN\x7f\xec\x11sT\x22\xf3?\xdf\xdd\
-\xaa\x0f\xee_\xea7\xd0C\xbaHX\xfa\x0dm\xeef\
-\x1b\xbd:{\xb0V\xb2\xd0/\x90\x1c\x84\xbd1\xf4\xae\
-\x8a\xd1\x01Tsy\xf4i?!\x92\xe6i\x82n^\
-w\x92^u\xbdu\xa7\xad\x83w<Z\xed\xab\xdey\
-\x9e\xe1W?\xab\xf1\xd8\x97\x1d\xe0\x8c\xb3\x1fbxd\
-\x8ez\xd5\x90x\x8b\x1b\x16\x5ca\x8d\xc8\xcb\xa7\xecD\
-Sv\xa0\x9d-\x17V;\xcb\x8c\xe9\xc8\x0c\xc7C\xe4\
-\x15\x8a\xe9\xfb\x8d(q# IDqI\xb0k\xd4\
-o\xd9\x89\xee\x9f<\x10 >$(:\xc2\x82\xae\xea\
-[\xb3\xea\xd52\xd6\x0e\xb8\xe3;$\x11\x1d\xdf7a\
-\x8d\xaeM45\xd5\x92\xadxAW\x89\xf0h\x87\x18\
-\xed\xe4\x13\x1d\x82 mC.\xef`~Q\xb0\xbe\xce\
-\x96\xdd\x078\xf9\x82\xfd\x8cN\x1e\xf9\x9bW^\xeb\xdf\
-\xf8\xe9}r\xa4\x04W\x9f\x0f\x9f8w\xa7\xdf\xcb\xa2\
-?\x93K{e\xed\xb5K\xac8\xe8\x88\xaa\xbcA%\
-\xda\xc3\xbe\xb4s\xea\x5c/\x9c\x9d\x87\xed\xa5\xcf\xcf\xd6\
-f\xe2Nd@o^\xe2\x82\x9c\xcf\xec\xd9\x82\xaeP\
-\xc0o\x1d*\xc9\xfe\x85H\x12\xbc\xeeX\x87\xac\xe8\x06\
-f\xff\xff\xd6\xce\xe5\xb7\x8e\xab\x8e\xe3\x9f\xdf\x99\xd7}\
-\xc5/l\x93\x98\xc6\x09j\x1aZ)I\xd5\xf2\x88\xd2\
-\x82\xa2\x16\xb1 \xab\x0a\xa9H\xfc\x03\xac\x80\x15[\x16\
-,\x10l\x11\x12k6\x14\x09\x09h$\x0a\x14\x16\x88\
-\x84\x80\x10\xa2\xe6UPE\x9d\xc8\x81\x12\x9b\xd8\xbe\xb6\
-\xefs\xe6\xcc9?\x16s}}\xe3\xd8w\xae\x11\xb3\
-\xbd\xf7\xce\xdc\xd1\x9c9\xe7\xfc\xbe\xaf\xdf37\x84\xa7\
-\xaf\x19\xfe\xf0\xe6\x02\xbdl\x86\xb9ia\xb6Qh\xf6\
-kq\x08S\x8aq\x83\xadA\xab\xd8\xd6\xb43\x8f7\
-\x9e^X\x84\xcfN%E\xe1\x9b\xc4\x03=\x8f)X\
-\xdc\xd6\x96#\x09\x84jd\xb0=\xc7\x83\xfb\x9ew\xfe\
-\xba@s\xf7\xde\xf2\x99\xf6\xc6\xca\x0fI_\xf9\x0a\xd5\
-\xdb+\x8b\x97\x98\xfb@\x95\x8b\x1f\xdd\x02#\xc3<\x1e\
-\x91\xc7\xfd\xa8\xa3n/\x86\x09j\x07\xe6\x18\xef\x05\xa3\
-Bl\xa1o\x15i\x086W\xb2J\xb1BU\xd3C\
-.\x95\x01q\xe7\xc4\xe1\x14\xe2\x91t\xd8@\x94\xfa\xbc\
-`\xad\xc1\xb6=.S\xbaM\xe8\xf7\x84\xcd\xfb-\x96\
-\xea\x0f\xb9\xfar\x977~\xab\xcf\xfe\xf9ms\x819\
-\x1e\xd0\xd6U\x9a\xb2A{ a8v\x90\xcb\x04\xcf\
-o\x5c\xeb\xa8I\x9b\xc2=v\x9d\x90\xf1\x86]\x19\xa3\
-\xc7)[\x8a\xca\xdcY'=\xcaBk\x85\xf1\xcd&\
-\xc82\xcc\xdd\xac?\x9c\x09\x1a\x15L\xbf\xf5\x1f\xf8\xf5\
-w<\xf6\x02\xbc\xfa\x8du\xa2\xf5\x0d\xbe\xf7\xedY\xf6\
-\x1eL\xe3$\xa4m\x84\xa8n8\xd5\xf0\xe4\x89\xa1\xae\
-J\xc7\x0e\xa2\x02\xabB\x03!\x0f@\xf7\x8ak\xf7\x07\
-\x9c~0((\xadQ\xaaR\xc8qm\x0e.\x0f\x89\
-+\x10\xab\x7fj\xe7\xa9|\xee#+\xee/\x7f\x8c\x0c\
-.H0\xb5.\x0e%\xe0p\xdf\xacQI\xf0 \xcd\
-`\xc45\xb6_I\x8f\xb2\xcc^\x8bA\x8f)\xfc\xbd\
-A$\xd4\xa2\x22\xe5\xad\xdf\xd2A\xbe\xd0\xbe?\x01\x8c\
-q\xcc\xceG(\x9eP \xb7\xfb\xe7T\xf6\x1e*Y\
-\xea\xc8\xfb\x0e\xd7\xb3\x98\xa8\xc7\xf5W\x9a|\xfab\x97\
-/}N\xf9\xfa\xd7\x00\xe4O\xe0\xcf3#\xffbO\
-7h\x8f\xf2\x0e\xc7!pe\xb3\xfb8\xa2\xf3\xb8\xc1\
-\xc2\x9c\xfdq\x00\x00\x04\x88IDAT~\xb8\xb7\xf1\
-\x91\xe7\x0b\x8e\x90\x18L\xaa\x83/#\x10d\xc2\xcfe\
-\x02\x8e\xa0l\x90\x97\xc1`G\xbeH\x0f\xf7\xa0\x93\x0e\
-\xbe\xb7\xf9;\xf8\xf9m\xae\xd8\xd7y6\x99\xed\xac\xc7\
-\xe7w\xad\xdf\xed\x10Mu\xb1\xed\x9cN7dw;\
-\xc0z\x0f\xb60\x86\x84*\xd4\x22\xa1\x82 \x1d!\xf2\
-\x82\xcd\x14u\xc5B\xaa^\xc0\x0a&\x12B\x01k\x14\
-\xb1\x8aj\xc6\xd4\x92\xbdW?\xe7\xbf\xfa\xbe\x9bY\xff\
-o\xefL\x93\xb9Y\x16\x9e\xeeP\xab\x98\xa1\xb9\xfc\xb1\
-=\xfeqp\x9e\x1c\x10s\xa3Fo1\x82\x8f\x84F\
-l\x08\x0d\x84^\x08\xd4`\xaaB\x5c\x11$*\x90\x18\
-\x09\x05B!\x99\x11T\x84<\x85\xf6\x8eg\xef\xa1\xa1\
-\xdbRZ\xad\x16\xf5d\x9b\xa9\xd3\xdb<qq\x9b\x1b\
-\xdf\xdc\xe1Gwr^\xfb\x22\xbc\xfd\xe0\x91:n\x8d\
-]\xc9p\x92\x1d\xc8\x8c\xcb\xf0\xf52\x88RN\x80\x0a\
-\x9aIEk\xc2\xa3-?\x0d\xe3S\x8b\x0fc\xeb\xe3\
-\x0a\xdd\xb2\xad\x0d%\xc4Y\x99\xd2s\x5c\xaa\xaert\
-\x90\xd5a$ax\x5c<\x83\xbct\x09\x13\x87\xa8\xdf\
-A\x96\x0c\xdcZ9\xafo~\xb0\xa6\x5c\xfaB\xc0g\
-?\x0co\xbc\x95\xb0\xf6\xab\x19:\xcd\x06\xea\x12\xea\xb3\
-\x8ejb\x08\x0c\xd4f\x0c\x01E\x138\xdf\xf0\x85\xbd\
-\xcf\x0b\xbd\x079A\xc3`*\x0a}p)dM\xb0\
-\x8d\x01Z\xd4\x93\x22\xeff6 \xae\x149@.;\
-\x90<\x0c\xc5q\xe6Q\x06\xb5\xd8\xdf\xcbP\xff?\xac\
-G\x06\x1b{c\x0e\x5cOSI\x80w\x83\xed\xb9(\
-\xc1\xb4\xc1+d\xaexIs\xabd\x0e\xda\xdb\x9ev\
-\xcb`\xb3\x1c\x13\xb4y\xf2\xec.\x97\xafu\xd8\xcc\xe1\
-\x97+\xca\xe6\xf7=\xcdm\xf9\x94\xbb\xc0\x94\x8fx\x8b\
-5\xee\xb1\xc3\x84\x13\xcd$\xcc\xeb\xa4N\xbcq\xab\x82\
-\x19\xc3\xf7\x0c\xc7\xb7\x1c\x81\xe5\x1f\xc7\xc0Nb\x02>\
-\xbc|\x05\x1c\x9dzV\x16\x17^\xb6\xd7\x1f\xa7\xfa,\
-\x8b\xa1;\xb6\x86\xb9\xfe\x0crn\x012\x87\x98\x08:\
-\xbf9\xe7ofk\xca\xe5\x9a\xd4\xce.\x1b\xb8\xea\xbb\
-\x9f\xfc\xbcr\xe3\x05\xe5\xf5\xd7b\xee\xfc\xf8\x14\xadN\
-\x8dn\xbb\xc2\xf4t@\x98\x04HU\xc9%\xa2V+\
-\xd0\xa1\xee\xba'\xae\x09\xc4\x82I<\xa6+\x98TI\
-\xea\x06\x8f a1h#\x154T:\xa9Gs\xdd\
-\xaf!\x0fe\xfa\x8ctP\x1cU\x7f\x8e\xdc\xde\xd0\xef\
-d\x84j\x05z\xa9\xe2r\xc1\x8b\xc7\xee\x08V\x84\xc6\
-\x19\xb0\xce\xe1{B\xde\xcfI\xdb\x10\x9b>\xf7m\x8b\
-\x85\xe56/~+e\x09\xe5\xcb/\x05\x101\x15\xfe\
-B\xa9!\xcf\xc9\xa2\x9c\xdd}?y\xa3\xcbsWV\
-Y\xfd\xfd\x87\xf8\xae\xbd\xab\x1d\xec\xc1\xf3\xf9\xd8\x92\xb0\
-\xd5\x83\xd5\xe6\xffR\x1b2\xc1\xf3/\xabE\xc7\xf5\xd4\
-\xd5\xd1\xd2=(\x11\xf9PBn\x95\xf5\x22-\x933\
-\xfb\x09W\x89\x93\xce\x0e\x93\xdc\xc7\xc1\xff\xa8\x9c\x86\xb9\
-\x97\x0b\x97\x90\xb7\x05Z\x12\x86p\xee6\x8b\x7f_\xe7\
-\xda\x8bH\xa7\x83\x84{\xa8j\xc2\xbbk\xd7Y\xbdr\
-\xda\xf3\xea'\x94[\x1b\xcco\xfd\xb4\xb2\x137\xc2\x5c\
-\x1a1\xd6DT\x93\x88\xdc\xc4$Q\xc4\xae\x091\x1a\
-a\xc4PO\x848U2\xf1\xa8\x01_\x1f\x90U]\
-O\xee\x95\xc0\x14(\x8a\x98\x22\x87fH`\x1d\x1a\xfc\
-#`\xccP\xd2\xa0\xbe\xe8S\xb5o=\x8f\x1a\x01\xb6\
-\xe3\xe8cQ\xb5\xa4i\x06\xd6\xe2%C]\x8e\xd8l\
-\xa6\xba\x91\x7f\xe6\xea\xf9\xf4\xf2\xf4\x1d\xfd\xc1Or\x91\
-lS\xbc\xb5\xdc[\x0e\xf8\xf7\xfa\x22x\xe5zu=\
-X^\xc6\xb7R\xe4\xbd\x9b\x8b\xee\xf9tY\xb6\xb1T\
-\x06\xbc\xf4-\xee\xeb]\x9a\xca\x0bO\x08\xcf/\xc1\xcf\
-\xfe\x01\xef6\xf5\x84\xcf\x82\x124\xef\xff5\x0e\x86&\
-\xca\xb0\xe4\x07e3(%o\xf38\x86\xf7\xa4o\xaf\
-\x94T\xee\xc7\x15;e\xadJ\x15\x89\x84h\xea\x00\x92\
-\xdc\xdff\xc4m\x09\xb3\x5c\xa3\x081\x06\x8d\x8a\xb2\x90\
-~\xd7h\x8a\x1f\xdeA%\x84,2\xf8\xa5\x05\x98\x9f\
-\x16LC\xd8=#|\xfcI\xd8\xc9\x99\xaf4es\
-\xbb&\x18I\xd04!\x0aB\xb2J@\xe0Crc\
-H\x89HbC\xe8\x0d\xde\x06\xc3\xc1n\x82\xc2\xa67\
-$\xc6\xbc\xa0\xc6\xe3\x03\x87\x09\x95\x00\x8f\xef{H\x1d\
-\x95$\xa7\xdb\xcaq\xb9%\x8b,\xd5\x99\x94\x9asX\
-\x15\xb6\x22\xcf\xc6C\xd0Ty\xef\x96\xc7\x00\x9dm\xe2\
-\x04\x99k\xc0\xa9nE\xfe\xa9}\xc2A\x8ee\x1a\x83\
-\xed\xc7 J\x1d\x8b\xf7E8]\xbb\x8d\xd6\x88\xa4\xe8\
-\x96\x01\x06\xa3\x16G\x8aSjQ\xd1\xde\xa8\x9f\x0fZ\
-\x93\x9e\xa88=\x0eT\x99\x04\xbd\x9b\xf4\x18\x9e\xef\xbf\
-6\xc27\xce\x0f\xa3'\x05\x00\x00\x00\x00IEND\
-\xaeB`\x82\
-\x00\x00FM\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00d\x00\x00\x00d\x08\x06\x00\x00\x00p\xe2\x95T\
-\x00\x00\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\
-\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\
-\x00\x9a\x9c\x18\x00\x00\x00\x07tIME\x07\xde\x08\x04\
-\x07/\x17\xcfr\xa0F\x00\x00 \x00IDATx\
-\xda\x9c\xbdi\xa0fEu.\xfcT\xd5\xde\xfb\x9d\xcf\
-\xdc\x136\xd0\x8c\xad\x80\xa0(\x10E\xe4\xc0{\x04\x0c\
-\x01\x15\xa7$\xd7!7Qcb\xe2\x97\xf8\xc5\xdc|\
-7\x1a\x87$71\x9aDM\x8c\xd7$&\xce\x03q\
-\x88q\x88\xc2\xfb\xc2AQ\x11\x15\x19e\x86\x86n\xe8\
-\xee\xd3}\xc6w\xdaCU\xad\xfb\xa3V\xed\xb7\xce\x01\
-\xfd\xf2}\xfe\xd1\xf2t\x9f\xae]\xabj=\xcfz\xd6\
-\xaaZ\x02\xfc\x9f\x85\x85y\x09@t:\x8b\xe6g\x8c\
-\x15\x00l\x19S\xa7\xb3h\xdb\xedy\x08\x81r\xbc\xb0\
-0\x0f\x00\x0a\x80\xedt\x16i\xeb\x98\xff|D\x04\xdd\
-\xed.\xa2\xdd\x9e\x17\x00\x94\x10\xd0\x9d\xce\x22\x16\x16\xdc\
-\xb8\xd3Y\xd4\x00\xd0n\xcfK! \xb7\x8c\xcb\xb9\xb5\
-\xdb\xf3J\x88'\xcc\xed\xbf4\xd7`\x5c\xce\x95\x08\xd1\
-\xd6\xb9\x00?{L\x04\xd5\xed\xba\xb9-,\xccK\x22\
-\xc8p\xfc\xffe\x1d%\xff\x9f1\x80\x06\x00\xcb\x1fX\
-%\x1a\x8f\x17\x16\xe6\xeb\x00j\x00\xfc/i\x00\xa8\xfa\
-\x9f\x0b\x81&\x80\x0a\x11,\x7fP\x0b@\x12\x18c\x82\
-\x08\x11\x8f\x85\x10\x98\x00 \xbb\xddE,,\xccK!\
-\xd0\xe2\x05E\xbb=\xaf\x00\xb4\x88@~n\xfc\xfb\xfd\
-\x5c*B\xa0A4\x9e\xab\x10\xa8\x11\x95s\xdb4\xd7\
-v{\xbe\x19\xce\x15@\x0b@\xc5o\x1c!\xd0\x02\x10\
-\xfb\x8d\x02`B\x08\xa8`\xf1[\xbc\xa0~q[\xbc\
-\xa0XX\x98\x8fxL?c\x1d+\xe1xaa\xbe\
-\x06l\x9ak\x83\xe7Zn\x0c\xc9\xffH\x15\xc0\x90\x17\
-\xac\x22\x04\x1a\x00\x06<\xae\x03\xa8\xf0\x18\x0b\x0b\xf3\x13\
-D\x88\x88\xca\xf14\x00\x01`\xd8\xed.\x02\xc0,\xef\
-\xb6Q\xbb=\x0f\x22l\x03\xa0\xbb\xdd\xc5\x8c\xc7\xdb\x01\
-\xe4\x9d\xceb\xce\x1f\xbc\x8d\x08Y\xa7\xb3\xa8y\xe7\xcf\
-\x12a\xd4\xed.\x9av{^\x11a\x8a\xe7f\x17\x16\
-\xe6c\x22\xb4\x880\xecv\x17iaa\xbe*\x04\xea\
-<\xf6\x1f\x98\x04s\x9b\x14\x022\x18\xcf\x08\x01\xeat\
-\x16\x87l\x9c9\x9ek\xca\x0b\xb2\x9d\x08E\xa7\xe3\xe6\
-\x0a\x94s-\xfc\x5c\x01\xa4~\xaeD\x98\xf1se\xe3\
-L\x01\x18u\xbb\x8bvaa>\xe1\x8d\xe4\xd7\xb1\xc6\
-\xeb<\xe0\xb96y\x1d\xfb\x9d\xce\x22\x84@\x1d\x80\x10\
-|d\xfcq\x8d\x01\xcc\x12\xe10\x7fp\x85\x08\x13B\
-\xe0h`\x9c*\x80\x95`\xb7\x09\x00\x1bD\x00\x80)\
-!Pt:\x8b\x03>)s\x00\xfa\xdd\xeeb\xca\x1f\
-\xb4\x9d\x08\xab\xddni\x8c\x9dD8\xda\xed.\x16\xbc\
-1v\x028\xdc\xe98c\x08\x81\x1dD8\xd4\xed.\
-\xdav{>\x12\x02\xdb\xf8\xe7\xb6\xdd\x9eO\x84\xc04\
-\x11\x96\xbcq\x004\x89\xb0\xcc\xe3\x06\x11\x12\x00\xabB\
-\x00\x00&x'\xf7\x88\x00!0C\x84\xb4\xdb]\x1c\
-\xf2\x5c\xb7\x09\x81\x8dNg1c7\xb4\x03\xc0J0\
-\xd7]\x00\x96\x82\x8d\xb3\x93\xd7\xc9\xf0\x1a\xee\x00p\x88\
-7N\x04`\xce\xafc\xbb=\x9f\xf0\xda\x1c\x09\x8cS\
-\xe7\xb9baa\xbe\x09@\x02\xd8\x10\x01\x86T\x00L\
-\xf3\x02\xf8\xe35\xc1\xbf\xd4\xbb\x82F\xa7\xb3x\x84\xff\
-|\x93\xdd\xd2\x0a\xef\xae\x09\x22\x88nwq\x9d\xdd\xd4\
-\x14\xfb\xd9>\x7f\xd04\x80Q\xa7\xb38\xe2\xc5\x9f\x01\
-\xb0\xc1'%\xe2\xf1J\xa7\xb3\xa8yc\xcc\x10\xe1\x08\
-\x1b#\xe1\x05<\x1c,\xfe\x14/\x80\x9fk\x8b\x17\xac\
-t\x05\x9d\xce\xe2\xd1`\xaeq\xa7\xb3\xb8\xea](\xbb\
-\x9d\x0d\xc6\xaf\xc9`#I\x22L\x0b\x81A\xa7\xb3\x98\
-\xf2b\xcf\x00X\xebt\x16\x0b\xde\x183\x00\x96;\x9d\
-E\xb3u\xae\xc1:\x86s\x9d\xdc\xb2\x8eM\xdeH\xe0\
-\x8dS\xedv\x17\x97\x01 \xe2\x09W\x014\x82\xbf\xd4\
- B\x05p\xe3v{~\x02\x80\x22\x827\xc6\x14\x11\
-\xd0\xed.\xae0\x86\xcc0@\xaf\xf3Q\x9f\x05\x90\xb1\
-1@\x84Yvi#6\xce\x0c\x80>\x1bC\xf1\xe2\
-\xae\xf1\xee\x8b\x01L\x02XfcT\x004\x81\xf2$\
-\xd4\xd9\x0f\x1f\x0evW\xe2\x8d\xd1n\xcfO2\xa8\x1e\
-e?>\xcd\x1e`\x15\x00\x880\xc3\x80\xbd\xc1\xc6\x99\
-a\x979\xe0\x931#\x04\x86l\x0c\xc9\x8b\xbb\xc1\xa7\
-\xd8\xcfu\xd5\x1b\x83\x08\x93B\xe0(\x1b\xa3\xca\x98\x11\
-\xce\xb5\xcac\xb4\xdb\xf3-\x00Q`\x8cI\xde\xc4\xcb\
-\xbcnQ\xc4;\x22\x06\xb0\xca\xbf\xa4\x06\xa0\x22\x04V\
-\xf9\x03\x9bB@\xf0\xcf\xd1n\xcfO1`\xf6\xd88\
-\xde\xe7\x0f\xbd\x1f\x06\xd0\xe3\x93\x00\x00;\xf9we\xbc\
-\x1bw\xf2\xee\xca\xdb\xedy\xc9~\xfa(\xfbi\xc5\xc6\
-<\xca\xc6\x89x\xf7.\xb3+\xa8\x10\xa1\xce\xae\xc4\x7f\
-p\xccn\x10\xed\xf6|K\x08\x10\x80U\x9e\xdb4\x11\
-\x0a\x22\xf4y.s\x8cGC^\x80\x1d\x00\xd6\xd9\xa5\
-\xfaq8\xd7\x1d\xc0\xd8\xa5\x12a;\xbb\x1d\xedO\x0e\
-\xbbs\xc3\x1b\xa9\xc5n\xc8\xb6\xdb\xf3U\x06\xec\x15&\
-\x0c\x0d!\xa0\x88\xb0\xc6\xc6\x98\x00@B`\x9d\xd7\xad\
-\x09 \xdd\x8a!\x15\xde\x01\x87\xbd+ BC\x08\x1c\
-e\xcf\xd6\xe0\xdd\xe8w\xdb\x04\x83d\x8fw\xfe\x14\x9f\
-\x8c!\x8fg\xd98\x19\x7f\xd06!\xb0\x12,\xfev\
-\xde\xd9\x1e\x14\xb7{\xcc`W\xb0\x8d\x08\x07y\xf1\x13\
->Y\x87\xf9\x03+B`2pSu\x22\xd4\x00,\
-3f4\x99\x9e\xae\xf3\xdc'\x01\x98\x9f\xe1B\x05\xfb\
-\xfcu\xc6\x8cp\xa3\xe8'\x9b+\x1b\xc7cF\xcc\xc6\
->\xc4sK\xd8\xady\x97Ze\x97z\xc4\xcf\x15@\
-\x95\x08+<\xd7\x16\xcf\xb1\x17bH\x9d\xdd\xd6\x91\xc0\
-\x15T\x03?<\x01 \xeat\x9c\x9bZX\x98\x9fd\
-:\xb8\xc6\xbbmJ\x08\x98Ng\xb1\xd7n\xcf\x0b!\
-0\xcd\x8cd\xe8\x8f>\xbb\xa9,`$\xebl\x9c\x98\
-\xc7+\xfc\xc1\x15\xc6\xaf\xa3\xc1\xa9m\x06\x1f\xd4\x00P\
-\x0f\xc6\x9ef/\xb3\x9b\xf2\xd4\xd5c\xc6$c\xc6:\
-\xbb\xd0i\xc6\x8c>\x9f\x84i!J\xe3x\xb7\xd4\xe3\
-S\x1c\x09\x81)\xde\xd9\x9a7\xc6$\x9fr\xbb\xb00\
-_%Bk\x0b\xf1\xf9y\xeb\xd8\x22B\xe21\x83\xd7\
-Uy\x97\x1a\x05\xc6\xa8\xf0\xf1\xf4\x7fH\x10!\xf4\xc3\
-&0\xc6,\x11\xb2nw\xb1\xcf\x18\xb2\x8d]\xc1\x80\
-\x17`\x1b\x11z\x1e3\x880\x170\x18I\xe4@\x92\
-]A\x14\xfaef$-\xef\x96\xda\xed\xf9\x1a\xef\xfc\
-\xa3\xc1\x07F\xfe\x83\x193\x00\xc0\x7f\xe0\x0cS\xd7\xd5\
-\x80\xda\xa6\xbc\xf8\x9e\x86\x0fx\xa3\x94s\xf5'\x85\x08\
-\xb3B`\x9d\xf1M\x12a:0F\xc4\x1be5\x00\
-\xf0\x06\xbbTj\xb7\xe7\xebD\xa80\xa6x\xccP@\
-\xb9\x8eS\x00l`\x8c\x19\x22\x14\xdd\xae\xdb8D\x88\
-\xc5\xc2\xc2\xbc\x22B\x8dY\x05\xf1\xd1\xaf\x08\x81U\xa6\
-\x87\x13\xfca\x1b<\x9e&B\xde\xed\x96\x8b?G\xe4\
-\xa8-\xef\xb6\xed\x8c\x199\x7f\xe0N\xde=\x05c\xc6\
-N!\x1c}\xe4\x7f{\x87\x10\x8e\xeaz\xba\xc8\xae\xc1\
-.,\xcc'D\x9b\xe8\xa2\x0fX=\x864\x18C\xd6\
-\x84\x00\x18`\xed\x7f\x95\xda2F\xac\xf0I\x10B`\
-\x17\x03nIm=\x0d\xf7s\x05J\x97\xbai\xae\xec\
-\xa6&\xb7\x9cj\x8f!\x1e\x8b\x15\x11\xd6\xd9MM\x01\
-\xd0D\xe8\x07nk(y\x87\xf7\x03c4<\xa0s\
-\x80\x18u:\x8b\x1b\xfc\xe7Zl\xe1A@mSo\
-\x0c!0\xedw\x17/\xfe\x9c7\x06\xbb\x82m\xbc\xf8\
-\x9e\xdanc?l\xd8\x15\xcc\x11\xb98\x83w\xdf\x0c\
-\x1b\xcf\x7f\xe0\xa4\x10e\x9cQgj\xbb\xc6\x01i\x93\
-\xe5\x95\x1e\xcfu\x82\x03\xd2a\xe0\x96\x06[N\xa9\xdf\
-8J\x08\xcc\xf1\xa9\xd3\x0b\x0b\x9bb\x1e\x13\xce\xd5\xd3\
-p6\x86\x9fk\x951\xe3\x88?\xd5\x0c\xf0+\x81\x8b\
-\xadt:\x8b\xeb!ft:\xce\xc3\xb0\x0b$\x00&\
-\x0a4\x95\x09\x22D\xddn\x19gL1F\xf8 \xd0\
-\xd3G\x1fg\xcc\x00\xa5\x1f\x06Oh\xc4Q\xaf\xe0\x93\
-\xd4\x0b\xe8\xe24\x1b\xda\x7f\xe0$\x83\xa6_\xfc\xd6V\
-j\xeb\xc9\x05\xcb\x1f\x89\xa7\xbaL\xc3#\xef\x97\xd9\x15\
-\xe0\xe7P\xdbi\x8e\xb8=\xd9\xf0\x98\x91\x05\xf8\xe6\xa9\
-m\xc4\xa7r%\xd8(\x13A\x9c\xe1\xa9\xed\xe1`\x13\
-\xd7\xf8\xe4x\xa6\x17\x87\xd4\x96e\xa2e\xbf\x8eD\xa0\
-nwq\xcd\x87\x0c>^k\xb7\xe7K\x0ci\x00\x10\
-B\xb8\x08\xdcS[\x22Gm\xdb\xed\xf9Y\xf6\xc3\x83\
-@\xfe\xe8u\xbbN\x1e\xe1\x88{-\x88\xc8w\x10\x95\
-Q\xaed?\xbd\xec\x8d\xc3\xbbs\x99wc\xcc\x81\xda\
-\x0a\x1f\xfd\x0a\x1bc\xd5\xfb\xe5\x90\xda2\xbe\x81\x08+\
-!\xb5\xf5\xbb\xad\xdd\x9e/\xa9-\xbb\xa9\x1d\xec\xa6F\
-~\xcc\x14>\x0b\xd4\x83r\xae\x8cw\xcb\xfeT\x13a\
-\x9a\xf1\xcbo\xa4V\xa0\x06T\x89Pe\xe3y9D\
-\xb1K\xf5q\x86\x15\xc21\xbdv{~\x06@\x16x\
-\x98mD\x18\xf8\x90\x01`\x0c\xf1\x1a\x0b[\xb0\xc9j\
-\xe7\xda\x93\xd0E\xbf\xfb6\xd1EfK9\xfb\xdd\x90\
-.n\x92C\x02\xcc\x08%\x86\xed\x00\x0e\xf2n\xdbD\
-m=\xdb\x0a\xe9\x22\x91\x93n\x82\xa3/\x89\xb0\xee\xa0\
-\x03S\xc2\xda\xe2\xda\xebo\x1c\x9c\xfb\xea\xdf\x12\xd5\xb5\
-\xc7\xe7\x86s\xc7\x8f\xee\xbe\xf2O\xd2\x99\x87~ w\
-\xdf|\xf5\xf6\xf5c\xcfZ\xdbw\xc1\xafg;\xee\xbc\
-F>\xe5G_\xd8\xde\xdb\xb5w\xe9\xb6\x0f\xbd;{\
-\xe1s\x9f!\x8b\xfa\xe4Na\xf4\xe1k\x17\xbfg\xda\
-\x0b\xf3\x91x\x22\x0d/\xa9-\xcf\xf5\x09\xd2\x0d\x7f{\
-\xa9\xab\x01c,\xe6\xff\xde\xe0\x0d5-\x84\x0b\x11\xd8\
-\xa3\xb4\x880\x10\xbch6\xa0\x8fq\xc0\xa6&\x00\xc8\
-Ngq-\xc0\x0c\xf33\xe2\x8eM\xd4\xf6I\xe8\xa2\
-\xa7\xb6\xcb\x81\x9b\x9adW@\x1c\xf3x\xb7\x85\xff\x12\
-}\x04\xe2.\xcf\xf5\xad@\xe5?\x7f\xef/\xe6\xf6\x9f\
-\xf7+\x13\xc2\x14\xbb\xaa\xeb\x87O\xd1\xb5\xe6\xd3\x8a\xea\
-\xc4\xac \xbb-J{\xd36\xaa\xd4M\x5c\x85\xb0F\
-\xc7i/\xd5I\xfd\xa8\x8d\x92\x87e\x91\xdd\xd78\xfa\
-\xf0R:u\xcc\xdd\xa3\xe9]\x0f\x0e\xae\xda1\xbc\xfc\
-\x9c\xa7\xce\xa6\x93\xbbV\xbb\x9d\xeb\xbd\x9b\xf2\x1b\xc3\xe3\
-Y+\x94?\x00\xd4\xbd\xac\xc4\x00^\xf14<\xa4\xb6\
-\x01\x0d'v\xa9\x9b\xd61\xeat\x16mp\xf4\x8d\x97\
-C\x16\x16\xe6g\xd9\xef\xae\xb1E\xe7\x84p\xf41\x88\
-z\x07a\x10\xc8\x98\x91\xf1I\x99\xe6@\xcb\xd3\xc5\xc9\
-\x80.&\xbc\x9b\x96CF\xc2l\xaa\xd4\x9e\x18$\xd1\
-n\xcfO\xf2\x1c\xbc1\xa6Ad\xba\xdd\x1bV\x00\xe0\
-\xb8\xf7\xfe\xc7e\xff2}\xecU\xba6\xb1\x17V\xef\
-\x89\xb2\xc1\xee\xbc9#MT\x01\xc8\x22J\xfb0q\
-\x156J \xacE\x94\x0d\xa0+uX\x15CX\x03\
-\xa53\x0c\xb6\x9fDVE\x8f&\xfd\xd5\x07\x9a\xff\xf0\
-\xbd[n\x8e\x92\x8f\x1ey\xc3\xb3\x97\x7f\xf5\x18\xc4\x87\
-\x85h\xc0\xd2\xd1-r\x88\xdf(-vS!\xf6R\
-`\x0c\x8f\x11O\xa0\xe1\x81\x00[\xba-\xc1\x8b\xdbd\
-\xd5\xb6\x17\x80b\x1aH\x0c\xdb\x84@\x8f\xf5\x1d\x10a\
-\xa7WB\xf9\xb8=A\xb5\xf5\xf4\x91\xdd\xd4vfK\
->\xca\x9d\xe3\x93P\xd2E>\xea!]\xf4\x18R\xd2\
-E\x00\x80\xc0\x94 \xab;\xddo\xf7\xa7>u\xff\xf3\
-\xe3\xb4\xf7A\x1dW\xf7\xda\xa8\x92\x80H\xc6i\x0f&\
-\xa9\xc2\xaa\x84\x04\x91\x88G\x1b\xe3\xc5'\x8bx\xb4\x81\
-\xa2\xda\x04\xc9\xc8\x8f\xa9\xa8\xb6@R\x09a\x0d\xe2\xb4\
-\x87\xa2\xda2$\x95\x96\xa6\xf8\xda1?\xf9\xea;\xef\
-\xfa\xdb\xb7\xde\x19\x08\xb0!\x86\xd4Y\xf3[\xe3q\x8b\
-\x08\xc2\xbb%O&<\x1c\xf0\xa6\x1e\x04\xb2\xd2\x0e\xf6\
- ^\xaa\x89%\x8b\x86\xd6\x1b\x83\x134\xda\xef|!\
-0\x15\x88m\x02\xc0\xac\x10X\xf3 (\x04\xe6\x02\xbd\
-Gq\xce\xe00s\xf9\x88\xe3\x92\xc3\x81\xde\xe3\x7fn\
-9\xf72\xe3]\x01\xeb?\x1e\xe0iaa\xbe.\x04\
-\xaa\x80\xe3\xee\xd2\xea\xa64\x05~\xf8k\xff29\xf5\
-\xc9\xfb\xbf,\x8b\xf4\x06\x13\xc5gY\x95T\x04Y\x19\
-\xe5\x03\xd88\xe1\xc57\x22\xcaz\xd0\x95\x1a\xac\x8a \
-\xacF\x94\xf6PT\x1b \xa9 \xac\xf6\xc6\x11$\xa5\
-\x10\xb6@\x9cn\xa0\xa8\xb5@R*i\xf2$\xca\x06\
-/}\xecY/\xbau\xea\xd3\x0f\xfe\xfeI\xef\xf8\xf8\
-\x5c<X\x9dH[\xdb\xb6\xaa\x07\xab\xc1\xc9I\xba\xdd\
-E\x9f\x8ah\xf1I\xf1\xc6\x98\xe4M\x1e\x0a\xac\x1bL\
-.$\x87\x14Z2\xff\x1dv:\x8b\x000E\x04\x11\
-\xd0E\x8f\x19\x03O\x17\x89Jj\xeb1\xa3\x17\xc4\x19\
-\xd3^\xfeh\xb7\xe7c\xc6\x10\x1f\xe4y\xed\xc9\xe7\x08\
-\xea<i\xaf\x9b59\x13\xe8\xc7\x13\x1e3:\x9dE\
-\x90\x90S\xb5\xd5\x03\xf2\xe6\xdf\xf8\xf8\xa5\x10t\x8b\xca\
-\x87/\x16Dd\xa2*\x81H\xa8l\x00\x12\x12Fy\
-\xb74\x84U\x09\xactn)\xca\x860q\x15$\x22\
-\x08\xa3\x11eC\x14\x95\x06H(H] \xcaF(\
-*-\x10$d\x91C\xe5\xa9(\xaa-\x22H%\x8b\
-\xf4o\xd6\x9fr\xda\x97\xbe\xff[\x9f?\xf6\xc6/\xff\
-\x1b\xda\x0b\x17\xb5\xc8I7K\x01\xf3\xabz7\xc5\xeb\
-\xa6\x02\xec\x9df\xe3\xf4\x83q\x16\x18\xc7\x07\xdbV\x06\
-\x182\xcba\xfcz\x90-\xcb\x18\xc0=\xd5\x1dr\xd4\
-+\x98M\xf5\xbdL\xcdnh\x9d#r\xc5\x18\xb2\x16\
-\xd0\xc5\x09\x22\xac\x06\x81T-8\x09\x0d\x22D\x01]\
-\x9c\xe0]\xb6\x02\x00\x17_\xb20\xd3\xb9\xf6\xba\xf5\x1b\
-\xfe\xefk_\x0f\xb2\x9f\x88\xd3\xdev\x92\x8at\x5c\x13\
- \x12I\xba\x01+#\x98\xa8\x0aXB\x9cn\xc0\xa8\
-\x98\x8d\xe3\xdc\x90\x89*\xa5q\xe2\xac\x0f\x1dWAB\
-A\x18\x0d\x95\x0f\xa1\xe3\x1aHHH\x93C\xe9\x14:\
-\xa9\x83 \x84\xd4\x19\x09\x9d\x93\xaeN\x5c@B\xfd\xfb\
-\x8e\x0f}\xe7e'-^\xaf\x05\xd1\xb2\xcfJ\x12\x8d\
-ix\xbb=\xefc \xcfR\xb71\xd5\xdd\x08\xdc\xd4\
-(\x90\x99v\xf8$^\x88!-\xa2M\x11\xf8,\x9f\
-\x9aQ\x90\xba\x5c\x0b$\x86\x1d?\x8f\xda>I\xf6\xec\
-\xbfLm\xdb\xed\xd2M\xad\x90\x13\xd4Z\xcf\xeb\xde\x90\
-\xbd\xff\x13\xf7\xbe\x16\xc0?\xaabH$\x950Q\x15\
-\x82\x08Q\xdew\x8b\xad\x12\x87\x09Y\x1f:\xae\x8d1\
-#\xdd@Q\xf1\x98\xc1\x18Qi\xb1\xdb2\x88\xb3\x1e\
-\x8a\xea\x04HH\xe7\xc6\xb2~9\x96\xa6@T\xf0\xc9\
-\xf1\xc6*\xd2\x15\x93\xd4/\xed\xcf\x9c\xf4\xa3\xe7\x7f\xe0\
-\x92\x86p\xe4\xc3/~\x99\x95\xe4\xf1L \xb0zE\
-y#\x88\x81v0\xeb\xf4\xd8\x1bI_A\x11\xca!\
-\x9c\xb0\x19\x052u\xcf\x8bm\xec\xf3}f/b\xe3\
--\x05\x11\xf8\xac7\x06\x07y\xb3\xde\x18\x8c\x11\xd3D\
-%\x97\xaf3\x05\xf4\xc6h\x08\x81z\xa7\xb3\xb8\xd2\xe9\
-,B\x10\xb5\xa6\x0e\xdc\x86\xbf\xfd\xc4}\xcf%\xa2\x7f\
-T\xf9\x88@B\x18U\x81 \x82\xca\x87\xb0\x22\x86\x95\
-\xce\x18*\x1bB\xabj\xe0\xa6\x06\xd0I\xc3\xb9)\xab\
-\x11\xa5\x83\xd2\x18\xd2\x14\x88\xb3\xc1\xa6\xc5\xdf4\xd69\
-\xa2|\x88\xbc\xd2\x02\x09\x01\xa5S\xa8|DE\xa59\
-c\x85\xfc\xc2\xb1\xb7|\xfe\x84\xea\xc6R\xd2\xe9,\xae\
-\xb1\xbbo\xb1\x9b\xf2\xc6\x98$\x1ac1\xbb\xb1\x81\xc7\
-\x0cN\x8c\xad\x06\xee\xbeE\x04\x1d\x85\x05\x09l\xc1\xb4\
-\xdb\x1dg\xfa\x18\xd0G[\xf2\x1b>\x02\xf7\x12\xbaf\
-\xf64\xc9n\xc7r\xbe\xa2\x19\xc6\x19\xcc\x9e\x96\xba\xdd\
-E\x5cz\xc1\xb3\x1b\xd1\xc6\xe1\xe8\xeb7\xdf\xbd\x04\x00\
-\xed\x85\xf9I\xe1\xa4\x9a\x92\xda\x0ak\xcc5\x7f\xfc\xe3\
-D@\xbf7\xce\x06\xb0*\x82\x89\xab\x00\x08Q\xda\x87\
-\x8d\x12\x94\xd46\x1b\xc0D\x09l\x14C\x90\xc7\x8c\x0a\
-\xacdc\xe4#\x98\xa4V.\xbe\xcaS\x14\xce-A\
-\xea\x1cJg\xee$A@\x15)\x84\xd1(*.M\
-\xa1\xf2\x11\x04\x19\x14\x95\xa6\x00@Q>:~}\xd7\
-iW\x7f\xfd\xe6\x9f\x9e\xc3s\xdfDmy\xdd\xf2n\
-\xd7\xb9{\x0e\x09F\xde\xdd\xf3\xb8\xefC\x84 +i\
-\x05\xfb=\xef\xebz\xa5/sJ\xe7\xa6L_ \x14\
-z7\xb5\xf4d\x09\x1c\x0e\x0ag\xcb\x9c8\xe7\x10\xba\
-\x1c8\x01\xc0\xa5\x17<{\xea\x96W\x7fD\xe6\xd5\x89\
-\xf4\x1b\xaf9%{\x0c\x90\xaf\x00\x0a\xfe\xc0)\x10\xf4\
-\x1d/\xf9\xb3A\xd6\x9c}C\x9c\x0f\xff\xb7Q\x11l\
-T\x01\x88\x90d}\xe8\xd8\xb9)\x10!I{\xd0I\
-\xe8\xa6z\x0e\xb0=\xb5M{\xec\xb6\xbc\x9b\x1a\xf0\xcf\
-Ui,]i\x8c\x8d\xa53\x87!BB\xe9\x0c\xc2\
-\x1a\x98\xb8\xeeNJ1\x02\x00\xb2QU\x00\xf4\xee\x0f\
-\xff\xda\xd3\xfe\xfc\x9f\x17\xe6c\x10\x06\xac8?\x81\xda\
-\xb2\xbb\xcf\x82\xc2\x8e\xe5-\xc5\x13G\x18{K\x0c\x99\
-`\x0b?i\xa6\x8f\x83\x99\xf0xm\xe3_\xe2%\xf3\
-m\x81\xf2\xb9)\xd3\xf7\x8b\xcf93I\x9b\xdbfo\
-}\xf9{\x87&\xa9=W\xe9\xf45\xaa\xc8/\xcbk\
-\x13S\x80\x804\x19\xa4)\xa0\x93\xfa\xad\x00\xbe0}\
-\xe0\x8e/\xcd\xdd\xff\xed\x95\x1f}\xfcC\x87g?\xf2\
-\xc3\x1a\x84\xbc\x8b\xa4<\xc1D5\x12 \xa1\xf2\x01\xac\
-\x8aa\xa3\x0a\x84?\x19q\x95\x83<\x8b8\xef\xa1H\
-\xd8\x18\x1e#J\xcc\xd8\x8a\x11\x1aQ\xbe\x053\xf2\x11\
-\xf2j\x0b\x10\x9bO\x0e\x00(\x93C\x1a\x8d\x22\xa9C\
-\x00$\x8b\xd1\xc1\xc9\xc7\xee\xba\xe4\xe1w\xbe\xfa.\xde\
-\xc4S,\xb8\x0e\x02j;\xf0\xac\x947\xe9\xda\x96\x10\
-!\xccJ*\xafeEA\xf9\xcbt\x10\x14\xca@\xb6\
-N\x03j\x1bf\xfa&\x83\xa4\xbf\xcb\xf4\x01G\xbb\x9d\
-E\x22@\x9c\xfe\x96\xbfz\xea\xe3O\xbf\xfc\x85$\xe4\
-\x1b\x95\xceN\x91\xa6@\x914\x00\xb7\xdbHZ#\x8a\
-J\x03\x80@T\x8c\x00k\xa1+\x8d\xcf\x03\xf4w\xf5\
-\xd5\x03\xc7\xe4\x8d\xb9\xabuR#\x10\x89\xa8\x18\x82\x84\
-\x82\x89\xab\x0e3r\xa6\xb6\x91\xc3\x90(\x1f2\xc03\
-\x86\x14#\xc7\xa6d\x04i5T\xce\xecIz\x80\xce\
-\xca\x93\xa1t\x06\xa9\x0b\x14\x15?\xb7\x14\xd2j\xf8\xb9\
-\xa9b\x04i-\x8aJ\x1d\x00\x10\xe5#\x00\x80I\x1a\
-o=\xe1{\x9f{\xdf\xecC\x8bS\xec\xfe7\xd88\
-a\xdeH0f\x0cX\x80U\x8c\xd5=\x0e\xaec\xae\
-\xcb\xeaE\xcc\xae\xc2\xc2\xb0\x8d {\xb6M\x88\xf2\xb8\
-y%t5PB\xa7BI\x9d\xb5\xa8\x95nw\x91\
-\x96\x01y\xec_}\xf5\x8a\xfe\xdc\x09\xef$\x88g\xa8\
-\x22\x85\xb0\x06:\xae\x13\x00\x11\xe5C\x00\x10ER\x07\
-\x08\x88\xf2>H(2I]\x80\xe8\x95q\xda\xbb8\
-k\xccY\x93T\x01\xb2\x88=f\xc4\x95r\xac\xe3\x8a\
-\xc3\x0cvC:\xa9r\x10\xe8\x00\xdd$5w2\x8c\
-\x86*F\xd0I\x0d$y\xe7\x9b\x0c\xba\xe2\xdc\x90\xd4\
-\x19\x84)\xa0+u@\x00\xaa\x18A\x90\x85N\xfc\xe2\
-\x0fAB\xb01\x04\xe2\xac\xefh\xb6\xdb\x18/\xd3\x11\
-}\x85\x80\xc7\xbb\xac\x86\xb3\x82\xec3\xa6~\xec\x8b)\
-|\x06\xd5\xd7\xa7)\xc6\x90\x95\x10C\x04\x1bc5\x94\
-C\x82j\x10\xc9\x99\xbf\x9fGm\xc7n\xab}ar\
-o\xfb\xcd/\xee\xed\xdc\xfbQ\x12\xb2\xe9\xb8}F:\
-i\x0a\xcfX\xbc_\x06\x00\xa5S\x10\x00\x1bU\x01\x80\
-T1\x04\xc9H\x98\xa8\x02ADQ\xd6\x17&\x0e\xa8\
-m\xda\xff9\x98a\x10\xa7\xfd-\x98\xd1GQm\x05\
-\xd4v\xe8\xe4\x13\x8f\x19E:\xc6\x10\x9dC\x99\x9c\xd9\
-\x19\x03<Y\x98\xb8\xe6\xe6Z\x8c@B:<\x03\xa0\
-\xf2!\xaa\xfd\xa3\xcfx\xec\x0f^x[\xb0\x89\xd7\xb7\
-d%Cj\x1b\xcaJ[\x8b\x03!}}\xab\x10\xe3\
-\x8a\x0b!0\x1b\xfc\x92\x883\x7f!\xb5\x9dc\xea\xea\
-\x85B/K\xdb\x1b\x00y\xdf\x85o\xbctc\xe7\xde\
-O\x93\x10M\xa9S\x92y\x8a\x22i\x08\x02\xa0\xf4\x08\
-B\x17.\x10\x03A\xea\x14\xb0\x06&\xaa\xbaq1\x12\
-\x04!\x8cJ\x00\xb2P\xf9@\x18\x15;*K\x06*\
-\x1b\xb8\x93\xc1\xecIe}\xc7\x96<@\xa7\x1e\xb0%\
-\x84)\x10\x05\xc6\x90\xa6@\x94\x0d\x90{c\xe8\x1c*\
-\x1f:\xe3\x09\x09\xa93H\x9d:\x0c\x02\x9c1\xac\x9f\
-+ u\x0a\x02\xc1D\x157.FDR\xa2?{\
-\xdc/\xfa\x08\x9d\xb3\xafYP\x0c\x18z\x94\xd9\xc0\x18\
-~\x13\xfb\x8ci$\x04\x12\xc9\x85\x0ei\xa0U\xfd\xcc\
-\x226_\x18\xe6\x8b\xd8\xc2L_\xa7\xb3H\x7f\x0aD\
-\xafy\xe7'\xcf[\x7f\xca\xe9\x1f# \x92yJB\
-\x17\xa2\xa8\xf0\x07\xe6C\xc08\xbf\x5c\x8e\xada\xfaI\
-P\xd9\x00\x04r~\x9f\x01\xdb\x0a\x09\x13% \xb2P\
-\x99\x03t\xa3b\x80\x0c\x94\xc7\x0c\xa9\x00\x1fq'U\
-X\xe1\x8c\xa1\x8a\x11\x8a\xa4\x01\x0b@\xe8\x0c\xb2H\xcb\
-\x7f[\x16#\x88\x92\xea\x12d>\x84\xd0\x05\x8a\xc4\x8d\
-\xdd\xdc4\x8f\x01\x95\x0f\x00K\xd0\xb1\x9bk\x94\xf5A\
-\x10BGU\x10\xd1\x95\xafk\xa1I\x9b\xb3\x923\x1c\
-\x5cgA5\xe4F`\x8c)\xa22\x15\x91p\x16\xb2\
-\xd8z%\xe0\x09El\x81\x8a\xabXX<\x1a\x04\x85\
-e9\xcc\xa5\x17\x9c\x93|s\xfbI3k\xbb\xcfz\
-\x0fA\xce\xa8\x22#a\xb5pnI@y\x10\x8c\xea\
-\x00\x11\xa2\xdc\x1d}\x938*\x1bg\x03\x18\x15\xc3\xc6\
-LmK\x8c`j;bj\x1b1\x9bJ{\xd0\x95\
-\x06c\x86scy\xa5\x01\x0d\x05h\x0d\x95\x0e\x90V\
-\x1b\x10$\xa0t\x81\xa8H\xa1\xab\x8d2\xe2ff\xc7\
-n)sn)\xa9\x01\x02<7\xc0F5\x17\xf3d\
-\x03\x90RN\x9a\x81E\x9c\x0e`\xa2\x98i\xb8E\x9c\
-\xf6~\xe1\x9fz\x18\x08\xae\xa0g5<\xa4\xb6;B\
-\xf7\xcf\x1e\xe5h`\x9ci_\x1c!\x82;\x0c\xdb8\
-\x02\xff/\x17\xb1\x05\x11x\x12g\x1bS\xdf\x7f\xed\xbf\
-\x5cFR\xfd\x934E\xac\x8aT\x14\x95\xe6\x98>\x9a\
-\xc2\xd3EH\x9d;\xd0\x8c\xab\x10\xec\x1aHH\x98\xb8\
-\xc2r\xc8\x10F\xf9 \xcf\xedF\x13\xb3j\xcb\x182\
-\x8e#,\x1aE\x1f\xa8O`[=\xc1\x99\xd31\x8e\
-S)\xb6\xcd\xce\xc2Bb\xa9\x9f\xe2\x91#+\xb8m\
-T\xc1Jn\xa1\x8b\x1c\x94\xba\x88\x1cB\x94l\xcbQ\
-[\x01e\x18\xe0\x93\x06\xcf5\x85\x00AG5\x9e\xeb\
-\x10$\x9dq\xdc\x5c\x07d\xa2D\xd8\xa8\xb2{\xe3\xd7\
-O\x7flaa~{\xe0\xa6\xc2M\xad}\x01\xf9\xcf\
-\x91\x95D\xc4\x16l\x06\xfc\xd8\x1f\xa7\xa3|%\xc0g\
-\xfa\x0e\x07nj\x22\xa8(\xac\x11\xd0\xbc\xf9W?<\
-\x22\xa1^\xab\x8a,\x91:GQ\xe5\x0f,R\xc7\xdd\
-+\x0d\x06\xc5\xd4S[\x00\xe4\xc6\x84\xd2\x18*\x1f\xc1\
-JU\x02\xb6\xcaG\xa5[\x12\xd6Q\xdb\x22\xae!\xb5\
-\x02\xc7\xd5\x04\x9e;\x15\xe1\x17O\xd9\x8b\x0b\x8f\x9d\xc4\
-\x8e\x9a\x84\x19\x0e\xa0\xea\x5c\x08h\x0a\x14\xa3\x04qs\
-7\x00\xe0\x9e#\x1b\xf8\xf6\xa3+\xe8.O\xe2\xe6#\
-#\x1c\xd9\x18 &?7\x82\xd2)$\xbb\xd0\xf1\xdc\
-\x88\xd9\x16qP(\xe0\xa4\x1b\xa6\xdd2\x12V\xc6P\
-Ev\xda\x7f\xdb\x8d\x8d\xc3\x8e\xa5\x86\xea\xf72\x1b\xc3\
-\xab\xdf[\xd7\xf1\x90\xaf\xcc$r\xf8\xa1X\xc5\xd5\x81\
-\xc6\xf2\xa4El\xec\xebZA]T\x0d@\xed\xd4\xc5\
-\xc5\xa3?\xfc\x95\xfaY\xaaH/\x16\xd6\xf0b;\xba\
-\x08\xa04F\x94\x0dAR\xc2T\xdc\x07:\xfa\x18\x97\
-n+\xcaz\xb0Q\x05&JX\x0e\xe9\xc3D\x1c\xf4\
-\x91\xfb\xf3#UE\xacb\xbc\xed\xccY\x5c\xba]\xe2\
-\x99O\x99E\x14E\xb0\xc6`}\xbd\x87f\xd3\x05q\
-EQ`4\x1a\x95\xe3,\xcbp\x5cM\xe0\x0d\xcf\xda\
-\x83\xdf \xc2\xcd\x07V\xf0\xd9\xfb\x96\xf1\xe1\xfb\x87\xa8\
-\x12!)R@\x00\x053\xbf8\x1b\xc0J\xe5\xdcX\
-8\xd7\xf8\x89s\x15D\xa8\xad\xee\xdf\xf3\xa9\x03\xb8V\
-\x1c(/\xfa\xcc\x06\x15\xf3%\x16o)\x96X\x09*\
-Y*B`C\xb2\x00\xa6\x03J\xe6+0\x14K\xee\
-\xa1\x908\x13\x94{&\x1cw\xac~X\x83\xa2\xac\xff\
-\x1ai\x0a\x98\xa8J\x9e\xa1\x80\x1c#\xf1;\x9b\x84p\
-\xd4\xd5:U\xd6\xc8\xd8}\x90\xb5\x88\xb3\x0d\x98\xa8\x0a\
-\xc3\x11w\x92n\xb01<F\xac#\x8bjx\xfa\xb6\
-&~p\xd5I\xf8\xcd\x13b\x9c\xbd{\x0eQ\x14\xc1\
-\x18\x83\xd5\xb55\xb4Z-(\xa5@\xc6`4\xe8c\
-b\xa2\x05)%\x8c.\x90\x8eF\xa85\x9cqt\x9e\
-\xe3\x8c\xa9\x04\xef\xbf\xf8\x14\xdc\xfc\xb2\xbd\xd8\x15i\x18\
-K\xce\x0d\xc1\xb9L+\x15,\x9fZ7\xd7\xa4<\xc5\
-I\xb6\x01\x13W\xd9\x18nn\xa3\xc9c\x9e\x1f}a\
-E\xc1\x89Y\xbb\xb8&\xcb\xb3\xd6\x1d\x01\x1cDD\x98\
-\xe3u.K\xa2\x88\xb0\xd1\xe9\x8c1\xc4W\x9d/o\
-Qm\xc3\xaa\xbc\xf0~F\x85\x8f\xe3\xa1Ng\x11\x04\
-\x88m\x1f\xfc\xf6\xe3yub\xa7\xf3\xc39\xa4\xc9]\
-D\x0e@\xe9\x1c\x82\x0ct\x5c\x87\x00A\xe9\x8c\xab\xc2\
-\xdc\x02\xa8b\xe4\xfc\xb2\xaa@\xc0:!0JJ9\
-$*\x06(\xa2:.\xd93\x85\x7f\x9d\xdf\x0d;\x1a\
-\xa0Q.\xbe\xc6\x91\xd5u\x14\x95&\xf6\x0f\x0dn~\
-|\x0dw<~\x14\xab\xaa\x89HJ\xec\xaa\x10\x8e\x8d\
-\x0d\xe6O\xde\x85\xdd\xad\x0a&\xa5A\x96\x8e019\
-\xe5NR\x96b\xdf\xea\x00o\xbay\x157\x1d\x1e \
-\xd2Y\x19\x14\x0a\x22\x8e\x91\xc4X\x1d(RX\x19m\
-Q\x07\xaadU$\x845\xc3jo\xe9}$\xd5G\
-\x97\xde\xf2\x82G\xaf8go4\x9c\xdc5\x07*\xd3\
-\xd51\xcb'\x9b\xd6\xd1\xdf\xc9i\xb7\xe7\xa5\xf0\xf7\xe8\
-X\x8d,\x82;\x0f\xfe\xbeF\x85\xd3\x8b+\x0cD\xfe\
-~\xc6J\xb7\xbbH\xbft\xce\xde\xfa#\xcfz\xc5\xf6\
-G\x9e\xf9\xd2\x87!@Q1\x12 G\x0f\x1dc\x19\
-\x02\x10\xd0I\xcdE\xe4\xc5\x10\x10\x12:\xae:vU\
-8\xcc\xe0 \x10Q1t\xae\xc1\x7fp1\xc2\x80b\
-\xfc\xee\xd9\xc7\xe0/\xce\xdb\x89\xd1p\x80j\xad\x8e(\
-\x8a\x00\xa3q\xcd\x83K\xf8\xea\xc1\x027\x1c\x1c\xe2\x9e\
-\xa3=(\x9d\x03\x95: \xa5\xfb\xdf\xba@\x1e\xd7 \
-\xa5\xc4\xb3\xa6$\x9e\xb3\xbd\x8a\xd7\x9cu,\xce\x9c\xad\
-a8\x18\xc0X\x8bV\xab\x85\xe5T\xe3u\xffy7\
-\xbe\xb5\xbf\x87\xa4\xe6\xa8\xb1;\xd5\x92\x15f \xe6\x93\
-\x13\xce\xd5(\x9f2&\x8a\x8a\xa1px\x17\xdd\x13\xe9\
-\xfc\x03\xcf\xfc\xf2\x1f}\xe1\x05\xd7^\xb7\xf2G\x80\x0d\
-\x0a\xee\xbc\x9b\xaaq\xc1\xb8O\xd2U\x01\x18\xc1\xae\x88\
-\x82\x08|\x8e\xd5\xc8\x12\x88\xb6T\xa57\x19S\xec\xc2\
-\xc2|}\xe7=\x8b\xe2k\x7f\xfc\xa3s\xacR\xd7\xab\
-\x22%\x01\x08\x13U@B8\xfa(\xa5\x93\xc8\xbd_\
-V1c\x04\x02\xd56\x1eS\xdd\xc4\xb3)B\x9c\xf6\
-1\x88\xaa\xf8\xcd3w\xe2\x7f\x9dw\x0c\xd2\xfe\x06Z\
-\xad\x963\x865\xf8\xado\xdd\x8d\xff8\xa8\xb1\xa1\x09\
-\xd2\x1a\xc4:s\xf2\x88P\x8e=\x99\xc2\xc5\x0d\xac\x0e\
-\x90\xb5\xd0Q\x0d;\x1b1^\xbd\xa7\x86?|\xd6N\
-T\xaa5\x08!0\xe8\xf7P@\xe1W\xae\x7f\x1c\xd7\
-\x1f\xe8\xa1i<\xd3c\xda\x9d\xf7\xa0\xa3\xeaXa\xce\
-z\xd0q}<\xd7\xac\x07\x9d4\xc8J\x05AV\xc4\
-Y\xdf\xe8\xb8\xf6\x0d]m\xfd\xea\x0b\xff\xf2\xbc\xd1\xca\
-\xb1\xcf\x9c\x15c\x0f\xb4\xc98\x5cz\x9a\x08\x81\xf5\xf0\
-:\xc2\xff\xafL_\xa7\xb3xd\xe2#?y\x8d\xd4\
-\xf9\xc7\x95\xd5\xd0,1H\x9dCpT\xeb\xd9\x957\
-\xce\x93\xec.D\xf9`\x8c\x19d\x9dD\x9e\xd4q\xe6\
-\xf6&\xae\xbed\x0f\xe2\xac\x8f\xa9\xa9)(\xa5\xb02\
-\xccp\xc9\xe7n\xc1=Y\x05JI'\x8f\xe4\x9c|\
-\x12\xc2\xa9\xb8\xc5\x88#p\xc1\x92z\xceiY@\x99\
-\x02YQ\xe0\xaa\xd3\x8e\xc1\xc7\xda{\x90\xa5.F\xaa\
-\xd5j8<*p\xf1\xe7n\xc3\xe3#\x02\xc5\xc9\x98\
-\x86G\x95`\xf1Y\x1dPjL\xc3\x93&H\xc9\x12\
-\x1f\x8bJ\x93HJ!\x8c\xd9w\xec\xed_}\xf1\xbb\
-?\xfc\xae\xdb\xaer\xa9\x85\x18N\xcb:\x14\xaccy\
-\xcf%\xbc\x16=\x13\x18\xa3\xc2l\xeb`P\x9a3\x15\
-T\xed\xd5}\xda\x15\x00\x92\xe1\xea\x8c29\x8a@b\
-\x10VCG\x15\x17\xf5\x16\x1c\x14\xb2\x16\xa5\x8a\x11\xac\
-PN\xfe`\xfahT\xb2\x89\xda\xea\xb8\x8aHEx\
-\xdb\xd9\xdb1\x85\xac4\xc6\xc3\xab\x03\x5cr\xf5m\xb8\
-7K\x10)/\x99\x0f\xcb\xe4\x92\xd49T1B^\
-i\xb8d\x93\xce\xa0\xf48\x19\xa5\xb4\xc3\xb7\xb8\xd6\xc0\
-\xe7\xee[\xc1\x95_\xbe\x13\xab\xa3\x1c\xf5\xbacW\x13\
-T\xe0\x0f\xce\xde\x89\xa8\xe2\x8c\xa1\x8a\x11\xac\x8a\xca\x8d\
-\xe2\xe7\xe6DK\x97\x08+XA\x16\xc6 \xca\x07N\
-z\x11RH\xad)*\x86{\xf6\x9fue\xf7\xd7>\
-r\xeb\xb9\xbf1\x8dX\x10M\x0bQ\xaek=4\xc6\
-\xc2\xc2\xbc\x94\x1c\xd6\xd7\x027\xb4\xa9\x88\x8d\x8fS-\
-(\xe7l\x12\xa1B\xe4\xc6o\x07*R\xe7L\x17\xdd\
-n\x12D\x0e3@\x88\xf3!\x08\x02\xba\xa4\x8b\x5c\x1d\
-\xc2\xae \xca\x06\x0e$\xcb\x0f\x1e\xc0\xa8\x04\x19I\x5c\
-\xb9\xa7\x89\x8b\xb6E\x88\xaau(\xa5\xd0\xcfr\xfc\xce\
-\xb5\xf7\xe2\xde\xa1\x80\x94\x02\x82\xf3\x15\xe5\xce\xd7iI\
-&\xac\x05\x04K5:f\xda]\x0c\x5c\xe6/n\x80\
-\xc8b\xd2\x8ep\xe3\xe3=\xbc\xfd'kH\x8d\xc5\xc6\
-\xc6\x06\x84\x94x\xf5\x99\xbbq\xf6\x5c\xcd\xc9#e%\
-\x0b+\xc8*f\x1d\x8d\x01]U\x5c\xb1\x845\xceX\
-Q\x90\x95\xd4\xa9\xd0q\x9d\x08bV\x16\xe9\xbf_\xfb\
-\xe6O\x9d\x7f~\xf7\x86\xf0bj%X\xd7\x1a\x00%\
-\xf9:n?\xa4\xb6\x9c\xeb5\xc1]\xeb\xd5\xe0\xa4$\
-\x5c\x97\x85\xf6\xc2|s\x1d\x10Ys\xf6\xfe\xb1\xe4\xc0\
-\x98A\x848\x1b\xc2\x88\xa8\xa4\x8bq\xd6\x87Qc\xee\
-\x9e\xf8j\x10\x8e\xc8\xe3\xb4\x07\x1d;\xb7\x05\x22\xbc\xfd\
-\x8c\x16\x94\x07p\xb2x\xdf\xf7\x1e\xc0uK\x06R\xa9\
-\xcd\xf9\x0e! \x8c\x86\xc9s\xf4D\x05\x91\x14\xd8S\
-\x07\x8em(\xc8J\x0d#ca\xb3\x11,\x09v\xa1\
-N\xba\xb1R\x01q\x05_z`\x19\x9f\xbe\xf5\x11T\
-\xabU\xd4j5\xc4R\xe0\x0d'VP\xa8$\xa0\xb6\
-=\x97\x12.\xd5\x82\x0d\x9e\xabr\x0as\xd6s\x22\xa4\
-\x94c\xe3\xb8\xb9\x09a5\x94\xc9v\xad\xef\xdc\xfb\x89\
-\xbf\xfe\xa7\xdb[/\xb8\xf8\x82*\x11\xaaDX\xf3\xf7\
-\x0f\xb9\x0e\xb8\x081dk1\xf1\xd6k\xd2U\x02&\
-\xa7\x0e\xde}\xf8\x8bw\x1d\xc6B\xfb\xc2\xfa\xc1S\xe7\
-\x9f\xb2\xff\xe9\xbf$\x09xud\xf2?\x86e=\x88\
-\x1c\xb5\x05\xc0t\x91\x8f~@\x17U>\x82\xf5~\xd9\
-ZD\x05\x97\xe2\xc8\x08yQ\xe0\xd5{\xaa\xf8\xc7_\
-z: $\xc8\x18\xdc}\xf0(\xce\xfe\xf2#\xa8\xc4\
-\x11W\x83\xb8\x02\x04\x08\x89)eq\xe6\x04\xf0\xaag\
-\x9e\x80K\x8e\x9f\xc2tB\xd0\xc3!\xa2\x86\xbbkt\
-p\xbd\x8f\xee\xc3+\xf8\xd2\x81\x0c\xb7\x1e\x19b\xb5?\
-(%u\x01\x00\xf9\x08\xa7\xcc\xd4\xd1}\xe5Yh\xc5\
-\x12\xfd~\x1f\xadf\x0d{?y7\x0e\xf63$\xc5\
-psL\x94\x0f\x02\x85\x99\xf1+i\x96\xc6\x88\xf3>\
-\x8a\xcaD\x80g\x03\x14\x95\x09\x22!\x84\xd2\xd9w\xcf\
-\xf9\xc2[\xae\xba\xe6\x86\x9b\x96\x82\xd7\x1d\xca\xebz\x22\
-,\x91\xdcBm\xfd\xc5vj\xb7\xe7\x9b\x10\xa8t\xb9\
-\x10l\xf7;?sn\xda\x98}e\xde\x98\xb9\x90\x80\
-gE.\x08$\x9d\xd4\x84s\x0dNb\xd0L\x17C\
-\xb6%\xe0\xe4\x11b\xd5\xd6\x01<\xc7\x1d\x8c)\xc5h\
-\x88\xce+\x9f\x81\xe7\xee\x9eBQ\x14\x88t\x86\xff\xb6\
-x\x10\xff\xfe\xd0\x1a\x122P&G\x1a\xd5\xd0J\x14\
-^qB\x13\xaf:e\x12\xe7\x1e\xbf\xc3E\xe4\xa3\x11\
-\xb2\xa2\xc0\xc4\x843\xc6`0\x00\xc8\xa2\xd1tr\xca\
-\x8f\xf6\x1f\xc1\x97\x1f\x5c\xc5g\x1e\x1eai\x94\xa3\xaa\
-\x9d\x8e\xb6J1>u\xc9\x89\xb8\xea\xd8* \x15j\
-\xb5\x1a>\xf0\x93C\xf8\xa3\xeb\xeeA\xb5:N\x11\xab\
-\xc2I9\xc4\x890U\xa4\xae\x00\xcf'\xc2\x98\xe9\x81\
-\xe5}/b:M/#i\x8d\xd0Q\xf5}\x1bo\
-:\xf7\xad\x0b\xed\xe7\xb7 d\x12\xd4\x01+\xc1\x18\xd2\
-\xe0\xea\x12\x13\x5cH\xf1\x98\xd2 !\x93\xee\xb5\xd7\xad\
-N|\xe4\xb6J\xdc?\xfa~\xab\xe2\x97\x98\xb8\xba\xc3\
-Q\xdb!H*2QE<)\xb5\xcd\xfb\xd0\xca\xb9\
-\xa5q\x81\xc2f9D\x07\xc2\xa1\xca\x06\xd853\x85\
-k_v:vT\x15\x06\xfd\x1e\xfa\xb2\x8as\xaf\xbe\
-\x1b\xfdQ\x06e2\x0cD\x05\xa7\xce6\xf0\x8f\x17\xee\
-\xc6\xd3&\x14&[.\x07>\x1a\x8d`\x8cA\xa3\xd1\
-\x80\x10\x02\xfd~\x1fRJ\xd4j\x8e\xdanll\xa0\
-\x92$\xa8T\xab\xb8\xe3\xe8\x10o\xfa\xcf;\xf1\xa3\xe5\
-\x02q\xa5\x02m\x09\xa7$9n\xfd\x8ds\x01\x19\x03\
- \xdc\xfb\xd8\x11\x9c\xf6\xf9\xfb\xd0\xa8U\xc7sMj\
-\xe5\xc6\x89YW\xf3'\xc5\xb9P\x9f\x22\xd6.+\xc9\
-\x05x\xca\xe4\xce\xad\xc65\x22!\xfa\xf5\x8d\xc3\xaf}\
-\xc1?\xfc\xd2\xb7\x0e\x9e2\x1f>\x0b\x92I\xbe\xa8\xd3\
-\x0f\xf8\xf1Tyyfa\xbe\x02\xa2z\xf7\xda\xebV\
-[\x1f\xba\xf9Y2\xddx\xdcJ\xf5F\x13U\xb6\x83\
-\x85@@\xc0\xcaX\x94\xe5\x9b2*\xe5\x8f8\xebC\
-\xab\xa4<\xeaI\xc6\x5c\xde\x17 \xa4\x1b(\xe2\x1a\xb3\
-+W\xc4\x96G5\xec\x9dm\xa0.\x81\xb5\xb55q\
-\xc8\xa7`\x00\x00 \x00IDATLLN\xe2\xdb\
-\x07\x07\xc8\xf2\x1cQ>\xc0HV\xd1>~\x1a?x\
-\xf9^<\xb5\x01L\xb01\xf2<G\x9e\xe7\xa51F\
-\xa31\x95\xf5'%\x8a\x22$\x95\x0a\x88\x08{*\x06\
-\xd7\xbf\xf2,\x5c\xf5\xb4\x9d\xc8\x8dE5\x1f\xe0\x9e\x81\
-\xc0\xfe\x81\x05@XYY\xc5\x09\xdb\xa7q\xf2l\x0b\
-\xd6r\xc1]\xd2(\x01=N{(\xe2\xfa\xa6\xac\xa4\
-N\x1a[0\xa4^\x16S\xc8\x22\x83\x89k !\x84\
-\xd4yKG\xd5\xd7\x7f\xed-7*\x01\xf2\xd5\xfe\x0a\
-\x80\x0e\xaf\xb4U\x99\x82\x1d\xeat\x16\xd1^\x98\xafK\
-\xab\x1b?\xbc\xe2/WZW\xc5\xbf\xabt\xf6Ai\
-\x0a\x14\x95\x06\x01\x10.\x87`\xa0\x93\x86cK\xda\x89\
-s\x1e\xb0\xc7t1.%\x07\x1d\xf8\xe1\xa8\x18q\xc1\
-\xc1xw\xb9L\x9d\xc4\xae\xaa\x80\x1e\x0d03\xed\xde\
-\xb5\xb9\xfd\xd0:\x90\x0e\x90WZ\xb8\xec\xf8)|\xf4\
-\xa2c\x91\x0d\x06\x98\x9c\x9ar\xbbi8\xc2j\x7f\x88\
-c\xb7\xcf\x02\x00F\xa3\x11\x8a\xc0m\x0d\x87C\x10\x11\
-\xe2j\x1d\xb9!P\x9eB)\x05\x95T\xf0\xa9KO\
-\xc2\x14\xa5\xf8\xd4}\x05\x84\x88p\xc3\xfeu\xbc\xe2\xf8\
-:\x9a\xcd&\xa2(\xc6i\xd3\x09\x0e\x1e]\xe6:`\
-G\x1e\xdc\x5c9\xc6\xd1Au#\xc7_Q\x91\x22\xe7\
-J\x15Yd\x88L\x8e<\x19\xab\xdd\xd2\x14\xc8\xab\x13\
-/\x84\xc0s\x04\xd9\xefY\xa1\x12\x7f\xcfE\x06\xc6\xa8\
-sa\xb4\xa3\xb6RU\xaf\xbd\xee\xc6#&\x8e\xff\x22\
-\xca\xd3\x0f\x08cP$\x0d\x02\xb9\x02\x05\xe1\xe5\x11b\
-jK\x80\x8e\x5cAB\x94\x8f\x0b\x9f\xc1\xdc\xddJ\xb5\
-\x85.&\xb0%]\x1c\xb9\x14\xae\x90\x80\xd1\x98\x91\x1a\
-\xb3S\x13\x90R\x82t\x81G\x9770\x8a\xeax\xda\
-L\x0d\xef\x7f\xee.TH\x97\xc6\xd8\xbf\xbc\x8e\xdf\xbc\
-\xe6>,\x91\x0b@\xfb\xfd>\x8c1\xa51z\xbd\x1e\
-\x88\x08\xcdf\x13#m\xf0\xc6o\xdc\x81\xbbWG\xa8\
-\xd7\xeb \x22\xac\xaf\xaf\xe3\xcf/8\x01W\x9c\xba\x03\
-\x12\x84\x9f>~\x14I\xb5\x82$qY\xca\x1d\xb2@\
-\xa1\x12\xce\xc7\x87\x95,\x0e\xb0\xcb\x18G\x80\xeb\x82s\
-\xae\x5c\x81\xabd)\xabl\x80\x88\x0b=\x8a\xa4A\x10\
-\x848\xed\xff\xd9\xb1w|\xc7t\xf9\xbd\x98v{>\
-\x92\xac\xeaF\xc1\x1d\x87\x9a\x152\xb9\xee\x9a\xeeJ\xeb\
-\xefnz\x8f\xd2\xe9[\x01\x12&\xae\xb8R\x1c\xaf\xef\
-xj\x9b\xf7a\xa4*\xabA\x92\xac\xef\x0a\x9dYB\
-O\xd2^\x10\x91;U\xd7\xc9%!]\xac\x8e\xddV\
->D\xb3\xd9\x84\x90\x0aZk\xac\xf6\xfa\xc8\xa2*\xa4\
-\x10\xf8\xcc\xa5'`6&T\xeb\xce-\x1d\x5c\xeb\xe3\
-\x0d\xd7\xde\x8f\xab\xf7\x0d!\x85@\x9e\x8e \xa5D\xa3\
-\xd1(\x8d\x11\xc7q9N\xfb\x1b\xf8\xda\xa3\x03\xbc\xf6\
-\xba\x03\xb8\xed\xc8\x00\x1b\xebk\xa8\xd5j\x98l\xd4\xf1\
-\x0f\x17\xef\xc1\xf1Q\x8a\x0d\x8a\x00\x15\xc3Z\x8b\xd5\xd5\
-U\xb4\x9a\x0dX\x11\x8d]pT\xe3\x22m\xbb%\xee\
-0\xae\xac(\xaer\x80Z@:\xcc\xe0\xfc|\x06\x90\
-\xe5\xac#D\x94\xa7\xb0*:\xe7\x0b\x7fr\xd3Y\xc1\
-\x9bc\x90|\xef\xad\xef\xab\xd2A\xd4\xba\xee\xda\xebV\
-Z\x7fw\xd3\xeb\xa5)\xfePZM:\xaa\x00\x04\xa1\
-LVF\xdc\xdeMY\x11\xb1\xa4\xee\xd8\x92V\xbe\xca\
-\xdc\x9d\x1c\x1d\xd7\xc6~7\xefs\x14\xab\xc6\x12C\xd2\
-\x1cW\x83\xe4}\x8e\xb0\xddIY__\xc7\xd4\xd4\x14\
-RC\xf8\xcb\xe7\x1c\x83\x9dJ\xa3\xdet\x92z\x9e\xe7\
-\xe8\x8fF\xc8d\x15\x12\xc0w\xf6\x1d\x81\xb0\xa6\xc4\x8c\
-\xe1p\x08)%\xaa\xd5*\x88\x08\xd9p\x80\xbb\xd75\
-\xac\x8a\xb0\x9e\xe6XZYC\xa3\xd1@\x92$\xb0\xd6\
-Bf\x03|\xf4\x8a3\x91\xc2)\xe8\xeb\xeb\xeb\x98\x9a\
-\x9c\x82\x90\xbcq\xca\x02<\xc1s\xf5\x95.\x82\xd5\x82\
-~\x99\x12.\x8b\xb4\xe3jyr\xa4)\xc6\xca\x85\xce\
-\x002\x5c\x1b@\xef\x22@\x80Ht\xbb\x8bZv\xbb\
-\x8b&\x88\x1c\x9b\x9d\xee\x0dK\xcd\x0f\xde\xf4\x5cU\x8c\
->\xa0LNE\x5c\x17 \x94\xa5;^\xa5Uz\x04\
-\x80\xca\x88[1},\xd9\x92\x1eqT\xabJ\xd5V\
-G\xd5qT[\x8c\xf8\xa8KH\xab\x11\x15)\xcb\xf5\
-\x02k\x83!6\xfa\x03\xcc\xcc\xcc@\x0a\x81\x86\xd0\xd8\
-\x91X4&\x9d\x9b\xca\xd3\x14i:\xc2)\xbb\xb6\xe1\
-i\xb3u\xd4(\xc7'\xef|\x1c\xb6R\x87\x10\x02\xc3\
-\xe1\x10\xd6Z4\x1a\x0d\x10\x11\x06\x83\x01H\x08\xfc\xdb\
-\xc3}hm1+\x0b<\xfb\x98)D\xb1\x9b{>\
-\x1a\xa0Q\xaf\xe3\xa4\x99&f\x13\x81b\xd8G\xb3\xd9\
-\x84R\x0ak\xa3l\x8co\xa1N\x964\xcb\x93\xa0t\
-\xca\x18\xe2\xa4\x19\xa5\xc7\x18\xa2\x8a\x0c\xca\xe4\x9c\x85\x84\
-\x93\xf7\xc7\x9a\x1f)\x9d^\xb2\xf7\xcd\xef9\xb1\xd3\xbd\
-\xa1\x17>\xf1W\x07\x10[\xa9\x96\x1b\x7f\x7f\xf3d\x92\
-\xf7\xff\x5c\x80jE\xec\x82\xbc\xa8\x18\x82\xe01\x821\
-CHh5v[!f\xc4y\x7f\x8c\x19<6*\
-v\x98A\xba\x14\x16\x09\xeed\xa8b\xc4\xbbGB\xda\
-\x02\xab\xfd!bvK\xd09NjDx\xc7\x8f\x8f\
-\xe2\xab\x0f\xae\xe0\x8e\x83+x\xc3\xb7\xeeE\xa3\xe90\
-\xe2%\xc7\xd5\x90H\xe0\xfe\x81\xc4\x1f}{\x1fz\xbd\
-\x0d\xc4J\xa1\xd9t\xd5\x22\xfd\xde\x06\x9a\xd5\x04_z\
-d\x80/\xdcw\x04v\xb4\x81W\x9d~\x0c\xa6[\xce\
-\x8d\xbd\xfe+\xb7\xe2\xa6\xa5\x0c\xdf=4\xc2\xcb\xfe\xe3\
-\xa78\xab\x05\xc4\xd5*\xe28\x86\xb1\x06\xfb\x8e\xac\x82\
-\xa2*\xcf\xd509\xa99c\x98\xc2\xd5pE5\x10\
-\x81\xeb\x805c+\xca\x9a.\x1d\xf9\xd4\xc3\x88\xd7\xd1\
-\x8dc\x87\xb5t\xf0\xe4\xe7_\xc6\xd7\xf5b\x8f!\x92\
-\x08\xeb\xd7]\xd3\xa5Z\xef\xc8\x95\x041\xcf%\xff\x22\
-*R\x10$\x17\xa9y\xc9!b\xa1\xd0W\x8bT\xca\
- /I\x07Lm\xe3RB/\xa2\x80\xbb\xa7\x03\xe8\
-\xa8V\x0a\x89q6(\xb9\xba\xb0\x1aI>\xc2\xbeT\
-\x225.\x0d\xdb\x1f\x8e\xf0\xbc\x93v\xe0\xf0\xb0\xc0k\
-\xbfz'.\xfa\xccO\xf0\x99\x07{\xf8\xd0\xad\x07A\
-E\x86\xf6qSx\xc5\xe9OAn\x0c>z\xcb>\
-\xbc\xe2\xeb\x0f\xe0\xee\x0d\xc3\x98\xd1\xc3r!\xf1\xa6\xc5\
-\xfdx\xfd\xb7\xeeC\xda\xdf\xc0\x99\xc7\xcc\xe1-\xbf\xb0\
-\x07\x00p\xed\xdd\x8f\xe0\xb3\xfb\xfax\xf1\xd7\xee\xc7\xe5\
-_\xba\x13?\xdew\x10W\x9e\xb6\x1b\x90Q\x89!w\
-l\x90\x93jH#\xce\x07c\xa9\x86tp\xea\x05\xa4\
-- M\xee\xb4-87%\xc8\x96\xee]\xe9\x14\x00\
-x],\xe7}\x22\xe1\xd6\xcd\xfe\xe2\x01@\x09\xb26\
-\x0a\x9e\xd6\xc03_\xf3\xa6\xa9G\xa2\xf8o\x9c[\x02\
-)\x93\x09x\x89\x81\x08\xcad\x8e\xda\xfa\xa8U\xa7\x8e\
-\xdaz\x95V\xa7\xd0qR\x82\xa0;\xda\xb5'wS\
-\xe5\xd1\xaf\xbb\x93\xc1\xe3\xbc\xd2\xc0O\x97G8\xd2\x1b\
-\x02\x91\xc1\xf4\xf44.n\x10&\xa4\xc5\x9a\xce\x90'\
-\x0dT\x09\xf8\xf3\x1b\xef\xc7e\xbb\x12\x9c\xbak\x0e\x7f\
-\xbfp2F\xa3\x11\xbe\xf6\xc0Q\x5c\xf7\xf8\x08\xcf\xf8\
-\xf8-\x98\x92\x05\x92Ha\xa9\x90\x88\x05\xd0@\x8es\
-v\xcf\xe2\xcb/;\x0b \x8b\xa3k\x1bx\xe7\x8f\x8e\
-B\x8a\x08d-(\x1b`\xfe\xe4c\xd0\xac&\xd0Z\
-c\xd8\xefc\x89\xaa8\xd4\xd7\x98L\xb0\x89\x96\x8f\xe7\
-\xea\x0a9\xa4.\x10y7%\xbc\xa2\xec\xaal\x1c\xdb\
-\xca]\xf1\x84\xaf~\xd4\x99+\x96p\x9bV\xa8bt\
-\xe2E\xff\xd7{w\xdd\xff\x81\xb7\x1e\x90\x9d\x8e\xc3\x90\
-\x7f\x05\xe2\x03{/}s\x11\xd7\xe7@DQ1\x12\
-\xee\xb8U\xd9m\xf1qc7\xe5\x0a\x9f%\xffRo\
-q\xe5\x8cA\x86\xddR\x5c\xba\xa5\xc8K\x0ep\xbbI\
-\xe9\xd4E\xb9\xc15\xb2\x82%\x86\xc3\xeb=\xfc\xf8\xb1\
-eLO\xb94k\xc5\xe6\xf8\x95S\xa6\xd0\x93,\xc5\
-\xe8\x11\xf2B\xe3-\xdf?\x8c\xf5\xcc`\xd0\xef\xe3\xef\
-\xdb'\xe2\xef^x\x06.\xdd3\x859\x99a-\xd3\
-X\xca\x04jJ\xe0\xdc\x19\x85w_p\x22\xbe\xf8\xd2\
-\xb3\xd0\x88$z\xbd>\xdes\xcba\xdc\xb5\x9aA\xc0\
-\xcdu\x88\x18\x7f\xf4\x0b\xc7\x83\xac\xc1`0\xc0\xc4\xd4\
-$>v\xd7\x11T\xa4\xbb6]\x94\x80\xcd\x15\xf1e\
-z\x9a\x15\xe6\xb2\xb0c\x04a5\x8a\xa4\x16\x8c\xad3\
-\x06a\xac\x863K\x8d\xf2\x01 \xe4\xc4\xa1\x13\xcf\x9f\
-\x03_\x85\xc6\xa5\x17\x9e\xd7\xd8s\xdb\x0f\xccg\xdf\xf1\
-\x9d\xc7I\x88\xe9\xa8`\xedIUXBg\x80VN\
-RH\xf2\x014\xdf\xd9\x03\x08I6`\xea\x1aA\xc0\
-\xcb!\xf5\x12\xd0K1N\xa8\xb1\xe4\xc0'\xc5\x19/\
-\x1d\xdf\xf1\xb3\x1a6\xcfp\xde\x09;p\xed+\xce\xc2\
-(Ma\xb5F\x5c\xaba\xcfG~\x88\xe1p\x00\xc1\
-\xc5\x12$\x04\xe6\xb7\xc7\xf8\xf4\x8b\xce@\x8b\xf3\x19\x07\
-\x8e,\xc3\xa8\x04\xebF\xa00\x04\x95\xf5\xf1\x94\x99I\
-\xcc\xb5\x5cMX\xde[\xc3\xdb\x7f\xb8\x84\x0f\xdfq\x84\
-3\x81}\x0cU\x15/8q\x1b>{\xf9^\xa4\xfd\
-\x0dLMNBH\x85]\x1f\xfa.\x8aa\xbf\xbc+\
-\x22\x891\xa4\x9c+S[v[\xaatS\x9c1\xd5\
-\xa9+\xec\x90\x15\x90\x00\xe2bX\xba{\x9f\x9ap\x1a\
-^<\x14d_\xf1\xc2\x8f\x5c\xf9-\xd9^\x98W\x17\
-\xdc\xf0\x83\xfc\xb3\x7f\xf2\xed\xcb\x88hR\xe9\x94\x00\xc0\
-\x08_`\x90\xc2J9\xe6\xe2\xf9\xd0\xc9!\x22*1\
-\xc4\x19'(b\x8bC\x8c\xe8;\x89A\x04\x85\xcf\xde\
-\x18\xbej\xbd<)\xee\xf2\x8c\xa8\xd4\xd1\xd9\xb7\x86\x9b\
-\x0f,\xc3\xe69\xea\x8d\x06\x12\xa5\xf0\x91\x8b\x8eC\xa1\
-\x0d\x7f\x90\x03\xcd\xeb\xf7o\xe0\xecO\xdf\x81\xef?\xb6\
-\x8e\xb5\x8d\x1ef\x9bu\x1c?\xd3\xc2\x99s\x0d\x9cZ\
-'\x9c\xbek\x16\xdbZuhmp\xfb\xa3\x87\xf0\x82\
-\xaf<\x88\x0f\xdcz\x18\x82c\xa6\x22\xaec\xaaV\xc5\
-\xef\x9f\xbd\x0bi\xcf\xd1l\xa9\x14>\xf4\xa3\xfd(\xfa\
-\xeb\x5ct\xcd\xa7<\x1bl\x92C\xa2<-\x8d!M\
-\x01\xa9\x0b\xe7A\xf8.\x09\x88`\xa4[|\x17\x22(\
-\xef\xa6\xdc\xba\xaa\x18V\xc4\x10D\xf5d\xb8v\xfc\xf3\
-\xeeY3\x91 Ko\x03\x8a&\xf0R\xc6\x0c\xa1\xf9\
-xI\xb6p\x08L\x863} \x87!%\xb5e\x06\
-R\x84\xb7[\xcb(\x96km\x19\x03\xc0\x99=i\xb2\
-\xc0\x0f\xbb\xa86\xe7\xa3\xdf\x92\x1a\xbf\xff\xcd\xbb\xf0\xdd\
-\xd7=\xbf\x8c+\xce\xdf\xd5\xc0\x1b\xcf=\x09\x1f\xb9\xed\
-q\xc4&\x03\x88 \x92\x1a\x0e\xf6s\xcc\x7f\xe2&\x5c\
-|\xfc4^t\xdan\x9c2=B\xd5d\x80\x8c`\
-\x14\xe1@o\x05\x9d\xfb\x1e\xc7\x17\x1f\x5cG!\x22T\
-\x04\xf1\x5ck\xd0$\xf0\xdbg\xee\xc0\xb3\xa7#\xd4\x1a\
-\x0dH)\xb1\xd4\x1b\xe2_\x7f\xfcPyQGr\x96\
-\xb1\x94Ct\x06\x15\xcc\xd5\xb9-SR[\xa9\x99]\
-\xc5\xe3\xb1/\x06\xf4\x05x\xde\xdd\x83,)\x9d\x0a\xa3\
-\xe2\xea\xef\x02\xae\x0c\xa8\xf9\xbe\x1bZ\xb1\x1e~\xdb\xca\
-\xe8\x19eAB>\x84U*p[C.t\x0e\x8e\
-\x9b\x8f\xc0\x11\xe4\x9d\xf9\xa48\xcc\xe0\x08\xbctK\xce\
-X\xd2j\xa6\x8bN.Q\xb6`%\xd4E\xb9\xcad\
-\x10\x5c\xd3\xf5\xee\x0bN\xc4\xef\x9c1\x83\xcc\x10\x1a\x8d\
-\x06\xfa\xb9\xc1\x1b\xbe\xf2\x13|\xf1\xc1\x15T*.\x0a\
-\xf6\xae \x131\x0c\x11f\x91\xa2Z\xadAD\x09\x86\
-\xda\xa0\xbf\xb1\x0e\x1bW\xa0\x82\x1c\xb9\x8e+\xe8\x15\x02\
-\xefz\xde\xf1\xf8\xdd\xd3\xa71\xd1jB\xa9\x08E\xa1\
-\xf1g7\xdc\x83\xbf\xbd}9Pms>\xc5\xa2,\
-i*\xddT\x91\xb9RS\x9fj(\xdc\xd5\x0a\xe3\x88\
-\x11\xcfM\xb1\xb2\xe1\xa8n\xa8\x86\xc7\xf9\xc0\x97<\xbd\
-;N\x07\xef\x92\x00\xd0Z{\xe4t+\xd5N\xb7\xb8\
-\x16q1\x80Q\xcaQ[\xd8\xf2/\x19\xfey\x92\xf5\
-\xc7uS\xbe\xe2\x22\xael\x8a;J9\x841\xa4\xbc\
-\x17N&\xa0\x8b\x0e3\xa4\xce\xc6\x80o\x0awwD\
-U@$\xf0w7=\x88[\x0e\xf7\xd1`\xedI\xe4\
-#|\xec\xca3\xf0\xe6\xf3N\xc2\xa0pT\xd4\xdfI\
-\x8f%\xd02C\x0cE\x82\xa3\x85\xc0\x91a\x8e\xa2\xbf\
-\x06Y\xadCENM\x88\xb3\x1e\x8a\xa8\x0a\x03\x85\x8f\
-^v*~{\xef\x04&[-(\xe5\xaa\x1f\xbf\xf3\
-\xe0cx\xff\xed\xcbe\xdc\x11\xe9Q\x10whHS\
-\xc0\xa8j\x19\x04\x0a2(o\x05\x17\x19\x08\x02VU\
-\xca<\x8f\xc3\x0c\xce\x98\x96\xeb\xc8\x19\xd3\xac\x1f\xdc\x9f\
-\xb7\xf5\xe3\x7f\xfa\xf5\xaa\xfc\xbd*dQ\x9d<\xce\xca\
-d\xd2\x053\x19,d\x19G\xa8<\x85\x951c\x86\
-+b\xd3Qe\xcc\xa6\xf2A\x80\x11\xdaU\x8b\xc4\x8d\
-r\xb1\x1d\x8646_=.\xa3\xde\x1cQ>\xe2\xbf\
-\xcfn\xacH\xd1j\xb6p\xcaL\x0d\xa7\xb6$\x94\xd5\
-\xf8\xf2\xbe\x1e\x0aKHS\xb7\xfb\xe2\xa4\x8a\xf7^t\
-\x12>\xff\xc2\x93\xb0g\xa6\x09\xa1\x22Xk \xb3!\
-\xb4d\xd1\x92\x9c.\xe6\x16S\x02V\x03i\x0f\xaa\xda\
-\xc4Y;&\xf0\x8d\x97\x9e\x8eW\xec\xa9cff\x1a\
-R\xb9\xeb\x0c\xb7\xef?\x8cW]\xbb\x1f\x9a\x00i\xdd\
-\x5c\xf3\xb8\xe1\xe4\x0f\x9b\x8fi<\xc0w#s\xd6\xae\
-X\x1e!]z\x10\xa99D\x90c\xb5\xdb\xaah\xbc\
-\x8e\xc5\x10:\x0a\xe6\x9a\xf5+\xc3\x89]:\xfa\xdb\x14\
-\xf6\x9f\xab\x93M\x00\xb5H\x8f\x00!\x9c\x00VZX\
-q\xd0\xe7\xdc\x90\xf5I~vC&b%\xd4\x18D\
-\xdac\xc8\xb8\xf4\xa6\xa4\x8bA\x05\xbc\x13\xdbrH[\
-\x8c\xef\xec\x15\x19\xb2\x22G{\xefn\xfc\xc9\xf9'\xe2\
-\x8cI\x89D\x02\x07\x8b\x08\xcdX\xc1f#\xac\xa7\x1a\
-;g&K\xe1\xf0%\xa7n\xc7E'\xef\xc2\x97\xef\
-=\x82o\xde\xb3\x1fw\xae\x08\xdc\xdf3 S .\
-R\x0cU\x04\xa3\x81Dh<\xb5%p\xee\xde\xe3\xb1\
-p\xd2v\x5cq\xd24T\x91BU\x5c\x01\x1d\xac\xc6\
-\xf5\x0f\x1e\xc2\x9b\x16\xf7c-\xd3H\xc8@\xda\xb0\xf2\
-2\x83\xb4\xc6\xe1\x9f\x97\x91\xc8\xba\xc2\x0er4\x1c\x04\
-\x8e3\xb8\xcaFHGm}e\xa6\x07t\x8cON\
-\xe9\xde]<\xb7q\xe0\xd4\x8bu$>{\x08\xcd\xc7\
-~:\xe7*\x08#2*\x11\x8e\x0e\x0e\x9c\x05\x1d\xf0\
-0\x1bbj\xeb\xd9U\x5c+-\x1eo:)\x1c\x14\
-\xc6\x1c\xf4\xf1\x13H\xda\x8fM\x01is\xe8\xa8\x0e\x22\
-\x87\x19\x83\xac\xc0\x8bN?\x0e\x9f\xbc\xf2t\x88\x22\x85\
-!@Vj\xd8]\x15H\x07}\xfcpi\x887]\
-\xf70>t\xc9^<{Z\x22I*P\x95\x0af\
-\x01\xbc\xf2\x84:^v\xca\x99\xe8[\x89\xe5a\x8e;\
-\x1e=\x84<\xaa@D1\xb6W#L\x8b\x14\xc7o\
-\x9b\xc1\xb6f\x0d\x89\x14e\x1d\xb0/\x9e\xf8\xd2\xed\x8f\
-\xe2\x0f\xbe\xfb8\x96F\x061\x19\xb7\xf3\xa3\xea\xd8\x85\
-\x1a\xc3\xf1\x18\x02|\xab\xb21\x98\xf8\xc4I\x80\x19Q\
-\xa9\xf1\x95\xd4\x96\x8b\x01c\x7f\x03\xact\xf7\x03\xd2I\
-UX\x19\xf5v\xed\xbb\xd9F\xb3\x0f\xde\xac\x00L\xeb\
-\xa8\x02#\x13\xe1}\x9f7\x86/j\x1b\x1bck\x5c\
-\xe1\x93\xfcL\x0fIs\x9c1\x1eG\xf9p\x9c\xd0\xb1\
-\xee\xf2Ly\x93\xc9\xe6\xb0E\x8e+O?\x0eW\xbf\
-\xe4\x0cdY\x86\x5c\x9b\xb2j\xdd\xab\xb6g\xec\x9a\xc1\
-\xed\x87o\xc7\x8b>s\x13\xfe\xe2\xe2\xbd\xf8\xefg\x1f\
-\x0fK\x84\xde\xc6\x06j\xb5:\x92$\xc1\x84\xb5h\xe8\
-!\xcex\xe6\x09PQ\x04\x22\x8b\xd5\xd55LN\x1e\
-\x03\xa5\x14\x8c1X^Y\xc5\xf4\xf44\xa4\x94(\x0a\
-\x8dww\xef\xc0{n]A%R\x90\x1c$n\x9a\
-kp\xc5M\xda\x1c\xd2\x0b\x83DP6\x07`aU\
-\x15\xc2\x12\x94q!\x82\xe1$\xdcX`\x0d\x0b9*\
-\xe3\x8ci>D\x91\xd4\x84\xab\xb4,V\xcf\xfd\xc6\xdb\
-\xa2h\xfb#?\x88\x0e\x9ep~\xddkQJo\x8e\
-;\x94Na<\x86X\xcb W\x05!\x90C\xe2Z\
-))\xb8\x08\xbcQ\x9e\x04\xa53\x14qP\xc4Vf\
-\xcf\x1c(\x92\xce\xf1\x82\xa7\x1e\x87\x7f\xb9\xfc4\xa4i\
-\xfa\x84L\x9f\xb5\x16\xf5f\x13U\x00;b\x8b\xa1\x06\
-~\xf3\x9a\x07\xf1\xb9\xfb\x96\xf1\xa6\xa7\xcf\xe1\xecc\xa6\
-q\xc2\xa4\xf3\xdb\xa3\xc1\x00\x8dF\x03\x8a+\xe2\xfb\xfd\
->&&&\xca\x8a\xf8l8\xc0\xec\xec\x0c\x1e\xdd\xc8\
-\xf0\xbdG\x8e\xe2=7\xdc\x83;{@-\x89\x02Z\
-\x1e\xca\x1f\xe1\x5c\xb3\xf2\x8e\xba/ \x97d\xc6\x11\xb8\
-v4\xdc\x95<\xf9\x8b\xacj\x8c\xc5\xc5h3\x16s\
-\x06\x95\xd7\xb1\xa8\x0eV\x86o\xbf\xb7\xa7\xa3\xfe\xd4n\
-\xa3\xa3J\x8a\xb2\xd09r\xc1LY\xd9\x9d\x8c1#\
-wO\x1cy\x0bG\xdag\xfa\x1c\xa0;\xb7T\x1bc\
-HI\x17Q\xbe\x88\xe0\xb9yT\xa4\x18\xe4\x1aW\x9c\
-~,>z\xf9iHL\x06C(\x8d\xb1\xb1\xb1\x81\
-(\x8a\xca\x93\xb2\xbe\xbe\x8e\x8d\xdc@U\xaah\x11\xe1\
-G\x0f\x1d\xc4\x7f\xdf\xbf\x8c\xd3w\xcd\xe0\xd9;[8\
-\x7f.\xc2\xd9\xc7n\xc3\xa9\xad\x84S\xa7#LNN\
-81\xc2\x1a\xdc\xba\x7f\x09\xb7\xaf\x19|\xf7\xf1\xc7\xf0\
-\x93\xc7Wq\xdf\xa1\x15\xe8\xb8\x8aj\xac\x5c\xc1\x9d)\
-\xca2\xd8qz\xda_\x8bN\x01\xd0&9\x04\x10\xa5\
-1b=tA_Ye3\xd8\x14\x22\x8c\xc71W\
-\xf7\xfbue\x16Z\x8c\xd6uTy\xf84\x00\xd1\xf2\
-\x8e3\x8c\xb2Y\x7fS\x1c\x01z\x22f\xe4\xfd\xb1\x9b\
-\xb2[\xdcT8\x86K\xe0D\xdac\x08G\xb1&g\
-\x0cq\xbbk\x94\xe7x\xc9\xe9\xc7\xe33W\x9d\x89<\
-\x1d\xc1\x10\xca\xb4\xea`0@\x1c\xc7er\xc9\xa6\x03\
-|\xf8\xf6%\x18\x19#\xf24:qs\xbb\xf3\xf0\x06\
-\xee\xdb\xff8>[m \x8a\x1eC,\x80\xed2C\
-\xa35\x01\xa1\x14\x8e\x0e2\x0c7\xd60\x8c\xea(H\
-@\x1b\xe7B)i@r\x04>\xc67\x9e\xab-\xc6\
-\x92\xba\xe1dR\x89\x19#\xa6\xb6\xbci\x8b\x94\x89\x8f\
-O=\x94rHY\xa3\xbc\xc9\xddgO\xb6\x8e\xf5\xa3\
-$\xa2G\x00 \x1a\xfe\xc1\x054\xfb\xce\x7f[/\x92\
-\xe6\x13\x8eS\xe8\xfb6\xc9\x1f\xc5\xa8\xa4\xb2n<\x0c\
-\xa8-\x1b\xc3\xfba\xa3\x9d\x12\xca\xaf7HS@\xe8\
-\x0c\xbft\xfa\xf1\xf8\xe4\x8b\x9f\x8e\x22\xcbP\x14\x1a\x13\
-\x13\x13 \xa2M\xd5\x22D\x84t8\xc4\xb7\x0fl\xe0\
-=?8\x80\x8ar/*hU\x09\xe6:r\xe4\xc2\
-J\xe4y\x81\xb8\x18\xe2\xbe\xa8\x06;r\xc5pI1\
-t\xf2\x87\x81\xa3\xe5\x05?\x5c\x06\x9f\x18\x0bT[[\
- *2\x8e\xc0\xbd\xa4\xce\xaa-\x05rH\xe9\x96r\
-\xc7JCw_^\xe1\xf6\xea\xf7\xe6`\xf9\x89\x9a^\
-\x03$\xe4\xa1\xde\x1f^|\xe0\x92\x8b\x9f\x97\xc8\xb7&\
-\x90VUV\xac\x8a\x8c\x0f\xda\x5cr\xc9\x07FC\xa6\
-\xb6\xbe\xe2\x22E\x11\xe87Q\x91\x8e\xe3\x08\xaf\x84\xc6\
-|\xedY\xbb:\xaa\xbc\xcc\x96\xa50y\x8a\xf6S\x8f\
-\xc3?]~\x1aL\xb6\x193\x06\x83\x01\xac\xb5.\xb9\
-D\x84t8\xc0u\x8f\xac\xe0\x8d\xd7<\x80\xc2\x98\x92\
->nR\x03d\x5cry\x9fB\x86\x90Pd\x90h\
-\x16\x02y\xe7;Z\xee\x98]8WprI\xe9\xdc\
-\xcd\x95\x93K\xca\xd7,3\x9br\x05\xe4\xcc\xb6\xfck\
-\x0f\xac~\xbb\xb9\x89@\xfd\xe6\x82\xf2`\x93\x8f\x93r\
-Ap\x0cAJ\xe7?\xfc\x22\x10[\x19\x17\xf2\xbd9\
-l\x11\xd7\x1e\x06\xd1j\x9c\x0d`dT\x0a`n\x9c\
-\x8c\xa9-\x073\xfed\xb8\xec\x99\x97\xd4\xb5+\xf9\x8f\
-\x82\x04\x8d\xd1\xd0\xaaZ~pVh\x5c\xbcw7>\
-\xf1\xa2\xa7\xa3fs\x10Pb\xc4\xc6\xc6\x06\x94\xcf\xf4\
-\x11\x90\x0f\xfb\xb8\xe9`\x1fo\xb8\xe6A,\x0d2T\
-\x8a~\x19\x13\xf9\xac\xa4\x91\xf1\xb8\xd6\x96\x8b\xb4\xcbb\
-\x89b\x04]V\x8b8\xb2\xa1\xf9\xdeJy=!r\
-*\xac2\xf9x\xb11\x8e3|\xbaz\x9c\xe9\xf3\x19\
-SWU\xa3\xcbB\x8f\x01\xdf\x00c\xb7\x95\xf5\xdd:\
-\x96\x85\x1dn\x1c*\x17n\xae\x92\x845b\xf2\xc8\xfd\
-\xdf|)Pt;\xd7S\xc4;\xf7Q\xa5\xf3\xe5\x22\
-\xa9\xcf=9\xb5\xb5[\xa8\xed\xd6\xb1\xd9Bm5\x22\
-\x7fR\x98>\xc2\x14\xa8\xd6\x1a\xf8\xfcU\xcfp\xd7\x8e\
--\xa1\xd1\xa8o*b\xf3\x98\x91\x0e\x07\xb8\xf9\xd0\x10\
-W~\xf1\x0e\x80\x80J1\x0c\x5c(\xf1\xbf]\x1b\x17\
-K\x84s\xe5,dQ\x09\xf1mX&\x97\xdc\xeeL\
-K\xbc\x93FC\xea|\x8c!\xba\x80\xb4\xc6\xa5Y-\
-\xa0l\xc6\x99\xbe\x84\xa9m6\x0e\x96-9bS\xbe\
-\xed\xc8!\xc2\xa6\xb9\xf67\xcfm\xbcn$\xac\x15\x95\
-tc\xdf\xa3\x7f\xfb\xe6\xeb\x84K\xa5C^~\xfe3\
-\xf0\xaa\xf7]q\xa4\x88*\x07\xad\x90\xe4&<tn\
-\xa9L.\x0dK\x80\x16\xb6@\x94\x0f\x90\xc7A\x85E\
->D\x9e4\xc6\xb5I\xc5\x88\x7f\xce\xca\xa8\xce0\x92\
-U\xbcd\xef\x0e\x90v\x15\x86\xcdf\xb3\xac0$\xa2\
-\xf2~\xc6h4\xc4\x0d\x8f\xae\xe1\x97\xbfrW\xb9;\
-\x8d\x8cJ\xb7\xa4\x8aa\x99\x7f/\xe7\xca\xb4\xdb\xbd}\
-5\x1c?Lf\x8bq\xee\x05\xceM\x8d\xc7n\xaec\
-\xda\xee\x00\x5c\x99\xcc\xa9\x0d^\x1e\xb1\x1aZ\xb9j\x11\
-i\xd2RRw\x19\xd4\x14V\xc8\xf1=\x97M\x85\x1d\
-\xa6\xc4\xb7P\xc3\x1b\x17v\xb8q\x9e4\xde\xc1o\x84\
-\xc5DHdZ\x9b\x8a\xfe~\x0d\xa9Q\xf1\x7f\x80,\
-T1$\xcdG\x1fd\x02\x10\x15\x003\x92\x82\xa9\xad\
-`\xf6T0{\x92:\x870\xc5x\xcc\x85ay\x5c\
-\x87%BK\xe4?\xb3\x88\x8d\x00d\xc3>n\xdc\xbf\
-\x86\xdf\xba\xf6\x01\xac\xa7\x05\x17\xd8\xc9\xd2M\xa9|T\
-\x1e}\xf0\xc5\x9f\xd2-Q\xe0B\x85czRg\xc8\
-\x03\x0c\x91\xa6p\x1b\xa5\xd4\xa2\xdc\xd8\xbb)\x18Sb\
-\x86*F\x00Y\x14\xfe5\x87\xc2\xc9#\xa5\x1c\x92\x0f\
-a\x11\xa4&\xf2ay\x09\xa9\x9c\xab\x8a`\x85\x04H\
-C\xe5<W\xb7\xa9I\xea\x91\xd0Qr\xb07s\xec\
-\xa7/\xbd\xf0\xbcD\xb8>$\x85\x04A3w\xfed\
-\x9c\x0d\x84\x8e\xaaAa\x18\x17,\x94\xc7m\x04\xad\xc2\
-\x0a\x8c\x8cw\xcf\xcfPB\xad\xcb\x9e\x81\x80\xc4d\xb8\
-\xf3H\x1f\xad\xa6+\xcd\x09\x8b\xd8\x88\x08\xd9\xa0\x87\x9b\
-\x0f\x0f\xf1+_\xf9)\x96\xfa\x19\xaa\x85\xf3\xb3e1\
-E\xde\xdf,A\xe4\xfd21\x06\xeb\xaa%5\xcb\xfd\
-\xb0\x9b\x15ea\x0d\xa4\xc9\xc6\xc62.\xd3W\x16(\
-\xe8\xbc\xbc\xc2M\xe4_\x96\x10<\xe6\xf8L(\xf7\xf7\
-\xfd\xf5;\x8e3\xa8\xbc\xf7\x92\xf8:+7\x8e*0\
-l\x9cq\x12O\xf1\x5c\xf9mH\xa1\xde~\xc5\xc7^\
-\x0e\x1d\xd7\xa6\xfd\xb5h\xd9\xed.\xe2\xe2K\xda\xf2\x7f\
-\xbd\xe3\xaa\x81\x8e\xab_ !\x85 C[1b\xec\
-\xa7\x1dF\xc4\xf9\x90/X\x8aq]\x15\x07\x81\x9e.\
-:%\x94\xa0L\x8eD\x10\xba\x8f\xf6\xd1yh\x19E\
-\x96Bq\x11\x1b\x98\xda~\xf7\xb1\x1e\xae\xb8\xfa6\xe4\
-\xda \xd1\xa3\xf2\x03\xca+nQ\xad,=u\x8ar\
-}s\x0c\xc4xUbF\x19Wh\xce\x7f\x8c%\xf4\
-\xa8\xe0SN(O\x8e_\xec\x92\xda\xaa\x04\xb0\x04\xa5\
-sX\xa8\xb2\xb0\xc3\xc5\x1dc9$f\xc3o~i\
-\xa2>\xde\xc4\x99\x0f\x09T8WAB\xde\xd1\xd88\
-|\xed\xa0\xb5sGpmZ\xa8\x85\x85y!\x88Z\
-Y\xbe/\xbb\xed\xdc_\xfb\x812\xfa\xf7\xa2\x22\x13\xbe\
-\xdcEZ\x83Hg\x9b\xf2\xc8e\x04\x0eWf\xefU\
-\x5c\xffV\x882\x9a\x95O\x11T\x5cT\x91(\x89\x7f\
-\xbfm\x1f&*\x0a\xc7\xccNA\x0a`\xdf\xd2\x0a\xbe\
-x\xf7!\xbc\xf5\xfa\x871,\x9ca\xc9\xd7tqD\
-?\xf6\xcb.\x15\xea\xeb\x80\x1d\xd7\x0f\xd4\x81r\xae\x8c\
-_>\x11\xc6\xc6Q\xac\x1e\x94s\xd59\x94\xd5e5\
-H\xe4\xef\xd3{7\xa5\xb3\xe0\xe2*!*2\xae5\
-H\xf8~}\x0aR\xac\xda\xc2\x22*2wj\x98\x08\
-E\x9a\xef\x8ep>>rwG\x88 M\xa4G\xef\
-\xb9\xe0[\xef\xf8a\x9e\xb4\xfcK\xd9\x15! \xfd\xb5\
-h\xf8\xc6\xbfs\x7f\xfc\xe9\x8ff\xd5\xc9_\xb7R\x91\
-\xb0FD\x9a\x0b\xc36e\xcf\xaae~C\xda \xc9\
-\xcf\x8f\xca\x98\xd8\xb91\x97=\x13\x5c\xf7\x0b\xc4z\x04\
-#$\x10Up\xfcT\x0d3\x22\xc7J\x01\xec\x1fX\
-\xe4\xd6\xa2Z\x8c\xa07\x15S\x0c7\xe7\xeb\xc3\xdd\xe8\
-\x03\xd8\xb8\x12\x80f6\x9e\x9b\xd5N\x0e)\x0b\x108\
-\xf1\xc5nK\xe9\x0c\x82\xcbbI\xf0\x5c\xfd\xddG\x80\
-\xef\xcf;\xea:\xce\xa0\xc6\xe58\xc9\x07\x0e[\x95\xdb\
-8q\xe02\x05\x11\x87\x08\xe31\x17i\x13\x09)\xa4\
-\xd1\xdf;\xe7\xdb\xef\x7f\xd1\xdc\xd2\x9d+W\xdf~\xb8\
-|Z\x03\xc0\xc6\xf8y\xa6\x85y)\x88v\xfeX%\
-\xef\xb1B^\x22\xac\xd9=\x8e$\xc5\x96+\x03\xbe\xf2\
-;\x1f?\xee\xc5\xc6q\xefGqT\x0b\x8co\x1e\x99\
-\x1cVH\x90\x8c\x01kq`i\x19\x8f\x94q\x04\xa1\
-RlvS\xac\x84\xb2[\x0a\xa9\xad\xdcL\x1f\x11\xb8\
-\xa9J8\xd7\xb0*]\xb3t\xc3.U\x17n\xe3x\
-\x80\xd6~\xae\x9e-eN\x9bRaP\x17\xc6<\xbc\
-\xd8JmN=\xc8 $\x88\xfd]\x11\x97\x81-\xe2\
-\x06\x91\x90BX\x9d\x9dt\xef\x7f\xfez\xb7\xd3=*\
-\xdck~\x09?\xad\xb1\xd4\xed2\x86,\xb8\xe6%s\
-\x10\xe2\xf0\xea\xbb_~\x9f\xd2\xf9\x07\xe2|DE\x5c\
-'/\x7f\xc4yh\x0c\x8e\xd0\x93\x1a\xbb\x02.\xc3/\
-s\xe29\x83fR\xd2KG\x17c\xae\xc8\xc8\x98.\
-\xaa-\x92\x83wC#\xde\xf92\x90\x1cjO\x8c+\
-\xd8M\xc5\xf9\x88\xe5\x90\xf1\x5c\xf3\xf2M^=V\x13\
-\xf8\xed\xac2\x9f\xef1\xc4\x1a\xc6\x10g,\xf7\xe2\x8f\
-\x8b+\x94\xce\xc7W\xb8\xadsS\xae\xa0\xdcc\xc6\xa8\
-\xac\x80\xf7c\xaf\x5c\x08\xc3\xa9\x88\xb8A$\x84\x90\xa6\
-\xd0\xd3\xcb\x0f\xbd\xfc\xd6O\xff\xc3\xbdb\xdc\xe9z\xc6\
-\xbf\x87\xbf\xb00/\x15\xbf\x13\xd8\xe47{\xf5\x95\xe7\
-=-\xdav\xe4\x9e{\x1e\xdds\xfe\xa9$\xe5\xd3\xa4\
-\xd5\xa4L!\xca$\xbfq~W\x07\x18\xe1T\xdcZ\
-PLl7%\xfd\xdd{S\xee\x01\xe4\xd8\xbb1\xde\
-\x9d1c\x86\xf1\xc5\x12E\xea\xe8\xe2\x93\xfae\x83H\
-\xe7\x18\xe3[\xe0B}\x01^\xa9\xda\xf2\xc6\xb0z\xac\
-\xdajVq\xfd\x5c\x8b\x14\xc2G\xe0\x9b\xc6\x95\xd2m\
-\x955\xcb~\xec\xafp\xb3\x0al\xa2-\xf8V\xd2p\
-\x8fo\xee&\xae\xb4F\xd7\x86+\xbf\xff\xf8_\xbf\xf1\
-S\xef\xe2zj~\x89\xf4h\xd0|\x12\x92\x1b\xcb\x0f\
-\xfc\xabq\x83\xd6\x8e\xd9\xe7_\xd3YNk3\xaf\x90\
-V\xffD\xe9L\xe8\xa8B\xe3\xa3\xaf\xc7\x92\x83\xc7\x8c\
-\x12\xf4|\xc5E2\x96\x1c6I\x0cC')\xf8\xe7\
-*\xb2\x81{\x11(\xa4\x8b\x9e\xc1x\xba\xe8$\x86\x80\
-v'\x9b\xdc\x92f\x9d\xadt\xa1<7i\x03\xcc\x00\
-\x97\xc1\x82\xca*\x9aH\xa7 )\x183\x9c\xcf')\
-\xa1\xfd8\x1f\xc0(\x8f!4\xbe\xf7\xa2\xbc\x1a\xde\x0b\
-\x8c\xc1\x85\x1d\xa1\xa4\xee\xf0\x8fHH\x12dP\x1b.\
-\xbf\xebw\xde\xf3k\x1f\x12\xe3K\xb6u\xbe~\xee;\
-ET\xb6^\x8b\xde\xf4j\xdc\x0b.\xbe ^\x9e=\
-\xe5\xf8\xfb\xcex\xc9\x97I\x883\xc6r\x08\xbb\x02r\
-\xbb\xd1\xe5\x04\x04\x94\xf5\x0c\xa5\x0aA.\xbb&\x08\xd0\
-Q\xe2\x94Q\x93\x8d/\xe1\x93\x97\x1c\xc6\xcah\x5c\x8c\
-l\x11W%\x09E\x82\xac\x88}\x04\xee\xa5\x9bRq\
-\x96\xc1\xb8\x11\xb0\xab\xd1\x96q z2\xc0\x17Q5\
-\x05\x90(\xab\xa5 CZU\x84\xe0\xa26'\x0c2\
-{2\x99\xcb\x81\xfb[\xc2z\x04\xe3\xdd\x14\x97@\x15\
-\xe5\x9dt\xf2\x18\xc1wG\x82\xb9\xb915{\x87\xfe\
-\xc7\xa1\xf7\xbd\xe1\xbd\x1c\x91'\xe2\x89O\x94<\xe9\xd3\
-\x1a\xd3\xbeib\xbb=_\xb5RM\xdd\xf2o\xff\xf2\
-\x80U\xf2r\xa5\xb3\x1b\x95\xc9|\x94K\x8e\xea\xe6.\
-\x8a\xe5\xc5v\x12C\xb5\xbc\xa3\xee\x94\xd0d\xf3\x9du\
-_\x81\xa1\xf9\x89#\x11\x11K\x0a\x0f[!\xdfC\x90\
-\x87\x04\x19\x11\xe9\x94tT\xa5R\x0e\xd1^\xde\x10\xa5\
-d^\xaa\x01\xc6\xd7\x09\xfbwL\xf8~F9\xceH\
-\x99\x0cET\xdd\x07\x81\x17\xc7\xc5\xe0c\xd2\x16#\xcd\
-\xb7\x86\xc7'\xc7\x9d\x04g\x0c\xc1\x80N\xe3\xb9J\x19\
-\xdcs\xf1\x01\xa6\x1d\xcfM\x00\xd2\x15zPQ\xcaF\
-\xc5#\x13\xeb\x07~90FM\x8c\xefq\xfa6\x1d\
-\x13\xc1\xd3\x1aJ\xf2\xc3e\xd5\xe0\x1atE\x084\x04\
-\xb72}\xcd\x87/?t\xec#\xdf{\xb5V\xd5\xf7\
-\xf1\x84\x85\xdb]\xd5\xf2\xe8\x0b\x22\x14%F\xb8\x07$\
-\xb5/\xb0+\xdc\xc3e\xdag\xcf\xdc\xeb\xd4d\x5c\xe2\
-K$Y\xff\xfb\x95l\xe3\x8a\xf5?}\xf9\xffT\xa6\
-\xb8<\xce\xfa\xb7\x1a\x19\x0b+\xa4(s\x0a\xb2R\xb2\
-)\xa5\xb3\xb1\xa2\x1cR[lUm\x89\x1c\x9e\x91(\
-T\xf5\xbb\x80\xb8\xec\xf2/\xbe\xe1\xbb\x97~\xf5\xf7\x7f\
-WG\xd5\x97\x80\xe8\xae\xb8\xe0g?TB\xee\xa9\xa8\
-\x81\xc37\x19\xb3\xcb\xe5W\xe58I\x17\x15C\x96\xfb\
-=F\xb8\xf1xn)iU\x11N\xa9(>=\xb7\
-\xf4\xd3\xab\x1e\xff\x9b\xdf\xbe\x9a\xdfF\xae\x09\xf7D\xc9\
-\xd1\xa07c\x1c\xf4\xdd\xaa\x03\x10\xea\xc4\x13\xf7(n\
-\xfe\xe5\x1f\xbb\x9c-[P/\xcc'+\xdb\xf6L\xee\
-y\xf0\xfa\x83\xb7\x9e\xf3\xbak[\x1b\x07\xbe\x03\xc8\x17\
-\x9a\xa8\xda \x08R&\x17\xae\x02#q \xa7\xddQ\
-\xb7|\x137.\xe9\x22\xdf\x1dqo\x83\xb8\xc7\xbe\x88\
-l}\xb0\xf4\xee\x93\xef\xfb\xe6\xeb\xee\xfd\xe8_\x1c\x5c\
-h?_<e\xffMb}\xe6\x84\x7f\x1a\xd5g\x12\
-a\xed/\xc4z(tTs\xaf\xeaX\x83X\x8f\xca\
-\xdaZa-b\x9f\xef\x10\xc2\xdd\xf1\xb3\x85\x8f\x89H\
-\x99B8|K\xfeXY\xfd\xeb\xcf\xf9\xce_g\xa3\
-\xc6\x9c\xcc\x93f\xff\x82\x1b\xde\xfb`\x1e\xd7\xbe\xbc:\
-{r\xa1\xa3\xca\xf3\x04\x91\x88\xf5\x88\xb8\x12S\x08\xa2\
-\xf1\xeb\x0d>cZp\x0dr\x19gl\x1aS\x5c\x0c\
-\x85\x8e\xeb\x82\x84x .FW>\xeb\xa6\xff}\xf5\
-\xeeGoz\xe0\xbe\x03K%\xb5\xf5=s\x19\xc0k\
-|\xaf\xd3\xb7\xe9\x88\x01\x8c\xd4C\x0f\xed\xb3\x0f=\xb4\
-\xcf?\xbf4\x1b\xb4$\xaa\x0a\x81i\x01,}\xf5\xfb\
-w\xa2m\x1f\xa8\x9dz\xf7\xd7\x8e<x\xca\xa5\x7fE\
-BZe\xf3\x93\xa55\xb1\x8e\xab\xb1\xab\xc0(\xca\xa8\
-V\x10\x9129HJ\xe1\x8d\xa1L\x06\xa3\x22me\
-tX\x90\xfd\xd6\x8eC\xb7\xbfj\xff\x07\xdf\xf2\xb9\xd7\
-\xdfs\xa7{\xa7K\x889\x08q\xf4\xb6\xcf|xT\
-,~\xf6\x9ac\xcex\xc6\x8d\xfd\xe6\xce\xdd$\xe4\xa4\
-\xb4\xa6\x1eo\xc2\x04\x83X\x0f\x91\xc7u\x82\x10\xc2\xe1\
-[\xea\x85AR\xa6X\x8e\xf4pQG\xb5\xcb\xfb\xef\
-z\xf1W\xceO\x8e6\x85\x10I\xa7{\xc3\xda\x09\xa7\
-\x9c\x8c\x95\x99=\xad\xfapE\xff\xf4\xe3\xef\xfbz\xfd\
-\xfc\x17\x7f02\xa3i+\xe3mV\xc6\x89 \x8a\xdd\
-\x5c\xe3\xb0n\x8a\x8c\xaa\x881\x9e\x8d\x02|3\x88\x8b\
-\xe1j\x11\xd7\xef#!\xff\xc7[\xde}\xe5o&\xfa\
-\xfe\xe1\xb0>\xb7t\xed\xf57R\xd0g\xeb0\x87\x18\
-5\xdf3\xc5\xb7\x07d\xb6\xb5\xba\xf5i\x8df\xd8\x8c\
-\x8b_\x8d[\x0e\xdb\x89.\xed8c\xe5\xf6O\xff=\
-\x08Pg\xbe\xea\xcd\xc7<tr\xfb\xb9\x00.\x88\x8b\
-\xd1y$\xc4q:\xaan\xf7\x99\xc1\x00\xc0{Q1\
-\xda\x0f!~\x5c\xc4\xb5\xef+S\x5c\xff\xf1?}\xd9\
-C_\xdf\x03\xfa\xe7}(\x82\x17\xa07:\x9d\xc5\xbc\
-\xbd0\x1f\x01b\xaa\xd3\xb9\xfe\xa8\x000\xf3\xff|\xea\
-y\xd2\x14\x97\xa4\xb5\xa93I\xc8\xd3\xa5\xd5{\xa4-\
-\x22\xa3\xc6\x11\xb8\xb4:/\xe2\xda\xc3\x00\xeeJ\xb2\xfe\
-]\xcd\xc1\xe1k\xf6\x7f\xf0-7\x02\xc0B\xfb\xc2I\
-\x08!}o\x0fn\x0fh\xbb\xdd\xc5\xf5S^\xf76\
-\xec\xbd\xfb\xabS_\xfd\xeem\xbd\xc6\xbb\xbe>-m\
-~q\x92\xf7.6\xaaz\xa2\x8e*'\x0b\xa2\xa7(\
-\x93%\x9b\x8b\xda2\x18\x95\xac[\xa9\xf6I\xab\x1f\xaa\
-d\x1bw\x14q\xad\xb3\xfeg\xbf\xfc\x1d\x00\xb8\xe4\xa2\
-\xf3g\x8d\x8aW\xbb\xc1\xeb{A\x93\xfb\xa6\x10H|\
-\xc3\xe2\xa0\xdd\xed\x0a?\xe0\x1f\x85Ok\x0c\xca\x9b\xb8\
-L\xc98Xi\xf2\xeb\xd7ke\xcf%\x80\xba\xdc\xb0\
-\xf8y\x97_\xb9\xed\xd0S\x9eU9x\xcc3\xa4 \
-\xaaO\xae\xee;!\xabMf\xa3\xfa\xecPX\xd3\xdb\
-q\xe8\x8e\x89,i\xec_\xdau\xf6\xe1\xfc\x7f^T\
-\x5cv\xe1y\xdb\x8b\xb8\xb6\xde\xe5\xbe$\xfc@d\xf8\
-6z\xd9)\xf4\x05\x17=/J\x8a\xc1\xe4+o\xfc\
-\xc9\xca\x1b\xfe\xf4?\xeb\x93k\x8fn\xaf\x0d\x97\xb7\xad\
-\xcc\x9d\x9c\x19UiUGk\xb5\xdahe\xb41y\
-\xeca\xa3\x92\xfe\x9e\x87\xae\xb7\xa7\xdc\xfb\x8d\xc1\xbf\xff\
-\xe0\xde~\xd0\x87\xc4p\x8c\x85v{~\x96;?\x94\
-\x8f\xe6C\xa0\xd7\xed,\x8e\x00\xe0\x8a\xe7\x9c1g\xe2\
-Z\xef\xba\x17\xbc\xab\x92\xe4\xc3\x89\xb9\xa5\x9f\x9e\xb0>\
-u\xfcFZ\x9f\xaeKST\xa6V\x1en\x0c\x9b\xdb\
-\x1e\x1e\xd5f\x86\xb5\xd1j~\xc2\x03\x22,\xaee\x00\
-\x00\x05\xb5IDAT\xdd\xe4m_\xf8\xf8#/\x06\
-\xe8\xb2\xe7\x9f\x1b\x15I}\x1a\xfc\xb8\xa5oh\xe3\xb1\
-9\xa0\xb6k\xec\x81&\xb8\xdf\x88o\xfc\xdc B\xe6\
-\xdbU\xd8\xb0\x9d\xa8\x7f:\xfc\xe7\xb5\x13\x0dz.\xb9\
-_\xea\x08\xf4\xb4\xb4&\xbb\xf6\xba\xef\x0c\x7f\xf5\xf4\x19\
-,\xed|\xfa\x1c\x09\xd1\xeb\x8e\x1f\xa6\xdf\x1e\xbc\xce)\
-\xb9\x0d\xeb\x91\xa0\x7f\xc6\x8e\xe0\xb1fO\xc3\xfd\xfb\xc0\
-\xee\xcdy\xe0P\xb7\xb3H\x97]x^bT2\x15\
-\xe7\x83\xa5o\xdcx\x8bw\x05u\x22,s[\xd6\x9f\
-\xdbB\x96O\xe5\xa6\x16\xb2\xdc\xc1 /\x1f@vm\
-7\xf4\x95\xbfp\xba\x1c\xd5gv(\x93/}\xf3\x86\
-\x1f\x98\xf6\xc2\xbc\x12?\xe7\xf5=\xffhhHm\x89\
-0\x11\x02\xb8o!\x1b\xdcQ\x97\x006\xc28\xa4\x16\
-\xbc\xe3\xfe\x84v\xa2|R\x9e\xb4\x9d(\x1f\xb7'k\
-'\x9ass\x13\xdfboS\x1f\x12^\x80\x22h\xcb\
-\x1avh\x9e\xf2\xed\x92\x18\xcfBzX\xe7\x8d\x12\xce\
-\xb5\x16\xb6e\xfdY-d\x83\xc6+e\x0bYn\xbb\
-\xf1\xa4-d\x83\xb7\x8b\xd7\x82\xb6\xe3\x9bZ\xc8\xf2{\
-\xf8ak\xa7\xb0-\xeb\x13Z\xc8\x12\xa1\xda\xed>\xf9\
-\x5c\xa3\xc0\x18\xd5\xe0u\xb3\x167\x9c<\x12t\x8f\xde\
-\xd4N\x94E\xc9U\xb6\xf0\xa6\xdeU[\xdb\xb2rO\
-\xa6^\xd0bo&h\x97\x1d>\xf8\xef_\xd2\x9e\x08\
-^\xb4\xf3.\xf4h\xf0jN\x12|\xe0\x04\xef.\xdf\
-\xca\xfb\xe7\xb6\x90\xdd\xdag\xeb\xc9Z\xc8n\xe9.\xf4\
-\xff\xdaB6`O\xe5\xeb{\xc1\xe2\xc7Bln!\
-\xeb\xe7\x1a\xb6\xbb\xe5\x9e_\x91\xe0k\xd15\xee \xe6\
-\x01\xbd\xc2\x0bDl\x1c\x01\x8c\xdb\x89\x12\xb9v\xa2\xec\
-\x1a\xe6\xb8s\x8co,\xb6\x83\xfdd\xd9s\xc9?D\
-\xcf\x0f\xfe\xef\xe2\xd6\x17O\xd6r/\xe2\xdfW\xbes\
-\xcb\x1d~\x8e\xb2\x1f\xf6OG\xf9\x97\xb5\x1b\xdc\xda{\
-\x8d\xfd\xf1\x84\x10\x9b\xdb\xd6\xf1\xe2\xfbV\xdee\x0b\xd9\
-\xa0\xcf\xd6J\xd0\x0e\xb0l!\xcb-\x8a~f\x9f-\
-?\xd7-o\x1bO\xfaG\xf5\xdb\xed\xf9\x1a\xf7j\xf4\
-\xaf\xf1\xf9\xd6\xde\xeb\xbc\x89'\x01\x18\x00\xbe\xc9}\x0b\
-\xc0P\xfak\xd1[\xdb\x89\x06l+\xe90\x80\xf3Q\
-\xa4nw\xd1\x1bc\x12@\xca\xc6\x10B`\x86[2\
-\x84\xbd\xab\x96\xc3\x07\xfe\x03cx\xbf{(x\xbcy\
-[\xf06z\xc2m]\x97\x02cL\x0a\xb1\xa9\xa1q\
-\xddsy6T\x14\xb4\xad\x9b\xe0v\x80e\xdb\xba\xb0\
-\x85,\xf7HY\x0b^\x9f\x9e\x0b;A\x08Q6\xa8\
-\x09\xe7Z\xb6\x90%rs\x0d\x82\xe9\x19\xef\xb6\xbc\x8b\
-\xe5\xd7\xad}\xcf\xdc\xaa\x10\xae\x85\xac\xc7\x0c\xdf\x03\xde\
-c1\x00\x13>\xcf\xd4\xe4F\xbba;\xd1hK;\
-Qt\xbb\x9b\xda\x89\x9aNg\xb1\x1f\xf4\x5c\xca\xbcq\
-\x02?\x5c\xf6!\xe1\xf6H:\xf0\xcbG\x83WP[\
-\x81\x0c]\xe3\x05>\x14\x04N\xd5\xa0-k\x8b7\x8a\
-\xc7\xb7I\x00\xd2\xbb)\xc6\x04\xeat\x16\xd7\x83\x16\xb2\
-:l!\xcb\x80\x9e\xb6\xdbeo\x8f^\xe0B\xa7\x03\
-<\x8b\x83|\xc5\xa6\xb9\x06\x8b]\xf7q\x06G\xe0\x15\
-\xdeX\xe5:\x06\x981\xc9\xc6X\x0d\x1a\x18\x97\xbd\xab\
-\xbc\x96\xd5\xe0\xe3\xb4\xcc\xbf\xc4\xfb\xba\xb2\x9d(\x7fP\
-\xd9N\x94\x9bOnx7\xc5/c\x0f\xb8c\xcf\x0e\
-6F\xd9\xcb*\xec\x7f\xc8\x9df\xd6\x02\xe3L\x04\xf4\
-\xb0\x12\xbe\xf8\xcct1\xe1G\x87\xbd1$\x11<\x9e\
-M\x11\xc1\x129\xe6\xd7n\xcf\xcfr\xa7\xb4u\xee\xe5\
-Q\xb6\x90\xf5c\x22\x0c\x83\xe6\xcb\x9bZ\xc8\xf2\xa9^\
-\x0f\xba\xe2LoyD\x7fS\x0bY\x22\xd4\x84p.\
-\x94\x1f\xb3\x8cx\xfc\x84\x16\xb2\xed\xf6\xbc\xdf\xc4>&\
-\x9a#B\xee\xe7\x0a \xf6\xb4\xb7\xc6\x93\xf2\xc6\x89\x03\
-\xba8\x01\xb8B\x11vSe;QvSs\x1c\xd4\
-\xfd\xcc\x9eK[\xfc\xf0\x93\xd1\xc5CA\xcb\xbd\xd9'\
-QB\xcb\xc6\xf2\xbc\x1bKj\xfb\x7f\x0a;\xbb\xd5\x84\
-\x81 \x0a\x9f5?\xd8\x9a\xc4R_\xa8\xa0\x8f\x9d\x85\
-\xbcM\x0b\xa5\xa5\x92h5$=\xbd\xc8\x990\x06K\
-/W\x09\x8e\xb3;3g7\xcb|\x12\x1fG\x8d-\
-\x12\xba\xff\x10\xb2\x0b\xd0\xca\xe0j\x86\xa5\xa5\xbb\xac\x0f\
-'\xc3s\xd5(\xdf\xc7\xbdr\xc2\xc8\xb8\xeb\x9f.\xdd\
-\xdf\xa0\xbd\x17\x14\xb7\x92\xc4\xc9h\xd1\x9d\xeb\xc9\xbb\x8e\
-\xb1\xf9r\x08\xea\xa4\xae\x9b\xd6\xd5\x8c\x1b\xb4\xb7\x14\xca\
-]\xe6\x92\xc6\xef\x0e\x97\xb4s\xbc\xc3\x5c\xe7f\xaf\xae\
-F<\x1b\x96U\xfd\x82\xb7j\xaaf\x05\xbc\x88\xb1\xf9\
-\x88\xb1\x81^\xaa\xe5u\xdd\x1c\xad\xa0\xebn@\xa7?\
-\xb8]\x10\x99\x9f\x5c\x94&\x8e\xf40\x88\xff\xb4\xd3o\
-\x8d\x87\xc3\xd44\x7f\xd1Xz\x07\xcc\x93\xb1V\xe4\xbc\
-9!\xb4\xb5^\xc6\x8a\x94\xc7\xban>\xe5\xc7\x82D\
-\xe6\xd0\xde\x150\xb3\x87\xcd\xd61\xc6f\xb4\xa3\x13(\
-M\xa4\x8e\xc3W`B\xa1\xb6\x0e`L\x87e\xbd\xe1\
-\xae\x0b]\xd1\x8b\x14j|\xf0o\xe7\x80B\x93gi\
-j\xa3\x85`\xe8\x8b\x87\x10\xa6\xbbI\xf6\xd2_r\xd3\
-dy\xee\xc6\x1b\x12I\x8c\x7f\xdb\xeap\xd9\x81Di\
-\xb6\xaa\xbeU\xdaw\x18\x86\xbc\x0ca\xb2U\x91QH\
-9\xda\xbec\xa3,`\xfb\x8e\xb5d;\xdd\x05\x85\xa3\
-\xdb\xf4e!LjJ\xcf&\xce\xaf\xa5\x16N\xab4\
-U\x850!\xd2\xf7\xfb\x17\xac\xf4aB\xa2w\xdb\xf8\
-\x14\xc0\x85\x9c\xe5cF\xe2\x0c\xa0\xb3\x5cg\xda]y\
-9\x93R39\x99\x92\xf3j\x84\xeaS\xab\xd4\x00r\
-\xda\x95*5\x045Q\xb3\xc9X\x01\x18\x9d\xf3W$\
-\x067NH\x5c-\xf4\xcdV\x00V#2\xa5)K\
-[\x99\x8e\x85\xce\xb2-\x93-\x17\xd5\xbbTR\xb8\xd7\
-\xf7\x89\xb8\xb4\x83\x9e\x0fr\xf6\x8fV3\xa5$)\xdb\
-F7\x19\x09\x89^\xd8<\x00HI\x5c\xcd\xaf\x1a\x9f\
-I\xb4\x0b?\x9e\xcco\xbf\xf0\x9b;b|}U\xee\
-\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00G\xf5\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x96\x00\x00\x00\x96\x08\x06\x00\x00\x00<\x01q\xe2\
-\x00\x00\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\
-\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\
-\x00\x9a\x9c\x18\x00\x00\x00\x07tIME\x07\xdd\x05\x1d\
-\x06(9\x0e2\xffs\x00\x00 \x00IDATx\
-\xda\xec\xbdi\x90%\xd7u\x1e\xf8\x9d{o\xe6\xdbj\
-\xdfzA/\xe8\x1d\x8d\xc6J\x00\x04W\x80\x04AR\
-\x12Er$\xd9#\x8dF\x1aK\x9a\x19Y\xa1\xb0\xac\
-e\xec\x915\x13\xf3\xc73\x11\x0aO8,\xcb\xd2H\
-\xb2d\xd11\x0aK#\xca\xb6$\xd2\x92Lp\x03)\
-\x12\xab\x00\x10@\xa3\x81\xde\xf7\xad\xb6\xae\xf5-\x99y\
-\xef=\xf3\xe3\xde\xcc\x97\xef\xd5\xab\xaa\xf7\xaa\xabA\x90\
-\xec\x17Qx\xa8\xea\xb7f\x9e<\xcbw\xbe\xf3\x1d\xe0\
-\xf6\xed\xf6\xed\xf6\xed\xf6\xed\xf6\xed\xf6\xed\xf6\xad\xd7\x9b\
-\xb5\xf6\xf6A\xf8\x1e\xb81\xf3\x86\x9fK\x1b1*!\
-D\xfa\xc6\xf4\xeb\x7f\xf6\xf9\xd2\xe7O\x9e\x0c\xe6\xa6f\
-\x04is\xfbl|\xa7:\x0b\x00B\x04\xd8\xb3g\xb7\
-\xfe\xf9\x8f},\xfe\xe4}{\xa3\x9by=\xda\x88\x15\
-\xff\xc5\xcbo\x16\x8f\x9d9\xbd\x13*\xb8\xef\xda\xdc\xfc\
-\x91\xab\xf3\x0b;\xaaqT\x06\x83\x00\xf0\xed\xd3\xf4\x1d\
-\xe8\x9d\xc0$Avt\xa0o~\xeb\xf0\xc8\xb9\xc1r\
-\xf8J51G\xff\xc5\x7f\xfb\xa99\x22\xb2\xedNe\
-S\x0c+}\xc1gf\xaf\x07G_;q\xf8\xcdK\
-\xd3O\x9e\xbez\xed\xf1J\xa5\xfc\xbe-\xc3\xc3\xe5\xfe\
-P)U\x0c\x05\x88n\x9f\xa1\xefX\xc3\x02\x88\x19\xba\
-\x11\xd9\x99j#\x9e\x9e\x9b[.\x86\xe1\x7f9\xb8e\
-\xec\xa9C\xdb\xb6\xff\xed\x8f\x7f\xe0\xa1\x19\x22\xea\xdai\
-tm\x09\x7f\xf4\xcd\x97&\x9e?w\xfe\xef_\x9d\x9a\
-~rdx\xe8\xf1\x03;w\x0c\xec\xde2.\x87\x06\
-\x070T.\xa2P\x08\x9b\x9f\xf0\xf6\xed;\xeeF\xe4\
-\xa2\xd1b\xad\x8e\xf9Z\x1dS3s8u\xf9jt\
-\xfe\xf2\xd5\xb9@\x88?{t\xdf\xee\xff\xef'\x1f}\
-\xef\xb7FG\xcb\xd1\xa6\x18\xd6\xb9\xf9\x1bx\xf1\xcd\x0b\
-{\xbf\xf4\xda\xd1\x9f\x9ak4~\xfe\xbe\x03{\x86\x1e\
-<rXn\x1f\x19\xe2\x82\x92\xa4\x8d\x81\xb1\x0c\xf0m\
-\x8b\xfa\x8e5\xaa\xbc? \x82\x94\x02J\x10\xe6\x96k\
-|\xe6\xf2Uz\xf6\xf57\xab7\xe6\x16\xff\xea\xe1}\
-;\xff\xe8\xfb\x1ez\xf0\xe9\x07\xee\xd8R\xa7u\xa2\x93\
-Z\xd5\xa0\xac\xc5\x1e!\xf0\xd2\xb1\xb3{\xff\xf3K\xaf\
-\xfe\x93R\xb1\xf8\xe3?\xf0\xfeG\x07\x8f\xec\xdb\x8dR\
-!\xe48I\xa8\xde\xd0`f\xd8\xdbF\xf5\x1d\x17\xf6\
-\xda\x0d\xcb\xfa{\x22\x826\x84\x98\x08\x950\xa4\xfb\xf7\
-\xef\xe1\xf1\xd1\x91\xca\xf3\xaf\x1f\xfb\xe4\xcbg\xce\x95\xe7\
-\xb4\xee/\x7f\xe8\xf1\xcf\x03\xa8o\xc8\xb0\xf6\x08\x81\xdf\
-\xff\xdb\xe7&\xbex\xf4\xad\x9f\xea\xabT\xfe\xbb'\x1e\
-\xb9\x7f\xf0\xde\xbd\xbb\xd9X\xa6F\x14\x91\xe5\xbc\x1b\xbd\
-\x9d[\xbd]\xe5?\x11\xad\x0e\x03\xb4\x9f\x87\xf4q\xe9\
-\xdf\x99a\xd6p\x02\x9c>\x87\x19\x0c \x06 \xa5\xa4\
-\xad\xc3C\xfc\xc4#\x0f\x96\xd9\xf2G\x8f\x9d=o?\
-\xf7\xccs\xd3\xcc\xfcu\x222\x9f\xfd\xecg\xf1\xa3?\
-\xfa\xa3+^K\xae\xf6&o,F\xc1\x7fy\xe1\xa5\
-\xffavq\xf1W?\xf2\xc8\x03\xc3\xf7\xec\xdb\xcd\xc6\
-Z\x8a\x13\xe3\xbe\xa07\xa8\xdb&\xb5\xf1D\xb9S\xb1\
-\xc3k<\x87s\x06\x96\xfens\xff\xc6\xcc-?&\
-\x17M\xac\xff\x9ds\x8f\xb7\xfe\xef\x9c{\x0f\xcd\x0c\xcb\
-\x80e\x80\xc1\xd0\x86\x91hM\xe50\xc4\xf8\xd8\x88\x9a\
-ZX\xda\xfd\xfa\xb9K\xc5S\x93\xd7_\xfd\xc0\xcb_\
-\x9c\xfb\xc7\xbf\xffG\x1d?\xafX\xed\xca\xf8\xe6\xdf\xbd\
-\xb2\x7fjv\xeeC\xf7\xee\xdf;t\xf7\xde\xdd\x80\x10\
-\x94h\x03\x22w\xd5|7U\x80\xdc\xc5\x89]\xebd\
-\xf7\xfa\x03fX\x00\xdaZ\x98\xdcO\xfb\xef\xd9\xdf\x8d\
-\x81\xcd?\x86\x19\x86\xad7\x02\xf7c:\xbc\x96\xf5?\
-\x89\xb1H\x8c\xf1\xaf\xcf\xb9\x1f\x0b\xcb\xcd\xc7\xbb\xe7\xa4\
-\x7fg\x18\x0bX0bm\xb0\x1c\xc7\x18*\x97\xf9\xbd\
-\x87\x0f\x96\x06\xca\xc5O^\x9c[\xfa\xe1{\xff\xf4\x85\
-BW\xa1\xf0\xe5\xcb\x97\xf1\xd0\x8e\x1d\xf8\x83\xaf|#\
-|\xf3\xea\xd4\xc7\x07\x07\x06\x9ex\xf0\xc8]\xa2\x10\x06\
-\x1c'\x9a6\x08}\xbd\xe3\xc3K\x0a\x10\xaeHd\xd7\
-1\xb8\xd43\xb4\x87\x9bNa\x89sG.\xf5\x22\x9d\
-BZ\xfb\xdfx\x0d\xabf\xd8\xae\x1e\xbb~\xa7\xa4\xf5\
-\x99\x16\x80a\x86\x00C\x109#K4\x18\xa0;&\
-Fqh\xe7\x8e\xbe\xd7N\x9f}\xf7\xdc\xdc\xd5\xfd\xcc\
-|\xacS*\xd4bX\x0f\xed\xd8\x81Yn\x88?\xfd\
-\xe2s\xf7^\x9c\x9e~\xfc\xd1\xfb\x8e\x0cn\x1f\x1bf\
-c\x99\xd8\xdaw\xb4Q\xb5\x87\x17\xee\xf20\xaeVx\
-\xf0*'\x5c\xf8\xd7o\x7f^z\xf2\xb2\x7fo;\x99\
-\xcc9\xe3\x22\x06\x98\xc0]\xf8GcyC\x17K\x9a\
-\x8fu\xfa~\x9c\xbb\x80\xa8\xc3s-3\xd8\xa79\x86\
-\x00\xe3\xbf\x8b\x89\x13\xb0R\xd8\xb7\xffN:}}\xea\
-\xc3\xa7\xa6f_{\xe1\xd4\xd9\xeb\x00f\xdb\xc1\xd3\x15\
-\xc9\xfb\xb1\xe3\x97\xb6\x06\x85\xe2\xbf\x1d\x1e\x1c:\xb2c\
-tX\x14\x84\xa0z\x12gotS'~\xf5#\x01\
-\x105\xbfp/\xc9\xa9\x03`\xb2+m\xbd\xab\x93\xdb\
-_\x9fW\x9a\x11w2\xcc\xf4=R\xc3\xcd\xbd\x06w\
-\xf8wt\xf0<\xad6\x92\x7f\x97\xd5\x1b\x16\xe9\xcb\xd8\
-\xd42\xbb\x0c\x1a\xec\xac\x1b6\x97\xf0\xaffh\x1d\xdf\
-\x93-\x8c?\xe6\xe9w\xd5\xcc`\xadQ)\x970>\
-62:?7\xffs\xdf\xba|\xf5%f\xfeB\xbb\
-\xd7ZaX_\xfa\xd6\x1b\xaa\xce\xbce\xb0\xbf\xaf8\
-48\x08m\xad\xbb\xb2\xdcE\xd6\xbdq\xb5%\xa7k\
-\xf6z\xfc\x87g_\x10\xf0*W\x19:\x9d\xcc5\xaa\
-$\xee\x14Zx\xe5\x83H\xb4\xfe\xdbZ\x9e\x84\x99a\
-m'\xa3\xb1]%h\xed\x17\x98\x0f\x8ak\x1e\xd7\xd4\
-\x8b\x08!\x5ce\xd7\xa3\x17\xe3\xb6\xd0\x9b\xbe\x1e\x09\xb1\
-~\x98L\x9f\xe3\x9f\xa7\xd9@\x80h\xb4\xbf\x0f\xe7/\
-]\x199ym\xea\xde\xe7\xcf]}\x1a@\xb4\xa6a\
-=s\xfa<\x86\x06\xfb\xf5\x91\xbd\xbb0\xd2_Fb\
-\x8c;\x90\x9dBL\x96O\xac\x84\xdc\x18\xdd\xb3 ,\
-\xda\xaeF\xcb+<d\xfa\xc5Z\x0c\x94W\x1aA\xfa\
-{\xfa\xec\xfc\xbf3\xbb+?\xcd\x1b\xb2\xb0e\xb8\xcd\
-\xf8W\xfaW\xc3\xb6\xf9\x9e\xcc0\xb9\xcf\xcc\xb9R\xbe\
-\xfd\xf8X\x9f\xa7d\xce\xd5:Cn\xf7\xffR\x88u\
-/\xda4$\xa5\x15_\xfe{\xb4{\x22Z\xb5\xd8`\
-0\x08\x04\x06\xdb\xf4\xdcvx\xbc?\x04\xec\xbfo\x1a\
-\x19\x04\x08D\x84\xbe\xbe\x0a\xac\xb5\xf2\xd2\xd4\xec\xae\xcf\
->\xfb\x5ca]\xc3\x9a\xaf.\x22\x08$\x09\x22\x14\x82\
-\x00\xdaW\x10\xe8\xd0&Z\xcf\xad\xf2ZI\xea:Y\
-g{b\xbajn\xd4\xc3\xc5k\xe0s\x0f\x7f\xc4L\
-.l\xad4%\x02S3\x7f\xb2m8PZI\xb9\
-\xef\xe6.$mufx\x9d\xaaM\x91\x86sfH\
-)A\x00\x84?\xab\xc2W\xdaB4M\x8eH\xb4\xe6\
-\x8d\xfeu\x89\xc8U\x89\xfe\x95M\xf6\x0c^\x1f\xb6\xe0\
-U\x9cC{\x81\xd1\xbcr\xdb\xfeN\x80 \xa8 \x00\
-\x11\xa1Zo\x94.\xcd.\xd2\xba\x00\xa9C>\xdd\x15\
-\xa0\x8d+m5\x1bdG\xb9Sn\xd4\xf2\xe6\xeb\xa7\
-\xa4\xccm^\xaa\xcb\xd0j\x99\xd7\xc4y\xda\xc3n\xbb\
-\xc7K\xafx)\xc8\x19\xc8\x9a`!\xc3\x1a\x9b}V\
-\x0b\x86\xd6>\x89e\xe3\x8f\x8d\x851.\x0c\x1a\x06\xd8\
-\xff\xbdS\x08&oT\x02\x00\x84\x80$@\x09\x99y\
-\x00!\x9c\xd7\x12BB\x08w\x1d\x0b\x12\x10\x82\xba\x08\
-\xaa\xbd_\xf4\xe0\x95\xafdW\xc6\x91\x96w`v\xde\
-\x9dA0\xf0)\x12Q\xc7\xf3\xb8\xc2\xb0\xc2R\x05a\
-\x18\x80 `\xac\x81\x05\xc1\x9d\x0f\xbb\xea\x09g\x02Z\
-\xa3\xde\xfa_\x8aS\xff\xdbCK\x88\xdb\x8c,\x0de\
-\xa6\xdb\xe7\xe7\xbcM\xd3\xd3\xac\xac\xa0\x18\x0ck-4\
-;o\xa5\xad\x855\x06\x89q\x8fM\xacAb\x0c\x8c\
-\xb5\x88\x12\x03\xc3\xc6\x95\xe4\x86\x1d\x1ed\xcc\xca\xeb\xd0\
-\x9f\x03%$\xa4 H\x12PJB\x10!T\x12\x92\
-\x08J\x0a()!I\x80\xfc\xef$$\x02r\xd7\xb5\
-\xf0\x9f\x97r\x81~u\x04\x9dra\xbd\xc3\xe3(\x9f\
-\x1e\x00\x82\xdc\xdf\x8c\x05\x08\xd6g}\xd4Z`\xf8\xef\
-\xe0\xb0/\xe7/\x95\x90\xa6\x94\x12\x10\xd62,\xf6\x1e\
-\x87\xc9\xa1\xae\x96\xdc\xc1Z\xb3m\xc3\xd8@\xcf\x90W\
-\x5c5i\xc9j\xad\xed\xca\x99\x99UB\xac\xb5\x16\x82\
-hu\x83c\xce\x05\x5c\x8fEqZ\xdas\x06$Z\
-\xe3\xc0\xc5\xc8Xh\x93 \xd2\x1a\xdaXhc\x11i\
-\x8d\x9aNP\x8dbh\xada\xad{\x1dm,\x0c\x01\
-\xcc\xb6\xc3\xb9t\x06%\xbc\x87*\xa8\x00J\x0a\x14\xc2\
-\x10\xe5@! \x82R\x12\xa1RPRA\x0a\x81@\
-H(I !\x10\xf80I$ \xa5\xbb\xe0S\x83\
-Hs7k\xdd\xd7\x93\xd2\x01\x9c\xf9#C\xa0\x96\xfc\
-\xb4\xf5X6+dc\x18L\x0c\x22\x01\xb0O\x032\
-K\x04\x98d\xaeZ\xb5\xa2\x1eE\xeb\x1bVR\xaf\xc1\
-T\xca\xb0\xd6%\xac\xd66\xc3\x06\xf9rZt\xccI\
-\xda\xcan\xe6\x0d1h\x9a\xde\x04Y\xa9\xbc^b\xca\
-\xa9\xeb\xf7\xc6O\xcc\xcd\x1c!\xdf\xee\xe8\x10<\xace\
-X\xb6>\xf43\xb450\xec\xd0\xe68I\x90h\x8d\
-81\xa8\xeb\x04\xb5(B-\xd1\xa8\xc5\x09\x1a\x89v\
-\x17\x80?6\xa1R\x18(\x84\x18+\x14\x10\x16\x82\x15\
-\x17\x22\xf9\xcf\xb8Pk`1\x8a\xb1\xdcHP\xa5\xc8\
-A$\x00\x94R(+\x85\xbeb\x88B\x10\xa2\x18H\
-\x14\xa4D\xa0$\x02\x15 \x94\x02\x81T\x99\xb7\x93,\
-\x00\x90\x031\x85pYIZ\x98\xb2E\xa2\x91\xf1.\
-\x19\x04A\x04b\x03\x93\xf7v\x19\xccC\xad!\x0f\x04\
-\xb0\x01[\x06\x11\xc3rkMO\x84,M\x10B\xd8\
-\xbebi}\xc3*\x95\xca\x10R\xa1\xce@\xcc\x00\xb1\
-\x851\xa6y2ZBFg\x9c)\xf5<&\xbd|\
-\xbah\x8b \x97\xd8\xe6Ql\x07\xcc\xae\x8fF\xdbn\
-\x12\xbb\x96\xec\xc1='\xdf\x06I\x8cAd\x18\xb1\xd1\
-\x88\xe2\x18Q\x9c\xa0\xdah\xa0\x9eh,E\xce\xb0\x84\
- (!0\x10\x06\xd878\x80\x1dC\x03\x98\xe8\xab\
-\xa0?\x0cQ\x0e\x03T\x82\x00\x85B\x00\xd9\xa1.3\
-\xccX\x8e\x22,G\x09jI\x82\xc5F\x84+\x0b\x0b\
-8=\xbb\x80\xc9Z\x0d\x8d8\xc6r\x14A\x10\xa1\x1c\
-(\x94\x0b\x05\x94\x03\x85B\x18 \x0c\x0b\x08e\x82P\
-)\x84JAZ\x01%\x84k\xf6\x8a\xb4w\xeb\x0f\x9d\
-e0\x0907/R\x93\xc3\xfb\xda\xcc\xbd\xed\x98\xa6\
-\xe77\xe7\xe1r\xde\x97\x88\xa0\xc9\xba\xaa\xd89\x02Q\
-m4\xd67,\xd7\x07t\xa1\x90\x8d\x81\xf1\xa1\x01\x1d\
-\x80?^\xeb\xe4\xf9p\xb6\x9e\xdfJ\xcbY^7\xb3\
-\xa2U\xb1\xa9N\xb8Y\xbe\x9aio\xd7\xb8\x1c\xca\xf5\
-\xc4\x12\xcb\x88\xb5\x866\xceC5\x12\x8dj\x1cc\xa9\
-\xde\xf0F\x10\xc3\x18\xc6@1\xc4\x9d\xa3C884\
-\x84{\xb6\x8ca\xcb@?\x06\x8b\x05\xf4\x85!\x02)\
-|\x12\xee\xce\xeez\x98\x14\xe7\xb0$g\xb4\x11n\xd4\
-\x1a81=\x8b7o\xcc\xe1\xf2\xdc\x02fku\xcc\
-\xd4\xea()\x85\xfeR\x01}\x85\x02\x8a\x85\x02J\x81\
-B1\x08\xa0\x94B %\x02!\x100<\x18\xe7\xaa\
-J\x07\xa9\xb5\x85b\xb6\xab\xc5\x98\x96\xcf\xd4^G\xaf\
-\xb0\x0fv$f\xed\x93j%\x84-\x04\xc1\xfa\x86\x95\
-\x7fO\xcb\x0c\x93\x9e\x98\xbcAu\x83\xde\xb6T&\xeb\
-y-j\xed\xbb\xad\x08y\xadW\x163un\x1f\xb7\
-\x19\xbde@\x88fBj}\xcf\xddX\x03\xb6\x16\xb1\
-\x01b\x9d Jb\xd4\x93\x04\xf58\xc1r#\xc2B\
-\xcd\x19\x95e\xc6\xd6\xfe>\x1c\x1a\x1b\xc1\xbb\xb6m\xc1\
-\xa1\xf1Q\xf4\x87\x01Ja\x90\x15\x0e\x1d\x8dz\x8d[\
-\xc6\x08!\x82\x04\x10H\x89\x81b\x01w\x0c\x0e\xe0\xd0\
-\xf8(\x9eH\x12\x5c_\x5c\xc6\xab\xd7&qtz\x06\
-g\xa6\xe60\xb9\xb0\x84\x1b\xaa\x8e\x81J\x09C\x85\x02\
-J\x85\x10\xa5 \x80\x0a\x02\x14\x94BA\x10\xa4\x94\x10\
-$\xa0\xad;Z\xa2#\xca\xbez\xce\xc9m\x9d\x0d^\
-\x0d\x83L\xc1l\xce*]\xee\xf4\xd5\xd5Z\x07!\xb6\
-i\xeea\xb2\x03\xb2j\xa3\x93\xb9\xdda4\x0d^\xe4\
-b\x9e\xc8\x15\x09\xd9\x17\x17+L\x89a\xc1\xbehH\
-\xbft\x13\xdc\xe6\x1c\x0c\xdb\xfc\xads\xce\x86\x0c\xad\xd6\
-\xac\xc1\xec\x0c+6\x06\x91\xb1\x88\xe3\x18\xb5(B5\
-\x8a0[\x8b\xb0P\xafC\xb0\xc5\x9e\xc1A<t\xc7\
-6<p\xc7V\xdc9<\x80\xa2r\xc9t\xfe\xe2\xca\
-\xf2\xa8\x9bdz\xa4\x9e5T\x12#Jb\xb8X\xc0\
-\xbe\xd1!|<\xde\x8bW._\xc33\x97\xaf\xe1\x8d\
-k\x93\xb8~c\x01\x0ba\x80\xd1\xbe2\x06\x8aE\x84\
-a\x88\xbe0\x80\x09\x02\x046\x8f\x8da\xd5\xa1\x875\
-\x0b\xac|\xc4Y\xe5q\x04\xb8H\xc6k\x17Xk\x1a\
-\x96\xf5\x18Nj\xa1\xabC!\xec\x0d\xa5\xcd\xcb\x10\xb5\
-x\x12\x06`\x8c3\x08A\xf0I\xe1Z`(\x81\xb8\
-\xf9\x1a.l\xda\xb6\xc2\x81a}!\xde\xe9\xb3\xb15\
-`r\x15\x94\xeb\x22hhmPO\x0cjI\x8cz\
-\xa21_\xadbv\xb9\x86z\x14c\xc7\xd0 \x9e\xd8\
-\xbb\x13\x8f\xec\xd8\x8e\x1d\x83\xfd(\x06AKbK\xf9\
-\x94a\x93n\x9d^\xa9\xa0\x14\x0aJ\xe1\xc3\xfbv\xe3\
-\x81;\xb6\xe2\x8d\xeb\xd3\xf8\xda\x85Kx\xe5\xe2U\x5c\
-\x9c\x99\xc3`\xb9\x84\xb1\xbe\x0al\xb1\x80\xa0\xc0(I\
-\x81 PP\x04H\xa9@\xcc\x19\x9a\xdf\x02\xd8v`\
-_\xe4\xbb\x1ak>\xce\xffM\x0a\x01cy\xcd\xf4Y\
-\xadj\x95l\x91h\xedJX\x9f\xbc\x19K\x19\x1e&\
-|pr\xc6\xe4\xc1\xb2\x16z\x17\xb7\x96`D\xb0\xd6\
-\xa5|$\x04\xb4q\x15G\x1arW?\xe4\xdc\x9a\xe6\
-\x13e\x09=\xb3\xf0\xefk\xd6\x80$\xdcw\xb1\xcc\x88\
-\xb4F#\x8e\x11'\x09\xaa\x89F\xad\xd1\xc0\x8dZ\x1d\
-\xd3\x8bK\xe8\x0bB<y`\x0f\x9e\xdc{'\x0eo\
-\x19EA\xa9\xae\x0c\xe0V\xdc\xf2F+\x85\xc4x\xa5\
-\x8c\xc7\xf7\xee\xc4\xbd['\xf0\xec\xd6q\xfc\xf5\xf13\
-89=\x8bz\xa21\xdaWA_b\x90\x14C\x14\
-t\x820\x0c\x11\x82 \xd3vO\x07\xf0\xb8\x9d}\xb1\
-&\x13\xa4=$\xfaP\xb8j+hU\xc3\xf2I/\
-\x1b\x0bf\x0bc\x05\x8c\xf5\xaf@\x9c} \xdb\x86}\
-\x99\xf6\xaf\xc0MC\xc8\x9aNH{s63&\x91\
-\x95\xb3\xdd\x90W\x00\xb6M\xef\xb8.9\x86\x19\x86\x81\
-\xc4W|q\x92\xa0\x16\xc7X\x8acT\xeb\x0d\xcc.\
--c\xb1\x11\xe3\xe0\xd8\x08>}h?\xde\xb3{\x07\
-\x06\x8b\x05wb\x99o\x9a\xd1\xb19F\xe6<\x85 \
-\x81\xb1J\x09\xdf\x7fh?\xee\x9e\x18\xc7\x17O\x9c\xc1\
-_\x9f>\x8f\xcb\xf3\x8b\x18\xeds\xa1\xbd/\x0cP\x84\
-\xf3&\x85@\xc1\xb2\x85\x02\xc0B\xae\xc92Y\x0d\xef\
-\xcb\xa8\xd0i\xd2\xee\xcf\xab\xe8\x02\xd9\xefxY\x12\x08\
-\xf0\xeeN\x93k]\x10\xe7\xad\xce\xba\xac8\xd7'\xb3\
-\x1d\x00A\xff\x89V\x1a@\xda<&\xf28Y\x0f#\
-\xfb9\xd4~\xad&\xb7\xc3\xd1\x18\xda2\x12\xad\x11%\
-\x09\x96\xe3\x04Q\xc3\xe5QW\x16\x17A\x96\xf0\xd1;\
-w\xe2S\xf7\x1e\xc6\xc1\xd1a()Z\x88{\xef\x14\
-\xf6Y\xde\x83\x05Rb\xff\xd8\x08\xb6\xf6W\xb0{x\
-\x10\x7f\xfa\xc6\x09\x5c\x5cXB\x9c\xc4\xe0\xfe>\x87\x8a\
-\x87!\x18\x80\x92\x02V\x08\xd0zT\x22\xe6\xf5\x99\x15\
-9\xc0Ym\xc8\xb0Rc0\x16\x895\xb0\x10\xce\xb0\
-:\x02G\xbeL\xf5\xb8\x15\xa7L\x01\xea\xb2\xbb\xe3+\
-\xc1^\x10\xfb\xb4\xd3N\xbc\x0a-\xc6\x7f\x1e\xe3\x1b\xc6\
-\xb110:\xc1r\xacQ\xf53s\xd7\x96\x96Q\x16\
-\x12\x9f\xbe\xe7\x00>}\xf7\x01\x8c\xf5U\xb2\x5c\xe4\x9d\
->\x18\x92~\xc6\xbeB\x01\x1f?\xb4\x0f\xdb\x06\xfa\xf1\
-'\xaf\x1d\xc3\xb3\x97\xaf#\xd6\x06[\xfa+(\xf9C\
-\x12\x04\x01X\xca\xac\xc1M\x04\x17\x22}\xd5hr\x06\
-\xb7^\xcc\xc837\x0c\xb3\xc76\xb9\xf7\xe4\xdd\x85A\
-\xd7\xd2\xb1\x9d\xd8\xa3i\xa6\x9eb \x96\x9b\xdd\x7f^\
-\xdd\xedn\x84!\xc1\x1d\x0e\xecj\xaf\x91\xf1\x86\xac\x85\
-\xd6\x1au\xad\x91$1\x16\xeb\x09\x16\xaaU\x5c\x9b_\
-\xc4x\xa5\x82\x1f\xbf\xffn|\xf4\xc0\x1eT\x0aa3\
-\xec}\x07\xf0\xf8)\xc7tPR\xe2\xc1;\xb6b\xb0\
-TD\xe5\xf5c\xf8\xea\xa9\x0b\xb8\xb6T\xc5\x98\x9f\x94\
-\x08\x0d\xc3\x84\x0e\xb5wm$\xe1\xba\x80\x04_\xd0\xac\
-\xcf\x0an\xf1X\xfeL(\x12\xebvU\xd4Z\xd8\x92\
-N\x99\x84f\xa5+\xb5]\xb8\xd5n\xf0.\xbb\x09\x8f\
-\xc9cf\xec\xaf\xa8D\x1b\xe88B]\x1bT\xa3\x04\
-\x8b\xb5\x1a\xae\xcd/b\xa4T\xc6\xff\xf8\xd0}\xf8\xf0\
-\xfe\xdd\x08\x95\xca\x0c\xf5;\x8d\xc9\x9f\xbf\x08\xf6\x8d\x0e\
-\xe3\xe7\x1f~\x10\x03a\x88\xcf\x1d;\x85\x99\xa5e0\
-3\xfaQr\x17\x9a\x12\x90RA\xa5\x95\xdf*,\xd7\
-\xd5\xec\xc0\xb2\x85 \x01\xc3\x0c)\x08\x9a\xd9\xb1I\x91\
-\xcb\x88\xd6e7\xf8\x93\x93\x00\xbeKO\x9br\xf2\xd7\
-{\x0c\xaf\x17\xeb\xb16\xaf\xcbr\x13\x16I\x8cA\x94\
-$\x88\xe3\x08\xcb\x91\xc1\x8dZ\x0d\xd3\x0b\x8b\x98\xa8\x94\
-\xf13\x0f\xdd\x8f\x0f\xb5\x19\xd5w\xf2-\xfd\xfc[\xfa\
-+\xf8\xa9\x07\xef\x051\xf0\xb9c'0\xb9\xb4\x94\xb5\
-\xaf\x18!\x84\xb1\x08}\xef\xb1\xb7&.g\x00\xb6e\
-\x865\x0c!\xc8\x85Bn6\xd7\xd75,\x91\x8bt\
-i#\xb9S\x92l\xd7\x00\xd76\xfc\x98u\x8c\xd3\xac\
-aX)\xab\xd2\x18\x8bz\x92@\xc71j\xb1\xc1\xec\
-\xf22\xae/-c{_\x1f~\xe6\xa1\xfb\xf0\xc4\xfe\
-\xdd\x08\xa5\xfc\xae0\xaa\xf6H1Z.\xe1\x1f\xbc\xeb\
-^\x18\xcb\xf8\x8fo\x9c\xc0\xa4]\xc4\xb8\x87Z\x02\x15\
-d\x0ds)\x85/\xbaV\x87\xbc\xa9cO\xd7\xa7;\
-\x90\x19\xb90\x10R\x97+\x92\xbb\x07H)M\xd8\x9a\
-\xf0%w\xd3P\xee\xd1s\xf1\x06*\x95\xf6\xc7\x19\x8f\
-\xab0\x03\x0dmP\x8f5\xa2\xc4`1\x8a1\xbd\xb8\
-\x84\x91B\x01?\xf3\xae{3\xa3\x02\xf8\xbbnz;\
-\xfd>\xa3\xe5\x12~\xec\xbe\xc3\x98n4\xf0\xe5S\xe7\
-A\xcbU\x87\xea\x97\x00\xb0r\xff\x9fU\xff\xc8\x8a\xae\
-\x0cZ\xb0v\x05\x17\xbe\xfdL\x08k\xc0\xc6\x9b\x16u\
-N\xfd\xd5Zfb\xad\x85\xcd\x92\xbc\xb5z\x81\x1d\xb0\
-\x0f^\xbf\xad\xdc\x0a\xc8rV\xadt\xcb\x95\xcf\xb8\xe6\
-\xd6\x19Wb,jq\x8cF\x9c`\xa9Q\xc7\xf4\xd2\
-\x12\x04\x11>y\xf8\x00\x1e\xdb\xbb\xcby\xaaU\x5c\xf7\
-\xdb\xeb]n\xdd\xbc/3c\xe7\xd0\x00~\xf6]\xf7\
-b\xb1V\xc3\xf3\x97\xaeA\x0a\x89A\xa9\x80 \x8fW\
-\x13\x02\xe1\x0c)16c\xd5\x0a\x22X\xad!=\xbc\
-\xa0H \xb1\xcd>\xad\x00\xa0\xa4D\x02Z\xb38[\
-=y\xb7\x8e\xf8fa[\xcaR\xac\x83$\xe4\xc7\x8d\
-z\x91\x1a\xccr%\x90\xa7{t\xf7\xbc\x14V\xd0\xd6\
-\xa2\x91$\x88\xe2\x04\xb5$\xc6\xfcr\x0d\xf5F\x84'\
-\x0f\xef\xc7'\x8f\x1cD9\x0c65\xfc9\xe3hk\
-.1#I\xa7\x8d\xb9y\xdc\x08p\x14\x17!\x1c\x97\
-*e\xe7\xadQ\xe9\xde\x94\xe7b\xc6\xde\xd1a\xfc\xc4\
-\x03\xf7`j\xa9\x86\xf3\x8bK\x08\x84\x80,\x15\xdd\xfb\
-\x11!\x94\x02\xb1M\xd9\x0d\xe4\xf8U\x9er\x8c\xec\x1e\
-h\x12d\x9a\xa9Kl\x1dW\xab\xb7\xaa0\xf0\x98\xa6\
-u\xd4[C\xddS\x7f[\xd1\xf1V\x8e\x14uQ\xd5\
-\x09\x0f\xb4\xf62\xf2\x9e\x8d\x83k\x8d8v,\xcf\xe5\
-Z\x0d\x8b\x8d\x08\x87\xb7L\xe0'\xee\xbd\x1b[\xfb*\
-\x9blT\xe9k\x11\x12k\xb1\x14\xc7\x98\xab:|\xec\
-\xc2\x8dy\xcc\xd5\x1b\x98\x8ab\xd4\xeauXc!\xa5\
-\xc0H\xb1\x88\xf1\xbe\x0a\xc6*e\xec\x18\xea\xc7\x96\xbe\
->\x8cU\xca(\x06j\xd3\x91~\xf6\xdc\xfaGvl\
-\xc3\x0f\xdfs\x08\xbf\xf5\xfc\xb70[\xadC\x12A\x93\
-\xe3p\x09+\xc1\xbei\xedR.\xf2i\x05 )\xbd\
-\x07\xb4\xbfOa$)\x08\xc6\x02:%Dq\x97\x86\
-U*\x14!T\x80\x08\xae\x15\xc2~\x12\x96z\xf0<\
-\xe9\xdc\x1d\xf7x\xb22\xf6\xa2G\xd5)%\xab\xad\xd1\
-\xc7J\x0d\xab\x96hD\xc6`)N0]\xadc0\
-T\xf8{G\x0eb\xdf\xc8\xd0\x8a\xf2\xfc&N\x99\x0b\
-\xa4D\xa8'\x09./,yz\xcb,NL\xce\xe0\
-\xda\xfc\x22bm\xa0\x85\x80\x01C\x1a\x03C\xceS1\
-\x18\x92\x08\xd0\x06\xe5P\xe1\xc0\xd8(\x1e\xdc\xb9\x1d\xf7\
-O\x8cb\xff\xe8\x08F\xfb\xcaP9\x8c\xeaf>o\
-\x9aZ\x14\x94\xc2G\x0f\xec\xc1\xab\x93\xd3\xf8\xf2\xa9\xf3\
-X\x8c\x13\x8cH\x89H\xb8c,}\x8e\x05\x9bA\xdd\
-\xae\xd1\x9f\x8e}\xb5\xdd7\x9d\x86OW8%\xcbw\
-aX\x96\x14$!\x9b\xa2u\xa2jhs\x88\xdd\x06\
-6j\xa90\xbb\x9b\xc4M\x01V\xca\x11\xd0:\xc7j\
-\xeb\xc3N]\x1b\x17\x06\xa3\x08\xf3\xcbUD\x89\xc6\xe3\
-\x07\xee\xc4{w\xdf\xe1N\xea&x\xab\xf45\x12c\
-pfv\x0e_>}\x0e\xdf\xbcp\x15g\xa6g\x10\
-\x19\x83 \x08\x1c\xbb\xb3TD\x91\x08\x8a\x08\x82\x18B\
-H?\xc5\xe3\xa8\xcf\xb1\xd0\xa8Y\x8b\x17\xafL\xe2\x85\
-KW0R*\xe2\xc1\xed[\xf1\xb1\x03w\xe2\xe1\xdd\
-;0V*m\xcaE\x90\xf6\xf8&*e\xfc\xe8=\
-\x87prr\x1ag\xe7\x96PP\x02\x14\x04\x00\x19\x84\
-\xca\xe7L\x9eb\x93\x9e#\x93\x1e\xf4Nt\xba\xd5\x07\
-s\xd66,\x89\x04@\x08&r\xfco\x10\xaceH\
-\xea\x82\xfe\xdb\xee\xb9\x90\x8e\x8d\xf9+\x9d\xf35\xa6\xe8\
-\x00\xcf\xfb9\xb6t2 e=\xb2E\x9e,\x9bv\
-\x1f\xb5of\xc7\xd6\x22\xd6\x1a\xd5(\xc6|\xad\x8e\xdd\
-\x83\x03\xf8\xc4\xdd\x870T*\xdd\xb4\xb7\xca\x1b\xe5\xa5\
-\xf9E|\xe5\xd4Y\xfc\xf5\xc9\xb3xcr\x06BH\
-\xf4\x85\x0a\xa3\xe52J\x81r\x18\x91R\x08\x18`)\
- \xe1\xda'\xb0\x06L\x02Vk$D`\xad\xd1\xd0\
-\x09\xa2Xc.\x8a\xf1_O_\xc0\x0b\x97\xaf\xe2\xbd\
-{v\xe1\x87\x0e\xef\xc7\xbb\xee\xd8\x86r\x10l\x8a\xe7\
-\x02\x11\xee\xdb:\x81\x8f\x1f\xd8\x8b\xdf\xfb\xbb\xd7\xb0P\
-\x8f\x10J\x05\x88\x22`\xc85\xa9[\xbay\xbcnu\
-\xc1p\xb9dO\xc9\xbbA\x00\x017_h\xad\x9bb\
-\xb1^3\xa9\xb3\xb3\xe9\xfc\xf2\x04\xe7\xed\x84\xa0\x8c\xeb\
-c\xb85M_\xa3\xd4s\xd0\x1e\x01\xda\xb0\xab^@\
-H\xac\x86\xf2\xcd\xf1\x14c\xd3Z#\xd6\x06I\x9c`\
-\xa1\x11#\x90\x0a\xdf\x7fp/\xf6\x8f\x0ew\xd9T\xea\
-\xceK\xbdr\xf9:\xfe\xe8[G\xf1\xcc\xb9K\xa8Z\
-\x8b\xa1R\x11C\xc5\x02\x0a\x81\x82\x08\x0bPB\xf8\xf1\
-.\x01I\x84\x94V)\x01\x10\x94\xbb\x18\xa4\x80`\x80\
-\x95\x82\xb4\x01J*A1\x0c\x11i\x8d\x1b\xd5:\xfe\
-\xfa\x8d\x138z\xf9*~\xf4\xbe#\xf8\xc4]\x07\xb0\
-e\xa0\xb2)\xf9`A)|\xfc\xd0^<{\xf9*\
-^\xbe2\x89b\x10\xa0?\x08\xb2cc\xb9\xc7\xa3\xb4\
-N\xd5\xbf\x0a@\xaa\x9d\xc7\xf2\xe5'\x13\xc1\x9a6\xbe\
-\x93psF\x0c7Ti\xd9t\x84\xdaZ\xf2-f\
-$\xcc\x90p=\xa7\xec\x9e\x5c\x8b\x80W\x19}\xb3\xcc\
-\xb0\xd6\x19\xaae \xb1M\x1am\xa2\x0dbc\x11%\
-\x1a\xd5\xd8\x8db\xdd\xb3u\x14\x1f;\xb8\x07\xa5@\xdd\
-TY\x9f\x1aU=I\xf0\xd4\xf1\xb3\xf8\x83\x17\xbf\x85\
-\x13\xd3\xb3(\x97\x8b\xd86\xd0\x87b\xa1\x80\x8a \x88\
- \x80\x02\x81\x04\x81\xa4\x9b\x0ft\xb4c\xf6,1\xf7\
-\xff\x96\x01\xab\x14\xc82\x98-\x04\x01\x1c0(\x08P\
-H\x12\x84Rb\xb9\xd1\xc0\xb9\x85e\xfc\xf6s/\xe1\
-\xcd\xa9\x19\xfc\xec\xa3\x0f\xe2\xd0\xc4\xd8My\xae\xb4B\
-\xdf58\x88O\x1e\xd8\x8b\x93\xd3sXh4\x10*\
-\x09\x14\x8b`(\x04\x1e\xe6!`]\xa8(\xcbm\x8c\
-EOMh\x03\xe5\xae2\xcbH\xb4\x05IZ\xa1\xac\
-\xa2\xb5\x86\x22Bb}\xb7\x93\x80 \xfb\xbd]\x12\xa5\
-)\x02`\xe1\x864,\x03\x96\x9c1\xa5\xf7\xf9\x83\x90\
-N\xeb\xe4EB\xf2\xad\x1b\xe3\x8dK{\xf2\x9e\xd5\x09\
-j\xb1F(\x05\x1e\xdd\xbe\x0d\xdb\x07\xfa\x90o\x89m\
-\xd8\xa8\xe2\x04\x7f\xf6\xda\x9b\xf8\xbd\xe7_\xc1d\xa3\x81\
-\xb1\x81>\x0c\x94\x8a(J\x05R\x0a\xa1\x14\x80R~\
-\x90\xc2\x8da\xc9t\xf4LH\xc8\xb4kA\x9e\xab\xc6\
-\x0c!\x09\xd6\x0aH\x06\x8c\x0a\x10\x00\xd0\x00J\x00\x84\
-(C\x0a\x89\x99Z\x0d\x7f\xfe\xd6),\x1b\x83_y\
-\xff#84>z\xd3\xf9V\xa8$\x1e\xbac\x1b\xf6\
-\x8e\x0c\xe1\xf5\xc9i\xd4\xa2\x18\xf0\x15)y4>\xeb\
-#\xae\x07\x84\x139\xe4\xddW\xc6\x9dFa\xd4\xaaP\
-\xbe'\xea\xc5\xda\xa9\xbeQ\xdb\x94\x0cSs\x08\x9b\x98\
-\x11s\xb3i\x89\x16\xfe{\x93\x17\x9ee[\xb9\x13\xee\
-\xc09\xe1\x1a\x9d\x19\xec@\x99\xa2J\x0a\xdced\x8a\
-\x1c\xda\x1ei\x83\xd8Z\xd4\xa3\x18KQ\x03;\x07\xfa\
-\xf1\x81;w\xba\x1c\xe2&\xc3_#I\xf0\x1f\x8f\xbe\
-\x85\xdfy\xfeeL7\x22L\xf4\xf7\xa1\xaf\xe8&e\
-\x14[\xc7/\x97nbYP\x13\x97\xb2\x94\xa7E[\
-\x9f\x0cs[\xae\xe7\xaa)\xc9n\xbaYI\x81\x06\x02\
-\x04\x8aQ\x060N\xc0l\xb5\x8e/\x9e:\x07\x02\xf0\
-\xcb\xef\x7f\x04\x07\xc7G|\xe2\xbc\xf1\xd0\xbesx\x10\
-\x1f\xdc\xb5\x1doM\xcd\xa0\x9a$(\xc6\x1aF\xaa,\
-\xfa\x90\x00\xa4W\x0f\xb5\x9e\x5c\x88\x0e-=\x92\x04\xcd\
-\x16R(\x080bt1\xb0\xda\xf4\x0cN\xca\xd0\xe9\
-T\xb6\xe1+\x9e\xd3\x03\xff\x18w\xf2\xad\x9f\x0c\x81\xf3\
-ff\x15\x98\x80V\x16\x80lm\xd3{\xb5aY\xec\
-\x87B\xf3\xea*\xd6\x03\xa2\x895\x88\x8cA5\xd10\
-\x96q\xcf\xb6q\xec\x1a\x1e\xbc\xe9\xab;\xb1\x16O\x9d\
-8\x8b\xdf\x7f\xf1U\xcc\xc5\x09&\xfa\xfb\xd1_\x08\x11\
-\x0a\x01\x12\x02B*\x04Bd'\x99Z\xf8\xe3\xcd\xd9\
-J\x0b\x80<7,\x83\x01\xfcE\xdb\xac\x90\x19\xf0c\
-\xf5\xd6\x18P\xa0Pd\xc68\x11\xe6\xeb\x0d<u\xf2\
-,\x08\xc0\xaf}\xe8}\xd854\xb0\xe1\xb0\xe8r-\
-\x89Gw\xed\xc0\x17N\x9f\xc7\xf9\xf9E\xc4ZCZ\
-\x0b!%43B\x16\xb0\xd4\xac\xcam\x8e\xf4\xc8m\
-P\x06\xc1S\xcd\x85@\x01]\x0c\xac\xa6UB$\x1c\
-I\xce\xae\x88\xb9\xb4\x12\x7f2\x9c\x93\xc8\x81\x87\xfb\x9b\
-\x1f\xcaX\xdb\x1cG\xea\x05\x8dO\xdf;'\xac\x96\xd2\
-b\x8c\xd1\xd0\x89q\xcd\xe6$F%\x0c\xf0\xf1\xfdw\
-b\xa0\x83\x8e@/7\xcb\x8c\x97/]\xc5\xef\xbd\xf0\
-\x0a\xaeU\xab\x18\xeb\xebG\xb9Xp\x9c\xa6 \x80\x12\
-N_!\x9b\x1eb\xcet\x0c:]\xa1\xc6?f\xc5\
-\x11l\x0b\xef`F \x04XJ\xc4\x01\xa3\x00`\xd0\
-{\xe5\xa7N\x9d\xc7\xf8@?~\xe1\xd1\x071^)\
-\xaf\xa8\xda\xba-Q\x88\x08\x07\xc6Fp\xef\xb6q\x9c\
-\xbe1\x8f\x86\xd6\x08\xfcL%\x00$Rv\x97\xc4\x13\
-!$\x82$\x09\x10\x10uP\xe6Vk\xd5xi\x81\
-f\xfdPi6\xdd\xdc%\x8e\x95q\xa5=\x7f\xa7\x97\
-\x83\x90i0\xa0\xa9A\x9e\xb6\x89bka\xb4\x85\xd1\
-\x09\xe2X#1\x16\x87GGq\xf7\xc4\xd8Mc@\
-SK\xcb\xf8\xcc\x8b\xaf\xe2\x8d\xe9Y\x8c\xf4UP,\
-\x84(y\xa3\x92Rf\x1ct\xbdFo\x8b\xda\x9b\xe4\
-v\xfd\xa1\xdd\xd4P\x04\x11\x0aJ!\xb1\x16\xaaP\xc0\
-\x18\x11\xae/.\xe1/_=\x86\xbbF\x86\xf0\xf7\xef\
-=\x8c@\xb6\x0e\xad\xb4k2p\xcb\x0b\xe7:\x1b\x04\
-\x94C\x85\x83\xc3CH\xea\x0d\x9c\x9a_\xc4@\xa0|\
-\x0e\xcb\x90$\xc1\xecG\xee\xb8\xc9\xb7o\xc1\x1f\x09\x80\
-R\x18P\x0a\xbb\x09(\x17B\x04\x1cv\x9fc\xa5\x07\
-\xc4\x92\x0fGXyOk\x18J\xf3\xcbP\xa6\x1e\xc7\
-]\x8a}\xacD\xe3\x9b\xef\x95\xca+\xc5\xd6\x22f\xa0\
-\xa1\x13Xc\xf1\xf0\xf6\x09T\x82\x9b\xf3V\x91\xd6\xf8\
-\xe2\xc9\xb3x\xf6\xfc%\x14\x83\xc0M9\x13@Jy\
-j/\xf9\x82\x88{\xeb+\xac\xa6V\x98Vb`\xdf\
-:\xa1,\xec\xb0R\x10\xd6\x82\xadD_\x18brq\
-\x11\xff\xe1\xe5\xd7q\xdf\x96q\xdc\xb3m\xc2\x8b\xbf!\
-\xc3\xfd\xd8W\x9e-\xde1\xa7Wa<rX\x0c\x02\
-\xdc\xb3u\x02\x83\xc5\x22\xce^\x9f\xc2\xb2rz\x10\x99\
-\x17I\xd1OBG\xb1Rf\x86%B\xb5\x10b\xc7\
-\xe0\x00H\x86@\x18t\xe7\xb1\x04\xbb\xdc\xc0Z\x86!\
-_\xe5x:\x05r\x06\xa3\xfd\xec\x9a^\xc3\x8b\xa5\xf9\
-\x05\xe7\xd4\xe8\xac\xff\x92\xb6\xc7&u\xfa\x5c\xb0\x05\xc7\
-1bc\x91\x18F\x91\x80\xbb'\xc6]\x09}\x13\x09\
-\xfb\x85\xb9\x05|\xee\xad\xd3hX\x83\xfer\x09\xca\x87\
-\xbe\xbc\xf0\x99h\xd7\x97X\xe5\xf54s\xcb\x08\x96\xf5\
-\x98\x96\xf6\xef\xa5\x88\x900C\xe5\xa6`\x22\xad\xd1H\
-\x12\x87\xcbY\x8b(\x8aPmDh\xd4\xea\xa8\xd6\xea\
-x\xf6\xf4y\xfc\xe5\xd1\xe3\xd8=2\x84r\x10 2\
-\xbaUU\x10X5\xd5H\x87\xe4\xb4\xb5\xd832\x84\
-=\xe3\xc38z\xe5\xaa\xab\x0a\x89Z\xe9/\x84\xce\xf7\
-h\x8a\xbe\xf9\xac\x9b\x89\x98\xf3S@kz,\xc7\x89\
-\x16H\xd86\xc7\xdf}\x22\x9a\xdet\xd6\xf2\xb1\xab\x86\
-\xb8\xd5hd&\xbb\xda\x9a\x0a\x9c\xab\x9d\xa7\xd6\xd0\xec\
-\x88|\xb1q\x9aU\x911\xa8k\x8dC#\x83\xd8=\
-<\xb8a:\x0c\x11!2\x06O\x9f\xb9\x80\xa3\x93\xd3\
-Pa\x01\x85B\xc1\xc1\x05B8\xb0\xd3\x17\x0c\xaei\
-+`\xcc:M.fh\xef\x91\xac\xf7\x08\xa9.;\
-1\xa3n\x0c\x1a\x1e\xdcm\xd4\xeb\x88\xb4q\x86U\xab\
-{\x03\xd3\xd0Fg\xda\x16\xd6ZT\xe3\x04\x7f\xfe\xfa\
-\x9b\xf8\xe8\xa1}x\xf7\xee; \x8c\xab\xce2\x95\x9d\
-50\x96,\x95\x00\xa3\x12\x06x\xd7\xb6\x09|\xed\xf8\
-i,4b\xcf\xb6\xe8\xed\x22\x14B\x80\x04A\x11\x92\
-\xc1\x80\xd6'\xfa)rb_\x94J!v\xba\x0a\x08\
-Y?\xa9\xb3X\xeb:l\x06\x22\x18\xcf\x01\x22\xa2L\
-\xcdf\xed\xd6\xaf3@\xa7We`\x18\x88\x8dF\x92\
-D\xd836\x8a\xa1J\xf1\xa68N\x97\x17\x16\xf17\
-\xc7O#f`\xd8k3\x10y\xb9\xc8\x9c\xe4e\x06\
-\x18\xb7\xe3=\x9eQ\x90\xca)\x91p-)\xc3\x00'\
-\x06\x06@\xad\x11\xa3V\xafa9\x8a\xd0H4L\x9c\
-\xa0\xe1\xf9cQ\xa23\x99Hw\xf2Dv \x09N\
-\x9b\xc1H\x83\x13\xd7\xa6\xf0\xe5\x93gpd\xdb8B\
-\xa9zf\x9eXf(\x92x\xd7\xf6-\x18,\x161\
-W\xaf\x83\xb9\xc7A\x92,'\x130\xd6\xaa\xd9zm\
-}\xa9\xc8\x84-\x02k\x00/<f\x05uP\x95i\
-&\xf5\xc2\x1b\x99\xa0\x95\x9a\xe4\xab\x85j\xf6E\xb9\xb6\
-\x9ci\xd4\xadu\x85\x18\xeb\xb0.\xe3i\xb6\x96\x81\xc8\
-Z4\x12\x83jb\xb0\xbb\xbf\x0f\xfd*\xdcp\x18\xb4\
-\xccx\xfd\xca$N\xde\x98G\xe8U\xf5\x9cv\xa3#\
-\x06\xc6\xc6@I\xd9\xfc\x1c\xd6f\xad%)\x1d\xe6\xa6\
-\xc8\xcd\x83G\xda\xc0\xc2\xc2\x1a\x8bz\xa2\xb1\xdc\x88P\
-\xaf.c)\xd6H\xa2\x08\xc6w\x0bRa\xb64\xbc\
-\xa6\x17Y\x06_\xb4Ph\x1c\x8e'\x95B-I\xf0\
-\xc5S\xe7\xf0\x89#\x07qd\xebDwHy>Z\
-\x18F\xa0\x80\x03\x13\xe3\x18*\x97\x80\x1bs=\x15U\
-\xf9\x93\xeb\x8e\x03\x99\xc1Bq}\x8f\x95b5\xec9\
-8\xd6\xae\xa6\x15\xca\xabR+\x90\x83\x05\xa4\x8f\xed\xd2\
-\xe7\x19\x22\xf7\xbbYE\xc0me\xeb\xd0\xaf\xf4\xf0s\
-\x82\xdah\x901\xb0I\x02%\x04\xb6\x0f\xf4m8\xbf\
-\x22\x22,E\x11\xfe\xf6\xfc%\xd4\xe2\x04\x95R\x01\xe4\
-_K\xb3\x85bWR'\xc6ds\x90)\xea/\x05\
-\x10k'\xd4Vk\xc4h\xe8\x18\xb5Z\x03q\xa3\x81\
-\xa5z\x03\xd58v\xa4?\xe3p\xb6\xf4{\x0ajb\
-`B\x08PN\xa1\xb8\xb3\xe3p\xa9B*\xf6q\xfc\
-\xeau\x9c\xbc6\x85#[&\xb2\x5c\xb7[\xb8\x81\xbd\
-\x92s\x7f\xb1\x88\x9dC\x03x\xe3\xea\xf5,\xff\xeb\xb5\
-\xc3-\xa4\x80\xb1,\xe7\xa3h}\x8f\x150\x90\x10\xa1\
-N\x02\x8a-D\x87u;\xd6\x9f\xe4T\x1c\xc2\x0d?\
-r\xcb\x10\xe4\x8a\xfd19\x1c\xca\xe6\x0c\x86\xf3\xc9\xf0\
-\x0a\x8d+\xff\xef\xfe\x80hk\xc1\xd6UP\x09\x80\xc8\
-hl+\x970Z*eZ\xed\xbd\xb3\xab\x80\x85F\
-\x84\xa3W'A\xd6M\xb2d\x8b\x8fVp\xa8\x85\x17\
-\xe5e\xc4I\x82z\x1c\xa3Zk\xa0\x11\xc7\xa8\xd7\xeb\
-\xa85\x22\xd4\x13\x9d\xc3\xde(\x0be*\x97\xc7\xac\x08\
-;\xd4\x1d]9\xcdm\x96\xeb\x11NL\xcf\xa2\xae\x13\
-\x14\x95rPN\x8fy@ \x05\xf6\x0c\x0f9\x9aq\
-\x9a;\xf7\x14\x0e\x9dT\x82\x14d\x86\x8a\xe5.\x86)\
-\x94\xb3~\xa1\x1d\xfd4!\xbb\xaa\xd0Y\xe2\x09\xf5\x96\
-(\x83\x02\xf2\xb8\x87\xc8\xb9i\x9bK\xdc5\xb3c\x03\
-\xc0y\x02)\x1c\xea,|R\x9cB\x14J\x88\xccS\
-\xa4\xf9\x81f\xd7b\x8a\x93\x04l\x19\xfd\x85\x02\xfa\x0a\
-\xe1\x86\x12\xf7\xf4\x19W\xe6\x171\xdfh\x80\xdd\x15\x88\
-\x90\x08\x82\xbc\x96UN\x92;\xf2\xa2l\xd5Z\x1d\x8d\
-(F\xa3\xd1@\xad\x11!J\x92\xec\xbbR\x8a\xc8\xef\
-\x15\x0a\xe6\x00\x00 \x00IDAT\xa7\xad\x9e.\x17\
-/tsN\xd3\xe1\x87(N\xf0\xc6\xd5)L-\xd7\
-\xb0kx\x08\xe4\xcfQ\xb7y\x123\x10\x08\xc2\x96\x81\
->\x04\x82\x90\x18/$\xd6\xe3\xc1\x93R\xc0\x90\x10\xb3\
-\x8b\xc9\xfa\x1e+\x97\xe59=\xd0\x5c\xc5\xd1N\x19N\
-\xacE\xe8\x8d*\xb16+\xaf\xd3{\xf8\x92z\xe5v\
-\x08nYT\x94\x19d:r\x9f\xc3\xac\xf2\xc3\x19\x99\
-$43\x22_\x9e\x97\xc2\x00}\x1em\xdfH\xbb#\
-\xd2\x06\xc7\xa7f\xd1\xd0\xda\xb1)}n#\xe0\x8a\x8a\
-(I\x10\xd7\x1bX\x8a\x22,.-\xa1\x91\x18Dq\
-\xd2\x22\xa7$\xbd1u|o\xda\x5c\x95\x1a\x01\xa7[\
-vfa\x11\x8b\xf5\x08b\x18=ox\xb7p*6\
-\xc3\x95\xb2\x07\xbd\x19j\x03\xb1\xd0\xc3&\xb6d\xa8\x87\
-\xf1\xaf\x9cw\x013\x02\xef29\xd7\xf7\xb2\xcc\x88\xd2\
-\x92:\x17\xd6l\x9bLv*\x07\xc1\xe4\x89d\xf0\xc8\
-n*\x0c\xe2s(!\x9c\x8eU\x9a\xc8r\x8e\xfb\x93\
-\xea\xa7'\xd6B[\x86\xb2N\x10n\xb0\x10\xa2/\x0c\
-;\x87\x98.n\xb118\xb7\xb8\x88H\x1b\x90\xd7\xf4\
-\xac6\x1aXL,\x96\x1a\x0d\xd4\xe3\x18Q\xbd\x0e\xad\
-\xdd\x16\x87\x14~\x14\xc2%\x09\xd9{\xf2\xcd\xb2\xbf\xba\
-\xc4\xf2\x00@J\xcc./c)jd\xd3\x81\x1bb\
-<\xf8\xf9\xc2\x0d-\xf2n\xee\xd7\x91K\x05\xd3\xbd\xc7\
-b\xaf=j=\xad\x22N\x93\xd7\x14$k\xf3$-\
-\xd5\x89\xff\x9b\xb1.\xc1\xb5^\x9c\xc6\x1a\xb8)\xdaL\
-#\x5cxQ\xfe\xd4k\xa5m\x9b\x95^\x92s\xd38\
-\x89N\x90\x18\x03\x06A\x05\x0aj\x83\x89;<_l\
-\xb9\x1e\xa1n,\x92\xc4 j4\x10'\x1a\xf5\xd8\xbd\
-G\xda\xc7\x13\xe48W\x82D\xb3\xd7\x977dz{\
-\xf4\xb3\x88\x9cRr\xb5ZG-\xd6^\xd1\xb6\xc7F\
-\x80\x87\x0a\x06\x8bE\x87\xf6o\xec\x83xx\x8at\xb9\
-'\x8f\x953\x1e\x0bd\xb8\x93\xf1S'\xd6\xb2\xd7\xf7\
-t j \xd0\x82\xc0s\xa6\xb3\xe5O`v\xcf-\
-\x94\x99\xf6\x846\xf5Ty\xadv\x075x&\xab5\
-P\x16\x88=3\xc0\xba\xd5\x10\x1bJ\xda\xd3\xca\xef\xf2\
-\xc2\x22n,,f\xbdH\x9b\xd3sH\xdb,Y\xf9\
-\x9f\x13\x10y\xbb\xa7\x13\xd3\xb9\xbe\xf4\xc2\xde\xe8&n\
-f P\x02\xa3\x95\xd2\xc6\x0d\xabyA1\x84E\x17\
-\x86\xe5\xb1\x1bv\x83\x8c\xf0e\xb2\xf5\x9e\xc4\xb1\x19|\
-o\xca\xa4\x18\x97Eb:\x885r\x13vX\x8b=\
-\xb3\x0a1\xc0\x85\x1er\xf2\xd8\x99\xb12!\x81\xf3\xa0\
-\xcc=\xc4\x9f\xb6\xca\xc9\xa4\x5c)\xcbX\xa8\xd5\xd1h\
-4 U\xe0@\xca,\xf1\xeePm\xbdC\x04Dh\
-\x83}\x86|\x97&\x90\x12$\xe8&\xcc\xdcu\x17u\
-\x07y[\xb5\x1eJ\x9bv\xc5\xd3\x06\xa7\xdb`\x95\xa7\
-\xbf\xa4\xae\xd8\xae8\x09&\x07\x02\x12(\xb7u\x82\xbb\
-<\x04yI$\xf2\xcb\x05,\xe0\xc5\xeb\x99\x01\xbd\x9e\
-\x85\x12\xb7\x86S\xeb6wic\xa1\x04A\x120\xe4\
-\xe5\xad\xb3eI\xbd\x94j\xdf6\xc3\xba9\xafg\x99\
-\xb1\xdc\x88{\xdc&\xd2vq1H[\x0eL\x07+\
-Rk]\xe0\x86-,\xdaV\x87\xe4F:\x5c\x19\x9d\
-\xe3\xab\xaf\xb1\xc02#\xf0\xf9U*\xdd^\x11\xf9\xdf\
-\xd3=\xca\xcc\x0c#\x05\xd8XH\xcbk:(\xcb\x04\
-Fn\x17r\xcbF2\x87\xb2\x8f\x0c\xf5C*\x09\xad\
-\x0d\xde\xc9\xb7\xa6N=A\x06\x0aA^\x81\xb0\xc7<\
--1\x16\xd7\x97\xabk\x12\x08V{n\xca\xc9\x00\x81\
-\x03Aq\xb1C\x86\xa7\xd6\xba\x1aR\xb9\xc5\xd5N\xbb\
-5\x9e\x16\x83\xd5\x15t\xdb[:+\xc2Rn\x99e\
-;\xe7\xbd\xfdwm\x1c\xca\x9d\x00\x10\xae|\xc4\xb2v\
-\x8d\xe8\xfc\xcb\xa6\xfa\xa4\xda\x00\x9aM6m\xb4\x82\x17\
-\xed\xa1\x82\xe1J\x19\x05\xa9\xb2\xed^\xef\xd4[\x13\x13\
-d\x0c\xf6\x95Q\x09CO\x12\xd8\x98\xe7J|\x93\xbb\
-\xe7\x16\x98m\xb5\x0a\xd1\x0d\xe7\xbd\xa5*4\xab\x8f}\
-\xb7nd\xe7\xd6\x88\x9f\x1f\x88\xc8\xdf\x03+\x84\xeaS\
-\x15dc\x1d\x8f<\xcf6MY\x04JJW\x05\xa6\
-\xc6\x96+\x84\x16\xe2\x18\x8bQ\x9cE.k\x9b\xd4e\
-\xc3M\x11\x5c\xceP\xf0V<' \xc2\xae\xbe>w\
-\xf5\x83o9dp\xb3\x15\xa1\xb1\x16d\x19w\x0e\x0f\
-a\xa0T\xe8\xe8\xdb\xbb\xab\x86\x0d\xaaI\xd22\xcf\xd0\
-K\xbe\xbe\xdem%m&mE\xf8P\xd7\x82\xa0w\
-\x98\xe0hJ\x1c\xd9\x8c\x9f\x058\xd16\xe5\x0dC\xe6\
-\x10u\xb3\x0a\xd9\x8f\xd9Ux\x19\x83 \x05QsP\
-G\xe6E\xb9\x19^\xe7k\x0d,7\x1c\x99_{\xe5\
-\x94\x96M\xa7\xb4z\xa2\xcb\xd6BH\x85{\xb7M\xa0\
-\x14\x06\x98\xad\xd6\xde\xf1Z\xa4\xae=$\xb0\x7fd\x08\
-#\xa5ROf\x95^4\x02@\xc4\x8c+K\xb5l\
-\xf6s\xb3o+{\x85a\x11\xe4\xa6,]\xe5\x05d\
-\x9d}\xe5\xcb\x7f\xbb\x86|s\x1eQOr\xe5{F\
-\xd2\xcb\x85\xc0T\xb6(\x9f'\xe41\xb2\xcc3\xe6\x9a\
-\xac\x89q\x83\xac\x89\x94 \x06\xae\xcd\xde\xc0\xd4R5\
-\x931JW\xe0Q\x17W\xbf3 w\xf5\xef\x1f\x1f\
-\xc5\x95\xb9\x85\x96=\x88\xef\xb40HD\xd0\xda\xa0\x12\
-H\xec\x9f\x18\xc3P\xa9\xd8\xb2\xb1\xbe\xdb\x1c\x8d\x08\xd0\
-\xdabzn\xa1\xb92p\x93]\xb5Xii\x0c\x0b\
-\x82N\xb1\x12\x9f\xdbd\x0b!S1\x88\xdcO\x9a?\
-\xb3\xdfDaS\x03i\xbbO\xf3\x01\xb7\xb5\xd4\x0d\x9f\
-\xa6xLl9\xf3R\x91\xb1\xd9\xff7\x8cAC\xbb\
-\xf5$6\x1d\xb7\x8fb\xd4\x16\x97P[\xaebqi\
-\x19\x97\xe7\x17\x90x\x8f\xd8k\x9e\xa1\x991P*\xe0\
-\xc3{w\xa3$DG\xbd\xd5w\x8aQ\xa5^}\xfb\
-\xf0\x10\xee\xda:\x8e@:|\xaf\xeb\x1e\xa1\xb7\x1d\x02\
-\xa1\xa1\x13\x9c\xbe1\x8f$5,\xba\xc5\x1e+J\x1a\
-0T\x80!Bl\xac\xd7\xacl\xb6^:\x11\xfb\xb4\
-1\x90\x92\xa0\x8dk\x1ckk\xbc\xdc\x0d7\xf9KR\
-x$\xbbY\xc9\x07B 2\xd6\xb7\x8c\x84\x9b\x0a\xf2\
-\xe8{#\xdd\x8f\xe8\xdf\xcf\xb0u\x83\x13\xb5\x06jK\
-\xcb\xee\xb5\x8cF\xc2\xc0\xe9\xd99,\xd4#\x0c\x95\x8a\
-=\x870\xb6\x8cR\x10\xe2=w\xee\xc4X\x7f\x1f.\
-\xce/\x80Yl\xb8Et\xabr\xab\x94\x97\xa6$\xe1\
-\xd1\xdd;pd\xcb\xb8\xc7\xe3z\xe3\xde\x93W\x9a\xb9\
-\xbeT\xc5l\xb5\xda\x12\x0dn\xa9a\x95KE\x18&\
-\xc0\x9a\xccc%\xd6@\x92\xeb\x15\xb6w\x0f\x9c\xa8\x98\
-3B\xcb\xf0yRSO\xc9\xb2\x93\xf0\xb2\xda\xb4n\
-\x11cB\x02\x9b\x8d\xcf'\xfe\xf9\xa9\x8c#\xa7\xf9\x91\
-e\x90\xd6h4b\xd4\xaaU4\x92\xd8\x91\xde<K\
-S'\x1a\xa7&gp\xa3V\xc7P\xa9\xd4{C\xd6\
-#\xf8\x07\xc7G\xf1\x9e=;q\xe9\x95yX_H\
-\xbccr-\x7fa\x1bc0X*\xe1\x83\xfbvc\
-K\x7f\xc5\xef\xb3\xe9\xed3J\x12`\xcb895\x83\
-\xc5F\x945\xd07\x1bE[\x11\x0ac\xed\xa7sI\
-\xc0\xc0izj\xd3D\xba%59\xd86[ i\
-3\x8d\x06\xdb\x06\xef\xa6\x1e'\xbd\xcf\x93\xf7\xd35\x88\
-\xec\x07]\xd3\xa64|\x7f\xd2j\x83\xa8V\xc3\xdc\xdc\
-\x02\xe6\xe6\xe7Q\x8fb?DLY[\x85\x85\xc0\xe9\
-\x99Y\xdc\xa8\xd5@\xa27L\x93r\x0d\xf0-\xfd}\
-\xf8\xd8]\x070X)\xfb\x86\xf7;(\x81\xf7\x03\x0c\
-l-\x1e\xdc}\x07>\xb0o7\x02){\xc6\xa0\x00\
-\xc7\xf4\x8d\x8c\xc1\xcb\x97\xafa\xa1\xde\xd8\x90\xf7$O\
-y\xea\xc9\xb0\x8a\xca\xcb\xd4x\x0c\x8b\xd1*Z\x9fp\
-3\xe6\xa7?\x8c\xe6\x1e>Z\xa3\x85\xd0\xe1x\xe5\x80\
-\xd5f\xd5i\x8d3\xa8\x85\xd99\xcc\xcf/\xa0Z\xaf\
-;\xc4X\x0a\xc7\xb8L\xa9-\xbe1<\xb5\xb8\x84c\
-\xd7\xa6\x10k\xd3:c\xd7\xe5I3\xd6)\xda<q\
-`\x0f>tp\x9fc\xb9z\xb0t#\x00\xe4f\xe3\
-Vi\x9e;\xde\xdf\x87\x1f\x7f\xf0^\xec\x1d\x1e\xca&\
-\xcd{\xca\xaf\xc85\xd1\x97\xa2\x08\xc7\xafO\xa3Zo\
-\xf4\x1c\x069\xdbz\xdb\xa3a\xad\xb5\xba2S\xd5\xdd\
-\xc4+9\x9b\xfa\xf0WeT\xadaq\xe6\x06\xe6\xe7\
-\x17Qo4|\xb3[\xac\xba/Q\x12\xa1f\x0c\xbe\
-v\xf6<\x1a\x89vpG\x0f\xc6\x90\xf6Ac\xcb\xd8\
-54\x80\xff\xf9\x91\xfb\xb1kt\x18:N6\xfd\xbb\
-n\xacu\xe2B\xa0`\xe0\x13w\xdf\x85O\x1d9\x04\
-\xe5\xf3\xd1\x0d\xa1\xee`\xbcv\xf5:N\xce\xcc\x823\
-\x9e}o\xc7\xab\x9b\xfe\xa2\xd8\x88+\xdc\xcc\xab15\
-V\x1b\xc7X^\x5c\xc2\xd2\xe2\x12\x1aQ\xe4f\xd7r\
-\x04\xba\xd5<_\xda\x9ex\xed\xca$\xae\xcc/@z\
-#\xed\xe5\xa0\xa7\x93B\x96\x19\xef\xdfw'\xfe\xde\xc3\
-\xf7\xa2R,l(\xd4l\xe6M\xc0-\xed\xd4Z\xe3\
-\x81\x1d\xdb\xf0\xd3\x8f>\x80\xf1\xbe2\x22\xad}\xda\xd5\
-\xcb\xb9p\x03\x1f\x0dc\xf0\xcd\x8bWpu\xc1)J\
-\xe7\x05M\xba\xf5|\xdd\x1c[\xf5m9b\xdc\x9c\xb8\
-5\xd6\xa0\xba\x5cERo@k\x9d\xe1Hk\xcd\xc8\
-\xb5_A\x92\x04\xae/.\xe1\x1b\xe7/\xe2\xae-c\
-P\xc2]\xd1=}$\x02\x22c\xd1\x17\x04\xf8\xd9G\
-\x1e\xc0\x95\xa9\x1b\xf8\xb3W\xdf\x80\xd6\x1aa\x10\xe4\xb7\
-\xe2\xbdm\x95 \x98\x11\xd7\x1b\xd86:\x8c\x9f\xff\xe0\
-\xa3x\xf4\xce\x1dnx\xc3\xf6\x9e\xff\x098)\xa3\x8b\
-s\x0bx\xf3\xe2UDQ\x0c\xa9d\xcf\xaf\x93\xe5\xcb\
-\x82r\xe7\x87n\xdecm\xa6\x97\x8a\xaa5,\xdd\x98\
-Gc\xb9\x0a\xed\xfb}\xb2\xcdK\xad\xf7\x03r2@\
-KQ\x8c/\x9e:\x87\x99Z\x1dJ\xd0\x06\x0e\x98\x0b\
-\xc5\x0dc\xb0wt\x04\xbf\xf0\xa1\xf7\xe1\xfd\xfb\xf7\xc0\
-\xf8=\x87 \xf6]\x09t\xf5\xb96\xf2\x03O\xcfv\
-\x12\xb0\x16\xf5F\x84\x81r\x09?\xf7\xfeG\xf0#\xf7\
-\x1f\x86\x122\x93h\xec\xf5\xb8K!`-\xf0\xc2\x85\
-\xcbx\xf5\xea$XP\xb6\x81\xb5\xa7\x1frK6\x09\
-\xfe\xf9\x84\x0e\x22Fo\x93\xc7\xca'\xfb`\x06'n\
-\xc5[\x5c\xaf\xbb\xfc\xc1\x8f\x9c\xf5\xfc\xbap\xf0\x86 \
-\x82\xb6\x16\xaf]\xbe\x8a\x17/\x5c\xc1\xa7\x8f\x1c\xf2\xfb\
-^z\xcb\x91R-\xab\xc8X\xbc{\xd7v\xfc\xf3\xef\
-\xfb0\xfe\x0f\x02\x9e9y\x0eqb\x10\x06\xca\x11\xed\
-\xba\xa8\x8a6r\x8c\xd2\xfe\xab\xb1\x16q\x9c\xa0?\x0c\
-\xf0\xd3\xef\x7f7\xfe\xe1\xfb\x1e\xc6@\xb1\x88Z\x9c\xf4\
-\x9c\x8e\xa4\xc7>\x94\x02\xf3\xf5\x06\xbez\xf2,\xae\xcc\
-/@I\x01\x91g\xc4\xf6\xf29\xfd\x5cC\x0c\xa7\xcb\
-?\xbc\x199\xd6F\xc2^*\xa6a\x8dAT\xada\
-\xee\xc6\x1c\x1a\xb5\x9aSs\xceI\x02\xb5-\xe9]\xf7\
-\xff\x01@J\xe9\x84\xf9\x85\xc0\xd4B\x15_x\xeb$\
-\xe6\xea\x0d\x84\xa9\xe6B\xef\xed{h\xe3 \x94\x0f\xec\
-\xdd\x85_\xff\x81'\xf1\x03\xf7\xdc\x05\x05F#\x8a}\
-\x01\xcb\xd9\x8c\xe1\xa6\x1c\xa2\x1c\x0c\x93\x18\x83\xa8\x11a\
-\xfb`?\xfe\xe9G\x1f\xc3?\xfb\xc8\xfb\xb1\xa5\xbf\x0f\
-\xf58\xd9\x18w\x0an\x86@\x80\xf0\xda\xd5)|\xfd\
-\xdcE\xaf\x19!\x9c\x12a\x0f\xc7;\xab,\xbd\x13\x10\
-\xd6\x82\x84D\xa3\xaf\xf46z,nbRl\x19q\
-\xbd\x8e\xc4\xf3\xc9\xc1\x8es\xdd\x0b{\x91W\xb9\x0a\x18\
-\x00\xacE \x04\xeaI\x82\xaf\x9f\xb9\x88\x17/]\xc1\
-\xc7\x0e\xed\xcbF\x9bz\xb9\x22So\x90\x8e\xb6\xbdw\
-\xf7\x1d\xf8\xbf>\xf1$\xb6\xf5\xf7\xe1\xcf_?\x86\x1b\
-\xf5\x06\x94\x94\x08rz\xa3\xbdz\x10\xdb^mr\xba\
-\xb2\xc5y\xdf\x87\xef\xdc\x89\x9f\xfb\xc0\xa3\xf8\x91\xfb\x0f\
-c\xb0X@-Izj\xdd\xb4\x7f\x9f@J\xcc\xd6\
-\xeb\xf8\xfc\xb1\xe3\xb847\x8fP*H\xe9\xe6\x04D\
-\x17\x91b\xc5\xb1\xf7\x84O\xebW\xa6\x14\x96\xa3\xb7\xc9\
-\xb0r|+k\x0c\xf4\xd22\x92$q\xacM\x22\x90\
-l\x0e\xba\x82\xd2\xc1G\xe1[\x14\x16B\x8al\x09y\
-*\xb1c\xd8B\x92p\xba\x11\xfe\xb9N\x8f\xdf\xa1\xac\
-RJ\x14\x00\x5c\xb81\x87\xcf\xbe|\x14\x0fl\xdf\x82\
-\xad\xfd}0\x8c\x95'\xb2KC\x8e\x8dS\xe5;\xbc\
-u\x0c\xff\xfc\x13O\xe0\xe1\xddw\xe0\xdf\xbd\xf0-\xbc\
-~\xe5\x1ajq\x8c\x82T\x10>W\xe9\xf6$QN\
-D6\xd5\xa97\xd6u%\xc6\xfa\xfa\xf0}\x87\xf6\xe2\
-g\xde\xfd \x1e\xda\xb5\x1d\x81T\xa8\xa5\x9ej\x83*\
-~\xcak\xa1\xbep\xee\x22\x9e:~\x1a\x8d\xc4\xa0R\
-\x08\x9b\x8c\x06F6L\xdb\xcd\xb1\xd7\xaeU\x02%%\
-$\xbb\xb4 \xea\xbf\xd5\x1e+e\x95\x0a\x01\xd6\x06I\
-\xa3\x8e\xa4\x11\x81=K\x22M\xf6\xd2\xd5\x19\x80\x1b\x0b\
-#\xffe\x5ch\x13\xd9\xa8\x98\xcc\xaaCW\xf9Q\xce\
-\xb5\xbb\xe7:Q\xd6t\xc9A %\xaaZ\xe3\xa9\x93\
-g\xf0\xa1\x13{\xf1c\x0f\x1e\x81\x02\x10o\xb4*\xf3\
-\x9e\xcbZ\x8b\xd1r\x09?\xf9\xf0\xfdx\xe0\x8e-\xf8\
-\xd3W\x8f\xe1K\xc7\xcf\xe2\xec\xec\x0dD\x89\x06\xe0\xf0\
-3\xe5\x0d\x8d\xd6)\xd5\xb5\xb50\x89v\xb2\x9a\x920\
-R.\xe3\xe1\x9d\xdb\xf0\xc3\xf7\x1f\xc1\xf7\xddu\x00c\
-}%X\xcb\x1eV\xd8\xb84\xa4 B\xa8\x08W\x17\
-\x97\xf0'\xaf\x1e\xc3\xb9\x99\x1b(\x86\x81\xdf\xe9Cm\
-\x0a{]\x1e{\x0f\xe58\xedT\xe5\xe4\xaej7\xba\
-7,\xda\x88Aye\x16k\x0c\xf4r\x15q\x1cg\
-@\x9fH\xe1\x03\xafRK9ji\x0bHG\xa9\xae\
-\x0cZh\xa7\x94\xcb\x97\xd2\x87\xb3o\xfd(\xe1\x92w\
-\x01B1\x080\xb9\xb4\x8c\xff\xf7\xa5\xd7\xf1\xe8\xee\xed\
-806\x0aq\x13\x13-\xe9\xa6\x86\x86\xd6PB\xe2\
-\xa1\x1d\xdbqx|\x1c\xff\xcd\x91C\xf8\x9b\x93g\xf1\
-\xd2\xf9\xcbx\xf3\xfa\x14\x16\x1b\x0dXk\x10Yw\x0c\
-\x84\x97,\xcfK\x07\x18\xbf;[\x00(\x85\x01\xb6\x0e\
-\xf4\xe1\xdd;\xef\xc0c\xfb\xf7\xe0\xc3\xfbwc\xf7\xf0\
- @\xe4\xc0O\xcb=\x87\xd9\xe6\xe9p\x076\x90\x02\
-\x89\xb6\xf8\x8b\xa3\xc7\xf1\x95\x93g\xdd4\x95\xf4K\xa2\
-\xfc\x1cB\xaf\xc7^\x10eF#\xd8\x02\xb0\x88Ma\
-}\xc3\x8a\xb5S\xc5\x0dD\x0fs \xe4\xe5\x0a\xad\x85\
-nD\xb0q\xec$\xbb\xbb\xd5\xb4\xbc\x89JJ{\x1a\
-\x8f\x22\x87\xb8\xd7\x8dEQ)\xec\x1c\xecC)\x08[\
-6w\xdc\x04\x00\xee\x9a\xe6\xc6\xc0\xb0E\x10H|`\
-\xcf.<\xb0}\x1b\xae,,\xe2\xcc\xf4,^\xbf6\
-\x89\xa3\x93S8>5\x8b\xa5F\xe4\x07?\x9a\xb3,\
-\x92\x04\x8aA\x80m\xc3\xfd\xd876\x8a\x07\xb7m\xc1\
-\xa1\xf1Q\x1c\x1c\x1b\xc1X_\x05R\x0ahc\xddV\
-\xdbT\x0a\xe9&\x22\x87\x12\x84@H<{\xf1\x12\xfe\
-\xe8\xa5\xd71\xbd\x5cC\x7f!lB\x0c>}\xa0\xde\
-_\xda\xc9\x1e\x80aI\x00L(P\xbc\xbea)\x06\
-\x22\xf2\xa2\xac\xdd\xe0R\x1e\xd3`k\x91\xd4\x1b\xe08\
-\xf6^\xc4}\x01\xbe\x05-\x91\xbcl\xa4\x922C\xcd\
-kI\x02I\x84O\xdd{\x08\xff\xe4C\xef\xc3\x1d\x83\
-\xfd\x88\xb5\xd9\x1c\x96\x02\xa5X\x17\x10\xb3{\xbfb \
-qh\xcb\x18\x0eM\x8c\xe2\x83\x07\xee\xc4|\xad\x8e\x85\
-F\x84j\x9c`v\xb9\xea9dN\xaei\xb8T\xc4\
-X\xb9\x88\xfeb\xc1o\xb5(\x22P\xd2\xf3\xdc\xbc^\
-\xbd\xe5\xd5G\xf5{Ho\x85\x10(*\x89\x0bs\xf3\
-\xf8\xc3\xe7_\xc6\xd1\xab\xd7Q\x08\x14\x94\xd7r\x97\xbe\
-\x12\xdf\xc8\x0c\xb4\x00\xa0\x94\x82\x14\x02\x82\x19 F\xc4\
-]HE\xca\xc0\x873\xdf\x84^\xf5\xbaIO\x163\
-\x84\xd6H\xea\x0d\xc0\x98\x16\x101\xcd\x836\xddS\xa5\
-\xebD\xd2\x02\x01\x8e\x85!\x08\xf8\xf4=\x87\xf0\xbf\x7f\
-\xf41\xdc\xbdu\x02\x0dmZ\xd8\xa8\x9b\x03\x0b8\xef\
-\xa5\x8d\x85\x06 \xac\x93\x82,H\x85\xed\x83\x03\xd81\
-\xe4\xc9\x8e\xdc\xba\xd4E\xf8\xf0h\xb3)q\x9b)\xd3\
-\xd8\x15:\xf07aT\xc4(J\xa7\xa3\xf5\xc7/\xbd\
-\x8e\xbf8z\x1c\x04\xa0\x1c\xa8,\x82\xa4`l\xcf)\
-O\xbe_H\xe4\x95\x0a\x09\xc5n<V#\x01\xa0\xc8\
-\x89\xba\xae%\x88F\x04\xb2\x16\x22\x8a`\x12'0\xab\
-\x88\xfc\xf2\xbb\xcd\xb6\xa4V/iR:.\x80\xc4\xba\
--\xf5J\x12>y\xe4.\xfc\xdaG>\x88\xbb\xb7\x8c\
-\xa3\xa1uV1n\xa6\xa7\xcc{/\xa0\xa9\xe7\x0e\x00\
-d)ch\x92\xd7\xdcL\x9fc\x98\xc1F7\xa5\x9d\
-\xda\xe8\xd8\x9b\xf5\xf9\x0a*\x80\xb1\x16\x7fy\xf4\x04\xfe\
-\xf0\xc5WP\x8dc\x8c\x94\xcb~\x0f4\xfc|\xe7M\
-\xbcg\xaebt\x1e\xcb\xa2\xc6]T\x85\x85\xc0o\xb0\
-\xb7\x9d=V*\xc4J\xcc@\xbd\x01\xad\x13\x08\x12\x08\
-\x02u\xcb\xf2)\xf6\x90A\xcaFME\xdc,3\xe2\
-\xc4B\x12\xf0\x83\x87\x0ff\x9e\xaa\x9e$\x1b\xea\xa7m\
-\xb8\xa7\xd7^\xf9e\x9b\x11\xb8\xeb\xe7\xdd|\xab\x8c\x10\
-*\x01\x02\xe3K'N\xe3_|\xf5\x9b\xb84\xbf\x88\
-\xe1R\x09\xca\x1b\x95 r\x95\xdfMnCc\xebS\
-\x11\x92`\x16(S\x17:\xef1\x05\x0e\xa7@\x87\xe5\
-\x97>\xac\xc8$\x81M\x12\xc03-o\xfd\xc9sb\
-\x22\xf9\xa5\x04l-\x96\xa3\x18\xd6\x1a|\xfa\xde\xc3\xf8\
-\xb5\x8f>\x86\xbb'\xc6Q\xf7[*\xbeWnio\
-<T\x0eBx\xfa\xf4y\xfc\xfa\xd7\x9e\xc5\xc9\xe9Y\
-\x0c\x95K\x08\xa5t-3\x0f\xf7\xdc\xec\xd5OD\x10\
-\x92\xfc\x12\x05\xff\xe6\xb6\x8be\xe3\xac5 }b\x06\
-j\x9f\x02\x85L\x12(\xad\x9d\x86U\xae\x1d\xd3q0\
-\x15\xabi\x90v\xf7\xb8\x96\xf0\xe7'\xa0S\xfeT5\
-\x8e\x010>y\xe4.\xfc\xea\x93\x1f\xc4=[\xc6Q\
-\xd7\xba\xb9\x0d\xf6\xbblK\xfd\x9a}@\xa5 \x08\xf8\
-\xfa\xd9\x8b\xf8?\xbf\xfc\x0d\xbc|\xf1\x0a\x06\x8a\x05\x94\
-\x82 \xc3\xa7\x90\x19\x16\xdd\xf49\x12pkm\xc8Z\
-@H4\xfa\xfb\xba\xc0\xb1\xa4[\xbb\xc99\xf9@\xf6\
-\xc9g\xa85\xd8+\x06S\x8e\xf7$\xfcr\x80\xec\xf7\
-\xb6\xc9\xe6^\x1f\x97\x86\xbc\xbcl\x12@`\xeb\x86-\
-\x16\x1b\x0dhc\xf0\xe9{\xef\xc2\xff\xf6\xe4c8\xb2\
-u\x02um\xb2\x9c\xea\x9d<t\xbai\x06\x05w\xfc\
-\x0b\x81\x825\x16_:u\x1e\xff\xf7\xd3\xcf\xe0\xa5\x8b\
-\x97\xd1\x17\x16P\x0e\x9c\xc0\x09\xda`\x05\xe9\xf536\
-z\x8ed*\x07\xeai\xe10\x16\x85\xea\xc2\xfa\x86E\
-:\x01\x02\xd5\x12\xfe\x02c\xa0\xfc\xd0h\xc67O-\
-\xd8\x83\x94\x9c\x83\x17V\xbd_\xefq\xaeV\xce\x8c+\
-\xed\xa1\xe5\xaf\x16'\x18k\xf1\xa9{\xee\xc2?{\xe2\
-\x838\xb2u\x02Q.Q\xa7\xefz/\xd5L\x0f*\
-A\x80\xe5$\xc6\xe7\xdf8\x89\x7f\xf3\xcd\x17\xf0\xe6\xf5\
-iT\x0a!JJA\x08\xe1Z5D\xae\x1b\xc0M\
-\xa0S\xacs\x0e\xd6;\x97\xcd\xd6\xd5\xea\x80\xc5J\x1c\
-K)D\xb9\x9d9\xa11(\xa0\xa9q\x9e*\xc6\xb4\
-TJ\x1d\x18\x9e\x1d\xef\xd7{\x1c\x91_1\x97k\xd4\
-fJ\xc5\x8cz\xe2\x0c\xe8\x07\xef>\x88_\xfb\xe8c\
-\xb8w\xeb\x84\x13\xda\xdf$H\xe1VTj\x9bZ\x18\
-\xa79\xae\x10(H\x85k\xcbU\xfc\xf1\xb7\xde\xc0\x1f\
->\xf7\x12.\xcf/a\xa0\x10\xa0\x10\x06\xd9\xc9W\xb9\
-\xfc\xd7\x89\xc6Q\xcb\xe2\xf8\x0d\x9d\xa3\x14\x5c\x15\xd2\x0f\
-\xccwn\xf2\xaf0,\xed\xe5\x87\x153\x8aZ#H\
-'sr\xaayb\xd3!\x85\xd6MV\x02\xcd\xcd_\
-\xe4\x01\xc4%OW\xfe\xe4=\x07\xf1\xabO|\x00G\
-\xb6L \xd2\xa6\xb94j\x13\x96\x89\x0b\x12~\x1e\xd2\
-n\x1a\xb6\xb4y\xa1\xcf\xe5J\x81p\xa2w/^\xbc\
-\x8c\x7f\xff\xf2\xeb\xf8\xc2\xb1\x93Xh40T)\x22\
-\x14\x02\x01\x11\x84\x94\xd9EJm`\x95\xda\x84s\xe7\
-\xfa\xbekG\x87\x0e\x1bV]\xfc.X\x8b\x12\x5ch\
-\xca\xb3[nM\xfe\xd2\xd4%\xb5m\x1a\xa6\xdaZ,\
-E1\xd82>q\xf7A\xfc\xafO\xbc\x1f\xf7\xf8\xf0\
-\x97\x18\xbbI\xcaz9\x11\x7f_a\x19v*\x86\xdf\
-.\x03kj\xbd\xba(\x11\x0a\x01A\x84\x99j\x0d\x7f\
-\xf5\xd6)\xfc\xc9\xb7\x8e\xe2\xd8\xb5I\x80\x81\xd1\xbeJ\
-\xb6\x8b\xba5\xa7\xf2\xad.\xda\xdcs\x97\x1aVf\xb5\
-\x1d\xb4\xd0U'\xc8\xdex\xcf%\x84c\x19\xe2VV\
-\xef~\x85H'\x9d\x17fF5N\x00\x06>y\xe4\
-\x10~\xe5\xc3\xef\xc3\xdd[\xc7\x11i\xe3\xd4\x067)\
-\xfc\xb9\x1d\x84\x02\xaf]\x9d\xc4\xf1\xc9i<\xb0}+\
-\xf6O\x8c\xa0\x14\xb8\xf5n\xc6/\xac\xca+H\xdf\xda\
-\x90\xd7\xa4\x00K)\xa0\x88\xb0\x9c$x\xe9\xc2\x15\xfc\
-\xa7W\x8f\xe1\xe93\xe71\xd7\x88PP\x0a\x05\xa5\x10\
-\xa4\x90B\xd6\x91H\xf3_G\x80\xbc\x15#lY\x96\
-\xad\x14P.\xafoX\xe9Fse\x19\xecw\x19\x0b\
-\xa2[b[\xa9\x8b\xcfZ\x1d9\x017c\x0c\x96\x1a\
-\x11\x04\x80\x1f\xb8\xfb\x00~\xe5\xc3\xef\xc5=[\xc73\
-O\xb5\x19\x89:3CI\x81PJ\xbcqm\x0a\xff\
-\xea\xe9g\xf0\xb53\x17p\xdf\x8em\xf8\xa1#\x87\xf0\
-\xd8\xde\xdd\xd8=2\x88\x92\x0a\x9c\xbe\xbc\x0f\xcb\xd9\xf2\
-\x83\xb6\x0b\x84z6\xa0\xb6\xb6\x0a\x11\x02\x22\x90t\x03\
-\xc3\x0c`\xae^\xc7\x89\xa9\x19|\xe1\xf4\x05|\xe9\xd8\
-\x09\x5cYX\x80\x05\xa1\xafP@\xa8d\xd6\xfbK\xbd\
-\xad\xdbz\x81\x95\xec\x84[\xe0M;\xa52\xab\xe3X\
-\xdeA\x09)\xa1\xc8\x95\xa7\xb7B}\xc5\xb5f\xdc\x81\
-H\xa1\x05 \xd5\xe5r}4\x01\xc6\xc7\x0f\xed\xc3?\
-\xfd\xf0\xfbpx\xcb\xb8O\xd4\xed\xa6%\xeaR8\xa3\
-:~}\x1a\xff\xf2\xe9g\xf1\xa5S\xe7\xa0\xad\xc1K\
-\xe7/\xe3\xf8\xb5I|a\xdb6|\xe0\xe0\x1e<\xb6\
-g\x17\x0e\x8d\x8f\xa0\x18(\x14\x94;\xe1\xc6\xd8\x96F\
-={\x02\xdcz\xce\x81r-\xa1\x94\xe7/S\xe0\xd1\
-Wo\x895\xb8^\xab\xe2\x95+\x93\xf8\xea\xe9sx\
-\xe6\xfc%\x5c\x9c]p}\xc00@A\xb9\xbe\x9f\xf0\
-\x8b\x0e\xf2p\x02\x81!\x85\xbce0\x9e[\x99\xe7\xd8\
-\x13k5\xb1W\x17^\xf3\xbbR\x887\xd9\xcfS\x13\
-\x87\x91m#m\xa9\x14Q5j\x00 \xfc\xe0\x91\xbb\
-\xf0\xcb\x8f\xbd\x07wM\x8c\xa2\x9e%\xea7\xaf\x8c\x92\
-\xf7T\xc7\xaeO\xe3_\x7f\xed9<u\xe24\x02)\
-1P,\xb8\xdd\x81\xd6\xe2\x99\x0b\x17\xf1\xe2\x95k\xf8\
-\xdc\x1b\xc7\xf1\xaem\x13x\xd7\xae;p\xff\xb6\x09l\
-\x1f\x18@9ta\x88\xbc<\x00Re\xc3u>\x5c\
-jX\x02\xe9L\x1f#6\x16\x0d\xad\xb1\x14\xc585\
-5\x8b\x17/^\xc6\xebW\xaf\xe3\xcd\xe9Y\x5c_X\
-\x86\x10\x84R\xa8P\x0c\x5c\xd8K\xc3#{\x9e[\x8a\
-\xa8\xbf]r\xe0\xca\xe7qk\x85\xb15\x89~\xd2\x87\
-)\xb1\x89\xec\x00\xa7\x8be!\xc8m\xaeO\x87\x99\x98\
-\x01c\x0c\xeaq\x02\x80\xf0\xb1C\xfb\xf0\xcb\x8f\xbf\x07\
-\x87'\xc6\xda\x10\xf5\x9b\xfd\x0c\x8cP\x08\x84J\xe1\xd8\
-\xe4\x0c~\xf3\xeb\xcf\xe1\x0b'N!\x0c\x14\xfa\x0b\x05\
-w\xe0\x84@h-JA\x88\xc4\x18\x9c\x9c\x9c\xc1\xe9\
-\xa9i|\xf1\xd4Y\x8c\xf5\xf5\xe1\xc8\xb6\x09\xbck\xdb\
-V\x1c\x1c\x1b\xc6h\x7f\x05\xe5 @)P(+w\
-\xf2\xa5\x90+\xae\xe5\x94B\xd7\xd0\x1au\xad\x11%\x09\
-\x1a\x89\xc6b#\xc6\xe9\x1bs835\x83W\xafO\
-\xe3\xdc\xec\x1c\xa6\x97\x96P\x8b\x13\x04J\xa1R,\xa0\
-\x14(?0\xe26J\xa8\x9c!\x91\xe7\xa19V\xed\
-\xdbS`0\xd6\x97\x96_\xd3\xb0\x02!:u\x0c7\
-|\x0b<\x99\xade\xf1\x93_O\xa6\xadE=v\xd5\
-\xdf\xc7\x0f\xed\xc3\xff\xf2\xf8{q\xc8{\xaa\xcdB\xd4\
-\x99\x9dQ\x15\x94\xc4\x9b\xd7\xa7\xf1\xaf\xbe\xf6,\x9e:\
-~\x1aa\x10\xa0\xbfTD\xe0\xab\x1b!\x05\x0a\xdc\x14\
-\xc3\xad\x14C\xb7\x5c \xd187s\x03\x97\xe6\x16\xf0\
-\x95\x13\xa7\xa1\x84\xc4\x96\xfe>\xec\x1e\x19\xc2H\x7f\x05\
-[\xfb\xca\xb8\xa3RA9\x08W\x1c\xf4t\xbf\xf2L\
-\xad\x8e\x99\xa5*\xa6jU\x5cXX\xc2\xd5\xf9E\xcc\
-\xd7\xea0\xd6\xa9\xfa8\xe6\xa7\xc4h\x7f\x01R\x08\x04\
-R\xb8\x8aOP\x962\xab\xf6\xfe\xacO\xf2\xad'\x17\
-\xder\xaf\x058\xbe\xfbF\x0c\x8b\xdd\x11\x86\xdad\x17\
-\x9b\xa7Y[v,\x0am\x1cN\xc5\xcc\xf8\xd8]\xfb\
-\xf0\x8b\x1fx\x14\x87&\xc6Z\xa8/\xb4\x09\x9e2\x90\
-\xceS\xbdq}\x06\xbf\xf1\xb5g\xf1\xd4\x893(\x16\
-B\x0c\x96\x8a\x8e\xb3\xee9\xf9\xe9\xe0\x80\xb5^Z\x89\
-\x00\x13\xd8\xa6\xb8\xae\xb6\x88\xfdv\xd7\xf3s\xf38\x7f\
-c.\xd3:\x95>\xe9\xce\x92\xf3\x1c59\x85\x00\xc8\
-s\xb3\x8d\xdf$&\x85@\xa0\x14\x8a\x22\x80\xf2\x86D\
-\x9e\xeb\xa4\x04\x1c\xb7<w\xf0\x94X\xb9\xaa$U\x81\
-y\xbbn$\x84\xdf\x86\xda\xab\xc7\xa2&\x08F\x9b\xe0\
-:\x9b+_%\xac5\x19\xaf*1\xc6i^Y\x8b\
-\x8f\x1c\xdc\x8b_~\xfc\xbd8<>\x8aZ\x92l\x1e\
-I\x8f\x19\x81G\xab\x8fO\xce\xe07\xbe\xf6\x0c\xbep\
-\xfc\x0cJ\x85\x00C\x95\x12\x02!=\x8e\xe5`\x07\xb7\
-}C\x02\xd2\x0b\xfc\x0a\x82\x22\xe3\x05p\x01\xad\x9a\xd3\
-\xc8N\xed\xb0\xa9F\x08j.\xca\xb0lA$\x9a\xbb\
-\xa4\xe1d\x84R\xa5\x1cA\xee\xfd(\xd7*\x11>\xb1\
-\x17\xe9\x061\x0f\x8c\xb6\x1f\x87N\xc0\xc7\xdb\x85\xb5\xb1\
-\xf7\x9d\xe92\xcf\xae\x0d\x8b\x007{\xc6&\x13C\xe5\
-\xb6\xeeP\xb7\xf7\xd92\x9f\x94\x9d \xdc\x9c\xa1\xf1\xe5\
-\xfbr#Fb\x0c>vh?~\xe9\xf1G]N\
-\x95\xe8\x0d\x0fgv\x0a\x7f\x81\x14(H\x897&\xa7\
-\xf0\x1bO?\x87\xa7N\x9eF\xb1\x10b\xd8\xd3J\xa4\
-o\x7f\xa4'\xa6\xb9\x9b\x87\x10(\x1f\x82\x85\xca\xbe\x8f\
-V\xb9&\xbdR\xd9\xa2\x84\x8c9\xc0\xb9\x81\x8f\x5c\xc2\
-\x9e-\xab\xf2GSf\x9e\xc7\xffWJHp\x93(\
-\x08\xe7=-\xb89\xc3\xd8\xe3\xf1\xbfU\xf7\x92\x08\xa4\
-\xcd\xaa\x89\xd6\x9a9\x16\xc1c*\x9c\x12\xbb\x00\xb2\x00\
-\x0b@X\xf7\xbb@\xba\xd5\xcboPe\xc0\x8a\xe6\xb6\
-/66\xab\xc2\xb4\xb1\xd0^\xd4\x22\xd6\x16\x0b\xf5\x06\
-\x12m\xf0\xe4\xa1=\xf8\xc5\x0f\xbe\x1bG2>\xd5\xe6\
-P_\x18\xde\xa8\x94\xf7T_\x7f\x1e\x7fs\xe6\x1c*\
-\x85\x10#\xa5\x12\x82@!T\xca\x03\x91\xb9\xbc%m\
-5\xd8V\xcaPzP\x03\xa0u\xd9x\xee\x22`\xbf\
-\xcaXf\x95\xae\x03,\x01\xb82\x9drS/9Q\
-\x0d\x95\xceX\xa6\xde-\x05c\x85\x80\xb0n\xae\x8fE\
-\x87\xe3\xdc\xed\xf9\xd8\xc4\xc7\x19\x81u\xf7\x17\xad\x9d\xbc\
-;\xf2Sv\x00E\x0a\xb8\xd9\xb6\xdf\xb9\x89\xda\x03\xc8\
-v\xf6\x10\x08\xf0\x0dm\xce\xed\xd6\xb1\xccX\x8eb\xc4\
-\xda\xe0#\x07\xee\xc4/?\xfe^\x1c\xd92\xee\x12u\
-\xbb\xc9\x89\xba\x948v}\x0a\xff\xfa\x1b/\xe0\xe9S\
-\xe70\x14\x86\x18\xaa\x94\x10\x0a\x99A\x0e\xf0(wk\
-R\x963\xec\x0e\x06.\x95j\x95\xbe\xcc=5H\xc7\
-\xda\xb8U'?X%\xb4\xe7)*\x9d\xc2x6\x96\
-eW9\xce\xdd\x9e\x8fMz\x9c\xf4\x03\x1b\x1bJ\xde\
-\xdd^\x19\x01lD\x03\x9c\x9b\xe2\x11\xd9\x96-m\xa1\
-\xadAb\x0d\xe6juDI\x82\x8f\x1e\xdc\x8b\x7f\xfc\
-\xc1Gqd\xcb\xf8\xa6Q_\xda\x13\xf5c\x933\xf8\
-\xcdo\xbc\x80/\x9f8\x8bB\x18`\xb8\x5cF\x10(\
-\x04~\xf4<\x1d\xa2%\xea\x9d])y\x95\xef\xee\xc3\
-\x19\xb3\xd3\xf8Jq\xbb4\x15@\xc7\x8aqU\x10\xfb\
-\x9dw\xe3\xf5\x8f\xd7\x9a\x1e+\xabNz\xcf\x95\xb3\xed\
-\xaci\x09\xac\xadA\xac5\xe6\xeb\x11\x1aq\x82'\x0e\
-\xee\xc1/=\xfe\x1e\x1c\xd9dD=M\xd4C\xa5\xf0\
-\xd6\xd4\x0c~\xf3o_\xc0WO\x9dG\xa5\x18b\xa8\
-\x5cFAI(\xa5\xa0\x84+$\x5c\x95E\xb7(\xf1\
-\x15\xf8\xee\xbc5\x87F\xb8[>\x16\x8c\x05\x0b\x09V\
-\x02RHX\xb6=\x9eW\xce8\xea\xc6:v\x82\xf6\
-\x0a\xccK\xf5\x08\x8d8\xc6\x93\x07\xf7\xe2\x97\x1e{\x0f\
-\xee\xde\xe2\x1a\xca\xfaV \xea\x93\xd3\xf8\xado\xbc\x80\
-\xaf\x9e>\x87b\x18`\xa8\x5c\xf2-\x19\xe5\xdaU\xb7\
-\xcc\x98\xbe\x17n\xbe\xc0\xc8\xddw\xe1\xb1\x9a\x14E!\
-\x00\xe1\xf7\x17v\xeb-R~T\xa6\xaal\x0c\xe2D\
-c\xbe\xde@l\x0c>~`/~\xe1\xb1Gqd\
-\xab\x1b\xd1J\xcc\xe6\xf5\xfe\x94\xef\xfd\xbd95\x83\xdf\
-\xfa\xc6\x0b\xf8\xda\xe9\xf3\xa8\x14B\x0c\x94\x8a\x08\x95B\
-A\x05\x08C\x95\xf9\x92\x94\x11\xc0\xb7-e\x03\xbe\x98\
-\x1cC\x95\x19Q7Mh\xca;q\x92\xce\x1a\xd7-\
-\xfd\x09\x96l\x0bJ\xcf\x19\xc6\xe3\xaa\xbf\x86N\xf0\xa1\
-\x83{\xf0\x8b\xef\x7f7\xee\x9a\x18s\x9ej\x93\xa9/\
-\xa1\x94xsr\x06\xff\xe6\xd9\xbf\xc3\xdf\x9e\xbd\x80r\
-\x18b\xa4\xaf\x8cP)\xf7\xef\x81\x82\x12\x12 7d\
-\xfa\xddOd\xbeU\x91\xd0\xf9)\xed\x89\x85\x85\xb8\x8b\
-\xf1\xaf\x04\x80\x04!\xb4\x02\xdc\x92_\xd1\x9a9\x15\xac\
-\x00\x11\x03R@k\xe3t\x1c\xac\xc5B#\x82f\xc6\
-\x93\x07\xf7\xe1\x1f\xbd\xefa\xdc\xd56LJ\x9beT\
-J\xe2\xad\xe9Y\xfc\xees/\xe1\x99\xb3\x17\xd0W\x08\
-1X.\xa1\xa0\x02()QT\x0aR6%\x0e\xdd\
-7\xfan\x1f\xbb\xb8u\xf0\xa8[\xfc\xce`\xc1@\xa1\
-\x0b>\x16VT\xda\xebc\xef\x0c\xc0\x90\x05q\x93\xf9\
-\x99\x18\x8bF\x1cC\x1b\x8b\xc7\xf6\xef\xc6/\xbe\xef\x11\
-\x1c\x1a\x1f\xbdE\xd4\x17\x81\xe3S3\xf8\x9d\xe7^\xc6\
-7\xce^D%t\xe1/\x08\x03\x14\x95B\xe0\x15\xff\
-\xa4g\x89vs\xb1\xdc\xbe\xadQ\xd6\xf9\xee\x82\xa3\xa8\
-\x0b \xaauiX\x04\xb0\xa4\xac\x8b\xbe^$\xb4\xe4\
-\x96;i\xeb\xb6IXmPO\x12D\xda\xe0#\xfb\
-\xef\xc4\xcf\xbe\xe7!\x1c\x1a\x1f\xcdX\x0a\x9b\x9d\xa8\xbf\
-59\x83\xdfy\xfee|\xf3\xecET|\xa2\x1e\x04\
-A\x069\x04~\xd1\x00\x91\xf8\xae\xad\xd3\xdev\xdbb\
-\x86\xf2\x0e\xa8\xab\x1c+\x7f-\xbb\xe9cZ7\x0d\x12\
-\xccH\xc8\xad\xc8\xb5p\xeb\xe8\xaaQ\x84\xdd#C\xf8\
-\xc9\x87\xee\xf5|\xaa\xcd\xa1\xbe\xa4t\xc04\xa7:1\
-5\x83\xdf}\xfee|\xe3\xec\x05T\xc2\x10C\xe5\x12\
-\xca\x85\x10\x81\x92\x08\x04A\xfa\x01\x09\x22y\xdb 6\
-+q\x17\x80\x81\x85\x81\xd3\xca*t\x037\xe4\xc5N\
-\x85\xdff\xba\x9e\xcbJ\xf7\xe4\xb0\x1f@h\x18\x8d\x82\
-\x94\xf8\xfe\x03{q\xd7\xc4\xb8S\xb0\xf3\xed\x91\x9b\xc9\
-jR\xdd\x88 \xcd\xa9fn\xe0\xb7\x9f}\x09\xdf<\
-w\x09\x950\xc4h\xa5\x8cB\x18 \x94\x0a\xa1\x92n\
-Z\xd7\xb3,q\xbb\xf6\xdb\xa4\xbc\xdd\x1dSK\x84\xc0\
-\x9f\xcb\xa8\x97\xd5\xbd\x04\xcaF\xb3\xd7;%l\x0c\x88\
-\x04\x08\xd6\xad\x7f\xd3\x06;\x87\x07\xf1\xf0\xae\xed()\
-\x85\xdaMH\x1e\xb6x*\xce\xf5\xfe\xa6|\xf8;w\
-\x11\xe5b\x11\xa3\xa5\x22\x8aa\x80R\x10 P\x12\x82\
-\x04\x84hR`n\xdf67\x16\x0a\xc1>\x921\x18\
-\xa2{\xc3\x82\xe7\xbb\xaf\x85\xae\xa6'\xdci+\x18\x80\
-\x18\xd6K%\xee\x1b\x1b\xc1\x1d\x83\x03\xd0\xb0\x9b3%\
-\x92R_\x94\xc2\xf1\xe9Y\xfc\xdbg_\xc27\xcf^\
-\xc0@\xa9\x84\xa1J\xd9S\x85%B\xa1\xa0\x94\x84 \
-\xbf\xc4\xe96\x08z\xcb\x90\xacl\xa2\xa8\x9bP\xc8p\
-\x9d\xf9\x82\x12\x08\x04\xb5aSM\x94\xd5S\x8f`\xbc\
-L\xa3&\x93mT \x06v\xf6\xf5a\xa0\x10B\x1b\
-\xbei^UJ}q\x88\xfa\x0c\xfe\x9f\xe7_\xc6s\
-g/\xa2\xbfT\xc4X_\x1f\xc2@\xbaQ\xa8@d\
-\x9a\xefiS9\xdb\x14\x9c\xff\xec\x1d\xbe\xc7\xca\xc7\xdc\
-~\xee\xaa\xcf\xf5<\x7f\xed\xf1\xce\xaer\xac\xb4b\x13\
- \x90T\x10\xd6\x22E}:Jb3C\xc3\xe6`\
-\x09\x07\x01\x94\x02\x09\x01\x82\xb9\x19'\xe5\xff\x9b\xf2\xa9\
-NL\xdf\xf0\xd5\xdfy\x0c\x96\x8a\x18\xeb\xefG\xc9\x0f\
-5\xb8\xc9\x15\xe11\xaafGWe\xc3\xaf\xfe\xb3\xb7\
-\xff\x7f\xcauZ\xf1\x98\xd5\xfe~\xfb\xb9\xee\xfc7E\
-n\x1b]\x19\x96\x92\x80\xf0\x1aY^$>\x93k\xf6\
-\xb2\xcc\xec\xc9\xfbY#\xd2\xd3z\x95pC\xaeR\xb8\
--S7\xe3\xa9\xf2\x89zAJ\xbc9=\x8b\xdfy\
-\xfe[x\xee\xfc%\x8cV*\x18\xae\x94\xd0\x17\x86\x08\
-\xa4D)T\x10\xc2u\x09\x94\xdb{\xb6\xa2 i\x95\
-\x94\x16\xad\x84\xb5\xb6\xbf\x03M\x19\xca\xdb\xcfm{.\
-\x11 $\xa4M\x1c\xadf\x95\xc2H\xadzZ\xd9y\
--H\x99M\xd2d\x8b\x84\xbc.\x12\x00\x905P\x16\
-\xd0R\x22\x90\x06\xa1R\xa8\x0b\x81\xc9z\x03Kq\x8c\
-\xe1R\x11\xdaRO\xc9{\x0b\xf5E*\x1c\x9f\xbd\x81\
-\x7f\xf7\xdc\xcbx\xee\xfc%\x0c\x96K\x98\xe8\xefC1\
-\x08P\x0c\xdc\x86\x88\x82\x1f\xdcdO\xe9URBc\
-\xa5\xb6S\xfb\xff\xaf\xb6\xb4\xb3\x9b\xff\xff\x9e~n\xca\
-_[AX\x5c\xcb\xb0\xb4v@\x05\x1c\xd7Z\xfa\x15\
-\xbb\xc8K\xd9\x08\xd1\x8c\xcc$\xa1\xa1!\xad\xdb\xc2U\
-T\x0aKD\xb8<}\x03S\xd5\x1a\xc6\xcbe\x08\xb2\
-\x99\x1cQ\xb7\x89\xba\x12\x02\x81T893\x8b?x\
-\xfee<s\xe12\x06K%L\xf4WP)\x14\x10\
-\x06\x12\x81\x17\xc9\x10R\xf9}1\xad_l3E\xe0\
-n?.\xf7;\x01q\x93\x03\xc9\x8a\x1f\x0f\xba\xab\x00\
-\x00\x07]IDAT\x14\xaf\x8fc)\x95)\xf5\xa5\
-+\xde4\x9b\x8c\x05 \xf2\x18\x97\xb5n\x8b\x81T\x08\
-Y\xc3\xb0B14(\x84\x01./.\xe3\xe8\xb5)\
-\x1c\x18\x1d\x86\x12\x04c\xbb\xf4V9D\xfd\xf8\xf4\x0c\
->\xf3\xc2\xb7\xf0\xcc\x85+\x18(\x970\xda_A%\
-(\xb8\xbcJJ\x90R^\x8f>\x0f\xde\xf9\xe1\x05\xa0\
-\xe5\xf3R\xdb\xef\xab\xdd\xdf~\xdc\x1a\x8fc\xf6\x83\xaa\
-\x8c\xc4\x1du\xabH\xe8\xa2\xea\x02n\x88\x8cA9\x0c\
-\x11(\xe5\xc3\x1d\xaf\xaa3\xca\xfeM\x88\x19\xa4\x14\x12\
-\xcb(\x06\x01\x06\x8aEL'\xcb\xf8\xca\x99\xf3\xb8o\
-\xdb8\x0eO\x8c\xf9\xd9\xc1\x5cH\xcd\xb9\xcf<\x1c\x91\
-\x22\xea\xa7\xa6o\xe03/\xbe\x8ag/^\xc6`\xb9\
-\x84\xb1\xbe2\xca\x85\x10e\xdf\xaa\x09\xbc\xb8\x98\xc8\xef\
-\xa6\xce\xab\x92\xdd\xbe\xdd\xb2\x9b\x14\x02JI\x10H$\
-`Y\x8bVz\x8dUi3Dn;\x05\x80L%\
-\xb7\xa3\xab\xf4'\xd4\x10!\x0c\xdc\xdf\xfb\x0b\x05\xc4Z\
-\xe3\xcc\xcc\x1c\xfe\xf8\xb57\xf1?=|?\xee\x1c\x1a\
-Dl\xbcrK\xbb\xab\xf5\xe8xZ\x00\x9c\x98\xb9\x81\
-\xcf\xbc\xf8\x0a^\xbc|\x15\x03\xe5\x12\xc6*\x15\x94\x0b\
-\x01JA\x88r!\xf0B\xf8\x0e\x00m\xd9\x9f\xb1\x8a\
-\x1e\xea\xed\xfbM\xbe\xf7[/\x98\x180,lA\xf7\
-\x00\x90\x02Y\xa5\xc5d\xd7L\xb4\xadu^\xab\xe8_\
-\xcdZ\x8b!S\x80\xb6\x8c\xe7.^\x05@\xf8\x89\xfb\
-\xee\xc6\xde\xb1a\x14\x03\x05c\xb9e\xbcKxRa\
-\x9c\x18\xbcz}\x1a\x7f\xfa\xfa[x\xe5\xea$\x06K\
-%\x0cW\x9c\xa7\xaa\x84\x81k(+\x09%\xa4\x9b\xa6\
-\x16\xdc2\x00{\xdbO\xbd]m\x1d@oT\x14\x84\
-\x00\x84\x020\x10`^k\xa3\x15\x83|\xb70\xad\xfa\
-\x98C\xf7\x1aRB\xd6\xea\xf8\xbb\x8bW0S\xad\xe2\
-\x89\xbd\xbbq\xf7\xf8\x18\xb6\x0f\xf4\xa3\x1c*\xb7B\x04\
-\x8c\xf9(\xc6\xb5\x85e\xbcq}\x0a_;\x7f\x19W\
-\x16\x161R\xa9`\xa8\xe2\x1a\xcaa\x10\xa0\xa4\x5c\x05\
-(\x08^M\xe5\xb6\x19};n)\x90*\xb06e\
-}\xed\xb5r$\x1c\x96e\xd7\xda\x97\xe7JO\xc3\xec\
-\xdb(\xceU\xa6z\x03R\x10\x16\xa4\xc4\xe5\xf9E\xfc\
-\x87W\x8eb[\xa5\x82=#\xc3(\x17\x03\x04$\x10\
-\x811\xd7\x88q\xf5\xc6<&\x97\x97!\xa4\xc4h\xa5\
-\x8c\xbeb\x01\x95B\xe0\xe8\xc4\x81\xf2\xd5\x9f\xc8\xb0\x95\
-\xdb\xee\xe9\xdbeY\xecV\xfe\xa6\xcb\xc6\xa9sOg\
-\xa5\xf0Zj\x95^.\x07l\xd7_\xb4\x94.\xa0\xf6\
-\xe6\x5c\x14\xd6\xad\x86%\xcfD\x90\x0a\xfd\x85\x00\xd5(\
-\xc6T\xa3\x81+\x97\xae\xb4Ph\x94T\x08\x95@\x7f\
-\xa9\x84\xbeR\x01\xc5 @!\x08P\xf2h\xba\x0b\x7f\
-\xe2v\xc8{G\x84Ar\xa9\x08yX\xca2\xa3\xd6\
-\x85aI\xaf\xdfN\xe4\xa7y\x85@/\xe3\x06\x0a\x80\
-\xb6M\x8f\x15*\x8500(\xd9\x02\xfaJ\x1a\xd6\x18\
-4ts\x84\x9e\xe0\xf0\xaf@\x0a\x84BBx\xc6g\
-)Pn\xcb\x14!\x93\x16\xba}{g\x18V\xd6\xdc\
-7\x96C!\xe2\xc1J\xc5\xaekX\xfb\xc6\xfaa(\
-`\xe3w\xe7\x85A\x00\x12\xdd\xefUf4\xa5\x1f\x89\
-\x08\x81R\x08\x95\x856\x166\x0c\xc0\xdc\x84\x1d\x9a9\
-\x1aej/\xc2\x93\xf3\x9c\xea\x8a\xcc\xad\xba\xbd\xed\xa9\
-\xde)7!\x08\xda2\x84\x14\x18)\x84\xf3\x8f\x1f\xde\
-g\xfe\xe5z\x86\xf5\xc8\xa1\xfd\x98\x5c\xac\x05'\xaf\xcf\
-\x22J4\xfaJ%G\x89\xe91\xc1\xb3\xd6\xafy\x05\
-\x10J\xce\xd6\x96X\xf8a\xd6\x5c\x91\x90^\x01NY\
-Efk\xcb\x04\x09\xbfF\xf6\xb6Q\xbdc<\x96?\
-\x13\x8d(\xe2r\x18.l\x1d\x1b\xbd\xfc\x03G\x0e$\
-\xebz\xac\xf7\xee\xdd\xa3\x8f]\x99\xbcz\xec\xd2\xf5\xa1\
-Z#*O\x0c\x0f\x90 \xe9\x13\xf8.\xdf\x9c\x09,\
-\x1dnk\xd8\xba\xa60\xdb\x8c\xbfc\xac\xed\x00\xba\xe5\
-\x840\x80V~:5EFn\xdf\xbe\xbd%\xa1\x14\
-\x02\x09\x03\xcbK\xb5\xea@\x10\xfc\xfe\xc3\xdb\xb7?C\
-Df]\xc3\xdaV*N\x1e\xb5\xf6\xbfg\xd8\x7fT\
-\xad5~\xd6Z*\x84RP\x0c\xd35\xbb\xd7\xb5U\
-\xbc\x06;\xfb\xdeb\x0e\x9c\x0d\xa4\xcc\x14LRY\xa3\
-<\xa6\x95\xb1\x22\xf2\xbae\xc2\xebA\xdc>\xbd\xdf\xd6\
-\x10\xa8\xa4\xc4\xd4\xfc\x12\xeaQ<\xb7\x7ft\xe8\x9b\x1f\
-\xbc\xeb\xce\x8b\xaeXl%\x19\xb4\x18\xd6\x9c\xfbG\xc3\
-\xcc\xa7\x8e\x9d\xbf\xf4_\xdf\x9a\x9d\xff\xa1\x85\xa5\xe5\x9d\
-\xdbF\x07\x19\x04\xb2\xd6v\xe9.\x9b\x9b\x0e3\x0ej\
-N\xc9\x96\xd0\xb6*CR\xf6\x1b\x81\xd1\x94\xbfoG\
-}o\xbb\xaco\xe7-T\x01\xc7I\x82\xe9\xa9\xa9e\
-E\xfc\xd9b\x18\xbcHD\xdc\x89\xb9\xd2bX\xc3\x19\
-\xeb\x92\xf0\xb9\x17_\x7f\xee\xc2\x8d\xf9\x7f\x7f\xe5\xea\xe4\
-/\x0eU\xca\x83\xfd\x95\x22'\xdaP74\xe3\x9b\x1e\
-\x98\xb8}\x0e\xdfQ\xe1\x8f}\xbbM*I\x97\xaeM\
-\xc5\xd5\xa5\xda\xe7\x1f\xd8}\xc7_\xfc\xc3\xc7\x1e]\xf8\
-9tV\x12\x5c\x15 \xfd\xf4\xbb\xef[\xf8\xcc\xb3/\
-~\xf6\x99S\x17\xb7\x9d\xbft\xe5\xc7\xee:\xb0\xa7\xbf\
-\x10\x04H\x8cva\xee\xf6!\xff^\xb0)\xa4,\x5c\
-)%\xae\xdeX\xc4\x85\xeb3\x8b#\xfd\x95g\x1f\xde\
-\xb3\xf5U\x22bkmn\x1b\xd8:\x86\x95\xba\xb6\x9f\
-~\xef#\xa7\xaa\xb5\xda\x1f\xbfty\xbab\x0a\x97?\
-ud\xf7\xce\xbeJ\x10\xb01\x86\x0c3\xec\xedc\xff\
-\xdd[\xfd\xb1\xcb\xa9\xa4\x10 !qyv\x0e\xa7\xce\
-]\x9a\x0b\xd9\xfe\xce\xfe\xad\xa3\xff\xe9\xd1]w\xd6\x8c\
-1\x1d\x8djU\xc3\xa2fHL\x8e^\xbe\xf2\xc2\x92\
-\x11\x953\xd7'\xe3\xd7\x22\xfd#\xfbw\xdd\xd1\xbfu\
-\xa0\x0f\x0a~\xfd\x07s\xce\xbao\xdf\xbe\xf3\xe1\x04x\
-Q]b)%\xd5\xa3\x18\x17gg\xa33\x97\xaf-\
-\x96\xac\xfe\xdd'\xf6\xef\xfa\xcc\x0f\xbd\xfb]S_9\
-qb\xcd\xb5\xcd\xebF4f\xc6\xe5\xd9\x99\xf0\x0b\xc7\
-\xce\xde\xff\xfc\x85\xcb?\x19\x16\xc2\x1f\xdf\xb6m\xbc\x7f\
-\xe7\xe8pP\x09C\x22?\xbe~\xcb\x979\xdd\xbe\xbd\
-\x0d\xa1\x8f]\x85N\xe0D[\x9a\x9a_\x8c/L\xce\
-4\x96\x96\xaa\x7f5R)=sxb\xe4?\xff\x83\
-\xf7<4\xd9\x0d\x01\xa0\xebT\x89\x99\xe9\xb7\x9f\xfe\xc6\
-\x8e\xcb\x8b\xf5\x1f\x9c\x8f\xe3\x07C\xa5>5\x18\xaa\xf1\
-\xfe\xbe>Q\xe9\xaf\xa0\x18\xc8Lc\xf4\xf6\xed;\xf3\
-f,\xa3\xde\x88P\xaf\xd5\xed\xff\xbf\x0f_\xbf\xbd\xfd\
-\xfa\xe3\xe7\xf6?\xff\xfe=\xd0\x10\x15\xd9\xab+-q\
-\xdaEC\xf9;\xb6\xa1\x05\x8a\x12\xd6\xf9\x97O\x19\x0c\
-\xc5\xa5\x19\xce<z\xc9v\xf7\xcdK\xb9\x9b\xaf\xde\x86\
-\xfc\xfa\xfd\xbb\xfa\xd3\xcf\x7f<_\x7f\xfdBX4\x9a\
-\xb2\x86l\x1d\xf8\xff\xff\x7f\x06VVV\x06N\xc6\xff\
-\xdf\xb9\x99\x18\xfadD\x04w\x7f\xfe\xcbp\xceS]\
-\xf2\xab\x8e\x94\xc2?\x5c\x0du\x8a\x12\x16\x03\x03\x03\xc3\
-\xf5O\x9f\x184\xf9\xf8\x18\xfe\xff\xff\xcfp\xe6\xfec\
-\x8d\xc7\x9f>/\xbe\xfd\xfe\x93\xd8\xbd\xe7\xaf\x18~\xfd\
-\xfe=\x1a9C\xbd\x0b\xc8\xc8\xc8 ),\xc0(\xc1\
-\xcf\xfbA\x86\x97+)P_\xfd<##\xeb_\x06\
-\x06\xc8\xe2M&\x12\x16\x02\xb0\x90b\xb7&\x1f\x1f\xbc\
-q\xff\xff\xff\xff[\xff\x1e>\x09x\xf9\xfb\x173\x07\
-\x0b\x03E\x1bSG\xc1\xe0HX,\x0c\x0c\x0c\xbc\xac\
-l\x0c\x22\x82\xbc\xff\x14\xc5\x04_02\xb2\xfeE\xdc\
-(B\x87\xd5%o\xdf~\x1a\x8d\x88\x11\x00^\xff}\
-=\x1a\x08\xa3`\x14\x8c\x82Q0\x0aF\x01y\x00\x00\
-\xdcV\xfe\xb1\x04[\x00W\x00\x00\x00\x00IEND\
-\xaeB`\x82\
-\x00\x00=\xa5\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3>a\xcb\
-\x00\x00\x00\x07tIME\x07\xd7\x08\x1d\x03\x16\x03\xd6\
-;\x18\x80\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\
-\xff\xa0\xbd\xa7\x93\x00\x00=GIDATx\xda\xed\
-}\x09\x9c\x14\xd5\xb5\xf7\xad\xeau\xf6\x0df\x06\x86e\
-\x80\x01\x1c\xf6M\x16\x01Q\x9e\x01%\x8a\xfb\xae\xd1\x18\
-\xb7H\xd4\xc4$\x12\xf3\xde\xfb\xe2\x97g\xd4\x185\xf1\
-!\x1a|\xc6hT$\x82\x8a\x1aL\x82\x02.\x80\xa8\
-,#\xfb>\x03\x0c\x0c\xb3\xef=\xbdV\xbdsn\x9d\
-\xdb]]S\xdd]=3(>S\xfc.U]S\
-\xddUu\xcf\xff\xec\xe7\xde+\xb1\xff{\x9b\x0d\x9a\xdd\
-\xd0d:\x8f[\x10\x9a\x87\xda\xb7~\x93\xfe\x0f\xbc\x83\
-\x13\x9a\x0b\x9a\x83\x9a\xcb\xd0\x9ct\xdeN @\xc2W\
-A\xab\x83\xd6\x92\xe4\xbd\xc4\xef\xe3\xef\xa4\xd0o\x04\xbf\
-\xc9\x9dg\xff\x86>7\x12\x22\x83\x88\x81\x84H\x87\x96\
-F\xc7n\xc3\xde\xa5\x03\x08\x02\xbe\x11Z*\x11\xce\x0b\
-\xcdo\xf1\x9ex\xbflh\xb9\x04\x00\x1f\x81\xcbG\xad\
-\x83~K\xfd\x17\x00N\xed\x86D\xed\x05m \x11\x12\
-\x09\x9dI\x04JKMM\xcd8\xef\xbc\xf3zO\x9c\
-8\xb1\xd7\xb0a\xc3\xf2\x06\x0c\x18\x90\x07[fVV\
-V\xba\xd3\xe9\xb4/]\xbat\xc3\xddw\xdf\xbd\x02\xae\
-\xad\x87\xd6j\x11\x00n\x22\xfcPh\x05\xf4\x0c\xed$\
-A\xc4\x1e[\x1b\x81\xc1C\xfb\x7f\xa9\x80\x1e\xded\x22\
-\xc0P\x02@\x9f\xc1\x83\x07\xe7^w\xddu\xc53g\
-\xce,\x1e:thQ\xbf~\xfd\x0a\xed\xb0\xc5\xfa\x81\
-\x86\x86\x86\xc6^\xbdz=\x0c\x87\xdb\xa0\xed\x81v\x12\
-\x9a\x92\xa0\x8f\xf2\xa1\x95@;c\xd6\xacYcn\xbf\
-\xfd\xf6\x91\x9f|\xf2I%\x80\xe9hKKK\x13\xfe\
-,I\x16\x04T\x13\x1d\xb7\x93ThO\xf0\xfb\xff\x02\
-@\x92\xdc?\x00\xda\xa8\xf1\xe3\xc7\x9f\xb5e\xcb\x96\xfb\
-\x14EQeY\x8ez\x0f8\xc7\x82\xc1 \x0b\x04\x02\
-,\x14\x0a\xf1\x86[NN\x0eSa\x9b1c\xc6S\
-\x9f~\xfa\xe9z8\xb5\x13Z%\x11)\x9e\xe8/B\
-\xe2\x17\x15\x15M\xda\xbd{\xf7\xbd\x19\x19\x19\xa8r\xf0\
-\xf7\x03\xfb\xf7\xef\xafX\xb3f\xcd\x9e\xc5\x8b\x17\xef=\
-p\xe0@-\xd9\x05\xd8\x9aI\xca4\xd1\xef\xb7\x9f\x8e\
-\xf6\x82\xed\x1b\x06\x007qc\xff\x07\x1ex`\xe6\x94\
-)S\x86K\xb0!\xb1\xbd^/\xf3x<\xac\xb5\xb5\
-\x95\x01W\xf2c\x9f\xcf\xc7\x1b\x02\xc1\xef\xf73\x97\xcb\
-\xc5@8H\xa0\x0e\xbc\xcb\x97//\xd7\x89nO\x9c\
-\xfeA\xd1?\x08\xda\xb0W^ye\xde\xe8\xd1\xa3K\
-\x04\xc8\xe0\xb7l\xf9\xf9\xf9y\xf8\x1c\x0b\x16,8\xeb\
-\x9ak\xae\x19\x02 \xc9\xda\xb6m\x9b\xb3\xa3\xa3#\x83\
-TT\x1a=\xb7D\x00\x08\x9en\x22\xf5\x1b\xe9\xb9\x00\
-\xd7\xcb\xc0\xcc\x9c\xb8\xf5\xf5\xf5\x9c\xe8\xd0\xe9\x9c\xdb\x01\
-\x13\xbc\xf1\x8bu\xfb\xb6\xb66\x94\x00l\xf6\xec\xd9\xe3\
-\x80xhGd\x11\x91b\xa9\x8cL\x02\x5co\x10\xfd\
-\x83\xcf?\xff\xfci\xf8\xfd\xaa\xaa*v\xf8\xf0av\
-\xf4\xe8QVWW\xc7\xef\x8b@\x1c>|\xf8\x90\x85\
-\x0b\x17^v\xec\xd8\xb1\x9f\xfd\xfd\xef\x7f\xbf\x1e$\xcd\
-t\xf8\xeex\x94\x1e\xa4\xb6rO7\xbb\xeb\x9b\x08\x80\
-\xa8MOp3\xa2\x8b=6\x94\x06\xc8\xb9\xa0\x0a\xb2\
-\xef\xb8\xe3\x8ea\xf0\xa7<\xd4\x0c\xb47z\x0bN\x12\
-\xff\x08\x80\x81\xbf\xff\xfd\xef\xe7 \xc7#\xb1Q\xba\xe0\
-\x86R\xa5\xb1\xb1\x91UVV\xb2\x8a\x8a\x0a\xb4/8\
- \xddnw\xca\x9c9s\xa6~\xf8\xe1\x87\xf7\x80\x9a\
-\xfa\xc1\xa8Q\xa3&\xa2\xbd\x82@\x22\xc0\xfd\x0b\x00=\
-\xa1\x82\x90\x1b\xb1\xc5#\xba\x1e\x18\xb8!\x01\xf1;7\
-\xdcp\xc38\x22H\x1fr\xef\x8aQ\xb5@\xeb\x07\xad\
-/y\x1a\xf8\xb7\xbe \xdeG\x8d\x193\xe6\x0c\x04\x0f\
-J\x1b\xb3\xfb\xa1\x1a\xc2\xbf!\x10\x8e\x1f?\xce\xda\xdb\
-\xb9Y!\x8d\x1d;\xb6\xf4\x89'\x9e8\x9b\xb8?\x85\
-\x00\xf6\xadv\x03e\x12\xbd)\x04\x80\x10\x19Hmt\
-\x9c\xbcN\x90\xa4\x98\x00\xc1\xbf\xe9\xf7\x08\x00p\x15\x19\
-\x18\x91\xa5\xc5\xc5\xc5\x85@\xb0\x06\x12\xf5\xe2\xde\x01j\
-\x88,;ps\xff_\xfe\xf2\x97s\xf1\x0fh_ \
-\x87\x1b\x7f\xd3x\x7f\x94\x10\xd8\xc0\x1e`)))h\
-\x9f\x04H\xf7\x87N7\x8f\xe0\xab\x06\x80\x8bDn>\
-5\x17\xb9J'\xc9Z\xaeI`$IF\xc9!8\
-\xdc\x8c\xd8f{$ r+\xba\x8a+W\xae\xbc\xe4\
-\xb9\xe7\x9e\xeb\x03\xe7\x14\x10\xdf~\xf4\x10\xc0\xaao\xdd\
-\xb9sg\x0b\xc5\x07\xdc \xfa'\x17\x14\x14\xe4\xa3\xaa\
-A;#\x19\xb0\x89\xed\xe0\xc1\x83u\xf4\x9e\xbe\xd3\xcd\
-\x08\xfc*\x01\x90I\xa2\xb6\x1f\x89\xd6A\x99\x99\x99Y\
-\xd0\xa9\xe83\x1f\x82v\x9c\xb8\xae!N\x10\xc5%\xe8\
-.\xc4\xbf^\x05$\x22\xbe\x9eC\xc1\x95c#G\x8e\
-\x1c\xfe\xd4SO\x0d7\xde\x04\x00\x12\x00@4\x81\xb4\
-\xf0\x0d\x1c8\xb0\x1f~\xbf\xb9\xb9\x99\xdb\x0f\xc9\xdc\x07\
-\xc3\x11x\xee\xcb/\xbf\xac\xa7\xa8\xa3\xf7\xdb\xe8\x05\xc8\
-\xa4\xffD\x00g\x18\x88\xc6\xf1\x1b6l\xf8\x1e\xe8\xcc\
-\xff\x00\x1f\xfa:\x10\xb3\xa3\xe1\xfc`hC\xe8\xbat\
-\x03\xd7\xa7\x92\xbeF\x97\xaa\x90\xbc\x00\xc9\xa8\x02b\xe9\
-\x7f\xa3\x81\x88\xc6 \xba\x8d(\x09\xb0\x89X\x01\x12\x98\
-\x08\xe7\x00\xf7\xae7\x12_\xe8w\x04\x8d\x95\xfb\x84\x8d\
-\x1b\x9b\x8d\x89x\xd4\xfa\xf5\xebk\xbf\xad\x12\xc0N\xc4\
-\xcf\xa7\x00\xce\x90k\xaf\xbdv\x0cp\xdd\xe5\xd9\xd9\xd9\
-9\xc8\x1d3g\xce\x9c\xb8y\xf3\xe6\x9cK.\xb9d\
-9\x88\xca\x14\xb2\xbe+\xc8X\xf2\x91%\x9eEF\x99\
-\xb0\xd8\xfb\x83e\xddG/f\x8d\xa29\x1e\x97bC\
-q.\xae3~\x07\x1b\x12\x0f@\xc6\x9b\xb0\xfa\xad\xdc\
-Gl\x0e\x87\x83\x9f\x03\xd7\xb3\x1d\x5c\xc6Vz\x97\xc0\
-\xb7I\x028\x88h\x03\x88\xb3G\x825|\xde\x0b/\
-\xbc\xf0}$\xbe\x08\xa6`'\x0d\x1b6l0H\x84\
-\xdb\xe7\xcd\x9b7Y\xe73\x17\x90\xaa\xc0\xc0K)\xb4\
-1 )&>\xf0\xc0\x03\xf3v\xec\xd8\xf1\xbd\xb3\xce\
-:k\xbc\xd1\x0eH$\x0d\x12y\x09\x82\x90\xf8\x5c(\
-%\xd0`Dk^\x88~=\x81\xe3\xddO\x00\x00\xb7\
-\x9a\x9a\x1a\xa1\xff\xfd:\xe3\xd2j\xff\x9dr\xaf\xe1T\
-I\x00\x17q*\xc6\xeb\x8b\xc0\xea\x1e\xf1\xe6\x9bo~\
-w\xf6\xec\xd9\x93\x05\xd7`\xa7\x8a\x8eEn\x03\xdf<\
-\xe7\xf5\xd7_\xbf\xf5\xa1\x87\x1ez\xeb\xd1G\x1fu\x93\
-$\xc0\xce*\x02#\xac\xdf\xe3\x8f?~\x16\x00d\x12\
-\xe8\xeeL\x9d\xae\xe6\xbex\x22\xbd\x1c\xcbSH\xa4\xc3\
-\xe3qx\xa2\xef\x0a\x00\x1c;v\xac\x96t\xbf\xcfb\
-\x7f\xa7\x91\x0a\xcc\xa4\xeb=\xe4!\xb5\x10\x80N{\x00\
-\xb8\x88\xf31|\xda\x1fti\xe9\xea\xd5\xab\xaf)-\
--\x1d\xaa7\xdc\xf4\x1d\x87\x84DQ\x0b\x9d\xe6|\xf0\
-\xc1\x07\xaf\x06\xdf\xb9\xf0\xfa\xeb\xaf\xff\x10\x80#?\xf2\
-\xc8#\x13\xe0xVZZZ\xba\xe8xa\xc9\x0b\x9d\
--:>\x19Bv\xe7Z+\xdf\x15*\xe0\xd0\xa1C\
-\xf5\xc4\xc5YD\xdc\xde\xe4\xf1\x04L\xfa-\x93\xae\xeb\
-K\x063J\x00T\x1f'X\xa4\x86!\xd4\x93\xc4\xea\
-\xe9d\x90\x9b8\x1f\x0d\xba\x01\xc3\x87\x0f\x1f\xb3j\xd5\
-\xaa\xeb\xfb\xf7\xef_d\xd4\xb5f{4\x9c\xf4\x1d\x0a\
-\xfa\xb3-\x1d6q\x8d0\xda\xcc\x02A\xf1~\xd7\xb8\
-O\xe6\xda\xae~\x17\x80\xcf\x9cN'\xaa\x12\xef9\xe7\
-\x9c\xf3\xec\xd6\xad[\x0f\xa2@\x80VM\xc4l$\xce\
-\xb6\xb3H:[D\x0b\xfb\x97\x94\x94\x0c8\xfb\xec\xb3\
-\xf3\x97.]z\x18\x0c\xd6]p\xee\x08yJ=\x0a\
-\x82\x9e\x04\x80\x8d,t\xb4\xe8\xf3\x90\xf8\xc0\xf97\xa3\
-\x0f\xad\xd7\x9b\x89:\xd4\xcc\xa2\xd6s\xfb\xe9Lt\xfd\
-\x1e\x83MYYY\xfc=@M\xf9\x97-[\xb6\xee\
-\x9e{\xee\xd9\x00\xc4\xac B\x1e!\xdb@&\xa2c\
-?\xf5\x01\xbc\x0fx\xf2\xc9'\xa7_u\xd5Ug\x83\
-\xcd\xe3\xde\xb4iS\xd9\x9c9s\xde\x80\x9f\xd8E\xc6\
-\xb1\x00\x81r\xba\x01 \x8b\xc2\xa9\xa5@\xfc\xf1z\xe2\
-\xa3xO\xb6#Q\x1a\x08#Q\xec\xad\xfeFw\x88\
-\xdd\x93\x80A5\x80 @I\x80[UU\xd5\xc9\x05\
-\x0b\x16\xbc\xf9\xde{\xef\xed\x86\x8f\x87I\xbc;\xc9\xe0\
-\x1d\x00\x00\x19u\xff\xfd\xf7_\xd0\xabW\xaf<}\xc7\
-\xea@\xb0\x93\xbe\x87*\xa1\x9e\xf5@\xf5QO\xa6\x83\
-3Hw\x95\xbc\xfd\xf6\xdbW\x0f\x1d:t\xb0\x08\x86\
-$\xb2\xd2\x8d\x96\xbc\x99T\xb0\xfa\xdd\xae\xecO\xd5w\
-1\xb6\x80.$J0\x04\x01\xd6\x11\x5cv\xd9e\xe3\
-\x80\xcb\x83k\xd7\xae\xf5S\xff\x0f\x99;w\xee\xd8\xe5\
-\xcb\x97_\x05.\xf29 9R\x11\xf0\x98X\xc2\xec\
-%\x86\x92\xb1\xc8e\xda\xb4i\x19\xaf\xbe\xfaj\x0dy\
-\x13~R\x03\x1d\xa7\x13\x00\x5cd\xb8\xe4\x83\xce\x1b4\
-r\xe4\xc8AF\xbd\x1e\xaf\xe3\xac\xbaW\xa7;\xd1\xcd\
-\xaeE\xa3\x15\x81\x80\x12\x01\x80`\x03b\x96\x82~\xcf\
-\xdd\xb5k\x97\x1f\xdc\xe2\xef.\x5c\xb8p>\xd6\x15P\
-\xdc\x00]G\xee\xdd\x88:\x06T'\x83\x06\x0d*\x1a\
-3f\x8cs\xc5\x8a\x15\x0dd@vPL\xc1w\xba\
-\xa8\x80\x14\xca\xa6\x9d\x01\x22l\xd2\xce\x9d;\xef\x01\xf1\
-\x97\x85\x00\xe8\x8a\x0a\xf8\xbauxW~\xc3h\xa3\x98\
-}\x17\xbc\x19\x1e\x866n\x18s\xc0p3J\x0b\xe3\
-\xf7\xf1;yy\x9aVX\xbcx\xf1\xbb?\xff\xf9\xcf\
-\xdf\x87CT#\x07)\x7f\xd2q:H\x80\x10\xfd\x9e\
-\x1b\xd0\xee\x041'O\x9f>}\x04\x8a\xb3XR\xe0\
-\xab\xe6R\x14\xc9\xc8Q\xd80\xd0#\xf6\x22\x1c\x8c\xcf\
-*\xa2\x7f\xc9\xde\xc7\xaa\x04\xd3W'\x09\xe9\xd0\xd4\xd4\
-\xc43\x8d\xb1R\xdbx\x0dw\xb1\xdcn6q\xe2\xc4\
-\x92\xca\xca\xca\xea\xed\xdb\xb7\xb7\x92!\xe8!\x00(_\
-\xb7\x04\x10n z\x02#\xa0\x13\xc7\x81\x14\xb8\xb3\xb8\
-\xb8\xb8\xbf>.\xfeUq)v2F\xf1P\xf4\x22\
-w\xe1g\xe1I$\xe4\x0ax^\xd4\xd9H$\xect\
-l\x08\x8aX\x9c\xde\x95g\xc4\xdf\xc3{`NB\xef\
-\xe1\xc4\xdb\xa3\x14@u\x00\xef\xd5\x0ev\xc3\x92m\xdb\
-\xb6m\x86\xd3\x07\xc8\xa3\xa8\xeb\x8aQ\xd8\xd35\x81A\
-\xfaM\x07<\xb4\xf3\xe4\xc9\x93\xfeK.\xb9d\x02\x1c\
-KB\x0a\x9cJ\x0eGBcQ\x06\x16d\xd4\xd6\xd6\
-r\xae\x12I\x1f=\x01\x12mx-J\x04\x94\x0e\x08\
-\x22\xcc\x1b\x08B\x89\x1cAw%\x98\x88k$2r\
-\xf5\xc7\xf8\x0ch\x14\x02 \x9d\xe7\x9e{n\xd1\xf3\xcf\
-?_\x0e\xcf)F9\xf9\xbbb\x0f\x9c\x8a\xaa`;\
-\x0540\xcd:\x16\xac\xdd\x1b\xa6L\x992\x0e;\x0d\
-9\xaa\xa7\xf50\x12\x0a-f\xac\xcdC\x82\xc5\xda\xbc\
-\xfe\x10\xabmjc\x955-\xac\xb6\x19$\x837\xc0\
-\x9a\xdb\xbdL\x86\x8e\xcdHs\xb3\xdc\x8c\x14\x96\x97\x99\
-\xca\x8a\xf23Y~v\x1a\xb3\xdb:\xa7I\x04A\x90\
-\x08\xa8\x97q\xffU\xdb*\xc8H\x85\x85\x85\xfc9V\
-\xae\x5c\xf9\xd1\xf5\xd7_\xbf\x12Nog\x91\x12w\xf5\
-\xeb\x06\x80\x88\x09p\x83p\xc4\x88\x11S6l\xd8p\
-\x0f\x86yQ\xe4%R\x05V;\x03\x09\x8f\xd62\x12\
-^\x1f\x1d\x14\x7f\xaf\xaaoc\x9f\xee<\xca6\xed\xa9\
-d;\xcaA\x1ax\xe1\x1a\xc9F\xaf,u~\xfb\xf0\
-m\x15\xfc\x01V\x98\x9b\xc6J\xfb\xe5\xb2\x7f\x9b4\x98\
-M.-b\x99\xa9\xaeN\xfa^\xf8\xf9f@8\xd5\
-A&,q\xc7\x0d$\xc1\x1f\xbe\xf8\xe2\x8b\x0f\x09\x04\
-\xc7\x99\xf5\x91N\xa74\x19\xe4\x11\xa1\xce\xdd\xbbw\xb7\
-\x81\xbbsp\xdc\xb8q#P\x0f\x0b\x00t'\x1e\x8f\
-b\xfe\xc4\x89\x13\x9d\x08_\xdd\xd8\xce\xde\xfah'[\
-\xbd\xa5\x9c\xd54\x814\xb0\xd9\x99*\x01'K\x0ex\
-S'\xeceQS\xdc\x19\xfa\xd8\xb7\xaa\xa2\x1d\xc0=\
-N6\x07\xa0\x9dd\xebv\x9e\xe0\xe7\x8bA2\x5cy\
-N)\xfb\xee\xd4a,\xd5\xed\x08G(Q\xfaP2\
-\x8b\x03\xc2j\xce\xa0;y\x07\xb4I\xc4v\xe8\xd0!\
-QJ\xa7t\xc5\x10<\x15\x12@\x129{\x0c\x0a\x81\
-\x118\xf1\xd3O?]\x801}\x14_\xc2\xfa5\x0b\
-\x0b'\xe2\x12\xd4\xc7G\x8e\x1c\x89\xca\xcf\xe3\xf9\xed\x87\
-\xaa\xd5gW~&\xed>\x0a.\xb2\xcd\xc9T\x19\x09\
-o\xe3\x04\xd7\x00@\x8d\x13^\xa2c#\xfbKZ\xff\
-)\x9a\x04\xe0}\x8a\x80P\xa2\xf7vYe\xb3F\xf7\
-c\xf7^9\x8d\xf5\xc9M\x8f\x22,r&\xbaxf\
-\x06cOI\x07\xe1F\x82\x04\x0c\xddy\xe7\x9d/.\
-[\xb6\xecS\xe2\xfcm\x94g\xf8\xda\x01\x90I6\xc0\
-0\xe8\x88\xd1\x9b6m\xba\x193\x81\xc2\xea5\xbaX\
-\xb1^\xd4hi\x83A\xc9\xcb\xaf\xf5\x9cPv\xa0J\
-}\xfc\xb5\x8f\xa5\xa3\xf5\xe0\x05\xd9\xc0\xbe\xb098q\
-\x15\xc9N{\x04\x81v\xccd\x9b\xa6\x02d\x02\x81\xf1\
-\xd5U\x12\xffx\x80#\x89ThJ\x90\x88\x1f\xd4\x00\
-\xc0?k\xc7\x12\x16\xb3\x8c\xea\xc3\x16^7\x13\xd4E\
-\xa4\x80\x09\xdfOH\x83\xee\xc6\x0c\x8c{\xec?!\xfa\
-\x9f~\xfa\xe9w\x1ex\xe0\x81\x0fH\xf7\xe3 \x97Z\
-\x96\xfch\xe7\xa4\x00 \x86a\xcb$r\x82\xac\xf3H\
-\x17\x07\xb9\x81Xs?\xfa\xc5\x17_\x9c\x7f\xf9\xe5\x97\
-\x9f\xcb\xc3\x84:\xce7\xb3p\xf5/\xab\xef\x0c\xf4\x81\
-q\x10\x06\x06I\xc4\xb5Mm>\xe5\xa1?\xbf/\x7f\
-~\xa0\x06\xe8\xeb\xe2\xc4W\x91\xd0\x5c\xe4k\xdc\xaf\xca\
-\x0e\x0d\x086\xbbN\xe4\x8b\xbdd\x22\x01\xd4\x08\x08\xd4\
-\x88-\xc0\x01\x10\x0ah\x84\xc7}\x08A\x10\xd0\xc0\x00\
-\xc76\xb8\xee{\xdf\x19\xc1~x\xc9\x94\xb0\xe1\x88\xcf\
-\x88\x9c\x8a\xad\xa7\xf4?JO$>\xfe\xf6\x87\x1f~\
-\xf8\xc5\xfc\xf9\xf3\x97\xc3\xe9]\xe4\x06Vw\x85\xf8\xc9\
-\x00 \x8bZ.\x15+4\xb3\xc8\xb0h\xbf\x0e\x10\xa8\
-\x9cp\x1c]\xe9\x15W\x5c1\x03\xdc\x94[\xb1v\x0f\
-u\xa4\xc8\x09\xc4sw\x8c/\x8dn\xcf\xfe\xfd\xfb\xf9\
-^l\xab6\xecQ~\xbfb\xa3\x1c\x00<J\xf6\x14\
-h\x0e \xb8C\x13\xfb6\xdc;\x81\xf0$\x09\xc2\x22\
-_\x8a\x88\x7f\xf1\xdaz\x09\xa4\xaa\x11+\x90\x1f\x0b\xe2\
-\x13\x00x\x0bi\xeaA\x81\xd7\x0d\xf950(b\x1f\
-b\x85Y.\xf6\xe4\x829\xact`\xef\xf0{!\xc7\
-fffv\xaa\x12NV\x05\xe0\xf7\xb3\xb3\xb39\x08\
-\xca\xcb\xcb\x8fL\x9f>\xfd\xcfmmm_R$\xb0\
-\x8a\x12C\xa7,\x14\x9c\xc6\x22\x05\x9d\x05,2&\xde\
-c\x00\x81\x8f\xa4C.\x18)\xe3\xcb\xca\xca~\xd8\xb7\
-o\xdf>T\xe8\x117\x82f\x16Q\xc3\x988\x12_\
-\x18z\xc1\x90\xa2\xfc\xbf\xe7\xff)o\xd8U\x056\x9d\
-\x1bZ*':\x17\xfb(\x01\xb8\xeewr\xa2\xab\x0c\
-\xc5\xbf\xa6\xe7%\x90\x06\x92\x0c{\xf4\xdd\xe1<?\x96\
-\xcc\xba\x80$\x0f\x97@Hh\xdc\x87\xf8\xb1\x8a\xd9H\
- \xb2\xaa\x84\x22@\x08\xc1\xeb\x06}\x1a\x18\x94\x00\x07\
-\x82\x0cR\xe2\xc7\x97Mb\xdf;\x7f|Ti\x18z\
-\x0a\x89\x88\x1f\xefo\xa8\xf3\x11L \x05[\xce;\xef\
-\xbc?\xee\xdb\xb7o+e\x05\x8ft75l\xb7\x00\
-\x90\x0c2\xe8\x06_p\xc1\x05\xa3\xaf\xbe\xfa\xeaR\xac\
-r\xd9\xb1cG=\xb8wu\xb5\xb5\xb58\xa8\xc3K\
-\xe1HlE\x8f?\xfe\xf8\xf4>\xb0\xe1\x0b j\xcd\
-j\xe5\xcdj\x04\xc4g4\xf2\xe0%\xc3\xc3\xbe\xc0_\
-\x0f\xdd\xf1\xe8\x1b\xb6\x93-~\xa05\x18^\xce\x14N\
-p\x89\x13\x1d\x89\x0f\xea\x05\xc0\x80D\x96\xb9\x9e\x87{\
-J\x1a\xf1e\x00\x82DA(Y_k \xc0H\xf7\
-VH\x02\xa8d\x04r\xa2s\x00\xa8\xc0\xe0A\xfeY\
-!\x10\xf0\xcf!;S\xe0\xde,\xd4\xa1\x81\x01\xee\xa9\
-\x04\xfd\xec\xc97\xb7\xb2\xcd\xfb\xab\xd8\x1f\xee\x9e\xc7U\
-\x02\x02\x18C\xbd\xa26 Y\xaf\x07U\xa7\xa8.\xba\
-\xf7\xde{\x97A\xbf\xec\xa5t0\x1a~\x0d\xdd\xad\x0b\
-H$\x01R\x89\xf8\xa5%%%S?\xfb\xec\xb3\xfb\
-\xb0dZ\x7fAKKKsuuu=\xb8e\xf5\
-\xa0\xab\xeb:::\x02w\xddu\xd7|\xa1\xb7\xb0%\
-\x131Cq\xbfw\xef\xde0\xe7W\xd5\xb7\x06\xef\xfc\
-\xdd[\xf6f/\xf0\xb53\x0d\x88\x9f\xca-}\xee\xd6\
-q\x15\x00{$>\x12\xdbFF\x1fV\x8c\xe3g\xd9\
-\xa6\x81B\x16QH\xba_\x14\x00u\x92_\x93\x03\x04\
-\x80P\xb8n\x11\x81\xa0\xf0\xa8\x1d|\x0ei\x00\x10-\
-\x84\xc5* \x09\xd4@\x07\x98\x09>\x92\x0c~6v\
-P\x0e\xfb\xd3\xc2\xcb\x98\xcb\xa1\xbd?\xaa@\xa3:\xb0\
-\xb2G\xee\x17\xae3\x80\xe8A\xd8}\x01m?\x19}\
-\xcd\xa7:\x1d\x9cC\x00\x18\x02\x5c\xfd\x9d\x91#G\x96\
-t\xca\x01\xbb\x5c\xee\xdc\xdc\xdc\x9c\x81\x03\x07\x16\x81\xaf\
-?\xf4\xcc3\xcf\x1c.\x88)\x88\x9f(Q\x226\x8c\
-\x13\x1c8p\x80\x13\x1f\xffv\xbc\xae%p\xcb#+\
-\x1c\x9e \xfc\x96;\x03\xb8?\x8d\x8b\x7f\xdc\xdb\xdd\xe9\
-\x80\x01\x97\xd6\x1c\xc0%t\xecp8\xf9\xb1\x03D\xa6\
-\x03:\xce\x09\xcda\x07\x0f\x04\x9a\x837\x098Sb\
-\x0e\xe0N\xde\xec\xda\xden\x13{\x89\x1f\xdb\xc1x\xb4\
-\x03\xe79\x1cv\xed\xd8n\x0b\x03Z\x86\xbf\x8b,\xa7\
-\x0d\x8ee~\xce\xce$2.\x11D5\x8d\x1e\xf6\xe1\
-\x96\x03\xec\x92\x99#\xe0\x1eZ? \x98P\x94'\x13\
-FF#XDP\xe1\xb8\x1a\x5cj\x8c\xf6\x89YI\
-\xba=\xd1\x95\x94\xc0\xea\xc7\x02\x8fQ\xe0\xc2O\x04\xae\
-\xfc)\xec3\xcc2Vz\x91&\x8e\x13e\xd5\xccJ\
-\xac\x0f\x1e<(\x06U\xb2\x86\x16O\xe0\xfa_/s\
-x\x83\xf0;n\x14\xfb\xe9\xa0\xee\xddLv\xa4\x00\x18\
-\x00\x08\xa0\xfbe\xe4|\xecx\x14\xf1`\xf5\xcb\x5c\xd4\
-c\x9c\x9e\x9e\x11\xb5>z\x80\x82\xfb\xe9\xb3\xf8['\
-;\x90$@\xd8\xfec\xaa\x16\x16\xa0=\xaa\x00>\x88\
-$\x18\xd08?\x14\xe8t\x1c\xf4y\xc06\xf4\x80I\
-\xe0e\x12\xd8\x07c\x06f\xb1\x97~y\x05\x07\x15\xbe\
-\xa7H.%c\x07\xe0\xf5\x08\x02P\xb7\xb5\xa3G\x8f\
-^\x04Rr\x1b\xa5\x83O\x90\xfa=%\x12@\x14)\
-\x16\xdfw\xdf}3f\xcf\x9e=\xde\xe8\xa2\xc5\x22\xac\
->\xffo\xbc6\xd6y\xf4\xf3\xd1\xd5\xe3#w\x02\xa1\
-\xc0\xcd\x0f-s\xb4\xfa$\xae\xf3\x1d\xa9\x99\xc0\xf1\xa9\
-\xcc\x09@p\xa6\xc2g\xa7\x9bs\xb8\xdd\xa9q\xbb\x93\
-s\xbe=\xcc\xcda\x8e\x06n/\xces\xb1\xc2L\x07\
-\xf3\x06\xd40\x97\x87\xaf3^\x1f%\x01\x80\xbbe)\
-\xbc\xb7\xc1y\x9bl\xa3\x11?\x9a\x14@\xd5\x22\x80.\
-\xd1\x9eK\x03\xec\x07\x8a-\xd55yX\xd9\xfe\xa3\xec\
-\xa2\xe9\xa5\xfc\xef\x08 }B\xc9\x8a4\xc0\xef\xa0\xe4\
-H\xd3\xb6\xd65k\xd6T\xb1\xc8\x80Z\xcf\xa9\x90\x00\
-\x12\xf9\xf38 c\xc2\xa6M\x9b\xee\x18>|x\x89\
-\xbe\x9c\xdb\xaaUoe\x8f\x16?\x0e\xab\xa6s\xea\x0f\
-\x7f\xb7B\xdd}\xb4I\xb6\xbb2\x98#=\x0b\x08\x9d\
-\xca\xb9\xde\x01\xa2_\x06\x13\x04\xb9\x1e\xf76\xd0\xff\x12\
-\x12A\x8ax{\x82\xb3\xd3\x5c2\xbbb|&\x9b7\
-2\x93\x13\xb0\x03\x00p\xa0\x06TL\xad\x9f\xed\xaf\xf6\
-\xb1\xf2z?\x0b*&\x81(\x92\x06\x8a\xaa\x86\xf7\x9c\
-\xfb1\xff\x00\x9e\x81\xd8\xf3\x16\xd4l\x80`\x00~\x0b\
-\xf4~\x08\xa7\xa4\xc1=\xb4@G;|\xf60)\xa0\
-y\x0b\xdf\x9f;\x82\xdds\xe5\x8c\xf0;\xa3nO\xc6\
-\x1e\x10\xe9\xe9\x06\xd8\x80\x16O\x82\x9a\xdcJq\x80j\
-\x16{\xbc\x80\xd2U/\xc0M\x12 \x0b\xf4z\xdfa\
-\xc3\x86\x0d1\x06i\xacZ\xf5\xb1\xe2\xfeb\x8f\xe8\xc6\
-\xf4\xad\x00\xcdsom\x0c\xec>\xd2\xe8t \xc1\xd3\
-\x81\xdb]\xa9`\xeb\xc11p\xbf\x0c\x04\xb7!\xe1A\
-\xcf\xcb\x5c\x05HQD\x97\xc9\xc0\x9bT\x9c\xc2n\x9d\
-\x96\xc32S\x22)\xe8t\xb7\xc4&\x0ct@K\xd3\
-\xee\x0b]SQ\x1f\x00@\xf8\xd8\xc1\x1a\x1f\xdb_\xe3\
-e\x1d~\xa53\xf110\xa8#<\xf7\x00\x05\x00\x90\
-\xa3\x01\x8ch\x07\xd8\x02`\xf1\xcb\xd8\x22\xdeF\x08\x84\
-\xb3\xc2#\xcf*\xfb\xcb\xfb\xbb\xd8\xd9\xe3\x06\xb3\xf1\xc3\
-\x8a\xc21\x0eL\x22Y\xcd\x1d\xa0}\x84 \x00{+\
-\xf7\xb6\xdbn;\xe3\xd9g\x9fE\x17\xb0w\x82\xec\x9f\
-(\x19kf1J\xc9\xe3\x01\x80\x07~n\xb9\xe5\x96\
-\x11HC\xfdH\x1e\xa3\x1aHD\xf0X\xa2\x1f\xff\x86\
-y{\xe1\xee\x1d\xa9jh}\xe5\xfd\xb2\x0c\x07\x18|\
-\xce\x94t\xe6\x02\xa2#\xe7;S\xc1\x00t\xe0\xfc>\
-@x$>\x8aP\xa6\xd3\xedd\xdd;\x81\x10WM\
-\xccdsK3\x22\x16\xbf\xc9\xf0/\xcd@\x95\xd8\xb0\
-B\x1b\x1b\xde'B\x84\xe3M\x01\xb6\xb2\xac\x89m\xaf\
-\xf4p\xc2+\x8a\x09\xd7\xf3\x86 \x90\x08\x04\xf8[`\
-\x98r\x15 \xf1\x16\xa4\xe7\x92Y\x1a\xb8\x8aZ\xbc\x08\
-O\xfc\xfc\x99\x7f\xb0w\x7f{\x13O&\x891\x0e\x22\
-@f\xc55D\x83\x10]\xc2\xeb\xae\xbbn\x12\x00\x00\
-+\x84\x9bHM\xc7\x1ao\xe8\xa3\xa4\x5c5\x95\x8e\x85\
-\xac\x00@b\x91\xb9\xf7rg\xcd\x9a5\x22\x16\xf7\xc7\
-\x1b\x8a\x15\x8b\xe0\xfak\x10\xd5\xe8#\xd3\x8b+\xff\xf1\
-\xfc?Sm \xee\x1d)\xa9\xcc\x05Dw\x00\xe7\xbb\
-\x00\x08\xb2\xcb\xcd\x89\xafq\xbe]\x0b\xe73\xad\xb3e\
-I\x8b>\xa5\xb9m\xec\xdeY\xb9lhAt\xc8\xd9\
-X\xbc\x11\x0b\x10\xb8\x0d\xc8\xb3\xb1v\x90\x02np\xdd\
-\xa2\xb8^eQ\x00\x08\x02\x02\xf4@\x08\xf2R2g\
-$\xd6\xc0\x22\xc0T\xc0\x18Py\x03\xa5\x1d\xf4\xb2\xdf\
-\xbe\xb2\x8e\xfd\xfa\xb6\xb9\xe1\xf7\x17A\xb2D\xf1\x00\x91\
-}\xc4\xeb\xc1\x1b;c\xda\xb4i}\xc0#p'\x90\
-\xf0^\x0a\x18I\x04\x86\x06+\x00pR\xf4/c\xd4\
-\xa8Q\x05\xfd`\x13\x85\x17V\x08lE\x0a\x88s\x98\
-\xcb\x17\x9fW\xac-k\xa9l\x08d\xdbS\x80\xfb9\
-\xd7\xa7\xf1\xbd\x03,`t\xf3P\xfcs\xe3Ip\x17\
-\x11\x1f\x8f\xb3S\xec\xec\xdessY\xff\x1cG'\x82\
-\xc7\x02\x80\x99\xadr\xbc\xd1\xcf\x1a=\x0a\xf8\xeerL\
-\xaeG\xe2cp)\x08\xe7dhRH\xd5<\x0f\x90\
-\xc4\x12w\xf1\x84D\xa2x\x02\xfcE\xc10\x13F\x14\
-\x81\x01\xdf\xdfR\xcen\xba\xa0\x8e\x95\xf4\xef\x1d\xae\x0a\
-2J\x01\xb3q\x88\xfa:\x08|\xa7\xbf\xfd\xedo\xf7\
-&\xd2\xefh/\x0c\x1d:\xf41\x92\x14\xd5\x04\x84(\
-b\x98\x8d\x0evQ\xbc?\xeb\xaa\xab\xae*\x11\xe2\xdf\
-8\xae\xcf\xf8`\xc6\xf3\x89\xae\xc5\xea\x1d1\xe6>\xa4\
-(\xfe?\xbe\xb3%\x9b\xfb\xf8N\x14\xff@|\xd0\xfd\
-.\x90\x04N\xee\xdf;\xb9\x95\xcf-q\xd1d\xcd\x9f\
-\xcfI\xb5\xb3\xfb\xbf\xd3\x8b\x0d\xc8uFY\xd6a\xeb\
-\xdc\xf09V\xc3kvVy9\xf1\xb19\xed\xd1M\
-\xf3\x16t\xf1\x03\xf4\x14d\x89\x9f\xe3q\x05\x11_\xc0\
-8\x84C\xc4#4u\xe5@\x09\xe6\xc6w\x83\xbd3\
-\x85\xfd\xff?\x7f\x10U2\x1eo\x9e\x01\xe39c\x0d\
-D\xbc\x0d\xed\x05\xb0\xe1\xc4|\x0b\xa9\xc4\xdc\x09%@\
-:y\x00YS\xa7N\x1dl$^<\x8eN\xc6\x06\
-\xd0\x89~\xf6\xca?\xb6\xb4z\x159\xcf\x81\x99=\x17\
-\xc6\xf9\xc1\xdds\xa7\x84\x03=62\xf8d2\xf4\xc4\
-\xb1\x13:\xfdG\xe7\xe4\xb1\x82Ls\xb7J\xef\x92\xc6\
-\xfa\xac\xcf\x07\xeeE\x00\xd85\xee\xd6D=p\xb9\xa4\
-j\xdc\x8dMR\xa2\xa2\x87\x1a\xff(\x9db\x09\xd8\xcf\
-<j(\x92L\xa0ymj\x08\x81\x0eW\x87Xy\
-\xb5\x87\xed*\xaff\xa3\x06\x17\x86\x89\x1a\xcb\x1603\
-\x9aiZ\xba\xb8\x9e\x03\x1a\x98\xf8\xae\x97]v\xd9\xe0\
-\xb2\xb2\xb2/\x89\xae.c\xdd\xa0\x99\x04\x10\xaf\x91\x8e\
-\x03\x14\x13\xe5\xaf\x13q\xbf\xd9w\xf0\x85\xc5K\x80\xa1\
-\xe5\xff\xcb?\xbf\xcc\x95\xc0\x90\x026\x01\x17/\x85\xf9\
-$\xe4\x1c7E\xf3\x9c\x9a\x1fN\xd6\xb5L\xc7\xd8n\
-\x9c\x9c\xc3\x06\xe59;\x11_\xcf\xd5\xf1\x88\xaf\x97\x0c\
-G\x1b\x02\xcc\x17\x8c\xc4\x0a\xec$al\xba\xbd\x95\x86\
-\xcf\xc8\xbf\x03\x12\xc0N\xde\x0aF\xcfm.\x00\xb4\x0b\
-\xbd\x18\xb0QR\xb2\xd8\x1f\xdf\xdd\x1c~>\xa1^\xad\
-D\x07\xad\x16\xd3\x08I1e\xca\x94Ad\xcf\xa5\x99\
-I\x009\x86\xef\x88(\xf1\xae_\xbf~\xbb>\xac+\
-*]\x12\x118\x1eHDe\x8f@\xf4\xfb\x9f\xef\xad\
-\xf7\x84l\x12\xe6\xf5%L\xea\x80\xf8d`P\xb5\xf8\
-\x19q>\xd3D\xbe\xa4\xefd\xc6f\x0cNe\x93\x8b\
-SbN\x07\xa3\xd7\xfff\x92\xc1xnOU\x07E\
-\x0d5E)\x93A\xa7I\x1d\x16\x8e(\x86\x1b]\x1b\
-\x06&]\x8b%\x01\xfco<L\xac\x11\x1f\xd5\x80\x8d\
-\x87\x96\xdd\xcc/\xa7\xf0\x1a\x85\xb2C\xf5\x18\xea\x0e\xf7\
-\xa9\xf0\xb0\xcc\x9e\xb1+\xa3\x91\x84\xda...\xee\xa7\
-S\x01\x0e+\x91@\x07\x01C~\xeb\xad\xb7\xc0N\xab\
-\xab\x1a;vl_\x0cA\x19\xd1\x17+\xc2\x97h\xb0\
-\x04N\xae(>\xff\xe7\xf3\xef;\x1a:\x80\xc9\xc0\xe0\
-\x93]`\xf1\x83\x8e\x94y\x82\x07\x5c%0\x9d\xd3\xdc\
-\xd0q\x9c\x90Zg\x03\x16X~\x86\x83\xdd137\
-\x1c^\x8dE\xfcX\x9d\xd9)\xde\x0e\xa2\xfe\xbd\x1dM\
-,\x10\xd4,~\x11\x0aV\xa8FD\x8b\x0bh1~\
-!\xea#\xa1\xe3\xceA\xa4p\xf7`_\xa1\xb1\xc8S\
-\x04*k\xed\x08r\xd7\xd2&i\xaaEV\x03l\xda\
-\xc8\x81:\xd7\xd4f\x99\xc8\x89J\xd0E\x02\x0aTA\
-\xca\xf2\xe5\xcb7\x83\xca\x15u\x03Q\x93W\x9bI\x80\
-\x16\xba\x10\x8b\x0d\xbe|\xe1\x85\x17\xd6M\x980a\xd1\
-\xab\xaf\xbe\xfa\x0f/lzi\x10\x8f\xcbc\x9d\x17\xa3\
-p\xb8\x1d\xd0\xe6i\xda\x7f\xbc\xc9\x8d\x19=L\xef\xf2\
-,\x1f\x10\x1e\xb3{\xd8:\x02!v\xb2\xd9\xcb\xf5\xb1\
-M\x8ed\xf3\xae\x9f\x9c\xc5\x0d53\xa3\xc9\xacf?\
-\x11@\xf7\x9d\xec\xe0A \xe1\xfaq\x82\x1b,\xf0\xce\
-\xbf\x11\xf1\x99\xc3\xcfA\xe7E\xd5\x19\x9e\xb1\xa1\x9b\x07\
-\xfd\xd5\xd0\x16b>E\xe6\x91KL]\xcb \xe9\xd6\
-l\xad\x08KB\xe3d\x17\xc9\xaa\x04\xb3\xfc\x8cx\xf6\
-9s\xe6\xf4e\x91\xf5\x14\x1cVT@-\xe5\x9b1\
-\xf7\xbc\x07\x93\x0f?\xfe\xf1\x8f\xdf\x995k\xd6S\x9b\
-6m\xda\x86\xf3\xe9\x09 \x18o\x96H5\xa0\xf5/\
-\x1ez\xd5\x86\xdd-*\xaf\xe3s\xf0\xdc>\xaa\x01U\
-\xd2\x8a9D4\xce\x1fP\xd9\xd1z\x0fk\xf7iz\
-rL\x91\x8b\x0d\xcbw\xc5\xe5h\xb3Z\xfex[\xd9\
-\xb1v\x9do\x1f\x1d\xfdS\xc3\x05c\xaa\xc1\xd0\x8b\x1f\
-[\x17\xee \xe6 *\xeb\x83\x9c\xf82/N\xd1\xd2\
-\xd6\xa8\x12\x9a=!v\xa0\xb2\xde\xd2\xf0\xb2dT\x82\
-Q\x0d\x8c\x181\xa27\x8b,\x9eaO\x04\x00\x01\x82\
-F\x1ahp\x98\x80\xb0\xeb\xf0\xe1\xc3_\x5ct\xd1E\
-\xaf\xdcz\xeb\xad\xffS\x09\x9b\xd1\xd2O\xa4\xfb\xb1\x89\
-9}\x90SW\x7fq(\x13\xf3\xf7*\x16\x8dHX\
-`\xa1\xed\xf99\x9d(Eb\x1c\xad\xf3\xb0\xea\xe6\x0e\
-6\x7flf'.\x8e%\x0a\xcdT\x96\x91\xab[\xbd\
-!\xb6\xff\xa4\x97[\xfch\xfd\x07\x0d\xd1?E\x11\x99\
-\xc0H\xc1\xb0Q\x05\x98v \x5c[\xd5\xe8e\x15\xb5\
-\x1e\x16\xe4\x95Hv^4\x22\xe9\x1a\xda\x02\x1fl>\
-\x10E0\xab\x1c\x9e(\xbd\xae\x7f\xef\x81\x03\x07\xf6\xa2\
-\xe0\x9e\xdb\x08\x80D\x15A~\x92\x06b\xa2\x22\x8c$\
-\xb5\xbf\xf3\xce;\xcd\xe5\xe5\xe5mk\xd6\xac\xb9\xcfL\
-L\xc6s\x0b\x85\xdf\x0b/\xeb\xdf~\xb8.\x9b\x81\xde\
-\xc7\x02N^\xde\xc5\xa8\x9a\x87Et/\xc6S\xb4\xe0\
-\x0f \xb9\xc0\xc1r]J8\x18\xa2/\xbf\xd6\xa7\xa3\
-\x8d\xd9\xc8XR\xa0\xa6%\xc0\xde)k\x00\x1b@7\
-\xfb\x08\xd3B\xc0\x8a!\x11\x14Q\x0d\xfa\x7f\x9d\xbd \
-\xfc^m\x8b\x0f\xb8\xde\xcb\x7f\x97\xab.\xae\xbe\xe0y\
-\xe1\xfd\xc0\xbf\x80w\x02B\xab\x1a\x086\xef;\xd9)\
-\x95n%*h\xf6w#\xc8E+,,\xcc\x8b%\
-\x01\xac\x0e\x0c\x11\xab_P\xc5$\xcb\x00\xb1\x92e\x96\
-\xc7\x8e\x07\x04\xbd\x9e\xab\xaamn\x00\xce(\xb4q\x8e\
-\xb7q\x00`\x197\xd6\xf4I\x18a\xc3\xebdI\xe3\
-4\x12\xa7\x97\x8f\xcf\x0a\xbb8b\x9c^\xac\x09(\xe2\
-mh\xf4\xfdsg#\xdbp\xa8\x95\x13[\xcf\xc9V\
-2\x81\x11\x89\x10\xa9\x1d\xf0\x06\x14v\x1c\xac\xd9\x93M\
-\xbe0\xa0\xc2\xaa\x80\xdb&\x98\xbfP\xa8\x81\x0aPl\
-\x0ck\x8awU\xd4\xf2\xdf\xb5\x19\xc0\x9c(*he\
-\xd63\xb1eggg\xb1\xe8\x85\xb3\xba42H!\
- \xe0\xb4/\xee\xa1C\x87F\xcd\xf5g%1$*\
-}p\xdby\xf8\x84\x075\x90\xca\xc5\xbeC+\xe5\xc6\
-\x81\x1c<\xe4\x12\xe1~\xd1F\xf4q\xb3\xd2Bw\xa7\
-\xa8\x98\x08\xa2\xd8\xb9\xabe35\xf4\xf4\xc7'\x80@\
-/m\xacc\xb5\xad\x01\xf3\x920\x03\x00\x22Y\xc1\xe8\
-l ~\xf6\x07\x15V\xd7\xeagUM^\xd8\xfbL\
-\xed\x83p\xe0\xca&q\xeeG\x00\xd8T\xadV\x11\x81\
-\xef\x07\xdb\xe0D]+\x1bP\x90\x1d\x97\xb0\xc6\xbf%\
-3sYVVV\x06\x8b\xac\x9e&\xebC\xc2\xc9\x0e\
-\x0d\xb3\xd1\x8f8\xfb\xf5\xeb\x97m6\xe5[\xbc(\xa0\
->\xe0\xb1u\x7f\x95Fp\x15\xbb\x04;G#~\x98\
-\xf0L\x8ar\xc7f\x0dM\xeb\xa4\xd7\xf5\xbaS\xd8\x16\
-\xa2l\xcb81\x05n\xdb\x8f{\xd8\xcb\x1bk\x99/\
-\xa80\xc9\xa4\x14B\x18z\xa2\x0a\xc8(\x05\xd0Nh\
-\xf2\x04\xb8\x88\xc7\x86\xc7\xf1\x8cB\x91\xa2\xd6\x1a\x85\x9d\
-\xf1\x1fp\xbf\x0a\x8d\x1b\xbb\xf0\x1cGN6\xb2\x81\x85\
-91\x19\xc7\xaaJ\x88%\x81\xe1\xbe\x8e\x82\x82\x82\x94\
-\xea\xeaj!\x01\xc4\xd8\x8e\xa4\x01 \x13\x00\x1c\xbdz\
-\xf5\xca\x88%\xfec\xd9\x00\xfa\x07\xde\x7f\xbc!\x15\xcb\
-\xb75\xce\xd7\xb8_\x01_;\x22\xfe#\xdc\x8f7\x9d\
-Q\x92\x1e\xd3\xf27\x82A\xac\x19\xa4\x8f\xf4\xad\xdd\xdb\
-\xc2\x96|\x5c\xc3\x1c8B\x09\xe3\xfdv\x99\xbbk\x0e\
-\x9b\x16c@\xe2\xa2\xe8\xc6X\x00r\xb6\x1f\x8e\xbd\xe0\
-\x1a\xb6t\x04\xb8\xff\x8e\x83K\xdb}A\x96\xc4(\xf3\
-\xa8\x80\x91\x96*\xb6iv\x80\x14\xe4\x83\x8f\xf0}\x11\
-\x00{\x8f\xd4\xb2Y\xe3\x87D\xd90\xdd\x99\xd7\xd0l\
-\x03\xe2\xb7\x91M\x17\xd4\xc7\x01\x92\x05\x80\x18Rcs\
-\xb9\x5c\xceXC\x9bb\x01A\xff\x80\xf5-\x1d\x0em\
-\xec\x1e\x19@\xc8\xf1\x1c\x04,J\xf4c\x1b\xd2\xcb\xc5\
-\xf23\xec1\xad\xfcxUIx\xcf\x95[\xeb\xd8O\
-_/\x8f\x18t\xb4?\xd5[$jHQB,\x1c\
-A\xf1\x0f\xcd\x0f\xc4\x0f\xa92\x0f0\x1d:\xd1h\xea\
-\x0aZ\x1dTj,\xd5\xa3\x82\x13\xdf\x96-[\xb6\xbf\
-\xf4\xd2K\xdb\xde}\xf7\xdd\x0a\xf2\xe6\x1a\x99am\xc3\
-d\x00\xe0 7B\xa6\x80\x8bl\xa5J\xc8\xc8\xa1\xe1\
-h`\xab\xd7\xc1\xdd=\xa6q\x81\xc4\xb9_\xab\x9e\x89\
-\x02\x01\x9c\x1b\xdb\xcf\x1d\xd7\xed1F\xfd\xf4\xf7\xdbr\
-\xa4\x9d\xfd\xfb\x9bG(G\xafj\xf7\x914)s*\
-1\x10\x8e\x5c\xca\xba06\x86\xb4\x81\xe8RH\xa2X\
-\x03x4\xb0\xf7x\xfdq\xe3\x19\xb1\xa4\x00J:\x11\
-T\xa3\xeb\xd4C\x87\x0e\x95\xbf\xf7\xde{e\xcf>\xfb\
-\xec\xae\xa6\xa6\xa6Z]\xf9x-\x15\x916'c\x04\
-\xca\x14CN\xa1}\x0e%\x16\xd2\x1d\x0e\xad\xe0\xdd\xac\
-P4\xd1@\x10\x1e\x05l\xf79y\xd4\x0f\x01\xa0\x10\
-\x00T\x8d@L\xa8\x01R\x05h\x00\xea\xf4\x99\xa5\x89\
-\x9b\xf9\x80\x92\x8e\x10\xbb\xff\xf5\x0a^\xfb\xa7U\xe8\xe0\
-\x7f\xaaV\xa7E\x83AN\x15\x084\xe23C\xb2\x08\
-\xd4\x0e\xbc_0 Q\xbcA\xb37<\xbe`L\xb5\
-\x16o\xaf7\xc0\xff\xf6\xb7\xbf}\xf4\xcc3\xcfl-\
-++\xab\x22b\x8b\xa5q\x1b\xa8\x1e\xc0C\x9f\x83V\
-\x00\xe0\xd2\x11>\x8b\x08\x8f\x0d\xc7\x06\xf6\x06\x0f o\
-\xd4\xa8Q#\x12\xa5\x89\xcdTAx\xdc\x9c\xdd\xc6\x02\
-\x8a\x88\xa7\x22\xd7+\xda(\x1d\x85\xcbN\x83\x07\x90b\
-\xa9\xac\xdcx\xcdoVU\xb2\x9a\xb6\x80\x16\x8b\xe7\x92\
-F\xfd\xca@\x10;S(3/O5k\xde\x04\x02\
-\xc1\x1f#\x1bh\xd5\xe8{\xf9\xe5\x97\xdf[\xb8p\xe1\
-gT$*\x16\xae\xd4/^\xe9\xb1Z\x13\x88\x5c\x9d\
-M\xf5\x00\xa9:\xe2\xf7v:\x9d\xbdn\xbf\xfd\xf6\xd2\
-K/\xbdt\xdc0\xd8\x8c\xbe\xbd\x15O jA\x05\
-\x19\x90\xa8D\x06erU\xc0\x89\x1f\xed\xfe\xb9\xa0\xc3\
-\x0a\xb3\x1c\x09\x89m\xd4\xfd\x9f\x1dne\xabw5\xf1\
-N\xd7\xd2\xf6\xeaW\x06\x82X\xe9c<\x1f\x0c\xa8\xe1\
-\xa8c\x80\x87\x9f\x150Dm\x09%\x80\x99J\xd0\x8d\
-\xce\xc2\xecm9En+Xdu\xf4\x84s\x06\x19\
-\x01\x80\xc4\xc7\xb2\xd5\x01Tq\xda\xfb\xec\xb3\xcf\xee\x7f\
-\xcb-\xb7\x8c\x9b6m\xdaX\x1c\x18\xa2w\xe9\xc4\xd4\
-j\xb1B\x90f6\x80\xd82\xd3\xdc\x81\x96f\x9d\xf3\
--\x0a(\x14I7x[e\xbd3lq3^\xb1\
-\xc4\xff\xa25U\x9c\xf8\x11\x82\xc7\x07\x81\x88=\xf4\x14\
-\xf7\xdb\xf5c\x0at\xcd\x17\x8a\x84\x9bC!\x85\x07\x93\
-\xb2\xd3\xdd1\xf3\x01\xf1\xec\x00\xd1B\xa1\x90\x98\x1d\xa4\
-\x99Z\x9be\xb0\x1a\x8c<>\x10\x14\xf4\xec(\x10+\
-\xf3KJJ\xb0$\xb0\xbf\xfe!\x90\xe8\xfa\xd9\xad\x92\
-)\x0f\xd7\xbfXnFJ\xa0\xb2\xd9\xc3\xa2\xc6\xe1\xeb\
-\x02@\x9a\xa3\x22\xb1\x82L\x87\xa9e\x1f/N\x8e\xdc\
-\xbf\x17\xf3\xfb\x9dD\x7f\x04\x04\xaa\x98\x15D\xd6\xec\x0e\
-\x01\xbe\xee\x82\x80\x0f,\xd1\x11_\x14\x96p\xeeGW\
-\x13\x0c\x12\xe4|??\xd6fv\xd1\x03\xc08\xa9\xa6\
-\x15\x15\xd0\xd6\xd6\xe6\xd7Ei\x93\x1a,j7\x1c\xa3\
-\xd8\xcf\xb8\xe9\xa6\x9bJg\xcd\x9a5M\x88x\xe1W\
-\x1b+W\x92-\x0f\xd7\xbf\x5cIQ\x9eg\xfb\xb1v\
-\x16V\x03b\x8e\x1e\xb0\xfa\x90;\x18\xc5\x01\x5c6)\
-\xe1pr#\x18\xde.k\xe0\xae\x97\xd6\x15*\xf7\x00\
-\x940\xc1\xb5\xdfUT=\x18\x84\xc9\x1b\x01CWp\
-\x80\x12\x07k\x17\xec\xa2\xa2HG|\x04\x83\xc7\x17b\
-\xfe\xa0\x06\x82`P\xebW\xbc\xd1\xe0\xbey\xa6R4\
-Q(X\xb7\xfc\x8d\x98\xa3!\xc4\x92\x9c%\xccn\x96\
-\xc9t\xbb\xdd\xe1\xf3X\xb8i5\xe2\x94\xc8\x03\xd0\x83\
-\xa0t`o/\xfb\xb4\x222\xf9\x82\x98\x88A\x92\xc3\
-\x19@>@\xc1!\xc7\xbc\xa7\x19\x08\xda\xbc!\xb6\xfe\
-@\x8b\xc6\xfd\x04\x02Uba0Ds\xbf\x00\x03\xa9\
-\x1eI\xb3\xca\xbb\xaa\x12\xf4\xc5\xa1Q\xc7\xf0\xce<\xb8\
-\xc4[\x88\xef\x03\x011\xed\x8c\xc2\xc6\x0d+25p\
-\xe3\xadz\xa2\xf7\xbev\xef\xde\xdd\xc8\x22k\x12%\xb5\
-\x96\x80\xbew\xc5,\x1f\xfe\xca\xca\xca6=\xf7'*\
-\xfb\x8aW\x04b\x0c\x12\x89\x17\x9cxF?[\x98\xe8\
-<2\x13\x08\xab\x81\xf0\x03Q\xb2\xc5J\xc0G\xdc\x07\
-\xc3\xbd!^\x85#E\x22p\xe1=Y\xe3\x220\xa3\
-+4\xb5\xc9,\xfcw\xed\x1a\x16.B\xb1L|\x12\
-\xffb\xac!\x12\xdeA\xd3\xc6\x84\x01\x80\xd3\xd5\x06C\
-|0\xa9\x00\x7fI\xbf^\x09K\xd7\xcc\xec\x1f\xa2O\
-h\xfb\xf6\xed\xcd]\x05\x80\xdd\x90\xec\xe1\x0b\x1b\xed\xdf\
-\xbf\xbf%\xd9\x01\x1fV\xce\x8b\x0c\x1en#\x87\x14\xe5\
-EM\xbf\x12nj\xd4\xf4-\x1e\x7f(\xa6\xa5of\
-\x08~y\xac\x8d\x06\x8d\x18\xb9Z\xe5\xd9E\x85\xd2\x8b\
-(h\xb8\x90\xd1\xa9\x04!\x0d\xb4\x98\x04=\x8a\x1a\x9d\
- \x8ae\xf4E\x0d5\xd7\x95\x8bc\xc3\x90\xb2\x9f\x87\
-\x98\x81\xf8\x01\x5c\xd6^H\xbc \x18\xc3v\xd6+;\
-\xbd\xd3\xbb$\x8a\x03\x88\x00P3l~\xbf_\xb8S\
-\xa8\xc2\xf3\xc8\xdf\xf7&+\x01\x82\x84 \xff\xbe}\xfb\
-Zp\x95\x0ba\x94\xf4\xe4x\x00\xf1\x92Y\x19i9\
-9i\x0e\x8f6\xebV02#\x97\x1a\x0d\xe0\x06O\
-\xd0\xd4\x9303B\xf1\xf8P\x8dVB\x16\x19\x1a\x1e\
-\xe1\xfe() EK\x01\xf3}gW\xce(\x11\xf0\
-\x9a\xa81\x034\x07\x81\x18;\x80\x5c\xef\x03\xc2\xfb\x80\
-\xe8>\xbf ~0<\xf3\xd8\xd9\xa3\x8bc\x0eb\x89\
-W\x0d$\xdc\xef\xec\xecl\xac\xfdGw\x1d\x93\x09\xc3\
-i_H@\xb0'\x03\x00U\xa8\x00\x0c\x1e\xd4\xc3f\
-V\xf1\xd3\xd5J`\xd1tK\xb0I\xb3\xc6\x0e8\xa9\
-eEH\x1fr\xb1\x18\x0d\x80\xfa\xb6\xa0\xe5\xda8\xdc\
-\x8e7\xfa\xc2\x01\x96H<\xde\x9c\xc06\x03 :\xef\
-c\x03A\x9cs\x12\xc1\xb5\xc1#R\x18\x08\xc8\xf9h\
-k\xf8\x02\x8a\xd6H\xff\x07\xf9\xfb\x06\xc2\xa0\x9f?\xa3\
-4\x8a\xf0V\xab\x81\xc4\xaa\xa4\xd8V\xacX\xb1`\xd1\
-\xa2E\x97\x01\x18p\x95\xf2\x91L\x1b\xd5],\xc6w\
-\xc4\xa9\xfc\xea\xf4\x87 \x89\x0e_uuu\x9dY\x81\
-\xa1\xd5\xfa\xffX\xdf\xd1\xaf\xc1w\xd3\x05\x93\xd4\xf0\xdc\
-{b\x0a61\x11\x13mU\xcd\x01M<\x9bp\xbb\
-Y\xa7a\xed\xa0~`G\xd8\x1e\x10\xc4\x94\xf5v\x80\
-\x14\x93\xc0\xd1-\x02\x18\xd4\xebB\xe4\xbb\x9d27R\
-\xddv\x9bn\xf4\x90\xd6\xb8\xcf\xaf#>\xdf\xfb\x05\xd0\
-\x83\xda\x88Qx\xef\xf3\xa7\x96v\x92\x00VJ\xbf0\
-\xdd\x8dC\xccifs\xe7\xc5\x17_<\xfb\x93O>\
-\xb9\xf7g?\xfb\x19\x0e<\x1c\xcb\xb4\xf5\x17Q\x22\xf4\
-g\x91u\x9a-\x03\xc0s\xf0\xe0\xc1\x93\x5c\xbfQ\x91\
-\x85\xd5\xf1\x00\x89T\x82H\xd3b\x9b:\xa6\xa4\xbf\xd3\
-\xc1'\xe0!\xae\xf0Gf\xe5\x14Y-\xe8\xb8\xf2:\
-\xbf%\xae\xe0\xd5>A\xc50\x803Z\x1a\x18\x8d=\
-3\xaeN\x04\x06$v\x0a\x10?\xd5ag).\x9b\
-\xd6\x9cv\x0d\x10N-\xd5\xac\x89~\xad\xe1D\xd5\xa8\
-\x02\xb4\xf7\x14\xd3\xcc\x85\xd8\x99\xc3\x0aY~nF\x97\
-\xea\xfe\xc5\xd2t8\xef\x10\xceG\x88\x9fq-\xe6\xbb\
-\xef\xbe\xfb\x8a\x8f>\xfa\xe8\x8e\xf3\xcf?\x7f&\x01a\
-8I\x83\x1c\xb3a\x00F\x00\x88\xa5H\xda6o\xde\
-|B?\xcb\x97\x15)\x90\x88\xfb\x85\x04\x10 p8\
-\xec\xce\x8b\xa6\x0c=\xaaq\x7f@7\xff^0\x0a\x04\
-\xbbNx\xe2\x16{\xea;0#\xc5\x1e&~\xb8\xd0\
-\x13>\x0bi \x8c63u\x10\xab\xe9#z\x82\xf8\
-n\xa7\x8d\x13;\x05\xf7\x0eM\x12\xe01\xb6\x80\xa2\x19\
-}\xc1 \x01\x91\x1b\x96\x0a\xb3I!f\x03\x00\xd8\x80\
-\xf3qL\xc0\x9d\x97L\xb5\xcc\xf9\xf1\xc0\x8f\xf3\x06\xe0\
-,db\xea\x99b\xd8\xfe\xf8\xc7?\xde\x0e\xaa\xe1\x86\
-\xa2\xa2\xa2\x09\x14\xd9\xcd\xa7\xd2\xf0\xb8\x00\xf0S\x0c\xb9\
-}\xf5\xea\xd5'D\xf9\xb7\xde\xf0\xea*\xf7\xeb\xff&\
-\x0aC\xf1\xc5\x17\xdex\xae#\x8a\xf8\x1c\x00\x9a\x85,\
-B\x1a\x9b+\xda\x12\x0e\xee\x10\x9fq\xd0\x88\xa8\xee\x0d\
-\xea$A\x04\x0c\x11\xb5`i\xb8\x97\x18\xea\x05\x8d\x13\
-\xd9e\xe7\xc4O\xa5\x96\xa2#|\x8a\xc3\xa6\xdd\x87\xdf\
-K\xd1\x1a\x0f\xcd\x00\xd8%\x00\x00H9L\x81 \xf1\
-3\x5c\x12\xbb\xf1\x823{\xac\x04\x1c\x9bX\xaa\x8e\x86\
-\x9cK\x93&M\x1a\xff\xdb\xdf\xfe\xf6<\x1d\xf1\x1dV\
-T\x007\x02kkk\x9bN\xc2\xa6\x97\x02\xc9\xd8\x00\
-\xf1\x0cC\xb1\x04\x0anC\x07\xf6\xed7zP^\xa3\
-\x06\x00\x9cf\xcdK6\x01Y\xcb\xb0a5O\xacx\
-\x80\x11\x04\xa5}\xd3\x22\x04G\xce7\x80!:\x11\xa3\
-\xea\xf2\xf6\xd1\x92\xc0nH\xe2p\x8ewh\x04\xe7\x84\
-w\xd9\xc2\xe7\xdc\xfc\xb3\x16\xc1\x0c\xf0{D\xee\x83\xff\
-\xec2\x10\x1f\xba\xd5\xae\xfa\xb9\x04@\x00\xdc2oB\
-\xb7\x87\x80\x99\x19\x8d\xc26\x10\x017\xaf\xd7+\x16\xac\
-\xce2\xb3\x03\xe4\x18\xa5\xe0|\x1a\xb2\x9d;wb\x15\
-\x09\x1fi\x8a\xf3\xd3\xa0\xa8q\xf2\xa1\xda\x8e\xa8&\x0a\
-2\xad\xaa\x04T\x038E\x8ax\xe8'\x7fta\x13\
-7\x8c\x82~m\xf6\xcd \x81@\xd1\xbc\x02\xb4\xec\x85\
-\x1aH4\xd4k\xf2\x90l\x1d\x17\xaa\x91c=\x18t\
-\x042\xaa\x86(\x83\xcf&\x93\xc87p:\xe8{\xfe\
-\xd9A\xfa\xdf\x81\x93?\x09`\xa9\xbc\xfe@$z\xd0\
-+\xe0\xf5\xbf\x00n9\xa4\x01\xc0!\x05\xd9\xbf\x7f\x7f\
-NR\x1c\x9e\x8cJ\xd0\xf7\xfb\xfa\xf5\xeb\x0fS\x82\xa8\
-\x92\x99,.e\xe6'\xfa(\x9b\xd4|\xf8\xf0\xe1Z\
-\xfd$E\x896\x1c\xf5c\xb6.\x8fY\xde\x00G\x07\
-\xa3\xc8\xc2\xe33G\x0d.\x1e5(\xb7e\xe7\xd1\xd6\
-LM\x0a\xd001^\x18\x08@\x80N|{[\x03\
-\x1b; #n\x07p\xc3rH&\xcbp\xdbYs\
-G\x80\x17_\xf0h\xb0J\x22\x9f\x8f1P#\xd1A\
-:\x8f\x15B\xb2\x12\x89\x1b\xe0O\xdae9\xe29H\
-\x9a\x14\x90\xe9\xbc\x9d\xe6(\x10I\x1fo\x80\xc2\xbb\x14\
-\xe3\xc7=b\x8aO\x1e\xad\xe0\x14r\xd0/\xc0\xfd\xaa\
-\xe2c\x1d^\x1f[p\xd1$\x96\x93\x99\xd6\xa9o\xba\
-S\x02n\x9cI\x84\xaa\x85B+W\xae\xc4\xb9\x84Z\
-\xa9\xb5Y\x05\x00F\x92\x9a\x1f~\xf8\xe1M@x;\
-V\x00\x9b\x11\x1c\x8c\x0e\x17p\xbf<e\xca\x94\x89\xc2\
-7\x15C\xbf\xac\xcc\x1b\x84 \xc0\xa5\x811&\xf0\xda\
-\xaf\xae\xf3\x8c\xfe\xfe\x7fg\xb2\xa0\x83\xc6\x07:\x08\x00\
-Zr\xf8\xb5M5l\xe1w\x07p=\x1c/l\x8a\
-\x83G/?3\x9f=\xb7\xae\x92\x82@j' \xe0\
-\xcc\x1e\xe1\xe0\x90\x14\x0d\x02AXY\xf8\xf4v\x91\xe0\
-\x89\x04}\x84t@O\xdf\xc7\x89N\xdcO\x12\x06\xef\
-\xc3\xe3\x00\x18A\x0cx\xb9Z\x0b\xf8=\xac\xbd\xdd\xc3\
-\xf2Re\xf6\xf0]\x17\xc6\x1c\xc7\xd0\xdd\x12p1\xfa\
-\x0a7\xf0\xe4\x0e555\x89\xc2\x10\x11*N\x08\x80\
-\x00!\x05E\x86\xfd\xc1\x07\x1f\xac1\x5c'\x1bTG\
-\xf6\xbcy\xf36?\xfd\xf4\xd3w\xe8\x07\x8cZ\x09#\
-\xe30q\x94\x02\xa8>\x8a\xfb\xe5\x17\xde8gt\xe5\
-\xcb\xef\xef\xed\xa7\x0d\x0e\xa5A\xa2\xda\xb0\x0a\xd6\xd4\xde\
-\xc1\x96\x7f^\xc3\xbe7\xa3O\xc2\xe2\xd0;g\xf7g\
-\xcf\x7fx\x5c+\x00\x0d\xb1N@\xe0\x9c\xaej\xd3\xb8\
-\x08\x10 A\xb5\xc9 \x22\x11?>\x0b\x19\x13\x9e\x82\
->\xd0c\xe3\xba\x1d]T\xce\xf9\x8aVM\x1c\xa4\xd1\
-\xc5b\xdax\xc5\xdf\x01\x02\xa0\x83\xb5\xb5\xb7\xb1\x8e6\
-\xe8\xd2@\x07{\xf6?\xafai)\xae\x98s.u\
-\xa5\x04\xdcx\x0d\xaaW<\xfe\xf8\xe3\x8f\xf7\xe8J\xc2\
-\xbcV\xe2\x00bC\x9d\x81\xb5e8?\x00\xceJ\xf9\
-\xa5\xae\xe1\xe7-\xd4\xf0\xb8\xec\xbd\xf7\xde+?~\xfc\
-x\xa51Be\xc5k\xc0\x15\xb9\x04\x01\x9f\xfa\xf1\x15\
-\xbd\x0a\xb2\x1c\x01n\x03@\xc7a\x87\x85c\x04\xe0\x1d\
-,z\xbf\x82\xbbW\x89*\x83\x87\x14\xa4\xb2\xeb\xa7\xf7\
-\x89\xe4 \xa8\xa6\x9f\x97}S\xe9\xb70\x02\x151\xb3\
-)\x17\xfdr8t,\x92\xc4\xdaX\x7f)<\x0a\x18\
-\xeb\xfb\xbd`\xdac\xd6\xb1\xc3\xa7\xb0\x8e\x80V>\x8e\
-I\x1e\xce\xf9\xc2\x80\x84g\xf6\xb6\xb7\xb0\xba\x86f\xd6\
-\x81\xb3\x9f\xc2;\xcd\x998\x88]z\xceX\x16k\xca\
-\x9d\xae\xb8\x80\xc6\xbd\x18,\x03\xbf\xa9,]\xbat\x1f\
-\x01\xa0\x85\xc5X\x5c2\xd6L\xa1\xaa\xae\xa4H\x14\x16\
-\xd6\x9b4\x0f\xfdFzAAA\xfa\xc4\x89\x13KQ\
-\x0a\x08+?\xdep-\xbd\xbeB\xffU\x1b\xddc\xb3\
-_8mx\xdd\x92\xb77\xa6\xab\x02\x9b|l\x95\x9d\
-\x0b\x02\x1cM\x8b\xbe\xf7\xd4\x92\x5c\x9a#0v\x9b4\
-(\x93\xbd\xf8\xf1q\x0e\x18\xf3\xdc\xbd\x1c.\xde\x10\x05\
-\x9b6\x9b\xae\x90\xc3\xae\xab\xe6\xa1\xf3\x5cm\xf9C<\
-\xaf\xcf\xf7\xfeP\xf83\xdeGL+\xe7\x01\xd5V\xd7\
-\xd0\xc8Z[\xc1{\x09\xb4s \xf7\xcdr\xb0u\x8b\
-\x7f\xc8\x9c\x0e{\xdc\xb4zw\x96\xd2\x13R\x15U\xc0\
-\xbe}\xfb\xf6/^\xbc\xf8c8u\x94\xaa\x81[\x92\
-\x01\x80\xde-\xf4\x91\xf80k~R\x0fi\xe01\xd8\
-o\xb8\xe1\x86I\xb8:\x98\xb0\xf4\xcd\x08nV\xfa\x84\
-v\x03\xda\x02\x08\x9e\xdc\xec\xf4\xf4\x9cT\xfb\xf1\xd5\x9f\
-\xef\xcd\x0c\xaf\xef#\xb3p\x9d\xc0\x97G\xdb\xd8e\x93\
-z\xb3t\x9c8B\xb7\x16\xa1\x91K2R\x1c\xac(\
-\xd7\xcdVm\xab\xe5`\x11\xc6\x9b\xc3\x16\x990:b\
-\xf5\x93a'\xcb\xe1\xfc\xbd\xbe\xac\x0b\xf7h\xd8y\x80\
-\xe3\x05\xd1q>\x81v\x7f\x90\x13\x1f-\x7f\x14\xfd\x18\
-\xeamj\xed`\xad-\xcd\xa0\xf6A\xe4\x07=\x9c\xf8\
-\xe8\x01\xac]t\x07\x1bP\x90\x13\x93\x11\xe21\x89\xd5\
-\x89!\xb0\xdfq\xf2\x0d\xdc\xbf\xf8\xe2\x8b\x1fl\xde\xbc\
-y;\xd5\x08\xd6\xc5R\x01\xdd]82Dc\xceR\
-A\xef\xa4\x16\x15\x15\xb9G\x8f\x1e=T\xcc\x89k\xa5\
-\x90D\xa8\x03\x94\x04\x22\xa4y\xe6\xc8\xe2\xcc\xaa\xea\xfa\
-\xfam\xfb\x8f\xa7F\x96z\xe1\xe3Q\xb8\xa8-\xaf\xf1\
-\xb0\xf3G\xf7\xe6\x80q\xe8V!3v\xcc\x98\x01\x99\
-\xe0Bz\xd9\xbe\xaa\xf6p\x82&\x9c\xb9\xd3\xcd\x12\xae\
-q\xbd\x1cv\x01\xc5\xb5x\x0e\xc5:\x8ax\xc1\xf5\x1a\
-\xe7G>#\xc7\xa3-\xd0\xee\xf5\x03\xe7{\x81\xf0(\
-\xee5\xaeG\x00H \xfa_\xf8\xc5\xa5\xec\xbc\xc9\xc3\
-\x92\x18S\x10\xed\xe3\x8bU\xc8E\x0a8\xd6L\x22\xa8\
-\xfb\xf1:h\xedw\xddu\xd7;\xd0\xa7\x87H\x024\
-\xc6\xaa\x13\xe8\x89\x95C)\xab\xce\x5c\x9b6mR\xae\
-\xbd\xf6\xda1 \xd2SD\xfd\xa0U\xb4\x8b\xf00\xaa\
-\x03\xdc\x7fw\xc6(\xf7g;\x0e\xb6\x1e\xae\xacw\x85\
-\xd7\xf9\xa1\x81\x02\x87k:X\xefL\x17\x1bV\x98\xca\
-\x8d1\xe4p\x87n\x02f\xfd$Qs\xc6\xf4fe\
-\x15-|PhT\xcaV\x07\x02}C\xbf\x1f\x89\xcf\
-\x09\x1f\xd08\x1e\x89\xed!\x91\xdfNR@\xcb\xf1k\
-q~\x9c+XA;\xc5\x8fv\x0b\x12\xdfC\xfb\x0e\
-\xf6\xf8]s\xd9\x0f\xe6O\xb5Dp3\xe9\x88\x0d'\
-\xd2F[\x09\xc5;\xae\x86\x8a\x93j\xe31JNT\
-\xb7B\xda\x22\xf7c\x9f\xaf]\xbbv\xd3;\xef\xbc\x83\
-e\xe2\xe8\x02\xc6]O\xa8'\x00\x10\xa0\x11C.x\
-\x18\x17\x88r\xfb\x99g\x9e9\x22\x91\x140;\x87\x08\
-\xc6\xc0\x12\x81@\xba\xe6;\x13\xed[w\x1f\xf6\x1e<\
-V\xeb\xe0C\x84\x84\xb1\x04\xbf\xbd\xf1@#\x9b2$\
-\x8b\xe5\xa6i\x83KT\xe1\xeb\xeb\xd4\x82L\xf5y\x17\
-\x8e/`;\x8e\xb6\xb2\x93\xcd\xfe0\x08\xa2\xd3\xb8\x22\
-\x8f/\xaaw\xd4p\x16\x0fA\x80S\xd5\xe0\xe0\x8dv\
-\xe2z4(\xf9\xd0p\x9e\xb9\xa4,\xa6 <\x89}\
-l\xbf\xbai\x16\xfb\xd9\xf5\xe7F\xe6\x0e\x88\xa1\x16\xe3\
-\x81\x01\x09\x8f\x8d\xe2,\x1d8\x22\x0b\xfe&\xe3o!\
-\xf1\xc5|\x8b8\xe16\x9d\x0b\xdew\xdf}o\xd6\xd5\
-\xd5\xed!\x00\xd4\xb3\xd8\x93I\xf7\x08\x00\xb0\xd7\xb0\xa4\
-\x05g\xa1\xc8\x80\x07I\xbd\xfa\xea\xab\xa3\x0aJ\x13\xa1\
-\x5c\xbf\xe1\xcb\x88\xa8#\xbe\xec\xd5\xdf\x99`\xaf\xa8\xac\
-n\xdb~\xe0\x84K3\xcc\xb5\xe2\x97 \xf8\xec\x9f\xec\
-kd\xe7\x8d\xcac.;\x8d\x94Q5\xc2\xc8d\xd4\
-\x85\x93%\x0e\x1b\x9b?\xa9\x0f\xabn\xf6\xb2C\xd5\x9e\
-0\xb1#\x8bFhC\xb5\x84\xa8GB\xb7\xe0\x80P\
-hm\xde \xe7x?\xb9xZ\x05\xb3\xae\xa8\x03\x03\
-W\x9c\xe3=\xe4\xb9x\x98\xac\xf8\xd8\x92\x9f^\xc4~\
-t\xe5\xcc(\xe2[!x\x94~\xa5\xd5Q\xf1\xbbo\
-\xbd\xf5\xd6\xeaK/\xbdt\xd9\x92%K>\xd9\xb8q\
-\xe3v\xf0\xf1\x0fWWW\x9f\x04\x89\xd0\x0c\x7f\x0f@\
-\x7f\x81wj\xb3\xafZ\xb5\xeaC\xb0\xfe\xbf \xe2W\
-\x92\x0b\x18[\xfatw\x08\x1cU\x9e\xe0Td\x83s\
-ss\xc7\xbe\xfd\xf6\xdb\xb7\x16\x16\x16\xf6\x15\xe1\xdeD\
-\xee\x8d\xd9\xdf\x90sq}\x5c\xb1\xec\x1av\xfb\xc3/\
-\xfe\xa3\xf5W\x7fZ\x97\xc9'\x93\xb2\xa70\xe6\xd0\xe6\
-\x15\x1c\xd27\x97=\x7f\xfb8\x96\x97\xe9f.\xa7\x03\
-\x88\xed\xe0{\x9c\xd3\x1f-n\xa7C;\x16\xbf\xff\xc2\
-\x87G\xd9\xfdKws\xc2\xa2\xc4\x08/\x06\x11\xaf\x00\
-T%sG\xd4/\x8a\x22V\x11\xb6\x16n+\xb44\
-\x87\xca\xde}\xf8z6mlI\xcc\x9aH\xab\x86\x1d\
-\xae\x90\x8a\x22\x1f@P}\xee\xb9\xe7.\x06\xeb\xbe\x8c\
-EVgKa\x91i_\xf08%''\xc7\x0dj\
-\x00\xc5\x05N\xe9s\x80\x00\xd0\x1aw\x0cC7\x01\x90\
-M\x03H\x8a\x81h#\xfe\xf2\x97\xbf\x5c5d\xc8\x10\
-\xbe\xae\x00F\xf9\xcc\xa2\x81\x89D\x9f>H$\xe6\xc8\
-Gup\xf6\xf8\xa1\xae\x0b\xa6\x96\xb4\xbc\xb5n\x9b\xab\
-\xc3\xeb\x0f\x13\xa3\xb1\xdd\xc7>;\xd0\xc0\xa6\x0f\xcf\xe5\
-\xe2\x9d\x0f\xb8\x0ci\x92'\xa4\x88\xc4L\x88\xa6}Q\
-\xd9\x84A\xd9\xec\xa6\xb3\x07\x804\xf0\xb1\x1d\xc7\x9a\xf9\
-\xf8<UO\xe9\xb0\x94\xd1/\x17\x17\xd4\xf6\xa2`\x05\
-\x13V\xdc\xc8\x03\xb1\xef\xf7\x84c\x16\xf3\xc6\x15\xb0\xf7\
-\xffp;\x1b:\xb0\xd04\x0f\x12\xeb]\xcd\xfa\x05%\
-!.K\x8b\xdf\xfd\xaf\xff\xfa\xaf\xbf\x82\x97\xb5\x9d\xb8\
-\xfa0\x89u1\xfe\x0f\xf7\x18\xac\xab\x06\x86\xab\x22\xa2\
-\x1f\xa7\xf3M\x09\x07\xb1t\x83\xf8i$\xf6q:\xd9\
-\xd2G\x1f}t\xce9\xe7\x9c3M\xe8r\xe3\x84G\
-Vl\x00\xe3y\xd4k\x22\xcd\x89R\xa1_~\xae\xeb\
-\x87\x97M\xf3\xed:pT\xdaw\xa4J\xe6\x5c\x09\xf7\
-\xa9k\xf1\xb2\xf5{\xeb\xd8\xc4\xe2,\x9e\x9c\x09\xf2Q\
-K\x94\x06\xe6eXA\x1e\xa3\x0f\xf2 P\x88\xc1%\
-l\xde\xd8^\xec\xd2I\x05|\x11\xa8C\xd5\xad\xe0\xc2\
-Q9\x9aB\xe5\xf5\x8aX.6\x18\xd9s\x8eGq\
-\xef\x0d\xeb|\xa7\xe2ec\x8b\x1c\xec\x89\xdbf\xb2\x7f\
-\xbf\xfdb\x96\xe2v1cE\xb5U\xf5\xa7\xb7\xfaQ\
-\xf4\xe3w\xc1\xb0\xfe\xfc\x91G\x1e\xf9\x08\xfet\x88\x00\
- F\xfb\xb6\xd2\xbe\x91\xe24\x02\x0c\xd5\x04\x90F+\
-c\x04\xba\xaa\x02RH\xf4\xe3Z\x82\xc3o\xbe\xf9\xe6\
-\x19\xbf\xf8\xc5/\xaeC\xfb\x04\x89/\xf2\xfd]\x0dp\
-\x18\xcfa\x8c\xa0\xa0\xa0 j\x0a\x98\x8f\xb6\xec\xf3\xdc\
-\xfc\x9be\xa9Gk=\xb4l\xac\x8be\xa5\xa7\xb0\x9f\
-_R\xca&\x0f\xeb\x0d\x84H\x01c\xd2\xc9c\x05v\
-Z\xe6\x85g-\xc3\xb6A$\x8c\x8a\x96\xfc'\xfb\xea\
-\xd9\xc7{\xeaY\xd9\x91\x16\xb6\xffD\xab6\xcfOx\
-\xcd`2\xf4B~\xe6\x94B\xac0Cb\xc5\xd92\
-\x1b\x98#\xb1\xe9#\x8a\xd8w\xbfs6\xcb\xc9\xced\
-\xc6\x11T]YY\x057\xd0\xed<\x98\x03\xd6\x7f\xd5\
-\xbcy\xf3\x9e\xa3E\x22\xf7\x11g7\xc7\xa1\xa5\x98\xbc\
-XMF\x87wE\xefc\x9cu\x0c\x16\x1aL\x9d:\
-u\xd2s\xcf=w;\x88j\xf4\x02\xc2s\x00w\x85\
-\xd0\xf1\xf6\xa8\x0e\xf2\xf3\xf3yjZ\x97VV^^\
-\xf5y\xf0\xc1?\xbf\xef\xac\xaco\xe7\x19D\x19\xda\xe5\
-g\x0ddWM\x1b\x08\xd7\xba\xb8\x0aq\xf14\xb6\x9d\
-\xcf\xe0\xadM\xd8d^\xe4\xa2\x8du\x04\x8b\xbf\xc3\xcf\
-j\x9a;XMS;kl\xc1D\x8e\x8f9\xe5\x10\
-4\x85\xb9dm\x9e\xe3\xec\xcct6}\xca\x046x\
-`\xffN\x13a\xe9gCI6\x92\x87\x93h\xa3\xde\
-\x07\xeb\xde\x0b\x8c\xb5d\xeb\xd6\xadh\xd0\xe1\xa4\x9db\
-}\xe0\x1e\x1d\xcb\xdc\x15\x00\x88\xb5\x04G\xf4\xef\xdf\xff\
-\xcc\xe5\xcb\x97\xdf\x06\xc6G/\xec<!\xb2\xbbBh\
-\xab\x12\x03k\xe0\xc0\xd8\x8c\x92\x06 \xf2\xd57\xd6n\
-\xf3/~c\xa3k\xd3\x9e\x13<\x894b@.\xbb\
-af1\xeb\x9f\x9f\xc1\x0dA\x04\x90\x0d\x97~\xc3x\
-\xbfM\xea\x94x\x09\x91\xaaPB\xda\xa8\x1d<F.\
-\xf4\x83j\xf0\x01\x00\xfc>8\x06\x80\xf7\xc9\xef\xc5\xce\
-\x9a<\x8e\xf5-,0-x5[U\xcdj\x7f`\
-\x1fVUU\xf1\xe3E\x8b\x16-\x7f\xfa\xe9\xa7?!\
-cn'\x8b\xbf6P\x977{\x17\xbe\xe3 \xfd\x9f\
-\xfb\xd3\x9f\xfetZvvv/|i$~2\x99\
-\xc0\xae\xae9\x84>1\x1aH\xb8\x96\xaeXx\x09\x1d\
-\xe3+\xffm\x82\x0b\x1a;\xd9\xd0\x12\xf8\x9f\x95\x1b\xed\
-\xef}\xbaWz\x10\xbc\xa1Y#\x0b\xd8\xf9\xe3\xfb2\
-\xb7K\x0b\x1d\xcb|\xe5/\xd1\xf1\xb2\xb6\x90\x83*8\
-W\xa1d\x0a\x06w\x02`/h\x80\xe8\xd5+\x9bM\
-\x1cS\xca\x86\x0f\x19\x04@rt\x1a\xe7 FI\xc7\
-\xd3\xebV\xa6\xda\xd7\x1f\x17\x15\x15e\xb1\xc8`O%\
-\xd9\x11?\xa7R\x02\xa4\x93\x04\x187g\xce\x9cYO\
-=\xf5\xd4m\x18\x98@\xb1(\xf2\xd0\xdd]E\xcc\xea\
-\xb5\xa8\xd3\xb1\x06\x8ej\x0a:\xb9\x5c\x1ep\xec7n\
-?\xcc\xbe\xd8}Dv\xa8>\x96a\xf7\x83h\xf5G\
-\x0c\xd4\xf0\xe8t\xadz\xc7\xe5r\xb0\x8c\xb4T\xf8\xbd\
-T\x96\x9f\x97\xcb\x06\x0d(\x02\xe2\xe7F\xcd\xe1\xa7\x97\
-\x1a\xa2\xf0\xa2+\xef\x16\xeb]\x85\xf5\x0f}\xe9\xbb\xfc\
-\xf2\xcb\xff\xfb\xc0\x81\x03\x9f\x91\xfe?\xc6z`\xa5\xd0\
-\x9e\x00\x80\x9d\x06\x1c`\xb9\xf1\xa8\xc7\x1e{\xec\xc2\xf9\
-\xf3\xe7\x9f'\xa2V\xfa\xba\xff\x9e\xd0\xfdV\xbe#\x96\
-kG \x98\xad\xc1c\x16vF1\x8fn\xa2D@\
-\x12\xab\x80\xc6\xfa\x8e\xd1V\xe8\xaa\x91g\xe5\x1d\x85\x11\
-\xb8y\xf3\xe6\xad7\xdex\xe3\xab\x94\x86\xdfO)\xfa\
-`O\x02\xa0+n\xa0\xa2\xcf\x01\xac[\xb7\xaec\xee\
-\xdc\xb9\x03\xc1\x0e\xc8\xc5\xceGC0\x19\xff?\x19\xdf\
-8\x9e\xfb\x84\x1d\x86\xb1\x03\xe4 1\x7f\x81q\xe9Z\
-\xbd\x8aB\xaf\x80/\x0bk\xb7u\x1a\x99c\x9c\xd9\x0c\
-\xdfI\x03M \xfc\xdb\xc9\xb8\xb3V\xb3|a\x1d\x0b\
-\xfd\x88\xef\xd2\xa7O\x9f\xc2C\x87\x0e\x1d9x\xf0`\
-=\xe5\xf3\xbd\xb1\xf2\xfa_%\x00D\xe1(\x0f\xda!\
-\xc7\x83\xaf\xdat\xe1\x85\x17\x8e\xc0\xb9\xe9\xb1\xd3\xf5\x13\
-H\xc4\x8c\x1f\xd3\xb2\xf2h\x9c\x99\x19O\xc9\xc6\x0c\x8c\
-%Q\xe8\x8eb'\x0a\xb7T\xe8i\xb3\x82Uq^\
-L~\x81M3\x00\xfd<\xd6n\xa6\xe3\xad\xfa\xf4\xc9\
-\x82YT\xf6\xd2sH\xa3F\x8d\xea\xf5\xea\xab\xaf\x1e\
-\x82\xe7ke\x91A\x9f\xc1\xaf\x1b\x00\xa2v\x10{\xd2\
-\xd1\xd8\xd8\xa8\x1c>|\xb8\x11l\x82q Nm\xa2\
-2%Vg\xa0\xc8E\xf7L\x94\x90\x89}Ot\xb2\
-\x11\x0cb \x8a\x00\x85hh\xb3\x88c$\xb2\xc8\xac\
-\x09\x00$\x0a\xe2$K\xe8d\xc1\x8c\x8c\x81\x865\x18\
-\xba\xd9\xf0\xb7\xc6\xcf?\xff\xbc\x86\x88\xdfN\xedk\x07\
-\x80\xca\x22\xe3\xd1m\xe5\xe5\xe5\x0at`\xdb\x94)S\
-F\x01\x81%}\x8aW\xcf\xf5\x98\xe9C\xce\xc7\xf3@\
-\x14/O\xf0j\x1b\xff\xbbYUqW;\xb9;\x00\
-\xea\xca\xef'\xa3\xca\x12=\x8b`\x0a\x04\xe6\x19g\x9c\
-Q\xb4b\xc5\x0a\x5c\xb7A\xcc\x01\xd4\xdeS^AO\
-\x14\x84\x84\x84\x7f\xbau\xebV\x7f^^^\x08\xc4\xd6\
-01N@L\xed\xce\x032\xc4\xf5\x98\xb2\x5c\xbbv\
-\xed\xfa\x1f\xfc\xe0\x07\x7f}\xe2\x89'\xd6\xa5\xa6\xa66\
-\xc3wJ\xe0;\xb2l\xb0\xb8\xbb\xd3\xc9\xc9^k5\
-a\xd3U\xf5\x94\xcc\xef\x0a)\x80\x865\xec\xdd\xd0G\
-\xad\x1f\x7f\xfcq9\x85}[uj\xf8k\x05\x80\xb0\
-\x07\x844P\xe1!\xdb\x06\x0f\x1e\xec\x18:t\xe8 \
-\x14\xf5b0\x890\xc8v\xed\xda\xb5\xe3'?\xf9\xc9\
-\xb2\x97^zi#\x88a\xccYWn\xdc\xb8\xb1\x11\
-\x0c\x9d\xcai\xd3\xa6\x0d\x023\x22U? \xb5\xbb\x9d\
-\xfcus\xb4Q\x95X\xfd}\xdc\xd0\x1d$u\xa4B\
-\x7f}\x84)`\xa6M\x05\xd7\xd8SA![\x0f\xa9\
-\x12/\x8b\xcc/\xa0\xac^\xbd\xbai\xc8\x90!\xf6\x92\
-\x92\x92A\xc2\xbd\x01\xd7\xa6\xea\xa1\x87\x1e\xfa\xebo~\
-\xf3\x9b\xb55558\xa1a\x85.\xbc\xe9\x07\x1b\xa2\
-u\xd5\xaaU\xe5\xf0\x1dW\xff\xfe\xfd\xfbb^\xc1\xb8\
-.Q\xb26\xc0\xa9\xe6\xe8x\xbf\x8f\x84\x17\x15<h\
-o\xf0\xe2\x14Z\xdb \x11\xe1\xf1}1\x15\x8c\xdf\x03\
-\x00\x04\x7f\xf7\xbb\xdf\xbd\xf6\xe6\x9bo\xe2j\xe1't\
-9~\xe5t\x02\x80\x11\x04!\x04\x01\x10R\xca\xca\xca\
-r\x83\xfeZ\xbb`\xc1\x82\x95{\xf7\xee\xddN\xe9\xcc\
-\x0a\x0al\x88U\xac\xd0\xb5\x09B\x87\xb5\xbc\xfb\xee\xbb\
-\xc7\x01\xe9G\xc6\x8e\x1d\xdb\x07\xfc\xfa\xccX*\xe1\xeb\
-\xd6\xd1\xf1\x9e\x01\x09\x87\x06\x9c\xde\x10F#\x14A\xa1\
-\x8fS\x98\xdd\x13\xafA\xe2\xa3\xee\x87\xef\x07\x1e\x7f\xfc\
-\xf1\xbf\xbe\xf2\xca+\x9fQ\x1c\xa0\x82T\x80\xe7\xeb\x0c\
-\x04\xc5\xdb\x90es)P\x84\x0b\x16\x0e\xa4\xcca\x93\
-.G-j\xd4Zu\x86\x8c\x8bj\x0b\xf2(\xd1\xd4\
-\x07\xb8\xa5\xa4\xac\xac\xecW\x22\xd4*\xea\x0b\x93\x0d\xb6\
-t%0\xd3\x95\xe0\x8dX\xb3@\x10\x1a\xb7\x93'O\
-\x1e\xff\xd3\x9f\xfe\xf4\xc1\xc4\x89\x13\xfb\xcf\x9d;\xf7\x5c\
-\xack@u\x88\xf9\x0c\x9bavP\xf1\x9eH|\xdc\
-\x83\xc1\xd7\xf1\xeb_\xffz)0\xc4VJ\x06\x1d\xa2\
-\x94o\x8fF\x03\xed=\x0c\x00\x85\x10j#\x1d\xd5D\
-\xb9\x83\x0e\xd2]\x22\x87\x1d0q)k\xe8:\xbc\xc6\
-\x01\xe8\x1fPWWW\x03Fe\xbe^\x8fvu\xe9\
-z+\xd7veY\x5c\xe1b\xea\x03DMMM\x0d\
-\xcb\x96-[\xf3\xec\xb3\xcf~\x09\xcf~\x12\x8e\xb3\xf6\
-\xec\xd9S\x0dR\xf02\x04;\xeav\x0ca\xeb\xc7[\
-\xe2o\x88\x92n0\xfc\x9a\x16.\x5c\xf8\xea\xfa\xf5\xeb\
-\xbf$\x89YN\xd2\xb2\xc7C\xc1=\x0d\x00\x01\x82j\
-\x12\xed\x0d$\x15\xfc\xbaHV<\xb7\x123J\x98\x04\
-\x91@\x028\xb3\xb3\xb3\xf3\xf4)V+\x04\x89\x97x\
-\xea\xe9$\x15\xe9\xe8\xb0\xde>z\xf4h9\xd81\x9b\
-\x81\xebw\x02A\x8f\x93\xceFp\xbb^x\xe1\x05\xcf\
-\xbe}\xfb\x1a\x1ey\xe4\x91krrr\xf20\xed\x8b\
-\xc9,t\x8b\xd1N\xc0\x08&n\xc7\x8e\x1d\xab\xb8\xeb\
-\xae\xbb^\xaf\xa8\xa8\x10E\x9d\x87u\x96?\xfb&\x00\
-@lm,\x899ku\xcf\x83\xea\xc0=~\xfc\xf8\
-\x1c\xd0\xff6QYc\x85\xa3\x93\xcd\xbeuWb\x08\
-\xae\x07\xc2W\x00aWm\xd8\xb0\xe1\x08I\xb2:\xe2\
-\xd8\x93\x04~|'/\xfc\xdds\xf5\xd5W7?\xf3\
-\xcc3W\x82\x91<\x14\xcb\xbb\xb1\x89\x0d\xab\x7f\xee\xb9\
-\xe7\x9eU \xfe\xf7\x11x\x8e\xe8\xec$\xf6M\x03@\
-W6\xbe\x1e\x11\x02\x00C\xa0\xb1\x12:\x89\xe6\xd1\x8f\
-EXcd\xcf\xach\xc3\xea\xfaG\xfa\x0d\xac\xf4\xbf\
-\x03q\xbf \xc9WC\x1c\xdbN\xb6\x0eJ\x8042\
-\x8e}UUU\x1dW^ye\xc7\x93O>9\xf7\
-\x9cs\xce\x99\xc1\xadg\xd8@j\xbc\xbdd\xc9\x92\xcd\
-L\xcb\xff\x0bk\xbf\x81Y\x98\xf1\xfb\xff\x12\x00\xf0y\
-x\x95+pHo\xfd\xe0\x92d9:^6\xd0L\
-b\x18\xb3\x88\xf1\xae5\xce\xd8M[\x0b\x11\xaf\x8dE\
-\x96f\x11[;\x01\x80O\xc2\x05\x92\xc3\x07\x9c\xee\xbd\
-\xff\xfe\xfb\x1b\xc0\xed\xed\xb3h\xd1\xa2\xf5;v\xec\xd8\
-GV~%\x19\xcb\x0d\xac\x873\x7f\xdf\x14\x00\xa0\xb8\
-L)**\xca\xd3'l\xac\xeah\xbd\xd5\x0fF\xd4\
-\xa7\xeb\xd6\xad\xdb?h\xd0\xa0\x9c\xbe}\xfb\xe6\xe4\xe7\
-\xe7g\x83k\xc9k\xcdSRR\x10hRAAA\
-\x1f\x913\x10Y\xc1\xaeH\x01\x9d\x1d\xd3\x18#J'\
-\x0c\xdd\xf0T|\x8f=\xf6X=\x01\xbe\x9e\xa4\xc7Q\
-2\x9c\x9bX\x0f\x97~}\xd3\x00\xe0\x06\xc2\xf4\xd2\x1b\
-\x80Vu\xb4\xd8\xa3\x07\xf1\x93\x9f\xfc\xe4}0\xc6\xf6\
-\x93W\xe2\xa2\xce\x16\xcb\xa6aK[\xbcx\xf1\xdc\x19\
-3fL\xd3\xe7\xf7\x93\xb5\x17\x92\x0c\x9d\xd7\x91\xaa\xf3\
-\x10\xe1\x1d$5\xeaYdi\x97\xaf\xb4\xc3O\x97M\
-\xd2\x11*%77\xb7w\x22\xb1\x1f\x8b x\x0c.\
-\xd8\xdf\x81\xf8\xe5\xc4u5:\xfbB\xa6\xfb`|\x22\
-s\xe9\xd2\xa5\xbd\xa7O\x9f>\xcd\xac~?\x91\xd4\x11\
-\xdf\x01\xf7-\x19=\xad\x92\x8ew\x91\xb4\x10.\xb3\x87\
-\x9d\xa2\xb2\xafD\x81\x9b\xd3e\x13\x13\x1e\xf3Y\xcb\xf5\
-\x13N`%\xb0\xa8\xda\x897\x11\x95\x08\x1d\x83\xcf\xbd\
-k\xc5\x8a\x15\xbb\xa8\xa3\xf7\x91^=H\xc7\xd8p\xe4\
-\x0c\x16Z6\x82\xf1v\x0c\x0c\xb3cFw\xd3\xca\xec\
-ga\xb6\xc6\x19\xa2\x92\xdf|\xe4\xd77\x18\x82b\xdf\
-Z\x000\xd2\x9dhL\x1d\xb9\xe9\xa6\x9b\x96\xbe\xf6\xda\
-k\xef644\xd4\x8a\xea\x1eQ@b6#\x99\x10\
-\xdf\x01\xd8\x1ez\xe8\xa1\xd5,22\xb6U'^\xeb\
-u\xd1H\x0fq`\xed\x07\x1f|\xb0\xcdhp\x1a\xf7\
-\xf1\xda7y\xb3\x9df\xcf#V\xb5TA|7\x03\
-wV\xbe\xfc\xf2\xcb\xbbZ[[O\xe4\xe4\xe4\xd80\
-\x80\x22R\xc6v\xddpp!)p\x03b~\x0cb\
-\xfdS\xb2\xa8\x8f\x12\x87\xa91$\x0e\x9f\xdcb\xff\xfe\
-\xfd\x8ek\xaf\xbdv*\xc6\x1db\xadFf\xfc,\xaa\
-\x87p{\xf3\xcd77\xd5\xd6\xd6\x0au\xd3\xdcS\x89\
-\x9ao#\x00\x14\x12\x8d\x1d$\x09\xda\x80\xc3\x1a\xc1E\
-:\xf1\xc6\x1bo\x1c\x00\xe2\xee\x00\x00\xb4\x80%\xef\xc8\
-\xc8\xc8\xc8\x92\xb4-,\xfaq\xa4\xec\x82\x05\x0b^\x07\
-\xb7z\x0f\x8b\xcc\x8c\xe1\x8b\x036\xb4\x092:::\
-2&O\x9e\xdc\xb7\x0fl\xc6\xa5m\xf4\xa5\xdf\xd8\xb0\
-jH\x84~\xc5\x06>\xfcGmmmGuy\x8e\
-\x7f\x01\xa0\x1b[\x88E2\x84\xed$\xba\xdb\xb4\x10{\
-S\xcd'\x9f|rd\xd9\xb2e;\xd6\xacY\xb3\x1d\
-\x08R\x07\x9c\x1f\xcc\xcc\xccLGB-Y\xb2d\xe5\
-g\x9f}VF\xe2\xff\x04K<8R&c,\x1d\
-\xf4\x7f\xca\xec\xd9\xb3'\x08\xa2\x8bU9\xf5\xab\xa3\xe9\
-m\x04\x8c\xf7\xef\x82\x0d\xee\xb7}\xd5\xaaU8Y\xd6\
-q\x8a\xfc\xb5|\x93T\x80t\x9a=\x87dr\xec\xa4\
-H\x1a\xbap8S$N\xb4\x93E\xc7\x98A\xcc\x04\
-\x10ddgg\xa7\xa0\xebG\xc6\xde\x01\x12\xc7\xbe\x04\
-\xef\x8c\x0c J\xdc\xc7n\xdd\xba\xf5?\xcd\x1e\xae\x1d\
-6\x10\xf1u\x15\x15\x15U``V\x01\x08\x8f\xef\xdd\
-\xbb\xb7\x9e\x88\xddB\xf7\xaa\xd0\x01@5\x18\xb6\xaa\xc9\
-9\xf6U\xf9\xfa_%\x00$\x1dgI:\xd7N\x1c\
-\xcb1\x8e\xe3\x9d\xd3\xffM\xf8\xf2n\x02E:\xb5\x14\
-\xd2\xe7\x1d$\x86\x1bI\x17K\x16\xde\x17A\x84\xb3i\
-\x97L\x9c8q\xe4\xc5\x17_\x5c\x02\xaa\xc4\x0b\x9eA\
-\x1bx\x22m\xa0~\x1a\x01Xb\xc64\x8f\xae\x89\x15\
-9}dX\x8a\xd98U\x0bMIpN1xE\
-\xfa\xf3=\x0a\x1c\xa9\x0b\xd7K\xba@\x8al \x9c\x1c\
-\xe7\xd8\xca>\x11H\xf4\xd7;E\xcc@w/UG\
-\x1c5\xc6\xfbI&\xf9\x07\xaca\xe8G\xd2\xc5\xad\x0b\
-\xdb\x8aY\xd2\x02\xd4|,z\xd64\xbf\xee\x5c \x0e\
-\x81\x95\x04\xc7\xf1\xf6\xc9\x9cS\x0c\x12\xa6\xdb\x00\x90c\
-\x10;\xd199\x0eP\xe4\x04\x80\xd1\x7f\x8e\xa5\x16\x8c\
-jC|O1y/\xc9\xc2\xfb\x0a\x89\x92I\x92D\
-\x14\xbb\x8a\xd9\xd3\x83\xba\xcf\xe2\x5c\x88E\x0f\xc5\x8e%\
-\xe2U\x9d\x81\x1b\x8b\x88f\x84\x8cE\x5c\xa5\x8b\xe7\x92\
-\x02\x80\x9c\xa0I\xdd\xfc{<\xc23\x03\xd73\x13u\
-`\xe5\x5c\xac\xcff{\x95T\x95\x9d\xf6!}P\xca\
- \x86U\x8b:>\xd69f\x91\xb0\x8aE\xc2&\xfb\
-;I\x85\x82c\xe90)\x81\x8e\x93\x12|_\xd1\x01\
-\xcd\xd89\x92A\x84I\x16D\x9a\xf1\x9e\x92\xee{\xb1\
-\x88n\xe6}\xf8cp4K`\xc8u\xf5\xb3j\x22\
-\x05b5\xd6\x8d\xbfw\xcb\x06\x90\x93\x10\xddVE\xbb\
-\x94\xe49)\x81\xb7\x10K\xd4K]xg5\xce9\
-5\xce95\xc6\xb9\x9e\xd2\xebVE\xbee\xf1\xdf\x1d\
-/@2X\xf9\xc9\x1a{V\x8d\xbeD\x9eAW\xc4\
-}2\xb9\x89x\x84\xb6\xc2\x95\xc9Z\xfcJ\x17\xf6!\
-\xab\xdc\xfeU\xc7\x01\x8cF\x9ad\xc2\xe5]mV\x8d\
-\xc3\xee\xbeg2\x1co\x15\x10\x89\xc0b\x06\x88S\x16\
-38]\x02AV\x9e/\x11w[\xb5\xfccI\x84\
-X\x1d\xad\xc69\xb6b/\x9c\x16\x01\x9fX\xdb\xff\x02\
-g`o\xbf\xd5v\x17\xfe\x00\x00\x00\x00IEND\
-\xaeB`\x82\
-\x00\x00\x06\xe9\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\xe1\x00\x00\x00\xe1\x08\x03\x00\x00\x00\x09m\x22H\
-\x00\x00\x00\x90PLTE\xff\xff\xff\xff\x00\x00\xff\xed\
-\xed\xff\xaf\xaf\xffvv\xff\x9b\x9b\xff\xf0\xf0\xff\xfa\xfa\
-\xff}}\xff\xa1\xa1\xff\xda\xda\xff\x1c\x1c\xff\x18\x18\xff\
-\x14\x14\xff99\xffDD\xff\xcf\xcf\xff\xa2\xa2\xff\xc2\
-\xc2\xffJJ\xff\xaa\xaa\xffRR\xff\xb8\xb8\xffYY\
-\xff\x22\x22\xff\xf5\xf5\xff\x96\x96\xff\x0f\x0f\xff>>\xff\
-\xea\xea\xff\xe4\xe4\xff\xb3\xb3\xff00\xff\x8a\x8a\xff\xc5\
-\xc5\xff\x86\x86\xffss\xff\x90\x90\xff\xdf\xdf\xff((\
-\xffjj\xffcc\xffWW\xffHH\xff\xd5\xd5\xff\
-\x88\x88\xff44\xffnn)j$3\x00\x00\x06\x14\
-IDATx\x9c\xed\x9d\xebb\xa2:\x14F\x0b*\
-\xa0\xd4\x8a\x14\xa9\x80\x97z\xc1[m}\xff\xb7;j\
-;\xe7\xd8\xec\x8c\x0d!\x90\xd0\xf3\xad\x9fN&\xdd\xcb\
-\x08\xd9I\x08yx\xa8\x0e\xd7\x99\x06q4\xec\xa4i\
-\xba\xf8\xc4\xbb\xe1\xfd\xf2A\x9e\x0e[\xe1\xc6N*\x8c\
-\xa22\x92Y|\xf2-AF\xdd\xa3\xad;\xe0\x82\xb8\
-A\xfa$\xaaw%\xdb\xc53\xddA\x17\xc0\x0d\xf2q\
-!\xbf+\xfbVc\x1c\xa7\x05\xdb\xef\xdfv\xdc\x87\xae\
-\xee\xd8\x85\x08\x0f\x99\x94\xe0\x99\xedj\xaa;z\x01:\
-\xc2\xf7\x17\x1e\x83\x9e\xee\xf8\x7f\xe4\xa5\x8c\xdf\x85\xa5n\
-\x83\xfbLGe\x05-\xabe\xf2\xc5\xb89\x94\x17\xb4\
-\xfc\xc8\x5c\xc5\xd9^\x81\xa0e\xbd\xc6\xa6*\xda\x9e\x12\
-A\xcb\x9a\x04\xbaU\xf8\xb8C\xe9^\x82edf\xdf\
-\x1fH\xe41\x7fce\xe2\xef\xd4yS'hY\xa1\
-n\x1d\x0e]\x95\x82V\xdf\xbc\x01\x95\xa3T\xd0\xb2:\
-\xba\x85\x08\xe9\x9dh3\xdf\xdfn_\xafl\xaf\x8c\xfd\
-G\xdf\xf7\xfb\xf7\xeeL\xbei\x03\xc6\xe4\x95\x1f\xe8\xeb\
-:\x8d\xe6q\x18\x86\xcbO\xc2\x1b\xe28\x9e\x0f\xf3\xbf\
-\xf5\xa1\xa9n%\x86\x167\xcaqt\xb4\x7f\xb8+&\
-\xb3\x90\x9f\x08=;\xf5D.\x0a7\xe1\xf66B7\
-};\xe2~;\xf3\xaac.D\x8f7\xe6\xcd\x85\xef\
-\x87\xf1\x96\xf7\xfdT\x19pa:\x9c\x9bF^\xa0\xd7\
-\x0e9\x97\xf1\xc1\xa8\xc4fM\x03\xdc\x17\x0a\x90\xf3\x15\
-m\xe3\xaa\xa2\x95`Fo\x16\x05/#\x87s!w\
-+\x8aV\x86\xe5\x846a\xc1\xa4dN\x1b\xd1\xa4\xe4\
-tN\xe6f\xb2a\xc1*\x5cz\xaf\xda\x194-E\
-s\xd2q\xe1\xe8V\xa4\x8e\x91A\xb3R9\x89nP\
-\xb8\x8e%\xa9\xc3\xa0\x81\xb0\xfbN\xa2k\x17\xaf\x85\xd4\
-\xf1j\xce\xb4[B\xa7/$\x86\x06\xa4\x8e\xad\xd1\x86\
-Q\xf1ZH\x1dcs\x86\xc1\x0e5\x94\xe8\xadIw\
-a\x90!\xa7\x0d\x9be\xe8\xba\xc9\x19\xe7\xef\xcch\xd2\
-\x16\xdd+\xcf%!\x86\xfe\xfc^%\x97\x98T\xa4\x04\
-\x9btwx\x1e\x0c&\x93\xc9\xd3\x1d\xe8b\xcc\xf6^\
-q.4-\xba[\xc99\xa2\xc1\xe0y\xb4\xf7\xcaM\
-\x1f\xdb'\xfag\x8dc\x5c\x22C\xef\xe9\x0e^\x90\x85\
-l3\xce\xe4\x96r5 ;\x0aY\xe8\x0e\x5c\x98\x89\
-\x5c\x06k?\xeb\x0e\x5c\x98L\xae\x11y3\x0b\xa6\xe2\
-I]\x89\xdd\xbe\xee\xb8\xc5\xd9K\x0d%\xe9\x90\xc8\x5c\
-\xe4\x86\x92tHj.rCIU+\xbau\xf0$\
-3\xd0r\x9bd\xf8\x01C\xaea[w\xd8\x05\x80!\
-\xdf\xb0I\xbf\xd2Bw\x9a\xebp\xf7\x8c\xcdY\x8b0\
-\x96\x8f\xf0O\xd8\x02\x86\xe1\xd3\xe0\xca\xa4\xd43\x865\
-\x93}|\x05\xdd\x16Hnb\xdd\xd1\x96\xe2Y`\xc5\
-\xab\xd9\x86\x22OS\xc1\xd0lD\x16\x8e\x9bm\xf8\x02\
-C\x18\x1a\x8f\xc8`\xbf\xd9\x86\x22+\xe304\x1b\x11\
-\xc3Pw\x90\xa58\x09<\xb4\xd9l\xc35\x0c\x1bo\
-\xd8\xfe\xfd\x86\x02\xcf\xddn\xba\x9f;\x93W\x9e\xb7j\
-_X\xb3C\xe1l\xd4\xd6\x04\xd9\xd1\xf1v\xfd\xf8k\
-\xe3\xf49\xee4\x14\x19\xe4\xbb\xeeu\xe1\xfe\xb2Vn\
-_ \xcb\x88\x8f\xd1\xe7?\xd4\x8e3`\xbf\xeb<\xb9\
-~\xfegY\xff\x8c\x80 !aW\xd8\x1f\xb5=\x9f\
-\xcc\xae\xf7ej\xf6,\x18d\xc8n\xcb\x81\xa1 0\
-\xac\x11\x18J\x02\xc3\x1a\x81\xa1$0\xac\x11\x18J\x02\
-\xc3\x1a\x81\xa1$\xc4\xb0O\xb6\x1a8\xc7\xe0;GR\
-\x09[\x22 \xd3~\x0e[\x82N\xd0\xb3\xe3\xc3\xbe\x9a\
-\xedm.\xa9\x97\x18\xd2m\xael\x09\xfa\xb8q\xca\x0e\
-V;l\x895;#A#)\xba\x7fL\xda\xb0\xc5\
-Nt\xf4\x89\xe1#\x1b\x7f\x875$\xdb\xc3\xc8\x9c\x0b\
-\x0ca\x08C\x18\xc2\x10\x860\x84!\x0ca\x08C\x18\
-\xc2\x10\x860\x84!\x0ca\x08C\x18\xc2\x10\x860\x84\
-!\x0ca\xd88C\xfa\xd6\xc7\x9a\x0c\xe9Z\xad\x22C\
-\xb2\xb6LV^u\x19>J\xbc\xf8\x8egH\x9e\xcc\
-5\xc7\xb0\x05C\x18\xc2\x10\x860\x84!\x0ca\x08C\
-\x18\xc2\x10\x860\x84!\x0ca\x08C\x0d\x86\x0e\xd97\
-\x0fC\x18\xc2\xf0\xf7\x1a\x92\xfdT\xbf\xce\x90\x1c\xbe\x08\
-C\x18j6\xa4\xefL1\xc6\xd0W\xb4\xd7\x93=\x11\
-\xde CEG$\xc2\x10\x860\x84!\x0ca\x08C\
-\x83\x0c\xed\x8f\xdfn8\x85!\x0c\x85\x0d\xf3\xdfnh\
-\xc1\x10\x860\x84!\x0ca\x08C\x18\xc2P\xdep\xc6\
-\x9en\x0b\xc3\xe6\x1b\x969t\xfc\x96\x03\xfb\xa7\xdf\x8d\
-1\x0c\xd5\x18\xbe\xb0\x7fz\x05C\x18\xc2\x10\x860\x84\
-\xe1\x8f\x86\x9e&\xc3\xcd\x16\x86\xd5\x19\xb2\xf1g\xc4\xb0\
-\xdfl\xc3\xf96\xeb\xdf\x92\x8d\x89\xe1\xf8{\x89\xbe\xd5\
-e\x0d\x87\x16S\xc2c\x0d{\xb5\x19\xb6\xd9\x12\x9b\xa8\
-;\xbc\xa5K\x9e\xe4q\x98\x12\xc3.y\xe5w\xaf\xc3\
-\x94X\xb2\xdf\xc1Q\x9faMhl\xc3\x9a\xa8\xaf\x0d\
-\xd7j\xea-L\xc0\x9e\xbb\x06CQ\xfe\x87\x86;\xa9\
-\x13\xea\xca\x13\xb2\x89\x05\x0cE!\x86{M\x86q}\
-\x86\x22\x07EV\x00I\x0e+3|\x118\xec\xb3\x0a\
-\x86lr[\x99\xe1H\xe0\xe0\xe4*H\xb3\xba\x0c\x9f\
-\x025\x15\x17e\xcd\x06\xa2\xca\x90\xcc\x08[k-\x17\
-b\xcc&m\xca\x0cw\xc4\xd0J5(\x1e\xc9\xea\x82\
-\xb5U\xf4c\x9aSC+\xad\xfbRt\x97T\xd0\x1a\
-)\xea\xb6\x5c\xb6\x1b\xbap\x0a\xa7Im\xdd\xa2\x9b\x1c\
-;\xec\xda\xe1\x055\xc7=\x9dYp*\xb7\xc6'o\
-\xb5X\xe4\xe9-\x9d[\xba\x85\xf8\xf6_o\xeb\xcc\x17\
-\x8b\xf7\x95\xc7\xeej\xf9DY\xaf5\xe5V\xaf\x9f\x93\
-*\xc1\x87\x87\xbdn\x17>=u\x86\x81n\x17.{\
-u\x82\x0f\x89\xa7\xdb\x86CF\xe6\xb2\xcap\xe4\xdd\xc9\
-4\x93+\xbd\x95\xbb$\xe9\xd5\xce\x81\x1e\x1eX\x0a\xbb\
-\xad\xdb\x88\xe1CQ\xc2\xf6\x1f\x1b\x9a\x9d\xea\xc4\x8f\xd4\
-\xa7\x1b=v;\x87V\xd4^\x84_l\xd8\x99.\x8d\
-,*\xf0;\xe3\xb0\xaf\xdb\xd5\x05}\xcd\xaf*\xa6k\
-#\x9aqP\xe1Y\xb6n\xc4\xbeS\xb8~\xfc\xb6\xc2\
-d\x8d\xc3q\xa1\xb9\x19_Zv\xa5\x82\xe7\x04.\xd0\
-\x99\xc1\xbd\xb5\x14\xf7\xf3|\xc7cGS\xc7\xb1\x0bk\
-\x9bYHf\xcb\xa8\x93\xaf\xbc\xdaxO\x87\xf1\xd1\x96\
-\xea\x03\xff\x01\xadC\x09=\x80%\xfac\x00\x00\x00\x00\
-IEND\xaeB`\x82\
-\x00\x00=\xf8\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3>a\xcb\
-\x00\x00=\xbfIDATx\xda\xed}y\x9c\x1dG\
-u\xeeWU\xbd\xdc}\xf6]\x1a\x8d4\x92%k\xc7\
-\xb2\x8d\xc1\x1b\xb6\xc1\x80\xcd\x16 @\x80<\x84\x81\x80\
-Cp\xc8\xc3\x10\xc0a\xe7e!\xec\xab\x09\x90\x18\x08\
-\x98\x18\x1e[ \xf6\x03l\xbc\x22lI\xb6%k\x97\
-F3\x92F#i\xf6\xe5\xae\xdd]U\xef\x8f^n\
-\xdd\x9e\xbe3sG\xb2\xd9\xdc\xbf_\xfd\xee\xbd}\xfb\
-\xf6\xed\xae\xf3\x9d\xef\x9c:\xe7t\x15\x91R\xe2\xe9\xed\
-Ow\xd3\xa2v\xa6\xc9\xd6?\xb6\xfb$\x8b\xfc\xdd\xef\
-D;f\xe4mO]\xc7<\x19\x0c\xf0;\x04\x10Q\
-^\xfdF\x010\xaf\x91\xea\xb2%a\xc1s\x00\x8er\
-\xa0\x04 ~\x97\xc0x2\x00\xf4\x87\xce\x00\xbe\xd4\x14\
-!K]\x02\x86\x00\x0c\x0e\xa2\x09H\x83\x03I\x09$\
-\x08\xa4F!)q\xe5K\x5c\x19\x971\x22A\xa4\x00\
-\x11\x12\xc4!@\x8e\x01Y\x0a8\x0cDP\xc0&\x90\
-%\x80\xd8\x1e0|p\xc8s\x0d\x88\xa7\x19`\xfe\xcd\
-\x17\xb8\x0e\xc8\x18\x07b\x0e\x10s S\x04N]\x0c\
-VK\x12\xc5\x8e\x06\xe4\x9a\xeb\x91mjE\xb6-\x85\
-RK\x1d\xacd\x06\x96\x19\x03\xd7\x198\x95\x9e\xdc\x08\
-\x088\xa8,B\xb3\xa6\xa1\x97\xa6`\xe4r0G\x86\
-\x91:=\x81\xe4\xc4\x04R\x939\xc4\xcf\x14a\x8eH\
-\xb0\x09\x0ddF\x03\xb2\x0c(\x02\xa4\x04\xc0\xf2\x18C\
-\xfc\xa11@$\x00~\x0f\x19\xc0\xa7s\x1d\x80)!\
-\x936\x90\xb4!\xea)\xac\x8ezd\x97ub|\xf9\
-\x0a\x8c\xf7\xac\xc0dO\x0f\xb2\xed\x9d\x8476%X\
-\xac.\x15C2\x9dD<\x93\x86\x9eLBK$\xc0\
-\xe2qP3\x06B\xca\xb4\xcfKE\xf0R\x09N>\
-\x0f;\x9bEq&\x8b\xect\x16S\xd9\x22\xc6rv\
-\xe9\x94`\x93\xc7\x90<s\x14\x0d\xc7\x8e\xa2\xb1\xff$\
-\x1a\xfb&\x91:\xc6a\x9e\xd6@&\x0d`\x9a\x009\
-\x0f\x10\x8e\x07\x06\xf94\x03\x9c\xbd\xe0\x99\x22\xf4z\x0b\
-\xb2-\x86\xc2\xf2%\x18]\xb3\x1eC\xeb6`\xf8\xfc\
-\xf3Q\xe8Z\x96\xd1\x12-\xad\x8d\xa8\xeb\xeaD\xa2\xab\
-\x0bFG\x17\xf4\x96\x16\x90\x86F \x9d\x06\xe2q\xc0\
-0\x01M\x03(u[\xf0/\x04\x10\x02\x90\x02\xe0\x1c\
-(Y@\xb1\x00\xe4r\x90\x13\x13\xb0G\x86a\x9d\x1e\
-B~p\x10\xd3\x83'1rz\x14\xc7\xa7\xac\xc2~\
-\x19\x1f\xda\x8d\xd6\x83{\xd0\xb1g\x10\x8d{\x0aH\x0c\
-\xe8\xa0\xc3\x060E@s\x00\x8a!?\xe2i\x06\xa8\
-\x81\xe2}z\xcf\x94 \x9b\x19\x8a=\xdd\x18\xddr!\
-N<\xf3\x998\xb3~C\xccn\xefno@\xe3\xf2\
-\xe5H\xf5\xf6\x22\xb6\xac\x07hk\x07\xea\xea\x80X\x1c\
-`\x0c\xa0\xcc\x15\xae/dB<.!U\x06\x06^\
-_H\xe9\xbd\xf5^\xa5\x00\x04\x07J%`z\x1a\x18\
-\x19F\xe9\xd8\x00\xb2G\x0ec\xfcH\x1fN\x0c\x8db\
-O\x9e\x9ey\x18-{w`\xe9\xf6~\xb4=\xea \
-v4\x062\xca@\xa6\x00\x92\x07`/\xd4D\xfc)\
-3\x80/\xf8\x94\x0d\xd9X\x82h\xab\xc7\xf4\xba-8\
-v\xf9U8\xfe\xac\x8b\xcc\xc2\x8a\xe5]\xcdh^\xb3\
-\x1a\xe9\xf3VC\xeb\xee\x06\x1a\x9a\x003\x060\x0a\x10\
-\xea\x09\xd8\xd3p\xca\xdc\xfd\xbe\xc6\x13\x0aPO\xf8*\
-\x03\x04BW\x9b\x00\xb8\xc7\x0a\xc2k\xfew\x90\xee\xe7\
-R\x09\x98\x9c\x00?q\x02\xd9\x03\xfb1v\xe0\x00\xfa\
-\x8f\x9d\xc6#E\xf3\xd8\xaf\xb1\xf4\xe1\x9dX\xf6\xe08\
-\xeaw\x9b`'u`\x1c \xb9Z\x80\xf0\xa7\xc4\x00\
-\xaa\xe0[J\xe0\xdd\xed\x18\xbb\xf0j\x1c\xbe\xfaZ\x0c\
-]\xb4\xb1\xc5\xcct\x9c\xb7\x12\x0dk\xd7\xc3\xec\xe9\x01\
-\x1a\x1a\x5c:\xf7\xb5\xda\x17\xb6\xc6\x00\xa6\xb9\xda\xef7\
-\x15\x04>0\x026 e\xe1\xab \x08\xcc\x81'x\
-\xce]\x06\xe0\xa1&\x15P\xd8605\x09\xe7\xd8\x00\
-&\x9fx\x02C\x07\x0eb\xd7\xe9|\xf6\x97\xe8\xdc~\
-\x0fV\xfd\xe2$\x9a\x1f1\xc0N\x18\xc0\xd8|@\xf8\
-Sb\x00\xe2\x0eEe\xd2\x81l.\x82/\xef\xc0\xe8\
-\xb3\x9f\x8f\x83\xcf\xbf\x9e\x9d\xde\xb2\xae\xab\xdeh[\xbf\
-\x0eu\xab\xd7\x80\xb5\xb5\x03\xb1\x98\xa7\xe5\xa4,`\xcd\
-\x17\xb8\xe6\xbe\xf7[\x14\x08\xe6\x02\x80\x84+\x0f\xa1\x80\
-@p\x0f\x04\x8a\xd0\x1dGyU\xde\xfb\xa0\x91\xd2e\
-\x86\xe1a\xcc\x1c\xd8\x8fS\xbbwc\xef\xb11\xebN\
-\xde\xba\xf3N\xac\xb9k\x10-\xdbb\xa0\xc74\x90Q\
-\x80d= \xc8?5\x06\xf0\x07\xdfq\x09\xd9\x90\x03\
-\xefj\xc4\xc4\xc5\xd7a\xff\xcb_\xca\x86.Y\xbf\xb4\
-\xd1l[\xbf\x1eu+W\x8266\xb9\x02\x05q\x85\
-\xe8k\xb8\xae\xb9\xefu\xdd\x13\xba^)|\x15\x18\x94\
-\x96\x81@}\xe1\xd3\xb2\x1b\xe0\x03\xc0\xa7~\xa1\xb4@\
-\xe3\x9dJ\x00p\x07\xb0=\x108\x0e\xe0\xd8\xde\xab\xc7\
-\x16\x80\xfbyj\x12\xd9\xc3\x87qj\xd7.\xec\xe9\x1f\
-\xb6\x7f\xc2;\x7f\xfb3\x9c\xff\xb314<\x9c\x00=\
-NAG\x01\xe4\xd5Q\xc3\x1f;\x03\x10\x00\x06 \xeb\
-K@\x07\x90\xdfp\x15\x0e\xbe\xf8\xb58\xfc\xfc\x0b:\
-S\x99\x8e\xf5\xeb\xd0\xd8\xdb\x0bZW\xe7\x0a/\xd0v\
-\xcd\xa5x]w\x85\xadk\xe5\xf7\xfe\xe7\x80\x05t\xf7\
-XM\xf3\xb4\xdfg\x02\xc5\x14\x04\xce`\x08\x00\xbe\xe6\
-GQ\xbf\xaa\xfdNX\xf0\x8ek\x06\xd4\xcf\x9c{\xe7\
-\xe4\xc0\xcc4\xa6\x8e\xf4ah\xd7.\xec8>\x99\xbb\
-\x1d+\xef\xbe\x1b\xab\x7f$\x90|,\x06r\x12 3\
-^<A\xfe13\x00\x05\x10\x17\x90\xady\x88U\xbd\
-\x18z\xdeV<\xf6\xca\xe7\xd6Y=K\xd7\xaeF\xeb\
-\xaa\x95\xd0\xeb\xeb\xcb\x82\xa7\x9e\x105\x06\xe8\x86+\xf0\
-\xe0\xd5\x13t\x00\x08\x85\x01|6P\x99`\x96CH\
-\xa2\x1d@!\xcbB\x17b6\xd5W\x03\x80m{\x00\
-\xf0\xf6\xa9\x9f}\x7fAp\x88\xa9)\x8c\x1e>\x8cc\
-\xbb\xf7\xe2\xeeqz\xe2?\xb0\xe9{\x87\xb0\xf4\x7f\x12\
-\xa0\xfd\x1e\x1b\x14g\xe4m\xfc\x8f\x8d\x01\xbc\xf1\xbcL\
-[\x90K\x80\xc2\x96\x17\xe3\x89\xd7\xbeA\xeb\xbfzu\
-o'\xebX\xb3\x1a\xe9\xa6&\x8f\xaeI\xa5M\xd7\x0d\
-\xc0\xd0#\x00\x10\x12\xbe\x0a\x08\xa6U2\x02\x0b\xb1\x80\
-:\x1a\xf0\x87\x7fB\x96\x87{\x5cF\xd0\xbe\xa2\xd5\x8e\
-\xedR\xbd\x13%t\x85\x09l\x0b\xb0\xec\xf2g\xc1\xdd\
-\xff\xe1\x1c\x85\xf11\x9c\xde\xb7\x1f\xfb\x0e\x1e\x13\xdf\xb6\
-\xbb\xef\xfe\x096\xde\xce\x91\xdci\xbal0}6\xf1\
-\x83\xdf\xb7\x5c\x80G\xf9\xa21\x07\xd9\xd3\x813\xd7\xde\
-\x88\x1d[_\xd0h\xf7t\xae\xdd\x88\x96\x8e\x0e\xe8\x86\
-\xe1v\x12\xe7\xae\x90\xa4t\x85$\xc3y\x17R\x19\x17\
-\x0c\xde\xfb6\x9d\x96G\x05D\xd1v\xaa\x9a\x00\xd5\x14\
-x'\x90\x02\xa0\x12\x10\xfeI}\xef\x9e\xba\xaf\x94\xba\
-\xdf\x11\x8ar\xfe tMaQ\x05\x8e\xa5\x1fO\x90\
-\x15\xa6!\x9eL\xa2g\xd3F\xa4ZZh\xc7\x9e\xbd\
-\xcf\xdb<r\xf7\x9a/c\xcb\xb7N\xa0\xf3\xae\x14\xe8\
-Q\x80\x8c\x01\xb0f\xe4m\xf2\x0f\x99\x01\x08\x80\x84K\
-\xf9\xce\xeaKp\xe8\xd57\x91\xdd\xaf\xda\xbc\xbc9\xd1\
-\xb2j\x152\xa9\x14(\xa5\xde\xd0\x9d\x822V\xd6r\
-\xd3\xf0\xb4\xdf(k\xbd\xff\xdeP\x19`\x1eF\xf0}\
-\x07\xdf\x1f\xd0X\x19\x04\x81\x0f\xe0;|\x8a\xddwB\
-\x9a\x1f\xa6{\xc7\xd3v'\x82\xf6m\xdb\xd5|Ga\
-\x00\xdbR\x18\xc1\x028\x87\x14\x02RJd\xf3y\x9c\
->x\x08\x8f\x1f\x19*~Al\xf8\xe1\x83X\xfd\xdd\
-\x04\xf4\xbd\x14d\xd8\x8b&\x8a?D\x06\xa0\x00b\x0e\
-D\xa7\x8d\xd2\x96W\xe3\xd17\xbf\xc5<vM\xcf\x9a\
-^4t\xb6\xc3\xd0t\xd8\xb6\x0dB\x08(\xa5`\x8c\
-\xb9@`\xcc\x13\x88\xac\x0c\xbc\x04Z&\xe7\xc8\xc1\xa9\
-\xc3;?\xe0\xa30\x82:*P}\x00\xa2d\x8a\xfd\
-\x91\x00\xf5~+\x94\x08\x22\x88\xf2\x9f$\x149\x0c5\
-(\xd1D(\xc1%\x0fl\xc2q\xe0p\x0e!\x04\x0c\
-MC\xc7\x9a\xd502\xe9\xd8\xc7\xf6\xeey\xed\xbf\x17\
-&\xbbn\xc7\x96\xafj\x88=\xa6\x81\x9e\x02\x90}\xb2\
-\xfc\x02\xed\xc9\x08D\xa4\xc9V\x06\xc8\xa4\x05\xd1\xa5a\
-\xe6\xd2\x9b\xf0\xf0;^]?\xbd\xb1}\xcd:\xa4\xea\
-2\x80\x90\xb0,\x0b\x94\xd2\xb2\xf0\x09\x81d\x0cD\xce\
-\xd3\xa9\x15\xf2&J\xe6\x9f(\xcc,+\xc3\xbe\xbeY\
-`lv\xf0G=\x17e\x9e)\xf0\xa8>*d\xac\
-\xfe\x07H\xa5\xf3(1;\x9a\x18\x8c,\x84\xab\xc7^\
-DQH\x09!\x04\x1c\xc7\x81\xf0\xf6\xd5\xb7\xb6`e\
-,\x86\x9b\xf6\xed\xbf\xb2s\xfc\xde\xd6/\xe1\xd9\xfff\
-!\xf3\x1b\x03\xb4/M\xb6Nz\xf6\xe7\xf7\x9e\x01t\
-@\xd6\x95 \x97\xa50q\xc5\xcdx\xf0\xa6\xebZ\xd1\
-\xd3x\xdeZ\x98\x86\x01\xc7v\x82\x03\x19c\xd04\x0d\
-\x94RH)!\xd5pk\xd0y\xb2\x92\x0d|g\x0d\
-r\x01 Q\xf2\x00\x94D\x0b\xbf\x82\x09H\xd97\xf0\
-\xed}\xb8ND-\x0f\x91j}\x88,\x87\x8b+\xe2\
-\x08\xa2r\xbfw\x9fR\xca\xa0\xf9 \x90B\xc00M\
-\xb4\xaf_\x87\xd7\x1e>|~\xe3\xa9{\xdf\xf3\x09\x5c\
-\xf6oSh\xba3\x06\x1c\x01\xc8\xe4\xb9f\x82s\xca\
-\x00i\xb2U\x03dC\x11rU#\xc6\xae}?\xee\
-\x7f\xeb\xd5]\xf1\xb6\xba\xe5\xcb@\x09\x81m\xdbe\xfb\
-@)\x08!\xee\x8d\xfb\x9d\x01\x84\xe2\xee\xa228\x13\
-\x08:\xaci\x11\xce\xa2\x94\x95\x0c\x80p\xe4/\x8aM\
-|\xc0P\x80\xf0J\xe7.\xec\xd0\xcd\x0a\x1f\xcb\x10(\
-\xc5l\x16\xf0\xeeC\x15\xbe\x7f\xff\x9cs8\x8e\x03\xdf\
-'\xab\xef\xed\xc5u\xfa\x89\x8e\xd4\xf1_\xbf\xe3c\xb8\
-\x9c\x8c\xa2\xf5g1\xe0\xe8B\x98\xe0w\xc5\x00\x94@\
-f\x8a\x90\xbd-\x18y\xd1\x07q\xdf[/[\x96i\
-H-Y\x02\xee8pd\xb9\x7f#\x85\xefu\x86\x10\
-\x02T\x08E\xf3Ee\x02Fmj,^\x84:_\
-QLW8J\xa0G\xd3\x80x\xc2u&%\x5c\xa7\
-\xacPp\x1d>\xdf\xb6G\xda\xf4\xd0\x7f\x04\xd7\x22+\
-5?`.%\x99\xa4\x1c/\xe6h\x81I\x00\x90\xe8\
-\xea\xc0\x95\x944\xb2\x81\x07\xfe\xe6\xc3\xb8L\x8e\xa0\xed\
-\xe7\x09\x90>\x09L\x9d+&8'\x0c\x90&[)\
- \x13E\xc8\xa5u\x18\xbb\xe6\x03\xb8\xff\xad\x97/\xcb\
-4$:;a\x97J\x01\xaa\x09!A\x8b\xd2\x02\xbf\
-\x05\x9e\xb8\x1f\x91\x13!\xa70\x00H\x08\x0c\xe1\xe3|\
-\xa7\x0bJ\x84\xaf\xa9\x19hnq\x93I\xeaV*\x02\
-\xa3#\xc0\xe8h\x88mB\xe7\x0eg\x06\xc3\xff-\xa2\
-L\x00\x0f\xeeI\xa5\x7f\x11z/\x84\x08\x98@\x08\x09\
-B\x00\xb3\xb5\x15\xcf\x06\x1a?<\xf0\xe0;>\x8c+\
-\xc8(Z\x7f\x1e\x039\xe21\x81\xf8}`\x00\x02 \
-nAv&0~\xc5-\xb8\xff\xed\x97w\xa7\x1b\x12\
-]]\xb0\x8aEp\xce=\xe5\x93`\x8c\x811V\x16\
-\xb4\xb7_\xed\x00\x19\xb6\xa1\x01\x08\xf8l\xf3P\xa1e\
-aa\x89\xd9\xe7\xe9\xea\x01\x1a\x9b\xa2\xef\xc2\x8c\x01]\
-K]`\xf4\xf7\x85\xb49\xcc8\x22\xfa{\xc1+\x1b\
-\x17\xb3\xc0\xa0j{\xf8\xbe\xd5W\xc7q}%!\x04\
-\x8c\x96f<[\xc8\xc6\x7f8\xfe\xc0\xdb?\x88\xab\xec\
-,\x1a-\x03\xc4\x02\x90\x9f\x91\xb7\x89\xdf\x19\x03\xa4\xc9\
-V\x02 \xe1@t1d\x9fu3\x1e\xfa\xdb\xab;\
-\xcd\xf6Dg'\xacb\x01\xb6\xed\x80s\x0e)e@\
-\xfb\x81\xc3\x17A\xfd\x15f\x80\xf3\xca\x84\x8c\xff\xca\xfc\
-\xcee\xde{V\xc9\x12\xbe\xd6Q^\xf6\xfc-\x0b\xe8\
-\xe8\xaa.|uki\x05\xb2Y\xe0\xc4q\xef\x7f\x9c\
-\xd9ia5f\xc0\x15A\xf3P\x13j.\xc1u\xf2\
-\xe4<&@e\x82\xe0\x95s\xe8\xcd\xcd\xb8\xccq\x9a\
-\xde3\xf4\xc0[?\x86\xe7\x8c8\xc8\xcch\xa0Ci\
-\xb2\xb5\x18\x1e\x1e=U\x0c@\x00\x98\x02\xa2\xdd\x82\xb5\
-\xe5\x1dx\xf8\x9d\xd77\xf3\xde\xe4\xd2e\xb0\xad\x22l\
-\xdb\x81m\xdb\xe0\x9c\xcf)\xf8H Td\xe2\x04\xc0\
-\x14\xe1s\x85\x11|\x10p\x0eP\xc7\xfd\xecG\xf9\x84\
-\xd7l\x1bH&\x81\x8e\xce\x85\xabE\xd7\x12`\xe8\xa4\
-\x17\xb0Q\x04\xad&\x86*\x98)|]\xbc2\x9d\xcc\
-\x05\xc0\x1dH!\xc0\x17(x\xff\xbd\xff\x19\x040\xda\
-\xdbp\xad=\xb8dl\xe4\xb7o\xff\x0c\xae\x18\xa7\x88\
-s\x0ar\xeal\x22\x86\x8bf\x00o\xac\xdf\x98\x87X\
-\xfd\x0a\xec\xba\xe15\xe9\xb1\xcd\xa9\x9e\xf3\xe0\xd8\x16,\
-\xcb\x86\xe38\x81C\xc3\x18s\xb5\xda\x03A\xa0\xe5\x94\
-B\x08Q\xe1\x13\x08\xaf\x93(\xe7 A<\x9e\x95;\
-\x9ey\x11:J=\xe13W\xdb\x19s\x8f\xa5\xb4\xb2\
-\x09\x01\xa4\xda\xdd\xe8\xe0B7\xc3\x00R)`z\xaa\
-\x5c'\xc8\xfd\xe8`DaH\xa0\xed\x8e\x02\x14\xa7\x22\
-\xb2(=M\x8e\x12tX\xd8\xeaw\xbe\x99\xf4_\xcd\
-\xceN\xbc\xa24\xb0\xe1\xe4\xf4c7~\x17\xcf\xcc\xa6\
-\xc0J\x00\x19M\x93\xad\xf6S\xc9\x00\x0c@&\x07\xd9\
-\xbb\x05G\xfe\xfc\xad\xc6\x91\xe76\xf6\xae\x82\x90<\x10\
-\xbem\xdb\x157\xa0\xde\xac/x\x7f\xbf\x0f\x90\x00\x0c\
-B@p\x0e\x16\xeeh\xc7\x03\x00S\xd2\xb3~\x8e?\
-\xd0~\xa7\xb2\xe8\xc3\xb7\xef\xb5n\xa6\xe92\x00\x88\x92\
-\x08rB\xf5\x01Ne\xd2hV+'\x93\xc2\xda\xef\
-\x0f\xfd\xc2\xc2W[9\xad\xe0\xc6\x0a\xdc\xa1-A\xb2\
-{\x09\xdetx\xe0\xaa\x81R\xfd\xc9m8\x7f&\x09\
-X\x8b\x8d\x11\xd4\xcc\x00\x9e\xdd\x8fY\x10\x9d\xad\x18\xbe\
-\xea\x9d\xe4\xf1W-Y\xbe\x04\x92QX\xc5\x22\x1c\xce\
-\x03\xea\x97R\x06\xc3\xbdj\xda\xaf\xb2@\xf0\xd9;\xce\
-e\x01\x9f\x01<\x8dv<\x8d\xa7\x9e\xf0\x1d\xc7\x0b\xe0\
-\xd8\xe1P\x9d\x12\xf4Y\x04;\x0a\xe1\x9a\x0fBB9\
-\x01%\xe7\xef\x832\xf8\xce\xcb\x10\xaa\x9f\xb9\x0d\xc9y\
-\x85\xf0}\x81\x87\x05\x1f\xfe\x5cy\x1b\x12\xb6\x07\x00\xc3\
-4\xd0\xd2\xdd\x89\x9b\xfav\xbfr@4\x1e\x1dA\xfb\
-\x8c\x09\x94\xd2dk\x0e\x80|\xb2\x19@\x17\x10M\x02\
-\xc5\xf5\x7f\x85\x1d\x7f\xb9\xa93\x9d`\x99\x14\xac\x82+\
-|\xc7q\xcavK\xa1/U\xf0a\x9b\x1f\xb9\x9fR\
-\x97\x05\x1cE\xab\xa9G\xf3\x8e\x9f\xcd\xb3\xcb\xb1~\xc7\
-\xcf\x08:J\xdc\xde\x1b\xaa\xf1E\x0c\x999w\x01@\
-\x89\x97\xf4qf'\x87\xec\xd0\xabZ\x0c\x12$\x88\x1c\
-\x88\x90\xc0\xc3t\x1f\xa5\xfd\xeaH)\xd2J\xc5L\xac\
-\xeeH\xc7n<\xb9\xe3\x0d\x1f\xc3\xd5\x03\x02\x89)\xea\
-\x8e\x0cj*1\xab\x89\x01<\xbb\x9f\xceC.\xbb\x1e\
-\xfb^}]:\xb7\xd2l\xef\x85]*\xc1\xf1nD\
-\x0dd\xa8\xe8UQ\x1e\xd6\xfa\xb0-\x0c\xf6S\xea\xb2\
-\x80\x13\xb2\xed~>\x7fV\x89w\x84\xf6\xfb9\xfe\xc5\
-\x02\x80\x10\x80\xdb\xe5\xf2/;T\x17\xc0C\xa0\x08\xd5\
-\x0f\x88y\x04\x1fe\xf7\x83\xe1p\xe4e\xf1 \x96\xa2\
-76\xe2y3'\x96=6\xfd\xc4k~\x88\x0b\x07\
-R`Y\x80L,4gP+\x03x\xd4/;\x96\
-\xe2\xf457\xb0C\xd7\xd5-\xed\x06\xe7\x1c\xb6\xed\x04\
-v\x9fGh[\xd8\x14\xcc\x12\xb4\xd2\xc2\xfb8!\xd0\
-\xfcNUs\xfe\x15\xe1]\x12\x8a\xd7{\x82\xd7\x94\xe1\
-\xd9b\x00`Y.\xd0*\xb4ZI\xfd:\xa1\x02\x90\
-\xa02\xc8\x13\xbe\x97\xf1sB\x00\xf0\x95\xc4\x17\xba\xff\
-y!\x00pK\x0d\x9d \xb0\x16\xefh\xc7\x1b\xf2G\
-\xaf~\xcc\xe9\xdc9\x88\xa5\xa3&PH\x93\xad\xf9\x85\
-\x8e\x0a\x16\xcc\x00i\xb2U\x93\x10M\x1c\xc5\x8d\xff\x0b\
-\x8f\xbfnUG\x9dAb&J^\xb0\xc7\xb6\xed\xe0\
-\xc2\xa2M\xea\xdc\x82\x0e\x83\xc2g\x0aB\x08\x84\xf7\x1e\
-\xd4\xf1\xa8~\xae\x87<\xe4\xec\xe0\xcc\x1c\xd75G/\
-\x03V\xa9<\xba\xa8\xa0z\xa7\x5c\x09d\x87\xea\x00<\
-\x80HO\x19\xaaQ\xbf\x0a\x82\xb09\x9c\x8f\xfe}\xa7\
-\x90\x10\x02\x123\xd1\xdd\x96\xd1\xdexr\xd7_|\x14\
-\xcdOH\xc4'I\xd9\x14\x9c3\x06 \x00\xe2\x05\xc8\
-\xaeg\xa3\xef\xfa\x17$\xa6Wj\xcd+`Y\xa5\xc0\
-\xe9S\x13\x19\xf3\x01 J\xd0\xe1}\x84\x90\xf2\xab\xe7\
-\x88QU\xf3g%\x82\xfcx\xbd\x17\x10\xd2\xfc\x87;\
-\x9c\xc5\x9b\x00\x1f\x00\x15\x8e\x9e\xa2\xf1VX\xf3-\xc0\
-\x9e[\xf8Q\xb4?\xd7\x08\xa0\xfa\xe5y\xa6\xa0D\xa0\
-\xd7\xd5\xe1\xea\xc9\xc1\x9e\xfbr\x87_z\x0f6\x0c$\
-Af\xd2d\xeb\xf4B\xa2\x84\x0bb\x804\xd9\xca\x04\
-dC\x02\xd9M\xaf\xc7\x81\x176t\xb6BH\x01\xc7\
-v\xdcDO\x84\xdd\x8fBm\x85VG\x08:\x0a\x1c\
-\xfe\x03\x9c\x04\x00\xb1-\x10\xca\x80D\xd2\x156w\xdc\
-g\xf8\xe2\x09\xf7\xd9?!+\x131\x82\x95\xbd\xf1\x9a\
-\x01\xe0\xb8&\x80i\x95v\xbdX\x00\x8a\xc5r\xa9\x98\
-m\x03\xb9\x19\x97\x1d<\xa0\xfa}2\x1f\x00\xaa\x05\x81\
-\x16Z\xa5\xe5\xb3\x00e\x14\xa9\xd6f\xbcv\xe0\xe0\x0b\
-w\xc8\xa5\xdb,\xd4\x8f2\xd0\x02\x80\xd2\xb9`\x00\x02\
- \x91\x87\xec|9\x0e\xbc\xf8\x82z4\x90T\x0aV\
-\xa9\x08\xc7){\xfd\x0b\xb9\xe8\xf9\x84\xee\xb7\x0a\xc1\x13\
-\x12D\xd6\xc8\xe6\x0b\xc0\xae\xbc\x1aX\xd1\xeb\x06v\x0a\
-\x05\xe0\xc8a\xe0\xd1\xed\xc0\xc8\xb0\x1b\xbc\x11\x02\xd0\x94\
-p\xb1\xef\xbc-\x86\x01J%\xf7\x5c>\x03\xe4\xb2n\
-\xa8\xf8\xca\x0b\x80\x15+\x81d\xcae\x89\x13\xc7\x81\x07\
-\xef\x83\xdc\xfe[p\x87\xc3a,\xb0\xf5~\xffT\x03\
-DT\xe8w\xa1\x9bj\x0ah,\x86\x0d\xf5$\xf3\xc2\
-\x89\x03/\xfd\x1e.\xde\x9b\x02\x19O\x93\xad\xf6|,\
-0/\x03\xa4\xc9V\xcd\x81\xaco\xc2\xf8\x05/'\xfd\
-W\xc6\xdb\xda\xe186\x1c\x87\x83\xf3\x85i\x7f\x14\x00\
-T\x1f@\x15\xba\x0a\x02\x10\x02\xe4r \x99\x0c\xcc\x1b\
-o\x02\xbb\xee\xc5\x95\x05\x1c\x00p\xfe:\xe0\x9ak\x81\
-\x1f\xff\x00x\xe8~7\xec\xeb\x87c\x19\xf3\x8aM\x17\
-\x01\x00\xdbq\x01\xe0\x07u\xf29\xe0Y\x97\x01\xd7\xbd\
-\xc4e\x1bu\xeb\xee\x01.\xbd\x02x\xe8~\xf0o~\
-\x03\xce\xd1#\xe0\x86\x09G\xc9\xeeEi~\x14\x18j\
-\xad\xd1\x0cB\xed\xb6\x05\xbd\xb1\x01/\x9b>\xfe\xec{\
-\xf8\xca\x8b\xa7\xd1rB\x03\xfcg\x0d\x16\xcd\x00\x04@\
-\xbc\x08\xd9\xf12\x1c\xbe~M\xa3\x9e$\xb1\x18\x1c\xcf\
-\xf1\xf3\xdbB/:*-\xac\xb6\x0a\xda'\x04rz\
-\x1a\xda\xaa\xf3\x10\xbf\xe5\xc3\xd0\xd6\xac\xad~\xe2D\x02\
-x\xed\xffr\xed\xf1\xb6\x87\x5c\x100\xee\xd2\xb7UZ\
-\xbc\x09(\x15\x01\xa1\x03\xb9\x1cp\xf1\xb3\x80W\xbcz\
-\xee\xe4\xc8\xa5W\xc0\xd8\xb0\x09\xe2k_A\xe9\xa7?\
-\x02\xa7\x04\x9c\xd0\xc8\xa1_\x94\xfd\xaf\xa5/\xc3\xa6\xd5\
-\xb1\x1d\xb0X\x0c\xbdu\x9a\xf9\xfc\xf1C/\xf86\x1a\
-\x1fIA\x1bI\x93\xad\x93s\xb1\x00\xad\xc6\x00\x1e\x0b\
-h\x1c\xa8o\xc0\xd4\x05\xd7\x91\x13\x97\x9bM\x8d\x9e\xf6\
-;\xb3P\xbb\xd0\x16\xa5\x01azt8\x87=9\x09\
-m\xf33P\xf7\x99/\xcd-|u{\xf9\xab\x80L\
-\xc6\xb5\xd3\x96\xe5\x0a\xdf*-.\x10\xe4\xd8\xae\xad\xcf\
-\xe7]\x80\xbd\xf8e\x0b\xcb\x8dg\xea\x10\x7f\xd7{\x91\
-|\xcf-\xe0L\x83\x93\xcb\x82G\x08\xbf\x9a9\xa8\xa5\
-/\xfd\x16\x98\x1b\xdb\x06\xad\xaf\xc3\xf5l\xf0\xe2\x16\x8c\
-_\xe0@6TS\xf29\x01\x90&[\xfd\x90o\xbc\
-\x08\xd1q\x19\xfa\xae]S\x87\x944M\xd8\x96]a\
-\xdfj\xbdX1Gg8\x8e\x03.\x04\xec\xc9I\x18\
-\x17_\x82\xa6\x7f\xfd\x1chs\xcb\xc2\x85\x96J\x03k\
-\xd6\xba\xe9\x5c\xcbr[\xc9Z$\x00<\x06\xc8\xce\x00\
-\xab\xd6\x00\xe9LM?\x8f]\xff\x124~\xfa\x8b \
--mp\xa6\xa7\x17\x04\x80\xc5\x08_\xedS\xdb\xb6\xc1\
-\x19\xc3\xf245\xaf\xc4\xd1\xab\x8a\x10\xad\x00b\x9e,\
-kc\x00\x00L@\xd6\xc5\x90[\xf7|\x1c\xbb<\xd6\
-\xd8\x00\xce\x9dY\xc1\x8c\xb3Al\x14\x15Z\x93\x13\x88\
-]|\x09\xda>\xf9y\xd0\x1a;\x1d\x80\x9b\xf6-\x15\
-]\xcd/\x95\xdc\xf7|\x91q\x80R\xc9u4k\x01\
-\xa1\x9aO\xda\xb8\x19m_\xf9\x06\xd8\xcaU\xb0\xa6\xa6\
-\xc0\xbd\xf1\x7f\x14\xeb-\xb6/\xd5>u\xcfkC\xcb\
-d\xf0|2\xf8\xcc\x14f\xce\x17\x90\x19/yW\x1b\
-\x03\x00\xd0K\x90\x0d\x1b0x\xc9\xc6\xa4\xdd$\xe3q\
-w\xd8w\x0e\x11\x1b\xf6\x94\xad\xe9i\xe8\xe7\xadF\xd7\
-\xa7\xbf\x00\x96\xc9,\xaa\xd3a\xdb\xae\xe0|\x13P*\
--.\x10\xc4=\x00\x94<3\xb2\xd8\x12\xe9\xa5\xddX\
-\xf2\xe5\xaf\xc38oM\x00\x82s\xa9\xfd\xe1>ul\
-\x07\x8e\xaeaM\xc2n\xb8\x00\x83\x97\x16\x81F\x00F\
-M\x00\xf0\x22-1\x01\xa7\xe398\xfe\xecL}\x12\
-\x5c\x8a\xb3\xb2\xfd\xd5\x10\xeb7\xbbP\x00\xa9\xabC\xcf\
-g\xbf\x02\xad\xa9y\xd1\x1d\xce\x8f\x1c\x06\xb7\x1d\xc8\xc0\
-\x04\x94\xce\xc2\x04\x94 \xb9\x03y\xf4\xc8Y\x15^\xea\
-\x1d\x9d\xe8\xf9\xdam0V\xf4\xc2V\xcc\x81\x9a8;\
-[\x00T\xf4\xa9\xe0\x88g\x12x\x0e\x8e_JP\xea\
-\x96\x90I\xb7ns\xe1\x00`\x0e\x90i\xc7\xc4\x86g\
-\xb2\x89UH\xa6\xe0(\xd1\xad\xa8\xd8\xf5bZ@\x87\
-\xb6\x0d\xbbX\xc4\xb2\x8f\xff\x0b\xe2\xab\xd7,\xba\xa3\xe5\
-\xc80\xac\x87\xb7\xc1\xa6\xd4\x8dNZ\x16\xb8eA.\
-\x02\x00\xd2\xe1p,\x0b6!\xb0\xb6?\x02yr\xf0\
-\xac@`tv\xa1\xf7\xcb_\x07\xa9o\x80\x95\xcf\xcd\
-\x1b\x14ZL\x0b\xe4c;\xe0f\x0c[\xb4\xe9\xdeN\
-Llv\x80\xbaj\xce`5\x00\x18%\xa0e\x13\x86\
-.Y\x92\xa6\x86`\x0c\xdc\xe15\x85*k\x89\x0b\x94\
-&'\xd1\xf6\xfa\xadh~\xe9\xcb\x17\x7f2)\x91\xff\
-\xe2g`\x8f\x8e\xb8S|\xfa\x89\x98\x1a\xe2\x14\x15L\
-\x22\x04\x1c\xc7\x06\x17\x12\xce\xd4$\x8a_\xfc\x8cW \
-\xb2\xf8-q\xfeZ\xac\xfa\xec\x17\xdd`\x91e-j\
-\xd8\xb7\x90!!\xe7\x1c\x9c\x00mI\xa2m\xc1\xc9\x8b\
-K\x90\xcd\xd5\xcc\x00\xadV\xf0Aau^\x82S\x9b\
-\xcdt\x12B\xcc\xce]\x9f\x0b\xca\x92R\xc2\xca\x15`\
-.\xefE\xef\x07?\xbax \x8d\x8fa\xfa\x83\xefE\
-\xe1\xd7\xbf\x820\x8c\x0aS\xe5\xf0\xc5\x01@\xaa\xb6Z\
-\xd7Q\xdc\xf6\x10\xa6oy7\xf8\xe0\xf1\xb3\x12R\xd3\
-\xf3\xafC\xf7\xdf\xdd\x8c\xe2D\xfe\x9c\xf6c\x94\x7fE\
-\x13q<\x13\xa77\xea(uH\xc8x\xd4h\x80V\
-\xa1\xffD+\xa6z\xd7\xb3\xe9ni\xc6*\x9c\xbf\xc5\
-\x0c\xfd\xaa6!\xc0-\x81U\x1f\xfa(\xf4\xc6\xc6E\
-u\xa8\xb5o/F\xdev\x03r\xff\xefN\x08\xc3\xac\
-\xf0\xb2\x1d\xc7\x01w\x16\xa7e\xbe\x89\x0a\xcec\x18(\
-<\xf4 F\xdf\xb2\x15\xd9;n?+\x10\xf4\xbe\xe7\
-\x164\x5c\xfeL8\xd9\xd29\x07@\x85\x7f\xa1\xebX\
-\xabg\x97\xb4cb\xb5\x03$\xa2F\x03Q\x00\xd0,\
-\xc8\xccy8\xb3\xa9#At\xce\xe8,[u\xae.\
-\xd6\xc9\xd9hy\xdes\xd0\xf5\xaa\xbfXTG\xe6\x1f\
-\xde\x86\xd3o\x7f3\x8aG\xfb \xe2\xf1\xc8\xc0\xd2b\
-M\x80\xea\xa3\x04\xf7o\x9a\xb0\xa7\xa70\xf6O\x1f\xc1\
-\xf0\xbbn\x02\x9f\x18_\xd4uS\xd3\xc4\xbaO~\x0e\
-\xc44 \xce\xc1\x08 2\xd8\xe6pp\x00\xcd1\xc9\
-\xd6bx\xa3]\xc5\x0f\xa0\x11\xf4oH\xf0\xe6M\x18\
-Y\x1bO\x98U\xb3Ug}\x91\x5c@2\x82\xf3\xde\
-\xf7\xc1\xd9\xf1\xfd\x05l\x85'va\xe8\xef\xde\x0ek\
-b\x02\xc20\xaa\x06\x96\xce\xce\x07\xa8\x1c\xa6r\xc7\x81\
- \x042\x16\xc7\xd4\x9d?\xc3\x897\xfd%\xac\x81\xfe\
-E\x81\xa0\xe1\xa2gb\xd9\x9b\xdf\x04;\xc7\x9f\x1c\x16\
-\xf0\xe4\xa5\x9b\x066ad\x1d\xe04\x030\xc2f \
-\xc4\x00\x84H \x9e@q\xc9\xf9dr9b\xb1\xc8\
-R\xa5s\xa2\xfd\x05\x8e\xd6\xe7]\x8d\xe6+\xaf\xaa}\
-\xa8\x7fj\x08\xc7\xdf\xf9\xd7\xae\xf0u\x1d<L\xfb\x15\
-@p\x16e\x02\xa4\x14\x15\x81\xaf\x0af\x11\x02H&\
-\x91\xdf\xbb\x07\xfd7\xbc\x1e\xc5#\x87\x17\x05\x82U\xef\
-y?b\xed\x8d\xe0\x16?\xf7\x0c\xe0\xfb\x02\x86\x8e\xd5\
-d\xba;\x89\xc2RAH\xe5\x04\xc9\xb3\x00@\xc0\x1c\
-\x82X\x0b\xa6z\x96j\xa5F\xaei\xe0\xce\xb9\x0dX\
-\xf8\xb6_\x02X~\xe3M\xb5\x0b\x86s\x1c{\xff\xbb\
-\x91?r\x04\xd20*\x84\x1f\x95_p8\x07\xb7\xed\
-E\x9a\x00>+r\xa7\xfa\x052\x16Ca\xe0(\xfa\
-\xde\xfaF\xd8\xa7\x86j\xfe\x8fx\xd7\x12,\xbb\xe1\xcd\
-p\xac'\xcf\x11t\x08E\xa7n\xd5\xb7c\xaa\xd7!\
-H\x80T\xfa\x01a\x00P\x9b \xde\x8d\xc9\xe5\xf5&\
-\xa8 \xa8Z\xadzV\xda_\x92\xa8\xdf\xb0\x1am\xd7\
-\xbe\xa0\xe6N;\xf3\xad\x7f\xc7\xd8]?\x07\x12\x89\xd9\
-I\xa4\x08aq!`\x0f\x9d\xac\xdd\xb9<}*2\
-j\x17\xcee\xc8X\x1c\xb9\xfd{q\xf8o\xff\x1a\xa2\
-T{\xc4\xb0\xe7-o\x83Q\x9f\x84\xb0\xc5\x93\xc3\x02\
-\x90H\x1b\x12=\x98\x5c\xe1\x00)\x80hiv\x03\xa9\
-f\x024\x01\x99^\x8e\xa9\x1e\xd3\xd4!\x85<\xe7\xc2\
-\x07$\xa4\x00\xba^\xf5\x17\xa0\x86QSg\x95\x86N\
-\xe2\xf8\xa7>\x01\xa9\x9bUS\xaca\x10\x08\xca\x90\x7f\
-t\x07d\xa9\xb8p\xed\xcf\xe7\x90\x7f\xecQp\xafT\
--\xecTV\xfc\xa7\xe3\x00\x89$\xc6~y\x17\x8e\x7f\
-\xfa\x135\x03 \xd9\xb3\x1c\xed/\xba\x1e\xb6\x8d'\x05\
-\x00B\x08h\xba\x86\xe5\x98\x5c&\x89H\x83\x80\xa9%\
-\x94\x01\x00\xd2\xda\x0d\x04\x04:#\xbc\xa1\x07\xd3K\xa9\
-\xae\x83\x0b^\xf1\x04\x0f\x97\x12\x1cXT\x13~\xe9\xa6\
-\x00\xf4\x84\x8e\xceE\x04}\x8e\x7f\xf1\xb3\xc8\x9f8\x0e\
-\xa9\x8cL\xe6\xab\xb9s\x08A\xe1\xd0AL\xff\xe8\x07\
-\x0b\xfe\x9f\xa9;nG\xb1\xbf\x0f\x82\xd2\xea\x82\x0f5\
-$\x92\x18\xf8\xdc\xa70\xfd\xe8\x8e\x9a\xef\xab\xfbuo\
-\x80$\xde\xect87-\x00\x00\x17\x90\x8c\xa1\x87\xcc\
-t0\xe2\xd4I\x02]u\xba\xa9\xe2\xff\x11A\xa0\xc5\
-`\xd5w\x90|\xa3\xd04\xe5$^%\xeb\x22/F\
-\xfa\x7fD\x08\x84\x05\xd4o\xde\x88\xf4\xdau\xb5y\xfd\
-\xc7\x8fa\xe8\xbb\xdf\x06\xe2\xb19\xd3\xc9\x22T\x85#\
-\x84\x80\xd04\x9c\xf9\xec'Q\xd8\xf9\xc8\xbc\xff\x93}\
-\xe8\x01\x0c\x7f\xf13\x10\x9a^\xc5\xa9\x8cv6\x05!\
-\xb0\xb2Y\x1c\xfa\xc8\x07f\xcf>2\xcf\xd6|\xd9\x15\
-H/\xefr\x1f38G\x00\xe0~\x9cE\x088\x94\
-\xa2\x83\x14\x1a\x13(\xb5\x08\x10]*r\x0f\xdeH\x80\
-p\x103\x89bk\x13\xb33\x82\xd1Y\xda\xef/\x94\
-\xb3\xd0\xe6\x0b\xdf;\xbf;\xf7\x86\x04Z\xaez.\x08\
-\xa55u\xd2\xd0w\xbf\x8d\xe2\xe93\x10sT\xd8D\
-\xd1\xb5\xe3\x0d\xdd\xec\x99i\x1c\xbb\xf1\xcd\x18\xbf\xfd?\
-!\x8a\x85\xd9\xb4\x9f\xcba\xec\x9b\xff\x8e\x137\xbd\x0d\
-N\xbe\x00\xee\x95\xa5E\x9d[D\x94zq\xc7\x01\x8d\
-\xc71\xfa\xab_`\xf4\x9e_\xd5toZ*\x85\x96\
-\xab\xaeq\x9f1\xad\xb1\x8f\xab5\xdbc\x01)\x04\x04\
-!\xa8\xa7v&-\x8b\xad\x82\x10\x1d\xa4l\x044\xd5\
-\x01\x14 F\x83,\xb4\xa7)7\x05\x08\x84?\xa1\x81\
-\x94p<\x00,t\xc4N\xbd\xe6\xcf\x0aM\xfd\x22O\
-\x0a4]~em\x1ey\xa9\x84\xe1\x1f\xff_\xd0\x98\
-\xe9\xce\xb0\xe5\x8d\xeb\xfd\x07K}\xbb\xa7>^\x16.\
-5#\x94Ad\xb3\x18\xfc\xc0{1\xfa\x9do\x22u\
-\xc9\xa50\x96v\xbb\xbe\xc5\xb1~\xe4\xb6=\x84\xe2\xa1\
-\x03\xeeC\xa1L\x83\x0cE<\xc3s\x18\xa81\x91 \
-\xa6\xef\xad<r\xe2\x1b_E\xf35\xcf\xab\xe9\x1e\xdb\
-\xaey\x1e\x0e\x7f\xe3[A\xff\x9e\xed\xfc/\xd2c\x01\
-\xd7\x11\x04R\x94\xb3\x06^h8C\xc04E\x8a\x0a\
-\x00\x08\x04@S(eb\x9a7u\xb5?d\xf3\xe8\
-\x7f\xa1\x00`\xcaEP\x85f$\x970\x9b\xd2\xc8\xac\
-\xdbP\xd3\xcdL?\xba\x03\xd9\x83\x07\xc0Ls\xd6\x14\
-3~\x12\xc4\x17\x8c\x0f\x82\xa8\x9aC\x80\x80\x98&\xf2\
-\x07\x0f \xf7\xc4\xeeJ\xf7\xd70\x82\xa7\x88\xa3\x84\x1f\
-~U\x87\xc4\x15\xf7\x9eH`\xfc\xbe_\xa3p\xac\x1f\
-\xf1e\xcb\x17|\x8f\x8d\x17\x5c\x88XRC\xc9v\x00\
-o\xa2\xb2\xb3Yk\x86(f@H\x09\x83\x01u\xbc\
-P\xc7\x09tD\x99\x00\x10\x10A$i\x92\xf9\xa4N\
-I\x19\xf5\xde\x9cvv-\x8e\x9e\x02\x04Z1\x86\x07\
-\x92\xcb\x96#\xd6\xd1Q\xd3\xcd\x8c\xdf\xf7k\xc8R\x11\
-\xc4{\xa6\xc0/,\xa5\x9e\x19\x89\xaa/\x88v\x0c\xbd\
-W\xc6\xdc:\xbfx\x1c\x88\xc7!\xe3q\x08\xaf\x94;\
-\xca\x94D=\xcbW\xad\xc0\x95j\x1a\xac\xb1q\x8c\xfe\
-\xea\x97\xb5\xc5\x04\x96\xf5 \xb9t\x09\xa8]\xb9\x16\x9e\
-<\x0b?\xc0Q\x9f\xc6&@3\xf2\xad\xd2\x1d\x0a\xb2\
-T\xec-$\xec\x04RI`dPL1Z9\x89\
-\x93\xef\xfd\x8b9\x9ao\xe3}\xca\xd7\x14\x13\x10\x08\x8b\
-\x03\xc9\xde^w6\xd0\x1a\xb6\xa9\xed\x0f\x83\xeaz\x85\
-\xf0+\x9e\x1b\x88H1/\xc4?\xe0B\xcczn\xaf\
-\x9a\xd0\xc3\x1aO\x150\x86\x81@)\xc1\xf8\x03\xf7\xd6\
-t\x8f,\x16Cry/\xa4,\xf7\x1d\x14\x85\x125\
-\xb6\xc0\x01\xf7\x14\x98R \x01\xa7\x11~0\x88(&\
- \x15\x7f\x8b\xb7r\x07\xd2&D\x83;\x93\xa5kg\
-\x89w\x02\xee\xcd\xa5L\xaa\xd0\x0d\x0b\x09_\xb5\xfdT\
-q\xf8\x12\xcbzj+\xcc\x99\x99A\xa1\xef0\x98a\
-F\x0a>\x0a\x14j~\x5c}\x8d\x02L\xd4\xf1Q\xbf\
-\xad\xf6\xbb\xb09\x02\x00f\x9a\xc8\xed\xdb\x07Q*\x81\
-\x9a\xe6\xc2kZ\x97\xaf\x00\xc5\xdd\x01{\xcaP\xab\xd5\
-/p\xfc\xeb\xf7\xae-\x06\x9e\x00!\x9a\x9a|\xd1|\
-\xfb\xef\xfe'I\xe9D\xa4l\xcb\xc2\xcc\xf4\x0cJ\xde\
-\x8fE\xb9\xe6\x22r\xc1UF\xca\x94\xa5\x02\x81*\x1d\
-\xe4w`\xac\x96\xb9z\xbc\x88\x9c3>\x0e\xaai\xb3\
-\x00\x10\xa5\x81Q\x02Z\xb0\xdd\xf4\x8eU\xafW\xbd~\
-\xf5U=&\x0c\x22\xaai\xb0\x86O\xc3:s\x1a\xb1\
-\xeee\x0b\xfe\xffXgW\xd0w\xd2\xebK_\x9b\x03\
-&\xa8\xc1)\x10\xc4\x07\x8f\x84$\x04iX\x06!\x95\
-:\xac)<C\x09\xa4\x9e\x96v\xcc\x0f\x01\xcf\xd8\x0e\
-\xc6\x01d\x01\xd8\xee\xda\xab\x88\xabN\x9dw\x02\x11\xb2\
-\xf72B\xf8n\x03\x8c\x86\xda\xf2\xfe\xf6\xd8(D\xa1\
-\x00j\x18UM@X\x10\xd5\xcc\xc3B\xabjT \
-\x84\xcf\xa3\xde\x8f?\x1a\x99\xf5?\x8cA\xe4r\xb0F\
-Fj\x02\x80\xd1\xd0\x10\x00\x80(f\xd5\x9f\xa4\xde\x9f\
-\xa9\x96\xd7\xc0\x00\xeel+\xae\x223\x80\x84\x9f\xa6V\
-\x19\x00\x12\x84P\x22\x83\xdba\xdeU\xe4$0\xe2=\
-s\x19\x07\x90\x22@\x1a@\x9a\x04\xab>Ud\x18\xa8\
-\xf2\x17\x81\xf0\xbd\xbfa\xe1\xc7\xaa\xe6\xbb\x89\xa9)\xb7\
-\xa6o\x01\xc2\xaff\x1e\x16#|U\xfb\xab\x09^\x1d\
-vV\xfc\x1f!\xe0\xb6\x0d\x9e\xcf\xd5\x16\x0fP\xca\xe0\
-+\xfaP\x01A-\xe6 \x08\x08I\x01\x01\x898\x1c\
-\x9d@\x12D\x0e\x03Q\xb1~F\x85\xb1g\xde\x81\x16\
-\xdc\xd5\x8d\xf2\x12\x98\x84[b\x92\x02P\xef\x81!\xe6\
-\x1d\xa7\x8e3\x02!\x11\xe2\xce\xd8\x9eH\xd4\x9c\xfds\
-\x7f\x1e5\xac\xc3\x9c~@5f\xa8f\xfb\xc3\x9a\x1e\
-\x06\x84\xea\x00F\xa5\x98\x83\xe3\xfd\xa1j\xadu\x08\x0a\
-?\xd3(\x10\x10\x80\xc8J\x01\xcf5\x0c\x94\x1e\x85\x10\
-\xe9/}Nd\x15\x06\x08\x82\x81\xc2\x06\x13Qk\xb0\
-\xab\xc8\xd4\xbd&\x00\xe4\x00X\x12\x98\x96@\x9c\x00I\
-\xe2\x82\x22\x09\xc0\x0c\x9fC\x02N\xb66\xad\xa0\x86\xee\
-\x8eQ\xe7\x10\xfe\x5c\x8ea-\xb6?\x8a\xe6\xc3@P\
-\xc1\x12v.\x83\xcf\xfeujZ\xad9\xe8\xf2\xdb\x08\
-\xa5\xacPP\xc5\xe3GHNR\x91\x0d\x03Pt\x1c\
-\x98\x96@\x91h\xb6$DF\xf8\x00\xc4\xf3/H1\
-G\xf5<\x95\x95C:\xf5\xe4\x1a\x00\x9d\x94\x81`x\
-\xfb4\x0f\x919\xe92E\x16@\x0c\x12\xa6\x10\x88\x11\
-\x02\x83R\x10\x09\xf0B\xbe6Z\xaco\x003\x8c`\
-89\x97\xf7\x1f%\xf8\xb35\x03Q\x8e`\x18\x14\xfe\
-\xfe\x80\x19\x84\x00\x8b\xc5\xa0\xa5\xd2\xb5\x99\xbb\xe9)O\
-\xd3I0{:\x0b\x0d\xb5\x9977\x86\xe3\xf5\xb9\xad\
-\x84\xdd-\xe9N\x08P\xf2\xde\xa7\x88\xbb\xdcH\x8b\x10\
-\xeeo\x08\x95\x12\xa4\xc2\x91\xd7\x00 ;}\xabL\xd6\
-\xbd\xcd\x01\xc8\x8cM\xe8\x94;\xd3:)\x87r=\x1a\
-a\x0a\xbd\xfbT\xef\x03\x82)\xfb\xfc\xfd\x12\x80\xed\xc7\
-\x12\xbc\x05\x13\x8a#\xc35u\x8a\xd1\xd6\x0e-\x93\x81\
-\xc8\xe7+\x84\xad\x0e-\xab\xc5\x05\x162*\x08Sy\
-\x94\xdd\x9f\x8b\x19\xa2\xce\xcf9\x87\x96\xce\xc0lm\xab\
-m\xc43>\xee\x85\xcb)\x98?\x0f\xb1\xa2\xd5>\x0b\
-p\x00\x05\xb8\xc2\xcdy>Z8\xf7\xe2\xcb\xce\xf7\xcf\
-\x18\x80\x19j\x14A\x89P\x11\xa0p\x14\xe1 \xc8\x15\
-\x891%E\xd9\x1eQ\xb8\x8bh\xe8\x9eC\xc8H\x19\
-\x08\xba\xc2\x06\xea>M\x01\x84\x162\x19\x85\xc1\xc1\x9a\
-\x01`\xb6w\xa0x\xe4p\xa4\x19\x98\xcf\x11\x9c\x8f\x09\
-\xa2l|X\xe3\xab\x8d\xf7\xfd\xfd\xfe\x1c\x07\xc198\
-G\xac\xcb]\xbd\xbc\xb6z\x87\xa1\xc0\xfb\xe7\x84\xc0\x91\
-\x12\xfe4\x1f\x05\x00E\x09\x94\xa4+\xf8\x92\xe7\x93\xf9\
-)d\x11bj\xaa\x8c\xcc\xa8\x87\xa0\x12\xd1r \xb0\
-\x14\xcbQ\x91\x0b\x10\x84\x10>A\x129!\xcb?\xf4\
-\xb5\xdd\x04 I\xa5\x0f\xa0E\xb0\x81\x16b\x03\xff\xd5\
-\x8f\x0f\xe4\x07\x8e\xd6\xe8\x03\x18\x88\xad^\x83\xe9\xdd\xbb\
-`x\xd1@_\xfb\x172\x02\xa85\x0eP\x0d\x04a\
-\xed\xaf\x18\xf7+\xf9\x07\xe1M0\x99\xde\xb8\xa9f\x1f\
-`\xb2\xef0\xf2p'}\xb0\xfc\xac\x9eti\xde\xa7\
-z\x10w\xfa#_\x82\xb6\xc7\xce\x96\xe2\x14\xcaP,\
-\x86y;\xb3\xc4\x1c\x06\x90\x05!<7\xf1e\x19\xce\
-\x05\x80\x82\xc8\x09\x9a\xc8\xf9\x8b;PB\xa0\x11\xc0 \
-\xae\xad\x0f\x0b\x9f\x85\xa9?\x82\x0d\x0c\x1f\x89\x84\x80i\
-@\xa1\xff(D\x0d\xd59\x00\xd0p\xc5U\x80\xac|\
-\xa4,\xaa\x85'\x5c\x08OH\x1d%\xf0\xb9\x98b\xa1\
-\xbe\xc4\xac\xa4\x91\x14\xa8\xbf\xfc9\xb5\xd9\xffl\x16\xb9\
-\xbe#\xeeT\x88\x0am\xeb^\xdf\x1b\x0a\x9dk\xa4\xdc\
-\xbf\xcc\x93\x83\x1e\xca\xbb\xa8\x0c\xe0\xfb\x11#,5J\
-\x09\xcd\x83\x10\x1e\x95\x0e\x96\x14pfX|\xbc(\xa9\
-\xd4%\x08%\x04\x86\x94\xc1\x05\xa8\x0e\x9f\x162\x05\xaa\
-\xad\xd1C\xc3AJ\x88\xbb,\x9c!Q<9\x88\xfc\
-\xc0\x00R5<\x03\xd8x\xf5sa\xb6u@\xe4\xb2\
- JD0l\x0e\xe6\x8a\xd4\xcd%\xcc\xa8\x10p\xb5\
-\x90p\xf5R7\xaf\x0a\xc7\xb6\xa1\xb7u\xa0\xfe\x8a\xda\
-\x00\x90;z\x04\xd6\xa9\xd30\xb5\x88\xf9\xdd\x08f-\
-\x96\xa6+\xde><v\xd6dy\x9aP\x16\x92\x91\x05\
-`\x8a&f(!\x15\xf3\xd0\xa8\x9e\x94\xa4\x04\xa5\x09\
-\x9a85\x03#\xcf\xa4\x04#\x04\xa6/|\xa2\x00@\
-\xd1\xf4\x80\xe2C\xe6AW\xa2\x81\xc4[\x1d\x8cj\x1a\
-\xf8t\x01S;\xb7\xd7\xd49fg\x17\x9a\x9e{-\
-d\xb1\x18,:\xe1\xaf8\xa6\xaeC\xa06\xf5\x18\xff\
-\xbd\xff[\xff\xf8r\xf2\x86\xcej\xd5\xa6\xb1\x99\xebx\
-J)d\xa9\x88\x96\x17^\x0f\xa3\xa5\xb5\xa6{\x9cx\
-\xe4a\xf0\xa2\x00e\xa4\xa2\x0f}3\xcbBZOI\
-\xa5y\xa5\x8a\xc0\xa1(\xa3F\x00]\x029\xe8\xf68\
-MN3@D\xd6\x04\x02DP\xc0\xce\xd1\xf8\xd8\x08\
-\x89O3)\xc0\x18ui\xdc\x0b\xf2\x98\xea\x05U\x11\
-~\x85\xcdW:\xab\xdc\xe9\xc0\xd8\xbdw\xd7\x1c\xa2\xed\
-x\xe3[\xa0%\x12\x15\xd9\xc5j\x02\x09\x0b<|\x0d\
-\xea\xf7s\xfd6|\x8c\xfa\xbf\xb3\x00@)\x88\x94\xd0\
-\x93it\xbe\xf1\xcd5\xdf\xdf\xe8=\xbf\xf4\x166#\
-\xb3Lm\x98\xfaUP\xcc\x02\x81b\x16\xfc\xdf\x9a\x02\
-\x18\xa7\xf1\xa9\x1c\x8d\x8d\x10\x02\x07J,\x80\xaaP \
-\x848\x165\xb2'ifT\x13\x02\x941h\x94\x22\
-\x06\x0f\x00\xde\xeak*\xf5Gi~u\xe1\x13hq\
-\x0d\x13\x0f=\x08gf\xba\xa6\x0eJ_x\x11\x9a_\
-\xf4R\xc8|n^\xad\x9f\x0b \xf3is5\x0d\xaf\
-v\x8e\xe0\xbf)\x85,\xe4\xd1\xfa\xf2W\x22\xb5qs\
-m\xc3\xbf\xb11Ll{\x08Z\x8c\x04`\xa2\xa1\x11\
-\x14\x8bp\xb8\xc3 \xf0?\x87\xcd\xb5!\x81!\x9a\x19\
--\xd0\xd80%(E\x03\xc0\xb55\x5c\x12mz\x80\
-5\x0c\x12G\x067\x16\x03\x10#.\x03\xb0\x90\x1f@\
-Cv_\xab\x22|\xdf\xf62\xd3Dq\xa0\x1f\xe3\xf7\
-\xdd[\xb3\x96,\xb9\xf9\xbd0\x9a\x9aA8\xaf\xaa\xa1\
-QZ\xba\x10\xa1V\xfbM\x85\x90\xe7\xf8O8\x0eb\
-\xed\x9d\xe8\xbe\xf9\xbd\xb5k\xff\xdd\xbf@\xf1\xc4i0\
-\xa3<\xca\xf1A\xa0+}\x1e\xa5\xf5\x15\xf2\xf0\xdc\x05\
-\x9f\xb1\x03\xa5\x14\xc0\x80\xd68(\xa8>\x01B,5\
-\x16\x14\x00 7\xf2E\x09BlB\xc8T\x9f\xde\xdc\
-oq\x80\x81\x802\x06\xdd\x03\x81\xa9x\xf5\xaa)\x08\
-\x0b?\xac!~\xe0\xc6\xbd1\x06B\x80\xd3\xff\xf5\x9d\
-\x9a;*\xb6\xa2\x17]\xef~\x1fd\xa9\x14\xd4\x19T\
-\xd3\xe6(3\xe0\xbf\x0f\xb7(\xbf!\x0a\x18s\xd9\x7f\
-i\x95\xd0\xfd\xfe\x0f\xc0\xac!\xfb\xe7oC\xb7\x7f\x07\
-\x94\x01\x84\x84\x80\x1ca\x0e\xaai\xbd\x0a\x0a\x13nX\
-\xde\xf0\xf6q\x09\xf4iM\xfd\x84\x90)\x108\xb9\xe1\
-/D3\x80$\x84k\x84\xe4\x06\xb5\xa6\xc3\xe3R\xb7\
-4o\xa5/J)\x0c\xef\xa4\xa6\xe2\x84\x84\xd1G#\
-\xb4\xbfB\xf8\xdeMi\x89$\xc6\xef\xf9\x15r\x07\xf7\
-\xd7\xdcY\xadox\x13\x9a\xff\xfc\xd5\x10\xd9\x99H\xa1\
-T\x13\xe2\x5c\x8e]\xd4\xb1s\x81!\xfc\x1b\x99\x9dA\
-\xdb\xeb\xdf\x80\x96\xbf\xf8\xcb\x9a\xefgz\xd7c\x18\xbf\
-\xff\xd7\xd0\x92\xb1Y\xd7\xe4\x97\xc0i\x98\xad\xf5L\xb1\
-\xf7D\x19\x92\x1b\x9e\xb9\xf6Y;&\x81\x190\xde\xaf\
-7\x1d\xd1\x08r\x12\xa4\x22\x87\x146\x01\x82\x11\x14F\
-\xb5\xcc\xc0\x00\xa9;\xa3s\x07Ls\xb5D\xa7\x14q\
-\xef\xa4zh\x14\x10\x08\xbf\x8a\x8d\x9d\xc5\x06\x9a\x061\
-3\x83\x93\xff\xf6\x95E\x15<.\xf9\xe8?#s\xe9\
-\x15\x90\xd9lU\x87n>\xad]\xa8\x09\xa8\x06\x86 \
-(\x94\x9dA\xc35\xd7\xa2\xfb#\xff\xb8\xa8{9q\
-\xeb\x97 \xf3yP\xa6U(LE?\x86\x04NC\
-\x0a\xc8Bl\xec+j\x1c@B\x02\x8343:\xca\
-\xea\xfa\x19P\x00!\xa2*\x00\xf2\xa7?/\x08!E\
-\x87\xc5N\xed5\xda\xfa\x98e\xbb7\xefQ\xa5I\x08\
-\xe2\x11\xb6\x87)\xd4?\x97\xa3\xa4\xb2\x81\x96Ja\xe4\
-\x87\xdfG\xe1\xf0\xa1\x9a;\x8d\xa5R\xe8\xfe\xc2\xadH\
-]|\x89\x0b\x829LA-\x8e]5\xf0T\xfb\xbd\
-\xcc\xce }\xd9\x95\xe8\xf9\xc2\xad\xa0\xf1D\xcd\xf7\x91\
-\xdd\xb3\x1b\xc3?\xfa\x01\xb4t*\xd2_RG\x18s\
-9\x80L\xf9\x1c\xf3\x8avb\x040\x09A\x8c\x03{\
-\x8c\xb6\xbe\x12\x8b\x9f$\x84\x94@+\x8b\xbahD\x22\
-\xd9&\x84N\xec2\xba\xf6\x15,\x09\x06R\x01\x82x\
-\xc8\x0fP\xa9\xbf\x1a\xb5\x86\xe3\xf6\x84\x100]\x07\x9f\
-\x9e\xc2\xf1O\xfd\xcb\xa24GkjF\xf7\xad\xdf@\
-\xe6\x9a\xe7Adg\xdc\xd0g\x15{\x1e~_\xcd\xfe\
-/x\xe8\x07@fgP\xff\xc2\x17a\xf9\xad\xdf\x00\
-\xab\xab_\xd4=\x0c\xfc\xcb?B(\xda?_\xfc\x81\
-\x85\x02n4\x82\x19b\x1e\x03$\x00\x18\x84\xc0\x91\xc0\
-.\xb3k/\xa1t\x12\x94\xd8\xf9\xa1\xcf\xcd\x03\x00\x10\
-\xc7\x00r}f\xc7\xfeA\x19\xcfk\x8e\x03\xa6iA\
-\x07\xf9\xa6@\xfdS\x84.\x1e\xf3\x00\xc2G\xb9\x9e\xce\
-`\xec\xa7?\xc2\xe4\xaf~\xb1\xa8\x0ed\xf5\x0d\xe8\xfa\
-\xc2W\xd1\xfc\x96\x1bA\x1c\x1b\xc4*\xd54\x84\x8b\x1a\
-\x22\xce\xe7\xec\xa1T\x02\xe1\x1c\xad\x7f\xfd\xb7X\xfa\x85\
-\xaf.n2K\x00\xa3?\xfb\x09\xc6\xee\xfco\xe8\xe9\
-\xf4\xacR\xf7(_#l\x0aT\x16P#\xb0q\xaf\
-P\xc7\xf4\x82x\xc30\x8b\x07\x8d\x8e\xfd:H\xd6O\
-'\xcc\xc7\x00\x92\x12\xe4\xa7\xb4\xf4\xd1\xc7\xf5\x8e\xa3\xac\
-P\x84\xe6-\xf3\xce\x14S`\x84\xc6\xfb\xf3!8\x0c\
-\x10J)\x88\xa7i\xc7?\xf6\x018\x93\x93\x8b\xeaH\
-\xa2\xebh\xbe\xf9}\xe8\xfc\xdc\xad0{W\x01\xb9,\
-\x882\xf3x8\x00\xe4/Y\xaf\xebz\xd04M\x0b\
-ZT\xa4\x91R\xea\xaea\x98\xcb\x22v\xdejt}\
-\xe9kh\xf9\xdf\xef\xa9\xb9\xbc=\xa8s\x1c\x1d\xc5\xc0\
-G>\x00\xaa\xe9 \x11\x91\xc9\xa8\x8c'\xf5\x96\xc2\xa3\
-UX\xc0\xd7~\xbfnS\xd34\xc4\xb8\xc0\x13z\xfb\
-\xc0\xb8V\xdf\xc7\x08\xf2\xa1R\x80h\x00\xe4O~V\
-\x80\xa0H\x88>\xb4-\xbebg\xa9h\x83\xa9\xd4\xe9\
-u\x94\xe1]\xcc|\xd4_\x0d\x04\xe5\x11A\x02\x85C\
-\x07q\xe2\xe3\x1f\xc2\xd9l\x89+\xafB\xe7m\xb7\xa3\
-\xf1\x9d\xef\x86\xd6\xd2\x02\xe4s`\xdc\x81\xc6\x18t]\
-\x87a\x180\x0c\x03\xa6i.\xa8\x19\x86\x01C\xd3\xa0\
-q\x0eR(\xc0hkC\xf3\xcd\xef\xc3\x92o\xdf\x81\
-d\x8d\x8f\xb6\xcd\xa2\xfe\x0f\xbe\x17\xc5\xfe>\xb0Xl\
-\xce\xe1l\x98I)\xa5\x01\x0b0e\x04@\xbd\x08\xa1\
-/|\x9d\xba\x01<i\x03\xbf\x89/\x7f\x0cT\x1f\x02\
-!\x85\xfc\xe0gg\xd5\xa8iU\xf2\xa2\xb6\x019\xbe\
-'\xbe\xf4\x91\xfe\xe9\xc4+\xce/Y)a\x1a\xb3\xe6\
-\x08\x08\xcf\xf1\x1f\xce\xb2\x85\x11\x1c\x05\x06\x00\xd03u\
-\x18\xbf\xe3v\xa47_\x80\xe6\xd7\xbfa\xd1\x1dKS\
-)\xd4\xdd\xf0WH\xbf\xec\x95(\xfc\xe2\x7f`\xdd\xf3\
-K\x88\xfe\xa3\xa0\xa5\x12\x88\xa6\xb9\x95\xc5\x8c\xb9\x0f\xa6\
-*\xf5w\xd2O\xf6\x08\x01\xc9\x1d\x08\xcb\x86plH\
-3\x06\xbaf-\x8ck\xaeE\xfc\xda\x17\x80\xd67\xe0\
-l\xb7\xd3_\xfb\x0aF\x7f\xf8\x03h\x99\xba\x8a\xa4U\
-\xb8\xce\xd0\xdf\xa7V\x1e\xfby\x15\x22DP\x8d\xed\xd7\
-\x02\xc4\xbcR\xbc\x18!`:\x83)\x04N\x22V\xd8\
-\x15[\xb6\xdd \x18\x87\xbb\x8e\x10\x16\x0a\x00N\x81\xe9\
-\x19-\xb3\xef\xc1X\xcf\xee\xb5\xd9C\xcff\x89\x16\x08\
-\xe5A\xcc\xf0\xc5V\xd5r\x05\xcd\xd5\xc0@(\x05M\
-\xc41\xf4\x8f\x1f\x81\xb9\xac\x07\xe9\xb3\xd40\xda\xd8\x88\
-\xe4k^\x8f\xe4\xab_\x07~p?\xf8c;!\x0f\
-\xec\x03\x86N\x82LO\x81\x94J\xee\xa2\x12\x0a!J\
-J\x81D\x022S\x07,Y\x0ar\xfe:\xb0gl\
-\x01[\xb5\x1a\xe7j\x9b\xfc\xd5\xff\xc3\x89\x7f\xfa\x18\xb4\
-d\x122TH\xe2\x9bE\x7f\xc5\x10\xb5\x7f\xa2\x9eu\
-dn\x997\x98\x07\x828\x808!\xd0|3],\
-`\x9b\xb9|\xdf\x84^\xbf/\x0eL!4\xfe\x9f\x13\
-\x00\xf9\xe3\x9f\x96\x89e\xef*P\xb0\xa1\xfb\x92\xab\x1f\
-x\xe5\xd8\xfeg5pAdD\x81\x83z\x13\xd5\xaa\
-u\xe62\x0fe;\xabAZ\x16\x06o\xbe\x09=_\
-\xfb\x16\xe2\x1b7\x9d}\x8f\x13\x02\xb6f-\x98\xbf\xde\
-@\xb1\x00\x8c\x8f\x03\x93\x13\xee\x94\xf2\x85\xbc[\xf8\x10\
-\x8f\xbbS\xcd\xd7\xd5\xbb+\x8c\xc7b8\xd7[n\xe7\
-v\x1c{\xd7M\xee\x08B\xd3\xdc%p\x22\x983R\
-\xeb\xa3\xfa\xd3\x03@\xe0\xf9\x03\xae\xf0u\x0d:\x08\xf2\
-\x16\xf0\xeb\xe6\xd5\x0f\x12\xca\x06%\x90/\x0c|J,\
-\x18\x00\xf1e\xef\x02\x00[\x87\x9c\xec\x8bum\xdb\xce\
-\xda\xfa_\x98\x9d^\x81\xc6\xc6\xc8<\xf8\x5cC\x97\x85\
-6\xc0}>NLMa\xf0o\xdf\x86\xa5_\xfe:\
-b\xe7\xaf;\xb7R\x88\xc5\x81\xce.\xb7=\x85[\xfe\
-\xd1\x1d\xe8\xbf\xf1M\x90\xb9\x1c\x987\xf3\x1a\x941\xbf\
-oZ\xe7\xd2\xfaY,\xa0$\x87\x0c\x00\x867T\xd7\
-4\x1d\xb1B\x01\x0f\xe9\xad\x83\x07\xe2\xdd\xbf5\x80q\
-\x10Ru\x8e\xdb\xc8Y\x1a\x0a\xc7>\x85\xc2\xb1O\x09\
-BHV0\xb3\xef\xe7\xe9\xf5w\xe7\xa7\xf3.\xe5h\
-\xac\xc2\x9b\xd64mNm\x8f\xf2\x03T\xca\x0b\x9b\x03\
-\x96H\x80\x0f\x0f\xe3\xe4\xdb\xde\x84B\x8du\x03\xbf\x8f\
-[\xf67\x0f\xe2\xd8\x8do\x82\x98\x9c\x00\x8d\xc7\x174\
-\xde_P\xf3\xe2\x11\xa6'|\xa6i\xd0t\x0d\x1a\xa5\
-\xe0\x05\x07?Oo\xb8\x9f\xb3\xf8aBHV\xad\x01\
-\x5c\x10\x00\xe2\xcboF|\xf9\xcd\x00\xa5\x96I0\xb6\
-3\xb5\xf2\xbe\x9d\xb2\xe1\x0c\x9b\x9e\x86\xae\xeb\x15\xc2W\
-\x8b,\x16B\xff\xd5|\x05u\x1fK$\xc0''p\
-\xea\x1doE\xf6\xae\x9f\xff\xc1\x0a\x7f\xea'?\xc4\xe0\
-\xdf\xfc\x15\xc4\xcc4X<QQ\xda>W?U\xfb\
->\xaa\x02Z\xf7\x84\xef\x8f\xd0\x8cR\x09\xfbH\xdd\xf8\
-#\xc9U\xf7\x18D\x9e\x01%\xc5B\xff'em\x0c\
-\xd0\xffI\x14\xfa?\x09\x10pBH\xd6\xd6RG~\
-R\xb7\xe9\xbe\xdc\xf84\x18\x08\xb4\x88\xb1\xf3\x5c\x17\x19\
-\x0eq\xce\xc5\x0e\xaa9\x80ea\xe4\x96\xf7`\xf2\xcb\
-\x9f\x87\x5c\xcc\xa2\x0f\xbf\xa3MZ\x16F?\xfd\x09\x9c\
-\xbe\xe5=n\xea:\x16\x9f\xb7\xc2h!\x80\x88\xeaS\
-\x7fX\xae\xe9\x1at\xca g\x8a\xf8qf\xd3\xbdE\
-=\xbd\x87\x122\x09B\xe6\xec\xb8h\x06\xe8}7\xe2\
-\xbd\xefv'\x0e%\xa4h\x10\x9cz(\xb3\xf6\xae\xed\
-h8\x83\xc9I\xe8\x86>+\xa8\xc2\xbc\xa0H-(\
-\x9e7;g\x18\xa0\xa6\x89\xa9\x7f\xfb2Foz\x1b\
-\x9c\xb3\x5c\xb8\xe1\xa9\xd8\xecC\x07p\xe6\xedo\xc6\xc4\
-7n\x05\x8d\xc5\x82\x87Z\xe7\x1a\x16WS\x9a\xb9\x1e\
-~\xa1\x94V0\xb0\xae\x1b0\x0a\x05<A\xea\xc7\xee\
-\xab[w\xa7Ap\x0a\x84\x14\x0bG>!k\x06@\
-\xa1\xef_\xddv\xe4\x13\x00!\x0e%d\xdc\xd6\x93\x8f\
-\xffW\xc3E?\x9f\x1e\x9d\x02\xe5\x12\x9a\xaeW\xc4\xd4\
-5M\x9b\xa5\xe5\x15Q\xac\x086\xa8:,T\x1bc\
-`\x99\x0c\xecG\xb7c\xea\xa6\xb7\xc1\xfa\xaf\xef\xd44\
-\xe7\xdfS\xa6\xf5\x85\x02J\xffy\x1b\xa6nz\x1b\xf8\
-\xee]0\xea\x1b@\xab(E\xad\x0a\x11\xd5\xa7\xcc\x0b\
-p\xb9\xda\xafC#\x04\xf6T\x01\xdfk\xb8\xf0\x17E\
-=\xbd\x9b\x12L\xa8\xd5\xbfUs*\x91\x0cp\xde\xdf\
-W\x84\x86\x01R0!O?\x9c9\xff\xce_O\xed\
-y\xce\xcbF\x86W\xe8]]\x15O\xaeD=2=\
-\xd7\xa3\x5c\x0bm\xd4\xbf\xd9\xbazh\x8e\x03\xfb\xeb\xb7\
-\x82n{\x10\xda\xab^\x07<\xeb\xd2EM4}N\
-7\xce\x81\xdf<\x00\xe7\x8e\xef\xc2\xde\xbf\x0f\x1ac\x90\
-\x99\x0c`Y\xb3\xa6\x92Q\x83=sMj\xa5~\xf6\
-\x7f\x1b>\xc6\xd7~J\xa9\x0b\x84\x89\x09<\xa0\xb5\x0d\
->\x94Y{\x97\x09\x9c\x06!\xc5\xc2\xc1\x7f\x91\x8b\x02\
-@\xe1\xd0\xac\x0c\x1d\x8f\xaf\xfe\xfb)\xc2\xccC\xdfn\
-\xbd\xf4\xff^t\xf2\x07\xefZ\xd6T\xa4z\xcc\x0c\xe8\
-H]\xd2<*H4\x1f\x1bT\x03\x88\x1f\xc3\xd7\x95\
-\xf8=;q\x1c\xf8\xc2\xa7\x80\xfb\xee\x06\x9e\xfb\x02`\
-\xd33\x80\x1ag\x1d=\xeb\xadT\x04\x1e\x7f\x14\xf8\xc5\
-\xff\x00{\x9e\x00sl\x18\xf5\xf5 \xde*\xe2Q\x11\
-\xd3\xb00\xa3\x04\x1d\xee\xc3\xf0\x04\x1bA:\xddc\x5c\
-M\xd3\xc0\x1c\x07\x13\xd3%\xdc\xd6y\xe9\x8f\x84\x16\xdf\
-C '\x00\xb2 \xa7)\x9a\x01\xd6\xbc7*\xa8R\
-2 O\xf7%{~\xf9_\xe9\x8d\x97\xdc4\xb8\xe7\
-\xf2\xc4y\xab u\x80\xfb\xeb\xd7RZ1\x89\xd2\x5c\
-t\xb6P_\xc0\xa7:\xdf\xcc0M\x031MW\xe0\
-\xfd}\xc0m_\x03zV\x00[.\x02\xd6o\x04j\
-|\x1e\xaf\xe6\xed\xcci\xe0\x89]\xc0\xce\xed\xc0\xb1~\
-w\x81\xc9L\x06\xb4T\x82fY\x91S\xb5\xfa \xf0\
-\x05\x18\xd6\xfa\xb09\x0c\x87\xd8\xd5\x87O}\xfaWM\
-/\xce\x8c\xe0\x87\xa9u\x0f\x1fH\xf5\xdei\x12\x0c\x01\
-\xb4P\xd8\xffOr\xd1\x00(\x1c\xf8\xe7H\xb2\x8b\x9d\
-\xff\xbe)\x0d\xf2\xc8\x0fZ/\xfd\xd6\xb3\x8e\xf6\xaf\xbd\
-ld\xa4\xc9howg\x10S.\xda\x07\xc1|\x8f\
-rG96\xe1\x8c\xa1\xea\xe8h\x8c\x81\xea\xba\xbbp\
-\xb4a\x00\x86\xe9\xb6\x89q\xe0\x9e_\x02;\x1e\x01\x96\
-.\x05zW\x01K\x97\x01MM\xee\xf7g\xab\xe9c\
-c\xc0\x89c@\xdf\x11w\xa1\xe8\x99)w\xb6\x8cL\
-\xc6]\x98\xd2*\x02\x12\xa0R\x82\xf9\xf3\xf3\xaa3\xad\
-*\xeb,Ei}\xb5G\xcf\xa3\x8e\xf35\x9fQ\x0a\
-\xcd4@'\xa6\xb0\xcbJL}o\xc9e\xdfb\x94\
-\x1d\x040)k\x98N(\x12\x00\xb1\xb5\xef\xab\x16Z\
-\xb5\x190\x9a7\xea\xb6\x7f\xa5\xe3\xea\xef\xf4\x0e\xfd\xf8\
-\xa6\xee\xbaz\xe8qw\xc8\xa6j\xae\xbf\xb4L-\xa3\
-\x80YC\x9cP\xc0\x89j\x9a+|\xddp\x9ba\x00\
-\x86\xee\x0aY7\x00\x8d\xb9\x1a:2\x02\xecz\xcc\x0d\
-\xed65\x03\x8d\x8d@\xa6\xce\x0d\xf7\x9a\xde\xb1\x94\xba\
-\x8bK\xfbv\x5cpo\xcd\xc1\xa2\x1b&\x9e\x9a\x02\xc6\
-\xc7\xdc65\xe9. )\xb8\xfb\xff\x99\xba\xf2\x92t\
-\x12n\x9cEJ@p0o61\x7f\x12K\xbf\xf9\
-3\x8dUS\x8a(\xc6\x0c\xf7_E\xd1\x8a\xa6\x81\xd9\
-\x0e&F\xa7\xf1\x95\x8e\x17}\x7f\xdah\xdafB\x8e\
-\x00\xb0\x8a{\xffQ\x9e\x15\x00\x8a\xfb\xfe\xa9\xda\xf1\x22\
-\xb6\xfe\xfdy\x13\xf2\xd4\xee\xba5?\xfdf\xf6\x19\x9b\
-\xdfyt\xf7\x15\xf5\xeb\xcf\x07\x0c=XYL]\x22\
-><\xfb\xc6|\x93<\xa9\xda_Q\xbd\x13\x08_i\
-Z\x04\x18|\x80h\x9a+\xd0\xe13\xc0\xe8\x88\xfbY\
-\xd3\xbc\xdf\xe8\x95\x00\x10\xc2\x05\x81\xe3\xdao8Ny\
-\xd5p)\xdc\x10\xb2\x7f>\xdbr\x1dO7\x85\xe85\
-\xe1\x9dC\xb8\xe3\xfe\x90\xf0}\xa1\x85Mc\x98\x11\xaa\
-=\xce6\xab\xd2Ys#~\xd6\xf1A\xdc\x9e\xd9\xf0\
-\xf0\x8e\x86u?6!\x87\x00R\x98+\xea\xb7p\x06\
-X\xff\xfe\xb9\x12,\x02 S:\x91}wt\x5c\xf1\
-\xcd\xf5}'\x97\xbf\xe8\xd8\xf1\xa5\xc9\x95+`\xc3\xae\
-\xb0u\xbe=\x8b\x02\xc1|\x13=\xcc\xea@\xc6\xcaB\
-\xd7\xf4\xd9`\x08\x98!\x04\x02Mw\x99\x811\x802\
-W\xf0\x84\xb8\xaf\xe5\x98\xb47\x81\x11u\x7f\xe7\x0b\x9f\
-;.\x18l\x1b\x15S\xab\x04\xc2\xf7\x04\xef\x03H\xe7\
-\x00\xd7A\xb9\xcb\x04\xe1{\xa8\xe6\x0cF\xed\x0b\x87\xcb\
-\xfd`\x1b\xd34\xe8\xba\x06~\xf2\x14\x1e\x90\xcdg\xfe\
-\xb3\xe3\xaaoi\x94\x1d\x060\x05\x80\x17w\xff\x1f\x9c\
-5\x00\x8a{\xe6\xacp\x95\xb1\x8d\xff`Q`\xc4\xd2\
-\x93\xdb?\xd7}\xfd\xd7\xbb\x8f~\xf7\xef\xb7\xa4\x86\x13\
-fg;\xec\x92\x15\xdc\x88\x7f\xc3\xea\x9a=\xd5\xb4>\
-<R\xa8*|]s\x9b\xa6\x87\xf6E\x00!8\x86\
-\xb9K\xc93\x0f\x00\xbe\xc0A\xca\x93\xe9Ho\x16,\
-\xc1\x15\x00Pwrco\xde\x9f`\x9e\x9b\xe0\xf8\x10\
-\x008w\xd7[\xd7\x1c0\xc7\xa9\xca\x02\xe1~\xa86\
-z\x02P\xfe\xad\x17\xff\xd7\x0d\x03b|\x02G&\x9d\
-\xd2gV\x5c\xf7\x1f\x96\x91~\xd8\x00N\x03\xb0 !\
-c\x1boA- \x88f\x80\x8d\xff0o\xdc\x03\x84\
-\x14\x0c)\x07O'\x97\xfc\xe2_\x97\xbc\xb0\xeb\x9f\xfb\
-\x7f\xfc\x96\x95\xc9\x041\xea\xeb`\x97,Ho\xde^\
-u^\xdd(g0\x8a\x05*\xea\xf3)u\x01\xe0\x0b\
-\x90in\xf3)\xdd\x07C\x98\xe2U3\xa1i\xca\xef\
-\x15\x00\x10U\xa3=;\xce9\xc0\x85\xa7\xfdT\x11|\
-H\xf8R\xb8`\x09\xb4_\x03x\xf9\x1a(\xb3#\x1f\
-J\x093b5g/l\xf3\x09!\xd0\x0c\x1d2W\
-\xc0\xc8\xd0(>\xd9\xf5\xe2\xef\x9dL-\xfd\x99\x09y\
-\x0c@\xae\xf8\xf8\xc7\x17\xb5\x9ag4\x03\xec\xfe\xf8B\
-~+b\x9b>0cB\x0c<\xde\xb8\xee{\x9f\xb5\
-&\x9ao\xd9\x7f\xdf\xcb\x97l^\x07#\x11\x87c\xd9\
-\xa0\x1e\x0b\xf8@Pm\xe0|\xf4_)|\xe6j\xb1\
-\xaf\xc9\x81@U0\xe8!V\x08\x01@\xf3\x01\xe0\x9b\
-\x01\x9f\x05<`\x0aO\xa3\x19\x07\x1c^\xc9\x12*\xed\
-\x0bE\xf3\xb9\xef;\xa8\xd7\xe3_\xaf\x06\xea8U\x1f\
-%\x8b\x1a\xf3\xab\x0a\xa1\x06z\x08q\xf3/\xb0,L\
-\xf4\x9f\xc0\x17Z.\xfb\xd5#\xcd\x9b\xbeg@\x1e\x95\
- S\x04\xe0\xb1\xcd\xff\x10\xdcJq\xd7\xc7\xcf\x92\x01\
-6\x7f`\x81\xa57\x84\x03d\x5c\x97\xf2\xd0]\x1d\x97\
-~\xa3\xd9\x9ei{\xc7\x13\x8f_\xdaq\xc1F\x181\
-\x13\x8eeW<\xaf\xef\x0f\x0f\xc37\x1b\xfe\x1c~\xea\
-\x16L\xf3\xec\xb7\xd2\xc1*0\x94N\xafd\x05\x1f\x04\
-\x0aPf\x99\x01TR:\xe7\x00u\x00'\xac\xf9P\
-l\xbeG\xf7>#i\x0e\xe00\x85\xa1\xdc\xf7\xd5*\
-\x93U3P\x8d\xf6U\xc0h\xba\x068\x1c\xd3G\xfa\
-\xf1\x1f\x99\x8d;\x7f\xday\xf9m:\xc1A\x80\x8e\x03\
-p\x8a\x8f.~\xd5\xd5h\x06x\xfcc\x0b\x0e\x81\x9b\
-\x17|\xc8&\x04\xa3\x1a\xd8\xfe\xff\xec~\xc1W\xd3\xfd\
-\xa5\xd4\x9bw\xed\xd9\xd4\xf6\x8cM0L\x13\x8e\x17\x15\
-\x13\x8aI\x88*)\x8b,-\x0b\x00@\xcb\xf4\x1d\x06\
-\x00\x0b\x09w\x163\xa8\x0c\xa1\x98\x01\xa2j\xb8\xa2\xd5\
-a\x1f\xa1B\xfb\x15\xcag<$\xf8P\xa3\xcc\xadz\
-\x9e\xa3<n\x96>\x85\xca\xe6)\xa5\xd0t\x0d\x84K\
-L\x1f\xee\xc3\xed\xe6\xaa\xdd\xff\xde\xfd\x82\xcfk\x84\xed\
-  g\xe0\xce\xfb \xcd\x0b>X\x19\xba\xa8\x01\x10\
-\x91\x000\xb7\xd4P\xa1\xeb\xe6\x0a,\x0a\x9caD\xdb\
-q\xeb\x8a\x97|\x89\xf5\xfd\xf8\xa67>\xbe{}\xc7\
-\x05e\x10\xf8\x11\xb0\xf0\xd4-\xd5:\xc1\xcf\x03\xb8\x02\
-a\xe5a\x1b\xf3>\xfb`\xa8\x00H\x88\x0d\x02VP\
-\x99@5\x03\x9e\x90\x03\x87\x8eW2\x83\xcf\x0e\x9a\x00\
-\x84\x0f.^!\xe4\x8aWF\xcb>\x86\xf7:\xdf\xb3\
-\x89\xaa\xd9\x0b@\xe29|L\xd3@\x84\xc0\xe4\xc1C\
-\xb8\x83-\xdb\xfb\xc5\x15/\xfe4e\xe6o)p\x12\
-\x12\x85\xd2\xa3\x1f=\xeb\x95\xa7#\x01P\xda\xf9\x91\x9a\
-\x93a\xe6\x96\x0f\x15\x190\x08jl\xfbR\xef\x9f\x01\
-G\x7f|\xd3\x1bw\xeeZ\xdf\xb1e3\xccx\x0c\x8e\
-m\xcf\x9aMk\xaey\xf7\xfd\xaa\x17\xa8\x8dx-\xbc\
-?\x0c\x90\xe0U\x01A\x85\xef\xa0\xb0\x80/d!\x00\
-\x11a\x1a\x02\xe1\xab\xc2\xa6\xb3\x01\xe8_G\xe8\xfa\xe6\
-\xca\xfd\x87M^E\x04T\xd7!m\x0b\x13{\x0f\xe2\
-\x0e\xd6\xbd\xf7\xd3+_\xfe\xafBKl\xd3\x04N\x02\
-\xc8\x03r\x96\xe6\xffn\x18@q\x0aA\x90c\x04\xc7\
-\xc1\x0c\xf9\xa5\x95\x7f\x06\xfb\xe8O\xff\xfa\x86\xed\x8fn\
-\xee\xde\xb2\x19f&\x0d\xdb\xcb\x90\xf9\x00\x90\xca\xf2/\
-a \x04\x1d\x12x\xec\xd4-\x80\xa7\xea\xeb\x1c`\x08\
-3\x83\x16\xf2\x13\xfcc|\x8a\x17\xfe\xb0\x8fT\x0e\xf1\
-x(\x86\xc0\x94\xff !`\x920XI\xc5\x03\xb3\
-a\xfaWC\xbb*\x184C\x07\xcf\x150\xb6\xf7\x00\
-\xbe\x1d[\xf5\xc4WV\xbc\xf8\xd3BK\xfcF\x93\x18\
-\x02\x91\xf9\xd2\x8e\x8f\x9c\xb35\xe7\xcf\x15\x03\x04 0\
-/\xfap\x96\x11y\x1cT\x17_]\xf9\xb2\xe2\xcc@\
-\xfc-7>\xb2\xfd\xf2\x15\x9b\xd7#\xd1\xd6\x02\xc7\xb2\
-\xab\xae\xf93\xcb)\xf4\x87j\xd4k\x15cr2\x1b\
-\x18Q\xec@\x14`\xa8^:\xf3@\xe0\xc7\x01|\xed\
-W\xfd\x01\xce]\x81\xf3\xd0\x7f\x04\xc2\x0e]\x1f\x8d\xb8\
-\xb6jO\xf9(&\xaf\x22\xcd\xab\xeb\xb0&&0\xb4\
-\xef0\xbe^\x7f\xc1\xc3\xb7\xf5<\xffVF\xf5m\x9a\
-\xc4\x90\xab\xf9\x90\xe6\x96\x0f\xcd\xb92\xd9\xd93\xc0\x85\
-g\xf1\x94\x8e\x1b)\xcc1\xe0\x18\xa1\xac\xf0\xdd\x15/\
-\x1c\x1b9Yw\xe6\xef\x1e\xbd\xe7\x15\xeb\xd6\xf4\x90\x86\
-\x15\xcb\xe1p\x0e\xa1D\xc5\xd4\xec\x98:\xf4Q\x1d\x8d\
-`<N\xaa\x00\x01Q\x9d\xafP\xba/\xc0\xb0\x8f\xe0\
-\x03\x80s\xf7\x952\x80\x0a\x80\xf2\xca\xe1\xa2z\x1e2\
-O\x0b\xc0\x8b\xc8\x11\x8e?\xbe\x9f\x15\xf0\xd1\x18\xb2'\
-\x86p\xb4\xef\x04>\xd7y\xf5\x7f\xff\xcf\x92\xcb\xbf\xc9\
-@v3)\x87\x00\xe4K\x8f|\xe8\x9ci\xfe\xdc\x0c\
-\xb0\xe3#guR\xf3\xe2\x8f\x08\x00\x05J\xc8)\x0d\
-\xc4\xfee\xf7\x15_>\x9dh\x1a\xbd\xf9\xe0\x7f\xbf\xee\
-\xd9\xd3\xd3\xe9\xd6\x0d\xeb\xa1\xc7b\xb0-K\xf1\xb5d\
-\xe5\xf8WY\xe8\xa9\x02\x08\xd5\xde\xab\x87\x12\xe5s\x14\
-`\x02\x13\xe1Q\xb9\xbf\x12F\x85\xe0\xab\x00\x0c\x0a\x10\
-\xd5}\xfe\x9f\x13\x94}\x0b\x94\x01\xa1\xa6\xb6\xc3\xa0\xd7\
-t\x0d\x92\x0bL\xee?\x84G\x87\xf3\xf9O\xf6\xbe\xf2\
-;\x8f\xb5l\xf8\x9e&\xc5\x11\x221\xea\xc6\xf8\xa54\
-/\xfap\xf9Z\x7f\x8f\x19\xc0\xbfi\x09\xc0\x22\x84\x8c\
-\xe8R\xf0'Z\xd6\x7f\xf3]\x89\xe6\xc1\xbf9\xf4\x93\
-7\xbd\xe4\x81m\xcb\xbb/\xd8\x88ds\x13l\xdbq\
-W&S\x18@\xf3\x93?\xbe\xad\x8e\xac\xfa\xa9U\x19\
-H\xe5k\xb0\x80\x01s\xb5?\xd0X\x12\x01\xb0Z\xff\
-\xafr\x88\xcb\x18\x9b\xf5X\x9d\xef\x10k\xba\x8e\xd2\xe4\
-\x14\xce\xec\xdd\x8f\xbbD\xf3\xf1\xcfox\xf57O\xa7\
-\xba\xee\xd2\x05\xef\x03\xa1\x13\x90\xd2.\xfd\xf6\x03\xe7\x5c\
-\xf3\x83\xeb[\xcc\xd2\xea\x0b`\x80\xe0\xa9E\xe9\x1a7\
-\x06\x22\xd36\xa1]\xd4)\x5c\xfc\x8ac\xf7\xbe\xee\x86\
-\xe1\x87\xafZ\xbfj)i^s\x1e\x08cpl\xb7\
-\x80\xc5\xafs\xa3\xba\xee\xa6n\x0d\xb3\x9c\xfb\x8f\x99\xee\
-\xd2n\xb1X\xe5\xabiz\xcd{o\x18J\xf3\xd2\xbf\
-F(Y\xe4\xc7\x05|\x06\xf03\x81\xb6\xed\xa6z-\
-\x0b\xb0K\x80e\xbbi_\xabT~-\x96\xdc\xb4q\
-\xa9\x08\x14\x95\xd7b\xd1M\x1b\x17\x0b\xde~\xf7xY\
-*\xc1\xb1m\xd8\xca\xac\xa6\xbe\xb39u\xb4\x1fG\x8e\
-\x9e\xc4m-\x17?p\xc7\xf2k\xbe\xed\xe8\x89\xed\xba\
-\xe0' 1\x05\x09\x0e!%Qs\x15\x7f@\x0c\xa0\
-\xaa\x83\xe3e\x10-\xa1\xc7\xf3\xdf?\xef\xba\x13O4\
-\xf6\xee~k\xdf\x9d\xaf\xb9\xe6\xd4\x83\xedK\x9f\xb1\x01\
-\xa9\xb6V7\x7f\xe0MLUN\xe2\xf8\x9e;+\x0f\
-\xb3\x82\xa93e9\x86\xafF\xf3d(f/\xc5\xec\
-\x10\xae_/\x19x\xfd^\x0e\xc0?F\xfd\x8d\xfa\x1f\
-B\x86\xce\x1f\xdaG\x88{\x9d\x9a\x16\xd4\x19\x10\xce\xc1\
-T?G\xd3\x90\x1d\x1e\xc1\x99}\x07p\x7f)1r\
-\xeb\x9a\xd7~\x7fo\xf3\xf9?gR\x1e\xd2!\xcf\x80\
-\x90\xbc\xf5\xc0-\x1cO\xc1\xf6T0\x80\xe2<\x81\xc0\
-]\xba\xb4\xce\xa6\xac\xd3(\xcdly\xe9\xc0}\xaf}\
-\xdd\xf0\xf6+7-m\xd2:\xd6\xaf\x83\xd9\xd4\xe8\x0a\
-X\xd3\x14\xed\xf7\x9an\x02\xa6\x11\xdao\x96\x99\x22\xa6\
-\xb0E\xf0\x1b\xffU\xc9\x1cjze0H\x0d\x03\xfb\
-,`[\x0a\x1b\x94\xbc\x02\x10\xcb\xd5v\x9f\x0d\x8a\xfe\
-\xfb\xa2W\x19\xe4\xed\xf7\x99\xc2*\x95\xf7;\x0e \x05\
-\xf2\x93\xd38\xbdw/\xf6\x0e\x8e\xf1\xdb[/\xfa\xcd\
-\x0f\x97?\xe7\xfb%#\xb3M\x97|\x10\x12\x13\x90\xd2\
-\x0a\x16\x0b\x10.\xb8\x9eL\x06\x88\x04\xc09a\x80Y\
-\x00\xf0\x9c#\x17\x04\x14\x14\x09\x0e\xd2,\x08Y\xb9d\
-\xf2\xd8\xd5\xaf9z\xcfK_T\xe8?\x7f\xf5\x9a\x15\
-h\xd9\xb4\x11\xac\xa1\xc1=\x9e1\xa5\xe0\xc3\x98M\xef\
-\x154\x1fj~j\xd8P\x8aG\xc2\xa9\xe10\x00\xb8\
-\xe3\xd2\xbe\xa3\x80\xa0dU\x02!0\x07\xf3\xbd\xb7\x00\
-n\x03B@LNbd\xef^\x1c:p\x14w\xc6\
-\x97\x1d\xf8n\xef\xf3~r\xac\xbe\xe7>\x22e\x1f\x83\
-<C$r\x10\x92CJi\xdd\xf7\xfe\xa7\xac\xb6\xf5\
-)d\x80\x00\x00>#Pw)s\xd49\x84\xb6C\
-\x88U\x1bF\xf6]\xfd\xaa\xa3\xf7^w\x0dF{V\
-lX\x83\xa6g<\x03Zss9\xf0\x12\xd4\x02\xaa\
-\x9a\x1d\x12\xb8\xbf\xaf\xa2@$\x942\x0eB\xb8\xa1\x5c\
-@\x90\x06v<\x008.\x08,\x95\x11J!0(\
-\xc2V}\x07\xee\xe6\x0d\xf8\xd8(\xc6\x1e\xdf\x8d\xa3{\
-\x0e\xe0^4\x0c\xdd\xd1s\xe5]\x8f\xb5o\xf89\x98\
-~H\x13|\x18\x12\xd3\x90\xd2\x22\x12\xa2\xd2\xbc\xfc\xf1\
-2@`\x12\xdc\xef\xc0@\x88)\x09\xea8e-p\
-Jk.:\xbd\xe7\xb9/\x19x\xf0\xb9Wbt\xf9\
-\x8au\xab\xd1|\xe1\x850\xbb\xbb]\xaa\x07q\xb58\
-(\x05\xd3+i^\xaf\xe2\xec\xa9)\xe1 Z\x18\x91\
-\x0cRA`\xdb\xb3\x9dC\x15\x10\x96\xe7$\xda\x1e\x18\
-\x1c\xaf\x84\xacTBi\xf0\x04\xc6v\xeeD\xff\x9e\x83\
-\xb8\x1f\x8d'~\xb8\xec\xb2\xfbw\xb4\xaf\xbf\x17z|\
-7\x93|\x90H2\x09)K\x90R@\xc2u\xf4<\
-\x01\xff\xa90\x80\x0f\x00?\xb8\xc2@\x88!\x092\x9c\
-j-pJ\xe7\xad\x1f>\xf8\x9c\xe7\x0f\xfc\xe6\x9a+\
-\x0b'V\xaf^\xd6\xc6\xda.\xbe\x08\xe9\xf5\xebA\x9b\
-\x9b]\xe1\xc2\x1b\xd3\xcf\xd2x\xd5\xde+9\x00\xdf\x91\
-\xa4\xac2\xa0\x13\xae\xf0q\x1c\x85\x09\x1c\xc5/P\xfc\
-\x03\xcbc\x04\xe1\x09\xdd\xb6!F\xc70\xb3o\x0f\x86\
-\xb7\xef\xc4\xa1\x81S\xe2\xfeX\xd7\xc1\xbb\x96=\xebW\
-\xbb[\xd7<\x08=v\x94\x09>L\x80q\x08Y\x80\
-\x84?.t\x97\xeb\x9a\xe5`\xfe\xe90@(\xba\x06\
-\x06\x02S\x10\x92\x16Tk\x81\xe0+\xda\xa7N^x\
-\xf9\x89\x9d\xcf\xba\xe2\xcc\x9eM\x9b\xe2N\xcb\xd25\xbd\
-h\xdc\xb2\x05\xc9\xf3\xd7\x82\xb5\xb6\xb9\xc3A_\x9b)\
-\x9bM\xf9,\x94\xabW\xc3\xca\xc1XE\xf1\xfa\xb9\xe3\
-j3w\xca\x8e\xa1o\x16\xfc\x88\xa1\x10@\xb1\x001\
-2\x82\xdc\x81\xfd\x18\xdf\xb1\x03\x83\x07\xfa\xb0+O\xc7\
-\xefk]\xf7\xd8\x83\xdd\x17>8T\xbfd\x07(;\
-J\x853F$rD\xa2\x04)\x1d\x08\xcf\xc9S\x84\
-\xfd4\x03\x90\xcap\xaf\xa4\x84\x81\xc0\x00H\x9aSZ\
-\x0fB[X)\xbb\xfc\xbc\xd1\xa3\xcf\xb8xp\xd7E\
-\x17M\xf4\xad]\x1b\x17M]=]h\xdc\xb0\x01\xc9\
-\xb5\xeb\x10\xebY\x06\xd2\xd4\xec\xae\x0c\xee\xc7\xfa\xa1\x84\
-o+\xf2\x03\xa1(\xa3Z\xe49k8\xe9\xb1B\xbe\
-\x0096\x8a\xe2\xb1\x01\xe4\xf6\xed\xc5\xc4\x13{q\xb2\
-\xff8\x0e\xe4\xe9\xc4\xf6\xfa\x15\x87\x1e^\xba\xe9\xf1\x83\
-\xcd\xbd;\x1c3u\x00\x90g\x98\xe0\x93\x90\xc8z\x9e\
-\xbd \x12\xb2\xac\xc9\xd5\x01\xf0\xa7\xce\x00\x95\xdf\x810\
-\xb8`\x88\x09\x90\x84d,\x0d\x896V\xca-\xef\x9e\
-\x18\x5c\xb7\xf6\xcc\xa1\xf5\x9bF\x0f\xaf<\xcf\x9a\xe8X\
-\x96\xa4\x99\x96\x8eV\xd4-\xefAbE/\xcc\xeen\
-\x18\xed\x1d`MM\xa0\xc9\xa4\x0b\x0c\xc3\x08\xd5\x03\xa0\
-\xb24\xdc\xb2\x80B\x01\x22\x9b\x05\x1f\x1f\x87}\xfa\x14\
-\x8a\xc7\x8f!\xdf\xd7\x87\xe9\xa3\x03\x189=\x82\xe3Y\
-{\xe6\x80\xd1xjO\xd3\x8a\xc3{\xdaW?q\xbc\
-q\xe9~\xc7L\x9f\x00\xc1(\xe1|\x82B\xce@\xa2\
-\x08)m\x08)|\xa1\x12\xb5\xac\xeci\x06X \x00\
-\xca\xf1x\xe2\x0d!5\x10\x98\x9c\x90\x04(K\x83\xd0\
-\x06\x08\xa7)V\x98\xe9\xe8\x9c:\xdd\xd3=~\xbc\xa7\
-g\xfc\xc4\xb2\xa5\xb9\x91\xceN{\xa6\xa1\x99\xc9t\xbd\
-\xc9\xccT*\x81x*\x01#\x99\x80\x16\x8fCK\xc4\
-A=\x06\x10\x90p\x0a\x058\x85\x22\xac\x5c\x1e\xc5l\
-\x0e3\xd9\x02\xa6JNi\xd4!3Czz\xeaD\
-\xb2\xe5\xcc\xb1\xc6\xa5\xc7\x8e5.=6T\xd7>P\
-\x88g\x06\xc1\xb43\x90r\x1c\x92\xe7\xa8\x90\x05\x22a\
-AJ\xdbw\xec\xc2\x81\xa2\x85\x02\xe0i\x06\x88\x06\x80\
-\xfa\x99H\x02\xea9\x8e:\x08\x0cA\x89\x09\xc2L\x10\
-\x9a\x00d\x06\x82\xd73+\xdf\x90(\xe5[\xeb\x8bS\
--\xc9b>\x9d*e\xcd\xfa\xdc\xa4i\xdaE\xdd\xe4\
-\x96\x16\x84\xec\x09`1\xc3)\xe9\xa6=\x99\xa8+e\
-\xe3\x99R\xceH\xccL&\xea\x86\xf3fb\xd81\x12\
-\xd3\xa0Z\x16\x04S\x102\x07\xc1\x8bT\x0awE7\
-\x09\x1bRr\x08\x85\xe2eH\xc0\xe2i\x068\xd7\x00\
-\x80$P\x8f\xf7\x93\xea\xd4\x1bVj\x12\xd0$!:\
-(5A\xa9\xe1Vfx\x22\x97\x90\xd1\xc9\x1eB\xbc\
-\xc5y\x89K\xdd\xbc\x04)KDH\x0eH\x87H\xe9\
-@\x82\xbb\xcd[\x95Y\x11$\x11\x95B\xfdC`\x80\
-\xa7\x22\x17\xf0$C\xd8]\xf6\xd6\xfb\xc4\xe1.\x9cE\
-\xbcL,\x01$\x85\xe4\x04R(i\xdc\x88d_P\
-\xfc\x89r'\xbb\xbd,@\x5c\xc8\xf8\xd0y\xb27\xeb\
-\xfe[\xfe\xb0\x19\xe0\xe9\xed\x0fg\xa3Ow\xc1\x9f\xf6\
-\xf6\xff\x01\xfdr\xa9f0\x22\xe9\xe1\x00\x00\x00\x00I\
-END\xaeB`\x82\
-\x00\x00,T\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00d\x00\x00\x00Z\x08\x06\x00\x00\x00N\x92\xf3\x89\
-\x00\x00\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\
-\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\
-\x00\x9a\x9c\x18\x00\x00\x00\x07tIME\x07\xdd\x06\x03\
-\x0f\x1c3\xadz\x84i\x00\x00 \x00IDATx\
-\xda\xed}i\x98\x9cWu\xe6{\xee\xfd\xbe\xaa\xean\
-uk_,K\x96d\xcb\x9b\xb0\x10\x06c\x96\x80\xb1\
-1\x036\x103\x90\x19\x06l\x12\x82\x1df\xb2\xb0$\
-!!1\x90e `\xc8<!\x0b!\xf8\x091\x84\
-\x00\x09K\x06b&0!\x0f\x19\x88'\x10l\xf0*\
-\x1b\xef\xb2,k\x97z\xef\xae\xed\xbb\xf7\x9c\xf9q\xcf\
-\xbd\xdf\xadV\xcb\x96\x9d\x90\x991.?z\xba\xaa\xba\
-\xaa\xfa\xab{\xb6\xf7\xbc\xe7\xbd\xd7\xc0\xbf\xe1\xed\x19W\
-\x84\x9f\xa7^\x0a\x83\xa7n\xff\xf7n;.\xaf\x8dq\
-\xdae\xd8\xb6\xe3\xa7\xf0;\xe7\xbd\x01\xe7\xe5Fz\xea\
-\xf6ol\x10\x008\xf9e\xb8\xe0\xa5\xbf\x8c\x87\xde\x7f\
-\xfd\xcf\xcb\xa6+p\xf0\x99\x97\xe3\x82\xa7\x8c\xf2o|\
-\xcb\x22\xe3\xc2W\xff\x06\x0e?\xd2\x86|\xe1\xfb_\x12\
-\xfc\x04d\xfb\x95\x90\x1d\xaf\xc7\xa5O\x19\xa5\xbe\x99\x1f\
-\xb6!n\xfd\x0c\xb0\xed\xb5x\xf9\x05/\xc4\xd7\xae\xf9\
-\x15\xac\x1eiB\x86\x8a\x11\xc0Av\x13\xc4\x8f\xe2k\
-\xe7^\x817u\xbf\xa5\xef\xbb\xfc)\x83\xfcP\x8cq\
-\xdbg\xc3\xfd\x8d\x97\xe2\xdd/})\xfe\xf6\x1d\xff\x05\
-C+\xc6 \x1e\xa0\x86\x1d\x02\x00\xf2}\xd0\x01\x02z\
-\xa3\xf8\xd3\xa1\x8b\xf0N\x00\x00=e\x94\x1f\xcam\xe4\
-T\xd0\xa6W\xe0\xbf}\xf0k\xa8\xee\xea@\x1e\xaa\xc0\
-{\x192\xe9.\x97=G\x0e\xc8\xf3\x7f\xe3\x5c\x19~\
-\x13d\xf9U\xe0\x93\xde\x02\xd9\xfe\x16\xf0\x8e\xd7\xe3\xf7\
-\x16F\xd8\x8f\xda\xcd\xfe\xab\x16\xef+\x80C;\x81s\
-^\x8b\xc6\xba\xad\xf8\xd0\x15o\xc4\xaf\x5c\xf62\x98\xb2\
-\x00\x0c@K\xf1.\xdcp\xeb\x0e\xbc\xf7\xaf/\xc1\xaf\
-\xbe\xf2\xfdx\xe8\xe8.\x8c\xb7\x0f\x91\x01P\xb5\x80\x91\
-Q<\x7f\xdd\x16\x9crp'\xberpg0\xca\xc1\
-\x9dO\x19\xe4\x09\x1b\xe3\xf6\xcf\x02\x1b^\x8c5\xab\xd6\
-\xe3\xe3\xaf|5\xde|\xd9+ \x22@A\xc3\xd4\xaa\
-\xae\xc6\xe7\xbe1\x89?\xfb\x87\xdf\x84\xb0\xc3m\xbb\xff\
-\x1eo\xbe\xe8\xed(\xca%\xd8=q/\x8c\x80\xb8\x09\
-\x19Z\x8ag\xae\xdb\x8a-+\xb7\xe0\x9bw|\x01\xbd\
-\x1f5\xa3\xd0\xbff\xcdX\xf7\x02l\xder\x0e>\xfb\
-\x86\x9f\xc5\xf3\x9f\xb5\x03B\x1e4b\x97a\xd9\xfc\x1f\
-\xe1\x0f\xbf\xfc\x19\xdc\xbc\xeb\xefa\x08 \x01\x18\x805\
-\x06\x17\x9c\xfd\x1f\x80b\x0d>{\xd3\xb5\x00\x1c\x9aC\
-\x84\x96\x17\xf4\x1e\xc4\xb7\xaa..\xbd\xf3\x8b\xe8Fc\
-?e\x90\xc7a\x8c3.\xc3\xba\xf5\xa7\xe1\x1f\x7f\xfa\
-\x97p\xc6)\x1b \xa5\x80\xc6h+F\xa7\xfe\x04\xbf\
-z\xdd\xe5\x98\xee\x1c\x05$\xc0\x08\x12@$<$\x22\
-l\xdb\xf0\x1clZ\xf7l|\xf2\xc6\x8f\xa0Q\x92\x94\
-\x0dP\x8b\x80\xe9\xdb\xe4\x1e\xdf\xc7sv~\x113;\
-.\x07n\xff\xcb\xa7R\xd6\xa3\x1a\xe2\xe0\xce\xf0\xef\xcc\
-\xcb\xb0}\xe3Y\xb8\xed\xf5\xbf\x88\xf5\x1b6B \xa0\
-1\x9c\x8f\xb9]o\xc5\xd5\x9f\xfaI\xb4{\xb3\xc1\xf4\
-\x14~0\x03D\x80!\x00\x02\xec\x9f\xda\x0b#]\x5c\
-\xb2\xfd\xb5xp\xfc.b\xea\xc3\x16\x90\xd1Shu\
-5\x89\x97\xaf>\x1d_\xbf\xe3s\x98\xdaqy\xa8Q\
-O\x19d\x91[\xcc\xeb\x9b/\xc6k\xb6_\x84\xbf{\
-\xf5[1\xb2v\x1d\xc4y\xd0&s%\xee\xbaq\x07\
-\xae\xfd\xbb\xf7\xa1\xe7\xdb0\x06 \x03\x18\xa3A\xa2\x8f\
-A\xe1\xa7\xb5\xc0\xe1\xd9C\x98\x98y\x18\xcf9\xf5\xc5\
-\xa8\xa8\x8b\xb6\x9b\xa2\xb2A\x18Y\x8du\xbe\x8b\x0b\x97\
-o\xc6?\xdf\xf19\x1cz\xb2\xd7\x94'd\x90\x88\xa6\
-\xcez\x15\xde\xf8\x9c\x9f\xc0\x9f\xbd\xf4M\x18\x1e\x1b\x0b\
-\x91\xb1\xc3\xfc\x1e\xbex\xfd=\xf8\xdb[>\x89\x8a\xbb\
-\xb0\x16 \x1b\x22\x02\x00Lv\x9fL\x1d)\xd6\x02]\
-7\x8f\xc3\xd3\xbb\xb1u\xe5v\x14\x0d\x83y?!\x8d\
-\x16at\x1d\xd6\xf5\xa7\xf1\x9a\xa5\xa7`\xe7\xce\xcf\xe3\
-\xc1g\x5c\xfe\xe45\x8a}\x22i\xea\xd0N\xe0\xdc\x9f\
-\xc4/\x9e}!\xae}\xf1\x9b\xd0h4 \xa5i\xd1\
-i\xbd\xf7\xe0\xcf>\xff\x15\xdc\xb2\xfb\x1f@\x86S$\
-\xc4\x85\x8fQB\x060\x85\x1a'>\xb6\xe1\x9fg\x87\
-\x83\xd3\x0fa\xeb\x8a\xedh5K\x9as\x13T4\x80\
-U\xa7\xd3pg\x02\xafY\xbe\x19\xb7\xdf\xf19\xdc\x9f\
-_\xcf\x8f\xa4Ab\xf1\x1e\xdb\x84\xc6\xb6W\xe1\xa3g\
-^\x8cw\xbf\xe4g L\xc02{\x0a\xad<\xfc3\
-\xf8\xd2W\xff\x09;\x0f|\x1bE\xa1\x0bm\x83\x01@\
-j\x08\x8d\x8e\xf4\x932c\xd9\xfa\xb1-\x80\xbd\x93\x0f\
-cys\x15\x96\x8d\xac@Of\x000\xad\xd8\x8cF\
-\xd5\xc6+\x96\x9d\x82{\x0e\xdd\x89{\x0e\xee\x0c\xc4\xe5\
-\x93\xa9\xae\xd8\xc7c\x8c\xd5\xdb\xd0:\xedE\xf8\xc4\xb3\
-\xdf\x807\x9d\xf7j\x88\x13\xd0\x16s!U\xf7^\x84\
-/\xff\xaf\xebq\xff\xd1[\xd1l\xa8\xb7/\xf0\xfcc\
-\x22E\x0d`bJ\xcb\x22\x87\x08(\x0a`\xaa3\x0e\
-b\xc1\x8a\xe1\xb5\xe8c\x16dD\x96\xacFK\x04\x97\
-\x0d\xafD\xfb\xc8\xdd\xf8\xee\xa1'Y\x03yB\x06\x89\
-_\xf6\xecW\xe2\xdb\xcf\xff9\x5c\xb2\xe5\xb9\x80g\xd0\
-f{!&n~\x1a\xbe\xfc\xdd\xeb0\xdd;\x84\xb2\
-\xcc\xbc\xdejd\xd8\xbax\x83\x00[\xd6\x86\x81\x01L\
-\xfe\x9e<Z4R\xfa\xdc\xc5|\xaf\x8dU\xcd\x93\xd1\
-\xc7<\xc1\xb2,YM\x8d\xc6\x08^\xdcX\x82\xd1#\
-\xf7\xe0\x1b\x07w\xfe\x08\xa6\xac\x1d\xaf\xc77^\xf8+\
-x\xe1\xc6s!$D'\xb9\x1fCu\xdb\x0b\xf1\xdf\
-o\xf90\x18\x15l\x11\xa2\xc2\xd8\xb0\x90D\x00\x15\xa1\
-`\x1bS?gl\x80\xbey\x0d1\x1a\x196\x7fl\
-\xea\xc2/\xc6c\xa67\x8d\x15\x8d\xb5`[\x11\xc3a\
-x\x05\xd9\xc6\x12<\xbb9\x86;\x8f\xdc\x8d{~$\
-\x0c\x12S\xc1i\x17\xe3\x19\x9b^\x80\x0f\xeex\x0dP\
-`\x94\xb6\xb4_\x83C\xdf[\x81\xbf\xb9\xf3\xa3h6\
-t\xa1\x8b\xda\xbbc\xbd\xb0\x1a\x1d\xb6\xd0h(\xf4\xf7\
-\x85\xde\x8fu%{/\xc5\x14\xa7\x06\xb6em\xe8\xb6\
-\x9b\xc3\x90\x19AQXT\x5cI\xd9@\xd1\x9d\x81\x1b\
-=\x09_\xddp\x1e\xfc\x93!RN\xa8S?\xfbU\
-\xf8\xf8\xab>\x86\xabV\x9e4D[\x8f^\x89\xef\xdc\
-t\x03\x1e\x1c\xdf\x89\xc2\x84\x8e;\xc2X\x91\xba\xd7\x08\
-mx\xfd<\xc5\xa7\x08\x10\xd6\x14&\xf5U\x08\xeb\xcb\
-i\xc1\x95\xc9\x82\xab\x15\xa0\xd5\x18\xc2P\xd9\xc2L5\
-\x89\x83\xb7\xa3;\xfe\x00\xce\xb8\xe3\xf3x\xe4\xc9\x10!\
-\x8f9\x0f9\xedb\x9cu\xfa%\xb8x\xc9\xf2\x92\x9e\
-y\xe4\xbd\xf8\xea\xff\xfe+<2\xbb\x13\x8dF\x9d\x9e\
-\x8c\x0d\xb5 OK\xa6\xd4tekO\x8f\xaf\xb5\x8d\
-\x0c\xfa\xc6\xe7J}\x8f\xcd~\xc6T\xa6\xef\xb5\xfa\xba\
->w\xd0v\xf3X\xdeZ\x81\xb1\xf5\xd4*\x87\xf1v\
-\xa0\x1e\x15?i\x0dr\xf2K\x80\xb15\xf6\xa2\xb3\xce\
->m\xcb\xb9\xfb\x7f\x1b\x9f\xfe\xe7\xab\xd1\xb3\x93h\x0e\
-Y4\x86,\x9a\xc3\x16\xcd\x11\x8b\xc6\xb0\x01\x95@1\
-\x04\x14\xc3j\x9c\x12\xb0\xad\xf0\xb3\x18\x02L#<6\
-\x05P4\x82QlC_\xdb\x5cp\xbf\xd4\xdf\xb7\xc2\
-\xcf\xa2e\xd0\x18\xb6(\x9a\x16e\xc3\xa29dA\x0d\
-\x8f\x1e\xb5\xb1y\xdb2\xb4F\xed;\xb6\xbd\x1a\xcb\x16\
-\xe3\xba\xae\xbb\xfai\xff\xcf,\xf6'\xae>\xe7_\x96\
-\xb2\xb6\xfdG4W\xac\x5cr\xfd3\xb6?\xf3e{\
-{7\x82\x8c\x12R\x9a\xa6D\x00\x16\xc6\xc6\x8d'c\
-\xc5\xdae\xd85uK\xe2\xa7\x22o%\x18LQ1\
-\x93\x0d\xa4\xac\xfcn\x96\xc6\x88\x00\x82\x85\xcc\xb6x\xf6\
-\x10\x9b\x94\xfeR*\x14\x94E\x89\x99\x89>\xf6\xdd\xd5\
-\xfb\xf5\x9d_\xc0\x87rC\x5cu\xcd]\xe9\xf3\xdf\xf3\
-\xef\xd1\x5c2:\xd4\x14\x11!\x04\xb69z#g\xde\
-)\x0b\x16E\x908\xd1\x81\xdb\xc2L\xca\x8bd\xda\x90\
-\x82\x09\x5cU\xfc\xee\xcf\xb9y\x00\xf8\xc4\xbb\xce\xc1\x95\
-\x1f\xb8\xf3\xb8k^<j\xc5\xb7\xe8\xf5z\xdd\xff\xfc\
-\x9d\x9bo8\xc5\x10\x88\x8e\xb5\x1fOO\xc9\x86\x93.\
-Z\xf9\xc9\x0b\x9e\xfb\x86\xa1\x07n\xbf\x05eQ\x7f\x03\
-\xf1!\xcd\x08#\x91\x8bi\x05\xf2\xfaB\x8b|3\x13\
-\xee7J\x83\xfd?p\xe6\xe0\xbd\xfdW\x038\xba\xd0\
-\x89D\xba0\x96\x84\x0cn\xaf=\xf1i\xb8\xf2\x9a\xbb\
-\xf0'o\xdf\xb4\x8e\x8c\xf9\x05c\xcbW\x8e\xadX\xb3\
-\xa2(\x9b\x00$-\x96\x1cg\x11e\x11\xaf\x95G\xf1\
-dY\xcc\x10\xd9+\x99\x9d\x5c\xbb~\xef\x1d\x00\xder\
-\xe5\x07\xee\xdcs\xdd\xbb\xce\xc1U\xc71\xcac\x19\x04\
-\xdf\xfb\xa4\xdb\x03`\xcf\xb1~\x11nc\xcf\xc6\xfa\x99\
-\xce\x84\x1fn,\x0diGa\xad\x08@\xa5\xbe\xcb\xd7\
-Wil\xf8]\xfc(2\x81\xfdM\x1f\x9f\xe1>\x0a\
-\xf5C|\x1f\xe4\xfar\xd3\xad\x9f\xc6\xfe\xc5\xafT\x06\
-F\xbeU\xd5o~\xf2=O\xff\xafKW\xac\xf9\xb5\
-3\xcf\x7f\x116nZ\x09CN\x00\x10{\x0e\xd1\x0d\
-\x01-@\x0e\x02\xc0\x10\xa9\x93\x08D\xea0\x17\x11\x18\
-c \xe0 \x0c\xc8S\xc1\xa2q\x15\x1d\x86@\x04L\
-L\xf67\xdd\xf8\xf5\xaf\xbe\xe8\xba\xab[O\xbf\xea\x03\
-w>|<\xa3<\xaaAn;\x81\xa1P{\x1as\
-3sS\xdc(\x1a\xa1\x06\x98\xc1t\x05\x01D\x179\
-\x22,c\xb3\x9c!\x0a\x8fc\x80H=/\xa1P\xf4\
-\xc9;A\xd5C\xf7D\xae\xf5\x0f~v\xf5\x99\xcb\xd7\
-\x9c\xfc\x85\xd3w<\xeb\xe9\xa7\x9e\xb9\x1enn\x97t\
-\x8e\xee!@\x08\x22\x10\xe1\x10\xacTG\xa7,\xe2\xe6\
-\xf1wD\xea0T\x87s\x8chf\x81\xd1\xc7,\xe1\
-\x03LJ\xe5\x01\xd4\x08\x04D\x84\xd1\xc6\xb0\x9c\x7f\xf1\
-Ec7|\xe5+\x9f\x01\xf0\xc2\xe3E\xc8\xbfXu\
-\xe2\xee\xc3\xdc\xec\xcc\xac\x94E\x19\x0av3\x14n\xc4\
-\x1e\xa2\x01\x14\xb1\xc8\xe7\xff\x9a\x19\xb2R$EE\x06\
-\x06Z\x8a\xac\x1aj(\x07\x7f<\xe1\xc3'\xb4p\xff\
-\xfe\x9bW\x9e\xbd\xe1\x8cg^\xff\xbc\x97]\xfa\xf4-\
-[Z\xd2\x9d\xbc\x0f\xce1\x85\xafi!0 * \
-\x08\x8d\x0e\x19\xab\xf7-\xc8\x14\x1a\x9e\x16d,LQ\
-@`\xd2\xeb\x00\x03c\x0b\x10Y\xc4\xcf364V\
-B\x05(\xfb<2\xe1\x1f\xc8\xc2\x98\xf0\x1eWuh\
-\xd5\xaa\x16\x96,_\xf9\x82\x8f\xfc\xc2\xfa\xe5O\xa8\x86\
-\x9c\xe0\x8dg&\xfbb\x0b+\xb6\x012%\x00\x9f\x15\
-^\xed/\xc8j\x81\xf4\x99wj}!\xaa#?\x02\
-\x80\xe8\xa1\xd6R\xa0a\x00Y,b\xaf\xd3zq\xed\
-/\x9f\xb6r\xf9\xbaS\xae\x7f\xde\xbf{\xe9\xe9\x0d\xda\
-\x83~\xc7\x91\xc0\x00,!\xbd\x88@X@\xd6\xc0\x10\
-\xa7\xfa\x05\x11\xb0\x04O\x87\x84\xf9\xb2\xf3!\x9d\x19C\
-\x90,\xdf\x8a\xa6\xaep\x9fC\x0a\x13\x86!\x82\xe7\xd0\
-l\x19\xe5\x88H\x0be\xfc\x1e\xcc\x00\xfbJF\xc6\x96\
-\x91-\xca\x8d\x00&\x7f(\x11\x02\x00\xdd9T0\x9e\
-L\x11.\xbd(C\x1a2\x16(\x9b5\x7feLx\
-\x1c\xa1\xafQ\x12\xd1hWo\x8b\xbaW\x89Qe\x0a\
-\xc0\x18r\x22\x8bG\xc5U\xd7\xdc\x85?~\xeb\xc6U\
-KW\xad\xfb\xe7\xf3.z\xc9\xe9C\xe5a\x81\xf7Y\
-\xca\x11\x10B\xaa\xb2\x06\x10fx'\x10\x91\xb0P\x90\
-T7\xa0\x8e`\x0d\x85\x06W\x18\x22\xa4\xf5\x83\xc0\xcc\
-)\x8d\x192`\x09\xe9\x88\x190\xa6\xce}\x22\x0cA\
-@\xa0\xa2\x8e\xa0\xd6\xa7\x05\xed\xef\xbf\xaeAb#&\
-\x82\xc9.\xcf\x86\x85\xd7\x1e\x22\xfeDl\xf4\xca\x9a:\
-\x89QO\x9a\xd2\xe2\xc2\xc3\x00\xa6\x19\x9e3E\xac!\
-\x04c\xa9\xab\xe0(\x18\xe3]!*\x00\xe0\xc3o^\
-q\xfe\xea\x8d[\xbf\xf9\x9c\x97\xbe\xf2\xf4\x95\xcb{\xe2\
-zs\x04\x1dz\x99X\xcb4\xd7\x8bb,cHK\
-Bx\x9eY\x7f\xc3\xa1\xbe\x84Z\x93\xe3$\x8a\xe1\x11\
-\x16X\xef\x93\xbe.\xfe\x0dJQ\x1e\x9c\x80bA\xa2\
-l(\xf7\x18kzB)\xebx\xd896b\x0cL\
-t\xdd,l\x01\x14\x8a\xa2\x8c2\xb8\xc25\xa52\xc0\
-\x8a\xe8\x17A\xd6\x9f\xd8\x05\x10\xb8\xa6S\xa8{\xf7\xdf\
-\xa0\x13\xff\xee\x95\x1f\xb8\x0b\x1fy\xcb\xfa\x15\xd6\x96\xbf\
-\xb6\xf9\x9c\xe7]\xb9\xe3y\xe7\xae\x1a*\xa6\xa4\xea\xcc\
-\x11\x91\x09\x9e\xc9\x0c\xabN\x1b\xaeCB\x81\x15\xc9\x80\
-/\xe09\x1a\x88\xc0\xec!D\x9avjcIj\x8c\
-P\xf7`\xba\xe0\x22\x12\x0a\xb8\x09E>\xbaxJ\xc5\
-\xa0\x10!PC.\x82T\x1f\x97A\xfe\xfc=;\xf0\
-\xd3\xbfs;>\xf9\xee\xed\xcf\x05\xe8b\x00C\xf9\xa7\
-\x8e\x16e\xef\x0f\xee\xbfe\xed|w&xz\xd6_\
-D\x18k\xd5\xc1\x22\xd2J\x1dXD3\x9a*\x06,\
-\x16\x8dH@Cl\xf3\x8f\x7fm\xdb\xfbG\x8a\xa2\x0f\
-`L\x84\xcf[\xb2t\xd5\xf3\xb7\xbf\xe0%\xd8\xb0a\
-\x89\xf4\xe7\x1f\x16vB\xd1\x80FQ\x8f\xe8\xe7x\xcf\
-\xb0\x86@\x12\xea\xbb\xf7\xa2\xa9\x87`\x14\xd2E#\x19\
-2)\x0a\x84BJ\x8a\x8f\x8d\x16\xbb\x94\xee\xd4\x98\x22\
-\xa2\xf7M0\xa0\x08\xac5\xa9\xd6P\xacO\x82\x147\
-O\xd8 \xf33G7}\xfeC\x17}\xea\xa4S\xcf\
-z\xd1\xdaM[A\xb6\xa8WW\x04\xcd\xa2\x81m_\
-\xaa0\xd5>$\x85M\xcdi(\xecZ\xb4MQ\xf7\
-\x22\x03\xeb^\x00\xec\x95\xf5\xcdQ\xbcBc\xf6\x00\x8b\
-\xc8hst\xf4\xfc\x17_\xfa\xce\x91V\x13e\xb3\x85\
-\xa5\xcbWal\xa9\x91\xee\xf4n\xea\xce\x1e!\x12\x82\
-\x80\xd5#\xa5\xf6jf\x9dV\x12D8XG\xf3\xb9\
-\xe8\xef(s\x0a@\xc0\xde\x85\xda \x80\x03\xc0L`\
-\x18x\x01\xc4\x1b\x08\x04,V\x0dV\x82\xd9@\x88P\
-\xd8V\xfaR\x95\xab0Z\x1eF\xb3\xd1\xa8\xa3]\xf8\
-\x84\xca\xc0q\x0dr\xdd\xd5\xe7\xa0\xdf\x99m\xacX\xbf\
-\xf5\xa3\xcf\xb9\xf4\xb5/\xda\xb4m\x0b\xd8\xcf\x07\xd4\x91\
-\x8a\x19\xa3\xa0\x02\xabV.\xc3\xf4\xcc85V\x12\xd8\
-\x87\x5c$\x1a\x05F\xd1U\x1aXi*\x8a\x17\x1a\x07\
-X)\xe6\x14}Ag&\xe4\x84\x0ak\xb0|y\x85\
-\x15KK\x18\xcc\x032\x83\xf6\x84'H\x8c>\x07\x08\
-\xc3\xf9\x0a`\xd1kdx\xef\xe1\x05`6\xe8W\x80\
-c\x0b\xcf\x84\xca\x15\x10\xb1p\x0c\xd8r4\xc0a\xd3\
-\x82)F \xb0\xb0\xc50\x8cm\x80L\x01\xd3h\xc2\
-\x98\x06\xc86P\x96-\x90)\xd1\xb0\x0d\xd8\xa2\x01\xa0\
-\x04\x99\x12\x02\x83\xa2\x1c\x06\xc8\xc2\x16M\xdcs\xf7\x0f\
-\xc03\xbf\x8bU+W\xc2F0\x80\x133\xcaq\x0d\
-r\xd55w\xe2\xba_\x7f\xda\x9a\xd5\x1b6\xbfb\xfd\
-\xd6\x0d\xe8\xb4'\x84 TU\x15\x9cs\x08\x1d/\xa1\
-0\x16\xad\xb2\xc4\xd4\xcc4\xec\xea\x02\x9e\xabA~!\
-\xe7\xb62\xb8\x0b\xce\xd2\x14\x0d\xc2\x0c\xca\xde/}\x80\
-+\xc1\x81\xc33\x98\x9cb\x00\x16\xce\x13*W\xc23\
-\xe0\x5c\x01*\x86t\xd1F`\xecPZ\x5c[\x0c\x81\
-L\x81V\xab\x85r\xb4\x81\xa2(\xd1,\x1bh6[\
-(\xcb\x12EY\xc2\xb3v\xecd`\x8c\x0d\xe9\x05\xa1\
-v\x18k@ \x90\xd6\x98\x18\xfdD\x04\x22\x03f\x0f\
-clJK!U\x15(\xca\x06\x0e\x1d9\x8a\x91\xa1\
-\x06\x9a\xada}\x8d\xe8g\xff\x0bjH\xd1l=}\
-\xc9\xf2\xd5\xa8\x5c\x1f\xber47_\xe1\xc1\x87\xd6`\
-h\xf8d-R@aJ8w\x13\xa6\xa7n\x83%\
-\x0b\xa0\x02e\xb4\x88\x10\xa0\xb0?\x14:;H\x1e.\
-4V^\xf6H\xf3?a\x1d:\xcd7\xa01\xb6\x0c\
-\x8d\xb2\x81VQ$\xd0em\xc8\xf9\x94Q\x16\xcc\x1c\
-`h\x16z\xcc\x8c\xbe\x03*\xcf\x98\xef\xcc\xa7\x08\x0f\
-\x8bL\xa9\xbf\x08\xbdEN}HzM\xfe\x9c\xf7\x1e\
-EQ\x0c\xbc6~\xce\xd8\xe8\x08\x96\x9d\xff\x19\x1c\x98\
-l\xa3\x1c\xffC\xac_\xdeEY,\xc6\x9e=\xfe\x1a\
-B\x22\xc0\xe4d\x0f\x13\x13\x84N\xc7`xx\x19N\
-\xdb\xba\xb9\xe6\xbbL\x89M\xbb7\xe3\xce\xde\x0dXf\
-\x8ac\x06S\x03\xec\x8e\x12\x8eq\xbe.^\xeb\x8b\x84\
-\xfb\x92\x15\xf5\xc8T\xf8\x8a\xd1j\x8c`\xcb\xe6\x0dX\
-\xb6t\x05\x8a\xa2@Q\x14\xb0\xd6\xa2,K\x10\x11\xac\
-\xb5j\x043\xb0p\xa1o\xa0\xb4\xf8\xf1~\xdd\xdc\x85\
-B\x9c/\xfc\xc0\x97'J\x9e\x9d\xff\x5c\xf8\xde\xda\x09\
-\xcc\xc0\xfdCG\xa6q\xf7\xbe\x0a\xfd%\x1e\xe5\x02\xe3\
-=Q\x83\x08\xc0\xd8\xb7\x7f\x16\xcd\xa1\xf3Q4\x18\xfd\
-~\x17sss\xe9KZS\xa20-t{s \
-\xd8\xd4uG\x8fOH\xcaj}(2b\xb1\xac\xe1\
-\xa1\xd8\x10\x11\x11\x08\x04o\x0d\x85\xddH\x81n\xb7\x87\
-\xf9b\x1e\x8dF\x03\xc6\x18\x18c`\xadE\xab\xd5J\
-^\x9d{l\x5c\xbc|\xd1rO\x8f\x06\xf2\xdeg\xe9\
-\xa4\xfe\xfd\xc2\xcf\xc9\x8d\x11o\xde\xfb\x01c\xe7\x8f\x01\
-\xc0U\x15\xbc\xe7\x002XNh<[<\x96=\x9c\
-\xf3\xe0\xde<l\xd1\x83\x08\xa1\xd3\xe9\xa0\xddn\xd7\x1e\
-\x07\x03+%\xe6\xe7\xdb\xe8O\x1bt:\xd9\x18\x17\x19\
-\xa9\x88\xbaG\x8d\x80'F\x09e\x82\x86\x85\xcf\xb96\
-\xc1\xb0A\xa7\xd3F\xa3l\xa6/mm\xc8\xf7UU\
-\x0d\x18\x85\x88\x14~\x06/\xf5\xde\x1f\x93\x86r/\xce\
-\x7f\x9fGK\x1eiyD\x04\x88\xcb)*s\x03/\
-L\x7f\xcc\x0c\x81\xa0\xb0\xa4H\xebqD\xc8\xd7\xff\xe8\
-\xfcQ\x10\xad\x88e\xb5\xb0\xe4\xc7'\xabu\xae?\x8f\
-j\xee(z\xed\xdd0\xc6\xa2\xd3\xe9`\xfa\xa8\xcb\xb0\
-\xb9E\xe9{\xb0s\x1e\xe6P\x13\xb6\xdb\x80H\xcdz\
-\xe6<U\xb4\x921\x83\xbcU\xfc]\x8a\x22\xa9\x1b:\
-;g\xd1bBg~\x0a\x85m\xa2,\x1b\xb06,\
-zQ\x14p\xce\xa1\xd7\xebaxx\x18\x8dF#\xa5\
-\xa5\xa2(\xe0\xbd?\xa6\x16,f\x14\xc9:\xf0X\x1b\
-\x9cs\x03\x8b\x1e#`\xb1\xe8\x88\x86\xc8\xef+\x89\x12\
-\x98\xdf\x9a:\x19\xcc\xe3\xc73\xc8\xdf\x7f\xf4\x82+\x96\
-\x9d\xb4\xfd?\x8d\xad>\xe3,\x90)EX\x84\x05'\
-\x09\x0f\x8b\xe6\x11\x91#\x00\x11\xa4\xc9\xb0<\x97\x0a\xa9\
-\x08\xb0m\x8d\xc5\xc6\xe5oC)\x06\x5c\x86\x86\x832\
-\xa8\x94O\xf8\x08\x94\x1a6\xa2cSC\xfd\xc6`\x15\
-^*\xa8\xce\x02\x8a\xf6\xad\x98\x1b\xef\xc1\x8c\x9c\x8c\xc6\
-\xb2m(\x9a\xa3(\x8b*\x19\xa6\xaa*\x0c\x0f\x0f\xa3\
-\xd9l\xa6\x85\xb4\xca\xeb\xc7(X\x98\xeb\x17F@|\
-]\x5cl\xe7\xdc\x82\xf9\x90M\x8b\xbeX\x94\xe4\xc6*\
-\x8a\x02\xec\x19`\x81g\x86HL\x1b\x8f\xd1\x18~\xf3\
-\xbaW\xben\xedi\x17^w\xea\xb3^\x17\x98i\x11\
-P\x0cqa#\xc2\xb0\xd6\xc0;\x97:jk\x0c\xbc\
-\xaf\x14&\x86\x0b`\x08\x0a\x1a$\xe2\x06g\xb4\x02\x22\
-\x81g\xaf3\x84\x90\xbbb\x87\x1c\xa2M\xc0>>\x17\
-\x8c\xc7\xe2\x00\xae\x80b-\x9c\x03\x8e\xec\xbe\x11\xfb\xee\
-\xfb\x0b\xb4G\xceFs\xf5\x0bP\x16\x04k\x0d\x9a\xcd\
-\x90\xce\xba\xdd.\x8a\xa2\xc0\xd0\xd0P\xaa)\xd6\xda\x01\
-\xef^l\x11\x17\x1a%w\x92\xbc\x90\xe7\x91\xd6\xeb\xf5\
-\xd2k\xf3H\x8b\xc6\xf4\xde\xc3{I\x00\xc7\xa759\
-~\x94\x14\xb6\xb1\xe4}[\x9f\xfb\x06\xb2v\x9a\x99]\
-6|q\xe2\xbd'\x22\x01\x84`T<]\x13pU\
-\xf0`f\x18\x02z\x9d\x0e\x1a\xc3\xadpQ\xde\x01\xfa\
-<\xc0p\xae\x0aF\x12\x0f0\x83\x0c\xc1\xfb\xd0\xcc\x19\
-\xbd\xcf\xecP\xc4\x8eZ8\xfc$\x01;\x07\x11Fi\
-w\xa2\x84\xc1)g<\x0b\x1b\xb7]\x8c\x07n\xfc4\
-\xf6?\xf8\x09\x14']\x86\xb2\xb5\x14UU\xa1\xd1h\
-\xa0\xd7\xeb\xa1(\x0a\xcc\xcf\xcf\xa3,\xcb\x84\xc4\x16\xd6\
-\x16\xc9\x9a\xdb\xe8\xed\xce\xb9\x81z\x12\x0d\x97\xd7\x84h\
-\xa8<\x92\xf2(\x8f\x867\xc6`br\x16\xb3s]\
-LMW\xe8w\x0b\x8c\x96}}\xed\xa3\xc0^2\xe5\
-\xc6\xb2\xd9\xf0\xbdN\x9f\xac\xb5\x10f\xb00\x0c\x19X\
-\xc3\x83sf\x9d\x07xf\x18}md;\xad\xb5`\
-\xcf\xe9\xa2!\x80\xd7\xeaMd\xc3g\xc2\x82L\xf0\x1e\
-2\x04\x22\x0b\xcfa\x11H\x0a\x08X7\xf3P]\x5c\
-\xc8@<\xa3\x02`\xe0\xd0\x1d\xbf\x01\xc6\x0c\xe3\xac\xf3\
-/\xc1\xca\x8d\x07q\xef\xcd\xff\x13\xf3\xad\xed\xb0KN\
-E\xb3\xaa\x12\x1c\xb6\xd6\xa2\xaa\xaa\x01\xf4\x14\x170G\
-N\xcc<\x80\xa2\xd2\xf5/\x88\xa4\xf8|\x1e!\x8b\xbd\
-67\xd0\xf8\xc4,&&\xe71T:\x0c5\x0c\xfa\
-e\x1b\x9e\x19\xf4(Y\xab\xf0UwO\xd5\x9b\xd9\x04\
-\x12\x0e\xde\x13\xe6\xa8\xac\xa3N\xf6\x1e&\xb2\x83q.\
-N\x14\x22\x85\xf4\xa2b\xe7*\x0c2\x80w\x8c\xa2 \
-x\xa7\xe4\x9b\xb6\xe5\xe1B9Q\xdd m\xfc,\xa5\
-\xd1j\xa0\xc9%9F\xd0=h:d\x01\x99\x12\xcc\
-=t\x0e\x7f\x03c\xa3\xa7b\xc7\x05\xaf\xc3\xdd7~\
-\x19G\xf6>\x80\xde\xea\x17\xa1QZ\x14\x85\x85\xb5\x16\
-EQ$D\x96\xa7\x93<\xfd,\xaca\xb9\xd7\xe7\x85\
-:O[\x8b\x01\x85\xdc8\xf1\xf9^\xbf\x87\xca1\x9c\
-c\xf4H\xe0<?vc\xc8\xde\x7fo~\xf2\xe0i\
-CK\x87\xfb I\x0c&\x91A\xd5\xefE\xc2\x00\xc6\
-\x00\xce\xfb\xb0<\x91\xdeV\xb4#\xc2\xa8\xaa\x0aE\xab\
-TCI\xe0\xb4t8\xe3|\xe0\x96\x08\xa2\x9a\xddD\
-h+\x1a\xe3T\xe0\x03\xef\xa3^+\xb9cH\xfd\x19\
-\x04\x08\x13\xaa\xd9\x07`\xedA\x9cw\xc9[q\xef\x8d\
-\x7f\x8d\xfb\xef\xfe\x22zk.EQ4P\x96\xc5\x00\
-<\x8eFYl\x91\x17\xa2\xa3\xe8\xed\x0b#$7@\
-\x0e\x97#\x22;Fo0\xdfF\xa7\xe3\xd0\xeb9\x00\
-\x16\xbd\xbeOT\xfcq\x0d\xe2\xbc\xbbmnr\xef\xe5\
-#\xcb\xb7\x01\xe2SJ\x8a\x8bn\x8a\x98+%\xcd1\
-D\x04\xd6\x18\x10\x04\xdeyXK\xb0\x96\xe0\x9d\x0f\x93\
-9K!\xb2L\x88\xa4 \xb86\xca\xa6VuzH\
-\x8b\x1e\x07:\xe1b\xbd\xce2\x9cg\x18\xa3\x05>\xc3\
-\xcf\xf1\x1a\x01\x80\xfd4:{\xff\x02g\x9c\xfbr\x8c\
-,]\x85{o\xfd\x1a\xe6\xe94t\x9b'\xc1\x14-\
-\xd8\xa2\x05c\x0b\x05\x0dF\xd3\xb1.\xb2\x0e\x9a\x8c\x09\
-\xd3\xbf\x1a9J\xed\x1c\xb1\xb0/\x06\x9d\xf5\xf98\x06\
-\x8e\x906\xa6\xf9N\xa7\x83^\xdf\xa3\xdd\xf5`\xe6`\
-\x90 \x8e\xf0\x8b\x19\xe3\xfa\x0f?\x1f\xf4\xd5\x8f\xbc\xe4\
-\x82-\xe7^\xf6\x8fg\x9c\x7fi\xa7\xea\xcfQ\x86\x08\
-\x85\xbd\xb3\x007\xc2\x88\xd3\x07D\xc5\x0c\x93P\x10B\
-\xde\x17\x8f\xaa\xaaP\x16\x16F\x04\x8c\xc8\x85\xb0\x16\xc8\
-\x00\x06\x00\x86\xb0O\x0b\xcf\xeca \xf0\xde)2\xd3\
-\xf7 \x18\xd1;\x1fx|Mu\x86\x00\xf6.\xfcT\
-\xa71\x10\x88\xf7 \xe3\xd1X\xfel\xf4\xaa\x16\x8e\xee\
-\xdb\x8d\x83\xfb\x1e\xc4\xccL\x173sm\x08JM\xab\
-\xb4\x80\xd2\xa9\xa1\xfbb(*\x16O\x8e\x86Z\xc4\xb3\
-\x07S\x18\xc2\xb8X\x1fw:}\xcc\x1d\xbe\x11\xcb\xc7\
-Bs8\xb6r-\xa4\xd3A{r\xdf\xfb\xac\xc1\xc3\
-\xdavL\x8b\xf0\xcd\xaf\x7f\xefC\xf7\x03@\xd1\x99=\
-r\x7f{\xfa\x90\x08\xb3\xfa`X\x18\x16\x09Z5f\
-0\x85\x81\xbfw.,&\xe9\xe2\xc51i\x1c\xde0\
-\x83),\xb45\x14 \x9fBY\xe8\xc2[\x13f\xcd\
-!5\x85!\x90\xb1&\x18*j\xa2\x80\x14Y.K\
-U^8\xa5\xbc\x08\x8dE\x18\x1e\x0c\xc3\x84\xce\xd1\xef\
-\x82\xec\x10V\xafZ\x86\xb5\xa7\x5c\x08O\xcb\xe1\xb9D\
-\xaf=U\x7f~\x8c6E\x88\xb6\x08\xbd\x84\xe8\x80\x09\
-T/l\xa2\x0b\x06\xbas\x0ff\xa9I\xcd\x0c4H\
->\x16\x16V\x86\xf8\x8a\xf0]\x8d\xa2<\xcf\x00\xe8\x9d\
-\xd6Z\x11\x00\xfd\xf9\xc9\xfe#w\x7f\xfd\xc8\x17\xdf\xff\
-\xad\xebD\xf0\xc1\xc2\xf5\xdam\xd7\xeb?P\xf5\xda\x9b\
-\x8a\x928r\xf6\xd6\x10\x5c\xe52m\x92\xa6\x22\x8e\x8a\
-\x8b\xf0GES\x88s\x0eb\x0d,\xc5\x82\x5c{ \
-\xeb\x1c7\xa4\x06VtVO\xdd\x84=\xc8\x00\xaer\
-A\xe9(\x02v\x8c\xa2\x10\x90\x11\x88\x97\x84\xdf\x99\x83\
-a\x89\x00\xf1!\xea\x08H\xe8E\xdc<|o\x06\xb6\
-\xfdp\x8a\xca\xe1\x91\x0d\x801I\xf0\xc0\xde\xa7\xef\xe0\
-\xab\x00\xb3\x8d%\xc0G\xd4\xc8i\xc6\xcc\xcc \xa5\xd7\
-}\x15\xa2\xd5\x1a\x03_\xd5\xd3\xc2\xc8,\x07Q\x04\x14\
-\xcasR\xaeT\xde\x83@(#{@\x14\xf4(\x04\
-\x1a\x19\xdeP\xae~\xc9\x9b\xd7\x0f\x8f\xae\xfb\xc0\xc3;\
-\xff\xf6\xae\xc2\x8b\xaf\xba\x9d\xe9\xfb:\xf3\xb3\x9b\x87\xc7\
-F4B\xd4\xa2\xda\xf4\x91\xca18\x16\xf4\xa0X\x0a\
-\x14\x87\xca_\xac1\xb0\xca(\x06\x0c\xefuO\xbaO\
-\xa9\xcdU\xa1\xdeD\xa1\x1a\xa16\xa8xI5\x07\xfa\
-%\xbd\xcf\x0c+H\x91f\x14\xc2\x16:\xb3\x0f@\xa4\
-6X\xf8\x1c\x81\xd7\xc9\xa1\x9f\xde\xad\x03\x18N\x8b-\
-:\xc0\xb2\x14\xfa\xa3\xa8L\x81\x1a$\xd4\x0fNc\x86\
-\x90\x82Q\xa7\xe0\x05\xe2\xde4C\x97\xc5u\xa6\x04\xa0\
-\xd2\xf4g(\xcc\xe1\xc3\x98z'\x99C\xdf\xc4\xc9\xa7\
-\xbe\xc2\xef\xbdo\xf4\x8d\x85\xafz\xfd\xb9\xc9\xfd\xf7\xf9\
-\xca]\x02\x11'*&\x0aa\x1c\x0c\x13\x91O\x9e7\
-9\xc7\xd3\xca\xd3x\xefk\xd4\x94I\x00S\xd4Y\x13\
-\x9a/}\x8d\xa5\x9c\xaa\x97\x84\xaeb\xcd\x08M\x96\xca\
-xb\xddJ\xc8\x82\xc1\xe97\x9cf\xd9\x84\xc0\x06D\
-\x11\x85\x08C\x88\x00\x8e\x7f\xcc\xe8\xc2\x07bT\x00x\
-&X\x15v\x87O\x8d\xa9\x8b\xd2\xb50\x9b0'g\
-\x0f\xcf!\x83D\xa3\xe4\xb3\xf5Z;@\x9a\x1dDE\
-\x1f5;\xc1J!\xc1\x84\xf4_\xf5\xba\x90\xb9C\x04\
-\x91\xca\xfc\xd45\xfb\xdc\xe4\x81\xbb\xef\xeb\xce\xcfRU\
-yb]\x04\xa3\x13%I\x8b\x8c\xd4\xd5\x12\x02\x02b\
-\x11TU\x05\x88\xc0UNkK=\xdb\xa6\x04+E\
-\xa9\x83\xf0\xd9\xac\x1a)\x80\xe1\xfa.\xc1^Vz%\
-}1\x09\xd5\x22\xd1\xd7\xda\xc9\xb3Jn\xd8qJ\x8b\
-\xce\x05\xa3W\xce\xeb\xd8\x5c\x9bT\x89\x80\x22@g\xd6\
-k\xf2>\x18*j\xa6|\x06\x85+\x1f\x1ab\xaf\x7f\
-+%L\xe1\xe0\x96Dp\x1c\xc0\x8b\x97\xd8O)\x94\
-\x8f\x12\xa3X\xe9\xd2\xfe\xca\xe0!N\xe9xP$$\
-\x05\xa6hbf\xe2\x80qUu\x93\x01\x80n{z\
-_gnz\xb6\xb4&\xc1J\xe7|*T\x95\xf7\xa1\
-\x18\x9a\xda(\x86B\xee\xb7\xd6\xc0qHE\xde\xbb\x90\
-K=\xc3{\x9di+\x07\x16R\x86\x82\x00\x0a\xf2\x9b\
-\xca1\x82\xb80\x14~\x82\xc0U>\xd1*D\x0a\x8b\
-=\xa7\xebb\x0e\xd1\x19\x94#\xa1\x18\xb3 \xa9\x15r\
-]U\x82\xaa\x82\xe4(\xc2\x81\xbe\x09\xb3\x16\x0f!N\
-)\xc59\x17\xc0\x846\xb7P\xe9\x90\xf7\x9c\xd4+\xe2\
-\xb5'b\x15a\x84\xd6\x0c\xceK\x12\xd5\xf1\x02\xcd\x16\
-\xeb\xef*\x97\xf75\xe1sE\x00S.G{\xbe\x87\
-\xaa\xdf\x09\x06a\xee\xef\x9f>\xbao\x8a\xa3\x07\xb3\x0f\
-\x17\xe5\x03\x04%\x85\x96\xde\xf9z\x7fy\x92\x8a\xfa`\
-\x00\xf54\xe7*\xf5PI\xe4\xa6s>\xa1*\xe6\xa0\
-\xfc\x08}J\x88\xac\x98\xbf\xe3\xc2[S7o\xde+\
-\xdceA\xbfr\xaa\x06dM#\x92\xc4\x0c\x94\xf1j\
-\x22\xb1F0\xbc\xa6@V'\x11!x\x0e\xd7\x1b\xa9\
-q\x03\x19\x80\xc3\xde)D\x0f\xee\x95z\x93XC\xa0\
-\x8e\x01\x05&\xa1/CZ`\x08\xa9\xe3H\x96\xd68\
-1\xd8\xa4\x12\xd6([\x12X\xcc\xcf\x8e\xbb\xb9\xe9\x83\
-\xf7\x19\x00\xa8z\xdd\x03\x93\x07\xee\x9e\x82\x1d\x82s\xda\
-\xbc(\x82\x11\xed\xb8\xbd\xd4\xcd\xa2p]\xe0$Q*\
-\xaa\x91\x0d\xa2(\x85\x87\xaad\xd0\xd0\x8f\x8fE/\xce\
-U\x01\xdd\xc4h\x8a\xcd\x9aW\xea&\xa6\x1d\xe7}r\
-\x92\x84\xdc\xe2uy\xd64W\x03\x84\x81\xe6\x91s\x81\
-\x9a$G\x89\xd7\xe3\x1c\xc3\xf9Z:\xe4\xa5\xdeF\x10\
-\xe6\xa5\x12`@6\xef\x17\xd5\x96\x89\xaa\xf59\xab\x1b\
-,I\x82\x15P\x9a\xd4b\x8e\xc8\xae8f8\x16x\
-\x15\xd9U\x1e\x86i\xe4^\xd7\xeb\xf6\x0a\x00x\xcb\xb5\
-\xfd\xfd\x9f^s\xeb\xa4\xb1K\x00\x99\x86\x81\x0d\x1f\xaa\
-\x92\x1af\x0a!Hu\xf8\x83\x19B\xc1\x9b\x859\xd4\
-\x8b$\x18C\x9d\x97\x85Q\xd8zz\x16El\xc1\x9b\
-\x04F\xaf84\x9f\x91\xf3\x0a\x8c\x01\x83\xb3B\x1eR\
-\x03\xebg\x86Q\x80z\xb6FJDh\xac\x8c\xb1\xd5\
-f\xd3@tKA\x88\x06\xaf\xd1\x1a\xa2\xb1\xa6E(\
-7\x9a\x02\x11\xe7\xc2\xe7\x18\x02\x9c\x93\x94\x1d\x22\xbcM\
-\x97\xa6\xe9\x0d\x11\xf6r\x1d=\x10\xc0\x80T\x09Y\x93\
-\x90P\xb8\xeez\x1d\xd3\x99\x9b\xbd\x8f\xbd\xeb\x9bO\xbd\
-\xfb\x0c\x00\xc0\xf4\xd1\x87\xf7\xb4g&$\xd5\x09\xef!\
->F\x82\x16s\x89=\x88v\xad\xc2A~\xa9\x88\x8c\
-\xf5w\xde\xfb\xb48@$\xd5bJ\x0bs\x02c\x83\
-j0\x86rl\x16=\xfb\x80\xabD\xe0\x1c\xabS\x04\
-\x03z\xe7\x93\xca\x90\xbdW\x0fc}\xaf\xa4\xc2\x0e\x85\
-\xaf\xecY\xebY\x80\xb5\xec4\xca\xd5q\xf2.=\x22\
-\xa2P\xf8C\xeaqY\xbat\x9e\x13\x22\x0c\x05\x9c\xb4\
-\x0eH\x8a\x90\x18Ea\xdfH\xd4\x04#9MD\x82\
-\x9cj\xa1\x00B\x22\x8dS\xcc\xd4\x91\xdd?\xe8w\xe7\
-\xfb\xe6\x8d\xef\xbfO?\xcc\xdf>\xbe\x7f\x97fM\xf5\
-T\x22\xb8L\x04\x10\x06.^9+I\x1dl\xf40\
-\xf6\xbe~\x8c\xda\xcbb\xb4p\xce\x8e:\x9f\x10NL\
-\x1f!\x9f\xd7\x85\x97h\xf0\xf3=\xd7\x8b\x09\xa2\x814\
-\x18k\x8f\xf3>\xb6\x90!R\xb2\xcd5\x10\xd1\xe2[\
-sf\x95\xf3al \x11\xfd\x88\xea\x91%\xf5 5\
-\xf1\x19\x163\x22(\xcf\x92\xb5\x01yK \x9azu\
-\xd8\x167\xf4P\x9d\xde\x84\xa0\x0e%\xd4\xaf\x9c\x9f8\
-p\xff\x03o\xfb\xd3\xaeO\xcc\x95s\xfd;\x0e\xed\xbe\
-U\x0a\xdb\x0c\x1d0I\x22\x08\xa3\x17G\xda!^,\
-G\xee&\xd6\x97\xbc\xae\xa4/\x12\xd2\x07k\x1d\x88S\
-\xb3\xb8\x98\xa2\x9cTX\xac`\xf0\xda\xa0\x92\xd4\xe4H\
-,\xaf\xa4\x1a\xe5\x9dKu$y\xa1W\xafe\xa4\xe8\
-\x12\x8d@\xca\x06l\x89\xe1E\xed\x0c\xa4\xf0U\x124\
-\x0ey\xde{>V\xb5\xa2\xdf\xcf\xa9\x93\xe4\xe4#\x0b\
-\x90\xfc${\xde{\xa9\xc7\xeaZz\x89\x80\x9e\x1f\x9a\
-\xea\xb5\xa7\x1e\x19\xd8\x8e\xd0\x9b\xafn?\xb8\xebf\xd8\
-\xd6J\x09\xc5[\x91\x8a\x0b\x84\x9f\xd3\xc9]\x5c\xf8X\
-\xb4\xc3\x171\xd9P_\x9b3M[\xac\x98\xbe^0\
-\xafP5x~,\xde\x01ZJ\x92\xff\xc7\xd9\x84\xd7\
-\xbf\x13S\xa2g\xae\xf9\xb1\x08E%\xb0\xce\x81\xc9\x8d\
-\xf0\xd8\xd7T\x8b\x8b\xd1\x11\xae\xc59\x0eP\x94c\xff\
-\x11\xd3\x8f\x07(\x00\x18\xefC\xf7OZ\x91c\x9f\xd1\
-\xafbO\xc3\x11\xaf\x809\xd4\x02\xc5\x10j\x14\xd2u\
-\x0a\xff\x9c\x0b\x11\x15\x224\x18'\xdc7\x98:r`\
-\xcaW\xd5\xfe\x01\x83\xfc\xfa_\xe2\xc8\xd1}w\xcd\xfb\
-\xaa\xa2H\xbf\x93\xc2\xb9Z\xa2\x15\x10R\xec7\xbcw\
-Z_|2\x840\xa7\xc2\x1b;m\xd6\xb4W\xf3Q\
-\x1c\xfep,\x90Y\x04\x04\xe4\xe3\xb2\x99E\xfc\x82\x0a\
-[\x15\x19\x05\xf5g\xcd\x10\x88\x1a\xdc\xf9z\x9f\x87\xf3\
-\x5c;\x11Kbn#\xa3\x11\x1aNRJH#\xcb\
-s\x00\x0f\xe2!Bi\xb1cS\x17\xf9\xb7\x80\xa8$\
-mi\xa0\x88\xdc\x92&\x80\x95\xfa\x89\x99%\xeeW\xa9\
-\xfb\x0f\x82Gk\xd5v\x1c|\xe8\x96\x89\xce<\xf6%\
-\x83\xfc\xc9\xdbO\x8ai\xeb\xa6\xa9\xc3{\x8b\xc8\x059\
-\xef\x13\xcf\xcf\xda\x1cF\xda;\xccH\xeam^\xec3\
-h\x9b\xc9]Xk\x07g\xf9?\x92\x91\xber*$\
-\xe3\x01\x10P\xa3\x93\x8c\xc6\x8f\xf81Bl\xcf\x09L\
-\x90\xf6+id\x8c\xc8\x15\xd5}\x80\xd7k\x16\xef\xc0\
-\xbe\x82\x88\x83p\x05\x88\x83w.8\x19q2b\xf8\
-|IL\x81\xf7\xf5\x0e]\x96\x08\x9b\xeb\x83<YH\
-\xa1.\xc1{\xc0{\xa4fM\x84\x12\x9cO\x85?n\
-\xb1+\x97\xca\xc1\xddw\x8c\xff\xd6\x970\x93\x0c\xf2\xf3\
-\x7fx@\xb7/\xfb\xef\x1e\xddwOA\xca\x5c\xdad\
-\x18\x17w\xcc\xd5\x5c\x12\xb2!N|\xac\xf3\x8c\xaa\xef\
-\x02~O\xf5\xc2\xa7\xe8\xa2\xa8i\xd2\x96\x9d\x90i\xa2\
-\x98\x03\x12\x8a\xf0\x95\xc3\x029-\xbc E[\x9eu\
-S\x8dA\x885J\xb49\xb3\x03\xfb>\xd8u\xc1\xbe\
-\x07vm\xb8\xfe<\x9c\xeb@\xb8\x07\xef\xfa`\xa9\xeb\
-Y\xa4\xde\xd3~\x0f\xaa\xf9\xa7\x04 \x22\x02\xd3Hv\
-N\xa3 \xd6REr\xceG\x16{p\xb7\x95d\x8d\
-\xa4d[9X\x04smA\xbf=\xbd\x13\x00\xae\xfd\
-\xa5\xf5\x83\xcaE/\xf2\x9dC{\xee\xc2\xa6m\xe7\x8a\
-\xabf4\xefV(\x0a\x03W9x\x98\xfa\x14\x00\xe1\
-\xf4\xa1N'\x8aaFB\xb0e\x84\x13\x9c\x8d\xe2E\
-\xa1\x9f\xd7/\x1f\xde\x13(\xf7`\xd2@\x87P\xda\x8c\
-\x09\xd8p\xde\x09\x11\x8c\x04\x12\x11\x86A\x5c\xa1_\xf5\
-@\x88\x8b\xef \xec\xd2\x10+v\xf8V7\xe7D\xe4\
-\xc4q\x03\x8e\xc2\xf0\xb8'DX\xc2\xfe\x8fHd*\
-\xc5\xe3\xd3hW\x8b\xbf\xd4L\xb5\xd3M@\xec\xa3\xec\
-)\x0c\xa1b\xfa\x22\x1a,\xea\xcc\x02\xb2\x04\xe7\x83>\
- |\xae\xc5\xd1\x83\xfb\xc59\xbe\x15\x00~\xf6\xf7\xf7\
-\x0f\x1aD\xbc\xff\xde\xf8\xfe{aM\x93D\x02v0\
-D`\xafj\xf2X\x1f\xb2\xe1P\x8c\x9a8\xb81\x85\
-h\xc1\xe4z\xcfA\xe4\xa5`\xc0\xb0\xb0d\xf5xW\
-\xdd\x08\x07\x00\x00\x0b\xc8IDAT\x8d\xb0\xd0\x81\x93\
-\xea\x03\xa6\x02\xd4{\x85\x1d\x08\x15\x5c\xd5\x85\x11\x0f\xef\
-\xfb\xe1u\xbe\xd2\x94\x22i\xac\x1c\x1b2\x02\x05F!\
-\xf3x2\xa2\x059B\xec(\x96\x03\xe0d`rX\
-+\xf15BT\xc0\x116u\xea\xcc%\x12\x88Q\x99\
-O\x81\x8a\x11\x0e\x1f\x97N\x1f\xc9\xd0\x94\xcb\x8ce\xb2\
-Ft\xc9\xca\xcd\xb2\xf7;\xdf\x87\xabp\xdb1R\xd2\
-?\xfa\xb9\x95x\xdb\xc7\xc6g\xff\xfc\xb7f\xf6v\xda\
-Sk8\xc0\xa4\xc0e\x19\xed\x0d2\x9a\xdd\xa6]I\
-\xac\x03\x7f\x84\x0e\x9b\x0d\x8c)\x81\x22\xec\xcf&\xdd\xbd\
-I \xb0\xeb\xc0\xb8y\x88\xef\x82]\x1b\xcc]\xf4{\
-m\x14\xe4U\x08\xe1\xea\xd4\xc7A*\xe4\xbcO\xc8\x83\
-(\x8a\x96\xb3\xcd\xfb\x09\x99IbQ\xe3l\xdc\xb3\xe4\
-\xbc+\x22\x16\xa4l~\xe1\xa3\xb3e,\x03\xa7.\xbb\
->[\xcai\x0dY\xb8\x7f06\x15\xe9z\xb0@\x9b\
-\xec\x04\xd6\x22\xf1{1\x05\x920\x9a#ki\xdf\x83\
-\x9f\xf1\xbf\xf5E\xdc{\x8cA\xde\xf6\xb1q\x85s\xee\
-\xd6\xe9\xf1\x83/\x1f\x19\x1d\xf3\xc1\x93j\xe56gR\
-\x1a2\x16\x96\x9a \xd3Di\x0ax1(M\x09\x03\
-\xc0\xbb9\xb8\xde$\xd8M\xc3W3p\xd5\x1c|\x7f\
->\x88\x17lV7\xbc\xc0XA\x9f\x91X\xd6H\x99\
-\xc7\xd4\xe29}{P\xdc<\x19\xb7\xab\x19\xc9\x16\x9f\
-\xd3k\x221Z\x1b'\xd2\x22\xba\x0dZ\x17'\x88(\
-0 P\xf0ZG\xd2\x08 \xa3?\x068+FX\
-\x1b\x19\x14\xca\xb1\xf2b6n\xfa\xd1Q\xb6\xd1#D\
-Xw}\x81\x08\xb3\xb3m\xdb\xef\xcc\xdf\x0c\x00\xbf\xf7\
-\xe61\xbc\xe3\xe33\xc7\xaa\xdf\xfb\xdd\xf9\xdb\xda3\x93\
-?\xbeb\xcd\xc64\xe3\x00\x05.FP\x0f[D\x1c\
-\xaa\xde\x0c\xfa\xed\x03`7\x07\xf6\xf3\xa8z3\x00\xf7\
-u\xa7kT\x88(\x87\x13\xd3\x82g8\xd1RL\xf5\
-\x1c#R\x14\xb1\xf8Y\xe5\x83\xb4\xfb\x0c\xbdG\x82\xd6\
-\x8a\xb4\x22\xb7$\x9c\x1d5\x14\xa1o>4\xaa\xd1\x1b\
-\x89\xc0IM\xd5s\x8a\x14\xf5d\x9ds(\xf1\xa1\xef\
-\xa9\xe7\xe5IFD\x04f\xd2\x8e?\x1c)\x12SZ\
-\xe8k4*8\xce\xd85E\xfb\xc8y\x11&'\xa6\
-\x0b\x16\xfe6\x00\xbc\xe3\xe33\x8boG\x98\x9d<t\
-\xcb\xdc\xd4Q\xb0\xeb\xa3\xd7\x19\x0f\xe9\x85\xbb`\xdf\x01\
-\xbb.\xbc\xef\x01\xdc\x85\xab\xfa\xd9NSI\xcd\x1c\xc1\
-\xe8\xf6\xe0\x90\x17\x8c\xe6X \xd3\xfc\x8a\xc0\xb1\x84\x8d\
-\x9d\x91~ \x198\x95&4i\x18\x10[\xd0\x802\
-D\xd3\x8a\x97\x81Y\x88\xa4E\x885`p\xb4\xcb^\
-\xe9\xfd\xa8\x8e\xa1l\xdb2\xd7\x22\x85(\xfc\x16\xcee\
-\xa2\xba+Lw2\xa5\xa1\x9a\xd4Ln>\x83!\xcd\
-{Q\xb5\xc2\x91\xda\xf2\x82\xe6\xc8\x18\x8e\xecz\x80\xd8\
-\x07\x83\x1cw\x7f\xc8\xf4\xc4\xcc\xee\xa9\xc3w\xf7&\x0e\
-Zr\xfdN \x13-%^\x8a\x92\xa7\xd8\x04\x0d\xc9\
-\x98\xd4OD\xf1\x98\x8dTz&\xc3\x8f'(\xc4E\
-\xf2.,|<\xc2)\xb2\xc4\xf96d\x11\x0e\x9b3\
-\x8d\x01{\x9f\x86[\x85\xa5\x04$\x88\x10\x18]]\xa4\
-\xd0m\xeb\xe2F\xa1\x1fI\x1a\x9fJ\xa4Z\xe2\x16\xb1\
-\xb8m\x00\x01\xc0\x08\xd5'\xe1\x18S\x0f\x94\xe2\x84/\
-M\xfb$\x1e4\x13\x8c\x92Rk\xd0K$\xa3\x85\x1d\
-\x00!*b\x83Z\xb6\xc6px\xdf\xcd`\xe1\x7fz\
-\xd4\x93\x1c\xbc\xc3t\xb7\xd3\xdd\xdb\xefu\x838\x9a\xea\
-\x0f\x01\xd7\x0cl\xc0\xf0\x81\xae`\xa7\xb0WtV\xa2\
-\x22\x01V\xfa$\xaa5DABT\x9d\x08{\x94\xb6\
-\x16\xdfI\x9a}(\xf3\xeb<\x5c\x15\x99[\x9f\x1aF\
-\xa3*\xfa\xb4+I\x1b\xb5\xd8 \xf6\xfb\x9c\xe69a\
-8\xe6\x95\xb1\xcdg\x22\x83\x14Kx\xaf\xd3\xfe\x08i\
-\xce\xc3ZkXgB\x9c\x89\xe9\x9c\xaa\xdb5\xb9\xa5\
-\xe7\xbd\x1f\x14\xcdy\xf6a\xfe\x119:\x08\xba\xdd\xae\
-\xed\xcc\xcf\x1cz\xf7\xa7\xdd\xc4\x07\xde\xd88~\x84x\
-\x87\xd9\xf9\xa9#\x8fx\xd7\xdf`m\x98\x9e\x19\xabE\
-\xd7RZ\x94X'\x122q\x92\x9d W\x0b\x16\x02\
-\x04\x0d_*B\xc6\xb4\x97<I6\xf3\xee\xba\x96\x9a\
-\xc5\xc5\x0f\xe9I\x12RA\x9c]d\xb4KL\x83D\
-\xd9\x0e\xae\xac>D\xda\x82}\x14\xeeEX\x1c\x99`\
-(\x8dRo=K\xc5:\xe3\xd7\xe2\xe9\x0e\xa1\xe6\x0c\
-\xd6\x96\x00$\xf4\x80\x00\xcd\x9f\x94d)\xd9\xee1\x02\
-\xdas\x1d+b\xbe\x0f\x00\xef\xfaT\xff\xf8\x06\xe9\xb4\
-1st\xff\x83{\x81\x8b\xc9\xbbv\x1a\xc4\x88H\xad\
-E\xca\x90N\xa0Mj\xd8\x19\xf6\x8f\xd4j\x14\xef\x05\
-\xb6@\xa2\xd6cgK\xa49X\xe7\x0f&\xeb\x94\xe3\
-\xf4\x11J7\xc4\xbf(\x22\x03R\xd0h\x8c\x98\xc6\xd2\
-\xf1\x16\xa8\xcf\xc5\xaa\x15!9\x1b[\x03\x80\x08k\xe3\
-w2\xa0\x1a\x9a\x1aJ\x5c[\xecu|2z-G\
-5\xa0\xa4A\x8e\xc2\x0c\x12\x82\x97\x08$\x00Q\xee\x8b\
-\x04 2\x98\x9d\x99\xb6\xfd^\xe7\x96\xc7<|\xe6#\
-\xff\x88\xfe\xe1\xbd\x87\xf7x_\x85?BA\xf0\x10\xc3\
-<g_%\xd2\x9dZ \x83d5BDN\x94\xb7\
-\xab2\xc1NR1r\xea\xdc%\xb2\xb8qs\xbd\xe6\
-\xfeHp\x86:\x22\x03\xa7\xbb\x85a\x16\xeb\xe9>Z\
-\xf0y\xf0\x102f$\x08\x9b\xe6\xdd\x1a\x1d>\x1b!\
-\xf4+N\x07\x1e\xc4c\x96X\xa2\x10CR\xcc\xb0\xd4\
-B,I\xe4eLB\xfa\x5c\xa6\x05H]z\xd6/\
-\xb1\x08\xc8Xt\xda=\xccMO~\xff\x84N\x03\xf2\
-\x15vM\x1f=\xd2M\xccmD*\xde\x07\xea:\xb2\
-\xb9\xce\xc19\x0f\xe7\x1d\xc4\x87\xbe\x82}h\xf2\xc2\x5c\
-\x82\xeb\x09\xa3R\xf9\x02\x1eP\x9d{\xce\x06T\xde'\
-\x01B\xe58\xf3\xf6\x00m\xa3\x138\x17ry\xda%\
-A!?{\xaf\xc3&_w\xe0Ip\xa1F\xe7\xb4\
-\xcd!\xceL\x82\xb73(\x1d\x94\x13\xff~\xa4}\xbc\
-g\xf4\xab|\xd6Q\xf7c\x02%\x13\xf5\xf5\xe9\x88@\
-\x13U\x9e\x01\xbe\xfbl\xf3\x94\xf7\x8c\xf9\xd9\xe9\xde\xcc\
-d\xb5\xfb}\x97\xd3c\xef\xc2e\xc1\x83\x93\x87\xf7w\
-\x97\xad:\xb3%\xda\xa8\xb1\xaa\x07\x15\x8e\xc0\xa3\xee\x98\
-C\x06\xf0\xb5\x220\xf3L\x91\xa0\x9f\xa2\x98\xf68W\
-\xfe\xa9H\x01\xd9\xf1ER\x17gc\x91ik\xa3\x01\
-\xc2H@\x84\xd3\xe2\xa4\xe3\x96P\x93\x82\x06ud\xd8\
-t\xfa\x82Jr\xe2\x19\x9b:\x8b\xafSZ\xcdA\x15\
-jm\xd1\xf7\xc5\xef\x1e\xa2.k\x06A\x89^\xcf\xd5\
-\x8c\xb5\xb6 \xd6\xc28\x1b\x11\x08;\xaa*\xffP\x10\
-Z\xcbcG\x08;<x\xf8\x91\x07:\xc66t.\
-\x10<=\x92\x88\x11\x02\xe7\x83,\xe7\xe2\x86\x1b\xa3\x92\
-JI\xe7H\x05\xbdn \xfb\x0c\x05\x1e(.\xbcM\
-z\xc2\xd4\xff\xa5\xa6.\xc2DQ$\xe44My\xae\
-{\x86 \xd6s*l\xc0\xc0\xf9U\x82P\xcf\xe2a\
-bi\xc3LDBi.\x12\x17\xb6\xeeC\xe3ip\
-\xc2\xb5\xbe\xcaK\x8d\xa4\x22\x85\x1e?\x93Euf\xc8\
-z+!\xf8,j\xe2'33\xcdM\x8d\xef\x11\xc6\
-\xcco\xfe\xd5\x09\xa4\xac\x0f\x7f\x03\x8f\x1c\xd9\xbb\xabS\
-\x96MMC\xa1\xed\x0cJ\xca@\xa4E\x9dV\x149\
-\xd4\xa3P\x0f\xc3\x92\xb6\xb7\x19\xc5\xf3\x85A\xad\x12\x8c\
-4\xb5\xce\xb0\x0d\xea\x03\xc1X\x85\xcda\x22X\xa7\x1f\
-\xa3JH\xa3<\x90\xa0V!\xc6c\x91\xbcJ\x94\x5c\
-\xd4\x89\xa5)^&,\x10\xae\x19^\x1fd\xa3q\x82\
-\x87\xa4\xe7\x8b\xca\xfd\xda`\x9c\x89\x1b$\xa5-\xddk\
-\xc8\x83\x1d?\xabx\x8f96\xccY\xbf\x02\x00\xd4\xa4\
-\x89\xc3\x07\xf6\xcc\xcd\x84\x19\xc8\xa3\x1a\xe4\xbd\xaf\xd3c\
-\xfb\xda\xfc\xc0\xf4\xf8Q\x8a\x8d\x96\x88\xa0\xaa|\xca\xc1\
-\x9ek\xd4\x13\x9e\xf3\xba\xbfC\xd2\xd1vI\x04\x91\xf2\
->\xa3rNIB\x86c\x1d\xa5J\xac\x01Qz\xe3\
-\xeb\xdeBg \x9c\x84m\x9c\x06e\x817\x0a\xbd\x86\
-Imz\xdd\x04\xc6z\x10\x0b\xbe\xcd\x0e\x17\x03\xd5\x88\
-\x0e\xa43\x8c8\xc8b\xaf\xdb\xea\xb2\x19\x86\x08\xac\x91\
-${5\x91\xa1T!aJ\xbb\x09\xe1\xaa,\x16u\
-\xe1\x8f\xe8\xb1\xd7m\xfb\x99\xc9\xde\xee\x8f}\x1b\xfe1\
-Or\xf8\xcd\xcf\xa5\xd3\x17n\x9a8\xb8\xff\xe5\xeb6\
-m\xaa\xf5\xba\xf1\xc8@\x0e\xaed\x8c\xc9 !i\xef\
-\x11\xc2\xdf$\xee\x89\xea\xd3\xd7\x98Q\x98b`\xb3h\
-\xce\x9e\x86\x01a\xd4\xf1\xa2>\xb82\xfeY%\x0c\xd9\
-\xe9\xbe\x13\xcd\xd3\x89bg\x09'\xdd\x08j\xed\x15\x01\
-U\x15\x16\xdf%\x85z\xad\x1fN\xc7\xf2\xa1\xee%(\
-R%\x12\xf5\xc4\x0b\x04\xed\x22z\x1eo\xcd4G\x95\
-P\x84\xc9\xe9\xfd\xa8\xebW\xece\xc6\x0f\x8dw\x05x\
-\xe0q\x1d\xad!\x82\xefM\x1e9`N>\xe3,\x18\
-W\x01$(\x1aT\xeb\x99\x90\xfdo\x8b\xe2&P\xa5\
-\xb1\xc3b\x90\xa2\x9f\xb0\x9f\x22l\xe21\xaa\xd3\x8a\x85\
-Y\x12\xf5\x9dPK\xae\xd1\x8d^\xa5'\xc0\x15\x99\xac\
-\x93(\xef\x86EeC\x94(\x8f\xf4\x9f\xa2\xb0\xb0\xfb\
-*+\xe0\xa8\xe9\x19\xef\x05\xc6R\xbd\xc9(\xa6\x0f\xca\
-\x8e\xf1\x92\x85\xa7@\xe8\xb5gP<l\xe2\x89\xc7\x83\
-\x88\x0a\xafe\x80%6\xc6`\xd7\xaeG:\xde\x85\xff\
-\x8f\xd6\x09\x1b\x84=\xbe7~`7\x5c\xb7\x0dWu\
-\xd3Y\x85\xe9\x94\x9e\xccs#\xabK\xea\xb5\xd6d\x8d\
-\xd2\xc0\xd9\x84\x92\x94\xf4H\x1bv8[\xe4\x18-\xa2\
-\x85\x96\xb33B\xd4`\x5c\xa7\x8d\x18I\xaeb\x14\x96\
-R7\xc0\x19IH\x904\xd3\xa7\xec\x04\x09,Xh\
-\x91\xa8)\x96\xa4<\x1c8\xc4&\x8a\x1a\xa4\xa6\xd4#\
-r\x8c\x18/r\xaa\xe1\xc0\x03\xd1\xc9\xa2\x9eu\xa2\xbd\
-hY\x948\xbcww\xd7{\xdc\xf7\xb8\x0cr\xcd\xff\
-\xc0\xf85o\x9c\x9d\xb6ec)\x0c\x89%\xa2\xca3\
-\x0a\x1b\xf6W\xb4t\xa3d\xda\xc3N\xf5\x22G\xba\x04\
-Y$%\xc1A\xa4\xd6S\x81\xab\xe7-!\xe7\xd6\x1e\
-hM\xb6K6\xcb\x1bqWV\xdc\xc5\x8bl.\x0f\
-\xca\xf6h\xa0\x9e\x1c&\x89\x91\x09t:s$M3\
-\xe6>\x9d\xf4:\xb8y3\xb2\x15i\xf3N\x1a\x17\xd4\
-/\x88\x02\x07\xca\xb6\xcc%U}:\x01\x9b\x84Yh\
-v\xa6=\xfe\xe1\xafc\xf6q\x9f\x06$\xeco8\xfc\
-\xf0\x83?\xbe|\xedI`v\x100\xfaJ\xbb\xb8\x81\
-\x8d\x91\xf5>\xf3\x81#\xb6\x91\x0f\x9c$;\x92[\xd2\
-N-c\xea#V\xbd\x0f\x9e>\xa0\xe5\x8a=E\x82\
-@\xf5^\x8e\xb8\x97/\x19Ek\x08e|\x18\xe5T\
-I|\x1c\xe7:&\x0c\xc1Xb\x91\xae\x09E\x826\
-\x8c\x5co\x9fH \x00\xd9\x09\x19$\x83\x07x\xca\xe0\
-!\x0b)\xa5\x8b\xa0,K\xec\x7fd\x1f \xf8\xf6\x89\
-\x1e\xcfd\xb2\xb6\x00\x07\xc6\xabk\xee\xbd\xfd\xa6K\x9f\
-y\xe1\xa5Esh(\xcd\xb0\xf3\xe3\x96\xe2\x1fMa\
-B5u\x12\xbf\xa4c\x0e\xdb\xa8I\x06\xcexGz\
-oH+e\xb6\xcd\x81\xf3\xb9D\xa2\xec\xb3&\xd1d\
-G\xe8gC\xac\xd0\x8ep-\xdeFvRj\x8c<\
--\xb8\xf9N\xa7X\x8b\xeaF\x8f\x06\x22'\xa6\xe2\x90\
-\xaa\x90\xed\x8aB6Y\x1cL\x7f\x82\x1aN\x97\xa5\xc5\
-\xf4\xc4\x14=x\xdf\xbdS\x0f\x1f\xc1\xeffk\x1dO\
-S8\xe6H\x01\x02\xd0\x00\xd0\xd2\x7fC\x00\x9a\xafx\
-\x06~\xec\xe9[\xcd/o:\xed\xd4\x93GF\xc7F\
-\x9b\xad\xa6\xad\xbb\xaf\xfa4\xfb\xb0/1\xda\x83\x06\xd2\
-\xcf\xe0\xd1r\x92\x15\xc4\x04q\xeaQ+\xe5\xa3\xd2\x9a\
-\x1a\xc9=\x8es\xd4sL*\x93c\xbeT.\xf3\x8c\
-E=n\xb2\x8d\x11\x90\x0b\xafA8\xe6\x18\xd88\xf5\
-\xab\xa3\x0cu=\x5cx\x12]\xf6\x87\x89\x08\x9dN\xb7\
-\x9a\x9a\x9c\x9a~d\xcf\xa1{\xbf\xb5\x13\xef\xfc\xfe.\
-<Da\xcba\x17@\x1f@\x85E\xce\x0a2\x00\x9a\
-\x00\x86\x01,\xc9\xfe5\xc6\x86\xb0\xea\xcc\xf5\xd8\xbav\
-\x19\xd6\x14\x06\x8d\xc7<\xc9\xf1Q\x0f\x0d\x5c\xb0!\x12\
-\x8fy\xda\xc4\xff\xcf7\x22\x00}\x8f\x99C\x93\xd8\xf3\
-\xfd]\xf8\x01\x809\x00\x1d\x00\xf3\x00\xdaz\xbf\xb7\x98\
-AHSX\xa9\x91\x12\xff5\xf5\xf9\x02O\xdd\x9e\xe8\
-\xcdk\xd9\xad\xf4_?\xfb\xe7\xf4\xf7\x02\x00\xff\x07\x94\
-X\x89d\xd0\xe0\xb9\xd5\x00\x00\x00\x00IEND\xae\
-B`\x82\
-"
-
-qt_resource_name = b"\
-\x00\x06\
-\x06\xfad\xc3\
-\x00i\
-\x00c\x00o\x00n\x00e\x00s\
-\x00\x03\
-\x00\x00g\xa4\
-\x00a\
-\x00d\x00d\
-\x00\x0a\
-\x0b\x9b~b\
-\x00c\
-\x00o\x00n\x00t\x00r\x00o\x00l\x00l\x00e\x00r\
-\x00\x04\
-\x00\x07f\xbe\
-\x00o\
-\x00p\x00e\x00n\
-\x00\x04\
-\x00\x06\xec0\
-\x00h\
-\x00e\x00l\x00p\
-\x00\x0b\
-\x0de\x1fG\
-\x00c\
-\x00h\x00a\x00n\x00g\x00e\x00_\x00v\x00i\x00e\x00w\
-\x00\x04\
-\x00\x07\xcf\xc7\
-\x00v\
-\x00i\x00e\x00w\
-\x00\x06\
-\x07\x9b\x88\x98\
-\x00s\
-\x00e\x00a\x00r\x00c\x00h\
-\x00\x06\
-\x06\xa6L\xf7\
-\x00c\
-\x00o\x00n\x00f\x00i\x00g\
-\x00\x06\
-\x06\xac,\xa5\
-\x00d\
-\x00e\x00l\x00e\x00t\x00e\
-\x00\x04\
-\x00\x06\xcf\x04\
-\x00e\
-\x00x\x00i\x00t\
-\x00\x06\
-\x06\x99n\x95\
-\x00b\
-\x00r\x00o\x00w\x00s\x00e\
-"
-
-qt_resource_struct = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x0b\x00\x00\x00\x02\
-\x00\x00\x00\x12\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x00\xb4\x00\x00\x00\x00\x00\x01\x00\x03\x1e\xdb\
-\x00\x00\x00F\x00\x00\x00\x00\x00\x01\x00\x01\x06\x1f\
-\x00\x00\x008\x00\x00\x00\x00\x00\x01\x00\x00\xecv\
-\x00\x00\x00p\x00\x00\x00\x00\x00\x01\x00\x02K\xfb\
-\x00\x00\x00\xc2\x00\x00\x00\x00\x00\x01\x00\x03\x5c\xd7\
-\x00\x00\x00\x90\x00\x00\x00\x00\x00\x01\x00\x02\xdaE\
-\x00\x00\x00\xa2\x00\x00\x00\x00\x00\x01\x00\x03\x17\xee\
-\x00\x00\x00~\x00\x00\x00\x00\x00\x01\x00\x02\x92L\
-\x00\x00\x00\x1e\x00\x00\x00\x00\x00\x01\x00\x00\x14A\
-\x00\x00\x00T\x00\x00\x00\x00\x00\x01\x00\x01FB\
-"
-
-def qInitResources():
-    QtCore.qRegisterResourceData(0x01, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(0x01, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
@@ -50,7 +50,11 @@ class Application(QtWidgets.QApplication):
             some additional options that are not passed through the command
             line.
         """
-        # Inheritance
+        # Inheritance: the web engine is imported after the application
+        # creation, when the documentation is first displayed, which requires
+        # the OpenGL contexts to be shared
+        QtCore.QCoreApplication.setAttribute(
+            QtCore.Qt.AA_ShareOpenGLContexts)
         QtWidgets.QApplication.__init__(self, [])
 
         # Extra application options
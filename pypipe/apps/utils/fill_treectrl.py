@@ -122,3 +122,66 @@ def search_in_menu(menu, match):
             return is_included
 
     return is_included
+
+
+def build_search_index(treectrl):
+    """ Flatten a tree control to filter it without rebuilding it.
+
+    The items are listed in pre-order: a parent item always comes before
+    its children.
+
+    Parameters
+    ----------
+    treectrl: QTreeControl (mandatory)
+        a tree control filled with the menu items.
+
+    Returns
+    -------
+    index: list of 3-uplet
+        for each item, the tree item, the lowercase module path
+        ('module.sub_module') and the position of the parent item in the
+        index (None for the top level items).
+    """
+    index = []
+    stack = [(treectrl.topLevelItem(idx), None, "")
+             for idx in reversed(range(treectrl.topLevelItemCount()))]
+    while len(stack) > 0:
+        item, parent_position, parent_module = stack.pop()
+        module_name = item.text(0).lower()
+        if parent_module:
+            current_module = parent_module + "." + module_name
+        else:
+            current_module = module_name
+        position = len(index)
+        index.append((item, current_module, parent_position))
+        for idx in reversed(range(item.childCount())):
+            stack.append((item.child(idx), position, current_module))
+    return index
+
+
+def filter_treectrl(treectrl, index, match=""):
+    """ Show only the tree items matching a string.
+
+    An item is displayed if the match is in its module path or if one of its
+    children is displayed. The match is insensitive to the cast.
+
+    Parameters
+    ----------
+    treectrl: QTreeControl (mandatory)
+        the tree control to filter.
+    index: list of 3-uplet (mandatory)
+        the tree control index generated by 'build_search_index'.
+    match: str (optional)
+        the string used to filter the menu items.
+    """
+    match = match.lower()
+    visible = [match in module_path for _, module_path, _ in index]
+    for position in reversed(range(len(index))):
+        parent_position = index[position][2]
+        if visible[position] and parent_position is not None:
+            visible[parent_position] = True
+    treectrl.setUpdatesEnabled(False)
+    for (item, _, _), is_visible in zip(index, visible):
+        if item.isHidden() == is_visible:
+            item.setHidden(not is_visible)
+    treectrl.setUpdatesEnabled(True)
@@ -0,0 +1,104 @@
+##########################################################################
+# PyPipe - Copyright (C) AGrigis, 2017
+# Distributed under the terms of the CeCILL-B license, as published by
+# the CEA-CNRS-INRIA. Refer to the LICENSE file or to
+# http://www.cecill.info/licences/Licence_CeCILL-B_V1-en.html
+# for details.
+##########################################################################
+
+"""
+Module that defines a startup profiler reporting the modules import times.
+"""
+
+# System import
+import sys
+import time
+import builtins
+import threading
+
+
+class ImportProfiler(object):
+    """ Measure the import time of the modules loaded at startup.
+
+    The builtin import function is wrapped while the profiler is running:
+    each import statement of the main thread that loads new modules is
+    recorded with its cumulative duration and its nesting depth.
+
+    >>> profiler = ImportProfiler()
+    >>> profiler.start()
+    >>> import numpy
+    >>> profiler.stop()
+    >>> profiler.report()
+    """
+    def __init__(self):
+        """ Initialize the 'ImportProfiler' class.
+        """
+        self.records = []
+        self.elapsed = None
+        self._depth = 0
+        self._import = None
+        self._start_time = None
+
+    def start(self):
+        """ Start recording the imports.
+        """
+        self._start_time = time.perf_counter()
+        self._import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def stop(self):
+        """ Stop recording the imports.
+
+        Returns
+        -------
+        elapsed: float
+            the time in seconds since the profiler was started.
+        """
+        if self._import is not None:
+            builtins.__import__ = self._import
+            self._import = None
+            self.elapsed = time.perf_counter() - self._start_time
+        return self.elapsed
+
+    def report(self, stream=None, max_depth=1, min_time=0.005):
+        """ Write the import times.
+
+        Parameters
+        ----------
+        stream: file (optional, default None)
+            the output stream, default the standard error.
+        max_depth: int (optional, default 1)
+            the deepest nested imports reported.
+        min_time: float (optional, default 0.005)
+            the imports faster than this time in seconds are not reported.
+        """
+        stream = stream or sys.stderr
+        elapsed = self.stop()
+        imports_time = sum(duration for _, depth, duration in self.records
+                           if depth == 0)
+        stream.write("Startup time: {0:.3f}s (imports: {1:.3f}s)\n".format(
+            elapsed, imports_time))
+        for name, depth, duration in self.records:
+            if depth <= max_depth and duration >= min_time:
+                stream.write("{0:10.3f}s {1}{2}\n".format(
+                    duration, "  " * depth, name))
+        stream.flush()
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(),
+                      level=0):
+        """ Wrap the builtin import function.
+        """
+        if threading.current_thread() is not threading.main_thread():
+            return self._import(name, globals, locals, fromlist, level)
+        nb_modules = len(sys.modules)
+        position = len(self.records)
+        self._depth += 1
+        start_time = time.perf_counter()
+        try:
+            return self._import(name, globals, locals, fromlist, level)
+        finally:
+            duration = time.perf_counter() - start_time
+            self._depth -= 1
+            if len(sys.modules) > nb_modules:
+                self.records.insert(
+                    position, ("." * level + name, self._depth, duration))
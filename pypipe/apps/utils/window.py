@@ -6,13 +6,30 @@
 # for details.
 ##########################################################################
 
+# System import
+import os
+import logging
+
 # Package import
-from pypipe.apps.resources.icones import *
+import pypipe.apps.resources as resources
 
 # Third party import
+from PySide2 import QtCore
 from PySide2.QtUiTools import QUiLoader
 
 
+# Define the logger
+logger = logging.getLogger(__name__)
+
+
+# Register the compiled icones: the binary resource file is mapped by Qt
+# and the icones are decoded on demand
+ICONES_FILE = os.path.join(resources.__path__[0], "icones.rcc")
+if not QtCore.QResource.registerResource(ICONES_FILE):
+    logger.error("Impossible to register the '{0}' resources.".format(
+        ICONES_FILE))
+
+
 class MyQUiLoader(object):
     """ Base window class based on ui file description.
     """
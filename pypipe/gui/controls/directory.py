@@ -7,6 +7,7 @@
 ##########################################################################
 
 # Package import
+from pypipe.lib.base import path_cache
 from pypipe.lib.controls import Directory
 
 # Third party import
@@ -71,6 +72,7 @@ class QtDirectory(QtWidgets.QWidget, Directory):
         """
         directory = QtWidgets.QFileDialog.getExistingDirectory(
             self, "Select directory", self._value or self._default_value)
+        path_cache.invalidate(directory)
         self._path.setText(directory)
         self._set_value(directory)
 
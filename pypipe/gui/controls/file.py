@@ -7,6 +7,7 @@
 ##########################################################################
 
 # Package import
+from pypipe.lib.base import path_cache
 from pypipe.lib.controls import File
 
 # Third party import
@@ -71,6 +72,7 @@ class QtFile(QtWidgets.QWidget, File):
         """
         fname, _ = QtWidgets.QFileDialog.getOpenFileName(
             self, "Select file", self._value or self._default_value)
+        path_cache.invalidate(fname)
         self._path.setText(fname)
         self._set_value(fname)
 
@@ -13,10 +13,110 @@ from pypipe.lib.controls import Object
 from PySide2 import QtWidgets, QtCore
 
 
+class ObjectsModel(QtCore.QAbstractListModel):
+    """ Expose a list of objects to a view.
+
+    Each row is an object index: the object type is only computed when a
+    row is displayed. For the output controls a last 'New' row is added.
+
+    The objects are read without the list item access so that displaying
+    them does not change the object store eviction order. An object is
+    enabled if its type or one of its base types has the expected name:
+    a spilled 'memmap' array is also an 'ndarray'.
+    """
+    def __init__(self, objects, otype=None, is_output=False, parent=None):
+        """ Initialize the 'ObjectsModel' class.
+
+        Parameters
+        ----------
+        objects: list
+            a list of objects.
+        otype: str (optional, default None)
+            enable only objects of a certain type.
+        is_output: bool (optional, default False)
+            if set, add a 'New' row.
+        parent: QObject (optional, default None)
+            the model parent.
+        """
+        super(ObjectsModel, self).__init__(parent)
+        self._objects = objects
+        self._valid_type = otype
+        self._is_output = is_output
+        self._count = len(objects)
+
+    @property
+    def new_row(self):
+        """ The 'New' row index or None for the input controls.
+        """
+        return self._count if self._is_output else None
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        """ The number of objects, plus the 'New' row for the outputs.
+        """
+        if parent.isValid():
+            return 0
+        return self._count + int(self._is_output)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        """ The object index as text and its type as tooltip.
+        """
+        if not index.isValid():
+            return None
+        row = index.row()
+        if row == self.new_row:
+            if role == QtCore.Qt.DisplayRole:
+                return "New"
+            return None
+        if role == QtCore.Qt.DisplayRole:
+            return str(row)
+        elif role == QtCore.Qt.ToolTipRole:
+            otype = type(self._peek(row)).__name__
+            return "This is a <b>{0}</b> object.".format(otype)
+        return None
+
+    def flags(self, index):
+        """ Disable the objects that do not have the expected type.
+        """
+        flags = QtCore.Qt.ItemNeverHasChildren
+        if not index.isValid():
+            return flags
+        row = index.row()
+        if (self._valid_type is None or row == self.new_row or
+                self._valid_type in [
+                    cls.__name__ for cls in type(self._peek(row)).__mro__]):
+            flags |= QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+        return flags
+
+    def _peek(self, row):
+        """ Get an object without changing the object store eviction order.
+        """
+        return list.__getitem__(self._objects, row)
+
+    def objects_changed(self, start, removed, count):
+        """ Signal the views that the 'removed' objects from the 'start'
+        index have been replaced by 'count' objects: the following objects
+        are shifted.
+        """
+        replaced = min(removed, count)
+        if removed > count:
+            self.beginRemoveRows(
+                QtCore.QModelIndex(), start + replaced, start + removed - 1)
+            self._count = len(self._objects)
+            self.endRemoveRows()
+        elif count > removed:
+            self.beginInsertRows(
+                QtCore.QModelIndex(), start + replaced, start + count - 1)
+            self._count = len(self._objects)
+            self.endInsertRows()
+        stop = start + count if removed == count else self._count
+        if start < stop:
+            self.dataChanged.emit(self.index(start), self.index(stop - 1))
+
+
 class QtObjects(QtWidgets.QWidget, Object):
     """ Define a custom objects user control.
     """
-    nb_item_per_line = 4
+    nb_visible_lines = 4
 
     def __init__(self, objects, value=None, otype=None, *args, **kwargs):
         """ Initialize the 'QtObjects' class.
@@ -38,10 +138,30 @@ class QtObjects(QtWidgets.QWidget, Object):
         self._valid_type = otype
         Object.__init__(self, value, *args, **kwargs)
         super(QtObjects, self).__init__()
-        self._layout = QtWidgets.QGridLayout()
+        self._layout = QtWidgets.QVBoxLayout()
         self._init_ui()
         self.setLayout(self._layout)
 
+    def reset(self):
+        """ Reset the control to his initiale selection.
+        """
+        self._select_default()
+
+    def update_objects(self, start, removed, count):
+        """ Update the control when the objects list has changed.
+
+        Parameters
+        ----------
+        start: int
+            the first modified object index.
+        removed: int
+            the number of replaced objects.
+        count: int
+            the number of new objects.
+        """
+        self._model.objects_changed(start, removed, count)
+        self._onselected()
+
     def _init_ui(self):
         """ Define the user interface.
         """
@@ -61,60 +181,58 @@ class QtObjects(QtWidgets.QWidget, Object):
         self._layout.setSizeConstraint(QtWidgets.QLayout.SetMinimumSize)
         self._layout.setContentsMargins(0, 0, 0, 0)
 
-        # Add grid check boxes to the layout
-        n = len(self._objects)
-        nb_rest_object = n % self.nb_item_per_line
-        nb_full_lines = n // self.nb_item_per_line
-
-        # > add full lines
-        cnt = 0
-        for i in range(nb_full_lines):
-            for j in range(self.nb_item_per_line):
-                button = QtWidgets.QRadioButton()
-                otype = type(self._objects[cnt]).__name__
-                button.setToolTip("This is a <b>{0}</b> object.".format(otype))
-                button.setText(str(cnt))
-                if self._default_value == cnt:
-                    button.setChecked(True) 
-                button.clicked.connect(self._onselected)
-                if self._valid_type is not None:
-                    button.setEnabled(self._valid_type == otype)
-                self._layout.addWidget(button, i, j)
-                cnt += 1
-
-        # > add incomplete line
-        for i in range(nb_rest_object):
-            button = QtWidgets.QRadioButton()
-            otype = type(self._objects[cnt]).__name__
-            button.setToolTip("This is a <b>{0}</b> object.".format(otype))
-            button.setText(str(cnt))
-            if self._default_value == cnt:
-                button.setChecked(True) 
-            button.clicked.connect(self._onselected)
-            if self._valid_type is not None:
-                button.setEnabled(self._valid_type == otype)
-            self._layout.addWidget(button, nb_full_lines, i)
-            cnt += 1
-
-        # > add create object check box
-        if self.is_output:
-            checkBox = QtWidgets.QRadioButton()
-            checkBox.setText("New")
-            if self._default_value == "New":
-                checkBox.setChecked(True)
-            checkBox.clicked.connect(self._onselected)
-            self._layout.addWidget(checkBox, nb_full_lines + 1, 0)
-
-    def _onselected(self):
-        """ Define the selection associated action.
+        # Add the objects view to the layout: only the visible rows are
+        # painted
+        self._model = ObjectsModel(
+            self._objects, otype=self._valid_type, is_output=self.is_output,
+            parent=self)
+        self._view = QtWidgets.QListView(self)
+        self._view.setModel(self._model)
+        self._view.setFlow(QtWidgets.QListView.LeftToRight)
+        self._view.setWrapping(True)
+        self._view.setResizeMode(QtWidgets.QListView.Adjust)
+        self._view.setUniformItemSizes(True)
+        self._view.setLayoutMode(QtWidgets.QListView.Batched)
+        self._view.setSelectionMode(
+            QtWidgets.QAbstractItemView.SingleSelection)
+        self._view.setEditTriggers(
+            QtWidgets.QAbstractItemView.NoEditTriggers)
+        row_height = self._view.fontMetrics().height() + 8
+        self._view.setGridSize(QtCore.QSize(
+            self._view.fontMetrics().averageCharWidth() * 8, row_height))
+        self._view.setMaximumHeight(row_height * self.nb_visible_lines + 4)
+        self._layout.addWidget(self._view)
+        self._select_default()
+        self._view.selectionModel().selectionChanged.connect(
+            self._onselected)
+
+    def _select_default(self):
+        """ Select the row associated to the default value.
         """
-        sender = self.sender()
-        if sender.isChecked() :
-            if self.is_output :
-                self._current_object = sender.text()
-            else:
-                self._current_object = int(sender.text())
-            self._set_value(self._objects[self._current_object])
+        if self._default_value == "New":
+            row = self._model.new_row
+        elif (isinstance(self._default_value, int) and
+                0 <= self._default_value < len(self._objects)):
+            row = self._default_value
+        else:
+            row = None
+        if row is None:
+            self._view.clearSelection()
         else:
+            self._view.setCurrentIndex(self._model.index(row))
+        self._onselected()
+
+    def _onselected(self, *args):
+        """ Define the selection associated action.
+
+        For the outputs, no selection or the 'New' row means that a new
+        object will be created.
+        """
+        indexes = self._view.selectionModel().selectedIndexes()
+        row = indexes[0].row() if len(indexes) > 0 else None
+        if row is None or row == self._model.new_row:
             self._current_object = None
             self._set_value(None)
+        else:
+            self._current_object = row
+            self._set_value(self._objects[row])
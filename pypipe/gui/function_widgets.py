@@ -7,17 +7,25 @@
 ##########################################################################
 
 # System import
+import os
+import contextlib
+import hashlib
 import textwrap
 import logging
 import traceback
 
 # Package import
 from pypipe.lib.base import Observable
+from pypipe.lib.base import is_tracing
+from pypipe.lib.base import summarize
+from pypipe.lib.base import trace
+from pypipe.lib.call import BoundCall
 from pypipe.gui.controls import QTCONTROLS
+from pypipe.gui.workers import Worker
 
 # Third party import
-from docutils.core import publish_string, publish_parts
-from PySide2 import QtWidgets, QtGui, QtCore, QtWebEngineWidgets
+from PySide2 import QtWidgets, QtGui, QtCore
+import shiboken2
 
 
 # Create a logger
@@ -26,50 +34,199 @@ logger = logging.getLogger(__name__)
 
 class FunctionDoc(QtWidgets.QWidget) :
     """ Generate function documentation widget from its rst docstring.
+
+    A single web view is reused: only its html content is swapped when a new
+    function is documented. The html documentations are rendered in a worker
+    and cached by docstring hash, in memory and optionally on disk. The web
+    engine and docutils are only loaded when the widget is first shown.
     """
-    def __init__(self, function):
+    def __init__(self, function=None, cachedir=None):
         """Initialize the 'FunctionDoc' class.
 
         Parameters
         ----------
-        function: callable
+        function: callable (optional, default None)
             the function to document.
+        cachedir: str (optional, default None)
+            if set, a folder where the rendered html documentations are
+            persisted.
         """
         # Inheritance
-        super(FunctionDoc, self).__init__()  
-
-        # Get the docstring
-        self._doc = textwrap.dedent(function.__doc__)
-        self.doc_html = publish_string(self._doc, writer_name="html")
-
-        # Display the html documentation
+        super(FunctionDoc, self).__init__()
+
+        # Define the class attributes
+        self.doc_html = None
+        self._cachedir = cachedir
+        self._html_cache = {}
+        self._key = None
+        self._pending = None
+        self._rendering = set()
+        if self._cachedir is not None and not os.path.isdir(self._cachedir):
+            os.makedirs(self._cachedir)
+
+        # Display the html documentation: the web view is created when the
+        # widget is first shown
         self._layout = QtWidgets.QVBoxLayout()
-        self._text = QtWebEngineWidgets.QWebEngineView() 
-        self._text.setHtml(self.doc_html.decode("utf8"))
-        self._text.show()
-        self._layout.addWidget(self._text)
+        self._text = None
         self.setLayout(self._layout)
+        if function is not None:
+            self.set_function(function)
+
+    def set_function(self, function):
+        """ Display the documentation of a function.
+
+        Parameters
+        ----------
+        function: callable
+            the function to document.
+        """
+        doc = textwrap.dedent(function.__doc__ or "")
+        key = hashlib.sha1(doc.encode("utf8")).hexdigest()
+        self._key = key
+        self._pending = None
+        html = self._cached_html(key)
+        if html is not None:
+            self._set_html(html)
+        elif self.isVisible():
+            self._render(key, doc)
+        else:
+            self._pending = (key, doc)
+
+    def clear(self):
+        """ Remove the displayed documentation.
+        """
+        self._key = None
+        self._pending = None
+        self._set_html("")
+
+    #######################################################################
+    # Events
+    #######################################################################
+
+    def showEvent(self, event):
+        """ Render the deferred documentation when the widget is shown.
+        """
+        super(FunctionDoc, self).showEvent(event)
+        if self._text is None:
+            from PySide2 import QtWebEngineWidgets
+            self._text = QtWebEngineWidgets.QWebEngineView()
+            self._text.setHtml(self.doc_html or "")
+            self._layout.addWidget(self._text)
+        if self._pending is not None:
+            key, doc = self._pending
+            self._pending = None
+            self._render(key, doc)
 
+    #######################################################################
+    # Private interface
+    #######################################################################
+
+    def _cached_html(self, key):
+        """ Get a rendered documentation from the memory or disk cache.
+        """
+        if key in self._html_cache:
+            return self._html_cache[key]
+        if self._cachedir is not None:
+            path = os.path.join(self._cachedir, key + ".html")
+            if os.path.isfile(path):
+                with open(path, "rt", encoding="utf8") as open_file:
+                    html = open_file.read()
+                self._html_cache[key] = html
+                return html
+        return None
+
+    def _render(self, key, doc):
+        """ Render a documentation in a worker.
+        """
+        if key in self._rendering:
+            return
+        self._rendering.add(key)
+        worker = Worker(render_docstring, "doc {0}".format(key), doc)
+        worker.signals.finished.connect(
+            lambda html, elapsed: self._on_rendered(key, html))
+        worker.signals.error.connect(
+            lambda trace, elapsed: self._on_render_error(key, trace))
+        worker.start()
+
+    def _on_rendered(self, key, html):
+        """ Callback used when a documentation is rendered: the html is
+        cached and displayed only if the function is still selected.
+        """
+        self._rendering.discard(key)
+        self._html_cache[key] = html
+        if self._cachedir is not None:
+            path = os.path.join(self._cachedir, key + ".html")
+            try:
+                with open(path, "wt", encoding="utf8") as open_file:
+                    open_file.write(html)
+            except OSError:
+                logger.warning("Impossible to cache documentation in "
+                               "'{0}'.".format(path))
+        if shiboken2.isValid(self) and key == self._key:
+            self._set_html(html)
+
+    def _on_render_error(self, key, trace):
+        """ Callback used when a documentation rendering failed.
+        """
+        self._rendering.discard(key)
+        logger.error("Error during documentation rendering.\n{0}".format(
+            trace))
+
+    def _set_html(self, html):
+        """ Swap the web view content.
+        """
+        self.doc_html = html
+        if self._text is not None:
+            self._text.setHtml(html)
 
-class FunctionParameters(QtWidgets.QWidget, Observable):
+
+def render_docstring(docstring):
+    """ Convert a rst docstring to html.
+
+    Parameters
+    ----------
+    docstring: str
+        the rst docstring.
+
+    Returns
+    -------
+    html: str
+        the html documentation.
+    """
+    from docutils.core import publish_string
+    return publish_string(docstring, writer_name="html").decode("utf8")
+
+
+class FunctionParameters(QtWidgets.QWidget):
     """ Generate function parameters widget.
+
+    The calls in progress are stored in the 'running' class attribute: the
+    'Objects' outputs are written back at the index selected when the call
+    was submitted, hence the objects can't be deleted meanwhile.
     """  
-    def __init__(self, function, objects=None, status_widget=None):
+    running = set()
+
+    def __init__(self, function, objects=None, status_widget=None,
+                 isolated=False, runlog=None):
         """ Initialize the 'FunctionParameters' class.
 
-        Emit an 'update' signal when the widget is updated.
+        The 'Objects' outputs are written in the objects list in a batch: the
+        list observers are notified once with a 'change' signal.
 
         Parameters
         ----------
         function: callable
             the function to execute.
-        objects: list, default None
+        objects: ObservableList, default None
             if an Objects control is created use this container.
         status_widget: Widget, default None
             a status widget to display inforamtion to the user.
+        isolated: bool, default False
+            if set, execute the function in a worker process.
+        runlog: RunLog, default None
+            if set, record the function calls measures in this log.
         """
         # Inheritance
-        Observable.__init__(self, ["update"])
         super(FunctionParameters, self).__init__()   
  
         # Define the class attibutes
@@ -77,6 +234,8 @@ class FunctionParameters(QtWidgets.QWidget, Observable):
         self._objects = objects
         self._function = function
         self._status = status_widget
+        self._isolated = isolated
+        self._runlog = runlog
 
         # Define the widget main layout
         self._layout = QtWidgets.QVBoxLayout()
@@ -90,67 +249,83 @@ class FunctionParameters(QtWidgets.QWidget, Observable):
     
     def __call__(self):
         """ Method to execute the function.
-        """            
-        # Build function expression and namespace
-        namespace, expression = self._build_expression()
+
+        The function is executed in the application thread pool so that the
+        user interface stays responsive: the outputs are written back
+        when the execution is done.
+        """
+        # Bind the function parameters
+        parameters = dict(
+            (name, control.value) for name, control in self._controls.items()
+            if not control.is_output)
+        call = BoundCall(self._function, isolated=self._isolated,
+                         runlog=self._runlog, **parameters)
+        object_ids = dict(
+            (name, control._current_object)
+            for name, control in self._controls.items()
+            if control.is_output and control.type == "Objects")
 
         # Display message to user
-        self._status.showMessage("Running {0}".format(repr(self._function)))  
+        func_name = getattr(
+            self._function, "__name__", repr(self._function))
+        self._status.showMessage("Queued {0}".format(func_name))
         self._status.reformat()
         self._status.hideOrShow()
-     
-        # Execute it
-        logger.debug("Execute function::")
-        logger.debug(expression)
-        def f():
-            exec(expression, namespace)
-        try:
-            f()
-        except:
-            logger.error("Error during function execution.")
-        logger.debug("Execute function done.")
-
-        # Update values
-        update_interface = False
-        logger.debug("Function outputs::")
-        for name, control in self._controls.items():
-            if control.is_output:
-                logger.debug("{0}: {1}".format(name, namespace[name]))
-                update_interface = True
-                if control.type == "Objects":
-                    object_id = control._current_object
-                    if object_id is None:
-                        self._objects.append(namespace[name])
-                        object_id = len(self._objects) - 1
-                    else:  
-                        self._objects[object_id] = namespace[name]
-                else:
-                    object_id = None
-                    control.value = namespace[name]
-        logger.debug("objects: {0}".format(self._objects))
-        logger.debug("Function outputs done.")
 
-        # Update interface
-        if update_interface and object_id is not None:
-            self.notify_observers("update", action="add", position=object_id)
+        # Execute it in a worker
+        trace(logger, "Execute function::\n{0}: {1}", func_name,
+              call.parameters)
+        FunctionParameters.running.add(call)
+        worker = Worker(call, func_name)
+        worker.signals.progress.connect(self._status.showMessage)
+        worker.signals.finished.connect(
+            lambda result, elapsed: self._on_function_done(
+                func_name, result, object_ids))
+        worker.signals.finished.connect(
+            lambda *args: FunctionParameters.running.discard(call))
+        worker.signals.error.connect(
+            lambda trace, elapsed: self._on_function_error(
+                func_name, trace, elapsed))
+        worker.signals.error.connect(
+            lambda *args: FunctionParameters.running.discard(call))
+        worker.start()
+
+    def update_objects(self, start, removed, count):
+        """ Update the 'Objects' controls when the objects list has changed.
 
-        # Done
-        self._status.clearMessage()
+        Parameters
+        ----------
+        start: int
+            the first modified object index.
+        removed: int
+            the number of replaced objects.
+        count: int
+            the number of new objects.
+        """
+        for control in self._controls.values():
+            if control.type == "Objects":
+                control.update_objects(start, removed, count)
+        self.validate_form()
 
     def validate_form(self):
         """ Method that checks if all the controls are defined properly.
         """
         all_controls_valid = True
-        logger.debug("Validation status::")
+        tracing = is_tracing(logger)
+        if tracing:
+            logger.debug("Validation status::")
         for name, control in self._controls.items():
             if control.is_output:
                 continue
-            logger.debug("{0}: {1} (optional {2}, value {3})".format(
-                name, control.valid, control.is_optional, control.value))
+            if tracing:
+                logger.debug("{0}: {1} (optional {2}, value {3})".format(
+                    name, control.valid, control.is_optional,
+                    summarize(control.value)))
             all_controls_valid = (all_controls_valid and control.valid)
             if not all_controls_valid:
                 break
-        logger.debug("Validation status done.")
+        if tracing:
+            logger.debug("Validation status done.")
         self._run.setEnabled(all_controls_valid)
     
     #######################################################################
@@ -169,16 +344,9 @@ class FunctionParameters(QtWidgets.QWidget, Observable):
     def onrun(self):
         """ Event to execute the function.
         """
-        # Deactivate buttons
-        self._run.setEnabled(False)
-        self._reset.setEnabled(False)
-
-        # Execute function
+        # Execute function: the function is submitted to the thread pool, so
+        # several executions can run at once
         self()
-
-        # Activate buttons
-        self._run.setEnabled(True)
-        self._reset.setEnabled(True)
         
     def onreset(self) :
         """ Event to reset the function displayed parameters.
@@ -191,38 +359,75 @@ class FunctionParameters(QtWidgets.QWidget, Observable):
     # Private interface 
     #######################################################################
 
-    def _build_expression(self):
-        """ Method that build the function expression and namespace.
+    def _on_function_done(self, func_name, result, object_ids):
+        """ Callback used when the function execution is done.
 
-        Returns
-        -------
-        namespace: dict
-            the function exec namespace.
-        expression: str
-            the function exec expression.
+        Parameters
+        ----------
+        func_name: str
+            the function name.
+        result: CallResult
+            the function call result.
+        object_ids: dict
+            the selected object index of each 'Objects' output control at
+            submission time.
         """
-        # Build the function namespace
-        namespace = {"function" : self._function}
-        for name, control in self._controls.items():
-            if control.is_output:
-                namespace[name] = None
-            else:
-                namespace[name] = control.value
-       
-        # Build the function expression
-        args = []
-        return_values = []
-        for name, control in self._controls.items():
-            if control.is_output:
-                return_values.append(name)
-            else :
-                args.append("{0}={0}".format(name))
-        expression = "function({0})".format(", ".join(args))
-        if return_values : 
-            return_expression = ", ".join(return_values)
-            expression = "{0} = {1}".format(return_expression, expression)
+        trace(logger, "Execute function done.")
+
+        # Display the error: the call fails if a declared return is missing
+        if not result.success:
+            logger.error("Error during function execution.\n{0}".format(
+                result.traceback))
+            self._status.showMessage("{0} failed after {1:.2f}s: {2}".format(
+                func_name, result.elapsed, result.exception), 4000)
+            return
+
+        # Update values: objects are always written back even if the widget
+        # has been closed in the meantime, the objects list observers are
+        # notified once
+        is_alive = shiboken2.isValid(self)
+        tracing = is_tracing(logger)
+        if tracing:
+            logger.debug("Function outputs::")
+        with contextlib.ExitStack() as stack:
+            if len(object_ids) > 0:
+                stack.enter_context(self._objects.batch())
+            for name, control in self._controls.items():
+                if control.is_output:
+                    value = result.outputs[name]
+                    if tracing:
+                        logger.debug("{0}: {1}".format(name, summarize(value)))
+                    if control.type == "Objects":
+                        object_id = object_ids[name]
+                        if object_id is None:
+                            self._objects.append(value)
+                        else:
+                            self._objects[object_id] = value
+                    elif is_alive:
+                        control.value = value
+        if tracing:
+            logger.debug("objects: {0}".format(summarize(self._objects)))
+            logger.debug("Function outputs done.")
+
+        # Done
+        self._status.showMessage(
+            "{0} done in {1:.2f}s".format(func_name, result.elapsed), 4000)
 
-        return namespace, expression
+    def _on_function_error(self, func_name, trace, elapsed):
+        """ Callback used when the function worker failed.
+
+        Parameters
+        ----------
+        func_name: str
+            the function name.
+        trace: str
+            the formatted traceback.
+        elapsed: float
+            the execution duration in seconds.
+        """
+        logger.error("Error during function execution.\n{0}".format(trace))
+        self._status.showMessage("{0} failed after {1:.2f}s".format(
+            func_name, elapsed), 4000)
 
     def _on_value_changed(self, signal):
         """ Callback used when the value of a control has changed.
@@ -245,14 +450,12 @@ class FunctionParameters(QtWidgets.QWidget, Observable):
             for idx, pname in enumerate(param_names):
 
                 # Create the parameter control widget
-                logger.debug("Create control::")
-                logger.debug("name: {0}".format(pname))   
-                logger.debug("output: {0}".format(is_output))               
                 if is_output:
                     ptype = self._function._output_types[idx]
                 else:
                     ptype = self._function._input_types[idx]
-                logger.debug("type: {0}".format(ptype))   
+                trace(logger, "Create control::\nname: {0}\noutput: {1}\n"
+                      "type: {2}", pname, is_output, ptype)
                 if ptype not in QTCONTROLS:
                     raise ValueError(
                         "Unrecognize control '{0}'.".format(ptype))
@@ -274,17 +477,17 @@ class FunctionParameters(QtWidgets.QWidget, Observable):
                     kwargs["value"] = self._function._default_values[pname]
                 try:
                     control = QTCONTROLS[ptype](*args, **kwargs)
-                except:
-                    trace = traceback.print_exc()
+                except Exception:
+                    error_trace = traceback.format_exc()
                     raise ValueError(
                         "{0}\nImpossible to build control '{1}' of type '{2}' "
                         "with the provided parameters '{3}'.".format(
-                            trace, pname, ptype, kwargs))
+                            error_trace, pname, ptype, kwargs))
                 self._controls[pname] = control
 
                 # Add observer
                 control.add_observer("value", self._on_value_changed)
-                logger.debug("Create control done.")
+                trace(logger, "Create control done.")
 
                 # Add input controls to the grid widget
                 if not control.is_output:
@@ -312,7 +515,8 @@ class FunctionParameters(QtWidgets.QWidget, Observable):
 
 
 class DeleteObjects(QtWidgets.QWidget, Observable):
-    """ Generate a widget to remove objects and notify observers.
+    """ Generate a widget to remove objects and notify observers when an
+    object has to be displayed.
     """
     def __init__(self, objects):
         """ Initialize the 'DeleteObjects' class.
@@ -370,6 +574,21 @@ class DeleteObjects(QtWidgets.QWidget, Observable):
         frame.setLayout(frame_layout)
         self._layout.addWidget(frame)
 
+    def update_objects(self, start, removed, count):
+        """ Update the board when the objects list has changed.
+
+        Parameters
+        ----------
+        start: int
+            the first modified object index.
+        removed: int
+            the number of replaced objects.
+        count: int
+            the number of new objects.
+        """
+        self.control.update_objects(start, removed, count)
+        self.validate_form()
+
     def validate_form(self):
         """ Method that checks if all the controls are defined properly.
         """
@@ -387,12 +606,19 @@ class DeleteObjects(QtWidgets.QWidget, Observable):
         self.validate_form()   
 
     def on_del_clicked(self) :
-        """ Remove the selected object from the list and notify observers
-        with the 'update' signal.
+        """ Remove the selected object from the list: the objects list
+        observers are notified with the 'change' signal.
+
+        The deletion is refused while a function call is running since its
+        outputs are identified by their index in the list.
         """
+        if len(FunctionParameters.running) > 0:
+            QtWidgets.QMessageBox.warning(
+                self, "Warning", "The objects can't be deleted while a "
+                "function is running ({0} running).".format(
+                    len(FunctionParameters.running)))
+            return
         del self._objects[self.control._current_object]
-        self.notify_observers("update", action="del",
-                              position=self.control._current_object)
 
     def on_show_clicked(self) :
         """ Notify observers an object want to be displayed with the 'update'
@@ -11,14 +11,16 @@ Module that defines custom array rendering widgets.
 """
 
 # System import
+import math
 import numpy
 
 # Third party import
 import PySide2
+from PySide2 import QtCore, QtWidgets
 import pyqtgraph
 
 
-def data_widget(data, scroll_axis=2):
+def data_widget(data, scroll_axis=2, preview_size=64 * 1024 ** 2):
     """ Plot an image associated data.
     Currently support on 1D, 2D or 3D data.
 
@@ -28,6 +30,9 @@ def data_widget(data, scroll_axis=2):
         the data to be displayed.
     scroll_axis: int (optional, default 2)
         the scroll axis for 3d data.
+    preview_size: int (optional, default 64MB)
+        3d data larger than this size in bytes are displayed slice by slice
+        with a downsampled preview first.
 
     Returns
     -------
@@ -38,8 +43,12 @@ def data_widget(data, scroll_axis=2):
     if data.ndim not in range(1, 4):
         raise ValueError("Unsupported data dimension.")
 
+    # Deal with large volumes: only the visible slice is loaded
+    if data.ndim == 3 and data.nbytes > preview_size:
+        return VolumeWidget(data, scroll_axis, preview_size)
+
     # Deal with complex data
-    if numpy.iscomplex(data).any():
+    if numpy.iscomplexobj(data):
         data = numpy.abs(data)
 
     # Create the widget
@@ -56,3 +65,106 @@ def data_widget(data, scroll_axis=2):
         widget.plot(data)
 
     return widget
+
+
+class VolumeWidget(QtWidgets.QWidget):
+    """ Display a large volume slice by slice.
+
+    A downsampled slice is displayed first, then the full resolution slice
+    is loaded once the user stops scrolling. The volume is never copied, so
+    memory-mapped arrays are read slice by slice.
+    """
+    load_delay = 150
+
+    def __init__(self, data, scroll_axis=2, preview_size=64 * 1024 ** 2):
+        """ Initialize the 'VolumeWidget' class.
+
+        Parameters
+        ----------
+        data: array
+            the 3d data to be displayed.
+        scroll_axis: int (optional, default 2)
+            the scroll axis.
+        preview_size: int (optional, default 64MB)
+            the approximate size in bytes of the downsampled volume.
+        """
+        super(VolumeWidget, self).__init__()
+        self._data = numpy.moveaxis(data, scroll_axis, 0)
+        self._is_complex = numpy.iscomplexobj(data)
+        self._step = max(1, int(math.ceil(
+            (float(data.nbytes) / preview_size) ** (1. / 3))))
+        self._index = self._data.shape[0] // 2
+
+        # Define the widget layout
+        self._layout = QtWidgets.QVBoxLayout()
+        self._view = pyqtgraph.ImageView()
+        self._slider = QtWidgets.QSlider(QtCore.Qt.Horizontal)
+        self._slider.setRange(0, self._data.shape[0] - 1)
+        self._slider.setValue(self._index)
+        self._layout.addWidget(self._view)
+        self._layout.addWidget(self._slider)
+        self.setLayout(self._layout)
+
+        # Compute the display levels from the downsampled volume
+        preview = self._get_slice(
+            slice(None, None, self._step), self._step)
+        self._levels = (float(preview.min()), float(preview.max()))
+
+        # Define a timer to load the full resolution slice
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._load_slice)
+        self._slider.valueChanged.connect(self._onscroll)
+
+        # Display the downsampled slice, then the full resolution slice
+        self._display(self._index, self._step, auto_range=True)
+        self._timer.start(0)
+
+    def _get_slice(self, index, step):
+        """ Read a downsampled slice.
+
+        Parameters
+        ----------
+        index: int or slice
+            the slice index along the scroll axis.
+        step: int
+            the downsampling factor.
+
+        Returns
+        -------
+        data: array
+            the requested data in memory.
+        """
+        data = numpy.asarray(self._data[index, ::step, ::step])
+        if self._is_complex:
+            data = numpy.abs(data)
+        return data
+
+    def _display(self, index, step, auto_range=False):
+        """ Display a slice.
+
+        Parameters
+        ----------
+        index: int
+            the slice index along the scroll axis.
+        step: int
+            the downsampling factor.
+        auto_range: bool (optional, default False)
+            if set, fit the view to the slice.
+        """
+        self._view.setImage(
+            self._get_slice(index, step), autoRange=auto_range,
+            autoLevels=False, levels=self._levels, scale=(step, step))
+
+    def _onscroll(self, index):
+        """ Display the downsampled slice and schedule the full resolution
+        slice loading.
+        """
+        self._index = index
+        self._display(index, self._step)
+        self._timer.start(self.load_delay)
+
+    def _load_slice(self):
+        """ Display the current slice at full resolution.
+        """
+        self._display(self._index, 1)
@@ -0,0 +1,122 @@
+##########################################################################
+# PyPipe - Copyright (C) AGrigis, 2017
+# Distributed under the terms of the CeCILL-B license, as published by
+# the CEA-CNRS-INRIA. Refer to the LICENSE file or to
+# http://www.cecill.info/licences/Licence_CeCILL-B_V1-en.html
+# for details.
+##########################################################################
+
+"""
+Module that defines a widget to display the function calls measures.
+"""
+
+# System import
+import time
+import logging
+
+# Package import
+from pypipe.lib.instrumentation import RunRecord
+
+# Third party import
+from PySide2 import QtWidgets, QtCore
+
+
+# Create a logger
+logger = logging.getLogger(__name__)
+
+
+class RunsWidget(QtWidgets.QWidget):
+    """ Display the records of a run log in a table.
+
+    The records may be added from worker threads: they are forwarded to the
+    table through a queued Qt signal.
+    """
+    record_added = QtCore.Signal(object)
+    headers = ("Function", "Start", "Wall (s)", "Thread CPU (s)",
+               "Peak memory (MB)", "Process max RSS (MB)", "Inputs (MB)",
+               "Outputs (MB)", "Error")
+
+    def __init__(self, runlog):
+        """ Initialize the 'RunsWidget' class.
+
+        Parameters
+        ----------
+        runlog: RunLog
+            the run log to display.
+        """
+        # Inheritance
+        super(RunsWidget, self).__init__()
+
+        # Define the class attributes
+        self._runlog = runlog
+
+        # Define the widget layout
+        self._layout = QtWidgets.QVBoxLayout()
+        self._init_ui()
+        self.setLayout(self._layout)
+
+        # Define signals
+        self.record_added.connect(self._add_row)
+        self._runlog.add_observer("record", self._on_record)
+        for record in self._runlog.records:
+            self._add_row(record)
+
+    def _init_ui(self):
+        """ Define the user interface.
+        """
+        # Add the records table to the layout
+        self._table = QtWidgets.QTableWidget(0, len(self.headers))
+        self._table.setHorizontalHeaderLabels(self.headers)
+        self._table.setEditTriggers(
+            QtWidgets.QAbstractItemView.NoEditTriggers)
+        self._layout.addWidget(self._table)
+
+        # Add an export button to the layout
+        hbox = QtWidgets.QHBoxLayout()
+        hbox.addStretch(1)
+        self._export = QtWidgets.QPushButton("Export", self)
+        self._export.clicked.connect(self.on_export_clicked)
+        hbox.addWidget(self._export)
+        self._layout.addLayout(hbox)
+
+    #######################################################################
+    # Signals
+    #######################################################################
+
+    def on_export_clicked(self):
+        """ Save the run log in a JSON or CSV file.
+        """
+        path = QtWidgets.QFileDialog.getSaveFileName(
+            self, "Export runs", "", "JSON (*.json);;CSV (*.csv)")[0]
+        if path:
+            self._runlog.save(path)
+
+    #######################################################################
+    # Private interface
+    #######################################################################
+
+    def _on_record(self, signal):
+        """ Forward a new record to the Qt main thread.
+        """
+        self.record_added.emit(signal.record)
+
+    def _add_row(self, record):
+        """ Add a record in the table.
+        """
+        values = record.to_dict()
+        row = self._table.rowCount()
+        self._table.insertRow(row)
+        for column, name in enumerate(RunRecord.fields):
+            value = values[name]
+            if value is None:
+                text = ""
+            elif name == "start":
+                text = time.strftime("%H:%M:%S", time.localtime(value))
+            elif name in ("wall_time", "cpu_time"):
+                text = "{0:.3f}".format(value)
+            elif isinstance(value, int):
+                text = "{0:.2f}".format(value / 1024. ** 2)
+            else:
+                text = str(value)
+            self._table.setItem(row, column, QtWidgets.QTableWidgetItem(text))
+        self._table.scrollToBottom()
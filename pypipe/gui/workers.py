@@ -0,0 +1,164 @@
+##########################################################################
+# PyPipe - Copyright (C) AGrigis, 2017
+# Distributed under the terms of the CeCILL-B license, as published by
+# the CEA-CNRS-INRIA. Refer to the LICENSE file or to
+# http://www.cecill.info/licences/Licence_CeCILL-B_V1-en.html
+# for details.
+##########################################################################
+
+"""
+Module that defines workers to execute callables outside the Qt main thread.
+"""
+
+# System import
+import time
+import logging
+import traceback
+
+# Package import
+from pypipe.lib.base import trace
+
+# Third party import
+from PySide2 import QtCore
+
+
+# Create a logger
+logger = logging.getLogger(__name__)
+
+
+class WorkerSignals(QtCore.QObject):
+    """ Define the signals emitted by a worker.
+
+    Signals are delivered in the thread of the receiver, ie. the Qt main
+    thread for the widgets.
+
+    Attributes
+    ----------
+    `started`: Signal(str)
+        emitted when the worker starts with the worker name.
+    `progress`: Signal(str)
+        emitted with a status message during the execution.
+    `finished`: Signal(object, float)
+        emitted with the callable result and the elapsed time in seconds.
+    `error`: Signal(str, float)
+        emitted with the formatted traceback and the elapsed time in seconds.
+    """
+    started = QtCore.Signal(str)
+    progress = QtCore.Signal(str)
+    finished = QtCore.Signal(object, float)
+    error = QtCore.Signal(str, float)
+
+
+class Worker(QtCore.QRunnable):
+    """ Execute a callable in a thread pool.
+
+    The worker keeps a reference on itself in the 'running' class attribute
+    until its 'finished' or 'error' signal is delivered in order to survive
+    the garbage collector. A 'progress' message is emitted when the
+    execution actually starts, and the callable can report its own progress
+    through the 'report' method:
+
+    >>> worker = Worker(pipeline.run, "pipeline")
+    >>> worker.kwargs["progress"] = worker.report
+    """
+    running = set()
+
+    def __init__(self, function, name=None, *args, **kwargs):
+        """ Initialize the 'Worker' class.
+
+        Parameters
+        ----------
+        function: callable
+            the callable to execute.
+        name: str (optional, default None)
+            a name describing the execution.
+        args, kwargs:
+            the callable parameters.
+        """
+        super(Worker, self).__init__()
+        self.setAutoDelete(False)
+        self.function = function
+        self.name = name or repr(function)
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+
+    def start(self, pool=None):
+        """ Submit the worker to a thread pool.
+
+        Parameters
+        ----------
+        pool: QThreadPool (optional, default None)
+            the thread pool, if not set use the application global pool.
+        """
+        pool = pool or QtCore.QThreadPool.globalInstance()
+        Worker.running.add(self)
+        self.signals.finished.connect(self._release)
+        self.signals.error.connect(self._release)
+        pool.start(self)
+
+    def run(self):
+        """ Execute the callable and emit the associated signals.
+        """
+        trace(logger, "Start worker '{0}'.", self.name)
+        self.signals.started.emit(self.name)
+        self.report("Running {0}".format(self.name))
+        start_time = time.time()
+        try:
+            result = self.function(*self.args, **self.kwargs)
+        except:
+            self.signals.error.emit(
+                traceback.format_exc(), time.time() - start_time)
+        else:
+            self.signals.finished.emit(result, time.time() - start_time)
+        trace(logger, "Worker '{0}' done.", self.name)
+
+    def report(self, message):
+        """ Emit a progress message, can be called from any thread.
+
+        Parameters
+        ----------
+        message: str
+            the status message.
+        """
+        trace(logger, "Worker '{0}' progress: {1}", self.name, message)
+        self.signals.progress.emit(message)
+
+    def _release(self, *args):
+        """ Drop the reference on the worker once the result is delivered.
+        """
+        Worker.running.discard(self)
+
+
+class MainThreadDispatcher(QtCore.QObject):
+    """ Execute callables in the thread of the dispatcher, ie. the Qt main
+    thread if the dispatcher is created there.
+
+    It can be used as the dispatcher of an observable queue so that the
+    notifications emitted from worker threads update the widgets safely:
+
+    >>> runlog.enable_queue(dispatcher=MainThreadDispatcher())
+    """
+    call = QtCore.Signal(object)
+
+    def __init__(self):
+        """ Initialize the 'MainThreadDispatcher' class.
+        """
+        super(MainThreadDispatcher, self).__init__()
+        self.call.connect(self._execute)
+
+    def __call__(self, function):
+        """ Execute a callable: directly if called from the dispatcher thread,
+        otherwise from the dispatcher thread event loop.
+
+        Parameters
+        ----------
+        function: callable
+            the callable to execute without parameter.
+        """
+        self.call.emit(function)
+
+    def _execute(self, function):
+        """ Execute a callable in the dispatcher thread.
+        """
+        function()
@@ -11,5 +11,13 @@ Module that defines common usefull tools.
 """
 
 from .observable import Observable
+from .observable import ObservableInterface
+from .observable import observers_report
 from .observable_list import ObservableList
+from .object_store import ObjectStore
+from .path_cache import PathCache
+from .path_cache import path_cache
+from .tracing import is_tracing
+from .tracing import summarize
+from .tracing import trace
 
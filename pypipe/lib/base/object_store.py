@@ -0,0 +1,269 @@
+##########################################################################
+# PyPipe - Copyright (C) AGrigis, 2017
+# Distributed under the terms of the CeCILL-B license, as published by
+# the CEA-CNRS-INRIA. Refer to the LICENSE file or to
+# http://www.cecill.info/licences/Licence_CeCILL-B_V1-en.html
+# for details.
+##########################################################################
+
+"""
+Module that defines a list that spills large arrays to disk.
+"""
+
+# System import
+import os
+import uuid
+import shutil
+import logging
+import weakref
+import tempfile
+from collections import OrderedDict
+
+# Package import
+from .tracing import trace
+from .observable_list import ObservableList
+
+# Third party import
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# Create a logger
+logger = logging.getLogger(__name__)
+
+
+class ObjectStore(ObservableList):
+    """ Create an observable list with a memory budget.
+
+    This class acts as a python list object. Each modification is notified
+    with a single 'change' signal emitted once the arrays are spilled (see
+    'ObservableList').
+
+    When the in-memory numpy arrays exceed the memory budget, some arrays are
+    saved as '.npy' files in a session scratch directory and replaced in the
+    list by 'numpy.memmap' views. The spilled arrays are chosen with an
+    eviction policy:
+
+    * 'lru': the least recently accessed arrays first.
+    * 'largest': the largest arrays first.
+
+    The scratch directory is removed when the store is garbage collected or
+    when the interpreter exits.
+
+    A 'spill' signal is emitted with the 'positions' of the arrays replaced
+    by memory-mapped views: the observers holding the in-memory arrays must
+    release them, otherwise spilling frees no memory.
+    """
+    policies = ("lru", "largest")
+    signals = ObservableList.signals + ("spill", )
+
+    def __init__(self, sequence=(), memory_budget=2 * 1024 ** 3,
+                 spill_threshold=16 * 1024 ** 2, policy="lru",
+                 scratchdir=None):
+        """ Initialize the ObjectStore class.
+
+        Parameters
+        ----------
+        sequence: list (optional)
+            the init list.
+        memory_budget: int (optional, default 2GB)
+            the maximum size in bytes of the in-memory arrays.
+        spill_threshold: int (optional, default 16MB)
+            the arrays smaller than this size in bytes are never spilled.
+        policy: str (optional, default 'lru')
+            the eviction policy: 'lru' or 'largest'.
+        scratchdir: str (optional, default None)
+            the folder where the arrays are spilled, if not set a temporary
+            folder is created at the first spill.
+        """
+        if policy not in self.policies:
+            raise ValueError("Unknown '{0}' eviction policy, allowed policies "
+                             "are {1}.".format(policy, self.policies))
+        ObservableList.__init__(self)
+        self.memory_budget = memory_budget
+        self.spill_threshold = spill_threshold
+        self.policy = policy
+        self._scratchdir = scratchdir
+        self._finalizer = None
+        self._resident = OrderedDict()
+        self._spilled = {}
+        self.extend(sequence)
+
+    ######################################################################
+    # List interface
+    ######################################################################
+
+    def __getitem__(self, index):
+        """ Overload the item access to track the recently used arrays.
+        """
+        value = list.__getitem__(self, index)
+        if not isinstance(index, slice) and id(value) in self._resident:
+            self._resident.move_to_end(id(value))
+        return value
+
+    def __setitem__(self, index, value):
+        """ Overload the item assignment.
+        """
+        removed = list.__getitem__(self, index)
+        if isinstance(index, slice):
+            value = list(value)
+        with self.batch():
+            ObservableList.__setitem__(self, index, value)
+            if isinstance(index, slice):
+                self._forget(removed)
+                self._track(value)
+            else:
+                self._forget([removed])
+                self._track([value])
+            self._enforce_budget()
+
+    def __delitem__(self, index):
+        """ Overload the item deletion.
+        """
+        removed = list.__getitem__(self, index)
+        ObservableList.__delitem__(self, index)
+        self._forget(removed if isinstance(index, slice) else [removed])
+
+    def __iadd__(self, values):
+        """ Overload the in-place concatenation.
+        """
+        self.extend(values)
+        return self
+
+    def append(self, value):
+        """ Overload the append method.
+        """
+        with self.batch():
+            ObservableList.append(self, value)
+            self._track([value])
+            self._enforce_budget()
+
+    def extend(self, values):
+        """ Overload the extend method.
+        """
+        values = list(values)
+        with self.batch():
+            ObservableList.extend(self, values)
+            self._track(values)
+            self._enforce_budget()
+
+    def insert(self, index, value):
+        """ Overload the insert method.
+        """
+        with self.batch():
+            ObservableList.insert(self, index, value)
+            self._track([value])
+            self._enforce_budget()
+
+    def pop(self, *args):
+        """ Overload the pop method.
+        """
+        value = ObservableList.pop(self, *args)
+        self._forget([value])
+        return value
+
+    def remove(self, value):
+        """ Overload the remove method.
+        """
+        index = self.index(value)
+        del self[index]
+
+    def clear(self):
+        """ Overload the clear method.
+        """
+        del self[:]
+
+    ######################################################################
+    # Public interface
+    ######################################################################
+
+    @property
+    def resident_size(self):
+        """ The size in bytes of the in-memory arrays.
+        """
+        return sum([array.nbytes for array in self._resident.values()])
+
+    def close(self):
+        """ Remove the scratch directory and all the spilled arrays.
+
+        The spilled arrays must not be accessed anymore.
+        """
+        if self._finalizer is not None:
+            self._finalizer()
+        self._spilled.clear()
+
+    ######################################################################
+    # Private interface
+    ######################################################################
+
+    def _is_spillable(self, value):
+        """ Check if a value is an in-memory array that can be spilled.
+        """
+        return (numpy is not None and isinstance(value, numpy.ndarray) and
+                not isinstance(value, numpy.memmap) and
+                not value.dtype.hasobject)
+
+    def _track(self, values):
+        """ Register the new in-memory arrays.
+        """
+        for value in values:
+            if self._is_spillable(value):
+                self._resident[id(value)] = value
+                self._resident.move_to_end(id(value))
+
+    def _forget(self, values):
+        """ Unregister the removed values and delete their spilled file if
+        the value is not in the list anymore.
+        """
+        for value in values:
+            if any(item is value for item in list.__iter__(self)):
+                continue
+            self._resident.pop(id(value), None)
+            path = self._spilled.pop(id(value), (None, None))[1]
+            if path is not None:
+                trace(logger, "Remove spilled array '{0}'.", path)
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def _enforce_budget(self):
+        """ Spill arrays until the in-memory arrays fit in the memory budget.
+        """
+        size = self.resident_size
+        while size > self.memory_budget:
+            candidates = [array for array in self._resident.values()
+                          if array.nbytes >= self.spill_threshold]
+            if len(candidates) == 0:
+                break
+            if self.policy == "largest":
+                victim = max(candidates, key=lambda array: array.nbytes)
+            else:
+                victim = candidates[0]
+            self._spill(victim)
+            size -= victim.nbytes
+
+    def _spill(self, array):
+        """ Save an array in the scratch directory and replace it in the list
+        by a memory-mapped view.
+        """
+        if self._scratchdir is None:
+            self._scratchdir = tempfile.mkdtemp(prefix="pypipe_")
+        if self._finalizer is None:
+            self._finalizer = weakref.finalize(
+                self, shutil.rmtree, self._scratchdir, True)
+        path = os.path.join(
+            self._scratchdir, "object_{0}.npy".format(uuid.uuid4().hex))
+        trace(logger, "Spill {0} bytes array to '{1}'.", array.nbytes, path)
+        numpy.save(path, array)
+        mapped_array = numpy.load(path, mmap_mode="r+")
+        self._resident.pop(id(array))
+        self._spilled[id(mapped_array)] = (mapped_array, path)
+        positions = []
+        for index, item in enumerate(list.__iter__(self)):
+            if item is array:
+                list.__setitem__(self, index, mapped_array)
+                positions.append(index)
+        self.notify_observers("spill", positions=positions)
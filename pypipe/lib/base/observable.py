@@ -10,36 +10,142 @@
 Module that define the observable pattern design.
 """
 
+# System import
+import gc
+import types
+import weakref
+import threading
+import collections
+
 
 class SignalObject(object):
-    """ Dummy class for signals.
+    """ The record sent to the observers of a signal.
+
+    A single record is reused for all the notifications of a signal: it is
+    only valid during the observers calls and must not be kept. The
+    notification parameters are available as attributes.
     """
-    pass
+    __slots__ = ("object", "signal", "parameters")
 
+    def __init__(self, signal):
+        """ Initialize the SignalObject class.
 
-class Observable(object):
-    """ Base class for observable classes.
+        Parameters
+        ----------
+        signal: str
+            the signal name.
+        """
+        self.object = None
+        self.signal = signal
+        self.parameters = None
 
-    This class defines a simple interface to add or remove observers
-    on an object.
+    def __getattr__(self, name):
+        """ Get a notification parameter.
+        """
+        if name != "parameters" and self.parameters is not None:
+            try:
+                return self.parameters[name]
+            except KeyError:
+                pass
+        raise AttributeError("Signal '{0}' has no attribute '{1}'.".format(
+            self.signal, name))
+
+
+class StrongObserver(object):
+    """ A strong reference to an observer.
     """
+    __slots__ = ("observer", )
 
-    def __init__(self, signals):
-        """ Initilize the Observable class.
+    def __init__(self, observer):
+        """ Initialize the StrongObserver class.
+
+        Parameters
+        ----------
+        observer: @func
+            the referenced observer.
+        """
+        self.observer = observer
+
+    def __call__(self):
+        """ Get the referenced observer.
+        """
+        return self.observer
+
+    def notify(self, record):
+        """ Call the observer.
+        """
+        self.observer(record)
+
+
+class WeakObserver(object):
+    """ A weak reference to a bound method observer.
+
+    As 'weakref.WeakMethod', the method object and function are stored
+    separately, but the notification calls the function directly without
+    creating a new bound method.
+    """
+    __slots__ = ("object_reference", "function")
+
+    def __init__(self, observer, callback=None):
+        """ Initialize the WeakObserver class.
+
+        Parameters
+        ----------
+        observer: bound method
+            the referenced observer.
+        callback: callable (optional, default None)
+            a function called when the method object is deleted.
+        """
+        self.object_reference = weakref.ref(observer.__self__, callback)
+        self.function = observer.__func__
+
+    def __call__(self):
+        """ Get the referenced observer, None if its object was deleted.
+        """
+        obj = self.object_reference()
+        if obj is None:
+            return None
+        return types.MethodType(self.function, obj)
+
+    def notify(self, record):
+        """ Call the observer if its object is alive.
+        """
+        obj = self.object_reference()
+        if obj is not None:
+            self.function(obj, record)
+
+
+class ObservableInterface(object):
+    """ The observable methods.
+
+    This class does not define any instance attribute so that the slotted
+    classes can be observable: the state is defined by '_init_observable'.
+    """
+    __slots__ = ()
+
+    def _init_observable(self, signals):
+        """ Initilize the observable state.
 
         Parameters
         ----------
         signals: list of str
             the allowed signals.
         """
-        # Define class parameters
+        # Define class parameters: the observers are stored in tuples that
+        # are only rebuilt when an observer is added or removed
         self._allowed_signals = []
         self._observers = {}
+        self._signals = {}
 
         # Set allowed signals
         for signal in signals:
             self._allowed_signals.append(signal)
-            self._observers[signal] = []
+            self._observers[signal] = ()
+            self._signals[signal] = SignalObject(signal)
+
+        # The callback used to remove the dead observers, created with the
+        # first weak observer
+        self._prune = None
 
         # Set a lock option to avoid multiple observer notifications
         self._locked = False
@@ -69,7 +175,7 @@ class Observable(object):
         observer: @func
             an obervation function to be removed.
         """
-        self._is_allowed_event(signal)
+        self._is_allowed_signal(signal)
         self._remove_observer(signal, observer)
 
     def notify_observers(self, signal, **kwargs):
@@ -85,8 +191,18 @@ class Observable(object):
         Returns
         -------
         out: bool
-            Fasle if a notification is in progress, otherwise True.
+            Fasle if a notification is in progress and the queue mode is
+            disabled, otherwise True.
         """
+        # Nothing to do if the signal is not observed
+        observers = self._observers[signal]
+        if not observers:
+            return True
+
+        # Queue the notification in the queue mode
+        if self._queue is not None:
+            return self._enqueue(signal, kwargs)
+
         # Chack if a notification if in progress
         if self._locked:
             return False
@@ -94,19 +210,49 @@ class Observable(object):
         # Set the lock
         self._locked = True
 
-        # Create a signal object
-        signal_to_be_notified = SignalObject()
-        setattr(signal_to_be_notified, "object", self)
-        setattr(signal_to_be_notified, "signal", signal)
-        for name, value in kwargs.items():
-            setattr(signal_to_be_notified, name, value)
+        # Notify all the observers and unlock the notification process
+        try:
+            self._dispatch(signal, kwargs)
+        finally:
+            self._locked = False
 
-        # Notify all the observers
-        for observer in self._observers[signal]:
-            observer(signal_to_be_notified)
+        return True
 
-        # Unlock the notification process
-        self._locked = False
+    def enable_queue(self, dispatcher=None):
+        """ Queue the notifications emitted during another notification.
+
+        The notifications emitted by the observers or by other threads are
+        delivered in order once the current notification is done.
+
+        Parameters
+        ----------
+        dispatcher: callable (optional, default None)
+            if set, a function that receives a callable delivering the queued
+            notifications and executes it, for instance in the Qt main
+            thread. Otherwise the notifications are delivered by the thread
+            that emits the first of them.
+        """
+        if self._queue is None:
+            self._queue = collections.deque()
+            self._queue_lock = threading.Lock()
+        self._dispatcher = dispatcher
+
+    def observers(self, signal):
+        """ Get the live observers of a signal.
+
+        Parameters
+        ----------
+        signal: str
+            a valid signal.
+
+        Returns
+        -------
+        observers: list of @func
+            the observers that will be called when the signal is emitted.
+        """
+        self._is_allowed_signal(signal)
+        observers = [reference() for reference in self._observers[signal]]
+        return [observer for observer in observers if observer is not None]
 
     ######################################################################
     # Properties
@@ -146,8 +292,14 @@ class Observable(object):
         observer: @func
             an obervation function.
         """
-        if observer not in self._observers[signal]:
-            self._observers[signal].append(observer)
+        if self._find_observer(signal, observer) is None:
+            if isinstance(observer, types.MethodType):
+                if self._prune is None:
+                    self._prune = self._prune_callback()
+                reference = WeakObserver(observer, self._prune)
+            else:
+                reference = StrongObserver(observer)
+            self._observers[signal] += (reference, )
 
     def _remove_observer(self, signal, observer):
         """ Remove an observer to a valid signal.
@@ -159,5 +311,166 @@ class Observable(object):
         observer: @func
             an obervation function to be removed.
         """
-        if observer in self._observers[signal]:
-            self._observers[signal].remove(observer)
+        reference = self._find_observer(signal, observer)
+        if reference is not None:
+            self._observers[signal] = tuple(
+                item for item in self._observers[signal]
+                if item is not reference)
+
+    def _find_observer(self, signal, observer):
+        """ Get the reference to an observer of a valid signal.
+
+        Parameters
+        ----------
+        signal: str
+            a valid signal.
+        observer: @func
+            an obervation function.
+
+        Returns
+        -------
+        reference: callable
+            the observer reference, None if the observer is not found.
+        """
+        for reference in self._observers[signal]:
+            if reference() == observer:
+                return reference
+        return None
+
+    def _dispatch(self, signal, kwargs):
+        """ Call the observers of a signal.
+
+        Parameters
+        ----------
+        signal: str
+            a valid signal.
+        kwargs: dict
+            the parameters that will be sent to the observers.
+        """
+        # Fill the signal record: the parameters are released after the
+        # notification so that the record does not keep the values alive
+        record = self._signals[signal]
+        record.object = self
+        record.parameters = kwargs
+        try:
+            for reference in self._observers[signal]:
+                reference.notify(record)
+        finally:
+            record.object = None
+            record.parameters = None
+
+    def _enqueue(self, signal, kwargs):
+        """ Queue a notification and start the delivery if no notification is
+        in progress.
+        """
+        with self._queue_lock:
+            self._queue.append((signal, kwargs))
+            if self._locked:
+                return True
+            self._locked = True
+        if self._dispatcher is not None:
+            self._dispatcher(self._deliver)
+        else:
+            self._deliver()
+        return True
+
+    def _deliver(self):
+        """ Deliver the queued notifications in order.
+
+        If an observer raises, the delivery stops and the remaining
+        notifications are delivered with the next one.
+        """
+        try:
+            while True:
+                with self._queue_lock:
+                    if len(self._queue) == 0:
+                        self._locked = False
+                        return
+                    signal, kwargs = self._queue.popleft()
+                self._dispatch(signal, kwargs)
+        except:
+            with self._queue_lock:
+                self._locked = False
+            raise
+
+    def _prune_callback(self):
+        """ Create the callback that removes the dead observers when an
+        observer object is deleted: the callback does not keep the observable
+        alive.
+        """
+        self_reference = weakref.ref(self)
+
+        def prune(dead_reference):
+            observable = self_reference()
+            if observable is not None:
+                observable._prune_observers()
+
+        return prune
+
+    def _prune_observers(self):
+        """ Remove the observers whose object has been deleted.
+        """
+        for signal, observers in list(self._observers.items()):
+            self._observers[signal] = tuple(
+                reference for reference in observers
+                if reference() is not None)
+
+
+class Observable(ObservableInterface):
+    """ Base class for observable classes.
+
+    This class defines a simple interface to add or remove observers
+    on an object.
+
+    The bound method observers are held through weak references: an
+    observer does not keep its object alive and is removed automatically
+    when its object is deleted. The other observers are held strongly.
+
+    By default, a notification emitted while another notification is in
+    progress is dropped. In the queue mode, enabled with 'enable_queue', the
+    nested and cross-thread notifications are queued and delivered in order,
+    optionally by a dispatcher that runs the delivery in another thread.
+    """
+    _queue = None
+    _dispatcher = None
+
+    def __init__(self, signals):
+        """ Initilize the Observable class.
+
+        Parameters
+        ----------
+        signals: list of str
+            the allowed signals.
+        """
+        self._init_observable(signals)
+
+
+def observers_report():
+    """ Count the live observables and their observers.
+
+    This diagnostic lists the objects that stay reachable through the
+    observers, for instance closed widgets in a long session.
+
+    Returns
+    -------
+    report: dict
+        for each observable type name, the number of live instances and the
+        number of observers grouped by the observer owner type name.
+    """
+    report = {}
+    for item in gc.get_objects():
+        if not isinstance(item, ObservableInterface):
+            continue
+        type_report = report.setdefault(
+            type(item).__name__, {"instances": 0, "observers": {}})
+        type_report["instances"] += 1
+        for signal in item.allowed_signals:
+            for observer in item.observers(signal):
+                owner = getattr(observer, "__self__", observer)
+                if isinstance(owner, types.FunctionType):
+                    name = owner.__qualname__
+                else:
+                    name = type(owner).__name__
+                type_report["observers"][name] = (
+                    type_report["observers"].get(name, 0) + 1)
+    return report
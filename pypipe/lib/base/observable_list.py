@@ -12,6 +12,9 @@ Module that defines an observable list from the observable pattern design.
 """
 
 
+# System import
+import contextlib
+
 # Package import
 from .observable import Observable
 
@@ -23,7 +26,19 @@ class ObservableList(list, Observable):
 
     The 'append', 'pop', 'insert' and 'remove' methods have been overloaded in
     order to notify some observers. The associated signals have the same names.
+
+    All the list modifications, including the bulk ones, are also notified
+    with a 'change' signal: the 'start' and 'removed' parameters tell us that
+    the 'removed' items from the 'start' index have been replaced by the
+    'values' items. The modifications done in a 'batch' context are
+    coalesced in a single 'change' notification and the single item signals
+    are not emitted.
+
+    >>> with objects.batch():
+    ...     for value in values:
+    ...         objects.append(value)
     """
+    signals = ("append", "pop", "insert", "remove", "change")
 
     def __init__(self, sequence=[]):
         """ Initilaize the ObservableList class.
@@ -34,7 +49,26 @@ class ObservableList(list, Observable):
             the init list.
         """
         list.__init__(self, sequence)
-        Observable.__init__(self, ["append", "pop", "insert", "remove"])
+        Observable.__init__(self, self.signals)
+        self._batch_depth = 0
+        self._batch_range = None
+
+    @contextlib.contextmanager
+    def batch(self):
+        """ Coalesce the list modifications in a single notification.
+
+        The batches can be nested: the 'change' signal is emitted when the
+        outermost batch exits.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_range is not None:
+                start, tail, size = self._batch_range
+                self._batch_range = None
+                self._notify_change(start, tail, size)
 
     def append(self, value):
         """ Overlaod the append method.
@@ -44,14 +78,21 @@ class ObservableList(list, Observable):
         value: object
             the value that will be added in the list.
         """
+        size = len(self)
         list.append(self, value)
-        self.notify_observers("append", value=value)
+        if not self._changed(size, size, size):
+            self.notify_observers("append", value=value)
     
     def pop(self, *args):
         """ Overlaod the pop method.
         """
+        size = len(self)
         value = list.pop(self, *args)
-        self.notify_observers("pop", value=value)
+        index = args[0] if args else -1
+        if index < 0:
+            index += size
+        if not self._changed(index, index + 1, size):
+            self.notify_observers("pop", value=value)
         return value
 
     def insert(self, index, value):
@@ -64,8 +105,14 @@ class ObservableList(list, Observable):
         value: object
             the value that will be inserted in the list.
         """
+        size = len(self)
         list.insert(self, index, value)
-        self.notify_observers("insert", value=value, index=index)
+        if index < 0:
+            position = max(index + size, 0)
+        else:
+            position = min(index, size)
+        if not self._changed(position, position, size):
+            self.notify_observers("insert", value=value, index=index)
 
     def remove(self, value):
         """ Overload the remove method.
@@ -75,5 +122,127 @@ class ObservableList(list, Observable):
         value: object
             the value that will be removed from the list.
         """
-        list.remove(self, value)
-        self.notify_observers("remove", value=value)
+        size = len(self)
+        index = self.index(value)
+        list.__delitem__(self, index)
+        if not self._changed(index, index + 1, size):
+            self.notify_observers("remove", value=value)
+
+    def extend(self, values):
+        """ Overload the extend method.
+
+        Parameters
+        ----------
+        values: iterable
+            the values that will be added in the list.
+        """
+        size = len(self)
+        list.extend(self, values)
+        self._changed(size, size, size)
+
+    def __iadd__(self, values):
+        """ Overload the in-place concatenation.
+        """
+        self.extend(values)
+        return self
+
+    def __imul__(self, factor):
+        """ Overload the in-place repetition.
+        """
+        size = len(self)
+        list.__imul__(self, factor)
+        self._changed(0, size, size)
+        return self
+
+    def __setitem__(self, index, value):
+        """ Overload the item and slice assignment.
+        """
+        size = len(self)
+        list.__setitem__(self, index, value)
+        start, stop = self._range(index, size)
+        self._changed(start, stop, size)
+
+    def __delitem__(self, index):
+        """ Overload the item and slice deletion.
+        """
+        size = len(self)
+        start, stop = self._range(index, size)
+        list.__delitem__(self, index)
+        self._changed(start, stop, size)
+
+    def clear(self):
+        """ Overload the clear method.
+        """
+        size = len(self)
+        list.clear(self)
+        self._changed(0, size, size)
+
+    def sort(self, *args, **kwargs):
+        """ Overload the sort method.
+        """
+        list.sort(self, *args, **kwargs)
+        self._changed(0, len(self), len(self))
+
+    def reverse(self):
+        """ Overload the reverse method.
+        """
+        list.reverse(self)
+        self._changed(0, len(self), len(self))
+
+    ######################################################################
+    # Private interface
+    ######################################################################
+
+    def _range(self, index, size):
+        """ Get the range of the list covered by an index or a slice.
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(size)
+            if step != 1:
+                positions = range(start, stop, step)
+                if len(positions) == 0:
+                    start = min(max(start, 0), size)
+                    return start, start
+                return min(positions), max(positions) + 1
+            return start, max(start, stop)
+        if index < 0:
+            index += size
+        return index, index + 1
+
+    def _changed(self, start, stop, size):
+        """ Record a modification of the list.
+
+        Parameters
+        ----------
+        start, stop: int
+            the replaced range in the list before the modification.
+        size: int
+            the list size before the modification.
+
+        Returns
+        -------
+        batched: bool
+            True if the modification is coalesced in a batch.
+        """
+        tail = size - stop
+        if self._batch_depth > 0:
+            if self._batch_range is None:
+                self._batch_range = (start, tail, size)
+            else:
+                batch_start, batch_tail, batch_size = self._batch_range
+                self._batch_range = (min(batch_start, start),
+                                     min(batch_tail, tail), batch_size)
+            return True
+        self._notify_change(start, tail, size)
+        return False
+
+    def _notify_change(self, start, tail, size):
+        """ Emit a 'change' signal for the modified range: the items between
+        the 'start' index and the 'tail' last items are new.
+        """
+        stop = len(self) - tail
+        removed = size - tail - start
+        if stop > start or removed > 0:
+            self.notify_observers(
+                "change", start=start, removed=removed,
+                values=list.__getitem__(self, slice(start, stop)))
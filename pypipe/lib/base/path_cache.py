@@ -0,0 +1,196 @@
+##########################################################################
+# PyPipe - Copyright (C) AGrigis, 2017
+# Distributed under the terms of the CeCILL-B license, as published by
+# the CEA-CNRS-INRIA. Refer to the LICENSE file or to
+# http://www.cecill.info/licences/Licence_CeCILL-B_V1-en.html
+# for details.
+##########################################################################
+
+"""
+Module that defines a path existence cache to limit the file system calls.
+"""
+
+# System import
+import os
+import stat
+import time
+from collections import OrderedDict
+
+
+# Global parameters
+FILE = "file"
+DIRECTORY = "directory"
+OTHER = "other"
+
+
+class PathCache(object):
+    """ Cache the kind of file system paths during a time to live.
+
+    The kind of a path is 'file', 'directory', 'other' or None if the path
+    does not exist. The expired paths are dropped when they are looked up
+    and the least recently used paths are dropped when the cache is full.
+    """
+    def __init__(self, ttl=2., maxsize=4096):
+        """ Initialize the 'PathCache' class.
+
+        Parameters
+        ----------
+        ttl: float (optional, default 2)
+            the time to live of a cached path in seconds, zero disables the
+            cache.
+        maxsize: int (optional, default 4096)
+            the maximum number of cached paths.
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+
+    def kind(self, path):
+        """ Get the kind of a path.
+
+        Parameters
+        ----------
+        path: str
+            a path.
+
+        Returns
+        -------
+        kind: str
+            'file', 'directory', 'other' or None if the path does not exist.
+        """
+        now = time.monotonic()
+        entry = self._lookup(path, now)
+        if entry is not None:
+            return entry[1]
+        try:
+            mode = os.stat(path).st_mode
+        except (OSError, ValueError):
+            kind = None
+        else:
+            kind = _mode_to_kind(mode)
+        self._store(path, now, kind)
+        return kind
+
+    def kinds(self, paths):
+        """ Get the kind of many paths.
+
+        The expired paths are grouped by parent directory and each parent
+        directory is listed only once.
+
+        Parameters
+        ----------
+        paths: list of str
+            some paths.
+
+        Returns
+        -------
+        kinds: list of str
+            for each path, 'file', 'directory', 'other' or None if the path
+            does not exist.
+        """
+        now = time.monotonic()
+        kinds = {}
+        to_scan = {}
+        for path in paths:
+            entry = self._lookup(path, now)
+            if entry is not None:
+                kinds[path] = entry[1]
+                continue
+            dirname, basename = os.path.split(path)
+            if basename in ("", ".", ".."):
+                kinds[path] = self.kind(path)
+            else:
+                to_scan.setdefault(dirname, []).append((path, basename))
+        for dirname, items in to_scan.items():
+            if len(items) == 1:
+                kinds[items[0][0]] = self.kind(items[0][0])
+                continue
+            try:
+                with os.scandir(dirname or os.curdir) as iterator:
+                    entries = dict((entry.name, entry) for entry in iterator)
+            except (OSError, ValueError):
+                entries = {}
+            for path, basename in items:
+                entry = entries.get(basename)
+                if entry is None:
+                    kind = None
+                elif entry.is_file():
+                    kind = FILE
+                elif entry.is_dir():
+                    kind = DIRECTORY
+                elif os.path.exists(path):
+                    kind = OTHER
+                else:
+                    kind = None
+                kinds[path] = kind
+                self._store(path, now, kind)
+        return [kinds[path] for path in paths]
+
+    def isfile(self, path):
+        """ Test whether a path is an existing regular file.
+        """
+        return self.kind(path) == FILE
+
+    def isdir(self, path):
+        """ Test whether a path is an existing directory.
+        """
+        return self.kind(path) == DIRECTORY
+
+    def isfiles(self, paths):
+        """ Test whether all the paths are existing regular files.
+        """
+        return all(kind == FILE for kind in self.kinds(paths))
+
+    def isdirs(self, paths):
+        """ Test whether all the paths are existing directories.
+        """
+        return all(kind == DIRECTORY for kind in self.kinds(paths))
+
+    def invalidate(self, path=None):
+        """ Forget a cached path.
+
+        Parameters
+        ----------
+        path: str (optional, default None)
+            the path to forget, if not set forget all the cached paths.
+        """
+        if path is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(path, None)
+
+    def _lookup(self, path, now):
+        """ Get a cached path entry, the expired entry is dropped.
+        """
+        entry = self._entries.get(path)
+        if entry is None:
+            return None
+        if now - entry[0] >= self.ttl:
+            del self._entries[path]
+            return None
+        self._entries.move_to_end(path)
+        return entry
+
+    def _store(self, path, now, kind):
+        """ Cache a path kind and drop the least recently used paths.
+        """
+        if self.ttl <= 0:
+            return
+        self._entries[path] = (now, kind)
+        self._entries.move_to_end(path)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+def _mode_to_kind(mode):
+    """ Convert a stat mode to a path kind.
+    """
+    if stat.S_ISREG(mode):
+        return FILE
+    elif stat.S_ISDIR(mode):
+        return DIRECTORY
+    return OTHER
+
+
+# Shared path cache
+path_cache = PathCache()
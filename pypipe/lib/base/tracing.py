@@ -0,0 +1,114 @@
+##########################################################################
+# PyPipe - Copyright (C) AGrigis, 2017
+# Distributed under the terms of the CeCILL-B license, as published by
+# the CEA-CNRS-INRIA. Refer to the LICENSE file or to
+# http://www.cecill.info/licences/Licence_CeCILL-B_V1-en.html
+# for details.
+##########################################################################
+
+"""
+Module that defines lazy debug tracing tools.
+
+The debug messages are only formatted when the debug level is enabled, and
+the traced values are summarized: the arrays are described by their shape
+and type and the long descriptions are truncated.
+"""
+
+# System import
+import logging
+
+
+# Global parameters
+MAX_LENGTH = 80
+MAX_ITEMS = 8
+
+
+def is_tracing(logger):
+    """ Check if the debug messages of a logger are emitted.
+
+    Parameters
+    ----------
+    logger: Logger
+        a logger.
+
+    Returns
+    -------
+    is_tracing: bool
+        True if the debug level is enabled.
+    """
+    return logger.isEnabledFor(logging.DEBUG)
+
+
+def trace(logger, message, *args):
+    """ Emit a debug message with summarized values.
+
+    Nothing is formatted if the debug level is disabled.
+
+    Parameters
+    ----------
+    logger: Logger
+        a logger.
+    message: str
+        the message with '{0}', '{1}', ... fields.
+    args: list
+        the values to be summarized in the message fields.
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(message.format(*[summarize(arg) for arg in args]))
+
+
+def summarize(value, max_length=MAX_LENGTH):
+    """ Describe a value in a size capped string.
+
+    Parameters
+    ----------
+    value: object
+        a value.
+    max_length: int (optional, default 80)
+        the maximum length of the description.
+
+    Returns
+    -------
+    description: str
+        the value description.
+    """
+    if isinstance(value, str):
+        description = value
+    else:
+        description = _describe(value, depth=0)
+    if len(description) > max_length:
+        description = description[:max_length - 3] + "..."
+    return description
+
+
+def _describe(value, depth):
+    """ Describe a value without calling the representation of arrays or of
+    large containers.
+    """
+    if hasattr(value, "shape") and hasattr(value, "dtype"):
+        return "<{0} shape={1} dtype={2}>".format(
+            type(value).__name__, value.shape, value.dtype)
+    elif isinstance(value, (list, tuple, dict)):
+        if depth > 1:
+            return "<{0} of {1} items>".format(type(value).__name__,
+                                                len(value))
+        if isinstance(value, dict):
+            items = ["{0}: {1}".format(_describe(key, depth + 1),
+                                       _describe(item, depth + 1))
+                     for key, item in list(value.items())[:MAX_ITEMS]]
+            template = "{{{0}}}"
+        else:
+            items = [_describe(item, depth + 1)
+                     for item in list(value[:MAX_ITEMS])]
+            if isinstance(value, list):
+                template = "[{0}]"
+            elif len(value) == 1:
+                template = "({0},)"
+            else:
+                template = "({0})"
+        if len(value) > MAX_ITEMS:
+            items.append("... {0} items".format(len(value)))
+        return template.format(", ".join(items))
+    elif isinstance(value, str) and len(value) > MAX_LENGTH:
+        return repr(value[:MAX_LENGTH]) + "..."
+    return repr(value)
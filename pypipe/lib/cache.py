@@ -0,0 +1,351 @@
+##########################################################################
+# PyPipe - Copyright (C) AGrigis, 2017
+# Distributed under the terms of the CeCILL-B license, as published by
+# the CEA-CNRS-INRIA. Refer to the LICENSE file or to
+# http://www.cecill.info/licences/Licence_CeCILL-B_V1-en.html
+# for details.
+##########################################################################
+
+"""
+Module that defines a content-addressed cache for the function results.
+"""
+
+# System import
+import os
+import copy
+import pickle
+import hashlib
+import inspect
+import logging
+import tempfile
+import functools
+import time
+
+# Third party import
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Package import
+from .base import trace
+
+
+# Create a logger
+logger = logging.getLogger(__name__)
+
+
+class ResultCache(object):
+    """ Store function results on disk.
+
+    The results are indexed by a fingerprint computed from the function
+    module path, the function source code and the input values. Inputs
+    declared with a 'nohash' metadata are not part of the fingerprint, and
+    inputs declared with a 'copy' metadata are deep-copied before the
+    execution.
+
+    When the cache size exceeds the size limit, the least recently used
+    results are removed. The cache size is tracked in process and is only
+    computed again from the cache directory when the limit is exceeded or
+    every 'refresh_interval' seconds, since other processes may share the
+    directory.
+    """
+    refresh_interval = 60.
+
+    def __init__(self, cachedir, max_size=1024 ** 3):
+        """ Initialize the 'ResultCache' class.
+
+        Parameters
+        ----------
+        cachedir: str
+            the folder where the results are stored.
+        max_size: int (optional, default 1GB)
+            the cache size limit in bytes.
+        """
+        self.cachedir = cachedir
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._memoized = {}
+        self._size = None
+        self._scanned_at = None
+        if not os.path.isdir(self.cachedir):
+            os.makedirs(self.cachedir)
+
+    def fingerprint(self, module_path, source_hash, params, nohash=()):
+        """ Compute the fingerprint of a function call.
+
+        See the module 'fingerprint' function.
+        """
+        return fingerprint(module_path, source_hash, params, nohash)
+
+    def get(self, key):
+        """ Get a result from the cache.
+
+        Parameters
+        ----------
+        key: str
+            the call fingerprint.
+
+        Returns
+        -------
+        hit: bool
+            True if the result is in the cache.
+        value: object
+            the cached result.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as open_file:
+                value = pickle.load(open_file)
+        except (IOError, OSError, EOFError, pickle.UnpicklingError):
+            self.misses += 1
+            return False, None
+        try:
+            os.utime(path, None)
+        except FileNotFoundError:
+            # Evicted by another process meanwhile
+            pass
+        self.hits += 1
+        return True, value
+
+    def set(self, key, value):
+        """ Store a result in the cache.
+
+        Parameters
+        ----------
+        key: str
+            the call fingerprint.
+        value: object
+            the result to be cached.
+        """
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            trace(logger, "Can't cache '{0}' result.", key)
+            return
+        path = self._path(key)
+        try:
+            replaced_size = os.path.getsize(path)
+        except OSError:
+            replaced_size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=self.cachedir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as open_file:
+            open_file.write(data)
+        os.replace(tmp_path, path)
+        if (self._size is None or
+                time.monotonic() - self._scanned_at >= self.refresh_interval):
+            self._evict()
+            return
+        self._size += len(data) - replaced_size
+        if self._size > self.max_size:
+            self._evict()
+
+    def clear(self):
+        """ Remove all the cached results.
+        """
+        for entry in os.scandir(self.cachedir):
+            if entry.name.endswith(".pkl"):
+                try:
+                    os.remove(entry.path)
+                except FileNotFoundError:
+                    pass
+        self._size = None
+
+    def memoize(self, function):
+        """ Cache the results of a function.
+
+        Parameters
+        ----------
+        function: callable
+            a function returned by 'load_func_from_module_path'.
+
+        Returns
+        -------
+        memoized_function: callable
+            the function with the same special attributes that uses the
+            cache. Its '_cached_call' attribute executes the function
+            differently, eg. in a worker process, through the same cache
+            entries: it is called with the named parameters and a callable
+            that returns the function returned values on a cache miss.
+        """
+        if id(function) in self._memoized:
+            return self._memoized[id(function)][1]
+        input_names = function._input_names
+        input_meta = function._input_meta or [{}] * len(input_names)
+        nohash = set(name for name, meta in zip(input_names, input_meta)
+                     if meta.get("nohash", False))
+        to_copy = set(name for name, meta in zip(input_names, input_meta)
+                      if meta.get("copy", False))
+        module_path = getattr(function, "_module_path", "{0}.{1}".format(
+            function.__module__, function.__name__))
+        source_hash = function_hash(function)
+
+        def cached_call(params, execute):
+            """ Check the cache before executing the function.
+            """
+            key = self.fingerprint(module_path, source_hash, params, nohash)
+            if key is not None:
+                hit, value = self.get(key)
+                if hit:
+                    trace(logger, "Cache hit for '{0}'.", module_path)
+                    return value
+            value = execute()
+            if key is not None:
+                self.set(key, value)
+            return value
+
+        @functools.wraps(function)
+        def memoized_function(*args, **kwargs):
+            """ Check the cache before executing the function.
+            """
+            params = dict(zip(input_names, args))
+            params.update(kwargs)
+
+            def execute():
+                """ Execute the function with the copied parameters.
+                """
+                if not to_copy:
+                    return function(*args, **kwargs)
+                return function(
+                    *[copy.deepcopy(value) if name in to_copy else value
+                      for name, value in zip(input_names, args)],
+                    **dict((name, copy.deepcopy(value) if name in to_copy
+                            else value) for name, value in kwargs.items()))
+
+            return cached_call(params, execute)
+
+        setattr(memoized_function, "_cached_call", cached_call)
+        self._memoized[id(function)] = (function, memoized_function)
+        return memoized_function
+
+    def __getstate__(self):
+        """ The memoized functions and the tracked cache size are not
+        transmitted to other processes.
+        """
+        state = self.__dict__.copy()
+        state["_memoized"] = {}
+        state["_size"] = None
+        return state
+
+    def _path(self, key):
+        """ Get the file associated to a fingerprint.
+        """
+        return os.path.join(self.cachedir, key + ".pkl")
+
+    def _evict(self):
+        """ Remove the least recently used results until the cache size is
+        under the size limit, and update the tracked cache size.
+
+        Several processes may share the cache directory: the files removed
+        by another process are ignored.
+        """
+        entries = []
+        for entry in os.scandir(self.cachedir):
+            if not entry.name.endswith(".pkl"):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+        size = sum([item[1] for item in entries])
+        for _, entry_size, path in sorted(entries):
+            if size <= self.max_size:
+                break
+            trace(logger, "Evict '{0}' from the cache.", path)
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            size -= entry_size
+        self._size = size
+        self._scanned_at = time.monotonic()
+
+
+def fingerprint(module_path, source_hash, params, nohash=()):
+    """ Compute the fingerprint of a function call.
+
+    Parameters
+    ----------
+    module_path: str
+        the function module path.
+    source_hash: str
+        the function source code hash.
+    params: dict
+        the function input values.
+    nohash: set of str (optional)
+        the input names that are not part of the fingerprint.
+
+    Returns
+    -------
+    key: str
+        the call fingerprint, None if an input value can't be hashed.
+    """
+    hasher = hashlib.sha1()
+    hasher.update(module_path.encode("utf8"))
+    hasher.update(source_hash.encode("utf8"))
+    for name in sorted(params):
+        if name in nohash:
+            continue
+        hasher.update(name.encode("utf8"))
+        if not _hash_value(hasher, params[name]):
+            trace(logger, "Can't hash '{0}' input.", name)
+            return None
+    return hasher.hexdigest()
+
+
+def function_hash(function):
+    """ Compute the hash of a function source code.
+
+    Parameters
+    ----------
+    function: callable
+        a function.
+
+    Returns
+    -------
+    source_hash: str
+        the function source code hash.
+    """
+    return hashlib.sha1(
+        inspect.getsource(function).encode("utf8")).hexdigest()
+
+
+def _hash_value(hasher, value):
+    """ Update a hash with a value.
+
+    Arrays are hashed from their raw buffer, without copy if they are
+    contiguous, the other objects from their pickle representation. The
+    object arrays can't be hashed: their buffer contains pointers.
+
+    Parameters
+    ----------
+    hasher: hashlib object
+        the hash to update.
+    value: object
+        the value to hash.
+
+    Returns
+    -------
+    is_hashed: bool
+        False if the value can't be hashed.
+    """
+    if numpy is not None and isinstance(value, numpy.ndarray):
+        if value.dtype.hasobject:
+            return False
+        hasher.update(str(value.dtype).encode("utf8"))
+        hasher.update(str(value.shape).encode("utf8"))
+        hasher.update(memoryview(numpy.ascontiguousarray(value)).cast("B"))
+        return True
+    if (hasattr(value, "dtype") and hasattr(value, "shape") and
+            hasattr(value, "tobytes")):
+        hasher.update(str(value.dtype).encode("utf8"))
+        hasher.update(str(value.shape).encode("utf8"))
+        hasher.update(value.tobytes())
+        return True
+    try:
+        hasher.update(pickle.dumps(value, protocol=4))
+    except Exception:
+        return False
+    return True
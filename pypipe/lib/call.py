@@ -0,0 +1,183 @@
+##########################################################################
+# PyPipe - Copyright (C) AGrigis, 2017
+# Distributed under the terms of the CeCILL-B license, as published by
+# the CEA-CNRS-INRIA. Refer to the LICENSE file or to
+# http://www.cecill.info/licences/Licence_CeCILL-B_V1-en.html
+# for details.
+##########################################################################
+
+"""
+Module that defines a reusable function call with named parameters.
+"""
+
+# System import
+import time
+import logging
+import traceback
+
+# Package import
+from .engine import call_function
+from .engine import named_outputs
+from .engine import unnamed_outputs
+from .isolation import run_isolated
+from .base import is_tracing
+
+
+# Create a logger
+logger = logging.getLogger(__name__)
+
+
+class CallResult(object):
+    """ The result of a function call.
+
+    Attributes
+    ----------
+    `inputs`: dict
+        the function input values.
+    `outputs`: dict
+        the function output values, None if the call failed.
+    `elapsed`: float
+        the call duration in seconds.
+    `exception`: Exception
+        the raised exception, None if the call succeeded.
+    `traceback`: str
+        the formatted exception traceback, None if the call succeeded.
+    """
+    def __init__(self, inputs, outputs=None, elapsed=0., exception=None,
+                 traceback=None):
+        """ Initialize the 'CallResult' class.
+        """
+        self.inputs = inputs
+        self.outputs = outputs
+        self.elapsed = elapsed
+        self.exception = exception
+        self.traceback = traceback
+
+    @property
+    def success(self):
+        """ True if the call succeeded.
+        """
+        return self.exception is None
+
+    def __repr__(self):
+        """ Display the call status.
+        """
+        status = "ok" if self.success else repr(self.exception)
+        return "<CallResult {0} in {1:.3f}s>".format(status, self.elapsed)
+
+
+class BoundCall(object):
+    """ Call a function with bound named parameters.
+
+    The parameters are checked when they are bound. Each call dispatches the
+    parameters as keyword arguments, without building any source code, and
+    returns a 'CallResult' with the outputs, the duration and the error
+    details: the call itself never raises. A call that does not set all the
+    declared returns fails.
+
+    >>> call = BoundCall(function, nbins=10)
+    >>> result = call(data=data)
+    >>> result.outputs, result.elapsed
+    """
+    def __init__(self, function, isolated=False, runlog=None, **parameters):
+        """ Initialize the 'BoundCall' class.
+
+        Parameters
+        ----------
+        function: callable
+            a function returned by 'load_func_from_module_path'.
+        isolated: bool (optional, default False)
+            if set, execute the function in a worker process.
+        runlog: RunLog (optional, default None)
+            if set, record the calls measures in this log.
+        parameters: dict
+            the bound function parameters.
+        """
+        self.function = function
+        self.isolated = isolated
+        self.runlog = runlog
+        self.parameters = {}
+        self.bind(**parameters)
+
+    def bind(self, **parameters):
+        """ Bind function parameters.
+
+        Parameters
+        ----------
+        parameters: dict
+            the function parameters.
+        """
+        self._check(parameters)
+        self.parameters.update(parameters)
+
+    def __call__(self, **parameters):
+        """ Execute the function.
+
+        Parameters
+        ----------
+        parameters: dict
+            parameters that override the bound parameters for this call.
+
+        Returns
+        -------
+        result: CallResult
+            the call result.
+        """
+        inputs = dict(self.function._default_values)
+        inputs.update(self.parameters)
+        inputs.update(parameters)
+        start_time = time.perf_counter()
+        try:
+            self._check(parameters)
+            if self.runlog is None:
+                outputs = self._execute(inputs)
+            else:
+                func_name = getattr(
+                    self.function, "__name__", repr(self.function))
+                with self.runlog.measure(func_name, inputs) as record:
+                    outputs = self._execute(inputs)
+                    record.set_outputs(outputs)
+        except Exception as error:
+            result = CallResult(
+                inputs, elapsed=time.perf_counter() - start_time,
+                exception=error, traceback=traceback.format_exc())
+            if is_tracing(logger):
+                logger.debug("Call failed.\n{0}".format(result.traceback))
+        else:
+            result = CallResult(
+                inputs, outputs, elapsed=time.perf_counter() - start_time)
+        return result
+
+    def _execute(self, inputs):
+        """ Execute the function in process or in a worker process and
+        check that all the declared returns are set.
+
+        A memoized function executed in a worker process uses the cache of
+        this process.
+        """
+        cached_call = getattr(self.function, "_cached_call", None)
+        if self.isolated and cached_call is not None:
+            # The worker process loads the raw function: look up and store
+            # the result in the cache from this process
+            outputs = named_outputs(self.function, cached_call(
+                inputs, lambda: unnamed_outputs(
+                    self.function, run_isolated(self.function, inputs))))
+        elif self.isolated:
+            outputs = run_isolated(self.function, inputs)
+        else:
+            outputs = call_function(self.function, inputs)
+        missing = set(self.function._output_names) - set(outputs or {})
+        if len(missing) > 0:
+            raise ValueError("Missing returns {0} for {1}().".format(
+                sorted(missing), getattr(self.function, "__name__",
+                                         repr(self.function))))
+        return outputs
+
+    def _check(self, parameters):
+        """ Check that the parameters are function inputs.
+        """
+        unknown = set(parameters) - set(self.function._input_names)
+        if len(unknown) > 0:
+            raise ValueError("Unknown parameters {0} for {1}().".format(
+                sorted(unknown), getattr(self.function, "__name__",
+                                         repr(self.function))))
@@ -19,6 +19,8 @@ from .int import Int
 from .float import Float
 from .list import List
 from .base import Base
+from .compact import ControlSchema
+from .compact import CompactControl
 
 
 CONTROLS = {
@@ -12,6 +12,8 @@ import logging
 
 # Package import
 from pypipe.lib.base import Observable
+from pypipe.lib.base import is_tracing
+from pypipe.lib.base import summarize
 
 
 # Create a logger
@@ -24,7 +26,9 @@ class Base(Observable):
     In order to test the parameter type, a '_is_valid' has to be
     specified. This function returned a boolean and take one parameter.
 
-    Extra parameters are stored as class parameters.
+    Extra parameters are stored as class parameters. The 'value' signal only
+    sends the new value: the extra parameters are available as attributes of
+    the notifying control, i.e. the signal 'object'.
 
     A 'None' value is interpreted as an undefined parameter.
 
@@ -45,7 +49,19 @@ class Base(Observable):
         must be copied if some smart-caching strategies are used.
     `nohash`: bool
         tells us if the control must appear in the finger print of the function.
+    `item_types`: tuple of type
+        if set, the valid value types used to check a sequence of values in
+        bulk.
+    `array_kinds`: str
+        if set, the valid numpy dtype kinds used to check an array of values.
+    `array_typecodes`: str
+        if set, the valid 'array.array' typecodes used to check an array of
+        values.
     """
+    item_types = None
+    array_kinds = None
+    array_typecodes = None
+
     def __init__(self, value=None, is_output=False, is_optional=False,
                  *args, **kwargs):
         """ Initialize the 'Base' class.
@@ -101,6 +117,28 @@ class Base(Observable):
         raise NotImplementedError("A '_is_valid' method has to be defined "
                                   "in child classes.")
 
+    def _is_valid_items(self, values):
+        """ A method used to check the type of a sequence of values.
+
+        When the 'item_types' attribute is defined, only the distinct value
+        types are checked.
+
+        Parameters
+        ----------
+        values: list (mandatory)
+            the values we want to check the type.
+
+        Returns
+        -------
+        is_valid: bool
+            return True if all the values have the expected type,
+            False otherwise.
+        """
+        if self.item_types is not None:
+            return all(issubclass(item_type, self.item_types)
+                       for item_type in set(map(type, values)))
+        return all(map(self._is_valid, values))
+
     def _update_value(self, signal):
         """ Define an observer method that will update the current control
         value.
@@ -128,13 +166,15 @@ class Base(Observable):
         value: object (mandatory)
             the value we want to set.
         """
-        logger.debug("Update value::")
-        logger.debug("{0}: {1}".format(self.name, value))
+        tracing = is_tracing(logger)
+        if tracing:
+            logger.debug("Update value::")
+            logger.debug("{0}: {1}".format(self.name, summarize(value)))
         if not self.inner:
             if self._is_valid(value):
                 self._value = value
                 self.valid = True
-                self.notify_observers("value", value=value, **self.kwargs)
+                self.notify_observers("value", value=value)
             else:
                 if self.is_optional and self.value is None:
                     self.valid = True
@@ -147,7 +187,8 @@ class Base(Observable):
                         "'{4}'({5}).".format(self.name, type(self), self._value,
                                              type(self._value), value,
                                              type(value)))
-        logger.debug("update: {0}".format(self.valid))
-        logger.debug("Update value done.")
+        if tracing:
+            logger.debug("update: {0}".format(self.valid))
+            logger.debug("Update value done.")
 
     value = property(lambda x: x._value, _set_value)
@@ -0,0 +1,208 @@
+##########################################################################
+# PyPipe - Copyright (C) AGrigis, 2017
+# Distributed under the terms of the CeCILL-B license, as published by
+# the CEA-CNRS-INRIA. Refer to the LICENSE file or to
+# http://www.cecill.info/licences/Licence_CeCILL-B_V1-en.html
+# for details.
+##########################################################################
+
+"""
+Module that defines a compact control representation for the headless
+executions.
+"""
+
+# Package import
+from pypipe.lib.base.observable import ObservableInterface
+from pypipe.lib.base.observable import SignalObject
+from .base import Base
+
+
+class ControlSchema(object):
+    """ The description shared by the compact controls of a parameter.
+
+    The control type, the input/output and optional flags and the extra
+    parameters are stored once in a prototype control: the compact controls
+    created from the schema only store their value.
+
+    >>> schema = ControlSchema("Enum", choices=("a", "b"))
+    >>> controls = [schema(value) for value in ("a", "b", "a")]
+    """
+    def __init__(self, control_type, is_output=False, is_optional=False,
+                 **kwargs):
+        """ Initialize the 'ControlSchema' class.
+
+        Parameters
+        ----------
+        control_type: str or class
+            the control type, a name of the 'CONTROLS' mapping or a control
+            class.
+        is_output: bool (optional, default False)
+            is the control an output or an input.
+        is_optional: bool (optional, default False)
+            is the control optional or not.
+        kwargs: dict
+            the control extra parameters.
+        """
+        # Avoid cycling import
+        from pypipe.lib.controls import CONTROLS as controls
+
+        if isinstance(control_type, str):
+            if control_type not in controls:
+                raise ValueError(
+                    "'{0}' is not a valid control type. Allowed types are "
+                    "{1}.".format(control_type, controls.keys()))
+            control_type = controls[control_type]
+        self.control_type = control_type
+        self.prototype = control_type(
+            is_output=is_output, is_optional=is_optional, **kwargs)
+
+    @property
+    def kwargs(self):
+        """ The extra parameters shared by the compact controls.
+        """
+        return self.prototype.kwargs
+
+    def __call__(self, value=None):
+        """ Create a compact control.
+
+        Parameters
+        ----------
+        value: object (optional, default None)
+            the control value.
+
+        Returns
+        -------
+        control: CompactControl
+            the new control.
+        """
+        return CompactControl(self, value)
+
+
+class CompactControl(ObservableInterface):
+    """ A slotted control created from a 'ControlSchema'.
+
+    The control stores its value and its validity only: the value checks
+    and the other attributes are read from the schema prototype. The
+    observers state is created with the first observer.
+    """
+    __slots__ = ("schema", "_value", "valid", "_allowed_signals",
+                 "_observers", "_signals", "_prune", "_locked", "_queue",
+                 "_queue_lock", "_dispatcher", "__weakref__")
+    signals = ("value", )
+
+    def __init__(self, schema, value=None):
+        """ Initialize the 'CompactControl' class.
+
+        Parameters
+        ----------
+        schema: ControlSchema
+            the control description.
+        value: object (optional, default None)
+            the control value.
+        """
+        self.schema = schema
+        self._value = None
+        self._allowed_signals = self.signals
+        self._observers = None
+        self._signals = None
+        self._prune = None
+        self._locked = False
+        self._queue = None
+        self._queue_lock = None
+        self._dispatcher = None
+        if value is None:
+            self.valid = schema.prototype.valid
+        else:
+            self.valid = False
+            self._set_value(value)
+
+    def __getattr__(self, name):
+        """ Get the public attributes from the schema prototype.
+        """
+        if name.startswith("_"):
+            raise AttributeError(
+                "'{0}' object has no attribute '{1}'.".format(
+                    type(self).__name__, name))
+        return getattr(self.schema.prototype, name)
+
+    def _is_valid(self, value):
+        """ Check the value with the schema prototype.
+        """
+        return self.schema.prototype._is_valid(value)
+
+    _update_value = Base._update_value
+    _set_value = Base._set_value
+    value = property(lambda x: x._value, _set_value)
+
+    ######################################################################
+    # Observable interface
+    ######################################################################
+
+    def add_observer(self, signal, observer):
+        """ Add an observer to the control.
+
+        Parameters
+        ----------
+        signal: str
+            a valid signal.
+        observer: @func
+            a function that will be called when the signal is emitted.
+        """
+        self._is_allowed_signal(signal)
+        if self._observers is None:
+            self._observers = dict((name, ()) for name in self.signals)
+            self._signals = dict(
+                (name, SignalObject(name)) for name in self.signals)
+        self._add_observer(signal, observer)
+
+    def remove_observer(self, signal, observer):
+        """ Remove an observer from the control.
+
+        Parameters
+        ----------
+        signal: str
+            a valid signal.
+        observer: @func
+            an obervation function to be removed.
+        """
+        self._is_allowed_signal(signal)
+        if self._observers is not None:
+            self._remove_observer(signal, observer)
+
+    def notify_observers(self, signal, **kwargs):
+        """ Notify observers of a given signal.
+
+        Parameters
+        ----------
+        signal: str
+            a valid signal.
+        kwargs: dict
+            the parameters that will be sent to the observers.
+
+        Returns
+        -------
+        out: bool
+            Fasle if a notification is in progress and the queue mode is
+            disabled, otherwise True.
+        """
+        if self._observers is None:
+            return True
+        return ObservableInterface.notify_observers(self, signal, **kwargs)
+
+    def observers(self, signal):
+        """ Get the live observers of a signal.
+
+        Parameters
+        ----------
+        signal: str
+            a valid signal.
+
+        Returns
+        -------
+        observers: list of @func
+            the observers that will be called when the signal is emitted.
+        """
+        self._is_allowed_signal(signal)
+        if self._observers is None:
+            return []
+        return ObservableInterface.observers(self, signal)
@@ -6,15 +6,15 @@
 # for details.
 ##########################################################################
 
-# System import
-import os
-
 # Package import
+from pypipe.lib.base import path_cache
 from .base import Base
 
 
 class File(Base):
     """ Define a file parameter.
+
+    The file system is accessed through the shared path cache.
     """
     def _is_valid(self, value):
         """ A method used to check if the value is a file name.
@@ -30,7 +30,26 @@ class File(Base):
             return True if the value is a file,
             False otherwise.
         """
-        if isinstance(value, str) and os.path.isfile(value):
+        if isinstance(value, str) and path_cache.isfile(value):
             return True
         else:
             return False
+
+    def _is_valid_items(self, values):
+        """ A method used to check a sequence of files in bulk.
+
+        The parent directories are listed only once.
+
+        Parameters
+        ----------
+        values: list (mandatory)
+            the values we want to check.
+
+        Returns
+        -------
+        is_valid: bool
+            return True if all the values are files,
+            False otherwise.
+        """
+        return (all(isinstance(value, str) for value in values) and
+                path_cache.isfiles(values))
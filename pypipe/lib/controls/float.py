@@ -13,6 +13,10 @@ from .base import Base
 class Float(Base):
     """ Define a float parameter.
     """
+    item_types = (float, )
+    array_kinds = "f"
+    array_typecodes = "fd"
+
     def _is_valid(self, value):
         """ A method used to check if the value is valid.
 
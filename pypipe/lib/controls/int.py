@@ -13,6 +13,10 @@ from .base import Base
 class Int(Base):
     """ Define an integer parameter.
     """
+    item_types = (int, )
+    array_kinds = "iu"
+    array_typecodes = "bBhHiIlLqQ"
+
     def _is_valid(self, value):
         """ A method used to check if the value is valid.
 
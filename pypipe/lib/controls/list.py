@@ -6,12 +6,25 @@
 # for details.
 ##########################################################################
 
+# System import
+import array
+
 # Package import
 from .base import Base
 
+# Third party import
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class List(Base):
     """ Define a list parameter.
+
+    A list value can also be a numpy array or an 'array.array' buffer when
+    the innermost control supports bulk array validation: in this case the
+    dtype and the number of dimensions are checked in one pass.
     """
     def __init__(self, value=None, *args, **kwargs):
         """ Initialize the 'List' class.
@@ -27,7 +40,7 @@ class List(Base):
             the parameter value.
         """
         # Avoid cycling import
-        from pypipe.lib.controls import controls
+        from pypipe.lib.controls import CONTROLS as controls
 
         # Check if a 'content' argument has been defined
         if "content" not in kwargs:
@@ -45,6 +58,12 @@ class List(Base):
                              "control type. Allowed types are {1}.".format(
                                  kwargs["content"], controls.keys()))
         self.inner_control = controls[control_type](**inner_kwargs)
+        if isinstance(self.inner_control, List):
+            self._depth = self.inner_control._depth + 1
+            self._leaf_control = self.inner_control._leaf_control
+        else:
+            self._depth = 1
+            self._leaf_control = self.inner_control
 
         # Create the list control
         Base.__init__(self, value, *args, **kwargs)
@@ -67,9 +86,14 @@ class List(Base):
         if value is None:
             return True
         elif isinstance(value, list):
-            for item in value:
-                if not self.inner_control._is_valid(item):
-                    return False
-            return True
+            return self.inner_control._is_valid_items(value)
+        elif numpy is not None and isinstance(value, numpy.ndarray):
+            return (self._leaf_control.array_kinds is not None and
+                    value.ndim == self._depth and
+                    value.dtype.kind in self._leaf_control.array_kinds)
+        elif isinstance(value, array.array):
+            return (self._leaf_control.array_typecodes is not None and
+                    self._depth == 1 and
+                    value.typecode in self._leaf_control.array_typecodes)
         else:
             return False
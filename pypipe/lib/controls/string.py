@@ -16,6 +16,8 @@ from .base import Base
 class String(Base):
     """ Define a string parameter.
     """
+    item_types = (str, bytes)
+
     def _is_valid(self, value):
         """ A method used to check if the value is a string.
 
@@ -0,0 +1,413 @@
+##########################################################################
+# PyPipe - Copyright (C) AGrigis, 2017
+# Distributed under the terms of the CeCILL-B license, as published by
+# the CEA-CNRS-INRIA. Refer to the LICENSE file or to
+# http://www.cecill.info/licences/Licence_CeCILL-B_V1-en.html
+# for details.
+##########################################################################
+
+"""
+Module that defines a headless engine to execute the functions declared in a
+menu configuration without any graphical dependency.
+"""
+
+# System import
+import json
+import logging
+import itertools
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+# Package import
+from .utils import load_func_from_module_path
+from .controls import CONTROLS
+from .controls import ControlSchema
+from .instrumentation import RunLog
+from .base import trace
+
+
+# Create a logger
+logger = logging.getLogger(__name__)
+
+
+def split_parameters(params):
+    """ Split a menu function parameters description.
+
+    Parameters
+    ----------
+    params: list
+        each item is a control type or a 2-uplet with a control type and the
+        associated metadata.
+
+    Returns
+    -------
+    types: list of str
+        the control types.
+    metas: list of dict
+        the controls associated metadata.
+    """
+    params = [param if isinstance(param, (tuple, list)) else (param, {})
+              for param in params]
+    return [param[0] for param in params], [param[1] for param in params]
+
+
+def walk_menu(menu, parent_module=""):
+    """ Go through all the functions declared in a menu.
+
+    Parameters
+    ----------
+    menu: hierachic dict
+        each key is a sub module of the module. Leafs contain a list with
+        the function module path, the input and output parameters.
+    parent_module: str (optional)
+        the parent module string description ('module.sub_module').
+
+    Returns
+    -------
+    functions: generator of 2-uplet
+        the function menu path and the function description.
+    """
+    for module_name, child_modules in menu.items():
+        if parent_module:
+            current_module = parent_module + "." + module_name
+        else:
+            current_module = module_name
+        if isinstance(child_modules, dict):
+            for item in walk_menu(child_modules, current_module):
+                yield item
+        else:
+            yield current_module, child_modules
+
+
+def find_function(menu, function_path):
+    """ Get a function description from a menu.
+
+    Parameters
+    ----------
+    menu: hierachic dict
+        the menu where the function is declared.
+    function_path: str
+        the function menu path: the menu keys joined with a '.', or the
+        function module path.
+
+    Returns
+    -------
+    description: list
+        the function module path, the input and output parameters.
+    """
+    for menu_path, description in walk_menu(menu):
+        if function_path in (menu_path, description[0]):
+            return description
+    raise ValueError("'{0}' is not declared in the menu.".format(
+        function_path))
+
+
+def load_menu_function(description, trusted=False):
+    """ Load a function from its menu description.
+
+    Parameters
+    ----------
+    description: list
+        the function module path, the input and output parameters.
+    trusted: bool (optional, default False)
+        if set, the input/output types are not checked during the function
+        calls.
+
+    Returns
+    -------
+    func: callable
+        the loaded function as returned by 'load_func_from_module_path'.
+    """
+    func_module_path, input_params, output_params = description
+    input_types, input_meta = split_parameters(input_params)
+    output_types, output_meta = split_parameters(output_params)
+    return load_func_from_module_path(
+        func_module_path=func_module_path,
+        input_arg_types=input_types,
+        output_arg_types=output_types,
+        input_meta=input_meta,
+        output_meta=output_meta,
+        trusted=trusted)
+
+
+def input_schemas(function):
+    """ Get the control schemas of a loaded function inputs.
+
+    The schemas are created once and stored in the '_input_schemas' function
+    attribute: checking a parameter set only creates compact controls. The
+    inputs whose type has no headless control, eg. 'Objects', are not
+    described.
+
+    Parameters
+    ----------
+    function: callable
+        a function returned by 'load_func_from_module_path'.
+
+    Returns
+    -------
+    schemas: dict
+        the 'ControlSchema' of each described input.
+    """
+    schemas = getattr(function, "_input_schemas", None)
+    if schemas is None:
+        schemas = {}
+        input_meta = function._input_meta or [{}] * len(function._input_names)
+        for name, control_type, meta in zip(
+                function._input_names, function._input_types, input_meta):
+            if control_type in CONTROLS:
+                schemas[name] = ControlSchema(control_type, **meta)
+        setattr(function, "_input_schemas", schemas)
+    return schemas
+
+
+def check_parameters(function, parameters):
+    """ Check the parameter values with the function input control schemas.
+
+    The inputs are not optional here: the missing parameters are set with the
+    function default values, hence each provided value must be valid, except
+    an explicit None for an input whose default value is None.
+
+    Parameters
+    ----------
+    function: callable
+        a function returned by 'load_func_from_module_path'.
+    parameters: dict
+        the function parameters.
+    """
+    schemas = input_schemas(function)
+    defaults = function._default_values
+    invalid = sorted(
+        name for name, value in parameters.items()
+        if name in schemas and not (
+            value is None and name in defaults and defaults[name] is None)
+        and not schemas[name](value).valid)
+    if len(invalid) > 0:
+        raise ValueError("Invalid parameters {0} for {1}().".format(
+            invalid, function.__name__))
+
+
+def load_parameter_sets(parameters):
+    """ Expand a parameter file content.
+
+    Parameters
+    ----------
+    parameters: list of dict or dict of list
+        either the explicit list of parameter sets, or a grid where each
+        parameter is associated to a list of values: in this case all the
+        combinations are generated.
+
+    Returns
+    -------
+    parameter_sets: list of dict
+        the parameter sets.
+    """
+    if isinstance(parameters, list):
+        return parameters
+    names = sorted(parameters.keys())
+    return [dict(zip(names, values)) for values in itertools.product(
+        *[parameters[name] for name in names])]
+
+
+def run_parameter_set(description, parameters, cache=None, trusted=False,
+                      runlog=None):
+    """ Execute a function with one parameter set.
+
+    The missing parameters are set with the function default values.
+
+    Parameters
+    ----------
+    description: list
+        the function module path, the input and output parameters.
+    parameters: dict
+        the function parameters.
+    cache: ResultCache (optional, default None)
+        if set, use this cache to store/retrieve the function results.
+    trusted: bool (optional, default False)
+        if set, the parameter values and the input/output types are not
+        checked.
+    runlog: RunLog (optional, default None)
+        if set, record the call measures in this log.
+
+    Returns
+    -------
+    outputs: dict
+        the function outputs.
+    """
+    function = load_menu_function(description, trusted=trusted)
+    unknown = set(parameters) - set(function._input_names)
+    if len(unknown) > 0:
+        raise ValueError("Unknown parameters {0} for {1}().".format(
+            sorted(unknown), function.__name__))
+    if not trusted:
+        check_parameters(function, parameters)
+    if cache is not None:
+        function = cache.memoize(function)
+    if runlog is not None:
+        function = runlog.instrument(function)
+    return call_function(function, parameters)
+
+
+def call_function(function, parameters):
+    """ Call a loaded function with named parameters.
+
+    The missing parameters are set with the function default values.
+
+    Parameters
+    ----------
+    function: callable
+        a function returned by 'load_func_from_module_path'.
+    parameters: dict
+        the function parameters.
+
+    Returns
+    -------
+    outputs: dict
+        the function outputs.
+    """
+    kwargs = dict(function._default_values)
+    kwargs.update(parameters)
+    return named_outputs(function, function(**kwargs))
+
+
+def named_outputs(function, return_values):
+    """ Name the values returned by a loaded function.
+
+    Parameters
+    ----------
+    function: callable
+        a function returned by 'load_func_from_module_path'.
+    return_values: object
+        the function returned values.
+
+    Returns
+    -------
+    outputs: dict
+        the function outputs.
+    """
+    if len(function._output_names) == 0:
+        return {}
+    elif len(function._output_names) == 1:
+        return_values = (return_values, )
+    return dict(zip(function._output_names, return_values))
+
+
+def unnamed_outputs(function, outputs):
+    """ Get the values returned by a loaded function from its named outputs,
+    the reverse of 'named_outputs'.
+
+    Parameters
+    ----------
+    function: callable
+        a function returned by 'load_func_from_module_path'.
+    outputs: dict
+        the function outputs.
+
+    Returns
+    -------
+    return_values: object
+        the function returned values.
+    """
+    if len(function._output_names) == 0:
+        return None
+    elif len(function._output_names) == 1:
+        return outputs[function._output_names[0]]
+    return tuple(outputs[name] for name in function._output_names)
+
+
+def _run_parameter_set(description, parameters, cache=None, trusted=False,
+                       instrument=False, trace_memory=False):
+    """ Execute a function with one parameter set and catch errors.
+
+    Returns
+    -------
+    result: dict
+        the 'parameters', the 'outputs', the 'error' traceback if the
+        execution failed and the 'run' record if the call is instrumented.
+    """
+    runlog = RunLog(trace_memory=trace_memory) if instrument else None
+    try:
+        outputs = run_parameter_set(description, parameters, cache, trusted,
+                                    runlog)
+        error = None
+    except:
+        outputs = None
+        error = traceback.format_exc()
+        logger.error("Error during function execution.\n{0}".format(error))
+    result = {"parameters": parameters, "outputs": outputs, "error": error}
+    if runlog is not None and len(runlog.records) > 0:
+        result["run"] = runlog.records[-1]
+    return result
+
+
+def run_batch(description, parameter_sets, jobs=1, cache=None,
+              trusted=False, runlog=None):
+    """ Execute a function with many parameter sets.
+
+    Parameters
+    ----------
+    description: list
+        the function module path, the input and output parameters.
+    parameter_sets: list of dict
+        the function parameter sets.
+    jobs: int (optional, default 1)
+        the number of worker processes, if lower or equal to one the
+        parameter sets are executed sequentially in the current process.
+    cache: ResultCache (optional, default None)
+        if set, use this cache to store/retrieve the function results.
+    trusted: bool (optional, default False)
+        if set, the parameter values and the input/output types are not
+        checked.
+    runlog: RunLog (optional, default None)
+        if set, record the calls measures in this log, including the calls
+        executed in the worker processes.
+
+    Returns
+    -------
+    results: list of dict
+        for each parameter set, the 'parameters', the 'outputs' and the
+        'error' traceback if the execution failed.
+    """
+    trace(logger, "Run batch::\nfunction: {0}\nparameter sets: {1}\n"
+          "jobs: {2}", description[0], len(parameter_sets), jobs)
+    instrument = runlog is not None
+    trace_memory = instrument and runlog.trace_memory
+    if jobs <= 1:
+        results = [
+            _run_parameter_set(description, parameters, cache, trusted,
+                               instrument, trace_memory)
+            for parameters in parameter_sets]
+    else:
+        chunksize = max(1, len(parameter_sets) // (4 * jobs))
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(
+                _run_parameter_set, itertools.repeat(description),
+                parameter_sets, itertools.repeat(cache),
+                itertools.repeat(trusted), itertools.repeat(instrument),
+                itertools.repeat(trace_memory), chunksize=chunksize))
+    for result in results:
+        if "run" in result:
+            runlog.add(result.pop("run"))
+    trace(logger, "Run batch done.")
+    return results
+
+
+def save_results(results, outfile):
+    """ Save batch results in a JSON file.
+
+    Arrays are converted to lists and the other non serializable objects
+    are stored with their representation.
+
+    Parameters
+    ----------
+    results: list of dict
+        the batch results.
+    outfile: str
+        the destination file.
+    """
+    def _default(obj):
+        if hasattr(obj, "tolist"):
+            return obj.tolist()
+        return repr(obj)
+
+    with open(outfile, "wt") as open_file:
+        json.dump(results, open_file, indent=4, default=_default)
@@ -55,3 +55,15 @@ class InvalidReturnNumberError(ValueError):
  
     def __str__(self):
         return self.error
+
+
+class IsolatedExecutionError(RuntimeError):
+    """ Raised when a function executed in a worker process failed or when
+    the worker process crashed.
+    """
+    def __init__(self, func_name, reason):
+        self.error = "Isolated execution of {0}() failed: {1}".format(
+            func_name, reason)
+
+    def __str__(self):
+        return self.error
@@ -0,0 +1,336 @@
+##########################################################################
+# PyPipe - Copyright (C) AGrigis, 2017
+# Distributed under the terms of the CeCILL-B license, as published by
+# the CEA-CNRS-INRIA. Refer to the LICENSE file or to
+# http://www.cecill.info/licences/Licence_CeCILL-B_V1-en.html
+# for details.
+##########################################################################
+
+"""
+Module that defines tools to measure the function calls duration and
+memory usage.
+"""
+
+# System import
+import csv
+import sys
+import json
+import time
+import logging
+import threading
+import functools
+import contextlib
+import tracemalloc
+
+# Third party import
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Package import
+from .base import Observable
+
+
+# Create a logger
+logger = logging.getLogger(__name__)
+
+# The memory tracing is shared by the concurrent measures
+_tracing_lock = threading.Lock()
+_tracing_users = 0
+_tracing_started = False
+
+
+class RunRecord(object):
+    """ The measures of a function call.
+
+    Attributes
+    ----------
+    `function`: str
+        the function name.
+    `start`: float
+        the call start time as a timestamp.
+    `wall_time`: float
+        the call duration in seconds.
+    `cpu_time`: float
+        the CPU time used by the calling thread during the call in seconds.
+    `peak_memory`: int
+        the peak of the memory allocated by python during the call in bytes,
+        None if the memory is not traced.
+    `process_max_rss`: int
+        the maximum resident set size reached by the process since it
+        started, read after the call in bytes, None if not available.
+    `input_size`: int
+        the approximate size of the inputs in bytes.
+    `output_size`: int
+        the approximate size of the outputs in bytes.
+    `error`: str
+        the error message if the call failed, None otherwise.
+    """
+    fields = ("function", "start", "wall_time", "cpu_time", "peak_memory",
+              "process_max_rss", "input_size", "output_size", "error")
+
+    def __init__(self, function, inputs=None):
+        """ Initialize the 'RunRecord' class.
+
+        Parameters
+        ----------
+        function: str
+            the function name.
+        inputs: dict (optional, default None)
+            the function input values.
+        """
+        self.function = function
+        self.start = time.time()
+        self.wall_time = None
+        self.cpu_time = None
+        self.peak_memory = None
+        self.process_max_rss = None
+        self.input_size = sizeof(list((inputs or {}).values()))
+        self.output_size = None
+        self.error = None
+
+    def set_outputs(self, outputs):
+        """ Measure the function outputs size.
+
+        Parameters
+        ----------
+        outputs: object
+            the function outputs.
+        """
+        if isinstance(outputs, dict):
+            outputs = list(outputs.values())
+        self.output_size = sizeof(outputs)
+
+    def to_dict(self):
+        """ Convert the record to a dictionary.
+        """
+        return dict((name, getattr(self, name)) for name in self.fields)
+
+    def __repr__(self):
+        """ Display the main measures.
+        """
+        return "<RunRecord {0} {1:.3f}s>".format(
+            self.function, self.wall_time or 0.)
+
+
+class RunLog(Observable):
+    """ Collect the measures of function calls.
+
+    A 'record' signal is emitted with the new record each time a call is
+    measured, possibly from a worker thread: the notifications are queued and
+    delivered in order.
+    """
+    def __init__(self, trace_memory=False):
+        """ Initialize the 'RunLog' class.
+
+        Parameters
+        ----------
+        trace_memory: bool (optional, default False)
+            if set, trace the python memory allocations during the calls with
+            'tracemalloc': the peak is process wide, shared by the concurrent
+            calls, and slows down the calls.
+        """
+        Observable.__init__(self, ["record"])
+        self.enable_queue()
+        self.trace_memory = trace_memory
+        self.records = []
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def measure(self, function, inputs=None):
+        """ Measure a function call.
+
+        Parameters
+        ----------
+        function: str
+            the function name.
+        inputs: dict (optional, default None)
+            the function input values.
+
+        Returns
+        -------
+        record: RunRecord
+            the call record: the outputs must be set with 'set_outputs'.
+        """
+        record = RunRecord(function, inputs)
+        if self.trace_memory:
+            _start_tracing()
+        start_cpu = time.thread_time()
+        start_wall = time.perf_counter()
+        try:
+            yield record
+        except Exception as error:
+            record.error = repr(error)
+            raise
+        finally:
+            record.wall_time = time.perf_counter() - start_wall
+            record.cpu_time = time.thread_time() - start_cpu
+            if self.trace_memory:
+                record.peak_memory = _stop_tracing()
+            record.process_max_rss = max_rss()
+            self.add(record)
+
+    def instrument(self, function):
+        """ Measure all the calls of a function.
+
+        Parameters
+        ----------
+        function: callable
+            a function returned by 'load_func_from_module_path'.
+
+        Returns
+        -------
+        instrumented_function: callable
+            the function with the same special attributes that records each
+            call in the log.
+        """
+        input_names = getattr(function, "_input_names", [])
+        func_name = getattr(function, "__name__", repr(function))
+
+        @functools.wraps(function)
+        def instrumented_function(*args, **kwargs):
+            """ Measure the function call.
+            """
+            inputs = dict(zip(input_names, args))
+            inputs.update(kwargs)
+            with self.measure(func_name, inputs) as record:
+                outputs = function(*args, **kwargs)
+                record.set_outputs(outputs)
+            return outputs
+
+        return instrumented_function
+
+    def add(self, record):
+        """ Add a record and emit the 'record' signal.
+
+        Parameters
+        ----------
+        record: RunRecord
+            a function call record.
+        """
+        with self._lock:
+            self.records.append(record)
+        self.notify_observers("record", record=record)
+
+    def to_json(self, outfile):
+        """ Save the records in a JSON file.
+
+        Parameters
+        ----------
+        outfile: str
+            the destination file.
+        """
+        with open(outfile, "wt") as open_file:
+            json.dump([record.to_dict() for record in self.records],
+                      open_file, indent=4)
+
+    def to_csv(self, outfile):
+        """ Save the records in a CSV file.
+
+        Parameters
+        ----------
+        outfile: str
+            the destination file.
+        """
+        with open(outfile, "wt", newline="") as open_file:
+            writer = csv.DictWriter(open_file, fieldnames=RunRecord.fields)
+            writer.writeheader()
+            for record in self.records:
+                writer.writerow(record.to_dict())
+
+    def save(self, outfile):
+        """ Save the records in a CSV file if the file extension is '.csv',
+        in a JSON file otherwise.
+        """
+        if outfile.lower().endswith(".csv"):
+            self.to_csv(outfile)
+        else:
+            self.to_json(outfile)
+
+
+def sizeof(value):
+    """ Get the approximate size of a value.
+
+    The arrays size is the size of their data, the containers size is the
+    sum of the size of their items (only one level deep).
+
+    Parameters
+    ----------
+    value: object
+        a value.
+
+    Returns
+    -------
+    size: int
+        the value size in bytes.
+    """
+    if hasattr(value, "nbytes"):
+        return int(value.nbytes)
+    elif isinstance(value, (list, tuple)):
+        return sum([_item_sizeof(item) for item in value])
+    elif isinstance(value, dict):
+        return sum([_item_sizeof(item) for item in value.values()])
+    return sys.getsizeof(value)
+
+
+def _item_sizeof(value):
+    """ Get the approximate size of a container item.
+    """
+    if hasattr(value, "nbytes"):
+        return int(value.nbytes)
+    return sys.getsizeof(value)
+
+
+def _start_tracing():
+    """ Start tracing the python memory allocations for a measure.
+
+    The tracing is started by the first measure and the peak is reset: the
+    concurrent measures share the same tracing.
+    """
+    global _tracing_users, _tracing_started
+    with _tracing_lock:
+        if _tracing_users == 0:
+            if tracemalloc.is_tracing():
+                tracemalloc.reset_peak()
+            else:
+                tracemalloc.start()
+                _tracing_started = True
+        _tracing_users += 1
+
+
+def _stop_tracing():
+    """ Stop tracing the python memory allocations for a measure.
+
+    The tracing is stopped by the last measure if it has been started by a
+    measure.
+
+    Returns
+    -------
+    peak: int
+        the peak of the traced memory in bytes.
+    """
+    global _tracing_users, _tracing_started
+    with _tracing_lock:
+        peak = tracemalloc.get_traced_memory()[1]
+        _tracing_users -= 1
+        if _tracing_users == 0 and _tracing_started:
+            tracemalloc.stop()
+            _tracing_started = False
+    return peak
+
+
+def max_rss():
+    """ Get the process maximum resident set size.
+
+    Returns
+    -------
+    size: int
+        the maximum resident set size in bytes, None if not available.
+    """
+    if resource is None:
+        return None
+    size = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform != "darwin":
+        size *= 1024
+    return size
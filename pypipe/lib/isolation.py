@@ -0,0 +1,220 @@
+##########################################################################
+# PyPipe - Copyright (C) AGrigis, 2017
+# Distributed under the terms of the CeCILL-B license, as published by
+# the CEA-CNRS-INRIA. Refer to the LICENSE file or to
+# http://www.cecill.info/licences/Licence_CeCILL-B_V1-en.html
+# for details.
+##########################################################################
+
+"""
+Module that defines an isolated execution mode: the functions are executed
+in a worker process and the arrays are transfered through shared memory.
+"""
+
+# System import
+import gc
+import logging
+import traceback
+import multiprocessing
+from multiprocessing import shared_memory
+
+# Third party import
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Package import
+from .engine import call_function
+from .exceptions import IsolatedExecutionError
+from .utils import load_func_from_module_path
+from .base import trace
+
+
+# Create a logger
+logger = logging.getLogger(__name__)
+
+
+# Marker of the shared arrays descriptions
+SHARED_ARRAY = "__pypipe_shared_array__"
+
+
+def run_isolated(function, parameters, timeout=None):
+    """ Execute a function in a worker process.
+
+    A new process is spawned for each call so that a crash or a memory
+    leak in the function does not affect the current process. The arrays
+    are copied in shared memory blocks and only the blocks descriptions are
+    sent to/received from the worker: the arrays are never pickled.
+
+    The output arrays are copied from their shared memory blocks in regular
+    arrays and the blocks are released: while an output is received, the
+    current process needs twice its size.
+
+    Parameters
+    ----------
+    function: callable
+        a function returned by 'load_func_from_module_path'.
+    parameters: dict
+        the function parameters.
+    timeout: float (optional, default None)
+        the maximum execution time in seconds.
+
+    Returns
+    -------
+    outputs: dict
+        the function outputs.
+    """
+    func_name = getattr(function, "__name__", repr(function))
+    spec = (function._module_path, function._input_types,
+            function._output_types, function._input_meta,
+            function._output_meta, getattr(function, "_trusted", False))
+    context = multiprocessing.get_context("spawn")
+    blocks = []
+    parent_conn, child_conn = context.Pipe(duplex=False)
+    try:
+        shared_parameters = dict(
+            (name, _share(value, blocks))
+            for name, value in parameters.items())
+        process = context.Process(
+            target=_isolated_main, args=(spec, shared_parameters, child_conn),
+            name="pypipe-{0}".format(func_name), daemon=True)
+        process.start()
+        child_conn.close()
+        trace(logger, "Isolated execution of '{0}' in process {1}.",
+              func_name, process.pid)
+        try:
+            if not parent_conn.poll(timeout):
+                process.terminate()
+                raise IsolatedExecutionError(
+                    func_name, "timeout after {0}s".format(timeout))
+            status, result = parent_conn.recv()
+        except EOFError:
+            process.join()
+            raise IsolatedExecutionError(
+                func_name, "the worker process exited with code {0}".format(
+                    process.exitcode))
+        finally:
+            process.join()
+    finally:
+        parent_conn.close()
+        for block in blocks:
+            block.close()
+            block.unlink()
+    if status == "error":
+        raise IsolatedExecutionError(func_name, "\n" + result)
+    return dict((name, _unshare(value)) for name, value in result.items())
+
+
+def _isolated_main(spec, shared_parameters, conn):
+    """ Worker process entry point.
+
+    Parameters
+    ----------
+    spec: tuple
+        the 'load_func_from_module_path' parameters.
+    shared_parameters: dict
+        the function parameters where the arrays are replaced by shared
+        memory descriptions.
+    conn: Connection
+        the connection used to send the results.
+    """
+    blocks = []
+    try:
+        function = load_func_from_module_path(
+            func_module_path=spec[0], input_arg_types=spec[1],
+            output_arg_types=spec[2], input_meta=spec[3],
+            output_meta=spec[4], trusted=spec[5])
+        parameters = dict(
+            (name, _attach(value, blocks))
+            for name, value in shared_parameters.items())
+        outputs = call_function(function, parameters)
+        shared_outputs = dict(
+            (name, _share(value)) for name, value in outputs.items())
+        del parameters, outputs
+        conn.send(("ok", shared_outputs))
+    except:
+        conn.send(("error", traceback.format_exc()))
+    finally:
+        gc.collect()
+        for block in blocks:
+            try:
+                block.close()
+            except BufferError:
+                pass
+        conn.close()
+
+
+def _is_shareable(value):
+    """ Check if a value is an array that can be placed in shared memory.
+    """
+    return (numpy is not None and isinstance(value, numpy.ndarray) and
+            not value.dtype.hasobject)
+
+
+def _share(value, blocks=None):
+    """ Copy an array in a new shared memory block.
+
+    Parameters
+    ----------
+    value: object
+        the value to share.
+    blocks: list (optional, default None)
+        if set, the created block is appended to this list, otherwise the
+        block is closed and must be unlinked by the receiver.
+
+    Returns
+    -------
+    description: object
+        the shared memory block description or the value itself if it is not
+        an array.
+    """
+    if not _is_shareable(value):
+        return value
+    block = shared_memory.SharedMemory(create=True, size=max(value.nbytes, 1))
+    array = numpy.ndarray(value.shape, dtype=value.dtype, buffer=block.buf)
+    array[...] = value
+    del array
+    description = (SHARED_ARRAY, block.name, value.shape, value.dtype.str)
+    if blocks is not None:
+        blocks.append(block)
+    else:
+        block.close()
+    return description
+
+
+def _attach(value, blocks):
+    """ Map a shared memory block description to an array without copy.
+    """
+    if not _is_description(value):
+        return value
+    _, name, shape, dtype = value
+    block = shared_memory.SharedMemory(name=name)
+    blocks.append(block)
+    return numpy.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+
+def _unshare(value):
+    """ Copy a shared memory block in a new array and release the block.
+
+    The array owns its memory: its lifetime is not bound to the block, at
+    the cost of a transient copy.
+    """
+    if not _is_description(value):
+        return value
+    _, name, shape, dtype = value
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        array = numpy.empty(shape, dtype=dtype)
+        array[...] = numpy.ndarray(shape, dtype=dtype, buffer=block.buf)
+    finally:
+        block.close()
+        block.unlink()
+    return array
+
+
+def _is_description(value):
+    """ Check if a value is a shared memory block description.
+    """
+    return (isinstance(value, tuple) and len(value) == 4 and
+            value[0] == SHARED_ARRAY)
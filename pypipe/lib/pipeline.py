@@ -0,0 +1,324 @@
+##########################################################################
+# PyPipe - Copyright (C) AGrigis, 2017
+# Distributed under the terms of the CeCILL-B license, as published by
+# the CEA-CNRS-INRIA. Refer to the LICENSE file or to
+# http://www.cecill.info/licences/Licence_CeCILL-B_V1-en.html
+# for details.
+##########################################################################
+
+"""
+Module that defines a pipeline: a directed acyclic graph of menu functions.
+"""
+
+# System import
+import json
+import logging
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+
+# Package import
+from .cache import fingerprint
+from .cache import function_hash
+from .engine import call_function
+from .engine import check_parameters
+from .engine import find_function
+from .engine import load_menu_function
+from .base import trace
+
+
+# Create a logger
+logger = logging.getLogger(__name__)
+
+
+class Pipeline(object):
+    """ Chain menu functions by connecting outputs to inputs.
+
+    The nodes are executed in topological order and the independent nodes
+    are executed in a thread pool as soon as their predecessors are done.
+    The outputs of each node are kept in memory with the fingerprint of its
+    inputs: when the pipeline is executed again, a node whose inputs are
+    unchanged is skipped.
+
+    A pipeline can be described in a JSON file::
+
+        {
+            "nodes": {
+                "load": {"function": "pypipe.demo.load",
+                         "parameters": {"ndim": 2}},
+                "hist": {"function": "pypipe.demo.plotting.histogram",
+                         "parameters": {"nbins": 10}}
+            },
+            "links": [["load.data", "hist.data"]]
+        }
+    """
+    def __init__(self, menu, trusted=False):
+        """ Initialize the 'Pipeline' class.
+
+        Parameters
+        ----------
+        menu: hierachic dict
+            the menu where the functions are declared.
+        trusted: bool (optional, default False)
+            if set, the node parameters and the input/output types are not
+            checked.
+        """
+        self.menu = menu
+        self.trusted = trusted
+        self.nodes = OrderedDict()
+        self.links = []
+        self._results = {}
+
+    @classmethod
+    def from_dict(cls, menu, description, trusted=False):
+        """ Create a pipeline from its dictionary description.
+
+        Parameters
+        ----------
+        menu: hierachic dict
+            the menu where the functions are declared.
+        description: dict
+            the pipeline 'nodes' and 'links'. Each node is described by its
+            function menu path or module path and its fixed 'parameters'.
+            Each link is a 2-uplet with the source 'node.output' and the
+            destination 'node.input'.
+        trusted: bool (optional, default False)
+            if set, the input/output types are not checked.
+
+        Returns
+        -------
+        pipeline: Pipeline
+            the created pipeline.
+        """
+        pipeline = cls(menu, trusted=trusted)
+        for name, node in description.get("nodes", {}).items():
+            pipeline.add_node(name, node["function"],
+                              node.get("parameters"))
+        for source, destination in description.get("links", []):
+            source_node, output = source.rsplit(".", 1)
+            destination_node, input = destination.rsplit(".", 1)
+            pipeline.connect(source_node, output, destination_node, input)
+        return pipeline
+
+    @classmethod
+    def from_json(cls, menu, path, trusted=False):
+        """ Create a pipeline from a JSON file.
+
+        See 'from_dict' for the file content.
+        """
+        with open(path, "rt") as open_file:
+            description = json.load(open_file,
+                                    object_pairs_hook=OrderedDict)
+        return cls.from_dict(menu, description, trusted=trusted)
+
+    def add_node(self, name, function_path, parameters=None):
+        """ Add a function to the pipeline.
+
+        Parameters
+        ----------
+        name: str
+            the node name.
+        function_path: str
+            the function menu path or module path.
+        parameters: dict (optional, default None)
+            the fixed function parameters, checked with the function input
+            control schemas unless the pipeline is trusted.
+        """
+        if name in self.nodes:
+            raise ValueError("Node '{0}' already exists.".format(name))
+        function = load_menu_function(
+            find_function(self.menu, function_path), trusted=self.trusted)
+        parameters = dict(parameters or {})
+        unknown = set(parameters) - set(function._input_names)
+        if len(unknown) > 0:
+            raise ValueError("Unknown parameters {0} for node '{1}'.".format(
+                sorted(unknown), name))
+        if not self.trusted:
+            check_parameters(function, parameters)
+        self.nodes[name] = {"function": function, "parameters": parameters}
+
+    def connect(self, source, output, destination, input):
+        """ Connect a node output to a node input.
+
+        Parameters
+        ----------
+        source: str
+            the source node name.
+        output: str
+            the source node output name.
+        destination: str
+            the destination node name.
+        input: str
+            the destination node input name.
+        """
+        for node, param, names in (
+                (source, output, "_output_names"),
+                (destination, input, "_input_names")):
+            if node not in self.nodes:
+                raise ValueError("Unknown node '{0}'.".format(node))
+            if param not in getattr(self.nodes[node]["function"], names):
+                raise ValueError("Unknown parameter '{0}' for node "
+                                 "'{1}'.".format(param, node))
+        for link in self.links:
+            if link[2:] == (destination, input):
+                raise ValueError(
+                    "Input '{0}.{1}' is already connected.".format(
+                        destination, input))
+        self.links.append((source, output, destination, input))
+
+    def levels(self):
+        """ Sort the nodes in topological order.
+
+        Returns
+        -------
+        levels: list of list of str
+            the node names grouped by level: the nodes of a level only depend
+            on the nodes of the previous levels.
+        """
+        predecessors = dict((name, set()) for name in self.nodes)
+        successors = dict((name, set()) for name in self.nodes)
+        for source, _, destination, _ in self.links:
+            predecessors[destination].add(source)
+            successors[source].add(destination)
+        nb_predecessors = dict(
+            (name, len(nodes)) for name, nodes in predecessors.items())
+        level = [name for name in self.nodes if nb_predecessors[name] == 0]
+        levels = []
+        while len(level) > 0:
+            levels.append(level)
+            next_level = []
+            for name in level:
+                for successor in successors[name]:
+                    nb_predecessors[successor] -= 1
+                    if nb_predecessors[successor] == 0:
+                        next_level.append(successor)
+            level = [name for name in self.nodes if name in next_level]
+        if sum([len(level) for level in levels]) != len(self.nodes):
+            raise ValueError("The pipeline contains a cycle.")
+        return levels
+
+    def run(self, jobs=1, cache=None, force=False, runlog=None,
+            progress=None):
+        """ Execute the pipeline.
+
+        Parameters
+        ----------
+        jobs: int (optional, default 1)
+            the number of threads used to execute the independent nodes: a
+            node is executed as soon as its predecessors are done.
+        cache: ResultCache (optional, default None)
+            if set, use this cache to store/retrieve the function results.
+        force: bool (optional, default False)
+            if set, execute all the nodes even if their inputs are unchanged.
+        runlog: RunLog (optional, default None)
+            if set, record the executed nodes measures in this log.
+        progress: callable (optional, default None)
+            if set, called with a status message each time a node is done.
+
+        Returns
+        -------
+        outputs: OrderedDict
+            the outputs of each node in topological order.
+        skipped: list of str
+            the nodes whose inputs are unchanged and that are not executed.
+        """
+        trace(logger, "Run pipeline::")
+        order = [name for level in self.levels() for name in level]
+        results = {}
+        skipped_nodes = set()
+
+        def node_done(name, node_outputs, skipped):
+            """ Store the outputs of a node and report the progress.
+            """
+            results[name] = node_outputs
+            if skipped:
+                skipped_nodes.add(name)
+            if progress is not None:
+                progress("Pipeline: {0}/{1} nodes done".format(
+                    len(results), len(order)))
+
+        if jobs <= 1:
+            for name in order:
+                node_done(name, *self._run_node(
+                    name, results, cache, force, runlog))
+        else:
+            # A node is submitted as soon as all its predecessors are done
+            nb_predecessors = dict((name, 0) for name in order)
+            successors = dict((name, []) for name in order)
+            for source, _, destination, _ in self.links:
+                nb_predecessors[destination] += 1
+                successors[source].append(destination)
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                futures = {}
+                for name in order:
+                    if nb_predecessors[name] == 0:
+                        futures[executor.submit(
+                            self._run_node, name, results, cache, force,
+                            runlog)] = name
+                while len(futures) > 0:
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        name = futures.pop(future)
+                        node_done(name, *future.result())
+                        for successor in successors[name]:
+                            nb_predecessors[successor] -= 1
+                            if nb_predecessors[successor] == 0:
+                                futures[executor.submit(
+                                    self._run_node, successor, results,
+                                    cache, force, runlog)] = successor
+        outputs = OrderedDict((name, results[name]) for name in order)
+        skipped_nodes = [name for name in order if name in skipped_nodes]
+        trace(logger, "skipped: {0}\nRun pipeline done.", skipped_nodes)
+        return outputs, skipped_nodes
+
+    def _run_node(self, name, outputs, cache=None, force=False,
+                  runlog=None):
+        """ Execute a node unless its inputs are unchanged.
+
+        The inputs fingerprint is not computed when the execution is
+        forced.
+
+        Returns
+        -------
+        outputs: dict
+            the node outputs.
+        skipped: bool
+            True if the previous outputs are returned.
+        """
+        node = self.nodes[name]
+        function = node["function"]
+        kwargs = dict(function._default_values)
+        kwargs.update(node["parameters"])
+        for source, output, destination, input in self.links:
+            if destination == name:
+                kwargs[input] = outputs[source][output]
+        missing = set(function._input_names) - set(kwargs)
+        if len(missing) > 0:
+            raise ValueError("Missing parameters {0} for node '{1}'.".format(
+                sorted(missing), name))
+        key = None
+        if not force:
+            input_meta = (function._input_meta or
+                          [{}] * len(function._input_names))
+            nohash = set(
+                input_name for input_name, meta in zip(
+                    function._input_names, input_meta)
+                if meta.get("nohash", False))
+            key = fingerprint(function._module_path, function_hash(function),
+                              kwargs, nohash)
+            previous = self._results.get(name)
+            if (key is not None and previous is not None and
+                    previous[0] == key):
+                trace(logger, "Skip unchanged node '{0}'.", name)
+                return previous[1], True
+        if cache is not None:
+            function = cache.memoize(function)
+        if runlog is not None:
+            function = runlog.instrument(function)
+        node_outputs = call_function(function, kwargs)
+        if key is None:
+            self._results.pop(name, None)
+        else:
+            self._results[name] = (key, node_outputs)
+        return node_outputs, False
@@ -9,6 +9,7 @@
 # System import
 import builtins
 import re
+import types
 import inspect
 import logging
 import importlib
@@ -19,6 +20,9 @@ from .exceptions import ArgumentValidationError
 from .exceptions import InvalidArgumentNumberError
 from .exceptions import InvalidReturnType
 from .exceptions import InvalidReturnNumberError
+from .base import is_tracing
+from .base import summarize
+from .base import trace
 
 
 # Create a logger
@@ -26,7 +30,9 @@ logger = logging.getLogger(__name__)
 
 
 # Global parameters
-TYPES = [t for t in builtins.__dict__.values() if isinstance(t, type)]
+TYPES = frozenset(
+    [t for t in builtins.__dict__.values() if isinstance(t, type)])
+FUNCTIONS_REGISTRY = {}
 
 
 def ordinal(num):
@@ -50,98 +56,169 @@ def ordinal(num):
         return "{0}{1}".format(num, ord)
 
 
-def inputs(*accepted_arg_types):
+def _type_checks(accepted_types):
+    """ Precompute the type checks of a decorator.
+
+    Only the builtin types are checked.
+
+    Parameters
+    ----------
+    accepted_types: tuple
+        the accepted types, eg. (<type 'tuple'>, <type 'int'>, 'file').
+
+    Returns
+    -------
+    checks: tuple of 2-uplet
+        the index and the type of each parameter to be checked.
+    """
+    return tuple(
+        (arg_num, accepted_type)
+        for arg_num, accepted_type in enumerate(accepted_types)
+        if isinstance(accepted_type, type) and accepted_type in TYPES)
+
+
+def _copy_function(function):
+    """ Create a new function object sharing the code of a function.
+
+    The copy has its own attributes and calling it has no overhead.
+
+    Parameters
+    ----------
+    function: callable
+        the function to copy.
+
+    Returns
+    -------
+    copied_function: callable
+        the copied function.
+    """
+    if isinstance(function, types.FunctionType):
+        copied_function = types.FunctionType(
+            function.__code__, function.__globals__, function.__name__,
+            function.__defaults__, function.__closure__)
+        copied_function.__kwdefaults__ = function.__kwdefaults__
+    else:
+        def copied_function(*function_args, **function_args_dict):
+            return function(*function_args, **function_args_dict)
+    return functools.update_wrapper(copied_function, function)
+
+
+def inputs(*accepted_arg_types, trusted=False):
     """ A decorator to validate the parameter types of a given function.
 
     It is passed a tuple, eg. (<type 'tuple'>, <type 'int'>, 'file'), and
     checks only types. This tuple is stored in the '_input_types' function
     attribute.
- 
+
+    The checks are compiled once at decoration time. In 'trusted' mode no
+    check is performed and the decorated function has no call overhead.
+
     Note: It doesn't do a deep check, for example checking through a
           tuple of types.
     """
+    nb_expected_args = len(accepted_arg_types)
+    checks = _type_checks(accepted_arg_types)
+
     def input_decorator(validate_function):
         """ Decorate the 'validate_function' function.
         """
+        func_name = validate_function.__name__
+
+        if trusted:
+            decorator_wrapper = _copy_function(validate_function)
+        else:
+            @functools.wraps(validate_function)
+            def decorator_wrapper(*function_args, **function_args_dict):
+                """ Define a sub-decorator to check the function parameters.
+                """
+                nb_args = len(function_args)
+                if nb_args + len(function_args_dict) != nb_expected_args:
+                    raise InvalidArgumentNumberError(func_name)
+                for arg_num, accepted_arg_type in checks:
+                    if arg_num >= nb_args:
+                        break
+                    if type(function_args[arg_num]) is not accepted_arg_type:
+                        raise ArgumentValidationError(
+                            ordinal(arg_num + 1), func_name, accepted_arg_type)
+                return validate_function(*function_args, **function_args_dict)
+
         # Store the accepted args in function parameter
-        setattr(validate_function, "_input_types", accepted_arg_types)
-
-        @functools.wraps(validate_function)
-        def decorator_wrapper(*function_args, **function_args_dict):
-            """ Define a sub-decorator to check the function parameters.
-            """
-            nb_args = len(function_args) + len(function_args_dict)
-            if len(accepted_arg_types) != nb_args:
-                raise InvalidArgumentNumberError(validate_function.__name__)
- 
-            for arg_num, (actual_arg, accepted_arg_type) in enumerate(
-                    zip(function_args, accepted_arg_types)):
-                if accepted_arg_type not in TYPES:
-                    continue
-                if type(actual_arg) is not accepted_arg_type:
-                    ord_num = ordinal(arg_num + 1)
-                    raise ArgumentValidationError(ord_num,
-                                                  validate_function.__name__,
-                                                  accepted_arg_type)
-            return validate_function(*function_args, **function_args_dict)
+        setattr(decorator_wrapper, "_input_types", accepted_arg_types)
         return decorator_wrapper
     return input_decorator
 
 
-def returns(*accepted_return_type_tuple):
+def returns(*accepted_return_type_tuple, trusted=False):
     """ Decorator to set the return types.
 
     It is passed a tuple, eg. (<type 'tuple'>, <type 'int'>, 'file'), and
     checks only types. This tuple is stored in the '_output_types' function
     attribute.
- 
+
+    The checks are compiled once at decoration time. In 'trusted' mode no
+    check is performed and the decorated function has no call overhead.
+
     Note: It doesn't do a deep check, for example checking through a
           tuple of types.
     """
+    nb_expected_returns = len(accepted_return_type_tuple)
+    checks = _type_checks(accepted_return_type_tuple)
+
     def return_decorator(validate_function):
         """ Decorate the 'validate_function' function.
         """
-        # Store the returned args in function parameter
-        setattr(validate_function, "_output_types", accepted_return_type_tuple)
-
-        @functools.wraps(validate_function)
-        def decorator_wrapper(*function_args, **function_args_dict):
-            """ Define a sub-decorator to check the function parameters.
-            """
-            return_values = validate_function(
-                *function_args, **function_args_dict)
-            if return_values is None and len(accepted_return_type_tuple) == 0:
+        func_name = validate_function.__name__
+
+        if trusted:
+            decorator_wrapper = _copy_function(validate_function)
+        else:
+            @functools.wraps(validate_function)
+            def decorator_wrapper(*function_args, **function_args_dict):
+                """ Define a sub-decorator to check the function returned
+                values.
+                """
+                return_values = validate_function(
+                    *function_args, **function_args_dict)
+                if return_values is None and nb_expected_returns == 0:
+                    return return_values
+                if isinstance(return_values, tuple):
+                    values = return_values
+                else:
+                    values = (return_values, )
+                if len(values) != nb_expected_returns:
+                    raise InvalidReturnNumberError(func_name)
+                for arg_num, accepted_return_type in checks:
+                    if type(values[arg_num]) is not accepted_return_type:
+                        raise InvalidReturnType(
+                            ordinal(arg_num + 1), func_name,
+                            accepted_return_type)
                 return return_values
-            flatten = False
-            if not isinstance(return_values, tuple):
-                flatten = True
-                return_values = (return_values, )
-
-            if len(return_values) != len(accepted_return_type_tuple):
-                raise InvalidReturnNumberError(validate_function.__name__)
-
-            for arg_num, (return_value, accepted_return_type) in enumerate(
-                    zip(return_values, accepted_return_type_tuple)):
-                if accepted_return_type not in TYPES:
-                    continue
-                if type(return_value) is not accepted_return_type:
-                    ord_num = ordinal(arg_num + 1)
-                    raise InvalidReturnType(ord_num,
-                                            validate_function.__name__,
-                                            accepted_return_type)
-
-            if flatten:
-                return_values = return_values[0]
-            return return_values
+
+        # Store the returned args in function parameter
+        setattr(decorator_wrapper, "_output_types",
+                accepted_return_type_tuple)
         return decorator_wrapper
     return return_decorator
 
 
+def clear_functions_registry():
+    """ Forget all the functions loaded with 'load_func_from_module_path'.
+
+    The next calls will import and inspect the functions again, for
+    instance after a module has been modified.
+    """
+    FUNCTIONS_REGISTRY.clear()
+
+
 def load_func_from_module_path(func_module_path, input_arg_types,
                                output_arg_types, input_meta=None,
-                               output_meta=None):
+                               output_meta=None, trusted=False):
     """ Load a function fom its module description.
 
+    The loaded functions are stored in a per-process registry indexed by
+    the module path and the type signature: loading twice the same
+    function returns the already decorated function.
+
     Parameters
     ----------
     func_module_path: str
@@ -154,13 +231,17 @@ def load_func_from_module_path(func_module_path, input_arg_types,
         the function input parameters associated metadata.
     output_meta: tuple
         the function input parameters associated metadata.
+    trusted: bool (optional, default False)
+        if set, the input/output types are not checked during the function
+        calls.
 
     Returns
     -------
     func: callable
-        the loaded function with special attributes: '_input_types',
-        '_output_types', '_input_names', '_output_names',
-        '_default_values', _'input_meta', and 'output_meta'.
+        the loaded function with special attributes: '_module_path',
+        '_trusted', '_input_types', '_output_types', '_input_names',
+        '_output_names', '_default_values', _'input_meta', and
+        'output_meta'.
     """
     # Check input parameters
     if input_meta is not None:
@@ -168,8 +249,17 @@ def load_func_from_module_path(func_module_path, input_arg_types,
     if output_meta is not None:
         assert len(output_arg_types) == len(output_meta)
 
+    # Check the registry
+    key = repr((func_module_path, tuple(input_arg_types),
+                tuple(output_arg_types),
+                None if input_meta is None else tuple(input_meta),
+                None if output_meta is None else tuple(output_meta),
+                trusted))
+    if key in FUNCTIONS_REGISTRY:
+        return FUNCTIONS_REGISTRY[key]
+
     # Load the function
-    logger.debug("Loading function '{0}'::".format(func_module_path))
+    trace(logger, "Loading function '{0}'::", func_module_path)
     module_name, func_name = func_module_path.rsplit(".", 1)
     mod = importlib.import_module(module_name)
     func = getattr(mod, func_name)
@@ -178,30 +268,34 @@ def load_func_from_module_path(func_module_path, input_arg_types,
             func_module_path))
 
     # Decorate the function to type inputs/outputs
-    decorated_func = returns(*output_arg_types)(inputs(*input_arg_types)(func))
-    logger.debug("input types: {0}".format(decorated_func._input_types))
-    logger.debug("output types: {0}".format(decorated_func._output_types))
+    decorated_func = returns(*output_arg_types, trusted=trusted)(
+        inputs(*input_arg_types, trusted=trusted)(func))
+    setattr(decorated_func, "_module_path", func_module_path)
+    setattr(decorated_func, "_trusted", trusted)
     setattr(decorated_func, "_input_meta", input_meta)
     setattr(decorated_func, "_output_meta", output_meta)
-    logger.debug("input meta: {0}".format(decorated_func._input_meta))
-    logger.debug("output meta: {0}".format(decorated_func._output_meta))
 
     # Inspect the function to get input/output parameters
-    prototype = inspect.getargspec(func)
+    prototype = inspect.getfullargspec(func)
     _inputs = prototype.args
     setattr(decorated_func, "_input_names", _inputs)
-    logger.debug("inputs: {0}".format(decorated_func._input_names))
     defaults = dict(zip(reversed(prototype.args or []),
                         reversed(prototype.defaults or [])))
     setattr(decorated_func, "_default_values", defaults)
-    logger.debug("defaults: {0}".format(decorated_func._default_values))
     code = inspect.getsourcelines(func)
     return_pattern = r"return\s*(.*)\n*$"
     _outputs = re.findall(return_pattern, code[0][-1])
     if len(_outputs) > 0:
         _outputs = [item.strip() for item in _outputs[0].split(",")]
     setattr(decorated_func, "_output_names", _outputs)
-    logger.debug("outputs: {0}".format(decorated_func._output_names))
-    logger.debug("Loading function done.")
+    if is_tracing(logger):
+        for name in ("_input_types", "_output_types", "_input_meta",
+                     "_output_meta", "_input_names", "_default_values",
+                     "_output_names"):
+            logger.debug("{0}: {1}".format(
+                name[1:].replace("_", " "),
+                summarize(getattr(decorated_func, name))))
+        logger.debug("Loading function done.")
+    FUNCTIONS_REGISTRY[key] = decorated_func
 
     return decorated_func
@@ -0,0 +1,127 @@
+##########################################################################
+# PyPipe - Copyright (C) AGrigis, 2017
+# Distributed under the terms of the CeCILL-B license, as published by
+# the CEA-CNRS-INRIA. Refer to the LICENSE file or to
+# http://www.cecill.info/licences/Licence_CeCILL-B_V1-en.html
+# for details.
+##########################################################################
+
+# System import
+import os
+import shutil
+import tempfile
+import unittest
+import numpy
+
+# Package import
+from pypipe.lib.cache import ResultCache
+from pypipe.lib.utils import load_func_from_module_path
+
+
+class TestCache(unittest.TestCase):
+    """ Test the function results cache.
+    """
+
+    def setUp(self):
+        """ Initialize the TestCache class.
+        """
+        self.cachedir = tempfile.mkdtemp()
+        self.cache = ResultCache(self.cachedir)
+        self.function = load_func_from_module_path(
+            "pypipe.demo.histogram", ("Objects", "Int", "Float", "Int"),
+            ("Objects", ), input_meta=({"copy": True}, {}, {"nohash": True},
+                                       {}),
+            output_meta=({}, ))
+        self.data = numpy.arange(100)
+
+    def tearDown(self):
+        """ Remove the cache folder.
+        """
+        shutil.rmtree(self.cachedir)
+
+    def test_memoize(self):
+        """ Method to test that the results are cached.
+        """
+        memoized_function = self.cache.memoize(self.function)
+        self.assertEqual(memoized_function._input_names,
+                         self.function._input_names)
+        hist = memoized_function(self.data, 10, 0., 0)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 1))
+        cached_hist = memoized_function(self.data.copy(), 10, 0., 0)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertTrue(numpy.allclose(hist, cached_hist))
+
+        # The 'lower_cut' parameter is not part of the finger print
+        memoized_function(self.data, 10, 50., 0)
+        self.assertEqual(self.cache.hits, 2)
+        memoized_function(self.data, 5, 0., 0)
+        self.assertEqual(self.cache.misses, 2)
+        self.assertEqual(len(os.listdir(self.cachedir)), 2)
+
+    def test_eviction(self):
+        """ Method to test the cache size limit.
+        """
+        self.cache.max_size = 1
+        memoized_function = self.cache.memoize(self.function)
+        memoized_function(self.data, 10, 0., 0)
+        self.assertEqual(len(os.listdir(self.cachedir)), 0)
+        self.cache.clear()
+
+    def test_size_tracking(self):
+        """ Method to test that the cache directory is only scanned when
+        the size limit is exceeded.
+        """
+        scans = []
+        evict = self.cache._evict
+        self.cache._evict = lambda: scans.append(1) or evict()
+        for idx in range(5):
+            self.cache.set(str(idx), self.data)
+        self.assertEqual(len(scans), 1)
+        self.cache.set("0", self.data)
+        self.assertEqual(len(scans), 1)
+        size = sum([os.path.getsize(os.path.join(self.cachedir, name))
+                    for name in os.listdir(self.cachedir)])
+        self.assertEqual(self.cache._size, size)
+        self.cache.max_size = size
+        self.cache.set("5", self.data)
+        self.assertEqual(len(scans), 2)
+        self.assertEqual(len(os.listdir(self.cachedir)), 5)
+        self.cache.refresh_interval = 0
+        self.cache.set("6", self.data)
+        self.assertEqual(len(scans), 3)
+
+    def test_shared_directory(self):
+        """ Method to test that the files removed by another process are
+        ignored.
+        """
+        self.cache.set("key", self.data)
+        os.remove(os.path.join(self.cachedir, "key.pkl"))
+        self.cache.max_size = 0
+        self.cache._evict()
+        self.assertEqual(self.cache.get("key"), (False, None))
+
+    def test_fingerprint(self):
+        """ Method to test the arrays fingerprints.
+        """
+        data = numpy.arange(20).reshape(4, 5)
+        key = self.cache.fingerprint("module", "source", {"data": data})
+        self.assertEqual(key, self.cache.fingerprint(
+            "module", "source", {"data": data.copy()}))
+        self.assertEqual(
+            self.cache.fingerprint("module", "source", {"data": data[:, ::2]}),
+            self.cache.fingerprint(
+                "module", "source", {"data": data[:, ::2].copy()}))
+        self.assertIsNone(self.cache.fingerprint(
+            "module", "source", {"data": numpy.array([1, "a"], dtype=object)}))
+
+
+def test():
+    """ Function to execute unitests.
+    """
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestCache)
+    runtime = unittest.TextTestRunner(verbosity=2).run(suite)
+    return runtime.wasSuccessful()
+
+
+if __name__ == "__main__":
+    test()
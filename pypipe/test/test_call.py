@@ -0,0 +1,98 @@
+##########################################################################
+# PyPipe - Copyright (C) AGrigis, 2017
+# Distributed under the terms of the CeCILL-B license, as published by
+# the CEA-CNRS-INRIA. Refer to the LICENSE file or to
+# http://www.cecill.info/licences/Licence_CeCILL-B_V1-en.html
+# for details.
+##########################################################################
+
+# System import
+import shutil
+import tempfile
+import unittest
+import numpy
+
+# Package import
+from pypipe.lib.cache import ResultCache
+from pypipe.lib.call import BoundCall
+from pypipe.lib.utils import load_func_from_module_path
+
+
+class TestCall(unittest.TestCase):
+    """ Test the bound function calls.
+    """
+
+    def setUp(self):
+        """ Initialize the TestCall class.
+        """
+        self.function = load_func_from_module_path(
+            "pypipe.demo.histogram", ("Objects", "Int", "Float", "Int"),
+            ("Objects", ))
+
+    def test_call(self):
+        """ Method to test the outputs and the overridden parameters.
+        """
+        call = BoundCall(self.function, nbins=4, lower_cut=-1.)
+        result = call(data=numpy.ones((5, 5)))
+        self.assertTrue(result.success)
+        self.assertEqual(result.outputs["hist_im"].sum(), 25)
+        self.assertEqual(result.inputs["cumulate"], 0)
+        self.assertGreaterEqual(result.elapsed, 0)
+        result = call(data=numpy.ones((5, 5)), nbins=2)
+        self.assertEqual(len(result.outputs["hist_im"]), 2)
+        self.assertEqual(call.parameters["nbins"], 4)
+        self.assertRaises(ValueError, BoundCall, self.function, bad=1)
+
+    def test_error(self):
+        """ Method to test that the call errors are captured.
+        """
+        call = BoundCall(self.function, data=numpy.ones((5, 5)), nbins=-1)
+        result = call()
+        self.assertFalse(result.success)
+        self.assertIsNone(result.outputs)
+        self.assertIsInstance(result.exception, ValueError)
+        self.assertIn("histogram", result.traceback)
+        self.assertFalse(call(bad=1).success)
+
+    def test_isolated_cache(self):
+        """ Method to test that the isolated calls use the result cache.
+        """
+        cachedir = tempfile.mkdtemp()
+        try:
+            cache = ResultCache(cachedir)
+            function = cache.memoize(self.function)
+            parameters = {"data": numpy.ones((5, 5)), "nbins": 4,
+                          "lower_cut": -1.}
+            call = BoundCall(function, isolated=True, **parameters)
+            for _ in range(2):
+                result = call()
+                self.assertTrue(result.success)
+                self.assertEqual(result.outputs["hist_im"].sum(), 25)
+            self.assertEqual((cache.hits, cache.misses), (1, 1))
+            result = BoundCall(function, **parameters)()
+            self.assertEqual(result.outputs["hist_im"].sum(), 25)
+            self.assertEqual((cache.hits, cache.misses), (2, 1))
+        finally:
+            shutil.rmtree(cachedir)
+
+    def test_missing_returns(self):
+        """ Method to test that a call must set all the declared returns.
+        """
+        function = load_func_from_module_path(
+            "pypipe.demo.histogram", ("Objects", "Int", "Float", "Int"),
+            ("Objects", "Objects"))
+        result = BoundCall(function, data=numpy.ones((5, 5)))()
+        self.assertFalse(result.success)
+        self.assertIsInstance(result.exception, ValueError)
+
+
+def test():
+    """ Function to execute unitests.
+    """
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestCall)
+    runtime = unittest.TextTestRunner(verbosity=2).run(suite)
+    return runtime.wasSuccessful()
+
+
+if __name__ == "__main__":
+    test()
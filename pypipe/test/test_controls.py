@@ -8,6 +8,7 @@
 
 # System import
 import os
+import array
 import unittest
 import numpy
 
@@ -21,6 +22,7 @@ from pypipe.lib.controls import Int
 from pypipe.lib.controls import Float
 from pypipe.lib.controls import Object
 from pypipe.lib.controls import List
+from pypipe.lib.controls import ControlSchema
 
 
 class TestControls(unittest.TestCase):
@@ -74,6 +76,28 @@ class TestControls(unittest.TestCase):
         self.dir.value = None
         self.assertEqual(self.dir.value, None)
 
+    def test_path_list(self):
+        """ Method to test if the file and directory lists are correctly
+        defined.
+        """
+        # Return to new line
+        print
+
+        # Check parameter state
+        files = [os.path.join(self.dirname, name)
+                 for name in os.listdir(self.dirname)
+                 if os.path.isfile(os.path.join(self.dirname, name))]
+        file_list = List(files, content="File")
+        self.assertEqual(file_list.value, files)
+        file_list.value = files + [self.dirname]
+        self.assertEqual(file_list.value, files)
+        file_list.value = files + [os.path.join(self.dirname, "missing")]
+        self.assertEqual(file_list.value, files)
+        dir_list = List([self.dirname], content="Directory")
+        self.assertEqual(dir_list.value, [self.dirname])
+        dir_list.value = [self.path]
+        self.assertEqual(dir_list.value, [self.dirname])
+
     def test_string(self):
         """ Method to test if the string parameter is correctly defined.
         """
@@ -133,6 +157,25 @@ class TestControls(unittest.TestCase):
         self.list.value = (["a", 2], ["c"])
         self.assertEqual(self.list.value, None)
 
+        # Check arrays
+        int_list = List(content="Int")
+        int_list.value = numpy.arange(10)
+        self.assertEqual(int_list.value.shape, (10, ))
+        int_list.value = numpy.zeros((2, 2), dtype=int)
+        self.assertEqual(int_list.value.shape, (10, ))
+        int_list.value = array.array("l", [1, 2])
+        self.assertEqual(list(int_list.value), [1, 2])
+        int_list.value = [1, 2, 3.]
+        self.assertEqual(list(int_list.value), [1, 2])
+        float_list = List(content="List_Float")
+        float_list.value = numpy.zeros((2, 2))
+        self.assertEqual(float_list.value.shape, (2, 2))
+        float_list.value = [numpy.zeros(2), [1., 2.]]
+        self.assertEqual(len(float_list.value), 2)
+        float_list.value = [[1., 2], [1.]]
+        self.assertEqual(len(float_list.value), 2)
+        self.assertFalse(self.list._is_valid(numpy.zeros((2, 2))))
+
         # Test raised cases
         self.assertRaises(ValueError, List)
         self.assertRaises(ValueError, List, content="Bad")
@@ -174,6 +217,31 @@ class TestControls(unittest.TestCase):
         self.float.value = "bad"
         self.assertEqual(self.float.value, 15.)
 
+    def test_compact(self):
+        """ Method to test if the compact controls are correctly defined.
+        """
+        # Check the values
+        schema = ControlSchema("Enum", choices=self.choices, crazy=True)
+        control = schema("c2")
+        self.assertFalse(hasattr(control, "__dict__"))
+        self.assertTrue(control.valid)
+        self.assertTrue(control.crazy)
+        self.assertEqual(control.choices, self.choices)
+        control.value = "bad"
+        self.assertEqual(control.value, "c2")
+        self.assertFalse(control.valid)
+        self.assertFalse(schema("bad").valid)
+        self.assertTrue(ControlSchema("Int", is_optional=True)().valid)
+        self.assertTrue(ControlSchema(List, content="List_Int")([[1]]).valid)
+        self.assertRaises(ValueError, ControlSchema, "Unknown")
+
+        # Check the notifications
+        values = []
+        control.add_observer("value", lambda signal: values.append(
+            (signal.object, signal.value)))
+        control.value = "c3"
+        self.assertEqual(values, [(control, "c3")])
+
 
 def test():
     """ Function to execute unitests.
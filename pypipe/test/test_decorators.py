@@ -19,6 +19,8 @@ from pypipe.lib.exceptions import InvalidReturnType
 from pypipe.lib.exceptions import InvalidReturnNumberError
 from pypipe.lib.utils import inputs
 from pypipe.lib.utils import returns
+from pypipe.lib.utils import load_func_from_module_path
+from pypipe.lib.utils import clear_functions_registry
 
 
 class TestDecorators(unittest.TestCase):
@@ -73,6 +75,34 @@ class TestDecorators(unittest.TestCase):
         self.assertEqual(decorated_func._input_types, input_types)
         self.assertEqual(decorated_func._output_types, output_types)
 
+    def test_trusted(self):
+        """ Method to test that the trusted mode does not check types.
+        """
+        decorated_func = returns(float, trusted=True)(
+            inputs(str, float, int, str, str, trusted=True)(test1))
+        self.assertIsNot(decorated_func, test1)
+        self.assertFalse(hasattr(test1, "_input_types"))
+        self.assertEqual(decorated_func._input_types,
+                         (str, float, int, str, str))
+        self.assertEqual(decorated_func._output_types, (float, ))
+        exitcode = decorated_func("a", 1, 5, "b", "c")
+        self.assertEqual(exitcode, 1)
+
+    def test_registry(self):
+        """ Method to test that the loaded functions are registered.
+        """
+        input_types = ("File", "Float", "Int", "Enum", "Str", "Str")
+        output_types = ("Int", )
+        func = load_func_from_module_path(
+            "pypipe.demo.test1", input_types, output_types)
+        self.assertIs(func, load_func_from_module_path(
+            "pypipe.demo.test1", list(input_types), list(output_types)))
+        self.assertIsNot(func, load_func_from_module_path(
+            "pypipe.demo.test1", input_types, ("Str", )))
+        clear_functions_registry()
+        self.assertIsNot(func, load_func_from_module_path(
+            "pypipe.demo.test1", input_types, output_types))
+
 
 def test():
     """ Function to execute unitests.
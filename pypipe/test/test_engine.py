@@ -0,0 +1,132 @@
+##########################################################################
+# PyPipe - Copyright (C) AGrigis, 2017
+# Distributed under the terms of the CeCILL-B license, as published by
+# the CEA-CNRS-INRIA. Refer to the LICENSE file or to
+# http://www.cecill.info/licences/Licence_CeCILL-B_V1-en.html
+# for details.
+##########################################################################
+
+# System import
+import unittest
+import numpy
+
+# Package import
+from pypipe.lib.engine import find_function
+from pypipe.lib.engine import input_schemas
+from pypipe.lib.engine import load_menu_function
+from pypipe.lib.engine import load_parameter_sets
+from pypipe.lib.engine import run_batch
+from pypipe.lib.engine import run_parameter_set
+
+
+class TestEngine(unittest.TestCase):
+    """ Test the headless execution engine.
+    """
+
+    def setUp(self):
+        """ Initialize the TestEngine class.
+        """
+        self.menu = {
+            "pypipe": {
+                "demo": {
+                    "load": [
+                        "pypipe.demo.generate_data",
+                        ("Int", ),
+                        (("Objects", {"otype": "ndarray"}), )
+                    ],
+                    "plotting": {
+                        "histogram": [
+                            "pypipe.demo.histogram",
+                            [["Objects", {"otype": "ndarray"}], "Int",
+                             "Float", "Int"],
+                            [["Objects", {"otype": "ndarray"}]]
+                        ]
+                    }
+                }
+            }
+        }
+
+    def test_find_function(self):
+        """ Method to test the function lookup in a menu.
+        """
+        description = find_function(self.menu, "pypipe.demo.load")
+        self.assertEqual(description[0], "pypipe.demo.generate_data")
+        description = find_function(self.menu, "pypipe.demo.histogram")
+        self.assertEqual(description[0], "pypipe.demo.histogram")
+        self.assertRaises(ValueError, find_function, self.menu, "bad")
+
+    def test_parameter_sets(self):
+        """ Method to test the parameter grid expansion.
+        """
+        parameter_sets = load_parameter_sets({"a": [1, 2], "b": ["x", "y"]})
+        self.assertEqual(len(parameter_sets), 4)
+        self.assertIn({"a": 2, "b": "x"}, parameter_sets)
+        parameter_sets = [{"a": 1}]
+        self.assertEqual(load_parameter_sets(parameter_sets), parameter_sets)
+
+    def test_run(self):
+        """ Method to test the function execution.
+        """
+        description = find_function(self.menu, "pypipe.demo.load")
+        outputs = run_parameter_set(description, {})
+        self.assertEqual(outputs["data"].shape, (16, 16))
+        self.assertRaises(
+            ValueError, run_parameter_set, description, {"bad": 1})
+        description = find_function(self.menu, "pypipe.demo.histogram")
+        outputs = run_parameter_set(
+            description, {"data": numpy.ones((5, 5)), "nbins": 3,
+                          "lower_cut": -1.})
+        self.assertEqual(outputs["hist_im"].sum(), 25)
+
+    def test_check_parameters(self):
+        """ Method to test the parameter values checks.
+        """
+        description = find_function(self.menu, "pypipe.demo.histogram")
+        function = load_menu_function(description)
+        schemas = input_schemas(function)
+        self.assertEqual(sorted(schemas), ["cumulate", "lower_cut", "nbins"])
+        self.assertIs(input_schemas(function), schemas)
+        parameters = {"data": numpy.ones((5, 5)), "nbins": 3, "lower_cut": -1}
+        self.assertRaises(
+            ValueError, run_parameter_set, description, parameters)
+        outputs = run_parameter_set(description, parameters, trusted=True)
+        self.assertEqual(outputs["hist_im"].sum(), 25)
+        description = find_function(self.menu, "pypipe.demo.load")
+        results = run_batch(description, [{"ndim": "3"}])
+        self.assertIn("Invalid parameters ['ndim']", results[0]["error"])
+
+        # An explicit None is valid if it is the default value
+        description = [
+            "pypipe.demo.test1",
+            ("File", "Float", "Int", ("Enum", {"choices": ("a", "b")}),
+             ("Objects", {"otype": "list"}), "Str"),
+            (("Objects", {"otype": "int"}), )]
+        parameters = {"i1": __file__, "i2": 1., "i4": None}
+        self.assertEqual(run_parameter_set(description, parameters)["r1"], 1)
+        parameters["i6"] = None
+        self.assertRaises(
+            ValueError, run_parameter_set, description, parameters)
+
+    def test_batch(self):
+        """ Method to test the batch execution.
+        """
+        description = find_function(self.menu, "pypipe.demo.load")
+        parameter_sets = load_parameter_sets({"ndim": [2, 3, 4]})
+        for jobs in (1, 2):
+            results = run_batch(description, parameter_sets, jobs=jobs)
+            self.assertEqual(len(results), 3)
+            self.assertEqual(results[1]["outputs"]["data"].ndim, 3)
+            self.assertIsNone(results[0]["error"])
+            self.assertIsNotNone(results[2]["error"])
+
+
+def test():
+    """ Function to execute unitests.
+    """
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestEngine)
+    runtime = unittest.TextTestRunner(verbosity=2).run(suite)
+    return runtime.wasSuccessful()
+
+
+if __name__ == "__main__":
+    test()
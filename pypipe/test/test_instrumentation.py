@@ -0,0 +1,102 @@
+##########################################################################
+# PyPipe - Copyright (C) AGrigis, 2017
+# Distributed under the terms of the CeCILL-B license, as published by
+# the CEA-CNRS-INRIA. Refer to the LICENSE file or to
+# http://www.cecill.info/licences/Licence_CeCILL-B_V1-en.html
+# for details.
+##########################################################################
+
+# System import
+import os
+import csv
+import json
+import shutil
+import tempfile
+import unittest
+import tracemalloc
+
+# Package import
+from pypipe.lib.engine import find_function
+from pypipe.lib.engine import run_batch
+from pypipe.lib.instrumentation import RunLog
+
+
+class TestInstrumentation(unittest.TestCase):
+    """ Test the function calls measures.
+    """
+
+    def setUp(self):
+        """ Initialize the TestInstrumentation class.
+        """
+        self.description = find_function({
+            "load": [
+                "pypipe.demo.generate_data",
+                ("Int", ),
+                (("Objects", {"otype": "ndarray"}), )
+            ]}, "load")
+        self.outdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """ Remove the output folder.
+        """
+        shutil.rmtree(self.outdir)
+
+    def test_batch(self):
+        """ Method to test the measures of batch executions.
+        """
+        for jobs in (1, 2):
+            runlog = RunLog(trace_memory=True)
+            results = run_batch(self.description, [{"ndim": 3}, {"ndim": 4}],
+                                jobs=jobs, runlog=runlog)
+            self.assertNotIn("run", results[0])
+            self.assertEqual(len(runlog.records), 2)
+            record = runlog.records[0]
+            self.assertEqual(record.function, "generate_data")
+            self.assertEqual(record.output_size, 16 * 16 * 3 * 8)
+            self.assertGreater(record.peak_memory, 0)
+            self.assertGreaterEqual(record.wall_time, 0)
+            self.assertIsNone(record.error)
+            self.assertIsNotNone(runlog.records[1].error)
+
+    def test_export(self):
+        """ Method to test the JSON/CSV export.
+        """
+        runlog = RunLog()
+        run_batch(self.description, [{"ndim": 2}], runlog=runlog)
+        json_file = os.path.join(self.outdir, "runs.json")
+        csv_file = os.path.join(self.outdir, "runs.csv")
+        runlog.save(json_file)
+        runlog.save(csv_file)
+        with open(json_file, "rt") as open_file:
+            records = json.load(open_file)
+        self.assertEqual(records[0]["function"], "generate_data")
+        self.assertIsNone(records[0]["peak_memory"])
+        with open(csv_file, "rt") as open_file:
+            records = list(csv.DictReader(open_file))
+        self.assertEqual(records[0]["output_size"], str(16 * 16 * 8))
+        self.assertIn("process_max_rss", records[0])
+
+    def test_concurrent_tracing(self):
+        """ Method to test that the memory tracing is shared by the
+        concurrent measures.
+        """
+        runlog = RunLog(trace_memory=True)
+        with runlog.measure("outer"):
+            with runlog.measure("inner"):
+                data = bytearray(1024 ** 2)
+            self.assertTrue(tracemalloc.is_tracing())
+            del data
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertGreaterEqual(runlog.records[1].peak_memory, 1024 ** 2)
+
+
+def test():
+    """ Function to execute unitests.
+    """
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestInstrumentation)
+    runtime = unittest.TextTestRunner(verbosity=2).run(suite)
+    return runtime.wasSuccessful()
+
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,107 @@
+##########################################################################
+# PyPipe - Copyright (C) AGrigis, 2017
+# Distributed under the terms of the CeCILL-B license, as published by
+# the CEA-CNRS-INRIA. Refer to the LICENSE file or to
+# http://www.cecill.info/licences/Licence_CeCILL-B_V1-en.html
+# for details.
+##########################################################################
+
+# System import
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+import subprocess
+import numpy
+
+# Package import
+from pypipe.lib.exceptions import IsolatedExecutionError
+from pypipe.lib.isolation import run_isolated
+from pypipe.lib.utils import load_func_from_module_path
+
+
+# A script that executes a function in a worker process: as the viewer,
+# its module level code is also executed by the worker
+SCRIPT = """
+import sys
+print("import")
+sys.stdout.flush()
+
+from pypipe.lib.isolation import run_isolated
+from pypipe.lib.utils import load_func_from_module_path
+
+
+def main():
+    function = load_func_from_module_path(
+        "pypipe.demo.generate_data", ("Int", ), ("Objects", ))
+    outputs = run_isolated(function, {"ndim": 3}, timeout=60)
+    print("shape", outputs["data"].shape)
+
+
+if __name__ == "__main__":
+    main()
+"""
+
+
+class TestIsolation(unittest.TestCase):
+    """ Test the execution of functions in a worker process.
+    """
+
+    def test_run(self):
+        """ Method to test that the arrays go through the worker process.
+        """
+        function = load_func_from_module_path(
+            "pypipe.demo.histogram", ("Objects", "Int", "Float", "Int"),
+            ("Objects", ))
+        data = numpy.arange(100, dtype=float).reshape(10, 10)
+        outputs = run_isolated(
+            function, {"data": data, "nbins": 4, "lower_cut": -1.})
+        self.assertTrue(numpy.allclose(
+            outputs["hist_im"], numpy.histogram(data, 4)[0]))
+
+    def test_error(self):
+        """ Method to test that the worker errors are reported.
+        """
+        function = load_func_from_module_path(
+            "pypipe.demo.generate_data", ("Int", ), ("Objects", ))
+        outputs = run_isolated(function, {"ndim": 3})
+        self.assertEqual(outputs["data"].shape, (16, 16, 3))
+        self.assertRaises(IsolatedExecutionError, run_isolated, function,
+                          {"ndim": 4})
+
+    def test_script(self):
+        """ Method to test an execution started from a script.
+        """
+        outdir = tempfile.mkdtemp()
+        try:
+            script = os.path.join(outdir, "isolated_script")
+            with open(script, "wt") as open_file:
+                open_file.write(SCRIPT)
+            env = dict(os.environ)
+            env["PYTHONPATH"] = os.pathsep.join(
+                [os.path.dirname(os.path.dirname(os.path.dirname(
+                    os.path.abspath(__file__))))] +
+                [path for path in [env.get("PYTHONPATH")] if path])
+            process = subprocess.run(
+                [sys.executable, script], stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE, env=env, timeout=120,
+                universal_newlines=True)
+        finally:
+            shutil.rmtree(outdir)
+        self.assertEqual(process.returncode, 0, process.stderr)
+        lines = process.stdout.splitlines()
+        self.assertEqual(lines.count("shape (16, 16, 3)"), 1)
+        self.assertEqual(lines.count("import"), 2)
+
+
+def test():
+    """ Function to execute unitests.
+    """
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestIsolation)
+    runtime = unittest.TextTestRunner(verbosity=2).run(suite)
+    return runtime.wasSuccessful()
+
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,110 @@
+##########################################################################
+# PyPipe - Copyright (C) AGrigis, 2017
+# Distributed under the terms of the CeCILL-B license, as published by
+# the CEA-CNRS-INRIA. Refer to the LICENSE file or to
+# http://www.cecill.info/licences/Licence_CeCILL-B_V1-en.html
+# for details.
+##########################################################################
+
+# System import
+import os
+import unittest
+import numpy
+
+# Package import
+from pypipe.lib.base import ObjectStore
+
+
+class TestObjectStore(unittest.TestCase):
+    """ Test the object store memory budget.
+    """
+
+    def setUp(self):
+        """ Initialize the TestObjectStore class.
+        """
+        self.array = numpy.ones((100, 100))
+        self.store = ObjectStore(
+            ["a", 1], memory_budget=2 * self.array.nbytes,
+            spill_threshold=self.array.nbytes)
+
+    def tearDown(self):
+        """ Remove the spilled arrays.
+        """
+        self.store.close()
+
+    def test_spill(self):
+        """ Method to test that the arrays are spilled.
+        """
+        # Within the budget
+        self.store.append(self.array)
+        self.store.append(self.array * 2)
+        self.assertEqual(self.store.resident_size, 2 * self.array.nbytes)
+        self.assertNotIsInstance(self.store[2], numpy.memmap)
+
+        # Spill the least recently used array
+        self.store[2]
+        self.store.append(self.array * 3)
+        self.assertEqual(len(self.store), 5)
+        self.assertIsInstance(self.store[3], numpy.memmap)
+        self.assertEqual(self.store.resident_size, 2 * self.array.nbytes)
+        self.assertTrue(numpy.allclose(self.store[3], self.array * 2))
+        path = self.store._spilled[id(self.store[3])][1]
+        self.assertTrue(os.path.isfile(path))
+
+        # Remove the spilled array
+        del self.store[3]
+        self.assertFalse(os.path.isfile(path))
+        self.assertEqual(self.store[:2], ["a", 1])
+
+    def test_change(self):
+        """ Method to test that a batch of modifications is notified once
+        after the arrays are spilled.
+        """
+        signals = []
+        self.store.add_observer("change", lambda signal: signals.append(
+            (signal.start, signal.removed, list(signal.values))))
+        with self.store.batch():
+            self.store[1] = 2
+            for factor in range(3):
+                self.store.append(self.array * factor)
+        self.assertEqual(len(signals), 1)
+        start, removed, values = signals[0]
+        self.assertEqual((start, removed, len(values)), (1, 1, 4))
+        self.assertIsInstance(values[1], numpy.memmap)
+        del self.store[0]
+        self.assertEqual(signals[1], (0, 1, []))
+
+    def test_spill_signal(self):
+        """ Method to test that the spilled positions are notified.
+        """
+        positions = []
+        self.store.add_observer("spill", lambda signal: positions.extend(
+            signal.positions))
+        self.store.extend([self.array, self.array * 2])
+        self.assertEqual(positions, [])
+        self.store.append(self.array * 3)
+        self.assertEqual(positions, [2])
+        self.assertIsInstance(self.store[2], numpy.memmap)
+
+    def test_policy(self):
+        """ Method to test the 'largest' eviction policy.
+        """
+        self.assertRaises(ValueError, ObjectStore, policy="bad")
+        store = ObjectStore(memory_budget=2 * self.array.nbytes,
+                            spill_threshold=0, policy="largest")
+        store.extend([self.array, numpy.ones((200, 100))])
+        self.assertIsInstance(store[1], numpy.memmap)
+        self.assertNotIsInstance(store[0], numpy.memmap)
+        store.close()
+
+
+def test():
+    """ Function to execute unitests.
+    """
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestObjectStore)
+    runtime = unittest.TextTestRunner(verbosity=2).run(suite)
+    return runtime.wasSuccessful()
+
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,207 @@
+##########################################################################
+# PyPipe - Copyright (C) AGrigis, 2017
+# Distributed under the terms of the CeCILL-B license, as published by
+# the CEA-CNRS-INRIA. Refer to the LICENSE file or to
+# http://www.cecill.info/licences/Licence_CeCILL-B_V1-en.html
+# for details.
+##########################################################################
+
+# System import
+import gc
+import unittest
+import threading
+
+# Package import
+from pypipe.lib.base import Observable
+from pypipe.lib.base import ObservableList
+from pypipe.lib.base import observers_report
+from pypipe.lib.controls import Int
+
+
+class Listener(object):
+    """ An observer object.
+    """
+    def __init__(self):
+        self.values = []
+
+    def on_value(self, signal):
+        self.values.append(signal.value)
+
+
+class TestObservable(unittest.TestCase):
+    """ Test the observers notifications.
+    """
+
+    def setUp(self):
+        """ Initialize the TestObservable class.
+        """
+        self.observable = Observable(["value", "other"])
+        self.received = []
+
+    def observer(self, signal):
+        """ Store the received signal parameters.
+        """
+        self.received.append((signal.object, signal.signal, signal.value))
+
+    def test_notify(self):
+        """ Method to test the observers notifications.
+        """
+        self.assertTrue(self.observable.notify_observers("value", value=1))
+        self.observable.add_observer("value", self.observer)
+        self.observable.add_observer("value", self.observer)
+        self.assertIsInstance(self.observable._observers["value"], tuple)
+        self.assertTrue(self.observable.notify_observers("value", value=2))
+        self.observable.notify_observers("value", value=3)
+        self.assertEqual(self.received, [
+            (self.observable, "value", 2), (self.observable, "value", 3)])
+        self.observable.remove_observer("value", self.observer)
+        self.observable.notify_observers("value", value=4)
+        self.assertEqual(len(self.received), 2)
+        self.assertRaises(Exception, self.observable.add_observer, "unknown",
+                          self.observer)
+
+    def test_signal_record(self):
+        """ Method to test the signal records reuse.
+        """
+        records = []
+        self.observable.add_observer("value", records.append)
+        self.observable.notify_observers("value", value=1)
+        self.observable.notify_observers("value", value=2)
+        self.assertIs(records[0], records[1])
+        self.assertIsNone(records[0].object)
+        self.assertFalse(hasattr(records[0], "value"))
+        self.assertRaises(AttributeError, setattr, records[0], "value", 1)
+
+    def test_weak_observers(self):
+        """ Method to test the observers weak references.
+        """
+        listener = Listener()
+        self.observable.add_observer("value", listener.on_value)
+        self.observable.add_observer("value", self.received.append)
+        self.assertEqual(self.observable.observers("value"),
+                         [listener.on_value, self.received.append])
+        report = observers_report()["Observable"]
+        self.assertEqual(report["observers"]["Listener"], 1)
+        self.observable.notify_observers("value", value=1)
+        self.assertEqual(listener.values, [1])
+        del listener
+        gc.collect()
+        self.assertEqual(len(self.observable._observers["value"]), 1)
+        self.observable.notify_observers("value", value=2)
+        self.assertEqual(len(self.received), 2)
+
+    def test_queue(self):
+        """ Method to test the queued notifications.
+        """
+        def nested(signal):
+            self.received.append(signal.value)
+            if signal.value == 1:
+                self.assertFalse(self.observable.notify_observers(
+                    "value", value=2))
+
+        self.observable.add_observer("value", nested)
+        self.observable.notify_observers("value", value=1)
+        self.assertEqual(self.received, [1])
+        self.observable.enable_queue()
+        self.received = []
+        self.observable.remove_observer("value", nested)
+
+        def nested(signal):
+            self.received.append(signal.value)
+            if signal.value == 1:
+                self.assertTrue(self.observable.notify_observers(
+                    "value", value=2))
+                self.assertTrue(self.observable.notify_observers(
+                    "value", value=3))
+                self.assertEqual(self.received, [1])
+
+        self.observable.add_observer("value", nested)
+        self.observable.notify_observers("value", value=1)
+        self.assertEqual(self.received, [1, 2, 3])
+
+    def test_queue_threads(self):
+        """ Method to test the cross-thread queued notifications.
+        """
+        pending = []
+        self.observable.enable_queue(dispatcher=pending.append)
+        self.observable.add_observer("value", self.observer)
+        threads = [
+            threading.Thread(
+                target=lambda start=start: [
+                    self.observable.notify_observers("value", value=value)
+                    for value in range(start, start + 100)])
+            for start in range(0, 400, 100)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(pending), 1)
+        self.assertEqual(self.received, [])
+        pending[0]()
+        values = [value for _, _, value in self.received]
+        self.assertEqual(sorted(values), list(range(400)))
+        for start in range(0, 400, 100):
+            thread_values = [value for value in values
+                             if start <= value < start + 100]
+            self.assertEqual(thread_values, sorted(thread_values))
+        self.observable.notify_observers("value", value=400)
+        self.assertEqual(len(pending), 2)
+
+    def test_list(self):
+        """ Method to test the list notifications.
+        """
+        objects = ObservableList([0, 1])
+        changes = []
+        objects.add_observer("append", self.observer)
+        objects.add_observer("change", lambda signal: changes.append(
+            (signal.start, signal.removed, signal.values)))
+        objects.append(2)
+        objects.extend([3, 4])
+        objects[1:3] = ["a"]
+        del objects[-1]
+        self.assertEqual(self.received, [(objects, "append", 2)])
+        self.assertEqual(changes, [
+            (2, 0, [2]), (3, 0, [3, 4]), (1, 2, ["a"]), (3, 1, [])])
+        self.assertEqual(objects, [0, "a", 3])
+
+    def test_list_batch(self):
+        """ Method to test the coalesced list notifications.
+        """
+        objects = ObservableList([0, 1])
+        changes = []
+        objects.add_observer("append", self.observer)
+        objects.add_observer("change", lambda signal: changes.append(
+            (signal.start, signal.removed, signal.values)))
+        with objects.batch():
+            for value in range(10000):
+                objects.append(value)
+            with objects.batch():
+                objects.pop(0)
+        self.assertEqual(self.received, [])
+        self.assertEqual(len(changes), 1)
+        self.assertEqual(changes[0][:2], (0, 2))
+        self.assertEqual(changes[0][2], objects)
+        with objects.batch():
+            pass
+        self.assertEqual(len(changes), 1)
+
+    def test_control(self):
+        """ Method to test the control value notifications.
+        """
+        control = Int(crazy=True)
+        control.add_observer("value", self.observer)
+        control.value = 2
+        self.assertEqual(self.received, [(control, "value", 2)])
+        self.assertTrue(control.crazy)
+
+
+def test():
+    """ Function to execute unitests.
+    """
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestObservable)
+    runtime = unittest.TextTestRunner(verbosity=2).run(suite)
+    return runtime.wasSuccessful()
+
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,72 @@
+##########################################################################
+# PyPipe - Copyright (C) AGrigis, 2017
+# Distributed under the terms of the CeCILL-B license, as published by
+# the CEA-CNRS-INRIA. Refer to the LICENSE file or to
+# http://www.cecill.info/licences/Licence_CeCILL-B_V1-en.html
+# for details.
+##########################################################################
+
+# System import
+import os
+import shutil
+import tempfile
+import unittest
+
+# Package import
+from pypipe.lib.base import PathCache
+
+
+class TestPathCache(unittest.TestCase):
+    """ Test the path existence cache.
+    """
+
+    def setUp(self):
+        """ Initialize the TestPathCache class.
+        """
+        self.outdir = tempfile.mkdtemp()
+        self.paths = [os.path.join(self.outdir, "file{0}".format(idx))
+                      for idx in range(5)]
+        for path in self.paths:
+            open(path, "wt").close()
+
+    def tearDown(self):
+        """ Remove the test folder.
+        """
+        shutil.rmtree(self.outdir)
+
+    def test_kinds(self):
+        """ Method to test the path kinds.
+        """
+        cache = PathCache()
+        self.assertEqual(cache.kinds(self.paths + [self.outdir]),
+                         ["file"] * 5 + ["directory"])
+        self.assertFalse(cache.isfile(self.paths[0] + "_bad"))
+
+    def test_size(self):
+        """ Method to test that the cache is bounded and drops the expired
+        paths.
+        """
+        cache = PathCache(maxsize=3)
+        self.assertTrue(cache.isfiles(self.paths))
+        self.assertEqual(list(cache._entries), self.paths[2:])
+        cache = PathCache(ttl=0)
+        self.assertTrue(cache.isfile(self.paths[0]))
+        self.assertEqual(len(cache._entries), 0)
+        cache = PathCache(ttl=60)
+        self.assertTrue(cache.isfile(self.paths[0]))
+        os.remove(self.paths[0])
+        self.assertTrue(cache.isfile(self.paths[0]))
+        cache._entries[self.paths[0]] = (-60, "file")
+        self.assertFalse(cache.isfile(self.paths[0]))
+
+
+def test():
+    """ Function to execute unitests.
+    """
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestPathCache)
+    runtime = unittest.TextTestRunner(verbosity=2).run(suite)
+    return runtime.wasSuccessful()
+
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,144 @@
+##########################################################################
+# PyPipe - Copyright (C) AGrigis, 2017
+# Distributed under the terms of the CeCILL-B license, as published by
+# the CEA-CNRS-INRIA. Refer to the LICENSE file or to
+# http://www.cecill.info/licences/Licence_CeCILL-B_V1-en.html
+# for details.
+##########################################################################
+
+# System import
+import time
+import shutil
+import tempfile
+import unittest
+
+# Package import
+from pypipe.lib.cache import ResultCache
+from pypipe.lib.pipeline import Pipeline
+
+
+class TestPipeline(unittest.TestCase):
+    """ Test the pipeline graph execution.
+    """
+
+    def setUp(self):
+        """ Initialize the TestPipeline class.
+        """
+        self.menu = {
+            "pypipe": {
+                "demo": {
+                    "load": [
+                        "pypipe.demo.generate_data",
+                        ("Int", ),
+                        (("Objects", {"otype": "ndarray"}), )
+                    ],
+                    "plotting": {
+                        "histogram": [
+                            "pypipe.demo.histogram",
+                            [["Objects", {"otype": "ndarray"}], "Int",
+                             "Float", "Int"],
+                            [["Objects", {"otype": "ndarray"}]]
+                        ]
+                    }
+                }
+            }
+        }
+        self.description = {
+            "nodes": {
+                "load": {"function": "pypipe.demo.load"},
+                "hist1": {"function": "pypipe.demo.plotting.histogram",
+                          "parameters": {"nbins": 2}},
+                "hist2": {"function": "pypipe.demo.plotting.histogram",
+                          "parameters": {"nbins": 4, "lower_cut": -1.}}
+            },
+            "links": [["load.data", "hist1.data"],
+                      ["load.data", "hist2.data"]]
+        }
+        self.cachedir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """ Remove the cache folder.
+        """
+        shutil.rmtree(self.cachedir)
+
+    def test_levels(self):
+        """ Method to test the topological sort.
+        """
+        pipeline = Pipeline.from_dict(self.menu, self.description)
+        self.assertEqual(pipeline.levels(), [["load"], ["hist1", "hist2"]])
+        self.assertRaises(ValueError, pipeline.connect,
+                          "hist1", "hist_im", "hist2", "data")
+        self.assertRaises(ValueError, pipeline.connect,
+                          "load", "bad", "hist2", "nbins")
+        pipeline.connect("hist1", "hist_im", "load", "ndim")
+        self.assertRaises(ValueError, pipeline.levels)
+
+    def test_run(self):
+        """ Method to test the pipeline execution and the skip of the
+        unchanged nodes.
+        """
+        pipeline = Pipeline.from_dict(self.menu, self.description)
+        for jobs in (1, 2):
+            outputs, skipped = pipeline.run(jobs=jobs, force=True)
+            self.assertEqual(list(outputs.keys()), ["load", "hist1", "hist2"])
+            self.assertEqual(len(outputs["hist1"]["hist_im"]), 2)
+            self.assertEqual(outputs["hist2"]["hist_im"].sum(), 256)
+            self.assertEqual(skipped, [])
+        self.assertEqual(pipeline.run()[1], [])
+        self.assertEqual(pipeline.run()[1], ["load", "hist1", "hist2"])
+        pipeline.nodes["hist2"]["parameters"]["nbins"] = 8
+        outputs, skipped = pipeline.run()
+        self.assertEqual(skipped, ["load", "hist1"])
+        self.assertEqual(len(outputs["hist2"]["hist_im"]), 8)
+        cache = ResultCache(self.cachedir)
+        self.assertEqual(pipeline.run(cache=cache)[1],
+                         ["load", "hist1", "hist2"])
+
+    def test_schedule(self):
+        """ Method to test that a node is executed as soon as its
+        predecessors are done.
+        """
+        description = {
+            "nodes": {
+                "load1": {"function": "pypipe.demo.load"},
+                "load2": {"function": "pypipe.demo.load"},
+                "hist1": {"function": "pypipe.demo.plotting.histogram"}
+            },
+            "links": [["load1.data", "hist1.data"]]
+        }
+        pipeline = Pipeline.from_dict(self.menu, description)
+        run_node = pipeline._run_node
+        events = []
+
+        def slow_run_node(name, *args):
+            if name == "load2":
+                time.sleep(0.5)
+            node_outputs = run_node(name, *args)
+            events.append(name)
+            return node_outputs
+
+        pipeline._run_node = slow_run_node
+        outputs, _ = pipeline.run(jobs=2)
+        self.assertEqual(events, ["load1", "hist1", "load2"])
+        self.assertEqual(list(outputs.keys()), ["load1", "load2", "hist1"])
+
+    def test_progress(self):
+        """ Method to test the pipeline progress messages.
+        """
+        pipeline = Pipeline.from_dict(self.menu, self.description)
+        messages = []
+        pipeline.run(progress=messages.append)
+        self.assertEqual(messages, ["Pipeline: {0}/3 nodes done".format(idx)
+                                    for idx in range(1, 4)])
+
+
+def test():
+    """ Function to execute unitests.
+    """
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestPipeline)
+    runtime = unittest.TextTestRunner(verbosity=2).run(suite)
+    return runtime.wasSuccessful()
+
+
+if __name__ == "__main__":
+    test()
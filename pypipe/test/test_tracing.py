@@ -0,0 +1,64 @@
+##########################################################################
+# PyPipe - Copyright (C) AGrigis, 2017
+# Distributed under the terms of the CeCILL-B license, as published by
+# the CEA-CNRS-INRIA. Refer to the LICENSE file or to
+# http://www.cecill.info/licences/Licence_CeCILL-B_V1-en.html
+# for details.
+##########################################################################
+
+# System import
+import logging
+import unittest
+import numpy
+
+# Package import
+from pypipe.lib.base import summarize
+from pypipe.lib.base import trace
+
+
+class TestTracing(unittest.TestCase):
+    """ Test the lazy debug tracing tools.
+    """
+
+    def test_summarize(self):
+        """ Method to test the size capped descriptions.
+        """
+        self.assertEqual(summarize(numpy.zeros((300, 300))),
+                         "<ndarray shape=(300, 300) dtype=float64>")
+        self.assertEqual(summarize(("Int", )), "('Int',)")
+        self.assertEqual(summarize("path"), "path")
+        description = summarize(list(range(1000)))
+        self.assertTrue(description.endswith("... 1000 items]"))
+        self.assertEqual(len(summarize("x" * 1000)), 80)
+
+    def test_trace(self):
+        """ Method to test that the messages are only formatted in debug.
+        """
+        class Value(object):
+            formatted = 0
+
+            def __repr__(self):
+                Value.formatted += 1
+                return "value"
+
+        logger = logging.getLogger("pypipe.test.tracing")
+        logger.setLevel(logging.ERROR)
+        trace(logger, "{0}", Value())
+        self.assertEqual(Value.formatted, 0)
+        logger.setLevel(logging.DEBUG)
+        with self.assertLogs(logger, logging.DEBUG) as logs:
+            trace(logger, "{0}", Value())
+        self.assertEqual(Value.formatted, 1)
+        self.assertIn("value", logs.output[0])
+
+
+def test():
+    """ Function to execute unitests.
+    """
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestTracing)
+    runtime = unittest.TextTestRunner(verbosity=2).run(suite)
+    return runtime.wasSuccessful()
+
+
+if __name__ == "__main__":
+    test()
@@ -27,10 +27,12 @@ pkgdata = {
     "pypipe": [
         os.path.join("apps", "resources", "*.png"),
         os.path.join("apps", "resources", "*.ui"),
+        os.path.join("apps", "resources", "*.rcc"),
         os.path.join("test", "*.py")]
 }
 scripts = [
-    os.path.join("pypipe", "apps", "pypipeview")
+    os.path.join("pypipe", "apps", "pypipeview"),
+    os.path.join("pypipe", "apps", "pypipe-run")
 ]
 
 # Write setup